@@ -39,15 +39,362 @@ short_description: HttpApi Plugin for Fortinet FortiOS Appliance or VM
 description:
   - This HttpApi plugin provides methods to connect to Fortinet FortiOS Appliance or VM via REST API
 version_added: "2.9"
+options:
+  session_cache:
+    description:
+      - Keep the detected FortiOS version and the login session on disk and reuse them
+        in later persistent connections to the same device, skipping the version probe and the re-login.
+      - Entries are keyed by host, port and username, hold a salted HMAC of the credentials checked
+        before reuse, and are dropped when the device answers with HTTP 401.
+    type: bool
+    default: false
+    env:
+      - name: ANSIBLE_FORTIOS_SESSION_CACHE
+    vars:
+      - name: ansible_httpapi_fortios_session_cache
+  session_cache_path:
+    description:
+      - Directory where the session cache entries are stored.
+    type: path
+    default: ~/.ansible/fortios_session_cache
+    env:
+      - name: ANSIBLE_FORTIOS_SESSION_CACHE_PATH
+    vars:
+      - name: ansible_httpapi_fortios_session_cache_path
+  session_cache_ttl:
+    description:
+      - Number of seconds a session cache entry stays valid.
+      - Keep it below the admin idle timeout of the device.
+    type: int
+    default: 300
+    env:
+      - name: ANSIBLE_FORTIOS_SESSION_CACHE_TTL
+    vars:
+      - name: ansible_httpapi_fortios_session_cache_ttl
+  log_path:
+    description:
+      - File receiving the request log when a task sets I(enable_log).
+      - The C({host}) placeholder is replaced with the device host so that each device gets its own file,
+        and C({pid}) with the process id of the persistent connection.
+      - The directory is created readable by its owner only. The log may reveal configuration data, avoid
+        world-writable directories such as C(/tmp).
+      - Connections sharing a file reopen it when another one has rotated it.
+    type: str
+    default: ~/.ansible/fortios_log/{host}.log
+    env:
+      - name: ANSIBLE_FORTIOS_LOG_PATH
+    vars:
+      - name: ansible_httpapi_fortios_log_path
+  log_level:
+    description:
+      - C(error) only logs failures, C(info) logs every request with its status and truncated bodies,
+        C(debug) logs the complete request and response bodies.
+    type: str
+    default: info
+    choices:
+      - error
+      - info
+      - debug
+    env:
+      - name: ANSIBLE_FORTIOS_LOG_LEVEL
+    vars:
+      - name: ansible_httpapi_fortios_log_level
+  log_body_limit:
+    description:
+      - Number of characters of the request and response bodies logged at the C(info) level.
+      - C(0) logs the request lines and statuses only.
+    type: int
+    default: 1024
+    vars:
+      - name: ansible_httpapi_fortios_log_body_limit
+  log_max_size:
+    description:
+      - Size in bytes at which the log file is rotated, C(0) disables the rotation.
+    type: int
+    default: 10485760
+    vars:
+      - name: ansible_httpapi_fortios_log_max_size
+  log_backup_count:
+    description:
+      - Number of rotated log files kept.
+    type: int
+    default: 3
+    vars:
+      - name: ansible_httpapi_fortios_log_backup_count
+  retry_max_attempts:
+    description:
+      - Maximum number of attempts for GET, PUT and DELETE requests failing with a connection error
+        or one of I(retry_status_codes). POST requests are never retried.
+      - C(1) disables the retries.
+    type: int
+    default: 1
+    vars:
+      - name: ansible_httpapi_fortios_retry_max_attempts
+  retry_backoff:
+    description:
+      - Base delay in seconds of the exponential backoff between attempts, a random jitter is applied to each delay.
+    type: float
+    default: 1.0
+    vars:
+      - name: ansible_httpapi_fortios_retry_backoff
+  retry_backoff_max:
+    description:
+      - Upper bound in seconds of the delay between attempts.
+    type: float
+    default: 30.0
+    vars:
+      - name: ansible_httpapi_fortios_retry_backoff_max
+  retry_status_codes:
+    description:
+      - HTTP status codes considered transient.
+    type: list
+    elements: int
+    default: [429, 502, 503, 504]
+    vars:
+      - name: ansible_httpapi_fortios_retry_status_codes
+  circuit_breaker_threshold:
+    description:
+      - Number of consecutive failed requests after which the device is considered down and further
+        requests fail immediately for I(circuit_breaker_cooldown) seconds.
+      - Connection errors, server errors (5xx) and 429 count as failures.
+      - C(0) disables the circuit breaker.
+    type: int
+    default: 0
+    vars:
+      - name: ansible_httpapi_fortios_circuit_breaker_threshold
+  circuit_breaker_cooldown:
+    description:
+      - Number of seconds requests fail fast once the circuit breaker is open.
+    type: int
+    default: 60
+    vars:
+      - name: ansible_httpapi_fortios_circuit_breaker_cooldown
+  perf_stats:
+    description:
+      - Record method, path template, status, payload sizes and timings of every request,
+        and return the records of a task in the C(perf) block of its result.
+    type: bool
+    default: false
+    env:
+      - name: ANSIBLE_FORTIOS_PERF_STATS
+    vars:
+      - name: ansible_httpapi_fortios_perf_stats
+  perf_trace_path:
+    description:
+      - Append every request record as a json line to this file, the C({host}) and C({pid}) placeholders are
+        replaced with the device host and the process id of the connection. Setting it enables the recording.
+    type: str
+    env:
+      - name: ANSIBLE_FORTIOS_PERF_TRACE_PATH
+    vars:
+      - name: ansible_httpapi_fortios_perf_trace_path
+  mkey_index:
+    description:
+      - Fetch the mkeys of a table once per connection and let FortiOSHandler.set() pick between
+        creating and updating an object from it, instead of sending a PUT and falling back to a POST.
+      - The index follows the changes made through the connection.
+    type: bool
+    default: false
+    env:
+      - name: ANSIBLE_FORTIOS_MKEY_INDEX
+    vars:
+      - name: ansible_httpapi_fortios_mkey_index
+  read_cache_ttl:
+    description:
+      - Number of seconds a CMDB read is served from memory to every task sharing the persistent connection.
+        0 disables the cache.
+      - Writes through the connection drop the cached reads of the table they touch, other writes drop
+        the whole cache. Reads are neither cached nor served from cache within a transaction.
+      - Changes made outside of the connection, or to the references between tables, are only seen
+        once the entries expire.
+    type: int
+    default: 0
+    env:
+      - name: ANSIBLE_FORTIOS_READ_CACHE_TTL
+    vars:
+      - name: ansible_httpapi_fortios_read_cache_ttl
+  read_cache_size:
+    description:
+      - Number of reads kept in the read cache, the least recently used ones are evicted first.
+    type: int
+    default: 256
+    env:
+      - name: ANSIBLE_FORTIOS_READ_CACHE_SIZE
+    vars:
+      - name: ansible_httpapi_fortios_read_cache_size
+  concurrent_requests:
+    description:
+      - Number of requests sent at the same time when a task applies a change to several virtual domains.
+    type: int
+    default: 8
+    env:
+      - name: ANSIBLE_FORTIOS_CONCURRENT_REQUESTS
+    vars:
+      - name: ansible_httpapi_fortios_concurrent_requests
 """
 
+import atexit
+import fcntl
+import binascii
+import hashlib
+import hmac
 import json
+import os
+import random
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
 from ansible.plugins.httpapi import HttpApiBase
 from ansible.module_utils.basic import to_text
+from ansible.module_utils._text import to_bytes
+from ansible.module_utils.six import string_types
+from ansible.module_utils.six.moves import queue
 from ansible.module_utils.six.moves import urllib
 import re
 from datetime import datetime
 
+# Endpoints reporting the FortiOS version in their top level 'version' field, smallest response first.
+# The interface schema is several hundred KB on large boxes and is only kept as the last resort.
+VERSION_PROBES = [
+    ('system_status', '/api/v2/monitor/system/status'),
+    ('interface_count', '/api/v2/cmdb/system/interface?vdom=root&start=0&count=1'),
+    ('interface_schema', '/api/v2/cmdb/system/interface?vdom=root&action=schema'),
+]
+
+# raw deflate bodies carry no header telling them apart from plain ones, only gzip is requested
+REQUEST_HEADERS = {
+    'Accept-Encoding': 'gzip',
+}
+
+# leading bytes of gzip and zlib streams
+GZIP_MAGIC = b'\x1f\x8b'
+ZLIB_MAGICS = (b'\x78\x01', b'\x78\x5e', b'\x78\x9c', b'\x78\xda')
+
+# FortiOS answers 500 for missing objects, which FortiOSHandler.set() relies on, so it is not retried by default
+RETRY_STATUS_CODES = [429, 502, 503, 504]
+
+# POST may create an object twice when replayed, only these methods are retried
+IDEMPOTENT_METHODS = ('GET', 'PUT', 'DELETE')
+
+# request records kept between two pop_perf_records() calls
+PERF_RECORDS_LIMIT = 10000
+
+# query parameters whose list values are sent as a single '|' separated value
+JOINED_QUERY_PARAMS = ('format',)
+
+# distinct encoded queries remembered by the plugin
+QUERY_CACHE_LIMIT = 256
+
+# objects per request when reading the mkeys of a table
+MKEY_INDEX_PAGE_SIZE = 5000
+
+# size of the compressed slices fed to the decompressor
+DECOMPRESS_CHUNK_SIZE = 65536
+
+LOG_LEVELS = {'error': 40, 'info': 20, 'debug': 10}
+
+# credentials never reach the log file, whether they travel as query parameters, form fields or json
+LOG_REDACTIONS = [
+    (re.compile(r'(access_token|secretkey)=[^&\s"\']*'), r'\1=********'),
+    (re.compile(r'"(access_token|secretkey|password|passwd)"\s*:\s*"[^"]*"'), r'"\1": "********"'),
+]
+
+
+class RequestLogWriter(object):
+    """
+    Write log lines from a background thread so that requests never wait on the disk.
+    Lines are dropped, and accounted for, when the bounded queue is full.
+    """
+
+    def __init__(self, path, max_size=0, backup_count=0, queue_size=1000):
+        self._path = path
+        self._inode = None
+        self._max_size = max_size
+        self._backup_count = backup_count
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._dropped = 0
+        self._file = None
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, line):
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            self._dropped += 1
+
+    def close(self, timeout=5):
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _open(self):
+        log_dir = os.path.dirname(self._path)
+        if log_dir and not os.path.isdir(log_dir):
+            os.makedirs(log_dir, 0o700)
+        self._file = open(self._path, 'a')
+        self._inode = os.fstat(self._file.fileno()).st_ino
+
+    def _moved(self):
+        """
+        tell whether the file was rotated or removed by another process writing to the same path
+        """
+        try:
+            return os.stat(self._path).st_ino != self._inode
+        except OSError:
+            return True
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        with open(self._path + '.lock', 'a') as lock_file:
+            # processes sharing the file rotate it one at a time, a file already rotated by another one is left alone
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            if not self._moved():
+                for index in range(self._backup_count - 1, 0, -1):
+                    source = '%s.%d' % (self._path, index)
+                    if os.path.exists(source):
+                        os.rename(source, '%s.%d' % (self._path, index + 1))
+                if self._backup_count > 0:
+                    os.rename(self._path, self._path + '.1')
+                else:
+                    os.remove(self._path)
+        self._open()
+
+    def _run(self):
+        burst_started = True
+        while True:
+            line = self._queue.get()
+            try:
+                if line is None:
+                    break
+                if self._file and burst_started and self._moved():
+                    self._file.close()
+                    self._file = None
+                if not self._file:
+                    self._open()
+                burst_started = False
+                if self._dropped:
+                    dropped, self._dropped = self._dropped, 0
+                    self._file.write('%s: %d log lines dropped, log queue full\n' % (datetime.now(), dropped))
+                self._file.write(line)
+                if self._queue.empty():
+                    # flush once per burst rather than once per line
+                    self._file.flush()
+                    burst_started = True
+                    if self._max_size and self._file.tell() >= self._max_size:
+                        self._rotate()
+            except (IOError, OSError):
+                pass
+        if self._file:
+            self._file.close()
+            self._file = None
+
 
 class HttpApi(HttpApiBase):
     def __init__(self, connection):
@@ -56,20 +403,66 @@ class HttpApi(HttpApiBase):
         self._conn = connection
         self._ccsrftoken = ''
         self._system_version = None
+        self._version_probe = None
         self._ansible_fos_version = 'v6.0.0'
         self._ansible_galaxy_version = '2.1.2'
         self._log = None
+        self._session_cache_file = None
+        self._session_credential = None
+        self._session_restored = False
+        # bumped by every login, a request rejected with 401 on an older session only needs replaying
+        self._session_generation = 0
+        self._circuit_failures = 0
+        self._circuit_open_until = None
+        self._perf_records = []
+        self._perf_trace = None
+        self._query_cache = {}
+        self._transaction_id = None
+        self._mkey_indexes = {}
+        self._read_cache = OrderedDict()
+        # bumped by every write, a read sent before the write completed must not be cached
+        self._read_cache_generation = 0
+        # guards the caches, the indexes and the records shared by the threads of send_requests()
+        self._state_lock = threading.RLock()
+
+    def _get_plugin_option(self, option, default=None):
+        try:
+            value = self.get_option(option)
+        except KeyError:
+            value = None
+        return default if value is None else value
+
+    def _log_enabled(self, level='info'):
+        if not self._conn.get_option('enable_log'):
+            return False
+        threshold = LOG_LEVELS.get(self._get_plugin_option('log_level', 'info'), LOG_LEVELS['info'])
+        return LOG_LEVELS[level] >= threshold
+
+    def _log_body(self, body):
+        body = to_text(body) if body else ''
+        if self._log_enabled('debug'):
+            return body
+        limit = self._get_plugin_option('log_body_limit', 1024)
+        if len(body) <= limit:
+            return body
+        return '%s...(%d characters truncated)' % (body[:limit], len(body) - limit)
 
-    def log(self, msg):
-        log_enabled = self._conn.get_option('enable_log')
-        if not log_enabled:
+    def _expand_path(self, path):
+        path = path.replace('{host}', str(self._conn.get_option('host'))).replace('{pid}', str(os.getpid()))
+        return os.path.expanduser(path)
+
+    def log(self, msg, level='info'):
+        if not self._log_enabled(level):
             return
         if not self._log:
-            self._log = open("/tmp/fortios.ansible.log", "a")
-        log_message = str(datetime.now())
-        log_message += ": " + str(msg) + '\n'
-        self._log.write(log_message)
-        self._log.flush()
+            log_path = self._expand_path(self._get_plugin_option('log_path', '~/.ansible/fortios_log/{host}.log'))
+            self._log = RequestLogWriter(log_path,
+                                         max_size=self._get_plugin_option('log_max_size', 10485760),
+                                         backup_count=self._get_plugin_option('log_backup_count', 3))
+        log_message = str(msg)
+        for pattern, replacement in LOG_REDACTIONS:
+            log_message = pattern.sub(replacement, log_message)
+        self._log.write('%s: %s\n' % (datetime.now(), log_message))
 
     def get_access_token(self):
         '''this is only available after a module is initialized'''
@@ -85,11 +478,91 @@ class HttpApi(HttpApiBase):
         """
         return None
 
+    def _session_cache_key(self, username):
+        # the credentials stay out of the file name, which anybody listing the directory can read
+        identity = 'token' if self.get_access_token() is not None else 'user:%s' % (username)
+        return hashlib.sha256(to_bytes('%s:%s:%s' % (self._conn.get_option('host'), self._conn.get_option('port'), identity))).hexdigest()
+
+    def _session_credential_digest(self, salt):
+        return hmac.new(to_bytes(salt), to_bytes(self._session_credential), hashlib.sha256).hexdigest()
+
+    def _load_session_cache(self, username, password):
+        self._session_cache_file = None
+        if not self._get_plugin_option('session_cache', False):
+            return False
+        access_token = self.get_access_token()
+        self._session_credential = 'token:' + access_token if access_token is not None else 'user:%s:%s' % (username, password)
+        cache_dir = os.path.expanduser(self._get_plugin_option('session_cache_path', '~/.ansible/fortios_session_cache'))
+        self._session_cache_file = os.path.join(cache_dir, self._session_cache_key(username) + '.json')
+        try:
+            with open(self._session_cache_file, 'r') as cache_file:
+                entry = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return False
+        if not isinstance(entry.get('salt'), string_types) or not isinstance(entry.get('credential'), string_types) or \
+                not hmac.compare_digest(to_bytes(entry['credential']), to_bytes(self._session_credential_digest(entry['salt']))):
+            # an entry of other credentials, overwritten by the next login
+            self.log('session cache entry of other credentials')
+            return False
+        if time.time() - entry.get('created', 0) > self._get_plugin_option('session_cache_ttl', 300):
+            self.log('session cache expired')
+            self._invalidate_session_cache()
+            return False
+        if self.get_access_token() is None:
+            if not entry.get('auth'):
+                return False
+            self._conn._auth = entry['auth']
+            self._ccsrftoken = entry.get('ccsrftoken', '')
+        self._system_version = entry.get('system_version')
+        self._version_probe = entry.get('version_probe')
+        self._session_restored = True
+        self.log('session restored from cache, system version: %s' % (self._system_version))
+        return True
+
+    def _save_session_cache(self):
+        if not self._session_cache_file:
+            return
+        salt = to_text(binascii.hexlify(os.urandom(16)))
+        entry = {
+            'created': time.time(),
+            'salt': salt,
+            'credential': self._session_credential_digest(salt),
+            'system_version': self._system_version,
+            'version_probe': self._version_probe,
+        }
+        if self.get_access_token() is None:
+            entry['auth'] = self._conn._auth
+            entry['ccsrftoken'] = self._ccsrftoken
+        cache_dir = os.path.dirname(self._session_cache_file)
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir, 0o700)
+            # write to a private temporary file first so that concurrent forks never read a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(entry, cache_file)
+            os.rename(tmp_path, self._session_cache_file)
+        except (IOError, OSError) as err:
+            self.log('unable to write session cache: %s' % (to_text(err)))
+
+    def _invalidate_session_cache(self):
+        self._session_restored = False
+        if not self._session_cache_file:
+            return
+        try:
+            os.remove(self._session_cache_file)
+        except OSError:
+            pass
+
     def login(self, username, password):
         """Call a defined login endpoint to receive an authentication token."""
         if (username is None or password is None) and self.get_access_token() is None:
             raise Exception('Please provide access token or username/password to login')
 
+        if self._load_session_cache(username, password):
+            self._session_generation += 1
+            return
+
         if self.get_access_token() is None:
             self.log('login with username and password')
             data = "username=" + urllib.parse.quote(username) + "&secretkey=" + urllib.parse.quote(password) + "&ajax=1"
@@ -101,15 +574,21 @@ class HttpApi(HttpApiBase):
         else:
             self.log('login with access token')
             self.send_request(url='/logincheck')
-            status, dummy = self.send_request(url='/api/v2/cmdb/system/interface?vdom=root&action=schema')
+            status = self._probe_system_version()
 
             if status == 401:
                 raise Exception('Invalid access token. Please check')
 
         self.update_system_version()
+        self._save_session_cache()
+        self._session_generation += 1
 
     def logout(self):
         """ Call to implement session logout."""
+        if self._session_cache_file:
+            # the session is kept alive for the next connections sharing the session cache
+            self.log('logout skipped, session is cached')
+            return
         self.log('logout')
         self.send_request(url='/logout', method="POST")
 
@@ -134,10 +613,10 @@ class HttpApi(HttpApiBase):
                         self._ccsrftoken = csrftoken_search.group(1)
 
             headers['x-csrftoken'] = self._ccsrftoken
-            self.log('update x-csrftoken: %s' % (self._ccsrftoken))
+            self.log('update x-csrftoken', level='debug')
             return headers
         else:
-            self.log('using access token - setting header')
+            self.log('using access token - setting header', level='debug')
 
             return {
                 "Accept": "application/json"
@@ -148,32 +627,289 @@ class HttpApi(HttpApiBase):
         propogate exceptions to users
         :param exc: Exception
         """
-        self.log('Exception thrown from handling http: ' + to_text(exc))
+        self.log('Exception thrown from handling http: ' + to_text(exc), level='error')
 
         return exc
 
     def _concat_token(self, url):
         if self.get_access_token():
-            token_pair = 'access_token=' + self.get_access_token()
+            token_pair = 'access_token=' + urllib.parse.quote(to_bytes(self.get_access_token()), safe='')
             return url + '&' + token_pair if '?' in url else url + '?' + token_pair
         return url
 
+    def _encode_query(self, params):
+        """
+        Encode query parameters once. A list value is sent as repeated keys, e.g. filter=a&filter=b,
+        except for 'format' whose fields are joined with '|'.
+        Encoded queries are memoized, modules issue the same few parameter sets over and over.
+        """
+        # values are keyed with their type, True == 1 but they are sent as True and 1
+        cache_key = tuple((key, tuple((type(item), item) for item in value) if isinstance(value, list) else (type(value), value))
+                          for key, value in params.items())
+        try:
+            return self._query_cache[cache_key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable values are encoded without being memoized
+            cache_key = None
+        pairs = []
+        for param_key, param_value in params.items():
+            if isinstance(param_value, list):
+                values = ['|'.join(str(item) for item in param_value)] if param_key in JOINED_QUERY_PARAMS else param_value
+            else:
+                values = [param_value]
+            for value in values:
+                pairs.append('%s=%s' % (urllib.parse.quote(to_bytes(param_key), safe=''),
+                                        urllib.parse.quote(to_bytes(str(value)), safe='')))
+        query = '&'.join(pairs)
+        if cache_key is not None:
+            if len(self._query_cache) >= QUERY_CACHE_LIMIT:
+                self._query_cache.clear()
+            self._query_cache[cache_key] = query
+        return query
+
     def _concat_params(self, url, params):
         if not params or not len(params):
             return url
-        url = url + '?' if '?' not in url else url
-        for param_key in params:
-            param_value = params[param_key]
-            if url[-1] == '?':
-                url += '%s=%s' % (param_key, param_value)
-            else:
-                url += '&%s=%s' % (param_key, param_value)
-        return url
+        query = self._encode_query(params)
+        if not query:
+            return url
+        return url + '&' + query if '?' in url else url + '?' + query
+
+    def _read_response_body(self, response, response_data):
+        """
+        Return the response body as bytes, inflating compressed responses slice by slice
+        so that the compressed buffer is never copied as a whole.
+        open_url of recent ansible-core inflates gzip bodies itself and leaves the Content-Encoding header,
+        the body is only inflated when it still starts with a gzip or zlib header.
+        """
+        content_encoding = (response.info().get('Content-Encoding') or '').lower()
+        if content_encoding not in ('gzip', 'x-gzip', 'deflate'):
+            return response_data.getvalue()
+        raw = response_data.getbuffer() if hasattr(response_data, 'getbuffer') else response_data.getvalue()
+        magic = bytes(raw[:2])
+        if magic != GZIP_MAGIC and magic not in ZLIB_MAGICS:
+            if isinstance(raw, memoryview):
+                raw.release()
+            return response_data.getvalue()
+        # 32 + MAX_WBITS accepts both gzip and zlib headers
+        decompressor = zlib.decompressobj(32 + zlib.MAX_WBITS)
+        chunks = []
+        try:
+            for offset in range(0, len(raw), DECOMPRESS_CHUNK_SIZE):
+                chunks.append(decompressor.decompress(raw[offset:offset + DECOMPRESS_CHUNK_SIZE]))
+            chunks.append(decompressor.flush())
+        finally:
+            if isinstance(raw, memoryview):
+                raw.release()
+        return b''.join(chunks)
+
+    def _decode_json(self, body):
+        try:
+            return json.loads(body)
+        except TypeError:
+            # json of python < 3.6 only accepts text
+            return json.loads(to_text(body))
+
+    def _retry_delay(self, attempt):
+        # exponential backoff with full jitter
+        ceiling = min(self._get_plugin_option('retry_backoff_max', 30.0),
+                      self._get_plugin_option('retry_backoff', 1.0) * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def _check_circuit_breaker(self):
+        if not self._get_plugin_option('circuit_breaker_threshold', 0):
+            return
+        if self._circuit_open_until and time.time() < self._circuit_open_until:
+            raise Exception('Circuit breaker open for %s after %d consecutive failures, failing fast for %d more seconds' %
+                            (self._conn.get_option('host'), self._circuit_failures, int(self._circuit_open_until - time.time())))
+
+    def _record_circuit_breaker(self, failed):
+        threshold = self._get_plugin_option('circuit_breaker_threshold', 0)
+        if not threshold:
+            return
+        if not failed:
+            self._circuit_failures = 0
+            self._circuit_open_until = None
+            return
+        self._circuit_failures += 1
+        # once open, a single request is let through after the cooldown and a failure opens the circuit again
+        if self._circuit_failures >= threshold:
+            self._circuit_open_until = time.time() + self._get_plugin_option('circuit_breaker_cooldown', 60)
+            self.log('circuit breaker opened after %d consecutive failures' % (self._circuit_failures), level='error')
+
+    def _perf_enabled(self):
+        return self._get_plugin_option('perf_stats', False) or bool(self._get_plugin_option('perf_trace_path'))
+
+    def _path_template(self, url):
+        """
+        turn a request url into the endpoint it targets, mkeys are replaced with {mkey}
+        e.g. /api/v2/cmdb/firewall/addrgrp/grp1/member/host1?vdom=root -> /api/v2/cmdb/firewall/addrgrp/{mkey}/member/{mkey}
+        monitor urls name their action after the table, e.g. /api/v2/monitor/firewall/policy/select, and are kept as is
+        """
+        segments = url.split('?', 1)[0].split('/')
+        if len(segments) <= 6 or segments[3] != 'cmdb':
+            return '/'.join(segments)
+        for index in range(6, len(segments), 2):
+            segments[index] = '{mkey}'
+        return '/'.join(segments)
+
+    def _record_perf(self, record):
+        with self._state_lock:
+            self._perf_records.append(record)
+            # records of tasks not collecting them must not pile up for the life of the connection
+            del self._perf_records[:-PERF_RECORDS_LIMIT]
+        trace_path = self._get_plugin_option('perf_trace_path')
+        if not trace_path:
+            return
+        with self._state_lock:
+            if not self._perf_trace:
+                self._perf_trace = RequestLogWriter(self._expand_path(trace_path))
+        trace = dict(record)
+        trace['host'] = self._conn.get_option('host')
+        trace['timestamp'] = time.time()
+        self._perf_trace.write(json.dumps(trace) + '\n')
+
+    def pop_perf_records(self):
+        """
+        return and forget the request records collected since the previous call
+        """
+        records = self._perf_records
+        self._perf_records = []
+        return records
+
+    def _request_headers(self, data):
+        headers = dict(REQUEST_HEADERS)
+        # form encoded bodies such as the credentials of /logincheck keep the default content type
+        if data and to_text(data[:64]).lstrip()[:1] in ('{', '['):
+            headers['Content-Type'] = 'application/json'
+        if self._transaction_id is not None:
+            headers['X-TRANSACTION-ID'] = str(self._transaction_id)
+        return headers
+
+    def set_transaction(self, transaction_id):
+        """
+        attach every following request to the given FortiOS transaction, None detaches them
+        """
+        self.log('transaction: %s' % (transaction_id))
+        self._transaction_id = transaction_id
+        # changes staged in a transaction may have been committed or discarded
+        self._mkey_indexes = {}
+
+    def get_transaction(self):
+        return self._transaction_id
+
+    def _cmdb_table_key(self, url):
+        """
+        split a cmdb url into the table it belongs to and the path below the table
+        e.g. /api/v2/cmdb/firewall/address/host1?vdom=root -> (('/api/v2/cmdb/firewall/address', 'root'), ['host1'])
+        :return: (None, None) for urls outside of the cmdb
+        """
+        parsed = urllib.parse.urlparse(url)
+        segments = parsed.path.split('/')
+        if len(segments) < 6 or segments[3] != 'cmdb':
+            return None, None
+        query = urllib.parse.parse_qs(parsed.query)
+        scope = 'global' if 'global' in query else query.get('vdom', [None])[0]
+        return ('/'.join(segments[:6]), scope), [urllib.parse.unquote(segment) for segment in segments[6:]]
+
+    def mkey_exists(self, table_url, mkeyname, mkey):
+        """
+        tell whether an object exists from the mkey index of its table, building the index on first use
+        :return: True or False, None when the index is disabled or cannot be built
+        """
+        if not self._get_plugin_option('mkey_index', False) or not mkeyname:
+            return None
+        table_key, dummy = self._cmdb_table_key(table_url)
+        if not table_key:
+            return None
+        index = self._mkey_indexes.get(table_key)
+        if index is None:
+            index = {'mkeyname': mkeyname, 'mkeys': set()}
+            start = 0
+            first = None
+            while True:
+                status, result = self.send_request(url=table_url, json_decode=True,
+                                                   params={'format': mkeyname, 'start': start, 'count': MKEY_INDEX_PAGE_SIZE})
+                if isinstance(result, list) and result:
+                    result = result[0]
+                if status != 200 or not isinstance(result, dict) or not isinstance(result.get('results'), list):
+                    self.log('unable to build the mkey index of %s' % (table_key[0]))
+                    return None
+                page = [str(item.get(mkeyname)) for item in result['results']]
+                # endpoints ignoring start and count serve the whole table, again and again
+                if start and page and page[0] == first:
+                    break
+                index['mkeys'].update(page)
+                if len(page) != MKEY_INDEX_PAGE_SIZE:
+                    break
+                first = page[0]
+                start += MKEY_INDEX_PAGE_SIZE
+            self._mkey_indexes[table_key] = index
+            self.log('mkey index of %s built with %d entries' % (table_key[0], len(index['mkeys'])))
+        return str(mkey) in index['mkeys']
+
+    def _update_mkey_index(self, method, url, data, status):
+        table_key, subpath = self._cmdb_table_key(url)
+        if table_key not in self._mkey_indexes or method == 'GET' or len(subpath) > 1:
+            # requests on child tables leave the objects of the table untouched
+            return
+        index = self._mkey_indexes[table_key]
+        if status != 200:
+            if status not in (400, 404, 405, 424, 500):
+                del self._mkey_indexes[table_key]
+            return
+        if method == 'DELETE' and subpath:
+            index['mkeys'].discard(subpath[0])
+        elif method == 'PUT' and subpath:
+            index['mkeys'].add(subpath[0])
+        elif method == 'POST' and not subpath:
+            try:
+                index['mkeys'].add(str(json.loads(data)[index['mkeyname']]))
+            except (ValueError, TypeError, KeyError):
+                del self._mkey_indexes[table_key]
+        else:
+            del self._mkey_indexes[table_key]
+
+    def _read_cache_enabled(self):
+        return self._get_plugin_option('read_cache_ttl', 0) > 0 and self._transaction_id is None
+
+    def _read_cache_get(self, cache_key):
+        entry = self._read_cache.pop(cache_key, None)
+        if entry is None:
+            return None
+        if entry['expires'] <= time.time():
+            return None
+        # most recently used entries live at the end
+        self._read_cache[cache_key] = entry
+        return entry['response']
+
+    def _read_cache_put(self, cache_key, table_key, response):
+        self._read_cache[cache_key] = {
+            'table': table_key,
+            'expires': time.time() + self._get_plugin_option('read_cache_ttl', 0),
+            'response': response,
+        }
+        while len(self._read_cache) > max(self._get_plugin_option('read_cache_size', 256), 1):
+            self._read_cache.popitem(last=False)
+
+    def _invalidate_read_cache(self, url):
+        if not self._read_cache:
+            return
+        table_key, dummy = self._cmdb_table_key(url)
+        if table_key is None:
+            # monitor actions and transaction commits may change any table
+            self._read_cache.clear()
+            return
+        for cache_key in [cache_key for cache_key, entry in self._read_cache.items() if entry['table'] == table_key]:
+            del self._read_cache[cache_key]
 
     def send_request(self, **message_kwargs):
         """
         Responsible for actual sending of data to the connection httpapi base plugin.
-        :param message_kwargs: A formatted dictionary containing request info: url, data, method
+        :param message_kwargs: A formatted dictionary containing request info: url, data, method,
+            params and json_decode. With json_decode, json responses are returned decoded.
 
         :return: Status code and response data.
         """
@@ -184,18 +920,146 @@ class HttpApi(HttpApiBase):
         data = message_kwargs.get('data', '')
         method = message_kwargs.get('method', 'GET')
         params = message_kwargs.get('params', {})
+        json_decode = message_kwargs.get('json_decode', False)
 
         url = self._concat_params(url, params)
-        self.log('send request: METHOD:%s URL:%s DATA:%s' % (method, url, data))
-        try:
-            response, response_data = self.connection.send(url, data, method=method)
+        session_generation, session_restored = self._session_generation, self._session_restored
+
+        read_cache_key = None
+        if method != 'GET':
+            with self._state_lock:
+                self._read_cache_generation += 1
+                self._invalidate_read_cache(message_kwargs.get('url', '/'))
+        elif self._read_cache_enabled():
+            table_key, dummy = self._cmdb_table_key(message_kwargs.get('url', '/'))
+            if table_key is not None:
+                read_cache_key = (url, json_decode)
+                with self._state_lock:
+                    read_cache_generation = self._read_cache_generation
+                    cached = self._read_cache_get(read_cache_key)
+                if cached is not None:
+                    self.log('read cache hit: URL:%s' % (url), level='debug')
+                    return cached
+
+        if self._log_enabled():
+            self.log('send request: METHOD:%s URL:%s DATA:%s' % (method, url, self._log_body(data)))
+        self._check_circuit_breaker()
+
+        max_attempts = self._get_plugin_option('retry_max_attempts', 1) if method in IDEMPOTENT_METHODS else 1
+        attempt = 0
+        started = time.time()
+        while True:
+            attempt += 1
+            attempt_started = time.time()
+            try:
+                response, response_data = self.connection.send(url, data, method=method, headers=self._request_headers(data))
+                received = time.time()
+                response_data.seek(0, 2)
+                response_size = response_data.tell()
+                body = self._read_response_body(response, response_data)
+                error = None
+            except Exception as err:
+                response = None
+                error = err
+            retryable = error is not None or response.status in self._get_plugin_option('retry_status_codes', RETRY_STATUS_CODES)
+            if not retryable or attempt >= max_attempts:
+                break
+            delay = self._retry_delay(attempt)
+            self.log('request %s %s failed (%s), retrying in %.2f seconds, attempt %d of %d' %
+                     (method, url, to_text(error) if error else 'status %s' % (response.status), delay, attempt + 1, max_attempts))
+            time.sleep(delay)
+        with self._state_lock:
+            # errors of the requests themselves, e.g. 424 for a missing dependency, tell nothing about the device health
+            self._record_circuit_breaker(error is not None or response.status >= 500 or response.status == 429)
+            if method != 'GET':
+                # reads of the table sent by other threads while the write was in flight may have cached the old state
+                self._read_cache_generation += 1
+                self._invalidate_read_cache(message_kwargs.get('url', '/'))
+
+        if error is not None:
+            self.log('request failed: METHOD:%s URL:%s ERROR:%s' % (method, url, to_text(error)), level='error')
+            if attempt > 1:
+                raise Exception('%s (gave up after %d attempts)' % (to_text(error), attempt))
+            raise Exception(error)
+
+        json_formatted = None
+        if json_decode:
+            try:
+                json_formatted = self._decode_json(body)
+            except ValueError:
+                json_formatted = None
+        if json_formatted is None:
+            json_formatted = to_text(body)
+
+        if self._log_enabled():
+            self.log('response status: %s data: %s' % (response.status, self._log_body(to_text(body))))
 
-            json_formatted = to_text(response_data.getvalue())
+        if self._perf_enabled():
+            self._record_perf({
+                'method': method,
+                'path': self._path_template(message_kwargs.get('url', '/')),
+                'status': response.status,
+                'attempts': attempt,
+                'request_bytes': len(data) if data else 0,
+                'response_bytes': response_size,
+                'decoded_bytes': len(body),
+                'transfer_time': round(received - attempt_started, 6),
+                'total_time': round(time.time() - started, 6),
+            })
 
-            self.log("response data: %s" % (json_formatted))
-            return response.status, json_formatted
-        except Exception as err:
-            raise Exception(err)
+        if self._mkey_indexes:
+            with self._state_lock:
+                self._update_mkey_index(method, message_kwargs.get('url', '/'), data, response.status)
+
+        if response.status == 401 and (session_restored or session_generation != self._session_generation):
+            # the cached session is no longer accepted by the device, login again and replay the request;
+            # of the threads of send_requests() rejected together, the first one logs in and the others wait for it
+            with self._state_lock:
+                if session_restored and session_generation == self._session_generation:
+                    self.log('cached session rejected, login again')
+                    self._invalidate_session_cache()
+                    self._conn._auth = None
+                    self._system_version = None
+                    self.login(self._conn.get_option('remote_user'), self._conn.get_option('password'))
+            return self.send_request(**message_kwargs)
+        if read_cache_key is not None and response.status == 200:
+            with self._state_lock:
+                if read_cache_generation == self._read_cache_generation:
+                    self._read_cache_put(read_cache_key, table_key, (response.status, json_formatted))
+        return response.status, json_formatted
+
+    def send_requests(self, requests):
+        """
+        Send several requests at the same time, up to concurrent_requests of them.
+        :param requests: A list of dictionaries of send_request() arguments.
+
+        :return: List of status codes and response data, in the order of the requests.
+        """
+        responses = [None] * len(requests)
+        errors = []
+        pending = queue.Queue()
+        for index in range(len(requests)):
+            pending.put(index)
+
+        def worker():
+            while True:
+                try:
+                    index = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    responses[index] = self.send_request(**requests[index])
+                except Exception as err:
+                    errors.append(err)
+
+        workers = [threading.Thread(target=worker) for dummy in range(min(len(requests), max(self._get_plugin_option('concurrent_requests', 8), 1)))]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return responses
 
     def update_system_version(self):
         """
@@ -204,13 +1068,39 @@ class HttpApi(HttpApiBase):
         check_system_status = self._conn.get_option('check_system_status') if 'check_system_status' in self._conn._options else True
         if not check_system_status or self._system_version:
             return
-        url = '/api/v2/cmdb/system/interface?vdom=root&action=schema'
-        status, result = self.send_request(url=url)
-        result_json = json.loads(result)
-        self._system_version = result_json.get('version', 'undefined')
-        self.log('system version: %s' % (self._system_version))
+        self._probe_system_version()
         self.log('ansible version: %s' % (self._ansible_fos_version))
 
+    def _probe_system_version(self):
+        """
+        detect the system version with the smallest endpoint answering it
+        :return: http status of the last probe sent
+        """
+        status = None
+        for probe_name, url in VERSION_PROBES:
+            status, result = self.send_request(url=url)
+            if status == 401:
+                return status
+            if status != 200:
+                continue
+            try:
+                version = json.loads(result).get('version')
+            except (ValueError, AttributeError):
+                version = None
+            if version:
+                self._system_version = version
+                self._version_probe = probe_name
+                self.log('system version: %s (probe: %s)' % (self._system_version, probe_name))
+                return status
+            self.log('version probe %s did not report a version' % (probe_name))
+        self._system_version = 'undefined'
+        self._version_probe = None
+        self.log('system version: %s' % (self._system_version))
+        return status
+
+    def get_version_probe(self):
+        return self._version_probe
+
     def get_system_version(self):
         self.update_system_version()
         return self._system_version
@@ -0,0 +1,75 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.module_utils.six import string_types
+
+
+def validate_attributes(schema, data, prefix=''):
+    """
+    Check the attributes of an object against the schema of its table reported by the device.
+    :return: List of error messages, empty when the object is valid.
+    """
+    errors = []
+    children = schema.get('children') or {}
+    for attribute, value in data.items():
+        attribute_path = prefix + attribute
+        if attribute not in children:
+            errors.append('%s is not an attribute of the table' % (attribute_path))
+            continue
+        attribute_schema = children[attribute]
+
+        if attribute_schema.get('category') == 'table':
+            if not isinstance(value, list):
+                errors.append('%s must be a list' % (attribute_path))
+                continue
+            for index, entry in enumerate(value):
+                if isinstance(entry, dict):
+                    errors.extend(validate_attributes(attribute_schema, entry, '%s[%d].' % (attribute_path, index)))
+                else:
+                    errors.append('%s[%d] must be a dictionary' % (attribute_path, index))
+            continue
+
+        attribute_type = attribute_schema.get('type')
+        if attribute_type == 'option' and attribute_schema.get('options'):
+            choices = [option['name'] for option in attribute_schema['options']]
+            values = value.split(' ') if isinstance(value, string_types) else [value]
+            invalid_values = [item for item in values if item not in choices]
+            if invalid_values:
+                errors.append('%s: %s not in %s' % (attribute_path, ', '.join(str(item) for item in invalid_values), ', '.join(choices)))
+        elif attribute_type == 'integer':
+            try:
+                number = int(value)
+            except (TypeError, ValueError):
+                errors.append('%s must be an integer' % (attribute_path))
+                continue
+            if 'min-value' in attribute_schema and number < attribute_schema['min-value'] or \
+                    'max-value' in attribute_schema and number > attribute_schema['max-value']:
+                errors.append('%s must be between %s and %s' %
+                              (attribute_path, attribute_schema.get('min-value'), attribute_schema.get('max-value')))
+        elif attribute_type == 'string' and attribute_schema.get('size') and isinstance(value, string_types):
+            if len(value) > attribute_schema['size']:
+                errors.append('%s is longer than %d characters' % (attribute_path, attribute_schema['size']))
+    return errors
+
+
+def item_result(resp, state, **identity):
+    """
+    Outcome of the request applying one object of a batch, identity holds the fields naming the object, e.g. its mkey.
+    """
+    result = dict(identity)
+    result.update({
+        'status': resp.get('status'),
+        'http_method': resp.get('http_method'),
+        'http_status': resp.get('http_status'),
+    })
+    if state == 'absent':
+        result['outcome'] = 'absent' if resp.get('http_status') == 404 else 'deleted'
+        result['succeeded'] = resp.get('status') == 'success' or resp.get('http_status') == 404
+    else:
+        result['outcome'] = {'GET': 'unchanged', 'POST': 'created'}.get(resp.get('http_method'), 'updated')
+        result['succeeded'] = resp.get('status') == 'success'
+    result['changed'] = result['succeeded'] and result['outcome'] in ('created', 'updated', 'deleted')
+    if not result['succeeded']:
+        result['outcome'] = 'failed'
+        result['response'] = resp
+    return result
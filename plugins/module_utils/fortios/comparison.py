@@ -48,6 +48,39 @@ def is_same_ip_address(current_ip, applied_ip):
         return total_bits_current_ip == total_bits_applied_ip
 
 
+def dict_list_key(applied_list):
+    for key, value in applied_list[0].items():
+        if all(type(applied.get(key)) in (str, int) and not (type(applied[key]) == str and IP_PREFIX.match(applied[key]))
+               for applied in applied_list):
+            return key
+    return None
+
+
+def dict_list_bucket(entry, key):
+    value = entry.get(key) if key else None
+    return value if type(value) in (str, int) else None
+
+
+def is_same_dict_list(current_list, applied_list):
+    # every applied entry must match its own current entry, entries are bucketed
+    # by a scalar key such as the name of a member to keep large tables linear
+    key = dict_list_key(applied_list)
+    buckets = {}
+    for current_dict in current_list:
+        buckets.setdefault(dict_list_bucket(current_dict, key), []).append(current_dict)
+
+    for applied_dict in applied_list:
+        candidates = buckets.get(dict_list_bucket(applied_dict, key), [])
+        for index, current_dict in enumerate(candidates):
+            if is_same_comparison(current_dict, applied_dict):
+                del candidates[index]
+                break
+        else:
+            return False
+
+    return True
+
+
 def is_same_comparison(reorder_current, reorder_filtered):
     for key, value in reorder_filtered.items():
         if key not in reorder_current:
@@ -59,14 +92,14 @@ def is_same_comparison(reorder_current, reorder_filtered):
         elif type(value) == list:
             if len(value) != len(reorder_current[key]):
                 return False
-            if type(value[0]) == dict:
-                for current_dict in reorder_current[key]:
-                    if not is_same_comparison(current_dict, value[0]):
-                        return False
+            if len(value) and type(value[0]) == dict:
+                if not is_same_dict_list(reorder_current[key], value):
+                    return False
             elif reorder_current[key] != value:
                 return False
         elif type(value) == str and IP_PREFIX.match(value):
-            return is_same_ip_address(reorder_current[key], value)
+            if not is_same_ip_address(reorder_current[key], value):
+                return False
 
         elif reorder_current[key] != value:
             return False
@@ -39,6 +39,7 @@ import traceback
 from ansible.module_utils._text import to_text
 from ansible.module_utils.basic import env_fallback
 from ansible.module_utils.basic import _load_params
+from ansible.module_utils.six import string_types
 import sys
 import json
 
@@ -47,6 +48,11 @@ try:
 except ImportError:
     import urllib as urlencoding
 
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import is_same_comparison
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import serialize
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import FORTIOS_VERSIONS
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import Revisions
+
 # BEGIN DEPRECATED
 
 # check for pyFG lib
@@ -131,10 +137,51 @@ def schema_to_module_spec(schema):
     return rdata
 
 
-def __check_version(revisions, version):
+# canonical table of the FortiOS versions met in the schemas: every version is interned once,
+# with its bit in the revision bitsets and its ordinal.
+fortios_versions = list()
+fortios_version_bits = dict()
+fortios_version_ordinals = dict()
+__version_support_cache = dict()
+__subtree_support_cache = dict()
+
+
+def __version_bit(version):
+    bit = fortios_version_bits.get(version)
+    if bit is None:
+        major, minor, patch = version.split('.')
+        bit = 1 << len(fortios_versions)
+        fortios_versions.append(version)
+        fortios_version_bits[version] = bit
+        fortios_version_ordinals[version] = int(major[1]) * 10000 + int(minor) * 100 + int(patch)
+    return bit
+
+
+# the versions of the schema registry come first, so that their bits are those of its bitsets
+for fortios_version in FORTIOS_VERSIONS:
+    __version_bit(fortios_version)
+
+
+def revision_bitsets(revisions):
+    """
+    Bitsets of the versions a revision map lists and of those supporting the schema node.
+    """
+    if isinstance(revisions, Revisions):
+        return revisions.present, revisions.supported
+    present = 0
+    supported = 0
+    for version in revisions:
+        bit = __version_bit(version)
+        present |= bit
+        if revisions[version] is True:
+            supported |= bit
+    return present, supported
+
+
+def __version_support(present, supported, version):
+    resolved_versions = [item for item in fortios_versions if present & fortios_version_bits[item]]
+    resolved_versions.sort(key=fortios_version_ordinals.get)
     result = dict()
-    resolved_versions = list(revisions.keys())
-    resolved_versions.sort(key=lambda x: int(x.split('.')[0][1]) * 10000 + int(x.split('.')[1]) * 100 + int(x.split('.')[2]))
     # try to detect the versioning gaps and mark them as violations:
     nearest_index = -1
     for i in range(len(resolved_versions)):
@@ -145,15 +192,15 @@ def __check_version(revisions, version):
         result['supported'] = False
         result['reason'] = 'not supported until in %s' % (resolved_versions[0])
     else:
-        if revisions[resolved_versions[nearest_index]] is False:
+        if not supported & fortios_version_bits[resolved_versions[nearest_index]]:
             latest_index = -1
             for i in range(nearest_index + 1, len(resolved_versions)):
-                if revisions[resolved_versions[i]] is True:
+                if supported & fortios_version_bits[resolved_versions[i]]:
                     latest_index = i
                     break
             earliest_index = nearest_index
             while earliest_index >= 0:
-                if revisions[resolved_versions[earliest_index]] is True:
+                if supported & fortios_version_bits[resolved_versions[earliest_index]]:
                     break
                 earliest_index -= 1
             earliest_index = 0 if earliest_index < 0 else earliest_index
@@ -167,6 +214,34 @@ def __check_version(revisions, version):
     return result
 
 
+def __check_version(revisions, version):
+    # the answer only depends on the bitsets of the node, shared by most nodes of a schema
+    present, supported = revision_bitsets(revisions)
+    key = (present, supported, version)
+    result = __version_support_cache.get(key)
+    if result is None:
+        result = __version_support_cache[key] = __version_support(present, supported, version)
+    return result
+
+
+def __subtree_supported(schema, version):
+    """
+    Whether a schema node, its children and its options are all supported by the version.
+    No value given to such a node can be reported, so its values need not be walked.
+    """
+    key = (id(schema), version)
+    cached = __subtree_support_cache.get(key)
+    if cached is not None:
+        return cached[1]
+    supported = 'revisions' in schema and __check_version(schema['revisions'], version)['supported'] is True
+    if supported:
+        nodes = list(schema.get('children', dict()).values()) + list(schema.get('options', list()))
+        supported = all(__subtree_supported(node, version) for node in nodes)
+    # the node is kept along with the answer, its id cannot be reused while it is cached
+    __subtree_support_cache[key] = (schema, supported)
+    return supported
+
+
 def __concat_attribute_sequence(trace_path):
     rdata = ''
     if type(trace_path) is not list:
@@ -204,6 +279,8 @@ def check_schema_versioning_internal(results, trace, schema, params, version):
                     continue
                 for key in list_item:
                     value = list_item[key]
+                    if __subtree_supported(schema['children'][key], version):
+                        continue
                     key_string = '%s(%s)' % (key, value) if type(value) in [int, bool, str] else key
                     trace.append(key_string)
                     check_schema_versioning_internal(results, trace, schema['children'][key], value, version)
@@ -230,6 +307,8 @@ def check_schema_versioning_internal(results, trace, schema, params, version):
                 dict_item_value = params[dict_item_key]
                 if dict_item_key not in schema['children']:
                     raise AssertionError()
+                if __subtree_supported(schema['children'][dict_item_key], version):
+                    continue
                 key_string = '%s(%s)' % (dict_item_key, dict_item_value) if type(dict_item_value) in [int, bool, str] else dict_item_key
                 trace.append(key_string)
                 check_schema_versioning_internal(results, trace, schema['children'][dict_item_key], dict_item_value, version)
@@ -263,6 +342,8 @@ def check_schema_versioning(fos, versioned_schema, top_level_param):
         param_value = params[param_name]
         if not param_value or param_name not in versioned_schema['children']:
             continue
+        if __subtree_supported(versioned_schema['children'][param_name], system_version):
+            continue
         key_string = '%s(%s)' % (param_name, param_value) if type(param_value) in [int, bool, str] else param_name
         trace.append(key_string)
         check_schema_versioning_internal(results, trace, versioned_schema['children'][param_name], param_value, system_version)
@@ -276,12 +357,70 @@ def check_schema_versioning(fos, versioned_schema, top_level_param):
 # END DEPRECATED
 
 
+def versioned_child_mkeyname(fos, versioned_schema, child):
+    """
+    Attribute keying the entries of a child table on the device version, e.g. id before FortiOS 6.4.0
+    and name since then for the members of a firewall internet-service-group.
+    :return: None when the schema does not tell a single attribute.
+    """
+    version = fos._conn.get_system_version()
+    children = versioned_schema['children'][child].get('children') or dict()
+    keys = [key for key in children if __check_version(children[key]['revisions'], version)['supported'] is True]
+    return keys[0].replace('_', '-') if len(keys) == 1 else None
+
+
+def fortios_sequence_action(data, fos, path, name, check_mode=False):
+    """
+    Move one object (action move) or reorder the objects (action reorder) of a sequenced table, e.g. firewall policies.
+    :return: is_error, has_changed and the response, as returned for the other states of the modules.
+    """
+    if data['action'] == 'move':
+        if not data['self'] or (not data['after'] and not data['before']):
+            fos._module.fail_json(msg='self, after(or before) must not be empty')
+        resp = fos.move(path, name, data['self'], before=data['before'], after=data['after'], vdom=data['vdom'],
+                        check_mode=check_mode)
+    else:
+        if not data['order']:
+            fos._module.fail_json(msg='order must not be empty')
+        resp = fos.reorder(path, name, data['order'], vdom=data['vdom'], check_mode=check_mode)
+    is_error = resp['status'] != 'success'
+    return is_error, not is_error and resp.get('revision_changed', True), resp
+
+
+def fortios_check_mode(data, fos, path, name, filtered_data):
+    """
+    Tell whether the state of a task would change the object of a table, reading it in every virtual domain of the task:
+    the task changes something when one of them misses the object or holds a different one.
+    :return: is_error, has_changed and the data of the task, as returned by the modules in check mode.
+    """
+    state = data['state']
+    if state != 'present' and state is not True and state != 'absent':
+        return True, False, {'reason: ': 'Must provide state parameter'}
+    mkey = fos.get_mkey(path, name, filtered_data, vdom=data['vdom'])
+    if mkey is None:
+        return False, state != 'absent', filtered_data
+
+    current_data = fos.get(path, name, vdom=data['vdom'], mkey=mkey)
+    responses = current_data['vdoms'].values() if 'vdoms' in current_data else [current_data]
+    current_objects = []
+    for resp in responses:
+        is_existed = resp.get('http_status') == 200 and isinstance(resp.get('results'), list) and len(resp['results']) > 0
+        current_objects.append(resp['results'][0] if is_existed else None)
+
+    if state == 'absent':
+        return False, any(current is not None for current in current_objects), filtered_data
+    return False, any(current is None or not is_same_comparison(serialize(current), serialize(filtered_data))
+                      for current in current_objects), filtered_data
+
+
 class FortiOSHandler(object):
 
     def __init__(self, conn, mod, module_mkeyname=None):
         self._conn = conn
         self._module = mod
         self._mkeyname = module_mkeyname
+        self._mkeynames = {}
+        self._all_vdoms = None
 
     def cmdb_url(self, path, name, vdom=None, mkey=None):
 
@@ -318,18 +457,25 @@ class FortiOSHandler(object):
         else:
             url = self.cmdb_url(path, name, vdom=vdom) + "&action=schema"
 
-        status, result_data = self._conn.send_request(url=url)
+        status, result_data = self._conn.send_request(url=url, json_decode=True)
 
+        result_data = self.__to_object(result_data)
         if status == 200:
             if vdom == "global":
-                return json.loads(to_text(result_data))[0]['results']
+                return result_data[0]['results']
             else:
-                return json.loads(to_text(result_data))['results']
+                return result_data['results']
         else:
-            return json.loads(to_text(result_data))
+            return result_data
 
     def get_mkeyname(self, path, name, vdom=None):
-        return self._mkeyname
+        return self._mkeynames.get((path, name), self._mkeyname)
+
+    def set_mkeyname(self, path, name, mkeyname):
+        """
+        mkey name of a table other than the one of the module
+        """
+        self._mkeynames[(path, name)] = mkeyname
 
     def get_mkey(self, path, name, data, vdom=None):
 
@@ -347,87 +493,612 @@ class FortiOSHandler(object):
         slash_index = url.find('/')
         full_url = self.log_url(url[: slash_index], url[slash_index + 1:])
 
-        status, result_data = self._conn.send_request(url=full_url, params=parameters, method='GET')
+        status, result_data = self._conn.send_request(url=full_url, params=parameters, method='GET', json_decode=True)
 
         return self.formatresponse(result_data)
 
     def monitor_get(self, url, vdom=None, parameters=None):
         slash_index = url.find('/')
         full_url = self.mon_url(url[: slash_index], url[slash_index + 1:], vdom)
-        status, result_data = self._conn.send_request(url=full_url, params=parameters, method='GET')
+        status, result_data = self._conn.send_request(url=full_url, params=parameters, method='GET', json_decode=True)
         return self.formatresponse(result_data, vdom=vdom)
 
     def monitor_post(self, url, data=None, vdom=None, mkey=None, parameters=None):
         slash_index = url.find('/')
         url = self.mon_url(url[: slash_index], url[slash_index + 1:], vdom)
 
-        status, result_data = self._conn.send_request(url=url, params=parameters, data=json.dumps(data), method='POST')
+        status, result_data = self._conn.send_request(url=url, params=parameters, data=json.dumps(data), method='POST', json_decode=True)
 
         return self.formatresponse(result_data, vdom=vdom)
 
     def get(self, path, name, vdom=None, mkey=None, parameters=None):
-        url = self.cmdb_url(path, name, vdom, mkey=mkey)
-
-        status, result_data = self._conn.send_request(url=url, params=parameters, method='GET')
-
-        return self.formatresponse(result_data, vdom=vdom)
+        return self.__apply(vdom, lambda one_vdom: self.__request_steps(
+            one_vdom, url=self.cmdb_url(path, name, one_vdom, mkey=mkey), params=parameters, method='GET'))
 
     def monitor(self, path, name, vdom=None, mkey=None, parameters=None):
         url = self.mon_url(path, name, vdom, mkey)
 
-        status, result_data = self._conn.send_request(url=url, params=parameters, method='GET')
+        status, result_data = self._conn.send_request(url=url, params=parameters, method='GET', json_decode=True)
 
         return self.formatresponse(result_data, vdom=vdom)
 
+    def iter_table(self, path, name, vdom=None, page_size=1000, parameters=None):
+        """
+        Yield the objects of a CMDB table, fetching page_size objects per request
+        so that neither the device nor the module holds more than one page at a time.
+        """
+        return self.__iter_pages(self.cmdb_url(path, name, vdom), vdom, page_size, parameters)
+
+    def iter_monitor(self, path, name, vdom=None, page_size=1000, parameters=None):
+        """
+        Yield the entries of a monitor table page by page, see iter_table().
+        """
+        return self.__iter_pages(self.mon_url(path, name, vdom), vdom, page_size, parameters)
+
+    def __iter_pages(self, url, vdom, page_size, parameters):
+        start = 0
+        first = None
+        while True:
+            page_parameters = dict(parameters or {})
+            page_parameters['start'] = start
+            page_parameters['count'] = page_size
+            status, result_data = self._conn.send_request(url=url, params=page_parameters, method='GET', json_decode=True)
+            resp = self.formatresponse(result_data, vdom=vdom)
+            results = resp.get('results')
+            if status != 200 or not isinstance(results, list):
+                self._module.fail_json(msg='Unable to read the page of %s starting at %d' % (url, start), meta=resp)
+            # endpoints ignoring start and count serve the whole table, again and again
+            if start and results and results[0] == first:
+                return
+            for result in results:
+                yield result
+            if len(results) != page_size:
+                return
+            first = results[0]
+            start += page_size
+
     def set(self, path, name, data, mkey=None, vdom=None, parameters=None):
+        return self.__apply(vdom, lambda one_vdom: self.__set_steps(path, name, data, mkey, one_vdom, parameters))
 
+    def __set_steps(self, path, name, data, mkey, vdom, parameters):
         if not mkey:
             mkey = self.get_mkey(path, name, data, vdom=vdom)
         url = self.cmdb_url(path, name, vdom, mkey)
 
-        status, result_data = self._conn.send_request(url=url, params=parameters, data=json.dumps(data), method='PUT')
-
-        if parameters and 'action' in parameters and parameters['action'] == 'move':
-            return self.formatresponse(result_data, vdom=vdom)
-
-        if status == 404 or status == 405 or status == 500:
-            return self.post(path, name, data, vdom, mkey)
-        else:
-            return self.formatresponse(result_data, vdom=vdom)
+        is_move = parameters and 'action' in parameters and parameters['action'] == 'move'
+        existed = None
+        if mkey and not is_move:
+            # True or False when the connection keeps an mkey index of the table, None otherwise
+            existed = self._conn.mkey_exists(self.cmdb_url(path, name, vdom), self.get_mkeyname(path, name, vdom), mkey)
+
+        put_data = data
+        partial_update = self._module.params.get('partial_update')
+        # a table object can only be compared when its mkey is known
+        if existed is not False and not is_move and (partial_update or self._module.params.get('skip_unchanged')) \
+                and (mkey or not self.get_mkeyname(path, name, vdom)):
+            status, result_data = yield self.__request(url=url, params=self.__projection(path, name, data, vdom), method='GET')
+            current_data = self.formatresponse(result_data, vdom=vdom)
+            current = current_data.get('results')
+            if isinstance(current, list):
+                current = current[0] if current else None
+            if current_data.get('http_status') == 200 and isinstance(current, dict):
+                changed_data = self.changed_attributes(current, data)
+                if not changed_data:
+                    current_data['revision_changed'] = False
+                    yield 'response', current_data
+                if partial_update:
+                    put_data = changed_data
+                existed = True
+            elif mkey and current_data.get('http_status') == 404:
+                existed = False
+
+        if existed is not False:
+            status, result_data = yield self.__request(url=url, params=parameters, data=json.dumps(put_data), method='PUT')
+
+            # without an index, a failed PUT is the only hint that the object does not exist yet
+            if is_move or not (existed is None and status in (404, 405, 500) or existed and status == 404):
+                yield 'response', self.formatresponse(result_data, vdom=vdom)
+
+        status, result_data = yield self.__post_request(path, name, data, vdom, mkey)
+        yield 'response', self.formatresponse(result_data, vdom=vdom)
+
+    def __projection(self, path, name, data, vdom=None):
+        """
+        read only the attributes managed by the task, and the mkey, when comparing an object
+        """
+        fields = list(data.keys())
+        mkeyname = self.get_mkeyname(path, name, vdom)
+        if mkeyname and mkeyname not in fields:
+            fields.append(mkeyname)
+        return {'format': fields} if fields else None
+
+    def changed_attributes(self, current, data):
+        """
+        Top level attributes of data which differ from the current object.
+        Child tables are returned whole, FortiOS replaces them on update.
+        """
+        current = serialize(current)
+        return dict((key, value) for key, value in data.items()
+                    if not is_same_comparison(current, {key: serialize(value)}))
 
     def post(self, path, name, data, vdom=None,
              mkey=None, parameters=None):
+        return self.__apply(vdom, lambda one_vdom: self.__request_steps(
+            one_vdom, **self.__post_request(path, name, data, one_vdom, mkey, parameters)[1]))
 
+    def __post_request(self, path, name, data, vdom, mkey, parameters=None):
         if mkey:
             mkeyname = self.get_mkeyname(path, name, vdom)
             data[mkeyname] = mkey
 
-        url = self.cmdb_url(path, name, vdom, mkey=None)
-
-        status, result_data = self._conn.send_request(url=url, params=parameters, data=json.dumps(data), method='POST')
-
-        return self.formatresponse(result_data, vdom=vdom)
+        return self.__request(url=self.cmdb_url(path, name, vdom, mkey=None), params=parameters, data=json.dumps(data), method='POST')
 
     def execute(self, path, name, data, vdom=None,
                 mkey=None, parameters=None, timeout=300):
         url = self.mon_url(path, name, vdom, mkey=mkey)
 
-        status, result_data = self._conn.send_request(url=url, params=parameters, data=json.dumps(data), method='POST', timeout=timeout)
+        status, result_data = self._conn.send_request(url=url, params=parameters, data=json.dumps(data), method='POST', timeout=timeout, json_decode=True)
 
         return self.formatresponse(result_data, vdom=vdom)
 
     def delete(self, path, name, vdom=None, mkey=None, parameters=None, data=None):
         if not mkey:
             mkey = self.get_mkey(path, name, data, vdom=vdom)
-        url = self.cmdb_url(path, name, vdom, mkey)
-        status, result_data = self._conn.send_request(url=url, params=parameters, data=json.dumps(data), method='DELETE')
+        return self.__apply(vdom, lambda one_vdom: self.__request_steps(
+            one_vdom, url=self.cmdb_url(path, name, one_vdom, mkey), params=parameters, data=json.dumps(data), method='DELETE'))
+
+    def set_objects(self, path, name, objects, vdom=None, batch_size=100):
+        """
+        Create or update several objects of a table, sending the requests of batch_size objects together.
+        :return: List of formatted responses, in the order of the objects.
+        """
+        return self.__apply_objects(objects, batch_size, lambda data: self.__set_steps(path, name, data, None, vdom, None))
+
+    def delete_objects(self, path, name, mkeys, vdom=None, batch_size=100):
+        """
+        Delete several objects of a table, see set_objects().
+        """
+        return self.__apply_objects(mkeys, batch_size, lambda mkey: self.__request_steps(
+            vdom, url=self.cmdb_url(path, name, vdom, mkey), method='DELETE'))
+
+    def override_table(self, path, name, objects, vdom=None, batch_size=100, keep=None):
+        """
+        Make a table hold exactly the given objects: the table is read once, missing objects are created,
+        differing ones updated and the others deleted, in rounds so that an object is deleted once the
+        objects referring to it are gone. The objects of the mkeys in keep are left as they are.
+        :return: The formatted responses of the objects, in their order, and the mkeys deleted with their responses.
+        """
+        mkeyname = self.get_mkeyname(path, name, vdom)
+        fields = [mkeyname]
+        for data in objects:
+            fields.extend(key for key in data if key not in fields)
+        current = {}
+        for item in self.iter_table(path, name, vdom=vdom, parameters={'format': fields, 'with_meta': 1}):
+            current[str(item.get(mkeyname))] = item
+
+        responses = self.__apply_objects(objects, batch_size, lambda data: self.__override_steps(
+            path, name, data, current.get(str(data.get(mkeyname))), vdom))
+
+        wanted = set(str(data.get(mkeyname)) for data in objects) | set(str(mkey) for mkey in keep or [])
+        # objects nobody refers to go first
+        unwanted = sorted((item for mkey, item in current.items() if mkey not in wanted), key=lambda item: item.get('q_ref') or 0)
+        pending = [item.get(mkeyname) for item in unwanted]
+        deleted = {}
+        while pending:
+            failed = []
+            for mkey, resp in zip(pending, self.delete_objects(path, name, pending, vdom=vdom, batch_size=batch_size)):
+                deleted[str(mkey)] = resp
+                if resp.get('status') != 'success' and resp.get('http_status') != 404:
+                    failed.append(mkey)
+            # a round deleting nothing leaves objects referred to from outside of the table
+            if len(failed) == len(pending):
+                break
+            pending = failed
+        return responses, [(item.get(mkeyname), deleted[str(item.get(mkeyname))]) for item in unwanted]
+
+    def __override_steps(self, path, name, data, current, vdom):
+        mkey = self.get_mkey(path, name, data, vdom=vdom)
+        if current is None:
+            status, result_data = yield self.__post_request(path, name, data, vdom, mkey)
+        else:
+            changed_data = self.changed_attributes(current, data)
+            if not changed_data:
+                yield 'response', {'status': 'success', 'http_method': 'GET', 'http_status': 200, 'revision_changed': False,
+                                   'mkey': mkey, 'vdom': vdom}
+            if self._module.params.get('partial_update'):
+                data = changed_data
+            status, result_data = yield self.__request(url=self.cmdb_url(path, name, vdom, mkey), data=json.dumps(data), method='PUT')
+        yield 'response', self.formatresponse(result_data, vdom=vdom)
+
+    def move(self, path, name, mkey, before=None, after=None, vdom=None, check_mode=False):
+        """
+        Move an object of a sequenced table right before or right after another one.
+        In check mode, the table is read to tell whether the object would move and nothing is changed.
+        """
+        if check_mode:
+            return self.__apply(vdom, lambda one_vdom: self.__move_check_steps(path, name, str(mkey), before, after, one_vdom))
+        parameters = {'action': 'move'}
+        if after:
+            parameters['after'] = after
+        if before:
+            parameters['before'] = before
+        return self.set(path, name, data=None, mkey=mkey, vdom=vdom, parameters=parameters)
+
+    def __move_check_steps(self, path, name, mkey, before, after, vdom):
+        mkeyname = self.get_mkeyname(path, name, vdom)
+        current = []
+        while True:
+            status, result_data = yield self.__request(url=self.cmdb_url(path, name, vdom), method='GET',
+                                                       params={'format': [mkeyname], 'start': len(current), 'count': 1000})
+            resp = self.formatresponse(result_data, vdom=vdom)
+            if status != 200 or not isinstance(resp.get('results'), list):
+                yield 'response', resp
+            page = [str(item.get(mkeyname)) for item in resp['results']]
+            # endpoints ignoring start and count serve the whole table, again and again
+            if current and page and page[0] == current[-1000]:
+                break
+            current.extend(page)
+            if len(page) != 1000:
+                break
+
+        position = dict((item, index) for index, item in enumerate(current))
+        unknown = [str(item) for item in (mkey, after, before) if item and str(item) not in position]
+        if unknown:
+            yield 'response', {'status': 'error', 'http_method': 'GET', 'http_status': 200, 'vdom': vdom,
+                               'message': 'unknown %s of %s %s: %s' % (mkeyname, path, name, ', '.join(unknown))}
+        moved = after and position[mkey] != position[str(after)] + 1 or before and position[mkey] + 1 != position[str(before)]
+        yield 'response', {'status': 'success', 'http_method': 'PUT' if moved else 'GET', 'http_status': 200,
+                           'revision_changed': bool(moved), 'vdom': vdom}
+
+    def reorder(self, path, name, order, vdom=None, check_mode=False):
+        """
+        Put the objects of a sequenced table, e.g. firewall policies, in the given order with as few moves
+        as possible: the objects already in order, the longest increasing subsequence, stay in place
+        and every other one is moved next to its predecessor.
+        Objects missing from order keep their place. In check mode, the moves are computed and not sent.
+        """
+        return self.__apply(vdom, lambda one_vdom: self.__reorder_steps(path, name, [str(mkey) for mkey in order], one_vdom, check_mode))
+
+    def __reorder_steps(self, path, name, order, vdom, check_mode):
+        mkeyname = self.get_mkeyname(path, name, vdom)
+        current = []
+        while True:
+            status, result_data = yield self.__request(url=self.cmdb_url(path, name, vdom), method='GET',
+                                                       params={'format': [mkeyname], 'start': len(current), 'count': 1000})
+            resp = self.formatresponse(result_data, vdom=vdom)
+            if status != 200 or not isinstance(resp.get('results'), list):
+                yield 'response', resp
+            page = [str(item.get(mkeyname)) for item in resp['results']]
+            # endpoints ignoring start and count serve the whole table, again and again
+            if current and page and page[0] == current[-1000]:
+                break
+            current.extend(page)
+            if len(page) != 1000:
+                break
+
+        position = dict((mkey, index) for index, mkey in enumerate(current))
+        unknown = [mkey for mkey in order if mkey not in position]
+        if unknown or len(set(order)) != len(order):
+            yield 'response', {'status': 'error', 'http_method': 'GET', 'http_status': 200, 'vdom': vdom,
+                               'message': 'order must list distinct %s of %s %s, unknown: %s' % (mkeyname, path, name, ', '.join(unknown))}
+
+        wanted = set(order)
+        moves = self.__minimal_moves([mkey for mkey in current if mkey in wanted], order)
+        resp = {'status': 'success', 'http_method': 'PUT' if moves else 'GET', 'http_status': 200,
+                'revision_changed': bool(moves), 'vdom': vdom, 'moves': moves}
+        if check_mode:
+            yield 'response', resp
+
+        for move in moves:
+            parameters = dict(move)
+            parameters['action'] = 'move'
+            del parameters['self']
+            status, result_data = yield self.__request(url=self.cmdb_url(path, name, vdom, move['self']), params=parameters,
+                                                       method='PUT')
+            move_resp = self.formatresponse(result_data, vdom=vdom)
+            if move_resp.get('status') != 'success':
+                move_resp['moves'] = moves
+                move_resp['failed_move'] = move
+                yield 'response', move_resp
+        yield 'response', resp
+
+    def __minimal_moves(self, current, order):
+        """
+        moves turning current into order, both list the same mkeys
+        """
+        rank = dict((mkey, index) for index, mkey in enumerate(order))
+        ranks = [rank[mkey] for mkey in current]
+        # longest increasing subsequence of the ranks, in O(n log n)
+        tails = []
+        tail_indexes = []
+        previous = [None] * len(ranks)
+        for index, value in enumerate(ranks):
+            low, high = 0, len(tails)
+            while low < high:
+                middle = (low + high) // 2
+                if tails[middle] < value:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low == len(tails):
+                tails.append(value)
+                tail_indexes.append(index)
+            else:
+                tails[low] = value
+                tail_indexes[low] = index
+            previous[index] = tail_indexes[low - 1] if low else None
+        staying = set()
+        index = tail_indexes[-1] if tail_indexes else None
+        while index is not None:
+            staying.add(current[index])
+            index = previous[index]
+
+        moves = []
+        for index, mkey in enumerate(order):
+            if mkey in staying:
+                continue
+            if index:
+                moves.append({'self': mkey, 'after': order[index - 1]})
+            else:
+                moves.append({'self': mkey, 'before': next(item for item in order if item in staying)})
+        return moves
+
+    def set_members(self, path, name, data, child, child_mkeyname, member_state, vdom=None, check_mode=False, batch_size=100):
+        """
+        Add (present) or remove (absent) the entries of a child table listed in data, e.g. the members of a group,
+        with one small request each on the endpoint of the child table instead of a PUT of the whole list.
+        The other attributes of data are set as usual, an object which does not exist yet is created with data.
+        """
+        vdoms = self.vdoms(vdom)
+        if vdoms is None:
+            return self.__set_members(path, name, data, child, child_mkeyname, member_state, vdom, check_mode, batch_size)
+        return self.__aggregate(vdoms, dict((one_vdom, self.__set_members(
+            path, name, data, child, child_mkeyname, member_state, one_vdom, check_mode, batch_size)) for one_vdom in vdoms))
+
+    def __child_url(self, path, name, vdom, mkey, child, child_mkey=None):
+        url = self.cmdb_url(path, name, mkey=mkey) + '/' + child
+        if child_mkey is not None:
+            url += '/' + urlencoding.quote(str(child_mkey), safe='')
+        if vdom:
+            url += '?global=1' if vdom == "global" else '?vdom=' + vdom
+        return url
+
+    def __set_members(self, path, name, data, child, child_mkeyname, member_state, vdom, check_mode, batch_size):
+        mkey = self.get_mkey(path, name, data, vdom=vdom)
+        status, result_data = self._conn.send_request(url=self.__child_url(path, name, vdom, mkey, child),
+                                                      params={'format': [child_mkeyname]}, method='GET', json_decode=True)
+        resp = self.formatresponse(result_data, vdom=vdom)
+        if status == 404:
+            # the object itself does not exist
+            if member_state == 'absent' or check_mode:
+                return {'status': 'success', 'http_method': 'GET', 'http_status': 200, 'vdom': vdom, 'mkey': mkey,
+                        'revision_changed': member_state != 'absent'}
+            return self.set(path, name, data, vdom=vdom)
+        if status != 200 or not isinstance(resp.get('results'), list):
+            return resp
+
+        current = set(str(entry.get(child_mkeyname)) for entry in resp['results'])
+        entries = [entry for entry in data[child] if (str(entry.get(child_mkeyname)) in current) == (member_state == 'absent')]
+        resp = {'status': 'success', 'http_method': 'GET', 'http_status': 200, 'vdom': vdom, 'mkey': mkey,
+                'revision_changed': bool(entries), child: [entry.get(child_mkeyname) for entry in entries]}
+        if check_mode:
+            return resp
+
+        if member_state == 'absent':
+            responses = self.__apply_objects(entries, batch_size, lambda entry: self.__request_steps(
+                vdom, url=self.__child_url(path, name, vdom, mkey, child, entry.get(child_mkeyname)), method='DELETE'))
+        else:
+            responses = self.__apply_objects(entries, batch_size, lambda entry: self.__request_steps(
+                vdom, url=self.__child_url(path, name, vdom, mkey, child), data=json.dumps(entry), method='POST'))
+        failed = [(entry.get(child_mkeyname), entry_resp) for entry, entry_resp in zip(entries, responses) if entry_resp.get('status') != 'success']
+        if responses:
+            resp['http_method'] = 'DELETE' if member_state == 'absent' else 'POST'
+        if failed:
+            resp['status'] = 'error'
+            resp['http_status'] = failed[0][1].get('http_status')
+            resp['failed'] = dict(failed)
+            return resp
+
+        others = dict((key, value) for key, value in data.items() if key != child)
+        if len(others) > 1:
+            others_resp = self.set(path, name, others, vdom=vdom)
+            others_resp['revision_changed'] = resp['revision_changed'] or others_resp.get('revision_changed', True)
+            others_resp[child] = resp[child]
+            return others_resp
+        return resp
+
+    def schemas(self, tables, vdom=None):
+        """
+        Read the schemas of several tables, given as (path, name) pairs, at the same time.
+        :return: Dictionary of the schema of every table, None for the tables whose schema could not be read.
+        """
+        responses = self.__apply_objects(tables, len(tables) or 1, lambda table: self.__request_steps(
+            vdom, url=self.cmdb_url(table[0], table[1], vdom), params={'action': 'schema'}, method='GET'))
+        return dict((table, resp.get('results') if resp.get('http_status') == 200 and isinstance(resp.get('results'), dict) else None)
+                    for table, resp in zip(tables, responses))
+
+    def apply_objects(self, items, vdom=None, batch_size=100):
+        """
+        Create, update or delete objects of several tables, see set_objects().
+        :param items: Dictionaries with the path, name, state (present or absent) and data of each object.
+        """
+        return self.__apply_objects(items, batch_size, lambda item: self.__set_steps(
+            item['path'], item['name'], item['data'], None, vdom, None) if item['state'] == 'present' else self.__request_steps(
+            vdom, url=self.cmdb_url(item['path'], item['name'], vdom, self.get_mkey(item['path'], item['name'], item['data'], vdom)),
+            method='DELETE'))
+
+    def get_objects(self, items, vdom=None, batch_size=100):
+        """
+        Read objects of several tables, see set_objects(). The whole table is read for tables without mkey.
+        :param items: Dictionaries with the path, name and data of each object.
+        """
+        return self.__apply_objects(items, batch_size, lambda item: self.__request_steps(
+            vdom, url=self.cmdb_url(item['path'], item['name'], vdom, self.get_mkey(item['path'], item['name'], item['data'], vdom)),
+            method='GET'))
+
+    def __apply_objects(self, items, batch_size, steps):
+        responses = []
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            batch_responses = self.__drive(dict((index, steps(item)) for index, item in enumerate(batch)))
+            responses.extend(batch_responses[index] for index in range(len(batch)))
+        return responses
+
+    def vdoms(self, vdom):
+        """
+        Split the virtual domains of a task: a list, a comma separated list or "*" for all of them.
+        :return: None when vdom names a single virtual domain
+        """
+        if isinstance(vdom, list):
+            return vdom
+        if not isinstance(vdom, string_types) or vdom != '*' and ',' not in vdom:
+            return None
+        if vdom == '*':
+            if self._all_vdoms is None:
+                resp = self.get('system', 'vdom', vdom='global', parameters={'format': ['name']})
+                if resp.get('http_status') != 200 or not isinstance(resp.get('results'), list):
+                    self._module.fail_json(msg='Unable to list the virtual domains', meta=resp)
+                self._all_vdoms = [item['name'] for item in resp['results']]
+            return self._all_vdoms
+        vdoms = [one_vdom.strip() for one_vdom in vdom.split(',') if one_vdom.strip()]
+        if not vdoms:
+            self._module.fail_json(msg='No virtual domain in %s' % (vdom))
+        return vdoms
+
+    def __request(self, **request):
+        request['json_decode'] = True
+        return 'request', request
+
+    def __request_steps(self, vdom, **request):
+        status, result_data = yield self.__request(**request)
+        yield 'response', self.formatresponse(result_data, vdom=vdom)
+
+    def __apply(self, vdom, steps):
+        """
+        Run the steps of an operation once per virtual domain.
+        Steps are generators yielding ('request', send_request() arguments), which receive the
+        status and data of the response, until they yield ('response', formatted response).
+        The pending requests of all the virtual domains are sent together.
+        """
+        vdoms = self.vdoms(vdom)
+        if vdoms is None:
+            return self.__drive({vdom: steps(vdom)})[vdom]
+        return self.__aggregate(vdoms, self.__drive(dict((one_vdom, steps(one_vdom)) for one_vdom in vdoms)))
+
+    def __drive(self, operations):
+        responses = {}
+        pending = {}
+
+        def advance(key, operation, reply):
+            kind, value = operation.send(reply)
+            if kind == 'request':
+                pending[key] = (operation, value)
+            else:
+                responses[key] = value
+
+        for key, operation in operations.items():
+            advance(key, operation, None)
+        while pending:
+            keys = list(pending)
+            if len(keys) == 1:
+                replies = [self._conn.send_request(**pending[keys[0]][1])]
+            else:
+                replies = self._conn.send_requests([pending[key][1] for key in keys])
+            for key, reply in zip(keys, replies):
+                advance(key, pending.pop(key)[0], reply)
+        return responses
+
+    def __aggregate(self, vdoms, responses):
+        """
+        merge the responses of the virtual domains, which are kept under the vdoms key
+        """
+        failed = [one_vdom for one_vdom in vdoms if not self.__succeeded(responses[one_vdom])]
+        first = responses[failed[0] if failed else vdoms[0]]
+        resp = {
+            'status': 'error' if failed else 'success',
+            'http_method': first.get('http_method'),
+            'http_status': first.get('http_status'),
+            'revision_changed': any(responses[one_vdom].get('status') == 'success' and responses[one_vdom].get('revision_changed', True)
+                                    for one_vdom in vdoms),
+            'vdom': ','.join(vdoms),
+            'vdoms': responses,
+        }
+        if all(isinstance(responses[one_vdom].get('results'), list) for one_vdom in vdoms):
+            resp['results'] = [result for one_vdom in vdoms for result in responses[one_vdom]['results']]
+        return resp
+
+    def __succeeded(self, resp):
+        return resp.get('status') == 'success' or resp.get('http_method') == 'DELETE' and resp.get('http_status') == 404
+
+    def __transaction_request(self, action, data=None, vdom=None):
+        url = '/api/v2/cmdb/'
+        if vdom:
+            url += '?global=1' if vdom == "global" else '?vdom=' + vdom
+        status, result_data = self._conn.send_request(url=url, params={'action': action}, data=json.dumps(data), method='POST',
+                                                      json_decode=True)
         return self.formatresponse(result_data, vdom=vdom)
 
+    def transaction_start(self, vdom=None, timeout=60):
+        """
+        Open a FortiOS transaction (6.4.0+), the following requests of the connection, including the ones
+        of later tasks, are staged until transaction_commit() or transaction_abort() is called.
+        """
+        if self._conn.get_transaction() is not None:
+            return {'status': 'error', 'message': 'transaction %s is already in progress' % (self._conn.get_transaction())}
+        resp = self.__transaction_request('transaction-start', data={'timeout': timeout}, vdom=vdom)
+        results = resp.get('results')
+        transaction_id = None
+        if resp['status'] == 'success' and isinstance(results, dict):
+            transaction_id = results.get('transaction_id', results.get('transaction-id'))
+        if transaction_id is None:
+            resp['status'] = 'error'
+            return resp
+        self._conn.set_transaction(transaction_id)
+        resp['transaction_id'] = transaction_id
+        return resp
+
+    def transaction_commit(self, vdom=None):
+        return self.__transaction_end('transaction-commit', vdom)
+
+    def transaction_abort(self, vdom=None):
+        return self.__transaction_end('transaction-abort', vdom)
+
+    def __transaction_end(self, action, vdom=None):
+        transaction_id = self._conn.get_transaction()
+        if transaction_id is None:
+            return {'status': 'error', 'message': 'no transaction in progress'}
+        try:
+            resp = self.__transaction_request(action, vdom=vdom)
+        finally:
+            # the transaction is over on the device side whether it was applied or not,
+            # and it is useless to the following requests when the device cannot be reached
+            self._conn.set_transaction(None)
+        resp['transaction_id'] = transaction_id
+        return resp
+
+    def transaction_release(self, vdom=None):
+        """
+        Abort the transaction still attached to the connection, if any, e.g. when a task fails halfway.
+        The connection is detached from the transaction even when the abort cannot be sent.
+        """
+        if self._conn.get_transaction() is None:
+            return None
+        try:
+            return self.transaction_abort(vdom=vdom)
+        except Exception:
+            return None
+
+    def __to_object(self, data):
+        # the connection decodes json responses already, only raw responses arrive as text
+        if isinstance(data, (dict, list)):
+            return data
+        return json.loads(to_text(data))
+
     def __to_local(self, data, is_array=False):
         try:
-            resp = json.loads(data)
+            resp = self.__to_object(data)
         except Exception:
-            resp = {'raw': data}
+            resp = {'raw': to_text(data)}
         if is_array and type(resp) is not list:
             resp = [resp]
         if is_array and 'status' not in resp[0]:
@@ -438,12 +1109,28 @@ class FortiOSHandler(object):
 
     def formatresponse(self, res, vdom=None):
         if vdom == "global":
-            resp = self.__to_local(to_text(res), True)[0]
+            resp = self.__to_local(res, True)[0]
             resp['vdom'] = "global"
         else:
-            resp = self.__to_local(to_text(res), False)
+            resp = self.__to_local(res, False)
         return resp
 
+    def perf_report(self):
+        """
+        Requests issued for the task, as module result keys.
+        Empty unless the connection records them, see the perf_stats option of the httpapi plugin.
+        """
+        records = self._conn.pop_perf_records()
+        if not records:
+            return {}
+        summary = {
+            'requests': len(records),
+            'request_bytes': sum(record['request_bytes'] for record in records),
+            'response_bytes': sum(record['response_bytes'] for record in records),
+            'total_time': round(sum(record['total_time'] for record in records), 6),
+        }
+        return {'perf': {'summary': summary, 'requests': records}}
+
     def jsonraw(self, method, path, data, specific_params, vdom=None, parameters=None):
         url = path
         bvdom = False
@@ -459,7 +1146,7 @@ class FortiOSHandler(object):
             else:
                 url += "?"
             url += specific_params
-        status, result_data = self._conn.send_request(url=url, method=method, data=json.dumps(data), params=parameters)
+        status, result_data = self._conn.send_request(url=url, method=method, data=json.dumps(data), params=parameters, json_decode=True)
         return self.formatresponse(result_data, vdom=vdom)
 
 # BEGIN DEPRECATED
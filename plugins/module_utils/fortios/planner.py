@@ -0,0 +1,115 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.module_utils.six import string_types
+
+
+def datasource_table(datasource):
+    """
+    table referred to by a datasource of the device schema, e.g. vpn.ssl.web.portal.name -> ('vpn.ssl.web', 'portal')
+    """
+    segments = datasource.split('.')
+    if len(segments) < 3:
+        return None
+    return '.'.join(segments[:-2]), segments[-2]
+
+
+def attribute_references(schema, data):
+    """
+    (table, mkey) pairs referred to by the attributes of data, child tables included
+    """
+    references = []
+    children = schema.get('children') or {}
+    for attribute, value in data.items():
+        attribute_schema = children.get(attribute)
+        if not attribute_schema:
+            continue
+        if attribute_schema.get('category') == 'table':
+            for entry in value if isinstance(value, list) else []:
+                if isinstance(entry, dict):
+                    references.extend(attribute_references(attribute_schema, entry))
+            continue
+        tables = [datasource_table(datasource) for datasource in attribute_schema.get('datasource') or []]
+        tables = [table for table in tables if table]
+        if not tables or value in (None, ''):
+            continue
+        values = value.split(' ') if isinstance(value, string_types) else [value]
+        for table in tables:
+            references.extend((table, str(item).strip('"')) for item in values if item != '')
+    return references
+
+
+def table_references(schema):
+    """
+    tables any attribute of a table may refer to
+    """
+    tables = set()
+    for attribute_schema in (schema.get('children') or {}).values():
+        if attribute_schema.get('category') == 'table':
+            tables.update(table_references(attribute_schema))
+        for datasource in attribute_schema.get('datasource') or []:
+            table = datasource_table(datasource)
+            if table:
+                tables.add(table)
+    return tables
+
+
+def layers(nodes, dependencies):
+    """
+    Group nodes in layers whose nodes only depend on nodes of the previous layers.
+    :param dependencies: node -> set of nodes it depends on, nodes outside of nodes are ignored.
+
+    :return: List of layers and the nodes left over by a dependency cycle.
+    """
+    known = set(nodes)
+    remaining = dict((node, set(dependency for dependency in dependencies.get(node, ()) if dependency in known and dependency != node))
+                     for node in nodes)
+    result = []
+    while remaining:
+        layer = [node for node in nodes if node in remaining and not remaining[node]]
+        if not layer:
+            break
+        result.append(layer)
+        for node in layer:
+            del remaining[node]
+        done = set(layer)
+        for node in remaining:
+            remaining[node] -= done
+    return result, [node for node in nodes if node in remaining]
+
+
+def plan(items, schemas, mkeynames):
+    """
+    Order the objects of several tables by the references between them.
+    Objects to create or update go first, each one after the objects it refers to. Objects to delete go last,
+    table by table, those of a table before those of the tables it may refer to.
+    :param items: dictionaries with path, name, state and the hyphenated data of each object.
+    :param schemas: device schema of every (path, name) table.
+    :param mkeynames: mkey name of every (path, name) table.
+
+    :return: List of layers of item indexes, and the indexes of the items in a dependency cycle.
+    """
+    defined = {}
+    for index, item in enumerate(items):
+        if item['state'] == 'present':
+            table = (item['path'], item['name'])
+            defined[(table, str(item['data'].get(mkeynames[table])))] = index
+
+    present = [index for index, item in enumerate(items) if item['state'] == 'present']
+    dependencies = {}
+    for index in present:
+        item = items[index]
+        references = attribute_references(schemas[(item['path'], item['name'])], item['data'])
+        dependencies[index] = set(defined[reference] for reference in references if reference in defined)
+    present_layers, cycle = layers(present, dependencies)
+
+    absent = [index for index, item in enumerate(items) if item['state'] != 'present']
+    tables = sorted(set((items[index]['path'], items[index]['name']) for index in absent))
+    # a table is emptied once the tables referring to it are
+    referrers = dict((table, set(other for other in tables if other != table and table in table_references(schemas[other])))
+                     for table in tables)
+    table_layers, table_cycle = layers(tables, referrers)
+    table_layers.append(table_cycle)
+    absent_layers = [[index for index in absent if (items[index]['path'], items[index]['name']) in layer] for layer in table_layers]
+
+    return present_layers + [layer for layer in absent_layers if layer], cycle
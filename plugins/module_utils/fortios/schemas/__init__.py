@@ -0,0 +1,75 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+import json
+
+from ansible.module_utils.common._collections_compat import Mapping
+
+# versions the revision bitsets of the schemas refer to, bit i of a bitset stands for FORTIOS_VERSIONS[i]
+FORTIOS_VERSIONS = [
+    'v6.0.0',
+    'v6.0.5',
+    'v6.0.11',
+    'v6.2.0',
+    'v6.2.3',
+    'v6.2.5',
+    'v6.2.7',
+    'v6.4.0',
+    'v6.4.1',
+    'v6.4.4',
+    'v7.0.0',
+]
+
+
+class Revisions(Mapping):
+    """
+    Read-only revision map of a schema node, version -> whether the node is supported,
+    decoded from the bitsets of the versions it lists and of those supporting it.
+    """
+    __slots__ = ('present', 'supported')
+
+    def __init__(self, present, supported):
+        self.present = present
+        self.supported = supported
+
+    def __getitem__(self, version):
+        try:
+            bit = 1 << FORTIOS_VERSIONS.index(version)
+        except ValueError:
+            raise KeyError(version)
+        if not self.present & bit:
+            raise KeyError(version)
+        return bool(self.supported & bit)
+
+    def __iter__(self):
+        for index, version in enumerate(FORTIOS_VERSIONS):
+            if self.present & 1 << index:
+                yield version
+
+    def __len__(self):
+        return bin(self.present).count('1')
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def decode_revisions(node):
+    revisions = node.get('revisions')
+    if isinstance(revisions, list):
+        node['revisions'] = Revisions(revisions[0], revisions[1])
+    return node
+
+
+def load_schema(schema):
+    """
+    Decode the versioned schema of a module, stored as compact json in the module of its table.
+    The revision map of every node is stored as a [present, supported] pair of bitsets over FORTIOS_VERSIONS.
+    """
+    return json.loads(schema, object_hook=decode_revisions)
+
+
+def load_module_spec(module_spec):
+    """
+    Decode the argument spec of a module, generated at build time from its versioned schema
+    by schema_to_module_spec and stored next to it.
+    """
+    return json.loads(module_spec)
@@ -0,0 +1,58 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"admin_login_logs":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"ssh_logs":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"antivirus_logs":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"configuration_changes_logs":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"v'
+    'alue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"IPsec_errors_logs":{"type":"string","options":[{"value":"enable","revisions":[2047'
+    ',2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"emergency","revisions":'
+    '[2047,2047]},{"value":"alert","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]},{"value":"error","revisions":[2047,2047]},{"value"'
+    ':"warning","revisions":[2047,2047]},{"value":"notification","revisions":[2047,2047]},{"value":"information","revisions":[2047,2047]},{"value":"debug",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"notification_interval":{"type":"integer","revisions":[2047,2047]},"local_disk_usage":{"type":"inte'
+    'ger","revisions":[2047,2047]},"amc_interface_bypass_mode":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]},"FDS_update_logs":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"di'
+    'sable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sslvpn_authentication_errors_logs":{"type":"string","options":[{"value":"enable","revisions'
+    '":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"PPP_errors_logs":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"username":{"type":"string","revisions":[2047,2047]},"FS'
+    'SO_disconnect_logs":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"mailto1":{"type":"string","revisions":[2047,2047]},"mailto3":{"type":"string","revisions":[2047,2047]},"mailto2":{"type":"string","revisio'
+    'ns":[2047,2047]},"fortiguard_log_quota_warning":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"warning_interval":{"type":"integer","revisions":[2047,2047]},"firewall_authentication_failure_logs":{"type":"s'
+    'tring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"alert_interval":{"'
+    'type":"integer","revisions":[2047,2047]},"critical_interval":{"type":"integer","revisions":[2047,2047]},"debug_interval":{"type":"integer","revisions"'
+    ':[2047,2047]},"email_interval":{"type":"integer","revisions":[2047,2047]},"FDS_license_expiring_days":{"type":"integer","revisions":[2047,2047]},"HA_l'
+    'ogs":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"IPS'
+    '_logs":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"e'
+    'mergency_interval":{"type":"integer","revisions":[2047,2047]},"log_disk_usage_warning":{"type":"string","options":[{"value":"enable","revisions":[2047'
+    ',2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"violation_traffic_logs":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"information_interval":{"type":"integer","revisions":[20'
+    '47,2047]},"webfilter_logs":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisi'
+    'ons":[2047,2047]},"FIPS_CC_errors":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"error_interval":{"type":"integer","revisions":[2047,2047]},"FDS_license_expiring_warning":{"type":"string","options":[{"val'
+    'ue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"filter_mode":{"type":"string","options":['
+    '{"value":"category","revisions":[2047,2047]},{"value":"threshold","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"admin_login_logs":{"type":"str","required":false,"choices":["enable","disable"]},"ssh_logs":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]},"antivirus_logs":{"type":"str","required":false,"choices":["enable","disable"]},"configuration_change'
+    's_logs":{"type":"str","required":false,"choices":["enable","disable"]},"IPsec_errors_logs":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"severity":{"type":"str","required":false,"choices":["emergency","alert","critical","error","warning","notification","information","debug"]},"noti'
+    'fication_interval":{"type":"int","required":false},"local_disk_usage":{"type":"int","required":false},"amc_interface_bypass_mode":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]},"FDS_update_logs":{"type":"str","required":false,"choices":["enable","disable"]},"sslvpn_authentication_err'
+    'ors_logs":{"type":"str","required":false,"choices":["enable","disable"]},"PPP_errors_logs":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"username":{"type":"str","required":false},"FSSO_disconnect_logs":{"type":"str","required":false,"choices":["enable","disable"]},"mailto1":{"type"'
+    ':"str","required":false},"mailto3":{"type":"str","required":false},"mailto2":{"type":"str","required":false},"fortiguard_log_quota_warning":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"warning_interval":{"type":"int","required":false},"firewall_authentication_failure_logs":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]},"alert_interval":{"type":"int","required":false},"critical_interval":{"type":"int","required":'
+    'false},"debug_interval":{"type":"int","required":false},"email_interval":{"type":"int","required":false},"FDS_license_expiring_days":{"type":"int","re'
+    'quired":false},"HA_logs":{"type":"str","required":false,"choices":["enable","disable"]},"IPS_logs":{"type":"str","required":false,"choices":["enable",'
+    '"disable"]},"emergency_interval":{"type":"int","required":false},"log_disk_usage_warning":{"type":"str","required":false,"choices":["enable","disable"'
+    ']},"violation_traffic_logs":{"type":"str","required":false,"choices":["enable","disable"]},"information_interval":{"type":"int","required":false},"web'
+    'filter_logs":{"type":"str","required":false,"choices":["enable","disable"]},"FIPS_CC_errors":{"type":"str","required":false,"choices":["enable","disab'
+    'le"]},"error_interval":{"type":"int","required":false},"FDS_license_expiring_warning":{"type":"str","required":false,"choices":["enable","disable"]},"'
+    'filter_mode":{"type":"str","required":false,"choices":["category","threshold"]}}}'
+)
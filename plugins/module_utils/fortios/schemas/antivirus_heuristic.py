@@ -0,0 +1,12 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"mode":{"type":"string","options":[{"value":"pass","revisions":[1023,1023]},{"value":"block","revisions":[1023,1023]},{"val'
+    'ue":"disable","revisions":[1023,1023]}],"revisions":[1023,1023]}},"revisions":[1023,1023]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"mode":{"type":"str","required":false,"choices":["pass","block","disable"]}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[127,127]},"entries":{"type":"list","children":{"status":{"type":"string","options":'
+    '[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"checksum":{"type":"string","revisions":[1'
+    '27,127]},"name":{"type":"string","revisions":[127,127]}},"revisions":[127,127]},"id":{"type":"integer","revisions":[127,127]},"name":{"type":"string",'
+    '"revisions":[127,127]}},"revisions":[127,127]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"status":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"checksum":{"type":"str","required":false},"name":{"type":"str","required":false}}},"id":{'
+    '"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
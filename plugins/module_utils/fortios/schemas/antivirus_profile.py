@@ -0,0 +1,295 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"feature_set":{"type":"string","options":[{"value":"flow","revisions":['
+    '1920,1920]},{"value":"proxy","revisions":[1920,1920]}],"revisions":[1920,1920]},"smtp":{"type":"dict","children":{"executables":{"type":"string","opti'
+    'ons":[{"value":"default","revisions":[2047,2047]},{"value":"virus","revisions":[2047,2047]}],"revisions":[2047,2047]},"av_scan":{"type":"string","opti'
+    'ons":[{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisions":['
+    '1024,1024]},"external_blocklist":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"v'
+    'alue":"monitor","revisions":[1024,1024]}],"revisions":[1024,1024]},"quarantine":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]'
+    '},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"content_disarm":{"type":"string","options":[{"value":"disable","revisions":[20'
+    '47,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"emulator":{"type":"string","options":[{"value":"enable","revisions":[2'
+    '047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"archive_block":{"multiple_values":true,"type":"list","options":[{"va'
+    'lue":"encrypted","revisions":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},{"value":"partiallycorrupted","revisions":[2047,2047]},{"value'
+    '":"multipart","revisions":[2047,2047]},{"value":"nested","revisions":[2047,2047]},{"value":"mailbomb","revisions":[2047,2047]},{"value":"fileslimit","'
+    'revisions":[2047,2047]},{"value":"timeout","revisions":[2047,2047]},{"value":"unhandled","revisions":[2047,2047]}],"revisions":[2047,2047]},"archive_l'
+    'og":{"multiple_values":true,"type":"list","options":[{"value":"encrypted","revisions":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},{"val'
+    'ue":"partiallycorrupted","revisions":[2047,2047]},{"value":"multipart","revisions":[2047,2047]},{"value":"nested","revisions":[2047,2047]},{"value":"m'
+    'ailbomb","revisions":[2047,2047]},{"value":"fileslimit","revisions":[2047,2047]},{"value":"timeout","revisions":[2047,2047]},{"value":"unhandled","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"outbreak_prevention":{"type":"string","options":[{"value":"disabled","revisions":[2047,1023]},{"value"'
+    ':"files","revisions":[2047,1023]},{"value":"full-archive","revisions":[2047,1023]},{"value":"disable","revisions":[1024,1024]},{"value":"block","revis'
+    'ions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":[{"'
+    'value":"scan","revisions":[1023,1023]},{"value":"avmonitor","revisions":[1023,1023]},{"value":"quarantine","revisions":[1023,1023]}],"revisions":[2047'
+    ',1023]}},"revisions":[2047,2047]},"analytics_db":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"analytics_ignore_filetype":{"type":"integer","revisions":[1024,1024]},"av_virus_log":{"type":"string","option'
+    's":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"external_blocklist_archive_scan"'
+    ':{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"replace'
+    'msg_group":{"type":"string","revisions":[2047,2047]},"outbreak_prevention_archive_scan":{"type":"string","options":[{"value":"disable","revisions":[10'
+    '24,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"analytics_bl_filetype":{"type":"integer","revisions":[2047,1023]},"ana'
+    'lytics_accept_filetype":{"type":"integer","revisions":[1024,1024]},"ftp":{"type":"dict","children":{"av_scan":{"type":"string","options":[{"value":"di'
+    'sable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisions":[1024,1024]},"exter'
+    'nal_blocklist":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","r'
+    'evisions":[1024,1024]}],"revisions":[1024,1024]},"quarantine":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable'
+    '","revisions":[1024,1024]}],"revisions":[1024,1024]},"emulator":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"archive_block":{"multiple_values":true,"type":"list","options":[{"value":"encrypted","revision'
+    's":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},{"value":"partiallycorrupted","revisions":[2047,2047]},{"value":"multipart","revisions":'
+    '[2047,2047]},{"value":"nested","revisions":[2047,2047]},{"value":"mailbomb","revisions":[2047,2047]},{"value":"fileslimit","revisions":[2047,2047]},{"'
+    'value":"timeout","revisions":[2047,2047]},{"value":"unhandled","revisions":[2047,2047]}],"revisions":[2047,2047]},"archive_log":{"multiple_values":tru'
+    'e,"type":"list","options":[{"value":"encrypted","revisions":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},{"value":"partiallycorrupted","'
+    'revisions":[2047,2047]},{"value":"multipart","revisions":[2047,2047]},{"value":"nested","revisions":[2047,2047]},{"value":"mailbomb","revisions":[2047'
+    ',2047]},{"value":"fileslimit","revisions":[2047,2047]},{"value":"timeout","revisions":[2047,2047]},{"value":"unhandled","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"outbreak_prevention":{"type":"string","options":[{"value":"disabled","revisions":[2047,1023]},{"value":"files","revisions":[2047'
+    ',1023]},{"value":"full-archive","revisions":[2047,1023]},{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value'
+    '":"monitor","revisions":[1024,1024]}],"revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":[{"value":"scan","revisions":'
+    '[1023,1023]},{"value":"avmonitor","revisions":[1023,1023]},{"value":"quarantine","revisions":[1023,1023]}],"revisions":[2047,1023]}},"revisions":[2047'
+    ',2047]},"analytics_max_upload":{"type":"integer","revisions":[2047,2047]},"mapi":{"type":"dict","children":{"executables":{"type":"string","options":['
+    '{"value":"default","revisions":[2047,2047]},{"value":"virus","revisions":[2047,2047]}],"revisions":[2047,2047]},"av_scan":{"type":"string","options":['
+    '{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisions":[1024,1'
+    '024]},"external_blocklist":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":'
+    '"monitor","revisions":[1024,1024]}],"revisions":[1024,1024]},"quarantine":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"va'
+    'lue":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"emulator":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"v'
+    'alue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"archive_block":{"multiple_values":true,"type":"list","options":[{"value":"encrypte'
+    'd","revisions":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},{"value":"partiallycorrupted","revisions":[2047,2047]},{"value":"multipart",'
+    '"revisions":[2047,2047]},{"value":"nested","revisions":[2047,2047]},{"value":"mailbomb","revisions":[2047,2047]},{"value":"fileslimit","revisions":[20'
+    '47,2047]},{"value":"timeout","revisions":[2047,2047]},{"value":"unhandled","revisions":[2047,2047]}],"revisions":[2047,2047]},"archive_log":{"multiple'
+    '_values":true,"type":"list","options":[{"value":"encrypted","revisions":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},{"value":"partially'
+    'corrupted","revisions":[2047,2047]},{"value":"multipart","revisions":[2047,2047]},{"value":"nested","revisions":[2047,2047]},{"value":"mailbomb","revi'
+    'sions":[2047,2047]},{"value":"fileslimit","revisions":[2047,2047]},{"value":"timeout","revisions":[2047,2047]},{"value":"unhandled","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"outbreak_prevention":{"type":"string","options":[{"value":"disabled","revisions":[2047,1023]},{"value":"files","revi'
+    'sions":[2047,1023]},{"value":"full-archive","revisions":[2047,1023]},{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,10'
+    '24]},{"value":"monitor","revisions":[1024,1024]}],"revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":[{"value":"scan",'
+    '"revisions":[1023,1023]},{"value":"avmonitor","revisions":[1023,1023]},{"value":"quarantine","revisions":[1023,1023]}],"revisions":[2047,1023]}},"revi'
+    'sions":[2047,2047]},"extended_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"content_disarm":{"type":"dict","children":{"office_action":{"type":"string","options":[{"value":"disable","revisions":[2040'
+    ',2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"pdf_act_launch":{"type":"string","options":[{"value":"disable","revision'
+    's":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"office_dde":{"type":"string","options":[{"value":"disable","revi'
+    'sions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"office_hylink":{"type":"string","options":[{"value":"disable'
+    '","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pdf_embedfile":{"type":"string","options":[{"value":"'
+    'disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"office_macro":{"type":"string","options":[{"va'
+    'lue":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"cover_page":{"type":"string","options":['
+    '{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"office_linked":{"type":"string","opt'
+    'ions":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pdf_javacode":{"type":"string'
+    '","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pdf_hyperlink":{"type":'
+    '"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"detect_only":{"t'
+    'ype":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pdf_act_got'
+    'or":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pdf_'
+    'act_form":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"original_file_destination":{"type":"string","options":[{"value":"fortisandbox","revisions":[2047,2047]},{"value":"quarantine","revisions":[2047,2047'
+    ']},{"value":"discard","revisions":[2047,2047]}],"revisions":[2047,2047]},"office_embed":{"type":"string","options":[{"value":"disable","revisions":[20'
+    '47,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pdf_act_sound":{"type":"string","options":[{"value":"disable","revisio'
+    'ns":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pdf_act_java":{"type":"string","options":[{"value":"disable","r'
+    'evisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pdf_act_movie":{"type":"string","options":[{"value":"disa'
+    'ble","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"error_action":{"type":"string","options":[{"value"'
+    ':"block","revisions":[1664,1664]},{"value":"log-only","revisions":[1664,1664]},{"value":"ignore","revisions":[1664,1664]}],"revisions":[1920,1664]}},"'
+    'revisions":[2047,2047]},"nntp":{"type":"dict","children":{"av_scan":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"'
+    'block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisions":[1024,1024]},"external_blocklist":{"type":"string","options":'
+    '[{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisions":[1024,'
+    '1024]},"quarantine":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1'
+    '024,1024]},"emulator":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"archive_block":{"multiple_values":true,"type":"list","options":[{"value":"encrypted","revisions":[2047,2047]},{"value":"corrupted","revi'
+    'sions":[2047,2047]},{"value":"partiallycorrupted","revisions":[2047,2047]},{"value":"multipart","revisions":[2047,2047]},{"value":"nested","revisions"'
+    ':[2047,2047]},{"value":"mailbomb","revisions":[2047,2047]},{"value":"fileslimit","revisions":[2047,2047]},{"value":"timeout","revisions":[2047,2047]},'
+    '{"value":"unhandled","revisions":[2047,2047]}],"revisions":[2047,2047]},"archive_log":{"multiple_values":true,"type":"list","options":[{"value":"encry'
+    'pted","revisions":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},{"value":"partiallycorrupted","revisions":[2047,2047]},{"value":"multipar'
+    't","revisions":[2047,2047]},{"value":"nested","revisions":[2047,2047]},{"value":"mailbomb","revisions":[2047,2047]},{"value":"fileslimit","revisions":'
+    '[2047,2047]},{"value":"timeout","revisions":[2047,2047]},{"value":"unhandled","revisions":[2047,2047]}],"revisions":[2047,2047]},"outbreak_prevention"'
+    ':{"type":"string","options":[{"value":"disabled","revisions":[2047,1023]},{"value":"files","revisions":[2047,1023]},{"value":"full-archive","revisions'
+    '":[2047,1023]},{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"rev'
+    'isions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":[{"value":"scan","revisions":[1023,1023]},{"value":"avmonitor","revisio'
+    'ns":[1023,1023]},{"value":"quarantine","revisions":[1023,1023]}],"revisions":[2047,1023]}},"revisions":[2047,2047]},"smb":{"type":"dict","children":{"'
+    'archive_block":{"type":"string","options":[{"value":"encrypted","revisions":[7,7]},{"value":"corrupted","revisions":[7,7]},{"value":"partiallycorrupte'
+    'd","revisions":[7,7]},{"value":"multipart","revisions":[7,7]},{"value":"nested","revisions":[7,7]},{"value":"mailbomb","revisions":[7,7]},{"value":"fi'
+    'leslimit","revisions":[7,7]},{"value":"timeout","revisions":[7,7]},{"value":"unhandled","revisions":[7,7]}],"revisions":[7,7]},"archive_log":{"type":"'
+    'string","options":[{"value":"encrypted","revisions":[7,7]},{"value":"corrupted","revisions":[7,7]},{"value":"partiallycorrupted","revisions":[7,7]},{"'
+    'value":"multipart","revisions":[7,7]},{"value":"nested","revisions":[7,7]},{"value":"mailbomb","revisions":[7,7]},{"value":"fileslimit","revisions":[7'
+    ',7]},{"value":"timeout","revisions":[7,7]},{"value":"unhandled","revisions":[7,7]}],"revisions":[7,7]},"outbreak_prevention":{"type":"string","options'
+    '":[{"value":"disabled","revisions":[7,7]},{"value":"files","revisions":[7,7]},{"value":"full-archive","revisions":[7,7]}],"revisions":[7,7]},"options"'
+    ':{"type":"string","options":[{"value":"scan","revisions":[7,7]},{"value":"avmonitor","revisions":[7,7]},{"value":"quarantine","revisions":[7,7]}],"rev'
+    'isions":[7,7]},"emulator":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]}},'
+    '"revisions":[2047,7]},"analytics_wl_filetype":{"type":"integer","revisions":[2047,1023]},"http":{"type":"dict","children":{"av_scan":{"type":"string",'
+    '"options":[{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisio'
+    'ns":[1024,1024]},"external_blocklist":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]'
+    '},{"value":"monitor","revisions":[1024,1024]}],"revisions":[1024,1024]},"quarantine":{"type":"string","options":[{"value":"disable","revisions":[1024,'
+    '1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"content_disarm":{"type":"string","options":[{"value":"disable","revisions'
+    '":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"emulator":{"type":"string","options":[{"value":"enable","revision'
+    's":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"archive_block":{"multiple_values":true,"type":"list","options":'
+    '[{"value":"encrypted","revisions":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},{"value":"partiallycorrupted","revisions":[2047,2047]},{"'
+    'value":"multipart","revisions":[2047,2047]},{"value":"nested","revisions":[2047,2047]},{"value":"mailbomb","revisions":[2047,2047]},{"value":"fileslim'
+    'it","revisions":[2047,2047]},{"value":"timeout","revisions":[2047,2047]},{"value":"unhandled","revisions":[2047,2047]}],"revisions":[2047,2047]},"arch'
+    'ive_log":{"multiple_values":true,"type":"list","options":[{"value":"encrypted","revisions":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},'
+    '{"value":"partiallycorrupted","revisions":[2047,2047]},{"value":"multipart","revisions":[2047,2047]},{"value":"nested","revisions":[2047,2047]},{"valu'
+    'e":"mailbomb","revisions":[2047,2047]},{"value":"fileslimit","revisions":[2047,2047]},{"value":"timeout","revisions":[2047,2047]},{"value":"unhandled"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"outbreak_prevention":{"type":"string","options":[{"value":"disabled","revisions":[2047,1023]},{"v'
+    'alue":"files","revisions":[2047,1023]},{"value":"full-archive","revisions":[2047,1023]},{"value":"disable","revisions":[1024,1024]},{"value":"block","'
+    'revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options'
+    '":[{"value":"scan","revisions":[1023,1023]},{"value":"avmonitor","revisions":[1023,1023]},{"value":"quarantine","revisions":[1023,1023]}],"revisions":'
+    '[2047,1023]}},"revisions":[2047,2047]},"cifs":{"type":"dict","children":{"av_scan":{"type":"string","options":[{"value":"disable","revisions":[1024,10'
+    '24]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisions":[1024,1024]},"external_blocklist":{"type":"str'
+    'ing","options":[{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"re'
+    'visions":[1024,1024]},"quarantine":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}]'
+    ',"revisions":[1024,1024]},"emulator":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]'
+    '}],"revisions":[2040,2040]},"archive_block":{"multiple_values":true,"type":"list","options":[{"value":"encrypted","revisions":[2040,2040]},{"value":"c'
+    'orrupted","revisions":[2040,2040]},{"value":"partiallycorrupted","revisions":[2040,2040]},{"value":"multipart","revisions":[2040,2040]},{"value":"nest'
+    'ed","revisions":[2040,2040]},{"value":"mailbomb","revisions":[2040,2040]},{"value":"fileslimit","revisions":[2040,2040]},{"value":"timeout","revisions'
+    '":[2040,2040]},{"value":"unhandled","revisions":[2040,2040]}],"revisions":[2040,2040]},"archive_log":{"multiple_values":true,"type":"list","options":['
+    '{"value":"encrypted","revisions":[2040,2040]},{"value":"corrupted","revisions":[2040,2040]},{"value":"partiallycorrupted","revisions":[2040,2040]},{"v'
+    'alue":"multipart","revisions":[2040,2040]},{"value":"nested","revisions":[2040,2040]},{"value":"mailbomb","revisions":[2040,2040]},{"value":"fileslimi'
+    't","revisions":[2040,2040]},{"value":"timeout","revisions":[2040,2040]},{"value":"unhandled","revisions":[2040,2040]}],"revisions":[2040,2040]},"outbr'
+    'eak_prevention":{"type":"string","options":[{"value":"disabled","revisions":[2040,1016]},{"value":"files","revisions":[2040,1016]},{"value":"full-arch'
+    'ive","revisions":[2040,1016]},{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions":[10'
+    '24,1024]}],"revisions":[2040,2040]},"options":{"multiple_values":true,"type":"list","options":[{"value":"scan","revisions":[1016,1016]},{"value":"avmo'
+    'nitor","revisions":[1016,1016]},{"value":"quarantine","revisions":[1016,1016]}],"revisions":[2040,1016]}},"revisions":[2040,2040]},"nac_quar":{"type":'
+    '"dict","children":{"infected":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"quar-src-ip","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"expiry":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"ems_threat_feed":{"type":"string","options":[{"value'
+    '":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"ssh":{"type":"dict","children":{"av_scan":{'
+    '"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,'
+    '1024]}],"revisions":[1024,1024]},"external_blocklist":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"block","revisi'
+    'ons":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisions":[1024,1024]},"quarantine":{"type":"string","options":[{"value":"disable","r'
+    'evisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"emulator":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"archive_block":{"multiple_values":true,"type":"list","o'
+    'ptions":[{"value":"encrypted","revisions":[2040,2040]},{"value":"corrupted","revisions":[2040,2040]},{"value":"partiallycorrupted","revisions":[2040,2'
+    '040]},{"value":"multipart","revisions":[2040,2040]},{"value":"nested","revisions":[2040,2040]},{"value":"mailbomb","revisions":[2040,2040]},{"value":"'
+    'fileslimit","revisions":[2040,2040]},{"value":"timeout","revisions":[2040,2040]},{"value":"unhandled","revisions":[2040,2040]}],"revisions":[2040,2040'
+    ']},"archive_log":{"multiple_values":true,"type":"list","options":[{"value":"encrypted","revisions":[2040,2040]},{"value":"corrupted","revisions":[2040'
+    ',2040]},{"value":"partiallycorrupted","revisions":[2040,2040]},{"value":"multipart","revisions":[2040,2040]},{"value":"nested","revisions":[2040,2040]'
+    '},{"value":"mailbomb","revisions":[2040,2040]},{"value":"fileslimit","revisions":[2040,2040]},{"value":"timeout","revisions":[2040,2040]},{"value":"un'
+    'handled","revisions":[2040,2040]}],"revisions":[2040,2040]},"outbreak_prevention":{"type":"string","options":[{"value":"disabled","revisions":[2040,10'
+    '16]},{"value":"files","revisions":[2040,1016]},{"value":"full-archive","revisions":[2040,1016]},{"value":"disable","revisions":[1024,1024]},{"value":"'
+    'block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisions":[2040,2040]},"options":{"multiple_values":true,"type":"list",'
+    '"options":[{"value":"scan","revisions":[1016,1016]},{"value":"avmonitor","revisions":[1016,1016]},{"value":"quarantine","revisions":[1016,1016]}],"rev'
+    'isions":[2040,1016]}},"revisions":[2040,2040]},"av_block_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"imap":{"type":"dict","children":{"executables":{"type":"string","options":[{"value":"default","r'
+    'evisions":[2047,2047]},{"value":"virus","revisions":[2047,2047]}],"revisions":[2047,2047]},"av_scan":{"type":"string","options":[{"value":"disable","r'
+    'evisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisions":[1024,1024]},"external_block'
+    'list":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions"'
+    ':[1024,1024]}],"revisions":[1024,1024]},"quarantine":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisi'
+    'ons":[1024,1024]}],"revisions":[1024,1024]},"content_disarm":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"emulator":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disabl'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"archive_block":{"multiple_values":true,"type":"list","options":[{"value":"encrypted","revisions'
+    '":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},{"value":"partiallycorrupted","revisions":[2047,2047]},{"value":"multipart","revisions":['
+    '2047,2047]},{"value":"nested","revisions":[2047,2047]},{"value":"mailbomb","revisions":[2047,2047]},{"value":"fileslimit","revisions":[2047,2047]},{"v'
+    'alue":"timeout","revisions":[2047,2047]},{"value":"unhandled","revisions":[2047,2047]}],"revisions":[2047,2047]},"archive_log":{"multiple_values":true'
+    ',"type":"list","options":[{"value":"encrypted","revisions":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},{"value":"partiallycorrupted","r'
+    'evisions":[2047,2047]},{"value":"multipart","revisions":[2047,2047]},{"value":"nested","revisions":[2047,2047]},{"value":"mailbomb","revisions":[2047,'
+    '2047]},{"value":"fileslimit","revisions":[2047,2047]},{"value":"timeout","revisions":[2047,2047]},{"value":"unhandled","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"outbreak_prevention":{"type":"string","options":[{"value":"disabled","revisions":[2047,1023]},{"value":"files","revisions":[2047,'
+    '1023]},{"value":"full-archive","revisions":[2047,1023]},{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value"'
+    ':"monitor","revisions":[1024,1024]}],"revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":[{"value":"scan","revisions":['
+    '1023,1023]},{"value":"avmonitor","revisions":[1023,1023]},{"value":"quarantine","revisions":[1023,1023]}],"revisions":[2047,1023]}},"revisions":[2047,'
+    '2047]},"name":{"type":"string","revisions":[2047,2047]},"pop3":{"type":"dict","children":{"executables":{"type":"string","options":[{"value":"default"'
+    ',"revisions":[2047,2047]},{"value":"virus","revisions":[2047,2047]}],"revisions":[2047,2047]},"av_scan":{"type":"string","options":[{"value":"disable"'
+    ',"revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]}],"revisions":[1024,1024]},"external_bl'
+    'ocklist":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"monitor","revisio'
+    'ns":[1024,1024]}],"revisions":[1024,1024]},"quarantine":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","rev'
+    'isions":[1024,1024]}],"revisions":[1024,1024]},"content_disarm":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"emulator":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"dis'
+    'able","revisions":[2047,2047]}],"revisions":[2047,2047]},"archive_block":{"multiple_values":true,"type":"list","options":[{"value":"encrypted","revisi'
+    'ons":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},{"value":"partiallycorrupted","revisions":[2047,2047]},{"value":"multipart","revisions'
+    '":[2047,2047]},{"value":"nested","revisions":[2047,2047]},{"value":"mailbomb","revisions":[2047,2047]},{"value":"fileslimit","revisions":[2047,2047]},'
+    '{"value":"timeout","revisions":[2047,2047]},{"value":"unhandled","revisions":[2047,2047]}],"revisions":[2047,2047]},"archive_log":{"multiple_values":t'
+    'rue,"type":"list","options":[{"value":"encrypted","revisions":[2047,2047]},{"value":"corrupted","revisions":[2047,2047]},{"value":"partiallycorrupted"'
+    ',"revisions":[2047,2047]},{"value":"multipart","revisions":[2047,2047]},{"value":"nested","revisions":[2047,2047]},{"value":"mailbomb","revisions":[20'
+    '47,2047]},{"value":"fileslimit","revisions":[2047,2047]},{"value":"timeout","revisions":[2047,2047]},{"value":"unhandled","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"outbreak_prevention":{"type":"string","options":[{"value":"disabled","revisions":[2047,1023]},{"value":"files","revisions":[20'
+    '47,1023]},{"value":"full-archive","revisions":[2047,1023]},{"value":"disable","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"val'
+    'ue":"monitor","revisions":[1024,1024]}],"revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":[{"value":"scan","revisions'
+    '":[1023,1023]},{"value":"avmonitor","revisions":[1023,1023]},{"value":"quarantine","revisions":[1023,1023]}],"revisions":[2047,1023]}},"revisions":[20'
+    '47,2047]},"external_blocklist":{"type":"list","children":{"name":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"ftgd_analytics":'
+    '{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"suspicious","revisions":[2047,2047]},{"value":"everything","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"scan_mode":{"type":"string","options":[{"value":"quick","revisions":[2047,7]},{"value":"full","revisions":['
+    '2047,7]},{"value":"default","revisions":[2040,2040]},{"value":"legacy","revisions":[2040,2040]}],"revisions":[2047,2047]},"mobile_malware_db":{"type":'
+    '"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"external_blockli'
+    'st_enable_all":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1'
+    '024]},"outbreak_prevention":{"type":"dict","children":{"external_blocklist":{"type":"string","options":[{"value":"disable","revisions":[1016,1016]},{"'
+    'value":"enable","revisions":[1016,1016]}],"revisions":[1016,1016]},"ftgd_service":{"type":"string","options":[{"value":"disable","revisions":[1016,101'
+    '6]},{"value":"enable","revisions":[1016,1016]}],"revisions":[1016,1016]}},"revisions":[2040,1016]},"inspection_mode":{"type":"string","options":[{"val'
+    'ue":"proxy","revisions":[7,7]},{"value":"flow-based","revisions":[7,7]}],"revisions":[2047,7]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"feature_set":{"type":"str","required":false,"choices":["flow","p'
+    'roxy"]},"smtp":{"type":"dict","required":false,"options":{"executables":{"type":"str","required":false,"choices":["default","virus"]},"av_scan":{"type'
+    '":"str","required":false,"choices":["disable","block","monitor"]},"external_blocklist":{"type":"str","required":false,"choices":["disable","block","mo'
+    'nitor"]},"quarantine":{"type":"str","required":false,"choices":["disable","enable"]},"content_disarm":{"type":"str","required":false,"choices":["disab'
+    'le","enable"]},"emulator":{"type":"str","required":false,"choices":["enable","disable"]},"archive_block":{"type":"list","required":false,"choices":["e'
+    'ncrypted","corrupted","partiallycorrupted","multipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"archive_log":{"type":"list","required'
+    '":false,"choices":["encrypted","corrupted","partiallycorrupted","multipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"outbreak_prevent'
+    'ion":{"type":"str","required":false},"options":{"type":"list","required":false}}},"analytics_db":{"type":"str","required":false,"choices":["disable","'
+    'enable"]},"analytics_ignore_filetype":{"type":"int","required":false},"av_virus_log":{"type":"str","required":false,"choices":["enable","disable"]},"e'
+    'xternal_blocklist_archive_scan":{"type":"str","required":false,"choices":["disable","enable"]},"replacemsg_group":{"type":"str","required":false},"out'
+    'break_prevention_archive_scan":{"type":"str","required":false,"choices":["disable","enable"]},"analytics_bl_filetype":{"type":"int","required":false},'
+    '"analytics_accept_filetype":{"type":"int","required":false},"ftp":{"type":"dict","required":false,"options":{"av_scan":{"type":"str","required":false,'
+    '"choices":["disable","block","monitor"]},"external_blocklist":{"type":"str","required":false,"choices":["disable","block","monitor"]},"quarantine":{"t'
+    'ype":"str","required":false,"choices":["disable","enable"]},"emulator":{"type":"str","required":false,"choices":["enable","disable"]},"archive_block":'
+    '{"type":"list","required":false,"choices":["encrypted","corrupted","partiallycorrupted","multipart","nested","mailbomb","fileslimit","timeout","unhand'
+    'led"]},"archive_log":{"type":"list","required":false,"choices":["encrypted","corrupted","partiallycorrupted","multipart","nested","mailbomb","fileslim'
+    'it","timeout","unhandled"]},"outbreak_prevention":{"type":"str","required":false},"options":{"type":"list","required":false}}},"analytics_max_upload":'
+    '{"type":"int","required":false},"mapi":{"type":"dict","required":false,"options":{"executables":{"type":"str","required":false,"choices":["default","v'
+    'irus"]},"av_scan":{"type":"str","required":false,"choices":["disable","block","monitor"]},"external_blocklist":{"type":"str","required":false,"choices'
+    '":["disable","block","monitor"]},"quarantine":{"type":"str","required":false,"choices":["disable","enable"]},"emulator":{"type":"str","required":false'
+    ',"choices":["enable","disable"]},"archive_block":{"type":"list","required":false,"choices":["encrypted","corrupted","partiallycorrupted","multipart","'
+    'nested","mailbomb","fileslimit","timeout","unhandled"]},"archive_log":{"type":"list","required":false,"choices":["encrypted","corrupted","partiallycor'
+    'rupted","multipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"outbreak_prevention":{"type":"str","required":false},"options":{"type":"'
+    'list","required":false}}},"extended_log":{"type":"str","required":false,"choices":["enable","disable"]},"content_disarm":{"type":"dict","required":fal'
+    'se,"options":{"office_action":{"type":"str","required":false,"choices":["disable","enable"]},"pdf_act_launch":{"type":"str","required":false,"choices"'
+    ':["disable","enable"]},"office_dde":{"type":"str","required":false,"choices":["disable","enable"]},"office_hylink":{"type":"str","required":false,"cho'
+    'ices":["disable","enable"]},"pdf_embedfile":{"type":"str","required":false,"choices":["disable","enable"]},"office_macro":{"type":"str","required":fal'
+    'se,"choices":["disable","enable"]},"cover_page":{"type":"str","required":false,"choices":["disable","enable"]},"office_linked":{"type":"str","required'
+    '":false,"choices":["disable","enable"]},"pdf_javacode":{"type":"str","required":false,"choices":["disable","enable"]},"pdf_hyperlink":{"type":"str","r'
+    'equired":false,"choices":["disable","enable"]},"detect_only":{"type":"str","required":false,"choices":["disable","enable"]},"pdf_act_gotor":{"type":"s'
+    'tr","required":false,"choices":["disable","enable"]},"pdf_act_form":{"type":"str","required":false,"choices":["disable","enable"]},"original_file_dest'
+    'ination":{"type":"str","required":false,"choices":["fortisandbox","quarantine","discard"]},"office_embed":{"type":"str","required":false,"choices":["d'
+    'isable","enable"]},"pdf_act_sound":{"type":"str","required":false,"choices":["disable","enable"]},"pdf_act_java":{"type":"str","required":false,"choic'
+    'es":["disable","enable"]},"pdf_act_movie":{"type":"str","required":false,"choices":["disable","enable"]},"error_action":{"type":"str","required":false'
+    '}}},"nntp":{"type":"dict","required":false,"options":{"av_scan":{"type":"str","required":false,"choices":["disable","block","monitor"]},"external_bloc'
+    'klist":{"type":"str","required":false,"choices":["disable","block","monitor"]},"quarantine":{"type":"str","required":false,"choices":["disable","enabl'
+    'e"]},"emulator":{"type":"str","required":false,"choices":["enable","disable"]},"archive_block":{"type":"list","required":false,"choices":["encrypted",'
+    '"corrupted","partiallycorrupted","multipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"archive_log":{"type":"list","required":false,"c'
+    'hoices":["encrypted","corrupted","partiallycorrupted","multipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"outbreak_prevention":{"typ'
+    'e":"str","required":false},"options":{"type":"list","required":false}}},"smb":{"type":"dict","required":false,"options":{"archive_block":{"type":"str"'
+    ',"required":false,"choices":["encrypted","corrupted","partiallycorrupted","multipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"archiv'
+    'e_log":{"type":"str","required":false,"choices":["encrypted","corrupted","partiallycorrupted","multipart","nested","mailbomb","fileslimit","timeout","'
+    'unhandled"]},"outbreak_prevention":{"type":"str","required":false,"choices":["disabled","files","full-archive"]},"options":{"type":"str","required":fa'
+    'lse,"choices":["scan","avmonitor","quarantine"]},"emulator":{"type":"str","required":false,"choices":["enable","disable"]}}},"analytics_wl_filetype":{'
+    '"type":"int","required":false},"http":{"type":"dict","required":false,"options":{"av_scan":{"type":"str","required":false,"choices":["disable","block"'
+    ',"monitor"]},"external_blocklist":{"type":"str","required":false,"choices":["disable","block","monitor"]},"quarantine":{"type":"str","required":false,'
+    '"choices":["disable","enable"]},"content_disarm":{"type":"str","required":false,"choices":["disable","enable"]},"emulator":{"type":"str","required":fa'
+    'lse,"choices":["enable","disable"]},"archive_block":{"type":"list","required":false,"choices":["encrypted","corrupted","partiallycorrupted","multipart'
+    '","nested","mailbomb","fileslimit","timeout","unhandled"]},"archive_log":{"type":"list","required":false,"choices":["encrypted","corrupted","partially'
+    'corrupted","multipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"outbreak_prevention":{"type":"str","required":false},"options":{"type'
+    '":"list","required":false}}},"cifs":{"type":"dict","required":false,"options":{"av_scan":{"type":"str","required":false,"choices":["disable","block","'
+    'monitor"]},"external_blocklist":{"type":"str","required":false,"choices":["disable","block","monitor"]},"quarantine":{"type":"str","required":false,"c'
+    'hoices":["disable","enable"]},"emulator":{"type":"str","required":false,"choices":["enable","disable"]},"archive_block":{"type":"list","required":fals'
+    'e,"choices":["encrypted","corrupted","partiallycorrupted","multipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"archive_log":{"type":"'
+    'list","required":false,"choices":["encrypted","corrupted","partiallycorrupted","multipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"o'
+    'utbreak_prevention":{"type":"str","required":false},"options":{"type":"list","required":false}}},"nac_quar":{"type":"dict","required":false,"options":'
+    '{"infected":{"type":"str","required":false,"choices":["none","quar-src-ip"]},"log":{"type":"str","required":false,"choices":["enable","disable"]},"exp'
+    'iry":{"type":"str","required":false}}},"ems_threat_feed":{"type":"str","required":false,"choices":["disable","enable"]},"ssh":{"type":"dict","required'
+    '":false,"options":{"av_scan":{"type":"str","required":false,"choices":["disable","block","monitor"]},"external_blocklist":{"type":"str","required":fal'
+    'se,"choices":["disable","block","monitor"]},"quarantine":{"type":"str","required":false,"choices":["disable","enable"]},"emulator":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"archive_block":{"type":"list","required":false,"choices":["encrypted","corrupted","partiallycorrupted","m'
+    'ultipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"archive_log":{"type":"list","required":false,"choices":["encrypted","corrupted","p'
+    'artiallycorrupted","multipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"outbreak_prevention":{"type":"str","required":false},"options'
+    '":{"type":"list","required":false}}},"av_block_log":{"type":"str","required":false,"choices":["enable","disable"]},"imap":{"type":"dict","required":fa'
+    'lse,"options":{"executables":{"type":"str","required":false,"choices":["default","virus"]},"av_scan":{"type":"str","required":false,"choices":["disabl'
+    'e","block","monitor"]},"external_blocklist":{"type":"str","required":false,"choices":["disable","block","monitor"]},"quarantine":{"type":"str","requir'
+    'ed":false,"choices":["disable","enable"]},"content_disarm":{"type":"str","required":false,"choices":["disable","enable"]},"emulator":{"type":"str","re'
+    'quired":false,"choices":["enable","disable"]},"archive_block":{"type":"list","required":false,"choices":["encrypted","corrupted","partiallycorrupted",'
+    '"multipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"archive_log":{"type":"list","required":false,"choices":["encrypted","corrupted",'
+    '"partiallycorrupted","multipart","nested","mailbomb","fileslimit","timeout","unhandled"]},"outbreak_prevention":{"type":"str","required":false},"optio'
+    'ns":{"type":"list","required":false}}},"name":{"type":"str","required":false},"pop3":{"type":"dict","required":false,"options":{"executables":{"type":'
+    '"str","required":false,"choices":["default","virus"]},"av_scan":{"type":"str","required":false,"choices":["disable","block","monitor"]},"external_bloc'
+    'klist":{"type":"str","required":false,"choices":["disable","block","monitor"]},"quarantine":{"type":"str","required":false,"choices":["disable","enabl'
+    'e"]},"content_disarm":{"type":"str","required":false,"choices":["disable","enable"]},"emulator":{"type":"str","required":false,"choices":["enable","di'
+    'sable"]},"archive_block":{"type":"list","required":false,"choices":["encrypted","corrupted","partiallycorrupted","multipart","nested","mailbomb","file'
+    'slimit","timeout","unhandled"]},"archive_log":{"type":"list","required":false,"choices":["encrypted","corrupted","partiallycorrupted","multipart","nes'
+    'ted","mailbomb","fileslimit","timeout","unhandled"]},"outbreak_prevention":{"type":"str","required":false},"options":{"type":"list","required":false}}'
+    '},"external_blocklist":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"ftgd_analytics":{"type":"str","required":f'
+    'alse,"choices":["disable","suspicious","everything"]},"scan_mode":{"type":"str","required":false},"mobile_malware_db":{"type":"str","required":false,"'
+    'choices":["disable","enable"]},"external_blocklist_enable_all":{"type":"str","required":false,"choices":["disable","enable"]},"outbreak_prevention":{"'
+    'type":"dict","required":false,"options":{"external_blocklist":{"type":"str","required":false,"choices":["disable","enable"]},"ftgd_service":{"type":"s'
+    'tr","required":false,"choices":["disable","enable"]}}},"inspection_mode":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,61 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"quarantine_quota":{"type":"integer","revisions":[2047,2047]},"store_intercepted":{"multiple_values":true,"type":"list","op'
+    'tions":[{"value":"imap","revisions":[127,127]},{"value":"smtp","revisions":[127,127]},{"value":"pop3","revisions":[127,127]},{"value":"http","revision'
+    's":[127,127]},{"value":"ftp","revisions":[127,127]},{"value":"imaps","revisions":[127,127]},{"value":"smtps","revisions":[127,127]},{"value":"pop3s","'
+    'revisions":[127,127]},{"value":"https","revisions":[127,127]},{"value":"ftps","revisions":[127,127]},{"value":"mapi","revisions":[127,127]},{"value":"'
+    'mm1","revisions":[127,127]},{"value":"mm3","revisions":[127,127]},{"value":"mm4","revisions":[127,127]},{"value":"mm7","revisions":[127,127]}],"revisi'
+    'ons":[2047,127]},"drop_infected":{"multiple_values":true,"type":"list","options":[{"value":"imap","revisions":[2047,2047]},{"value":"smtp","revisions"'
+    ':[2047,2047]},{"value":"pop3","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"value":"nntp'
+    '","revisions":[2047,2047]},{"value":"imaps","revisions":[2047,2047]},{"value":"smtps","revisions":[2047,2047]},{"value":"pop3s","revisions":[2047,2047'
+    ']},{"value":"https","revisions":[2047,2047]},{"value":"ftps","revisions":[2047,2047]},{"value":"mapi","revisions":[2047,2047]},{"value":"cifs","revisi'
+    'ons":[2047,2047]},{"value":"mm1","revisions":[2047,127]},{"value":"mm3","revisions":[2047,127]},{"value":"mm4","revisions":[2047,127]},{"value":"mm7",'
+    '"revisions":[2047,127]},{"value":"ssh","revisions":[2040,2040]}],"revisions":[2047,2047]},"maxfilesize":{"type":"integer","revisions":[2047,2047]},"ag'
+    'elimit":{"type":"integer","revisions":[2047,2047]},"destination":{"type":"string","options":[{"value":"NULL","revisions":[2047,2047]},{"value":"disk",'
+    '"revisions":[2047,2047]},{"value":"FortiAnalyzer","revisions":[2047,2047]}],"revisions":[2047,2047]},"drop_heuristic":{"multiple_values":true,"type":"'
+    'list","options":[{"value":"imap","revisions":[2047,2047]},{"value":"smtp","revisions":[2047,2047]},{"value":"pop3","revisions":[2047,2047]},{"value":"'
+    'http","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"value":"nntp","revisions":[2047,2047]},{"value":"imaps","revisions":[2047,204'
+    '7]},{"value":"smtps","revisions":[2047,2047]},{"value":"pop3s","revisions":[2047,2047]},{"value":"https","revisions":[2047,2047]},{"value":"ftps","rev'
+    'isions":[2047,2047]},{"value":"mapi","revisions":[2047,2047]},{"value":"cifs","revisions":[2047,2047]},{"value":"mm1","revisions":[2047,127]},{"value"'
+    ':"mm3","revisions":[2047,127]},{"value":"mm4","revisions":[2047,127]},{"value":"mm7","revisions":[2047,127]},{"value":"ssh","revisions":[2040,2040]}],'
+    '"revisions":[2047,2047]},"store_heuristic":{"multiple_values":true,"type":"list","options":[{"value":"imap","revisions":[2047,2047]},{"value":"smtp","'
+    'revisions":[2047,2047]},{"value":"pop3","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"va'
+    'lue":"nntp","revisions":[2047,2047]},{"value":"imaps","revisions":[2047,2047]},{"value":"smtps","revisions":[2047,2047]},{"value":"pop3s","revisions":'
+    '[2047,2047]},{"value":"https","revisions":[2047,2047]},{"value":"ftps","revisions":[2047,2047]},{"value":"mapi","revisions":[2047,2047]},{"value":"cif'
+    's","revisions":[2047,2047]},{"value":"mm1","revisions":[2047,127]},{"value":"mm3","revisions":[2047,127]},{"value":"mm4","revisions":[2047,127]},{"val'
+    'ue":"mm7","revisions":[2047,127]},{"value":"ssh","revisions":[2040,2040]}],"revisions":[2047,2047]},"store_infected":{"multiple_values":true,"type":"l'
+    'ist","options":[{"value":"imap","revisions":[2047,2047]},{"value":"smtp","revisions":[2047,2047]},{"value":"pop3","revisions":[2047,2047]},{"value":"h'
+    'ttp","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"value":"nntp","revisions":[2047,2047]},{"value":"imaps","revisions":[2047,2047'
+    ']},{"value":"smtps","revisions":[2047,2047]},{"value":"pop3s","revisions":[2047,2047]},{"value":"https","revisions":[2047,2047]},{"value":"ftps","revi'
+    'sions":[2047,2047]},{"value":"mapi","revisions":[2047,2047]},{"value":"cifs","revisions":[2047,2047]},{"value":"mm1","revisions":[2047,127]},{"value":'
+    '"mm3","revisions":[2047,127]},{"value":"mm4","revisions":[2047,127]},{"value":"mm7","revisions":[2047,127]},{"value":"ssh","revisions":[2040,2040]}],"'
+    'revisions":[2047,2047]},"store_blocked":{"multiple_values":true,"type":"list","options":[{"value":"imap","revisions":[2047,2047]},{"value":"smtp","rev'
+    'isions":[2047,2047]},{"value":"pop3","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"value'
+    '":"nntp","revisions":[2047,2047]},{"value":"imaps","revisions":[2047,2047]},{"value":"smtps","revisions":[2047,2047]},{"value":"pop3s","revisions":[20'
+    '47,2047]},{"value":"ftps","revisions":[2047,2047]},{"value":"mapi","revisions":[2047,2047]},{"value":"cifs","revisions":[2047,2047]},{"value":"mm1","r'
+    'evisions":[2047,127]},{"value":"mm3","revisions":[2047,127]},{"value":"mm4","revisions":[2047,127]},{"value":"mm7","revisions":[2047,127]},{"value":"s'
+    'sh","revisions":[2040,2040]}],"revisions":[2047,2047]},"drop_intercepted":{"multiple_values":true,"type":"list","options":[{"value":"imap","revisions"'
+    ':[127,127]},{"value":"smtp","revisions":[127,127]},{"value":"pop3","revisions":[127,127]},{"value":"http","revisions":[127,127]},{"value":"ftp","revis'
+    'ions":[127,127]},{"value":"imaps","revisions":[127,127]},{"value":"smtps","revisions":[127,127]},{"value":"pop3s","revisions":[127,127]},{"value":"htt'
+    'ps","revisions":[127,127]},{"value":"ftps","revisions":[127,127]},{"value":"mapi","revisions":[127,127]},{"value":"mm1","revisions":[127,127]},{"value'
+    '":"mm3","revisions":[127,127]},{"value":"mm4","revisions":[127,127]},{"value":"mm7","revisions":[127,127]}],"revisions":[2047,127]},"lowspace":{"type"'
+    ':"string","options":[{"value":"drop-new","revisions":[2047,2047]},{"value":"ovrw-old","revisions":[2047,2047]}],"revisions":[2047,2047]},"drop_blocked'
+    '":{"multiple_values":true,"type":"list","options":[{"value":"imap","revisions":[2047,2047]},{"value":"smtp","revisions":[2047,2047]},{"value":"pop3","'
+    'revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"value":"nntp","revisions":[2047,2047]},{"va'
+    'lue":"imaps","revisions":[2047,2047]},{"value":"smtps","revisions":[2047,2047]},{"value":"pop3s","revisions":[2047,2047]},{"value":"ftps","revisions":'
+    '[2047,2047]},{"value":"mapi","revisions":[2047,2047]},{"value":"cifs","revisions":[2047,2047]},{"value":"mm1","revisions":[2047,127]},{"value":"mm3","'
+    'revisions":[2047,127]},{"value":"mm4","revisions":[2047,127]},{"value":"mm7","revisions":[2047,127]},{"value":"ssh","revisions":[2040,2040]}],"revisio'
+    'ns":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"quarantine_quota":{"type":"int","required":false},"store_intercepted":{"type":"list","required":false},"dr'
+    'op_infected":{"type":"list","required":false},"maxfilesize":{"type":"int","required":false},"agelimit":{"type":"int","required":false},"destination":{'
+    '"type":"str","required":false,"choices":["NULL","disk","FortiAnalyzer"]},"drop_heuristic":{"type":"list","required":false},"store_heuristic":{"type":"'
+    'list","required":false},"store_infected":{"type":"list","required":false},"store_blocked":{"type":"list","required":false},"drop_intercepted":{"type":'
+    '"list","required":false},"lowspace":{"type":"str","required":false,"choices":["drop-new","ovrw-old"]},"drop_blocked":{"type":"list","required":false}}'
+    '}'
+)
@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"override_timeout":{"type":"integer","revisions":[2047,2047]},"machine_learning_detection":{"type":"string","options":[{"va'
+    'lue":"enable","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024'
+    ']},"use_extreme_db":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1'
+    '920,1920]},"default_db":{"type":"string","options":[{"value":"normal","revisions":[127,127]},{"value":"extended","revisions":[127,127]},{"value":"extr'
+    'eme","revisions":[127,127]}],"revisions":[2047,127]},"grayware":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"override_timeout":{"type":"int","required":false},"machine_learning_detection":{"type":"str","required":fa'
+    'lse,"choices":["enable","monitor","disable"]},"use_extreme_db":{"type":"str","required":false,"choices":["enable","disable"]},"default_db":{"type":"st'
+    'r","required":false},"grayware":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"category":{"type":"integer","revisions":[2047,2047]},"protocol":{"type'
+    '":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,23]},"tag":{"type":"string","revisions":[2047,2047]},"behavior":{"type":'
+    '"string","revisions":[2047,2047]},"signature":{"type":"string","revisions":[2047,2047]},"vendor":{"type":"string","revisions":[2047,2047]},"technology'
+    '":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"category":{"type":"int","required":false},"protocol":{"type":"st'
+    'r","required":false},"name":{"type":"str","required":false},"tag":{"type":"str","required":false},"behavior":{"type":"str","required":false},"signatur'
+    'e":{"type":"str","required":false},"vendor":{"type":"str","required":false},"technology":{"type":"str","required":false},"id":{"type":"int","required"'
+    ':false}}}'
+)
@@ -0,0 +1,22 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"category":{"type":"list","children":{"id":{"type":"integer","revisions'
+    '":[2047,2047]}},"revisions":[2047,2047]},"vendor":{"type":"string","revisions":[1024,1024]},"name":{"type":"string","revisions":[2047,2047]},"technolo'
+    'gy":{"type":"string","revisions":[1024,1024]},"popularity":{"multiple_values":true,"type":"list","options":[{"value":"1","revisions":[1024,1024]},{"va'
+    'lue":"2","revisions":[1024,1024]},{"value":"3","revisions":[1024,1024]},{"value":"4","revisions":[1024,1024]},{"value":"5","revisions":[1024,1024]}],"'
+    'revisions":[1024,1024]},"application":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"behavior":'
+    '{"type":"string","revisions":[1024,1024]},"type":{"type":"string","options":[{"value":"application","revisions":[2047,2047]},{"value":"category","revi'
+    'sions":[2047,1023]},{"value":"filter","revisions":[1024,1024]}],"revisions":[2047,2047]},"protocols":{"type":"string","revisions":[1024,1024]},"risk":'
+    '{"type":"list","children":{"level":{"type":"integer","revisions":[1024,1024]}},"revisions":[1024,1024]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"category":{"type":"list","required":false,"options":{"id":{"type'
+    '":"int","required":false}}},"vendor":{"type":"str","required":false},"name":{"type":"str","required":false},"technology":{"type":"str","required":fals'
+    'e},"popularity":{"type":"list","required":false,"choices":["1","2","3","4","5"]},"application":{"type":"list","required":false,"options":{"id":{"type"'
+    ':"int","required":false}}},"behavior":{"type":"str","required":false},"type":{"type":"str","required":false},"protocols":{"type":"str","required":fals'
+    'e},"risk":{"type":"list","required":false,"options":{"level":{"type":"int","required":false}}}}}'
+)
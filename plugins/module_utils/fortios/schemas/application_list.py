@@ -0,0 +1,79 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"control_default_network_services":{"type":"string","options":[{"value"'
+    ':"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"enforce_default_app_port":{"type":"string","'
+    'options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"name":{"type":"string","re'
+    'visions":[2047,2047]},"other_application_action":{"type":"string","options":[{"value":"pass","revisions":[2047,2047]},{"value":"block","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"p2p_black_list":{"multiple_values":true,"type":"list","options":[{"value":"skype","revisions":[1023,1023]},{"valu'
+    'e":"edonkey","revisions":[1023,1023]},{"value":"bittorrent","revisions":[1023,1023]}],"revisions":[2047,1023]},"deep_app_inspection":{"type":"string",'
+    '"options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"replacemsg_group":{"type"'
+    ':"string","revisions":[2047,2047]},"extended_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"force_inclusion_ssl_di_sigs":{"type":"string","options":[{"value":"disable","revisions":[2024,2024]},{"value'
+    '":"enable","revisions":[2024,2024]}],"revisions":[2040,2024]},"app_replacemsg":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]}'
+    ',{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"other_application_log":{"type":"string","options":[{"value":"disable","revision'
+    's":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"entries":{"type":"list","children":{"per_ip_shaper":{"type":"str'
+    'ing","revisions":[2047,2047]},"sub_category":{"type":"list","children":{"id":{"type":"integer","revisions":[127,127]}},"revisions":[2047,127]},"sessio'
+    'n_ttl":{"type":"integer","revisions":[2047,2047]},"technology":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047'
+    ']},"category":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"exclusion":{"type":"list","childre'
+    'n":{"id":{"type":"integer","revisions":[1600,1600]}},"revisions":[1984,1600]},"parameters":{"type":"list","children":{"members":{"type":"list","childr'
+    'en":{"id":{"type":"integer","revisions":[1920,1920]},"value":{"type":"string","revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1920]'
+    '}},"revisions":[1920,1920]},"id":{"type":"integer","revisions":[2047,2047]},"value":{"type":"string","revisions":[2047,127]}},"revisions":[2047,2047]}'
+    ',"application":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"rate_track":{"type":"string","opt'
+    'ions":[{"value":"none","revisions":[2047,2047]},{"value":"src-ip","revisions":[2047,2047]},{"value":"dest-ip","revisions":[2047,2047]},{"value":"dhcp-'
+    'client-mac","revisions":[2047,2047]},{"value":"dns-domain","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_packet":{"type":"string","options":'
+    '[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rate_count":{"type":"integer","revi'
+    'sions":[2047,2047]},"vendor":{"type":"string","revisions":[2047,2047]},"risk":{"type":"list","children":{"level":{"type":"integer","revisions":[2047,2'
+    '047]}},"revisions":[2047,2047]},"shaper_reverse":{"type":"string","revisions":[2047,2047]},"quarantine_expiry":{"type":"string","revisions":[2047,2047'
+    ']},"rate_mode":{"type":"string","options":[{"value":"periodical","revisions":[2047,2047]},{"value":"continuous","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"protocols":{"type":"string","revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"val'
+    'ue":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"quarantine":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"va'
+    'lue":"attacker","revisions":[2047,2047]}],"revisions":[2047,2047]},"popularity":{"multiple_values":true,"type":"list","options":[{"value":"1","revisio'
+    'ns":[2047,2047]},{"value":"2","revisions":[2047,2047]},{"value":"3","revisions":[2047,2047]},{"value":"4","revisions":[2047,2047]},{"value":"5","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"shaper":{"type":"string","revisions":[2047,2047]},"behavior":{"type":"string","revisions":[2047,2047]},"'
+    'action":{"type":"string","options":[{"value":"pass","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]},{"value":"reset","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"rate_duration":{"type":"integer","revisions":[2047,2047]},"quarantine_log":{"type":"string","options":[{"value":'
+    '"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"unknown_application'
+    '_log":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"de'
+    'fault_network_services":{"type":"list","children":{"services":{"multiple_values":true,"type":"list","options":[{"value":"http","revisions":[2040,2040]'
+    '},{"value":"ssh","revisions":[2040,2040]},{"value":"telnet","revisions":[2040,2040]},{"value":"ftp","revisions":[2040,2040]},{"value":"dns","revisions'
+    '":[2040,2040]},{"value":"smtp","revisions":[2040,2040]},{"value":"pop3","revisions":[2040,2040]},{"value":"imap","revisions":[2040,2040]},{"value":"sn'
+    'mp","revisions":[2040,2040]},{"value":"nntp","revisions":[2040,2040]},{"value":"https","revisions":[2040,2040]}],"revisions":[2040,2040]},"violation_a'
+    'ction":{"type":"string","options":[{"value":"pass","revisions":[2040,2040]},{"value":"monitor","revisions":[2040,2040]},{"value":"block","revisions":['
+    '2040,2040]}],"revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]},"port":{"type":"integer","revisions":[2040,2040]}},"revisions":['
+    '2040,2040]},"unknown_application_action":{"type":"string","options":[{"value":"pass","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":[{"value":"allow-dns","revisions":[2047,2047]},{"value":"allow-i'
+    'cmp","revisions":[2047,2047]},{"value":"allow-http","revisions":[2047,2047]},{"value":"allow-ssl","revisions":[2047,2047]},{"value":"allow-quic","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"p2p_block_list":{"multiple_values":true,"type":"list","options":[{"value":"skype","revisions":[1024,102'
+    '4]},{"value":"edonkey","revisions":[1024,1024]},{"value":"bittorrent","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"control_default_network_services":{"type":"str","required":false'
+    ',"choices":["disable","enable"]},"enforce_default_app_port":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","requi'
+    'red":false},"other_application_action":{"type":"str","required":false,"choices":["pass","block"]},"p2p_black_list":{"type":"list","required":false},"d'
+    'eep_app_inspection":{"type":"str","required":false,"choices":["disable","enable"]},"replacemsg_group":{"type":"str","required":false},"extended_log":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"force_inclusion_ssl_di_sigs":{"type":"str","required":false},"app_replacemsg":{"type":"'
+    'str","required":false,"choices":["disable","enable"]},"other_application_log":{"type":"str","required":false,"choices":["disable","enable"]},"entries"'
+    ':{"type":"list","required":false,"options":{"per_ip_shaper":{"type":"str","required":false},"sub_category":{"type":"list","required":false,"options":{'
+    '"id":{"type":"int","required":false}}},"session_ttl":{"type":"int","required":false},"technology":{"type":"str","required":false},"id":{"type":"int","'
+    'required":false},"category":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"exclusion":{"type":"list","required":fa'
+    'lse,"options":{"id":{"type":"int","required":false}}},"parameters":{"type":"list","required":false,"options":{"members":{"type":"list","required":fals'
+    'e,"options":{"id":{"type":"int","required":false},"value":{"type":"str","required":false},"name":{"type":"str","required":false}}},"id":{"type":"int",'
+    '"required":false},"value":{"type":"str","required":false}}},"application":{"type":"list","required":false,"options":{"id":{"type":"int","required":fal'
+    'se}}},"rate_track":{"type":"str","required":false,"choices":["none","src-ip","dest-ip","dhcp-client-mac","dns-domain"]},"log_packet":{"type":"str","re'
+    'quired":false,"choices":["disable","enable"]},"rate_count":{"type":"int","required":false},"vendor":{"type":"str","required":false},"risk":{"type":"li'
+    'st","required":false,"options":{"level":{"type":"int","required":false}}},"shaper_reverse":{"type":"str","required":false},"quarantine_expiry":{"type"'
+    ':"str","required":false},"rate_mode":{"type":"str","required":false,"choices":["periodical","continuous"]},"protocols":{"type":"str","required":false}'
+    ',"log":{"type":"str","required":false,"choices":["disable","enable"]},"quarantine":{"type":"str","required":false,"choices":["none","attacker"]},"popu'
+    'larity":{"type":"list","required":false,"choices":["1","2","3","4","5"]},"shaper":{"type":"str","required":false},"behavior":{"type":"str","required":'
+    'false},"action":{"type":"str","required":false,"choices":["pass","block","reset"]},"rate_duration":{"type":"int","required":false},"quarantine_log":{"'
+    'type":"str","required":false,"choices":["disable","enable"]}}},"unknown_application_log":{"type":"str","required":false,"choices":["disable","enable"]'
+    '},"default_network_services":{"type":"list","required":false,"options":{"services":{"type":"list","required":false,"choices":["http","ssh","telnet","f'
+    'tp","dns","smtp","pop3","imap","snmp","nntp","https"]},"violation_action":{"type":"str","required":false,"choices":["pass","monitor","block"]},"id":{"'
+    'type":"int","required":false},"port":{"type":"int","required":false}}},"unknown_application_action":{"type":"str","required":false,"choices":["pass","'
+    'block"]},"options":{"type":"list","required":false,"choices":["allow-dns","allow-icmp","allow-http","allow-ssl","allow-quic"]},"p2p_block_list":{"type'
+    '":"list","required":false,"choices":["skype","edonkey","bittorrent"]}}}'
+)
@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"category":{"type":"integer","revisions":[2047,2047]},"protocol":{"type":"string","revisions":[2047,2047]},"name":{"type":"'
+    'string","revisions":[2047,2047]},"weight":{"type":"integer","revisions":[2047,2047]},"parameter":{"type":"string","revisions":[2047,127]},"popularity"'
+    ':{"type":"integer","revisions":[2047,2047]},"metadata":{"type":"list","children":{"valueid":{"type":"integer","revisions":[2047,2047]},"id":{"type":"i'
+    'nteger","revisions":[2047,2047]},"metaid":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"behavior":{"type":"string","revisions"'
+    ':[2047,2047]},"vendor":{"type":"string","revisions":[2047,2047]},"parameters":{"type":"list","children":{"default value":{"type":"string","revisions":'
+    '[1920,1920]},"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"technology":{"type":"string","revisions":[2047,2047]},"id":{"'
+    'type":"integer","revisions":[2047,2047]},"risk":{"type":"integer","revisions":[2047,2047]},"sub_category":{"type":"integer","revisions":[2047,127]}},"'
+    'revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"category":{"type":"int","required":false},"protocol":{"type":"str","required":false},"name":{"type":"str",'
+    '"required":false},"weight":{"type":"int","required":false},"parameter":{"type":"str","required":false},"popularity":{"type":"int","required":false},"m'
+    'etadata":{"type":"list","required":false,"options":{"valueid":{"type":"int","required":false},"id":{"type":"int","required":false},"metaid":{"type":"i'
+    'nt","required":false}}},"behavior":{"type":"str","required":false},"vendor":{"type":"str","required":false},"parameters":{"type":"list","required":fal'
+    'se,"options":{"default value":{"type":"str","required":false},"name":{"type":"str","required":false}}},"technology":{"type":"str","required":false},"i'
+    'd":{"type":"int","required":false},"risk":{"type":"int","required":false},"sub_category":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,30 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"web_auth_cookie":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"protocol":{"type":"string","options":[{"value":"http","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2'
+    '047]},{"value":"socks","revisions":[2047,2047]},{"value":"ssh","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":'
+    '[2047,2047]},"active_auth_method":{"type":"string","revisions":[2047,2047]},"web_portal":{"type":"string","options":[{"value":"enable","revisions":[20'
+    '40,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"dstaddr6":{"type":"list","children":{"name":{"type":"string","revisio'
+    'ns":[1024,1024]}},"revisions":[1024,1024]},"comments":{"type":"string","revisions":[2047,2047]},"srcaddr":{"type":"list","children":{"name":{"type":"s'
+    'tring","revisions":[2047,2047]}},"revisions":[2047,2047]},"ip_based":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"'
+    'disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"srcintf":{"type":"list","children":{"name":{"type":"string","revisions":[1024,1024]}},"re'
+    'visions":[1024,1024]},"srcaddr6":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"transaction_ba'
+    'sed":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dst'
+    'addr":{"type":"list","children":{"name":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"sso_auth_method":{"type":"string","revisi'
+    'ons":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"web_auth_cookie":{"type":"str","re'
+    'quired":false,"choices":["enable","disable"]},"protocol":{"type":"str","required":false,"choices":["http","ftp","socks","ssh"]},"name":{"type":"str","'
+    'required":false},"active_auth_method":{"type":"str","required":false},"web_portal":{"type":"str","required":false,"choices":["enable","disable"]},"dst'
+    'addr6":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"comments":{"type":"str","required":false},"srcaddr":{"type'
+    '":"list","required":false,"options":{"name":{"type":"str","required":false}}},"ip_based":{"type":"str","required":false,"choices":["enable","disable"]'
+    '},"srcintf":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"srcaddr6":{"type":"list","required":false,"options":{'
+    '"name":{"type":"str","required":false}}},"transaction_based":{"type":"str","required":false,"choices":["enable","disable"]},"dstaddr":{"type":"list","'
+    'required":false,"options":{"name":{"type":"str","required":false}}},"sso_auth_method":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,27 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"negotiate_ntlm":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"saml_server":{"type":"string","revisions":[1024,1024]},"saml_time'
+    'out":{"type":"integer","revisions":[1024,1024]},"fsso_guest":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"ems_device_owner":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value"'
+    ':"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"kerberos_keytab":{"type":"string","revisions":[2047,2047]},"fsso_agent_for_ntlm":{"type'
+    '":"string","revisions":[2047,2047]},"domain_controller":{"type":"string","revisions":[2047,2047]},"ssh_ca":{"type":"string","revisions":[2047,2047]},"'
+    'require_tfa":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"method":{"multiple_values":true,"type":"list","options":[{"value":"ntlm","revisions":[2047,2047]},{"value":"basic","revisions":[2047,2047]},{"val'
+    'ue":"digest","revisions":[2047,2047]},{"value":"form","revisions":[2047,2047]},{"value":"negotiate","revisions":[2047,2047]},{"value":"fsso","revision'
+    's":[2047,2047]},{"value":"rsso","revisions":[2047,2047]},{"value":"ssh-publickey","revisions":[2047,2047]},{"value":"cert","revisions":[1024,1024]},{"'
+    'value":"saml","revisions":[1024,1024]}],"revisions":[2047,2047]},"user_database":{"type":"list","children":{"name":{"type":"string","revisions":[2047,'
+    '2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"negotiate_ntlm":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","requi'
+    'red":false},"saml_server":{"type":"str","required":false},"saml_timeout":{"type":"int","required":false},"fsso_guest":{"type":"str","required":false,"'
+    'choices":["enable","disable"]},"ems_device_owner":{"type":"str","required":false,"choices":["enable","disable"]},"kerberos_keytab":{"type":"str","requ'
+    'ired":false},"fsso_agent_for_ntlm":{"type":"str","required":false},"domain_controller":{"type":"str","required":false},"ssh_ca":{"type":"str","require'
+    'd":false},"require_tfa":{"type":"str","required":false,"choices":["enable","disable"]},"method":{"type":"list","required":false},"user_database":{"typ'
+    'e":"list","required":false,"options":{"name":{"type":"str","required":false}}}}}'
+)
@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"captive_portal":{"type":"string","revisions":[2047,2047]},"sso_auth_scheme":{"type":"string","revisions":[2047,2047]},"cap'
+    'tive_portal_ssl_port":{"type":"integer","revisions":[2040,2040]},"dev_range":{"type":"list","children":{"name":{"type":"string","revisions":[1024,1024'
+    ']}},"revisions":[1024,1024]},"captive_portal_port":{"type":"integer","revisions":[2047,2047]},"auth_https":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"captive_portal_type":{"type":"string","options":[{"'
+    'value":"fqdn","revisions":[2047,2047]},{"value":"ip","revisions":[2047,2047]}],"revisions":[2047,2047]},"captive_portal_ip6":{"type":"string","revisio'
+    'ns":[2047,2047]},"captive_portal6":{"type":"string","revisions":[2047,2047]},"active_auth_scheme":{"type":"string","revisions":[2047,2047]},"captive_p'
+    'ortal_ip":{"type":"string","revisions":[2047,2047]},"user_cert_ca":{"type":"list","children":{"name":{"type":"string","revisions":[1024,1024]}},"revis'
+    'ions":[1024,1024]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"captive_portal":{"type":"str","required":false},"sso_auth_scheme":{"type":"str","required":false},"captive'
+    '_portal_ssl_port":{"type":"int","required":false},"dev_range":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"cap'
+    'tive_portal_port":{"type":"int","required":false},"auth_https":{"type":"str","required":false,"choices":["enable","disable"]},"captive_portal_type":{"'
+    'type":"str","required":false,"choices":["fqdn","ip"]},"captive_portal_ip6":{"type":"str","required":false},"captive_portal6":{"type":"str","required":'
+    'false},"active_auth_scheme":{"type":"str","required":false},"captive_portal_ip":{"type":"str","required":false},"user_cert_ca":{"type":"list","require'
+    'd":false,"options":{"name":{"type":"str","required":false}}}}}'
+)
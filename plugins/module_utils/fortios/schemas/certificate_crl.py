@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"last_updated":{"type":"integer","revisions":[2047,23]},"name":{"type":"string","revisions":[2047,2047]},"scep_url":{"type"'
+    ':"string","revisions":[2047,2047]},"ldap_password":{"type":"string","revisions":[2047,2047]},"ldap_server":{"type":"string","revisions":[2047,2047]},"'
+    'update_vdom":{"type":"string","revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2047,2047]},"ldap_username":{"type":"string","revisio'
+    'ns":[2047,2047]},"source":{"type":"string","options":[{"value":"factory","revisions":[2047,2047]},{"value":"user","revisions":[2047,2047]},{"value":"b'
+    'undle","revisions":[2047,2047]}],"revisions":[2047,2047]},"range":{"type":"string","options":[{"value":"global","revisions":[2047,2047]},{"value":"vdo'
+    'm","revisions":[2047,2047]}],"revisions":[2047,2047]},"http_url":{"type":"string","revisions":[2047,2047]},"scep_cert":{"type":"string","revisions":[2'
+    '047,2047]},"update_interval":{"type":"integer","revisions":[2047,2047]},"crl":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"last_updated":{"type":"int","required":false},"name":{"type":"str","required":false},"scep_url":{"type":"s'
+    'tr","required":false},"ldap_password":{"type":"str","required":false},"ldap_server":{"type":"str","required":false},"update_vdom":{"type":"str","requi'
+    'red":false},"source_ip":{"type":"str","required":false},"ldap_username":{"type":"str","required":false},"source":{"type":"str","required":false,"choic'
+    'es":["factory","user","bundle"]},"range":{"type":"str","required":false,"choices":["global","vdom"]},"http_url":{"type":"str","required":false},"scep_'
+    'cert":{"type":"str","required":false},"update_interval":{"type":"int","required":false},"crl":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,37 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"last_updated":{"type":"integer","revisions":[2047,23]},"scep_url":{"type":"string","revisions":[2047,2047]},"auto_regenera'
+    'te_days":{"type":"integer","revisions":[2047,2047]},"auto_regenerate_days_warning":{"type":"integer","revisions":[2047,2047]},"cmp_server_cert":{"type'
+    '":"string","revisions":[2047,2047]},"certificate":{"type":"string","revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},"sour'
+    'ce":{"type":"string","options":[{"value":"factory","revisions":[2047,2047]},{"value":"user","revisions":[2047,2047]},{"value":"bundle","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"state":{"type":"string","revisions":[2047,2047]},"name_encoding":{"type":"string","options":[{"value":"printable"'
+    ',"revisions":[2047,2047]},{"value":"utf8","revisions":[2047,2047]}],"revisions":[2047,2047]},"cmp_server":{"type":"string","revisions":[2047,2047]},"a'
+    'cme_ca_url":{"type":"string","revisions":[1024,1024]},"scep_password":{"type":"string","revisions":[2047,2047]},"acme_domain":{"type":"string","revisi'
+    'ons":[1024,1024]},"csr":{"type":"string","revisions":[2047,2047]},"ike_localid_type":{"type":"string","options":[{"value":"asn1dn","revisions":[2047,2'
+    '047]},{"value":"fqdn","revisions":[2047,2047]}],"revisions":[2047,2047]},"private_key":{"type":"string","revisions":[2047,2047]},"cmp_path":{"type":"s'
+    'tring","revisions":[2047,2047]},"ike_localid":{"type":"string","revisions":[2047,2047]},"acme_renew_window":{"type":"integer","revisions":[1024,1024]}'
+    ',"ca_identifier":{"type":"string","revisions":[2047,2047]},"password":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2'
+    '047,2047]},"acme_rsa_key_size":{"type":"integer","revisions":[1024,1024]},"source_ip":{"type":"string","revisions":[2047,2047]},"cmp_regeneration_meth'
+    'od":{"type":"string","options":[{"value":"keyupate","revisions":[2047,2047]},{"value":"renewal","revisions":[2047,2047]}],"revisions":[2047,2047]},"ra'
+    'nge":{"type":"string","options":[{"value":"global","revisions":[2047,2047]},{"value":"vdom","revisions":[2047,2047]}],"revisions":[2047,2047]},"enroll'
+    '_protocol":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"scep","revisions":[2047,2047]},{"value":"cmpv2","revisions":'
+    '[2047,2047]},{"value":"acme2","revisions":[1024,1024]}],"revisions":[2047,2047]},"acme_email":{"type":"string","revisions":[1024,1024]}},"revisions":['
+    '2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"last_updated":{"type":"int","required":false},"scep_url":{"type":"str","required":false},"auto_regenerate_'
+    'days":{"type":"int","required":false},"auto_regenerate_days_warning":{"type":"int","required":false},"cmp_server_cert":{"type":"str","required":false}'
+    ',"certificate":{"type":"str","required":false},"comments":{"type":"str","required":false},"source":{"type":"str","required":false,"choices":["factory"'
+    ',"user","bundle"]},"state":{"type":"str","required":false},"name_encoding":{"type":"str","required":false,"choices":["printable","utf8"]},"cmp_server"'
+    ':{"type":"str","required":false},"acme_ca_url":{"type":"str","required":false},"scep_password":{"type":"str","required":false},"acme_domain":{"type":"'
+    'str","required":false},"csr":{"type":"str","required":false},"ike_localid_type":{"type":"str","required":false,"choices":["asn1dn","fqdn"]},"private_k'
+    'ey":{"type":"str","required":false},"cmp_path":{"type":"str","required":false},"ike_localid":{"type":"str","required":false},"acme_renew_window":{"typ'
+    'e":"int","required":false},"ca_identifier":{"type":"str","required":false},"password":{"type":"str","required":false},"name":{"type":"str","required":'
+    'false},"acme_rsa_key_size":{"type":"int","required":false},"source_ip":{"type":"str","required":false},"cmp_regeneration_method":{"type":"str","requir'
+    'ed":false,"choices":["keyupate","renewal"]},"range":{"type":"str","required":false,"choices":["global","vdom"]},"enroll_protocol":{"type":"str","requi'
+    'red":false},"acme_email":{"type":"str","required":false}}}'
+)
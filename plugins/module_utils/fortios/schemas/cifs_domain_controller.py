@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"username":{"type":"string","revisions":[376,376]},"server_name":{"type":"string","revisions":[376,376]},"ip":{"type":"stri'
+    'ng","revisions":[376,376]},"domain_name":{"type":"string","revisions":[376,376]},"ip6":{"type":"string","revisions":[376,376]},"password":{"type":"str'
+    'ing","revisions":[376,376]},"port":{"type":"integer","revisions":[376,376]}},"revisions":[376,376]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"username":{"type":"str","required":false},"server_name":{"type":"str","required":false},"ip":{"type":"str"'
+    ',"required":false},"domain_name":{"type":"str","required":false},"ip6":{"type":"str","required":false},"password":{"type":"str","required":false},"por'
+    't":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,29 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"file_filter":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"va'
+    'lue":"disable","revisions":[120,120]}],"revisions":[120,120]},"log":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"dis'
+    'able","revisions":[120,120]}],"revisions":[120,120]},"entries":{"type":"list","children":{"comment":{"type":"string","revisions":[120,120]},"direction'
+    '":{"type":"string","options":[{"value":"incoming","revisions":[120,120]},{"value":"outgoing","revisions":[120,120]},{"value":"any","revisions":[120,12'
+    '0]}],"revisions":[120,120]},"protocol":{"multiple_values":true,"type":"list","options":[{"value":"cifs","revisions":[16,16]}],"revisions":[112,16]},"f'
+    'ile_type":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"filter":{"type":"string","revisions":[120'
+    ',120]},"action":{"type":"string","options":[{"value":"log","revisions":[120,120]},{"value":"block","revisions":[120,120]}],"revisions":[120,120]}},"re'
+    'visions":[120,120]}},"revisions":[376,120]},"server_keytab":{"type":"list","children":{"password":{"type":"string","revisions":[368,16]},"keytab":{"ty'
+    'pe":"string","revisions":[376,376]},"principal":{"type":"string","revisions":[376,376]}},"revisions":[376,376]},"server_credential_type":{"type":"stri'
+    'ng","options":[{"value":"none","revisions":[376,376]},{"value":"credential-replication","revisions":[376,376]},{"value":"credential-keytab","revisions'
+    '":[376,376]}],"revisions":[376,376]},"name":{"type":"string","revisions":[376,376]},"domain_controller":{"type":"string","revisions":[376,376]}},"revi'
+    'sions":[376,376]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"file_filter":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":'
+    '["enable","disable"]},"log":{"type":"str","required":false,"choices":["enable","disable"]},"entries":{"type":"list","required":false,"options":{"comme'
+    'nt":{"type":"str","required":false},"direction":{"type":"str","required":false,"choices":["incoming","outgoing","any"]},"protocol":{"type":"list","req'
+    'uired":false},"file_type":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"filter":{"type":"str","required":false}'
+    ',"action":{"type":"str","required":false,"choices":["log","block"]}}}}},"server_keytab":{"type":"list","required":false,"options":{"password":{"type":'
+    '"str","required":false},"keytab":{"type":"str","required":false},"principal":{"type":"str","required":false}}},"server_credential_type":{"type":"str",'
+    '"required":false,"choices":["none","credential-replication","credential-keytab"]},"name":{"type":"str","required":false},"domain_controller":{"type":"'
+    'str","required":false}}}'
+)
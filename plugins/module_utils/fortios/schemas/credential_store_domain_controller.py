@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"username":{"type":"string","revisions":[896,896]},"server_name":{"type":"string","revisions":[896,896]},"ip":{"type":"stri'
+    'ng","revisions":[896,896]},"hostname":{"type":"string","revisions":[896,640]},"domain_name":{"type":"string","revisions":[896,896]},"ip6":{"type":"str'
+    'ing","revisions":[896,896]},"password":{"type":"string","revisions":[896,896]},"port":{"type":"integer","revisions":[896,896]}},"revisions":[896,896]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"username":{"type":"str","required":false},"server_name":{"type":"str","required":false},"ip":{"type":"str"'
+    ',"required":false},"hostname":{"type":"str","required":false},"domain_name":{"type":"str","required":false},"ip6":{"type":"str","required":false},"pas'
+    'sword":{"type":"str","required":false},"port":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,32 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"entries":{"type":"list","children":{"file_type":{"type":"string","opti'
+    'ons":[{"value":"7z","revisions":[2047,2047]},{"value":"arj","revisions":[2047,2047]},{"value":"cab","revisions":[2047,2047]},{"value":"lzh","revisions'
+    '":[2047,2047]},{"value":"rar","revisions":[2047,2047]},{"value":"tar","revisions":[2047,2047]},{"value":"zip","revisions":[2047,2047]},{"value":"bzip"'
+    ',"revisions":[2047,2047]},{"value":"gzip","revisions":[2047,2047]},{"value":"bzip2","revisions":[2047,2047]},{"value":"xz","revisions":[2047,2047]},{"'
+    'value":"bat","revisions":[2047,2047]},{"value":"msc","revisions":[2047,511]},{"value":"uue","revisions":[2047,2047]},{"value":"mime","revisions":[2047'
+    ',2047]},{"value":"base64","revisions":[2047,2047]},{"value":"binhex","revisions":[2047,2047]},{"value":"elf","revisions":[2047,2047]},{"value":"exe","'
+    'revisions":[2047,2047]},{"value":"hta","revisions":[2047,2047]},{"value":"html","revisions":[2047,2047]},{"value":"jad","revisions":[2047,2047]},{"val'
+    'ue":"class","revisions":[2047,2047]},{"value":"cod","revisions":[2047,2047]},{"value":"javascript","revisions":[2047,2047]},{"value":"msoffice","revis'
+    'ions":[2047,2047]},{"value":"msofficex","revisions":[2047,2047]},{"value":"fsg","revisions":[2047,2047]},{"value":"upx","revisions":[2047,2047]},{"val'
+    'ue":"petite","revisions":[2047,2047]},{"value":"aspack","revisions":[2047,2047]},{"value":"sis","revisions":[2047,2047]},{"value":"hlp","revisions":[2'
+    '047,2047]},{"value":"activemime","revisions":[2047,2047]},{"value":"jpeg","revisions":[2047,2047]},{"value":"gif","revisions":[2047,2047]},{"value":"t'
+    'iff","revisions":[2047,2047]},{"value":"png","revisions":[2047,2047]},{"value":"bmp","revisions":[2047,2047]},{"value":"ignored","revisions":[2047,7]}'
+    ',{"value":"unknown","revisions":[2047,2047]},{"value":"mpeg","revisions":[2047,2047]},{"value":"mov","revisions":[2047,2047]},{"value":"mp3","revision'
+    's":[2047,2047]},{"value":"wma","revisions":[2047,2047]},{"value":"wav","revisions":[2047,2047]},{"value":"pdf","revisions":[2047,2047]},{"value":"avi"'
+    ',"revisions":[2047,2047]},{"value":"rm","revisions":[2047,2047]},{"value":"torrent","revisions":[2047,2047]},{"value":"hibun","revisions":[2047,2047]}'
+    ',{"value":"msi","revisions":[2047,2047]},{"value":"mach-o","revisions":[2047,2047]},{"value":"dmg","revisions":[2047,2047]},{"value":".net","revisions'
+    '":[2047,2047]},{"value":"xar","revisions":[2047,2047]},{"value":"chm","revisions":[2047,2047]},{"value":"iso","revisions":[2047,2047]},{"value":"crx",'
+    '"revisions":[2047,2047]},{"value":"flac","revisions":[2040,2040]}],"revisions":[2047,2047]},"pattern":{"type":"string","revisions":[2047,2047]},"filte'
+    'r_type":{"type":"string","options":[{"value":"pattern","revisions":[2047,2047]},{"value":"type","revisions":[2047,2047]}],"revisions":[2047,2047]}},"r'
+    'evisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"file_type":'
+    '{"type":"str","required":false},"pattern":{"type":"str","required":false},"filter_type":{"type":"str","required":false,"choices":["pattern","type"]}}}'
+    ',"id":{"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,31 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"username":{"type":"string","revisions":[2047,2047]},"remove_deleted":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"scan_subdirectories":{"type":"string","options":[{"value":"en'
+    'able","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},'
+    '"server_type":{"type":"string","options":[{"value":"samba","revisions":[2047,2047]}],"revisions":[2047,2047]},"sensitivity":{"type":"string","revision'
+    's":[2047,2047]},"tod_min":{"type":"integer","revisions":[2047,2047]},"file_pattern":{"type":"string","revisions":[2047,2047]},"period":{"type":"string'
+    '","options":[{"value":"none","revisions":[2047,2047]},{"value":"daily","revisions":[2047,2047]},{"value":"weekly","revisions":[2047,2047]},{"value":"m'
+    'onthly","revisions":[2047,2047]}],"revisions":[2047,2047]},"server":{"type":"string","revisions":[2047,2047]},"tod_hour":{"type":"integer","revisions"'
+    ':[2047,2047]},"weekday":{"type":"string","options":[{"value":"sunday","revisions":[2047,2047]},{"value":"monday","revisions":[2047,2047]},{"value":"tu'
+    'esday","revisions":[2047,2047]},{"value":"wednesday","revisions":[2047,2047]},{"value":"thursday","revisions":[2047,2047]},{"value":"friday","revision'
+    's":[2047,2047]},{"value":"saturday","revisions":[2047,2047]}],"revisions":[2047,2047]},"keep_modified":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"scan_on_creation":{"type":"string","options":[{"value":'
+    '"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"date":{"type":"integer","revisions":[2047,204'
+    '7]},"password":{"type":"string","revisions":[2047,2047]},"file_path":{"type":"string","revisions":[2047,2047]},"vdom":{"type":"string","options":[{"va'
+    'lue":"mgmt","revisions":[2047,2047]},{"value":"current","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"username":{"type":"str","required":false},"remove_deleted":{"type":"str","required":false,"choices":["enab'
+    'le","disable"]},"scan_subdirectories":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"server_ty'
+    'pe":{"type":"str","required":false,"choices":["samba"]},"sensitivity":{"type":"str","required":false},"tod_min":{"type":"int","required":false},"file_'
+    'pattern":{"type":"str","required":false},"period":{"type":"str","required":false,"choices":["none","daily","weekly","monthly"]},"server":{"type":"str"'
+    ',"required":false},"tod_hour":{"type":"int","required":false},"weekday":{"type":"str","required":false,"choices":["sunday","monday","tuesday","wednesd'
+    'ay","thursday","friday","saturday"]},"keep_modified":{"type":"str","required":false,"choices":["enable","disable"]},"scan_on_creation":{"type":"str","'
+    'required":false,"choices":["enable","disable"]},"date":{"type":"int","required":false},"password":{"type":"str","required":false},"file_path":{"type":'
+    '"str","required":false},"vdom":{"type":"str","required":false,"choices":["mgmt","current"]}}}'
+)
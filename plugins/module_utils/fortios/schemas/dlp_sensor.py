@@ -0,0 +1,55 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"feature_set":{"type":"string","options":[{"value":"flow","revisions":['
+    '1920,1920]},{"value":"proxy","revisions":[1920,1920]}],"revisions":[1920,1920]},"dlp_log":{"type":"string","options":[{"value":"enable","revisions":[2'
+    '047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"flow_based":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"extended_log":{"type":"string"'
+    ',"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"filter":{"type":"list","'
+    'children":{"severity":{"type":"string","options":[{"value":"info","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","'
+    'revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]},"proto":{"mult'
+    'iple_values":true,"type":"list","options":[{"value":"smtp","revisions":[2047,2047]},{"value":"pop3","revisions":[2047,2047]},{"value":"imap","revision'
+    's":[2047,2047]},{"value":"http-get","revisions":[2047,2047]},{"value":"http-post","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"v'
+    'alue":"nntp","revisions":[2047,2047]},{"value":"mapi","revisions":[2047,2047]},{"value":"mm1","revisions":[2047,127]},{"value":"mm3","revisions":[2047'
+    ',127]},{"value":"mm4","revisions":[2047,127]},{"value":"mm7","revisions":[2047,127]},{"value":"ssh","revisions":[2040,2040]},{"value":"cifs","revision'
+    's":[1920,1920]}],"revisions":[2047,2047]},"file_type":{"type":"integer","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"file","r'
+    'evisions":[2047,2047]},{"value":"message","revisions":[2047,2047]}],"revisions":[2047,2047]},"sensitivity":{"type":"list","children":{"name":{"type":"'
+    'string","revisions":[2040,2040]}},"revisions":[2040,2040]},"filter_by":{"type":"string","options":[{"value":"credit-card","revisions":[2047,2047]},{"v'
+    'alue":"ssn","revisions":[2047,2047]},{"value":"regexp","revisions":[2047,2047]},{"value":"file-type","revisions":[2047,2047]},{"value":"file-size","re'
+    'visions":[2047,2047]},{"value":"fingerprint","revisions":[2047,2047]},{"value":"watermark","revisions":[2047,2047]},{"value":"encrypted","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"archive":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"match_percentage":{"type":"integer","revisions":[2047,2047]},"file_size":{"type":"integer","revisions":[2047,2'
+    '047]},"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"log-only","revisions":[2047,2047]},{"value":"block","re'
+    'visions":[2047,2047]},{"value":"quarantine-ip","revisions":[2047,2047]}],"revisions":[2047,2047]},"regexp":{"type":"string","revisions":[2047,2047]},"'
+    'company_identifier":{"type":"string","revisions":[2047,2047]},"fp_sensitivity":{"type":"list","children":{"name":{"type":"string","revisions":[7,7]}},'
+    '"revisions":[2047,7]},"id":{"type":"integer","revisions":[2047,2047]},"expiry":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revi'
+    'sions":[2047,2047]}},"revisions":[2047,2047]},"full_archive_proto":{"multiple_values":true,"type":"list","options":[{"value":"smtp","revisions":[2047,'
+    '2047]},{"value":"pop3","revisions":[2047,2047]},{"value":"imap","revisions":[2047,2047]},{"value":"http-get","revisions":[2047,2047]},{"value":"http-p'
+    'ost","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"value":"nntp","revisions":[2047,2047]},{"value":"mapi","revisions":[2047,2047]'
+    '},{"value":"mm1","revisions":[2047,127]},{"value":"mm3","revisions":[2047,127]},{"value":"mm4","revisions":[2047,127]},{"value":"mm7","revisions":[204'
+    '7,127]},{"value":"ssh","revisions":[2040,2040]},{"value":"cifs","revisions":[1920,1920]}],"revisions":[2047,2047]},"summary_proto":{"multiple_values":'
+    'true,"type":"list","options":[{"value":"smtp","revisions":[2047,2047]},{"value":"pop3","revisions":[2047,2047]},{"value":"imap","revisions":[2047,2047'
+    ']},{"value":"http-get","revisions":[2047,2047]},{"value":"http-post","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"value":"nntp",'
+    '"revisions":[2047,2047]},{"value":"mapi","revisions":[2047,2047]},{"value":"mm1","revisions":[2047,127]},{"value":"mm3","revisions":[2047,127]},{"valu'
+    'e":"mm4","revisions":[2047,127]},{"value":"mm7","revisions":[2047,127]},{"value":"ssh","revisions":[2040,2040]},{"value":"cifs","revisions":[1920,1920'
+    ']}],"revisions":[2047,2047]},"replacemsg_group":{"type":"string","revisions":[2047,2047]},"options":{"type":"string","revisions":[2047,127]},"nac_quar'
+    '_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"r'
+    'evisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"feature_set":{"type":"str","required":false,"choices":["flow","p'
+    'roxy"]},"dlp_log":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"flow_based":{"type":"str","re'
+    'quired":false},"extended_log":{"type":"str","required":false,"choices":["enable","disable"]},"filter":{"type":"list","required":false,"options":{"seve'
+    'rity":{"type":"str","required":false,"choices":["info","low","medium","high","critical"]},"proto":{"type":"list","required":false},"file_type":{"type"'
+    ':"int","required":false},"type":{"type":"str","required":false,"choices":["file","message"]},"sensitivity":{"type":"list","required":false,"options":{'
+    '"name":{"type":"str","required":false}}},"filter_by":{"type":"str","required":false,"choices":["credit-card","ssn","regexp","file-type","file-size","f'
+    'ingerprint","watermark","encrypted"]},"archive":{"type":"str","required":false,"choices":["disable","enable"]},"match_percentage":{"type":"int","requi'
+    'red":false},"file_size":{"type":"int","required":false},"action":{"type":"str","required":false,"choices":["allow","log-only","block","quarantine-ip"]'
+    '},"regexp":{"type":"str","required":false},"company_identifier":{"type":"str","required":false},"fp_sensitivity":{"type":"list","required":false,"opti'
+    'ons":{"name":{"type":"str","required":false}}},"id":{"type":"int","required":false},"expiry":{"type":"str","required":false},"name":{"type":"str","req'
+    'uired":false}}},"full_archive_proto":{"type":"list","required":false},"summary_proto":{"type":"list","required":false},"replacemsg_group":{"type":"str'
+    '","required":false},"options":{"type":"str","required":false},"nac_quar_log":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"cache_mem_percent":{"type":"integer","revisions":[2047,2047]},"storage_device":{"type":"string","revisions":[2047,2047]},"'
+    'db_mode":{"type":"string","options":[{"value":"stop-adding","revisions":[2047,2047]},{"value":"remove-modified-then-oldest","revisions":[2047,2047]},{'
+    '"value":"remove-oldest","revisions":[2047,2047]}],"revisions":[2047,2047]},"chunk_size":{"type":"integer","revisions":[2047,2047]},"size":{"type":"int'
+    'eger","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"cache_mem_percent":{"type":"int","required":false},"storage_device":{"type":"str","required":false},"db_mo'
+    'de":{"type":"str","required":false,"choices":["stop-adding","remove-modified-then-oldest","remove-oldest"]},"chunk_size":{"type":"int","required":fals'
+    'e},"size":{"type":"int","required":false}}}'
+)
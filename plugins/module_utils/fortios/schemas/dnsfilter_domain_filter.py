@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"entries":{"type":"list","children":{"action":{"type":"string","options'
+    '":[{"value":"block","revisions":[2047,2047]},{"value":"allow","revisions":[2047,2047]},{"value":"monitor","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"domain":{"type":"string","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"simple","revisions":[2047,2047]},{"value":"rege'
+    'x","revisions":[2047,2047]},{"value":"wildcard","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"r'
+    'evisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"action":{"t'
+    'ype":"str","required":false,"choices":["block","allow","monitor"]},"status":{"type":"str","required":false,"choices":["enable","disable"]},"domain":{"'
+    'type":"str","required":false},"type":{"type":"str","required":false,"choices":["simple","regex","wildcard"]},"id":{"type":"int","required":false}}},"i'
+    'd":{"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
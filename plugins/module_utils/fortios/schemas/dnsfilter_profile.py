@@ -0,0 +1,43 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"external_ip_blocklist":{"type":"list","children":{"name":{"type":"stri'
+    'ng","revisions":[2047,2047]}},"revisions":[2047,2047]},"domain_filter":{"type":"dict","children":{"domain_filter_table":{"type":"integer","revisions":'
+    '[2047,2047]}},"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"youtube_restrict":{"type":"string","options":[{"value":"stric'
+    't","revisions":[2047,2047]},{"value":"moderate","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_all_domain":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"safe_search":{"type":"string","options":[{'
+    '"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"redirect_portal6":{"type":"string","r'
+    'evisions":[2040,2040]},"block_botnet":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"sdns_ftgd_err_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"block_action":{"type":"string","options":[{"value":"block","revisions":[2047,2047]},{"value":"redirect","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"redirect_portal":{"type":"string","revisions":[2047,2047]},"ftgd_dns":{"type":"dict","children":{"optio'
+    'ns":{"multiple_values":true,"type":"list","options":[{"value":"error-allow","revisions":[2047,2047]},{"value":"ftgd-disable","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"filters":{"type":"list","children":{"category":{"type":"integer","revisions":[2047,2047]},"action":{"type":"string","option'
+    's":[{"value":"block","revisions":[2047,2047]},{"value":"monitor","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions"'
+    ':[2047,2047]},"log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]},"dns_translation":{"type":"list","children":{"status":{"type":"string","options":[{"val'
+    'ue":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"src":{"type":"string","revisions":[2040,2'
+    '040]},"dst6":{"type":"string","revisions":[2040,2040]},"dst":{"type":"string","revisions":[2040,2040]},"prefix":{"type":"integer","revisions":[2040,20'
+    '40]},"id":{"type":"integer","revisions":[2040,2040]},"netmask":{"type":"string","revisions":[2040,2040]},"src6":{"type":"string","revisions":[2040,204'
+    '0]},"addr_type":{"type":"string","options":[{"value":"ipv4","revisions":[2040,2040]},{"value":"ipv6","revisions":[2040,2040]}],"revisions":[2040,2040]'
+    '}},"revisions":[2040,2040]},"sdns_domain_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"external_ip_blocklist":{"type":"list","required":false,"options"'
+    ':{"name":{"type":"str","required":false}}},"domain_filter":{"type":"dict","required":false,"options":{"domain_filter_table":{"type":"int","required":f'
+    'alse}}},"name":{"type":"str","required":false},"youtube_restrict":{"type":"str","required":false,"choices":["strict","moderate"]},"log_all_domain":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"safe_search":{"type":"str","required":false,"choices":["disable","enable"]},"redirect_por'
+    'tal6":{"type":"str","required":false},"block_botnet":{"type":"str","required":false,"choices":["disable","enable"]},"sdns_ftgd_err_log":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]},"block_action":{"type":"str","required":false,"choices":["block","redirect"]},"redirect_portal":{"typ'
+    'e":"str","required":false},"ftgd_dns":{"type":"dict","required":false,"options":{"options":{"type":"list","required":false,"choices":["error-allow","f'
+    'tgd-disable"]},"filters":{"type":"list","required":false,"options":{"category":{"type":"int","required":false},"action":{"type":"str","required":false'
+    ',"choices":["block","monitor"]},"id":{"type":"int","required":false},"log":{"type":"str","required":false,"choices":["enable","disable"]}}}}},"dns_tra'
+    'nslation":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"src":{"type":"str","requ'
+    'ired":false},"dst6":{"type":"str","required":false},"dst":{"type":"str","required":false},"prefix":{"type":"int","required":false},"id":{"type":"int",'
+    '"required":false},"netmask":{"type":"str","required":false},"src6":{"type":"str","required":false},"addr_type":{"type":"str","required":false,"choices'
+    '":["ipv4","ipv6"]}}},"sdns_domain_log":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
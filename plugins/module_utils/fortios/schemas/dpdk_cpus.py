@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"tx_cpus":{"type":"string","revisions":[1024,1024]},"ips_cpus":{"type":"string","revisions":[1024,1024]},"vnp_cpus":{"type"'
+    ':"string","revisions":[1024,1024]},"rx_cpus":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"tx_cpus":{"type":"str","required":false},"ips_cpus":{"type":"str","required":false},"vnp_cpus":{"type":"st'
+    'r","required":false},"rx_cpus":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,22 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}'
+    '],"revisions":[1024,1024]},"mbufpool_percentage":{"type":"integer","revisions":[1024,1024]},"hugepage_percentage":{"type":"integer","revisions":[1024,'
+    '1024]},"elasticbuffer":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions"'
+    ':[1024,1024]},"multiqueue":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisi'
+    'ons":[1024,1024]},"interface":{"type":"list","children":{"interface_name":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"sleep_o'
+    'n_idle":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"'
+    'per_session_accounting":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"traffic-log-only","revisions":[1024,1024]},{'
+    '"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"mbufpool_percentage":{"type":"int"'
+    ',"required":false},"hugepage_percentage":{"type":"int","required":false},"elasticbuffer":{"type":"str","required":false,"choices":["disable","enable"]'
+    '},"multiqueue":{"type":"str","required":false,"choices":["disable","enable"]},"interface":{"type":"list","required":false,"options":{"interface_name":'
+    '{"type":"str","required":false}}},"sleep_on_idle":{"type":"str","required":false,"choices":["disable","enable"]},"per_session_accounting":{"type":"str'
+    '","required":false,"choices":["disable","traffic-log-only","enable"]}}}'
+)
@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[1024,1024]},"entries":{"type":"list","children":{"status":{"type":"string","options'
+    '":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"pattern_type":{"type":"string","o'
+    'ptions":[{"value":"wildcard","revisions":[1024,1024]},{"value":"regexp","revisions":[1024,1024]}],"revisions":[1024,1024]},"ip4_subnet":{"type":"strin'
+    'g","revisions":[1024,1024]},"email_pattern":{"type":"string","revisions":[1024,1024]},"id":{"type":"integer","revisions":[1024,1024]},"ip6_subnet":{"t'
+    'ype":"string","revisions":[1024,1024]},"action":{"type":"string","options":[{"value":"reject","revisions":[1024,1024]},{"value":"spam","revisions":[10'
+    '24,1024]},{"value":"clear","revisions":[1024,1024]}],"revisions":[1024,1024]},"type":{"type":"string","options":[{"value":"ip","revisions":[1024,1024]'
+    '},{"value":"email","revisions":[1024,1024]}],"revisions":[1024,1024]},"addr_type":{"type":"string","options":[{"value":"ipv4","revisions":[1024,1024]}'
+    ',{"value":"ipv6","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"id":{"type":"integer","revisions":[1024,1024]},"name":{'
+    '"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"status":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"pattern_type":{"type":"str","required":false,"choices":["wildcard","regexp"]},"ip4_subnet'
+    '":{"type":"str","required":false},"email_pattern":{"type":"str","required":false},"id":{"type":"int","required":false},"ip6_subnet":{"type":"str","req'
+    'uired":false},"action":{"type":"str","required":false,"choices":["reject","spam","clear"]},"type":{"type":"str","required":false,"choices":["ip","emai'
+    'l"]},"addr_type":{"type":"str","required":false,"choices":["ipv4","ipv6"]}}},"id":{"type":"int","required":false},"name":{"type":"str","required":fals'
+    'e}}}'
+)
@@ -0,0 +1,25 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2040,2040]},"entries":{"type":"list","children":{"status":{"type":"string","options'
+    '":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"pattern_type":{"type":"string","o'
+    'ptions":[{"value":"wildcard","revisions":[2040,2040]},{"value":"regexp","revisions":[2040,2040]}],"revisions":[2040,2040]},"language":{"type":"string"'
+    ',"options":[{"value":"western","revisions":[2040,2040]},{"value":"simch","revisions":[2040,2040]},{"value":"trach","revisions":[2040,2040]},{"value":"'
+    'japanese","revisions":[2040,2040]},{"value":"korean","revisions":[2040,2040]},{"value":"french","revisions":[2040,2040]},{"value":"thai","revisions":['
+    '2040,2040]},{"value":"spanish","revisions":[2040,2040]}],"revisions":[2040,2040]},"pattern":{"type":"string","revisions":[2040,2040]},"score":{"type":'
+    '"integer","revisions":[2040,2040]},"action":{"type":"string","options":[{"value":"spam","revisions":[2040,2040]},{"value":"clear","revisions":[2040,20'
+    '40]}],"revisions":[2040,2040]},"where":{"type":"string","options":[{"value":"subject","revisions":[2040,2040]},{"value":"body","revisions":[2040,2040]'
+    '},{"value":"all","revisions":[2040,2040]}],"revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"id":{"t'
+    'ype":"integer","revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"status":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"pattern_type":{"type":"str","required":false,"choices":["wildcard","regexp"]},"language":'
+    '{"type":"str","required":false,"choices":["western","simch","trach","japanese","korean","french","thai","spanish"]},"pattern":{"type":"str","required"'
+    ':false},"score":{"type":"int","required":false},"action":{"type":"str","required":false,"choices":["spam","clear"]},"where":{"type":"str","required":f'
+    'alse,"choices":["subject","body","all"]},"id":{"type":"int","required":false}}},"id":{"type":"int","required":false},"name":{"type":"str","required":f'
+    'alse}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2040,2040]},"entries":{"type":"list","children":{"status":{"type":"string","options'
+    '":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"action":{"type":"string","options'
+    '":[{"value":"reject","revisions":[2040,2040]},{"value":"spam","revisions":[2040,2040]}],"revisions":[2040,2040]},"id":{"type":"integer","revisions":[2'
+    '040,2040]},"server":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]},"name":{"type"'
+    ':"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"status":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"action":{"type":"str","required":false,"choices":["reject","spam"]},"id":{"type":"int","r'
+    'equired":false},"server":{"type":"str","required":false}}},"id":{"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"spam_submit_srv":{"type":"string","revisions":[2040,2040]},"spam_submit_txt2htm":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"spam_submit_force":{"type":"string","options":[{"'
+    'value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"spam_submit_srv":{"type":"str","required":false},"spam_submit_txt2htm":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]},"spam_submit_force":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2040,2040]},"entries":{"type":"list","children":{"status":{"type":"string","options'
+    '":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"ip6_subnet":{"type":"string","rev'
+    'isions":[2040,2040]},"ip4_subnet":{"type":"string","revisions":[2040,2040]},"addr_type":{"type":"string","options":[{"value":"ipv4","revisions":[2040,'
+    '2040]},{"value":"ipv6","revisions":[2040,2040]}],"revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"i'
+    'd":{"type":"integer","revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"status":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"ip6_subnet":{"type":"str","required":false},"ip4_subnet":{"type":"str","required":false},'
+    '"addr_type":{"type":"str","required":false,"choices":["ipv4","ipv6"]},"id":{"type":"int","required":false}}},"id":{"type":"int","required":false},"nam'
+    'e":{"type":"str","required":false}}}'
+)
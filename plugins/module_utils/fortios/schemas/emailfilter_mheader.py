@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2040,2040]},"entries":{"type":"list","children":{"status":{"type":"string","options'
+    '":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"fieldbody":{"type":"string","revi'
+    'sions":[2040,2040]},"pattern_type":{"type":"string","options":[{"value":"wildcard","revisions":[2040,2040]},{"value":"regexp","revisions":[2040,2040]}'
+    '],"revisions":[2040,2040]},"fieldname":{"type":"string","revisions":[2040,2040]},"action":{"type":"string","options":[{"value":"spam","revisions":[204'
+    '0,2040]},{"value":"clear","revisions":[2040,2040]}],"revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+    ',"id":{"type":"integer","revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"status":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"fieldbody":{"type":"str","required":false},"pattern_type":{"type":"str","required":false,'
+    '"choices":["wildcard","regexp"]},"fieldname":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["spam","clear"]},"id":'
+    '{"type":"int","required":false}}},"id":{"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,86 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2040,2040]},"feature_set":{"type":"string","options":[{"value":"flow","revisions":['
+    '1920,1920]},{"value":"proxy","revisions":[1920,1920]}],"revisions":[1920,1920]},"spam_bword_threshold":{"type":"integer","revisions":[2040,2040]},"spa'
+    'm_iptrust_table":{"type":"integer","revisions":[2040,2040]},"spam_log_fortiguard_response":{"type":"string","options":[{"value":"disable","revisions":'
+    '[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"smtp":{"type":"dict","children":{"local_override":{"type":"string",'
+    '"options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"hdrip":{"type":"string","'
+    'options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"log":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[376,376]},{"value":"disable","revisions":[376,376]}],"revisions":[2040,376]},"log_all":{"type":"string","options'
+    '":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1920,1664]},"action":{"type":"string","options'
+    '":[{"value":"pass","revisions":[2040,2040]},{"value":"tag","revisions":[2040,2040]},{"value":"discard","revisions":[2040,2040]}],"revisions":[2040,204'
+    '0]},"tag_msg":{"type":"string","revisions":[2040,2040]},"tag_type":{"multiple_values":true,"type":"list","options":[{"value":"subject","revisions":[20'
+    '40,2040]},{"value":"header","revisions":[2040,2040]},{"value":"spaminfo","revisions":[2040,2040]}],"revisions":[2040,2040]}},"revisions":[2040,2040]},'
+    '"other_webmails":{"type":"dict","children":{"log_all":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revis'
+    'ions":[1664,1664]}],"revisions":[1664,1664]}},"revisions":[1920,1664]},"replacemsg_group":{"type":"string","revisions":[2040,2040]},"gmail":{"type":"d'
+    'ict","children":{"log_all":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisi'
+    'ons":[1920,1664]},"log":{"type":"string","options":[{"value":"enable","revisions":[376,376]},{"value":"disable","revisions":[376,376]}],"revisions":[2'
+    '040,376]}},"revisions":[2040,2040]},"spam_mheader_table":{"type":"integer","revisions":[2040,2040]},"spam_rbl_table":{"type":"integer","revisions":[20'
+    '40,2040]},"mapi":{"type":"dict","children":{"action":{"type":"string","options":[{"value":"pass","revisions":[2040,2040]},{"value":"discard","revision'
+    's":[2040,2040]}],"revisions":[2040,2040]},"log_all":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisio'
+    'ns":[1664,1664]}],"revisions":[1920,1664]},"log":{"type":"string","options":[{"value":"enable","revisions":[376,376]},{"value":"disable","revisions":['
+    '376,376]}],"revisions":[2040,376]}},"revisions":[2040,2040]},"spam_bword_table":{"type":"integer","revisions":[2040,2040]},"yahoo_mail":{"type":"dict"'
+    ',"children":{"log_all":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions"'
+    ':[1920,1664]},"log":{"type":"string","options":[{"value":"enable","revisions":[376,376]},{"value":"disable","revisions":[376,376]}],"revisions":[2040,'
+    '376]}},"revisions":[2040,2040]},"msn_hotmail":{"type":"dict","children":{"log_all":{"type":"string","options":[{"value":"disable","revisions":[1664,16'
+    '64]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1920,1664]},"log":{"type":"string","options":[{"value":"enable","revisions":[376,376]},{'
+    '"value":"disable","revisions":[376,376]}],"revisions":[2040,376]}},"revisions":[2040,2040]},"pop3":{"type":"dict","children":{"action":{"type":"string'
+    '","options":[{"value":"pass","revisions":[2040,2040]},{"value":"tag","revisions":[2040,2040]}],"revisions":[2040,2040]},"log_all":{"type":"string","op'
+    'tions":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1920,1664]},"log":{"type":"string","optio'
+    'ns":[{"value":"enable","revisions":[376,376]},{"value":"disable","revisions":[376,376]}],"revisions":[2040,376]},"tag_msg":{"type":"string","revisions'
+    '":[2040,2040]},"tag_type":{"multiple_values":true,"type":"list","options":[{"value":"subject","revisions":[2040,2040]},{"value":"header","revisions":['
+    '2040,2040]},{"value":"spaminfo","revisions":[2040,2040]}],"revisions":[2040,2040]}},"revisions":[2040,2040]},"external":{"type":"string","options":[{"'
+    'value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"imap":{"type":"dict","children":{"acti'
+    'on":{"type":"string","options":[{"value":"pass","revisions":[2040,2040]},{"value":"tag","revisions":[2040,2040]}],"revisions":[2040,2040]},"log_all":{'
+    '"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1920,1664]},"log":{"ty'
+    'pe":"string","options":[{"value":"enable","revisions":[376,376]},{"value":"disable","revisions":[376,376]}],"revisions":[2040,376]},"tag_msg":{"type":'
+    '"string","revisions":[2040,2040]},"tag_type":{"multiple_values":true,"type":"list","options":[{"value":"subject","revisions":[2040,2040]},{"value":"he'
+    'ader","revisions":[2040,2040]},{"value":"spaminfo","revisions":[2040,2040]}],"revisions":[2040,2040]}},"revisions":[2040,2040]},"spam_log":{"type":"st'
+    'ring","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"name":{"type":"stri'
+    'ng","revisions":[2040,2040]},"spam_filtering":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2'
+    '040,2040]}],"revisions":[2040,2040]},"file_filter":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[120,'
+    '120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"scan_archive_contents":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"log":{"type":"string","options":[{"value":"enable","revisions":[120,'
+    '120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"entries":{"type":"list","children":{"comment":{"type":"string","revisions":[1'
+    '20,120]},"protocol":{"multiple_values":true,"type":"list","options":[{"value":"smtp","revisions":[120,120]},{"value":"imap","revisions":[120,120]},{"v'
+    'alue":"pop3","revisions":[120,120]}],"revisions":[120,120]},"file_type":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"re'
+    'visions":[120,120]},"password_protected":{"type":"string","options":[{"value":"yes","revisions":[120,120]},{"value":"any","revisions":[120,120]}],"rev'
+    'isions":[120,120]},"filter":{"type":"string","revisions":[120,120]},"action":{"type":"string","options":[{"value":"log","revisions":[120,120]},{"value'
+    '":"block","revisions":[120,120]}],"revisions":[120,120]}},"revisions":[120,120]}},"revisions":[2040,120]},"spam_bal_table":{"type":"integer","revision'
+    's":[1024,1024]},"options":{"multiple_values":true,"type":"list","options":[{"value":"bannedword","revisions":[2040,2040]},{"value":"spambwl","revision'
+    's":[2040,1016]},{"value":"spamfsip","revisions":[2040,2040]},{"value":"spamfssubmit","revisions":[2040,2040]},{"value":"spamfschksum","revisions":[204'
+    '0,2040]},{"value":"spamfsurl","revisions":[2040,2040]},{"value":"spamhelodns","revisions":[2040,2040]},{"value":"spamraddrdns","revisions":[2040,2040]'
+    '},{"value":"spamrbl","revisions":[2040,2040]},{"value":"spamhdrcheck","revisions":[2040,2040]},{"value":"spamfsphish","revisions":[2040,2040]},{"value'
+    '":"spambal","revisions":[1024,1024]}],"revisions":[2040,2040]},"spam_bwl_table":{"type":"integer","revisions":[2040,1016]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"feature_set":{"type":"str","required":false,"choices":["flow","p'
+    'roxy"]},"spam_bword_threshold":{"type":"int","required":false},"spam_iptrust_table":{"type":"int","required":false},"spam_log_fortiguard_response":{"t'
+    'ype":"str","required":false,"choices":["disable","enable"]},"smtp":{"type":"dict","required":false,"options":{"local_override":{"type":"str","required'
+    '":false,"choices":["disable","enable"]},"hdrip":{"type":"str","required":false,"choices":["disable","enable"]},"log":{"type":"str","required":false},"'
+    'log_all":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["pass","tag","discard"]},"tag_msg":{"type":"str","required'
+    '":false},"tag_type":{"type":"list","required":false,"choices":["subject","header","spaminfo"]}}},"other_webmails":{"type":"dict","required":false,"opt'
+    'ions":{"log_all":{"type":"str","required":false,"choices":["disable","enable"]}}},"replacemsg_group":{"type":"str","required":false},"gmail":{"type":"'
+    'dict","required":false,"options":{"log_all":{"type":"str","required":false},"log":{"type":"str","required":false}}},"spam_mheader_table":{"type":"int"'
+    ',"required":false},"spam_rbl_table":{"type":"int","required":false},"mapi":{"type":"dict","required":false,"options":{"action":{"type":"str","required'
+    '":false,"choices":["pass","discard"]},"log_all":{"type":"str","required":false},"log":{"type":"str","required":false}}},"spam_bword_table":{"type":"in'
+    't","required":false},"yahoo_mail":{"type":"dict","required":false,"options":{"log_all":{"type":"str","required":false},"log":{"type":"str","required":'
+    'false}}},"msn_hotmail":{"type":"dict","required":false,"options":{"log_all":{"type":"str","required":false},"log":{"type":"str","required":false}}},"p'
+    'op3":{"type":"dict","required":false,"options":{"action":{"type":"str","required":false,"choices":["pass","tag"]},"log_all":{"type":"str","required":f'
+    'alse},"log":{"type":"str","required":false},"tag_msg":{"type":"str","required":false},"tag_type":{"type":"list","required":false,"choices":["subject",'
+    '"header","spaminfo"]}}},"external":{"type":"str","required":false,"choices":["enable","disable"]},"imap":{"type":"dict","required":false,"options":{"a'
+    'ction":{"type":"str","required":false,"choices":["pass","tag"]},"log_all":{"type":"str","required":false},"log":{"type":"str","required":false},"tag_m'
+    'sg":{"type":"str","required":false},"tag_type":{"type":"list","required":false,"choices":["subject","header","spaminfo"]}}},"spam_log":{"type":"str","'
+    'required":false,"choices":["disable","enable"]},"name":{"type":"str","required":false},"spam_filtering":{"type":"str","required":false,"choices":["ena'
+    'ble","disable"]},"file_filter":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"sca'
+    'n_archive_contents":{"type":"str","required":false,"choices":["enable","disable"]},"log":{"type":"str","required":false,"choices":["enable","disable"]'
+    '},"entries":{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"protocol":{"type":"list","required":false,"choices":'
+    '["smtp","imap","pop3"]},"file_type":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"password_protected":{"type":"'
+    'str","required":false,"choices":["yes","any"]},"filter":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["log","bloc'
+    'k"]}}}}},"spam_bal_table":{"type":"int","required":false},"options":{"type":"list","required":false},"spam_bwl_table":{"type":"int","required":false}}'
+    '}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"info":{"type":"string","revisions":[23,23]},"ad_groups":{"type":"string","revisions":[23,23]},"id":{"type":"integer","revi'
+    'sions":[23,23]},"src_ip":{"type":"string","revisions":[23,23]},"ftcl_uid":{"type":"string","revisions":[23,23]},"src_mac":{"type":"string","revisions"'
+    ':[23,23]}},"revisions":[23,23]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"info":{"type":"str","required":false},"ad_groups":{"type":"str","required":false},"id":{"type":"int","requ'
+    'ired":false},"src_ip":{"type":"str","required":false},"ftcl_uid":{"type":"str","required":false},"src_mac":{"type":"str","required":false}}}'
+)
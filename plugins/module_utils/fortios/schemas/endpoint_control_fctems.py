@@ -0,0 +1,33 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"pull_vulnerabilities":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions'
+    '":[1920,1920]}],"revisions":[1920,1920]},"https_port":{"type":"integer","revisions":[2040,2040]},"certificate":{"type":"string","revisions":[1920,896]'
+    '},"pull_sysinfo":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920'
+    ',1920]},"status_check_interval":{"type":"integer","revisions":[1536,512]},"call_timeout":{"type":"integer","revisions":[2040,2040]},"source_ip":{"type'
+    '":"string","revisions":[2040,2040]},"admin_password":{"type":"string","revisions":[2040,120]},"capabilities":{"multiple_values":true,"type":"list","op'
+    'tions":[{"value":"fabric-auth","revisions":[1024,1024]},{"value":"silent-approval","revisions":[1024,1024]},{"value":"websocket","revisions":[1024,102'
+    '4]}],"revisions":[1024,1024]},"server":{"type":"string","revisions":[2040,2040]},"pull_malware_hash":{"type":"string","options":[{"value":"enable","re'
+    'visions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"cloud_server_type":{"type":"string","options":[{"value":"'
+    'production","revisions":[1920,1920]},{"value":"alpha","revisions":[1920,1920]},{"value":"beta","revisions":[1920,1920]}],"revisions":[1920,1920]},"adm'
+    'in_username":{"type":"string","revisions":[2040,120]},"pull_avatars":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"'
+    'disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"serial_number":{"type":"string","revisions":[2040,120]},"websocket_override":{"type":"str'
+    'ing","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"fortinetone_cloud_au'
+    'thentication":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,20'
+    '40]},"pull_tags":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920'
+    ',1920]},"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"pull_vulnerabilities":{"type":"str","required":false,"choices":["enable","disable"]},"https_port":{"type":'
+    '"int","required":false},"certificate":{"type":"str","required":false},"pull_sysinfo":{"type":"str","required":false,"choices":["enable","disable"]},"s'
+    'tatus_check_interval":{"type":"int","required":false},"call_timeout":{"type":"int","required":false},"source_ip":{"type":"str","required":false},"admi'
+    'n_password":{"type":"str","required":false},"capabilities":{"type":"list","required":false,"choices":["fabric-auth","silent-approval","websocket"]},"s'
+    'erver":{"type":"str","required":false},"pull_malware_hash":{"type":"str","required":false,"choices":["enable","disable"]},"cloud_server_type":{"type":'
+    '"str","required":false,"choices":["production","alpha","beta"]},"admin_username":{"type":"str","required":false},"pull_avatars":{"type":"str","require'
+    'd":false,"choices":["enable","disable"]},"serial_number":{"type":"str","required":false},"websocket_override":{"type":"str","required":false,"choices"'
+    ':["enable","disable"]},"fortinetone_cloud_authentication":{"type":"str","required":false,"choices":["enable","disable"]},"pull_tags":{"type":"str","re'
+    'quired":false,"choices":["enable","disable"]},"name":{"type":"str","required":false}}}'
+)
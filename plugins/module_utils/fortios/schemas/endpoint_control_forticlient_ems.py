@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[7,7]},"listen_port":{"type":"integer","revisions":[7,7]},"admin_type":{"type":"string"'
+    ',"options":[{"value":"Windows","revisions":[7,7]},{"value":"LDAP","revisions":[7,7]}],"revisions":[7,7]},"rest_api_auth":{"type":"string","options":[{'
+    '"value":"disable","revisions":[7,7]},{"value":"userpass","revisions":[7,7]}],"revisions":[7,7]},"admin_username":{"type":"string","revisions":[7,7]},"'
+    'admin_password":{"type":"string","revisions":[7,7]},"address":{"type":"string","revisions":[7,7]},"serial_number":{"type":"string","revisions":[7,7]},'
+    '"upload_port":{"type":"integer","revisions":[7,7]},"https_port":{"type":"integer","revisions":[7,7]}},"revisions":[7,7]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"listen_port":{"type":"int","required":false},"admin_type":{"type":"'
+    'str","required":false,"choices":["Windows","LDAP"]},"rest_api_auth":{"type":"str","required":false,"choices":["disable","userpass"]},"admin_username":'
+    '{"type":"str","required":false},"admin_password":{"type":"str","required":false},"address":{"type":"str","required":false},"serial_number":{"type":"st'
+    'r","required":false},"upload_port":{"type":"int","required":false},"https_port":{"type":"int","required":false}}}'
+)
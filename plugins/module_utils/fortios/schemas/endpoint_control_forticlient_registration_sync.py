@@ -0,0 +1,11 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"peer_ip":{"type":"string","revisions":[7,7]},"peer_name":{"type":"string","revisions":[7,7]}},"revisions":[7,7]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"peer_ip":{"type":"str","required":false},"peer_name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,124 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"forticlient_ios_settings":{"type":"dict","children":{"forticlient_wf":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"client_vpn_settings":{"type":"list","children":{"vpn_configuration_content":{"'
+    'type":"string","revisions":[7,7]},"vpn_configuration_name":{"type":"string","revisions":[7,7]},"sslvpn_access_port":{"type":"integer","revisions":[7,7'
+    ']},"sslvpn_require_certificate":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7'
+    ',7]},"preshared_key":{"type":"string","revisions":[7,7]},"remote_gw":{"type":"string","revisions":[7,7]},"type":{"type":"string","options":[{"value":"'
+    'ipsec","revisions":[7,7]},{"value":"ssl","revisions":[7,7]}],"revisions":[7,7]},"auth_method":{"type":"string","options":[{"value":"psk","revisions":['
+    '7,7]},{"value":"certificate","revisions":[7,7]}],"revisions":[7,7]},"name":{"type":"string","revisions":[7,7]}},"revisions":[7,7]},"configuration_name'
+    '":{"type":"string","revisions":[7,7]},"client_vpn_provisioning":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","r'
+    'evisions":[7,7]}],"revisions":[7,7]},"distribute_configuration_profile":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"dis'
+    'able","revisions":[7,7]}],"revisions":[7,7]},"disable_wf_when_protected":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"di'
+    'sable","revisions":[7,7]}],"revisions":[7,7]},"forticlient_wf_profile":{"type":"string","revisions":[7,7]},"configuration_content":{"type":"string","r'
+    'evisions":[7,7]}},"revisions":[7,7]},"forticlient_android_settings":{"type":"dict","children":{"forticlient_wf":{"type":"string","options":[{"value":"'
+    'enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"forticlient_vpn_provisioning":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"forticlient_advanced_vpn_buffer":{"type":"string","revisions'
+    '":[7,7]},"disable_wf_when_protected":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revision'
+    's":[7,7]},"forticlient_advanced_vpn":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revision'
+    's":[7,7]},"forticlient_vpn_settings":{"type":"list","children":{"name":{"type":"string","revisions":[7,7]},"sslvpn_access_port":{"type":"integer","rev'
+    'isions":[7,7]},"sslvpn_require_certificate":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"r'
+    'evisions":[7,7]},"preshared_key":{"type":"string","revisions":[7,7]},"remote_gw":{"type":"string","revisions":[7,7]},"type":{"type":"string","options"'
+    ':[{"value":"ipsec","revisions":[7,7]},{"value":"ssl","revisions":[7,7]}],"revisions":[7,7]},"auth_method":{"type":"string","options":[{"value":"psk","'
+    'revisions":[7,7]},{"value":"certificate","revisions":[7,7]}],"revisions":[7,7]}},"revisions":[7,7]},"forticlient_wf_profile":{"type":"string","revisio'
+    'ns":[7,7]}},"revisions":[7,7]},"on_net_addr":{"type":"list","children":{"name":{"type":"string","revisions":[7,7]}},"revisions":[7,7]},"description":{'
+    '"type":"string","revisions":[7,7]},"user_groups":{"type":"list","children":{"name":{"type":"string","revisions":[7,7]}},"revisions":[7,7]},"profile_na'
+    'me":{"type":"string","revisions":[7,7]},"forticlient_winmac_settings":{"type":"dict","children":{"forticlient_wf":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"forticlient_vuln_scan_compliance_action":{"type":"string","opt'
+    'ions":[{"value":"block","revisions":[7,7]},{"value":"warning","revisions":[7,7]}],"revisions":[7,7]},"forticlient_vuln_scan":{"type":"string","options'
+    '":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"forticlient_application_firewall":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"forticlient_own_file":{"type":"list","child'
+    'ren":{"id":{"type":"integer","revisions":[7,7]},"file":{"type":"string","revisions":[7,7]}},"revisions":[7,7]},"forticlient_security_posture_complianc'
+    'e_action":{"type":"string","options":[{"value":"block","revisions":[7,7]},{"value":"warning","revisions":[7,7]}],"revisions":[7,7]},"sandbox_address":'
+    '{"type":"string","revisions":[7,7]},"forticlient_log_upload":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revi'
+    'sions":[7,7]}],"revisions":[7,7]},"forticlient_log_upload_level":{"type":"string","options":[{"value":"traffic","revisions":[7,7]},{"value":"vulnerabi'
+    'lity","revisions":[7,7]},{"value":"event","revisions":[7,7]}],"revisions":[7,7]},"forticlient_vuln_scan_exempt":{"type":"string","options":[{"value":"'
+    'enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"forticlient_vuln_scan_enforce":{"type":"string","options":[{"val'
+    'ue":"critical","revisions":[7,7]},{"value":"high","revisions":[7,7]},{"value":"medium","revisions":[7,7]},{"value":"low","revisions":[7,7]},{"value":"'
+    'info","revisions":[7,7]}],"revisions":[7,7]},"av_realtime_protection":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disab'
+    'le","revisions":[7,7]}],"revisions":[7,7]},"forticlient_minimum_software_version":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"v'
+    'alue":"disable","revisions":[7,7]}],"revisions":[7,7]},"forticlient_mac_ver":{"type":"string","revisions":[7,7]},"forticlient_application_firewall_lis'
+    't":{"type":"string","revisions":[7,7]},"sandbox_analysis":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisio'
+    'ns":[7,7]}],"revisions":[7,7]},"forticlient_vuln_scan_enforce_grace":{"type":"integer","revisions":[7,7]},"forticlient_security_posture":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"forticlient_registration_compliance_act'
+    'ion":{"type":"string","options":[{"value":"block","revisions":[7,7]},{"value":"warning","revisions":[7,7]}],"revisions":[7,7]},"forticlient_system_com'
+    'pliance_action":{"type":"string","options":[{"value":"block","revisions":[7,7]},{"value":"warning","revisions":[7,7]}],"revisions":[7,7]},"forticlient'
+    '_system_compliance":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"fortic'
+    'lient_running_app":{"type":"list","children":{"process_name3":{"type":"string","revisions":[7,7]},"app_name":{"type":"string","revisions":[7,7]},"app_'
+    'sha256_signature3":{"type":"string","revisions":[7,7]},"app_sha256_signature2":{"type":"string","revisions":[7,7]},"process_name2":{"type":"string","r'
+    'evisions":[7,7]},"process_name":{"type":"string","revisions":[7,7]},"process_name4":{"type":"string","revisions":[7,7]},"app_sha256_signature":{"type"'
+    ':"string","revisions":[7,7]},"app_sha256_signature4":{"type":"string","revisions":[7,7]},"application_check_rule":{"type":"string","options":[{"value"'
+    ':"present","revisions":[7,7]},{"value":"absent","revisions":[7,7]}],"revisions":[7,7]},"id":{"type":"integer","revisions":[7,7]}},"revisions":[7,7]},"'
+    'forticlient_operating_system":{"type":"list","children":{"os_type":{"type":"string","options":[{"value":"custom","revisions":[7,7]},{"value":"mac-os",'
+    '"revisions":[7,7]},{"value":"win-7","revisions":[7,7]},{"value":"win-80","revisions":[7,7]},{"value":"win-81","revisions":[7,7]},{"value":"win-10","re'
+    'visions":[7,7]},{"value":"win-2000","revisions":[7,7]},{"value":"win-home-svr","revisions":[7,7]},{"value":"win-svr-10","revisions":[7,7]},{"value":"w'
+    'in-svr-2003","revisions":[7,7]},{"value":"win-svr-2003-r2","revisions":[7,7]},{"value":"win-svr-2008","revisions":[7,7]},{"value":"win-svr-2008-r2","r'
+    'evisions":[7,7]},{"value":"win-svr-2012","revisions":[7,7]},{"value":"win-svr-2012-r2","revisions":[7,7]},{"value":"win-sto-svr-2003","revisions":[7,7'
+    ']},{"value":"win-vista","revisions":[7,7]},{"value":"win-xp","revisions":[7,7]},{"value":"ubuntu-linux","revisions":[7,7]},{"value":"centos-linux","re'
+    'visions":[7,7]},{"value":"redhat-linux","revisions":[7,7]},{"value":"fedora-linux","revisions":[7,7]}],"revisions":[7,7]},"os_name":{"type":"string","'
+    'revisions":[7,7]},"id":{"type":"integer","revisions":[7,7]}},"revisions":[7,7]},"forticlient_log_upload_server":{"type":"string","revisions":[7,7]},"a'
+    'v_signature_up_to_date":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"fo'
+    'rticlient_registry_entry":{"type":"list","children":{"registry_entry":{"type":"string","revisions":[7,7]},"id":{"type":"integer","revisions":[7,7]}},"'
+    'revisions":[7,7]},"forticlient_wf_profile":{"type":"string","revisions":[7,7]},"forticlient_ems_entries":{"type":"list","children":{"name":{"type":"st'
+    'ring","revisions":[7,7]}},"revisions":[7,7]},"forticlient_ems_compliance":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"d'
+    'isable","revisions":[7,7]}],"revisions":[7,7]},"forticlient_linux_ver":{"type":"string","revisions":[7,7]},"os_av_software_installed":{"type":"string"'
+    ',"options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"forticlient_av":{"type":"string","options"'
+    ':[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"forticlient_win_ver":{"type":"string","revisions":[7'
+    ',7]},"forticlient_ems_compliance_action":{"type":"string","options":[{"value":"block","revisions":[7,7]},{"value":"warning","revisions":[7,7]}],"revis'
+    'ions":[7,7]}},"revisions":[7,7]},"device_groups":{"type":"list","children":{"name":{"type":"string","revisions":[7,7]}},"revisions":[7,7]},"src_addr":'
+    '{"type":"list","children":{"name":{"type":"string","revisions":[7,7]}},"revisions":[7,7]},"replacemsg_override_group":{"type":"string","revisions":[7,'
+    '7]},"users":{"type":"list","children":{"name":{"type":"string","revisions":[7,7]}},"revisions":[7,7]}},"revisions":[7,7]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"forticlient_ios_settings":{"type":"dict","required":false,"options":{"forticlient_wf":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]},"client_vpn_settings":{"type":"list","required":false,"options":{"vpn_configuration_content":{"type":"str",'
+    '"required":false},"vpn_configuration_name":{"type":"str","required":false},"sslvpn_access_port":{"type":"int","required":false},"sslvpn_require_certif'
+    'icate":{"type":"str","required":false,"choices":["enable","disable"]},"preshared_key":{"type":"str","required":false},"remote_gw":{"type":"str","requi'
+    'red":false},"type":{"type":"str","required":false,"choices":["ipsec","ssl"]},"auth_method":{"type":"str","required":false,"choices":["psk","certificat'
+    'e"]},"name":{"type":"str","required":false}}},"configuration_name":{"type":"str","required":false},"client_vpn_provisioning":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"distribute_configuration_profile":{"type":"str","required":false,"choices":["enable","disable"]},"disable_wf_wh'
+    'en_protected":{"type":"str","required":false,"choices":["enable","disable"]},"forticlient_wf_profile":{"type":"str","required":false},"configuration_c'
+    'ontent":{"type":"str","required":false}}},"forticlient_android_settings":{"type":"dict","required":false,"options":{"forticlient_wf":{"type":"str","re'
+    'quired":false,"choices":["enable","disable"]},"forticlient_vpn_provisioning":{"type":"str","required":false,"choices":["enable","disable"]},"forticlie'
+    'nt_advanced_vpn_buffer":{"type":"str","required":false},"disable_wf_when_protected":{"type":"str","required":false,"choices":["enable","disable"]},"fo'
+    'rticlient_advanced_vpn":{"type":"str","required":false,"choices":["enable","disable"]},"forticlient_vpn_settings":{"type":"list","required":false,"opt'
+    'ions":{"name":{"type":"str","required":false},"sslvpn_access_port":{"type":"int","required":false},"sslvpn_require_certificate":{"type":"str","require'
+    'd":false,"choices":["enable","disable"]},"preshared_key":{"type":"str","required":false},"remote_gw":{"type":"str","required":false},"type":{"type":"s'
+    'tr","required":false,"choices":["ipsec","ssl"]},"auth_method":{"type":"str","required":false,"choices":["psk","certificate"]}}},"forticlient_wf_profil'
+    'e":{"type":"str","required":false}}},"on_net_addr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"description":{'
+    '"type":"str","required":false},"user_groups":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"profile_name":{"type'
+    '":"str","required":false},"forticlient_winmac_settings":{"type":"dict","required":false,"options":{"forticlient_wf":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"forticlient_vuln_scan_compliance_action":{"type":"str","required":false,"choices":["block","warning"]},"forticlient_vuln'
+    '_scan":{"type":"str","required":false,"choices":["enable","disable"]},"forticlient_application_firewall":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"forticlient_own_file":{"type":"list","required":false,"options":{"id":{"type":"int","required":false},"file":{"type":"str","require'
+    'd":false}}},"forticlient_security_posture_compliance_action":{"type":"str","required":false,"choices":["block","warning"]},"sandbox_address":{"type":"'
+    'str","required":false},"forticlient_log_upload":{"type":"str","required":false,"choices":["enable","disable"]},"forticlient_log_upload_level":{"type":'
+    '"str","required":false,"choices":["traffic","vulnerability","event"]},"forticlient_vuln_scan_exempt":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"forticlient_vuln_scan_enforce":{"type":"str","required":false,"choices":["critical","high","medium","low","info"]},"av_realtime_protect'
+    'ion":{"type":"str","required":false,"choices":["enable","disable"]},"forticlient_minimum_software_version":{"type":"str","required":false,"choices":["'
+    'enable","disable"]},"forticlient_mac_ver":{"type":"str","required":false},"forticlient_application_firewall_list":{"type":"str","required":false},"san'
+    'dbox_analysis":{"type":"str","required":false,"choices":["enable","disable"]},"forticlient_vuln_scan_enforce_grace":{"type":"int","required":false},"f'
+    'orticlient_security_posture":{"type":"str","required":false,"choices":["enable","disable"]},"forticlient_registration_compliance_action":{"type":"str"'
+    ',"required":false,"choices":["block","warning"]},"forticlient_system_compliance_action":{"type":"str","required":false,"choices":["block","warning"]},'
+    '"forticlient_system_compliance":{"type":"str","required":false,"choices":["enable","disable"]},"forticlient_running_app":{"type":"list","required":fal'
+    'se,"options":{"process_name3":{"type":"str","required":false},"app_name":{"type":"str","required":false},"app_sha256_signature3":{"type":"str","requir'
+    'ed":false},"app_sha256_signature2":{"type":"str","required":false},"process_name2":{"type":"str","required":false},"process_name":{"type":"str","requi'
+    'red":false},"process_name4":{"type":"str","required":false},"app_sha256_signature":{"type":"str","required":false},"app_sha256_signature4":{"type":"st'
+    'r","required":false},"application_check_rule":{"type":"str","required":false,"choices":["present","absent"]},"id":{"type":"int","required":false}}},"f'
+    'orticlient_operating_system":{"type":"list","required":false,"options":{"os_type":{"type":"str","required":false,"choices":["custom","mac-os","win-7",'
+    '"win-80","win-81","win-10","win-2000","win-home-svr","win-svr-10","win-svr-2003","win-svr-2003-r2","win-svr-2008","win-svr-2008-r2","win-svr-2012","wi'
+    'n-svr-2012-r2","win-sto-svr-2003","win-vista","win-xp","ubuntu-linux","centos-linux","redhat-linux","fedora-linux"]},"os_name":{"type":"str","required'
+    '":false},"id":{"type":"int","required":false}}},"forticlient_log_upload_server":{"type":"str","required":false},"av_signature_up_to_date":{"type":"str'
+    '","required":false,"choices":["enable","disable"]},"forticlient_registry_entry":{"type":"list","required":false,"options":{"registry_entry":{"type":"s'
+    'tr","required":false},"id":{"type":"int","required":false}}},"forticlient_wf_profile":{"type":"str","required":false},"forticlient_ems_entries":{"type'
+    '":"list","required":false,"options":{"name":{"type":"str","required":false}}},"forticlient_ems_compliance":{"type":"str","required":false,"choices":["'
+    'enable","disable"]},"forticlient_linux_ver":{"type":"str","required":false},"os_av_software_installed":{"type":"str","required":false,"choices":["enab'
+    'le","disable"]},"forticlient_av":{"type":"str","required":false,"choices":["enable","disable"]},"forticlient_win_ver":{"type":"str","required":false},'
+    '"forticlient_ems_compliance_action":{"type":"str","required":false,"choices":["block","warning"]}}},"device_groups":{"type":"list","required":false,"o'
+    'ptions":{"name":{"type":"str","required":false}}},"src_addr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"repl'
+    'acemsg_override_group":{"type":"str","required":false},"users":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"integer","revisions":[7,7]},"uid":{"type":"string","revisions":[7,7]},"reg_fortigate":{"type":"string","r'
+    'evisions":[7,7]},"ip":{"type":"string","revisions":[7,7]},"flag":{"type":"integer","revisions":[7,7]},"mac":{"type":"string","revisions":[7,7]},"vdom"'
+    ':{"type":"string","revisions":[7,7]}},"revisions":[7,7]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"int","required":false},"uid":{"type":"str","required":false},"reg_fortigate":{"type":"str'
+    '","required":false},"ip":{"type":"str","required":false},"flag":{"type":"int","required":false},"mac":{"type":"str","required":false},"vdom":{"type":"'
+    'str","required":false}}}'
+)
@@ -0,0 +1,28 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"forticlient_user_avatar":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revision'
+    's":[127,127]}],"revisions":[127,127]},"download_custom_link":{"type":"string","revisions":[127,7]},"forticlient_disconnect_unsupported_client":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"forticlient_reg_key_e'
+    'nforce":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[127,7]},"forticlient_ems_'
+    'rest_api_call_timeout":{"type":"integer","revisions":[127,7]},"forticlient_warning_interval":{"type":"integer","revisions":[127,7]},"forticlient_reg_t'
+    'imeout":{"type":"integer","revisions":[127,7]},"download_location":{"type":"string","options":[{"value":"fortiguard","revisions":[7,7]},{"value":"cust'
+    'om","revisions":[7,7]}],"revisions":[127,7]},"forticlient_offline_grace":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"di'
+    'sable","revisions":[7,7]}],"revisions":[127,7]},"forticlient_sys_update_interval":{"type":"integer","revisions":[127,127]},"forticlient_dereg_unsuppor'
+    'ted_client":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[127,7]},"forticlient_'
+    'keepalive_interval":{"type":"integer","revisions":[127,127]},"forticlient_avdb_update_interval":{"type":"integer","revisions":[127,7]},"forticlient_re'
+    'g_key":{"type":"string","revisions":[127,7]},"forticlient_offline_grace_interval":{"type":"integer","revisions":[127,7]}},"revisions":[127,127]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"forticlient_user_avatar":{"type":"str","required":false,"choices":["enable","disable"]},"download_custom_l'
+    'ink":{"type":"str","required":false},"forticlient_disconnect_unsupported_client":{"type":"str","required":false,"choices":["enable","disable"]},"forti'
+    'client_reg_key_enforce":{"type":"str","required":false},"forticlient_ems_rest_api_call_timeout":{"type":"int","required":false},"forticlient_warning_i'
+    'nterval":{"type":"int","required":false},"forticlient_reg_timeout":{"type":"int","required":false},"download_location":{"type":"str","required":false}'
+    ',"forticlient_offline_grace":{"type":"str","required":false},"forticlient_sys_update_interval":{"type":"int","required":false},"forticlient_dereg_unsu'
+    'pported_client":{"type":"str","required":false},"forticlient_keepalive_interval":{"type":"int","required":false},"forticlient_avdb_update_interval":{"'
+    'type":"int","required":false},"forticlient_reg_key":{"type":"str","required":false},"forticlient_offline_grace_interval":{"type":"int","required":fals'
+    'e}}}'
+)
@@ -0,0 +1,32 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"slot":{"type":"string","options":[{"value":"sim1","revisions":[1664,1664]},{"value":"sim2","revisions":[1664,1664]}],"revi'
+    'sions":[1664,1664]},"username":{"type":"string","revisions":[1664,1664]},"capacity":{"type":"integer","revisions":[1664,1664]},"name":{"type":"string"'
+    ',"revisions":[1664,1664]},"monthly_fee":{"type":"integer","revisions":[1664,1664]},"type":{"type":"string","options":[{"value":"carrier","revisions":['
+    '1664,1664]},{"value":"slot","revisions":[1664,1664]},{"value":"iccid","revisions":[1664,1664]},{"value":"generic","revisions":[1664,1664]}],"revisions'
+    '":[1664,1664]},"pdn":{"type":"string","options":[{"value":"ipv4-only","revisions":[1536,1536]},{"value":"ipv6-only","revisions":[1536,1536]},{"value":'
+    '"ipv4-ipv6","revisions":[1536,1536]}],"revisions":[1536,1536]},"signal_threshold":{"type":"integer","revisions":[1664,1664]},"auth_type":{"type":"stri'
+    'ng","options":[{"value":"none","revisions":[1664,1664]},{"value":"pap","revisions":[1664,1664]},{"value":"chap","revisions":[1664,1664]}],"revisions":'
+    '[1664,1664]},"overage":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions"'
+    ':[1664,1664]},"PDN":{"type":"string","options":[{"value":"ipv4-only","revisions":[128,128]},{"value":"ipv6-only","revisions":[128,128]},{"value":"ipv4'
+    '-ipv6","revisions":[128,128]}],"revisions":[1664,128]},"carrier":{"type":"string","revisions":[1664,1664]},"apn":{"type":"string","revisions":[1536,15'
+    '36]},"signal_period":{"type":"integer","revisions":[1664,1664]},"APN":{"type":"string","revisions":[1664,128]},"iccid":{"type":"string","revisions":[1'
+    '664,1664]},"private_network":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revi'
+    'sions":[1664,1664]},"password":{"type":"string","revisions":[1664,1664]},"billing_date":{"type":"integer","revisions":[1664,1664]},"preferred_subnet":'
+    '{"type":"integer","revisions":[1664,1664]},"modem_id":{"type":"string","options":[{"value":"modem1","revisions":[1664,1664]},{"value":"modem2","revisi'
+    'ons":[1664,1664]},{"value":"all","revisions":[1664,1664]}],"revisions":[1664,1664]}},"revisions":[1664,1664]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"slot":{"type":"str","required":false,"choices":["sim1","sim2"]},"username":{"type":"str","required":false}'
+    ',"capacity":{"type":"int","required":false},"name":{"type":"str","required":false},"monthly_fee":{"type":"int","required":false},"type":{"type":"str",'
+    '"required":false,"choices":["carrier","slot","iccid","generic"]},"pdn":{"type":"str","required":false,"choices":["ipv4-only","ipv6-only","ipv4-ipv6"]}'
+    ',"signal_threshold":{"type":"int","required":false},"auth_type":{"type":"str","required":false,"choices":["none","pap","chap"]},"overage":{"type":"str'
+    '","required":false,"choices":["disable","enable"]},"PDN":{"type":"str","required":false},"carrier":{"type":"str","required":false},"apn":{"type":"str"'
+    ',"required":false},"signal_period":{"type":"int","required":false},"APN":{"type":"str","required":false},"iccid":{"type":"str","required":false},"priv'
+    'ate_network":{"type":"str","required":false,"choices":["disable","enable"]},"password":{"type":"str","required":false},"billing_date":{"type":"int","r'
+    'equired":false},"preferred_subnet":{"type":"int","required":false},"modem_id":{"type":"str","required":false,"choices":["modem1","modem2","all"]}}}'
+)
@@ -0,0 +1,101 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"controller_report":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[1664,16'
+    '64]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1664,1664]},"interval":{"type":"integer","revisions":[1664,1664]},"signal_threshold":{"t'
+    'ype":"integer","revisions":[1664,1664]}},"revisions":[1920,1664]},"cdma_nai":{"type":"string","revisions":[2047,383]},"wimax_auth_protocol":{"type":"s'
+    'tring","options":[{"value":"tls","revisions":[383,383]},{"value":"ttls","revisions":[383,383]}],"revisions":[2047,383]},"secondary_ha":{"type":"string'
+    '","revisions":[2047,383]},"wimax_realm":{"type":"string","revisions":[2047,383]},"cdma_aaa_spi":{"type":"string","revisions":[2047,383]},"redial":{"ty'
+    'pe":"string","options":[{"value":"none","revisions":[383,383]},{"value":"1","revisions":[383,383]},{"value":"2","revisions":[383,383]},{"value":"3","r'
+    'evisions":[383,383]},{"value":"4","revisions":[383,383]},{"value":"5","revisions":[383,383]},{"value":"6","revisions":[383,383]},{"value":"7","revisio'
+    'ns":[383,383]},{"value":"8","revisions":[383,383]},{"value":"9","revisions":[383,383]},{"value":"10","revisions":[383,383]}],"revisions":[2047,383]},"'
+    'id":{"type":"string","revisions":[2047,2047]},"ppp_auth_protocol":{"type":"string","options":[{"value":"auto","revisions":[383,383]},{"value":"pap","r'
+    'evisions":[383,383]},{"value":"chap","revisions":[383,383]}],"revisions":[2047,383]},"initiated_update":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[383,383]},{"value":"disable","revisions":[383,383]}],"revisions":[2047,383]},"multi_mode":{"type":"string","options":[{"value":"auto","re'
+    'visions":[383,383]},{"value":"auto-3g","revisions":[383,383]},{"value":"force-lte","revisions":[383,383]},{"value":"force-3g","revisions":[383,383]},{'
+    '"value":"force-2g","revisions":[383,383]}],"revisions":[2047,383]},"ppp_echo_request":{"type":"string","options":[{"value":"enable","revisions":[383,3'
+    '83]},{"value":"disable","revisions":[383,383]}],"revisions":[2047,383]},"ext_name":{"type":"string","revisions":[2047,2047]},"role":{"type":"string","'
+    'options":[{"value":"none","revisions":[383,383]},{"value":"primary","revisions":[383,383]},{"value":"secondary","revisions":[383,383]}],"revisions":[2'
+    '047,383]},"authorized":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions"'
+    ':[1920,1664]},"ppp_username":{"type":"string","revisions":[2047,383]},"quota_limit_mb":{"type":"integer","revisions":[2047,383]},"ifname":{"type":"str'
+    'ing","revisions":[2047,383]},"dial_status":{"type":"integer","revisions":[2047,383]},"wimax_carrier":{"type":"string","revisions":[2047,383]},"descrip'
+    'tion":{"type":"string","revisions":[2047,2047]},"ha_shared_secret":{"type":"string","revisions":[2047,383]},"at_dial_script":{"type":"string","revisio'
+    'ns":[2047,383]},"ppp_password":{"type":"string","revisions":[2047,383]},"modem_type":{"type":"string","options":[{"value":"cdma","revisions":[383,383]'
+    '},{"value":"gsm/lte","revisions":[383,383]},{"value":"wimax","revisions":[383,383]}],"revisions":[2047,383]},"conn_status":{"type":"integer","revision'
+    's":[2047,383]},"modem1":{"type":"dict","children":{"sim1_pin":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable'
+    '","revisions":[1664,1664]}],"revisions":[1664,1664]},"auto_switch":{"type":"dict","children":{"dataplan":{"type":"string","options":[{"value":"disable'
+    '","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1664,1664]},"disconnect":{"type":"string","options":[{"value":"dis'
+    'able","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1664,1664]},"switch_back_time":{"type":"string","revisions":[1'
+    '664,1664]},"switch_back_timer":{"type":"integer","revisions":[1664,1664]},"switch_back":{"multiple_values":true,"type":"list","options":[{"value":"tim'
+    'e","revisions":[1664,1664]},{"value":"timer","revisions":[1664,1664]}],"revisions":[1664,1664]},"signal":{"type":"string","options":[{"value":"disable'
+    '","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1664,1664]},"disconnect_period":{"type":"integer","revisions":[166'
+    '4,1664]},"disconnect_threshold":{"type":"integer","revisions":[1664,1664]}},"revisions":[1664,1664]},"sim2_pin_code":{"type":"string","revisions":[166'
+    '4,1664]},"conn_status":{"type":"integer","revisions":[1664,1664]},"sim1_pin_code":{"type":"string","revisions":[1664,1664]},"default_sim":{"type":"str'
+    'ing","options":[{"value":"sim1","revisions":[1664,1664]},{"value":"sim2","revisions":[1664,1664]},{"value":"carrier","revisions":[1664,1664]},{"value"'
+    ':"cost","revisions":[1664,1664]}],"revisions":[1664,1664]},"redundant_intf":{"type":"string","revisions":[1664,1664]},"redundant_mode":{"type":"string'
+    '","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1664,1664]},"ifname":{"type":"string'
+    '","revisions":[1664,1664]},"preferred_carrier":{"type":"string","revisions":[1664,1664]},"sim2_pin":{"type":"string","options":[{"value":"disable","re'
+    'visions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1664,1664]},"gps":{"type":"string","options":[{"value":"disable","revis'
+    'ions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1664,1664]}},"revisions":[1920,1664]},"modem2":{"type":"dict","children":{'
+    '"sim1_pin":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1664,1664]'
+    '},"auto_switch":{"type":"dict","children":{"dataplan":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revis'
+    'ions":[1664,1664]}],"revisions":[1664,1664]},"disconnect":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","r'
+    'evisions":[1664,1664]}],"revisions":[1664,1664]},"switch_back_time":{"type":"string","revisions":[1664,1664]},"switch_back_timer":{"type":"integer","r'
+    'evisions":[1664,1664]},"switch_back":{"multiple_values":true,"type":"list","options":[{"value":"time","revisions":[1664,1664]},{"value":"timer","revis'
+    'ions":[1664,1664]}],"revisions":[1664,1664]},"signal":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revis'
+    'ions":[1664,1664]}],"revisions":[1664,1664]},"disconnect_period":{"type":"integer","revisions":[1664,1664]},"disconnect_threshold":{"type":"integer","'
+    'revisions":[1664,1664]}},"revisions":[1664,1664]},"sim2_pin_code":{"type":"string","revisions":[1664,1664]},"conn_status":{"type":"integer","revisions'
+    '":[1664,1664]},"sim1_pin_code":{"type":"string","revisions":[1664,1664]},"default_sim":{"type":"string","options":[{"value":"sim1","revisions":[1664,1'
+    '664]},{"value":"sim2","revisions":[1664,1664]},{"value":"carrier","revisions":[1664,1664]},{"value":"cost","revisions":[1664,1664]}],"revisions":[1664'
+    ',1664]},"redundant_intf":{"type":"string","revisions":[1664,1664]},"redundant_mode":{"type":"string","options":[{"value":"disable","revisions":[1664,1'
+    '664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1664,1664]},"ifname":{"type":"string","revisions":[1664,1664]},"preferred_carrier":{"ty'
+    'pe":"string","revisions":[1664,1664]},"sim2_pin":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions"'
+    ':[1664,1664]}],"revisions":[1664,1664]},"gps":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1'
+    '664,1664]}],"revisions":[1664,1664]}},"revisions":[1920,1664]},"login_password":{"type":"string","revisions":[1920,1664]},"roaming":{"type":"string","'
+    'options":[{"value":"enable","revisions":[383,383]},{"value":"disable","revisions":[383,383]}],"revisions":[2047,383]},"billing_start_day":{"type":"int'
+    'eger","revisions":[2047,383]},"access_point_name":{"type":"string","revisions":[2047,383]},"cdma_ha_spi":{"type":"string","revisions":[2047,383]},"nam'
+    'e":{"type":"string","revisions":[1920,1664]},"modem_passwd":{"type":"string","revisions":[2047,383]},"admin":{"type":"string","options":[{"value":"dis'
+    'able","revisions":[383,383]},{"value":"discovered","revisions":[383,383]},{"value":"enable","revisions":[383,383]}],"revisions":[2047,383]},"dial_mode'
+    '":{"type":"string","options":[{"value":"dial-on-demand","revisions":[383,383]},{"value":"always-connect","revisions":[383,383]}],"revisions":[2047,383'
+    ']},"primary_ha":{"type":"string","revisions":[2047,383]},"vdom":{"type":"integer","revisions":[2047,2047]},"mode":{"type":"string","options":[{"value"'
+    ':"standalone","revisions":[383,383]},{"value":"redundant","revisions":[383,383]}],"revisions":[2047,383]},"redundant_intf":{"type":"string","revisions'
+    '":[2047,383]},"aaa_shared_secret":{"type":"string","revisions":[2047,383]},"sim_pin":{"type":"string","revisions":[2047,383]}},"revisions":[2047,2047]'
+    '}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"controller_report":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"cho'
+    'ices":["disable","enable"]},"interval":{"type":"int","required":false},"signal_threshold":{"type":"int","required":false}}},"cdma_nai":{"type":"str","'
+    'required":false},"wimax_auth_protocol":{"type":"str","required":false},"secondary_ha":{"type":"str","required":false},"wimax_realm":{"type":"str","req'
+    'uired":false},"cdma_aaa_spi":{"type":"str","required":false},"redial":{"type":"str","required":false},"id":{"type":"str","required":false},"ppp_auth_p'
+    'rotocol":{"type":"str","required":false},"initiated_update":{"type":"str","required":false},"multi_mode":{"type":"str","required":false},"ppp_echo_req'
+    'uest":{"type":"str","required":false},"ext_name":{"type":"str","required":false},"role":{"type":"str","required":false},"authorized":{"type":"str","re'
+    'quired":false},"ppp_username":{"type":"str","required":false},"quota_limit_mb":{"type":"int","required":false},"ifname":{"type":"str","required":false'
+    '},"dial_status":{"type":"int","required":false},"wimax_carrier":{"type":"str","required":false},"description":{"type":"str","required":false},"ha_shar'
+    'ed_secret":{"type":"str","required":false},"at_dial_script":{"type":"str","required":false},"ppp_password":{"type":"str","required":false},"modem_type'
+    '":{"type":"str","required":false},"conn_status":{"type":"int","required":false},"modem1":{"type":"dict","required":false,"options":{"sim1_pin":{"type"'
+    ':"str","required":false,"choices":["disable","enable"]},"auto_switch":{"type":"dict","required":false,"options":{"dataplan":{"type":"str","required":f'
+    'alse,"choices":["disable","enable"]},"disconnect":{"type":"str","required":false,"choices":["disable","enable"]},"switch_back_time":{"type":"str","req'
+    'uired":false},"switch_back_timer":{"type":"int","required":false},"switch_back":{"type":"list","required":false,"choices":["time","timer"]},"signal":{'
+    '"type":"str","required":false,"choices":["disable","enable"]},"disconnect_period":{"type":"int","required":false},"disconnect_threshold":{"type":"int"'
+    ',"required":false}}},"sim2_pin_code":{"type":"str","required":false},"conn_status":{"type":"int","required":false},"sim1_pin_code":{"type":"str","requ'
+    'ired":false},"default_sim":{"type":"str","required":false,"choices":["sim1","sim2","carrier","cost"]},"redundant_intf":{"type":"str","required":false}'
+    ',"redundant_mode":{"type":"str","required":false,"choices":["disable","enable"]},"ifname":{"type":"str","required":false},"preferred_carrier":{"type":'
+    '"str","required":false},"sim2_pin":{"type":"str","required":false,"choices":["disable","enable"]},"gps":{"type":"str","required":false,"choices":["dis'
+    'able","enable"]}}},"modem2":{"type":"dict","required":false,"options":{"sim1_pin":{"type":"str","required":false,"choices":["disable","enable"]},"auto'
+    '_switch":{"type":"dict","required":false,"options":{"dataplan":{"type":"str","required":false,"choices":["disable","enable"]},"disconnect":{"type":"st'
+    'r","required":false,"choices":["disable","enable"]},"switch_back_time":{"type":"str","required":false},"switch_back_timer":{"type":"int","required":fa'
+    'lse},"switch_back":{"type":"list","required":false,"choices":["time","timer"]},"signal":{"type":"str","required":false,"choices":["disable","enable"]}'
+    ',"disconnect_period":{"type":"int","required":false},"disconnect_threshold":{"type":"int","required":false}}},"sim2_pin_code":{"type":"str","required"'
+    ':false},"conn_status":{"type":"int","required":false},"sim1_pin_code":{"type":"str","required":false},"default_sim":{"type":"str","required":false,"ch'
+    'oices":["sim1","sim2","carrier","cost"]},"redundant_intf":{"type":"str","required":false},"redundant_mode":{"type":"str","required":false,"choices":["'
+    'disable","enable"]},"ifname":{"type":"str","required":false},"preferred_carrier":{"type":"str","required":false},"sim2_pin":{"type":"str","required":f'
+    'alse,"choices":["disable","enable"]},"gps":{"type":"str","required":false,"choices":["disable","enable"]}}},"login_password":{"type":"str","required":'
+    'false},"roaming":{"type":"str","required":false},"billing_start_day":{"type":"int","required":false},"access_point_name":{"type":"str","required":fals'
+    'e},"cdma_ha_spi":{"type":"str","required":false},"name":{"type":"str","required":false},"modem_passwd":{"type":"str","required":false},"admin":{"type"'
+    ':"str","required":false},"dial_mode":{"type":"str","required":false},"primary_ha":{"type":"str","required":false},"vdom":{"type":"int","required":fals'
+    'e},"mode":{"type":"str","required":false},"redundant_intf":{"type":"str","required":false},"aaa_shared_secret":{"type":"str","required":false},"sim_pi'
+    'n":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,30 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[1920,1920]},"feature_set":{"type":"string","options":[{"value":"flow","revisions":['
+    '1920,1920]},{"value":"proxy","revisions":[1920,1920]}],"revisions":[1920,1920]},"scan_archive_contents":{"type":"string","options":[{"value":"disable"'
+    ',"revisions":[1920,1920]},{"value":"enable","revisions":[1920,1920]}],"revisions":[1920,1920]},"log":{"type":"string","options":[{"value":"disable","r'
+    'evisions":[1920,1920]},{"value":"enable","revisions":[1920,1920]}],"revisions":[1920,1920]},"rules":{"type":"list","children":{"comment":{"type":"stri'
+    'ng","revisions":[1920,1920]},"direction":{"type":"string","options":[{"value":"incoming","revisions":[1920,1920]},{"value":"outgoing","revisions":[192'
+    '0,1920]},{"value":"any","revisions":[1920,1920]}],"revisions":[1920,1920]},"protocol":{"multiple_values":true,"type":"list","options":[{"value":"http"'
+    ',"revisions":[1920,1920]},{"value":"ftp","revisions":[1920,1920]},{"value":"smtp","revisions":[1920,1920]},{"value":"imap","revisions":[1920,1920]},{"'
+    'value":"pop3","revisions":[1920,1920]},{"value":"mapi","revisions":[1920,1920]},{"value":"cifs","revisions":[1920,1920]},{"value":"ssh","revisions":[1'
+    '920,1920]}],"revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1920]},"file_type":{"type":"list","children":{"name":{"type":"string","'
+    'revisions":[1920,1920]}},"revisions":[1920,1920]},"password_protected":{"type":"string","options":[{"value":"yes","revisions":[1920,1920]},{"value":"a'
+    'ny","revisions":[1920,1920]}],"revisions":[1920,1920]},"action":{"type":"string","options":[{"value":"log-only","revisions":[1920,1920]},{"value":"blo'
+    'ck","revisions":[1920,1920]}],"revisions":[1920,1920]}},"revisions":[1920,1920]},"extended_log":{"type":"string","options":[{"value":"disable","revisi'
+    'ons":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1920,1664]},"replacemsg_group":{"type":"string","revisions":[1920,1920]},"n'
+    'ame":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"feature_set":{"type":"str","required":false,"choices":["flow","p'
+    'roxy"]},"scan_archive_contents":{"type":"str","required":false,"choices":["disable","enable"]},"log":{"type":"str","required":false,"choices":["disabl'
+    'e","enable"]},"rules":{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"direction":{"type":"str","required":false,'
+    '"choices":["incoming","outgoing","any"]},"protocol":{"type":"list","required":false,"choices":["http","ftp","smtp","imap","pop3","mapi","cifs","ssh"]}'
+    ',"name":{"type":"str","required":false},"file_type":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"password_prot'
+    'ected":{"type":"str","required":false,"choices":["yes","any"]},"action":{"type":"str","required":false,"choices":["log-only","block"]}}},"extended_log'
+    '":{"type":"str","required":false},"replacemsg_group":{"type":"str","required":false},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,138 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"api_gateway":{"type":"list","children":{"ssl_algorithm":{"type":"string","options":[{"value":"high","revisions":[1024,1024'
+    ']},{"value":"medium","revisions":[1024,1024]},{"value":"low","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[1024,10'
+    '24]},"ssl_min_version":{"type":"string","options":[{"value":"tls-1.0","revisions":[1024,1024]},{"value":"tls-1.1","revisions":[1024,1024]},{"value":"t'
+    'ls-1.2","revisions":[1024,1024]},{"value":"tls-1.3","revisions":[1024,1024]}],"revisions":[1024,1024]},"ssl_cipher_suites":{"type":"list","children":{'
+    '"priority":{"type":"integer","revisions":[1024,1024]},"cipher":{"type":"string","options":[{"value":"TLS-AES-128-GCM-SHA256","revisions":[1024,1024]},'
+    '{"value":"TLS-AES-256-GCM-SHA384","revisions":[1024,1024]},{"value":"TLS-CHACHA20-POLY1305-SHA256","revisions":[1024,1024]},{"value":"TLS-ECDHE-RSA-WI'
+    'TH-CHACHA20-POLY1305-SHA256","revisions":[1024,1024]},{"value":"TLS-ECDHE-ECDSA-WITH-CHACHA20-POLY1305-SHA256","revisions":[1024,1024]},{"value":"TLS-'
+    'DHE-RSA-WITH-CHACHA20-POLY1305-SHA256","revisions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH-AES-128-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-DHE'
+    '-RSA-WITH-AES-256-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH-AES-128-CBC-SHA256","revisions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH'
+    '-AES-128-GCM-SHA256","revisions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH-AES-256-CBC-SHA256","revisions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH-AES-2'
+    '56-GCM-SHA384","revisions":[1024,1024]},{"value":"TLS-DHE-DSS-WITH-AES-128-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-DHE-DSS-WITH-AES-256-CBC-SH'
+    'A","revisions":[1024,1024]},{"value":"TLS-DHE-DSS-WITH-AES-128-CBC-SHA256","revisions":[1024,1024]},{"value":"TLS-DHE-DSS-WITH-AES-128-GCM-SHA256","re'
+    'visions":[1024,1024]},{"value":"TLS-DHE-DSS-WITH-AES-256-CBC-SHA256","revisions":[1024,1024]},{"value":"TLS-DHE-DSS-WITH-AES-256-GCM-SHA384","revision'
+    's":[1024,1024]},{"value":"TLS-ECDHE-RSA-WITH-AES-128-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-ECDHE-RSA-WITH-AES-128-CBC-SHA256","revisions":[1'
+    '024,1024]},{"value":"TLS-ECDHE-RSA-WITH-AES-128-GCM-SHA256","revisions":[1024,1024]},{"value":"TLS-ECDHE-RSA-WITH-AES-256-CBC-SHA","revisions":[1024,1'
+    '024]},{"value":"TLS-ECDHE-RSA-WITH-AES-256-CBC-SHA384","revisions":[1024,1024]},{"value":"TLS-ECDHE-RSA-WITH-AES-256-GCM-SHA384","revisions":[1024,102'
+    '4]},{"value":"TLS-ECDHE-ECDSA-WITH-AES-128-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-ECDHE-ECDSA-WITH-AES-128-CBC-SHA256","revisions":[1024,1024'
+    ']},{"value":"TLS-ECDHE-ECDSA-WITH-AES-128-GCM-SHA256","revisions":[1024,1024]},{"value":"TLS-ECDHE-ECDSA-WITH-AES-256-CBC-SHA384","revisions":[1024,10'
+    '24]},{"value":"TLS-ECDHE-ECDSA-WITH-AES-256-GCM-SHA384","revisions":[1024,1024]},{"value":"TLS-RSA-WITH-AES-128-CBC-SHA","revisions":[1024,1024]},{"va'
+    'lue":"TLS-RSA-WITH-AES-256-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-RSA-WITH-AES-128-CBC-SHA256","revisions":[1024,1024]},{"value":"TLS-RSA-WIT'
+    'H-AES-128-GCM-SHA256","revisions":[1024,1024]},{"value":"TLS-RSA-WITH-AES-256-CBC-SHA256","revisions":[1024,1024]},{"value":"TLS-RSA-WITH-AES-256-GCM-'
+    'SHA384","revisions":[1024,1024]},{"value":"TLS-RSA-WITH-CAMELLIA-128-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-RSA-WITH-CAMELLIA-256-CBC-SHA","r'
+    'evisions":[1024,1024]},{"value":"TLS-RSA-WITH-CAMELLIA-128-CBC-SHA256","revisions":[1024,1024]},{"value":"TLS-RSA-WITH-CAMELLIA-256-CBC-SHA256","revis'
+    'ions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH-3DES-EDE-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH-CAMELLIA-128-CBC-SHA","revisions":'
+    '[1024,1024]},{"value":"TLS-DHE-DSS-WITH-CAMELLIA-128-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH-CAMELLIA-256-CBC-SHA","revisions":[1'
+    '024,1024]},{"value":"TLS-DHE-DSS-WITH-CAMELLIA-256-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH-CAMELLIA-128-CBC-SHA256","revisions":['
+    '1024,1024]},{"value":"TLS-DHE-DSS-WITH-CAMELLIA-128-CBC-SHA256","revisions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH-CAMELLIA-256-CBC-SHA256","revision'
+    's":[1024,1024]},{"value":"TLS-DHE-DSS-WITH-CAMELLIA-256-CBC-SHA256","revisions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH-SEED-CBC-SHA","revisions":[102'
+    '4,1024]},{"value":"TLS-DHE-DSS-WITH-SEED-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH-ARIA-128-CBC-SHA256","revisions":[1024,1024]},{"'
+    'value":"TLS-DHE-RSA-WITH-ARIA-256-CBC-SHA384","revisions":[1024,1024]},{"value":"TLS-DHE-DSS-WITH-ARIA-128-CBC-SHA256","revisions":[1024,1024]},{"valu'
+    'e":"TLS-DHE-DSS-WITH-ARIA-256-CBC-SHA384","revisions":[1024,1024]},{"value":"TLS-RSA-WITH-SEED-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-RSA-WIT'
+    'H-ARIA-128-CBC-SHA256","revisions":[1024,1024]},{"value":"TLS-RSA-WITH-ARIA-256-CBC-SHA384","revisions":[1024,1024]},{"value":"TLS-ECDHE-RSA-WITH-ARIA'
+    '-128-CBC-SHA256","revisions":[1024,1024]},{"value":"TLS-ECDHE-RSA-WITH-ARIA-256-CBC-SHA384","revisions":[1024,1024]},{"value":"TLS-ECDHE-ECDSA-WITH-AR'
+    'IA-128-CBC-SHA256","revisions":[1024,1024]},{"value":"TLS-ECDHE-ECDSA-WITH-ARIA-256-CBC-SHA384","revisions":[1024,1024]},{"value":"TLS-ECDHE-RSA-WITH-'
+    'RC4-128-SHA","revisions":[1024,1024]},{"value":"TLS-ECDHE-RSA-WITH-3DES-EDE-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-DHE-DSS-WITH-3DES-EDE-CBC-'
+    'SHA","revisions":[1024,1024]},{"value":"TLS-RSA-WITH-3DES-EDE-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-RSA-WITH-RC4-128-MD5","revisions":[1024,'
+    '1024]},{"value":"TLS-RSA-WITH-RC4-128-SHA","revisions":[1024,1024]},{"value":"TLS-DHE-RSA-WITH-DES-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-DHE'
+    '-DSS-WITH-DES-CBC-SHA","revisions":[1024,1024]},{"value":"TLS-RSA-WITH-DES-CBC-SHA","revisions":[1024,1024]}],"revisions":[1024,1024]},"versions":{"mu'
+    'ltiple_values":true,"type":"list","options":[{"value":"tls-1.0","revisions":[1024,1024]},{"value":"tls-1.1","revisions":[1024,1024]},{"value":"tls-1.2'
+    '","revisions":[1024,1024]},{"value":"tls-1.3","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"service":{"type":"string",'
+    '"options":[{"value":"http","revisions":[1024,1024]},{"value":"https","revisions":[1024,1024]},{"value":"tcp-forwarding","revisions":[1024,1024]},{"val'
+    'ue":"samlsp","revisions":[1024,1024]}],"revisions":[1024,1024]},"realservers":{"type":"list","children":{"status":{"type":"string","options":[{"value"'
+    ':"active","revisions":[1024,1024]},{"value":"standby","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"'
+    'health_check":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,10'
+    '24]},"weight":{"type":"integer","revisions":[1024,1024]},"ip":{"type":"string","revisions":[1024,1024]},"id":{"type":"integer","revisions":[1024,1024]'
+    '},"http_host":{"type":"string","revisions":[1024,1024]},"health_check_proto":{"type":"string","options":[{"value":"ping","revisions":[1024,1024]},{"va'
+    'lue":"http","revisions":[1024,1024]},{"value":"tcp-connect","revisions":[1024,1024]}],"revisions":[1024,1024]},"address":{"type":"string","revisions":'
+    '[1024,1024]},"port":{"type":"integer","revisions":[1024,1024]},"mappedport":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"http_'
+    'cookie_domain_from_host":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revision'
+    's":[1024,1024]},"https_cookie_secure":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024'
+    ']}],"revisions":[1024,1024]},"http_cookie_generation":{"type":"integer","revisions":[1024,1024]},"http_cookie_domain":{"type":"string","revisions":[10'
+    '24,1024]},"url_map_type":{"type":"string","options":[{"value":"sub-string","revisions":[1024,1024]},{"value":"wildcard","revisions":[1024,1024]},{"val'
+    'ue":"regex","revisions":[1024,1024]}],"revisions":[1024,1024]},"http_cookie_share":{"type":"string","options":[{"value":"disable","revisions":[1024,10'
+    '24]},{"value":"same-ip","revisions":[1024,1024]}],"revisions":[1024,1024]},"ssl_dh_bits":{"type":"string","options":[{"value":"768","revisions":[1024,'
+    '1024]},{"value":"1024","revisions":[1024,1024]},{"value":"1536","revisions":[1024,1024]},{"value":"2048","revisions":[1024,1024]},{"value":"3072","rev'
+    'isions":[1024,1024]},{"value":"4096","revisions":[1024,1024]}],"revisions":[1024,1024]},"ldb_method":{"type":"string","options":[{"value":"static","re'
+    'visions":[1024,1024]},{"value":"round-robin","revisions":[1024,1024]},{"value":"weighted","revisions":[1024,1024]},{"value":"least-session","revisions'
+    '":[1024,1024]},{"value":"least-rtt","revisions":[1024,1024]},{"value":"first-alive","revisions":[1024,1024]},{"value":"http-host","revisions":[1024,10'
+    '24]}],"revisions":[1024,1024]},"persistence":{"type":"string","options":[{"value":"none","revisions":[1024,1024]},{"value":"http-cookie","revisions":['
+    '1024,1024]}],"revisions":[1024,1024]},"virtual_host":{"type":"string","revisions":[1024,1024]},"ssl_max_version":{"type":"string","options":[{"value":'
+    '"tls-1.0","revisions":[1024,1024]},{"value":"tls-1.1","revisions":[1024,1024]},{"value":"tls-1.2","revisions":[1024,1024]},{"value":"tls-1.3","revisio'
+    'ns":[1024,1024]}],"revisions":[1024,1024]},"url_map":{"type":"string","revisions":[1024,1024]},"saml_server":{"type":"string","revisions":[1024,1024]}'
+    ',"id":{"type":"integer","revisions":[1024,1024]},"http_cookie_age":{"type":"integer","revisions":[1024,1024]},"http_cookie_path":{"type":"string","rev'
+    'isions":[1024,1024]}},"revisions":[1024,1024]},"name":{"type":"string","revisions":[1024,1024]},"realservers":{"type":"list","children":{"status":{"ty'
+    'pe":"string","options":[{"value":"active","revisions":[1024,1024]},{"value":"standby","revisions":[1024,1024]},{"value":"disable","revisions":[1024,10'
+    '24]}],"revisions":[1024,1024]},"ip":{"type":"string","revisions":[1024,1024]},"id":{"type":"integer","revisions":[1024,1024]},"weight":{"type":"intege'
+    'r","revisions":[1024,1024]},"port":{"type":"integer","revisions":[1024,1024]}},"revisions":[1024,1024]},"empty_cert_action":{"type":"string","options"'
+    ':[{"value":"accept","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]}],"revisions":[1024,1024]},"server_pubkey_auth":{"type":"string"'
+    ',"options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"vip":{"type":"string","r'
+    'evisions":[1024,1024]},"ldb_method":{"type":"string","options":[{"value":"static","revisions":[1024,1024]},{"value":"round-robin","revisions":[1024,10'
+    '24]},{"value":"weighted","revisions":[1024,1024]},{"value":"least-session","revisions":[1024,1024]},{"value":"least-rtt","revisions":[1024,1024]},{"va'
+    'lue":"first-alive","revisions":[1024,1024]}],"revisions":[1024,1024]},"server_pubkey_auth_settings":{"type":"dict","children":{"permit_x11_forwarding"'
+    ':{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"auth_ca'
+    '":{"type":"string","revisions":[1024,1024]},"permit_port_forwarding":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"'
+    'disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"permit_pty":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"valu'
+    'e":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"permit_user_rc":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]'
+    '},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"permit_agent_forwarding":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"source_address":{"type":"string","options":[{"value":"enable'
+    '","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"cert_extension":{"type":"list","children":{"data":{"'
+    'type":"string","revisions":[1024,1024]},"critical":{"type":"string","options":[{"value":"no","revisions":[1024,1024]},{"value":"yes","revisions":[1024'
+    ',1024]}],"revisions":[1024,1024]},"type":{"type":"string","options":[{"value":"fixed","revisions":[1024,1024]},{"value":"user","revisions":[1024,1024]'
+    '}],"revisions":[1024,1024]},"name":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]}},"revisions":[1024,1024]},"client_cert":{"type"'
+    ':"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[10'
+    '24,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"api_gateway":{"type":"list","required":false,"options":{"ssl_algorithm":{"type":"str","required":false,"ch'
+    'oices":["high","medium","low","custom"]},"ssl_min_version":{"type":"str","required":false,"choices":["tls-1.0","tls-1.1","tls-1.2","tls-1.3"]},"ssl_ci'
+    'pher_suites":{"type":"list","required":false,"options":{"priority":{"type":"int","required":false},"cipher":{"type":"str","required":false,"choices":['
+    '"TLS-AES-128-GCM-SHA256","TLS-AES-256-GCM-SHA384","TLS-CHACHA20-POLY1305-SHA256","TLS-ECDHE-RSA-WITH-CHACHA20-POLY1305-SHA256","TLS-ECDHE-ECDSA-WITH-C'
+    'HACHA20-POLY1305-SHA256","TLS-DHE-RSA-WITH-CHACHA20-POLY1305-SHA256","TLS-DHE-RSA-WITH-AES-128-CBC-SHA","TLS-DHE-RSA-WITH-AES-256-CBC-SHA","TLS-DHE-RS'
+    'A-WITH-AES-128-CBC-SHA256","TLS-DHE-RSA-WITH-AES-128-GCM-SHA256","TLS-DHE-RSA-WITH-AES-256-CBC-SHA256","TLS-DHE-RSA-WITH-AES-256-GCM-SHA384","TLS-DHE-'
+    'DSS-WITH-AES-128-CBC-SHA","TLS-DHE-DSS-WITH-AES-256-CBC-SHA","TLS-DHE-DSS-WITH-AES-128-CBC-SHA256","TLS-DHE-DSS-WITH-AES-128-GCM-SHA256","TLS-DHE-DSS-'
+    'WITH-AES-256-CBC-SHA256","TLS-DHE-DSS-WITH-AES-256-GCM-SHA384","TLS-ECDHE-RSA-WITH-AES-128-CBC-SHA","TLS-ECDHE-RSA-WITH-AES-128-CBC-SHA256","TLS-ECDHE'
+    '-RSA-WITH-AES-128-GCM-SHA256","TLS-ECDHE-RSA-WITH-AES-256-CBC-SHA","TLS-ECDHE-RSA-WITH-AES-256-CBC-SHA384","TLS-ECDHE-RSA-WITH-AES-256-GCM-SHA384","TL'
+    'S-ECDHE-ECDSA-WITH-AES-128-CBC-SHA","TLS-ECDHE-ECDSA-WITH-AES-128-CBC-SHA256","TLS-ECDHE-ECDSA-WITH-AES-128-GCM-SHA256","TLS-ECDHE-ECDSA-WITH-AES-256-'
+    'CBC-SHA384","TLS-ECDHE-ECDSA-WITH-AES-256-GCM-SHA384","TLS-RSA-WITH-AES-128-CBC-SHA","TLS-RSA-WITH-AES-256-CBC-SHA","TLS-RSA-WITH-AES-128-CBC-SHA256",'
+    '"TLS-RSA-WITH-AES-128-GCM-SHA256","TLS-RSA-WITH-AES-256-CBC-SHA256","TLS-RSA-WITH-AES-256-GCM-SHA384","TLS-RSA-WITH-CAMELLIA-128-CBC-SHA","TLS-RSA-WIT'
+    'H-CAMELLIA-256-CBC-SHA","TLS-RSA-WITH-CAMELLIA-128-CBC-SHA256","TLS-RSA-WITH-CAMELLIA-256-CBC-SHA256","TLS-DHE-RSA-WITH-3DES-EDE-CBC-SHA","TLS-DHE-RSA'
+    '-WITH-CAMELLIA-128-CBC-SHA","TLS-DHE-DSS-WITH-CAMELLIA-128-CBC-SHA","TLS-DHE-RSA-WITH-CAMELLIA-256-CBC-SHA","TLS-DHE-DSS-WITH-CAMELLIA-256-CBC-SHA","T'
+    'LS-DHE-RSA-WITH-CAMELLIA-128-CBC-SHA256","TLS-DHE-DSS-WITH-CAMELLIA-128-CBC-SHA256","TLS-DHE-RSA-WITH-CAMELLIA-256-CBC-SHA256","TLS-DHE-DSS-WITH-CAMEL'
+    'LIA-256-CBC-SHA256","TLS-DHE-RSA-WITH-SEED-CBC-SHA","TLS-DHE-DSS-WITH-SEED-CBC-SHA","TLS-DHE-RSA-WITH-ARIA-128-CBC-SHA256","TLS-DHE-RSA-WITH-ARIA-256-'
+    'CBC-SHA384","TLS-DHE-DSS-WITH-ARIA-128-CBC-SHA256","TLS-DHE-DSS-WITH-ARIA-256-CBC-SHA384","TLS-RSA-WITH-SEED-CBC-SHA","TLS-RSA-WITH-ARIA-128-CBC-SHA25'
+    '6","TLS-RSA-WITH-ARIA-256-CBC-SHA384","TLS-ECDHE-RSA-WITH-ARIA-128-CBC-SHA256","TLS-ECDHE-RSA-WITH-ARIA-256-CBC-SHA384","TLS-ECDHE-ECDSA-WITH-ARIA-128'
+    '-CBC-SHA256","TLS-ECDHE-ECDSA-WITH-ARIA-256-CBC-SHA384","TLS-ECDHE-RSA-WITH-RC4-128-SHA","TLS-ECDHE-RSA-WITH-3DES-EDE-CBC-SHA","TLS-DHE-DSS-WITH-3DES-'
+    'EDE-CBC-SHA","TLS-RSA-WITH-3DES-EDE-CBC-SHA","TLS-RSA-WITH-RC4-128-MD5","TLS-RSA-WITH-RC4-128-SHA","TLS-DHE-RSA-WITH-DES-CBC-SHA","TLS-DHE-DSS-WITH-DE'
+    'S-CBC-SHA","TLS-RSA-WITH-DES-CBC-SHA"]},"versions":{"type":"list","required":false,"choices":["tls-1.0","tls-1.1","tls-1.2","tls-1.3"]}}},"service":{"'
+    'type":"str","required":false,"choices":["http","https","tcp-forwarding","samlsp"]},"realservers":{"type":"list","required":false,"options":{"status":{'
+    '"type":"str","required":false,"choices":["active","standby","disable"]},"health_check":{"type":"str","required":false,"choices":["disable","enable"]},'
+    '"weight":{"type":"int","required":false},"ip":{"type":"str","required":false},"id":{"type":"int","required":false},"http_host":{"type":"str","required'
+    '":false},"health_check_proto":{"type":"str","required":false,"choices":["ping","http","tcp-connect"]},"address":{"type":"str","required":false},"port"'
+    ':{"type":"int","required":false},"mappedport":{"type":"str","required":false}}},"http_cookie_domain_from_host":{"type":"str","required":false,"choices'
+    '":["disable","enable"]},"https_cookie_secure":{"type":"str","required":false,"choices":["disable","enable"]},"http_cookie_generation":{"type":"int","r'
+    'equired":false},"http_cookie_domain":{"type":"str","required":false},"url_map_type":{"type":"str","required":false,"choices":["sub-string","wildcard",'
+    '"regex"]},"http_cookie_share":{"type":"str","required":false,"choices":["disable","same-ip"]},"ssl_dh_bits":{"type":"str","required":false,"choices":['
+    '"768","1024","1536","2048","3072","4096"]},"ldb_method":{"type":"str","required":false,"choices":["static","round-robin","weighted","least-session","l'
+    'east-rtt","first-alive","http-host"]},"persistence":{"type":"str","required":false,"choices":["none","http-cookie"]},"virtual_host":{"type":"str","req'
+    'uired":false},"ssl_max_version":{"type":"str","required":false,"choices":["tls-1.0","tls-1.1","tls-1.2","tls-1.3"]},"url_map":{"type":"str","required"'
+    ':false},"saml_server":{"type":"str","required":false},"id":{"type":"int","required":false},"http_cookie_age":{"type":"int","required":false},"http_coo'
+    'kie_path":{"type":"str","required":false}}},"name":{"type":"str","required":false},"realservers":{"type":"list","required":false,"options":{"status":{'
+    '"type":"str","required":false,"choices":["active","standby","disable"]},"ip":{"type":"str","required":false},"id":{"type":"int","required":false},"wei'
+    'ght":{"type":"int","required":false},"port":{"type":"int","required":false}}},"empty_cert_action":{"type":"str","required":false,"choices":["accept","'
+    'block"]},"server_pubkey_auth":{"type":"str","required":false,"choices":["disable","enable"]},"vip":{"type":"str","required":false},"ldb_method":{"type'
+    '":"str","required":false,"choices":["static","round-robin","weighted","least-session","least-rtt","first-alive"]},"server_pubkey_auth_settings":{"type'
+    '":"dict","required":false,"options":{"permit_x11_forwarding":{"type":"str","required":false,"choices":["enable","disable"]},"auth_ca":{"type":"str","r'
+    'equired":false},"permit_port_forwarding":{"type":"str","required":false,"choices":["enable","disable"]},"permit_pty":{"type":"str","required":false,"c'
+    'hoices":["enable","disable"]},"permit_user_rc":{"type":"str","required":false,"choices":["enable","disable"]},"permit_agent_forwarding":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]},"source_address":{"type":"str","required":false,"choices":["enable","disable"]},"cert_extension":{"ty'
+    'pe":"list","required":false,"options":{"data":{"type":"str","required":false},"critical":{"type":"str","required":false,"choices":["no","yes"]},"type"'
+    ':{"type":"str","required":false,"choices":["fixed","user"]},"name":{"type":"str","required":false}}}}},"client_cert":{"type":"str","required":false,"c'
+    'hoices":["disable","enable"]}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ssl_certificate":{"type":"string","revisions":[1024,1024]},"host":{"type":"string","revisions":[1024,1024]},"host_type":{"'
+    'type":"string","options":[{"value":"sub-string","revisions":[1024,1024]},{"value":"wildcard","revisions":[1024,1024]}],"revisions":[1024,1024]},"name"'
+    ':{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ssl_certificate":{"type":"str","required":false},"host":{"type":"str","required":false},"host_type":{"type'
+    '":"str","required":false,"choices":["sub-string","wildcard"]},"name":{"type":"str","required":false}}}'
+)
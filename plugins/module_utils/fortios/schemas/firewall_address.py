@@ -0,0 +1,55 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"allow_routing":{"type":"string","options":[{"value":"enable","revision'
+    's":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"macaddr":{"type":"list","children":{"macaddr":{"type":"string",'
+    '"revisions":[1024,1024]}},"revisions":[1024,1024]},"color":{"type":"integer","revisions":[2047,2047]},"list":{"type":"list","children":{"ip":{"type":"'
+    'string","revisions":[2047,2047]},"net_id":{"type":"string","revisions":[2032,16]},"obj_id":{"type":"string","revisions":[2032,16]}},"revisions":[2047,'
+    '2047]},"sdn_tag":{"type":"string","revisions":[2047,2047]},"fabric_object":{"type":"string","options":[{"value":"enable","revisions":[1536,1536]},{"va'
+    'lue":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"fqdn":{"type":"string","revisions":[2047,2047]},"interface":{"type":"string","revis'
+    'ions":[2040,2040]},"sdn":{"type":"string","options":[{"value":"aci","revisions":[7,7]},{"value":"aws","revisions":[7,7]},{"value":"azure","revisions":'
+    '[7,7]},{"value":"gcp","revisions":[7,7]},{"value":"nsx","revisions":[7,7]},{"value":"nuage","revisions":[7,7]},{"value":"oci","revisions":[7,7]},{"val'
+    'ue":"openstack","revisions":[7,7]}],"revisions":[2047,2047]},"epg_name":{"type":"string","revisions":[2047,2047]},"subnet":{"type":"string","revisions'
+    '":[2047,2047]},"obj_type":{"type":"string","options":[{"value":"ip","revisions":[1664,1664]},{"value":"mac","revisions":[1664,1664]}],"revisions":[192'
+    '0,1664]},"sdn_addr_type":{"type":"string","options":[{"value":"private","revisions":[2040,2040]},{"value":"public","revisions":[2040,2040]},{"value":"'
+    'all","revisions":[2040,2040]}],"revisions":[2040,2040]},"policy_group":{"type":"string","revisions":[2047,2047]},"obj_tag":{"type":"string","revisions'
+    '":[1920,1664]},"end_ip":{"type":"string","revisions":[2047,2047]},"subnet_name":{"type":"string","revisions":[2047,2047]},"tenant":{"type":"string","r'
+    'evisions":[2047,2047]},"clearpass_spt":{"type":"string","options":[{"value":"unknown","revisions":[2040,2040]},{"value":"healthy","revisions":[2040,20'
+    '40]},{"value":"quarantine","revisions":[2040,2040]},{"value":"checkup","revisions":[2040,2040]},{"value":"transient","revisions":[2040,2040]},{"value"'
+    ':"infected","revisions":[2040,2040]}],"revisions":[2040,2040]},"node_ip_only":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{'
+    '"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"type":{"type":"string","options":[{"value":"ipmask","revisions":[2047,2047]},{"v'
+    'alue":"iprange","revisions":[2047,2047]},{"value":"fqdn","revisions":[2047,2047]},{"value":"geography","revisions":[2047,2047]},{"value":"wildcard","r'
+    'evisions":[2047,2047]},{"value":"wildcard-fqdn","revisions":[2047,7]},{"value":"dynamic","revisions":[2047,2047]},{"value":"interface-subnet","revisio'
+    'ns":[2040,2040]},{"value":"mac","revisions":[2040,2040]}],"revisions":[2047,2047]},"associated_interface":{"type":"string","revisions":[2047,2047]},"s'
+    'tart_mac":{"type":"string","revisions":[2040,1016]},"visibility":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disabl'
+    'e","revisions":[127,127]}],"revisions":[2047,127]},"organization":{"type":"string","revisions":[2047,2047]},"start_ip":{"type":"string","revisions":[2'
+    '047,2047]},"cache_ttl":{"type":"integer","revisions":[2047,2047]},"sub_type":{"type":"string","options":[{"value":"sdn","revisions":[2040,2040]},{"val'
+    'ue":"clearpass-spt","revisions":[2040,2040]},{"value":"fsso","revisions":[2040,2040]},{"value":"ems-tag","revisions":[1920,1920]}],"revisions":[2040,2'
+    '040]},"tagging":{"type":"list","children":{"category":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"tags'
+    '":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]},"uuid":{"type":"stri'
+    'ng","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"obj_id":{"type":"string","revisions":[2047,2047]},"country":{"type":"st'
+    'ring","revisions":[2047,2047]},"end_mac":{"type":"string","revisions":[2040,1016]},"wildcard_fqdn":{"type":"string","revisions":[2047,2047]},"filter":'
+    '{"type":"string","revisions":[2047,2047]},"wildcard":{"type":"string","revisions":[2047,2047]},"fsso_group":{"type":"list","children":{"name":{"type":'
+    '"string","revisions":[2040,2040]}},"revisions":[2040,2040]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"allow_routing":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"macaddr":{"type":"list","required":false,"options":{"macaddr":{"type":"str","required":false}}},"color":{"type":"int","required":false}'
+    ',"list":{"type":"list","required":false,"options":{"ip":{"type":"str","required":false},"net_id":{"type":"str","required":false},"obj_id":{"type":"str'
+    '","required":false}}},"sdn_tag":{"type":"str","required":false},"fabric_object":{"type":"str","required":false,"choices":["enable","disable"]},"fqdn":'
+    '{"type":"str","required":false},"interface":{"type":"str","required":false},"sdn":{"type":"str","required":false},"epg_name":{"type":"str","required":'
+    'false},"subnet":{"type":"str","required":false},"obj_type":{"type":"str","required":false},"sdn_addr_type":{"type":"str","required":false,"choices":["'
+    'private","public","all"]},"policy_group":{"type":"str","required":false},"obj_tag":{"type":"str","required":false},"end_ip":{"type":"str","required":f'
+    'alse},"subnet_name":{"type":"str","required":false},"tenant":{"type":"str","required":false},"clearpass_spt":{"type":"str","required":false,"choices":'
+    '["unknown","healthy","quarantine","checkup","transient","infected"]},"node_ip_only":{"type":"str","required":false,"choices":["enable","disable"]},"ty'
+    'pe":{"type":"str","required":false},"associated_interface":{"type":"str","required":false},"start_mac":{"type":"str","required":false},"visibility":{"'
+    'type":"str","required":false},"organization":{"type":"str","required":false},"start_ip":{"type":"str","required":false},"cache_ttl":{"type":"int","req'
+    'uired":false},"sub_type":{"type":"str","required":false},"tagging":{"type":"list","required":false,"options":{"category":{"type":"str","required":fals'
+    'e},"name":{"type":"str","required":false},"tags":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}}},"uuid":{"type":'
+    '"str","required":false},"name":{"type":"str","required":false},"obj_id":{"type":"str","required":false},"country":{"type":"str","required":false},"end'
+    '_mac":{"type":"str","required":false},"wildcard_fqdn":{"type":"str","required":false},"filter":{"type":"str","required":false},"wildcard":{"type":"str'
+    '","required":false},"fsso_group":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}}}'
+)
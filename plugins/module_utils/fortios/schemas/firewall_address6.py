@@ -0,0 +1,38 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"macaddr":{"type":"list","children":{"macaddr":{"type":"string","revisi'
+    'ons":[1024,1024]}},"revisions":[1024,1024]},"color":{"type":"integer","revisions":[2047,2047]},"end_mac":{"type":"string","revisions":[2040,744]},"fab'
+    'ric_object":{"type":"string","options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536'
+    ']},"cache_ttl":{"type":"integer","revisions":[2047,2047]},"uuid":{"type":"string","revisions":[2047,2047]},"list":{"type":"list","children":{"ip":{"ty'
+    'pe":"string","revisions":[2047,2047]},"net_id":{"type":"string","revisions":[2032,16]},"obj_id":{"type":"string","revisions":[2032,16]}},"revisions":['
+    '2047,2047]},"subnet_segment":{"type":"list","children":{"type":{"type":"string","options":[{"value":"any","revisions":[2047,2047]},{"value":"specific"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"value":{"type":"string","revisions":[2047,2047]}'
+    '},"revisions":[2047,2047]},"template":{"type":"string","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"ipprefix","revisions":[20'
+    '47,2047]},{"value":"iprange","revisions":[2047,2047]},{"value":"fqdn","revisions":[2047,2047]},{"value":"dynamic","revisions":[2047,2047]},{"value":"t'
+    'emplate","revisions":[2047,2047]},{"value":"mac","revisions":[2040,1768]},{"value":"geography","revisions":[1920,1920]}],"revisions":[2047,2047]},"sta'
+    'rt_mac":{"type":"string","revisions":[2040,744]},"visibility":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable",'
+    '"revisions":[127,127]}],"revisions":[2047,127]},"host":{"type":"string","revisions":[2047,2047]},"ip6":{"type":"string","revisions":[2047,2047]},"star'
+    't_ip":{"type":"string","revisions":[2047,2047]},"sdn":{"type":"string","options":[{"value":"nsx","revisions":[7,7]}],"revisions":[2047,2047]},"tagging'
+    '":{"type":"list","children":{"category":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"tags":{"type":"lis'
+    't","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]},"name":{"type":"string","revisions'
+    '":[2047,2047]},"obj_id":{"type":"string","revisions":[2047,2047]},"country":{"type":"string","revisions":[1920,1920]},"host_type":{"type":"string","op'
+    'tions":[{"value":"any","revisions":[2047,2047]},{"value":"specific","revisions":[2047,2047]}],"revisions":[2047,2047]},"fqdn":{"type":"string","revisi'
+    'ons":[2047,2047]},"end_ip":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"macaddr":{"type":"list","required":false,"options":{"macaddr":{"'
+    'type":"str","required":false}}},"color":{"type":"int","required":false},"end_mac":{"type":"str","required":false},"fabric_object":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]},"cache_ttl":{"type":"int","required":false},"uuid":{"type":"str","required":false},"list":{"type":"list","r'
+    'equired":false,"options":{"ip":{"type":"str","required":false},"net_id":{"type":"str","required":false},"obj_id":{"type":"str","required":false}}},"su'
+    'bnet_segment":{"type":"list","required":false,"options":{"type":{"type":"str","required":false,"choices":["any","specific"]},"name":{"type":"str","req'
+    'uired":false},"value":{"type":"str","required":false}}},"template":{"type":"str","required":false},"type":{"type":"str","required":false},"start_mac":'
+    '{"type":"str","required":false},"visibility":{"type":"str","required":false},"host":{"type":"str","required":false},"ip6":{"type":"str","required":fal'
+    'se},"start_ip":{"type":"str","required":false},"sdn":{"type":"str","required":false},"tagging":{"type":"list","required":false,"options":{"category":{'
+    '"type":"str","required":false},"name":{"type":"str","required":false},"tags":{"type":"list","required":false,"options":{"name":{"type":"str","required'
+    '":false}}}}},"name":{"type":"str","required":false},"obj_id":{"type":"str","required":false},"country":{"type":"str","required":false},"host_type":{"t'
+    'ype":"str","required":false,"choices":["any","specific"]},"fqdn":{"type":"str","required":false},"end_ip":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"subnet_segment_count":{"type":"integer","revisions":[2047,2047]},"subnet_segment":{"type":"list","children":{"exclusive":{'
+    '"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"values":{'
+    '"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"value":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+    ',"id":{"type":"integer","revisions":[2047,2047]},"bits":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"'
+    'revisions":[2047,2047]},"ip6":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"fabric_object":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[2047,204'
+    '7]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"subnet_segment_count":{"type":"int","required":false},"subnet_segment":{"type":"list","required":false,"op'
+    'tions":{"exclusive":{"type":"str","required":false,"choices":["enable","disable"]},"values":{"type":"list","required":false,"options":{"name":{"type":'
+    '"str","required":false},"value":{"type":"str","required":false}}},"id":{"type":"int","required":false},"bits":{"type":"int","required":false},"name":{'
+    '"type":"str","required":false}}},"ip6":{"type":"str","required":false},"name":{"type":"str","required":false},"fabric_object":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]}}}'
+)
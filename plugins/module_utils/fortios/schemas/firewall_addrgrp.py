@@ -0,0 +1,29 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"category":{"type":"string","options":[{"value":"default","revisions":['
+    '1024,1024]},{"value":"ztna-ems-tag","revisions":[1024,1024]},{"value":"ztna-geo-tag","revisions":[1024,1024]}],"revisions":[1024,1024]},"name":{"type"'
+    ':"string","revisions":[2047,2047]},"allow_routing":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"color":{"type":"integer","revisions":[2047,2047]},"visibility":{"type":"string","options":[{"value":"enable'
+    '","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"member":{"type":"list","children":{"name":{"type":"string'
+    '","revisions":[2047,2047]}},"revisions":[2047,2047]},"exclude_member":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"re'
+    'visions":[2040,2040]},"fabric_object":{"type":"string","options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536'
+    ']}],"revisions":[1536,1536]},"exclude":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,204'
+    '0]}],"revisions":[2040,2040]},"type":{"type":"string","options":[{"value":"default","revisions":[1920,1920]},{"value":"folder","revisions":[1920,1920]'
+    '}],"revisions":[1920,1920]},"tagging":{"type":"list","children":{"category":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisio'
+    'ns":[2047,2047]},"tags":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]'
+    '},"uuid":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"category":{"type":"str","required":false,"choices":["default","z'
+    'tna-ems-tag","ztna-geo-tag"]},"name":{"type":"str","required":false},"allow_routing":{"type":"str","required":false,"choices":["enable","disable"]},"c'
+    'olor":{"type":"int","required":false},"visibility":{"type":"str","required":false},"member":{"type":"list","required":false,"options":{"name":{"type":'
+    '"str","required":false}}},"exclude_member":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"fabric_object":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]},"exclude":{"type":"str","required":false,"choices":["enable","disable"]},"type":{"type":"str",'
+    '"required":false,"choices":["default","folder"]},"tagging":{"type":"list","required":false,"options":{"category":{"type":"str","required":false},"name'
+    '":{"type":"str","required":false},"tags":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}}},"uuid":{"type":"str","r'
+    'equired":false}}}'
+)
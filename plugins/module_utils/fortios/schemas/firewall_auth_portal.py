@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"identity_based_route":{"type":"string","revisions":[2047,2047]},"groups":{"type":"list","children":{"name":{"type":"string'
+    '","revisions":[2047,2047]}},"revisions":[2047,2047]},"portal_addr6":{"type":"string","revisions":[2047,2047]},"portal_addr":{"type":"string","revision'
+    's":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"identity_based_route":{"type":"str","required":false},"groups":{"type":"list","required":false,"options":{'
+    '"name":{"type":"str","required":false}}},"portal_addr6":{"type":"str","required":false},"portal_addr":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,20 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[127,127]},"entries":{"type":"list","children":{"status":{"type":"string","options":'
+    '[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"action":{"multiple_values":true,"type":"l'
+    'ist","options":[{"value":"block","revisions":[127,127]},{"value":"exempt","revisions":[127,127]},{"value":"exempt-mass-mms","revisions":[127,127]}],"r'
+    'evisions":[127,127]},"carrier_endpoint":{"type":"string","revisions":[127,127]},"log_action":{"multiple_values":true,"type":"list","options":[{"value"'
+    ':"archive","revisions":[127,127]}],"revisions":[127,127]},"pattern_type":{"type":"string","options":[{"value":"wildcard","revisions":[127,127]},{"valu'
+    'e":"regexp","revisions":[127,127]},{"value":"simple","revisions":[127,127]}],"revisions":[127,127]}},"revisions":[127,127]},"id":{"type":"integer","re'
+    'visions":[127,127]},"name":{"type":"string","revisions":[127,127]}},"revisions":[127,127]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"status":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"action":{"type":"list","required":false,"choices":["block","exempt","exempt-mass-mms"]},"'
+    'carrier_endpoint":{"type":"str","required":false},"log_action":{"type":"list","required":false,"choices":["archive"]},"pattern_type":{"type":"str","re'
+    'quired":false,"choices":["wildcard","regexp","simple"]}}},"id":{"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
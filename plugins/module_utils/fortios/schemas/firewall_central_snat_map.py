@@ -0,0 +1,30 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"dst_addr6":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"nat":{"t'
+    'ype":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"protocol":{'
+    '"type":"integer","revisions":[2047,2047]},"uuid":{"type":"string","revisions":[1920,1920]},"nat_ippool6":{"type":"list","children":{"name":{"type":"st'
+    'ring","revisions":[1920,1920]}},"revisions":[1920,1920]},"orig_port":{"type":"string","revisions":[2047,2047]},"nat_port":{"type":"string","revisions"'
+    ':[2047,2047]},"orig_addr6":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"comments":{"type":"s'
+    'tring","revisions":[2047,2047]},"srcintf":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"nat_i'
+    'ppool":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"policyid":{"type":"integer","revisions":'
+    '[2047,2047]},"orig_addr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"type":{"type":"string"'
+    ',"options":[{"value":"ipv4","revisions":[1920,1920]},{"value":"ipv6","revisions":[1920,1920]}],"revisions":[1920,1920]},"dst_addr":{"type":"list","chi'
+    'ldren":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"dstintf":{"type":"list","children":{"name":{"type":"string","revis'
+    'ions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"dst_addr6":{"type":"list","require'
+    'd":false,"options":{"name":{"type":"str","required":false}}},"nat":{"type":"str","required":false,"choices":["disable","enable"]},"protocol":{"type":"'
+    'int","required":false},"uuid":{"type":"str","required":false},"nat_ippool6":{"type":"list","required":false,"options":{"name":{"type":"str","required"'
+    ':false}}},"orig_port":{"type":"str","required":false},"nat_port":{"type":"str","required":false},"orig_addr6":{"type":"list","required":false,"options'
+    '":{"name":{"type":"str","required":false}}},"comments":{"type":"str","required":false},"srcintf":{"type":"list","required":false,"options":{"name":{"t'
+    'ype":"str","required":false}}},"nat_ippool":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"policyid":{"type":"in'
+    't","required":false},"orig_addr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"type":{"type":"str","required":f'
+    'alse,"choices":["ipv4","ipv6"]},"dst_addr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"dstintf":{"type":"list'
+    '","required":false,"options":{"name":{"type":"str","required":false}}}}}'
+)
@@ -0,0 +1,112 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"internet_service_src":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":'
+    '[120,120]}],"revisions":[120,120]},"per_ip_shaper":{"type":"string","revisions":[120,120]},"traffic_shaper":{"type":"string","revisions":[120,120]},"h'
+    'ttp_policy_redirect":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,'
+    '120]},"srcaddr_negate":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[12'
+    '0,120]},"captive_portal_exempt":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revis'
+    'ions":[120,120]},"diffserv_forward":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"r'
+    'evisions":[120,120]},"wanopt_detection":{"type":"string","options":[{"value":"active","revisions":[120,120]},{"value":"passive","revisions":[120,120]}'
+    ',{"value":"off","revisions":[120,120]}],"revisions":[120,120]},"cifs_profile":{"type":"string","revisions":[120,120]},"service_negate":{"type":"string'
+    '","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"logtraffic":{"type":"string",'
+    '"options":[{"value":"all","revisions":[120,120]},{"value":"utm","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120'
+    ']},"session_ttl":{"type":"integer","revisions":[120,120]},"ips_sensor":{"type":"string","revisions":[120,120]},"mms_profile":{"type":"string","revisio'
+    'ns":[120,120]},"webproxy_forward_server":{"type":"string","revisions":[120,120]},"internet_service_negate":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"internet_service_custom":{"type":"list","children":{"name'
+    '":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"diffserv_reverse":{"type":"string","options":[{"value":"enable","revisions":[120,12'
+    '0]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"ippool":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"'
+    'value":"disable","revisions":[120,120]}],"revisions":[120,120]},"traffic_shaper_reverse":{"type":"string","revisions":[120,120]},"fixedport":{"type":"'
+    'string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"users":{"type":"list","'
+    'children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"outbound":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"uuid":{"type":"string","revisions":[120,120]},"service":{"type":"list",'
+    '"children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"vpntunnel":{"type":"string","revisions":[120,120]},"webproxy_profi'
+    'le":{"type":"string","revisions":[120,120]},"dlp_sensor":{"type":"string","revisions":[120,120]},"ssl_ssh_profile":{"type":"string","revisions":[120,1'
+    '20]},"internet_service_src_custom":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"comments":{"type'
+    '":"string","revisions":[120,120]},"inbound":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,1'
+    '20]}],"revisions":[120,120]},"dstintf":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"wanopt":{"ty'
+    'pe":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"dnsfilter_profile"'
+    ':{"type":"string","revisions":[120,120]},"profile_group":{"type":"string","revisions":[120,120]},"application_list":{"type":"string","revisions":[120,'
+    '120]},"icap_profile":{"type":"string","revisions":[120,120]},"tcp_mss_receiver":{"type":"integer","revisions":[120,120]},"inspection_mode":{"type":"st'
+    'ring","options":[{"value":"proxy","revisions":[120,120]},{"value":"flow","revisions":[120,120]}],"revisions":[120,120]},"internet_service":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"internet_service_src_nega'
+    'te":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"global_lab'
+    'el":{"type":"string","revisions":[112,16]},"status":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions'
+    '":[120,120]}],"revisions":[120,120]},"diffservcode_forward":{"type":"string","revisions":[120,120]},"nat":{"type":"string","options":[{"value":"enable'
+    '","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"profile_type":{"type":"string","options":[{"value":"single'
+    '","revisions":[120,120]},{"value":"group","revisions":[120,120]}],"revisions":[120,120]},"schedule":{"type":"string","revisions":[120,120]},"dstaddr4"'
+    ':{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"wanopt_profile":{"type":"string","revisions":[120,'
+    '120]},"dstaddr6":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"utm_status":{"type":"string","opti'
+    'ons":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"diffservcode_rev":{"type":"string","'
+    'revisions":[120,120]},"tcp_mss_sender":{"type":"integer","revisions":[120,120]},"emailfilter_profile":{"type":"string","revisions":[120,120]},"policyi'
+    'd":{"type":"integer","revisions":[120,120]},"srcintf":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]'
+    '},"wanopt_peer":{"type":"string","revisions":[120,120]},"voip_profile":{"type":"string","revisions":[120,120]},"auto_asic_offload":{"type":"string","o'
+    'ptions":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"ssh_filter_profile":{"type":"stri'
+    'ng","revisions":[120,120]},"internet_service_custom_group":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120'
+    ',120]},"srcaddr6":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"groups":{"type":"list","children"'
+    ':{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"fsso_groups":{"type":"list","children":{"name":{"type":"string","revisions":'
+    '[120,120]}},"revisions":[120,120]},"waf_profile":{"type":"string","revisions":[120,120]},"webfilter_profile":{"type":"string","revisions":[120,120]},"'
+    'logtraffic_start":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120'
+    ']},"name":{"type":"string","revisions":[120,120]},"webcache":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","'
+    'revisions":[120,120]}],"revisions":[120,120]},"internet_service_id":{"type":"list","children":{"id":{"type":"integer","revisions":[120,120]}},"revisio'
+    'ns":[120,120]},"dstaddr_negate":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revis'
+    'ions":[120,120]},"webcache_https":{"type":"string","options":[{"value":"disable","revisions":[120,120]},{"value":"enable","revisions":[120,120]}],"rev'
+    'isions":[120,120]},"av_profile":{"type":"string","revisions":[120,120]},"profile_protocol_options":{"type":"string","revisions":[120,120]},"poolname4"'
+    ':{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"ssh_policy_redirect":{"type":"string","options":[{'
+    '"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"poolname6":{"type":"list","children":{"name'
+    '":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"internet_service_src_id":{"type":"list","children":{"id":{"type":"integer","revisio'
+    'ns":[120,120]}},"revisions":[120,120]},"internet_service_group":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions"'
+    ':[120,120]},"action":{"type":"string","options":[{"value":"accept","revisions":[120,120]},{"value":"deny","revisions":[120,120]},{"value":"ipsec","rev'
+    'isions":[120,120]}],"revisions":[120,120]},"srcaddr4":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]'
+    '},"internet_service_src_custom_group":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"internet_serv'
+    'ice_src_group":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"wanopt_passive_opt":{"type":"string"'
+    ',"options":[{"value":"default","revisions":[120,120]},{"value":"transparent","revisions":[120,120]},{"value":"non-transparent","revisions":[120,120]}]'
+    ',"revisions":[120,120]}},"revisions":[120,120]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"internet_service_src":{"type":"str","required":false,"choices":["enable","disable"]},"per_ip_shaper":{"typ'
+    'e":"str","required":false},"traffic_shaper":{"type":"str","required":false},"http_policy_redirect":{"type":"str","required":false,"choices":["enable",'
+    '"disable"]},"srcaddr_negate":{"type":"str","required":false,"choices":["enable","disable"]},"captive_portal_exempt":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"diffserv_forward":{"type":"str","required":false,"choices":["enable","disable"]},"wanopt_detection":{"type":"str","requi'
+    'red":false,"choices":["active","passive","off"]},"cifs_profile":{"type":"str","required":false},"service_negate":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"logtraffic":{"type":"str","required":false,"choices":["all","utm","disable"]},"session_ttl":{"type":"int","required":false}'
+    ',"ips_sensor":{"type":"str","required":false},"mms_profile":{"type":"str","required":false},"webproxy_forward_server":{"type":"str","required":false},'
+    '"internet_service_negate":{"type":"str","required":false,"choices":["enable","disable"]},"internet_service_custom":{"type":"list","required":false,"op'
+    'tions":{"name":{"type":"str","required":false}}},"diffserv_reverse":{"type":"str","required":false,"choices":["enable","disable"]},"ippool":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"traffic_shaper_reverse":{"type":"str","required":false},"fixedport":{"type":"str","required":fal'
+    'se,"choices":["enable","disable"]},"users":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"outbound":{"type":"str'
+    '","required":false,"choices":["enable","disable"]},"uuid":{"type":"str","required":false},"service":{"type":"list","required":false,"options":{"name":'
+    '{"type":"str","required":false}}},"vpntunnel":{"type":"str","required":false},"webproxy_profile":{"type":"str","required":false},"dlp_sensor":{"type":'
+    '"str","required":false},"ssl_ssh_profile":{"type":"str","required":false},"internet_service_src_custom":{"type":"list","required":false,"options":{"na'
+    'me":{"type":"str","required":false}}},"comments":{"type":"str","required":false},"inbound":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"dstintf":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"wanopt":{"type":"str","required":false,"choices":["'
+    'enable","disable"]},"dnsfilter_profile":{"type":"str","required":false},"profile_group":{"type":"str","required":false},"application_list":{"type":"st'
+    'r","required":false},"icap_profile":{"type":"str","required":false},"tcp_mss_receiver":{"type":"int","required":false},"inspection_mode":{"type":"str"'
+    ',"required":false,"choices":["proxy","flow"]},"internet_service":{"type":"str","required":false,"choices":["enable","disable"]},"internet_service_src_'
+    'negate":{"type":"str","required":false,"choices":["enable","disable"]},"global_label":{"type":"str","required":false},"status":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"diffservcode_forward":{"type":"str","required":false},"nat":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"profile_type":{"type":"str","required":false,"choices":["single","group"]},"schedule":{"type":"str","required":false},"dstaddr4":{"type'
+    '":"list","required":false,"options":{"name":{"type":"str","required":false}}},"wanopt_profile":{"type":"str","required":false},"dstaddr6":{"type":"lis'
+    't","required":false,"options":{"name":{"type":"str","required":false}}},"utm_status":{"type":"str","required":false,"choices":["enable","disable"]},"d'
+    'iffservcode_rev":{"type":"str","required":false},"tcp_mss_sender":{"type":"int","required":false},"emailfilter_profile":{"type":"str","required":false'
+    '},"policyid":{"type":"int","required":false},"srcintf":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"wanopt_pee'
+    'r":{"type":"str","required":false},"voip_profile":{"type":"str","required":false},"auto_asic_offload":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"ssh_filter_profile":{"type":"str","required":false},"internet_service_custom_group":{"type":"list","required":false,"options":{"name":'
+    '{"type":"str","required":false}}},"srcaddr6":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"groups":{"type":"lis'
+    't","required":false,"options":{"name":{"type":"str","required":false}}},"fsso_groups":{"type":"list","required":false,"options":{"name":{"type":"str",'
+    '"required":false}}},"waf_profile":{"type":"str","required":false},"webfilter_profile":{"type":"str","required":false},"logtraffic_start":{"type":"str"'
+    ',"required":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"webcache":{"type":"str","required":false,"choices":["enable"'
+    ',"disable"]},"internet_service_id":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"dstaddr_negate":{"type":"str","r'
+    'equired":false,"choices":["enable","disable"]},"webcache_https":{"type":"str","required":false,"choices":["disable","enable"]},"av_profile":{"type":"s'
+    'tr","required":false},"profile_protocol_options":{"type":"str","required":false},"poolname4":{"type":"list","required":false,"options":{"name":{"type"'
+    ':"str","required":false}}},"ssh_policy_redirect":{"type":"str","required":false,"choices":["enable","disable"]},"poolname6":{"type":"list","required":'
+    'false,"options":{"name":{"type":"str","required":false}}},"internet_service_src_id":{"type":"list","required":false,"options":{"id":{"type":"int","req'
+    'uired":false}}},"internet_service_group":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"action":{"type":"str","r'
+    'equired":false,"choices":["accept","deny","ipsec"]},"srcaddr4":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"in'
+    'ternet_service_src_custom_group":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"internet_service_src_group":{"ty'
+    'pe":"list","required":false,"options":{"name":{"type":"str","required":false}}},"wanopt_passive_opt":{"type":"str","required":false,"choices":["defaul'
+    't","transparent","non-transparent"]}}}'
+)
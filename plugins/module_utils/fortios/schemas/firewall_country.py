@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"region":{"type":"list","children":{"id":{"type":"integer","revisions":[1920,1920]}},"revisions":[1920,1920]},"id":{"type":'
+    '"integer","revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"region":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"id":{"type":"in'
+    't","required":false},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"interface":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"traffic_'
+    'type":{"multiple_values":true,"type":"list","options":[{"value":"ssl","revisions":[1920,1920]},{"value":"ssh","revisions":[1920,1920]}],"revisions":[1'
+    '920,1920]},"traffic_source":{"type":"string","options":[{"value":"client","revisions":[1920,1920]},{"value":"server","revisions":[1920,1920]},{"value"'
+    ':"both","revisions":[1920,1920]}],"revisions":[1920,1920]},"dstmac":{"type":"string","revisions":[1920,1920]},"name":{"type":"string","revisions":[192'
+    '0,1920]}},"revisions":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"interface":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"traffic_ty'
+    'pe":{"type":"list","required":false,"choices":["ssl","ssh"]},"traffic_source":{"type":"str","required":false,"choices":["client","server","both"]},"ds'
+    'tmac":{"type":"str","required":false},"name":{"type":"str","required":false}}}'
+)
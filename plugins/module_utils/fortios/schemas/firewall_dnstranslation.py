@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"src":{"type":"string","revisions":[2047,2047]},"dst":{"type":"string","revisions":[2047,2047]},"netmask":{"type":"string",'
+    '"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"src":{"type":"str","required":false},"dst":{"type":"str","required":false},"netmask":{"type":"str","requir'
+    'ed":false},"id":{"type":"int","required":false}}}'
+)
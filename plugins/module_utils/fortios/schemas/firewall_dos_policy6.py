@@ -0,0 +1,30 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"name":{"type":"string","revisions":[1920,1664]},"service":{"type":"list","children":{"name":{"type":"string","revisions":['
+    '2047,2047]}},"revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},"srcaddr":{"type":"list","children":{"name":{"type":"string'
+    '","revisions":[2047,2047]}},"revisions":[2047,2047]},"policyid":{"type":"integer","revisions":[2047,2047]},"interface":{"type":"string","revisions":[2'
+    '047,2047]},"dstaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"anomaly":{"type":"list","c'
+    'hildren":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"name":{"type":"string","revisions":[2047,2047]},"quarantine":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":'
+    '"attacker","revisions":[2047,2047]}],"revisions":[2047,2047]},"threshold":{"type":"integer","revisions":[2047,2047]},"quarantine_expiry":{"type":"stri'
+    'ng","revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"pass","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]},{'
+    '"value":"proxy","revisions":[2047,1023]}],"revisions":[2047,2047]},"threshold(default)":{"type":"integer","revisions":[2047,2047]},"quarantine_log":{"'
+    'type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"log":{"typ'
+    'e":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":['
+    '2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":fal'
+    'se},"service":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"comments":{"type":"str","required":false},"srcaddr"'
+    ':{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"policyid":{"type":"int","required":false},"interface":{"type":"s'
+    'tr","required":false},"dstaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"anomaly":{"type":"list","required'
+    '":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","required":false},"quarantine":{"type"'
+    ':"str","required":false,"choices":["none","attacker"]},"threshold":{"type":"int","required":false},"quarantine_expiry":{"type":"str","required":false}'
+    ',"action":{"type":"str","required":false,"choices":["pass","block","proxy"]},"threshold(default)":{"type":"int","required":false},"quarantine_log":{"t'
+    'ype":"str","required":false,"choices":["disable","enable"]},"log":{"type":"str","required":false,"choices":["enable","disable"]}}}}}'
+)
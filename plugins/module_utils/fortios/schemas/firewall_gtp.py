@@ -0,0 +1,254 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ie_allow_list_v2":{"type":"string","revisions":[1024,1024]},"user_plane_message_rate_limit":{"type":"integer","revisions":'
+    '[2047,2047]},"log_imsi_prefix":{"type":"string","revisions":[2047,2047]},"miss_must_ie":{"type":"string","options":[{"value":"allow","revisions":[2047'
+    ',2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"interface_notify":{"type":"string","revisions":[2047,2047]},"handover_grou'
+    'p":{"type":"string","revisions":[2047,2047]},"control_plane_message_rate_limit":{"type":"integer","revisions":[2047,2047]},"message_filter_v2":{"type"'
+    ':"string","revisions":[2047,2047]},"rate_limit_mode":{"type":"string","options":[{"value":"per-profile","revisions":[2047,2047]},{"value":"per-stream"'
+    ',"revisions":[2047,2047]},{"value":"per-apn","revisions":[2047,2047]}],"revisions":[2047,2047]},"policy":{"type":"list","children":{"imsi_prefix":{"ty'
+    'pe":"string","revisions":[2040,2040]},"msisdn":{"type":"string","revisions":[2047,7]},"rat_type":{"multiple_values":true,"type":"list","options":[{"va'
+    'lue":"any","revisions":[2047,2047]},{"value":"utran","revisions":[2047,2047]},{"value":"geran","revisions":[2047,2047]},{"value":"wlan","revisions":[2'
+    '047,2047]},{"value":"gan","revisions":[2047,2047]},{"value":"hspa","revisions":[2047,2047]},{"value":"eutran","revisions":[2040,2040]},{"value":"virtu'
+    'al","revisions":[2040,2040]},{"value":"nbiot","revisions":[2040,2040]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"mess'
+    'ages":{"multiple_values":true,"type":"list","options":[{"value":"create-req","revisions":[2047,2047]},{"value":"create-res","revisions":[2047,2047]},{'
+    '"value":"update-req","revisions":[2047,2047]},{"value":"update-res","revisions":[2047,2047]}],"revisions":[2047,2047]},"imei":{"type":"string","revisi'
+    'ons":[2047,2047]},"rai":{"type":"string","revisions":[2047,2047]},"max_apn_restriction":{"type":"string","options":[{"value":"all","revisions":[2047,2'
+    '047]},{"value":"public-1","revisions":[2047,2047]},{"value":"public-2","revisions":[2047,2047]},{"value":"private-1","revisions":[2047,2047]},{"value"'
+    ':"private-2","revisions":[2047,2047]}],"revisions":[2047,2047]},"apn_sel_mode":{"multiple_values":true,"type":"list","options":[{"value":"ms","revisio'
+    'ns":[2047,2047]},{"value":"net","revisions":[2047,2047]},{"value":"vrf","revisions":[2047,2047]}],"revisions":[2047,2047]},"uli":{"type":"string","rev'
+    'isions":[2047,2047]},"apnmember":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"msisdn_prefix"'
+    ':{"type":"string","revisions":[2040,2040]},"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"imsi":{"type":"string","revisions":[2047,7]}},"revisions":[2047,2047]},"tunnel_timeout":{"type":"integer","rev'
+    'isions":[2047,2047]},"gtpu_denied_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"ie_remove_policy":{"type":"list","children":{"sgsn_addr":{"type":"string","revisions":[2047,2047]},"remove_ies":{"multi'
+    'ple_values":true,"type":"list","options":[{"value":"apn-restriction","revisions":[2047,2047]},{"value":"rat-type","revisions":[2047,2047]},{"value":"r'
+    'ai","revisions":[2047,2047]},{"value":"uli","revisions":[2047,2047]},{"value":"imei","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"'
+    'integer","revisions":[2047,2047]},"sgsn_addr6":{"type":"string","revisions":[1920,1664]}},"revisions":[2047,2047]},"apn_filter":{"type":"string","opti'
+    'ons":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisi'
+    'ons":[2047,2047]},"noip_filter":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"ie_allow_list_v0v1":{"type":"string","revisions":[1024,1024]},"sub_second_sampling":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"denied_log":{"type":"string","options":[{"value":"'
+    'enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"context_id":{"type":"integer","revisions":[204'
+    '7,2047]},"out_of_state_ie":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"half_open_timeout":{"type":"integer","revisions":[2047,2047]},"warning_threshold":{"type":"integer","revisions":[2047,2047]},"policy_v2'
+    '":{"type":"list","children":{"imsi_prefix":{"type":"string","revisions":[2040,2040]},"rat_type":{"multiple_values":true,"type":"list","options":[{"val'
+    'ue":"any","revisions":[2040,2040]},{"value":"utran","revisions":[2040,2040]},{"value":"geran","revisions":[2040,2040]},{"value":"wlan","revisions":[20'
+    '40,2040]},{"value":"gan","revisions":[2040,2040]},{"value":"hspa","revisions":[2040,2040]},{"value":"eutran","revisions":[2040,2040]},{"value":"virtua'
+    'l","revisions":[2040,2040]},{"value":"nbiot","revisions":[2040,2040]},{"value":"ltem","revisions":[1920,1664]},{"value":"nr","revisions":[1920,1664]}]'
+    ',"revisions":[2040,2040]},"messages":{"multiple_values":true,"type":"list","options":[{"value":"create-ses-req","revisions":[2040,2040]},{"value":"cre'
+    'ate-ses-res","revisions":[2040,2040]},{"value":"modify-bearer-req","revisions":[2040,2040]},{"value":"modify-bearer-res","revisions":[2040,2040]}],"re'
+    'visions":[2040,2040]},"mei":{"type":"string","revisions":[2040,2040]},"max_apn_restriction":{"type":"string","options":[{"value":"all","revisions":[20'
+    '40,2040]},{"value":"public-1","revisions":[2040,2040]},{"value":"public-2","revisions":[2040,2040]},{"value":"private-1","revisions":[2040,2040]},{"va'
+    'lue":"private-2","revisions":[2040,2040]}],"revisions":[2040,2040]},"apnmember":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2'
+    '040]}},"revisions":[2040,2040]},"uli":{"type":"string","revisions":[2040,2040]},"action":{"type":"string","options":[{"value":"allow","revisions":[204'
+    '0,2040]},{"value":"deny","revisions":[2040,2040]}],"revisions":[2040,2040]},"apn_sel_mode":{"multiple_values":true,"type":"list","options":[{"value":"'
+    'ms","revisions":[2040,2040]},{"value":"net","revisions":[2040,2040]},{"value":"vrf","revisions":[2040,2040]}],"revisions":[2040,2040]},"msisdn_prefix"'
+    ':{"type":"string","revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"send_delete_when_timeout":{"type'
+    '":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"default_noip_a'
+    'ction":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"spoof'
+    '_src_addr":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"i'
+    'msi":{"type":"list","children":{"selection_mode":{"multiple_values":true,"type":"list","options":[{"value":"ms","revisions":[2047,2047]},{"value":"net'
+    '","revisions":[2047,2047]},{"value":"vrf","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"allow","re'
+    'visions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"apnmember":{"type":"list","children":{"name":{"type":"string'
+    '","revisions":[2047,2047]}},"revisions":[2047,2047]},"mcc_mnc":{"type":"string","revisions":[2047,2047]},"msisdn_prefix":{"type":"string","revisions":'
+    '[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"rate_limited_log":{"type":"string","options":[{"value":"enable'
+    '","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_message_length":{"type":"integer","revisions":[2'
+    '047,2047]},"extension_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisi'
+    'ons":[2047,2047]},"echo_request_interval":{"type":"integer","revisions":[2047,2047]},"monitor_mode":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[2047,2047]},{"value":"disable","revisions":[2047,2047]},{"value":"vdom","revisions":[2040,2040]}],"revisions":[2047,2047]},"addr_notify":{"ty'
+    'pe":"string","revisions":[2047,2047]},"log_gtpu_limit":{"type":"integer","revisions":[2047,2047]},"reserved_ie":{"type":"string","options":[{"value":"'
+    'allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"state_invalid_log":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"message_filter_v0v1":{"type":"string","'
+    'revisions":[2047,2047]},"authorized_ggsns":{"type":"string","revisions":[2047,2047]},"port_notify":{"type":"integer","revisions":[2047,2047]},"gtp_in_'
+    'gtp":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"comment'
+    '":{"type":"string","revisions":[2047,2047]},"invalid_sgsns_to_log":{"type":"string","revisions":[2047,2047]},"apn":{"type":"list","children":{"apnmemb'
+    'er":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"action":{"type":"string","options":[{"value'
+    '":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"selection_mode":{"multiple_values":true,"type":'
+    '"list","options":[{"value":"ms","revisions":[2047,2047]},{"value":"net","revisions":[2047,2047]},{"value":"vrf","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"rate_sampling_interval":{"type":"integer","revisions":[2047,20'
+    '47]},"authorized_ggsns6":{"type":"string","revisions":[1920,1664]},"traffic_count_log":{"type":"string","options":[{"value":"enable","revisions":[2047'
+    ',2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip_policy":{"type":"list","children":{"srcaddr6":{"type":"string","revi'
+    'sions":[1920,1664]},"dstaddr6":{"type":"string","revisions":[1920,1664]},"srcaddr":{"type":"string","revisions":[2047,2047]},"action":{"type":"string"'
+    ',"options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"dstaddr":{"type":"string","r'
+    'evisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"gtpu_forwarded_log":{"type":"string","options":[{"va'
+    'lue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ie_remover":{"type":"string","options":['
+    '{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"policy_filter":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sub_second_interval":{"type":'
+    '"string","options":[{"value":"0.5","revisions":[2040,2040]},{"value":"0.25","revisions":[2040,2040]},{"value":"0.1","revisions":[2040,2040]}],"revisio'
+    'ns":[2040,2040]},"tunnel_limit":{"type":"integer","revisions":[2047,2047]},"imsi_filter":{"type":"string","options":[{"value":"enable","revisions":[20'
+    '47,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"message_rate_limit":{"type":"dict","children":{"identification_reques'
+    't":{"type":"integer","revisions":[2047,2047]},"pdu_notify_request":{"type":"integer","revisions":[2047,2047]},"update_pdp_response":{"type":"integer",'
+    '"revisions":[2047,2047]},"fwd_relocation_request":{"type":"integer","revisions":[2047,2047]},"identification_response":{"type":"integer","revisions":['
+    '2047,2047]},"support_ext_hdr_notify":{"type":"integer","revisions":[2047,2047]},"delete_aa_pdp_request":{"type":"integer","revisions":[2047,2047]},"up'
+    'date_pdp_request":{"type":"integer","revisions":[2047,2047]},"delete_mbms_request":{"type":"integer","revisions":[2047,2047]},"fwd_relocation_response'
+    '":{"type":"integer","revisions":[2047,2047]},"create_pdp_response":{"type":"integer","revisions":[2047,2047]},"mbms_ses_start_response":{"type":"integ'
+    'er","revisions":[2047,2047]},"g_pdu":{"type":"integer","revisions":[2047,2047]},"create_aa_pdp_response":{"type":"integer","revisions":[2047,2047]},"c'
+    'reate_mbms_response":{"type":"integer","revisions":[2047,2047]},"echo_reponse":{"type":"integer","revisions":[2047,2047]},"create_aa_pdp_request":{"ty'
+    'pe":"integer","revisions":[2047,2047]},"relocation_cancel_request":{"type":"integer","revisions":[2047,2047]},"mbms_reg_response":{"type":"integer","r'
+    'evisions":[2047,2047]},"echo_request":{"type":"integer","revisions":[2047,2047]},"fwd_reloc_complete_ack":{"type":"integer","revisions":[2047,2047]},"'
+    'update_mbms_response":{"type":"integer","revisions":[2047,2047]},"create_mbms_request":{"type":"integer","revisions":[2047,2047]},"pdu_notify_rej_resp'
+    'onse":{"type":"integer","revisions":[2047,2047]},"mbms_reg_request":{"type":"integer","revisions":[2047,2047]},"note_ms_response":{"type":"integer","r'
+    'evisions":[2047,2047]},"create_pdp_request":{"type":"integer","revisions":[2047,2047]},"send_route_request":{"type":"integer","revisions":[2047,2047]}'
+    ',"mbms_notify_rej_response":{"type":"integer","revisions":[2047,2047]},"mbms_ses_stop_response":{"type":"integer","revisions":[2047,2047]},"send_route'
+    '_response":{"type":"integer","revisions":[2047,2047]},"mbms_ses_start_request":{"type":"integer","revisions":[2047,2047]},"error_indication":{"type":"'
+    'integer","revisions":[2047,2047]},"mbms_notify_request":{"type":"integer","revisions":[2047,2047]},"mbms_de_reg_request":{"type":"integer","revisions"'
+    ':[2047,2047]},"mbms_ses_stop_request":{"type":"integer","revisions":[2047,2047]},"delete_pdp_request":{"type":"integer","revisions":[2047,2047]},"ran_'
+    'info":{"type":"integer","revisions":[2047,2047]},"delete_pdp_response":{"type":"integer","revisions":[2047,2047]},"relocation_cancel_response":{"type"'
+    ':"integer","revisions":[2047,2047]},"note_ms_request":{"type":"integer","revisions":[2047,2047]},"fwd_relocation_complete":{"type":"integer","revision'
+    's":[2047,2047]},"failure_report_response":{"type":"integer","revisions":[2047,2047]},"mbms_notify_response":{"type":"integer","revisions":[2047,2047]}'
+    ',"pdu_notify_rej_request":{"type":"integer","revisions":[2047,2047]},"fwd_srns_context":{"type":"integer","revisions":[2047,2047]},"version_not_suppor'
+    't":{"type":"integer","revisions":[2047,2047]},"mbms_notify_rej_request":{"type":"integer","revisions":[2047,2047]},"delete_mbms_response":{"type":"int'
+    'eger","revisions":[2047,2047]},"delete_aa_pdp_response":{"type":"integer","revisions":[2047,2047]},"fwd_srns_context_ack":{"type":"integer","revisions'
+    '":[2047,2047]},"sgsn_context_response":{"type":"integer","revisions":[2047,2047]},"failure_report_request":{"type":"integer","revisions":[2047,2047]},'
+    '"sgsn_context_request":{"type":"integer","revisions":[2047,2047]},"pdu_notify_response":{"type":"integer","revisions":[2047,2047]},"mbms_de_reg_respon'
+    'se":{"type":"integer","revisions":[2047,2047]},"update_mbms_request":{"type":"integer","revisions":[2047,2047]},"sgsn_context_ack":{"type":"integer","'
+    'revisions":[2047,2047]}},"revisions":[2047,2047]},"log_msisdn_prefix":{"type":"string","revisions":[2047,2047]},"ie_white_list_v2":{"type":"string","r'
+    'evisions":[2047,1023]},"invalid_reserved_field":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"message_rate_limit_v2":{"type":"dict","children":{"delete_session_request":{"type":"integer","revisions":[2047,204'
+    '7]},"echo_request":{"type":"integer","revisions":[2047,2047]},"create_session_request":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2'
+    '047]},"authorized_sgsns6":{"type":"string","revisions":[1920,1664]},"message_rate_limit_v0":{"type":"dict","children":{"create_pdp_request":{"type":"i'
+    'nteger","revisions":[2047,2047]},"delete_pdp_request":{"type":"integer","revisions":[2047,2047]},"echo_request":{"type":"integer","revisions":[2047,20'
+    '47]}},"revisions":[2047,2047]},"message_rate_limit_v1":{"type":"dict","children":{"create_pdp_request":{"type":"integer","revisions":[2047,2047]},"del'
+    'ete_pdp_request":{"type":"integer","revisions":[2047,2047]},"echo_request":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"log_f'
+    'req":{"type":"integer","revisions":[2047,2047]},"ie_validation":{"type":"dict","children":{"gsn_addr":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ms_tzone":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"nsapi":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"msisdn":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"selection_mode":{"type":"string","options":[{"value":"e'
+    'nable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"uli":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rat_type":{"type":"string","options":[{"value":"en'
+    'able","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"end_user_addr":{"type":"string","options":[{"val'
+    'ue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rai":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"charging_gateway_addr":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pdp_context":{"type":"string"'
+    ',"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"charging_ID":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"reordering_required'
+    '":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"imei":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"mm_conte'
+    'xt":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"qos_'
+    'profile":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"apn_restriction":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[204'
+    '7,2047]},"imsi":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"ms_validated":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]}},"revisions":[2047,2047]},"invalid_sgsns6_to_log":{"type":"string","revisions":[1920,1664]},"remove_if_recovery_differ":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"noip_policy":{"type":"lis'
+    't","children":{"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"start":{"type":"integer","revisions":[2047,2047]},"end":{"type":"integer","revisions":[2047,2047]},"id":{"type":"integer","revisions":[204'
+    '7,2047]},"type":{"type":"string","options":[{"value":"etsi","revisions":[2047,2047]},{"value":"ietf","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '}},"revisions":[2047,2047]},"gtpu_log_freq":{"type":"integer","revisions":[2047,2047]},"unknown_version_action":{"type":"string","options":[{"value":"'
+    'allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"per_apn_shaper":{"type":"list","children":{"rate_l'
+    'imit":{"type":"integer","revisions":[2047,2047]},"version":{"type":"integer","revisions":[2047,2047]},"apn":{"type":"string","revisions":[2047,2047]},'
+    '"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"forwarded_log":{"type":"string","options":[{"value":"enable","revisions":[2'
+    '047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip_filter":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"min_message_length":{"type":"integer","revisions":[2047,2047]},"g'
+    'lobal_tunnel_limit":{"type":"string","revisions":[2047,2047]},"out_of_state_message":{"type":"string","options":[{"value":"allow","revisions":[2047,20'
+    '47]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"half_close_timeout":{"type":"integer","revisions":[2047,2047]},"default_imsi_'
+    'action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"remo'
+    've_if_echo_expires":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"tunnel_limit_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"default_ip_action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"ie_white_list_v0v1":{"type":"string","revisions":[2047,1023]},"default_policy_action":{"type":"string","options":[{"value'
+    '":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"send_delete_when_timeout_v2":{"type":"string","'
+    'options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"default_apn_action":{"type'
+    '":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"handover_group6":{'
+    '"type":"string","revisions":[1920,1664]},"authorized_sgsns":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ie_allow_list_v2":{"type":"str","required":false},"user_plane_message_rate_limit":{"type":"int","required"'
+    ':false},"log_imsi_prefix":{"type":"str","required":false},"miss_must_ie":{"type":"str","required":false,"choices":["allow","deny"]},"interface_notify"'
+    ':{"type":"str","required":false},"handover_group":{"type":"str","required":false},"control_plane_message_rate_limit":{"type":"int","required":false},"'
+    'message_filter_v2":{"type":"str","required":false},"rate_limit_mode":{"type":"str","required":false,"choices":["per-profile","per-stream","per-apn"]},'
+    '"policy":{"type":"list","required":false,"options":{"imsi_prefix":{"type":"str","required":false},"msisdn":{"type":"str","required":false},"rat_type":'
+    '{"type":"list","required":false},"id":{"type":"int","required":false},"messages":{"type":"list","required":false,"choices":["create-req","create-res",'
+    '"update-req","update-res"]},"imei":{"type":"str","required":false},"rai":{"type":"str","required":false},"max_apn_restriction":{"type":"str","required'
+    '":false,"choices":["all","public-1","public-2","private-1","private-2"]},"apn_sel_mode":{"type":"list","required":false,"choices":["ms","net","vrf"]},'
+    '"uli":{"type":"str","required":false},"apnmember":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"msisdn_prefix":'
+    '{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["allow","deny"]},"imsi":{"type":"str","required":false}}},"tunnel_t'
+    'imeout":{"type":"int","required":false},"gtpu_denied_log":{"type":"str","required":false,"choices":["enable","disable"]},"ie_remove_policy":{"type":"l'
+    'ist","required":false,"options":{"sgsn_addr":{"type":"str","required":false},"remove_ies":{"type":"list","required":false,"choices":["apn-restriction"'
+    ',"rat-type","rai","uli","imei"]},"id":{"type":"int","required":false},"sgsn_addr6":{"type":"str","required":false}}},"apn_filter":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"noip_filter":{"type":"str","required":false,"choices":["enable","di'
+    'sable"]},"ie_allow_list_v0v1":{"type":"str","required":false},"sub_second_sampling":{"type":"str","required":false,"choices":["enable","disable"]},"de'
+    'nied_log":{"type":"str","required":false,"choices":["enable","disable"]},"context_id":{"type":"int","required":false},"out_of_state_ie":{"type":"str",'
+    '"required":false,"choices":["allow","deny"]},"half_open_timeout":{"type":"int","required":false},"warning_threshold":{"type":"int","required":false},"'
+    'policy_v2":{"type":"list","required":false,"options":{"imsi_prefix":{"type":"str","required":false},"rat_type":{"type":"list","required":false},"messa'
+    'ges":{"type":"list","required":false,"choices":["create-ses-req","create-ses-res","modify-bearer-req","modify-bearer-res"]},"mei":{"type":"str","requi'
+    'red":false},"max_apn_restriction":{"type":"str","required":false,"choices":["all","public-1","public-2","private-1","private-2"]},"apnmember":{"type":'
+    '"list","required":false,"options":{"name":{"type":"str","required":false}}},"uli":{"type":"str","required":false},"action":{"type":"str","required":fa'
+    'lse,"choices":["allow","deny"]},"apn_sel_mode":{"type":"list","required":false,"choices":["ms","net","vrf"]},"msisdn_prefix":{"type":"str","required":'
+    'false},"id":{"type":"int","required":false}}},"send_delete_when_timeout":{"type":"str","required":false,"choices":["enable","disable"]},"default_noip_'
+    'action":{"type":"str","required":false,"choices":["allow","deny"]},"spoof_src_addr":{"type":"str","required":false,"choices":["allow","deny"]},"imsi":'
+    '{"type":"list","required":false,"options":{"selection_mode":{"type":"list","required":false,"choices":["ms","net","vrf"]},"action":{"type":"str","requ'
+    'ired":false,"choices":["allow","deny"]},"apnmember":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"mcc_mnc":{"ty'
+    'pe":"str","required":false},"msisdn_prefix":{"type":"str","required":false},"id":{"type":"int","required":false}}},"rate_limited_log":{"type":"str","r'
+    'equired":false,"choices":["enable","disable"]},"max_message_length":{"type":"int","required":false},"extension_log":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"echo_request_interval":{"type":"int","required":false},"monitor_mode":{"type":"str","required":false},"addr_notify":{"ty'
+    'pe":"str","required":false},"log_gtpu_limit":{"type":"int","required":false},"reserved_ie":{"type":"str","required":false,"choices":["allow","deny"]},'
+    '"state_invalid_log":{"type":"str","required":false,"choices":["enable","disable"]},"message_filter_v0v1":{"type":"str","required":false},"authorized_g'
+    'gsns":{"type":"str","required":false},"port_notify":{"type":"int","required":false},"gtp_in_gtp":{"type":"str","required":false,"choices":["allow","de'
+    'ny"]},"comment":{"type":"str","required":false},"invalid_sgsns_to_log":{"type":"str","required":false},"apn":{"type":"list","required":false,"options"'
+    ':{"apnmember":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"action":{"type":"str","required":false,"choices":["'
+    'allow","deny"]},"selection_mode":{"type":"list","required":false,"choices":["ms","net","vrf"]},"id":{"type":"int","required":false}}},"rate_sampling_i'
+    'nterval":{"type":"int","required":false},"authorized_ggsns6":{"type":"str","required":false},"traffic_count_log":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"ip_policy":{"type":"list","required":false,"options":{"srcaddr6":{"type":"str","required":false},"dstaddr6":{"type":"str","'
+    'required":false},"srcaddr":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["allow","deny"]},"dstaddr":{"type":"str"'
+    ',"required":false},"id":{"type":"int","required":false}}},"gtpu_forwarded_log":{"type":"str","required":false,"choices":["enable","disable"]},"ie_remo'
+    'ver":{"type":"str","required":false,"choices":["enable","disable"]},"policy_filter":{"type":"str","required":false,"choices":["enable","disable"]},"su'
+    'b_second_interval":{"type":"str","required":false,"choices":["0.5","0.25","0.1"]},"tunnel_limit":{"type":"int","required":false},"imsi_filter":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]},"message_rate_limit":{"type":"dict","required":false,"options":{"identification_request":{"typ'
+    'e":"int","required":false},"pdu_notify_request":{"type":"int","required":false},"update_pdp_response":{"type":"int","required":false},"fwd_relocation_'
+    'request":{"type":"int","required":false},"identification_response":{"type":"int","required":false},"support_ext_hdr_notify":{"type":"int","required":f'
+    'alse},"delete_aa_pdp_request":{"type":"int","required":false},"update_pdp_request":{"type":"int","required":false},"delete_mbms_request":{"type":"int"'
+    ',"required":false},"fwd_relocation_response":{"type":"int","required":false},"create_pdp_response":{"type":"int","required":false},"mbms_ses_start_res'
+    'ponse":{"type":"int","required":false},"g_pdu":{"type":"int","required":false},"create_aa_pdp_response":{"type":"int","required":false},"create_mbms_r'
+    'esponse":{"type":"int","required":false},"echo_reponse":{"type":"int","required":false},"create_aa_pdp_request":{"type":"int","required":false},"reloc'
+    'ation_cancel_request":{"type":"int","required":false},"mbms_reg_response":{"type":"int","required":false},"echo_request":{"type":"int","required":fals'
+    'e},"fwd_reloc_complete_ack":{"type":"int","required":false},"update_mbms_response":{"type":"int","required":false},"create_mbms_request":{"type":"int"'
+    ',"required":false},"pdu_notify_rej_response":{"type":"int","required":false},"mbms_reg_request":{"type":"int","required":false},"note_ms_response":{"t'
+    'ype":"int","required":false},"create_pdp_request":{"type":"int","required":false},"send_route_request":{"type":"int","required":false},"mbms_notify_re'
+    'j_response":{"type":"int","required":false},"mbms_ses_stop_response":{"type":"int","required":false},"send_route_response":{"type":"int","required":fa'
+    'lse},"mbms_ses_start_request":{"type":"int","required":false},"error_indication":{"type":"int","required":false},"mbms_notify_request":{"type":"int","'
+    'required":false},"mbms_de_reg_request":{"type":"int","required":false},"mbms_ses_stop_request":{"type":"int","required":false},"delete_pdp_request":{"'
+    'type":"int","required":false},"ran_info":{"type":"int","required":false},"delete_pdp_response":{"type":"int","required":false},"relocation_cancel_resp'
+    'onse":{"type":"int","required":false},"note_ms_request":{"type":"int","required":false},"fwd_relocation_complete":{"type":"int","required":false},"fai'
+    'lure_report_response":{"type":"int","required":false},"mbms_notify_response":{"type":"int","required":false},"pdu_notify_rej_request":{"type":"int","r'
+    'equired":false},"fwd_srns_context":{"type":"int","required":false},"version_not_support":{"type":"int","required":false},"mbms_notify_rej_request":{"t'
+    'ype":"int","required":false},"delete_mbms_response":{"type":"int","required":false},"delete_aa_pdp_response":{"type":"int","required":false},"fwd_srns'
+    '_context_ack":{"type":"int","required":false},"sgsn_context_response":{"type":"int","required":false},"failure_report_request":{"type":"int","required'
+    '":false},"sgsn_context_request":{"type":"int","required":false},"pdu_notify_response":{"type":"int","required":false},"mbms_de_reg_response":{"type":"'
+    'int","required":false},"update_mbms_request":{"type":"int","required":false},"sgsn_context_ack":{"type":"int","required":false}}},"log_msisdn_prefix":'
+    '{"type":"str","required":false},"ie_white_list_v2":{"type":"str","required":false},"invalid_reserved_field":{"type":"str","required":false,"choices":['
+    '"allow","deny"]},"message_rate_limit_v2":{"type":"dict","required":false,"options":{"delete_session_request":{"type":"int","required":false},"echo_req'
+    'uest":{"type":"int","required":false},"create_session_request":{"type":"int","required":false}}},"authorized_sgsns6":{"type":"str","required":false},"'
+    'message_rate_limit_v0":{"type":"dict","required":false,"options":{"create_pdp_request":{"type":"int","required":false},"delete_pdp_request":{"type":"i'
+    'nt","required":false},"echo_request":{"type":"int","required":false}}},"message_rate_limit_v1":{"type":"dict","required":false,"options":{"create_pdp_'
+    'request":{"type":"int","required":false},"delete_pdp_request":{"type":"int","required":false},"echo_request":{"type":"int","required":false}}},"log_fr'
+    'eq":{"type":"int","required":false},"ie_validation":{"type":"dict","required":false,"options":{"gsn_addr":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"ms_tzone":{"type":"str","required":false,"choices":["enable","disable"]},"nsapi":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"msisdn":{"type":"str","required":false,"choices":["enable","disable"]},"selection_mode":{"type":"str","required":false,"choices":["enab'
+    'le","disable"]},"uli":{"type":"str","required":false,"choices":["enable","disable"]},"rat_type":{"type":"str","required":false,"choices":["enable","di'
+    'sable"]},"end_user_addr":{"type":"str","required":false,"choices":["enable","disable"]},"rai":{"type":"str","required":false,"choices":["enable","disa'
+    'ble"]},"charging_gateway_addr":{"type":"str","required":false,"choices":["enable","disable"]},"pdp_context":{"type":"str","required":false,"choices":['
+    '"enable","disable"]},"charging_ID":{"type":"str","required":false,"choices":["enable","disable"]},"reordering_required":{"type":"str","required":false'
+    ',"choices":["enable","disable"]},"imei":{"type":"str","required":false,"choices":["enable","disable"]},"mm_context":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"qos_profile":{"type":"str","required":false,"choices":["enable","disable"]},"apn_restriction":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"imsi":{"type":"str","required":false,"choices":["enable","disable"]},"ms_validated":{"type":"str","required":fal'
+    'se,"choices":["enable","disable"]}}},"invalid_sgsns6_to_log":{"type":"str","required":false},"remove_if_recovery_differ":{"type":"str","required":fals'
+    'e,"choices":["enable","disable"]},"noip_policy":{"type":"list","required":false,"options":{"action":{"type":"str","required":false,"choices":["allow",'
+    '"deny"]},"start":{"type":"int","required":false},"end":{"type":"int","required":false},"id":{"type":"int","required":false},"type":{"type":"str","requ'
+    'ired":false,"choices":["etsi","ietf"]}}},"gtpu_log_freq":{"type":"int","required":false},"unknown_version_action":{"type":"str","required":false,"choi'
+    'ces":["allow","deny"]},"per_apn_shaper":{"type":"list","required":false,"options":{"rate_limit":{"type":"int","required":false},"version":{"type":"int'
+    '","required":false},"apn":{"type":"str","required":false},"id":{"type":"int","required":false}}},"forwarded_log":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"ip_filter":{"type":"str","required":false,"choices":["enable","disable"]},"min_message_length":{"type":"int","required":fal'
+    'se},"global_tunnel_limit":{"type":"str","required":false},"out_of_state_message":{"type":"str","required":false,"choices":["allow","deny"]},"half_clos'
+    'e_timeout":{"type":"int","required":false},"default_imsi_action":{"type":"str","required":false,"choices":["allow","deny"]},"remove_if_echo_expires":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"tunnel_limit_log":{"type":"str","required":false,"choices":["enable","disable"]},"defau'
+    'lt_ip_action":{"type":"str","required":false,"choices":["allow","deny"]},"ie_white_list_v0v1":{"type":"str","required":false},"default_policy_action":'
+    '{"type":"str","required":false,"choices":["allow","deny"]},"send_delete_when_timeout_v2":{"type":"str","required":false,"choices":["enable","disable"]'
+    '},"default_apn_action":{"type":"str","required":false,"choices":["allow","deny"]},"handover_group6":{"type":"str","required":false},"authorized_sgsns"'
+    ':{"type":"str","required":false}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"rule":{"type":"list","children":{"device":{"type":"string","revisions":[2'
+    '047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"groups":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revi'
+    'sions":[2047,2047]},"gateway":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]}'
+    '},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"rule":{"type":"list","required":false,"options":{"device":{"type":"'
+    'str","required":false},"id":{"type":"int","required":false},"groups":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}'
+    '}},"gateway":{"type":"str","required":false}}},"comments":{"type":"str","required":false}}}'
+)
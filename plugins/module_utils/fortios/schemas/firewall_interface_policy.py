@@ -0,0 +1,41 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"spamfilter_profile":{"type":"string","revisions":[2047,7]},"application_list":{"type":"string","revisions":[2047,2047]},"d'
+    'lp_sensor_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[204'
+    '7,2047]},"av_profile":{"type":"string","revisions":[2047,2047]},"dsri":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value"'
+    ':"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"application_list_status":{"type":"string","options":[{"value":"enable","revisions":[204'
+    '7,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"service":{"type":"list","children":{"name":{"type":"string","revisions'
+    '":[2047,2047]}},"revisions":[2047,2047]},"webfilter_profile_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dlp_sensor":{"type":"string","revisions":[2047,2047]},"comments":{"type":"string","revisio'
+    'ns":[2047,2047]},"label":{"type":"string","revisions":[2047,23]},"address_type":{"type":"string","options":[{"value":"ipv4","revisions":[23,23]},{"val'
+    'ue":"ipv6","revisions":[23,23]}],"revisions":[2047,23]},"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disa'
+    'ble","revisions":[2047,2047]}],"revisions":[2047,2047]},"av_profile_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"v'
+    'alue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"srcaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047'
+    ']}},"revisions":[2047,2047]},"emailfilter_profile":{"type":"string","revisions":[2040,2040]},"policyid":{"type":"integer","revisions":[2047,2047]},"em'
+    'ailfilter_profile_status":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisio'
+    'ns":[2040,2040]},"interface":{"type":"string","revisions":[2047,2047]},"ips_sensor_status":{"type":"string","options":[{"value":"enable","revisions":['
+    '2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"webfilter_profile":{"type":"string","revisions":[2047,2047]},"scan_'
+    'botnet_connections":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value":"block","revisions":[7,7]},{"value":"monitor","revision'
+    's":[7,7]}],"revisions":[2047,7]},"ips_sensor":{"type":"string","revisions":[2047,2047]},"dstaddr":{"type":"list","children":{"name":{"type":"string","'
+    'revisions":[2047,2047]}},"revisions":[2047,2047]},"spamfilter_profile_status":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value'
+    '":"disable","revisions":[7,7]}],"revisions":[2047,7]},"logtraffic":{"type":"string","options":[{"value":"all","revisions":[2047,2047]},{"value":"utm",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"spamfilter_profile":{"type":"str","required":false},"application_list":{"type":"str","required":false},"dl'
+    'p_sensor_status":{"type":"str","required":false,"choices":["enable","disable"]},"av_profile":{"type":"str","required":false},"dsri":{"type":"str","req'
+    'uired":false,"choices":["enable","disable"]},"application_list_status":{"type":"str","required":false,"choices":["enable","disable"]},"service":{"type'
+    '":"list","required":false,"options":{"name":{"type":"str","required":false}}},"webfilter_profile_status":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"dlp_sensor":{"type":"str","required":false},"comments":{"type":"str","required":false},"label":{"type":"str","required":false},"add'
+    'ress_type":{"type":"str","required":false},"status":{"type":"str","required":false,"choices":["enable","disable"]},"av_profile_status":{"type":"str","'
+    'required":false,"choices":["enable","disable"]},"srcaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"emailfi'
+    'lter_profile":{"type":"str","required":false},"policyid":{"type":"int","required":false},"emailfilter_profile_status":{"type":"str","required":false,"'
+    'choices":["enable","disable"]},"interface":{"type":"str","required":false},"ips_sensor_status":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"webfilter_profile":{"type":"str","required":false},"scan_botnet_connections":{"type":"str","required":false},"ips_sensor":{"type":"str","requ'
+    'ired":false},"dstaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"spamfilter_profile_status":{"type":"str","'
+    'required":false},"logtraffic":{"type":"str","required":false,"choices":["all","utm","disable"]}}}'
+)
@@ -0,0 +1,41 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"spamfilter_profile":{"type":"string","revisions":[2047,7]},"application_list":{"type":"string","revisions":[2047,2047]},"d'
+    'lp_sensor_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[204'
+    '7,2047]},"av_profile":{"type":"string","revisions":[2047,2047]},"service6":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}'
+    '},"revisions":[2047,2047]},"dsri":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"application_list_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"webfilter_profile_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"'
+    'disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dlp_sensor":{"type":"string","revisions":[2047,2047]},"comments":{"type":"string","revisi'
+    'ons":[2047,2047]},"label":{"type":"string","revisions":[2047,23]},"address_type":{"type":"string","options":[{"value":"ipv4","revisions":[23,23]},{"va'
+    'lue":"ipv6","revisions":[23,23]}],"revisions":[2047,23]},"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"dis'
+    'able","revisions":[2047,2047]}],"revisions":[2047,2047]},"av_profile_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"'
+    'value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dstaddr6":{"type":"list","children":{"name":{"type":"string","revisions":[2047,20'
+    '47]}},"revisions":[2047,2047]},"emailfilter_profile":{"type":"string","revisions":[2040,2040]},"policyid":{"type":"integer","revisions":[2047,2047]},"'
+    'emailfilter_profile_status":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revis'
+    'ions":[2040,2040]},"interface":{"type":"string","revisions":[2047,2047]},"ips_sensor_status":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"webfilter_profile":{"type":"string","revisions":[2047,2047]},"sca'
+    'n_botnet_connections":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value":"block","revisions":[7,7]},{"value":"monitor","revisi'
+    'ons":[7,7]}],"revisions":[2047,7]},"ips_sensor":{"type":"string","revisions":[2047,2047]},"srcaddr6":{"type":"list","children":{"name":{"type":"string'
+    '","revisions":[2047,2047]}},"revisions":[2047,2047]},"spamfilter_profile_status":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"va'
+    'lue":"disable","revisions":[7,7]}],"revisions":[2047,7]},"logtraffic":{"type":"string","options":[{"value":"all","revisions":[2047,2047]},{"value":"ut'
+    'm","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"spamfilter_profile":{"type":"str","required":false},"application_list":{"type":"str","required":false},"dl'
+    'p_sensor_status":{"type":"str","required":false,"choices":["enable","disable"]},"av_profile":{"type":"str","required":false},"service6":{"type":"list"'
+    ',"required":false,"options":{"name":{"type":"str","required":false}}},"dsri":{"type":"str","required":false,"choices":["enable","disable"]},"applicati'
+    'on_list_status":{"type":"str","required":false,"choices":["enable","disable"]},"webfilter_profile_status":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"dlp_sensor":{"type":"str","required":false},"comments":{"type":"str","required":false},"label":{"type":"str","required":false},"ad'
+    'dress_type":{"type":"str","required":false},"status":{"type":"str","required":false,"choices":["enable","disable"]},"av_profile_status":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]},"dstaddr6":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"email'
+    'filter_profile":{"type":"str","required":false},"policyid":{"type":"int","required":false},"emailfilter_profile_status":{"type":"str","required":false'
+    ',"choices":["enable","disable"]},"interface":{"type":"str","required":false},"ips_sensor_status":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]},"webfilter_profile":{"type":"str","required":false},"scan_botnet_connections":{"type":"str","required":false},"ips_sensor":{"type":"str","re'
+    'quired":false},"srcaddr6":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"spamfilter_profile_status":{"type":"str'
+    '","required":false},"logtraffic":{"type":"str","required":false,"choices":["all","utm","disable"]}}}'
+)
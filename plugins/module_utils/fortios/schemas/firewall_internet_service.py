@@ -0,0 +1,25 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"direction":{"type":"string","options":[{"value":"src","revisions":[2047,2047]},{"value":"dst","revisions":[2047,2047]},{"v'
+    'alue":"both","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"database":{"type":"string","options"'
+    ':[{"value":"isdb","revisions":[2047,2047]},{"value":"irdb","revisions":[2047,2047]}],"revisions":[2047,2047]},"extra_ip_range_number":{"type":"integer'
+    '","revisions":[2040,2040]},"icon_id":{"type":"integer","revisions":[2047,2047]},"sld_id":{"type":"integer","revisions":[2047,127]},"obsolete":{"type":'
+    '"integer","revisions":[2040,2040]},"reputation":{"type":"integer","revisions":[2047,127]},"ip_number":{"type":"integer","revisions":[2040,2040]},"offs'
+    'et":{"type":"integer","revisions":[2047,7]},"entry":{"type":"list","children":{"protocol":{"type":"integer","revisions":[7,7]},"ip_range_number":{"typ'
+    'e":"integer","revisions":[7,7]},"id":{"type":"integer","revisions":[7,7]},"ip_number":{"type":"integer","revisions":[7,7]},"port":{"type":"integer","r'
+    'evisions":[7,7]}},"revisions":[2047,7]},"singularity":{"type":"integer","revisions":[2040,2040]},"ip_range_number":{"type":"integer","revisions":[2040'
+    ',2040]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"direction":{"type":"str","required":false,"choices":["src","dst","both"]},"name":{"type":"str","required":'
+    'false},"database":{"type":"str","required":false,"choices":["isdb","irdb"]},"extra_ip_range_number":{"type":"int","required":false},"icon_id":{"type":'
+    '"int","required":false},"sld_id":{"type":"int","required":false},"obsolete":{"type":"int","required":false},"reputation":{"type":"int","required":fals'
+    'e},"ip_number":{"type":"int","required":false},"offset":{"type":"int","required":false},"entry":{"type":"list","required":false,"options":{"protocol":'
+    '{"type":"int","required":false},"ip_range_number":{"type":"int","required":false},"id":{"type":"int","required":false},"ip_number":{"type":"int","requ'
+    'ired":false},"port":{"type":"int","required":false}}},"singularity":{"type":"int","required":false},"ip_range_number":{"type":"int","required":false},'
+    '"id":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2040,2040]},"entry":{"type":"list","children":{"port_range":{"type":"list","childre'
+    'n":{"end_port":{"type":"integer","revisions":[2040,2040]},"start_port":{"type":"integer","revisions":[2040,2040]},"id":{"type":"integer","revisions":['
+    '2040,2040]}},"revisions":[2040,2040]},"protocol":{"type":"integer","revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revision'
+    's":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entry":{"type":"list","required":false,"options":{"port_range":{'
+    '"type":"list","required":false,"options":{"end_port":{"type":"int","required":false},"start_port":{"type":"int","required":false},"id":{"type":"int","'
+    'required":false}}},"protocol":{"type":"int","required":false},"id":{"type":"int","required":false}}},"id":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,12 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"append_port":{"type":"integer","revisions":[2024,2024]},"match_port":{"type":"integer","revisions":[2024,2024]}},"revision'
+    's":[2024,2024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"append_port":{"type":"int","required":false},"match_port":{"type":"int","required":false}}}'
+)
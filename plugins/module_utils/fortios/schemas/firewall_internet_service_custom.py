@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"master_service_id":{"'
+    'type":"integer","revisions":[2047,7]},"disable_entry":{"type":"list","children":{"port":{"type":"integer","revisions":[7,7]},"protocol":{"type":"integ'
+    'er","revisions":[7,7]},"ip_range":{"type":"list","children":{"start_ip":{"type":"string","revisions":[7,7]},"end_ip":{"type":"string","revisions":[7,7'
+    ']},"id":{"type":"integer","revisions":[7,7]}},"revisions":[7,7]},"id":{"type":"integer","revisions":[7,7]}},"revisions":[2047,7]},"reputation":{"type"'
+    ':"integer","revisions":[2040,2040]},"entry":{"type":"list","children":{"port_range":{"type":"list","children":{"end_port":{"type":"integer","revisions'
+    '":[2047,2047]},"start_port":{"type":"integer","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"dst"'
+    ':{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"protocol":{"type":"integer","revisions":[2047,'
+    '2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"name":{"type":"str","required":false},"master_service_id":{"type'
+    '":"int","required":false},"disable_entry":{"type":"list","required":false,"options":{"port":{"type":"int","required":false},"protocol":{"type":"int","'
+    'required":false},"ip_range":{"type":"list","required":false,"options":{"start_ip":{"type":"str","required":false},"end_ip":{"type":"str","required":fa'
+    'lse},"id":{"type":"int","required":false}}},"id":{"type":"int","required":false}}},"reputation":{"type":"int","required":false},"entry":{"type":"list"'
+    ',"required":false,"options":{"port_range":{"type":"list","required":false,"options":{"end_port":{"type":"int","required":false},"start_port":{"type":"'
+    'int","required":false},"id":{"type":"int","required":false}}},"dst":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}'
+    '},"protocol":{"type":"int","required":false},"id":{"type":"int","required":false}}}}}'
+)
@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"member":{"type":"list","children":{"name":{"type":"string","revisions"'
+    ':[2047,2047]}},"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"member":{"type":"list","required":false,"options":{"name":{"type'
+    '":"str","required":false}}},"name":{"type":"str","required":false}}}'
+)
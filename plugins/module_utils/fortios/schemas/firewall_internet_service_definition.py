@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"entry":{"type":"list","children":{"port_range":{"type":"list","children":{"end_port":{"type":"integer","revisions":[2040,2'
+    '040]},"start_port":{"type":"integer","revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"category_id":'
+    '{"type":"integer","revisions":[2040,2040]},"protocol":{"type":"integer","revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]},"seq'
+    '_num":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"entry":{"type":"list","required":false,"options":{"port_range":{"type":"list","required":false,"options":{'
+    '"end_port":{"type":"int","required":false},"start_port":{"type":"int","required":false},"id":{"type":"int","required":false}}},"category_id":{"type":"'
+    'int","required":false},"protocol":{"type":"int","required":false},"name":{"type":"str","required":false},"seq_num":{"type":"int","required":false}}},"'
+    'id":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,25 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2040,2040]},"entry":{"type":"list","children":{"port_range":{"type":"list","childre'
+    'n":{"end_port":{"type":"integer","revisions":[2040,2040]},"start_port":{"type":"integer","revisions":[2040,2040]},"id":{"type":"integer","revisions":['
+    '2040,2040]}},"revisions":[2040,2040]},"dst":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"pro'
+    'tocol":{"type":"integer","revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"id":{"type":"integer","re'
+    'visions":[2040,2040]},"disable_entry":{"type":"list","children":{"port_range":{"type":"list","children":{"end_port":{"type":"integer","revisions":[204'
+    '0,2040]},"start_port":{"type":"integer","revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"protocol":'
+    '{"type":"integer","revisions":[2040,2040]},"ip_range":{"type":"list","children":{"start_ip":{"type":"string","revisions":[2040,2040]},"end_ip":{"type"'
+    ':"string","revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,'
+    '2040]}},"revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entry":{"type":"list","required":false,"options":{"port_range":{'
+    '"type":"list","required":false,"options":{"end_port":{"type":"int","required":false},"start_port":{"type":"int","required":false},"id":{"type":"int","'
+    'required":false}}},"dst":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"protocol":{"type":"int","required":false'
+    '},"id":{"type":"int","required":false}}},"id":{"type":"int","required":false},"disable_entry":{"type":"list","required":false,"options":{"port_range":'
+    '{"type":"list","required":false,"options":{"end_port":{"type":"int","required":false},"start_port":{"type":"int","required":false},"id":{"type":"int",'
+    '"required":false}}},"protocol":{"type":"int","required":false},"ip_range":{"type":"list","required":false,"options":{"start_ip":{"type":"str","require'
+    'd":false},"end_ip":{"type":"str","required":false},"id":{"type":"int","required":false}}},"id":{"type":"int","required":false}}}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"member":{"type":"list","children":{"id":{"type":"integer","revisions":'
+    '[2047,127]},"name":{"type":"string","revisions":[1920,1920]}},"revisions":[2047,2047]},"direction":{"type":"string","options":[{"value":"source","revi'
+    'sions":[2040,2040]},{"value":"destination","revisions":[2040,2040]},{"value":"both","revisions":[2040,2040]}],"revisions":[2040,2040]},"name":{"type":'
+    '"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"member":{"type":"list","required":false,"options":{"id":{"type":'
+    '"int","required":false},"name":{"type":"str","required":false}}},"direction":{"type":"str","required":false,"choices":["source","destination","both"]}'
+    ',"name":{"type":"str","required":false}}}'
+)
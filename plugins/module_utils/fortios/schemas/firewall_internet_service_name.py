@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]},"city_id":{"type":"integer","revisions":[1920,1920]},"internet_service_id"'
+    ':{"type":"integer","revisions":[1920,1920]},"country_id":{"type":"integer","revisions":[1920,1920]},"type":{"type":"string","options":[{"value":"defau'
+    'lt","revisions":[1920,1920]},{"value":"location","revisions":[1920,1920]}],"revisions":[1920,1920]},"region_id":{"type":"integer","revisions":[1920,19'
+    '20]}},"revisions":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"city_id":{"type":"int","required":false},"internet_service_id":{"ty'
+    'pe":"int","required":false},"country_id":{"type":"int","required":false},"type":{"type":"str","required":false,"choices":["default","location"]},"regi'
+    'on_id":{"type":"int","required":false}}}'
+)
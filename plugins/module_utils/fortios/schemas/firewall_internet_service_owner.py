@@ -0,0 +1,11 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"id":{"type":"integer","revisions":[2024,2024]},"name":{"type":"string","revisions":[2024,2024]}},"revisions":[2024,2024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"id":{"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
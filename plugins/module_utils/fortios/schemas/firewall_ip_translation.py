@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"startip":{"type":"string","revisions":[2047,2047]},"endip":{"type":"string","revisions":[2047,2047]},"transid":{"type":"in'
+    'teger","revisions":[2047,2047]},"map_startip":{"type":"string","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"SCTP","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"startip":{"type":"str","required":false},"endip":{"type":"str","required":false},"transid":{"type":"int","'
+    'required":false},"map_startip":{"type":"str","required":false},"type":{"type":"str","required":false,"choices":["SCTP"]}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"bindtofw":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"bindthroughfw":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"undefinedhost":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"block","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"bindtofw":{"type":"str","required":false,"choices":["enable","disable"]},"bindthroughfw":{"type":"str","re'
+    'quired":false,"choices":["enable","disable"]},"undefinedhost":{"type":"str","required":false,"choices":["allow","block"]}}}'
+)
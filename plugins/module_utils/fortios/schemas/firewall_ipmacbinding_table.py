@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"mac":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","rev'
+    'isions":[2047,2047]},"seq_num":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"ip":{"type":"str","required":false'
+    '},"mac":{"type":"str","required":false},"name":{"type":"str","required":false},"seq_num":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"permit_any_host":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"endip":{"type":"string","revisions":[2047,2047]},"source_startip":{"type":"string","revisions":[2047,2047]},"star'
+    'tport":{"type":"integer","revisions":[1024,1024]},"endport":{"type":"integer","revisions":[1024,1024]},"startip":{"type":"string","revisions":[2047,20'
+    '47]},"source_endip":{"type":"string","revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions"'
+    ':[2047,2047]},"port_per_user":{"type":"integer","revisions":[1024,1024]},"arp_reply":{"type":"string","options":[{"value":"disable","revisions":[2047,'
+    '2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"associated_interface":{"type":"string","revisions":[2047,2047]},"pba_time'
+    'out":{"type":"integer","revisions":[2047,2047]},"block_size":{"type":"integer","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"o'
+    'verload","revisions":[2047,2047]},{"value":"one-to-one","revisions":[2047,2047]},{"value":"fixed-port-range","revisions":[2047,2047]},{"value":"port-b'
+    'lock-allocation","revisions":[2047,2047]}],"revisions":[2047,2047]},"num_blocks_per_user":{"type":"integer","revisions":[2047,2047]},"arp_intf":{"type'
+    '":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"permit_any_host":{"type":"str","required":false,"choices":["disable","enable"]},"endip":{"type":"str","req'
+    'uired":false},"source_startip":{"type":"str","required":false},"startport":{"type":"int","required":false},"endport":{"type":"int","required":false},"'
+    'startip":{"type":"str","required":false},"source_endip":{"type":"str","required":false},"comments":{"type":"str","required":false},"name":{"type":"str'
+    '","required":false},"port_per_user":{"type":"int","required":false},"arp_reply":{"type":"str","required":false,"choices":["disable","enable"]},"associ'
+    'ated_interface":{"type":"str","required":false},"pba_timeout":{"type":"int","required":false},"block_size":{"type":"int","required":false},"type":{"ty'
+    'pe":"str","required":false,"choices":["overload","one-to-one","fixed-port-range","port-block-allocation"]},"num_blocks_per_user":{"type":"int","requir'
+    'ed":false},"arp_intf":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"startip":{"type":"string","revisions":[2047,2047]},"endip":{"type":"string","revisions":[2047,2047]},"name":{"type":"strin'
+    'g","revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"startip":{"type":"str","required":false},"endip":{"type":"str","required":false},"name":{"type":"str","req'
+    'uired":false},"comments":{"type":"str","required":false}}}'
+)
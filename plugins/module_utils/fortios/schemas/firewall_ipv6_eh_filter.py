@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"dest_opt":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"hop_opt":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"fragment":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"routing_type":{"type":"integer","revisions":[2047,2047]},"auth":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"hdopt_type":{"type":"integer","revisions":[2047,2047]},"routi'
+    'ng":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"no_n'
+    'ext":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"re'
+    'visions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"dest_opt":{"type":"str","required":false,"choices":["enable","disable"]},"hop_opt":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"fragment":{"type":"str","required":false,"choices":["enable","disable"]},"routing_type":{"type":"int","requir'
+    'ed":false},"auth":{"type":"str","required":false,"choices":["enable","disable"]},"hdopt_type":{"type":"int","required":false},"routing":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]},"no_next":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,22 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"dns_protocol":{"type":"string","options":[{"value":"udp","revisions":[1024,1024]},{"value":"tcp","revisions":[1024,1024]}]'
+    ',"revisions":[1024,1024]},"http_match":{"type":"string","revisions":[2047,2047]},"retry":{"type":"integer","revisions":[2047,2047]},"name":{"type":"st'
+    'ring","revisions":[2047,2047]},"interval":{"type":"integer","revisions":[2047,2047]},"port":{"type":"integer","revisions":[2047,2047]},"src_ip":{"type'
+    '":"string","revisions":[1920,1920]},"dns_match_ip":{"type":"string","revisions":[1024,1024]},"timeout":{"type":"integer","revisions":[2047,2047]},"dns'
+    '_request_domain":{"type":"string","revisions":[1024,1024]},"type":{"type":"string","options":[{"value":"ping","revisions":[2047,2047]},{"value":"tcp",'
+    '"revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"passive-sip","revisions":[2047,1023]},{"value":"https","revisions":[2040,2'
+    '040]},{"value":"dns","revisions":[1024,1024]}],"revisions":[2047,2047]},"http_get":{"type":"string","revisions":[2047,2047]},"http_max_redirects":{"ty'
+    'pe":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"dns_protocol":{"type":"str","required":false,"choices":["udp","tcp"]},"http_match":{"type":"str","required'
+    '":false},"retry":{"type":"int","required":false},"name":{"type":"str","required":false},"interval":{"type":"int","required":false},"port":{"type":"int'
+    '","required":false},"src_ip":{"type":"str","required":false},"dns_match_ip":{"type":"str","required":false},"timeout":{"type":"int","required":false},'
+    '"dns_request_domain":{"type":"str","required":false},"type":{"type":"str","required":false},"http_get":{"type":"str","required":false},"http_max_redir'
+    'ects":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"intf":{"type":"string","revisions":[2047,2047]},"uuid":{"type":"string","revisions":[1920,1920]},"service":{"type":"list",'
+    '"children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"schedule":{"type":"string","revisions":[2047,2047]},"dstaddr_n'
+    'egate":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"s'
+    'ervice_negate":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1'
+    '024]},"comments":{"type":"string","revisions":[2047,2047]},"srcaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"rev'
+    'isions":[2047,2047]},"policyid":{"type":"integer","revisions":[2047,2047]},"srcaddr_negate":{"type":"string","options":[{"value":"enable","revisions":'
+    '[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"action":{"type":"string","options":[{"value":"accept","revisions":'
+    '[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"dstaddr":{"type":"list","children":{"name":{"type":"string","revision'
+    's":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"intf":{"type":"str","required":fal'
+    'se},"uuid":{"type":"str","required":false},"service":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"schedule":{"'
+    'type":"str","required":false},"dstaddr_negate":{"type":"str","required":false,"choices":["enable","disable"]},"service_negate":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"comments":{"type":"str","required":false},"srcaddr":{"type":"list","required":false,"options":{"name":{"type"'
+    ':"str","required":false}}},"policyid":{"type":"int","required":false},"srcaddr_negate":{"type":"str","required":false,"choices":["enable","disable"]},'
+    '"action":{"type":"str","required":false,"choices":["accept","deny"]},"dstaddr":{"type":"list","required":false,"options":{"name":{"type":"str","requir'
+    'ed":false}}}}}'
+)
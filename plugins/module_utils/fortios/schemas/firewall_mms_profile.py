@@ -0,0 +1,181 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[127,127]},"mms_antispam_mass_log":{"type":"string","options":[{"value":"enable","re'
+    'visions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"mm1_convert_hex":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"mm4":{"multiple_values":true,"type":"list","options":[{"valu'
+    'e":"avmonitor","revisions":[127,127]},{"value":"oversize","revisions":[127,127]},{"value":"quarantine","revisions":[127,127]},{"value":"scan","revisio'
+    'ns":[127,127]},{"value":"bannedword","revisions":[127,127]},{"value":"fragmail","revisions":[127,127]},{"value":"splice","revisions":[127,127]},{"valu'
+    'e":"carrier-endpoint-bwl","revisions":[127,127]},{"value":"remove-blocked","revisions":[127,127]},{"value":"mms-checksum","revisions":[127,127]}],"rev'
+    'isions":[127,127]},"mm7":{"multiple_values":true,"type":"list","options":[{"value":"avmonitor","revisions":[127,127]},{"value":"oversize","revisions":'
+    '[127,127]},{"value":"quarantine","revisions":[127,127]},{"value":"scan","revisions":[127,127]},{"value":"bannedword","revisions":[127,127]},{"value":"'
+    'chunkedbypass","revisions":[127,127]},{"value":"clientcomfort","revisions":[127,127]},{"value":"servercomfort","revisions":[127,127]},{"value":"carrie'
+    'r-endpoint-bwl","revisions":[127,127]},{"value":"remove-blocked","revisions":[127,127]},{"value":"mms-checksum","revisions":[127,127]}],"revisions":[1'
+    '27,127]},"mmsbwordthreshold":{"type":"integer","revisions":[127,127]},"mm1":{"multiple_values":true,"type":"list","options":[{"value":"avmonitor","rev'
+    'isions":[127,127]},{"value":"oversize","revisions":[127,127]},{"value":"quarantine","revisions":[127,127]},{"value":"scan","revisions":[127,127]},{"va'
+    'lue":"bannedword","revisions":[127,127]},{"value":"chunkedbypass","revisions":[127,127]},{"value":"clientcomfort","revisions":[127,127]},{"value":"ser'
+    'vercomfort","revisions":[127,127]},{"value":"carrier-endpoint-bwl","revisions":[127,127]},{"value":"remove-blocked","revisions":[127,127]},{"value":"m'
+    'ms-checksum","revisions":[127,127]}],"revisions":[127,127]},"mm3":{"multiple_values":true,"type":"list","options":[{"value":"avmonitor","revisions":[1'
+    '27,127]},{"value":"oversize","revisions":[127,127]},{"value":"quarantine","revisions":[127,127]},{"value":"scan","revisions":[127,127]},{"value":"bann'
+    'edword","revisions":[127,127]},{"value":"fragmail","revisions":[127,127]},{"value":"splice","revisions":[127,127]},{"value":"carrier-endpoint-bwl","re'
+    'visions":[127,127]},{"value":"remove-blocked","revisions":[127,127]},{"value":"mms-checksum","revisions":[127,127]}],"revisions":[127,127]},"dupe":{"t'
+    'ype":"list","children":{"status1":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"rev'
+    'isions":[127,127]},"limit3":{"type":"integer","revisions":[127,127]},"status3":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"'
+    'value":"disable","revisions":[127,127]}],"revisions":[127,127]},"status2":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value'
+    '":"disable","revisions":[127,127]}],"revisions":[127,127]},"window3":{"type":"integer","revisions":[127,127]},"window2":{"type":"integer","revisions":'
+    '[127,127]},"window1":{"type":"integer","revisions":[127,127]},"limit2":{"type":"integer","revisions":[127,127]},"action1":{"multiple_values":true,"typ'
+    'e":"list","options":[{"value":"block","revisions":[127,127]},{"value":"archive","revisions":[127,127]},{"value":"log","revisions":[127,127]},{"value":'
+    '"archive-first","revisions":[127,127]},{"value":"alert-notif","revisions":[127,127]}],"revisions":[127,127]},"action3":{"multiple_values":true,"type":'
+    '"list","options":[{"value":"block","revisions":[127,127]},{"value":"archive","revisions":[127,127]},{"value":"log","revisions":[127,127]},{"value":"ar'
+    'chive-first","revisions":[127,127]},{"value":"alert-notif","revisions":[127,127]}],"revisions":[127,127]},"action2":{"multiple_values":true,"type":"li'
+    'st","options":[{"value":"block","revisions":[127,127]},{"value":"archive","revisions":[127,127]},{"value":"log","revisions":[127,127]},{"value":"archi'
+    've-first","revisions":[127,127]},{"value":"alert-notif","revisions":[127,127]}],"revisions":[127,127]},"block_time1":{"type":"integer","revisions":[12'
+    '7,127]},"block_time2":{"type":"integer","revisions":[127,127]},"block_time3":{"type":"integer","revisions":[127,127]},"protocol":{"type":"string","rev'
+    'isions":[127,127]},"limit1":{"type":"integer","revisions":[127,127]}},"revisions":[127,127]},"mm4oversizelimit":{"type":"integer","revisions":[127,127'
+    ']},"replacemsg_group":{"type":"string","revisions":[127,127]},"mms_checksum_log":{"type":"string","options":[{"value":"enable","revisions":[127,127]},'
+    '{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"mm7_outbreak_prevention":{"type":"string","options":[{"value":"disabled","revisions'
+    '":[127,127]},{"value":"files","revisions":[127,127]},{"value":"full-archive","revisions":[127,127]}],"revisions":[127,127]},"bwordtable":{"type":"inte'
+    'ger","revisions":[127,127]},"notification":{"type":"list","children":{"from_in_header":{"type":"string","options":[{"value":"enable","revisions":[127,'
+    '127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"bword_int":{"type":"integer","revisions":[127,127]},"protocol":{"type":"strin'
+    'g","revisions":[127,127]},"msg_type":{"type":"string","options":[{"value":"submit-req","revisions":[127,127]},{"value":"deliver-req","revisions":[127,'
+    '127]}],"revisions":[127,127]},"carrier_endpoint_bwl_int_mode":{"type":"string","options":[{"value":"hours","revisions":[127,127]},{"value":"minutes","'
+    'revisions":[127,127]}],"revisions":[127,127]},"vas_id":{"type":"string","revisions":[127,127]},"file_block_status":{"type":"string","options":[{"value'
+    '":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"msg_protocol":{"type":"string","options":[{"value'
+    '":"mm1","revisions":[127,127]},{"value":"mm3","revisions":[127,127]},{"value":"mm4","revisions":[127,127]},{"value":"mm7","revisions":[127,127]}],"rev'
+    'isions":[127,127]},"carrier_endpoint_bwl_status":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":['
+    '127,127]}],"revisions":[127,127]},"flood_int_mode":{"type":"string","options":[{"value":"hours","revisions":[127,127]},{"value":"minutes","revisions":'
+    '[127,127]}],"revisions":[127,127]},"flood_int":{"type":"integer","revisions":[127,127]},"alert_status":{"type":"string","options":[{"value":"enable","'
+    'revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"tod_window_end":{"type":"string","revisions":[127,127]},"floo'
+    'd_status":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"file'
+    '_block_int":{"type":"integer","revisions":[127,127]},"mmsc_username":{"type":"string","revisions":[127,127]},"virus_int":{"type":"integer","revisions"'
+    ':[127,127]},"mms_checksum_int_mode":{"type":"string","options":[{"value":"hours","revisions":[127,127]},{"value":"minutes","revisions":[127,127]}],"re'
+    'visions":[127,127]},"mmsc_hostname":{"type":"string","revisions":[127,127]},"dupe_int":{"type":"integer","revisions":[127,127]},"mmsc_port":{"type":"i'
+    'nteger","revisions":[127,127]},"bword_int_mode":{"type":"string","options":[{"value":"hours","revisions":[127,127]},{"value":"minutes","revisions":[12'
+    '7,127]}],"revisions":[127,127]},"alert_int_mode":{"type":"string","options":[{"value":"hours","revisions":[127,127]},{"value":"minutes","revisions":[1'
+    '27,127]}],"revisions":[127,127]},"dupe_status":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[12'
+    '7,127]}],"revisions":[127,127]},"mms_checksum_status":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisio'
+    'ns":[127,127]}],"revisions":[127,127]},"virus_status":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisio'
+    'ns":[127,127]}],"revisions":[127,127]},"alert_int":{"type":"integer","revisions":[127,127]},"alert_src_msisdn":{"type":"string","revisions":[127,127]}'
+    ',"days_allowed":{"multiple_values":true,"type":"list","options":[{"value":"sunday","revisions":[127,127]},{"value":"monday","revisions":[127,127]},{"v'
+    'alue":"tuesday","revisions":[127,127]},{"value":"wednesday","revisions":[127,127]},{"value":"thursday","revisions":[127,127]},{"value":"friday","revis'
+    'ions":[127,127]},{"value":"saturday","revisions":[127,127]}],"revisions":[127,127]},"vasp_id":{"type":"string","revisions":[127,127]},"detect_server":'
+    '{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"tod_window_sta'
+    'rt":{"type":"string","revisions":[127,127]},"mmsc_url":{"type":"string","revisions":[127,127]},"mms_checksum_int":{"type":"integer","revisions":[127,1'
+    '27]},"tod_window_duration":{"type":"string","revisions":[127,127]},"rate_limit":{"type":"integer","revisions":[127,127]},"virus_int_mode":{"type":"str'
+    'ing","options":[{"value":"hours","revisions":[127,127]},{"value":"minutes","revisions":[127,127]}],"revisions":[127,127]},"mmsc_password":{"type":"str'
+    'ing","revisions":[127,127]},"file_block_int_mode":{"type":"string","options":[{"value":"hours","revisions":[127,127]},{"value":"minutes","revisions":['
+    '127,127]}],"revisions":[127,127]},"dupe_int_mode":{"type":"string","options":[{"value":"hours","revisions":[127,127]},{"value":"minutes","revisions":['
+    '127,127]}],"revisions":[127,127]},"bword_status":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":['
+    '127,127]}],"revisions":[127,127]},"carrier_endpoint_bwl_int":{"type":"integer","revisions":[127,127]},"user_domain":{"type":"string","revisions":[127,'
+    '127]}},"revisions":[127,127]},"mm7_convert_hex":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[1'
+    '27,127]}],"revisions":[127,127]},"mm3oversizelimit":{"type":"integer","revisions":[127,127]},"mm7comfortinterval":{"type":"integer","revisions":[127,1'
+    '27]},"mm1oversizelimit":{"type":"integer","revisions":[127,127]},"flood":{"type":"list","children":{"status1":{"type":"string","options":[{"value":"en'
+    'able","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"limit3":{"type":"integer","revisions":[127,127]},"stat'
+    'us3":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"status2":'
+    '{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"window3":{"typ'
+    'e":"integer","revisions":[127,127]},"window2":{"type":"integer","revisions":[127,127]},"window1":{"type":"integer","revisions":[127,127]},"limit2":{"t'
+    'ype":"integer","revisions":[127,127]},"action1":{"multiple_values":true,"type":"list","options":[{"value":"block","revisions":[127,127]},{"value":"arc'
+    'hive","revisions":[127,127]},{"value":"log","revisions":[127,127]},{"value":"archive-first","revisions":[127,127]},{"value":"alert-notif","revisions":'
+    '[127,127]}],"revisions":[127,127]},"action3":{"multiple_values":true,"type":"list","options":[{"value":"block","revisions":[127,127]},{"value":"archiv'
+    'e","revisions":[127,127]},{"value":"log","revisions":[127,127]},{"value":"archive-first","revisions":[127,127]},{"value":"alert-notif","revisions":[12'
+    '7,127]}],"revisions":[127,127]},"action2":{"multiple_values":true,"type":"list","options":[{"value":"block","revisions":[127,127]},{"value":"archive",'
+    '"revisions":[127,127]},{"value":"log","revisions":[127,127]},{"value":"archive-first","revisions":[127,127]},{"value":"alert-notif","revisions":[127,1'
+    '27]}],"revisions":[127,127]},"block_time1":{"type":"integer","revisions":[127,127]},"block_time2":{"type":"integer","revisions":[127,127]},"block_time'
+    '3":{"type":"integer","revisions":[127,127]},"protocol":{"type":"string","revisions":[127,127]},"limit1":{"type":"integer","revisions":[127,127]}},"rev'
+    'isions":[127,127]},"mm7_addr_hdr":{"type":"string","revisions":[127,127]},"mms_av_virus_log":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"mms_av_oversize_log":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"carrier_endpoint_prefix_range_min":{"type":"integer","revisions"'
+    ':[127,127]},"mms_carrier_endpoint_filter_log":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127'
+    ',127]}],"revisions":[127,127]},"mm7comfortamount":{"type":"integer","revisions":[127,127]},"notif_msisdn":{"type":"list","children":{"msisdn":{"type":'
+    '"string","revisions":[127,127]},"threshold":{"multiple_values":true,"type":"list","options":[{"value":"flood-thresh-1","revisions":[127,127]},{"value"'
+    ':"flood-thresh-2","revisions":[127,127]},{"value":"flood-thresh-3","revisions":[127,127]},{"value":"dupe-thresh-1","revisions":[127,127]},{"value":"du'
+    'pe-thresh-2","revisions":[127,127]},{"value":"dupe-thresh-3","revisions":[127,127]}],"revisions":[127,127]}},"revisions":[127,127]},"mms_web_content_l'
+    'og":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"mm1_retrie'
+    've_scan":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"mm1_r'
+    'etr_dupe":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"mm1c'
+    'omfortamount":{"type":"integer","revisions":[127,127]},"mm7_addr_source":{"type":"string","options":[{"value":"http-header","revisions":[127,127]},{"v'
+    'alue":"cookie","revisions":[127,127]}],"revisions":[127,127]},"mm7oversizelimit":{"type":"integer","revisions":[127,127]},"avnotificationtable":{"type'
+    '":"integer","revisions":[127,127]},"mms_checksum_table":{"type":"integer","revisions":[127,127]},"outbreak_prevention":{"type":"dict","children":{"ext'
+    'ernal_blocklist":{"type":"string","options":[{"value":"disable","revisions":[120,120]},{"value":"enable","revisions":[120,120]}],"revisions":[120,120]'
+    '},"ftgd_service":{"type":"string","options":[{"value":"disable","revisions":[120,120]},{"value":"enable","revisions":[120,120]}],"revisions":[120,120]'
+    '}},"revisions":[120,120]},"mm1comfortinterval":{"type":"integer","revisions":[127,127]},"name":{"type":"string","revisions":[127,127]},"remove_blocked'
+    '_const_length":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},'
+    '"carrierendpointbwltable":{"type":"integer","revisions":[127,127]},"mm1_addr_hdr":{"type":"string","revisions":[127,127]},"extended_utm_log":{"type":"'
+    'string","revisions":[127,127]},"mms_av_block_log":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":'
+    '[127,127]}],"revisions":[127,127]},"carrier_endpoint_prefix_range_max":{"type":"integer","revisions":[127,127]},"mm3_outbreak_prevention":{"type":"str'
+    'ing","options":[{"value":"disabled","revisions":[127,127]},{"value":"files","revisions":[127,127]},{"value":"full-archive","revisions":[127,127]}],"re'
+    'visions":[127,127]},"mm4_outbreak_prevention":{"type":"string","options":[{"value":"disabled","revisions":[127,127]},{"value":"files","revisions":[127'
+    ',127]},{"value":"full-archive","revisions":[127,127]}],"revisions":[127,127]},"mm1_outbreak_prevention":{"type":"string","options":[{"value":"disabled'
+    '","revisions":[127,127]},{"value":"files","revisions":[127,127]},{"value":"full-archive","revisions":[127,127]}],"revisions":[127,127]},"mms_notificat'
+    'ion_log":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"carri'
+    'er_endpoint_prefix":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,1'
+    '27]},"mm1_addr_source":{"type":"string","options":[{"value":"http-header","revisions":[127,127]},{"value":"cookie","revisions":[127,127]}],"revisions"'
+    ':[127,127]},"carrier_endpoint_prefix_string":{"type":"string","revisions":[127,127]}},"revisions":[127,127]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"mms_antispam_mass_log":{"type":"str","required":false,"choices":'
+    '["enable","disable"]},"mm1_convert_hex":{"type":"str","required":false,"choices":["enable","disable"]},"mm4":{"type":"list","required":false,"choices"'
+    ':["avmonitor","oversize","quarantine","scan","bannedword","fragmail","splice","carrier-endpoint-bwl","remove-blocked","mms-checksum"]},"mm7":{"type":"'
+    'list","required":false,"choices":["avmonitor","oversize","quarantine","scan","bannedword","chunkedbypass","clientcomfort","servercomfort","carrier-end'
+    'point-bwl","remove-blocked","mms-checksum"]},"mmsbwordthreshold":{"type":"int","required":false},"mm1":{"type":"list","required":false,"choices":["avm'
+    'onitor","oversize","quarantine","scan","bannedword","chunkedbypass","clientcomfort","servercomfort","carrier-endpoint-bwl","remove-blocked","mms-check'
+    'sum"]},"mm3":{"type":"list","required":false,"choices":["avmonitor","oversize","quarantine","scan","bannedword","fragmail","splice","carrier-endpoint-'
+    'bwl","remove-blocked","mms-checksum"]},"dupe":{"type":"list","required":false,"options":{"status1":{"type":"str","required":false,"choices":["enable",'
+    '"disable"]},"limit3":{"type":"int","required":false},"status3":{"type":"str","required":false,"choices":["enable","disable"]},"status2":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]},"window3":{"type":"int","required":false},"window2":{"type":"int","required":false},"window1":{"type"'
+    ':"int","required":false},"limit2":{"type":"int","required":false},"action1":{"type":"list","required":false,"choices":["block","archive","log","archiv'
+    'e-first","alert-notif"]},"action3":{"type":"list","required":false,"choices":["block","archive","log","archive-first","alert-notif"]},"action2":{"type'
+    '":"list","required":false,"choices":["block","archive","log","archive-first","alert-notif"]},"block_time1":{"type":"int","required":false},"block_time'
+    '2":{"type":"int","required":false},"block_time3":{"type":"int","required":false},"protocol":{"type":"str","required":false},"limit1":{"type":"int","re'
+    'quired":false}}},"mm4oversizelimit":{"type":"int","required":false},"replacemsg_group":{"type":"str","required":false},"mms_checksum_log":{"type":"str'
+    '","required":false,"choices":["enable","disable"]},"mm7_outbreak_prevention":{"type":"str","required":false,"choices":["disabled","files","full-archiv'
+    'e"]},"bwordtable":{"type":"int","required":false},"notification":{"type":"list","required":false,"options":{"from_in_header":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"bword_int":{"type":"int","required":false},"protocol":{"type":"str","required":false},"msg_type":{"type":"str",'
+    '"required":false,"choices":["submit-req","deliver-req"]},"carrier_endpoint_bwl_int_mode":{"type":"str","required":false,"choices":["hours","minutes"]}'
+    ',"vas_id":{"type":"str","required":false},"file_block_status":{"type":"str","required":false,"choices":["enable","disable"]},"msg_protocol":{"type":"s'
+    'tr","required":false,"choices":["mm1","mm3","mm4","mm7"]},"carrier_endpoint_bwl_status":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"flood_int_mode":{"type":"str","required":false,"choices":["hours","minutes"]},"flood_int":{"type":"int","required":false},"alert_status":{"type":"st'
+    'r","required":false,"choices":["enable","disable"]},"tod_window_end":{"type":"str","required":false},"flood_status":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"file_block_int":{"type":"int","required":false},"mmsc_username":{"type":"str","required":false},"virus_int":{"type":"int'
+    '","required":false},"mms_checksum_int_mode":{"type":"str","required":false,"choices":["hours","minutes"]},"mmsc_hostname":{"type":"str","required":fal'
+    'se},"dupe_int":{"type":"int","required":false},"mmsc_port":{"type":"int","required":false},"bword_int_mode":{"type":"str","required":false,"choices":['
+    '"hours","minutes"]},"alert_int_mode":{"type":"str","required":false,"choices":["hours","minutes"]},"dupe_status":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"mms_checksum_status":{"type":"str","required":false,"choices":["enable","disable"]},"virus_status":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]},"alert_int":{"type":"int","required":false},"alert_src_msisdn":{"type":"str","required":false},"days_allowed":{'
+    '"type":"list","required":false,"choices":["sunday","monday","tuesday","wednesday","thursday","friday","saturday"]},"vasp_id":{"type":"str","required":'
+    'false},"detect_server":{"type":"str","required":false,"choices":["enable","disable"]},"tod_window_start":{"type":"str","required":false},"mmsc_url":{"'
+    'type":"str","required":false},"mms_checksum_int":{"type":"int","required":false},"tod_window_duration":{"type":"str","required":false},"rate_limit":{"'
+    'type":"int","required":false},"virus_int_mode":{"type":"str","required":false,"choices":["hours","minutes"]},"mmsc_password":{"type":"str","required":'
+    'false},"file_block_int_mode":{"type":"str","required":false,"choices":["hours","minutes"]},"dupe_int_mode":{"type":"str","required":false,"choices":["'
+    'hours","minutes"]},"bword_status":{"type":"str","required":false,"choices":["enable","disable"]},"carrier_endpoint_bwl_int":{"type":"int","required":f'
+    'alse},"user_domain":{"type":"str","required":false}}},"mm7_convert_hex":{"type":"str","required":false,"choices":["enable","disable"]},"mm3oversizelim'
+    'it":{"type":"int","required":false},"mm7comfortinterval":{"type":"int","required":false},"mm1oversizelimit":{"type":"int","required":false},"flood":{"'
+    'type":"list","required":false,"options":{"status1":{"type":"str","required":false,"choices":["enable","disable"]},"limit3":{"type":"int","required":fa'
+    'lse},"status3":{"type":"str","required":false,"choices":["enable","disable"]},"status2":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"window3":{"type":"int","required":false},"window2":{"type":"int","required":false},"window1":{"type":"int","required":false},"limit2":{"type":"int",'
+    '"required":false},"action1":{"type":"list","required":false,"choices":["block","archive","log","archive-first","alert-notif"]},"action3":{"type":"list'
+    '","required":false,"choices":["block","archive","log","archive-first","alert-notif"]},"action2":{"type":"list","required":false,"choices":["block","ar'
+    'chive","log","archive-first","alert-notif"]},"block_time1":{"type":"int","required":false},"block_time2":{"type":"int","required":false},"block_time3"'
+    ':{"type":"int","required":false},"protocol":{"type":"str","required":false},"limit1":{"type":"int","required":false}}},"mm7_addr_hdr":{"type":"str","r'
+    'equired":false},"mms_av_virus_log":{"type":"str","required":false,"choices":["enable","disable"]},"mms_av_oversize_log":{"type":"str","required":false'
+    ',"choices":["enable","disable"]},"carrier_endpoint_prefix_range_min":{"type":"int","required":false},"mms_carrier_endpoint_filter_log":{"type":"str","'
+    'required":false,"choices":["enable","disable"]},"mm7comfortamount":{"type":"int","required":false},"notif_msisdn":{"type":"list","required":false,"opt'
+    'ions":{"msisdn":{"type":"str","required":false},"threshold":{"type":"list","required":false,"choices":["flood-thresh-1","flood-thresh-2","flood-thresh'
+    '-3","dupe-thresh-1","dupe-thresh-2","dupe-thresh-3"]}}},"mms_web_content_log":{"type":"str","required":false,"choices":["enable","disable"]},"mm1_retr'
+    'ieve_scan":{"type":"str","required":false,"choices":["enable","disable"]},"mm1_retr_dupe":{"type":"str","required":false,"choices":["enable","disable"'
+    ']},"mm1comfortamount":{"type":"int","required":false},"mm7_addr_source":{"type":"str","required":false,"choices":["http-header","cookie"]},"mm7oversiz'
+    'elimit":{"type":"int","required":false},"avnotificationtable":{"type":"int","required":false},"mms_checksum_table":{"type":"int","required":false},"ou'
+    'tbreak_prevention":{"type":"dict","required":false,"options":{"external_blocklist":{"type":"str","required":false,"choices":["disable","enable"]},"ftg'
+    'd_service":{"type":"str","required":false,"choices":["disable","enable"]}}},"mm1comfortinterval":{"type":"int","required":false},"name":{"type":"str",'
+    '"required":false},"remove_blocked_const_length":{"type":"str","required":false,"choices":["enable","disable"]},"carrierendpointbwltable":{"type":"int"'
+    ',"required":false},"mm1_addr_hdr":{"type":"str","required":false},"extended_utm_log":{"type":"str","required":false},"mms_av_block_log":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]},"carrier_endpoint_prefix_range_max":{"type":"int","required":false},"mm3_outbreak_prevention":{"type"'
+    ':"str","required":false,"choices":["disabled","files","full-archive"]},"mm4_outbreak_prevention":{"type":"str","required":false,"choices":["disabled",'
+    '"files","full-archive"]},"mm1_outbreak_prevention":{"type":"str","required":false,"choices":["disabled","files","full-archive"]},"mms_notification_log'
+    '":{"type":"str","required":false,"choices":["enable","disable"]},"carrier_endpoint_prefix":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"mm1_addr_source":{"type":"str","required":false,"choices":["http-header","cookie"]},"carrier_endpoint_prefix_string":{"type":"str","required":fal'
+    'se}}}'
+)
@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"subnet":{"type":"string","revisions":[2047,2047]},"name":{"type":"stri'
+    'ng","revisions":[2047,2047]},"color":{"type":"integer","revisions":[2047,2047]},"visibility":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"end_ip":{"type":"string","revisions":[2047,2047]},"tagging":{"type":"l'
+    'ist","children":{"category":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"tags":{"type":"list","children'
+    '":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]},"start_ip":{"type":"string","revisions":[2047,'
+    '2047]},"type":{"type":"string","options":[{"value":"multicastrange","revisions":[2047,2047]},{"value":"broadcastmask","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"associated_interface":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"subnet":{"type":"str","required":false},"name":{"type":"str","re'
+    'quired":false},"color":{"type":"int","required":false},"visibility":{"type":"str","required":false},"end_ip":{"type":"str","required":false},"tagging"'
+    ':{"type":"list","required":false,"options":{"category":{"type":"str","required":false},"name":{"type":"str","required":false},"tags":{"type":"list","r'
+    'equired":false,"options":{"name":{"type":"str","required":false}}}}},"start_ip":{"type":"str","required":false},"type":{"type":"str","required":false,'
+    '"choices":["multicastrange","broadcastmask"]},"associated_interface":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"color":{"type":"integ'
+    'er","revisions":[2047,2047]},"visibility":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127'
+    ']}],"revisions":[2047,127]},"ip6":{"type":"string","revisions":[2047,2047]},"tagging":{"type":"list","children":{"category":{"type":"string","revision'
+    's":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"tags":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"'
+    'revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"name":{"type":"str","required":false},"color":{"type":"int","req'
+    'uired":false},"visibility":{"type":"str","required":false},"ip6":{"type":"str","required":false},"tagging":{"type":"list","required":false,"options":{'
+    '"category":{"type":"str","required":false},"name":{"type":"str","required":false},"tags":{"type":"list","required":false,"options":{"name":{"type":"st'
+    'r","required":false}}}}}}}'
+)
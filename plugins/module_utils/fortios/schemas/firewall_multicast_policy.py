@@ -0,0 +1,28 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"dnat":{"type":"string","revisions":[2047,2047]},"protocol":{"type":"integer","revisions":[2047,2047]},"uuid":{"type":"stri'
+    'ng","revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1664]},"end_port":{"type":"integer","revisions":[2047,2047]},"comments":{"type"'
+    ':"string","revisions":[1920,1920]},"auto_asic_offload":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"srcaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047'
+    ',2047]},"snat_ip":{"type":"string","revisions":[2047,2047]},"dstintf":{"type":"string","revisions":[2047,2047]},"srcintf":{"type":"string","revisions"'
+    ':[2047,2047]},"action":{"type":"string","options":[{"value":"accept","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"start_port":{"type":"integer","revisions":[2047,2047]},"dstaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047'
+    ']}},"revisions":[2047,2047]},"snat":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"logtraffic":{"type":"string","options":[{"value":"enable","revisions":[204'
+    '7,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"dnat":{"type":"str","required":fal'
+    'se},"protocol":{"type":"int","required":false},"uuid":{"type":"str","required":false},"name":{"type":"str","required":false},"end_port":{"type":"int",'
+    '"required":false},"comments":{"type":"str","required":false},"auto_asic_offload":{"type":"str","required":false,"choices":["enable","disable"]},"srcad'
+    'dr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"snat_ip":{"type":"str","required":false},"dstintf":{"type":"s'
+    'tr","required":false},"srcintf":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["accept","deny"]},"start_port":{"ty'
+    'pe":"int","required":false},"dstaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"snat":{"type":"str","requir'
+    'ed":false,"choices":["enable","disable"]},"id":{"type":"int","required":false},"logtraffic":{"type":"str","required":false,"choices":["enable","disabl'
+    'e"]}}}'
+)
@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"protocol":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[1920,1664]},"end_port":{"type":"'
+    'integer","revisions":[2047,2047]},"uuid":{"type":"string","revisions":[1024,1024]},"comments":{"type":"string","revisions":[1024,1024]},"auto_asic_off'
+    'load":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sr'
+    'caddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"dstintf":{"type":"string","revisions":[2'
+    '047,2047]},"srcintf":{"type":"string","revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"accept","revisions":[2047,2047]},{"value'
+    '":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"start_port":{"type":"integer","revisions":[2047,2047]},"dstaddr":{"type":"list","children'
+    '":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"logtraffic":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2'
+    '047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"protocol":{"type":"int","required"'
+    ':false},"name":{"type":"str","required":false},"end_port":{"type":"int","required":false},"uuid":{"type":"str","required":false},"comments":{"type":"s'
+    'tr","required":false},"auto_asic_offload":{"type":"str","required":false,"choices":["enable","disable"]},"srcaddr":{"type":"list","required":false,"op'
+    'tions":{"name":{"type":"str","required":false}}},"dstintf":{"type":"str","required":false},"srcintf":{"type":"str","required":false},"action":{"type":'
+    '"str","required":false,"choices":["accept","deny"]},"start_port":{"type":"int","required":false},"dstaddr":{"type":"list","required":false,"options":{'
+    '"name":{"type":"str","required":false}}},"id":{"type":"int","required":false},"logtraffic":{"type":"str","required":false,"choices":["enable","disable'
+    '"]}}}'
+)
@@ -0,0 +1,210 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"per_ip_shaper":{"type":"string","revisions":[2047,2047]},"email_collect":{"type":"string","options":[{"value":"enable","re'
+    'visions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"voip_profile":{"type":"string","revisions":[2047,2047]},"'
+    'learning_mode":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"dscp_mat'
+    'ch":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"diffserv_reverse":{'
+    '"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"traffic_s'
+    'haper_reverse":{"type":"string","revisions":[2047,2047]},"np_acceleration":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"va'
+    'lue":"disable","revisions":[2047,2047]}],"revisions":[2047,1023]},"uuid":{"type":"string","revisions":[2047,2047]},"vpntunnel":{"type":"string","revis'
+    'ions":[2047,2047]},"dlp_sensor":{"type":"string","revisions":[2047,2047]},"identity_based_route":{"type":"string","revisions":[2047,2047]},"ztna_geo_t'
+    'ag":{"type":"list","children":{"name":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"custom_log_fields":{"type":"list","children'
+    '":{"field_id":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"match_vip_only":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"internet_service_src_negate":{"type":"string","options":[{"'
+    'value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"natip":{"type":"string","revisions":[2'
+    '047,2047]},"srcaddr_negate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"src_vendor_mac":{"type":"list","children":{"id":{"type":"integer","revisions":[1920,1920]}},"revisions":[1920,1920]},"passive_wan_'
+    'health_measurement":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1'
+    '024,1024]},"reputation_direction":{"type":"string","options":[{"value":"source","revisions":[2040,2040]},{"value":"destination","revisions":[2040,2040'
+    ']}],"revisions":[2040,2040]},"fsso_groups":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"emai'
+    'lfilter_profile":{"type":"string","revisions":[2040,2040]},"name":{"type":"string","revisions":[2047,2047]},"internet_service_id":{"type":"list","chil'
+    'dren":{"id":{"type":"integer","revisions":[127,127]}},"revisions":[2047,127]},"ntlm":{"type":"string","options":[{"value":"enable","revisions":[2047,2'
+    '047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"natoutbound":{"type":"string","options":[{"value":"enable","revisions":[2'
+    '047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"internet_service_name":{"type":"list","children":{"name":{"type":"st'
+    'ring","revisions":[1920,1920]}},"revisions":[1920,1920]},"internet_service_group":{"type":"list","children":{"name":{"type":"string","revisions":[2040'
+    ',2040]}},"revisions":[2040,2040]},"internet_service_src_group":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions'
+    '":[2040,2040]},"disclaimer":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"internet_service_src":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"spamfilter_profile":{"type":"string","revisions":[2047,7]},"ssh_filter_profile":{"type":"string","revisions":[2047,2'
+    '047]},"vlan_cos_rev":{"type":"integer","revisions":[2047,2047]},"tcp_session_without_syn":{"type":"string","options":[{"value":"all","revisions":[2047'
+    ',2047]},{"value":"data-only","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"url_category":{"type":"li'
+    'st","children":{"id":{"type":"integer","revisions":[127,127]}},"revisions":[2047,127]},"session_ttl":{"type":"integer","revisions":[2047,2047]},"mms_p'
+    'rofile":{"type":"string","revisions":[2047,127]},"internet_service_negate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"va'
+    'lue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_redirect_addr":{"type":"string","revisions":[2047,2047]},"srcaddr6":{"type":"l'
+    'ist","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"poolname":{"type":"list","children":{"name":{"type":"stri'
+    'ng","revisions":[2047,2047]}},"revisions":[2047,2047]},"ssl_ssh_profile":{"type":"string","revisions":[2047,2047]},"internet_service_src_custom":{"typ'
+    'e":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},'
+    '"label":{"type":"string","revisions":[2047,23]},"wanopt":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"internet_service":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"di'
+    'sable","revisions":[2047,2047]}],"revisions":[2047,2047]},"capture_packet":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"va'
+    'lue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"app_category":{"type":"list","children":{"id":{"type":"integer","revisions":[127,12'
+    '7]}},"revisions":[2047,127]},"profile_type":{"type":"string","options":[{"value":"single","revisions":[2047,2047]},{"value":"group","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"schedule":{"type":"string","revisions":[2047,2047]},"wanopt_profile":{"type":"string","revisions":[2047,2047]},"dsta'
+    'ddr6":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"diffservcode_rev":{"type":"string","revis'
+    'ions":[2047,2047]},"tcp_mss_sender":{"type":"integer","revisions":[2047,2047]},"dstintf":{"type":"list","children":{"name":{"type":"string","revisions'
+    '":[2047,2047]}},"revisions":[2047,2047]},"srcintf":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047'
+    ']},"ssl_mirror_intf":{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}},"revisions":[2047,127]},"dscp_negate":{"type":"string"'
+    ',"options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"auto_asic_offload":{"type":"string","op'
+    'tions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"internet_service_custom_grou'
+    'p":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"file_filter_profile":{"type":"string","revis'
+    'ions":[1920,1920]},"dstaddr_negate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"scan_botnet_connections":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value":"block","revisions":[7'
+    ',7]},{"value":"monitor","revisions":[7,7]}],"revisions":[2047,7]},"match_vip":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{'
+    '"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"internet_service_src_name":{"type":"list","children":{"name":{"type":"string","r'
+    'evisions":[1920,1920]}},"revisions":[1920,1920]},"ssh_policy_redirect":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value"'
+    ':"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"rsso":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"di'
+    'sable","revisions":[127,127]}],"revisions":[2047,127]},"anti_replay":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"'
+    'disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"redirect_url":{"type":"string","revisions":[2047,2047]},"tos":{"type":"string","revisions'
+    '":[2040,2040]},"action":{"type":"string","options":[{"value":"accept","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]},{"value":"ipse'
+    'c","revisions":[2047,2047]}],"revisions":[2047,2047]},"tos_negate":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"di'
+    'sable","revisions":[2040,2040]}],"revisions":[2040,2040]},"logtraffic":{"type":"string","options":[{"value":"all","revisions":[2047,2047]},{"value":"u'
+    'tm","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gtp_profile":{"type":"string","revisions":[2047,10'
+    '23]},"http_policy_redirect":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revis'
+    'ions":[2040,2040]},"groups":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"icap_profile":{"typ'
+    'e":"string","revisions":[2047,2047]},"application_list":{"type":"string","revisions":[2047,2047]},"service_negate":{"type":"string","options":[{"value'
+    '":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"send_deny_packet":{"type":"string","options'
+    '":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"fsso_agent_for_ntlm":{"type":"str'
+    'ing","revisions":[2047,2047]},"webcache":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"ippool":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"service":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"wccp"'
+    ':{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"webprox'
+    'y_profile":{"type":"string","revisions":[2040,2040]},"permit_stun_host":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value'
+    '":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ztna_status":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"'
+    'value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"dnsfilter_profile":{"type":"string","revisions":[2047,2047]},"profile_group":{"ty'
+    'pe":"string","revisions":[2047,2047]},"replacemsg_override_group":{"type":"string","revisions":[2047,2047]},"tcp_mss_receiver":{"type":"integer","revi'
+    'sions":[2047,2047]},"ntlm_enabled_browsers":{"type":"list","children":{"user_agent_string":{"type":"string","revisions":[2047,2047]}},"revisions":[204'
+    '7,2047]},"global_label":{"type":"string","revisions":[2047,23]},"inbound":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"val'
+    'ue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"delay_tcp_npu_session":{"type":"string","options":[{"value":"enable","revisions":[20'
+    '47,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dynamic_shaping":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"srcaddr":{"type":"list","children":{"name":{"type":"string",'
+    '"revisions":[2047,2047]}},"revisions":[2047,2047]},"block_notification":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value'
+    '":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"tos_mask":{"type":"string","revisions":[2040,2040]},"reputation_minimum":{"type":"inte'
+    'ger","revisions":[2040,2040]},"permit_any_host":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"logtraffic_start":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]},"geoip_match":{"type":"string","options":[{"value":"physical-location","revisions":[1920,1920]},{"val'
+    'ue":"registered-location","revisions":[1920,1920]}],"revisions":[1920,1920]},"videofilter_profile":{"type":"string","revisions":[1024,1024]},"webcache'
+    '_https":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"'
+    'ips_sensor":{"type":"string","revisions":[2047,2047]},"devices":{"type":"list","children":{"name":{"type":"string","revisions":[23,23]}},"revisions":['
+    '2047,23]},"radius_mac_auth_bypass":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"internet_service_src_id":{"type":"list","children":{"id":{"type":"integer","revisions":[127,127]}},"revisions":[2047,127]},'
+    '"schedule_timeout":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"ntlm_guest":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"wanopt_passive_opt":{"type":"string","options":[{"value":"default","revisions":[2047,2047]},{"value":"transparent","revisions":[2047,20'
+    '47]},{"value":"non-transparent","revisions":[2047,2047]}],"revisions":[2047,2047]},"traffic_shaper":{"type":"string","revisions":[2047,2047]},"captive'
+    '_portal_exempt":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"diffserv_forward":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"wanopt_detection":{"type":"string","options":[{"value":"active","revisions":[2047,2047]},{"value":"passive","revisions":[2047,2047]}'
+    ',{"value":"off","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_cert":{"type":"string","revisions":[2047,2047]},"rtp_addr":{"type":"list","ch'
+    'ildren":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"natinbound":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"cifs_profile":{"type":"string","revisions":[2040,2040]},"inte'
+    'rnet_service_custom":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"vlan_cos_fwd":{"type":"int'
+    'eger","revisions":[2047,2047]},"fixedport":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"dsri":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"outbound":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"rtp_nat":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"application":{"type":"list","children":{"id":{"type":"integer","revisions":[127,127]}},"revisions":[2047,127]},"ss'
+    'l_mirror":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"geo'
+    'ip_anycast":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040'
+    ']},"nat":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"timeout_send_rst":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"fsso":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127'
+    ']},"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"diffservcode_forward":{"type":"string","revisions":[2047,2047]},"users":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]'
+    '}},"revisions":[2047,2047]},"dscp_value":{"type":"string","revisions":[2047,7]},"utm_status":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"waf_profile":{"type":"string","revisions":[2047,2047]},"decrypted'
+    '_traffic_mirror":{"type":"string","revisions":[1920,1920]},"policyid":{"type":"integer","revisions":[2047,2047]},"firewall_session_dirty":{"type":"str'
+    'ing","options":[{"value":"check-all","revisions":[2047,2047]},{"value":"check-new","revisions":[2047,2047]}],"revisions":[2047,2047]},"wanopt_peer":{"'
+    'type":"string","revisions":[2047,2047]},"dstaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]'
+    '},"webfilter_profile":{"type":"string","revisions":[2047,2047]},"app_group":{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}}'
+    ',"revisions":[2047,127]},"vlan_filter":{"type":"string","revisions":[2047,2047]},"av_profile":{"type":"string","revisions":[2047,2047]},"ztna_ems_tag"'
+    ':{"type":"list","children":{"name":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"poolname6":{"type":"list","children":{"name":{'
+    '"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"auth_path":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},'
+    '{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"wsso":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"va'
+    'lue":"disable","revisions":[127,127]}],"revisions":[2047,127]},"internet_service_src_custom_group":{"type":"list","children":{"name":{"type":"string",'
+    '"revisions":[2040,2040]}},"revisions":[2040,2040]},"webproxy_forward_server":{"type":"string","revisions":[2040,2040]},"profile_protocol_options":{"ty'
+    'pe":"string","revisions":[2047,2047]},"inspection_mode":{"type":"string","options":[{"value":"proxy","revisions":[2040,2040]},{"value":"flow","revisio'
+    'ns":[2040,2040]}],"revisions":[2040,2040]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"per_ip_shaper":{"type":"str","required":false},"email_collect":{"type":"str","required":false,"choices":["'
+    'enable","disable"]},"voip_profile":{"type":"str","required":false},"learning_mode":{"type":"str","required":false},"dscp_match":{"type":"str","require'
+    'd":false},"diffserv_reverse":{"type":"str","required":false,"choices":["enable","disable"]},"traffic_shaper_reverse":{"type":"str","required":false},"'
+    'np_acceleration":{"type":"str","required":false,"choices":["enable","disable"]},"uuid":{"type":"str","required":false},"vpntunnel":{"type":"str","requ'
+    'ired":false},"dlp_sensor":{"type":"str","required":false},"identity_based_route":{"type":"str","required":false},"ztna_geo_tag":{"type":"list","requir'
+    'ed":false,"options":{"name":{"type":"str","required":false}}},"custom_log_fields":{"type":"list","required":false,"options":{"field_id":{"type":"str",'
+    '"required":false}}},"match_vip_only":{"type":"str","required":false,"choices":["enable","disable"]},"internet_service_src_negate":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]},"natip":{"type":"str","required":false},"srcaddr_negate":{"type":"str","required":false,"choices":["enable"'
+    ',"disable"]},"src_vendor_mac":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"passive_wan_health_measurement":{"typ'
+    'e":"str","required":false,"choices":["enable","disable"]},"reputation_direction":{"type":"str","required":false,"choices":["source","destination"]},"f'
+    'sso_groups":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"emailfilter_profile":{"type":"str","required":false},'
+    '"name":{"type":"str","required":false},"internet_service_id":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"ntlm":'
+    '{"type":"str","required":false,"choices":["enable","disable"]},"natoutbound":{"type":"str","required":false,"choices":["enable","disable"]},"internet_'
+    'service_name":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"internet_service_group":{"type":"list","required":f'
+    'alse,"options":{"name":{"type":"str","required":false}}},"internet_service_src_group":{"type":"list","required":false,"options":{"name":{"type":"str",'
+    '"required":false}}},"disclaimer":{"type":"str","required":false,"choices":["enable","disable"]},"internet_service_src":{"type":"str","required":false,'
+    '"choices":["enable","disable"]},"spamfilter_profile":{"type":"str","required":false},"ssh_filter_profile":{"type":"str","required":false},"vlan_cos_re'
+    'v":{"type":"int","required":false},"tcp_session_without_syn":{"type":"str","required":false,"choices":["all","data-only","disable"]},"url_category":{"'
+    'type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"session_ttl":{"type":"int","required":false},"mms_profile":{"type":"s'
+    'tr","required":false},"internet_service_negate":{"type":"str","required":false,"choices":["enable","disable"]},"auth_redirect_addr":{"type":"str","req'
+    'uired":false},"srcaddr6":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"poolname":{"type":"list","required":fals'
+    'e,"options":{"name":{"type":"str","required":false}}},"ssl_ssh_profile":{"type":"str","required":false},"internet_service_src_custom":{"type":"list","'
+    'required":false,"options":{"name":{"type":"str","required":false}}},"comments":{"type":"str","required":false},"label":{"type":"str","required":false}'
+    ',"wanopt":{"type":"str","required":false,"choices":["enable","disable"]},"internet_service":{"type":"str","required":false,"choices":["enable","disabl'
+    'e"]},"capture_packet":{"type":"str","required":false,"choices":["enable","disable"]},"app_category":{"type":"list","required":false,"options":{"id":{"'
+    'type":"int","required":false}}},"profile_type":{"type":"str","required":false,"choices":["single","group"]},"schedule":{"type":"str","required":false}'
+    ',"wanopt_profile":{"type":"str","required":false},"dstaddr6":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"diff'
+    'servcode_rev":{"type":"str","required":false},"tcp_mss_sender":{"type":"int","required":false},"dstintf":{"type":"list","required":false,"options":{"n'
+    'ame":{"type":"str","required":false}}},"srcintf":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"ssl_mirror_intf"'
+    ':{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"dscp_negate":{"type":"str","required":false},"auto_asic_offload"'
+    ':{"type":"str","required":false,"choices":["enable","disable"]},"internet_service_custom_group":{"type":"list","required":false,"options":{"name":{"ty'
+    'pe":"str","required":false}}},"file_filter_profile":{"type":"str","required":false},"dstaddr_negate":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"scan_botnet_connections":{"type":"str","required":false},"match_vip":{"type":"str","required":false,"choices":["enable","disable"]},"in'
+    'ternet_service_src_name":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"ssh_policy_redirect":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"rsso":{"type":"str","required":false},"anti_replay":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]},"redirect_url":{"type":"str","required":false},"tos":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["acc'
+    'ept","deny","ipsec"]},"tos_negate":{"type":"str","required":false,"choices":["enable","disable"]},"logtraffic":{"type":"str","required":false,"choices'
+    '":["all","utm","disable"]},"gtp_profile":{"type":"str","required":false},"http_policy_redirect":{"type":"str","required":false,"choices":["enable","di'
+    'sable"]},"groups":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"icap_profile":{"type":"str","required":false},"'
+    'application_list":{"type":"str","required":false},"service_negate":{"type":"str","required":false,"choices":["enable","disable"]},"send_deny_packet":{'
+    '"type":"str","required":false,"choices":["disable","enable"]},"fsso_agent_for_ntlm":{"type":"str","required":false},"webcache":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"ippool":{"type":"str","required":false,"choices":["enable","disable"]},"service":{"type":"list","required":fa'
+    'lse,"options":{"name":{"type":"str","required":false}}},"wccp":{"type":"str","required":false,"choices":["enable","disable"]},"webproxy_profile":{"typ'
+    'e":"str","required":false},"permit_stun_host":{"type":"str","required":false,"choices":["enable","disable"]},"ztna_status":{"type":"str","required":fa'
+    'lse,"choices":["enable","disable"]},"dnsfilter_profile":{"type":"str","required":false},"profile_group":{"type":"str","required":false},"replacemsg_ov'
+    'erride_group":{"type":"str","required":false},"tcp_mss_receiver":{"type":"int","required":false},"ntlm_enabled_browsers":{"type":"list","required":fal'
+    'se,"options":{"user_agent_string":{"type":"str","required":false}}},"global_label":{"type":"str","required":false},"inbound":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"delay_tcp_npu_session":{"type":"str","required":false,"choices":["enable","disable"]},"dynamic_shaping":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]},"srcaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},'
+    '"block_notification":{"type":"str","required":false,"choices":["enable","disable"]},"tos_mask":{"type":"str","required":false},"reputation_minimum":{"'
+    'type":"int","required":false},"permit_any_host":{"type":"str","required":false,"choices":["enable","disable"]},"logtraffic_start":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]},"geoip_match":{"type":"str","required":false,"choices":["physical-location","registered-location"]},"videof'
+    'ilter_profile":{"type":"str","required":false},"webcache_https":{"type":"str","required":false,"choices":["disable","enable"]},"ips_sensor":{"type":"s'
+    'tr","required":false},"devices":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"radius_mac_auth_bypass":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"internet_service_src_id":{"type":"list","required":false,"options":{"id":{"type":"int","require'
+    'd":false}}},"schedule_timeout":{"type":"str","required":false,"choices":["enable","disable"]},"ntlm_guest":{"type":"str","required":false,"choices":["'
+    'enable","disable"]},"wanopt_passive_opt":{"type":"str","required":false,"choices":["default","transparent","non-transparent"]},"traffic_shaper":{"type'
+    '":"str","required":false},"captive_portal_exempt":{"type":"str","required":false,"choices":["enable","disable"]},"diffserv_forward":{"type":"str","req'
+    'uired":false,"choices":["enable","disable"]},"wanopt_detection":{"type":"str","required":false,"choices":["active","passive","off"]},"auth_cert":{"typ'
+    'e":"str","required":false},"rtp_addr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"natinbound":{"type":"str","'
+    'required":false,"choices":["enable","disable"]},"cifs_profile":{"type":"str","required":false},"internet_service_custom":{"type":"list","required":fal'
+    'se,"options":{"name":{"type":"str","required":false}}},"vlan_cos_fwd":{"type":"int","required":false},"fixedport":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"dsri":{"type":"str","required":false,"choices":["enable","disable"]},"outbound":{"type":"str","required":false,"choices":['
+    '"enable","disable"]},"rtp_nat":{"type":"str","required":false,"choices":["disable","enable"]},"application":{"type":"list","required":false,"options":'
+    '{"id":{"type":"int","required":false}}},"ssl_mirror":{"type":"str","required":false},"geoip_anycast":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"nat":{"type":"str","required":false,"choices":["enable","disable"]},"timeout_send_rst":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"fsso":{"type":"str","required":false},"status":{"type":"str","required":false,"choices":["enable","disable"]},"diffservcode_forward":{'
+    '"type":"str","required":false},"users":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"dscp_value":{"type":"str",'
+    '"required":false},"utm_status":{"type":"str","required":false,"choices":["enable","disable"]},"waf_profile":{"type":"str","required":false},"decrypted'
+    '_traffic_mirror":{"type":"str","required":false},"policyid":{"type":"int","required":false},"firewall_session_dirty":{"type":"str","required":false,"c'
+    'hoices":["check-all","check-new"]},"wanopt_peer":{"type":"str","required":false},"dstaddr":{"type":"list","required":false,"options":{"name":{"type":"'
+    'str","required":false}}},"webfilter_profile":{"type":"str","required":false},"app_group":{"type":"list","required":false,"options":{"name":{"type":"st'
+    'r","required":false}}},"vlan_filter":{"type":"str","required":false},"av_profile":{"type":"str","required":false},"ztna_ems_tag":{"type":"list","requi'
+    'red":false,"options":{"name":{"type":"str","required":false}}},"poolname6":{"type":"list","required":false,"options":{"name":{"type":"str","required":'
+    'false}}},"auth_path":{"type":"str","required":false,"choices":["enable","disable"]},"wsso":{"type":"str","required":false},"internet_service_src_custo'
+    'm_group":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"webproxy_forward_server":{"type":"str","required":false}'
+    ',"profile_protocol_options":{"type":"str","required":false},"inspection_mode":{"type":"str","required":false,"choices":["proxy","flow"]}}}'
+)
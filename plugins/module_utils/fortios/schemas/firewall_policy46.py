@@ -0,0 +1,34 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"per_ip_shaper":{"type":"string","revisions":[2047,2047]},"traffic_shaper":{"type":"string","revisions":[2047,2047]},"ippoo'
+    'l":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"traff'
+    'ic_shaper_reverse":{"type":"string","revisions":[2047,2047]},"fixedport":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"valu'
+    'e":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"uuid":{"type":"string","revisions":[2047,2047]},"service":{"type":"list","children":{'
+    '"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"poolname":{"type":"list","children":{"name":{"type":"string","revisions":['
+    '2047,2047]}},"revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},"dstintf":{"type":"string","revisions":[2047,2047]},"tcp_ms'
+    's_receiver":{"type":"integer","revisions":[2047,2047]},"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"schedule":{"type":"string","revisions":[2047,2047]},"tcp_mss_sender":{"type":"integer","revisi'
+    'ons":[2047,2047]},"srcaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"policyid":{"type":"'
+    'integer","revisions":[2047,2047]},"srcintf":{"type":"string","revisions":[2047,2047]},"permit_any_host":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"logtraffic_start":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"name":{"type":"string","revisions":[1920,166'
+    '4]},"action":{"type":"string","options":[{"value":"accept","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"dstaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"logtraffic":{"type":"string","option'
+    's":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"per_ip_shaper":{"type":"str","required":false},"traffic_shaper":{"type":"str","required":false},"ippool":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"traffic_shaper_reverse":{"type":"str","required":false},"fixedport":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"uuid":{"type":"str","required":false},"service":{"type":"list","required":false,"options":{"name":{"type"'
+    ':"str","required":false}}},"poolname":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"comments":{"type":"str","re'
+    'quired":false},"dstintf":{"type":"str","required":false},"tcp_mss_receiver":{"type":"int","required":false},"status":{"type":"str","required":false,"c'
+    'hoices":["enable","disable"]},"schedule":{"type":"str","required":false},"tcp_mss_sender":{"type":"int","required":false},"srcaddr":{"type":"list","re'
+    'quired":false,"options":{"name":{"type":"str","required":false}}},"policyid":{"type":"int","required":false},"srcintf":{"type":"str","required":false}'
+    ',"permit_any_host":{"type":"str","required":false,"choices":["enable","disable"]},"logtraffic_start":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"name":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["accept","deny"]},"dstaddr":{"type":"list","re'
+    'quired":false,"options":{"name":{"type":"str","required":false}}},"logtraffic":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,117 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"per_ip_shaper":{"type":"string","revisions":[127,127]},"webproxy_forward_server":{"type":"string","revisions":[120,120]},"'
+    'dscp_match":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[127,7]},"diffserv_rev'
+    'erse":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"traffic_'
+    'shaper_reverse":{"type":"string","revisions":[127,127]},"uuid":{"type":"string","revisions":[127,127]},"vpntunnel":{"type":"string","revisions":[127,1'
+    '27]},"dlp_sensor":{"type":"string","revisions":[127,127]},"custom_log_fields":{"type":"list","children":{"field_id":{"type":"string","revisions":[127,'
+    '127]}},"revisions":[127,127]},"voip_profile":{"type":"string","revisions":[127,127]},"np_acceleration":{"type":"string","options":[{"value":"enable","'
+    'revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"fsso_groups":{"type":"list","children":{"name":{"type":"strin'
+    'g","revisions":[120,120]}},"revisions":[120,120]},"emailfilter_profile":{"type":"string","revisions":[120,120]},"name":{"type":"string","revisions":[1'
+    '27,127]},"natoutbound":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[12'
+    '7,127]},"logtraffic":{"type":"string","options":[{"value":"all","revisions":[127,127]},{"value":"utm","revisions":[127,127]},{"value":"disable","revis'
+    'ions":[127,127]}],"revisions":[127,127]},"spamfilter_profile":{"type":"string","revisions":[127,7]},"ssh_filter_profile":{"type":"string","revisions":'
+    '[127,127]},"vlan_cos_rev":{"type":"integer","revisions":[127,127]},"tcp_session_without_syn":{"type":"string","options":[{"value":"all","revisions":[1'
+    '27,127]},{"value":"data-only","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"url_category":{"type":"list","'
+    'children":{"id":{"type":"integer","revisions":[127,127]}},"revisions":[127,127]},"session_ttl":{"type":"integer","revisions":[127,127]},"mms_profile":'
+    '{"type":"string","revisions":[127,127]},"poolname":{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}},"revisions":[127,127]},"'
+    'ssl_ssh_profile":{"type":"string","revisions":[127,127]},"comments":{"type":"string","revisions":[127,127]},"label":{"type":"string","revisions":[127,'
+    '23]},"app_category":{"type":"list","children":{"id":{"type":"integer","revisions":[127,127]}},"revisions":[127,127]},"profile_type":{"type":"string","'
+    'options":[{"value":"single","revisions":[127,127]},{"value":"group","revisions":[127,127]}],"revisions":[127,127]},"schedule":{"type":"string","revisi'
+    'ons":[127,127]},"diffservcode_rev":{"type":"string","revisions":[127,127]},"tcp_mss_sender":{"type":"integer","revisions":[127,127]},"dstintf":{"type"'
+    ':"list","children":{"name":{"type":"string","revisions":[127,127]}},"revisions":[127,127]},"srcaddr_negate":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"ssl_mirror_intf":{"type":"list","children":{"name":{"typ'
+    'e":"string","revisions":[127,127]}},"revisions":[127,127]},"dscp_negate":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"di'
+    'sable","revisions":[7,7]}],"revisions":[127,7]},"auto_asic_offload":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"dis'
+    'able","revisions":[127,127]}],"revisions":[127,127]},"vlan_filter":{"type":"string","revisions":[127,127]},"srcintf":{"type":"list","children":{"name"'
+    ':{"type":"string","revisions":[127,127]}},"revisions":[127,127]},"ssh_policy_redirect":{"type":"string","options":[{"value":"enable","revisions":[120,'
+    '120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"anti_replay":{"type":"string","options":[{"value":"enable","revisions":[120,1'
+    '20]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"action":{"type":"string","options":[{"value":"accept","revisions":[127,127]},{'
+    '"value":"deny","revisions":[127,127]},{"value":"ipsec","revisions":[127,127]}],"revisions":[127,127]},"tos_negate":{"type":"string","options":[{"value'
+    '":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"replacemsg_override_group":{"type":"string","revi'
+    'sions":[127,127]},"http_policy_redirect":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]'
+    '}],"revisions":[120,120]},"groups":{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}},"revisions":[127,127]},"icap_profile":{"'
+    'type":"string","revisions":[127,127]},"application_list":{"type":"string","revisions":[127,127]},"service_negate":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"send_deny_packet":{"type":"string","options":[{"va'
+    'lue":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"webcache":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"ippool":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"service":{"type":"list","children":{"name":{"type":"stri'
+    'ng","revisions":[127,127]}},"revisions":[127,127]},"webproxy_profile":{"type":"string","revisions":[120,120]},"tos":{"type":"string","revisions":[120,'
+    '120]},"dnsfilter_profile":{"type":"string","revisions":[120,120]},"profile_group":{"type":"string","revisions":[127,127]},"tcp_mss_receiver":{"type":"'
+    'integer","revisions":[127,127]},"global_label":{"type":"string","revisions":[127,23]},"inbound":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"srcaddr":{"type":"list","children":{"name":{"type":"string","revisio'
+    'ns":[127,127]}},"revisions":[127,127]},"tos_mask":{"type":"string","revisions":[120,120]},"logtraffic_start":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"webcache_https":{"type":"string","options":[{"value":"d'
+    'isable","revisions":[120,120]},{"value":"enable","revisions":[120,120]}],"revisions":[120,120]},"ips_sensor":{"type":"string","revisions":[127,127]},"'
+    'devices":{"type":"list","children":{"name":{"type":"string","revisions":[23,23]}},"revisions":[127,23]},"rsso":{"type":"string","options":[{"value":"e'
+    'nable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"traffic_shaper":{"type":"string","revisions":[127,127'
+    ']},"diffserv_forward":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127'
+    ',127]},"natinbound":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,1'
+    '27]},"cifs_profile":{"type":"string","revisions":[120,120]},"vlan_cos_fwd":{"type":"integer","revisions":[127,127]},"fixedport":{"type":"string","opti'
+    'ons":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"dsri":{"type":"string","options":[{"'
+    'value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"outbound":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"application":{"type":"list","children":{"id":{"t'
+    'ype":"integer","revisions":[127,127]}},"revisions":[127,127]},"ssl_mirror":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"valu'
+    'e":"disable","revisions":[127,127]}],"revisions":[127,127]},"nat":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disab'
+    'le","revisions":[127,127]}],"revisions":[127,127]},"timeout_send_rst":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"d'
+    'isable","revisions":[127,127]}],"revisions":[127,127]},"status":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable'
+    '","revisions":[127,127]}],"revisions":[127,127]},"diffservcode_forward":{"type":"string","revisions":[127,127]},"users":{"type":"list","children":{"na'
+    'me":{"type":"string","revisions":[127,127]}},"revisions":[127,127]},"dscp_value":{"type":"string","revisions":[127,7]},"utm_status":{"type":"string","'
+    'options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"waf_profile":{"type":"string","r'
+    'evisions":[120,120]},"policyid":{"type":"integer","revisions":[127,127]},"firewall_session_dirty":{"type":"string","options":[{"value":"check-all","re'
+    'visions":[127,127]},{"value":"check-new","revisions":[127,127]}],"revisions":[127,127]},"webfilter_profile":{"type":"string","revisions":[127,127]},"d'
+    'staddr_negate":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},'
+    '"av_profile":{"type":"string","revisions":[127,127]},"dstaddr":{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}},"revisions":'
+    '[127,127]},"app_group":{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}},"revisions":[127,127]},"profile_protocol_options":{"'
+    'type":"string","revisions":[127,127]},"inspection_mode":{"type":"string","options":[{"value":"proxy","revisions":[120,120]},{"value":"flow","revisions'
+    '":[120,120]}],"revisions":[120,120]}},"revisions":[127,127]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"per_ip_shaper":{"type":"str","required":false},"webproxy_forward_server":{"type":"str","required":false},"'
+    'dscp_match":{"type":"str","required":false},"diffserv_reverse":{"type":"str","required":false,"choices":["enable","disable"]},"traffic_shaper_reverse"'
+    ':{"type":"str","required":false},"uuid":{"type":"str","required":false},"vpntunnel":{"type":"str","required":false},"dlp_sensor":{"type":"str","requir'
+    'ed":false},"custom_log_fields":{"type":"list","required":false,"options":{"field_id":{"type":"str","required":false}}},"voip_profile":{"type":"str","r'
+    'equired":false},"np_acceleration":{"type":"str","required":false,"choices":["enable","disable"]},"fsso_groups":{"type":"list","required":false,"option'
+    's":{"name":{"type":"str","required":false}}},"emailfilter_profile":{"type":"str","required":false},"name":{"type":"str","required":false},"natoutbound'
+    '":{"type":"str","required":false,"choices":["enable","disable"]},"logtraffic":{"type":"str","required":false,"choices":["all","utm","disable"]},"spamf'
+    'ilter_profile":{"type":"str","required":false},"ssh_filter_profile":{"type":"str","required":false},"vlan_cos_rev":{"type":"int","required":false},"tc'
+    'p_session_without_syn":{"type":"str","required":false,"choices":["all","data-only","disable"]},"url_category":{"type":"list","required":false,"options'
+    '":{"id":{"type":"int","required":false}}},"session_ttl":{"type":"int","required":false},"mms_profile":{"type":"str","required":false},"poolname":{"typ'
+    'e":"list","required":false,"options":{"name":{"type":"str","required":false}}},"ssl_ssh_profile":{"type":"str","required":false},"comments":{"type":"s'
+    'tr","required":false},"label":{"type":"str","required":false},"app_category":{"type":"list","required":false,"options":{"id":{"type":"int","required":'
+    'false}}},"profile_type":{"type":"str","required":false,"choices":["single","group"]},"schedule":{"type":"str","required":false},"diffservcode_rev":{"t'
+    'ype":"str","required":false},"tcp_mss_sender":{"type":"int","required":false},"dstintf":{"type":"list","required":false,"options":{"name":{"type":"str'
+    '","required":false}}},"srcaddr_negate":{"type":"str","required":false,"choices":["enable","disable"]},"ssl_mirror_intf":{"type":"list","required":fals'
+    'e,"options":{"name":{"type":"str","required":false}}},"dscp_negate":{"type":"str","required":false},"auto_asic_offload":{"type":"str","required":false'
+    ',"choices":["enable","disable"]},"vlan_filter":{"type":"str","required":false},"srcintf":{"type":"list","required":false,"options":{"name":{"type":"st'
+    'r","required":false}}},"ssh_policy_redirect":{"type":"str","required":false,"choices":["enable","disable"]},"anti_replay":{"type":"str","required":fal'
+    'se,"choices":["enable","disable"]},"action":{"type":"str","required":false,"choices":["accept","deny","ipsec"]},"tos_negate":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"replacemsg_override_group":{"type":"str","required":false},"http_policy_redirect":{"type":"str","required":fals'
+    'e,"choices":["enable","disable"]},"groups":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"icap_profile":{"type":'
+    '"str","required":false},"application_list":{"type":"str","required":false},"service_negate":{"type":"str","required":false,"choices":["enable","disabl'
+    'e"]},"send_deny_packet":{"type":"str","required":false,"choices":["enable","disable"]},"webcache":{"type":"str","required":false,"choices":["enable","'
+    'disable"]},"ippool":{"type":"str","required":false,"choices":["enable","disable"]},"service":{"type":"list","required":false,"options":{"name":{"type"'
+    ':"str","required":false}}},"webproxy_profile":{"type":"str","required":false},"tos":{"type":"str","required":false},"dnsfilter_profile":{"type":"str",'
+    '"required":false},"profile_group":{"type":"str","required":false},"tcp_mss_receiver":{"type":"int","required":false},"global_label":{"type":"str","req'
+    'uired":false},"inbound":{"type":"str","required":false,"choices":["enable","disable"]},"srcaddr":{"type":"list","required":false,"options":{"name":{"t'
+    'ype":"str","required":false}}},"tos_mask":{"type":"str","required":false},"logtraffic_start":{"type":"str","required":false,"choices":["enable","disab'
+    'le"]},"webcache_https":{"type":"str","required":false,"choices":["disable","enable"]},"ips_sensor":{"type":"str","required":false},"devices":{"type":"'
+    'list","required":false,"options":{"name":{"type":"str","required":false}}},"rsso":{"type":"str","required":false,"choices":["enable","disable"]},"traf'
+    'fic_shaper":{"type":"str","required":false},"diffserv_forward":{"type":"str","required":false,"choices":["enable","disable"]},"natinbound":{"type":"st'
+    'r","required":false,"choices":["enable","disable"]},"cifs_profile":{"type":"str","required":false},"vlan_cos_fwd":{"type":"int","required":false},"fix'
+    'edport":{"type":"str","required":false,"choices":["enable","disable"]},"dsri":{"type":"str","required":false,"choices":["enable","disable"]},"outbound'
+    '":{"type":"str","required":false,"choices":["enable","disable"]},"application":{"type":"list","required":false,"options":{"id":{"type":"int","required'
+    '":false}}},"ssl_mirror":{"type":"str","required":false,"choices":["enable","disable"]},"nat":{"type":"str","required":false,"choices":["enable","disab'
+    'le"]},"timeout_send_rst":{"type":"str","required":false,"choices":["enable","disable"]},"status":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]},"diffservcode_forward":{"type":"str","required":false},"users":{"type":"list","required":false,"options":{"name":{"type":"str","required":fa'
+    'lse}}},"dscp_value":{"type":"str","required":false},"utm_status":{"type":"str","required":false,"choices":["enable","disable"]},"waf_profile":{"type":'
+    '"str","required":false},"policyid":{"type":"int","required":false},"firewall_session_dirty":{"type":"str","required":false,"choices":["check-all","che'
+    'ck-new"]},"webfilter_profile":{"type":"str","required":false},"dstaddr_negate":{"type":"str","required":false,"choices":["enable","disable"]},"av_prof'
+    'ile":{"type":"str","required":false},"dstaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"app_group":{"type"'
+    ':"list","required":false,"options":{"name":{"type":"str","required":false}}},"profile_protocol_options":{"type":"str","required":false},"inspection_mo'
+    'de":{"type":"str","required":false,"choices":["proxy","flow"]}}}'
+)
@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"icap_profile":{"type":"string","revisions":[2047,2047]},"file_filter_profile":{"type":"string","revisions":[1920,1920]},"w'
+    'ebfilter_profile":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"spamfilter_profile":{"type":"string","re'
+    'visions":[2047,7]},"application_list":{"type":"string","revisions":[2047,2047]},"videofilter_profile":{"type":"string","revisions":[1024,1024]},"dlp_s'
+    'ensor":{"type":"string","revisions":[2047,2047]},"ssl_ssh_profile":{"type":"string","revisions":[2047,2047]},"ips_sensor":{"type":"string","revisions"'
+    ':[2047,2047]},"av_profile":{"type":"string","revisions":[2047,2047]},"emailfilter_profile":{"type":"string","revisions":[2040,2040]},"dnsfilter_profil'
+    'e":{"type":"string","revisions":[2047,2047]},"cifs_profile":{"type":"string","revisions":[2040,2040]},"voip_profile":{"type":"string","revisions":[204'
+    '7,2047]},"mms_profile":{"type":"string","revisions":[2047,127]},"waf_profile":{"type":"string","revisions":[2047,2047]},"profile_protocol_options":{"t'
+    'ype":"string","revisions":[2047,2047]},"ssh_filter_profile":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"icap_profile":{"type":"str","required":false},"file_filter_profile":{"type":"str","required":false},"webfi'
+    'lter_profile":{"type":"str","required":false},"name":{"type":"str","required":false},"spamfilter_profile":{"type":"str","required":false},"application'
+    '_list":{"type":"str","required":false},"videofilter_profile":{"type":"str","required":false},"dlp_sensor":{"type":"str","required":false},"ssl_ssh_pro'
+    'file":{"type":"str","required":false},"ips_sensor":{"type":"str","required":false},"av_profile":{"type":"str","required":false},"emailfilter_profile":'
+    '{"type":"str","required":false},"dnsfilter_profile":{"type":"str","required":false},"cifs_profile":{"type":"str","required":false},"voip_profile":{"ty'
+    'pe":"str","required":false},"mms_profile":{"type":"str","required":false},"waf_profile":{"type":"str","required":false},"profile_protocol_options":{"t'
+    'ype":"str","required":false},"ssh_filter_profile":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,182 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"ftp":{"type":"dict","children":{"status":{"type":"string","options":[{'
+    '"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"oversize_limit":{"type":"integer","re'
+    'visions":[2047,2047]},"stream_based_uncompressed_limit":{"type":"integer","revisions":[1024,1024]},"uncompressed_oversize_limit":{"type":"integer","re'
+    'visions":[2047,2047]},"tcp_window_minimum":{"type":"integer","revisions":[1024,1024]},"ssl_offloaded":{"type":"string","options":[{"value":"no","revis'
+    'ions":[2040,2040]},{"value":"yes","revisions":[2040,2040]}],"revisions":[2040,2040]},"tcp_window_type":{"type":"string","options":[{"value":"system","'
+    'revisions":[1024,1024]},{"value":"static","revisions":[1024,1024]},{"value":"dynamic","revisions":[1024,1024]}],"revisions":[1024,1024]},"ports":{"typ'
+    'e":"integer","revisions":[2047,2047]},"comfort_amount":{"type":"integer","revisions":[2047,2047]},"inspect_all":{"type":"string","options":[{"value":"'
+    'enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"comfort_interval":{"type":"integer","revisions'
+    '":[2047,2047]},"tcp_window_maximum":{"type":"integer","revisions":[1024,1024]},"scan_bzip2":{"type":"string","options":[{"value":"enable","revisions":'
+    '[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"uncompressed_nest_limit":{"type":"integer","revisions":[2047,2047]'
+    '},"options":{"multiple_values":true,"type":"list","options":[{"value":"clientcomfort","revisions":[2047,2047]},{"value":"oversize","revisions":[2047,2'
+    '047]},{"value":"splice","revisions":[2047,2047]},{"value":"bypass-rest-command","revisions":[2047,2047]},{"value":"bypass-mode-command","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"tcp_window_size":{"type":"integer","revisions":[1024,1024]}},"revisions":[2047,2047]},"rpc_over_http":{"type":"s'
+    'tring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"str'
+    'ing","revisions":[2047,2047]},"mapi":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"valu'
+    'e":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"oversize_limit":{"type":"integer","revisions":[2047,2047]},"uncompressed_oversize_lim'
+    'it":{"type":"integer","revisions":[2047,2047]},"ports":{"type":"integer","revisions":[2047,2047]},"scan_bzip2":{"type":"string","options":[{"value":"e'
+    'nable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"uncompressed_nest_limit":{"type":"integer","rev'
+    'isions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":[{"value":"fragmail","revisions":[2047,2047]},{"value":"oversize","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"smtp":{"type":"dict","children":{"status":{"type":"string","options":[{"value'
+    '":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"proxy_after_tcp_handshake":{"type":"string"'
+    ',"options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"oversize_limit":{"type":'
+    '"integer","revisions":[2047,2047]},"uncompressed_oversize_limit":{"type":"integer","revisions":[2047,2047]},"ssl_offloaded":{"type":"string","options"'
+    ':[{"value":"no","revisions":[2040,2040]},{"value":"yes","revisions":[2040,2040]}],"revisions":[2040,2040]},"ports":{"type":"integer","revisions":[2047'
+    ',2047]},"inspect_all":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"scan_bzip2":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"server_busy":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"uncompressed_nest_limit":{"type":"integer","revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":['
+    '{"value":"fragmail","revisions":[2047,2047]},{"value":"oversize","revisions":[2047,2047]},{"value":"splice","revisions":[2047,2047]}],"revisions":[204'
+    '7,2047]}},"revisions":[2047,2047]},"switching_protocols_log":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"pop3":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revision'
+    's":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"proxy_after_tcp_handshake":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"oversize_limit":{"type":"integer","revisions'
+    '":[2047,2047]},"uncompressed_oversize_limit":{"type":"integer","revisions":[2047,2047]},"ssl_offloaded":{"type":"string","options":[{"value":"no","rev'
+    'isions":[2040,2040]},{"value":"yes","revisions":[2040,2040]}],"revisions":[2040,2040]},"ports":{"type":"integer","revisions":[2047,2047]},"inspect_all'
+    '":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"scan_b'
+    'zip2":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"un'
+    'compressed_nest_limit":{"type":"integer","revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":[{"value":"fragmail","revi'
+    'sions":[2047,2047]},{"value":"oversize","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"oversize_log":{"type":"string","'
+    'options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dns":{"type":"dict","child'
+    'ren":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"ports":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"replacemsg_group":{"type":"string","revisions":[2047,2047]},"mail_'
+    'signature":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"signature":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"http":{"type":"dict","children"'
+    ':{"fortinet_bar_port":{"type":"integer","revisions":[2047,383]},"tcp_window_type":{"type":"string","options":[{"value":"system","revisions":[2040,2040'
+    ']},{"value":"static","revisions":[2040,2040]},{"value":"dynamic","revisions":[2040,2040]}],"revisions":[2040,2040]},"unknown_http_version":{"type":"st'
+    'ring","options":[{"value":"reject","revisions":[1920,1920]},{"value":"tunnel","revisions":[1920,1920]},{"value":"best-effort","revisions":[1920,1920]}'
+    '],"revisions":[1920,1920]},"tcp_window_size":{"type":"integer","revisions":[2040,2040]},"stream_based_uncompressed_limit":{"type":"integer","revisions'
+    '":[2040,2040]},"uncompressed_oversize_limit":{"type":"integer","revisions":[2047,2047]},"comfort_amount":{"type":"integer","revisions":[2047,2047]},"t'
+    'cp_window_minimum":{"type":"integer","revisions":[2040,2040]},"tcp_window_maximum":{"type":"integer","revisions":[2040,2040]},"scan_bzip2":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"status":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"oversize_limit":{"t'
+    'ype":"integer","revisions":[2047,2047]},"fortinet_bar":{"type":"string","options":[{"value":"enable","revisions":[383,383]},{"value":"disable","revisi'
+    'ons":[383,383]}],"revisions":[2047,383]},"post_lang":{"multiple_values":true,"type":"list","options":[{"value":"jisx0201","revisions":[2047,2047]},{"v'
+    'alue":"jisx0208","revisions":[2047,2047]},{"value":"jisx0212","revisions":[2047,2047]},{"value":"gb2312","revisions":[2047,2047]},{"value":"ksc5601-ex'
+    '","revisions":[2047,2047]},{"value":"euc-jp","revisions":[2047,2047]},{"value":"sjis","revisions":[2047,2047]},{"value":"iso2022-jp","revisions":[2047'
+    ',2047]},{"value":"iso2022-jp-1","revisions":[2047,2047]},{"value":"iso2022-jp-2","revisions":[2047,2047]},{"value":"euc-cn","revisions":[2047,2047]},{'
+    '"value":"ces-gbk","revisions":[2047,2047]},{"value":"hz","revisions":[2047,2047]},{"value":"ces-big5","revisions":[2047,2047]},{"value":"euc-kr","revi'
+    'sions":[2047,2047]},{"value":"iso2022-jp-3","revisions":[2047,2047]},{"value":"iso8859-1","revisions":[2047,2047]},{"value":"tis620","revisions":[2047'
+    ',2047]},{"value":"cp874","revisions":[2047,2047]},{"value":"cp1252","revisions":[2047,2047]},{"value":"cp1251","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"ssl_offloaded":{"type":"string","options":[{"value":"no","revisions":[2040,2040]},{"value":"yes","revisions":[2040,2040]}],"revisions":[2'
+    '040,2040]},"tunnel_non_http":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revi'
+    'sions":[1920,1920]},"block_page_status_code":{"type":"integer","revisions":[2047,2047]},"proxy_after_tcp_handshake":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"switching_protocols":{"type":"string","opt'
+    'ions":[{"value":"bypass","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"http_policy":{"type":"string","'
+    'options":[{"value":"disable","revisions":[7,7]},{"value":"enable","revisions":[7,7]}],"revisions":[2047,7]},"streaming_content_bypass":{"type":"string'
+    '","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ports":{"type":"integer'
+    '","revisions":[2047,2047]},"retry_count":{"type":"integer","revisions":[2047,2047]},"range_block":{"type":"string","options":[{"value":"disable","revi'
+    'sions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"inspect_all":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"comfort_interval":{"type":"integer","revisions":[2047,2'
+    '047]},"strip_x_forwarded_for":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"uncompressed_nest_limit":{"type":"integer","revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":[{'
+    '"value":"clientcomfort","revisions":[2047,2047]},{"value":"servercomfort","revisions":[2047,2047]},{"value":"oversize","revisions":[2047,2047]},{"valu'
+    'e":"chunkedbypass","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"cifs":{"type":"dict","children":{"status":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"oversize_limit":{"t'
+    'ype":"integer","revisions":[1920,1920]},"server_credential_type":{"type":"string","options":[{"value":"none","revisions":[1728,1728]},{"value":"creden'
+    'tial-replication","revisions":[1728,1728]},{"value":"credential-keytab","revisions":[1728,1728]}],"revisions":[1984,1728]},"uncompressed_oversize_limi'
+    't":{"type":"integer","revisions":[1920,1920]},"server_keytab":{"type":"list","children":{"keytab":{"type":"string","revisions":[1728,1728]},"principal'
+    '":{"type":"string","revisions":[1728,1728]}},"revisions":[1984,1728]},"tcp_window_type":{"type":"string","options":[{"value":"system","revisions":[192'
+    '0,1920]},{"value":"static","revisions":[1920,1920]},{"value":"dynamic","revisions":[1920,1920]}],"revisions":[1920,1920]},"options":{"multiple_values"'
+    ':true,"type":"list","options":[{"value":"oversize","revisions":[1920,1920]}],"revisions":[1920,1920]},"tcp_window_minimum":{"type":"integer","revision'
+    's":[1920,1920]},"tcp_window_maximum":{"type":"integer","revisions":[1920,1920]},"scan_bzip2":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"uncompressed_nest_limit":{"type":"integer","revisions":[1920,1920'
+    ']},"ports":{"type":"integer","revisions":[2040,2040]},"domain_controller":{"type":"string","revisions":[1920,1664]},"tcp_window_size":{"type":"integer'
+    '","revisions":[1920,1920]}},"revisions":[2040,2040]},"nntp":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"proxy_after_tcp_handshake":{"type":"string","options":[{"value'
+    '":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"oversize_limit":{"type":"integer","revision'
+    's":[2047,2047]},"uncompressed_oversize_limit":{"type":"integer","revisions":[2047,2047]},"ports":{"type":"integer","revisions":[2047,2047]},"inspect_a'
+    'll":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"scan'
+    '_bzip2":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"'
+    'uncompressed_nest_limit":{"type":"integer","revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":[{"value":"oversize","re'
+    'visions":[2047,2047]},{"value":"splice","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"imap":{"type":"dict","children":'
+    '{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"proxy_after_tcp_handshake":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revi'
+    'sions":[1920,1920]},"oversize_limit":{"type":"integer","revisions":[2047,2047]},"uncompressed_oversize_limit":{"type":"integer","revisions":[2047,2047'
+    ']},"ssl_offloaded":{"type":"string","options":[{"value":"no","revisions":[2040,2040]},{"value":"yes","revisions":[2040,2040]}],"revisions":[2040,2040]'
+    '},"ports":{"type":"integer","revisions":[2047,2047]},"inspect_all":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"di'
+    'sable","revisions":[2047,2047]}],"revisions":[2047,2047]},"scan_bzip2":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value"'
+    ':"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"uncompressed_nest_limit":{"type":"integer","revisions":[2047,2047]},"options":{"multipl'
+    'e_values":true,"type":"list","options":[{"value":"fragmail","revisions":[2047,2047]},{"value":"oversize","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]}},"revisions":[2047,2047]},"ssh":{"type":"dict","children":{"oversize_limit":{"type":"integer","revisions":[2040,2040]},"stream_based_uncompresse'
+    'd_limit":{"type":"integer","revisions":[1024,1024]},"uncompressed_oversize_limit":{"type":"integer","revisions":[2040,2040]},"ssl_offloaded":{"type":"'
+    'string","options":[{"value":"no","revisions":[1024,1024]},{"value":"yes","revisions":[1024,1024]}],"revisions":[1024,1024]},"tcp_window_type":{"type":'
+    '"string","options":[{"value":"system","revisions":[1024,1024]},{"value":"static","revisions":[1024,1024]},{"value":"dynamic","revisions":[1024,1024]}]'
+    ',"revisions":[1024,1024]},"comfort_amount":{"type":"integer","revisions":[2040,2040]},"tcp_window_minimum":{"type":"integer","revisions":[1024,1024]},'
+    '"comfort_interval":{"type":"integer","revisions":[2040,2040]},"tcp_window_maximum":{"type":"integer","revisions":[1024,1024]},"scan_bzip2":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"uncompressed_nest_l'
+    'imit":{"type":"integer","revisions":[2040,2040]},"options":{"multiple_values":true,"type":"list","options":[{"value":"oversize","revisions":[2040,2040'
+    ']},{"value":"clientcomfort","revisions":[2040,2040]},{"value":"servercomfort","revisions":[2040,2040]}],"revisions":[2040,2040]},"tcp_window_size":{"t'
+    'ype":"integer","revisions":[1024,1024]}},"revisions":[2040,2040]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"ftp":{"type":"dict","required":false,"options":{"status":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]},"oversize_limit":{"type":"int","required":false},"stream_based_uncompressed_limit":{"type":"in'
+    't","required":false},"uncompressed_oversize_limit":{"type":"int","required":false},"tcp_window_minimum":{"type":"int","required":false},"ssl_offloaded'
+    '":{"type":"str","required":false,"choices":["no","yes"]},"tcp_window_type":{"type":"str","required":false,"choices":["system","static","dynamic"]},"po'
+    'rts":{"type":"int","required":false},"comfort_amount":{"type":"int","required":false},"inspect_all":{"type":"str","required":false,"choices":["enable"'
+    ',"disable"]},"comfort_interval":{"type":"int","required":false},"tcp_window_maximum":{"type":"int","required":false},"scan_bzip2":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]},"uncompressed_nest_limit":{"type":"int","required":false},"options":{"type":"list","required":false,"choice'
+    's":["clientcomfort","oversize","splice","bypass-rest-command","bypass-mode-command"]},"tcp_window_size":{"type":"int","required":false}}},"rpc_over_ht'
+    'tp":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"mapi":{"type":"dict","required":false,"opti'
+    'ons":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"oversize_limit":{"type":"int","required":false},"uncompressed_oversize_'
+    'limit":{"type":"int","required":false},"ports":{"type":"int","required":false},"scan_bzip2":{"type":"str","required":false,"choices":["enable","disabl'
+    'e"]},"uncompressed_nest_limit":{"type":"int","required":false},"options":{"type":"list","required":false,"choices":["fragmail","oversize"]}}},"smtp":{'
+    '"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"proxy_after_tcp_handshake":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"oversize_limit":{"type":"int","required":false},"uncompressed_oversize_limit":{"type":"int","r'
+    'equired":false},"ssl_offloaded":{"type":"str","required":false,"choices":["no","yes"]},"ports":{"type":"int","required":false},"inspect_all":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"scan_bzip2":{"type":"str","required":false,"choices":["enable","disable"]},"server_busy":{"type'
+    '":"str","required":false,"choices":["enable","disable"]},"uncompressed_nest_limit":{"type":"int","required":false},"options":{"type":"list","required"'
+    ':false,"choices":["fragmail","oversize","splice"]}}},"switching_protocols_log":{"type":"str","required":false,"choices":["disable","enable"]},"pop3":{'
+    '"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"proxy_after_tcp_handshake":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"oversize_limit":{"type":"int","required":false},"uncompressed_oversize_limit":{"type":"int","r'
+    'equired":false},"ssl_offloaded":{"type":"str","required":false,"choices":["no","yes"]},"ports":{"type":"int","required":false},"inspect_all":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"scan_bzip2":{"type":"str","required":false,"choices":["enable","disable"]},"uncompressed_nest_l'
+    'imit":{"type":"int","required":false},"options":{"type":"list","required":false,"choices":["fragmail","oversize"]}}},"oversize_log":{"type":"str","req'
+    'uired":false,"choices":["disable","enable"]},"dns":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enab'
+    'le","disable"]},"ports":{"type":"int","required":false}}},"replacemsg_group":{"type":"str","required":false},"mail_signature":{"type":"dict","required'
+    '":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"signature":{"type":"str","required":false}}},"http":{"type'
+    '":"dict","required":false,"options":{"fortinet_bar_port":{"type":"int","required":false},"tcp_window_type":{"type":"str","required":false,"choices":["'
+    'system","static","dynamic"]},"unknown_http_version":{"type":"str","required":false,"choices":["reject","tunnel","best-effort"]},"tcp_window_size":{"ty'
+    'pe":"int","required":false},"stream_based_uncompressed_limit":{"type":"int","required":false},"uncompressed_oversize_limit":{"type":"int","required":f'
+    'alse},"comfort_amount":{"type":"int","required":false},"tcp_window_minimum":{"type":"int","required":false},"tcp_window_maximum":{"type":"int","requir'
+    'ed":false},"scan_bzip2":{"type":"str","required":false,"choices":["enable","disable"]},"status":{"type":"str","required":false,"choices":["enable","di'
+    'sable"]},"oversize_limit":{"type":"int","required":false},"fortinet_bar":{"type":"str","required":false},"post_lang":{"type":"list","required":false,"'
+    'choices":["jisx0201","jisx0208","jisx0212","gb2312","ksc5601-ex","euc-jp","sjis","iso2022-jp","iso2022-jp-1","iso2022-jp-2","euc-cn","ces-gbk","hz","c'
+    'es-big5","euc-kr","iso2022-jp-3","iso8859-1","tis620","cp874","cp1252","cp1251"]},"ssl_offloaded":{"type":"str","required":false,"choices":["no","yes"'
+    ']},"tunnel_non_http":{"type":"str","required":false,"choices":["enable","disable"]},"block_page_status_code":{"type":"int","required":false},"proxy_af'
+    'ter_tcp_handshake":{"type":"str","required":false,"choices":["enable","disable"]},"switching_protocols":{"type":"str","required":false,"choices":["byp'
+    'ass","block"]},"http_policy":{"type":"str","required":false},"streaming_content_bypass":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"ports":{"type":"int","required":false},"retry_count":{"type":"int","required":false},"range_block":{"type":"str","required":false,"choices":["disabl'
+    'e","enable"]},"inspect_all":{"type":"str","required":false,"choices":["enable","disable"]},"comfort_interval":{"type":"int","required":false},"strip_x'
+    '_forwarded_for":{"type":"str","required":false,"choices":["disable","enable"]},"uncompressed_nest_limit":{"type":"int","required":false},"options":{"t'
+    'ype":"list","required":false,"choices":["clientcomfort","servercomfort","oversize","chunkedbypass"]}}},"cifs":{"type":"dict","required":false,"options'
+    '":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"oversize_limit":{"type":"int","required":false},"server_credential_type":{'
+    '"type":"str","required":false},"uncompressed_oversize_limit":{"type":"int","required":false},"server_keytab":{"type":"list","required":false,"options"'
+    ':{"keytab":{"type":"str","required":false},"principal":{"type":"str","required":false}}},"tcp_window_type":{"type":"str","required":false,"choices":["'
+    'system","static","dynamic"]},"options":{"type":"list","required":false,"choices":["oversize"]},"tcp_window_minimum":{"type":"int","required":false},"t'
+    'cp_window_maximum":{"type":"int","required":false},"scan_bzip2":{"type":"str","required":false,"choices":["enable","disable"]},"uncompressed_nest_limi'
+    't":{"type":"int","required":false},"ports":{"type":"int","required":false},"domain_controller":{"type":"str","required":false},"tcp_window_size":{"typ'
+    'e":"int","required":false}}},"nntp":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"proxy_after_tcp_handshake":{"type":"str","required":false,"choices":["enable","disable"]},"oversize_limit":{"type":"int","required":false},"uncompre'
+    'ssed_oversize_limit":{"type":"int","required":false},"ports":{"type":"int","required":false},"inspect_all":{"type":"str","required":false,"choices":["'
+    'enable","disable"]},"scan_bzip2":{"type":"str","required":false,"choices":["enable","disable"]},"uncompressed_nest_limit":{"type":"int","required":fal'
+    'se},"options":{"type":"list","required":false,"choices":["oversize","splice"]}}},"imap":{"type":"dict","required":false,"options":{"status":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"proxy_after_tcp_handshake":{"type":"str","required":false,"choices":["enable","disable"]},"overs'
+    'ize_limit":{"type":"int","required":false},"uncompressed_oversize_limit":{"type":"int","required":false},"ssl_offloaded":{"type":"str","required":fals'
+    'e,"choices":["no","yes"]},"ports":{"type":"int","required":false},"inspect_all":{"type":"str","required":false,"choices":["enable","disable"]},"scan_b'
+    'zip2":{"type":"str","required":false,"choices":["enable","disable"]},"uncompressed_nest_limit":{"type":"int","required":false},"options":{"type":"list'
+    '","required":false,"choices":["fragmail","oversize"]}}},"ssh":{"type":"dict","required":false,"options":{"oversize_limit":{"type":"int","required":fal'
+    'se},"stream_based_uncompressed_limit":{"type":"int","required":false},"uncompressed_oversize_limit":{"type":"int","required":false},"ssl_offloaded":{"'
+    'type":"str","required":false,"choices":["no","yes"]},"tcp_window_type":{"type":"str","required":false,"choices":["system","static","dynamic"]},"comfor'
+    't_amount":{"type":"int","required":false},"tcp_window_minimum":{"type":"int","required":false},"comfort_interval":{"type":"int","required":false},"tcp'
+    '_window_maximum":{"type":"int","required":false},"scan_bzip2":{"type":"str","required":false,"choices":["enable","disable"]},"uncompressed_nest_limit"'
+    ':{"type":"int","required":false},"options":{"type":"list","required":false,"choices":["oversize","clientcomfort","servercomfort"]},"tcp_window_size":{'
+    '"type":"int","required":false}}}}}'
+)
@@ -0,0 +1,40 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"category":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"comment":{'
+    '"type":"string","revisions":[2047,2047]},"header_name":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"hea'
+    'der_group":{"type":"list","children":{"case_sensitivity":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"header":{"type":"string","revisions":[2047,2047]},"header_name":{"type":"string","revisions":[2047,20'
+    '47]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"color":{"type":"integer","revisions":[2047,2047]},"referrer":{"type":"'
+    'string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"visibility":{"typ'
+    'e":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"case_sensitivity":'
+    '{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"header":'
+    '{"type":"string","revisions":[2047,2047]},"host":{"type":"string","revisions":[2047,2047]},"ua":{"multiple_values":true,"type":"list","options":[{"val'
+    'ue":"chrome","revisions":[2047,2047]},{"value":"ms","revisions":[2047,2047]},{"value":"firefox","revisions":[2047,2047]},{"value":"safari","revisions"'
+    ':[2047,2047]},{"value":"other","revisions":[2047,2047]}],"revisions":[2047,2047]},"query":{"type":"string","revisions":[2047,2047]},"host_regex":{"typ'
+    'e":"string","revisions":[2047,2047]},"path":{"type":"string","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"host-regex","revisi'
+    'ons":[2047,2047]},{"value":"url","revisions":[2047,2047]},{"value":"category","revisions":[2047,2047]},{"value":"method","revisions":[2047,2047]},{"va'
+    'lue":"ua","revisions":[2047,2047]},{"value":"header","revisions":[2047,2047]},{"value":"src-advanced","revisions":[2047,2047]},{"value":"dst-advanced"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"method":{"multiple_values":true,"type":"list","options":[{"value":"get","revisions":[2047,2047]},'
+    '{"value":"post","revisions":[2047,2047]},{"value":"put","revisions":[2047,2047]},{"value":"head","revisions":[2047,2047]},{"value":"connect","revision'
+    's":[2047,2047]},{"value":"trace","revisions":[2047,2047]},{"value":"options","revisions":[2047,2047]},{"value":"delete","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"tagging":{"type":"list","children":{"category":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[20'
+    '47,2047]},"tags":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]},"uuid'
+    '":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"category":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"comment":{"ty'
+    'pe":"str","required":false},"header_name":{"type":"str","required":false},"name":{"type":"str","required":false},"header_group":{"type":"list","requir'
+    'ed":false,"options":{"case_sensitivity":{"type":"str","required":false,"choices":["disable","enable"]},"header":{"type":"str","required":false},"heade'
+    'r_name":{"type":"str","required":false},"id":{"type":"int","required":false}}},"color":{"type":"int","required":false},"referrer":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]},"visibility":{"type":"str","required":false},"case_sensitivity":{"type":"str","required":false,"choices":["'
+    'disable","enable"]},"header":{"type":"str","required":false},"host":{"type":"str","required":false},"ua":{"type":"list","required":false,"choices":["c'
+    'hrome","ms","firefox","safari","other"]},"query":{"type":"str","required":false},"host_regex":{"type":"str","required":false},"path":{"type":"str","re'
+    'quired":false},"type":{"type":"str","required":false,"choices":["host-regex","url","category","method","ua","header","src-advanced","dst-advanced"]},"'
+    'method":{"type":"list","required":false,"choices":["get","post","put","head","connect","trace","options","delete"]},"tagging":{"type":"list","required'
+    '":false,"options":{"category":{"type":"str","required":false},"name":{"type":"str","required":false},"tags":{"type":"list","required":false,"options":'
+    '{"name":{"type":"str","required":false}}}}},"uuid":{"type":"str","required":false}}}'
+)
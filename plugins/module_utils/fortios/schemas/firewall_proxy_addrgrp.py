@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"color":{"type":"integ'
+    'er","revisions":[2047,2047]},"visibility":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127'
+    ']}],"revisions":[2047,127]},"member":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"type":{"ty'
+    'pe":"string","options":[{"value":"src","revisions":[2047,2047]},{"value":"dst","revisions":[2047,2047]}],"revisions":[2047,2047]},"tagging":{"type":"l'
+    'ist","children":{"category":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"tags":{"type":"list","children'
+    '":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]},"uuid":{"type":"string","revisions":[2047,2047'
+    ']}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"name":{"type":"str","required":false},"color":{"type":"int","req'
+    'uired":false},"visibility":{"type":"str","required":false},"member":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}'
+    '},"type":{"type":"str","required":false,"choices":["src","dst"]},"tagging":{"type":"list","required":false,"options":{"category":{"type":"str","requir'
+    'ed":false},"name":{"type":"str","required":false},"tags":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}}},"uuid":'
+    '{"type":"str","required":false}}}'
+)
@@ -0,0 +1,91 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"icap_profile":{"type":"string","revisions":[2047,2047]},"ssh_filter_profile":{"type":"string","revisions":[2047,2047]},"sr'
+    'caddr_negate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,20'
+    '47]},"spamfilter_profile":{"type":"string","revisions":[2047,7]},"application_list":{"type":"string","revisions":[2047,2047]},"internet_service_negate'
+    '":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"servic'
+    'e_negate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"session_ttl":{"type":"integer","revisions":[2047,2047]},"av_profile":{"type":"string","revisions":[2047,2047]},"device_ownership":{"type":"string","'
+    'options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"proxy":{"type":"string","o'
+    'ptions":[{"value":"explicit-web","revisions":[2047,2047]},{"value":"transparent-web","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},'
+    '{"value":"ssh","revisions":[2047,2047]},{"value":"ssh-tunnel","revisions":[2047,2047]},{"value":"wanopt","revisions":[2047,2047]},{"value":"access-pro'
+    'xy","revisions":[1024,1024]}],"revisions":[2047,2047]},"mms_profile":{"type":"string","revisions":[2047,127]},"webproxy_forward_server":{"type":"strin'
+    'g","revisions":[2047,2047]},"cifs_profile":{"type":"string","revisions":[2040,2040]},"internet_service_custom":{"type":"list","children":{"name":{"typ'
+    'e":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"dstaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},'
+    '"revisions":[2047,2047]},"uuid":{"type":"string","revisions":[2047,2047]},"service":{"type":"list","children":{"name":{"type":"string","revisions":[20'
+    '47,2047]}},"revisions":[2047,2047]},"poolname":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"'
+    'webproxy_profile":{"type":"string","revisions":[2047,2047]},"dlp_sensor":{"type":"string","revisions":[2047,2047]},"ssl_ssh_profile":{"type":"string",'
+    '"revisions":[2047,2047]},"http_tunnel_auth":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},"label":{"type":"string","revisions":[2047,23]},"profile_group'
+    '":{"type":"string","revisions":[2047,2047]},"internet_service":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disabl'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"dstaddr6":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisio'
+    'ns":[2047,2047]},"global_label":{"type":"string","revisions":[2047,23]},"srcintf":{"type":"list","children":{"name":{"type":"string","revisions":[2047'
+    ',2047]}},"revisions":[2047,2047]},"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"users":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"profi'
+    'le_type":{"type":"string","options":[{"value":"single","revisions":[2047,2047]},{"value":"group","revisions":[2047,2047]}],"revisions":[2047,2047]},"s'
+    'chedule":{"type":"string","revisions":[2047,2047]},"disclaimer":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"doma'
+    'in","revisions":[2047,2047]},{"value":"policy","revisions":[2047,2047]},{"value":"user","revisions":[2047,2047]}],"revisions":[2047,2047]},"policyid":'
+    '{"type":"integer","revisions":[2047,2047]},"utm_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"videofilter_profile":{"type":"string","revisions":[1024,1024]},"waf_profile":{"type":"string","revisio'
+    'ns":[2047,2047]},"srcaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"emailfilter_profile"'
+    ':{"type":"string","revisions":[2040,2040]},"dstintf":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,20'
+    '47]},"groups":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"access_proxy":{"type":"list","chi'
+    'ldren":{"name":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"voip_profile":{"type":"string","revisions":[1024,1024]},"transpare'
+    'nt":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"inte'
+    'rnet_service_custom_group":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"srcaddr6":{"type":"l'
+    'ist","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"decrypted_traffic_mirror":{"type":"string","revisions":[1'
+    '920,1920]},"file_filter_profile":{"type":"string","revisions":[1920,1920]},"webfilter_profile":{"type":"string","revisions":[2047,2047]},"logtraffic_s'
+    'tart":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"na'
+    'me":{"type":"string","revisions":[1920,1664]},"scan_botnet_connections":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value":"bl'
+    'ock","revisions":[7,7]},{"value":"monitor","revisions":[7,7]}],"revisions":[2047,7]},"internet_service_id":{"type":"list","children":{"id":{"type":"in'
+    'teger","revisions":[127,127]}},"revisions":[2047,127]},"dstaddr_negate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value'
+    '":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"webcache_https":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]'
+    '},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ips_sensor":{"type":"string","revisions":[2047,2047]},"ztna_ems_tag":{"type":"'
+    'list","children":{"name":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"ssh_policy_redirect":{"type":"string","options":[{"value'
+    '":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"internet_service_name":{"type":"list","chil'
+    'dren":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"internet_service_group":{"type":"list","children":{"name":{"type":"'
+    'string","revisions":[2040,2040]}},"revisions":[2040,2040]},"redirect_url":{"type":"string","revisions":[2047,2047]},"action":{"type":"string","options'
+    '":[{"value":"accept","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]},{"value":"redirect","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"webcache":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"replacemsg_override_group":{"type":"string","revisions":[2047,2047]},"profile_protocol_options":{"type":"string","revisions":[2047,2047]},"'
+    'logtraffic":{"type":"string","options":[{"value":"all","revisions":[2047,2047]},{"value":"utm","revisions":[2047,2047]},{"value":"disable","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"icap_profile":{"type":"str","required":false},"ssh_filter_profile":{"type":"str","required":false},"srcadd'
+    'r_negate":{"type":"str","required":false,"choices":["enable","disable"]},"spamfilter_profile":{"type":"str","required":false},"application_list":{"typ'
+    'e":"str","required":false},"internet_service_negate":{"type":"str","required":false,"choices":["enable","disable"]},"service_negate":{"type":"str","re'
+    'quired":false,"choices":["enable","disable"]},"session_ttl":{"type":"int","required":false},"av_profile":{"type":"str","required":false},"device_owner'
+    'ship":{"type":"str","required":false,"choices":["enable","disable"]},"proxy":{"type":"str","required":false},"mms_profile":{"type":"str","required":fa'
+    'lse},"webproxy_forward_server":{"type":"str","required":false},"cifs_profile":{"type":"str","required":false},"internet_service_custom":{"type":"list"'
+    ',"required":false,"options":{"name":{"type":"str","required":false}}},"dstaddr":{"type":"list","required":false,"options":{"name":{"type":"str","requi'
+    'red":false}}},"uuid":{"type":"str","required":false},"service":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"po'
+    'olname":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"webproxy_profile":{"type":"str","required":false},"dlp_se'
+    'nsor":{"type":"str","required":false},"ssl_ssh_profile":{"type":"str","required":false},"http_tunnel_auth":{"type":"str","required":false,"choices":["'
+    'enable","disable"]},"comments":{"type":"str","required":false},"label":{"type":"str","required":false},"profile_group":{"type":"str","required":false}'
+    ',"internet_service":{"type":"str","required":false,"choices":["enable","disable"]},"dstaddr6":{"type":"list","required":false,"options":{"name":{"type'
+    '":"str","required":false}}},"global_label":{"type":"str","required":false},"srcintf":{"type":"list","required":false,"options":{"name":{"type":"str","'
+    'required":false}}},"status":{"type":"str","required":false,"choices":["enable","disable"]},"users":{"type":"list","required":false,"options":{"name":{'
+    '"type":"str","required":false}}},"profile_type":{"type":"str","required":false,"choices":["single","group"]},"schedule":{"type":"str","required":false'
+    '},"disclaimer":{"type":"str","required":false,"choices":["disable","domain","policy","user"]},"policyid":{"type":"int","required":false},"utm_status":'
+    '{"type":"str","required":false,"choices":["enable","disable"]},"videofilter_profile":{"type":"str","required":false},"waf_profile":{"type":"str","requ'
+    'ired":false},"srcaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"emailfilter_profile":{"type":"str","requir'
+    'ed":false},"dstintf":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"groups":{"type":"list","required":false,"opt'
+    'ions":{"name":{"type":"str","required":false}}},"access_proxy":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"vo'
+    'ip_profile":{"type":"str","required":false},"transparent":{"type":"str","required":false,"choices":["enable","disable"]},"internet_service_custom_grou'
+    'p":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"srcaddr6":{"type":"list","required":false,"options":{"name":{"'
+    'type":"str","required":false}}},"decrypted_traffic_mirror":{"type":"str","required":false},"file_filter_profile":{"type":"str","required":false},"webf'
+    'ilter_profile":{"type":"str","required":false},"logtraffic_start":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str",'
+    '"required":false},"scan_botnet_connections":{"type":"str","required":false},"internet_service_id":{"type":"list","required":false,"options":{"id":{"ty'
+    'pe":"int","required":false}}},"dstaddr_negate":{"type":"str","required":false,"choices":["enable","disable"]},"webcache_https":{"type":"str","required'
+    '":false,"choices":["disable","enable"]},"ips_sensor":{"type":"str","required":false},"ztna_ems_tag":{"type":"list","required":false,"options":{"name":'
+    '{"type":"str","required":false}}},"ssh_policy_redirect":{"type":"str","required":false,"choices":["enable","disable"]},"internet_service_name":{"type"'
+    ':"list","required":false,"options":{"name":{"type":"str","required":false}}},"internet_service_group":{"type":"list","required":false,"options":{"name'
+    '":{"type":"str","required":false}}},"redirect_url":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["accept","deny",'
+    '"redirect"]},"webcache":{"type":"str","required":false,"choices":["enable","disable"]},"replacemsg_override_group":{"type":"str","required":false},"pr'
+    'ofile_protocol_options":{"type":"str","required":false},"logtraffic":{"type":"str","required":false,"choices":["all","utm","disable"]}}}'
+)
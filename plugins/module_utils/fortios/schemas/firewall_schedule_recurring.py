@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"end":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"color":{"type":"integer",'
+    '"revisions":[2047,2047]},"fabric_object":{"type":"string","options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536,1'
+    '536]}],"revisions":[1536,1536]},"start":{"type":"string","revisions":[2047,2047]},"day":{"multiple_values":true,"type":"list","options":[{"value":"sun'
+    'day","revisions":[2047,2047]},{"value":"monday","revisions":[2047,2047]},{"value":"tuesday","revisions":[2047,2047]},{"value":"wednesday","revisions":'
+    '[2047,2047]},{"value":"thursday","revisions":[2047,2047]},{"value":"friday","revisions":[2047,2047]},{"value":"saturday","revisions":[2047,2047]},{"va'
+    'lue":"none","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"end":{"type":"str","required":false},"name":{"type":"str","required":false},"color":{"type":"int","require'
+    'd":false},"fabric_object":{"type":"str","required":false,"choices":["enable","disable"]},"start":{"type":"str","required":false},"day":{"type":"list",'
+    '"required":false,"choices":["sunday","monday","tuesday","wednesday","thursday","friday","saturday","none"]}}}'
+)
@@ -0,0 +1,91 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"internet_service_src":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions'
+    '":[2040,2040]}],"revisions":[2040,2040]},"icap_profile":{"type":"string","revisions":[2040,2040]},"enforce_default_app_port":{"type":"string","options'
+    '":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"ssh_filter_profile":{"type":"stri'
+    'ng","revisions":[2040,2040]},"internet_service_src_negate":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","'
+    'revisions":[2040,2040]}],"revisions":[2040,2040]},"srcaddr_negate":{"type":"string","options":[{"value":"enable","revisions":[1664,1664]},{"value":"di'
+    'sable","revisions":[1664,1664]}],"revisions":[1920,1664]},"application_list":{"type":"string","revisions":[2040,2040]},"url_category":{"type":"list","'
+    'children":{"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"cifs_profile":{"type":"string","revisions":[2040,2040]},"service'
+    '_negate":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},'
+    '"send_deny_packet":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[20'
+    '40,2040]},"av_profile":{"type":"string","revisions":[2040,2040]},"mms_profile":{"type":"string","revisions":[2040,120]},"learning_mode":{"type":"strin'
+    'g","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"internet_service_negat'
+    'e":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"inter'
+    'net_service_custom":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"dstaddr":{"type":"list","ch'
+    'ildren":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"uuid":{"type":"string","revisions":[2040,2040]},"service":{"type"'
+    ':"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"dlp_sensor":{"type":"string","revisions":[2040,2040]},'
+    '"ssl_ssh_profile":{"type":"string","revisions":[2040,2040]},"internet_service_src_custom":{"type":"list","children":{"name":{"type":"string","revision'
+    's":[2040,2040]}},"revisions":[2040,2040]},"comments":{"type":"string","revisions":[2040,2040]},"application":{"type":"list","children":{"id":{"type":"'
+    'integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"dstintf":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"re'
+    'visions":[2040,2040]},"dnsfilter_profile":{"type":"string","revisions":[2040,2040]},"profile_group":{"type":"string","revisions":[2040,2040]},"logtraf'
+    'fic":{"type":"string","options":[{"value":"all","revisions":[2040,2040]},{"value":"utm","revisions":[2040,2040]},{"value":"disable","revisions":[2040,'
+    '2040]}],"revisions":[2040,2040]},"global_label":{"type":"string","revisions":[2032,16]},"status":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"users":{"type":"list","children":{"name":{"type":"string","re'
+    'visions":[2040,2040]}},"revisions":[2040,2040]},"profile_type":{"type":"string","options":[{"value":"single","revisions":[2040,2040]},{"value":"group"'
+    ',"revisions":[2040,2040]}],"revisions":[2040,2040]},"schedule":{"type":"string","revisions":[2040,2040]},"dstaddr4":{"type":"list","children":{"name":'
+    '{"type":"string","revisions":[120,120]}},"revisions":[2040,120]},"dstaddr6":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]'
+    '}},"revisions":[2040,2040]},"utm_status":{"type":"string","options":[{"value":"enable","revisions":[16,16]},{"value":"disable","revisions":[16,16]}],"'
+    'revisions":[2032,16]},"app_category":{"type":"list","children":{"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"videofilter'
+    '_profile":{"type":"string","revisions":[1024,1024]},"srcaddr":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions"'
+    ':[1920,1920]},"emailfilter_profile":{"type":"string","revisions":[2040,2040]},"policyid":{"type":"integer","revisions":[2040,2040]},"srcintf":{"type":'
+    '"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"voip_profile":{"type":"string","revisions":[2040,2040]}'
+    ',"internet_service_id":{"type":"list","children":{"id":{"type":"integer","revisions":[120,120]}},"revisions":[2040,120]},"internet_service_custom_grou'
+    'p":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"srcaddr6":{"type":"list","children":{"name":'
+    '{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"groups":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040'
+    ']}},"revisions":[2040,2040]},"fsso_groups":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"file'
+    '_filter_profile":{"type":"string","revisions":[1920,1920]},"webfilter_profile":{"type":"string","revisions":[2040,2040]},"logtraffic_start":{"type":"s'
+    'tring","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[2040,120]},"name":{"type":"string",'
+    '"revisions":[2040,2040]},"uuid_idx":{"type":"integer","revisions":[2032,16]},"internet_service_src_group":{"type":"list","children":{"name":{"type":"s'
+    'tring","revisions":[2040,2040]}},"revisions":[2040,2040]},"dstaddr_negate":{"type":"string","options":[{"value":"enable","revisions":[1664,1664]},{"va'
+    'lue":"disable","revisions":[1664,1664]}],"revisions":[1920,1664]},"ips_sensor":{"type":"string","revisions":[2040,2040]},"internet_service_src_name":{'
+    '"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"internet_service_name":{"type":"list","children"'
+    ':{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"internet_service_src_id":{"type":"list","children":{"id":{"type":"intege'
+    'r","revisions":[120,120]}},"revisions":[2040,120]},"internet_service_group":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]'
+    '}},"revisions":[2040,2040]},"action":{"type":"string","options":[{"value":"accept","revisions":[2040,2040]},{"value":"deny","revisions":[2040,2040]}],'
+    '"revisions":[2040,2040]},"srcaddr4":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[2040,120]},"internet_servi'
+    'ce_src_custom_group":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"app_group":{"type":"list",'
+    '"children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"profile_protocol_options":{"type":"string","revisions":[2040,2'
+    '040]},"internet_service":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revision'
+    's":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"internet_service_src":{"type":"str","required":false,"choices":["enable","disable"]},"icap_profile":{"type'
+    '":"str","required":false},"enforce_default_app_port":{"type":"str","required":false,"choices":["enable","disable"]},"ssh_filter_profile":{"type":"str"'
+    ',"required":false},"internet_service_src_negate":{"type":"str","required":false,"choices":["enable","disable"]},"srcaddr_negate":{"type":"str","requir'
+    'ed":false},"application_list":{"type":"str","required":false},"url_category":{"type":"list","required":false,"options":{"id":{"type":"int","required":'
+    'false}}},"cifs_profile":{"type":"str","required":false},"service_negate":{"type":"str","required":false,"choices":["enable","disable"]},"send_deny_pac'
+    'ket":{"type":"str","required":false,"choices":["disable","enable"]},"av_profile":{"type":"str","required":false},"mms_profile":{"type":"str","required'
+    '":false},"learning_mode":{"type":"str","required":false,"choices":["enable","disable"]},"internet_service_negate":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"internet_service_custom":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"dstaddr":{"t'
+    'ype":"list","required":false,"options":{"name":{"type":"str","required":false}}},"uuid":{"type":"str","required":false},"service":{"type":"list","requ'
+    'ired":false,"options":{"name":{"type":"str","required":false}}},"dlp_sensor":{"type":"str","required":false},"ssl_ssh_profile":{"type":"str","required'
+    '":false},"internet_service_src_custom":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"comments":{"type":"str","r'
+    'equired":false},"application":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"dstintf":{"type":"list","required":fa'
+    'lse,"options":{"name":{"type":"str","required":false}}},"dnsfilter_profile":{"type":"str","required":false},"profile_group":{"type":"str","required":f'
+    'alse},"logtraffic":{"type":"str","required":false,"choices":["all","utm","disable"]},"global_label":{"type":"str","required":false},"status":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"users":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"pro'
+    'file_type":{"type":"str","required":false,"choices":["single","group"]},"schedule":{"type":"str","required":false},"dstaddr4":{"type":"list","required'
+    '":false,"options":{"name":{"type":"str","required":false}}},"dstaddr6":{"type":"list","required":false,"options":{"name":{"type":"str","required":fals'
+    'e}}},"utm_status":{"type":"str","required":false},"app_category":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"vi'
+    'deofilter_profile":{"type":"str","required":false},"srcaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"emai'
+    'lfilter_profile":{"type":"str","required":false},"policyid":{"type":"int","required":false},"srcintf":{"type":"list","required":false,"options":{"name'
+    '":{"type":"str","required":false}}},"voip_profile":{"type":"str","required":false},"internet_service_id":{"type":"list","required":false,"options":{"i'
+    'd":{"type":"int","required":false}}},"internet_service_custom_group":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}'
+    '}},"srcaddr6":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"groups":{"type":"list","required":false,"options":{'
+    '"name":{"type":"str","required":false}}},"fsso_groups":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"file_filte'
+    'r_profile":{"type":"str","required":false},"webfilter_profile":{"type":"str","required":false},"logtraffic_start":{"type":"str","required":false},"nam'
+    'e":{"type":"str","required":false},"uuid_idx":{"type":"int","required":false},"internet_service_src_group":{"type":"list","required":false,"options":{'
+    '"name":{"type":"str","required":false}}},"dstaddr_negate":{"type":"str","required":false},"ips_sensor":{"type":"str","required":false},"internet_servi'
+    'ce_src_name":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"internet_service_name":{"type":"list","required":fal'
+    'se,"options":{"name":{"type":"str","required":false}}},"internet_service_src_id":{"type":"list","required":false,"options":{"id":{"type":"int","requir'
+    'ed":false}}},"internet_service_group":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"action":{"type":"str","requ'
+    'ired":false,"choices":["accept","deny"]},"srcaddr4":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"internet_serv'
+    'ice_src_custom_group":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"app_group":{"type":"list","required":false,'
+    '"options":{"name":{"type":"str","required":false}}},"profile_protocol_options":{"type":"str","required":false},"internet_service":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"fabric_object":{"type'
+    '":"string","options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]}},"revisions":[2'
+    '047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"name":{"type":"str","required":false},"fabric_object":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,46 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"tcp_timewait_timer":{"type":"integer","revisions":[2047,2047]},"protoc'
+    'ol":{"type":"string","options":[{"value":"TCP/UDP/SCTP","revisions":[2047,2047]},{"value":"ICMP","revisions":[2047,2047]},{"value":"ICMP6","revisions"'
+    ':[2047,2047]},{"value":"IP","revisions":[2047,2047]},{"value":"HTTP","revisions":[2047,2047]},{"value":"FTP","revisions":[2047,2047]},{"value":"CONNEC'
+    'T","revisions":[2047,2047]},{"value":"SOCKS-TCP","revisions":[2047,2047]},{"value":"SOCKS-UDP","revisions":[2047,2047]},{"value":"ALL","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"helper":{"type":"string","options":[{"value":"auto","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]},{"value":"ftp","revisions":[2047,2047]},{"value":"tftp","revisions":[2047,2047]},{"value":"ras","revisions":[2047,2047]},{"value":"h323","revi'
+    'sions":[2047,2047]},{"value":"tns","revisions":[2047,2047]},{"value":"mms","revisions":[2047,2047]},{"value":"sip","revisions":[2047,2047]},{"value":"'
+    'pptp","revisions":[2047,2047]},{"value":"rtsp","revisions":[2047,2047]},{"value":"dns-udp","revisions":[2047,2047]},{"value":"dns-tcp","revisions":[20'
+    '47,2047]},{"value":"pmap","revisions":[2047,2047]},{"value":"rsh","revisions":[2047,2047]},{"value":"dcerpc","revisions":[2047,2047]},{"value":"mgcp",'
+    '"revisions":[2047,2047]},{"value":"gtp-c","revisions":[2047,1023]},{"value":"gtp-u","revisions":[2047,1023]},{"value":"gtp-b","revisions":[2047,1023]}'
+    '],"revisions":[2047,2047]},"color":{"type":"integer","revisions":[2047,2047]},"session_ttl":{"type":"integer","revisions":[2047,2047]},"app_service_ty'
+    'pe":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"app-id","revisions":[2047,2047]},{"value":"app-category","revisi'
+    'ons":[2047,2047]}],"revisions":[2047,2047]},"iprange":{"type":"string","revisions":[2047,2047]},"category":{"type":"string","revisions":[2047,2047]},"'
+    'sctp_portrange":{"type":"string","revisions":[2047,2047]},"tcp_portrange":{"type":"string","revisions":[2047,2047]},"fabric_object":{"type":"string","'
+    'options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"protocol_number":{"type":"'
+    'integer","revisions":[2047,2047]},"tcp_halfopen_timer":{"type":"integer","revisions":[2047,2047]},"application":{"type":"list","children":{"id":{"type'
+    '":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"udp_idle_timer":{"type":"integer","revisions":[2047,2047]},"icmpcode":{"type":"integer'
+    '","revisions":[2047,2047]},"app_category":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"udp_po'
+    'rtrange":{"type":"string","revisions":[2047,2047]},"visibility":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"icmptype":{"type":"integer","revisions":[2047,2047]},"proxy":{"type":"string","options":[{"val'
+    'ue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,'
+    '2047]},"tcp_halfclose_timer":{"type":"integer","revisions":[2047,2047]},"fqdn":{"type":"string","revisions":[2047,2047]},"tcp_rst_timer":{"type":"inte'
+    'ger","revisions":[1024,1024]},"check_reset_range":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"strict","revisions'
+    '":[2047,2047]},{"value":"default","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"tcp_timewait_timer":{"type":"int","required":false},"protocol":{'
+    '"type":"str","required":false,"choices":["TCP/UDP/SCTP","ICMP","ICMP6","IP","HTTP","FTP","CONNECT","SOCKS-TCP","SOCKS-UDP","ALL"]},"helper":{"type":"s'
+    'tr","required":false,"choices":["auto","disable","ftp","tftp","ras","h323","tns","mms","sip","pptp","rtsp","dns-udp","dns-tcp","pmap","rsh","dcerpc","'
+    'mgcp","gtp-c","gtp-u","gtp-b"]},"color":{"type":"int","required":false},"session_ttl":{"type":"int","required":false},"app_service_type":{"type":"str"'
+    ',"required":false,"choices":["disable","app-id","app-category"]},"iprange":{"type":"str","required":false},"category":{"type":"str","required":false},'
+    '"sctp_portrange":{"type":"str","required":false},"tcp_portrange":{"type":"str","required":false},"fabric_object":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"protocol_number":{"type":"int","required":false},"tcp_halfopen_timer":{"type":"int","required":false},"application":{"type"'
+    ':"list","required":false,"options":{"id":{"type":"int","required":false}}},"udp_idle_timer":{"type":"int","required":false},"icmpcode":{"type":"int","'
+    'required":false},"app_category":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"udp_portrange":{"type":"str","requi'
+    'red":false},"visibility":{"type":"str","required":false,"choices":["enable","disable"]},"icmptype":{"type":"int","required":false},"proxy":{"type":"st'
+    'r","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"tcp_halfclose_timer":{"type":"int","required":false},"fqdn'
+    '":{"type":"str","required":false},"tcp_rst_timer":{"type":"int","required":false},"check_reset_range":{"type":"str","required":false,"choices":["disab'
+    'le","strict","default"]}}}'
+)
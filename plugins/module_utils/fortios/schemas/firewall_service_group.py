@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"color":{"type":"integ'
+    'er","revisions":[2047,2047]},"fabric_object":{"type":"string","options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[15'
+    '36,1536]}],"revisions":[1536,1536]},"member":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"pr'
+    'oxy":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"re'
+    'visions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"name":{"type":"str","required":false},"color":{"type":"int","req'
+    'uired":false},"fabric_object":{"type":"str","required":false,"choices":["enable","disable"]},"member":{"type":"list","required":false,"options":{"name'
+    '":{"type":"str","required":false}}},"proxy":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
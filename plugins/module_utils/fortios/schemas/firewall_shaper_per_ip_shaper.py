@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"max_concurrent_session":{"type":"integer","revisions":[2047,2047]},"max_concurrent_tcp_session":{"type":"integer","revisio'
+    'ns":[1024,1024]},"diffservcode_forward":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"diffserv_forward":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"bandwidt'
+    'h_unit":{"type":"string","options":[{"value":"kbps","revisions":[2047,2047]},{"value":"mbps","revisions":[2047,2047]},{"value":"gbps","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"diffservcode_rev":{"type":"string","revisions":[2047,2047]},"max_bandwidth":{"type":"integer","revisions":[2047,20'
+    '47]},"diffserv_reverse":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"max_concurrent_udp_session":{"type":"integer","revisions":[1024,1024]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"max_concurrent_session":{"type":"int","required":false},"max_concurrent_tcp_session":{"type":"int","requir'
+    'ed":false},"diffservcode_forward":{"type":"str","required":false},"name":{"type":"str","required":false},"diffserv_forward":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"bandwidth_unit":{"type":"str","required":false,"choices":["kbps","mbps","gbps"]},"diffservcode_rev":{"type":"str'
+    '","required":false},"max_bandwidth":{"type":"int","required":false},"diffserv_reverse":{"type":"str","required":false,"choices":["enable","disable"]},'
+    '"max_concurrent_udp_session":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,25 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"dscp_marking_method":{"type":"string","options":[{"value":"multi-stage","revisions":[2040,2040]},{"value":"static","revisi'
+    'ons":[2040,2040]}],"revisions":[2040,2040]},"exceed_bandwidth":{"type":"integer","revisions":[2040,2040]},"name":{"type":"string","revisions":[2047,20'
+    '47]},"per_policy":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[204'
+    '7,2047]},"bandwidth_unit":{"type":"string","options":[{"value":"kbps","revisions":[2047,2047]},{"value":"mbps","revisions":[2047,2047]},{"value":"gbps'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"diffservcode":{"type":"string","revisions":[2047,2047]},"maximum_dscp":{"type":"string","revisio'
+    'ns":[2040,2040]},"priority":{"type":"string","options":[{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"h'
+    'igh","revisions":[2047,2047]}],"revisions":[2047,2047]},"maximum_bandwidth":{"type":"integer","revisions":[2047,2047]},"overhead":{"type":"integer","r'
+    'evisions":[2040,2040]},"exceed_dscp":{"type":"string","revisions":[2040,2040]},"guaranteed_bandwidth":{"type":"integer","revisions":[2047,2047]},"exce'
+    'ed_class_id":{"type":"integer","revisions":[2040,2040]},"diffserv":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"di'
+    'sable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"dscp_marking_method":{"type":"str","required":false,"choices":["multi-stage","static"]},"exceed_bandwidth"'
+    ':{"type":"int","required":false},"name":{"type":"str","required":false},"per_policy":{"type":"str","required":false,"choices":["disable","enable"]},"b'
+    'andwidth_unit":{"type":"str","required":false,"choices":["kbps","mbps","gbps"]},"diffservcode":{"type":"str","required":false},"maximum_dscp":{"type":'
+    '"str","required":false},"priority":{"type":"str","required":false,"choices":["low","medium","high"]},"maximum_bandwidth":{"type":"int","required":fals'
+    'e},"overhead":{"type":"int","required":false},"exceed_dscp":{"type":"str","required":false},"guaranteed_bandwidth":{"type":"int","required":false},"ex'
+    'ceed_class_id":{"type":"int","required":false},"diffserv":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,64 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"internet_service_src":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"traffic_shaper":{"type":"string","revisions":[2047,2047]'
+    '},"srcintf":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"diffserv_forward":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"url_category":{"type":"li'
+    'st","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"internet_service_custom":{"type":"list","children":{"name":'
+    '{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"diffserv_reverse":{"type":"string","options":[{"value":"enable","revisions":[2040'
+    ',2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"traffic_shaper_reverse":{"type":"string","revisions":[2047,2047]},"id":'
+    '{"type":"integer","revisions":[2047,2047]},"service":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,20'
+    '47]},"tos":{"type":"string","revisions":[2040,2040]},"internet_service_src_custom":{"type":"list","children":{"name":{"type":"string","revisions":[204'
+    '7,2047]}},"revisions":[2047,2047]},"application":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},'
+    '"dstintf":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"per_ip_shaper":{"type":"string","revi'
+    'sions":[2047,2047]},"app_category":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"status":{"typ'
+    'e":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"diffservcode_'
+    'forward":{"type":"string","revisions":[2040,2040]},"users":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2'
+    '047,2047]},"schedule":{"type":"string","revisions":[2047,2047]},"dstaddr6":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}'
+    '},"revisions":[2047,2047]},"diffservcode_rev":{"type":"string","revisions":[2040,2040]},"srcaddr":{"type":"list","children":{"name":{"type":"string","'
+    'revisions":[2047,2047]}},"revisions":[2047,2047]},"tos_mask":{"type":"string","revisions":[2040,2040]},"groups":{"type":"list","children":{"name":{"ty'
+    'pe":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"internet_service_custom_group":{"type":"list","children":{"name":{"type":"string","re'
+    'visions":[2040,2040]}},"revisions":[2040,2040]},"dstaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[20'
+    '47,2047]},"srcaddr6":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"name":{"type":"string","re'
+    'visions":[2040,2040]},"class_id":{"type":"integer","revisions":[2047,2047]},"internet_service_id":{"type":"list","children":{"id":{"type":"integer","r'
+    'evisions":[127,127]}},"revisions":[2047,127]},"internet_service_src_name":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}}'
+    ',"revisions":[1920,1920]},"internet_service_name":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]'
+    '},"internet_service_src_id":{"type":"list","children":{"id":{"type":"integer","revisions":[127,127]}},"revisions":[2047,127]},"internet_service_group"'
+    ':{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"ip_version":{"type":"string","options":[{"valu'
+    'e":"4","revisions":[2047,2047]},{"value":"6","revisions":[2047,2047]}],"revisions":[2047,2047]},"tos_negate":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"internet_service_src_custom_group":{"type":"list"'
+    ',"children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"app_group":{"type":"list","children":{"name":{"type":"string"'
+    ',"revisions":[2040,2040]}},"revisions":[2040,2040]},"internet_service_src_group":{"type":"list","children":{"name":{"type":"string","revisions":[2040,'
+    '2040]}},"revisions":[2040,2040]},"internet_service":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"internet_service_src":{"type":"str","required":false,"choices":['
+    '"enable","disable"]},"traffic_shaper":{"type":"str","required":false},"srcintf":{"type":"list","required":false,"options":{"name":{"type":"str","requi'
+    'red":false}}},"diffserv_forward":{"type":"str","required":false,"choices":["enable","disable"]},"url_category":{"type":"list","required":false,"option'
+    's":{"id":{"type":"int","required":false}}},"internet_service_custom":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}'
+    '}},"diffserv_reverse":{"type":"str","required":false,"choices":["enable","disable"]},"traffic_shaper_reverse":{"type":"str","required":false},"id":{"t'
+    'ype":"int","required":false},"service":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"tos":{"type":"str","requir'
+    'ed":false},"internet_service_src_custom":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"application":{"type":"li'
+    'st","required":false,"options":{"id":{"type":"int","required":false}}},"dstintf":{"type":"list","required":false,"options":{"name":{"type":"str","requ'
+    'ired":false}}},"per_ip_shaper":{"type":"str","required":false},"app_category":{"type":"list","required":false,"options":{"id":{"type":"int","required"'
+    ':false}}},"status":{"type":"str","required":false,"choices":["enable","disable"]},"diffservcode_forward":{"type":"str","required":false},"users":{"typ'
+    'e":"list","required":false,"options":{"name":{"type":"str","required":false}}},"schedule":{"type":"str","required":false},"dstaddr6":{"type":"list","r'
+    'equired":false,"options":{"name":{"type":"str","required":false}}},"diffservcode_rev":{"type":"str","required":false},"srcaddr":{"type":"list","requir'
+    'ed":false,"options":{"name":{"type":"str","required":false}}},"tos_mask":{"type":"str","required":false},"groups":{"type":"list","required":false,"opt'
+    'ions":{"name":{"type":"str","required":false}}},"internet_service_custom_group":{"type":"list","required":false,"options":{"name":{"type":"str","requi'
+    'red":false}}},"dstaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"srcaddr6":{"type":"list","required":false'
+    ',"options":{"name":{"type":"str","required":false}}},"name":{"type":"str","required":false},"class_id":{"type":"int","required":false},"internet_servi'
+    'ce_id":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"internet_service_src_name":{"type":"list","required":false,"'
+    'options":{"name":{"type":"str","required":false}}},"internet_service_name":{"type":"list","required":false,"options":{"name":{"type":"str","required":'
+    'false}}},"internet_service_src_id":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"internet_service_group":{"type":'
+    '"list","required":false,"options":{"name":{"type":"str","required":false}}},"ip_version":{"type":"str","required":false,"choices":["4","6"]},"tos_nega'
+    'te":{"type":"str","required":false,"choices":["enable","disable"]},"internet_service_src_custom_group":{"type":"list","required":false,"options":{"nam'
+    'e":{"type":"str","required":false}}},"app_group":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"internet_service'
+    '_src_group":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"internet_service":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]}}}'
+)
@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"policing","revisions":[204'
+    '0,2040]},{"value":"queuing","revisions":[2040,2040]}],"revisions":[2040,2040]},"default_class_id":{"type":"integer","revisions":[2047,2047]},"profile_'
+    'name":{"type":"string","revisions":[2047,2047]},"shaping_entries":{"type":"list","children":{"cburst_in_msec":{"type":"integer","revisions":[2040,2040'
+    ']},"maximum_bandwidth_percentage":{"type":"integer","revisions":[2047,2047]},"min":{"type":"integer","revisions":[2040,2040]},"class_id":{"type":"inte'
+    'ger","revisions":[2047,2047]},"max":{"type":"integer","revisions":[2040,2040]},"priority":{"type":"string","options":[{"value":"high","revisions":[204'
+    '7,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"top","revisions":[2040,2040]},{"value":"critical'
+    '","revisions":[2040,2040]}],"revisions":[2047,2047]},"burst_in_msec":{"type":"integer","revisions":[2040,2040]},"limit":{"type":"integer","revisions":'
+    '[2040,2040]},"guaranteed_bandwidth_percentage":{"type":"integer","revisions":[2047,2047]},"red_probability":{"type":"integer","revisions":[2040,2040]}'
+    ',"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"type":{"type":"str","required":false,"choices":["policing","queu'
+    'ing"]},"default_class_id":{"type":"int","required":false},"profile_name":{"type":"str","required":false},"shaping_entries":{"type":"list","required":f'
+    'alse,"options":{"cburst_in_msec":{"type":"int","required":false},"maximum_bandwidth_percentage":{"type":"int","required":false},"min":{"type":"int","r'
+    'equired":false},"class_id":{"type":"int","required":false},"max":{"type":"int","required":false},"priority":{"type":"str","required":false},"burst_in_'
+    'msec":{"type":"int","required":false},"limit":{"type":"int","required":false},"guaranteed_bandwidth_percentage":{"type":"int","required":false},"red_p'
+    'robability":{"type":"int","required":false},"id":{"type":"int","required":false}}}}}'
+)
@@ -0,0 +1,60 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"spamfilter_profile":{"type":"string","revisions":[2047,7]},"protocol":{"type":"string","revisions":[2047,2047]},"applicati'
+    'on_list":{"type":"string","revisions":[2047,2047]},"dlp_sensor_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value"'
+    ':"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"av_profile":{"type":"string","revisions":[2047,2047]},"file_filter_profile_status":{"ty'
+    'pe":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"interface":{'
+    '"type":"string","revisions":[2047,2047]},"port":{"type":"string","revisions":[2047,2047]},"dsri":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"application_list_status":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"webfilter_profile_status":{"type":"string","'
+    'options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dlp_sensor":{"type":"strin'
+    'g","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"ipv6":{"type":"string","options":[{"value":"enable","revisions":[2047,204'
+    '7]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"anomaly":{"type":"list","children":{"status":{"type":"string","options":[{"'
+    'value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[20'
+    '47,2047]},"quarantine":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"attacker","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"threshold":{"type":"integer","revisions":[2047,2047]},"quarantine_expiry":{"type":"string","revisions":[2047,2047]},"action":{"type":"st'
+    'ring","options":[{"value":"pass","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]},{"value":"proxy","revisions":[2047,1023]}],"revisi'
+    'ons":[2047,2047]},"threshold(default)":{"type":"integer","revisions":[2047,2047]},"quarantine_log":{"type":"string","options":[{"value":"disable","rev'
+    'isions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"status":{"type":"string","options":['
+    '{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"non_ip":{"type":"string","options":['
+    '{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_packet_count":{"type":"integer",'
+    '"revisions":[2047,2047]},"av_profile_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"vlan":{"type":"string","revisions":[2047,2047]},"ip_threatfeed":{"type":"list","children":{"name":{"type":"string'
+    '","revisions":[1024,1024]}},"revisions":[1024,1024]},"host":{"type":"string","revisions":[2047,2047]},"emailfilter_profile":{"type":"string","revision'
+    's":[2040,2040]},"emailfilter_profile_status":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[20'
+    '40,2040]}],"revisions":[2040,2040]},"ips_dos_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisi'
+    'ons":[2047,2047]}],"revisions":[2047,2047]},"ips_sensor_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"file_filter_profile":{"type":"string","revisions":[1024,1024]},"webfilter_profile":{"type":"st'
+    'ring","revisions":[2047,2047]},"scan_botnet_connections":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value":"block","revisions'
+    '":[7,7]},{"value":"monitor","revisions":[7,7]}],"revisions":[2047,7]},"ips_sensor":{"type":"string","revisions":[2047,2047]},"ip_threatfeed_status":{"'
+    'type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"spamfilter'
+    '_profile_status":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"logtra'
+    'ffic":{"type":"string","options":[{"value":"all","revisions":[2047,2047]},{"value":"utm","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"spamfilter_profile":{"type":"str","required":false},"protocol":{"type":"str","required":false},"applicatio'
+    'n_list":{"type":"str","required":false},"dlp_sensor_status":{"type":"str","required":false,"choices":["enable","disable"]},"av_profile":{"type":"str",'
+    '"required":false},"file_filter_profile_status":{"type":"str","required":false,"choices":["enable","disable"]},"interface":{"type":"str","required":fal'
+    'se},"port":{"type":"str","required":false},"dsri":{"type":"str","required":false,"choices":["enable","disable"]},"application_list_status":{"type":"st'
+    'r","required":false,"choices":["enable","disable"]},"webfilter_profile_status":{"type":"str","required":false,"choices":["enable","disable"]},"dlp_sen'
+    'sor":{"type":"str","required":false},"id":{"type":"int","required":false},"ipv6":{"type":"str","required":false,"choices":["enable","disable"]},"anoma'
+    'ly":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","required"'
+    ':false},"quarantine":{"type":"str","required":false,"choices":["none","attacker"]},"threshold":{"type":"int","required":false},"quarantine_expiry":{"t'
+    'ype":"str","required":false},"action":{"type":"str","required":false,"choices":["pass","block","proxy"]},"threshold(default)":{"type":"int","required"'
+    ':false},"quarantine_log":{"type":"str","required":false,"choices":["disable","enable"]},"log":{"type":"str","required":false,"choices":["enable","disa'
+    'ble"]}}},"status":{"type":"str","required":false,"choices":["enable","disable"]},"non_ip":{"type":"str","required":false,"choices":["enable","disable"'
+    ']},"max_packet_count":{"type":"int","required":false},"av_profile_status":{"type":"str","required":false,"choices":["enable","disable"]},"vlan":{"type'
+    '":"str","required":false},"ip_threatfeed":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"host":{"type":"str","re'
+    'quired":false},"emailfilter_profile":{"type":"str","required":false},"emailfilter_profile_status":{"type":"str","required":false,"choices":["enable","'
+    'disable"]},"ips_dos_status":{"type":"str","required":false,"choices":["enable","disable"]},"ips_sensor_status":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"file_filter_profile":{"type":"str","required":false},"webfilter_profile":{"type":"str","required":false},"scan_botnet_connect'
+    'ions":{"type":"str","required":false},"ips_sensor":{"type":"str","required":false},"ip_threatfeed_status":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"spamfilter_profile_status":{"type":"str","required":false},"logtraffic":{"type":"str","required":false,"choices":["all","utm","dis'
+    'able"]}}}'
+)
@@ -0,0 +1,20 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"trusted","revisions":[2047,2047]},{"value":"revoked","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"public_key":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"ip":{"type":"stri'
+    'ng","revisions":[2047,2047]},"hostname":{"type":"string","revisions":[2047,2047]},"nid":{"type":"string","options":[{"value":"256","revisions":[2047,2'
+    '047]},{"value":"384","revisions":[2047,2047]},{"value":"521","revisions":[2047,2047]}],"revisions":[2047,2047]},"type":{"type":"string","options":[{"v'
+    'alue":"RSA","revisions":[2047,2047]},{"value":"DSA","revisions":[2047,2047]},{"value":"ECDSA","revisions":[2047,2047]},{"value":"ED25519","revisions":'
+    '[2047,2047]},{"value":"RSA-CA","revisions":[2047,2047]},{"value":"DSA-CA","revisions":[2047,2047]},{"value":"ECDSA-CA","revisions":[2047,2047]},{"valu'
+    'e":"ED25519-CA","revisions":[2047,2047]}],"revisions":[2047,2047]},"port":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["trusted","revoked"]},"public_key":{"type":"str","requir'
+    'ed":false},"name":{"type":"str","required":false},"ip":{"type":"str","required":false},"hostname":{"type":"str","required":false},"nid":{"type":"str",'
+    '"required":false,"choices":["256","384","521"]},"type":{"type":"str","required":false,"choices":["RSA","DSA","ECDSA","ED25519","RSA-CA","DSA-CA","ECDS'
+    'A-CA","ED25519-CA"]},"port":{"type":"int","required":false}}}'
+)
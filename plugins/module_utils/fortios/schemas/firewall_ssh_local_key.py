@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"source":{"type":"string","options":[{"value":"built-in","revisions":[2047,2047]},{"value":"user","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"private_key":{"type":"string","revisions":[2047,2047]},"password":{"type":"string","revisions":[2047,2047]},"name":{"type":'
+    '"string","revisions":[2047,2047]},"public_key":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"source":{"type":"str","required":false,"choices":["built-in","user"]},"private_key":{"type":"str","require'
+    'd":false},"password":{"type":"str","required":false},"name":{"type":"str","required":false},"public_key":{"type":"str","required":false}}}'
+)
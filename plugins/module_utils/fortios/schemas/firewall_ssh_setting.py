@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"untrusted_caname":{"type":"string","revisions":[2047,2047]},"hostkey_ecdsa521":{"type":"string","revisions":[2047,2047]},"'
+    'hostkey_ed25519":{"type":"string","revisions":[2047,2047]},"hostkey_rsa2048":{"type":"string","revisions":[2047,2047]},"caname":{"type":"string","revi'
+    'sions":[2047,2047]},"host_trusted_checking":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"hostkey_ecdsa384":{"type":"string","revisions":[2047,2047]},"hostkey_dsa1024":{"type":"string","revisions":[2047,2'
+    '047]},"hostkey_ecdsa256":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"untrusted_caname":{"type":"str","required":false},"hostkey_ecdsa521":{"type":"str","required":false},"host'
+    'key_ed25519":{"type":"str","required":false},"hostkey_rsa2048":{"type":"str","required":false},"caname":{"type":"str","required":false},"host_trusted_'
+    'checking":{"type":"str","required":false,"choices":["enable","disable"]},"hostkey_ecdsa384":{"type":"str","required":false},"hostkey_dsa1024":{"type":'
+    '"str","required":false},"hostkey_ecdsa256":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,30 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ssl_min_version":{"type":"string","options":[{"value":"tls-1.0","revisions":[2047,2047]},{"value":"tls-1.1","revisions":[2'
+    '047,2047]},{"value":"tls-1.2","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_cert":{"type":"string","revisions":[2047,2047]},"ssl_mode":{"typ'
+    'e":"string","options":[{"value":"half","revisions":[2047,2047]},{"value":"full","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"str'
+    'ing","revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"add_header_x_forwarded_proto":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_dh_bits":{"type":"string","options":[{"value":'
+    '"768","revisions":[2047,2047]},{"value":"1024","revisions":[2047,2047]},{"value":"1536","revisions":[2047,2047]},{"value":"2048","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"ssl_algorithm":{"type":"string","options":[{"value":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047'
+    ',2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]},"url_rewrite":{"type":"string","options":[{"value":"enable","revisions":[204'
+    '7,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_max_version":{"type":"string","options":[{"value":"tls-1.0","revis'
+    'ions":[2047,2047]},{"value":"tls-1.1","revisions":[2047,2047]},{"value":"tls-1.2","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_send_empty_f'
+    'rags":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"po'
+    'rt":{"type":"integer","revisions":[2047,2047]},"mapped_port":{"type":"integer","revisions":[2047,2047]},"ssl_client_renegotiation":{"type":"string","o'
+    'ptions":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]},{"value":"secure","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ssl_min_version":{"type":"str","required":false,"choices":["tls-1.0","tls-1.1","tls-1.2"]},"ssl_cert":{"ty'
+    'pe":"str","required":false},"ssl_mode":{"type":"str","required":false,"choices":["half","full"]},"name":{"type":"str","required":false},"ip":{"type":"'
+    'str","required":false},"add_header_x_forwarded_proto":{"type":"str","required":false,"choices":["enable","disable"]},"ssl_dh_bits":{"type":"str","requ'
+    'ired":false,"choices":["768","1024","1536","2048"]},"ssl_algorithm":{"type":"str","required":false,"choices":["high","medium","low"]},"url_rewrite":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"ssl_max_version":{"type":"str","required":false,"choices":["tls-1.0","tls-1.1","tls-1.2"'
+    ']},"ssl_send_empty_frags":{"type":"str","required":false,"choices":["enable","disable"]},"port":{"type":"int","required":false},"mapped_port":{"type":'
+    '"int","required":false},"ssl_client_renegotiation":{"type":"str","required":false,"choices":["allow","deny","secure"]}}}'
+)
@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"session_cache_timeout":{"type":"integer","revisions":[2047,2047]},"kxp_queue_threshold":{"type":"integer","revisions":[204'
+    '7,1023]},"abbreviate_handshake":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"proxy_connect_timeout":{"type":"integer","revisions":[2047,2047]},"session_cache_capacity":{"type":"integer","revisions":[2047'
+    ',2047]},"cert_cache_timeout":{"type":"integer","revisions":[2047,2047]},"ssl_dh_bits":{"type":"string","options":[{"value":"768","revisions":[2047,204'
+    '7]},{"value":"1024","revisions":[2047,2047]},{"value":"1536","revisions":[2047,2047]},{"value":"2048","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"no_matching_cipher_action":{"type":"string","options":[{"value":"bypass","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"cert_cache_capacity":{"type":"integer","revisions":[2047,2047]},"ssl_queue_threshold":{"type":"integer","revisions":[2047,1023]},"'
+    'ssl_send_empty_frags":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"session_cache_timeout":{"type":"int","required":false},"kxp_queue_threshold":{"type":"int","required":fals'
+    'e},"abbreviate_handshake":{"type":"str","required":false,"choices":["enable","disable"]},"proxy_connect_timeout":{"type":"int","required":false},"sess'
+    'ion_cache_capacity":{"type":"int","required":false},"cert_cache_timeout":{"type":"int","required":false},"ssl_dh_bits":{"type":"str","required":false,'
+    '"choices":["768","1024","1536","2048"]},"no_matching_cipher_action":{"type":"str","required":false,"choices":["bypass","drop"]},"cert_cache_capacity":'
+    '{"type":"int","required":false},"ssl_queue_threshold":{"type":"int","required":false},"ssl_send_empty_frags":{"type":"str","required":false,"choices":'
+    '["enable","disable"]}}}'
+)
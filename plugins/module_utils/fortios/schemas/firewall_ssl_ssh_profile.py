@@ -0,0 +1,277 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"untrusted_caname":{"type":"string","revisions":[2047,2047]},"rpc_over_'
+    'https":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"p'
+    'op3s":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"deep-inspection","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"proxy_after_tcp_handshake":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":'
+    '"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"unsupported_ssl_negotiation":{"type":"string","options":[{"value":"allow","revisions":[1'
+    '920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]},"invalid_server_cert":{"type":"string","options":[{"value":"allow","rev'
+    'isions":[120,120]},{"value":"block","revisions":[120,120]}],"revisions":[2040,120]},"cert_validation_failure":{"type":"string","options":[{"value":"al'
+    'low","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},"unsuppor'
+    'ted_ssl":{"type":"string","options":[{"value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[127,127]},{"value":"block","revisions":['
+    '127,127]}],"revisions":[2047,127]},"sni_server_cert_check":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"strict","r'
+    'evisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"allow_invalid_server_cert":{"type":"string","options":[{'
+    '"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"revoked_server_cert":{"type":"string","options":[{"v'
+    'alue":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},'
+    '"expired_server_cert":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore'
+    '","revisions":[1920,1920]}],"revisions":[1920,1920]},"untrusted_server_cert":{"type":"string","options":[{"value":"allow","revisions":[2040,2040]},{"v'
+    'alue":"block","revisions":[2040,2040]},{"value":"ignore","revisions":[2040,2040]}],"revisions":[2040,2040]},"untrusted_cert":{"type":"string","options'
+    '":[{"value":"allow","revisions":[7,7]},{"value":"block","revisions":[7,7]},{"value":"ignore","revisions":[7,7]}],"revisions":[2047,7]},"unsupported_ss'
+    'l_cipher":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]},"c'
+    'ert_validation_timeout":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"igno'
+    're","revisions":[1920,1920]}],"revisions":[1920,1920]},"client_cert_request":{"type":"string","options":[{"value":"bypass","revisions":[127,127]},{"va'
+    'lue":"inspect","revisions":[127,127]},{"value":"block","revisions":[127,127]}],"revisions":[2047,127]},"ports":{"type":"integer","revisions":[2047,204'
+    '7]},"client_certificate":{"type":"string","options":[{"value":"bypass","revisions":[1920,1920]},{"value":"inspect","revisions":[1920,1920]},{"value":"'
+    'block","revisions":[1920,1920]}],"revisions":[1920,1920]}},"revisions":[2047,2047]},"allowlist":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"caname":{"type":"string","revisions":[2047,2047]},"ftps":{"typ'
+    'e":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"deep-inspection","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"unsupported_ssl_negotiation":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","r'
+    'evisions":[1920,1920]}],"revisions":[1920,1920]},"invalid_server_cert":{"type":"string","options":[{"value":"allow","revisions":[120,120]},{"value":"b'
+    'lock","revisions":[120,120]}],"revisions":[2040,120]},"cert_validation_failure":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},'
+    '{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},"unsupported_ssl":{"type":"string","opt'
+    'ions":[{"value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[127,127]},{"value":"block","revisions":[127,127]}],"revisions":[2047,1'
+    '27]},"sni_server_cert_check":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"strict","revisions":[2040,2040]},{"value'
+    '":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"allow_invalid_server_cert":{"type":"string","options":[{"value":"enable","revisions":['
+    '7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"revoked_server_cert":{"type":"string","options":[{"value":"allow","revisions":[192'
+    '0,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},"expired_server_cert":{"type":'
+    '"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"r'
+    'evisions":[1920,1920]},"untrusted_server_cert":{"type":"string","options":[{"value":"allow","revisions":[2040,2040]},{"value":"block","revisions":[204'
+    '0,2040]},{"value":"ignore","revisions":[2040,2040]}],"revisions":[2040,2040]},"untrusted_cert":{"type":"string","options":[{"value":"allow","revisions'
+    '":[7,7]},{"value":"block","revisions":[7,7]},{"value":"ignore","revisions":[7,7]}],"revisions":[2047,7]},"unsupported_ssl_cipher":{"type":"string","op'
+    'tions":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]},"cert_validation_timeout":{"type'
+    '":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],'
+    '"revisions":[1920,1920]},"client_cert_request":{"type":"string","options":[{"value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[12'
+    '7,127]},{"value":"block","revisions":[127,127]}],"revisions":[2047,127]},"ports":{"type":"integer","revisions":[2047,2047]},"client_certificate":{"typ'
+    'e":"string","options":[{"value":"bypass","revisions":[1920,1920]},{"value":"inspect","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]'
+    '}],"revisions":[1920,1920]}},"revisions":[2047,2047]},"use_ssl_server":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value'
+    '":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"server_cert_mode":{"type":"string","options":[{"value":"re-sign","revisions":[2047,2047'
+    ']},{"value":"replace","revisions":[2047,2047]}],"revisions":[2047,2047]},"block_blocklisted_certificates":{"type":"string","options":[{"value":"disabl'
+    'e","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"ssl_negotiation_log":{"type":"string","options":[{"v'
+    'alue":"disable","revisions":[1920,1920]},{"value":"enable","revisions":[1920,1920]}],"revisions":[1920,1920]},"supported_alpn":{"type":"string","optio'
+    'ns":[{"value":"http1-1","revisions":[1024,1024]},{"value":"http2","revisions":[1024,1024]},{"value":"all","revisions":[1024,1024]},{"value":"none","re'
+    'visions":[1024,1024]}],"revisions":[1024,1024]},"https":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions"'
+    ':[2047,2047]},{"value":"certificate-inspection","revisions":[2047,2047]},{"value":"deep-inspection","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"proxy_after_tcp_handshake":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revi'
+    'sions":[1920,1920]},"unsupported_ssl_negotiation":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":['
+    '1920,1920]}],"revisions":[1920,1920]},"invalid_server_cert":{"type":"string","options":[{"value":"allow","revisions":[120,120]},{"value":"block","revi'
+    'sions":[120,120]}],"revisions":[2040,120]},"cert_probe_failure":{"type":"string","options":[{"value":"allow","revisions":[1024,1024]},{"value":"block"'
+    ',"revisions":[1024,1024]}],"revisions":[1024,1024]},"cert_validation_failure":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"'
+    'value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},"unsupported_ssl":{"type":"string","optio'
+    'ns":[{"value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[127,127]},{"value":"block","revisions":[127,127]}],"revisions":[2047,127'
+    ']},"sni_server_cert_check":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"strict","revisions":[2040,2040]},{"value":'
+    '"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"allow_invalid_server_cert":{"type":"string","options":[{"value":"enable","revisions":[7,'
+    '7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"revoked_server_cert":{"type":"string","options":[{"value":"allow","revisions":[1920,'
+    '1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},"expired_server_cert":{"type":"s'
+    'tring","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"rev'
+    'isions":[1920,1920]},"untrusted_server_cert":{"type":"string","options":[{"value":"allow","revisions":[2040,2040]},{"value":"block","revisions":[2040,'
+    '2040]},{"value":"ignore","revisions":[2040,2040]}],"revisions":[2040,2040]},"untrusted_cert":{"type":"string","options":[{"value":"allow","revisions":'
+    '[7,7]},{"value":"block","revisions":[7,7]},{"value":"ignore","revisions":[7,7]}],"revisions":[2047,7]},"unsupported_ssl_cipher":{"type":"string","opti'
+    'ons":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]},"cert_validation_timeout":{"type":'
+    '"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"r'
+    'evisions":[1920,1920]},"client_cert_request":{"type":"string","options":[{"value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[127,'
+    '127]},{"value":"block","revisions":[127,127]}],"revisions":[2047,127]},"ports":{"type":"integer","revisions":[2047,2047]},"client_certificate":{"type"'
+    ':"string","options":[{"value":"bypass","revisions":[1920,1920]},{"value":"inspect","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}]'
+    ',"revisions":[1920,1920]}},"revisions":[2047,2047]},"whitelist":{"type":"string","options":[{"value":"enable","revisions":[1023,1023]},{"value":"disab'
+    'le","revisions":[1023,1023]}],"revisions":[2047,1023]},"server_cert":{"type":"string","revisions":[2047,2047]},"mapi_over_https":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl":{"type":"dict","children'
+    '":{"unsupported_ssl_negotiation":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"rev'
+    'isions":[1920,1920]},"invalid_server_cert":{"type":"string","options":[{"value":"allow","revisions":[120,120]},{"value":"block","revisions":[120,120]}'
+    '],"revisions":[2040,120]},"cert_validation_failure":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions"'
+    ':[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},"unsupported_ssl":{"type":"string","options":[{"value":"bypass","re'
+    'visions":[127,127]},{"value":"inspect","revisions":[127,127]},{"value":"block","revisions":[127,127]}],"revisions":[2047,127]},"sni_server_cert_check"'
+    ':{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"strict","revisions":[2040,2040]},{"value":"disable","revisions":[204'
+    '0,2040]}],"revisions":[2040,2040]},"allow_invalid_server_cert":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","re'
+    'visions":[7,7]}],"revisions":[2047,7]},"revoked_server_cert":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","r'
+    'evisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},"inspect_all":{"type":"string","options":[{"value":"disabl'
+    'e","revisions":[2047,2047]},{"value":"certificate-inspection","revisions":[2047,2047]},{"value":"deep-inspection","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"untrusted_server_cert":{"type":"string","options":[{"value":"allow","revisions":[2040,2040]},{"value":"block","revisions":[2040,2040]}'
+    ',{"value":"ignore","revisions":[2040,2040]}],"revisions":[2040,2040]},"untrusted_cert":{"type":"string","options":[{"value":"allow","revisions":[7,7]}'
+    ',{"value":"block","revisions":[7,7]},{"value":"ignore","revisions":[7,7]}],"revisions":[2047,7]},"unsupported_ssl_cipher":{"type":"string","options":['
+    '{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]},"cert_validation_timeout":{"type":"strin'
+    'g","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisio'
+    'ns":[1920,1920]},"client_cert_request":{"type":"string","options":[{"value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[127,127]},'
+    '{"value":"block","revisions":[127,127]}],"revisions":[2047,127]},"expired_server_cert":{"type":"string","options":[{"value":"allow","revisions":[1920,'
+    '1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},"client_certificate":{"type":"st'
+    'ring","options":[{"value":"bypass","revisions":[1920,1920]},{"value":"inspect","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"re'
+    'visions":[1920,1920]}},"revisions":[2047,2047]},"ssl_server":{"type":"list","children":{"ssl_other_client_cert_request":{"type":"string","options":[{"'
+    'value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[127,127]},{"value":"block","revisions":[127,127]}],"revisions":[2047,127]},"smt'
+    'ps_client_certificate":{"type":"string","options":[{"value":"bypass","revisions":[1920,1920]},{"value":"inspect","revisions":[1920,1920]},{"value":"bl'
+    'ock","revisions":[1920,1920]}],"revisions":[1920,1920]},"ip":{"type":"string","revisions":[2047,2047]},"https_client_cert_request":{"type":"string","o'
+    'ptions":[{"value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[127,127]},{"value":"block","revisions":[127,127]}],"revisions":[2047'
+    ',127]},"imaps_client_cert_request":{"type":"string","options":[{"value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[127,127]},{"va'
+    'lue":"block","revisions":[127,127]}],"revisions":[2047,127]},"pop3s_client_cert_request":{"type":"string","options":[{"value":"bypass","revisions":[12'
+    '7,127]},{"value":"inspect","revisions":[127,127]},{"value":"block","revisions":[127,127]}],"revisions":[2047,127]},"ftps_client_cert_request":{"type":'
+    '"string","options":[{"value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[127,127]},{"value":"block","revisions":[127,127]}],"revis'
+    'ions":[2047,127]},"smtps_client_cert_request":{"type":"string","options":[{"value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[127'
+    ',127]},{"value":"block","revisions":[127,127]}],"revisions":[2047,127]},"ssl_other_client_certificate":{"type":"string","options":[{"value":"bypass","'
+    'revisions":[1920,1920]},{"value":"inspect","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]},"ftps_client_c'
+    'ertificate":{"type":"string","options":[{"value":"bypass","revisions":[1920,1920]},{"value":"inspect","revisions":[1920,1920]},{"value":"block","revis'
+    'ions":[1920,1920]}],"revisions":[1920,1920]},"pop3s_client_certificate":{"type":"string","options":[{"value":"bypass","revisions":[1920,1920]},{"value'
+    '":"inspect","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]},"id":{"type":"integer","revisions":[2047,2047'
+    ']},"imaps_client_certificate":{"type":"string","options":[{"value":"bypass","revisions":[1920,1920]},{"value":"inspect","revisions":[1920,1920]},{"val'
+    'ue":"block","revisions":[1920,1920]}],"revisions":[1920,1920]},"https_client_certificate":{"type":"string","options":[{"value":"bypass","revisions":[1'
+    '920,1920]},{"value":"inspect","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]}},"revisions":[2047,2047]},"'
+    'ssh":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"deep-inspection","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"proxy_after_tcp_handshake":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"'
+    'disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"ssh_policy_check":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"val'
+    'ue":"enable","revisions":[7,7]}],"revisions":[2047,7]},"ssh_tun_policy_check":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},'
+    '{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssh_algorithm":{"type":"string","options":[{"value":"compatible","revisions":[20'
+    '47,2047]},{"value":"high-encryption","revisions":[2047,2047]}],"revisions":[2047,2047]},"inspect_all":{"type":"string","options":[{"value":"disable","'
+    'revisions":[2047,2047]},{"value":"deep-inspection","revisions":[2047,2047]}],"revisions":[2047,2047]},"unsupported_version":{"type":"string","options"'
+    ':[{"value":"bypass","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"ports":{"type":"integer","revisions"'
+    ':[2047,2047]}},"revisions":[2047,2047]},"block_blacklisted_certificates":{"type":"string","options":[{"value":"disable","revisions":[1016,1016]},{"val'
+    'ue":"enable","revisions":[1016,1016]}],"revisions":[2040,1016]},"ssl_exemptions_log":{"type":"string","options":[{"value":"disable","revisions":[2047,'
+    '2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"ssl_exempt":{"type":"lis'
+    't","children":{"regex":{"type":"string","revisions":[2047,2047]},"wildcard_fqdn":{"type":"string","revisions":[2047,2047]},"address6":{"type":"string"'
+    ',"revisions":[2047,2047]},"address":{"type":"string","revisions":[2047,2047]},"fortiguard_category":{"type":"integer","revisions":[2047,2047]},"type":'
+    '{"type":"string","options":[{"value":"fortiguard-category","revisions":[2047,2047]},{"value":"address","revisions":[2047,2047]},{"value":"address6","r'
+    'evisions":[2047,2047]},{"value":"wildcard-fqdn","revisions":[2047,2047]},{"value":"regex","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"ty'
+    'pe":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"smtps":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"dis'
+    'able","revisions":[2047,2047]},{"value":"deep-inspection","revisions":[2047,2047]}],"revisions":[2047,2047]},"proxy_after_tcp_handshake":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"unsupported_ssl_negot'
+    'iation":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]},"inv'
+    'alid_server_cert":{"type":"string","options":[{"value":"allow","revisions":[120,120]},{"value":"block","revisions":[120,120]}],"revisions":[2040,120]}'
+    ',"cert_validation_failure":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"i'
+    'gnore","revisions":[1920,1920]}],"revisions":[1920,1920]},"unsupported_ssl":{"type":"string","options":[{"value":"bypass","revisions":[127,127]},{"val'
+    'ue":"inspect","revisions":[127,127]},{"value":"block","revisions":[127,127]}],"revisions":[2047,127]},"sni_server_cert_check":{"type":"string","option'
+    's":[{"value":"enable","revisions":[2040,2040]},{"value":"strict","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[20'
+    '40,2040]},"allow_invalid_server_cert":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisio'
+    'ns":[2047,7]},"revoked_server_cert":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"'
+    'value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},"expired_server_cert":{"type":"string","options":[{"value":"allow","revisions":[192'
+    '0,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},"untrusted_server_cert":{"type'
+    '":"string","options":[{"value":"allow","revisions":[2040,2040]},{"value":"block","revisions":[2040,2040]},{"value":"ignore","revisions":[2040,2040]}],'
+    '"revisions":[2040,2040]},"untrusted_cert":{"type":"string","options":[{"value":"allow","revisions":[7,7]},{"value":"block","revisions":[7,7]},{"value"'
+    ':"ignore","revisions":[7,7]}],"revisions":[2047,7]},"unsupported_ssl_cipher":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"v'
+    'alue":"block","revisions":[1920,1920]}],"revisions":[1920,1920]},"cert_validation_timeout":{"type":"string","options":[{"value":"allow","revisions":[1'
+    '920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},"client_cert_request":{"type'
+    '":"string","options":[{"value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[127,127]},{"value":"block","revisions":[127,127]}],"rev'
+    'isions":[2047,127]},"ports":{"type":"integer","revisions":[2047,2047]},"client_certificate":{"type":"string","options":[{"value":"bypass","revisions":'
+    '[1920,1920]},{"value":"inspect","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]}},"revisions":[2047,2047]}'
+    ',"imaps":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"deep-inspection","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"proxy_after_tcp_handshake":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"valu'
+    'e":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"unsupported_ssl_negotiation":{"type":"string","options":[{"value":"allow","revisions"'
+    ':[1920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]},"invalid_server_cert":{"type":"string","options":[{"value":"allow","'
+    'revisions":[120,120]},{"value":"block","revisions":[120,120]}],"revisions":[2040,120]},"cert_validation_failure":{"type":"string","options":[{"value":'
+    '"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920]},"unsup'
+    'ported_ssl":{"type":"string","options":[{"value":"bypass","revisions":[127,127]},{"value":"inspect","revisions":[127,127]},{"value":"block","revisions'
+    '":[127,127]}],"revisions":[2047,127]},"sni_server_cert_check":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"strict"'
+    ',"revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"allow_invalid_server_cert":{"type":"string","options"'
+    ':[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"revoked_server_cert":{"type":"string","options":['
+    '{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ignore","revisions":[1920,1920]}],"revisions":[1920,1920'
+    ']},"expired_server_cert":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"ign'
+    'ore","revisions":[1920,1920]}],"revisions":[1920,1920]},"untrusted_server_cert":{"type":"string","options":[{"value":"allow","revisions":[2040,2040]},'
+    '{"value":"block","revisions":[2040,2040]},{"value":"ignore","revisions":[2040,2040]}],"revisions":[2040,2040]},"untrusted_cert":{"type":"string","opti'
+    'ons":[{"value":"allow","revisions":[7,7]},{"value":"block","revisions":[7,7]},{"value":"ignore","revisions":[7,7]}],"revisions":[2047,7]},"unsupported'
+    '_ssl_cipher":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]}'
+    ',"cert_validation_timeout":{"type":"string","options":[{"value":"allow","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]},{"value":"i'
+    'gnore","revisions":[1920,1920]}],"revisions":[1920,1920]},"client_cert_request":{"type":"string","options":[{"value":"bypass","revisions":[127,127]},{'
+    '"value":"inspect","revisions":[127,127]},{"value":"block","revisions":[127,127]}],"revisions":[2047,127]},"ports":{"type":"integer","revisions":[2047,'
+    '2047]},"client_certificate":{"type":"string","options":[{"value":"bypass","revisions":[1920,1920]},{"value":"inspect","revisions":[1920,1920]},{"value'
+    '":"block","revisions":[1920,1920]}],"revisions":[1920,1920]}},"revisions":[2047,2047]},"ssl_anomalies_log":{"type":"string","options":[{"value":"disab'
+    'le","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dot":{"type":"dict","children":{"status":{"type":"s'
+    'tring","options":[{"value":"disable","revisions":[1024,1024]},{"value":"deep-inspection","revisions":[1024,1024]}],"revisions":[1024,1024]},"proxy_aft'
+    'er_tcp_handshake":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[102'
+    '4,1024]},"unsupported_ssl_negotiation":{"type":"string","options":[{"value":"allow","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]}'
+    '],"revisions":[1024,1024]},"cert_validation_failure":{"type":"string","options":[{"value":"allow","revisions":[1024,1024]},{"value":"block","revisions'
+    '":[1024,1024]},{"value":"ignore","revisions":[1024,1024]}],"revisions":[1024,1024]},"revoked_server_cert":{"type":"string","options":[{"value":"allow"'
+    ',"revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"ignore","revisions":[1024,1024]}],"revisions":[1024,1024]},"expired_serv'
+    'er_cert":{"type":"string","options":[{"value":"allow","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"ignore","revisions"'
+    ':[1024,1024]}],"revisions":[1024,1024]},"untrusted_server_cert":{"type":"string","options":[{"value":"allow","revisions":[1024,1024]},{"value":"block"'
+    ',"revisions":[1024,1024]},{"value":"ignore","revisions":[1024,1024]}],"revisions":[1024,1024]},"unsupported_ssl_cipher":{"type":"string","options":[{"'
+    'value":"allow","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]}],"revisions":[1024,1024]},"cert_validation_timeout":{"type":"string"'
+    ',"options":[{"value":"allow","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]},{"value":"ignore","revisions":[1024,1024]}],"revisions'
+    '":[1024,1024]},"sni_server_cert_check":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"strict","revisions":[1024,1024'
+    ']},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"client_certificate":{"type":"string","options":[{"value":"bypass","revisions'
+    '":[1024,1024]},{"value":"inspect","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024'
+    ']}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"untrusted_caname":{"type":"str","required":false},"rpc_over_http'
+    's":{"type":"str","required":false,"choices":["enable","disable"]},"pop3s":{"type":"dict","required":false,"options":{"status":{"type":"str","required"'
+    ':false,"choices":["disable","deep-inspection"]},"proxy_after_tcp_handshake":{"type":"str","required":false,"choices":["enable","disable"]},"unsupporte'
+    'd_ssl_negotiation":{"type":"str","required":false,"choices":["allow","block"]},"invalid_server_cert":{"type":"str","required":false},"cert_validation_'
+    'failure":{"type":"str","required":false,"choices":["allow","block","ignore"]},"unsupported_ssl":{"type":"str","required":false},"sni_server_cert_check'
+    '":{"type":"str","required":false,"choices":["enable","strict","disable"]},"allow_invalid_server_cert":{"type":"str","required":false},"revoked_server_'
+    'cert":{"type":"str","required":false,"choices":["allow","block","ignore"]},"expired_server_cert":{"type":"str","required":false,"choices":["allow","bl'
+    'ock","ignore"]},"untrusted_server_cert":{"type":"str","required":false,"choices":["allow","block","ignore"]},"untrusted_cert":{"type":"str","required"'
+    ':false},"unsupported_ssl_cipher":{"type":"str","required":false,"choices":["allow","block"]},"cert_validation_timeout":{"type":"str","required":false,'
+    '"choices":["allow","block","ignore"]},"client_cert_request":{"type":"str","required":false},"ports":{"type":"int","required":false},"client_certificat'
+    'e":{"type":"str","required":false,"choices":["bypass","inspect","block"]}}},"allowlist":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"caname":{"type":"str","required":false},"ftps":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disabl'
+    'e","deep-inspection"]},"unsupported_ssl_negotiation":{"type":"str","required":false,"choices":["allow","block"]},"invalid_server_cert":{"type":"str","'
+    'required":false},"cert_validation_failure":{"type":"str","required":false,"choices":["allow","block","ignore"]},"unsupported_ssl":{"type":"str","requi'
+    'red":false},"sni_server_cert_check":{"type":"str","required":false,"choices":["enable","strict","disable"]},"allow_invalid_server_cert":{"type":"str",'
+    '"required":false},"revoked_server_cert":{"type":"str","required":false,"choices":["allow","block","ignore"]},"expired_server_cert":{"type":"str","requ'
+    'ired":false,"choices":["allow","block","ignore"]},"untrusted_server_cert":{"type":"str","required":false,"choices":["allow","block","ignore"]},"untrus'
+    'ted_cert":{"type":"str","required":false},"unsupported_ssl_cipher":{"type":"str","required":false,"choices":["allow","block"]},"cert_validation_timeou'
+    't":{"type":"str","required":false,"choices":["allow","block","ignore"]},"client_cert_request":{"type":"str","required":false},"ports":{"type":"int","r'
+    'equired":false},"client_certificate":{"type":"str","required":false,"choices":["bypass","inspect","block"]}}},"use_ssl_server":{"type":"str","required'
+    '":false,"choices":["disable","enable"]},"server_cert_mode":{"type":"str","required":false,"choices":["re-sign","replace"]},"block_blocklisted_certific'
+    'ates":{"type":"str","required":false,"choices":["disable","enable"]},"ssl_negotiation_log":{"type":"str","required":false,"choices":["disable","enable'
+    '"]},"supported_alpn":{"type":"str","required":false,"choices":["http1-1","http2","all","none"]},"https":{"type":"dict","required":false,"options":{"st'
+    'atus":{"type":"str","required":false,"choices":["disable","certificate-inspection","deep-inspection"]},"proxy_after_tcp_handshake":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"unsupported_ssl_negotiation":{"type":"str","required":false,"choices":["allow","block"]},"invalid_server_'
+    'cert":{"type":"str","required":false},"cert_probe_failure":{"type":"str","required":false,"choices":["allow","block"]},"cert_validation_failure":{"typ'
+    'e":"str","required":false,"choices":["allow","block","ignore"]},"unsupported_ssl":{"type":"str","required":false},"sni_server_cert_check":{"type":"str'
+    '","required":false,"choices":["enable","strict","disable"]},"allow_invalid_server_cert":{"type":"str","required":false},"revoked_server_cert":{"type":'
+    '"str","required":false,"choices":["allow","block","ignore"]},"expired_server_cert":{"type":"str","required":false,"choices":["allow","block","ignore"]'
+    '},"untrusted_server_cert":{"type":"str","required":false,"choices":["allow","block","ignore"]},"untrusted_cert":{"type":"str","required":false},"unsup'
+    'ported_ssl_cipher":{"type":"str","required":false,"choices":["allow","block"]},"cert_validation_timeout":{"type":"str","required":false,"choices":["al'
+    'low","block","ignore"]},"client_cert_request":{"type":"str","required":false},"ports":{"type":"int","required":false},"client_certificate":{"type":"st'
+    'r","required":false,"choices":["bypass","inspect","block"]}}},"whitelist":{"type":"str","required":false},"server_cert":{"type":"str","required":false'
+    '},"mapi_over_https":{"type":"str","required":false,"choices":["enable","disable"]},"ssl":{"type":"dict","required":false,"options":{"unsupported_ssl_n'
+    'egotiation":{"type":"str","required":false,"choices":["allow","block"]},"invalid_server_cert":{"type":"str","required":false},"cert_validation_failure'
+    '":{"type":"str","required":false,"choices":["allow","block","ignore"]},"unsupported_ssl":{"type":"str","required":false},"sni_server_cert_check":{"typ'
+    'e":"str","required":false,"choices":["enable","strict","disable"]},"allow_invalid_server_cert":{"type":"str","required":false},"revoked_server_cert":{'
+    '"type":"str","required":false,"choices":["allow","block","ignore"]},"inspect_all":{"type":"str","required":false,"choices":["disable","certificate-ins'
+    'pection","deep-inspection"]},"untrusted_server_cert":{"type":"str","required":false,"choices":["allow","block","ignore"]},"untrusted_cert":{"type":"st'
+    'r","required":false},"unsupported_ssl_cipher":{"type":"str","required":false,"choices":["allow","block"]},"cert_validation_timeout":{"type":"str","req'
+    'uired":false,"choices":["allow","block","ignore"]},"client_cert_request":{"type":"str","required":false},"expired_server_cert":{"type":"str","required'
+    '":false,"choices":["allow","block","ignore"]},"client_certificate":{"type":"str","required":false,"choices":["bypass","inspect","block"]}}},"ssl_serve'
+    'r":{"type":"list","required":false,"options":{"ssl_other_client_cert_request":{"type":"str","required":false},"smtps_client_certificate":{"type":"str"'
+    ',"required":false,"choices":["bypass","inspect","block"]},"ip":{"type":"str","required":false},"https_client_cert_request":{"type":"str","required":fa'
+    'lse},"imaps_client_cert_request":{"type":"str","required":false},"pop3s_client_cert_request":{"type":"str","required":false},"ftps_client_cert_request'
+    '":{"type":"str","required":false},"smtps_client_cert_request":{"type":"str","required":false},"ssl_other_client_certificate":{"type":"str","required":'
+    'false,"choices":["bypass","inspect","block"]},"ftps_client_certificate":{"type":"str","required":false,"choices":["bypass","inspect","block"]},"pop3s_'
+    'client_certificate":{"type":"str","required":false,"choices":["bypass","inspect","block"]},"id":{"type":"int","required":false},"imaps_client_certific'
+    'ate":{"type":"str","required":false,"choices":["bypass","inspect","block"]},"https_client_certificate":{"type":"str","required":false,"choices":["bypa'
+    'ss","inspect","block"]}}},"ssh":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","deep-inspecti'
+    'on"]},"proxy_after_tcp_handshake":{"type":"str","required":false,"choices":["enable","disable"]},"ssh_policy_check":{"type":"str","required":false},"s'
+    'sh_tun_policy_check":{"type":"str","required":false,"choices":["disable","enable"]},"ssh_algorithm":{"type":"str","required":false,"choices":["compati'
+    'ble","high-encryption"]},"inspect_all":{"type":"str","required":false,"choices":["disable","deep-inspection"]},"unsupported_version":{"type":"str","re'
+    'quired":false,"choices":["bypass","block"]},"ports":{"type":"int","required":false}}},"block_blacklisted_certificates":{"type":"str","required":false}'
+    ',"ssl_exemptions_log":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","required":false},"ssl_exempt":{"type":"list'
+    '","required":false,"options":{"regex":{"type":"str","required":false},"wildcard_fqdn":{"type":"str","required":false},"address6":{"type":"str","requir'
+    'ed":false},"address":{"type":"str","required":false},"fortiguard_category":{"type":"int","required":false},"type":{"type":"str","required":false,"choi'
+    'ces":["fortiguard-category","address","address6","wildcard-fqdn","regex"]},"id":{"type":"int","required":false}}},"smtps":{"type":"dict","required":fa'
+    'lse,"options":{"status":{"type":"str","required":false,"choices":["disable","deep-inspection"]},"proxy_after_tcp_handshake":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"unsupported_ssl_negotiation":{"type":"str","required":false,"choices":["allow","block"]},"invalid_server_cert":{'
+    '"type":"str","required":false},"cert_validation_failure":{"type":"str","required":false,"choices":["allow","block","ignore"]},"unsupported_ssl":{"type'
+    '":"str","required":false},"sni_server_cert_check":{"type":"str","required":false,"choices":["enable","strict","disable"]},"allow_invalid_server_cert":'
+    '{"type":"str","required":false},"revoked_server_cert":{"type":"str","required":false,"choices":["allow","block","ignore"]},"expired_server_cert":{"typ'
+    'e":"str","required":false,"choices":["allow","block","ignore"]},"untrusted_server_cert":{"type":"str","required":false,"choices":["allow","block","ign'
+    'ore"]},"untrusted_cert":{"type":"str","required":false},"unsupported_ssl_cipher":{"type":"str","required":false,"choices":["allow","block"]},"cert_val'
+    'idation_timeout":{"type":"str","required":false,"choices":["allow","block","ignore"]},"client_cert_request":{"type":"str","required":false},"ports":{"'
+    'type":"int","required":false},"client_certificate":{"type":"str","required":false,"choices":["bypass","inspect","block"]}}},"imaps":{"type":"dict","re'
+    'quired":false,"options":{"status":{"type":"str","required":false,"choices":["disable","deep-inspection"]},"proxy_after_tcp_handshake":{"type":"str","r'
+    'equired":false,"choices":["enable","disable"]},"unsupported_ssl_negotiation":{"type":"str","required":false,"choices":["allow","block"]},"invalid_serv'
+    'er_cert":{"type":"str","required":false},"cert_validation_failure":{"type":"str","required":false,"choices":["allow","block","ignore"]},"unsupported_s'
+    'sl":{"type":"str","required":false},"sni_server_cert_check":{"type":"str","required":false,"choices":["enable","strict","disable"]},"allow_invalid_ser'
+    'ver_cert":{"type":"str","required":false},"revoked_server_cert":{"type":"str","required":false,"choices":["allow","block","ignore"]},"expired_server_c'
+    'ert":{"type":"str","required":false,"choices":["allow","block","ignore"]},"untrusted_server_cert":{"type":"str","required":false,"choices":["allow","b'
+    'lock","ignore"]},"untrusted_cert":{"type":"str","required":false},"unsupported_ssl_cipher":{"type":"str","required":false,"choices":["allow","block"]}'
+    ',"cert_validation_timeout":{"type":"str","required":false,"choices":["allow","block","ignore"]},"client_cert_request":{"type":"str","required":false},'
+    '"ports":{"type":"int","required":false},"client_certificate":{"type":"str","required":false,"choices":["bypass","inspect","block"]}}},"ssl_anomalies_l'
+    'og":{"type":"str","required":false,"choices":["disable","enable"]},"dot":{"type":"dict","required":false,"options":{"status":{"type":"str","required":'
+    'false,"choices":["disable","deep-inspection"]},"proxy_after_tcp_handshake":{"type":"str","required":false,"choices":["enable","disable"]},"unsupported'
+    '_ssl_negotiation":{"type":"str","required":false,"choices":["allow","block"]},"cert_validation_failure":{"type":"str","required":false,"choices":["all'
+    'ow","block","ignore"]},"revoked_server_cert":{"type":"str","required":false,"choices":["allow","block","ignore"]},"expired_server_cert":{"type":"str",'
+    '"required":false,"choices":["allow","block","ignore"]},"untrusted_server_cert":{"type":"str","required":false,"choices":["allow","block","ignore"]},"u'
+    'nsupported_ssl_cipher":{"type":"str","required":false,"choices":["allow","block"]},"cert_validation_timeout":{"type":"str","required":false,"choices":'
+    '["allow","block","ignore"]},"sni_server_cert_check":{"type":"str","required":false,"choices":["enable","strict","disable"]},"client_certificate":{"typ'
+    'e":"str","required":false,"choices":["bypass","inspect","block"]}}}}}'
+)
@@ -0,0 +1,12 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"class_id":{"type":"integer","revisions":[2040,2040]},"class_name":{"type":"string","revisions":[2040,2040]}},"revisions":['
+    '2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"class_id":{"type":"int","required":false},"class_name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"service":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"schedule":'
+    '{"type":"string","revisions":[2047,2047]},"srcaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,204'
+    '7]},"srcintf":{"type":"string","revisions":[2047,2047]},"ttl":{"type":"string","revisions":[2047,2047]},"action":{"type":"string","options":[{"value":'
+    '"accept","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},'
+    '"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"service":{"type":"list","required"'
+    ':false,"options":{"name":{"type":"str","required":false}}},"schedule":{"type":"str","required":false},"srcaddr":{"type":"list","required":false,"optio'
+    'ns":{"name":{"type":"str","required":false}}},"srcintf":{"type":"str","required":false},"ttl":{"type":"str","required":false},"action":{"type":"str","'
+    'required":false,"choices":["accept","deny"]},"id":{"type":"int","required":false}}}'
+)
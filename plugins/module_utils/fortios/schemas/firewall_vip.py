@@ -0,0 +1,206 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"ssl_hpkp_backup":{"type":"string","revisions":[2047,2047]},"ssl_client'
+    '_session_state_type":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"time","revisions":[2047,2047]},{"value":"count"'
+    ',"revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]}],"revisions":[2047,2047]},"protocol":{"type":"string","options":[{"value":"tcp","re'
+    'visions":[2047,2047]},{"value":"udp","revisions":[2047,2047]},{"value":"sctp","revisions":[2047,2047]},{"value":"icmp","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"ssl_hsts":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"max_embryonic_connections":{"type":"integer","revisions":[2047,2047]},"color":{"type":"integer","revisions":[2047,2047]},"ssl_s'
+    'erver_min_version":{"type":"string","options":[{"value":"ssl-3.0","revisions":[2047,2047]},{"value":"tls-1.0","revisions":[2047,2047]},{"value":"tls-1'
+    '.1","revisions":[2047,2047]},{"value":"tls-1.2","revisions":[2047,2047]},{"value":"client","revisions":[2047,2047]},{"value":"tls-1.3","revisions":[20'
+    '40,2040]}],"revisions":[2047,2047]},"ssl_hpkp_primary":{"type":"string","revisions":[2047,2047]},"http_cookie_generation":{"type":"integer","revisions'
+    '":[2047,2047]},"http_cookie_domain":{"type":"string","revisions":[2047,2047]},"ssl_cipher_suites":{"type":"list","children":{"priority":{"type":"integ'
+    'er","revisions":[2047,2047]},"cipher":{"type":"string","options":[{"value":"TLS-ECDHE-RSA-WITH-CHACHA20-POLY1305-SHA256","revisions":[2047,2047]},{"va'
+    'lue":"TLS-ECDHE-ECDSA-WITH-CHACHA20-POLY1305-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-CHACHA20-POLY1305-SHA256","revisions":[2047,2'
+    '047]},{"value":"TLS-DHE-RSA-WITH-AES-128-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-AES-256-CBC-SHA","revisions":[2047,2047]},{"valu'
+    'e":"TLS-DHE-RSA-WITH-AES-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-AES-128-GCM-SHA256","revisions":[2047,2047]},{"value":"TL'
+    'S-DHE-RSA-WITH-AES-256-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-AES-256-GCM-SHA384","revisions":[2047,2047]},{"value":"TLS-DHE-'
+    'DSS-WITH-AES-128-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-AES-256-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-AES'
+    '-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-AES-128-GCM-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-AES-256-C'
+    'BC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-AES-256-GCM-SHA384","revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-AES-128-CBC-S'
+    'HA","revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-AES-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-AES-128-GCM-SHA256'
+    '","revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-AES-256-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-AES-256-CBC-SHA384","re'
+    'visions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-AES-256-GCM-SHA384","revisions":[2047,2047]},{"value":"TLS-ECDHE-ECDSA-WITH-AES-128-CBC-SHA","revis'
+    'ions":[2047,2047]},{"value":"TLS-ECDHE-ECDSA-WITH-AES-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-ECDHE-ECDSA-WITH-AES-128-GCM-SHA256","rev'
+    'isions":[2047,2047]},{"value":"TLS-ECDHE-ECDSA-WITH-AES-256-CBC-SHA384","revisions":[2047,2047]},{"value":"TLS-ECDHE-ECDSA-WITH-AES-256-GCM-SHA384","r'
+    'evisions":[2047,2047]},{"value":"TLS-RSA-WITH-AES-128-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-AES-256-CBC-SHA","revisions":[2047,2047'
+    ']},{"value":"TLS-RSA-WITH-AES-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-AES-128-GCM-SHA256","revisions":[2047,2047]},{"value":"T'
+    'LS-RSA-WITH-AES-256-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-AES-256-GCM-SHA384","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-CA'
+    'MELLIA-128-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-CAMELLIA-256-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-CAMELLIA-128'
+    '-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-CAMELLIA-256-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-3DES-EDE-CBC'
+    '-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-CAMELLIA-128-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-CAMELLIA-128-CBC-S'
+    'HA","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-CAMELLIA-256-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-CAMELLIA-256-CBC-SHA'
+    '","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-CAMELLIA-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-CAMELLIA-128-CBC-SH'
+    'A256","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-CAMELLIA-256-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-CAMELLIA-256-CB'
+    'C-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-SEED-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-SEED-CBC-SHA","revisio'
+    'ns":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-ARIA-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-ARIA-256-CBC-SHA384","revisions":'
+    '[2047,2047]},{"value":"TLS-DHE-DSS-WITH-ARIA-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-ARIA-256-CBC-SHA384","revisions":[204'
+    '7,2047]},{"value":"TLS-RSA-WITH-SEED-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-ARIA-128-CBC-SHA256","revisions":[2047,2047]},{"value":"'
+    'TLS-RSA-WITH-ARIA-256-CBC-SHA384","revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-ARIA-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-EC'
+    'DHE-RSA-WITH-ARIA-256-CBC-SHA384","revisions":[2047,2047]},{"value":"TLS-ECDHE-ECDSA-WITH-ARIA-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-'
+    'ECDHE-ECDSA-WITH-ARIA-256-CBC-SHA384","revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-RC4-128-SHA","revisions":[2047,2047]},{"value":"TLS-ECDHE-'
+    'RSA-WITH-3DES-EDE-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-3DES-EDE-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-3DES-'
+    'EDE-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-RC4-128-MD5","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-RC4-128-SHA","revisions":[20'
+    '47,2047]},{"value":"TLS-DHE-RSA-WITH-DES-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-DES-CBC-SHA","revisions":[2047,2047]},{"value":"'
+    'TLS-RSA-WITH-DES-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-AES-128-GCM-SHA256","revisions":[2040,2040]},{"value":"TLS-AES-256-GCM-SHA384","revis'
+    'ions":[2040,2040]},{"value":"TLS-CHACHA20-POLY1305-SHA256","revisions":[2040,2040]}],"revisions":[2047,2047]},"versions":{"multiple_values":true,"type'
+    '":"list","options":[{"value":"ssl-3.0","revisions":[2047,2047]},{"value":"tls-1.0","revisions":[2047,2047]},{"value":"tls-1.1","revisions":[2047,2047]'
+    '},{"value":"tls-1.2","revisions":[2047,2047]},{"value":"tls-1.3","revisions":[2040,2040]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"dns_map'
+    'ping_ttl":{"type":"integer","revisions":[2047,2047]},"portmapping_type":{"type":"string","options":[{"value":"1-to-1","revisions":[2047,2047]},{"value'
+    '":"m-to-n","revisions":[2047,2047]}],"revisions":[2047,2047]},"arp_reply":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"va'
+    'lue":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"http_redirect":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]'
+    '},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"mappedip":{"type":"list","children":{"range":{"type":"string","revisions":[20'
+    '47,2047]}},"revisions":[2047,2047]},"ssl_max_version":{"type":"string","options":[{"value":"ssl-3.0","revisions":[2047,2047]},{"value":"tls-1.0","revi'
+    'sions":[2047,2047]},{"value":"tls-1.1","revisions":[2047,2047]},{"value":"tls-1.2","revisions":[2047,2047]},{"value":"tls-1.3","revisions":[2040,2040]'
+    '}],"revisions":[2047,2047]},"ssl_mode":{"type":"string","options":[{"value":"half","revisions":[2047,2047]},{"value":"full","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"portforward":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"http_ip_header_name":{"type":"string","revisions":[2047,2047]},"ssl_htt'
+    'p_location_conversion":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"ssl_algorithm":{"type":"string","options":[{"value":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value"'
+    ':"low","revisions":[2047,2047]},{"value":"custom","revisions":[2047,2047]}],"revisions":[2047,2047]},"extip":{"type":"string","revisions":[2047,2047]}'
+    ',"uuid":{"type":"string","revisions":[2047,2047]},"service":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":['
+    '2047,2047]},"ssl_client_rekey_count":{"type":"integer","revisions":[2040,2040]},"ssl_hpkp":{"type":"string","options":[{"value":"disable","revisions":'
+    '[2047,2047]},{"value":"enable","revisions":[2047,2047]},{"value":"report-only","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_http_match_host'
+    '":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"monito'
+    'r":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"ssl_hpkp_include_subdomains":{"type":"string'
+    '","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_hsts_age":{"type":"'
+    'integer","revisions":[2047,2047]},"ssl_hpkp_age":{"type":"integer","revisions":[2047,2047]},"http_cookie_domain_from_host":{"type":"string","options":'
+    '[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_dh_bits":{"type":"string","opti'
+    'ons":[{"value":"768","revisions":[2047,2047]},{"value":"1024","revisions":[2047,2047]},{"value":"1536","revisions":[2047,2047]},{"value":"2048","revis'
+    'ions":[2047,2047]},{"value":"3072","revisions":[2047,2047]},{"value":"4096","revisions":[2047,2047]}],"revisions":[2047,2047]},"mappedport":{"type":"s'
+    'tring","revisions":[2047,2047]},"ssl_server_cipher_suites":{"type":"list","children":{"priority":{"type":"integer","revisions":[2047,2047]},"cipher":{'
+    '"type":"string","options":[{"value":"TLS-ECDHE-RSA-WITH-CHACHA20-POLY1305-SHA256","revisions":[2047,2047]},{"value":"TLS-ECDHE-ECDSA-WITH-CHACHA20-POL'
+    'Y1305-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-CHACHA20-POLY1305-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-AES-12'
+    '8-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-AES-256-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-AES-128-CBC-SHA256'
+    '","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-AES-128-GCM-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-AES-256-CBC-SHA256","rev'
+    'isions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-AES-256-GCM-SHA384","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-AES-128-CBC-SHA","revisions":['
+    '2047,2047]},{"value":"TLS-DHE-DSS-WITH-AES-256-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-AES-128-CBC-SHA256","revisions":[2047,2047'
+    ']},{"value":"TLS-DHE-DSS-WITH-AES-128-GCM-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-AES-256-CBC-SHA256","revisions":[2047,2047]},{"v'
+    'alue":"TLS-DHE-DSS-WITH-AES-256-GCM-SHA384","revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-AES-128-CBC-SHA","revisions":[2047,2047]},{"value":"'
+    'TLS-ECDHE-RSA-WITH-AES-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-AES-128-GCM-SHA256","revisions":[2047,2047]},{"value":"TL'
+    'S-ECDHE-RSA-WITH-AES-256-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-AES-256-CBC-SHA384","revisions":[2047,2047]},{"value":"TLS-ECD'
+    'HE-RSA-WITH-AES-256-GCM-SHA384","revisions":[2047,2047]},{"value":"TLS-ECDHE-ECDSA-WITH-AES-128-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-ECDHE-'
+    'ECDSA-WITH-AES-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-ECDHE-ECDSA-WITH-AES-128-GCM-SHA256","revisions":[2047,2047]},{"value":"TLS-ECDH'
+    'E-ECDSA-WITH-AES-256-CBC-SHA384","revisions":[2047,2047]},{"value":"TLS-ECDHE-ECDSA-WITH-AES-256-GCM-SHA384","revisions":[2047,2047]},{"value":"TLS-RS'
+    'A-WITH-AES-128-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-AES-256-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-AES-128-CBC-S'
+    'HA256","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-AES-128-GCM-SHA256","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-AES-256-CBC-SHA256","revisi'
+    'ons":[2047,2047]},{"value":"TLS-RSA-WITH-AES-256-GCM-SHA384","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-CAMELLIA-128-CBC-SHA","revisions":[2047,2'
+    '047]},{"value":"TLS-RSA-WITH-CAMELLIA-256-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-CAMELLIA-128-CBC-SHA256","revisions":[2047,2047]},{'
+    '"value":"TLS-RSA-WITH-CAMELLIA-256-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-3DES-EDE-CBC-SHA","revisions":[2047,2047]},{"value"'
+    ':"TLS-DHE-RSA-WITH-CAMELLIA-128-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-CAMELLIA-128-CBC-SHA","revisions":[2047,2047]},{"value":"'
+    'TLS-DHE-RSA-WITH-CAMELLIA-256-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-CAMELLIA-256-CBC-SHA","revisions":[2047,2047]},{"value":"TL'
+    'S-DHE-RSA-WITH-CAMELLIA-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-CAMELLIA-128-CBC-SHA256","revisions":[2047,2047]},{"value"'
+    ':"TLS-DHE-RSA-WITH-CAMELLIA-256-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-CAMELLIA-256-CBC-SHA256","revisions":[2047,2047]},{"va'
+    'lue":"TLS-DHE-RSA-WITH-SEED-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-SEED-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-'
+    'WITH-ARIA-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-ARIA-256-CBC-SHA384","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH'
+    '-ARIA-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-ARIA-256-CBC-SHA384","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-SEED-CB'
+    'C-SHA","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-ARIA-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-ARIA-256-CBC-SHA384","revi'
+    'sions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-ARIA-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-ARIA-256-CBC-SHA384","revi'
+    'sions":[2047,2047]},{"value":"TLS-ECDHE-ECDSA-WITH-ARIA-128-CBC-SHA256","revisions":[2047,2047]},{"value":"TLS-ECDHE-ECDSA-WITH-ARIA-256-CBC-SHA384","'
+    'revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-RC4-128-SHA","revisions":[2047,2047]},{"value":"TLS-ECDHE-RSA-WITH-3DES-EDE-CBC-SHA","revisions":'
+    '[2047,2047]},{"value":"TLS-DHE-DSS-WITH-3DES-EDE-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-3DES-EDE-CBC-SHA","revisions":[2047,2047]},{'
+    '"value":"TLS-RSA-WITH-RC4-128-MD5","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-RC4-128-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-RSA-WITH-DE'
+    'S-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-DHE-DSS-WITH-DES-CBC-SHA","revisions":[2047,2047]},{"value":"TLS-RSA-WITH-DES-CBC-SHA","revisions":['
+    '2047,2047]},{"value":"TLS-AES-128-GCM-SHA256","revisions":[2040,2040]},{"value":"TLS-AES-256-GCM-SHA384","revisions":[2040,2040]},{"value":"TLS-CHACHA'
+    '20-POLY1305-SHA256","revisions":[2040,2040]}],"revisions":[2047,2047]},"versions":{"multiple_values":true,"type":"list","options":[{"value":"ssl-3.0",'
+    '"revisions":[2047,2047]},{"value":"tls-1.0","revisions":[2047,2047]},{"value":"tls-1.1","revisions":[2047,2047]},{"value":"tls-1.2","revisions":[2047,'
+    '2047]},{"value":"tls-1.3","revisions":[2040,2040]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"st'
+    'atic-nat","revisions":[2047,2047]},{"value":"load-balance","revisions":[2047,2047]},{"value":"server-load-balance","revisions":[2047,2047]},{"value":"'
+    'dns-translation","revisions":[2047,2047]},{"value":"fqdn","revisions":[2047,2047]},{"value":"access-proxy","revisions":[1024,1024]}],"revisions":[2047'
+    ',2047]},"src_filter":{"type":"list","children":{"range":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"persistence":{"type":"str'
+    'ing","options":[{"value":"none","revisions":[2047,2047]},{"value":"http-cookie","revisions":[2047,2047]},{"value":"ssl-session-id","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"ssl_client_renegotiation":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revi'
+    'sions":[2047,2047]},{"value":"secure","revisions":[2047,2047]}],"revisions":[2047,2047]},"status":{"type":"string","options":[{"value":"disable","revi'
+    'sions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"ssl_min_version":{"type":"string","options":[{"value":"ssl-3'
+    '.0","revisions":[2047,2047]},{"value":"tls-1.0","revisions":[2047,2047]},{"value":"tls-1.1","revisions":[2047,2047]},{"value":"tls-1.2","revisions":[2'
+    '047,2047]},{"value":"tls-1.3","revisions":[2040,2040]}],"revisions":[2047,2047]},"http_ip_header":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_server_session_state_timeout":{"type":"integer","revisio'
+    'ns":[2047,2047]},"server_type":{"type":"string","options":[{"value":"http","revisions":[2047,2047]},{"value":"https","revisions":[2047,2047]},{"value"'
+    ':"imaps","revisions":[2047,2047]},{"value":"pop3s","revisions":[2047,2047]},{"value":"smtps","revisions":[2047,2047]},{"value":"ssl","revisions":[2047'
+    ',2047]},{"value":"tcp","revisions":[2047,2047]},{"value":"udp","revisions":[2047,2047]},{"value":"ip","revisions":[2047,2047]},{"value":"ssh","revisio'
+    'ns":[1024,1024]}],"revisions":[2047,2047]},"extintf":{"type":"string","revisions":[2047,2047]},"https_cookie_secure":{"type":"string","options":[{"val'
+    'ue":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_server_max_version":{"type":"string",'
+    '"options":[{"value":"ssl-3.0","revisions":[2047,2047]},{"value":"tls-1.0","revisions":[2047,2047]},{"value":"tls-1.1","revisions":[2047,2047]},{"value'
+    '":"tls-1.2","revisions":[2047,2047]},{"value":"client","revisions":[2047,2047]},{"value":"tls-1.3","revisions":[2040,2040]}],"revisions":[2047,2047]},'
+    '"ssl_client_session_state_timeout":{"type":"integer","revisions":[2047,2047]},"extaddr":{"type":"list","children":{"name":{"type":"string","revisions"'
+    ':[2047,2047]}},"revisions":[2047,2047]},"ssl_server_session_state_max":{"type":"integer","revisions":[2047,2047]},"http_cookie_path":{"type":"string",'
+    '"revisions":[2047,2047]},"mapped_addr":{"type":"string","revisions":[2047,2047]},"nat_source_vip":{"type":"string","options":[{"value":"disable","revi'
+    'sions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"http_multiplex":{"type":"string","options":[{"value":"enable'
+    '","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"http_cookie_age":{"type":"integer","revisions":[2047'
+    ',2047]},"ssl_send_empty_frags":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"ssl_certificate":{"type":"string","revisions":[2047,2047]},"gratuitous_arp_interval":{"type":"integer","revisions":[2047,2047]}'
+    ',"name":{"type":"string","revisions":[2047,2047]},"realservers":{"type":"list","children":{"status":{"type":"string","options":[{"value":"active","rev'
+    'isions":[2047,2047]},{"value":"standby","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"client_ip":{"t'
+    'ype":"string","revisions":[2047,2047]},"monitor":{"type":"string","revisions":[2047,2047]},"weight":{"type":"integer","revisions":[2047,2047]},"ip":{"'
+    'type":"string","revisions":[2047,2047]},"address":{"type":"string","revisions":[1920,1920]},"port":{"type":"integer","revisions":[2047,2047]},"holddow'
+    'n_interval":{"type":"integer","revisions":[2047,2047]},"http_host":{"type":"string","revisions":[2047,2047]},"healthcheck":{"type":"string","options":'
+    '[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]},{"value":"vip","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"type":{"type":"string","options":[{"value":"ip","revisions":[1920,1920]},{"value":"address","revisions":[1920,1920]}],"revisions":[1920,1920]},"i'
+    'd":{"type":"integer","revisions":[2047,2047]},"max_connections":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"ssl_client_sessi'
+    'on_state_max":{"type":"integer","revisions":[2047,2047]},"ssl_hpkp_report_uri":{"type":"string","revisions":[2047,2047]},"ssl_hsts_include_subdomains"'
+    ':{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"http_co'
+    'okie_share":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"same-ip","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"extport":{"type":"string","revisions":[2047,2047]},"ldb_method":{"type":"string","options":[{"value":"static","revisions":[2047,2047]},{"value":"'
+    'round-robin","revisions":[2047,2047]},{"value":"weighted","revisions":[2047,2047]},{"value":"least-session","revisions":[2047,2047]},{"value":"least-r'
+    'tt","revisions":[2047,2047]},{"value":"first-alive","revisions":[2047,2047]},{"value":"http-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"'
+    'ssl_pfs":{"type":"string","options":[{"value":"require","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]},{"value":"allow","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"outlook_web_access":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_server_algorithm":{"type":"string","options":[{"value":"high","revisions":[2047,2047]},{"valu'
+    'e":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"custom","revisions":[2047,2047]},{"value":"client","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"ssl_server_session_state_type":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value'
+    '":"time","revisions":[2047,2047]},{"value":"count","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]}],"revisions":[2047,2047]},"srcint'
+    'f_filter":{"type":"list","children":{"interface_name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"websphere_server":{"type":"'
+    'string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_client_fallba'
+    'ck":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"webl'
+    'ogic_server":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"ssl_hpkp_backup":{"type":"str","required":false},"ssl_client_ses'
+    'sion_state_type":{"type":"str","required":false,"choices":["disable","time","count","both"]},"protocol":{"type":"str","required":false,"choices":["tcp'
+    '","udp","sctp","icmp"]},"ssl_hsts":{"type":"str","required":false,"choices":["disable","enable"]},"max_embryonic_connections":{"type":"int","required"'
+    ':false},"color":{"type":"int","required":false},"ssl_server_min_version":{"type":"str","required":false},"ssl_hpkp_primary":{"type":"str","required":f'
+    'alse},"http_cookie_generation":{"type":"int","required":false},"http_cookie_domain":{"type":"str","required":false},"ssl_cipher_suites":{"type":"list"'
+    ',"required":false,"options":{"priority":{"type":"int","required":false},"cipher":{"type":"str","required":false},"versions":{"type":"list","required":'
+    'false}}},"dns_mapping_ttl":{"type":"int","required":false},"portmapping_type":{"type":"str","required":false,"choices":["1-to-1","m-to-n"]},"arp_reply'
+    '":{"type":"str","required":false,"choices":["disable","enable"]},"http_redirect":{"type":"str","required":false,"choices":["enable","disable"]},"mappe'
+    'dip":{"type":"list","required":false,"options":{"range":{"type":"str","required":false}}},"ssl_max_version":{"type":"str","required":false},"ssl_mode"'
+    ':{"type":"str","required":false,"choices":["half","full"]},"portforward":{"type":"str","required":false,"choices":["disable","enable"]},"id":{"type":"'
+    'int","required":false},"http_ip_header_name":{"type":"str","required":false},"ssl_http_location_conversion":{"type":"str","required":false,"choices":['
+    '"enable","disable"]},"ssl_algorithm":{"type":"str","required":false,"choices":["high","medium","low","custom"]},"extip":{"type":"str","required":false'
+    '},"uuid":{"type":"str","required":false},"service":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"ssl_client_rek'
+    'ey_count":{"type":"int","required":false},"ssl_hpkp":{"type":"str","required":false,"choices":["disable","enable","report-only"]},"ssl_http_match_host'
+    '":{"type":"str","required":false,"choices":["enable","disable"]},"monitor":{"type":"list","required":false,"options":{"name":{"type":"str","required":'
+    'false}}},"ssl_hpkp_include_subdomains":{"type":"str","required":false,"choices":["disable","enable"]},"ssl_hsts_age":{"type":"int","required":false},"'
+    'ssl_hpkp_age":{"type":"int","required":false},"http_cookie_domain_from_host":{"type":"str","required":false,"choices":["disable","enable"]},"ssl_dh_bi'
+    'ts":{"type":"str","required":false,"choices":["768","1024","1536","2048","3072","4096"]},"mappedport":{"type":"str","required":false},"ssl_server_ciph'
+    'er_suites":{"type":"list","required":false,"options":{"priority":{"type":"int","required":false},"cipher":{"type":"str","required":false},"versions":{'
+    '"type":"list","required":false}}},"type":{"type":"str","required":false},"src_filter":{"type":"list","required":false,"options":{"range":{"type":"str"'
+    ',"required":false}}},"persistence":{"type":"str","required":false,"choices":["none","http-cookie","ssl-session-id"]},"ssl_client_renegotiation":{"type'
+    '":"str","required":false,"choices":["allow","deny","secure"]},"status":{"type":"str","required":false,"choices":["disable","enable"]},"ssl_min_version'
+    '":{"type":"str","required":false},"http_ip_header":{"type":"str","required":false,"choices":["enable","disable"]},"ssl_server_session_state_timeout":{'
+    '"type":"int","required":false},"server_type":{"type":"str","required":false},"extintf":{"type":"str","required":false},"https_cookie_secure":{"type":"'
+    'str","required":false,"choices":["disable","enable"]},"ssl_server_max_version":{"type":"str","required":false},"ssl_client_session_state_timeout":{"ty'
+    'pe":"int","required":false},"extaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"ssl_server_session_state_ma'
+    'x":{"type":"int","required":false},"http_cookie_path":{"type":"str","required":false},"mapped_addr":{"type":"str","required":false},"nat_source_vip":{'
+    '"type":"str","required":false,"choices":["disable","enable"]},"http_multiplex":{"type":"str","required":false,"choices":["enable","disable"]},"http_co'
+    'okie_age":{"type":"int","required":false},"ssl_send_empty_frags":{"type":"str","required":false,"choices":["enable","disable"]},"ssl_certificate":{"ty'
+    'pe":"str","required":false},"gratuitous_arp_interval":{"type":"int","required":false},"name":{"type":"str","required":false},"realservers":{"type":"li'
+    'st","required":false,"options":{"status":{"type":"str","required":false,"choices":["active","standby","disable"]},"client_ip":{"type":"str","required"'
+    ':false},"monitor":{"type":"str","required":false},"weight":{"type":"int","required":false},"ip":{"type":"str","required":false},"address":{"type":"str'
+    '","required":false},"port":{"type":"int","required":false},"holddown_interval":{"type":"int","required":false},"http_host":{"type":"str","required":fa'
+    'lse},"healthcheck":{"type":"str","required":false,"choices":["disable","enable","vip"]},"type":{"type":"str","required":false,"choices":["ip","address'
+    '"]},"id":{"type":"int","required":false},"max_connections":{"type":"int","required":false}}},"ssl_client_session_state_max":{"type":"int","required":f'
+    'alse},"ssl_hpkp_report_uri":{"type":"str","required":false},"ssl_hsts_include_subdomains":{"type":"str","required":false,"choices":["disable","enable"'
+    ']},"http_cookie_share":{"type":"str","required":false,"choices":["disable","same-ip"]},"extport":{"type":"str","required":false},"ldb_method":{"type":'
+    '"str","required":false,"choices":["static","round-robin","weighted","least-session","least-rtt","first-alive","http-host"]},"ssl_pfs":{"type":"str","r'
+    'equired":false,"choices":["require","deny","allow"]},"outlook_web_access":{"type":"str","required":false,"choices":["disable","enable"]},"ssl_server_a'
+    'lgorithm":{"type":"str","required":false,"choices":["high","medium","low","custom","client"]},"ssl_server_session_state_type":{"type":"str","required"'
+    ':false,"choices":["disable","time","count","both"]},"srcintf_filter":{"type":"list","required":false,"options":{"interface_name":{"type":"str","requir'
+    'ed":false}}},"websphere_server":{"type":"str","required":false,"choices":["disable","enable"]},"ssl_client_fallback":{"type":"str","required":false,"c'
+    'hoices":["disable","enable"]},"weblogic_server":{"type":"str","required":false,"choices":["disable","enable"]}}}'
+)
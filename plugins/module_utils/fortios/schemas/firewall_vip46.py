@@ -0,0 +1,41 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"portforward":{"type":"string","options":[{"value":"disable","revisions'
+    '":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"protocol":{"type":"string","options":[{"value":"tcp","revisions":'
+    '[2047,2047]},{"value":"udp","revisions":[2047,2047]}],"revisions":[2047,2047]},"uuid":{"type":"string","revisions":[2047,2047]},"realservers":{"type":'
+    '"list","children":{"status":{"type":"string","options":[{"value":"active","revisions":[2047,2047]},{"value":"standby","revisions":[2047,2047]},{"value'
+    '":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"client_ip":{"type":"string","revisions":[2047,2047]},"monitor":{"type":"string","revis'
+    'ions":[2047,2047]},"weight":{"type":"integer","revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"port":{"type":"integer","revisi'
+    'ons":[2047,2047]},"holddown_interval":{"type":"integer","revisions":[2047,2047]},"healthcheck":{"type":"string","options":[{"value":"disable","revisio'
+    'ns":[2047,2047]},{"value":"enable","revisions":[2047,2047]},{"value":"vip","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","'
+    'revisions":[2047,2047]},"max_connections":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"color":{"type":"integer","revisions":['
+    '2047,2047]},"type":{"type":"string","options":[{"value":"static-nat","revisions":[2047,2047]},{"value":"server-load-balance","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"server_type":{"type":"string","options":[{"value":"http","revisions":[2047,2047]},{"value":"tcp","revisions":[2047,2047]},{'
+    '"value":"udp","revisions":[2047,2047]},{"value":"ip","revisions":[2047,2047]}],"revisions":[2047,2047]},"monitor":{"type":"list","children":{"name":{"'
+    'type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"arp_reply":{"type":"string","option'
+    's":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ldb_method":{"type":"string","op'
+    'tions":[{"value":"static","revisions":[2047,2047]},{"value":"round-robin","revisions":[2047,2047]},{"value":"weighted","revisions":[2047,2047]},{"valu'
+    'e":"least-session","revisions":[2047,2047]},{"value":"least-rtt","revisions":[2047,2047]},{"value":"first-alive","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"mappedip":{"type":"string","revisions":[2047,2047]},"extport":{"type":"string","revisions":[2047,2047]},"extip":{"type":"string","revis'
+    'ions":[2047,2047]},"srcintf_filter":{"type":"list","children":{"interface_name":{"type":"string","revisions":[576,576]}},"revisions":[1984,576]},"src_'
+    'filter":{"type":"list","children":{"range":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"mappedport":{"type":"string","revision'
+    's":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"portforward":{"type":"str","required":false,"choices":["disable"'
+    ',"enable"]},"protocol":{"type":"str","required":false,"choices":["tcp","udp"]},"uuid":{"type":"str","required":false},"realservers":{"type":"list","re'
+    'quired":false,"options":{"status":{"type":"str","required":false,"choices":["active","standby","disable"]},"client_ip":{"type":"str","required":false}'
+    ',"monitor":{"type":"str","required":false},"weight":{"type":"int","required":false},"ip":{"type":"str","required":false},"port":{"type":"int","require'
+    'd":false},"holddown_interval":{"type":"int","required":false},"healthcheck":{"type":"str","required":false,"choices":["disable","enable","vip"]},"id":'
+    '{"type":"int","required":false},"max_connections":{"type":"int","required":false}}},"color":{"type":"int","required":false},"type":{"type":"str","requ'
+    'ired":false,"choices":["static-nat","server-load-balance"]},"server_type":{"type":"str","required":false,"choices":["http","tcp","udp","ip"]},"monitor'
+    '":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"id":{"type":"int","required":false},"arp_reply":{"type":"str","'
+    'required":false,"choices":["disable","enable"]},"ldb_method":{"type":"str","required":false,"choices":["static","round-robin","weighted","least-sessio'
+    'n","least-rtt","first-alive"]},"mappedip":{"type":"str","required":false},"extport":{"type":"str","required":false},"extip":{"type":"str","required":f'
+    'alse},"srcintf_filter":{"type":"list","required":false,"options":{"interface_name":{"type":"str","required":false}}},"src_filter":{"type":"list","requ'
+    'ired":false,"options":{"range":{"type":"str","required":false}}},"mappedport":{"type":"str","required":false},"name":{"type":"str","required":false}}}'
+)
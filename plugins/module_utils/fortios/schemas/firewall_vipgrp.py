@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"color":{"type":"integer","revisions":[2047,2047]},"comments":{"type":"str'
+    'ing","revisions":[2047,2047]},"member":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"interfac'
+    'e":{"type":"string","revisions":[2047,2047]},"uuid":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"color":{"type":"int","required":false},"comments":{"type":"str","re'
+    'quired":false},"member":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"interface":{"type":"str","required":false'
+    '},"uuid":{"type":"str","required":false}}}'
+)
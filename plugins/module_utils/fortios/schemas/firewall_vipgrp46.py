@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"color":{"type":"integer","revisions":[2047,2047]},"member":{"type":"list","children":{"name":{"type":"string","revisions":'
+    '[2047,2047]}},"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},"uuid":{"'
+    'type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"color":{"type":"int","required":false},"member":{"type":"list","required":false,"options":{"name":{"type":'
+    '"str","required":false}}},"name":{"type":"str","required":false},"comments":{"type":"str","required":false},"uuid":{"type":"str","required":false}}}'
+)
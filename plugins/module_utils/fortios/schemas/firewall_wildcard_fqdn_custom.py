@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"color":{"type":"integ'
+    'er","revisions":[2047,2047]},"wildcard_fqdn":{"type":"string","revisions":[2047,2047]},"visibility":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"uuid":{"type":"string","revisions":[2047,2047]}},"revisions":[2'
+    '047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"name":{"type":"str","required":false},"color":{"type":"int","req'
+    'uired":false},"wildcard_fqdn":{"type":"str","required":false},"visibility":{"type":"str","required":false},"uuid":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,22 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"sec_default_action":{"type":"string","options":[{"value":"accept","revisions":[2047,2047]},{"value":"deny","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"ssl_cert":{"type":"string","revisions":[2040,2040]},"outgoing_ip":{"type":"string","revisions":[2047,2047]},"ssl"'
+    ':{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"incomin'
+    'g_ip":{"type":"string","revisions":[2047,2047]},"ssl_dh_bits":{"type":"string","options":[{"value":"768","revisions":[2040,2040]},{"value":"1024","rev'
+    'isions":[2040,2040]},{"value":"1536","revisions":[2040,2040]},{"value":"2048","revisions":[2040,2040]}],"revisions":[2040,2040]},"incoming_port":{"typ'
+    'e":"string","revisions":[2047,2047]},"ssl_algorithm":{"type":"string","options":[{"value":"high","revisions":[2040,2040]},{"value":"medium","revisions'
+    '":[2040,2040]},{"value":"low","revisions":[2040,2040]}],"revisions":[2040,2040]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"sec_default_action":{"type":"str",'
+    '"required":false,"choices":["accept","deny"]},"ssl_cert":{"type":"str","required":false},"outgoing_ip":{"type":"str","required":false},"ssl":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"incoming_ip":{"type":"str","required":false},"ssl_dh_bits":{"type":"str","required":false,"choi'
+    'ces":["768","1024","1536","2048"]},"incoming_port":{"type":"str","required":false},"ssl_algorithm":{"type":"str","required":false,"choices":["high","m'
+    'edium","low"]}}}'
+)
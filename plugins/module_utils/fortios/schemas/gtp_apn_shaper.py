@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"action":{"type":"string","options":[{"value":"drop","revisions":[2047,2047]},{"value":"reject","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"apn":{"type":"string","revisions":[2047,2047]},"back_off_time":{"type":"integer","revisions":[2047,2047]},"id":{"type":"integ'
+    'er","revisions":[2047,2047]},"rate_limit":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"action":{"type":"str","required":false,"choices":["drop","reject"]},"apn":{"type":"str","required":false},'
+    '"back_off_time":{"type":"int","required":false},"id":{"type":"int","required":false},"rate_limit":{"type":"int","required":false}}}'
+)
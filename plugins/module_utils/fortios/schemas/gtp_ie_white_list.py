@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[1023,1023]},"entries":{"type":"list","children":{"message":{"type":"integer","revision'
+    's":[1023,1023]},"ie":{"type":"integer","revisions":[1023,1023]},"id":{"type":"integer","revisions":[1023,1023]}},"revisions":[1023,1023]}},"revisions"'
+    ':[1023,1023]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"message":{"typ'
+    'e":"int","required":false},"ie":{"type":"int","required":false},"id":{"type":"int","required":false}}}}}'
+)
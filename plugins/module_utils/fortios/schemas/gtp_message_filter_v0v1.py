@@ -0,0 +1,67 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"node_alive":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"end_marker":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"delete_aa_pdp":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"echo":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"update_pdp":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"support_extension":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"mbms_de_registration":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"delete_pdp":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"fwd_relocation":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"mbms_session_stop":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"unknown_message_white_list":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2'
+    '047]}},"revisions":[2047,2047]},"update_mbms":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"redirection":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"identification":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"ms_info_change_notif":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"gtp_pdu":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"note_ms_present":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","'
+    'revisions":[2047,2047]}],"revisions":[2047,2047]},"delete_mbms":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"error_indication":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"'
+    'deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"v0_create_aa_pdp__v1_init_pdp_ctx":{"type":"string","options":[{"value":"allow","revisions":'
+    '[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"mbms_registration":{"type":"string","options":[{"value":"allow","revi'
+    'sions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"ran_info":{"type":"string","options":[{"value":"allow","revisi'
+    'ons":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"data_record":{"type":"string","options":[{"value":"allow","revis'
+    'ions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"unknown_message":{"type":"string","options":[{"value":"allow","'
+    'revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"relocation_cancel":{"type":"string","options":[{"value":"a'
+    'llow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"fw'
+    'd_srns_context":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"version_not_support":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"send_route":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"mbms_session_update":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"failure_report":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"create_pdp":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"pdu_notification":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"mbms_notification":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"create_mbms":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"mbms_session_start":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"sgsn_context":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"node_alive":{"type":"str","required":false,"choices":["allow","deny"]},"end_marker":{"type":"str","require'
+    'd":false,"choices":["allow","deny"]},"delete_aa_pdp":{"type":"str","required":false,"choices":["allow","deny"]},"echo":{"type":"str","required":false,'
+    '"choices":["allow","deny"]},"update_pdp":{"type":"str","required":false,"choices":["allow","deny"]},"support_extension":{"type":"str","required":false'
+    ',"choices":["allow","deny"]},"mbms_de_registration":{"type":"str","required":false,"choices":["allow","deny"]},"delete_pdp":{"type":"str","required":f'
+    'alse,"choices":["allow","deny"]},"fwd_relocation":{"type":"str","required":false,"choices":["allow","deny"]},"mbms_session_stop":{"type":"str","requir'
+    'ed":false,"choices":["allow","deny"]},"unknown_message_white_list":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"'
+    'update_mbms":{"type":"str","required":false,"choices":["allow","deny"]},"redirection":{"type":"str","required":false,"choices":["allow","deny"]},"iden'
+    'tification":{"type":"str","required":false,"choices":["allow","deny"]},"ms_info_change_notif":{"type":"str","required":false,"choices":["allow","deny"'
+    ']},"gtp_pdu":{"type":"str","required":false,"choices":["allow","deny"]},"note_ms_present":{"type":"str","required":false,"choices":["allow","deny"]},"'
+    'delete_mbms":{"type":"str","required":false,"choices":["allow","deny"]},"error_indication":{"type":"str","required":false,"choices":["allow","deny"]},'
+    '"v0_create_aa_pdp__v1_init_pdp_ctx":{"type":"str","required":false,"choices":["allow","deny"]},"mbms_registration":{"type":"str","required":false,"cho'
+    'ices":["allow","deny"]},"ran_info":{"type":"str","required":false,"choices":["allow","deny"]},"data_record":{"type":"str","required":false,"choices":['
+    '"allow","deny"]},"unknown_message":{"type":"str","required":false,"choices":["allow","deny"]},"relocation_cancel":{"type":"str","required":false,"choi'
+    'ces":["allow","deny"]},"name":{"type":"str","required":false},"fwd_srns_context":{"type":"str","required":false,"choices":["allow","deny"]},"version_n'
+    'ot_support":{"type":"str","required":false,"choices":["allow","deny"]},"send_route":{"type":"str","required":false,"choices":["allow","deny"]},"mbms_s'
+    'ession_update":{"type":"str","required":false,"choices":["allow","deny"]},"failure_report":{"type":"str","required":false,"choices":["allow","deny"]},'
+    '"create_pdp":{"type":"str","required":false,"choices":["allow","deny"]},"pdu_notification":{"type":"str","required":false,"choices":["allow","deny"]},'
+    '"mbms_notification":{"type":"str","required":false,"choices":["allow","deny"]},"create_mbms":{"type":"str","required":false,"choices":["allow","deny"]'
+    '},"mbms_session_start":{"type":"str","required":false,"choices":["allow","deny"]},"sgsn_context":{"type":"str","required":false,"choices":["allow","de'
+    'ny"]}}}'
+)
@@ -0,0 +1,41 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"change_notification":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"delete_bearer_cmd_fail":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"modify_bearer_cmd_fail":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value'
+    '":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"resume":{"type":"string","options":[{"va'
+    'lue":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"version_not_support":{"type":"string","optio'
+    'ns":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"bearer_resource_cmd_fail":{"type":"'
+    'string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"delete_bearer_req_res'
+    'p":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"echo":{"t'
+    'ype":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"update_bearer":'
+    '{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"delete_pdn_c'
+    'onnection_set":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"suspend":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"'
+    'unknown_message":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"delete_session":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"update_pdn_connection_set":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"modify_bearer_req_resp":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"create_bearer":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"trace_session":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"unknown_message_white_list":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"rev'
+    'isions":[2047,2047]},"create_session":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"change_notification":{"type":"str","required":false,"choices":["allow","deny"]},"delete_bearer_cmd_fail":{'
+    '"type":"str","required":false,"choices":["allow","deny"]},"modify_bearer_cmd_fail":{"type":"str","required":false,"choices":["allow","deny"]},"name":{'
+    '"type":"str","required":false},"resume":{"type":"str","required":false,"choices":["allow","deny"]},"version_not_support":{"type":"str","required":fals'
+    'e,"choices":["allow","deny"]},"bearer_resource_cmd_fail":{"type":"str","required":false,"choices":["allow","deny"]},"delete_bearer_req_resp":{"type":"'
+    'str","required":false,"choices":["allow","deny"]},"echo":{"type":"str","required":false,"choices":["allow","deny"]},"update_bearer":{"type":"str","req'
+    'uired":false,"choices":["allow","deny"]},"delete_pdn_connection_set":{"type":"str","required":false,"choices":["allow","deny"]},"suspend":{"type":"str'
+    '","required":false,"choices":["allow","deny"]},"unknown_message":{"type":"str","required":false,"choices":["allow","deny"]},"delete_session":{"type":"'
+    'str","required":false,"choices":["allow","deny"]},"update_pdn_connection_set":{"type":"str","required":false,"choices":["allow","deny"]},"modify_beare'
+    'r_req_resp":{"type":"str","required":false,"choices":["allow","deny"]},"create_bearer":{"type":"str","required":false,"choices":["allow","deny"]},"tra'
+    'ce_session":{"type":"str","required":false,"choices":["allow","deny"]},"unknown_message_white_list":{"type":"list","required":false,"options":{"id":{"'
+    'type":"int","required":false}}},"create_session":{"type":"str","required":false,"choices":["allow","deny"]}}}'
+)
@@ -0,0 +1,12 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"tunnel_limit":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[20'
+    '47,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"tunnel_limit":{"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,46 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"preview":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]'
+    '}],"revisions":[2040,2040]},"name":{"type":"string","revisions":[2047,2047]},"response_server":{"type":"string","revisions":[2047,2047]},"respmod_defa'
+    'ult_action":{"type":"string","options":[{"value":"forward","revisions":[1920,1920]},{"value":"bypass","revisions":[1920,1920]}],"revisions":[1920,1920'
+    ']},"streaming_content_bypass":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"response_failure":{"type":"string","options":[{"value":"error","revisions":[2047,2047]},{"value":"bypass","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"request_failure":{"type":"string","options":[{"value":"error","revisions":[2047,2047]},{"value":"bypass","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"request":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"preview_data_length":{"type":"integer","revisions":[2040,2040]},"response_path":{"type":"string","revisions":[20'
+    '47,2047]},"request_server":{"type":"string","revisions":[2047,2047]},"respmod_forward_rules":{"type":"list","children":{"action":{"type":"string","opt'
+    'ions":[{"value":"forward","revisions":[1920,1920]},{"value":"bypass","revisions":[1920,1920]}],"revisions":[1920,1920]},"host":{"type":"string","revis'
+    'ions":[1920,1920]},"http_resp_status_code":{"type":"list","children":{"code":{"type":"integer","revisions":[1920,1920]}},"revisions":[1920,1920]},"nam'
+    'e":{"type":"string","revisions":[1920,1920]},"header_group":{"type":"list","children":{"case_sensitivity":{"type":"string","options":[{"value":"disabl'
+    'e","revisions":[1920,1920]},{"value":"enable","revisions":[1920,1920]}],"revisions":[1920,1920]},"header":{"type":"string","revisions":[1920,1920]},"h'
+    'eader_name":{"type":"string","revisions":[1920,1920]},"id":{"type":"integer","revisions":[1920,1920]}},"revisions":[1920,1920]}},"revisions":[1920,192'
+    '0]},"methods":{"multiple_values":true,"type":"list","options":[{"value":"delete","revisions":[2047,2047]},{"value":"get","revisions":[2047,2047]},{"va'
+    'lue":"head","revisions":[2047,2047]},{"value":"options","revisions":[2047,2047]},{"value":"post","revisions":[2047,2047]},{"value":"put","revisions":['
+    '2047,2047]},{"value":"trace","revisions":[2047,2047]},{"value":"other","revisions":[2047,2047]}],"revisions":[2047,2047]},"replacemsg_group":{"type":"'
+    'string","revisions":[2047,2047]},"response_req_hdr":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisio'
+    'ns":[2040,2040]}],"revisions":[2040,2040]},"icap_headers":{"type":"list","children":{"content":{"type":"string","revisions":[2040,2040]},"base64_encod'
+    'ing":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"id"'
+    ':{"type":"integer","revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"response":{"type":"string","op'
+    'tions":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"request_path":{"type":"strin'
+    'g","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"preview":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","required":fa'
+    'lse},"response_server":{"type":"str","required":false},"respmod_default_action":{"type":"str","required":false,"choices":["forward","bypass"]},"stream'
+    'ing_content_bypass":{"type":"str","required":false,"choices":["disable","enable"]},"response_failure":{"type":"str","required":false,"choices":["error'
+    '","bypass"]},"request_failure":{"type":"str","required":false,"choices":["error","bypass"]},"request":{"type":"str","required":false,"choices":["disab'
+    'le","enable"]},"preview_data_length":{"type":"int","required":false},"response_path":{"type":"str","required":false},"request_server":{"type":"str","r'
+    'equired":false},"respmod_forward_rules":{"type":"list","required":false,"options":{"action":{"type":"str","required":false,"choices":["forward","bypas'
+    's"]},"host":{"type":"str","required":false},"http_resp_status_code":{"type":"list","required":false,"options":{"code":{"type":"int","required":false}}'
+    '},"name":{"type":"str","required":false},"header_group":{"type":"list","required":false,"options":{"case_sensitivity":{"type":"str","required":false,"'
+    'choices":["disable","enable"]},"header":{"type":"str","required":false},"header_name":{"type":"str","required":false},"id":{"type":"int","required":fa'
+    'lse}}}}},"methods":{"type":"list","required":false,"choices":["delete","get","head","options","post","put","trace","other"]},"replacemsg_group":{"type'
+    '":"str","required":false},"response_req_hdr":{"type":"str","required":false,"choices":["disable","enable"]},"icap_headers":{"type":"list","required":f'
+    'alse,"options":{"content":{"type":"str","required":false},"base64_encoding":{"type":"str","required":false,"choices":["disable","enable"]},"id":{"type'
+    '":"int","required":false},"name":{"type":"str","required":false}}},"response":{"type":"str","required":false,"choices":["disable","enable"]},"request_'
+    'path":{"type":"str","required":false}}}'
+)
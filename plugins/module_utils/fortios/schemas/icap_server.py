@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ssl_cert":{"type":"string","revisions":[1024,1024]},"secure":{"type":"string","options":[{"value":"enable","revisions":[10'
+    '24,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"name":{"type":"string","revisions":[2047,2047]},"ip_version":{"type":'
+    '"string","options":[{"value":"4","revisions":[2047,2047]},{"value":"6","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip6_address":{"type":"strin'
+    'g","revisions":[2047,2047]},"ip_address":{"type":"string","revisions":[2047,2047]},"port":{"type":"integer","revisions":[2047,2047]},"max_connections"'
+    ':{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ssl_cert":{"type":"str","required":false},"secure":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"name":{"type":"str","required":false},"ip_version":{"type":"str","required":false,"choices":["4","6"]},"ip6_address":{"type":"str","required"'
+    ':false},"ip_address":{"type":"str","required":false},"port":{"type":"int","required":false},"max_connections":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,22 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"comment":{"type":"string","revisions":[2047,2047]},"protocol":{"type":"string","revisions":[2047,2047]},"severity":{"type"'
+    ':"string","revisions":[2047,2047]},"sig_name":{"type":"string","revisions":[2047,23]},"application":{"type":"string","revisions":[2047,2047]},"tag":{"'
+    'type":"string","revisions":[2047,2047]},"location":{"type":"string","revisions":[2047,2047]},"signature":{"type":"string","revisions":[2047,2047]},"ac'
+    'tion":{"type":"string","options":[{"value":"pass","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_pa'
+    'cket":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"os'
+    '":{"type":"string","revisions":[2047,2047]},"rule_id":{"type":"integer","revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"disable",'
+    '"revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"comment":{"type":"str","required":'
+    'false},"protocol":{"type":"str","required":false},"severity":{"type":"str","required":false},"sig_name":{"type":"str","required":false},"application":'
+    '{"type":"str","required":false},"tag":{"type":"str","required":false},"location":{"type":"str","required":false},"signature":{"type":"str","required":'
+    'false},"action":{"type":"str","required":false,"choices":["pass","block"]},"log_packet":{"type":"str","required":false,"choices":["disable","enable"]}'
+    ',"os":{"type":"str","required":false},"rule_id":{"type":"int","required":false},"log":{"type":"str","required":false,"choices":["disable","enable"]}}}'
+)
@@ -0,0 +1,39 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"ngfw_max_scan_range":{"type":"integer","revisions":[1536,1536]},"deep_app_insp_timeout":{"type":"integer","revisions":[204'
+    '7,2047]},"np_accel_mode":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"basic","revisions":[2047,2047]}],"revisions":['
+    '2047,1023]},"packet_log_queue_depth":{"type":"integer","revisions":[1984,1984]},"session_limit_mode":{"type":"string","options":[{"value":"accurate","'
+    'revisions":[2047,2047]},{"value":"heuristic","revisions":[2047,2047]}],"revisions":[2047,2047]},"fail_open":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"database":{"type":"string","options":[{"value":"re'
+    'gular","revisions":[2047,2047]},{"value":"extended","revisions":[2047,2047]}],"revisions":[2047,2047]},"ips_reserve_cpu":{"type":"string","options":[{'
+    '"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,1023]},"anomaly_mode":{"type":"string","optio'
+    'ns":[{"value":"periodical","revisions":[2047,2047]},{"value":"continuous","revisions":[2047,2047]}],"revisions":[2047,2047]},"exclude_signatures":{"ty'
+    'pe":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"industrial","revisions":[2047,2047]}],"revisions":[2047,2047]},"tls_active_'
+    'probe":{"type":"dict","children":{"interface":{"type":"string","revisions":[1600,1600]},"source_ip6":{"type":"string","revisions":[1600,1600]},"source'
+    '_ip":{"type":"string","revisions":[1600,1600]},"vdom":{"type":"string","revisions":[1600,1600]},"interface_select_method":{"type":"string","options":['
+    '{"value":"auto","revisions":[1600,1600]},{"value":"sdwan","revisions":[1600,1600]},{"value":"specify","revisions":[1600,1600]}],"revisions":[1600,1600'
+    ']}},"revisions":[1984,1600]},"traffic_submit":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"socket_size":{"type":"integer","revisions":[2047,2047]},"skype_client_public_ipaddr":{"type":"string","revisions'
+    '":[2047,127]},"deep_app_insp_db_limit":{"type":"integer","revisions":[2047,2047]},"engine_count":{"type":"integer","revisions":[2047,2047]},"intellige'
+    'nt_mode":{"type":"string","options":[{"value":"enable","revisions":[511,511]},{"value":"disable","revisions":[511,511]}],"revisions":[2047,511]},"sync'
+    '_session_ttl":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,20'
+    '47]},"cp_accel_mode":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"basic","revisions":[2047,2047]},{"value":"advanced'
+    '","revisions":[2047,2047]}],"revisions":[2047,1023]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"ngfw_max_scan_range":{"type":"int","required":false},"deep_app_insp_timeout":{"type":"int","required":fals'
+    'e},"np_accel_mode":{"type":"str","required":false,"choices":["none","basic"]},"packet_log_queue_depth":{"type":"int","required":false},"session_limit_'
+    'mode":{"type":"str","required":false,"choices":["accurate","heuristic"]},"fail_open":{"type":"str","required":false,"choices":["enable","disable"]},"d'
+    'atabase":{"type":"str","required":false,"choices":["regular","extended"]},"ips_reserve_cpu":{"type":"str","required":false,"choices":["disable","enabl'
+    'e"]},"anomaly_mode":{"type":"str","required":false,"choices":["periodical","continuous"]},"exclude_signatures":{"type":"str","required":false,"choices'
+    '":["none","industrial"]},"tls_active_probe":{"type":"dict","required":false,"options":{"interface":{"type":"str","required":false},"source_ip6":{"type'
+    '":"str","required":false},"source_ip":{"type":"str","required":false},"vdom":{"type":"str","required":false},"interface_select_method":{"type":"str","'
+    'required":false,"choices":["auto","sdwan","specify"]}}},"traffic_submit":{"type":"str","required":false,"choices":["enable","disable"]},"socket_size":'
+    '{"type":"int","required":false},"skype_client_public_ipaddr":{"type":"str","required":false},"deep_app_insp_db_limit":{"type":"int","required":false},'
+    '"engine_count":{"type":"int","required":false},"intelligent_mode":{"type":"str","required":false},"sync_session_ttl":{"type":"str","required":false,"c'
+    'hoices":["enable","disable"]},"cp_accel_mode":{"type":"str","required":false,"choices":["none","basic","advanced"]}}}'
+)
@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"group":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"service":{"type":"strin'
+    'g","revisions":[2047,2047]},"severity":{"type":"string","revisions":[2047,2047]},"rev":{"type":"integer","revisions":[2047,2047]},"metadata":{"type":"'
+    'list","children":{"valueid":{"type":"integer","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"metaid":{"type":"integer","rev'
+    'isions":[2047,2047]}},"revisions":[2047,2047]},"application":{"type":"string","revisions":[2047,2047]},"location":{"type":"string","revisions":[2047,2'
+    '047]},"action":{"type":"string","options":[{"value":"pass","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"date":{"type":"integer","revisions":[2047,2047]},"log_packet":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"ena'
+    'ble","revisions":[2047,2047]}],"revisions":[2047,2047]},"os":{"type":"string","revisions":[2047,2047]},"rule_id":{"type":"integer","revisions":[2047,2'
+    '047]},"log":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"group":{"type":"str","required":fa'
+    'lse},"name":{"type":"str","required":false},"service":{"type":"str","required":false},"severity":{"type":"str","required":false},"rev":{"type":"int","'
+    'required":false},"metadata":{"type":"list","required":false,"options":{"valueid":{"type":"int","required":false},"id":{"type":"int","required":false},'
+    '"metaid":{"type":"int","required":false}}},"application":{"type":"str","required":false},"location":{"type":"str","required":false},"action":{"type":"'
+    'str","required":false,"choices":["pass","block"]},"date":{"type":"int","required":false},"log_packet":{"type":"str","required":false,"choices":["disab'
+    'le","enable"]},"os":{"type":"str","required":false},"rule_id":{"type":"int","required":false},"log":{"type":"str","required":false,"choices":["disable'
+    '","enable"]}}}'
+)
@@ -0,0 +1,74 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"scan_botnet_connectio'
+    'ns":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"block","revisions":[2040,2040]},{"value":"monitor","revisions":['
+    '2040,2040]}],"revisions":[2040,2040]},"replacemsg_group":{"type":"string","revisions":[2047,2047]},"extended_log":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"filter":{"type":"list","children":{"status":'
+    '{"type":"string","options":[{"value":"disable","revisions":[383,383]},{"value":"enable","revisions":[383,383]},{"value":"default","revisions":[383,383'
+    ']}],"revisions":[383,383]},"protocol":{"type":"string","revisions":[383,383]},"severity":{"type":"string","revisions":[383,383]},"log":{"type":"string'
+    '","options":[{"value":"disable","revisions":[383,383]},{"value":"enable","revisions":[383,383]}],"revisions":[383,383]},"quarantine":{"type":"string",'
+    '"options":[{"value":"none","revisions":[383,383]},{"value":"attacker","revisions":[383,383]}],"revisions":[383,383]},"application":{"type":"string","r'
+    'evisions":[383,383]},"quarantine_expiry":{"type":"integer","revisions":[383,383]},"location":{"type":"string","revisions":[383,383]},"action":{"type":'
+    '"string","options":[{"value":"pass","revisions":[383,383]},{"value":"block","revisions":[383,383]},{"value":"reset","revisions":[383,383]},{"value":"d'
+    'efault","revisions":[383,383]}],"revisions":[383,383]},"log_packet":{"type":"string","options":[{"value":"disable","revisions":[383,383]},{"value":"en'
+    'able","revisions":[383,383]}],"revisions":[383,383]},"os":{"type":"string","revisions":[383,383]},"quarantine_log":{"type":"string","options":[{"value'
+    '":"disable","revisions":[383,383]},{"value":"enable","revisions":[383,383]}],"revisions":[383,383]},"name":{"type":"string","revisions":[383,383]}},"r'
+    'evisions":[2047,383]},"block_malicious_url":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"entries":{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047'
+    ']},{"value":"enable","revisions":[2047,2047]},{"value":"default","revisions":[2047,2047]}],"revisions":[2047,2047]},"rate_count":{"type":"integer","re'
+    'visions":[2047,2047]},"cve":{"type":"list","children":{"cve_entry":{"type":"string","revisions":[1664,1664]}},"revisions":[1920,1664]},"protocol":{"ty'
+    'pe":"string","revisions":[2047,2047]},"severity":{"type":"string","revisions":[2047,2047]},"quarantine_expiry":{"type":"string","revisions":[2047,2047'
+    ']},"os":{"type":"string","revisions":[2047,2047]},"quarantine":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"attacker'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"rule":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2'
+    '047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"application":{"type":"string","revisions":[2047,2047]},"log_attack_context":{"type":"strin'
+    'g","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"location":{"type":"str'
+    'ing","revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"pass","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]},'
+    '{"value":"reset","revisions":[2047,2047]},{"value":"default","revisions":[2047,2047]}],"revisions":[2047,2047]},"rate_track":{"type":"string","options'
+    '":[{"value":"none","revisions":[2047,2047]},{"value":"src-ip","revisions":[2047,2047]},{"value":"dest-ip","revisions":[2047,2047]},{"value":"dhcp-clie'
+    'nt-mac","revisions":[2047,2047]},{"value":"dns-domain","revisions":[2047,2047]}],"revisions":[2047,2047]},"rate_mode":{"type":"string","options":[{"va'
+    'lue":"periodical","revisions":[2047,2047]},{"value":"continuous","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_packet":{"type":"string","opt'
+    'ions":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rate_duration":{"type":"integ'
+    'er","revisions":[2047,2047]},"quarantine_log":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"exempt_ip":{"type":"list","children":{"src_ip":{"type":"string","revisions":[2047,2047]},"dst_ip":{"type":"strin'
+    'g","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"disa'
+    'ble","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"override":{"type":"list"'
+    ',"children":{"status":{"type":"string","options":[{"value":"disable","revisions":[383,383]},{"value":"enable","revisions":[383,383]}],"revisions":[383'
+    ',383]},"log":{"type":"string","options":[{"value":"disable","revisions":[383,383]},{"value":"enable","revisions":[383,383]}],"revisions":[383,383]},"q'
+    'uarantine":{"type":"string","options":[{"value":"none","revisions":[383,383]},{"value":"attacker","revisions":[383,383]}],"revisions":[383,383]},"rule'
+    '_id":{"type":"integer","revisions":[383,383]},"quarantine_expiry":{"type":"integer","revisions":[383,383]},"action":{"type":"string","options":[{"valu'
+    'e":"pass","revisions":[383,383]},{"value":"block","revisions":[383,383]},{"value":"reset","revisions":[383,383]}],"revisions":[383,383]},"log_packet":'
+    '{"type":"string","options":[{"value":"disable","revisions":[383,383]},{"value":"enable","revisions":[383,383]}],"revisions":[383,383]},"quarantine_log'
+    '":{"type":"string","options":[{"value":"disable","revisions":[383,383]},{"value":"enable","revisions":[383,383]}],"revisions":[383,383]},"exempt_ip":{'
+    '"type":"list","children":{"src_ip":{"type":"string","revisions":[383,383]},"dst_ip":{"type":"string","revisions":[383,383]},"id":{"type":"integer","re'
+    'visions":[383,383]}},"revisions":[383,383]}},"revisions":[2047,383]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"name":{"type":"str","required":false},"scan_botnet_connections":'
+    '{"type":"str","required":false,"choices":["disable","block","monitor"]},"replacemsg_group":{"type":"str","required":false},"extended_log":{"type":"str'
+    '","required":false,"choices":["enable","disable"]},"filter":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choice'
+    's":["disable","enable","default"]},"protocol":{"type":"str","required":false},"severity":{"type":"str","required":false},"log":{"type":"str","required'
+    '":false,"choices":["disable","enable"]},"quarantine":{"type":"str","required":false,"choices":["none","attacker"]},"application":{"type":"str","requir'
+    'ed":false},"quarantine_expiry":{"type":"int","required":false},"location":{"type":"str","required":false},"action":{"type":"str","required":false,"cho'
+    'ices":["pass","block","reset","default"]},"log_packet":{"type":"str","required":false,"choices":["disable","enable"]},"os":{"type":"str","required":fa'
+    'lse},"quarantine_log":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","required":false}}},"block_malicious_url":{"'
+    'type":"str","required":false,"choices":["disable","enable"]},"entries":{"type":"list","required":false,"options":{"status":{"type":"str","required":fa'
+    'lse,"choices":["disable","enable","default"]},"rate_count":{"type":"int","required":false},"cve":{"type":"list","required":false,"options":{"cve_entry'
+    '":{"type":"str","required":false}}},"protocol":{"type":"str","required":false},"severity":{"type":"str","required":false},"quarantine_expiry":{"type":'
+    '"str","required":false},"os":{"type":"str","required":false},"quarantine":{"type":"str","required":false,"choices":["none","attacker"]},"rule":{"type"'
+    ':"list","required":false,"options":{"id":{"type":"int","required":false}}},"id":{"type":"int","required":false},"application":{"type":"str","required"'
+    ':false},"log_attack_context":{"type":"str","required":false,"choices":["disable","enable"]},"location":{"type":"str","required":false},"action":{"type'
+    '":"str","required":false,"choices":["pass","block","reset","default"]},"rate_track":{"type":"str","required":false,"choices":["none","src-ip","dest-ip'
+    '","dhcp-client-mac","dns-domain"]},"rate_mode":{"type":"str","required":false,"choices":["periodical","continuous"]},"log_packet":{"type":"str","requi'
+    'red":false,"choices":["disable","enable"]},"rate_duration":{"type":"int","required":false},"quarantine_log":{"type":"str","required":false,"choices":['
+    '"disable","enable"]},"exempt_ip":{"type":"list","required":false,"options":{"src_ip":{"type":"str","required":false},"dst_ip":{"type":"str","required"'
+    ':false},"id":{"type":"int","required":false}}},"log":{"type":"str","required":false,"choices":["disable","enable"]}}},"override":{"type":"list","requi'
+    'red":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"log":{"type":"str","required":false,"choices":["disable'
+    '","enable"]},"quarantine":{"type":"str","required":false,"choices":["none","attacker"]},"rule_id":{"type":"int","required":false},"quarantine_expiry":'
+    '{"type":"int","required":false},"action":{"type":"str","required":false,"choices":["pass","block","reset"]},"log_packet":{"type":"str","required":fals'
+    'e,"choices":["disable","enable"]},"quarantine_log":{"type":"str","required":false,"choices":["disable","enable"]},"exempt_ip":{"type":"list","required'
+    '":false,"options":{"src_ip":{"type":"str","required":false},"dst_ip":{"type":"str","required":false},"id":{"type":"int","required":false}}}}}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"ips_packet_quota":{"type":"integer","revisions":[2047,2047]},"packet_log_history":{"type":"integer","revisions":[2047,2047'
+    ']},"packet_log_post_attack":{"type":"integer","revisions":[2047,2047]},"packet_log_memory":{"type":"integer","revisions":[2047,2047]}},"revisions":[20'
+    '47,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"ips_packet_quota":{"type":"int","required":false},"packet_log_history":{"type":"int","required":false},"pa'
+    'cket_log_post_attack":{"type":"int","required":false},"packet_log_memory":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"id":{"type":"integer","revisions":[2024,2024]},"id_policy_id":{"type":"integer","revisions":[2024,2024]},"vdom_id":{"type"'
+    ':"integer","revisions":[2024,2024]},"which":{"type":"string","options":[{"value":"firewall","revisions":[2024,2024]},{"value":"firewall6","revisions":'
+    '[2024,104]},{"value":"interface","revisions":[2024,2024]},{"value":"interface6","revisions":[2024,2024]},{"value":"sniffer","revisions":[2024,2024]},{'
+    '"value":"sniffer6","revisions":[2024,2024]},{"value":"explicit","revisions":[2024,2024]}],"revisions":[2024,2024]},"policy_id":{"type":"integer","revi'
+    'sions":[2024,2024]}},"revisions":[2024,2024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"id":{"type":"int","required":false},"id_policy_id":{"type":"int","required":false},"vdom_id":{"type":"int"'
+    ',"required":false},"which":{"type":"str","required":false,"choices":["firewall","firewall6","interface","interface6","sniffer","sniffer6","explicit"]}'
+    ',"policy_id":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,67 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"free_style":{"type":"list","children":{"category":{"type":"string","options":[{"value":"traffic","revisions":[1024,1024]},'
+    '{"value":"event","revisions":[1024,1024]},{"value":"virus","revisions":[1024,1024]},{"value":"webfilter","revisions":[1024,1024]},{"value":"attack","r'
+    'evisions":[1024,1024]},{"value":"spam","revisions":[1024,1024]},{"value":"anomaly","revisions":[1024,1024]},{"value":"voip","revisions":[1024,1024]},{'
+    '"value":"dlp","revisions":[1024,1024]},{"value":"app-ctrl","revisions":[1024,1024]},{"value":"waf","revisions":[1024,1024]},{"value":"gtp","revisions"'
+    ':[1024,1024]},{"value":"dns","revisions":[1024,1024]},{"value":"ssh","revisions":[1024,1024]},{"value":"ssl","revisions":[1024,1024]},{"value":"file-f'
+    'ilter","revisions":[1024,1024]},{"value":"icap","revisions":[1024,1024]}],"revisions":[1024,1024]},"filter":{"type":"string","revisions":[1024,1024]},'
+    '"id":{"type":"integer","revisions":[1024,1024]},"filter_type":{"type":"string","options":[{"value":"include","revisions":[1024,1024]},{"value":"exclud'
+    'e","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"wan_opt":{"type":"string","options":[{"value":"enable","revisions":[1'
+    '27,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"filter_type":{"type":"string","options":[{"value":"include","revisions":['
+    '1023,1023]},{"value":"exclude","revisions":[1023,1023]}],"revisions":[2047,1023]},"local_traffic":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"netscan_vulnerability":{"type":"string","revisions":[2047,7]'
+    '},"ppp":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"radiu'
+    's":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"event":{"t'
+    'ype":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"multicast_traffi'
+    'c":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sever'
+    'ity":{"type":"string","options":[{"value":"emergency","revisions":[2047,2047]},{"value":"alert","revisions":[2047,2047]},{"value":"critical","revision'
+    's":[2047,2047]},{"value":"error","revisions":[2047,2047]},{"value":"warning","revisions":[2047,2047]},{"value":"notification","revisions":[2047,2047]}'
+    ',{"value":"information","revisions":[2047,2047]},{"value":"debug","revisions":[2047,2047]}],"revisions":[2047,2047]},"sslvpn_log_session":{"type":"str'
+    'ing","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"notification":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"system":{"type":"string"'
+    ',"options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"gtp":{"type":"string","option'
+    's":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sniffer_traffic":{"type":"string'
+    '","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"voip":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dns":{"type":"string","op'
+    'tions":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"dhcp":{"type":"string","options":[{"value":'
+    '"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"anomaly":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"ldb_monitor":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"ssh":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"sslvpn_log_adm":{"type":"string","options":[{"value":"enable","revisions":'
+    '[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"cpu_memory_usage":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"netscan_discovery":{"type":"string","revisions":[2047,7]},"ha":{"t'
+    'ype":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"forward_traffic"'
+    ':{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipsec":'
+    '{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"dlp_archive":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sslvpn_l'
+    'og_auth":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"admi'
+    'n":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"vip_ssl":{'
+    '"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"filter":{"type'
+    '":"string","revisions":[2047,1023]},"pattern":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127'
+    ',127]}],"revisions":[2047,127]},"wireless_activity":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions'
+    '":[127,127]}],"revisions":[2047,127]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"free_style":{"type":"list","required":false,"options":{"category":{"type":"str","required":false,"choices"'
+    ':["traffic","event","virus","webfilter","attack","spam","anomaly","voip","dlp","app-ctrl","waf","gtp","dns","ssh","ssl","file-filter","icap"]},"filter'
+    '":{"type":"str","required":false},"id":{"type":"int","required":false},"filter_type":{"type":"str","required":false,"choices":["include","exclude"]}}}'
+    ',"wan_opt":{"type":"str","required":false},"filter_type":{"type":"str","required":false},"local_traffic":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"netscan_vulnerability":{"type":"str","required":false},"ppp":{"type":"str","required":false},"radius":{"type":"str","required":fals'
+    'e},"event":{"type":"str","required":false},"multicast_traffic":{"type":"str","required":false,"choices":["enable","disable"]},"severity":{"type":"str"'
+    ',"required":false,"choices":["emergency","alert","critical","error","warning","notification","information","debug"]},"sslvpn_log_session":{"type":"str'
+    '","required":false},"notification":{"type":"str","required":false},"system":{"type":"str","required":false},"gtp":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"sniffer_traffic":{"type":"str","required":false,"choices":["enable","disable"]},"voip":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]},"dns":{"type":"str","required":false},"dhcp":{"type":"str","required":false},"anomaly":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]},"auth":{"type":"str","required":false},"ldb_monitor":{"type":"str","required":false},"ssh":{"type":"str","required":false}'
+    ',"sslvpn_log_adm":{"type":"str","required":false},"cpu_memory_usage":{"type":"str","required":false},"netscan_discovery":{"type":"str","required":fals'
+    'e},"ha":{"type":"str","required":false},"forward_traffic":{"type":"str","required":false,"choices":["enable","disable"]},"ipsec":{"type":"str","requir'
+    'ed":false},"dlp_archive":{"type":"str","required":false,"choices":["enable","disable"]},"sslvpn_log_auth":{"type":"str","required":false},"admin":{"ty'
+    'pe":"str","required":false},"vip_ssl":{"type":"str","required":false},"filter":{"type":"str","required":false},"pattern":{"type":"str","required":fals'
+    'e},"wireless_activity":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,50 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"uploaduser":{"type":"string","revisions":[2047,2047]},"uploadip":{"type":"string","revisions":[2047,2047]},"uploadtime":{"'
+    'type":"string","revisions":[2047,2047]},"diskfull":{"type":"string","options":[{"value":"overwrite","revisions":[2047,2047]},{"value":"nolog","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"roll_schedule":{"type":"string","options":[{"value":"daily","revisions":[2047,2047]},{"value":"weekly","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"uploadport":{"type":"integer","revisions":[2047,2047]},"full_second_warning_threshold":{"type":"integ'
+    'er","revisions":[2047,2047]},"upload_destination":{"type":"string","options":[{"value":"ftp-server","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"ips_archive":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"roll_time":{"type":"string","revisions":[2047,2047]},"uploadtype":{"multiple_values":true,"type":"list","options":[{"value":"traffic","revision'
+    's":[2047,2047]},{"value":"event","revisions":[2047,2047]},{"value":"virus","revisions":[2047,2047]},{"value":"webfilter","revisions":[2047,2047]},{"va'
+    'lue":"IPS","revisions":[2047,2047]},{"value":"spamfilter","revisions":[2047,7]},{"value":"dlp-archive","revisions":[2047,2047]},{"value":"anomaly","re'
+    'visions":[2047,2047]},{"value":"voip","revisions":[2047,2047]},{"value":"dlp","revisions":[2047,2047]},{"value":"app-ctrl","revisions":[2047,2047]},{"'
+    'value":"waf","revisions":[2047,2047]},{"value":"netscan","revisions":[2047,7]},{"value":"gtp","revisions":[2047,2047]},{"value":"dns","revisions":[204'
+    '7,2047]},{"value":"emailfilter","revisions":[2040,2040]},{"value":"ssh","revisions":[2040,2040]},{"value":"ssl","revisions":[2040,2040]},{"value":"cif'
+    's","revisions":[2040,1016]},{"value":"file-filter","revisions":[2040,2040]},{"value":"icap","revisions":[1920,1920]}],"revisions":[2047,2047]},"roll_d'
+    'ay":{"multiple_values":true,"type":"list","options":[{"value":"sunday","revisions":[2047,2047]},{"value":"monday","revisions":[2047,2047]},{"value":"t'
+    'uesday","revisions":[2047,2047]},{"value":"wednesday","revisions":[2047,2047]},{"value":"thursday","revisions":[2047,2047]},{"value":"friday","revisio'
+    'ns":[2047,2047]},{"value":"saturday","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_log_file_size":{"type":"integer","revisions":[2047,2047]}'
+    ',"max_policy_packet_capture_size":{"type":"integer","revisions":[2047,2047]},"report_quota":{"type":"integer","revisions":[2047,2047]},"status":{"type'
+    '":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"upload_ssl_con'
+    'n":{"type":"string","options":[{"value":"default","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"low","revisions":[2047,2'
+    '047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"full_final_warning_threshold":{"type":"integer","revisions":[2047,2047]},'
+    '"uploadpass":{"type":"string","revisions":[2047,2047]},"interface":{"type":"string","revisions":[1920,1664]},"maximum_log_age":{"type":"integer","revi'
+    'sions":[2047,2047]},"uploaddir":{"type":"string","revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2047,2047]},"upload":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"uploadsched":{"type":'
+    '"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"interface_select'
+    '_method":{"type":"string","options":[{"value":"auto","revisions":[1664,1664]},{"value":"sdwan","revisions":[1664,1664]},{"value":"specify","revisions"'
+    ':[1664,1664]}],"revisions":[1920,1664]},"log_quota":{"type":"integer","revisions":[2047,2047]},"upload_delete_files":{"type":"string","options":[{"val'
+    'ue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"full_first_warning_threshold":{"type":"in'
+    'teger","revisions":[2047,2047]},"dlp_archive_quota":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"uploaduser":{"type":"str","required":false},"uploadip":{"type":"str","required":false},"uploadtime":{"type'
+    '":"str","required":false},"diskfull":{"type":"str","required":false,"choices":["overwrite","nolog"]},"roll_schedule":{"type":"str","required":false,"c'
+    'hoices":["daily","weekly"]},"uploadport":{"type":"int","required":false},"full_second_warning_threshold":{"type":"int","required":false},"upload_desti'
+    'nation":{"type":"str","required":false,"choices":["ftp-server"]},"ips_archive":{"type":"str","required":false,"choices":["enable","disable"]},"roll_ti'
+    'me":{"type":"str","required":false},"uploadtype":{"type":"list","required":false},"roll_day":{"type":"list","required":false,"choices":["sunday","mond'
+    'ay","tuesday","wednesday","thursday","friday","saturday"]},"max_log_file_size":{"type":"int","required":false},"max_policy_packet_capture_size":{"type'
+    '":"int","required":false},"report_quota":{"type":"int","required":false},"status":{"type":"str","required":false,"choices":["enable","disable"]},"uplo'
+    'ad_ssl_conn":{"type":"str","required":false,"choices":["default","high","low","disable"]},"full_final_warning_threshold":{"type":"int","required":fals'
+    'e},"uploadpass":{"type":"str","required":false},"interface":{"type":"str","required":false},"maximum_log_age":{"type":"int","required":false},"uploadd'
+    'ir":{"type":"str","required":false},"source_ip":{"type":"str","required":false},"upload":{"type":"str","required":false,"choices":["enable","disable"]'
+    '},"uploadsched":{"type":"str","required":false,"choices":["disable","enable"]},"interface_select_method":{"type":"str","required":false},"log_quota":{'
+    '"type":"int","required":false},"upload_delete_files":{"type":"str","required":false,"choices":["enable","disable"]},"full_first_warning_threshold":{"t'
+    'ype":"int","required":false},"dlp_archive_quota":{"type":"int","required":false}}}'
+)
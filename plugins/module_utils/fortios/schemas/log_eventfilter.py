@@ -0,0 +1,35 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"endpoint":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"cifs":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}'
+    '],"revisions":[1024,1024]},"wan_opt":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"sdwan":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}'
+    '],"revisions":[1920,1920]},"ha":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"system":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"switch_controller":{"type":"string","options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536'
+    ',1536]}],"revisions":[1536,1536]},"connector":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2'
+    '040,2040]}],"revisions":[2040,2040]},"compliance_check":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions'
+    '":[7,7]}],"revisions":[2047,7]},"wireless_activity":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"router":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"fortiextender":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","'
+    'revisions":[2040,2040]}],"revisions":[2040,2040]},"security_rating":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"vpn":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disa'
+    'ble","revisions":[2047,2047]}],"revisions":[2047,2047]},"event":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"user":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"endpoint":{"type":"str","required":false,"choices":["enable","disable"]},"cifs":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"wan_opt":{"type":"str","required":false,"choices":["enable","disable"]},"sdwan":{"type":"str","required":false,"'
+    'choices":["enable","disable"]},"ha":{"type":"str","required":false,"choices":["enable","disable"]},"system":{"type":"str","required":false,"choices":['
+    '"enable","disable"]},"switch_controller":{"type":"str","required":false,"choices":["enable","disable"]},"connector":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"compliance_check":{"type":"str","required":false},"wireless_activity":{"type":"str","required":false,"choices":["enable"'
+    ',"disable"]},"router":{"type":"str","required":false,"choices":["enable","disable"]},"fortiextender":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"security_rating":{"type":"str","required":false,"choices":["enable","disable"]},"vpn":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"event":{"type":"str","required":false,"choices":["enable","disable"]},"user":{"type":"str","required":false,"choices":["enable","disabl'
+    'e"]}}}'
+)
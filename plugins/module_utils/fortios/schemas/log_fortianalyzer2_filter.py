@@ -0,0 +1,42 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"filter":{"type":"string","revisions":[2047,1023]},"dns":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{'
+    '"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"netscan_discovery":{"type":"string","revisions":[2047,7]},"severity":{"type":"string","op'
+    'tions":[{"value":"emergency","revisions":[2047,2047]},{"value":"alert","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]},{"value":'
+    '"error","revisions":[2047,2047]},{"value":"warning","revisions":[2047,2047]},{"value":"notification","revisions":[2047,2047]},{"value":"information","'
+    'revisions":[2047,2047]},{"value":"debug","revisions":[2047,2047]}],"revisions":[2047,2047]},"multicast_traffic":{"type":"string","options":[{"value":"'
+    'enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"local_traffic":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"voip":{"type":"string","options":[{"val'
+    'ue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"filter_type":{"type":"string","options":['
+    '{"value":"include","revisions":[1023,1023]},{"value":"exclude","revisions":[1023,1023]}],"revisions":[2047,1023]},"gtp":{"type":"string","options":[{"'
+    'value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sniffer_traffic":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssh":{"type":"string","option'
+    's":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"free_style":{"type":"list","children":{"categor'
+    'y":{"type":"string","options":[{"value":"traffic","revisions":[1024,1024]},{"value":"event","revisions":[1024,1024]},{"value":"virus","revisions":[102'
+    '4,1024]},{"value":"webfilter","revisions":[1024,1024]},{"value":"attack","revisions":[1024,1024]},{"value":"spam","revisions":[1024,1024]},{"value":"a'
+    'nomaly","revisions":[1024,1024]},{"value":"voip","revisions":[1024,1024]},{"value":"dlp","revisions":[1024,1024]},{"value":"app-ctrl","revisions":[102'
+    '4,1024]},{"value":"waf","revisions":[1024,1024]},{"value":"gtp","revisions":[1024,1024]},{"value":"dns","revisions":[1024,1024]},{"value":"ssh","revis'
+    'ions":[1024,1024]},{"value":"ssl","revisions":[1024,1024]},{"value":"file-filter","revisions":[1024,1024]},{"value":"icap","revisions":[1024,1024]}],"'
+    'revisions":[1024,1024]},"filter":{"type":"string","revisions":[1024,1024]},"id":{"type":"integer","revisions":[1024,1024]},"filter_type":{"type":"stri'
+    'ng","options":[{"value":"include","revisions":[1024,1024]},{"value":"exclude","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,10'
+    '24]},"dlp_archive":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"netscan_vulnerability":{"type":"string","revisions":[2047,7]},"anomaly":{"type":"string","options":[{"value":"enable","revisions":[2047,204'
+    '7]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"forward_traffic":{"type":"string","options":[{"value":"enable","revisions":'
+    '[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"filter":{"type":"str","required":false},"dns":{"type":"str","required":false},"netscan_discovery":{"type":'
+    '"str","required":false},"severity":{"type":"str","required":false,"choices":["emergency","alert","critical","error","warning","notification","informat'
+    'ion","debug"]},"multicast_traffic":{"type":"str","required":false,"choices":["enable","disable"]},"local_traffic":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"voip":{"type":"str","required":false,"choices":["enable","disable"]},"filter_type":{"type":"str","required":false},"gtp":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"sniffer_traffic":{"type":"str","required":false,"choices":["enable","disable"]},"ssh":{'
+    '"type":"str","required":false},"free_style":{"type":"list","required":false,"options":{"category":{"type":"str","required":false,"choices":["traffic",'
+    '"event","virus","webfilter","attack","spam","anomaly","voip","dlp","app-ctrl","waf","gtp","dns","ssh","ssl","file-filter","icap"]},"filter":{"type":"s'
+    'tr","required":false},"id":{"type":"int","required":false},"filter_type":{"type":"str","required":false,"choices":["include","exclude"]}}},"dlp_archiv'
+    'e":{"type":"str","required":false,"choices":["enable","disable"]},"netscan_vulnerability":{"type":"str","required":false},"anomaly":{"type":"str","req'
+    'uired":false,"choices":["enable","disable"]},"forward_traffic":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,39 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"filter":{"type":"string","revisions":[2040,1016]},"dlp_archive":{"type":"string","options":[{"value":"enable","revisions":'
+    '[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"severity":{"type":"string","options":[{"value":"emergency","revisi'
+    'ons":[2040,2040]},{"value":"alert","revisions":[2040,2040]},{"value":"critical","revisions":[2040,2040]},{"value":"error","revisions":[2040,2040]},{"v'
+    'alue":"warning","revisions":[2040,2040]},{"value":"notification","revisions":[2040,2040]},{"value":"information","revisions":[2040,2040]},{"value":"de'
+    'bug","revisions":[2040,2040]}],"revisions":[2040,2040]},"multicast_traffic":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"v'
+    'alue":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"local_traffic":{"type":"string","options":[{"value":"enable","revisions":[2040,204'
+    '0]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"filter_type":{"type":"string","options":[{"value":"include","revisions":[10'
+    '16,1016]},{"value":"exclude","revisions":[1016,1016]}],"revisions":[2040,1016]},"gtp":{"type":"string","options":[{"value":"enable","revisions":[2040,'
+    '2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"sniffer_traffic":{"type":"string","options":[{"value":"enable","revision'
+    's":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"voip":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"free_style":{"type":"list","children":{"category":{"type":"string'
+    '","options":[{"value":"traffic","revisions":[1024,1024]},{"value":"event","revisions":[1024,1024]},{"value":"virus","revisions":[1024,1024]},{"value":'
+    '"webfilter","revisions":[1024,1024]},{"value":"attack","revisions":[1024,1024]},{"value":"spam","revisions":[1024,1024]},{"value":"anomaly","revisions'
+    '":[1024,1024]},{"value":"voip","revisions":[1024,1024]},{"value":"dlp","revisions":[1024,1024]},{"value":"app-ctrl","revisions":[1024,1024]},{"value":'
+    '"waf","revisions":[1024,1024]},{"value":"gtp","revisions":[1024,1024]},{"value":"dns","revisions":[1024,1024]},{"value":"ssh","revisions":[1024,1024]}'
+    ',{"value":"ssl","revisions":[1024,1024]},{"value":"file-filter","revisions":[1024,1024]},{"value":"icap","revisions":[1024,1024]}],"revisions":[1024,1'
+    '024]},"filter":{"type":"string","revisions":[1024,1024]},"id":{"type":"integer","revisions":[1024,1024]},"filter_type":{"type":"string","options":[{"v'
+    'alue":"include","revisions":[1024,1024]},{"value":"exclude","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"anomaly":{"t'
+    'ype":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"forward_tra'
+    'ffic":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]}},"r'
+    'evisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"filter":{"type":"str","required":false},"dlp_archive":{"type":"str","required":false,"choices":["enable","'
+    'disable"]},"severity":{"type":"str","required":false,"choices":["emergency","alert","critical","error","warning","notification","information","debug"]'
+    '},"multicast_traffic":{"type":"str","required":false,"choices":["enable","disable"]},"local_traffic":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"filter_type":{"type":"str","required":false},"gtp":{"type":"str","required":false,"choices":["enable","disable"]},"sniffer_traffic":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"voip":{"type":"str","required":false,"choices":["enable","disable"]},"free_style":{"type"'
+    ':"list","required":false,"options":{"category":{"type":"str","required":false,"choices":["traffic","event","virus","webfilter","attack","spam","anomal'
+    'y","voip","dlp","app-ctrl","waf","gtp","dns","ssh","ssl","file-filter","icap"]},"filter":{"type":"str","required":false},"id":{"type":"int","required"'
+    ':false},"filter_type":{"type":"str","required":false,"choices":["include","exclude"]}}},"anomaly":{"type":"str","required":false,"choices":["enable","'
+    'disable"]},"forward_traffic":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
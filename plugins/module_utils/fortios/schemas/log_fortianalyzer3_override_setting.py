@@ -0,0 +1,46 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"use_management_vdom":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions"'
+    ':[2040,2040]}],"revisions":[2040,2040]},"max_log_rate":{"type":"integer","revisions":[2040,2040]},"upload_option":{"type":"string","options":[{"value"'
+    ':"store-and-upload","revisions":[2040,2040]},{"value":"realtime","revisions":[2040,2040]},{"value":"1-minute","revisions":[2040,2040]},{"value":"5-min'
+    'ute","revisions":[2040,2040]}],"revisions":[2040,2040]},"certificate_verification":{"type":"string","options":[{"value":"enable","revisions":[2040,204'
+    '0]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"serial":{"type":"list","children":{"name":{"type":"string","revisions":[204'
+    '0,2040]}},"revisions":[2040,2040]},"enc_algorithm":{"type":"string","options":[{"value":"high-medium","revisions":[2040,2040]},{"value":"high","revisi'
+    'ons":[2040,2040]},{"value":"low","revisions":[2040,2040]}],"revisions":[2040,2040]},"upload_interval":{"type":"string","options":[{"value":"daily","re'
+    'visions":[2040,2040]},{"value":"weekly","revisions":[2040,2040]},{"value":"monthly","revisions":[2040,2040]}],"revisions":[2040,2040]},"upload_time":{'
+    '"type":"string","revisions":[2040,2040]},"certificate":{"type":"string","revisions":[2040,2040]},"priority":{"type":"string","options":[{"value":"defa'
+    'ult","revisions":[2040,2040]},{"value":"low","revisions":[2040,2040]}],"revisions":[2040,2040]},"conn_timeout":{"type":"integer","revisions":[2040,204'
+    '0]},"override":{"type":"string","options":[{"value":"enable","revisions":[16,16]},{"value":"disable","revisions":[16,16]}],"revisions":[2032,16]},"mgm'
+    't_name":{"type":"string","revisions":[2032,16]},"hmac_algorithm":{"type":"string","options":[{"value":"sha256","revisions":[2040,2040]},{"value":"sha1'
+    '","revisions":[2040,2040]}],"revisions":[2040,2040]},"status":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable'
+    '","revisions":[2040,2040]}],"revisions":[2040,2040]},"ssl_min_proto_version":{"type":"string","options":[{"value":"default","revisions":[2040,2040]},{'
+    '"value":"SSLv3","revisions":[2040,2040]},{"value":"TLSv1","revisions":[2040,2040]},{"value":"TLSv1-1","revisions":[2040,2040]},{"value":"TLSv1-2","rev'
+    'isions":[2040,2040]}],"revisions":[2040,2040]},"faz_type":{"type":"integer","revisions":[2032,16]},"interface":{"type":"string","revisions":[1984,1728'
+    ']},"__change_ip":{"type":"integer","revisions":[2032,16]},"upload_day":{"type":"string","revisions":[2040,2040]},"monitor_keepalive_period":{"type":"i'
+    'nteger","revisions":[2040,2040]},"preshared_key":{"type":"string","revisions":[1024,1024]},"access_config":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"source_ip":{"type":"string","revisions":[2040,2040]'
+    '},"server":{"type":"string","revisions":[2040,2040]},"interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[1728,1728]},{"'
+    'value":"sdwan","revisions":[1728,1728]},{"value":"specify","revisions":[1728,1728]}],"revisions":[1984,1728]},"monitor_failure_retry_period":{"type":"'
+    'integer","revisions":[2040,2040]},"reliable":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[20'
+    '40,2040]}],"revisions":[2040,2040]},"ips_archive":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions'
+    '":[2040,2040]}],"revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"use_management_vdom":{"type":"str","required":false,"choices":["enable","disable"]},"max_log_rate":{"type"'
+    ':"int","required":false},"upload_option":{"type":"str","required":false,"choices":["store-and-upload","realtime","1-minute","5-minute"]},"certificate_'
+    'verification":{"type":"str","required":false,"choices":["enable","disable"]},"serial":{"type":"list","required":false,"options":{"name":{"type":"str",'
+    '"required":false}}},"enc_algorithm":{"type":"str","required":false,"choices":["high-medium","high","low"]},"upload_interval":{"type":"str","required":'
+    'false,"choices":["daily","weekly","monthly"]},"upload_time":{"type":"str","required":false},"certificate":{"type":"str","required":false},"priority":{'
+    '"type":"str","required":false,"choices":["default","low"]},"conn_timeout":{"type":"int","required":false},"override":{"type":"str","required":false},"'
+    'mgmt_name":{"type":"str","required":false},"hmac_algorithm":{"type":"str","required":false,"choices":["sha256","sha1"]},"status":{"type":"str","requir'
+    'ed":false,"choices":["enable","disable"]},"ssl_min_proto_version":{"type":"str","required":false,"choices":["default","SSLv3","TLSv1","TLSv1-1","TLSv1'
+    '-2"]},"faz_type":{"type":"int","required":false},"interface":{"type":"str","required":false},"__change_ip":{"type":"int","required":false},"upload_day'
+    '":{"type":"str","required":false},"monitor_keepalive_period":{"type":"int","required":false},"preshared_key":{"type":"str","required":false},"access_c'
+    'onfig":{"type":"str","required":false,"choices":["enable","disable"]},"source_ip":{"type":"str","required":false},"server":{"type":"str","required":fa'
+    'lse},"interface_select_method":{"type":"str","required":false},"monitor_failure_retry_period":{"type":"int","required":false},"reliable":{"type":"str"'
+    ',"required":false,"choices":["enable","disable"]},"ips_archive":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
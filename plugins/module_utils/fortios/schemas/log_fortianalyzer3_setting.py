@@ -0,0 +1,43 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"max_log_rate":{"type":"integer","revisions":[2040,2040]},"interface":{"type":"string","revisions":[1984,1728]},"certificat'
+    'e_verification":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,'
+    '2040]},"serial":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"enc_algorithm":{"type":"string"'
+    ',"options":[{"value":"high-medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"upload_interval":{"type":"string","options":[{"value":"daily","revisions":[2047,2047]},{"value":"weekly","revisions":[2047,2047]},{"'
+    'value":"monthly","revisions":[2047,2047]}],"revisions":[2047,2047]},"upload_time":{"type":"string","revisions":[2047,2047]},"certificate":{"type":"str'
+    'ing","revisions":[2047,2047]},"priority":{"type":"string","options":[{"value":"default","revisions":[2040,2040]},{"value":"low","revisions":[2040,2040'
+    ']}],"revisions":[2040,2040]},"conn_timeout":{"type":"integer","revisions":[2047,2047]},"mgmt_name":{"type":"string","revisions":[2047,23]},"hmac_algor'
+    'ithm":{"type":"string","options":[{"value":"sha256","revisions":[2047,2047]},{"value":"sha1","revisions":[2047,2047]}],"revisions":[2047,2047]},"statu'
+    's":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_m'
+    'in_proto_version":{"type":"string","options":[{"value":"default","revisions":[2047,2047]},{"value":"SSLv3","revisions":[2047,2047]},{"value":"TLSv1","'
+    'revisions":[2047,2047]},{"value":"TLSv1-1","revisions":[2047,2047]},{"value":"TLSv1-2","revisions":[2047,2047]}],"revisions":[2047,2047]},"faz_type":{'
+    '"type":"integer","revisions":[2047,23]},"upload_option":{"type":"string","options":[{"value":"store-and-upload","revisions":[2047,2047]},{"value":"rea'
+    'ltime","revisions":[2047,2047]},{"value":"1-minute","revisions":[2047,2047]},{"value":"5-minute","revisions":[2047,2047]}],"revisions":[2047,2047]},"_'
+    '_change_ip":{"type":"integer","revisions":[2047,23]},"upload_day":{"type":"string","revisions":[2047,2047]},"monitor_keepalive_period":{"type":"intege'
+    'r","revisions":[2047,2047]},"preshared_key":{"type":"string","revisions":[1024,1024]},"access_config":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"source_ip":{"type":"string","revisions":[2047,2047]},"se'
+    'rver":{"type":"string","revisions":[2047,2047]},"interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[1728,1728]},{"value'
+    '":"sdwan","revisions":[1728,1728]},{"value":"specify","revisions":[1728,1728]}],"revisions":[1984,1728]},"monitor_failure_retry_period":{"type":"integ'
+    'er","revisions":[2047,2047]},"reliable":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"ips_archive":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"max_log_rate":{"type":"int","required":false},"interface":{"type":"str","required":false},"certificate_ver'
+    'ification":{"type":"str","required":false,"choices":["enable","disable"]},"serial":{"type":"list","required":false,"options":{"name":{"type":"str","re'
+    'quired":false}}},"enc_algorithm":{"type":"str","required":false,"choices":["high-medium","high","low"]},"upload_interval":{"type":"str","required":fal'
+    'se,"choices":["daily","weekly","monthly"]},"upload_time":{"type":"str","required":false},"certificate":{"type":"str","required":false},"priority":{"ty'
+    'pe":"str","required":false,"choices":["default","low"]},"conn_timeout":{"type":"int","required":false},"mgmt_name":{"type":"str","required":false},"hm'
+    'ac_algorithm":{"type":"str","required":false,"choices":["sha256","sha1"]},"status":{"type":"str","required":false,"choices":["enable","disable"]},"ssl'
+    '_min_proto_version":{"type":"str","required":false,"choices":["default","SSLv3","TLSv1","TLSv1-1","TLSv1-2"]},"faz_type":{"type":"int","required":fals'
+    'e},"upload_option":{"type":"str","required":false,"choices":["store-and-upload","realtime","1-minute","5-minute"]},"__change_ip":{"type":"int","requir'
+    'ed":false},"upload_day":{"type":"str","required":false},"monitor_keepalive_period":{"type":"int","required":false},"preshared_key":{"type":"str","requ'
+    'ired":false},"access_config":{"type":"str","required":false,"choices":["enable","disable"]},"source_ip":{"type":"str","required":false},"server":{"typ'
+    'e":"str","required":false},"interface_select_method":{"type":"str","required":false},"monitor_failure_retry_period":{"type":"int","required":false},"r'
+    'eliable":{"type":"str","required":false,"choices":["enable","disable"]},"ips_archive":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
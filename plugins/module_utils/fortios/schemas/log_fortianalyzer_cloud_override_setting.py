@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"override":{"type":"string","options":[{"value":"enable","revisions":[21,21]},{"value":"disable","revisions":[21,21]}],"rev'
+    'isions":[2045,21]},"status":{"type":"string","options":[{"value":"enable","revisions":[2045,2045]},{"value":"disable","revisions":[2045,2045]}],"revis'
+    'ions":[2045,2045]},"faz_type":{"type":"integer","revisions":[2045,21]}},"revisions":[2045,2045]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"override":{"type":"str","required":false},"status":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"faz_type":{"type":"int","required":false}}}'
+)
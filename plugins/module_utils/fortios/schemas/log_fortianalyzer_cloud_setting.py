@@ -0,0 +1,39 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"faz_type":{"type":"integer","revisions":[2045,21]},"upload_option":{"type":"string","options":[{"value":"store-and-upload"'
+    ',"revisions":[2045,2045]},{"value":"realtime","revisions":[2045,2045]},{"value":"1-minute","revisions":[2045,2045]},{"value":"5-minute","revisions":[2'
+    '045,2045]}],"revisions":[2045,2045]},"upload_interval":{"type":"string","options":[{"value":"daily","revisions":[2045,2045]},{"value":"weekly","revisi'
+    'ons":[2045,2045]},{"value":"monthly","revisions":[2045,2045]}],"revisions":[2045,2045]},"enc_algorithm":{"type":"string","options":[{"value":"high-med'
+    'ium","revisions":[2045,2045]},{"value":"high","revisions":[2045,2045]},{"value":"low","revisions":[2045,2045]}],"revisions":[2045,2045]},"ips_archive"'
+    ':{"type":"string","options":[{"value":"enable","revisions":[2045,2045]},{"value":"disable","revisions":[2045,2045]}],"revisions":[2045,2045]},"upload_'
+    'time":{"type":"string","revisions":[2045,2045]},"certificate":{"type":"string","revisions":[2045,2045]},"priority":{"type":"string","options":[{"value'
+    '":"default","revisions":[2040,2040]},{"value":"low","revisions":[2040,2040]}],"revisions":[2040,2040]},"conn_timeout":{"type":"integer","revisions":[2'
+    '045,2045]},"mgmt_name":{"type":"string","revisions":[2045,21]},"hmac_algorithm":{"type":"string","options":[{"value":"sha256","revisions":[2045,2045]}'
+    ',{"value":"sha1","revisions":[2045,2045]}],"revisions":[2045,2045]},"status":{"type":"string","options":[{"value":"enable","revisions":[2045,2045]},{"'
+    'value":"disable","revisions":[2045,2045]}],"revisions":[2045,2045]},"ssl_min_proto_version":{"type":"string","options":[{"value":"default","revisions"'
+    ':[2045,2045]},{"value":"SSLv3","revisions":[2045,2045]},{"value":"TLSv1","revisions":[2045,2045]},{"value":"TLSv1-1","revisions":[2045,2045]},{"value"'
+    ':"TLSv1-2","revisions":[2045,2045]}],"revisions":[2045,2045]},"max_log_rate":{"type":"integer","revisions":[2040,2040]},"interface":{"type":"string","'
+    'revisions":[1984,1728]},"__change_ip":{"type":"integer","revisions":[2045,21]},"upload_day":{"type":"string","revisions":[2045,2045]},"monitor_keepali'
+    've_period":{"type":"integer","revisions":[2045,2045]},"preshared_key":{"type":"string","revisions":[1024,1024]},"access_config":{"type":"string","opti'
+    'ons":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"source_ip":{"type":"string","r'
+    'evisions":[2045,2045]},"interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[1728,1728]},{"value":"sdwan","revisions":[17'
+    '28,1728]},{"value":"specify","revisions":[1728,1728]}],"revisions":[1984,1728]},"monitor_failure_retry_period":{"type":"integer","revisions":[2045,204'
+    '5]}},"revisions":[2045,2045]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"faz_type":{"type":"int","required":false},"upload_option":{"type":"str","required":false,"choices":["store'
+    '-and-upload","realtime","1-minute","5-minute"]},"upload_interval":{"type":"str","required":false,"choices":["daily","weekly","monthly"]},"enc_algorith'
+    'm":{"type":"str","required":false,"choices":["high-medium","high","low"]},"ips_archive":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"upload_time":{"type":"str","required":false},"certificate":{"type":"str","required":false},"priority":{"type":"str","required":false,"choices":["def'
+    'ault","low"]},"conn_timeout":{"type":"int","required":false},"mgmt_name":{"type":"str","required":false},"hmac_algorithm":{"type":"str","required":fal'
+    'se,"choices":["sha256","sha1"]},"status":{"type":"str","required":false,"choices":["enable","disable"]},"ssl_min_proto_version":{"type":"str","require'
+    'd":false,"choices":["default","SSLv3","TLSv1","TLSv1-1","TLSv1-2"]},"max_log_rate":{"type":"int","required":false},"interface":{"type":"str","required'
+    '":false},"__change_ip":{"type":"int","required":false},"upload_day":{"type":"str","required":false},"monitor_keepalive_period":{"type":"int","required'
+    '":false},"preshared_key":{"type":"str","required":false},"access_config":{"type":"str","required":false,"choices":["enable","disable"]},"source_ip":{"'
+    'type":"str","required":false},"interface_select_method":{"type":"str","required":false},"monitor_failure_retry_period":{"type":"int","required":false}'
+    '}}'
+)
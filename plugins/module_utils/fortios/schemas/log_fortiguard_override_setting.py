@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"upload_day":{"type":"string","revisions":[2047,2047]},"upload_time":{"type":"string","revisions":[2047,2047]},"max_log_rat'
+    'e":{"type":"integer","revisions":[2040,2040]},"priority":{"type":"string","options":[{"value":"default","revisions":[2040,2040]},{"value":"low","revis'
+    'ions":[2040,2040]}],"revisions":[2040,2040]},"override":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"upload_option":{"type":"string","options":[{"value":"store-and-upload","revisions":[2047,2047]},{"valu'
+    'e":"realtime","revisions":[2047,2047]},{"value":"1-minute","revisions":[2047,2047]},{"value":"5-minute","revisions":[2047,2047]}],"revisions":[2047,20'
+    '47]},"upload_interval":{"type":"string","options":[{"value":"daily","revisions":[2047,2047]},{"value":"weekly","revisions":[2047,2047]},{"value":"mont'
+    'hly","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"upload_day":{"type":"str","require'
+    'd":false},"upload_time":{"type":"str","required":false},"max_log_rate":{"type":"int","required":false},"priority":{"type":"str","required":false,"choi'
+    'ces":["default","low"]},"override":{"type":"str","required":false,"choices":["enable","disable"]},"upload_option":{"type":"str","required":false,"choi'
+    'ces":["store-and-upload","realtime","1-minute","5-minute"]},"upload_interval":{"type":"str","required":false,"choices":["daily","weekly","monthly"]}}}'
+)
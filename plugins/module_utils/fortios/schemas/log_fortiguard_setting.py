@@ -0,0 +1,29 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"upload_day":{"type":"string","revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2047,2047]},"upload_time":'
+    '{"type":"string","revisions":[2047,2047]},"max_log_rate":{"type":"integer","revisions":[2040,2040]},"priority":{"type":"string","options":[{"value":"d'
+    'efault","revisions":[2040,2040]},{"value":"low","revisions":[2040,2040]}],"revisions":[2040,2040]},"interface":{"type":"string","revisions":[1984,1728'
+    ']},"interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[1728,1728]},{"value":"sdwan","revisions":[1728,1728]},{"value":"'
+    'specify","revisions":[1728,1728]}],"revisions":[1984,1728]},"ssl_min_proto_version":{"type":"string","options":[{"value":"default","revisions":[2047,2'
+    '047]},{"value":"SSLv3","revisions":[2047,2047]},{"value":"TLSv1","revisions":[2047,2047]},{"value":"TLSv1-1","revisions":[2047,2047]},{"value":"TLSv1-'
+    '2","revisions":[2047,2047]}],"revisions":[2047,2047]},"conn_timeout":{"type":"integer","revisions":[2047,2045]},"upload_option":{"type":"string","opti'
+    'ons":[{"value":"store-and-upload","revisions":[2047,2047]},{"value":"realtime","revisions":[2047,2047]},{"value":"1-minute","revisions":[2047,2047]},{'
+    '"value":"5-minute","revisions":[2047,2047]}],"revisions":[2047,2047]},"upload_interval":{"type":"string","options":[{"value":"daily","revisions":[2047'
+    ',2047]},{"value":"weekly","revisions":[2047,2047]},{"value":"monthly","revisions":[2047,2047]}],"revisions":[2047,2047]},"enc_algorithm":{"type":"stri'
+    'ng","options":[{"value":"high-medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"upload_day":{"type":"str","require'
+    'd":false},"source_ip":{"type":"str","required":false},"upload_time":{"type":"str","required":false},"max_log_rate":{"type":"int","required":false},"pr'
+    'iority":{"type":"str","required":false,"choices":["default","low"]},"interface":{"type":"str","required":false},"interface_select_method":{"type":"str'
+    '","required":false},"ssl_min_proto_version":{"type":"str","required":false,"choices":["default","SSLv3","TLSv1","TLSv1-1","TLSv1-2"]},"conn_timeout":{'
+    '"type":"int","required":false},"upload_option":{"type":"str","required":false,"choices":["store-and-upload","realtime","1-minute","5-minute"]},"upload'
+    '_interval":{"type":"str","required":false,"choices":["daily","weekly","monthly"]},"enc_algorithm":{"type":"str","required":false,"choices":["high-medi'
+    'um","high","low"]}}}'
+)
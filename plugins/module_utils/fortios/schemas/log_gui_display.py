@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"fortiview_unscanned_apps":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"resolve_hosts":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"resolve_apps":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"di'
+    'sable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"fortiview_unscanned_apps":{"type":"str","required":false,"choices":["enable","disable"]},"resolve_hosts":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"resolve_apps":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
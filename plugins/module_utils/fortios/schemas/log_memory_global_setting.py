@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"full_first_warning_threshold":{"type":"integer","revisions":[2047,2047]},"full_second_warning_threshold":{"type":"integer"'
+    ',"revisions":[2047,2047]},"full_final_warning_threshold":{"type":"integer","revisions":[2047,2047]},"max_size":{"type":"integer","revisions":[2047,204'
+    '7]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"full_first_warning_threshold":{"type":"int","required":false},"full_second_warning_threshold":{"type":"int'
+    '","required":false},"full_final_warning_threshold":{"type":"int","required":false},"max_size":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"diskfull":{"type":"string","options":[{"value":"overwrite","revisions":[383,383]}],"revisions":[2047,383]}},"revisions":[2'
+    '047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"diskfull":{"type":"str","required"'
+    ':false}}}'
+)
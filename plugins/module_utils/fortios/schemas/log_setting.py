@@ -0,0 +1,44 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"user_anonymize":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"expolicy_implicit_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","'
+    'revisions":[2047,2047]}],"revisions":[2047,2047]},"local_out":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"fwpolicy_implicit_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"'
+    'value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"brief_traffic_format":{"type":"string","options":[{"value":"enable","revisions":['
+    '2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"fortiview_weekly_data":{"type":"string","options":[{"value":"enable'
+    '","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,1023]},"log_user_in_upper":{"type":"string","options":[{"val'
+    'ue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_invalid_packet":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_policy_name":{"type":"str'
+    'ing","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"local_in_deny_unicast":{"'
+    'type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"local_in_d'
+    'eny_broadcast":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"daemon_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"neighbor_event":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisi'
+    'ons":[2047,2047]},"resolve_port":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"faz_override":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,204'
+    '0]}],"revisions":[2040,2040]},"syslog_override":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":'
+    '[2040,2040]}],"revisions":[2040,2040]},"log_policy_comment":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"local_in_allow":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"resolve_ip":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value'
+    '":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"fwpolicy6_implicit_log":{"type":"string","options":[{"value":"enable","revisions":[204'
+    '7,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"custom_log_fields":{"type":"list","children":{"field_id":{"type":"stri'
+    'ng","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"user_anonymize":{"type":"str","required":false,"choices":["enable","disable"]},"expolicy_implicit_log":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"local_out":{"type":"str","required":false,"choices":["enable","disable"]},"fwpolicy_impli'
+    'cit_log":{"type":"str","required":false,"choices":["enable","disable"]},"brief_traffic_format":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"fortiview_weekly_data":{"type":"str","required":false,"choices":["enable","disable"]},"log_user_in_upper":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]},"log_invalid_packet":{"type":"str","required":false,"choices":["enable","disable"]},"log_policy_name":{"type":"str","requi'
+    'red":false},"local_in_deny_unicast":{"type":"str","required":false,"choices":["enable","disable"]},"local_in_deny_broadcast":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"daemon_log":{"type":"str","required":false,"choices":["enable","disable"]},"neighbor_event":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"resolve_port":{"type":"str","required":false,"choices":["enable","disable"]},"faz_override":{"type":"str"'
+    ',"required":false,"choices":["enable","disable"]},"syslog_override":{"type":"str","required":false,"choices":["enable","disable"]},"log_policy_comment'
+    '":{"type":"str","required":false,"choices":["enable","disable"]},"local_in_allow":{"type":"str","required":false,"choices":["enable","disable"]},"reso'
+    'lve_ip":{"type":"str","required":false,"choices":["enable","disable"]},"fwpolicy6_implicit_log":{"type":"str","required":false,"choices":["enable","di'
+    'sable"]},"custom_log_fields":{"type":"list","required":false,"options":{"field_id":{"type":"str","required":false}}}}}'
+)
@@ -0,0 +1,42 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}'
+    '],"revisions":[2040,2040]},"custom_field_name":{"type":"list","children":{"custom":{"type":"string","revisions":[2040,2040]},"id":{"type":"integer","r'
+    'evisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"certificate":{"type":"string","revisions":[2040,204'
+    '0]},"facility":{"type":"string","options":[{"value":"kernel","revisions":[2040,2040]},{"value":"user","revisions":[2040,2040]},{"value":"mail","revisi'
+    'ons":[2040,2040]},{"value":"daemon","revisions":[2040,2040]},{"value":"auth","revisions":[2040,2040]},{"value":"syslog","revisions":[2040,2040]},{"val'
+    'ue":"lpr","revisions":[2040,2040]},{"value":"news","revisions":[2040,2040]},{"value":"uucp","revisions":[2040,2040]},{"value":"cron","revisions":[2040'
+    ',2040]},{"value":"authpriv","revisions":[2040,2040]},{"value":"ftp","revisions":[2040,2040]},{"value":"ntp","revisions":[2040,2040]},{"value":"audit",'
+    '"revisions":[2040,2040]},{"value":"alert","revisions":[2040,2040]},{"value":"clock","revisions":[2040,2040]},{"value":"local0","revisions":[2040,2040]'
+    '},{"value":"local1","revisions":[2040,2040]},{"value":"local2","revisions":[2040,2040]},{"value":"local3","revisions":[2040,2040]},{"value":"local4","'
+    'revisions":[2040,2040]},{"value":"local5","revisions":[2040,2040]},{"value":"local6","revisions":[2040,2040]},{"value":"local7","revisions":[2040,2040'
+    ']}],"revisions":[2040,2040]},"format":{"type":"string","options":[{"value":"default","revisions":[2040,2040]},{"value":"csv","revisions":[2040,2040]},'
+    '{"value":"cef","revisions":[2040,2040]},{"value":"rfc5424","revisions":[1024,1024]}],"revisions":[2040,2040]},"source_ip":{"type":"string","revisions"'
+    ':[2040,2040]},"max_log_rate":{"type":"integer","revisions":[2040,2040]},"server":{"type":"string","revisions":[2040,2040]},"priority":{"type":"string"'
+    ',"options":[{"value":"default","revisions":[2040,2040]},{"value":"low","revisions":[2040,2040]}],"revisions":[2040,2040]},"interface":{"type":"string"'
+    ',"revisions":[1984,1728]},"interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[1728,1728]},{"value":"sdwan","revisions":'
+    '[1728,1728]},{"value":"specify","revisions":[1728,1728]}],"revisions":[1984,1728]},"ssl_min_proto_version":{"type":"string","options":[{"value":"defau'
+    'lt","revisions":[2040,2040]},{"value":"SSLv3","revisions":[2040,2040]},{"value":"TLSv1","revisions":[2040,2040]},{"value":"TLSv1-1","revisions":[2040,'
+    '2040]},{"value":"TLSv1-2","revisions":[2040,2040]}],"revisions":[2040,2040]},"mode":{"type":"string","options":[{"value":"udp","revisions":[2040,2040]'
+    '},{"value":"legacy-reliable","revisions":[2040,2040]},{"value":"reliable","revisions":[2040,2040]}],"revisions":[2040,2040]},"syslog_type":{"type":"in'
+    'teger","revisions":[2032,16]},"override":{"type":"string","options":[{"value":"enable","revisions":[16,16]},{"value":"disable","revisions":[16,16]}],"'
+    'revisions":[2032,16]},"enc_algorithm":{"type":"string","options":[{"value":"high-medium","revisions":[2040,2040]},{"value":"high","revisions":[2040,20'
+    '40]},{"value":"low","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"port":{"type":"integer","revisions'
+    '":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"custom_field_name":{"type":"list",'
+    '"required":false,"options":{"custom":{"type":"str","required":false},"id":{"type":"int","required":false},"name":{"type":"str","required":false}}},"ce'
+    'rtificate":{"type":"str","required":false},"facility":{"type":"str","required":false,"choices":["kernel","user","mail","daemon","auth","syslog","lpr",'
+    '"news","uucp","cron","authpriv","ftp","ntp","audit","alert","clock","local0","local1","local2","local3","local4","local5","local6","local7"]},"format"'
+    ':{"type":"str","required":false},"source_ip":{"type":"str","required":false},"max_log_rate":{"type":"int","required":false},"server":{"type":"str","re'
+    'quired":false},"priority":{"type":"str","required":false,"choices":["default","low"]},"interface":{"type":"str","required":false},"interface_select_me'
+    'thod":{"type":"str","required":false},"ssl_min_proto_version":{"type":"str","required":false,"choices":["default","SSLv3","TLSv1","TLSv1-1","TLSv1-2"]'
+    '},"mode":{"type":"str","required":false,"choices":["udp","legacy-reliable","reliable"]},"syslog_type":{"type":"int","required":false},"override":{"typ'
+    'e":"str","required":false},"enc_algorithm":{"type":"str","required":false,"choices":["high-medium","high","low","disable"]},"port":{"type":"int","requ'
+    'ired":false}}}'
+)
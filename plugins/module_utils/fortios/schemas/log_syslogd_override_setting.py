@@ -0,0 +1,42 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"custom_field_name":{"type":"list","children":{"custom":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","r'
+    'evisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"certificate":{"type":"string","revisions":[2047,204'
+    '7]},"facility":{"type":"string","options":[{"value":"kernel","revisions":[2047,2047]},{"value":"user","revisions":[2047,2047]},{"value":"mail","revisi'
+    'ons":[2047,2047]},{"value":"daemon","revisions":[2047,2047]},{"value":"auth","revisions":[2047,2047]},{"value":"syslog","revisions":[2047,2047]},{"val'
+    'ue":"lpr","revisions":[2047,2047]},{"value":"news","revisions":[2047,2047]},{"value":"uucp","revisions":[2047,2047]},{"value":"cron","revisions":[2047'
+    ',2047]},{"value":"authpriv","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"value":"ntp","revisions":[2047,2047]},{"value":"audit",'
+    '"revisions":[2047,2047]},{"value":"alert","revisions":[2047,2047]},{"value":"clock","revisions":[2047,2047]},{"value":"local0","revisions":[2047,2047]'
+    '},{"value":"local1","revisions":[2047,2047]},{"value":"local2","revisions":[2047,2047]},{"value":"local3","revisions":[2047,2047]},{"value":"local4","'
+    'revisions":[2047,2047]},{"value":"local5","revisions":[2047,2047]},{"value":"local6","revisions":[2047,2047]},{"value":"local7","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"format":{"type":"string","options":[{"value":"default","revisions":[2047,2047]},{"value":"csv","revisions":[2047,2047]},'
+    '{"value":"cef","revisions":[2047,2047]},{"value":"rfc5424","revisions":[1024,1024]}],"revisions":[2047,2047]},"source_ip":{"type":"string","revisions"'
+    ':[2047,2047]},"max_log_rate":{"type":"integer","revisions":[2040,2040]},"server":{"type":"string","revisions":[2047,2047]},"priority":{"type":"string"'
+    ',"options":[{"value":"default","revisions":[2040,2040]},{"value":"low","revisions":[2040,2040]}],"revisions":[2040,2040]},"interface":{"type":"string"'
+    ',"revisions":[1984,1728]},"interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[1728,1728]},{"value":"sdwan","revisions":'
+    '[1728,1728]},{"value":"specify","revisions":[1728,1728]}],"revisions":[1984,1728]},"ssl_min_proto_version":{"type":"string","options":[{"value":"defau'
+    'lt","revisions":[2047,2047]},{"value":"SSLv3","revisions":[2047,2047]},{"value":"TLSv1","revisions":[2047,2047]},{"value":"TLSv1-1","revisions":[2047,'
+    '2047]},{"value":"TLSv1-2","revisions":[2047,2047]}],"revisions":[2047,2047]},"mode":{"type":"string","options":[{"value":"udp","revisions":[2047,2047]'
+    '},{"value":"legacy-reliable","revisions":[2047,2047]},{"value":"reliable","revisions":[2047,2047]}],"revisions":[2047,2047]},"syslog_type":{"type":"in'
+    'teger","revisions":[2032,16]},"override":{"type":"string","options":[{"value":"enable","revisions":[23,23]},{"value":"disable","revisions":[23,23]}],"'
+    'revisions":[2047,23]},"enc_algorithm":{"type":"string","options":[{"value":"high-medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,20'
+    '47]},{"value":"low","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"port":{"type":"integer","revisions'
+    '":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"custom_field_name":{"type":"list",'
+    '"required":false,"options":{"custom":{"type":"str","required":false},"id":{"type":"int","required":false},"name":{"type":"str","required":false}}},"ce'
+    'rtificate":{"type":"str","required":false},"facility":{"type":"str","required":false,"choices":["kernel","user","mail","daemon","auth","syslog","lpr",'
+    '"news","uucp","cron","authpriv","ftp","ntp","audit","alert","clock","local0","local1","local2","local3","local4","local5","local6","local7"]},"format"'
+    ':{"type":"str","required":false},"source_ip":{"type":"str","required":false},"max_log_rate":{"type":"int","required":false},"server":{"type":"str","re'
+    'quired":false},"priority":{"type":"str","required":false,"choices":["default","low"]},"interface":{"type":"str","required":false},"interface_select_me'
+    'thod":{"type":"str","required":false},"ssl_min_proto_version":{"type":"str","required":false,"choices":["default","SSLv3","TLSv1","TLSv1-1","TLSv1-2"]'
+    '},"mode":{"type":"str","required":false,"choices":["udp","legacy-reliable","reliable"]},"syslog_type":{"type":"int","required":false},"override":{"typ'
+    'e":"str","required":false},"enc_algorithm":{"type":"str","required":false,"choices":["high-medium","high","low","disable"]},"port":{"type":"int","requ'
+    'ired":false}}}'
+)
@@ -0,0 +1,97 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"web":{"type":"list","children":{"category":{"type":"integer","revisions":[2047,2047]},"id":{"type":"integer","revisions":['
+    '2047,2047]},"level":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium",'
+    '"revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":'
+    '[2047,2047]},"malware":{"type":"dict","children":{"file_blocked":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"low'
+    '","revisions":[2040,2040]},{"value":"medium","revisions":[2040,2040]},{"value":"high","revisions":[2040,2040]},{"value":"critical","revisions":[2040,2'
+    '040]}],"revisions":[2040,2040]},"fsa_high_risk":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"low","revisions":[20'
+    '40,2040]},{"value":"medium","revisions":[2040,2040]},{"value":"high","revisions":[2040,2040]},{"value":"critical","revisions":[2040,2040]}],"revisions'
+    '":[2040,2040]},"virus_file_type_executable":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"low","revisions":[2047,2'
+    '047]},{"value":"medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"botnet_connection":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value":"low","revisions":[7,7]},{"value":"medium","'
+    'revisions":[7,7]},{"value":"high","revisions":[7,7]},{"value":"critical","revisions":[7,7]}],"revisions":[2047,7]},"switch_proto":{"type":"string","op'
+    'tions":[{"value":"disable","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"high"'
+    ',"revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]},"fsa_malicious":{"type":"string","options":[{"value":'
+    '"disable","revisions":[2040,2040]},{"value":"low","revisions":[2040,2040]},{"value":"medium","revisions":[2040,2040]},{"value":"high","revisions":[204'
+    '0,2040]},{"value":"critical","revisions":[2040,2040]}],"revisions":[2040,2040]},"virus_scan_error":{"type":"string","options":[{"value":"disable","rev'
+    'isions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"val'
+    'ue":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]},"command_blocked":{"type":"string","options":[{"value":"disable","revisions":[2047,2'
+    '047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"critical",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"ems_threat_feed":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":'
+    '"low","revisions":[1024,1024]},{"value":"medium","revisions":[1024,1024]},{"value":"high","revisions":[1024,1024]},{"value":"critical","revisions":[10'
+    '24,1024]}],"revisions":[1024,1024]},"content_disarm":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"low","revisions'
+    '":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"virus_blocked":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value":"low","revisions":[7,7]},{"value":"medi'
+    'um","revisions":[7,7]},{"value":"high","revisions":[7,7]},{"value":"critical","revisions":[7,7]}],"revisions":[2047,7]},"malware_list":{"type":"string'
+    '","options":[{"value":"disable","revisions":[2040,2040]},{"value":"low","revisions":[2040,2040]},{"value":"medium","revisions":[2040,2040]},{"value":"'
+    'high","revisions":[2040,2040]},{"value":"critical","revisions":[2040,2040]}],"revisions":[2040,2040]},"mimefragmented":{"type":"string","options":[{"v'
+    'alue":"disable","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"high","revisions'
+    '":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]},"virus_outbreak_prevention":{"type":"string","options":[{"value"'
+    ':"disable","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"high","revisions":[20'
+    '47,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]},"virus_infected":{"type":"string","options":[{"value":"disable","revi'
+    'sions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"valu'
+    'e":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]},"fsa_medium_risk":{"type":"string","options":[{"value":"disable","revisions":[2040,20'
+    '40]},{"value":"low","revisions":[2040,2040]},{"value":"medium","revisions":[2040,2040]},{"value":"high","revisions":[2040,2040]},{"value":"critical","'
+    'revisions":[2040,2040]}],"revisions":[2040,2040]},"oversized":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"low","'
+    'revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"botnet_connection_detected":{"type":"string","options":[{"value":"disable","revisions":[2040,2'
+    '040]},{"value":"low","revisions":[2040,2040]},{"value":"medium","revisions":[2040,2040]},{"value":"high","revisions":[2040,2040]},{"value":"critical",'
+    '"revisions":[2040,2040]}],"revisions":[2040,2040]},"geolocation":{"type":"list","children":{"country":{"type":"string","revisions":[2047,2047]},"id":{'
+    '"type":"integer","revisions":[2047,2047]},"level":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"low","revisions":['
+    '2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]}},"revisions":[2047,2047]},"url_block_detected":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"low"'
+    ',"revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"level":{"type":"dict","children":{"high":{"type":"integer","revisions":[2047,2047]},"medium":{"type":"integer","revisi'
+    'ons":[2047,2047]},"critical":{"type":"integer","revisions":[2047,2047]},"low":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"ip'
+    's":{"type":"dict","children":{"medium_severity":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"low","revisions":[20'
+    '47,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"high_severity":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value'
+    '":"medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]},"l'
+    'ow_severity":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","revisi'
+    'ons":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]},"critical_severity":'
+    '{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,20'
+    '47]},{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]},"info_severity":{"type":"string",'
+    '"options":[{"value":"disable","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"hi'
+    'gh","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"failed_connection":{"ty'
+    'pe":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]}'
+    ',{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]},"blocked_connection":{"type":"string"'
+    ',"options":[{"value":"disable","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"h'
+    'igh","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]},"application":{"type":"list","children":{"categor'
+    'y":{"type":"integer","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"level":{"type":"string","options":[{"value":"disable","'
+    'revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"'
+    'value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"web":{"type":"list","required":fal'
+    'se,"options":{"category":{"type":"int","required":false},"id":{"type":"int","required":false},"level":{"type":"str","required":false,"choices":["disab'
+    'le","low","medium","high","critical"]}}},"malware":{"type":"dict","required":false,"options":{"file_blocked":{"type":"str","required":false,"choices":'
+    '["disable","low","medium","high","critical"]},"fsa_high_risk":{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]},"'
+    'virus_file_type_executable":{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]},"botnet_connection":{"type":"str","'
+    'required":false},"switch_proto":{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]},"fsa_malicious":{"type":"str","'
+    'required":false,"choices":["disable","low","medium","high","critical"]},"virus_scan_error":{"type":"str","required":false,"choices":["disable","low","'
+    'medium","high","critical"]},"command_blocked":{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]},"ems_threat_feed"'
+    ':{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]},"content_disarm":{"type":"str","required":false,"choices":["di'
+    'sable","low","medium","high","critical"]},"virus_blocked":{"type":"str","required":false},"malware_list":{"type":"str","required":false,"choices":["di'
+    'sable","low","medium","high","critical"]},"mimefragmented":{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]},"vir'
+    'us_outbreak_prevention":{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]},"virus_infected":{"type":"str","require'
+    'd":false,"choices":["disable","low","medium","high","critical"]},"fsa_medium_risk":{"type":"str","required":false,"choices":["disable","low","medium",'
+    '"high","critical"]},"oversized":{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]}}},"botnet_connection_detected":'
+    '{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]},"geolocation":{"type":"list","required":false,"options":{"count'
+    'ry":{"type":"str","required":false},"id":{"type":"int","required":false},"level":{"type":"str","required":false,"choices":["disable","low","medium","h'
+    'igh","critical"]}}},"url_block_detected":{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]},"level":{"type":"dict"'
+    ',"required":false,"options":{"high":{"type":"int","required":false},"medium":{"type":"int","required":false},"critical":{"type":"int","required":false'
+    '},"low":{"type":"int","required":false}}},"ips":{"type":"dict","required":false,"options":{"medium_severity":{"type":"str","required":false,"choices":'
+    '["disable","low","medium","high","critical"]},"high_severity":{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]},"'
+    'low_severity":{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]},"critical_severity":{"type":"str","required":fals'
+    'e,"choices":["disable","low","medium","high","critical"]},"info_severity":{"type":"str","required":false,"choices":["disable","low","medium","high","c'
+    'ritical"]}}},"failed_connection":{"type":"str","required":false,"choices":["disable","low","medium","high","critical"]},"blocked_connection":{"type":"'
+    'str","required":false,"choices":["disable","low","medium","high","critical"]},"application":{"type":"list","required":false,"options":{"category":{"ty'
+    'pe":"int","required":false},"id":{"type":"int","required":false},"level":{"type":"str","required":false,"choices":["disable","low","medium","high","cr'
+    'itical"]}}}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}'
+    '],"revisions":[1024,1024]},"interval":{"type":"integer","revisions":[1024,1024]},"multipliers":{"type":"string","revisions":[1024,1024]}},"revisions":'
+    '[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"interval":{"type":"int","required"'
+    ':false},"multipliers":{"type":"str","required":false}}}'
+)
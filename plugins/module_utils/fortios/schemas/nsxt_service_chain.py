@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"service_index":{"type":"list","children":{"vd":{"type":"string","revisions":[1024,1024]},"id":{"type":"integer","revisions'
+    '":[1024,1024]},"reverse_index":{"type":"integer","revisions":[1024,1024]},"name":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"'
+    'id":{"type":"integer","revisions":[1024,1024]},"name":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"service_index":{"type":"list","required":false,"options":{"vd":{"type":"str","required":false},"id":{"type'
+    '":"int","required":false},"reverse_index":{"type":"int","required":false},"name":{"type":"str","required":false}}},"id":{"type":"int","required":false'
+    '},"name":{"type":"str","required":false}}}'
+)
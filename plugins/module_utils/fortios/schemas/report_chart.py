@@ -0,0 +1,78 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"x_series":{"type":"dict","children":{"is_category":{"type":"string","options":[{"value":"yes","revisions":[1023,1023]},{"v'
+    'alue":"no","revisions":[1023,1023]}],"revisions":[1023,1023]},"font_size":{"type":"integer","revisions":[1023,1023]},"databind":{"type":"string","revi'
+    'sions":[1023,1023]},"scale_step":{"type":"integer","revisions":[1023,1023]},"caption":{"type":"string","revisions":[1023,1023]},"caption_font_size":{"'
+    'type":"integer","revisions":[1023,1023]},"scale_unit":{"type":"string","options":[{"value":"minute","revisions":[1023,1023]},{"value":"hour","revision'
+    's":[1023,1023]},{"value":"day","revisions":[1023,1023]},{"value":"month","revisions":[1023,1023]},{"value":"year","revisions":[1023,1023]}],"revisions'
+    '":[1023,1023]},"scale_direction":{"type":"string","options":[{"value":"decrease","revisions":[1023,1023]},{"value":"increase","revisions":[1023,1023]}'
+    '],"revisions":[1023,1023]},"scale_format":{"type":"string","options":[{"value":"YYYY-MM-DD-HH-MM","revisions":[1023,1023]},{"value":"YYYY-MM-DD HH","r'
+    'evisions":[1023,1023]},{"value":"YYYY-MM-DD","revisions":[1023,1023]},{"value":"YYYY-MM","revisions":[1023,1023]},{"value":"YYYY","revisions":[1023,10'
+    '23]},{"value":"HH-MM","revisions":[1023,1023]},{"value":"MM-DD","revisions":[1023,1023]}],"revisions":[1023,1023]},"label_angle":{"type":"string","opt'
+    'ions":[{"value":"45-degree","revisions":[1023,1023]},{"value":"vertical","revisions":[1023,1023]},{"value":"horizontal","revisions":[1023,1023]}],"rev'
+    'isions":[1023,1023]},"unit":{"type":"string","revisions":[1023,1023]}},"revisions":[1023,1023]},"period":{"type":"string","options":[{"value":"last24h'
+    '","revisions":[1023,1023]},{"value":"last7d","revisions":[1023,1023]}],"revisions":[1023,1023]},"dataset":{"type":"string","revisions":[1023,1023]},"l'
+    'egend_font_size":{"type":"integer","revisions":[1023,1023]},"category":{"type":"string","options":[{"value":"misc","revisions":[1023,1023]},{"value":"'
+    'traffic","revisions":[1023,1023]},{"value":"event","revisions":[1023,1023]},{"value":"virus","revisions":[1023,1023]},{"value":"webfilter","revisions"'
+    ':[1023,1023]},{"value":"attack","revisions":[1023,1023]},{"value":"spam","revisions":[1023,1023]},{"value":"dlp","revisions":[1023,1023]},{"value":"ap'
+    'p-ctrl","revisions":[1023,1023]},{"value":"vulnerability","revisions":[1023,1023]}],"revisions":[1023,1023]},"style":{"type":"string","options":[{"val'
+    'ue":"auto","revisions":[1023,1023]},{"value":"manual","revisions":[1023,1023]}],"revisions":[1023,1023]},"title":{"type":"string","revisions":[1023,10'
+    '23]},"comments":{"type":"string","revisions":[1023,1023]},"policy":{"type":"integer","revisions":[1023,1023]},"graph_type":{"type":"string","options":'
+    '[{"value":"none","revisions":[1023,1023]},{"value":"bar","revisions":[1023,1023]},{"value":"pie","revisions":[1023,1023]},{"value":"line","revisions":'
+    '[1023,1023]},{"value":"flow","revisions":[1023,1023]}],"revisions":[1023,1023]},"y_series":{"type":"dict","children":{"group":{"type":"string","revisi'
+    'ons":[1023,1023]},"extra_databind":{"type":"string","revisions":[1023,1023]},"caption_font_size":{"type":"integer","revisions":[1023,1023]},"databind"'
+    ':{"type":"string","revisions":[1023,1023]},"extra_y_legend":{"type":"string","revisions":[1023,1023]},"caption":{"type":"string","revisions":[1023,102'
+    '3]},"extra_y":{"type":"string","options":[{"value":"enable","revisions":[1023,1023]},{"value":"disable","revisions":[1023,1023]}],"revisions":[1023,10'
+    '23]},"y_legend":{"type":"string","revisions":[1023,1023]},"font_size":{"type":"integer","revisions":[1023,1023]},"label_angle":{"type":"string","optio'
+    'ns":[{"value":"45-degree","revisions":[1023,1023]},{"value":"vertical","revisions":[1023,1023]},{"value":"horizontal","revisions":[1023,1023]}],"revis'
+    'ions":[1023,1023]},"unit":{"type":"string","revisions":[1023,1023]}},"revisions":[1023,1023]},"type":{"type":"string","options":[{"value":"graph","rev'
+    'isions":[1023,1023]},{"value":"table","revisions":[1023,1023]}],"revisions":[1023,1023]},"value_series":{"type":"dict","children":{"databind":{"type":'
+    '"string","revisions":[1023,1023]}},"revisions":[1023,1023]},"drill_down_charts":{"type":"list","children":{"status":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[1023,1023]},{"value":"disable","revisions":[1023,1023]}],"revisions":[1023,1023]},"chart_name":{"type":"string","revisions":['
+    '1023,1023]},"id":{"type":"integer","revisions":[1023,1023]}},"revisions":[1023,1023]},"background":{"type":"string","revisions":[1023,1023]},"legend":'
+    '{"type":"string","options":[{"value":"enable","revisions":[1023,1023]},{"value":"disable","revisions":[1023,1023]}],"revisions":[1023,1023]},"category'
+    '_series":{"type":"dict","children":{"font_size":{"type":"integer","revisions":[1023,1023]},"databind":{"type":"string","revisions":[1023,1023]}},"revi'
+    'sions":[1023,1023]},"name":{"type":"string","revisions":[1023,1023]},"column":{"type":"list","children":{"mapping":{"type":"list","children":{"display'
+    'name":{"type":"string","revisions":[1023,1023]},"value_type":{"type":"string","options":[{"value":"integer","revisions":[1023,1023]},{"value":"string"'
+    ',"revisions":[1023,1023]}],"revisions":[1023,1023]},"value2":{"type":"string","revisions":[1023,1023]},"value1":{"type":"string","revisions":[1023,102'
+    '3]},"id":{"type":"integer","revisions":[1023,1023]},"op":{"type":"string","options":[{"value":"none","revisions":[1023,1023]},{"value":"greater","revi'
+    'sions":[1023,1023]},{"value":"greater-equal","revisions":[1023,1023]},{"value":"less","revisions":[1023,1023]},{"value":"less-equal","revisions":[1023'
+    ',1023]},{"value":"equal","revisions":[1023,1023]},{"value":"between","revisions":[1023,1023]}],"revisions":[1023,1023]}},"revisions":[1023,1023]},"det'
+    'ail_value":{"type":"string","revisions":[1023,1023]},"footer_value":{"type":"string","revisions":[1023,1023]},"footer_unit":{"type":"string","revision'
+    's":[1023,1023]},"header_value":{"type":"string","revisions":[1023,1023]},"id":{"type":"integer","revisions":[1023,1023]},"detail_unit":{"type":"string'
+    '","revisions":[1023,1023]}},"revisions":[1023,1023]},"favorite":{"type":"string","options":[{"value":"no","revisions":[1023,1023]},{"value":"yes","rev'
+    'isions":[1023,1023]}],"revisions":[1023,1023]},"color_palette":{"type":"string","revisions":[1023,1023]},"title_font_size":{"type":"integer","revision'
+    's":[1023,1023]},"dimension":{"type":"string","options":[{"value":"2D","revisions":[1023,1023]},{"value":"3D","revisions":[1023,1023]}],"revisions":[10'
+    '23,1023]}},"revisions":[1023,1023]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"x_series":{"type":"dict","required":false,"options":{"is_category":{"type":"str","required":false,"choices'
+    '":["yes","no"]},"font_size":{"type":"int","required":false},"databind":{"type":"str","required":false},"scale_step":{"type":"int","required":false},"c'
+    'aption":{"type":"str","required":false},"caption_font_size":{"type":"int","required":false},"scale_unit":{"type":"str","required":false,"choices":["mi'
+    'nute","hour","day","month","year"]},"scale_direction":{"type":"str","required":false,"choices":["decrease","increase"]},"scale_format":{"type":"str","'
+    'required":false,"choices":["YYYY-MM-DD-HH-MM","YYYY-MM-DD HH","YYYY-MM-DD","YYYY-MM","YYYY","HH-MM","MM-DD"]},"label_angle":{"type":"str","required":f'
+    'alse,"choices":["45-degree","vertical","horizontal"]},"unit":{"type":"str","required":false}}},"period":{"type":"str","required":false,"choices":["las'
+    't24h","last7d"]},"dataset":{"type":"str","required":false},"legend_font_size":{"type":"int","required":false},"category":{"type":"str","required":fals'
+    'e,"choices":["misc","traffic","event","virus","webfilter","attack","spam","dlp","app-ctrl","vulnerability"]},"style":{"type":"str","required":false,"c'
+    'hoices":["auto","manual"]},"title":{"type":"str","required":false},"comments":{"type":"str","required":false},"policy":{"type":"int","required":false}'
+    ',"graph_type":{"type":"str","required":false,"choices":["none","bar","pie","line","flow"]},"y_series":{"type":"dict","required":false,"options":{"grou'
+    'p":{"type":"str","required":false},"extra_databind":{"type":"str","required":false},"caption_font_size":{"type":"int","required":false},"databind":{"t'
+    'ype":"str","required":false},"extra_y_legend":{"type":"str","required":false},"caption":{"type":"str","required":false},"extra_y":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]},"y_legend":{"type":"str","required":false},"font_size":{"type":"int","required":false},"label_angle":{"type'
+    '":"str","required":false,"choices":["45-degree","vertical","horizontal"]},"unit":{"type":"str","required":false}}},"type":{"type":"str","required":fal'
+    'se,"choices":["graph","table"]},"value_series":{"type":"dict","required":false,"options":{"databind":{"type":"str","required":false}}},"drill_down_cha'
+    'rts":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"chart_name":{"type":"str","re'
+    'quired":false},"id":{"type":"int","required":false}}},"background":{"type":"str","required":false},"legend":{"type":"str","required":false,"choices":['
+    '"enable","disable"]},"category_series":{"type":"dict","required":false,"options":{"font_size":{"type":"int","required":false},"databind":{"type":"str"'
+    ',"required":false}}},"name":{"type":"str","required":false},"column":{"type":"list","required":false,"options":{"mapping":{"type":"list","required":fa'
+    'lse,"options":{"displayname":{"type":"str","required":false},"value_type":{"type":"str","required":false,"choices":["integer","string"]},"value2":{"ty'
+    'pe":"str","required":false},"value1":{"type":"str","required":false},"id":{"type":"int","required":false},"op":{"type":"str","required":false,"choices'
+    '":["none","greater","greater-equal","less","less-equal","equal","between"]}}},"detail_value":{"type":"str","required":false},"footer_value":{"type":"s'
+    'tr","required":false},"footer_unit":{"type":"str","required":false},"header_value":{"type":"str","required":false},"id":{"type":"int","required":false'
+    '},"detail_unit":{"type":"str","required":false}}},"favorite":{"type":"str","required":false,"choices":["no","yes"]},"color_palette":{"type":"str","req'
+    'uired":false},"title_font_size":{"type":"int","required":false},"dimension":{"type":"str","required":false,"choices":["2D","3D"]}}}'
+)
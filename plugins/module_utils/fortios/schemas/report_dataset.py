@@ -0,0 +1,22 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"policy":{"type":"integer","revisions":[1023,1023]},"query":{"type":"string","revisions":[1023,1023]},"name":{"type":"strin'
+    'g","revisions":[1023,1023]},"parameters":{"type":"list","children":{"field":{"type":"string","revisions":[1023,1023]},"display_name":{"type":"string",'
+    '"revisions":[1023,1023]},"id":{"type":"integer","revisions":[1023,1023]},"data_type":{"type":"string","options":[{"value":"text","revisions":[1023,102'
+    '3]},{"value":"integer","revisions":[1023,1023]},{"value":"double","revisions":[1023,1023]},{"value":"long-integer","revisions":[1023,1023]},{"value":"'
+    'date-time","revisions":[1023,1023]}],"revisions":[1023,1023]}},"revisions":[1023,1023]},"field":{"type":"list","children":{"displayname":{"type":"stri'
+    'ng","revisions":[1023,1023]},"type":{"type":"string","options":[{"value":"text","revisions":[1023,1023]},{"value":"integer","revisions":[1023,1023]},{'
+    '"value":"double","revisions":[1023,1023]}],"revisions":[1023,1023]},"id":{"type":"integer","revisions":[1023,1023]},"name":{"type":"string","revisions'
+    '":[1023,1023]}},"revisions":[1023,1023]}},"revisions":[1023,1023]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"policy":{"type":"int","required":false},"query":{"type":"str","required":false},"name":{"type":"str","requ'
+    'ired":false},"parameters":{"type":"list","required":false,"options":{"field":{"type":"str","required":false},"display_name":{"type":"str","required":f'
+    'alse},"id":{"type":"int","required":false},"data_type":{"type":"str","required":false,"choices":["text","integer","double","long-integer","date-time"]'
+    '}}},"field":{"type":"list","required":false,"options":{"displayname":{"type":"str","required":false},"type":{"type":"str","required":false,"choices":['
+    '"text","integer","double"]},"id":{"type":"int","required":false},"name":{"type":"str","required":false}}}}}'
+)
@@ -0,0 +1,80 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"email_recipients":{"type":"string","revisions":[2047,2047]},"subtitle":{"type":"string","revisions":[2047,2047]},"descript'
+    'ion":{"type":"string","revisions":[2047,2047]},"style_theme":{"type":"string","revisions":[2047,2047]},"title":{"type":"string","revisions":[2047,2047'
+    ']},"email_send":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"format":{"multiple_values":true,"type":"list","options":[{"value":"pdf","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_pdf_report":{"'
+    'type":"integer","revisions":[2047,2047]},"page":{"type":"dict","children":{"footer":{"type":"dict","children":{"footer_item":{"type":"list","children"'
+    ':{"style":{"type":"string","revisions":[2047,2047]},"description":{"type":"string","revisions":[2047,2047]},"content":{"type":"string","revisions":[20'
+    '47,2047]},"img_src":{"type":"string","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"text","revisions":[2047,2047]},{"value":"im'
+    'age","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"style":{"type":"str'
+    'ing","revisions":[2047,2047]}},"revisions":[2047,2047]},"column_break_before":{"multiple_values":true,"type":"list","options":[{"value":"heading1","re'
+    'visions":[2047,2047]},{"value":"heading2","revisions":[2047,2047]},{"value":"heading3","revisions":[2047,2047]}],"revisions":[2047,2047]},"header":{"t'
+    'ype":"dict","children":{"style":{"type":"string","revisions":[2047,2047]},"header_item":{"type":"list","children":{"style":{"type":"string","revisions'
+    '":[2047,2047]},"description":{"type":"string","revisions":[2047,2047]},"content":{"type":"string","revisions":[2047,2047]},"img_src":{"type":"string",'
+    '"revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"text","revisions":[2047,2047]},{"value":"image","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]},"paper":{"type":"string","optio'
+    'ns":[{"value":"a4","revisions":[2047,2047]},{"value":"letter","revisions":[2047,2047]}],"revisions":[2047,2047]},"page_break_before":{"multiple_values'
+    '":true,"type":"list","options":[{"value":"heading1","revisions":[2047,2047]},{"value":"heading2","revisions":[2047,2047]},{"value":"heading3","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options":[{"value":"header-on-first-page","revisions":[204'
+    '7,2047]},{"value":"footer-on-first-page","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"options":{"multiple_values":tru'
+    'e,"type":"list","options":[{"value":"include-table-of-content","revisions":[2047,2047]},{"value":"auto-numbering-heading","revisions":[2047,2047]},{"v'
+    'alue":"view-chart-as-heading","revisions":[2047,2047]},{"value":"show-html-navbar-before-heading","revisions":[2047,2047]},{"value":"dummy-option","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"body_item":{"type":"list","children":{"list_component":{"type":"string","options":[{"value":"bullet",'
+    '"revisions":[1023,1023]},{"value":"numbered","revisions":[1023,1023]}],"revisions":[2047,1023]},"text_component":{"type":"string","options":[{"value":'
+    '"text","revisions":[2047,2047]},{"value":"heading1","revisions":[2047,2047]},{"value":"heading2","revisions":[2047,2047]},{"value":"heading3","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"style":{"type":"string","revisions":[2047,2047]},"hide":{"'
+    'type":"string","options":[{"value":"enable","revisions":[1023,1023]},{"value":"disable","revisions":[1023,1023]}],"revisions":[2047,1023]},"parameters'
+    '":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]},"value":{"type":"string","revisions":[2047,2047]},"name":{"type":"string"'
+    ',"revisions":[2047,2047]}},"revisions":[2047,2047]},"title":{"type":"string","revisions":[2047,2047]},"content":{"type":"string","revisions":[2047,204'
+    '7]},"drill_down_types":{"type":"string","revisions":[2047,1023]},"img_src":{"type":"string","revisions":[2047,2047]},"table_head_style":{"type":"strin'
+    'g","revisions":[2047,1023]},"drill_down_items":{"type":"string","revisions":[2047,1023]},"type":{"type":"string","options":[{"value":"text","revisions'
+    '":[2047,2047]},{"value":"image","revisions":[2047,2047]},{"value":"chart","revisions":[2047,2047]},{"value":"misc","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"chart_options":{"multiple_values":true,"type":"list","options":[{"value":"include-no-data","revisions":[2047,2047]},{"value":"hide-ti'
+    'tle","revisions":[2047,2047]},{"value":"show-caption","revisions":[2047,2047]}],"revisions":[2047,2047]},"table_even_row_style":{"type":"string","revi'
+    'sions":[2047,1023]},"description":{"type":"string","revisions":[2047,2047]},"top_n":{"type":"integer","revisions":[2047,2047]},"table_odd_row_style":{'
+    '"type":"string","revisions":[2047,1023]},"chart":{"type":"string","revisions":[2047,2047]},"table_caption_style":{"type":"string","revisions":[2047,10'
+    '23]},"table_column_widths":{"type":"string","revisions":[2047,1023]},"column":{"type":"integer","revisions":[2047,1023]},"list":{"type":"list","childr'
+    'en":{"content":{"type":"string","revisions":[1023,1023]},"id":{"type":"integer","revisions":[1023,1023]}},"revisions":[2047,1023]},"misc_component":{"'
+    'type":"string","options":[{"value":"hline","revisions":[2047,2047]},{"value":"page-break","revisions":[2047,2047]},{"value":"column-break","revisions"'
+    ':[2047,2047]},{"value":"section-start","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"cutoff_time":{"type":"string","re'
+    'visions":[2047,2047]},"time":{"type":"string","revisions":[2047,2047]},"schedule_type":{"type":"string","options":[{"value":"demand","revisions":[2047'
+    ',2047]},{"value":"daily","revisions":[2047,2047]},{"value":"weekly","revisions":[2047,2047]}],"revisions":[2047,2047]},"cutoff_option":{"type":"string'
+    '","options":[{"value":"run-time","revisions":[2047,2047]},{"value":"custom","revisions":[2047,2047]}],"revisions":[2047,2047]},"day":{"type":"string",'
+    '"options":[{"value":"sunday","revisions":[2047,2047]},{"value":"monday","revisions":[2047,2047]},{"value":"tuesday","revisions":[2047,2047]},{"value":'
+    '"wednesday","revisions":[2047,2047]},{"value":"thursday","revisions":[2047,2047]},{"value":"friday","revisions":[2047,2047]},{"value":"saturday","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"email_recipients":{"type":"str","required":false},"subtitle":{"type":"str","required":false},"description"'
+    ':{"type":"str","required":false},"style_theme":{"type":"str","required":false},"title":{"type":"str","required":false},"email_send":{"type":"str","req'
+    'uired":false,"choices":["enable","disable"]},"format":{"type":"list","required":false,"choices":["pdf"]},"max_pdf_report":{"type":"int","required":fal'
+    'se},"page":{"type":"dict","required":false,"options":{"footer":{"type":"dict","required":false,"options":{"footer_item":{"type":"list","required":fals'
+    'e,"options":{"style":{"type":"str","required":false},"description":{"type":"str","required":false},"content":{"type":"str","required":false},"img_src"'
+    ':{"type":"str","required":false},"type":{"type":"str","required":false,"choices":["text","image"]},"id":{"type":"int","required":false}}},"style":{"ty'
+    'pe":"str","required":false}}},"column_break_before":{"type":"list","required":false,"choices":["heading1","heading2","heading3"]},"header":{"type":"di'
+    'ct","required":false,"options":{"style":{"type":"str","required":false},"header_item":{"type":"list","required":false,"options":{"style":{"type":"str"'
+    ',"required":false},"description":{"type":"str","required":false},"content":{"type":"str","required":false},"img_src":{"type":"str","required":false},"'
+    'type":{"type":"str","required":false,"choices":["text","image"]},"id":{"type":"int","required":false}}}}},"paper":{"type":"str","required":false,"choi'
+    'ces":["a4","letter"]},"page_break_before":{"type":"list","required":false,"choices":["heading1","heading2","heading3"]},"options":{"type":"list","requ'
+    'ired":false,"choices":["header-on-first-page","footer-on-first-page"]}}},"options":{"type":"list","required":false,"choices":["include-table-of-conten'
+    't","auto-numbering-heading","view-chart-as-heading","show-html-navbar-before-heading","dummy-option"]},"body_item":{"type":"list","required":false,"op'
+    'tions":{"list_component":{"type":"str","required":false},"text_component":{"type":"str","required":false,"choices":["text","heading1","heading2","head'
+    'ing3"]},"id":{"type":"int","required":false},"style":{"type":"str","required":false},"hide":{"type":"str","required":false},"parameters":{"type":"list'
+    '","required":false,"options":{"id":{"type":"int","required":false},"value":{"type":"str","required":false},"name":{"type":"str","required":false}}},"t'
+    'itle":{"type":"str","required":false},"content":{"type":"str","required":false},"drill_down_types":{"type":"str","required":false},"img_src":{"type":"'
+    'str","required":false},"table_head_style":{"type":"str","required":false},"drill_down_items":{"type":"str","required":false},"type":{"type":"str","req'
+    'uired":false,"choices":["text","image","chart","misc"]},"chart_options":{"type":"list","required":false,"choices":["include-no-data","hide-title","sho'
+    'w-caption"]},"table_even_row_style":{"type":"str","required":false},"description":{"type":"str","required":false},"top_n":{"type":"int","required":fal'
+    'se},"table_odd_row_style":{"type":"str","required":false},"chart":{"type":"str","required":false},"table_caption_style":{"type":"str","required":false'
+    '},"table_column_widths":{"type":"str","required":false},"column":{"type":"int","required":false},"list":{"type":"list","required":false,"options":{"co'
+    'ntent":{"type":"str","required":false},"id":{"type":"int","required":false}}},"misc_component":{"type":"str","required":false,"choices":["hline","page'
+    '-break","column-break","section-start"]}}},"cutoff_time":{"type":"str","required":false},"time":{"type":"str","required":false},"schedule_type":{"type'
+    '":"str","required":false,"choices":["demand","daily","weekly"]},"cutoff_option":{"type":"str","required":false,"choices":["run-time","custom"]},"day":'
+    '{"type":"str","required":false,"choices":["sunday","monday","tuesday","wednesday","thursday","friday","saturday"]},"name":{"type":"str","required":fal'
+    'se}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"web_browsing_threshold":{"type":"integer","revisions":[2047,2047]},"fortiview":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"report_source":{"multiple_values":true,"type":"list'
+    '","options":[{"value":"forward-traffic","revisions":[2047,2047]},{"value":"sniffer-traffic","revisions":[2047,2047]},{"value":"local-deny-traffic","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"pdf_report":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"top_n":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"web_browsing_threshold":{"type":"int","required":false},"fortiview":{"type":"str","required":false,"choice'
+    's":["enable","disable"]},"report_source":{"type":"list","required":false,"choices":["forward-traffic","sniffer-traffic","local-deny-traffic"]},"pdf_re'
+    'port":{"type":"str","required":false,"choices":["enable","disable"]},"top_n":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,37 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"height":{"type":"string","revisions":[1023,1023]},"border_right":{"type":"string","revisions":[1023,1023]},"font_style":{"'
+    'type":"string","options":[{"value":"normal","revisions":[1023,1023]},{"value":"italic","revisions":[1023,1023]}],"revisions":[1023,1023]},"margin_righ'
+    't":{"type":"string","revisions":[1023,1023]},"padding_bottom":{"type":"string","revisions":[1023,1023]},"width":{"type":"string","revisions":[1023,102'
+    '3]},"padding_left":{"type":"string","revisions":[1023,1023]},"line_height":{"type":"string","revisions":[1023,1023]},"font_family":{"type":"string","o'
+    'ptions":[{"value":"Verdana","revisions":[1023,1023]},{"value":"Arial","revisions":[1023,1023]},{"value":"Helvetica","revisions":[1023,1023]},{"value":'
+    '"Courier","revisions":[1023,1023]},{"value":"Times","revisions":[1023,1023]}],"revisions":[1023,1023]},"column_gap":{"type":"string","revisions":[1023'
+    ',1023]},"padding_right":{"type":"string","revisions":[1023,1023]},"font_weight":{"type":"string","options":[{"value":"normal","revisions":[1023,1023]}'
+    ',{"value":"bold","revisions":[1023,1023]}],"revisions":[1023,1023]},"border_top":{"type":"string","revisions":[1023,1023]},"border_left":{"type":"stri'
+    'ng","revisions":[1023,1023]},"border_bottom":{"type":"string","revisions":[1023,1023]},"name":{"type":"string","revisions":[1023,1023]},"font_size":{"'
+    'type":"string","revisions":[1023,1023]},"fg_color":{"type":"string","revisions":[1023,1023]},"bg_color":{"type":"string","revisions":[1023,1023]},"ali'
+    'gn":{"type":"string","options":[{"value":"left","revisions":[1023,1023]},{"value":"center","revisions":[1023,1023]},{"value":"right","revisions":[1023'
+    ',1023]},{"value":"justify","revisions":[1023,1023]}],"revisions":[1023,1023]},"column_span":{"type":"string","options":[{"value":"none","revisions":[1'
+    '023,1023]},{"value":"all","revisions":[1023,1023]}],"revisions":[1023,1023]},"margin_top":{"type":"string","revisions":[1023,1023]},"margin_left":{"ty'
+    'pe":"string","revisions":[1023,1023]},"padding_top":{"type":"string","revisions":[1023,1023]},"margin_bottom":{"type":"string","revisions":[1023,1023]'
+    '},"options":{"multiple_values":true,"type":"list","options":[{"value":"font","revisions":[1023,1023]},{"value":"text","revisions":[1023,1023]},{"value'
+    '":"color","revisions":[1023,1023]},{"value":"align","revisions":[1023,1023]},{"value":"size","revisions":[1023,1023]},{"value":"margin","revisions":[1'
+    '023,1023]},{"value":"border","revisions":[1023,1023]},{"value":"padding","revisions":[1023,1023]},{"value":"column","revisions":[1023,1023]}],"revisio'
+    'ns":[1023,1023]}},"revisions":[1023,1023]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"height":{"type":"str","required":false},"border_right":{"type":"str","required":false},"font_style":{"type'
+    '":"str","required":false,"choices":["normal","italic"]},"margin_right":{"type":"str","required":false},"padding_bottom":{"type":"str","required":false'
+    '},"width":{"type":"str","required":false},"padding_left":{"type":"str","required":false},"line_height":{"type":"str","required":false},"font_family":{'
+    '"type":"str","required":false,"choices":["Verdana","Arial","Helvetica","Courier","Times"]},"column_gap":{"type":"str","required":false},"padding_right'
+    '":{"type":"str","required":false},"font_weight":{"type":"str","required":false,"choices":["normal","bold"]},"border_top":{"type":"str","required":fals'
+    'e},"border_left":{"type":"str","required":false},"border_bottom":{"type":"str","required":false},"name":{"type":"str","required":false},"font_size":{"'
+    'type":"str","required":false},"fg_color":{"type":"str","required":false},"bg_color":{"type":"str","required":false},"align":{"type":"str","required":f'
+    'alse,"choices":["left","center","right","justify"]},"column_span":{"type":"str","required":false,"choices":["none","all"]},"margin_top":{"type":"str",'
+    '"required":false},"margin_left":{"type":"str","required":false},"padding_top":{"type":"str","required":false},"margin_bottom":{"type":"str","required"'
+    ':false},"options":{"type":"list","required":false,"choices":["font","text","color","align","size","margin","border","padding","column"]}}}'
+)
@@ -0,0 +1,35 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"toc_heading2_style":{"type":"string","revisions":[1023,1023]},"bullet_list_style":{"type":"string","revisions":[1023,1023]'
+    '},"toc_heading4_style":{"type":"string","revisions":[1023,1023]},"image_style":{"type":"string","revisions":[1023,1023]},"table_chart_head_style":{"ty'
+    'pe":"string","revisions":[1023,1023]},"table_chart_caption_style":{"type":"string","revisions":[1023,1023]},"page_header_style":{"type":"string","revi'
+    'sions":[1023,1023]},"report_title_style":{"type":"string","revisions":[1023,1023]},"table_chart_style":{"type":"string","revisions":[1023,1023]},"defa'
+    'ult_pdf_style":{"type":"string","revisions":[1023,1023]},"normal_text_style":{"type":"string","revisions":[1023,1023]},"numbered_list_style":{"type":"'
+    'string","revisions":[1023,1023]},"heading3_style":{"type":"string","revisions":[1023,1023]},"toc_title_style":{"type":"string","revisions":[1023,1023]'
+    '},"graph_chart_style":{"type":"string","revisions":[1023,1023]},"page_footer_style":{"type":"string","revisions":[1023,1023]},"toc_heading1_style":{"t'
+    'ype":"string","revisions":[1023,1023]},"toc_heading3_style":{"type":"string","revisions":[1023,1023]},"heading4_style":{"type":"string","revisions":[1'
+    '023,1023]},"hline_style":{"type":"string","revisions":[1023,1023]},"page_orient":{"type":"string","options":[{"value":"portrait","revisions":[1023,102'
+    '3]},{"value":"landscape","revisions":[1023,1023]}],"revisions":[1023,1023]},"heading2_style":{"type":"string","revisions":[1023,1023]},"default_html_s'
+    'tyle":{"type":"string","revisions":[1023,1023]},"column_count":{"type":"string","options":[{"value":"1","revisions":[1023,1023]},{"value":"2","revisio'
+    'ns":[1023,1023]},{"value":"3","revisions":[1023,1023]}],"revisions":[1023,1023]},"name":{"type":"string","revisions":[1023,1023]},"page_style":{"type"'
+    ':"string","revisions":[1023,1023]},"report_subtitle_style":{"type":"string","revisions":[1023,1023]},"heading1_style":{"type":"string","revisions":[10'
+    '23,1023]},"table_chart_even_row_style":{"type":"string","revisions":[1023,1023]},"table_chart_odd_row_style":{"type":"string","revisions":[1023,1023]}'
+    '},"revisions":[1023,1023]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"toc_heading2_style":{"type":"str","required":false},"bullet_list_style":{"type":"str","required":false},"t'
+    'oc_heading4_style":{"type":"str","required":false},"image_style":{"type":"str","required":false},"table_chart_head_style":{"type":"str","required":fal'
+    'se},"table_chart_caption_style":{"type":"str","required":false},"page_header_style":{"type":"str","required":false},"report_title_style":{"type":"str"'
+    ',"required":false},"table_chart_style":{"type":"str","required":false},"default_pdf_style":{"type":"str","required":false},"normal_text_style":{"type"'
+    ':"str","required":false},"numbered_list_style":{"type":"str","required":false},"heading3_style":{"type":"str","required":false},"toc_title_style":{"ty'
+    'pe":"str","required":false},"graph_chart_style":{"type":"str","required":false},"page_footer_style":{"type":"str","required":false},"toc_heading1_styl'
+    'e":{"type":"str","required":false},"toc_heading3_style":{"type":"str","required":false},"heading4_style":{"type":"str","required":false},"hline_style"'
+    ':{"type":"str","required":false},"page_orient":{"type":"str","required":false,"choices":["portrait","landscape"]},"heading2_style":{"type":"str","requ'
+    'ired":false},"default_html_style":{"type":"str","required":false},"column_count":{"type":"str","required":false,"choices":["1","2","3"]},"name":{"type'
+    '":"str","required":false},"page_style":{"type":"str","required":false},"report_subtitle_style":{"type":"str","required":false},"heading1_style":{"type'
+    '":"str","required":false},"table_chart_even_row_style":{"type":"str","required":false},"table_chart_odd_row_style":{"type":"str","required":false}}}'
+)
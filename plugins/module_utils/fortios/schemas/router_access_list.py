@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"rule":{"type":"list","children":{"exact_match":{"type":"string","options"'
+    ':[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"prefix":{"type":"string","revision'
+    's":[2047,2047]},"flags":{"type":"integer","revisions":[2047,1023]},"wildcard":{"type":"string","revisions":[2047,2047]},"action":{"type":"string","opt'
+    'ions":[{"value":"permit","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions'
+    '":[2047,2047]}},"revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"rule":{"type":"list","required":false,"options":{"exact_match":{"ty'
+    'pe":"str","required":false,"choices":["enable","disable"]},"prefix":{"type":"str","required":false},"flags":{"type":"int","required":false},"wildcard"'
+    ':{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["permit","deny"]},"id":{"type":"int","required":false}}},"comments'
+    '":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"rule":{"type":"list","children":{"action":{"type":"string","options":[{"v'
+    'alue":"permit","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"flags":{"type":"integer","revisions":[2047'
+    ',2047]},"exact_match":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"prefix6":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"comments":'
+    '{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"rule":{"type":"list","required":false,"options":{"action":{"type":"'
+    'str","required":false,"choices":["permit","deny"]},"flags":{"type":"int","required":false},"exact_match":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"id":{"type":"int","required":false},"prefix6":{"type":"str","required":false}}},"comments":{"type":"str","required":false}}}'
+)
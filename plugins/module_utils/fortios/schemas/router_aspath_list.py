@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"rule":{"type":"list","children":{"action":{"type":"string","options":[{"v'
+    'alue":"deny","revisions":[2047,2047]},{"value":"permit","revisions":[2047,2047]}],"revisions":[2047,2047]},"regexp":{"type":"string","revisions":[2047'
+    ',2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"rule":{"type":"list","required":false,"options":{"action":{"type":"'
+    'str","required":false,"choices":["deny","permit"]},"regexp":{"type":"str","required":false},"id":{"type":"int","required":false}}}}}'
+)
@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"device":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"gateway":{"type":"stri'
+    'ng","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"device":{"type":"str","required":false},"name":{"type":"str","required":false},"gateway":{"type":"str","re'
+    'quired":false}}}'
+)
@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"neighbor":{"type":"list","children":{"interface":{"type":"string","revisions":[2047,2047]},"ip":{"type":"string","revision'
+    's":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"neighbor":{"type":"list","required":false,"options":{"interface":{"type":"str","required":false},"ip":{"ty'
+    'pe":"str","required":false}}}}}'
+)
@@ -0,0 +1,337 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"ignore_optional_capability":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"confederation_peers":{"type":"list","children":{"peer":{"type":"string","revisions":[2047,2047]}},"rev'
+    'isions":[2047,2047]},"multipath_recursive_distance":{"type":"string","options":[{"value":"enable","revisions":[1664,1664]},{"value":"disable","revisio'
+    'ns":[1664,1664]}],"revisions":[1920,1664]},"distance_internal":{"type":"integer","revisions":[2047,2047]},"dampening_reuse":{"type":"integer","revisio'
+    'ns":[2047,2047]},"dampening_reachability_half_life":{"type":"integer","revisions":[2047,2047]},"graceful_stalepath_time":{"type":"integer","revisions"'
+    ':[2047,2047]},"additional_path_select6":{"type":"integer","revisions":[2040,2040]},"aggregate_address6":{"type":"list","children":{"id":{"type":"integ'
+    'er","revisions":[2047,2047]},"summary_only":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"prefix6":{"type":"string","revisions":[2047,2047]},"as_set":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"as":{"type":"integer","revisions":[2'
+    '047,2047]},"dampening_max_suppress_time":{"type":"integer","revisions":[2047,2047]},"cluster_id":{"type":"string","revisions":[2047,2047]},"recursive_'
+    'next_hop":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]}'
+    ',"ibgp_multipath":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[204'
+    '7,2047]},"confederation_identifier":{"type":"integer","revisions":[2047,2047]},"log_neighbour_changes":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"additional_path":{"type":"string","options":[{"value":"'
+    'enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"neighbor_range":{"type":"list","children":{"ma'
+    'x_neighbor_num":{"type":"integer","revisions":[2047,2047]},"neighbor_group":{"type":"string","revisions":[2047,2047]},"prefix":{"type":"string","revis'
+    'ions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"distance_local":{"type":"integer","revisions":[2047,2047'
+    ']},"dampening":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"network":{"type":"list","children":{"backdoor":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"prefix":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"route'
+    '_map":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"graceful_restart_time":{"type":"integer","revisions":[2047,2047]},"bestpath'
+    '_med_confed":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"dampening_suppress":{"type":"integer","revisions":[2047,2047]},"additional_path_select":{"type":"integer","revisions":[2040,2040]},"ebgp_multipat'
+    'h":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"bestp'
+    'ath_cmp_confed_aspath":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"scan_time":{"type":"integer","revisions":[2047,2047]},"fast_external_failover":{"type":"string","options":[{"value":"enable","revisions'
+    '":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"always_compare_med":{"type":"string","options":[{"value":"enable'
+    '","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dampening_route_map":{"type":"string","revisions":[2'
+    '047,2047]},"bestpath_med_missing_as_worst":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"additional_path6":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisi'
+    'ons":[2040,2040]}],"revisions":[2040,2040]},"neighbor_range6":{"type":"list","children":{"max_neighbor_num":{"type":"integer","revisions":[2047,2047]}'
+    ',"neighbor_group":{"type":"string","revisions":[2047,2047]},"prefix6":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[20'
+    '47,2047]}},"revisions":[2047,2047]},"vrf_leak":{"type":"list","children":{"vrf":{"type":"string","revisions":[1920,1920]},"target":{"type":"list","chi'
+    'ldren":{"interface":{"type":"string","revisions":[1920,1920]},"route_map":{"type":"string","revisions":[1920,1920]},"vrf":{"type":"string","revisions"'
+    ':[1920,1920]}},"revisions":[1920,1920]}},"revisions":[1920,1920]},"router_id":{"type":"string","revisions":[2047,2047]},"default_local_preference":{"t'
+    'ype":"integer","revisions":[2047,2047]},"bestpath_as_path_ignore":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"dis'
+    'able","revisions":[2047,2047]}],"revisions":[2047,2047]},"distance_external":{"type":"integer","revisions":[2047,2047]},"graceful_end_on_timer":{"type'
+    '":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"client_to_clie'
+    'nt_reflection":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"synchronization":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"network6":{"type":"list","children":{"backdoor":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"prefix6":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,20'
+    '47]},"route_map":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"keepalive_timer":{"type":"integer","revisions":[2047,2047]},"gra'
+    'ceful_restart":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"admin_distance":{"type":"list","children":{"neighbour_prefix":{"type":"string","revisions":[2047,2047]},"distance":{"type":"integer","revisions'
+    '":[2047,2047]},"route_list":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"redis'
+    'tribute":{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"route_map":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions'
+    '":[2047,2047]},"deterministic_med":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"aggregate_address":{"type":"list","children":{"summary_only":{"type":"string","options":[{"value":"enable","revisions":[204'
+    '7,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"prefix":{"type":"string","revisions":[2047,2047]},"id":{"type":"intege'
+    'r","revisions":[2047,2047]},"as_set":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"enforce_first_as":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"valu'
+    'e":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dampening_unreachability_half_life":{"type":"integer","revisions":[2047,2047]},"neigh'
+    'bor_group":{"type":"list","children":{"soft_reconfiguration6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"ebgp_multihop_ttl":{"type":"integer","revisions":[2047,2047]},"allowas_in_enable":{"type":"strin'
+    'g","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"distribute_list_out":{'
+    '"type":"string","revisions":[2047,2047]},"capability_orf6":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"receive","re'
+    'visions":[2047,2047]},{"value":"send","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]}],"revisions":[2047,2047]},"bfd":{"type":"strin'
+    'g","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"passive":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"advertisement_interva'
+    'l":{"type":"integer","revisions":[2047,2047]},"dont_capability_negotiate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"val'
+    'ue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"next_hop_self6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047'
+    ']},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"remove_private_as6":{"type":"string","options":[{"value":"enable","revisions'
+    '":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"send_community6":{"type":"string","options":[{"value":"standard"'
+    ',"revisions":[2047,2047]},{"value":"extended","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"maximum_prefix6":{"type":"integer","revisions":[2047,2047]},"route_server_client":{"type":"string","options":[{"value'
+    '":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"restart_time":{"type":"integer","revisions"'
+    ':[2047,2047]},"prefix_list_out6":{"type":"string","revisions":[2047,2047]},"activate6":{"type":"string","options":[{"value":"enable","revisions":[2047'
+    ',2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"attribute_unchanged6":{"multiple_values":true,"type":"list","options":['
+    '{"value":"as-path","revisions":[2047,2047]},{"value":"med","revisions":[2047,2047]},{"value":"next-hop","revisions":[2047,2047]}],"revisions":[2047,20'
+    '47]},"name":{"type":"string","revisions":[2047,2047]},"maximum_prefix_threshold":{"type":"integer","revisions":[2047,2047]},"send_community":{"type":"'
+    'string","options":[{"value":"standard","revisions":[2047,2047]},{"value":"extended","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]},'
+    '{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"keep_alive_timer":{"type":"integer","revisions":[2047,2047]},"activate":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"shutdown":{"typ'
+    'e":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"weight":{"typ'
+    'e":"integer","revisions":[2047,2047]},"next_hop_self_rr6":{"type":"string","options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","r'
+    'evisions":[1536,1536]}],"revisions":[1536,1536]},"remove_private_as":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"'
+    'disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"capability_default_originate6":{"type":"string","options":[{"value":"enable","revisions":'
+    '[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"next_hop_self_rr":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"stale_route":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"filter_list_in6":{"type":"string","revisions":[2047'
+    ',2047]},"capability_graceful_restart":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"capability_graceful_restart6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"as_override6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"dis'
+    'able","revisions":[2047,2047]}],"revisions":[2047,2047]},"maximum_prefix_warning_only":{"type":"string","options":[{"value":"enable","revisions":[2047'
+    ',2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"route_map_in6":{"type":"string","revisions":[2047,2047]},"interface":{"'
+    'type":"string","revisions":[2047,2047]},"route_map_in":{"type":"string","revisions":[2047,2047]},"ebgp_enforce_multihop":{"type":"string","options":[{'
+    '"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"maximum_prefix_warning_only6":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"distribute_list'
+    '_out6":{"type":"string","revisions":[2047,2047]},"prefix_list_in":{"type":"string","revisions":[2047,2047]},"retain_stale_time":{"type":"integer","rev'
+    'isions":[2047,2047]},"adv_additional_path6":{"type":"integer","revisions":[2040,2040]},"allowas_in6":{"type":"integer","revisions":[2047,2047]},"route'
+    '_map_out6":{"type":"string","revisions":[2047,2047]},"route_reflector_client":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{'
+    '"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"local_as_replace_as":{"type":"string","options":[{"value":"enable","revisions":['
+    '2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"additional_path":{"type":"string","options":[{"value":"send","revis'
+    'ions":[2040,2040]},{"value":"receive","revisions":[2040,2040]},{"value":"both","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"'
+    'revisions":[2040,2040]},"route_reflector_client6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"filter_list_out6":{"type":"string","revisions":[2047,2047]},"adv_additional_path":{"type":"integer","revisio'
+    'ns":[2040,2040]},"allowas_in":{"type":"integer","revisions":[2047,2047]},"route_map_out6_preferable":{"type":"string","revisions":[2040,2040]},"attrib'
+    'ute_unchanged":{"multiple_values":true,"type":"list","options":[{"value":"as-path","revisions":[2047,2047]},{"value":"med","revisions":[2047,2047]},{"'
+    'value":"next-hop","revisions":[2047,2047]}],"revisions":[2047,2047]},"maximum_prefix_threshold6":{"type":"integer","revisions":[2047,2047]},"unsuppres'
+    's_map":{"type":"string","revisions":[2047,2047]},"capability_default_originate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]}'
+    ',{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"soft_reconfiguration":{"type":"string","options":[{"value":"enable","revisions'
+    '":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"additional_path6":{"type":"string","options":[{"value":"send","r'
+    'evisions":[2040,2040]},{"value":"receive","revisions":[2040,2040]},{"value":"both","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]'
+    '}],"revisions":[2040,2040]},"distribute_list_in":{"type":"string","revisions":[2047,2047]},"connect_timer":{"type":"integer","revisions":[2047,2047]},'
+    '"prefix_list_in6":{"type":"string","revisions":[2047,2047]},"default_originate_routemap6":{"type":"string","revisions":[2047,2047]},"prefix_list_out":'
+    '{"type":"string","revisions":[2047,2047]},"strict_capability_match":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"as_override":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"valu'
+    'e":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"filter_list_out":{"type":"string","revisions":[2047,2047]},"remote_as":{"type":"integ'
+    'er","revisions":[2047,2047]},"link_down_failover":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"route_server_client6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"maximum_prefix":{"type":"integer","revisions":[2047,2047]},"capability_orf":{"type":"string","'
+    'options":[{"value":"none","revisions":[2047,2047]},{"value":"receive","revisions":[2047,2047]},{"value":"send","revisions":[2047,2047]},{"value":"both'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"update_source":{"type":"string","revisions":[2047,2047]},"description":{"type":"string","revisio'
+    'ns":[2047,2047]},"allowas_in_enable6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"capability_dynamic":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"filter_list_in":{"type":"string","revisions":[2047,2047]},"local_as":{"type":"integer","revisions":[2047,204'
+    '7]},"route_map_out_preferable":{"type":"string","revisions":[2040,2040]},"next_hop_self":{"type":"string","options":[{"value":"enable","revisions":[20'
+    '47,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"distribute_list_in6":{"type":"string","revisions":[2047,2047]},"local'
+    '_as_no_prepend":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"override_capability":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"holdtime_timer":{"type":"integer","revisions":[2047,2047]},"capability_route_refresh":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"route_map_out":{"type":"string","revisions":[2047,2'
+    '047]},"default_originate_routemap":{"type":"string","revisions":[2047,2047]},"unsuppress_map6":{"type":"string","revisions":[2047,2047]}},"revisions":'
+    '[2047,2047]},"graceful_update_delay":{"type":"integer","revisions":[2047,2047]},"bestpath_cmp_routerid":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"redistribute6":{"type":"list","children":{"status":{"t'
+    'ype":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"route_map":'
+    '{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"neighbor":{"type":"list","childr'
+    'en":{"soft_reconfiguration6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"ebgp_multihop_ttl":{"type":"integer","revisions":[2047,2047]},"allowas_in_enable":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"distribute_list_out":{"type":"string","revisions":[2047'
+    ',2047]},"capability_orf6":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"receive","revisions":[2047,2047]},{"value":"s'
+    'end","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]}],"revisions":[2047,2047]},"bfd":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"passive":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"advertisement_interval":{"type":"integer","revisions":'
+    '[2047,2047]},"dont_capability_negotiate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"next_hop_self6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"remove_private_as6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"send_community6":{"type":"string","options":[{"value":"standard","revisions":[2047,2047]},{"value'
+    '":"extended","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"'
+    'maximum_prefix6":{"type":"integer","revisions":[2047,2047]},"route_server_client":{"type":"string","options":[{"value":"enable","revisions":[2047,2047'
+    ']},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"restart_time":{"type":"integer","revisions":[2047,2047]},"prefix_list_out6":'
+    '{"type":"string","revisions":[2047,2047]},"password":{"type":"string","revisions":[2047,2047]},"activate6":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"attribute_unchanged6":{"multiple_values":true,"type'
+    '":"list","options":[{"value":"as-path","revisions":[2047,2047]},{"value":"med","revisions":[2047,2047]},{"value":"next-hop","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"maximum_prefix_threshold":{"type":"integer","revisions":[2047,2047]},"send_community":{"type":"string","options":[{"value":"'
+    'standard","revisions":[2047,2047]},{"value":"extended","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]},{"value":"disable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"keep_alive_timer":{"type":"integer","revisions":[2047,2047]},"activate":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"shutdown":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"weight":{"type":"integer","revisions":[204'
+    '7,2047]},"next_hop_self_rr6":{"type":"string","options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revi'
+    'sions":[1536,1536]},"remove_private_as":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"capability_default_originate6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disabl'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"conditional_advertise":{"type":"list","children":{"advertise_routemap":{"type":"string","revisi'
+    'ons":[2047,2047]},"condition_type":{"type":"string","options":[{"value":"exist","revisions":[2047,2047]},{"value":"non-exist","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"condition_routemap":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"next_hop_self_rr":{"type":"string'
+    '","options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"stale_route":{"type":"s'
+    'tring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"filter_list_in6":{'
+    '"type":"string","revisions":[2047,2047]},"capability_graceful_restart":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value"'
+    ':"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"capability_graceful_restart6":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"as_override6":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"maximum_prefix_warning_only":{"type":"string","options":[{"'
+    'value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"route_map_in6":{"type":"string","revis'
+    'ions":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]},"route_map_in":{"type":"string","revisions":[2047,2047]},"ebgp_enforce_multih'
+    'op":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"maxi'
+    'mum_prefix_warning_only6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"maximum_prefix":{"type":"integer","revisions":[2047,2047]},"distribute_list_out6":{"type":"string","revisions":[2047,2047]},"prefix_'
+    'list_in":{"type":"string","revisions":[2047,2047]},"retain_stale_time":{"type":"integer","revisions":[2047,2047]},"adv_additional_path6":{"type":"inte'
+    'ger","revisions":[2040,2040]},"allowas_in6":{"type":"integer","revisions":[2047,2047]},"route_map_out6":{"type":"string","revisions":[2047,2047]},"rou'
+    'te_reflector_client":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"local_as_replace_as":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"additional_path":{"type":"string","options":[{"value":"send","revisions":[2040,2040]},{"value":"receive","revisions":[2040,2'
+    '040]},{"value":"both","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"route_reflector_client6":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"filter_list_out'
+    '6":{"type":"string","revisions":[2047,2047]},"adv_additional_path":{"type":"integer","revisions":[2040,2040]},"allowas_in":{"type":"integer","revision'
+    's":[2047,2047]},"route_map_out6_preferable":{"type":"string","revisions":[2040,2040]},"attribute_unchanged":{"multiple_values":true,"type":"list","opt'
+    'ions":[{"value":"as-path","revisions":[2047,2047]},{"value":"med","revisions":[2047,2047]},{"value":"next-hop","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"maximum_prefix_threshold6":{"type":"integer","revisions":[2047,2047]},"unsuppress_map":{"type":"string","revisions":[2047,2047]},"capabil'
+    'ity_default_originate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"additional_path6":{"type":"string","options":[{"value":"send","revisions":[2040,2040]},{"value":"receive","revisions":[2040,2040]},{"va'
+    'lue":"both","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"distribute_list_in":{"type":"string","revi'
+    'sions":[2047,2047]},"connect_timer":{"type":"integer","revisions":[2047,2047]},"prefix_list_in6":{"type":"string","revisions":[2047,2047]},"ip":{"type'
+    '":"string","revisions":[2047,2047]},"default_originate_routemap6":{"type":"string","revisions":[2047,2047]},"prefix_list_out":{"type":"string","revisi'
+    'ons":[2047,2047]},"strict_capability_match":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"as_override":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"filter_list_out":{"type":"string","revisions":[2047,2047]},"remote_as":{"type":"integer","revisions":[2047,20'
+    '47]},"link_down_failover":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"route_server_client6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"soft_reconfiguration":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"capability_orf":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"receive",'
+    '"revisions":[2047,2047]},{"value":"send","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]}],"revisions":[2047,2047]},"update_source":{'
+    '"type":"string","revisions":[2047,2047]},"description":{"type":"string","revisions":[2047,2047]},"allowas_in_enable6":{"type":"string","options":[{"va'
+    'lue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"capability_dynamic":{"type":"string","op'
+    'tions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"filter_list_in":{"type":"str'
+    'ing","revisions":[2047,2047]},"local_as":{"type":"integer","revisions":[2047,2047]},"route_map_out_preferable":{"type":"string","revisions":[2040,2040'
+    ']},"next_hop_self":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"distribute_list_in6":{"type":"string","revisions":[2047,2047]},"local_as_no_prepend":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"override_capability":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"holdtime_timer":{"type":"integer","revisions":[20'
+    '47,2047]},"capability_route_refresh":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"route_map_out":{"type":"string","revisions":[2047,2047]},"default_originate_routemap":{"type":"string","revisions":[2047,'
+    '2047]},"unsuppress_map6":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"network_import_check":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"holdtime_timer":{"type":"integer","revisio'
+    'ns":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"ignore_optional_capability":{"type":"str","required":false,"choices":["enable","disable"]},"confederation_'
+    'peers":{"type":"list","required":false,"options":{"peer":{"type":"str","required":false}}},"multipath_recursive_distance":{"type":"str","required":fal'
+    'se},"distance_internal":{"type":"int","required":false},"dampening_reuse":{"type":"int","required":false},"dampening_reachability_half_life":{"type":"'
+    'int","required":false},"graceful_stalepath_time":{"type":"int","required":false},"additional_path_select6":{"type":"int","required":false},"aggregate_'
+    'address6":{"type":"list","required":false,"options":{"id":{"type":"int","required":false},"summary_only":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"prefix6":{"type":"str","required":false},"as_set":{"type":"str","required":false,"choices":["enable","disable"]}}},"as":{"type":"in'
+    't","required":false},"dampening_max_suppress_time":{"type":"int","required":false},"cluster_id":{"type":"str","required":false},"recursive_next_hop":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"ibgp_multipath":{"type":"str","required":false,"choices":["enable","disable"]},"confede'
+    'ration_identifier":{"type":"int","required":false},"log_neighbour_changes":{"type":"str","required":false,"choices":["enable","disable"]},"additional_'
+    'path":{"type":"str","required":false,"choices":["enable","disable"]},"neighbor_range":{"type":"list","required":false,"options":{"max_neighbor_num":{"'
+    'type":"int","required":false},"neighbor_group":{"type":"str","required":false},"prefix":{"type":"str","required":false},"id":{"type":"int","required":'
+    'false}}},"distance_local":{"type":"int","required":false},"dampening":{"type":"str","required":false,"choices":["enable","disable"]},"network":{"type"'
+    ':"list","required":false,"options":{"backdoor":{"type":"str","required":false,"choices":["enable","disable"]},"prefix":{"type":"str","required":false}'
+    ',"id":{"type":"int","required":false},"route_map":{"type":"str","required":false}}},"graceful_restart_time":{"type":"int","required":false},"bestpath_'
+    'med_confed":{"type":"str","required":false,"choices":["enable","disable"]},"dampening_suppress":{"type":"int","required":false},"additional_path_selec'
+    't":{"type":"int","required":false},"ebgp_multipath":{"type":"str","required":false,"choices":["enable","disable"]},"bestpath_cmp_confed_aspath":{"type'
+    '":"str","required":false,"choices":["enable","disable"]},"scan_time":{"type":"int","required":false},"fast_external_failover":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]},"always_compare_med":{"type":"str","required":false,"choices":["enable","disable"]},"dampening_route_map":{"typ'
+    'e":"str","required":false},"bestpath_med_missing_as_worst":{"type":"str","required":false,"choices":["enable","disable"]},"additional_path6":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"neighbor_range6":{"type":"list","required":false,"options":{"max_neighbor_num":{"type":"int","r'
+    'equired":false},"neighbor_group":{"type":"str","required":false},"prefix6":{"type":"str","required":false},"id":{"type":"int","required":false}}},"vrf'
+    '_leak":{"type":"list","required":false,"options":{"vrf":{"type":"str","required":false},"target":{"type":"list","required":false,"options":{"interface'
+    '":{"type":"str","required":false},"route_map":{"type":"str","required":false},"vrf":{"type":"str","required":false}}}}},"router_id":{"type":"str","req'
+    'uired":false},"default_local_preference":{"type":"int","required":false},"bestpath_as_path_ignore":{"type":"str","required":false,"choices":["enable",'
+    '"disable"]},"distance_external":{"type":"int","required":false},"graceful_end_on_timer":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"client_to_client_reflection":{"type":"str","required":false,"choices":["enable","disable"]},"synchronization":{"type":"str","required":false,"choice'
+    's":["enable","disable"]},"network6":{"type":"list","required":false,"options":{"backdoor":{"type":"str","required":false,"choices":["enable","disable"'
+    ']},"prefix6":{"type":"str","required":false},"id":{"type":"int","required":false},"route_map":{"type":"str","required":false}}},"keepalive_timer":{"ty'
+    'pe":"int","required":false},"graceful_restart":{"type":"str","required":false,"choices":["enable","disable"]},"admin_distance":{"type":"list","require'
+    'd":false,"options":{"neighbour_prefix":{"type":"str","required":false},"distance":{"type":"int","required":false},"route_list":{"type":"str","required'
+    '":false},"id":{"type":"int","required":false}}},"redistribute":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]},"route_map":{"type":"str","required":false},"name":{"type":"str","required":false}}},"deterministic_med":{"type":"str","re'
+    'quired":false,"choices":["enable","disable"]},"aggregate_address":{"type":"list","required":false,"options":{"summary_only":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"prefix":{"type":"str","required":false},"id":{"type":"int","required":false},"as_set":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]}}},"enforce_first_as":{"type":"str","required":false,"choices":["enable","disable"]},"dampening_unreachability_hal'
+    'f_life":{"type":"int","required":false},"neighbor_group":{"type":"list","required":false,"options":{"soft_reconfiguration6":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"ebgp_multihop_ttl":{"type":"int","required":false},"allowas_in_enable":{"type":"str","required":false,"choices":'
+    '["enable","disable"]},"distribute_list_out":{"type":"str","required":false},"capability_orf6":{"type":"str","required":false,"choices":["none","receiv'
+    'e","send","both"]},"bfd":{"type":"str","required":false,"choices":["enable","disable"]},"passive":{"type":"str","required":false,"choices":["enable","'
+    'disable"]},"advertisement_interval":{"type":"int","required":false},"dont_capability_negotiate":{"type":"str","required":false,"choices":["enable","di'
+    'sable"]},"next_hop_self6":{"type":"str","required":false,"choices":["enable","disable"]},"remove_private_as6":{"type":"str","required":false,"choices"'
+    ':["enable","disable"]},"send_community6":{"type":"str","required":false,"choices":["standard","extended","both","disable"]},"maximum_prefix6":{"type":'
+    '"int","required":false},"route_server_client":{"type":"str","required":false,"choices":["enable","disable"]},"restart_time":{"type":"int","required":f'
+    'alse},"prefix_list_out6":{"type":"str","required":false},"activate6":{"type":"str","required":false,"choices":["enable","disable"]},"attribute_unchang'
+    'ed6":{"type":"list","required":false,"choices":["as-path","med","next-hop"]},"name":{"type":"str","required":false},"maximum_prefix_threshold":{"type"'
+    ':"int","required":false},"send_community":{"type":"str","required":false,"choices":["standard","extended","both","disable"]},"keep_alive_timer":{"type'
+    '":"int","required":false},"activate":{"type":"str","required":false,"choices":["enable","disable"]},"shutdown":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"weight":{"type":"int","required":false},"next_hop_self_rr6":{"type":"str","required":false,"choices":["enable","disable"]},"r'
+    'emove_private_as":{"type":"str","required":false,"choices":["enable","disable"]},"capability_default_originate6":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"next_hop_self_rr":{"type":"str","required":false,"choices":["enable","disable"]},"stale_route":{"type":"str","required":fal'
+    'se,"choices":["enable","disable"]},"filter_list_in6":{"type":"str","required":false},"capability_graceful_restart":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]},"capability_graceful_restart6":{"type":"str","required":false,"choices":["enable","disable"]},"as_override6":{"type":"str"'
+    ',"required":false,"choices":["enable","disable"]},"maximum_prefix_warning_only":{"type":"str","required":false,"choices":["enable","disable"]},"route_'
+    'map_in6":{"type":"str","required":false},"interface":{"type":"str","required":false},"route_map_in":{"type":"str","required":false},"ebgp_enforce_mult'
+    'ihop":{"type":"str","required":false,"choices":["enable","disable"]},"maximum_prefix_warning_only6":{"type":"str","required":false,"choices":["enable"'
+    ',"disable"]},"distribute_list_out6":{"type":"str","required":false},"prefix_list_in":{"type":"str","required":false},"retain_stale_time":{"type":"int"'
+    ',"required":false},"adv_additional_path6":{"type":"int","required":false},"allowas_in6":{"type":"int","required":false},"route_map_out6":{"type":"str"'
+    ',"required":false},"route_reflector_client":{"type":"str","required":false,"choices":["enable","disable"]},"local_as_replace_as":{"type":"str","requir'
+    'ed":false,"choices":["enable","disable"]},"additional_path":{"type":"str","required":false,"choices":["send","receive","both","disable"]},"route_refle'
+    'ctor_client6":{"type":"str","required":false,"choices":["enable","disable"]},"filter_list_out6":{"type":"str","required":false},"adv_additional_path":'
+    '{"type":"int","required":false},"allowas_in":{"type":"int","required":false},"route_map_out6_preferable":{"type":"str","required":false},"attribute_un'
+    'changed":{"type":"list","required":false,"choices":["as-path","med","next-hop"]},"maximum_prefix_threshold6":{"type":"int","required":false},"unsuppre'
+    'ss_map":{"type":"str","required":false},"capability_default_originate":{"type":"str","required":false,"choices":["enable","disable"]},"soft_reconfigur'
+    'ation":{"type":"str","required":false,"choices":["enable","disable"]},"additional_path6":{"type":"str","required":false,"choices":["send","receive","b'
+    'oth","disable"]},"distribute_list_in":{"type":"str","required":false},"connect_timer":{"type":"int","required":false},"prefix_list_in6":{"type":"str",'
+    '"required":false},"default_originate_routemap6":{"type":"str","required":false},"prefix_list_out":{"type":"str","required":false},"strict_capability_m'
+    'atch":{"type":"str","required":false,"choices":["enable","disable"]},"as_override":{"type":"str","required":false,"choices":["enable","disable"]},"fil'
+    'ter_list_out":{"type":"str","required":false},"remote_as":{"type":"int","required":false},"link_down_failover":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"route_server_client6":{"type":"str","required":false,"choices":["enable","disable"]},"maximum_prefix":{"type":"int","required'
+    '":false},"capability_orf":{"type":"str","required":false,"choices":["none","receive","send","both"]},"update_source":{"type":"str","required":false},"'
+    'description":{"type":"str","required":false},"allowas_in_enable6":{"type":"str","required":false,"choices":["enable","disable"]},"capability_dynamic":'
+    '{"type":"str","required":false,"choices":["enable","disable"]},"filter_list_in":{"type":"str","required":false},"local_as":{"type":"int","required":fa'
+    'lse},"route_map_out_preferable":{"type":"str","required":false},"next_hop_self":{"type":"str","required":false,"choices":["enable","disable"]},"distri'
+    'bute_list_in6":{"type":"str","required":false},"local_as_no_prepend":{"type":"str","required":false,"choices":["enable","disable"]},"override_capabili'
+    'ty":{"type":"str","required":false,"choices":["enable","disable"]},"holdtime_timer":{"type":"int","required":false},"capability_route_refresh":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]},"route_map_out":{"type":"str","required":false},"default_originate_routemap":{"type":"str","re'
+    'quired":false},"unsuppress_map6":{"type":"str","required":false}}},"graceful_update_delay":{"type":"int","required":false},"bestpath_cmp_routerid":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"redistribute6":{"type":"list","required":false,"options":{"status":{"type":"str","require'
+    'd":false,"choices":["enable","disable"]},"route_map":{"type":"str","required":false},"name":{"type":"str","required":false}}},"neighbor":{"type":"list'
+    '","required":false,"options":{"soft_reconfiguration6":{"type":"str","required":false,"choices":["enable","disable"]},"ebgp_multihop_ttl":{"type":"int"'
+    ',"required":false},"allowas_in_enable":{"type":"str","required":false,"choices":["enable","disable"]},"distribute_list_out":{"type":"str","required":f'
+    'alse},"capability_orf6":{"type":"str","required":false,"choices":["none","receive","send","both"]},"bfd":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"passive":{"type":"str","required":false,"choices":["enable","disable"]},"advertisement_interval":{"type":"int","required":false},"d'
+    'ont_capability_negotiate":{"type":"str","required":false,"choices":["enable","disable"]},"next_hop_self6":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"remove_private_as6":{"type":"str","required":false,"choices":["enable","disable"]},"send_community6":{"type":"str","required":fals'
+    'e,"choices":["standard","extended","both","disable"]},"maximum_prefix6":{"type":"int","required":false},"route_server_client":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]},"restart_time":{"type":"int","required":false},"prefix_list_out6":{"type":"str","required":false},"password":{"'
+    'type":"str","required":false},"activate6":{"type":"str","required":false,"choices":["enable","disable"]},"attribute_unchanged6":{"type":"list","requir'
+    'ed":false,"choices":["as-path","med","next-hop"]},"maximum_prefix_threshold":{"type":"int","required":false},"send_community":{"type":"str","required"'
+    ':false,"choices":["standard","extended","both","disable"]},"keep_alive_timer":{"type":"int","required":false},"activate":{"type":"str","required":fals'
+    'e,"choices":["enable","disable"]},"shutdown":{"type":"str","required":false,"choices":["enable","disable"]},"weight":{"type":"int","required":false},"'
+    'next_hop_self_rr6":{"type":"str","required":false,"choices":["enable","disable"]},"remove_private_as":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"capability_default_originate6":{"type":"str","required":false,"choices":["enable","disable"]},"conditional_advertise":{"type":"list","'
+    'required":false,"options":{"advertise_routemap":{"type":"str","required":false},"condition_type":{"type":"str","required":false,"choices":["exist","no'
+    'n-exist"]},"condition_routemap":{"type":"str","required":false}}},"next_hop_self_rr":{"type":"str","required":false,"choices":["enable","disable"]},"s'
+    'tale_route":{"type":"str","required":false,"choices":["enable","disable"]},"filter_list_in6":{"type":"str","required":false},"capability_graceful_rest'
+    'art":{"type":"str","required":false,"choices":["enable","disable"]},"capability_graceful_restart6":{"type":"str","required":false,"choices":["enable",'
+    '"disable"]},"as_override6":{"type":"str","required":false,"choices":["enable","disable"]},"maximum_prefix_warning_only":{"type":"str","required":false'
+    ',"choices":["enable","disable"]},"route_map_in6":{"type":"str","required":false},"interface":{"type":"str","required":false},"route_map_in":{"type":"s'
+    'tr","required":false},"ebgp_enforce_multihop":{"type":"str","required":false,"choices":["enable","disable"]},"maximum_prefix_warning_only6":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"maximum_prefix":{"type":"int","required":false},"distribute_list_out6":{"type":"str","required":'
+    'false},"prefix_list_in":{"type":"str","required":false},"retain_stale_time":{"type":"int","required":false},"adv_additional_path6":{"type":"int","requ'
+    'ired":false},"allowas_in6":{"type":"int","required":false},"route_map_out6":{"type":"str","required":false},"route_reflector_client":{"type":"str","re'
+    'quired":false,"choices":["enable","disable"]},"local_as_replace_as":{"type":"str","required":false,"choices":["enable","disable"]},"additional_path":{'
+    '"type":"str","required":false,"choices":["send","receive","both","disable"]},"route_reflector_client6":{"type":"str","required":false,"choices":["enab'
+    'le","disable"]},"filter_list_out6":{"type":"str","required":false},"adv_additional_path":{"type":"int","required":false},"allowas_in":{"type":"int","r'
+    'equired":false},"route_map_out6_preferable":{"type":"str","required":false},"attribute_unchanged":{"type":"list","required":false,"choices":["as-path"'
+    ',"med","next-hop"]},"maximum_prefix_threshold6":{"type":"int","required":false},"unsuppress_map":{"type":"str","required":false},"capability_default_o'
+    'riginate":{"type":"str","required":false,"choices":["enable","disable"]},"additional_path6":{"type":"str","required":false,"choices":["send","receive"'
+    ',"both","disable"]},"distribute_list_in":{"type":"str","required":false},"connect_timer":{"type":"int","required":false},"prefix_list_in6":{"type":"st'
+    'r","required":false},"ip":{"type":"str","required":false},"default_originate_routemap6":{"type":"str","required":false},"prefix_list_out":{"type":"str'
+    '","required":false},"strict_capability_match":{"type":"str","required":false,"choices":["enable","disable"]},"as_override":{"type":"str","required":fa'
+    'lse,"choices":["enable","disable"]},"filter_list_out":{"type":"str","required":false},"remote_as":{"type":"int","required":false},"link_down_failover"'
+    ':{"type":"str","required":false,"choices":["enable","disable"]},"route_server_client6":{"type":"str","required":false,"choices":["enable","disable"]},'
+    '"soft_reconfiguration":{"type":"str","required":false,"choices":["enable","disable"]},"capability_orf":{"type":"str","required":false,"choices":["none'
+    '","receive","send","both"]},"update_source":{"type":"str","required":false},"description":{"type":"str","required":false},"allowas_in_enable6":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]},"capability_dynamic":{"type":"str","required":false,"choices":["enable","disable"]},"filter_li'
+    'st_in":{"type":"str","required":false},"local_as":{"type":"int","required":false},"route_map_out_preferable":{"type":"str","required":false},"next_hop'
+    '_self":{"type":"str","required":false,"choices":["enable","disable"]},"distribute_list_in6":{"type":"str","required":false},"local_as_no_prepend":{"ty'
+    'pe":"str","required":false,"choices":["enable","disable"]},"override_capability":{"type":"str","required":false,"choices":["enable","disable"]},"holdt'
+    'ime_timer":{"type":"int","required":false},"capability_route_refresh":{"type":"str","required":false,"choices":["enable","disable"]},"route_map_out":{'
+    '"type":"str","required":false},"default_originate_routemap":{"type":"str","required":false},"unsuppress_map6":{"type":"str","required":false}}},"netwo'
+    'rk_import_check":{"type":"str","required":false,"choices":["enable","disable"]},"holdtime_timer":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"type":{"type":"string","options":[{"value":"standard","revisions":[2047,2047]},{"value":"expanded","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"rule":{"type":"list","children":{"action":{"type":"string","options":[{"'
+    'value":"deny","revisions":[2047,2047]},{"value":"permit","revisions":[2047,2047]}],"revisions":[2047,2047]},"regexp":{"type":"string","revisions":[204'
+    '7,2047]},"id":{"type":"integer","revisions":[2047,2047]},"match":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[204'
+    '7,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"type":{"type":"str","required":false,"choices":["standard","expanded"]},"name":{"type":"str","required":fa'
+    'lse},"rule":{"type":"list","required":false,"options":{"action":{"type":"str","required":false,"choices":["deny","permit"]},"regexp":{"type":"str","re'
+    'quired":false},"id":{"type":"int","required":false},"match":{"type":"str","required":false}}}}}'
+)
@@ -0,0 +1,117 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"auth_mode_l2":{"type":"string","options":[{"value":"password","revisions":[2047,2047]},{"value":"md5","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"auth_mode_l1":{"type":"string","options":[{"value":"password","revisions":[2047,2047]},{"value":"md5","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"default_originate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"metric_style":{"type":"string","options":[{"value":"narrow","revisions":[2047,2047]},{"value":"wide","r'
+    'evisions":[2047,2047]},{"value":"transition","revisions":[2047,2047]},{"value":"narrow-transition","revisions":[2047,2047]},{"value":"narrow-transitio'
+    'n-l1","revisions":[2047,2047]},{"value":"narrow-transition-l2","revisions":[2047,2047]},{"value":"wide-l1","revisions":[2047,2047]},{"value":"wide-l2"'
+    ',"revisions":[2047,2047]},{"value":"wide-transition","revisions":[2047,2047]},{"value":"wide-transition-l1","revisions":[2047,2047]},{"value":"wide-tr'
+    'ansition-l2","revisions":[2047,2047]},{"value":"transition-l1","revisions":[2047,2047]},{"value":"transition-l2","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"lsp_gen_interval_l2":{"type":"integer","revisions":[2047,2047]},"auth_sendonly_l1":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_password_l1":{"type":"string","revisions":[2047,2047]},'
+    '"auth_password_l2":{"type":"string","revisions":[2047,2047]},"default_originate6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047'
+    ']},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_sendonly_l2":{"type":"string","options":[{"value":"enable","revisions":'
+    '[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"overload_bit_suppress":{"multiple_values":true,"type":"list","opti'
+    'ons":[{"value":"external","revisions":[2047,2047]},{"value":"interlevel","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_lsp_lifetime":{"type"'
+    ':"integer","revisions":[2047,2047]},"overload_bit":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"adv_passive_only6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"adjacency_check":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value"'
+    ':"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dynamic_hostname":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]'
+    '},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"lsp_refresh_interval":{"type":"integer","revisions":[2047,2047]},"redistribut'
+    'e6_l2_list":{"type":"string","revisions":[2047,2047]},"adv_passive_only":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"valu'
+    'e":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"isis_interface":{"type":"list","children":{"auth_mode_l2":{"type":"string","options":'
+    '[{"value":"md5","revisions":[2047,2047]},{"value":"password","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_mode_l1":{"type":"string","optio'
+    'ns":[{"value":"md5","revisions":[2047,2047]},{"value":"password","revisions":[2047,2047]}],"revisions":[2047,2047]},"lsp_retransmit_interval":{"type":'
+    '"integer","revisions":[2047,2047]},"lsp_interval":{"type":"integer","revisions":[2047,2047]},"mesh_group_id":{"type":"integer","revisions":[2047,2047]'
+    '},"auth_password_l2":{"type":"string","revisions":[2047,2047]},"priority_l1":{"type":"integer","revisions":[2047,2047]},"priority_l2":{"type":"integer'
+    '","revisions":[2047,2047]},"auth_send_only_l1":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"wide_metric_l1":{"type":"integer","revisions":[2047,2047]},"wide_metric_l2":{"type":"integer","revisions":[2047'
+    ',2047]},"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"mesh_group":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"hello_padding":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"auth_send_only_l2":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"csnp_interval_l1":{"type":"integer","revisions":[2047,2047]},"hello_multiplier_l2":{"type":"integer","revisions":[2047,'
+    '2047]},"hello_multiplier_l1":{"type":"integer","revisions":[2047,2047]},"hello_interval_l2":{"type":"integer","revisions":[2047,2047]},"hello_interval'
+    '_l1":{"type":"integer","revisions":[2047,2047]},"auth_password_l1":{"type":"string","revisions":[2047,2047]},"status6":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[204'
+    '7,2047]},"csnp_interval_l2":{"type":"integer","revisions":[2047,2047]},"circuit_type":{"type":"string","options":[{"value":"level-1-2","revisions":[20'
+    '47,2047]},{"value":"level-1","revisions":[2047,2047]},{"value":"level-2","revisions":[2047,2047]}],"revisions":[2047,2047]},"metric_l2":{"type":"integ'
+    'er","revisions":[2047,2047]},"auth_keychain_l1":{"type":"string","revisions":[2047,2047]},"auth_keychain_l2":{"type":"string","revisions":[2047,2047]}'
+    ',"metric_l1":{"type":"integer","revisions":[2047,2047]},"network_type":{"type":"string","options":[{"value":"broadcast","revisions":[2047,2047]},{"val'
+    'ue":"point-to-point","revisions":[2047,2047]},{"value":"loopback","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"redist'
+    'ribute_l2":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"redistribute_l1":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"summary_address":{"type":"list","children":{"prefix":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,20'
+    '47]},"level":{"type":"string","options":[{"value":"level-1-2","revisions":[2047,2047]},{"value":"level-1","revisions":[2047,2047]},{"value":"level-2",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"overload_bit_on_startup":{"type":"integer","revisions":[2047,2047]},"is_'
+    'type":{"type":"string","options":[{"value":"level-1-2","revisions":[2047,2047]},{"value":"level-1","revisions":[2047,2047]},{"value":"level-2-only","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]},"adjacency_check6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"summary_address6":{"type":"list","children":{"level":{"type":"string","options":[{"value":'
+    '"level-1-2","revisions":[2047,2047]},{"value":"level-1","revisions":[2047,2047]},{"value":"level-2","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"prefix6":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"redistribute":{"type":'
+    '"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"protocol":{"type":"string","revisions":[2047,2047]},"level":{"type":"string","options":[{"value":"level-1-2","revisions":[2047,204'
+    '7]},{"value":"level-1","revisions":[2047,2047]},{"value":"level-2","revisions":[2047,2047]}],"revisions":[2047,2047]},"metric":{"type":"integer","revi'
+    'sions":[2047,2047]},"metric_type":{"type":"string","options":[{"value":"external","revisions":[2047,2047]},{"value":"internal","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"routemap":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"redistribute6_l2":{"type":"string","option'
+    's":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"redistribute6_l1":{"type":"strin'
+    'g","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"isis_net":{"type":"lis'
+    't","children":{"net":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"spf_interval'
+    '_exp_l1":{"type":"string","revisions":[2047,2047]},"auth_keychain_l1":{"type":"string","revisions":[2047,2047]},"auth_keychain_l2":{"type":"string","r'
+    'evisions":[2047,2047]},"spf_interval_exp_l2":{"type":"string","revisions":[2047,2047]},"redistribute6_l1_list":{"type":"string","revisions":[2047,2047'
+    ']},"redistribute6":{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"protocol":{"type":"string","revisions":[2047,2047]},"level":{"type":"string","options":[{"value":"level'
+    '-1-2","revisions":[2047,2047]},{"value":"level-1","revisions":[2047,2047]},{"value":"level-2","revisions":[2047,2047]}],"revisions":[2047,2047]},"metr'
+    'ic":{"type":"integer","revisions":[2047,2047]},"metric_type":{"type":"string","options":[{"value":"external","revisions":[2047,2047]},{"value":"intern'
+    'al","revisions":[2047,2047]}],"revisions":[2047,2047]},"routemap":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"ignore_lsp_erro'
+    'rs":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"lsp_'
+    'gen_interval_l1":{"type":"integer","revisions":[2047,2047]},"redistribute_l2_list":{"type":"string","revisions":[2047,2047]},"redistribute_l1_list":{"'
+    'type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"auth_mode_l2":{"type":"str","required":false,"choices":["password","md5"]},"auth_mode_l1":{"type":"str","r'
+    'equired":false,"choices":["password","md5"]},"default_originate":{"type":"str","required":false,"choices":["enable","disable"]},"metric_style":{"type"'
+    ':"str","required":false,"choices":["narrow","wide","transition","narrow-transition","narrow-transition-l1","narrow-transition-l2","wide-l1","wide-l2",'
+    '"wide-transition","wide-transition-l1","wide-transition-l2","transition-l1","transition-l2"]},"lsp_gen_interval_l2":{"type":"int","required":false},"a'
+    'uth_sendonly_l1":{"type":"str","required":false,"choices":["enable","disable"]},"auth_password_l1":{"type":"str","required":false},"auth_password_l2":'
+    '{"type":"str","required":false},"default_originate6":{"type":"str","required":false,"choices":["enable","disable"]},"auth_sendonly_l2":{"type":"str","'
+    'required":false,"choices":["enable","disable"]},"overload_bit_suppress":{"type":"list","required":false,"choices":["external","interlevel"]},"max_lsp_'
+    'lifetime":{"type":"int","required":false},"overload_bit":{"type":"str","required":false,"choices":["enable","disable"]},"adv_passive_only6":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"adjacency_check":{"type":"str","required":false,"choices":["enable","disable"]},"dynamic_hostnam'
+    'e":{"type":"str","required":false,"choices":["enable","disable"]},"lsp_refresh_interval":{"type":"int","required":false},"redistribute6_l2_list":{"typ'
+    'e":"str","required":false},"adv_passive_only":{"type":"str","required":false,"choices":["enable","disable"]},"isis_interface":{"type":"list","required'
+    '":false,"options":{"auth_mode_l2":{"type":"str","required":false,"choices":["md5","password"]},"auth_mode_l1":{"type":"str","required":false,"choices"'
+    ':["md5","password"]},"lsp_retransmit_interval":{"type":"int","required":false},"lsp_interval":{"type":"int","required":false},"mesh_group_id":{"type":'
+    '"int","required":false},"auth_password_l2":{"type":"str","required":false},"priority_l1":{"type":"int","required":false},"priority_l2":{"type":"int","'
+    'required":false},"auth_send_only_l1":{"type":"str","required":false,"choices":["enable","disable"]},"wide_metric_l1":{"type":"int","required":false},"'
+    'wide_metric_l2":{"type":"int","required":false},"status":{"type":"str","required":false,"choices":["enable","disable"]},"mesh_group":{"type":"str","re'
+    'quired":false,"choices":["enable","disable"]},"hello_padding":{"type":"str","required":false,"choices":["enable","disable"]},"auth_send_only_l2":{"typ'
+    'e":"str","required":false,"choices":["enable","disable"]},"csnp_interval_l1":{"type":"int","required":false},"hello_multiplier_l2":{"type":"int","requ'
+    'ired":false},"hello_multiplier_l1":{"type":"int","required":false},"hello_interval_l2":{"type":"int","required":false},"hello_interval_l1":{"type":"in'
+    't","required":false},"auth_password_l1":{"type":"str","required":false},"status6":{"type":"str","required":false,"choices":["enable","disable"]},"name'
+    '":{"type":"str","required":false},"csnp_interval_l2":{"type":"int","required":false},"circuit_type":{"type":"str","required":false,"choices":["level-1'
+    '-2","level-1","level-2"]},"metric_l2":{"type":"int","required":false},"auth_keychain_l1":{"type":"str","required":false},"auth_keychain_l2":{"type":"s'
+    'tr","required":false},"metric_l1":{"type":"int","required":false},"network_type":{"type":"str","required":false,"choices":["broadcast","point-to-point'
+    '","loopback"]}}},"redistribute_l2":{"type":"str","required":false,"choices":["enable","disable"]},"redistribute_l1":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"summary_address":{"type":"list","required":false,"options":{"prefix":{"type":"str","required":false},"id":{"type":"int",'
+    '"required":false},"level":{"type":"str","required":false,"choices":["level-1-2","level-1","level-2"]}}},"overload_bit_on_startup":{"type":"int","requi'
+    'red":false},"is_type":{"type":"str","required":false,"choices":["level-1-2","level-1","level-2-only"]},"adjacency_check6":{"type":"str","required":fal'
+    'se,"choices":["enable","disable"]},"summary_address6":{"type":"list","required":false,"options":{"level":{"type":"str","required":false,"choices":["le'
+    'vel-1-2","level-1","level-2"]},"prefix6":{"type":"str","required":false},"id":{"type":"int","required":false}}},"redistribute":{"type":"list","require'
+    'd":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"protocol":{"type":"str","required":false},"level":{"type"'
+    ':"str","required":false,"choices":["level-1-2","level-1","level-2"]},"metric":{"type":"int","required":false},"metric_type":{"type":"str","required":f'
+    'alse,"choices":["external","internal"]},"routemap":{"type":"str","required":false}}},"redistribute6_l2":{"type":"str","required":false,"choices":["ena'
+    'ble","disable"]},"redistribute6_l1":{"type":"str","required":false,"choices":["enable","disable"]},"isis_net":{"type":"list","required":false,"options'
+    '":{"net":{"type":"str","required":false},"id":{"type":"int","required":false}}},"spf_interval_exp_l1":{"type":"str","required":false},"auth_keychain_l'
+    '1":{"type":"str","required":false},"auth_keychain_l2":{"type":"str","required":false},"spf_interval_exp_l2":{"type":"str","required":false},"redistrib'
+    'ute6_l1_list":{"type":"str","required":false},"redistribute6":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"protocol":{"type":"str","required":false},"level":{"type":"str","required":false,"choices":["level-1-2","level-1","level-2'
+    '"]},"metric":{"type":"int","required":false},"metric_type":{"type":"str","required":false,"choices":["external","internal"]},"routemap":{"type":"str",'
+    '"required":false}}},"ignore_lsp_errors":{"type":"str","required":false,"choices":["enable","disable"]},"lsp_gen_interval_l1":{"type":"int","required":'
+    'false},"redistribute_l2_list":{"type":"str","required":false},"redistribute_l1_list":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"key":{"type":"list","children":{"id":{"type":"string","revisions":[2047,2'
+    '047]},"key_string":{"type":"string","revisions":[2047,2047]},"send_lifetime":{"type":"string","revisions":[2047,2047]},"accept_lifetime":{"type":"stri'
+    'ng","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"key":{"type":"list","required":false,"options":{"id":{"type":"str",'
+    '"required":false},"key_string":{"type":"str","required":false},"send_lifetime":{"type":"str","required":false},"accept_lifetime":{"type":"str","requir'
+    'ed":false}}}}}'
+)
@@ -0,0 +1,76 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"interface":{"type":"list","children":{"rp_candidate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]'
+    '},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rp_candidate_group":{"type":"string","revisions":[2047,2047]},"pim_mode":{"ty'
+    'pe":"string","options":[{"value":"sparse-mode","revisions":[2047,2047]},{"value":"dense-mode","revisions":[2047,2047]}],"revisions":[2047,2047]},"rpf_'
+    'nbr_fail_back":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2'
+    '040]},"hello_interval":{"type":"integer","revisions":[2047,2047]},"rp_candidate_interval":{"type":"integer","revisions":[2047,2047]},"state_refresh_in'
+    'terval":{"type":"integer","revisions":[2047,2047]},"bfd":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"passive":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]},"rpf_nbr_fail_back_filter":{"type":"string","revisions":[2040,2040]},"igmp":{"type":"dict","children"'
+    ':{"last_member_query_interval":{"type":"integer","revisions":[2047,2047]},"immediate_leave_group":{"type":"string","revisions":[2047,2047]},"query_tim'
+    'eout":{"type":"integer","revisions":[2047,2047]},"router_alert_check":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":'
+    '"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"query_max_response_time":{"type":"integer","revisions":[2047,2047]},"version":{"type":"s'
+    'tring","options":[{"value":"3","revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]},{"value":"1","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"access_group":{"type":"string","revisions":[2047,2047]},"query_interval":{"type":"integer","revisions":[2047,2047]},"last_member_query_count"'
+    ':{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"propagation_delay":{"type":"integer","revisions":[2047,2047]},"join_group":{"ty'
+    'pe":"list","children":{"address":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"ttl_threshold":{"type":"integer","revisions":[20'
+    '47,2047]},"static_group":{"type":"string","revisions":[2047,2047]},"multicast_flow":{"type":"string","revisions":[2047,2047]},"name":{"type":"string",'
+    '"revisions":[2047,2047]},"hello_holdtime":{"type":"integer","revisions":[2047,2047]},"dr_priority":{"type":"integer","revisions":[2047,2047]},"neighbo'
+    'ur_filter":{"type":"string","revisions":[2047,2047]},"rp_candidate_priority":{"type":"integer","revisions":[2047,2047]},"cisco_exclude_genid":{"type":'
+    '"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[204'
+    '7,2047]},"route_limit":{"type":"integer","revisions":[2047,2047]},"route_threshold":{"type":"integer","revisions":[2047,2047]},"pim_sm_global":{"type"'
+    ':"dict","children":{"null_register_retries":{"type":"integer","revisions":[2047,2047]},"accept_register_list":{"type":"string","revisions":[2047,2047]'
+    '},"bsr_allow_quick_refresh":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"cisco_register_checksum":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"register_rate_limit":{"type":"integer","revisions":[2047,2047]},"register_source":{"type":"string","options":[{"v'
+    'alue":"disable","revisions":[2047,2047]},{"value":"interface","revisions":[2047,2047]},{"value":"ip-address","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"join_prune_holdtime":{"type":"integer","revisions":[2047,2047]},"register_source_interface":{"type":"string","revisions":[2047,2047]},"mess'
+    'age_interval":{"type":"integer","revisions":[2047,2047]},"ssm_range":{"type":"string","revisions":[2047,2047]},"rp_address":{"type":"list","children":'
+    '{"ip_address":{"type":"string","revisions":[2047,2047]},"group":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,204'
+    '7]}},"revisions":[2047,2047]},"cisco_ignore_rp_set_priority":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"spt_threshold":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"cisco_register_checksum_group":{"type":"string","revisions":[2047,2047]},"bsr_priority":{"'
+    'type":"integer","revisions":[2047,2047]},"cisco_crp_prefix":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"accept_source_list":{"type":"string","revisions":[2047,2047]},"spt_threshold_group":{"type":"strin'
+    'g","revisions":[2047,2047]},"bsr_hash":{"type":"integer","revisions":[2047,2047]},"register_source_ip":{"type":"string","revisions":[2047,2047]},"bsr_'
+    'candidate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"ssm":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"'
+    'register_supression":{"type":"integer","revisions":[2047,2047]},"register_rp_reachability":{"type":"string","options":[{"value":"enable","revisions":['
+    '2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rp_register_keepalive":{"type":"integer","revisions":[2047,2047]},"'
+    'bsr_interface":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"multicast_routing":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"interface":{"type":"list","required":false,"options":{"rp_candidate":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"rp_candidate_group":{"type":"str","required":false},"pim_mode":{"type":"str","required":false,"choices":["sparse-mode","den'
+    'se-mode"]},"rpf_nbr_fail_back":{"type":"str","required":false,"choices":["enable","disable"]},"hello_interval":{"type":"int","required":false},"rp_can'
+    'didate_interval":{"type":"int","required":false},"state_refresh_interval":{"type":"int","required":false},"bfd":{"type":"str","required":false,"choice'
+    's":["enable","disable"]},"passive":{"type":"str","required":false,"choices":["enable","disable"]},"rpf_nbr_fail_back_filter":{"type":"str","required":'
+    'false},"igmp":{"type":"dict","required":false,"options":{"last_member_query_interval":{"type":"int","required":false},"immediate_leave_group":{"type":'
+    '"str","required":false},"query_timeout":{"type":"int","required":false},"router_alert_check":{"type":"str","required":false,"choices":["enable","disab'
+    'le"]},"query_max_response_time":{"type":"int","required":false},"version":{"type":"str","required":false,"choices":["3","2","1"]},"access_group":{"typ'
+    'e":"str","required":false},"query_interval":{"type":"int","required":false},"last_member_query_count":{"type":"int","required":false}}},"propagation_d'
+    'elay":{"type":"int","required":false},"join_group":{"type":"list","required":false,"options":{"address":{"type":"str","required":false}}},"ttl_thresho'
+    'ld":{"type":"int","required":false},"static_group":{"type":"str","required":false},"multicast_flow":{"type":"str","required":false},"name":{"type":"st'
+    'r","required":false},"hello_holdtime":{"type":"int","required":false},"dr_priority":{"type":"int","required":false},"neighbour_filter":{"type":"str","'
+    'required":false},"rp_candidate_priority":{"type":"int","required":false},"cisco_exclude_genid":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]}}},"route_limit":{"type":"int","required":false},"route_threshold":{"type":"int","required":false},"pim_sm_global":{"type":"dict","required":fa'
+    'lse,"options":{"null_register_retries":{"type":"int","required":false},"accept_register_list":{"type":"str","required":false},"bsr_allow_quick_refresh'
+    '":{"type":"str","required":false,"choices":["enable","disable"]},"cisco_register_checksum":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"register_rate_limit":{"type":"int","required":false},"register_source":{"type":"str","required":false,"choices":["disable","interface","ip-addres'
+    's"]},"join_prune_holdtime":{"type":"int","required":false},"register_source_interface":{"type":"str","required":false},"message_interval":{"type":"int'
+    '","required":false},"ssm_range":{"type":"str","required":false},"rp_address":{"type":"list","required":false,"options":{"ip_address":{"type":"str","re'
+    'quired":false},"group":{"type":"str","required":false},"id":{"type":"int","required":false}}},"cisco_ignore_rp_set_priority":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"spt_threshold":{"type":"str","required":false,"choices":["enable","disable"]},"cisco_register_checksum_group":{'
+    '"type":"str","required":false},"bsr_priority":{"type":"int","required":false},"cisco_crp_prefix":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]},"accept_source_list":{"type":"str","required":false},"spt_threshold_group":{"type":"str","required":false},"bsr_hash":{"type":"int","require'
+    'd":false},"register_source_ip":{"type":"str","required":false},"bsr_candidate":{"type":"str","required":false,"choices":["enable","disable"]},"ssm":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"register_supression":{"type":"int","required":false},"register_rp_reachability":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"rp_register_keepalive":{"type":"int","required":false},"bsr_interface":{"type":"str","required'
+    '":false}}},"multicast_routing":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
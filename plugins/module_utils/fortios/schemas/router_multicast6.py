@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"interface":{"type":"list","children":{"hello_holdtime":{"type":"integer","revisions":[2047,2047]},"hello_interval":{"type"'
+    ':"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"multicast_routing":{"type":"string","o'
+    'ptions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"multicast_pmtu":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pim_sm_global":{"ty'
+    'pe":"dict","children":{"rp_address":{"type":"list","children":{"ip6_address":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisio'
+    'ns":[2047,2047]}},"revisions":[2047,2047]},"register_rate_limit":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[20'
+    '47,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"interface":{"type":"list","required":false,"options":{"hello_holdtime":{"type":"int","required":false},"he'
+    'llo_interval":{"type":"int","required":false},"name":{"type":"str","required":false}}},"multicast_routing":{"type":"str","required":false,"choices":["'
+    'enable","disable"]},"multicast_pmtu":{"type":"str","required":false,"choices":["enable","disable"]},"pim_sm_global":{"type":"dict","required":false,"o'
+    'ptions":{"rp_address":{"type":"list","required":false,"options":{"ip6_address":{"type":"str","required":false},"id":{"type":"int","required":false}}},'
+    '"register_rate_limit":{"type":"int","required":false}}}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"flows":{"type":"list","children":{"source_addr":{"type":"string","revisio'
+    'ns":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"group_addr":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"com'
+    'ments":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"flows":{"type":"list","required":false,"options":{"source_addr":{"t'
+    'ype":"str","required":false},"id":{"type":"int","required":false},"group_addr":{"type":"str","required":false}}},"comments":{"type":"str","required":f'
+    'alse}}}'
+)
@@ -0,0 +1,124 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"distribute_route_map_in":{"type":"string","revisions":[2047,2047]},"default_information_metric":{"type":"integer","revisio'
+    'ns":[2047,2047]},"distance_intra_area":{"type":"integer","revisions":[2047,2047]},"default_information_metric_type":{"type":"string","options":[{"valu'
+    'e":"1","revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]}],"revisions":[2047,2047]},"network":{"type":"list","children":{"prefix":{"type":'
+    '"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"comments":{"type":"string","revisions":[1024,1024]},"area":{"type":'
+    '"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"area":{"type":"list","children":{"stub_type":{"type":"string","options":[{"value":"no-sum'
+    'mary","revisions":[2047,2047]},{"value":"summary","revisions":[2047,2047]}],"revisions":[2047,2047]},"nssa_default_information_originate_metric":{"typ'
+    'e":"integer","revisions":[2047,2047]},"nssa_default_information_originate_metric_type":{"type":"string","options":[{"value":"1","revisions":[2047,2047'
+    ']},{"value":"2","revisions":[2047,2047]}],"revisions":[2047,2047]},"nssa_default_information_originate":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"always","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"nssa_redist'
+    'ribution":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"shortcut":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]},{"value":"default","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"default_cost":{"type":"integer","revisions":[2047,2047]},"authentication":{"type":"string","options":['
+    '{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"md5","revisions":[2047,2047]}],"revisions":[2047,2047]},"n'
+    'ssa_translator_role":{"type":"string","options":[{"value":"candidate","revisions":[2047,2047]},{"value":"never","revisions":[2047,2047]},{"value":"alw'
+    'ays","revisions":[2047,2047]}],"revisions":[2047,2047]},"virtual_link":{"type":"list","children":{"retransmit_interval":{"type":"integer","revisions":'
+    '[2047,2047]},"md5_keys":{"type":"list","children":{"key_string":{"type":"string","revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,204'
+    '0]}},"revisions":[2040,2040]},"name":{"type":"string","revisions":[2047,2047]},"md5_keychain":{"type":"string","revisions":[2040,2040]},"md5_key":{"ty'
+    'pe":"string","revisions":[2047,7]},"authentication":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":['
+    '2047,2047]},{"value":"md5","revisions":[2047,2047]}],"revisions":[2047,2047]},"dead_interval":{"type":"integer","revisions":[2047,2047]},"hello_interv'
+    'al":{"type":"integer","revisions":[2047,2047]},"peer":{"type":"string","revisions":[2047,2047]},"authentication_key":{"type":"string","revisions":[204'
+    '7,2047]},"transmit_delay":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"filter_list":{"type":"list","children":{"direction":{"'
+    'type":"string","options":[{"value":"in","revisions":[2047,2047]},{"value":"out","revisions":[2047,2047]}],"revisions":[2047,2047]},"list":{"type":"str'
+    'ing","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"range":{"type":"list","children":{"substitute'
+    '_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"advertise":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"prefix":{"type":"string","revisions":[2047,2047]},"substitute":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,'
+    '2047]}},"revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"regular","revisions":[2047,2047]},{"value":"nssa","revisions":[2047,2047'
+    ']},{"value":"stub","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"string","revisions":[2047,2047]},"comments":{"type":"string","revi'
+    'sions":[1024,1024]}},"revisions":[2047,2047]},"distribute_list":{"type":"list","children":{"protocol":{"type":"string","options":[{"value":"connected"'
+    ',"revisions":[2047,2047]},{"value":"static","revisions":[2047,2047]},{"value":"rip","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"i'
+    'nteger","revisions":[2047,2047]},"access_list":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"abr_type":{"type":"string","option'
+    's":[{"value":"cisco","revisions":[2047,2047]},{"value":"ibm","revisions":[2047,2047]},{"value":"shortcut","revisions":[2047,2047]},{"value":"standard"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"distance_external":{"type":"integer","revisions":[2047,2047]},"default_information_originate":{"t'
+    'ype":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"always","revisions":[2047,2047]},{"value":"disable","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"passive_interface":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047'
+    ']},"restart_mode":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"lls","revisions":[2047,2047]},{"value":"graceful-rest'
+    'art","revisions":[2047,2047]}],"revisions":[2047,2047]},"default_information_route_map":{"type":"string","revisions":[2047,2047]},"router_id":{"type":'
+    '"string","revisions":[2047,2047]},"distance_inter_area":{"type":"integer","revisions":[2047,2047]},"auto_cost_ref_bandwidth":{"type":"integer","revisi'
+    'ons":[2047,2047]},"log_neighbour_changes":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"default_metric":{"type":"integer","revisions":[2047,2047]},"summary_address":{"type":"list","children":{"prefix":{"t'
+    'ype":"string","revisions":[2047,2047]},"tag":{"type":"integer","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"advertise":{"'
+    'type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions'
+    '":[2047,2047]},"spf_timers":{"type":"string","revisions":[2047,2047]},"distance":{"type":"integer","revisions":[2047,2047]},"redistribute":{"type":"li'
+    'st","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"metric":{"type":"integer","revisions":[2047,2047]},"tag":{"type":"integer","revision'
+    's":[2047,2047]},"metric_type":{"type":"string","options":[{"value":"1","revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"routemap":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"restart_period":{"type":"integer","revisions":[2047,2047]},"'
+    'bfd":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dis'
+    'tribute_list_in":{"type":"string","revisions":[2047,2047]},"database_overflow":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},'
+    '{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"database_overflow_max_lsas":{"type":"integer","revisions":[2047,2047]},"databas'
+    'e_overflow_time_to_recover":{"type":"integer","revisions":[2047,2047]},"neighbor":{"type":"list","children":{"priority":{"type":"integer","revisions":'
+    '[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"cost":{"type":"integer","revisions":[2047,2047]},"poll_interval":{"type":"integer","revis'
+    'ions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"rfc1583_compatible":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ospf_interface":{"type":"list","children":{"'
+    'ip":{"type":"string","revisions":[2047,2047]},"md5_key":{"type":"string","revisions":[2047,7]},"cost":{"type":"integer","revisions":[2047,2047]},"hell'
+    'o_interval":{"type":"integer","revisions":[2047,2047]},"mtu_ignore":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"retransmit_interval":{"type":"integer","revisions":[2047,2047]},"bfd":{"type":"string","op'
+    'tions":[{"value":"global","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"comments":{"type":"string","revisions":[1024,1024]},"priority":{"type":"integer","revisions":[2047,2047]},"authentication":{"type":"str'
+    'ing","options":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"md5","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"prefix_length":{"type":"integer","revisions":[2047,2047]},"authentication_key":{"type":"string","revisions":[2047,2047]},"resync_timeou'
+    't":{"type":"integer","revisions":[2047,2047]},"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"database_filter_out":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"hello_multiplier":{"type":"integer","revisions":[2047,2047]},"interface":{"type":"string",'
+    '"revisions":[2047,2047]},"transmit_delay":{"type":"integer","revisions":[2047,2047]},"md5_keys":{"type":"list","children":{"key_string":{"type":"strin'
+    'g","revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"name":{"type":"string","revisions":[2047,2047]}'
+    ',"md5_keychain":{"type":"string","revisions":[2040,2040]},"mtu":{"type":"integer","revisions":[2047,2047]},"dead_interval":{"type":"integer","revision'
+    's":[2047,2047]},"network_type":{"type":"string","options":[{"value":"broadcast","revisions":[2047,2047]},{"value":"non-broadcast","revisions":[2047,20'
+    '47]},{"value":"point-to-point","revisions":[2047,2047]},{"value":"point-to-multipoint","revisions":[2047,2047]},{"value":"point-to-multipoint-non-broa'
+    'dcast","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"distribute_route_map_in":{"type":"str","required":false},"default_information_metric":{"type":"int","requi'
+    'red":false},"distance_intra_area":{"type":"int","required":false},"default_information_metric_type":{"type":"str","required":false,"choices":["1","2"]'
+    '},"network":{"type":"list","required":false,"options":{"prefix":{"type":"str","required":false},"id":{"type":"int","required":false},"comments":{"type'
+    '":"str","required":false},"area":{"type":"str","required":false}}},"area":{"type":"list","required":false,"options":{"stub_type":{"type":"str","requir'
+    'ed":false,"choices":["no-summary","summary"]},"nssa_default_information_originate_metric":{"type":"int","required":false},"nssa_default_information_or'
+    'iginate_metric_type":{"type":"str","required":false,"choices":["1","2"]},"nssa_default_information_originate":{"type":"str","required":false,"choices"'
+    ':["enable","always","disable"]},"nssa_redistribution":{"type":"str","required":false,"choices":["enable","disable"]},"shortcut":{"type":"str","require'
+    'd":false,"choices":["disable","enable","default"]},"default_cost":{"type":"int","required":false},"authentication":{"type":"str","required":false,"cho'
+    'ices":["none","text","md5"]},"nssa_translator_role":{"type":"str","required":false,"choices":["candidate","never","always"]},"virtual_link":{"type":"l'
+    'ist","required":false,"options":{"retransmit_interval":{"type":"int","required":false},"md5_keys":{"type":"list","required":false,"options":{"key_stri'
+    'ng":{"type":"str","required":false},"id":{"type":"int","required":false}}},"name":{"type":"str","required":false},"md5_keychain":{"type":"str","requir'
+    'ed":false},"md5_key":{"type":"str","required":false},"authentication":{"type":"str","required":false,"choices":["none","text","md5"]},"dead_interval":'
+    '{"type":"int","required":false},"hello_interval":{"type":"int","required":false},"peer":{"type":"str","required":false},"authentication_key":{"type":"'
+    'str","required":false},"transmit_delay":{"type":"int","required":false}}},"filter_list":{"type":"list","required":false,"options":{"direction":{"type"'
+    ':"str","required":false,"choices":["in","out"]},"list":{"type":"str","required":false},"id":{"type":"int","required":false}}},"range":{"type":"list","'
+    'required":false,"options":{"substitute_status":{"type":"str","required":false,"choices":["enable","disable"]},"advertise":{"type":"str","required":fal'
+    'se,"choices":["disable","enable"]},"prefix":{"type":"str","required":false},"substitute":{"type":"str","required":false},"id":{"type":"int","required"'
+    ':false}}},"type":{"type":"str","required":false,"choices":["regular","nssa","stub"]},"id":{"type":"str","required":false},"comments":{"type":"str","re'
+    'quired":false}}},"distribute_list":{"type":"list","required":false,"options":{"protocol":{"type":"str","required":false,"choices":["connected","static'
+    '","rip"]},"id":{"type":"int","required":false},"access_list":{"type":"str","required":false}}},"abr_type":{"type":"str","required":false,"choices":["c'
+    'isco","ibm","shortcut","standard"]},"distance_external":{"type":"int","required":false},"default_information_originate":{"type":"str","required":false'
+    ',"choices":["enable","always","disable"]},"passive_interface":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"res'
+    'tart_mode":{"type":"str","required":false,"choices":["none","lls","graceful-restart"]},"default_information_route_map":{"type":"str","required":false}'
+    ',"router_id":{"type":"str","required":false},"distance_inter_area":{"type":"int","required":false},"auto_cost_ref_bandwidth":{"type":"int","required":'
+    'false},"log_neighbour_changes":{"type":"str","required":false,"choices":["enable","disable"]},"default_metric":{"type":"int","required":false},"summar'
+    'y_address":{"type":"list","required":false,"options":{"prefix":{"type":"str","required":false},"tag":{"type":"int","required":false},"id":{"type":"int'
+    '","required":false},"advertise":{"type":"str","required":false,"choices":["disable","enable"]}}},"spf_timers":{"type":"str","required":false},"distanc'
+    'e":{"type":"int","required":false},"redistribute":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"name":{"type":"str","required":false},"metric":{"type":"int","required":false},"tag":{"type":"int","required":false},"metric_type":{"t'
+    'ype":"str","required":false,"choices":["1","2"]},"routemap":{"type":"str","required":false}}},"restart_period":{"type":"int","required":false},"bfd":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"distribute_list_in":{"type":"str","required":false},"database_overflow":{"type":"str","'
+    'required":false,"choices":["enable","disable"]},"database_overflow_max_lsas":{"type":"int","required":false},"database_overflow_time_to_recover":{"typ'
+    'e":"int","required":false},"neighbor":{"type":"list","required":false,"options":{"priority":{"type":"int","required":false},"ip":{"type":"str","requir'
+    'ed":false},"cost":{"type":"int","required":false},"poll_interval":{"type":"int","required":false},"id":{"type":"int","required":false}}},"rfc1583_comp'
+    'atible":{"type":"str","required":false,"choices":["enable","disable"]},"ospf_interface":{"type":"list","required":false,"options":{"ip":{"type":"str",'
+    '"required":false},"md5_key":{"type":"str","required":false},"cost":{"type":"int","required":false},"hello_interval":{"type":"int","required":false},"m'
+    'tu_ignore":{"type":"str","required":false,"choices":["enable","disable"]},"retransmit_interval":{"type":"int","required":false},"bfd":{"type":"str","r'
+    'equired":false,"choices":["global","enable","disable"]},"comments":{"type":"str","required":false},"priority":{"type":"int","required":false},"authent'
+    'ication":{"type":"str","required":false,"choices":["none","text","md5"]},"prefix_length":{"type":"int","required":false},"authentication_key":{"type":'
+    '"str","required":false},"resync_timeout":{"type":"int","required":false},"status":{"type":"str","required":false,"choices":["disable","enable"]},"data'
+    'base_filter_out":{"type":"str","required":false,"choices":["enable","disable"]},"hello_multiplier":{"type":"int","required":false},"interface":{"type"'
+    ':"str","required":false},"transmit_delay":{"type":"int","required":false},"md5_keys":{"type":"list","required":false,"options":{"key_string":{"type":"'
+    'str","required":false},"id":{"type":"int","required":false}}},"name":{"type":"str","required":false},"md5_keychain":{"type":"str","required":false},"m'
+    'tu":{"type":"int","required":false},"dead_interval":{"type":"int","required":false},"network_type":{"type":"str","required":false,"choices":["broadcas'
+    't","non-broadcast","point-to-point","point-to-multipoint","point-to-multipoint-non-broadcast"]}}}}}'
+)
@@ -0,0 +1,109 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"router_id":{"type":"string","revisions":[2047,2047]},"default_information_metric_type":{"type":"string","options":[{"value'
+    '":"1","revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]}],"revisions":[2047,2047]},"redistribute":{"type":"list","children":{"status":{"ty'
+    'pe":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"metric_type"'
+    ':{"type":"string","options":[{"value":"1","revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]}],"revisions":[2047,2047]},"metric":{"type":"i'
+    'nteger","revisions":[2047,2047]},"routemap":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2'
+    '047,2047]},"auto_cost_ref_bandwidth":{"type":"integer","revisions":[2047,2047]},"log_neighbour_changes":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"area":{"type":"list","children":{"stub_type":{"type":"'
+    'string","options":[{"value":"no-summary","revisions":[2047,2047]},{"value":"summary","revisions":[2047,2047]}],"revisions":[2047,2047]},"nssa_default_'
+    'information_originate_metric":{"type":"integer","revisions":[2047,2047]},"nssa_default_information_originate_metric_type":{"type":"string","options":['
+    '{"value":"1","revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]}],"revisions":[2047,2047]},"nssa_default_information_originate":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipsec_auth_alg":{"t'
+    'ype":"string","options":[{"value":"md5","revisions":[2040,2040]},{"value":"sha1","revisions":[2040,2040]},{"value":"sha256","revisions":[2040,2040]},{'
+    '"value":"sha384","revisions":[2040,2040]},{"value":"sha512","revisions":[2040,2040]}],"revisions":[2040,2040]},"nssa_redistribution":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"string","rev'
+    'isions":[2047,2047]},"virtual_link":{"type":"list","children":{"retransmit_interval":{"type":"integer","revisions":[2047,2047]},"ipsec_keys":{"type":"'
+    'list","children":{"spi":{"type":"integer","revisions":[2040,2040]},"enc_key":{"type":"string","revisions":[2040,2040]},"auth_key":{"type":"string","re'
+    'visions":[2040,2040]}},"revisions":[2040,2040]},"name":{"type":"string","revisions":[2047,2047]},"ipsec_auth_alg":{"type":"string","options":[{"value"'
+    ':"md5","revisions":[2040,2040]},{"value":"sha1","revisions":[2040,2040]},{"value":"sha256","revisions":[2040,2040]},{"value":"sha384","revisions":[204'
+    '0,2040]},{"value":"sha512","revisions":[2040,2040]}],"revisions":[2040,2040]},"peer":{"type":"string","revisions":[2047,2047]},"authentication":{"type'
+    '":"string","options":[{"value":"none","revisions":[2040,2040]},{"value":"ah","revisions":[2040,2040]},{"value":"esp","revisions":[2040,2040]},{"value"'
+    ':"area","revisions":[2040,2040]}],"revisions":[2040,2040]},"dead_interval":{"type":"integer","revisions":[2047,2047]},"hello_interval":{"type":"intege'
+    'r","revisions":[2047,2047]},"key_rollover_interval":{"type":"integer","revisions":[2040,2040]},"ipsec_enc_alg":{"type":"string","options":[{"value":"n'
+    'ull","revisions":[2040,2040]},{"value":"des","revisions":[2040,2040]},{"value":"3des","revisions":[2040,2040]},{"value":"aes128","revisions":[2040,204'
+    '0]},{"value":"aes192","revisions":[2040,2040]},{"value":"aes256","revisions":[2040,2040]}],"revisions":[2040,2040]},"transmit_delay":{"type":"integer"'
+    ',"revisions":[2047,2047]}},"revisions":[2047,2047]},"authentication":{"type":"string","options":[{"value":"none","revisions":[2040,2040]},{"value":"ah'
+    '","revisions":[2040,2040]},{"value":"esp","revisions":[2040,2040]}],"revisions":[2040,2040]},"ipsec_keys":{"type":"list","children":{"spi":{"type":"in'
+    'teger","revisions":[2040,2040]},"enc_key":{"type":"string","revisions":[2040,2040]},"auth_key":{"type":"string","revisions":[2040,2040]}},"revisions":'
+    '[2040,2040]},"nssa_translator_role":{"type":"string","options":[{"value":"candidate","revisions":[2047,2047]},{"value":"never","revisions":[2047,2047]'
+    '},{"value":"always","revisions":[2047,2047]}],"revisions":[2047,2047]},"key_rollover_interval":{"type":"integer","revisions":[2040,2040]},"ipsec_enc_a'
+    'lg":{"type":"string","options":[{"value":"null","revisions":[2040,2040]},{"value":"des","revisions":[2040,2040]},{"value":"3des","revisions":[2040,204'
+    '0]},{"value":"aes128","revisions":[2040,2040]},{"value":"aes192","revisions":[2040,2040]},{"value":"aes256","revisions":[2040,2040]}],"revisions":[204'
+    '0,2040]},"range":{"type":"list","children":{"advertise":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"prefix6":{"type":"string","revisions":[2047,2047]}},"r'
+    'evisions":[2047,2047]},"type":{"type":"string","options":[{"value":"regular","revisions":[2047,2047]},{"value":"nssa","revisions":[2047,2047]},{"value'
+    '":"stub","revisions":[2047,2047]}],"revisions":[2047,2047]},"default_cost":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"defau'
+    'lt_metric":{"type":"integer","revisions":[2047,2047]},"bfd":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"abr_type":{"type":"string","options":[{"value":"cisco","revisions":[2047,2047]},{"value":"ibm","re'
+    'visions":[2047,2047]},{"value":"standard","revisions":[2047,2047]}],"revisions":[2047,2047]},"summary_address":{"type":"list","children":{"advertise":'
+    '{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"tag":{"t'
+    'ype":"integer","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"prefix6":{"type":"string","revisions":[2047,2047]}},"revision'
+    's":[2047,2047]},"spf_timers":{"type":"string","revisions":[2047,2047]},"default_information_metric":{"type":"integer","revisions":[2047,2047]},"defaul'
+    't_information_originate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"always","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ospf6_interface":{"type":"list","children":{"status":{"type":"string","options":[{"value":'
+    '"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"area_id":{"type":"string","revisions":[2047,2'
+    '047]},"ipsec_keys":{"type":"list","children":{"spi":{"type":"integer","revisions":[2040,2040]},"enc_key":{"type":"string","revisions":[2040,2040]},"au'
+    'th_key":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"cost":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string",'
+    '"revisions":[2047,2047]},"bfd":{"type":"string","options":[{"value":"global","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]},{"val'
+    'ue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipsec_auth_alg":{"type":"string","options":[{"value":"md5","revisions":[2040,2040]},'
+    '{"value":"sha1","revisions":[2040,2040]},{"value":"sha256","revisions":[2040,2040]},{"value":"sha384","revisions":[2040,2040]},{"value":"sha512","revi'
+    'sions":[2040,2040]}],"revisions":[2040,2040]},"retransmit_interval":{"type":"integer","revisions":[2047,2047]},"mtu":{"type":"integer","revisions":[20'
+    '47,2047]},"priority":{"type":"integer","revisions":[2047,2047]},"neighbor":{"type":"list","children":{"priority":{"type":"integer","revisions":[2047,2'
+    '047]},"poll_interval":{"type":"integer","revisions":[2047,2047]},"cost":{"type":"integer","revisions":[2047,2047]},"ip6":{"type":"string","revisions":'
+    '[2047,2047]}},"revisions":[2047,2047]},"authentication":{"type":"string","options":[{"value":"none","revisions":[2040,2040]},{"value":"ah","revisions"'
+    ':[2040,2040]},{"value":"esp","revisions":[2040,2040]},{"value":"area","revisions":[2040,2040]}],"revisions":[2040,2040]},"dead_interval":{"type":"inte'
+    'ger","revisions":[2047,2047]},"hello_interval":{"type":"integer","revisions":[2047,2047]},"key_rollover_interval":{"type":"integer","revisions":[2040,'
+    '2040]},"ipsec_enc_alg":{"type":"string","options":[{"value":"null","revisions":[2040,2040]},{"value":"des","revisions":[2040,2040]},{"value":"3des","r'
+    'evisions":[2040,2040]},{"value":"aes128","revisions":[2040,2040]},{"value":"aes192","revisions":[2040,2040]},{"value":"aes256","revisions":[2040,2040]'
+    '}],"revisions":[2040,2040]},"mtu_ignore":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]},"network_type":{"type":"string","options":[{"value":"broadcast",'
+    '"revisions":[2047,2047]},{"value":"point-to-point","revisions":[2047,2047]},{"value":"non-broadcast","revisions":[2047,2047]},{"value":"point-to-multi'
+    'point","revisions":[2047,2047]},{"value":"point-to-multipoint-non-broadcast","revisions":[2047,2047]}],"revisions":[2047,2047]},"transmit_delay":{"typ'
+    'e":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"passive_interface":{"type":"list","children":{"name":{"type":"string","revisions":[20'
+    '47,2047]}},"revisions":[2047,2047]},"default_information_route_map":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"router_id":{"type":"str","required":false},"default_information_metric_type":{"type":"str","required":fals'
+    'e,"choices":["1","2"]},"redistribute":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"'
+    ']},"metric_type":{"type":"str","required":false,"choices":["1","2"]},"metric":{"type":"int","required":false},"routemap":{"type":"str","required":fals'
+    'e},"name":{"type":"str","required":false}}},"auto_cost_ref_bandwidth":{"type":"int","required":false},"log_neighbour_changes":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]},"area":{"type":"list","required":false,"options":{"stub_type":{"type":"str","required":false,"choices":["no-sum'
+    'mary","summary"]},"nssa_default_information_originate_metric":{"type":"int","required":false},"nssa_default_information_originate_metric_type":{"type"'
+    ':"str","required":false,"choices":["1","2"]},"nssa_default_information_originate":{"type":"str","required":false,"choices":["enable","disable"]},"ipse'
+    'c_auth_alg":{"type":"str","required":false,"choices":["md5","sha1","sha256","sha384","sha512"]},"nssa_redistribution":{"type":"str","required":false,"'
+    'choices":["enable","disable"]},"id":{"type":"str","required":false},"virtual_link":{"type":"list","required":false,"options":{"retransmit_interval":{"'
+    'type":"int","required":false},"ipsec_keys":{"type":"list","required":false,"options":{"spi":{"type":"int","required":false},"enc_key":{"type":"str","r'
+    'equired":false},"auth_key":{"type":"str","required":false}}},"name":{"type":"str","required":false},"ipsec_auth_alg":{"type":"str","required":false,"c'
+    'hoices":["md5","sha1","sha256","sha384","sha512"]},"peer":{"type":"str","required":false},"authentication":{"type":"str","required":false,"choices":["'
+    'none","ah","esp","area"]},"dead_interval":{"type":"int","required":false},"hello_interval":{"type":"int","required":false},"key_rollover_interval":{"t'
+    'ype":"int","required":false},"ipsec_enc_alg":{"type":"str","required":false,"choices":["null","des","3des","aes128","aes192","aes256"]},"transmit_dela'
+    'y":{"type":"int","required":false}}},"authentication":{"type":"str","required":false,"choices":["none","ah","esp"]},"ipsec_keys":{"type":"list","requi'
+    'red":false,"options":{"spi":{"type":"int","required":false},"enc_key":{"type":"str","required":false},"auth_key":{"type":"str","required":false}}},"ns'
+    'sa_translator_role":{"type":"str","required":false,"choices":["candidate","never","always"]},"key_rollover_interval":{"type":"int","required":false},"'
+    'ipsec_enc_alg":{"type":"str","required":false,"choices":["null","des","3des","aes128","aes192","aes256"]},"range":{"type":"list","required":false,"opt'
+    'ions":{"advertise":{"type":"str","required":false,"choices":["disable","enable"]},"id":{"type":"int","required":false},"prefix6":{"type":"str","requir'
+    'ed":false}}},"type":{"type":"str","required":false,"choices":["regular","nssa","stub"]},"default_cost":{"type":"int","required":false}}},"default_metr'
+    'ic":{"type":"int","required":false},"bfd":{"type":"str","required":false,"choices":["enable","disable"]},"abr_type":{"type":"str","required":false,"ch'
+    'oices":["cisco","ibm","standard"]},"summary_address":{"type":"list","required":false,"options":{"advertise":{"type":"str","required":false,"choices":['
+    '"disable","enable"]},"tag":{"type":"int","required":false},"id":{"type":"int","required":false},"prefix6":{"type":"str","required":false}}},"spf_timer'
+    's":{"type":"str","required":false},"default_information_metric":{"type":"int","required":false},"default_information_originate":{"type":"str","require'
+    'd":false,"choices":["enable","always","disable"]},"ospf6_interface":{"type":"list","required":false,"options":{"status":{"type":"str","required":false'
+    ',"choices":["disable","enable"]},"area_id":{"type":"str","required":false},"ipsec_keys":{"type":"list","required":false,"options":{"spi":{"type":"int"'
+    ',"required":false},"enc_key":{"type":"str","required":false},"auth_key":{"type":"str","required":false}}},"cost":{"type":"int","required":false},"name'
+    '":{"type":"str","required":false},"bfd":{"type":"str","required":false,"choices":["global","enable","disable"]},"ipsec_auth_alg":{"type":"str","requir'
+    'ed":false,"choices":["md5","sha1","sha256","sha384","sha512"]},"retransmit_interval":{"type":"int","required":false},"mtu":{"type":"int","required":fa'
+    'lse},"priority":{"type":"int","required":false},"neighbor":{"type":"list","required":false,"options":{"priority":{"type":"int","required":false},"poll'
+    '_interval":{"type":"int","required":false},"cost":{"type":"int","required":false},"ip6":{"type":"str","required":false}}},"authentication":{"type":"st'
+    'r","required":false,"choices":["none","ah","esp","area"]},"dead_interval":{"type":"int","required":false},"hello_interval":{"type":"int","required":fa'
+    'lse},"key_rollover_interval":{"type":"int","required":false},"ipsec_enc_alg":{"type":"str","required":false,"choices":["null","des","3des","aes128","a'
+    'es192","aes256"]},"mtu_ignore":{"type":"str","required":false,"choices":["enable","disable"]},"interface":{"type":"str","required":false},"network_typ'
+    'e":{"type":"str","required":false,"choices":["broadcast","point-to-point","non-broadcast","point-to-multipoint","point-to-multipoint-non-broadcast"]},'
+    '"transmit_delay":{"type":"int","required":false}}},"passive_interface":{"type":"list","required":false,"options":{"name":{"type":"str","required":fals'
+    'e}}},"default_information_route_map":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,35 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"protocol":{"type":"integer","revisions":[2047,2047]},"end_port":{"type":"integer","revisions":[2047,2047]},"dst_negate":{"'
+    'type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"start_sour'
+    'ce_port":{"type":"integer","revisions":[2047,2047]},"internet_service_custom":{"type":"list","children":{"name":{"type":"string","revisions":[2040,204'
+    '0]}},"revisions":[2040,2040]},"input_device":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"ga'
+    'teway":{"type":"string","revisions":[2047,2047]},"tos":{"type":"string","revisions":[2047,2047]},"dst":{"type":"list","children":{"subnet":{"type":"st'
+    'ring","revisions":[2047,2047]}},"revisions":[2047,2047]},"input_device_negate":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},'
+    '{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"comments":{"type":"string","revisions":[2047,2047]},"status":{"type":"string","'
+    'options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"start_port":{"type":"integ'
+    'er","revisions":[2047,2047]},"srcaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"tos_mask'
+    '":{"type":"string","revisions":[2047,2047]},"src":{"type":"list","children":{"subnet":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,204'
+    '7]},"seq_num":{"type":"integer","revisions":[2047,2047]},"internet_service_id":{"type":"list","children":{"id":{"type":"integer","revisions":[2040,204'
+    '0]}},"revisions":[2040,2040]},"src_negate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"deny","revisions":[2047,2047]},{"value":"permit","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"end_source_port":{"type":"integer","revisions":[2047,2047]},"dstaddr":{"type":"list","children":{"name":{"type":"strin'
+    'g","revisions":[2047,2047]}},"revisions":[2047,2047]},"output_device":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"protocol":{"type":"int","required":false},"end_port":{"type":"int","required":false},"dst_negate":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"start_source_port":{"type":"int","required":false},"internet_service_custom":{"type":"list","r'
+    'equired":false,"options":{"name":{"type":"str","required":false}}},"input_device":{"type":"list","required":false,"options":{"name":{"type":"str","req'
+    'uired":false}}},"gateway":{"type":"str","required":false},"tos":{"type":"str","required":false},"dst":{"type":"list","required":false,"options":{"subn'
+    'et":{"type":"str","required":false}}},"input_device_negate":{"type":"str","required":false,"choices":["enable","disable"]},"comments":{"type":"str","r'
+    'equired":false},"status":{"type":"str","required":false,"choices":["enable","disable"]},"start_port":{"type":"int","required":false},"srcaddr":{"type"'
+    ':"list","required":false,"options":{"name":{"type":"str","required":false}}},"tos_mask":{"type":"str","required":false},"src":{"type":"list","required'
+    '":false,"options":{"subnet":{"type":"str","required":false}}},"seq_num":{"type":"int","required":false},"internet_service_id":{"type":"list","required'
+    '":false,"options":{"id":{"type":"int","required":false}}},"src_negate":{"type":"str","required":false,"choices":["enable","disable"]},"action":{"type"'
+    ':"str","required":false,"choices":["deny","permit"]},"end_source_port":{"type":"int","required":false},"dstaddr":{"type":"list","required":false,"opti'
+    'ons":{"name":{"type":"str","required":false}}},"output_device":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,20 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"src":{"type":"string","revisions":[2047,2047]},"protocol":{"type":"integer","revisions":[2047,2047]},"seq_num":{"type":"in'
+    'teger","revisions":[2047,2047]},"tos":{"type":"string","revisions":[2047,2047]},"dst":{"type":"string","revisions":[2047,2047]},"end_port":{"type":"in'
+    'teger","revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},"output_device":{"type":"string","revisions":[2047,2047]},"start_'
+    'port":{"type":"integer","revisions":[2047,2047]},"input_device":{"type":"string","revisions":[2047,2047]},"gateway":{"type":"string","revisions":[2047'
+    ',2047]},"tos_mask":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"src":{"type":"str","required":fals'
+    'e},"protocol":{"type":"int","required":false},"seq_num":{"type":"int","required":false},"tos":{"type":"str","required":false},"dst":{"type":"str","req'
+    'uired":false},"end_port":{"type":"int","required":false},"comments":{"type":"str","required":false},"output_device":{"type":"str","required":false},"s'
+    'tart_port":{"type":"int","required":false},"input_device":{"type":"str","required":false},"gateway":{"type":"str","required":false},"tos_mask":{"type"'
+    ':"str","required":false}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"rule":{"type":"list","children":{"le":{"type":"integer","revisions":[2047'
+    ',2047]},"prefix":{"type":"string","revisions":[2047,2047]},"ge":{"type":"integer","revisions":[2047,2047]},"flags":{"type":"integer","revisions":[2047'
+    ',1023]},"action":{"type":"string","options":[{"value":"permit","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,20'
+    '47]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]}},"revisions":[2047'
+    ',2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"rule":{"type":"list","required":false,"options":{"le":{"type":"int"'
+    ',"required":false},"prefix":{"type":"str","required":false},"ge":{"type":"int","required":false},"flags":{"type":"int","required":false},"action":{"ty'
+    'pe":"str","required":false,"choices":["permit","deny"]},"id":{"type":"int","required":false}}},"comments":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"rule":{"type":"list","children":{"le":{"type":"integer","revisions":[2047'
+    ',2047]},"prefix6":{"type":"string","revisions":[2047,2047]},"ge":{"type":"integer","revisions":[2047,2047]},"flags":{"type":"integer","revisions":[204'
+    '7,2047]},"action":{"type":"string","options":[{"value":"permit","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]}},"revisions":[204'
+    '7,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"rule":{"type":"list","required":false,"options":{"le":{"type":"int"'
+    ',"required":false},"prefix6":{"type":"str","required":false},"ge":{"type":"int","required":false},"flags":{"type":"int","required":false},"action":{"t'
+    'ype":"str","required":false,"choices":["permit","deny"]},"id":{"type":"int","required":false}}},"comments":{"type":"str","required":false}}}'
+)
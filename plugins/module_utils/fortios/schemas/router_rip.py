@@ -0,0 +1,56 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"distance":{"type":"list","children":{"distance":{"type":"integer","revisions":[2047,2047]},"prefix":{"type":"string","revi'
+    'sions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"access_list":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},'
+    '"redistribute":{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"metric":{"type":"integer","revisions":[2047,2047]},"routemap":{"type":"string","revisions":[2047,2047]},"na'
+    'me":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"distribute_list":{"type":"list","children":{"status":{"type":"string","option'
+    's":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"listname":{"type":"string","revi'
+    'sions":[2047,2047]},"direction":{"type":"string","options":[{"value":"in","revisions":[2047,2047]},{"value":"out","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"neighb'
+    'or":{"type":"list","children":{"ip":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]'
+    '},"default_metric":{"type":"integer","revisions":[2047,2047]},"garbage_timer":{"type":"integer","revisions":[2047,2047]},"update_timer":{"type":"integ'
+    'er","revisions":[2047,2047]},"max_out_metric":{"type":"integer","revisions":[2047,2047]},"network":{"type":"list","children":{"prefix":{"type":"string'
+    '","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"default_information_originate":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"version":{"type":"string"'
+    ',"options":[{"value":"1","revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]}],"revisions":[2047,2047]},"passive_interface":{"type":"list","'
+    'children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"recv_buffer_size":{"type":"integer","revisions":[2047,2047]},"i'
+    'nterface":{"type":"list","children":{"auth_keychain":{"type":"string","revisions":[2047,2047]},"receive_version":{"multiple_values":true,"type":"list"'
+    ',"options":[{"value":"1","revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":'
+    '[2047,2047]},"split_horizon_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"split_horizon":{"type":"string","options":[{"value":"poisoned","revisions":[2047,2047]},{"value":"regular","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"auth_mode":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047'
+    ',2047]},{"value":"md5","revisions":[2047,2047]}],"revisions":[2047,2047]},"send_version":{"multiple_values":true,"type":"list","options":[{"value":"1"'
+    ',"revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]}],"revisions":[2047,2047]},"send_version2_broadcast":{"type":"string","options":[{"valu'
+    'e":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_string":{"type":"string","revisions":'
+    '[2047,2047]},"flags":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"timeout_timer":{"type":"integer","revisions":[2047,2047]},"'
+    'offset_list":{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"direction":{"type":"string","options":[{"value":"in","revisions":[2047,2047]},{"value":"out","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"access_list":{"type":"string","revisions":[2047,2047]},"offset":{"type":"integer","revisions":[2047,2047]},"interf'
+    'ace":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"distance":{"type":"list","required":false,"options":{"distance":{"type":"int","required":false},"prefix":{'
+    '"type":"str","required":false},"id":{"type":"int","required":false},"access_list":{"type":"str","required":false}}},"redistribute":{"type":"list","req'
+    'uired":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"metric":{"type":"int","required":false},"routemap":{"'
+    'type":"str","required":false},"name":{"type":"str","required":false}}},"distribute_list":{"type":"list","required":false,"options":{"status":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"listname":{"type":"str","required":false},"direction":{"type":"str","required":false,"choices":'
+    '["in","out"]},"interface":{"type":"str","required":false},"id":{"type":"int","required":false}}},"neighbor":{"type":"list","required":false,"options":'
+    '{"ip":{"type":"str","required":false},"id":{"type":"int","required":false}}},"default_metric":{"type":"int","required":false},"garbage_timer":{"type":'
+    '"int","required":false},"update_timer":{"type":"int","required":false},"max_out_metric":{"type":"int","required":false},"network":{"type":"list","requ'
+    'ired":false,"options":{"prefix":{"type":"str","required":false},"id":{"type":"int","required":false}}},"default_information_originate":{"type":"str","'
+    'required":false,"choices":["enable","disable"]},"version":{"type":"str","required":false,"choices":["1","2"]},"passive_interface":{"type":"list","requ'
+    'ired":false,"options":{"name":{"type":"str","required":false}}},"recv_buffer_size":{"type":"int","required":false},"interface":{"type":"list","require'
+    'd":false,"options":{"auth_keychain":{"type":"str","required":false},"receive_version":{"type":"list","required":false,"choices":["1","2"]},"name":{"ty'
+    'pe":"str","required":false},"split_horizon_status":{"type":"str","required":false,"choices":["enable","disable"]},"split_horizon":{"type":"str","requi'
+    'red":false,"choices":["poisoned","regular"]},"auth_mode":{"type":"str","required":false,"choices":["none","text","md5"]},"send_version":{"type":"list"'
+    ',"required":false,"choices":["1","2"]},"send_version2_broadcast":{"type":"str","required":false,"choices":["disable","enable"]},"auth_string":{"type":'
+    '"str","required":false},"flags":{"type":"int","required":false}}},"timeout_timer":{"type":"int","required":false},"offset_list":{"type":"list","requir'
+    'ed":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"direction":{"type":"str","required":false,"choices":["in'
+    '","out"]},"access_list":{"type":"str","required":false},"offset":{"type":"int","required":false},"interface":{"type":"str","required":false},"id":{"ty'
+    'pe":"int","required":false}}}}}'
+)
@@ -0,0 +1,49 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"distance":{"type":"list","children":{"distance":{"type":"integer","revisions":[2047,2047]},"prefix6":{"type":"string","rev'
+    'isions":[2047,2047]},"access_list6":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]'
+    '},"redistribute":{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisi'
+    'ons":[2047,2047]}],"revisions":[2047,2047]},"metric":{"type":"integer","revisions":[2047,2047]},"routemap":{"type":"string","revisions":[2047,2047]},"'
+    'name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"distribute_list":{"type":"list","children":{"status":{"type":"string","opti'
+    'ons":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"listname":{"type":"string","re'
+    'visions":[2047,2047]},"direction":{"type":"string","options":[{"value":"in","revisions":[2047,2047]},{"value":"out","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"neig'
+    'hbor":{"type":"list","children":{"interface":{"type":"string","revisions":[2047,2047]},"ip6":{"type":"string","revisions":[2047,2047]},"id":{"type":"i'
+    'nteger","revisions":[2047,2047]}},"revisions":[2047,2047]},"default_metric":{"type":"integer","revisions":[2047,2047]},"garbage_timer":{"type":"intege'
+    'r","revisions":[2047,2047]},"update_timer":{"type":"integer","revisions":[2047,2047]},"aggregate_address":{"type":"list","children":{"id":{"type":"int'
+    'eger","revisions":[2047,2047]},"prefix6":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"max_out_metric":{"type":"integer","revis'
+    'ions":[2047,2047]},"network":{"type":"list","children":{"prefix":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,20'
+    '47]}},"revisions":[2047,2047]},"default_information_originate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disabl'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"passive_interface":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}}'
+    ',"revisions":[2047,2047]},"interface":{"type":"list","children":{"split_horizon_status":{"type":"string","options":[{"value":"enable","revisions":[204'
+    '7,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"flags":{"type":"integer","revisions":[2047,2047]},"split_horizon":{"ty'
+    'pe":"string","options":[{"value":"poisoned","revisions":[2047,2047]},{"value":"regular","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"ty'
+    'pe":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"timeout_timer":{"type":"integer","revisions":[2047,2047]},"offset_list":{"type":"list'
+    '","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"direction":{"type":"string","options":[{"value":"in","revisions":[2047,2047]},{"value":"out","revisions":[2047,2047]}],"revisions":[204'
+    '7,2047]},"access_list6":{"type":"string","revisions":[2047,2047]},"offset":{"type":"integer","revisions":[2047,2047]},"interface":{"type":"string","re'
+    'visions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"distance":{"type":"list","required":false,"options":{"distance":{"type":"int","required":false},"prefix6":'
+    '{"type":"str","required":false},"access_list6":{"type":"str","required":false},"id":{"type":"int","required":false}}},"redistribute":{"type":"list","r'
+    'equired":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"metric":{"type":"int","required":false},"routemap":'
+    '{"type":"str","required":false},"name":{"type":"str","required":false}}},"distribute_list":{"type":"list","required":false,"options":{"status":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]},"listname":{"type":"str","required":false},"direction":{"type":"str","required":false,"choices'
+    '":["in","out"]},"interface":{"type":"str","required":false},"id":{"type":"int","required":false}}},"neighbor":{"type":"list","required":false,"options'
+    '":{"interface":{"type":"str","required":false},"ip6":{"type":"str","required":false},"id":{"type":"int","required":false}}},"default_metric":{"type":"'
+    'int","required":false},"garbage_timer":{"type":"int","required":false},"update_timer":{"type":"int","required":false},"aggregate_address":{"type":"lis'
+    't","required":false,"options":{"id":{"type":"int","required":false},"prefix6":{"type":"str","required":false}}},"max_out_metric":{"type":"int","requir'
+    'ed":false},"network":{"type":"list","required":false,"options":{"prefix":{"type":"str","required":false},"id":{"type":"int","required":false}}},"defau'
+    'lt_information_originate":{"type":"str","required":false,"choices":["enable","disable"]},"passive_interface":{"type":"list","required":false,"options"'
+    ':{"name":{"type":"str","required":false}}},"interface":{"type":"list","required":false,"options":{"split_horizon_status":{"type":"str","required":fals'
+    'e,"choices":["enable","disable"]},"flags":{"type":"int","required":false},"split_horizon":{"type":"str","required":false,"choices":["poisoned","regula'
+    'r"]},"name":{"type":"str","required":false}}},"timeout_timer":{"type":"int","required":false},"offset_list":{"type":"list","required":false,"options":'
+    '{"status":{"type":"str","required":false,"choices":["enable","disable"]},"direction":{"type":"str","required":false,"choices":["in","out"]},"access_li'
+    'st6":{"type":"str","required":false},"offset":{"type":"int","required":false},"interface":{"type":"str","required":false},"id":{"type":"int","required'
+    '":false}}}}}'
+)
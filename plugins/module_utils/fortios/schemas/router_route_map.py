@@ -0,0 +1,58 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"rule":{"type":"list","children":{"match_interface":{"type":"string","revi'
+    'sions":[2047,2047]},"set_dampening_suppress":{"type":"integer","revisions":[2047,2047]},"set_metric_type":{"type":"string","options":[{"value":"1","re'
+    'visions":[2047,1023]},{"value":"2","revisions":[2047,1023]},{"value":"none","revisions":[2047,2047]},{"value":"external-type1","revisions":[1024,1024]'
+    '},{"value":"external-type2","revisions":[1024,1024]}],"revisions":[2047,2047]},"set_ip6_nexthop_local":{"type":"string","revisions":[2047,2047]},"set_'
+    'ip_nexthop":{"type":"string","revisions":[2047,2047]},"match_origin":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"eg'
+    'p","revisions":[2047,2047]},{"value":"igp","revisions":[2047,2047]},{"value":"incomplete","revisions":[2047,2047]}],"revisions":[2047,2047]},"set_damp'
+    'ening_reachability_half_life":{"type":"integer","revisions":[2047,2047]},"set_community_delete":{"type":"string","revisions":[2047,2047]},"id":{"type"'
+    ':"integer","revisions":[2047,2047]},"set_community":{"type":"list","children":{"community":{"type":"string","revisions":[2047,2047]}},"revisions":[204'
+    '7,2047]},"set_extcommunity_rt":{"type":"list","children":{"community":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"set_dampeni'
+    'ng_unreachability_half_life":{"type":"integer","revisions":[2047,2047]},"match_community":{"type":"string","revisions":[2047,2047]},"set_community_add'
+    'itive":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"s'
+    'et_atomic_aggregate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"set_weight":{"type":"integer","revisions":[2047,2047]},"set_flags":{"type":"integer","revisions":[2047,1023]},"set_aggregator_ip":{"type"'
+    ':"string","revisions":[2047,2047]},"match_ip_nexthop":{"type":"string","revisions":[2047,2047]},"set_metric":{"type":"integer","revisions":[2047,2047]'
+    '},"match_flags":{"type":"integer","revisions":[2047,1023]},"set_route_tag":{"type":"integer","revisions":[2047,2047]},"set_extcommunity_soo":{"type":"'
+    'list","children":{"community":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"set_aggregator_as":{"type":"integer","revisions":[2'
+    '047,2047]},"match_ip_address":{"type":"string","revisions":[2047,2047]},"set_local_preference":{"type":"integer","revisions":[2047,2047]},"match_route'
+    '_type":{"type":"string","options":[{"value":"1","revisions":[2047,1023]},{"value":"2","revisions":[2047,1023]},{"value":"none","revisions":[2047,2047]'
+    '},{"value":"external-type1","revisions":[1024,1024]},{"value":"external-type2","revisions":[1024,1024]}],"revisions":[2047,2047]},"set_dampening_reuse'
+    '":{"type":"integer","revisions":[2047,2047]},"set_aspath":{"type":"list","children":{"as":{"type":"string","revisions":[2047,2047]}},"revisions":[2047'
+    ',2047]},"set_originator_id":{"type":"string","revisions":[2047,2047]},"match_metric":{"type":"integer","revisions":[2047,2047]},"set_origin":{"type":"'
+    'string","options":[{"value":"none","revisions":[2047,2047]},{"value":"egp","revisions":[2047,2047]},{"value":"igp","revisions":[2047,2047]},{"value":"'
+    'incomplete","revisions":[2047,2047]}],"revisions":[2047,2047]},"match_as_path":{"type":"string","revisions":[2047,2047]},"set_aspath_action":{"type":"'
+    'string","options":[{"value":"prepend","revisions":[2047,2047]},{"value":"replace","revisions":[2047,2047]}],"revisions":[2047,2047]},"set_dampening_ma'
+    'x_suppress":{"type":"integer","revisions":[2047,2047]},"set_ip6_nexthop":{"type":"string","revisions":[2047,2047]},"set_tag":{"type":"integer","revisi'
+    'ons":[2047,2047]},"match_ip6_nexthop":{"type":"string","revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"permit","revisions":[20'
+    '47,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"match_ip6_address":{"type":"string","revisions":[2047,2047]},"match_comm'
+    'unity_exact":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"match_vrf":{"type":"integer","revisions":[1920,1920]},"match_tag":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"comments"'
+    ':{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"rule":{"type":"list","required":false,"options":{"match_interface":'
+    '{"type":"str","required":false},"set_dampening_suppress":{"type":"int","required":false},"set_metric_type":{"type":"str","required":false},"set_ip6_ne'
+    'xthop_local":{"type":"str","required":false},"set_ip_nexthop":{"type":"str","required":false},"match_origin":{"type":"str","required":false,"choices":'
+    '["none","egp","igp","incomplete"]},"set_dampening_reachability_half_life":{"type":"int","required":false},"set_community_delete":{"type":"str","requir'
+    'ed":false},"id":{"type":"int","required":false},"set_community":{"type":"list","required":false,"options":{"community":{"type":"str","required":false}'
+    '}},"set_extcommunity_rt":{"type":"list","required":false,"options":{"community":{"type":"str","required":false}}},"set_dampening_unreachability_half_l'
+    'ife":{"type":"int","required":false},"match_community":{"type":"str","required":false},"set_community_additive":{"type":"str","required":false,"choice'
+    's":["enable","disable"]},"set_atomic_aggregate":{"type":"str","required":false,"choices":["enable","disable"]},"set_weight":{"type":"int","required":f'
+    'alse},"set_flags":{"type":"int","required":false},"set_aggregator_ip":{"type":"str","required":false},"match_ip_nexthop":{"type":"str","required":fals'
+    'e},"set_metric":{"type":"int","required":false},"match_flags":{"type":"int","required":false},"set_route_tag":{"type":"int","required":false},"set_ext'
+    'community_soo":{"type":"list","required":false,"options":{"community":{"type":"str","required":false}}},"set_aggregator_as":{"type":"int","required":f'
+    'alse},"match_ip_address":{"type":"str","required":false},"set_local_preference":{"type":"int","required":false},"match_route_type":{"type":"str","requ'
+    'ired":false},"set_dampening_reuse":{"type":"int","required":false},"set_aspath":{"type":"list","required":false,"options":{"as":{"type":"str","require'
+    'd":false}}},"set_originator_id":{"type":"str","required":false},"match_metric":{"type":"int","required":false},"set_origin":{"type":"str","required":f'
+    'alse,"choices":["none","egp","igp","incomplete"]},"match_as_path":{"type":"str","required":false},"set_aspath_action":{"type":"str","required":false,"'
+    'choices":["prepend","replace"]},"set_dampening_max_suppress":{"type":"int","required":false},"set_ip6_nexthop":{"type":"str","required":false},"set_ta'
+    'g":{"type":"int","required":false},"match_ip6_nexthop":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["permit","de'
+    'ny"]},"match_ip6_address":{"type":"str","required":false},"match_community_exact":{"type":"str","required":false,"choices":["enable","disable"]},"matc'
+    'h_vrf":{"type":"int","required":false},"match_tag":{"type":"int","required":false}}},"comments":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,31 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"pimsm_debug_joinprune_flags":{"type":"string","revisions":[2032,16]},"igmp_debug_flags":{"type":"string","revisions":[2032'
+    ',16]},"ospf_debug_nfsm_flags":{"type":"string","revisions":[2032,16]},"ospf_debug_packet_flags":{"type":"string","revisions":[2032,16]},"ospf6_debug_l'
+    'sa_flags":{"type":"string","revisions":[2032,16]},"ospf_debug_nsm_flags":{"type":"string","revisions":[2032,16]},"ospf6_debug_nsm_flags":{"type":"stri'
+    'ng","revisions":[2032,16]},"ospf_debug_events_flags":{"type":"string","revisions":[2032,16]},"hostname":{"type":"string","revisions":[2047,2047]},"bgp'
+    '_debug_flags":{"type":"string","revisions":[2032,16]},"rip_debug_flags":{"type":"string","revisions":[2032,16]},"ospf_debug_ifsm_flags":{"type":"strin'
+    'g","revisions":[2032,16]},"ospf_debug_route_flags":{"type":"string","revisions":[2032,16]},"ospf6_debug_route_flags":{"type":"string","revisions":[203'
+    '2,16]},"ospf6_debug_nfsm_flags":{"type":"string","revisions":[2032,16]},"ospf_debug_lsa_flags":{"type":"string","revisions":[2032,16]},"pimsm_debug_si'
+    'mple_flags":{"type":"string","revisions":[2032,16]},"ripng_debug_flags":{"type":"string","revisions":[2032,16]},"pimsm_debug_timer_flags":{"type":"str'
+    'ing","revisions":[2032,16]},"ospf6_debug_events_flags":{"type":"string","revisions":[2032,16]},"imi_debug_flags":{"type":"string","revisions":[2032,16'
+    ']},"ospf6_debug_packet_flags":{"type":"string","revisions":[2032,16]},"isis_debug_flags":{"type":"string","revisions":[2032,16]},"show_filter":{"type"'
+    ':"string","revisions":[2047,2047]},"pimdm_debug_flags":{"type":"string","revisions":[2032,16]},"ospf6_debug_ifsm_flags":{"type":"string","revisions":['
+    '2032,16]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"pimsm_debug_joinprune_flags":{"type":"str","required":false},"igmp_debug_flags":{"type":"str","required":f'
+    'alse},"ospf_debug_nfsm_flags":{"type":"str","required":false},"ospf_debug_packet_flags":{"type":"str","required":false},"ospf6_debug_lsa_flags":{"type'
+    '":"str","required":false},"ospf_debug_nsm_flags":{"type":"str","required":false},"ospf6_debug_nsm_flags":{"type":"str","required":false},"ospf_debug_e'
+    'vents_flags":{"type":"str","required":false},"hostname":{"type":"str","required":false},"bgp_debug_flags":{"type":"str","required":false},"rip_debug_f'
+    'lags":{"type":"str","required":false},"ospf_debug_ifsm_flags":{"type":"str","required":false},"ospf_debug_route_flags":{"type":"str","required":false}'
+    ',"ospf6_debug_route_flags":{"type":"str","required":false},"ospf6_debug_nfsm_flags":{"type":"str","required":false},"ospf_debug_lsa_flags":{"type":"st'
+    'r","required":false},"pimsm_debug_simple_flags":{"type":"str","required":false},"ripng_debug_flags":{"type":"str","required":false},"pimsm_debug_timer'
+    '_flags":{"type":"str","required":false},"ospf6_debug_events_flags":{"type":"str","required":false},"imi_debug_flags":{"type":"str","required":false},"'
+    'ospf6_debug_packet_flags":{"type":"str","required":false},"isis_debug_flags":{"type":"str","required":false},"show_filter":{"type":"str","required":fa'
+    'lse},"pimdm_debug_flags":{"type":"str","required":false},"ospf6_debug_ifsm_flags":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,30 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"src":{"type":"string","revisions":[2047,2047]},"vrf":{"type":"integer","revisions":[2047,2047]},"dynamic_gateway":{"type":'
+    '"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"weight":{"type":'
+    '"integer","revisions":[2047,2047]},"distance":{"type":"integer","revisions":[2047,2047]},"sdwan":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"dst":{"type":"string","revisions":[2047,2047]},"seq_num":{"ty'
+    'pe":"integer","revisions":[2047,2047]},"comment":{"type":"string","revisions":[2047,2047]},"priority":{"type":"integer","revisions":[2047,2047]},"virt'
+    'ual_wan_link":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},'
+    '"internet_service_custom":{"type":"string","revisions":[2047,2047]},"blackhole":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]}'
+    ',{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"device":{"type":"string","revisions":[2047,2047]},"bfd":{"type":"string","opti'
+    'ons":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dstaddr":{"type":"string","rev'
+    'isions":[2047,2047]},"link_monitor_exempt":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"gateway":{"type":"string","revisions":[2047,2047]},"internet_service":{"type":"integer","revisions":[2047,2047]}},"'
+    'revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"src":{"type":"str","required":fals'
+    'e},"vrf":{"type":"int","required":false},"dynamic_gateway":{"type":"str","required":false,"choices":["enable","disable"]},"weight":{"type":"int","requ'
+    'ired":false},"distance":{"type":"int","required":false},"sdwan":{"type":"str","required":false,"choices":["enable","disable"]},"dst":{"type":"str","re'
+    'quired":false},"seq_num":{"type":"int","required":false},"comment":{"type":"str","required":false},"priority":{"type":"int","required":false},"virtual'
+    '_wan_link":{"type":"str","required":false},"internet_service_custom":{"type":"str","required":false},"blackhole":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"device":{"type":"str","required":false},"bfd":{"type":"str","required":false,"choices":["enable","disable"]},"dstaddr":{"ty'
+    'pe":"str","required":false},"link_monitor_exempt":{"type":"str","required":false,"choices":["enable","disable"]},"gateway":{"type":"str","required":fa'
+    'lse},"internet_service":{"type":"int","required":false}}}'
+)
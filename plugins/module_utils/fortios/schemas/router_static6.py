@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"distance":{"type":"integer","revisions":[2047,2047]},"dynamic_gateway":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"devindex":{"type":"integer","revisions":[2047,2047]},"sdwan'
+    '":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"dst":{'
+    '"type":"string","revisions":[2047,2047]},"bfd":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"seq_num":{"type":"integer","revisions":[2047,2047]},"priority":{"type":"integer","revisions":[2047,2047]},"virt'
+    'ual_wan_link":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},'
+    '"blackhole":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"device":{"type":"string","revisions":[2047,2047]},"link_monitor_exempt":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"v'
+    'alue":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"gateway":{"type":"string","revisions":[2047,2047]},"comment":{"type":"string","rev'
+    'isions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"distance":{"type":"int","required"'
+    ':false},"dynamic_gateway":{"type":"str","required":false,"choices":["enable","disable"]},"devindex":{"type":"int","required":false},"sdwan":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"dst":{"type":"str","required":false},"bfd":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]},"seq_num":{"type":"int","required":false},"priority":{"type":"int","required":false},"virtual_wan_link":{"type":"str","required":false},"bla'
+    'ckhole":{"type":"str","required":false,"choices":["enable","disable"]},"device":{"type":"str","required":false},"link_monitor_exempt":{"type":"str","r'
+    'equired":false,"choices":["enable","disable"]},"gateway":{"type":"str","required":false},"comment":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[7,7]},"entries":{"type":"list","children":{"status":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"pattern_type":{"type":"string","options":[{"value":"wildc'
+    'ard","revisions":[7,7]},{"value":"regexp","revisions":[7,7]}],"revisions":[7,7]},"ip4_subnet":{"type":"string","revisions":[7,7]},"email_pattern":{"ty'
+    'pe":"string","revisions":[7,7]},"id":{"type":"integer","revisions":[7,7]},"ip6_subnet":{"type":"string","revisions":[7,7]},"action":{"type":"string","'
+    'options":[{"value":"reject","revisions":[7,7]},{"value":"spam","revisions":[7,7]},{"value":"clear","revisions":[7,7]}],"revisions":[7,7]},"type":{"typ'
+    'e":"string","options":[{"value":"ip","revisions":[7,7]},{"value":"email","revisions":[7,7]}],"revisions":[7,7]},"addr_type":{"type":"string","options"'
+    ':[{"value":"ipv4","revisions":[7,7]},{"value":"ipv6","revisions":[7,7]}],"revisions":[7,7]}},"revisions":[7,7]},"id":{"type":"integer","revisions":[7,'
+    '7]},"name":{"type":"string","revisions":[7,7]}},"revisions":[7,7]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"status":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"pattern_type":{"type":"str","required":false,"choices":["wildcard","regexp"]},"ip4_subnet'
+    '":{"type":"str","required":false},"email_pattern":{"type":"str","required":false},"id":{"type":"int","required":false},"ip6_subnet":{"type":"str","req'
+    'uired":false},"action":{"type":"str","required":false,"choices":["reject","spam","clear"]},"type":{"type":"str","required":false,"choices":["ip","emai'
+    'l"]},"addr_type":{"type":"str","required":false,"choices":["ipv4","ipv6"]}}},"id":{"type":"int","required":false},"name":{"type":"str","required":fals'
+    'e}}}'
+)
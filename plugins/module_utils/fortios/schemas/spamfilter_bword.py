@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[7,7]},"entries":{"type":"list","children":{"status":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"pattern_type":{"type":"string","options":[{"value":"wildc'
+    'ard","revisions":[7,7]},{"value":"regexp","revisions":[7,7]}],"revisions":[7,7]},"language":{"type":"string","options":[{"value":"western","revisions"'
+    ':[7,7]},{"value":"simch","revisions":[7,7]},{"value":"trach","revisions":[7,7]},{"value":"japanese","revisions":[7,7]},{"value":"korean","revisions":['
+    '7,7]},{"value":"french","revisions":[7,7]},{"value":"thai","revisions":[7,7]},{"value":"spanish","revisions":[7,7]}],"revisions":[7,7]},"pattern":{"ty'
+    'pe":"string","revisions":[7,7]},"score":{"type":"integer","revisions":[7,7]},"action":{"type":"string","options":[{"value":"spam","revisions":[7,7]},{'
+    '"value":"clear","revisions":[7,7]}],"revisions":[7,7]},"where":{"type":"string","options":[{"value":"subject","revisions":[7,7]},{"value":"body","revi'
+    'sions":[7,7]},{"value":"all","revisions":[7,7]}],"revisions":[7,7]},"id":{"type":"integer","revisions":[7,7]}},"revisions":[7,7]},"id":{"type":"intege'
+    'r","revisions":[7,7]},"name":{"type":"string","revisions":[7,7]}},"revisions":[7,7]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"status":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"pattern_type":{"type":"str","required":false,"choices":["wildcard","regexp"]},"language":'
+    '{"type":"str","required":false,"choices":["western","simch","trach","japanese","korean","french","thai","spanish"]},"pattern":{"type":"str","required"'
+    ':false},"score":{"type":"int","required":false},"action":{"type":"str","required":false,"choices":["spam","clear"]},"where":{"type":"str","required":f'
+    'alse,"choices":["subject","body","all"]},"id":{"type":"int","required":false}}},"id":{"type":"int","required":false},"name":{"type":"str","required":f'
+    'alse}}}'
+)
@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[7,7]},"entries":{"type":"list","children":{"status":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"ip6_subnet":{"type":"string","revisions":[7,7]},"ip4_subn'
+    'et":{"type":"string","revisions":[7,7]},"addr_type":{"type":"string","options":[{"value":"ipv4","revisions":[7,7]},{"value":"ipv6","revisions":[7,7]}]'
+    ',"revisions":[7,7]},"id":{"type":"integer","revisions":[7,7]}},"revisions":[7,7]},"id":{"type":"integer","revisions":[7,7]},"name":{"type":"string","r'
+    'evisions":[7,7]}},"revisions":[7,7]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"status":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"ip6_subnet":{"type":"str","required":false},"ip4_subnet":{"type":"str","required":false},'
+    '"addr_type":{"type":"str","required":false,"choices":["ipv4","ipv6"]},"id":{"type":"int","required":false}}},"id":{"type":"int","required":false},"nam'
+    'e":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[7,7]},"entries":{"type":"list","children":{"status":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"fieldbody":{"type":"string","revisions":[7,7]},"pattern_t'
+    'ype":{"type":"string","options":[{"value":"wildcard","revisions":[7,7]},{"value":"regexp","revisions":[7,7]}],"revisions":[7,7]},"fieldname":{"type":"'
+    'string","revisions":[7,7]},"action":{"type":"string","options":[{"value":"spam","revisions":[7,7]},{"value":"clear","revisions":[7,7]}],"revisions":[7'
+    ',7]},"id":{"type":"integer","revisions":[7,7]}},"revisions":[7,7]},"id":{"type":"integer","revisions":[7,7]},"name":{"type":"string","revisions":[7,7]'
+    '}},"revisions":[7,7]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"status":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"fieldbody":{"type":"str","required":false},"pattern_type":{"type":"str","required":false,'
+    '"choices":["wildcard","regexp"]},"fieldname":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["spam","clear"]},"id":'
+    '{"type":"int","required":false}}},"id":{"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,58 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[7,7]},"spam_bword_threshold":{"type":"integer","revisions":[7,7]},"spam_iptrust_tab'
+    'le":{"type":"integer","revisions":[7,7]},"spam_log_fortiguard_response":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value":"en'
+    'able","revisions":[7,7]}],"revisions":[7,7]},"smtp":{"type":"dict","children":{"local_override":{"type":"string","options":[{"value":"disable","revisi'
+    'ons":[7,7]},{"value":"enable","revisions":[7,7]}],"revisions":[7,7]},"hdrip":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value'
+    '":"enable","revisions":[7,7]}],"revisions":[7,7]},"log":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions'
+    '":[7,7]}],"revisions":[7,7]},"action":{"type":"string","options":[{"value":"pass","revisions":[7,7]},{"value":"tag","revisions":[7,7]},{"value":"disca'
+    'rd","revisions":[7,7]}],"revisions":[7,7]},"tag_msg":{"type":"string","revisions":[7,7]},"tag_type":{"type":"list","options":[{"value":"subject","revi'
+    'sions":[7,7]},{"value":"header","revisions":[7,7]},{"value":"spaminfo","revisions":[7,7]}],"revisions":[7,7]}},"revisions":[7,7]},"replacemsg_group":{'
+    '"type":"string","revisions":[7,7]},"gmail":{"type":"dict","children":{"log":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":'
+    '"disable","revisions":[7,7]}],"revisions":[7,7]}},"revisions":[7,7]},"spam_mheader_table":{"type":"integer","revisions":[7,7]},"spam_rbl_table":{"type'
+    '":"integer","revisions":[7,7]},"mapi":{"type":"dict","children":{"action":{"type":"string","options":[{"value":"pass","revisions":[7,7]},{"value":"dis'
+    'card","revisions":[7,7]}],"revisions":[7,7]},"log":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,'
+    '7]}],"revisions":[7,7]}},"revisions":[7,7]},"spam_bword_table":{"type":"integer","revisions":[7,7]},"yahoo_mail":{"type":"dict","children":{"log":{"ty'
+    'pe":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]}},"revisions":[7,7]},"msn_hotmai'
+    'l":{"type":"dict","children":{"log":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions'
+    '":[7,7]}},"revisions":[7,7]},"flow_based":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"rev'
+    'isions":[7,7]},"pop3":{"type":"dict","children":{"action":{"type":"string","options":[{"value":"pass","revisions":[7,7]},{"value":"tag","revisions":[7'
+    ',7]}],"revisions":[7,7]},"tag_msg":{"type":"string","revisions":[7,7]},"log":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value"'
+    ':"disable","revisions":[7,7]}],"revisions":[7,7]},"tag_type":{"type":"list","options":[{"value":"subject","revisions":[7,7]},{"value":"header","revisi'
+    'ons":[7,7]},{"value":"spaminfo","revisions":[7,7]}],"revisions":[7,7]}},"revisions":[7,7]},"external":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"imap":{"type":"dict","children":{"action":{"type":"string","options":[{"va'
+    'lue":"pass","revisions":[7,7]},{"value":"tag","revisions":[7,7]}],"revisions":[7,7]},"tag_msg":{"type":"string","revisions":[7,7]},"log":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[7,7]},"tag_type":{"type":"list","options":[{"v'
+    'alue":"subject","revisions":[7,7]},{"value":"header","revisions":[7,7]},{"value":"spaminfo","revisions":[7,7]}],"revisions":[7,7]}},"revisions":[7,7]}'
+    ',"spam_log":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value":"enable","revisions":[7,7]}],"revisions":[7,7]},"name":{"type":'
+    '"string","revisions":[7,7]},"spam_filtering":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"'
+    'revisions":[7,7]},"options":{"type":"list","options":[{"value":"bannedword","revisions":[7,7]},{"value":"spambwl","revisions":[7,7]},{"value":"spamfsi'
+    'p","revisions":[7,7]},{"value":"spamfssubmit","revisions":[7,7]},{"value":"spamfschksum","revisions":[7,7]},{"value":"spamfsurl","revisions":[7,7]},{"'
+    'value":"spamhelodns","revisions":[7,7]},{"value":"spamraddrdns","revisions":[7,7]},{"value":"spamrbl","revisions":[7,7]},{"value":"spamhdrcheck","revi'
+    'sions":[7,7]},{"value":"spamfsphish","revisions":[7,7]}],"revisions":[7,7]},"spam_bwl_table":{"type":"integer","revisions":[7,7]}},"revisions":[7,7]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"spam_bword_threshold":{"type":"int","required":false},"spam_iptr'
+    'ust_table":{"type":"int","required":false},"spam_log_fortiguard_response":{"type":"str","required":false,"choices":["disable","enable"]},"smtp":{"type'
+    '":"dict","required":false,"options":{"local_override":{"type":"str","required":false,"choices":["disable","enable"]},"hdrip":{"type":"str","required":'
+    'false,"choices":["disable","enable"]},"log":{"type":"str","required":false,"choices":["enable","disable"]},"action":{"type":"str","required":false,"ch'
+    'oices":["pass","tag","discard"]},"tag_msg":{"type":"str","required":false},"tag_type":{"type":"list","required":false,"choices":["subject","header","s'
+    'paminfo"]}}},"replacemsg_group":{"type":"str","required":false},"gmail":{"type":"dict","required":false,"options":{"log":{"type":"str","required":fals'
+    'e,"choices":["enable","disable"]}}},"spam_mheader_table":{"type":"int","required":false},"spam_rbl_table":{"type":"int","required":false},"mapi":{"typ'
+    'e":"dict","required":false,"options":{"action":{"type":"str","required":false,"choices":["pass","discard"]},"log":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]}}},"spam_bword_table":{"type":"int","required":false},"yahoo_mail":{"type":"dict","required":false,"options":{"log":{"type":'
+    '"str","required":false,"choices":["enable","disable"]}}},"msn_hotmail":{"type":"dict","required":false,"options":{"log":{"type":"str","required":false'
+    ',"choices":["enable","disable"]}}},"flow_based":{"type":"str","required":false,"choices":["enable","disable"]},"pop3":{"type":"dict","required":false,'
+    '"options":{"action":{"type":"str","required":false,"choices":["pass","tag"]},"tag_msg":{"type":"str","required":false},"log":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"tag_type":{"type":"list","required":false,"choices":["subject","header","spaminfo"]}}},"external":{"type":"str"'
+    ',"required":false,"choices":["enable","disable"]},"imap":{"type":"dict","required":false,"options":{"action":{"type":"str","required":false,"choices":'
+    '["pass","tag"]},"tag_msg":{"type":"str","required":false},"log":{"type":"str","required":false,"choices":["enable","disable"]},"tag_type":{"type":"lis'
+    't","required":false,"choices":["subject","header","spaminfo"]}}},"spam_log":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"ty'
+    'pe":"str","required":false},"spam_filtering":{"type":"str","required":false,"choices":["enable","disable"]},"options":{"type":"list","required":false,'
+    '"choices":["bannedword","spambwl","spamfsip","spamfssubmit","spamfschksum","spamfsurl","spamhelodns","spamraddrdns","spamrbl","spamhdrcheck","spamfsph'
+    'ish"]},"spam_bwl_table":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,44 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"shell_commands":{"type":"list","children":{"log":{"type":"string","option'
+    's":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pattern":{"type":"string","revis'
+    'ions":[2047,2047]},"alert":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisi'
+    'ons":[2047,2047]},"action":{"type":"string","options":[{"value":"block","revisions":[2047,2047]},{"value":"allow","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"type":{"type":"string","options":[{"value":"simple","revisions":[2047,2047]},{"value":"regex","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"low","revisions":[2047,2047]},{"value":"me'
+    'dium","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revis'
+    'ions":[2047,2047]},"file_filter":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"di'
+    'sable","revisions":[120,120]}],"revisions":[120,120]},"scan_archive_contents":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"v'
+    'alue":"disable","revisions":[120,120]}],"revisions":[120,120]},"log":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"di'
+    'sable","revisions":[120,120]}],"revisions":[120,120]},"entries":{"type":"list","children":{"comment":{"type":"string","revisions":[120,120]},"directio'
+    'n":{"type":"string","options":[{"value":"incoming","revisions":[120,120]},{"value":"outgoing","revisions":[120,120]},{"value":"any","revisions":[120,1'
+    '20]}],"revisions":[120,120]},"protocol":{"multiple_values":true,"type":"list","options":[{"value":"ssh","revisions":[16,16]}],"revisions":[112,16]},"f'
+    'ile_type":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"password_protected":{"type":"string","opt'
+    'ions":[{"value":"yes","revisions":[120,120]},{"value":"any","revisions":[120,120]}],"revisions":[120,120]},"filter":{"type":"string","revisions":[120,'
+    '120]},"action":{"type":"string","options":[{"value":"log","revisions":[120,120]},{"value":"block","revisions":[120,120]}],"revisions":[120,120]}},"rev'
+    'isions":[120,120]}},"revisions":[2040,120]},"default_command_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"dis'
+    'able","revisions":[2047,2047]}],"revisions":[2047,2047]},"block":{"multiple_values":true,"type":"list","options":[{"value":"x11","revisions":[2047,204'
+    '7]},{"value":"shell","revisions":[2047,2047]},{"value":"exec","revisions":[2047,2047]},{"value":"port-forward","revisions":[2047,2047]},{"value":"tun-'
+    'forward","revisions":[2047,2047]},{"value":"sftp","revisions":[2047,2047]},{"value":"unknown","revisions":[2047,2047]},{"value":"scp","revisions":[204'
+    '0,2040]}],"revisions":[2047,2047]},"log":{"multiple_values":true,"type":"list","options":[{"value":"x11","revisions":[2047,2047]},{"value":"shell","re'
+    'visions":[2047,2047]},{"value":"exec","revisions":[2047,2047]},{"value":"port-forward","revisions":[2047,2047]},{"value":"tun-forward","revisions":[20'
+    '47,2047]},{"value":"sftp","revisions":[2047,2047]},{"value":"unknown","revisions":[2047,2047]},{"value":"scp","revisions":[2040,2040]}],"revisions":[2'
+    '047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"shell_commands":{"type":"list","required":false,"options":{"log":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"pattern":{"type":"str","required":false},"alert":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"action":{"type":"str","required":false,"choices":["block","allow"]},"type":{"type":"str","required":false,"choices":["simple"'
+    ',"regex"]},"id":{"type":"int","required":false},"severity":{"type":"str","required":false,"choices":["low","medium","high","critical"]}}},"file_filter'
+    '":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"scan_archive_contents":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"log":{"type":"str","required":false,"choices":["enable","disable"]},"entries":{"type":"list","r'
+    'equired":false,"options":{"comment":{"type":"str","required":false},"direction":{"type":"str","required":false,"choices":["incoming","outgoing","any"]'
+    '},"protocol":{"type":"list","required":false},"file_type":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"passwor'
+    'd_protected":{"type":"str","required":false,"choices":["yes","any"]},"filter":{"type":"str","required":false},"action":{"type":"str","required":false,'
+    '"choices":["log","block"]}}}}},"default_command_log":{"type":"str","required":false,"choices":["enable","disable"]},"block":{"type":"list","required":'
+    'false},"log":{"type":"list","required":false}}}'
+)
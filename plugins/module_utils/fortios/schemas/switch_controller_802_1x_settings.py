@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"max_reauth_attempt":{"type":"integer","revisions":[2047,2047]},"tx_period":{"type":"integer","revisions":[1920,1920]},"rea'
+    'uth_period":{"type":"integer","revisions":[2047,2047]},"link_down_auth":{"type":"string","options":[{"value":"set-unauth","revisions":[2047,2047]},{"v'
+    'alue":"no-action","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"max_reauth_attempt":{"type":"int","required":false},"tx_period":{"type":"int","required":false},"reauth_pe'
+    'riod":{"type":"int","required":false},"link_down_auth":{"type":"str","required":false,"choices":["set-unauth","no-action"]}}}'
+)
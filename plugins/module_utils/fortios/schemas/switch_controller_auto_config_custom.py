@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"switch_binding":{"type":"list","children":{"policy":{"type":"string","revisions":[2040,2040]},"switch_id":{"type":"string"'
+    ',"revisions":[2040,2040]}},"revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"switch_binding":{"type":"list","required":false,"options":{"policy":{"type":"str","required":false},"switc'
+    'h_id":{"type":"str","required":false}}},"name":{"type":"str","required":false}}}'
+)
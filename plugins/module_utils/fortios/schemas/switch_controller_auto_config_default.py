@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"isl_policy":{"type":"string","revisions":[2040,2040]},"icl_policy":{"type":"string","revisions":[2040,2040]},"fgt_policy":'
+    '{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"isl_policy":{"type":"str","required":false},"icl_policy":{"type":"str","required":false},"fgt_policy":{"ty'
+    'pe":"str","required":false}}}'
+)
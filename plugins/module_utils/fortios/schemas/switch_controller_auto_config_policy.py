@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"igmp_flood_traffic":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":'
+    '[2040,2040]}],"revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]},"storm_control_policy":{"type":"string","revisions":[2040,2040'
+    ']},"qos_policy":{"type":"string","revisions":[2040,2040]},"igmp_flood_report":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{'
+    '"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"poe_status":{"type":"string","options":[{"value":"enable","revisions":[2040,2040'
+    ']},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"igmp_flood_traffic":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","r'
+    'equired":false},"storm_control_policy":{"type":"str","required":false},"qos_policy":{"type":"str","required":false},"igmp_flood_report":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]},"poe_status":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
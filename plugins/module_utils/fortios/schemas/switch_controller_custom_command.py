@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"command":{"type":"string","revisions":[2047,2047]},"description":{"type":"string","revisions":[2047,2047]},"command_name":'
+    '{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"command":{"type":"str","required":false},"description":{"type":"str","required":false},"command_name":{"ty'
+    'pe":"str","required":false}}}'
+)
@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"policy":{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value'
+    '":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"category":{"type":"string","options":[{"value":"device","revisions":[1024,1024]},{"val'
+    'ue":"interface-tag","revisions":[1024,1024]}],"revisions":[1024,1024]},"lldp_profile":{"type":"string","revisions":[1024,1024]},"name":{"type":"string'
+    '","revisions":[1024,1024]},"family":{"type":"string","revisions":[1024,1024]},"interface_tags":{"type":"list","children":{"tag_name":{"type":"string",'
+    '"revisions":[1024,1024]}},"revisions":[1024,1024]},"host":{"type":"string","revisions":[1024,1024]},"mac":{"type":"string","revisions":[1024,1024]},"v'
+    'lan_policy":{"type":"string","revisions":[1024,1024]},"bounce_port_link":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"val'
+    'ue":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"802_1x":{"type":"string","revisions":[1024,1024]},"qos_policy":{"type":"string","revi'
+    'sions":[1024,1024]},"type":{"type":"string","revisions":[1024,1024]},"description":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]}'
+    ',"fortilink":{"type":"string","revisions":[1024,1024]},"name":{"type":"string","revisions":[1024,1024]},"description":{"type":"string","revisions":[10'
+    '24,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"policy":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["ena'
+    'ble","disable"]},"category":{"type":"str","required":false,"choices":["device","interface-tag"]},"lldp_profile":{"type":"str","required":false},"name"'
+    ':{"type":"str","required":false},"family":{"type":"str","required":false},"interface_tags":{"type":"list","required":false,"options":{"tag_name":{"typ'
+    'e":"str","required":false}}},"host":{"type":"str","required":false},"mac":{"type":"str","required":false},"vlan_policy":{"type":"str","required":false'
+    '},"bounce_port_link":{"type":"str","required":false,"choices":["disable","enable"]},"802_1x":{"type":"str","required":false},"qos_policy":{"type":"str'
+    '","required":false},"type":{"type":"str","required":false},"description":{"type":"str","required":false}}},"fortilink":{"type":"str","required":false}'
+    ',"name":{"type":"str","required":false},"description":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,29 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"timeout_tcp_rst":{"type":"integer","revisions":[2040,2040]},"timeout_tcp":{"type":"integer","revisions":[2040,2040]},"time'
+    'out_general":{"type":"integer","revisions":[2040,2040]},"timeout_tcp_fin":{"type":"integer","revisions":[2040,2040]},"level":{"type":"string","options'
+    '":[{"value":"vlan","revisions":[2040,2040]},{"value":"ip","revisions":[2040,2040]},{"value":"port","revisions":[2040,2040]},{"value":"proto","revision'
+    's":[2040,2040]},{"value":"mac","revisions":[2040,2040]}],"revisions":[2040,2040]},"aggregates":{"type":"list","children":{"ip":{"type":"string","revis'
+    'ions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"collector_ip":{"type":"string","revisions":[2040,2040]},'
+    '"timeout_max":{"type":"integer","revisions":[2040,2040]},"sample_rate":{"type":"integer","revisions":[2040,2040]},"transport":{"type":"string","option'
+    's":[{"value":"udp","revisions":[2040,2040]},{"value":"tcp","revisions":[2040,2040]},{"value":"sctp","revisions":[2040,2040]}],"revisions":[2040,2040]}'
+    ',"collector_port":{"type":"integer","revisions":[2040,2040]},"format":{"type":"string","options":[{"value":"netflow1","revisions":[2040,2040]},{"value'
+    '":"netflow5","revisions":[2040,2040]},{"value":"netflow9","revisions":[2040,2040]},{"value":"ipfix","revisions":[2040,2040]}],"revisions":[2040,2040]}'
+    ',"sample_mode":{"type":"string","options":[{"value":"local","revisions":[2040,2040]},{"value":"perimeter","revisions":[2040,2040]},{"value":"device-in'
+    'gress","revisions":[2040,2040]}],"revisions":[2040,2040]},"max_export_pkt_size":{"type":"integer","revisions":[2040,2040]},"timeout_udp":{"type":"inte'
+    'ger","revisions":[2040,2040]},"timeout_icmp":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"timeout_tcp_rst":{"type":"int","required":false},"timeout_tcp":{"type":"int","required":false},"timeout_ge'
+    'neral":{"type":"int","required":false},"timeout_tcp_fin":{"type":"int","required":false},"level":{"type":"str","required":false,"choices":["vlan","ip"'
+    ',"port","proto","mac"]},"aggregates":{"type":"list","required":false,"options":{"ip":{"type":"str","required":false},"id":{"type":"int","required":fal'
+    'se}}},"collector_ip":{"type":"str","required":false},"timeout_max":{"type":"int","required":false},"sample_rate":{"type":"int","required":false},"tran'
+    'sport":{"type":"str","required":false,"choices":["udp","tcp","sctp"]},"collector_port":{"type":"int","required":false},"format":{"type":"str","require'
+    'd":false,"choices":["netflow1","netflow5","netflow9","ipfix"]},"sample_mode":{"type":"str","required":false,"choices":["local","perimeter","device-ing'
+    'ress"]},"max_export_pkt_size":{"type":"int","required":false},"timeout_udp":{"type":"int","required":false},"timeout_icmp":{"type":"int","required":fa'
+    'lse}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"link_down_flush":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[10'
+    '24,1024]}],"revisions":[1024,1024]},"name":{"type":"string","revisions":[1024,1024]},"nac_ports":{"type":"dict","children":{"bounce_nac_port":{"type":'
+    '"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"onboarding_vlan"'
+    ':{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"inactive_timer":{"type":"integer","revisions":[1024,1024]}},"revisions":[1024,10'
+    '24]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"link_down_flush":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","requ'
+    'ired":false},"nac_ports":{"type":"dict","required":false,"options":{"bounce_nac_port":{"type":"str","required":false,"choices":["disable","enable"]},"'
+    'onboarding_vlan":{"type":"str","required":false}}},"inactive_timer":{"type":"int","required":false}}}'
+)
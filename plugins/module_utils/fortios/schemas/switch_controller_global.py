@@ -0,0 +1,37 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"quarantine_mode":{"type":"string","options":[{"value":"by-vlan","revisions":[1920,1920]},{"value":"by-redirect","revisions'
+    '":[1920,1920]}],"revisions":[1920,1920]},"default_virtual_switch_vlan":{"type":"string","revisions":[2047,2047]},"bounce_quarantined_link":{"type":"st'
+    'ring","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"custom_command":{"t'
+    'ype":"list","children":{"command_entry":{"type":"string","revisions":[2040,2040]},"command_name":{"type":"string","revisions":[2040,2040]}},"revisions'
+    '":[2040,2040]},"vlan_all_mode":{"type":"string","options":[{"value":"all","revisions":[2040,2040]},{"value":"defined","revisions":[2040,2040]}],"revis'
+    'ions":[2040,2040]},"mac_aging_interval":{"type":"integer","revisions":[2047,2047]},"mac_event_logging":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"vlan_optimization":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"mac_violation_timer":{"type":"integer","revi'
+    'sions":[2047,2047]},"mac_retention_period":{"type":"integer","revisions":[2047,2047]},"https_image_push":{"type":"string","options":[{"value":"enable"'
+    ',"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_mac_limit_violations":{"type":"string","options":'
+    '[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"allow_multiple_interfaces":{"type":'
+    '"string","options":[{"value":"enable","revisions":[383,383]},{"value":"disable","revisions":[383,383]}],"revisions":[2047,383]},"sn_dns_resolution":{"'
+    'type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"disable_di'
+    'scovery":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"update_user_device":{"multiple_values"'
+    ':true,"type":"list","options":[{"value":"mac-cache","revisions":[1664,1664]},{"value":"lldp","revisions":[1664,1664]},{"value":"dhcp-snooping","revisi'
+    'ons":[1664,1664]},{"value":"l2-db","revisions":[1664,1664]},{"value":"l3-db","revisions":[1664,1664]}],"revisions":[1920,1664]},"fips_enforce":{"type"'
+    ':"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[20'
+    '47,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"quarantine_mode":{"type":"str","required":false,"choices":["by-vlan","by-redirect"]},"default_virtual_swit'
+    'ch_vlan":{"type":"str","required":false},"bounce_quarantined_link":{"type":"str","required":false,"choices":["disable","enable"]},"custom_command":{"t'
+    'ype":"list","required":false,"options":{"command_entry":{"type":"str","required":false},"command_name":{"type":"str","required":false}}},"vlan_all_mod'
+    'e":{"type":"str","required":false,"choices":["all","defined"]},"mac_aging_interval":{"type":"int","required":false},"mac_event_logging":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]},"vlan_optimization":{"type":"str","required":false,"choices":["enable","disable"]},"mac_violation_tim'
+    'er":{"type":"int","required":false},"mac_retention_period":{"type":"int","required":false},"https_image_push":{"type":"str","required":false,"choices"'
+    ':["enable","disable"]},"log_mac_limit_violations":{"type":"str","required":false,"choices":["enable","disable"]},"allow_multiple_interfaces":{"type":"'
+    'str","required":false},"sn_dns_resolution":{"type":"str","required":false,"choices":["enable","disable"]},"disable_discovery":{"type":"list","required'
+    '":false,"options":{"name":{"type":"str","required":false}}},"update_user_device":{"type":"list","required":false},"fips_enforce":{"type":"str","requir'
+    'ed":false,"choices":["disable","enable"]}}}'
+)
@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"aging_time":{"type":"integer","revisions":[2047,2047]},"flood_unknown_multicast":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"aging_time":{"type":"int","required":false},"flood_unknown_multicast":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]}}}'
+)
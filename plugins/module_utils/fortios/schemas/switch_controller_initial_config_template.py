@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]},"ip":{"type":"string","revisions":[1920,1920]},"vlanid":{"type":"integer",'
+    '"revisions":[1920,1920]},"auto_ip":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}]'
+    ',"revisions":[1920,1920]},"allowaccess":{"multiple_values":true,"type":"list","options":[{"value":"ping","revisions":[1920,1920]},{"value":"https","re'
+    'visions":[1920,1920]},{"value":"ssh","revisions":[1920,1920]},{"value":"snmp","revisions":[1920,1920]},{"value":"http","revisions":[1920,1920]},{"valu'
+    'e":"telnet","revisions":[1920,1920]},{"value":"fgfm","revisions":[1920,1920]},{"value":"radius-acct","revisions":[1920,1920]},{"value":"probe-response'
+    '","revisions":[1920,1920]},{"value":"fabric","revisions":[1920,1920]},{"value":"ftm","revisions":[1920,1920]}],"revisions":[1920,1920]},"dhcp_server":'
+    '{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]}},"revisio'
+    'ns":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"ip":{"type":"str","required":false},"vlanid":{"type":"int","require'
+    'd":false},"auto_ip":{"type":"str","required":false,"choices":["enable","disable"]},"allowaccess":{"type":"list","required":false,"choices":["ping","ht'
+    'tps","ssh","snmp","http","telnet","fgfm","radius-acct","probe-response","fabric","ftm"]},"dhcp_server":{"type":"str","required":false,"choices":["enab'
+    'le","disable"]}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"nac":{"type":"string","revisions":[1920,1920]},"quarantine":{"type":"string","revisions":[1920,1920]},"default_vlan":{"typ'
+    'e":"string","revisions":[1920,1920]},"video":{"type":"string","revisions":[1920,1920]},"voice":{"type":"string","revisions":[1920,1920]},"rspan":{"typ'
+    'e":"string","revisions":[1920,1920]}},"revisions":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"nac":{"type":"str","required":false},"quarantine":{"type":"str","required":false},"default_vlan":{"type":"'
+    'str","required":false},"video":{"type":"str","required":false},"voice":{"type":"str","required":false},"rspan":{"type":"str","required":false}}}'
+)
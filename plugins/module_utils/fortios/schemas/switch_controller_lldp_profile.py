@@ -0,0 +1,36 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"med_tlvs":{"multiple_values":true,"type":"list","options":[{"value":"inventory-management","revisions":[2047,2047]},{"valu'
+    'e":"network-policy","revisions":[2047,2047]},{"value":"power-management","revisions":[2040,2040]},{"value":"location-identification","revisions":[2040'
+    ',2040]}],"revisions":[2047,2047]},"auto_mclag_icl":{"type":"string","options":[{"value":"disable","revisions":[1920,1920]},{"value":"enable","revision'
+    's":[1920,1920]}],"revisions":[1920,1920]},"name":{"type":"string","revisions":[2047,2047]},"auto_isl_hello_timer":{"type":"integer","revisions":[2047,'
+    '2047]},"auto_isl":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[204'
+    '7,2047]},"custom_tlvs":{"type":"list","children":{"information_string":{"type":"string","revisions":[2047,2047]},"subtype":{"type":"integer","revision'
+    's":[2047,2047]},"oui":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"med_networ'
+    'k_policy":{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"vlan_intf":{"type":"string","revisions":[2040,2040]},"vlan":{"t'
+    'ype":"integer","revisions":[2047,23]},"dscp":{"type":"integer","revisions":[2047,2047]},"priority":{"type":"integer","revisions":[2047,2047]},"assign_'
+    'vlan":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]}},"r'
+    'evisions":[2047,2047]},"auto_isl_port_group":{"type":"integer","revisions":[2047,2047]},"auto_isl_receive_timeout":{"type":"integer","revisions":[2047'
+    ',2047]},"med_location_service":{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"e'
+    'nable","revisions":[2040,2040]}],"revisions":[2040,2040]},"sys_location_id":{"type":"string","revisions":[2040,2040]},"name":{"type":"string","revisio'
+    'ns":[2040,2040]}},"revisions":[2040,2040]},"802.3_tlvs":{"multiple_values":true,"type":"list","options":[{"value":"max-frame-size","revisions":[2047,2'
+    '047]},{"value":"power-negotiation","revisions":[2040,2040]}],"revisions":[2047,2047]},"802.1_tlvs":{"multiple_values":true,"type":"list","options":[{"'
+    'value":"port-vlan-id","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"med_tlvs":{"type":"list","required":false},"auto_mclag_icl":{"type":"str","required":false,"choices":["dis'
+    'able","enable"]},"name":{"type":"str","required":false},"auto_isl_hello_timer":{"type":"int","required":false},"auto_isl":{"type":"str","required":fal'
+    'se,"choices":["disable","enable"]},"custom_tlvs":{"type":"list","required":false,"options":{"information_string":{"type":"str","required":false},"subt'
+    'ype":{"type":"int","required":false},"oui":{"type":"str","required":false},"name":{"type":"str","required":false}}},"med_network_policy":{"type":"list'
+    '","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","required":false},"vlan_int'
+    'f":{"type":"str","required":false},"vlan":{"type":"int","required":false},"dscp":{"type":"int","required":false},"priority":{"type":"int","required":f'
+    'alse},"assign_vlan":{"type":"str","required":false,"choices":["disable","enable"]}}},"auto_isl_port_group":{"type":"int","required":false},"auto_isl_r'
+    'eceive_timeout":{"type":"int","required":false},"med_location_service":{"type":"list","required":false,"options":{"status":{"type":"str","required":fa'
+    'lse,"choices":["disable","enable"]},"sys_location_id":{"type":"str","required":false},"name":{"type":"str","required":false}}},"802.3_tlvs":{"type":"l'
+    'ist","required":false},"802.1_tlvs":{"type":"list","required":false,"choices":["port-vlan-id"]}}}'
+)
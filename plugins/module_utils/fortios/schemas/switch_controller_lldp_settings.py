@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions'
+    '":[2047,7]},"management_interface":{"type":"string","options":[{"value":"internal","revisions":[2047,2047]},{"value":"mgmt","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"fast_start_interval":{"type":"integer","revisions":[2047,2047]},"tx_interval":{"type":"integer","revisions":[2047,2047]},"tx'
+    '_hold":{"type":"integer","revisions":[2047,2047]},"device_detection":{"type":"string","options":[{"value":"disable","revisions":[1920,1920]},{"value":'
+    '"enable","revisions":[1920,1920]}],"revisions":[1920,1920]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false},"management_interface":{"type":"str","required":false,"choices":["'
+    'internal","mgmt"]},"fast_start_interval":{"type":"int","required":false},"tx_interval":{"type":"int","required":false},"tx_hold":{"type":"int","requir'
+    'ed":false},"device_detection":{"type":"str","required":false,"choices":["disable","enable"]}}}'
+)
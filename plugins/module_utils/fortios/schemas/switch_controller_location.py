@@ -0,0 +1,43 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"elin_number":{"type":"dict","children":{"parent_key":{"type":"string","revisions":[1984,1600]},"elin_num":{"type":"string"'
+    ',"revisions":[2040,2040]}},"revisions":[2040,2040]},"address_civic":{"type":"dict","children":{"number":{"type":"string","revisions":[2040,2040]},"sea'
+    't":{"type":"string","revisions":[2040,2040]},"county":{"type":"string","revisions":[2040,2040]},"street":{"type":"string","revisions":[2040,2040]},"ro'
+    'ad_section":{"type":"string","revisions":[2040,2040]},"primary_road":{"type":"string","revisions":[2040,2040]},"postal_community":{"type":"string","re'
+    'visions":[2040,2040]},"unit":{"type":"string","revisions":[2040,2040]},"post_office_box":{"type":"string","revisions":[2040,2040]},"city":{"type":"str'
+    'ing","revisions":[2040,2040]},"additional":{"type":"string","revisions":[2040,2040]},"zip":{"type":"string","revisions":[2040,2040]},"floor":{"type":"'
+    'string","revisions":[2040,2040]},"street_suffix":{"type":"string","revisions":[2040,2040]},"city_division":{"type":"string","revisions":[2040,2040]},"'
+    'sub_branch_road":{"type":"string","revisions":[2040,2040]},"direction":{"type":"string","revisions":[2040,2040]},"branch_road":{"type":"string","revis'
+    'ions":[2040,2040]},"country_subdivision":{"type":"string","revisions":[2040,2040]},"additional_code":{"type":"string","revisions":[2040,2040]},"number'
+    '_suffix":{"type":"string","revisions":[2040,2040]},"street_name_pre_mod":{"type":"string","revisions":[2040,2040]},"name":{"type":"string","revisions"'
+    ':[2040,2040]},"building":{"type":"string","revisions":[2040,2040]},"parent_key":{"type":"string","revisions":[1984,1600]},"language":{"type":"string",'
+    '"revisions":[2040,2040]},"room":{"type":"string","revisions":[2040,2040]},"country":{"type":"string","revisions":[2040,2040]},"script":{"type":"string'
+    '","revisions":[2040,2040]},"place_type":{"type":"string","revisions":[2040,2040]},"street_name_post_mod":{"type":"string","revisions":[2040,2040]},"tr'
+    'ailing_str_suffix":{"type":"string","revisions":[2040,2040]},"landmark":{"type":"string","revisions":[2040,2040]},"block":{"type":"string","revisions"'
+    ':[2040,2040]}},"revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]},"coordinates":{"type":"dict","children":{"altitude_unit":{"ty'
+    'pe":"string","options":[{"value":"m","revisions":[2040,2040]},{"value":"f","revisions":[2040,2040]}],"revisions":[2040,2040]},"parent_key":{"type":"st'
+    'ring","revisions":[1984,1600]},"altitude":{"type":"string","revisions":[2040,2040]},"datum":{"type":"string","options":[{"value":"WGS84","revisions":['
+    '2040,2040]},{"value":"NAD83","revisions":[2040,2040]},{"value":"NAD83/MLLW","revisions":[2040,2040]}],"revisions":[2040,2040]},"longitude":{"type":"st'
+    'ring","revisions":[2040,2040]},"latitude":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"elin_number":{"type":"dict","required":false,"options":{"parent_key":{"type":"str","required":false},"elin'
+    '_num":{"type":"str","required":false}}},"address_civic":{"type":"dict","required":false,"options":{"number":{"type":"str","required":false},"seat":{"t'
+    'ype":"str","required":false},"county":{"type":"str","required":false},"street":{"type":"str","required":false},"road_section":{"type":"str","required"'
+    ':false},"primary_road":{"type":"str","required":false},"postal_community":{"type":"str","required":false},"unit":{"type":"str","required":false},"post'
+    '_office_box":{"type":"str","required":false},"city":{"type":"str","required":false},"additional":{"type":"str","required":false},"zip":{"type":"str","'
+    'required":false},"floor":{"type":"str","required":false},"street_suffix":{"type":"str","required":false},"city_division":{"type":"str","required":fals'
+    'e},"sub_branch_road":{"type":"str","required":false},"direction":{"type":"str","required":false},"branch_road":{"type":"str","required":false},"countr'
+    'y_subdivision":{"type":"str","required":false},"additional_code":{"type":"str","required":false},"number_suffix":{"type":"str","required":false},"stre'
+    'et_name_pre_mod":{"type":"str","required":false},"name":{"type":"str","required":false},"building":{"type":"str","required":false},"parent_key":{"type'
+    '":"str","required":false},"language":{"type":"str","required":false},"room":{"type":"str","required":false},"country":{"type":"str","required":false},'
+    '"script":{"type":"str","required":false},"place_type":{"type":"str","required":false},"street_name_post_mod":{"type":"str","required":false},"trailing'
+    '_str_suffix":{"type":"str","required":false},"landmark":{"type":"str","required":false},"block":{"type":"str","required":false}}},"name":{"type":"str"'
+    ',"required":false},"coordinates":{"type":"dict","required":false,"options":{"altitude_unit":{"type":"str","required":false,"choices":["m","f"]},"paren'
+    't_key":{"type":"str","required":false},"altitude":{"type":"str","required":false},"datum":{"type":"str","required":false,"choices":["WGS84","NAD83","N'
+    'AD83/MLLW"]},"longitude":{"type":"str","required":false},"latitude":{"type":"str","required":false}}}}}'
+)
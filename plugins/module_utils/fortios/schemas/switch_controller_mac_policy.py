@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"count":{"type":"string","options":[{"value":"disable","revisions":[1920,1920]},{"value":"enable","revisions":[1920,1920]}]'
+    ',"revisions":[1920,1920]},"fortilink":{"type":"string","revisions":[1920,1920]},"traffic_policy":{"type":"string","revisions":[1920,1920]},"vlan":{"ty'
+    'pe":"string","revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1920]},"drop":{"type":"string","options":[{"value":"disable","revision'
+    's":[256,256]},{"value":"enable","revisions":[256,256]}],"revisions":[1792,256]},"bounce_port_link":{"type":"string","options":[{"value":"disable","rev'
+    'isions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"description":{"type":"string","revisions":[1920,1920]}},"re'
+    'visions":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"count":{"type":"str","required":false,"choices":["disable","enable"]},"fortilink":{"type":"str","required"'
+    ':false},"traffic_policy":{"type":"str","required":false},"vlan":{"type":"str","required":false},"name":{"type":"str","required":false},"drop":{"type":'
+    '"str","required":false},"bounce_port_link":{"type":"str","required":false,"choices":["disable","enable"]},"description":{"type":"str","required":false'
+    '}}}'
+)
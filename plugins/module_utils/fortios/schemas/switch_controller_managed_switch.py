@@ -0,0 +1,277 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"dynamically_discovered":{"type":"integer","revisions":[2047,2047]},"remote_log":{"type":"list","children":{"status":{"type'
+    '":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"severity":{"ty'
+    'pe":"string","options":[{"value":"emergency","revisions":[2040,2040]},{"value":"alert","revisions":[2040,2040]},{"value":"critical","revisions":[2040,'
+    '2040]},{"value":"error","revisions":[2040,2040]},{"value":"warning","revisions":[2040,2040]},{"value":"notification","revisions":[2040,2040]},{"value"'
+    ':"information","revisions":[2040,2040]},{"value":"debug","revisions":[2040,2040]}],"revisions":[2040,2040]},"facility":{"type":"string","options":[{"v'
+    'alue":"kernel","revisions":[2040,2040]},{"value":"user","revisions":[2040,2040]},{"value":"mail","revisions":[2040,2040]},{"value":"daemon","revisions'
+    '":[2040,2040]},{"value":"auth","revisions":[2040,2040]},{"value":"syslog","revisions":[2040,2040]},{"value":"lpr","revisions":[2040,2040]},{"value":"n'
+    'ews","revisions":[2040,2040]},{"value":"uucp","revisions":[2040,2040]},{"value":"cron","revisions":[2040,2040]},{"value":"authpriv","revisions":[2040,'
+    '2040]},{"value":"ftp","revisions":[2040,2040]},{"value":"ntp","revisions":[2040,2040]},{"value":"audit","revisions":[2040,2040]},{"value":"alert","rev'
+    'isions":[2040,2040]},{"value":"clock","revisions":[2040,2040]},{"value":"local0","revisions":[2040,2040]},{"value":"local1","revisions":[2040,2040]},{'
+    '"value":"local2","revisions":[2040,2040]},{"value":"local3","revisions":[2040,2040]},{"value":"local4","revisions":[2040,2040]},{"value":"local5","rev'
+    'isions":[2040,2040]},{"value":"local6","revisions":[2040,2040]},{"value":"local7","revisions":[2040,2040]}],"revisions":[2040,2040]},"server":{"type":'
+    '"string","revisions":[2040,2040]},"csv":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,20'
+    '40]}],"revisions":[2040,2040]},"port":{"type":"integer","revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2'
+    '040]},"fsw_wan2_admin":{"type":"string","options":[{"value":"discovered","revisions":[23,23]},{"value":"disable","revisions":[23,23]},{"value":"enable'
+    '","revisions":[23,23]}],"revisions":[2047,23]},"switch_id":{"type":"string","revisions":[2047,2047]},"dynamic_capability":{"type":"integer","revisions'
+    '":[2047,2047]},"override_snmp_trap_threshold":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2'
+    '040,2040]}],"revisions":[2040,2040]},"flow_identity":{"type":"string","revisions":[2040,2040]},"max_allowed_trunk_members":{"type":"integer","revision'
+    's":[2047,1687]},"mirror":{"type":"list","children":{"status":{"type":"string","options":[{"value":"active","revisions":[2047,2047]},{"value":"inactive'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"dst":{"type":"string","revisions":[2047,2047]},'
+    '"src_egress":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"switching_packet":{"type":"string"'
+    ',"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"src_ingress":{"type":"li'
+    'st","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]},"switch_device_tag":{"type":"stri'
+    'ng","revisions":[2047,2047]},"firmware_provision_version":{"type":"string","revisions":[1024,1024]},"description":{"type":"string","revisions":[2047,2'
+    '047]},"poe_pre_standard_detection":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"switch_dhcp_opt43_key":{"type":"string","revisions":[1920,1920]},"switch_stp_settings":{"type":"dict","children":{"status":'
+    '{"type":"string","options":[{"value":"enable","revisions":[23,23]},{"value":"disable","revisions":[23,23]}],"revisions":[23,23]}},"revisions":[2047,23'
+    ']},"custom_command":{"type":"list","children":{"command_entry":{"type":"string","revisions":[2047,2047]},"command_name":{"type":"string","revisions":['
+    '2047,2047]}},"revisions":[2047,2047]},"override_snmp_community":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disab'
+    'le","revisions":[2040,2040]}],"revisions":[2040,2040]},"switch_log":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"local_override":{"type":"string","options":[{"value":"'
+    'enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value"'
+    ':"emergency","revisions":[2047,2047]},{"value":"alert","revisions":[2047,2047]},{"value":"critical","revisions":[2047,2047]},{"value":"error","revisio'
+    'ns":[2047,2047]},{"value":"warning","revisions":[2047,2047]},{"value":"notification","revisions":[2047,2047]},{"value":"information","revisions":[2047'
+    ',2047]},{"value":"debug","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"fsw_wan1_admin":{"type":"string","options":[{"v'
+    'alue":"discovered","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"name":{"type":"string","revisions":[2047,2047]},"ip_source_guard":{"type":"list","children":{"binding_entry":{"type":"list","children":{"ip":{'
+    '"type":"string","revisions":[1920,1920]},"mac":{"type":"string","revisions":[1920,1920]},"entry_name":{"type":"string","revisions":[1920,1920]}},"revi'
+    'sions":[1920,1920]},"description":{"type":"string","revisions":[1920,1920]},"port":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]}'
+    ',"version":{"type":"integer","revisions":[2047,2047]},"override_snmp_user":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"va'
+    'lue":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"igmp_snooping":{"type":"dict","children":{"local_override":{"type":"string","option'
+    's":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"aging_time":{"type":"integer","r'
+    'evisions":[2047,2047]},"flood_unknown_multicast":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"qos_red_probability":{"type":"integer","revisions":[1920,1920]},"staged_image_versi'
+    'on":{"type":"string","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"virtual","revisions":[2047,2047]},{"value":"physical","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"snmp_sysinfo":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revis'
+    'ions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"description":{"type":"string","revisions":[2040,2040]},"conta'
+    'ct_info":{"type":"string","revisions":[2040,2040]},"location":{"type":"string","revisions":[2040,2040]},"engine_id":{"type":"string","revisions":[2040'
+    ',2040]}},"revisions":[2040,2040]},"static_mac":{"type":"list","children":{"description":{"type":"string","revisions":[2040,2040]},"vlan":{"type":"stri'
+    'ng","revisions":[2040,2040]},"mac":{"type":"string","revisions":[2040,2040]},"interface":{"type":"string","revisions":[2040,2040]},"type":{"type":"str'
+    'ing","options":[{"value":"static","revisions":[2040,2040]},{"value":"sticky","revisions":[2040,2040]}],"revisions":[2040,2040]},"id":{"type":"integer"'
+    ',"revisions":[2040,2040]}},"revisions":[2040,2040]},"snmp_community":{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable'
+    '","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"query_v1_port":{"type":"integer","revisions":[2040,20'
+    '40]},"name":{"type":"string","revisions":[2040,2040]},"query_v1_status":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"valu'
+    'e":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]},"trap_v2c_rport":{"type":"integer","rev'
+    'isions":[2040,2040]},"hosts":{"type":"list","children":{"ip":{"type":"string","revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}'
+    '},"revisions":[2040,2040]},"trap_v1_status":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[204'
+    '0,2040]}],"revisions":[2040,2040]},"trap_v1_lport":{"type":"integer","revisions":[2040,2040]},"trap_v2c_status":{"type":"string","options":[{"value":"'
+    'disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"trap_v1_rport":{"type":"integer","revisions":['
+    '2040,2040]},"events":{"multiple_values":true,"type":"list","options":[{"value":"cpu-high","revisions":[2040,2040]},{"value":"mem-low","revisions":[204'
+    '0,2040]},{"value":"log-full","revisions":[2040,2040]},{"value":"intf-ip","revisions":[2040,2040]},{"value":"ent-conf-change","revisions":[2040,2040]}]'
+    ',"revisions":[2040,2040]},"query_v2c_status":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[20'
+    '40,2040]}],"revisions":[2040,2040]},"trap_v2c_lport":{"type":"integer","revisions":[2040,2040]},"query_v2c_port":{"type":"integer","revisions":[2040,2'
+    '040]}},"revisions":[2040,2040]},"stp_settings":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[23,23]},'
+    '{"value":"disable","revisions":[23,23]}],"revisions":[2047,23]},"max_age":{"type":"integer","revisions":[2047,2047]},"local_override":{"type":"string"'
+    ',"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","'
+    'revisions":[2047,2047]},"hello_time":{"type":"integer","revisions":[2047,2047]},"pending_timer":{"type":"integer","revisions":[2047,2047]},"max_hops":'
+    '{"type":"integer","revisions":[2047,2047]},"forward_time":{"type":"integer","revisions":[2047,2047]},"revision":{"type":"integer","revisions":[2047,20'
+    '47]}},"revisions":[2047,2047]},"owner_vdom":{"type":"string","revisions":[2047,2047]},"switch_profile":{"type":"string","revisions":[2047,2047]},"snmp'
+    '_user":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]},"auth_pwd":{"type":"string","revisions":[2040,2040]},"priv_pwd":{"t'
+    'ype":"string","revisions":[2040,2040]},"priv_proto":{"type":"string","options":[{"value":"aes","revisions":[2040,1016]},{"value":"des","revisions":[20'
+    '40,2040]},{"value":"aes128","revisions":[1024,1024]},{"value":"aes192","revisions":[1024,1024]},{"value":"aes192c","revisions":[1024,1024]},{"value":"'
+    'aes256","revisions":[1024,1024]},{"value":"aes256c","revisions":[1024,1024]}],"revisions":[2040,2040]},"queries":{"type":"string","options":[{"value":'
+    '"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"query_port":{"type":"integer","revisions":[20'
+    '40,2040]},"security_level":{"type":"string","options":[{"value":"no-auth-no-priv","revisions":[2040,2040]},{"value":"auth-no-priv","revisions":[2040,2'
+    '040]},{"value":"auth-priv","revisions":[2040,2040]}],"revisions":[2040,2040]},"auth_proto":{"type":"string","options":[{"value":"md5","revisions":[204'
+    '0,2040]},{"value":"sha","revisions":[2040,1016]},{"value":"sha1","revisions":[1024,1024]},{"value":"sha224","revisions":[1024,1024]},{"value":"sha256"'
+    ',"revisions":[1024,1024]},{"value":"sha384","revisions":[1024,1024]},{"value":"sha512","revisions":[1024,1024]}],"revisions":[2040,2040]}},"revisions"'
+    ':[2040,2040]},"storm_control":{"type":"dict","children":{"broadcast":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"'
+    'disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"local_override":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"'
+    'value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"unknown_unicast":{"type":"string","options":[{"value":"enable","revisions":[2047,'
+    '2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"unknown_multicast":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rate":{"type":"integer","revisions":[2047,2047]}},"revisions"'
+    ':[2047,2047]},"qos_drop_policy":{"type":"string","options":[{"value":"taildrop","revisions":[1920,1920]},{"value":"random-early-detection","revisions"'
+    ':[1920,1920]}],"revisions":[1920,1920]},"802_1X_settings":{"type":"dict","children":{"max_reauth_attempt":{"type":"integer","revisions":[2047,2047]},"'
+    'link_down_auth":{"type":"string","options":[{"value":"set-unauth","revisions":[2047,2047]},{"value":"no-action","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"local_override":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"reauth_period":{"type":"integer","revisions":[2047,2047]},"tx_period":{"type":"integer","revisions":[1920,1920]}},"revisions":[2'
+    '047,2047]},"override_snmp_sysinfo":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}]'
+    ',"revisions":[2040,2040]},"fsw_wan2_peer":{"type":"string","revisions":[2047,23]},"delayed_restart_trigger":{"type":"integer","revisions":[2047,2047]}'
+    ',"directly_connected":{"type":"integer","revisions":[2047,2047]},"snmp_trap_threshold":{"type":"dict","children":{"trap_high_cpu_threshold":{"type":"i'
+    'nteger","revisions":[2040,2040]},"trap_low_memory_threshold":{"type":"integer","revisions":[2040,2040]},"trap_log_full_threshold":{"type":"integer","r'
+    'evisions":[2040,2040]}},"revisions":[2040,2040]},"tdr_supported":{"type":"string","revisions":[1536,1536]},"l3_discovered":{"type":"integer","revision'
+    's":[1920,1920]},"poe_lldp_detection":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"'
+    'revisions":[2040,120]},"stp_instance":{"type":"list","children":{"priority":{"type":"string","options":[{"value":"0","revisions":[2040,2040]},{"value"'
+    ':"4096","revisions":[2040,2040]},{"value":"8192","revisions":[2040,2040]},{"value":"12288","revisions":[2040,2040]},{"value":"16384","revisions":[2040'
+    ',2040]},{"value":"20480","revisions":[2040,2040]},{"value":"24576","revisions":[2040,2040]},{"value":"28672","revisions":[2040,2040]},{"value":"32768"'
+    ',"revisions":[2040,2040]},{"value":"36864","revisions":[2040,2040]},{"value":"40960","revisions":[2040,2040]},{"value":"45056","revisions":[2040,2040]'
+    '},{"value":"49152","revisions":[2040,2040]},{"value":"53248","revisions":[2040,2040]},{"value":"57344","revisions":[2040,2040]},{"value":"61440","revi'
+    'sions":[2040,2040]}],"revisions":[2040,2040]},"id":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"mclag_igmp_snooping_aware":{"t'
+    'ype":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"firmware_pr'
+    'ovision":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},'
+    '"access_profile":{"type":"string","revisions":[2040,2040]},"poe_detection_type":{"type":"integer","revisions":[2047,2047]},"fsw_wan1_peer":{"type":"st'
+    'ring","revisions":[2047,2047]},"pre_provisioned":{"type":"integer","revisions":[2047,2047]},"ports":{"type":"list","children":{"min_bundle":{"type":"i'
+    'nteger","revisions":[2047,2047]},"stp_bpdu_guard":{"type":"string","options":[{"value":"enabled","revisions":[2047,2047]},{"value":"disabled","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"rpvst_port":{"type":"string","options":[{"value":"disabled","revisions":[1664,1664]},{"value":"enabled","r'
+    'evisions":[1664,1664]}],"revisions":[1920,1664]},"arp_inspection_trust":{"type":"string","options":[{"value":"untrusted","revisions":[2047,2047]},{"va'
+    'lue":"trusted","revisions":[2047,2047]}],"revisions":[2047,2047]},"sflow_counter_interval":{"type":"integer","revisions":[2047,2047]},"p2p_port":{"typ'
+    'e":"integer","revisions":[1920,1920]},"matched_dpp_intf_tags":{"type":"string","revisions":[1024,1024]},"export_to":{"type":"string","revisions":[2047'
+    ',2047]},"switch_id":{"type":"string","revisions":[2047,2047]},"port_prefix_type":{"type":"integer","revisions":[2047,2047]},"fec_state":{"type":"strin'
+    'g","options":[{"value":"disabled","revisions":[1024,1024]},{"value":"cl74","revisions":[1024,1024]},{"value":"cl91","revisions":[1024,1024]}],"revisio'
+    'ns":[1024,1024]},"storm_control_policy":{"type":"string","revisions":[2040,2040]},"untagged_vlans":{"type":"list","children":{"vlan_name":{"type":"str'
+    'ing","revisions":[2047,2047]}},"revisions":[2047,2047]},"isl_peer_port_name":{"type":"string","revisions":[2047,2047]},"allowed_vlans":{"type":"list",'
+    '"children":{"vlan_name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"fgt_peer_device_name":{"type":"string","revisions":[2047,'
+    '2047]},"speed":{"type":"string","options":[{"value":"10half","revisions":[2047,2047]},{"value":"10full","revisions":[2047,2047]},{"value":"100half","r'
+    'evisions":[2047,2047]},{"value":"100full","revisions":[2047,2047]},{"value":"1000auto","revisions":[2047,2047]},{"value":"1000fiber","revisions":[2047'
+    ',2047]},{"value":"1000full","revisions":[2047,2047]},{"value":"10000","revisions":[2047,2047]},{"value":"40000","revisions":[2047,2047]},{"value":"aut'
+    'o","revisions":[2047,2047]},{"value":"auto-module","revisions":[2047,2047]},{"value":"100FX-half","revisions":[2047,2047]},{"value":"100FX-full","revi'
+    'sions":[2047,2047]},{"value":"100000full","revisions":[2047,2047]},{"value":"2500full","revisions":[2047,23]},{"value":"25000full","revisions":[2047,2'
+    '047]},{"value":"50000full","revisions":[2047,2047]},{"value":"10000cr","revisions":[2047,2045]},{"value":"10000sr","revisions":[2047,2045]},{"value":"'
+    '100000sr4","revisions":[2047,2045]},{"value":"100000cr4","revisions":[2047,2045]},{"value":"25000cr4","revisions":[2047,2045]},{"value":"25000sr4","re'
+    'visions":[2047,2045]},{"value":"5000full","revisions":[2047,2045]},{"value":"2500auto","revisions":[2040,2024]}],"revisions":[2047,2047]},"fiber_port"'
+    ':{"type":"integer","revisions":[2047,2047]},"allowed_vlans_all":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"description":{"type":"string","revisions":[2047,2047]},"sample_direction":{"type":"string","op'
+    'tions":[{"value":"tx","revisions":[2047,2047]},{"value":"rx","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"poe_pre_standard_detection":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"pause_meter":{"type":"integer","revisions":[1536,1536]},"max_bundle":{"type":"integer","revisions":[2047,2047]},"export_tags":'
+    '{"type":"list","children":{"tag_name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"stp_state":{"type":"string","options":[{"va'
+    'lue":"enabled","revisions":[2047,2047]},{"value":"disabled","revisions":[2047,2047]}],"revisions":[2047,2047]},"port_policy":{"type":"string","revisio'
+    'ns":[1024,1024]},"stacking_port":{"type":"integer","revisions":[2047,2047]},"sflow_sample_rate":{"type":"integer","revisions":[2047,7]},"dhcp_snoop_op'
+    'tion82_trust":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,20'
+    '47]},"matched_dpp_policy":{"type":"string","revisions":[1024,1024]},"ip_source_guard":{"type":"string","options":[{"value":"disable","revisions":[1920'
+    ',1920]},{"value":"enable","revisions":[1920,1920]}],"revisions":[1920,1920]},"dhcp_snooping":{"type":"string","options":[{"value":"untrusted","revisio'
+    'ns":[2047,2047]},{"value":"trusted","revisions":[2047,2047]}],"revisions":[2047,2047]},"lldp_status":{"type":"string","options":[{"value":"disable","r'
+    'evisions":[2047,2047]},{"value":"rx-only","revisions":[2047,2047]},{"value":"tx-only","revisions":[2047,2047]},{"value":"tx-rx","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"discard_mode":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"all-untagged","revisions":['
+    '2047,2047]},{"value":"all-tagged","revisions":[2047,2047]}],"revisions":[2047,2047]},"igmp_snooping":{"type":"string","options":[{"value":"enable","re'
+    'visions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"port_selection_criteria":{"type":"string","options":[{"value":'
+    '"src-mac","revisions":[2047,2047]},{"value":"dst-mac","revisions":[2047,2047]},{"value":"src-dst-mac","revisions":[2047,2047]},{"value":"src-ip","revi'
+    'sions":[2047,2047]},{"value":"dst-ip","revisions":[2047,2047]},{"value":"src-dst-ip","revisions":[2047,2047]}],"revisions":[2047,2047]},"edge_port":{"'
+    'type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"poe_status'
+    '":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"type":'
+    '{"type":"string","options":[{"value":"physical","revisions":[2047,2047]},{"value":"trunk","revisions":[2047,2047]}],"revisions":[2047,2047]},"stp_bpdu'
+    '_guard_timeout":{"type":"integer","revisions":[2047,2047]},"igmps_flood_traffic":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]'
+    '},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"port_security_policy":{"type":"string","revisions":[2047,2047]},"status":{"ty'
+    'pe":"string","options":[{"value":"up","revisions":[2047,2047]},{"value":"down","revisions":[2047,2047]}],"revisions":[2047,2047]},"mclag":{"type":"str'
+    'ing","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"lldp_profile":{"type'
+    '":"string","revisions":[2047,2047]},"port_owner":{"type":"string","revisions":[2047,2047]},"packet_sampler":{"type":"string","options":[{"value":"enab'
+    'led","revisions":[2040,2040]},{"value":"disabled","revisions":[2040,2040]}],"revisions":[2040,2040]},"poe_capable":{"type":"integer","revisions":[2047'
+    ',2047]},"lacp_speed":{"type":"string","options":[{"value":"slow","revisions":[2047,2047]},{"value":"fast","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"aggregator_mode":{"type":"string","options":[{"value":"bandwidth","revisions":[1664,1664]},{"value":"count","revisions":[1664,1664]}],"revisio'
+    'ns":[1920,1664]},"vlan":{"type":"string","revisions":[2047,2047]},"fortilink_port":{"type":"integer","revisions":[2047,2047]},"bundle":{"type":"string'
+    '","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"flow_control":{"type":"'
+    'string","options":[{"value":"disable","revisions":[1536,1536]},{"value":"tx","revisions":[1536,1536]},{"value":"rx","revisions":[1536,1536]},{"value":'
+    '"both","revisions":[1536,1536]}],"revisions":[1536,1536]},"ptp_policy":{"type":"string","revisions":[1920,1664]},"members":{"type":"list","children":{'
+    '"member_name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"media_type":{"type":"string","revisions":[1536,1536]},"loop_guard":'
+    '{"type":"string","options":[{"value":"enabled","revisions":[2047,2047]},{"value":"disabled","revisions":[2047,2047]}],"revisions":[2047,2047]},"mode":'
+    '{"type":"string","options":[{"value":"static","revisions":[2047,2047]},{"value":"lacp-passive","revisions":[2047,2047]},{"value":"lacp-active","revisi'
+    'ons":[2047,2047]}],"revisions":[2047,2047]},"stp_root_guard":{"type":"string","options":[{"value":"enabled","revisions":[2047,2047]},{"value":"disable'
+    'd","revisions":[2047,2047]}],"revisions":[2047,2047]},"fgt_peer_port_name":{"type":"string","revisions":[2047,2047]},"igmps_flood_reports":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sflow_sampler":{"ty'
+    'pe":"string","options":[{"value":"enabled","revisions":[7,7]},{"value":"disabled","revisions":[7,7]}],"revisions":[2047,7]},"access_mode":{"type":"str'
+    'ing","options":[{"value":"normal","revisions":[1920,896]},{"value":"nac","revisions":[1920,1920]},{"value":"dynamic","revisions":[1024,1024]},{"value"'
+    ':"static","revisions":[1024,1024]}],"revisions":[1920,1920]},"export_to_pool_flag":{"type":"integer","revisions":[2047,21]},"packet_sample_rate":{"typ'
+    'e":"integer","revisions":[2040,2040]},"loop_guard_timeout":{"type":"integer","revisions":[2047,2047]},"speed_mask":{"type":"integer","revisions":[2047'
+    ',23]},"sticky_mac":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[20'
+    '40,2040]},"learning_limit":{"type":"integer","revisions":[2047,2047]},"virtual_port":{"type":"integer","revisions":[2047,23]},"port_name":{"type":"str'
+    'ing","revisions":[2047,2047]},"flags":{"type":"integer","revisions":[2047,2047]},"mac_addr":{"type":"string","revisions":[2040,2040]},"isl_peer_device'
+    '_name":{"type":"string","revisions":[2047,2047]},"mclag_icl_port":{"type":"integer","revisions":[1920,1920]},"pause_meter_resume":{"type":"string","op'
+    'tions":[{"value":"75%","revisions":[1536,1536]},{"value":"50%","revisions":[1536,1536]},{"value":"25%","revisions":[1536,1536]}],"revisions":[1536,153'
+    '6]},"port_number":{"type":"integer","revisions":[2047,2047]},"qos_policy":{"type":"string","revisions":[2047,2047]},"isl_local_trunk_name":{"type":"st'
+    'ring","revisions":[2047,2047]},"fec_capable":{"type":"integer","revisions":[1024,1024]},"export_to_pool":{"type":"string","revisions":[2047,2047]},"me'
+    'mber_withdrawal_behavior":{"type":"string","options":[{"value":"forward","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"dynamically_discovered":{"type":"int","required":false},"remote_log":{"type":"list","required":false,"opti'
+    'ons":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"severity":{"type":"str","required":false,"choices":["emergency","alert"'
+    ',"critical","error","warning","notification","information","debug"]},"facility":{"type":"str","required":false,"choices":["kernel","user","mail","daem'
+    'on","auth","syslog","lpr","news","uucp","cron","authpriv","ftp","ntp","audit","alert","clock","local0","local1","local2","local3","local4","local5","l'
+    'ocal6","local7"]},"server":{"type":"str","required":false},"csv":{"type":"str","required":false,"choices":["enable","disable"]},"port":{"type":"int","'
+    'required":false},"name":{"type":"str","required":false}}},"fsw_wan2_admin":{"type":"str","required":false},"switch_id":{"type":"str","required":false}'
+    ',"dynamic_capability":{"type":"int","required":false},"override_snmp_trap_threshold":{"type":"str","required":false,"choices":["enable","disable"]},"f'
+    'low_identity":{"type":"str","required":false},"max_allowed_trunk_members":{"type":"int","required":false},"mirror":{"type":"list","required":false,"op'
+    'tions":{"status":{"type":"str","required":false,"choices":["active","inactive"]},"name":{"type":"str","required":false},"dst":{"type":"str","required"'
+    ':false},"src_egress":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"switching_packet":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"src_ingress":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}}},"switch_devic'
+    'e_tag":{"type":"str","required":false},"firmware_provision_version":{"type":"str","required":false},"description":{"type":"str","required":false},"poe'
+    '_pre_standard_detection":{"type":"str","required":false,"choices":["enable","disable"]},"switch_dhcp_opt43_key":{"type":"str","required":false},"switc'
+    'h_stp_settings":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]}}},"custom_command":'
+    '{"type":"list","required":false,"options":{"command_entry":{"type":"str","required":false},"command_name":{"type":"str","required":false}}},"override_'
+    'snmp_community":{"type":"str","required":false,"choices":["enable","disable"]},"switch_log":{"type":"dict","required":false,"options":{"status":{"type'
+    '":"str","required":false,"choices":["enable","disable"]},"local_override":{"type":"str","required":false,"choices":["enable","disable"]},"severity":{"'
+    'type":"str","required":false,"choices":["emergency","alert","critical","error","warning","notification","information","debug"]}}},"fsw_wan1_admin":{"t'
+    'ype":"str","required":false,"choices":["discovered","disable","enable"]},"name":{"type":"str","required":false},"ip_source_guard":{"type":"list","requ'
+    'ired":false,"options":{"binding_entry":{"type":"list","required":false,"options":{"ip":{"type":"str","required":false},"mac":{"type":"str","required":'
+    'false},"entry_name":{"type":"str","required":false}}},"description":{"type":"str","required":false},"port":{"type":"str","required":false}}},"version"'
+    ':{"type":"int","required":false},"override_snmp_user":{"type":"str","required":false,"choices":["enable","disable"]},"igmp_snooping":{"type":"dict","r'
+    'equired":false,"options":{"local_override":{"type":"str","required":false,"choices":["enable","disable"]},"aging_time":{"type":"int","required":false}'
+    ',"flood_unknown_multicast":{"type":"str","required":false,"choices":["enable","disable"]}}},"qos_red_probability":{"type":"int","required":false},"sta'
+    'ged_image_version":{"type":"str","required":false},"type":{"type":"str","required":false,"choices":["virtual","physical"]},"snmp_sysinfo":{"type":"dic'
+    't","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"description":{"type":"str","required":false},"'
+    'contact_info":{"type":"str","required":false},"location":{"type":"str","required":false},"engine_id":{"type":"str","required":false}}},"static_mac":{"'
+    'type":"list","required":false,"options":{"description":{"type":"str","required":false},"vlan":{"type":"str","required":false},"mac":{"type":"str","req'
+    'uired":false},"interface":{"type":"str","required":false},"type":{"type":"str","required":false,"choices":["static","sticky"]},"id":{"type":"int","req'
+    'uired":false}}},"snmp_community":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"q'
+    'uery_v1_port":{"type":"int","required":false},"name":{"type":"str","required":false},"query_v1_status":{"type":"str","required":false,"choices":["disa'
+    'ble","enable"]},"id":{"type":"int","required":false},"trap_v2c_rport":{"type":"int","required":false},"hosts":{"type":"list","required":false,"options'
+    '":{"ip":{"type":"str","required":false},"id":{"type":"int","required":false}}},"trap_v1_status":{"type":"str","required":false,"choices":["disable","e'
+    'nable"]},"trap_v1_lport":{"type":"int","required":false},"trap_v2c_status":{"type":"str","required":false,"choices":["disable","enable"]},"trap_v1_rpo'
+    'rt":{"type":"int","required":false},"events":{"type":"list","required":false,"choices":["cpu-high","mem-low","log-full","intf-ip","ent-conf-change"]},'
+    '"query_v2c_status":{"type":"str","required":false,"choices":["disable","enable"]},"trap_v2c_lport":{"type":"int","required":false},"query_v2c_port":{"'
+    'type":"int","required":false}}},"stp_settings":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false},"max_age":{"type":"'
+    'int","required":false},"local_override":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"hello_t'
+    'ime":{"type":"int","required":false},"pending_timer":{"type":"int","required":false},"max_hops":{"type":"int","required":false},"forward_time":{"type"'
+    ':"int","required":false},"revision":{"type":"int","required":false}}},"owner_vdom":{"type":"str","required":false},"switch_profile":{"type":"str","req'
+    'uired":false},"snmp_user":{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"auth_pwd":{"type":"str","required":false}'
+    ',"priv_pwd":{"type":"str","required":false},"priv_proto":{"type":"str","required":false},"queries":{"type":"str","required":false,"choices":["disable"'
+    ',"enable"]},"query_port":{"type":"int","required":false},"security_level":{"type":"str","required":false,"choices":["no-auth-no-priv","auth-no-priv","'
+    'auth-priv"]},"auth_proto":{"type":"str","required":false}}},"storm_control":{"type":"dict","required":false,"options":{"broadcast":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"local_override":{"type":"str","required":false,"choices":["enable","disable"]},"unknown_unicast":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"unknown_multicast":{"type":"str","required":false,"choices":["enable","disable"]},"rate":{"typ'
+    'e":"int","required":false}}},"qos_drop_policy":{"type":"str","required":false,"choices":["taildrop","random-early-detection"]},"802_1X_settings":{"typ'
+    'e":"dict","required":false,"options":{"max_reauth_attempt":{"type":"int","required":false},"link_down_auth":{"type":"str","required":false,"choices":['
+    '"set-unauth","no-action"]},"local_override":{"type":"str","required":false,"choices":["enable","disable"]},"reauth_period":{"type":"int","required":fa'
+    'lse},"tx_period":{"type":"int","required":false}}},"override_snmp_sysinfo":{"type":"str","required":false,"choices":["disable","enable"]},"fsw_wan2_pe'
+    'er":{"type":"str","required":false},"delayed_restart_trigger":{"type":"int","required":false},"directly_connected":{"type":"int","required":false},"sn'
+    'mp_trap_threshold":{"type":"dict","required":false,"options":{"trap_high_cpu_threshold":{"type":"int","required":false},"trap_low_memory_threshold":{"'
+    'type":"int","required":false},"trap_log_full_threshold":{"type":"int","required":false}}},"tdr_supported":{"type":"str","required":false},"l3_discover'
+    'ed":{"type":"int","required":false},"poe_lldp_detection":{"type":"str","required":false},"stp_instance":{"type":"list","required":false,"options":{"pr'
+    'iority":{"type":"str","required":false,"choices":["0","4096","8192","12288","16384","20480","24576","28672","32768","36864","40960","45056","49152","5'
+    '3248","57344","61440"]},"id":{"type":"str","required":false}}},"mclag_igmp_snooping_aware":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"firmware_provision":{"type":"str","required":false,"choices":["enable","disable"]},"access_profile":{"type":"str","required":false},"poe_detectio'
+    'n_type":{"type":"int","required":false},"fsw_wan1_peer":{"type":"str","required":false},"pre_provisioned":{"type":"int","required":false},"ports":{"ty'
+    'pe":"list","required":false,"options":{"min_bundle":{"type":"int","required":false},"stp_bpdu_guard":{"type":"str","required":false,"choices":["enable'
+    'd","disabled"]},"rpvst_port":{"type":"str","required":false},"arp_inspection_trust":{"type":"str","required":false,"choices":["untrusted","trusted"]},'
+    '"sflow_counter_interval":{"type":"int","required":false},"p2p_port":{"type":"int","required":false},"matched_dpp_intf_tags":{"type":"str","required":f'
+    'alse},"export_to":{"type":"str","required":false},"switch_id":{"type":"str","required":false},"port_prefix_type":{"type":"int","required":false},"fec_'
+    'state":{"type":"str","required":false,"choices":["disabled","cl74","cl91"]},"storm_control_policy":{"type":"str","required":false},"untagged_vlans":{"'
+    'type":"list","required":false,"options":{"vlan_name":{"type":"str","required":false}}},"isl_peer_port_name":{"type":"str","required":false},"allowed_v'
+    'lans":{"type":"list","required":false,"options":{"vlan_name":{"type":"str","required":false}}},"fgt_peer_device_name":{"type":"str","required":false},'
+    '"speed":{"type":"str","required":false},"fiber_port":{"type":"int","required":false},"allowed_vlans_all":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"description":{"type":"str","required":false},"sample_direction":{"type":"str","required":false,"choices":["tx","rx","both"]},"poe_p'
+    're_standard_detection":{"type":"str","required":false,"choices":["enable","disable"]},"pause_meter":{"type":"int","required":false},"max_bundle":{"typ'
+    'e":"int","required":false},"export_tags":{"type":"list","required":false,"options":{"tag_name":{"type":"str","required":false}}},"stp_state":{"type":"'
+    'str","required":false,"choices":["enabled","disabled"]},"port_policy":{"type":"str","required":false},"stacking_port":{"type":"int","required":false},'
+    '"sflow_sample_rate":{"type":"int","required":false},"dhcp_snoop_option82_trust":{"type":"str","required":false,"choices":["enable","disable"]},"matche'
+    'd_dpp_policy":{"type":"str","required":false},"ip_source_guard":{"type":"str","required":false,"choices":["disable","enable"]},"dhcp_snooping":{"type"'
+    ':"str","required":false,"choices":["untrusted","trusted"]},"lldp_status":{"type":"str","required":false,"choices":["disable","rx-only","tx-only","tx-r'
+    'x"]},"discard_mode":{"type":"str","required":false,"choices":["none","all-untagged","all-tagged"]},"igmp_snooping":{"type":"str","required":false},"po'
+    'rt_selection_criteria":{"type":"str","required":false,"choices":["src-mac","dst-mac","src-dst-mac","src-ip","dst-ip","src-dst-ip"]},"edge_port":{"type'
+    '":"str","required":false,"choices":["enable","disable"]},"poe_status":{"type":"str","required":false,"choices":["enable","disable"]},"type":{"type":"s'
+    'tr","required":false,"choices":["physical","trunk"]},"stp_bpdu_guard_timeout":{"type":"int","required":false},"igmps_flood_traffic":{"type":"str","req'
+    'uired":false,"choices":["enable","disable"]},"port_security_policy":{"type":"str","required":false},"status":{"type":"str","required":false,"choices":'
+    '["up","down"]},"mclag":{"type":"str","required":false,"choices":["enable","disable"]},"lldp_profile":{"type":"str","required":false},"port_owner":{"ty'
+    'pe":"str","required":false},"packet_sampler":{"type":"str","required":false,"choices":["enabled","disabled"]},"poe_capable":{"type":"int","required":f'
+    'alse},"lacp_speed":{"type":"str","required":false,"choices":["slow","fast"]},"aggregator_mode":{"type":"str","required":false},"vlan":{"type":"str","r'
+    'equired":false},"fortilink_port":{"type":"int","required":false},"bundle":{"type":"str","required":false,"choices":["enable","disable"]},"flow_control'
+    '":{"type":"str","required":false,"choices":["disable","tx","rx","both"]},"ptp_policy":{"type":"str","required":false},"members":{"type":"list","requir'
+    'ed":false,"options":{"member_name":{"type":"str","required":false}}},"media_type":{"type":"str","required":false},"loop_guard":{"type":"str","required'
+    '":false,"choices":["enabled","disabled"]},"mode":{"type":"str","required":false,"choices":["static","lacp-passive","lacp-active"]},"stp_root_guard":{"'
+    'type":"str","required":false,"choices":["enabled","disabled"]},"fgt_peer_port_name":{"type":"str","required":false},"igmps_flood_reports":{"type":"str'
+    '","required":false,"choices":["enable","disable"]},"sflow_sampler":{"type":"str","required":false},"access_mode":{"type":"str","required":false},"expo'
+    'rt_to_pool_flag":{"type":"int","required":false},"packet_sample_rate":{"type":"int","required":false},"loop_guard_timeout":{"type":"int","required":fa'
+    'lse},"speed_mask":{"type":"int","required":false},"sticky_mac":{"type":"str","required":false,"choices":["enable","disable"]},"learning_limit":{"type"'
+    ':"int","required":false},"virtual_port":{"type":"int","required":false},"port_name":{"type":"str","required":false},"flags":{"type":"int","required":f'
+    'alse},"mac_addr":{"type":"str","required":false},"isl_peer_device_name":{"type":"str","required":false},"mclag_icl_port":{"type":"int","required":fals'
+    'e},"pause_meter_resume":{"type":"str","required":false,"choices":["75%","50%","25%"]},"port_number":{"type":"int","required":false},"qos_policy":{"typ'
+    'e":"str","required":false},"isl_local_trunk_name":{"type":"str","required":false},"fec_capable":{"type":"int","required":false},"export_to_pool":{"typ'
+    'e":"str","required":false},"member_withdrawal_behavior":{"type":"str","required":false,"choices":["forward","block"]}}}}}'
+)
@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[896,896]},{"value":"disable","revisions":[896,896]}],"r'
+    'evisions":[896,896]},"description":{"type":"string","revisions":[896,896]},"port_policy":{"type":"string","revisions":[896,896]},"matched_nac_policy":'
+    '{"type":"string","revisions":[896,896]},"mac_policy":{"type":"string","revisions":[896,896]},"mac":{"type":"string","revisions":[896,896]},"last_known'
+    '_port":{"type":"string","revisions":[896,896]},"id":{"type":"integer","revisions":[896,896]},"last_known_switch":{"type":"string","revisions":[896,896'
+    ']},"last_seen":{"type":"integer","revisions":[896,896]}},"revisions":[896,896]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"description":{"type":"str","requir'
+    'ed":false},"port_policy":{"type":"str","required":false},"matched_nac_policy":{"type":"str","required":false},"mac_policy":{"type":"str","required":fa'
+    'lse},"mac":{"type":"str","required":false},"last_known_port":{"type":"str","required":false},"id":{"type":"int","required":false},"last_known_switch":'
+    '{"type":"str","required":false},"last_seen":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"bounce_nac_port":{"type":"string","options":[{"value":"disable","revisions":[896,896]},{"value":"enable","revisions":[896,'
+    '896]}],"revisions":[896,896]},"name":{"type":"string","revisions":[896,896]},"inactive_timer":{"type":"integer","revisions":[896,896]},"mode":{"type":'
+    '"string","options":[{"value":"local","revisions":[896,896]},{"value":"global","revisions":[896,896]}],"revisions":[896,896]},"link_down_flush":{"type"'
+    ':"string","options":[{"value":"disable","revisions":[896,896]},{"value":"enable","revisions":[896,896]}],"revisions":[896,896]},"onboarding_vlan":{"ty'
+    'pe":"string","revisions":[896,896]},"auto_auth":{"type":"string","options":[{"value":"disable","revisions":[896,896]},{"value":"enable","revisions":[8'
+    '96,896]}],"revisions":[896,896]}},"revisions":[896,896]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"bounce_nac_port":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","requ'
+    'ired":false},"inactive_timer":{"type":"int","required":false},"mode":{"type":"str","required":false,"choices":["local","global"]},"link_down_flush":{"'
+    'type":"str","required":false,"choices":["disable","enable"]},"onboarding_vlan":{"type":"str","required":false},"auto_auth":{"type":"str","required":fa'
+    'lse,"choices":["disable","enable"]}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"fortilink":{"type":"string","revisions":[896,896]},"lldp_profile":{"type":"string","revisions":[896,896]},"name":{"type":"'
+    'string","revisions":[896,896]},"vlan_policy":{"type":"string","revisions":[896,896]},"bounce_port_link":{"type":"string","options":[{"value":"disable"'
+    ',"revisions":[896,896]},{"value":"enable","revisions":[896,896]}],"revisions":[896,896]},"802_1x":{"type":"string","revisions":[896,896]},"qos_policy"'
+    ':{"type":"string","revisions":[896,896]},"description":{"type":"string","revisions":[896,896]}},"revisions":[896,896]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"fortilink":{"type":"str","required":false},"lldp_profile":{"type":"str","required":false},"name":{"type":"'
+    'str","required":false},"vlan_policy":{"type":"str","required":false},"bounce_port_link":{"type":"str","required":false,"choices":["disable","enable"]}'
+    ',"802_1x":{"type":"str","required":false},"qos_policy":{"type":"str","required":false},"description":{"type":"str","required":false}}}'
+)
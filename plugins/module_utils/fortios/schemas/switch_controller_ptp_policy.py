@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}'
+    '],"revisions":[1664,1664]},"name":{"type":"string","revisions":[1664,1664]}},"revisions":[1664,1664]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","required":fal'
+    'se}}}'
+)
@@ -0,0 +1,12 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"mode":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{"value":"transparent-e2e","revisions":[1664'
+    ',1664]},{"value":"transparent-p2p","revisions":[1664,1664]}],"revisions":[1664,1664]}},"revisions":[1664,1664]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"mode":{"type":"str","required":false,"choices":["disable","transparent-e2e","transparent-p2p"]}}}'
+)
@@ -0,0 +1,43 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"description":{"type":"string","revisions":[2047,2047]},"egress_pri_taggin'
+    'g":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"prior'
+    'ity_7":{"type":"string","options":[{"value":"queue-0","revisions":[2047,2047]},{"value":"queue-1","revisions":[2047,2047]},{"value":"queue-2","revisio'
+    'ns":[2047,2047]},{"value":"queue-3","revisions":[2047,2047]},{"value":"queue-4","revisions":[2047,2047]},{"value":"queue-5","revisions":[2047,2047]},{'
+    '"value":"queue-6","revisions":[2047,2047]},{"value":"queue-7","revisions":[2047,2047]}],"revisions":[2047,2047]},"priority_6":{"type":"string","option'
+    's":[{"value":"queue-0","revisions":[2047,2047]},{"value":"queue-1","revisions":[2047,2047]},{"value":"queue-2","revisions":[2047,2047]},{"value":"queu'
+    'e-3","revisions":[2047,2047]},{"value":"queue-4","revisions":[2047,2047]},{"value":"queue-5","revisions":[2047,2047]},{"value":"queue-6","revisions":['
+    '2047,2047]},{"value":"queue-7","revisions":[2047,2047]}],"revisions":[2047,2047]},"priority_5":{"type":"string","options":[{"value":"queue-0","revisio'
+    'ns":[2047,2047]},{"value":"queue-1","revisions":[2047,2047]},{"value":"queue-2","revisions":[2047,2047]},{"value":"queue-3","revisions":[2047,2047]},{'
+    '"value":"queue-4","revisions":[2047,2047]},{"value":"queue-5","revisions":[2047,2047]},{"value":"queue-6","revisions":[2047,2047]},{"value":"queue-7",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"priority_4":{"type":"string","options":[{"value":"queue-0","revisions":[2047,2047]},{"value":"queu'
+    'e-1","revisions":[2047,2047]},{"value":"queue-2","revisions":[2047,2047]},{"value":"queue-3","revisions":[2047,2047]},{"value":"queue-4","revisions":['
+    '2047,2047]},{"value":"queue-5","revisions":[2047,2047]},{"value":"queue-6","revisions":[2047,2047]},{"value":"queue-7","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"priority_3":{"type":"string","options":[{"value":"queue-0","revisions":[2047,2047]},{"value":"queue-1","revisions":[2047,2047]},{'
+    '"value":"queue-2","revisions":[2047,2047]},{"value":"queue-3","revisions":[2047,2047]},{"value":"queue-4","revisions":[2047,2047]},{"value":"queue-5",'
+    '"revisions":[2047,2047]},{"value":"queue-6","revisions":[2047,2047]},{"value":"queue-7","revisions":[2047,2047]}],"revisions":[2047,2047]},"priority_2'
+    '":{"type":"string","options":[{"value":"queue-0","revisions":[2047,2047]},{"value":"queue-1","revisions":[2047,2047]},{"value":"queue-2","revisions":['
+    '2047,2047]},{"value":"queue-3","revisions":[2047,2047]},{"value":"queue-4","revisions":[2047,2047]},{"value":"queue-5","revisions":[2047,2047]},{"valu'
+    'e":"queue-6","revisions":[2047,2047]},{"value":"queue-7","revisions":[2047,2047]}],"revisions":[2047,2047]},"priority_1":{"type":"string","options":[{'
+    '"value":"queue-0","revisions":[2047,2047]},{"value":"queue-1","revisions":[2047,2047]},{"value":"queue-2","revisions":[2047,2047]},{"value":"queue-3",'
+    '"revisions":[2047,2047]},{"value":"queue-4","revisions":[2047,2047]},{"value":"queue-5","revisions":[2047,2047]},{"value":"queue-6","revisions":[2047,'
+    '2047]},{"value":"queue-7","revisions":[2047,2047]}],"revisions":[2047,2047]},"priority_0":{"type":"string","options":[{"value":"queue-0","revisions":['
+    '2047,2047]},{"value":"queue-1","revisions":[2047,2047]},{"value":"queue-2","revisions":[2047,2047]},{"value":"queue-3","revisions":[2047,2047]},{"valu'
+    'e":"queue-4","revisions":[2047,2047]},{"value":"queue-5","revisions":[2047,2047]},{"value":"queue-6","revisions":[2047,2047]},{"value":"queue-7","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"description":{"type":"str","required":false},"egress_pri_tagging":{'
+    '"type":"str","required":false,"choices":["disable","enable"]},"priority_7":{"type":"str","required":false,"choices":["queue-0","queue-1","queue-2","qu'
+    'eue-3","queue-4","queue-5","queue-6","queue-7"]},"priority_6":{"type":"str","required":false,"choices":["queue-0","queue-1","queue-2","queue-3","queue'
+    '-4","queue-5","queue-6","queue-7"]},"priority_5":{"type":"str","required":false,"choices":["queue-0","queue-1","queue-2","queue-3","queue-4","queue-5"'
+    ',"queue-6","queue-7"]},"priority_4":{"type":"str","required":false,"choices":["queue-0","queue-1","queue-2","queue-3","queue-4","queue-5","queue-6","q'
+    'ueue-7"]},"priority_3":{"type":"str","required":false,"choices":["queue-0","queue-1","queue-2","queue-3","queue-4","queue-5","queue-6","queue-7"]},"pr'
+    'iority_2":{"type":"str","required":false,"choices":["queue-0","queue-1","queue-2","queue-3","queue-4","queue-5","queue-6","queue-7"]},"priority_1":{"t'
+    'ype":"str","required":false,"choices":["queue-0","queue-1","queue-2","queue-3","queue-4","queue-5","queue-6","queue-7"]},"priority_0":{"type":"str","r'
+    'equired":false,"choices":["queue-0","queue-1","queue-2","queue-3","queue-4","queue-5","queue-6","queue-7"]}}}'
+)
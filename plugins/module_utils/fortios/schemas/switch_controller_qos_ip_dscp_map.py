@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"map":{"type":"list","children":{"cos_queue":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions"'
+    ':[2047,2047]},"diffserv":{"multiple_values":true,"type":"list","options":[{"value":"CS0","revisions":[2047,2047]},{"value":"CS1","revisions":[2047,204'
+    '7]},{"value":"AF11","revisions":[2047,2047]},{"value":"AF12","revisions":[2047,2047]},{"value":"AF13","revisions":[2047,2047]},{"value":"CS2","revisio'
+    'ns":[2047,2047]},{"value":"AF21","revisions":[2047,2047]},{"value":"AF22","revisions":[2047,2047]},{"value":"AF23","revisions":[2047,2047]},{"value":"'
+    'CS3","revisions":[2047,2047]},{"value":"AF31","revisions":[2047,2047]},{"value":"AF32","revisions":[2047,2047]},{"value":"AF33","revisions":[2047,2047'
+    ']},{"value":"CS4","revisions":[2047,2047]},{"value":"AF41","revisions":[2047,2047]},{"value":"AF42","revisions":[2047,2047]},{"value":"AF43","revision'
+    's":[2047,2047]},{"value":"CS5","revisions":[2047,2047]},{"value":"EF","revisions":[2047,2047]},{"value":"CS6","revisions":[2047,2047]},{"value":"CS7",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"value":{"type":"string","revisions":[2047,2047]},"ip_precedence":{"multiple_values":true,"type":"l'
+    'ist","options":[{"value":"network-control","revisions":[2047,2047]},{"value":"internetwork-control","revisions":[2047,2047]},{"value":"critic-ecp","re'
+    'visions":[2047,2047]},{"value":"flashoverride","revisions":[2047,2047]},{"value":"flash","revisions":[2047,2047]},{"value":"immediate","revisions":[20'
+    '47,2047]},{"value":"priority","revisions":[2047,2047]},{"value":"routine","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+    ',"name":{"type":"string","revisions":[2047,2047]},"description":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"map":{"type":"list","required":false,"options":{"cos_queue":{"type":"int","required":false},"name":{"type"'
+    ':"str","required":false},"diffserv":{"type":"list","required":false,"choices":["CS0","CS1","AF11","AF12","AF13","CS2","AF21","AF22","AF23","CS3","AF31'
+    '","AF32","AF33","CS4","AF41","AF42","AF43","CS5","EF","CS6","CS7"]},"value":{"type":"str","required":false},"ip_precedence":{"type":"list","required":'
+    'false,"choices":["network-control","internetwork-control","critic-ecp","flashoverride","flash","immediate","priority","routine"]}}},"name":{"type":"st'
+    'r","required":false},"description":{"type":"str","required":false}}}'
+)
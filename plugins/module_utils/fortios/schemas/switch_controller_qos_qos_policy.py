@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"default_cos":{"type":"integer","revisions":[2047,2047]},"trust_dot1p_map":{"type":"string","revisions":[2047,2047]},"queue'
+    '_policy":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"trust_ip_dscp_map":{"type":"string","revisions":['
+    '2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"default_cos":{"type":"int","required":false},"trust_dot1p_map":{"type":"str","required":false},"queue_poli'
+    'cy":{"type":"str","required":false},"name":{"type":"str","required":false},"trust_ip_dscp_map":{"type":"str","required":false}}}'
+)
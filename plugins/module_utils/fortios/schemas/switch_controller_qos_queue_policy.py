@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"cos_queue":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"weight":{"type":"integer","revisio'
+    'ns":[2047,2047]},"min_rate":{"type":"integer","revisions":[2047,2047]},"ecn":{"type":"string","options":[{"value":"disable","revisions":[1664,1664]},{'
+    '"value":"enable","revisions":[1664,1664]}],"revisions":[1920,1664]},"max_rate":{"type":"integer","revisions":[2047,2047]},"max_rate_percent":{"type":"'
+    'integer","revisions":[2040,2040]},"drop_policy":{"type":"string","options":[{"value":"taildrop","revisions":[2047,2047]},{"value":"weighted-random-ear'
+    'ly-detection","revisions":[2047,2047]}],"revisions":[2047,2047]},"min_rate_percent":{"type":"integer","revisions":[2040,2040]},"description":{"type":"'
+    'string","revisions":[2047,2047]}},"revisions":[2047,2047]},"rate_by":{"type":"string","options":[{"value":"kbps","revisions":[2040,2040]},{"value":"pe'
+    'rcent","revisions":[2040,2040]}],"revisions":[2040,2040]},"name":{"type":"string","revisions":[2047,2047]},"schedule":{"type":"string","options":[{"va'
+    'lue":"strict","revisions":[2047,2047]},{"value":"round-robin","revisions":[2047,2047]},{"value":"weighted","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"cos_queue":{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"weight":{"ty'
+    'pe":"int","required":false},"min_rate":{"type":"int","required":false},"ecn":{"type":"str","required":false},"max_rate":{"type":"int","required":false'
+    '},"max_rate_percent":{"type":"int","required":false},"drop_policy":{"type":"str","required":false,"choices":["taildrop","weighted-random-early-detecti'
+    'on"]},"min_rate_percent":{"type":"int","required":false},"description":{"type":"str","required":false}}},"rate_by":{"type":"str","required":false,"cho'
+    'ices":["kbps","percent"]},"name":{"type":"str","required":false},"schedule":{"type":"str","required":false,"choices":["strict","round-robin","weighted'
+    '"]}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"quarantine":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"targets":{"type":"list","children":{"mac":{"type":"string","revisions":[2047,2047]},"tag":{"type":"list","children":{"'
+    'tags":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"entry_id":{"type":"integer","revisions":[2047,23]},"description":{"type":"s'
+    'tring","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"quarantine":{"type":"str","required":false,"choices":["enable","disable"]},"targets":{"type":"list","requi'
+    'red":false,"options":{"mac":{"type":"str","required":false},"tag":{"type":"list","required":false,"options":{"tags":{"type":"str","required":false}}},'
+    '"entry_id":{"type":"int","required":false},"description":{"type":"str","required":false}}}}}'
+)
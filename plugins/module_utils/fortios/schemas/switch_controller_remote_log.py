@@ -0,0 +1,28 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}'
+    '],"revisions":[2040,2040]},"severity":{"type":"string","options":[{"value":"emergency","revisions":[2040,2040]},{"value":"alert","revisions":[2040,204'
+    '0]},{"value":"critical","revisions":[2040,2040]},{"value":"error","revisions":[2040,2040]},{"value":"warning","revisions":[2040,2040]},{"value":"notif'
+    'ication","revisions":[2040,2040]},{"value":"information","revisions":[2040,2040]},{"value":"debug","revisions":[2040,2040]}],"revisions":[2040,2040]},'
+    '"facility":{"type":"string","options":[{"value":"kernel","revisions":[2040,2040]},{"value":"user","revisions":[2040,2040]},{"value":"mail","revisions"'
+    ':[2040,2040]},{"value":"daemon","revisions":[2040,2040]},{"value":"auth","revisions":[2040,2040]},{"value":"syslog","revisions":[2040,2040]},{"value":'
+    '"lpr","revisions":[2040,2040]},{"value":"news","revisions":[2040,2040]},{"value":"uucp","revisions":[2040,2040]},{"value":"cron","revisions":[2040,204'
+    '0]},{"value":"authpriv","revisions":[2040,2040]},{"value":"ftp","revisions":[2040,2040]},{"value":"ntp","revisions":[2040,2040]},{"value":"audit","rev'
+    'isions":[2040,2040]},{"value":"alert","revisions":[2040,2040]},{"value":"clock","revisions":[2040,2040]},{"value":"local0","revisions":[2040,2040]},{"'
+    'value":"local1","revisions":[2040,2040]},{"value":"local2","revisions":[2040,2040]},{"value":"local3","revisions":[2040,2040]},{"value":"local4","revi'
+    'sions":[2040,2040]},{"value":"local5","revisions":[2040,2040]},{"value":"local6","revisions":[2040,2040]},{"value":"local7","revisions":[2040,2040]}],'
+    '"revisions":[2040,2040]},"server":{"type":"string","revisions":[2040,2040]},"csv":{"type":"string","options":[{"value":"enable","revisions":[2040,2040'
+    ']},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"port":{"type":"integer","revisions":[2040,2040]},"name":{"type":"string","re'
+    'visions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"severity":{"type":"str","required"'
+    ':false,"choices":["emergency","alert","critical","error","warning","notification","information","debug"]},"facility":{"type":"str","required":false,"c'
+    'hoices":["kernel","user","mail","daemon","auth","syslog","lpr","news","uucp","cron","authpriv","ftp","ntp","audit","alert","clock","local0","local1","'
+    'local2","local3","local4","local5","local6","local7"]},"server":{"type":"str","required":false},"csv":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"port":{"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
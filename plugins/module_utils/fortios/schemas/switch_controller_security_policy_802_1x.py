@@ -0,0 +1,35 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"security_mode":{"type":"string","options":[{"value":"802.1X","revisions":[2047,2047]},{"value":"802.1X-mac-based","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"framevid_apply":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable",'
+    '"revisions":[2040,2040]}],"revisions":[2040,2040]},"authserver_timeout_period":{"type":"integer","revisions":[1536,1536]},"eap_auto_untagged_vlans":{"'
+    'type":"string","options":[{"value":"disable","revisions":[1920,1920]},{"value":"enable","revisions":[1920,1920]}],"revisions":[1920,1920]},"name":{"ty'
+    'pe":"string","revisions":[2047,2047]},"guest_vlan_id":{"type":"string","revisions":[2047,2047]},"auth_fail_vlanid":{"type":"integer","revisions":[2047'
+    ',23]},"guest_auth_delay":{"type":"integer","revisions":[2047,2047]},"authserver_timeout_vlan":{"type":"string","options":[{"value":"disable","revision'
+    's":[1536,1536]},{"value":"enable","revisions":[1536,1536]}],"revisions":[1536,1536]},"policy_type":{"type":"string","options":[{"value":"802.1X","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"auth_fail_vlan":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enabl'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"eap_passthru":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":'
+    '"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"authserver_timeout_vlanid":{"type":"string","revisions":[1536,1536]},"guest_vlan":{"type"'
+    ':"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"user_group":{"t'
+    'ype":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"auth_fail_vlan_id":{"type":"string","revisions":[2'
+    '047,2047]},"radius_timeout_overwrite":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"open_auth":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"mac_auth_bypass":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"guest_vlanid":{"type":"integer","revisions":[2047,23]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"security_mode":{"type":"str","required":false,"choices":["802.1X","802.1X-mac-based"]},"framevid_apply":{"'
+    'type":"str","required":false,"choices":["disable","enable"]},"authserver_timeout_period":{"type":"int","required":false},"eap_auto_untagged_vlans":{"t'
+    'ype":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","required":false},"guest_vlan_id":{"type":"str","required":false},"au'
+    'th_fail_vlanid":{"type":"int","required":false},"guest_auth_delay":{"type":"int","required":false},"authserver_timeout_vlan":{"type":"str","required":'
+    'false,"choices":["disable","enable"]},"policy_type":{"type":"str","required":false,"choices":["802.1X"]},"auth_fail_vlan":{"type":"str","required":fal'
+    'se,"choices":["disable","enable"]},"eap_passthru":{"type":"str","required":false,"choices":["disable","enable"]},"authserver_timeout_vlanid":{"type":"'
+    'str","required":false},"guest_vlan":{"type":"str","required":false,"choices":["disable","enable"]},"user_group":{"type":"list","required":false,"optio'
+    'ns":{"name":{"type":"str","required":false}}},"auth_fail_vlan_id":{"type":"str","required":false},"radius_timeout_overwrite":{"type":"str","required":'
+    'false,"choices":["disable","enable"]},"open_auth":{"type":"str","required":false,"choices":["disable","enable"]},"mac_auth_bypass":{"type":"str","requ'
+    'ired":false,"choices":["disable","enable"]},"guest_vlanid":{"type":"int","required":false}}}'
+)
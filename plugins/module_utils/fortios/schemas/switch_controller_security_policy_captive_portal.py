@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"vlan":{"type":"string","revisions":[23,23]},"name":{"type":"string","revisions":[23,23]},"policy_type":{"type":"string","o'
+    'ptions":[{"value":"captive-portal","revisions":[23,23]}],"revisions":[23,23]}},"revisions":[23,23]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"vlan":{"type":"str","required":false},"name":{"type":"str","required":false},"policy_type":{"type":"str","'
+    'required":false,"choices":["captive-portal"]}}}'
+)
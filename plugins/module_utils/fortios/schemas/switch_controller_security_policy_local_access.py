@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"internal_allowaccess":{"multiple_values":true,"type":"list","options":[{"value":"https","revisions":[2040,2040]},{"value":'
+    '"ping","revisions":[2040,2040]},{"value":"ssh","revisions":[2040,2040]},{"value":"snmp","revisions":[2040,2040]},{"value":"http","revisions":[2040,204'
+    '0]},{"value":"telnet","revisions":[2040,2040]},{"value":"radius-acct","revisions":[2040,2040]}],"revisions":[2040,2040]},"name":{"type":"string","revi'
+    'sions":[2040,2040]},"mgmt_allowaccess":{"multiple_values":true,"type":"list","options":[{"value":"https","revisions":[2040,2040]},{"value":"ping","rev'
+    'isions":[2040,2040]},{"value":"ssh","revisions":[2040,2040]},{"value":"snmp","revisions":[2040,2040]},{"value":"http","revisions":[2040,2040]},{"value'
+    '":"telnet","revisions":[2040,2040]},{"value":"radius-acct","revisions":[2040,2040]}],"revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"internal_allowaccess":{"type":"list","required":false,"choices":["https","ping","ssh","snmp","http","telne'
+    't","radius-acct"]},"name":{"type":"str","required":false},"mgmt_allowaccess":{"type":"list","required":false,"choices":["https","ping","ssh","snmp","h'
+    'ttp","telnet","radius-acct"]}}}'
+)
@@ -0,0 +1,28 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}'
+    '],"revisions":[2040,2040]},"query_v1_port":{"type":"integer","revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]},"query_v1_statu'
+    's":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"id":{'
+    '"type":"integer","revisions":[2040,2040]},"trap_v2c_rport":{"type":"integer","revisions":[2040,2040]},"hosts":{"type":"list","children":{"ip":{"type":'
+    '"string","revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"trap_v1_status":{"type":"string","options'
+    '":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"trap_v1_lport":{"type":"integer",'
+    '"revisions":[2040,2040]},"trap_v2c_status":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040'
+    ',2040]}],"revisions":[2040,2040]},"trap_v1_rport":{"type":"integer","revisions":[2040,2040]},"events":{"multiple_values":true,"type":"list","options":'
+    '[{"value":"cpu-high","revisions":[2040,2040]},{"value":"mem-low","revisions":[2040,2040]},{"value":"log-full","revisions":[2040,2040]},{"value":"intf-'
+    'ip","revisions":[2040,2040]},{"value":"ent-conf-change","revisions":[2040,2040]}],"revisions":[2040,2040]},"query_v2c_status":{"type":"string","option'
+    's":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"trap_v2c_lport":{"type":"integer'
+    '","revisions":[2040,2040]},"query_v2c_port":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"query_v1_port":{"type":"int","requ'
+    'ired":false},"name":{"type":"str","required":false},"query_v1_status":{"type":"str","required":false,"choices":["disable","enable"]},"id":{"type":"int'
+    '","required":false},"trap_v2c_rport":{"type":"int","required":false},"hosts":{"type":"list","required":false,"options":{"ip":{"type":"str","required":'
+    'false},"id":{"type":"int","required":false}}},"trap_v1_status":{"type":"str","required":false,"choices":["disable","enable"]},"trap_v1_lport":{"type":'
+    '"int","required":false},"trap_v2c_status":{"type":"str","required":false,"choices":["disable","enable"]},"trap_v1_rport":{"type":"int","required":fals'
+    'e},"events":{"type":"list","required":false,"choices":["cpu-high","mem-low","log-full","intf-ip","ent-conf-change"]},"query_v2c_status":{"type":"str",'
+    '"required":false,"choices":["disable","enable"]},"trap_v2c_lport":{"type":"int","required":false},"query_v2c_port":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}'
+    '],"revisions":[2040,2040]},"description":{"type":"string","revisions":[2040,2040]},"contact_info":{"type":"string","revisions":[2040,2040]},"location"'
+    ':{"type":"string","revisions":[2040,2040]},"engine_id":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"description":{"type":"str","requir'
+    'ed":false},"contact_info":{"type":"str","required":false},"location":{"type":"str","required":false},"engine_id":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"trap_high_cpu_threshold":{"type":"integer","revisions":[2040,2040]},"trap_low_memory_threshold":{"type":"integer","revisio'
+    'ns":[2040,2040]},"trap_log_full_threshold":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"trap_high_cpu_threshold":{"type":"int","required":false},"trap_low_memory_threshold":{"type":"int","requir'
+    'ed":false},"trap_log_full_threshold":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]},"auth_pwd":{"type":"string","revisions":[2040,2040]},"priv_pwd":{"type":"s'
+    'tring","revisions":[2040,2040]},"priv_proto":{"type":"string","options":[{"value":"aes","revisions":[2040,1016]},{"value":"des","revisions":[2040,2040'
+    ']},{"value":"aes128","revisions":[1024,1024]},{"value":"aes192","revisions":[1024,1024]},{"value":"aes192c","revisions":[1024,1024]},{"value":"aes256"'
+    ',"revisions":[1024,1024]},{"value":"aes256c","revisions":[1024,1024]}],"revisions":[2040,2040]},"queries":{"type":"string","options":[{"value":"disabl'
+    'e","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"query_port":{"type":"integer","revisions":[2040,2040'
+    ']},"security_level":{"type":"string","options":[{"value":"no-auth-no-priv","revisions":[2040,2040]},{"value":"auth-no-priv","revisions":[2040,2040]},{'
+    '"value":"auth-priv","revisions":[2040,2040]}],"revisions":[2040,2040]},"auth_proto":{"type":"string","options":[{"value":"md5","revisions":[2040,2040]'
+    '},{"value":"sha","revisions":[2040,1016]},{"value":"sha1","revisions":[1024,1024]},{"value":"sha224","revisions":[1024,1024]},{"value":"sha256","revis'
+    'ions":[1024,1024]},{"value":"sha384","revisions":[1024,1024]},{"value":"sha512","revisions":[1024,1024]}],"revisions":[2040,2040]}},"revisions":[2040,'
+    '2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"auth_pwd":{"type":"str","required":false},"priv_pwd":{"type":"str",'
+    '"required":false},"priv_proto":{"type":"str","required":false},"queries":{"type":"str","required":false,"choices":["disable","enable"]},"query_port":{'
+    '"type":"int","required":false},"security_level":{"type":"str","required":false,"choices":["no-auth-no-priv","auth-no-priv","auth-priv"]},"auth_proto":'
+    '{"type":"str","required":false}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"broadcast":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"rate":{"type":"integer","revisions":[2047,2047]},"unknown_unicast":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"unknown_multicast":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"broadcast":{"type":"str","required":false,"choices":["enable","disable"]},"rate":{"type":"int","required":'
+    'false},"unknown_unicast":{"type":"str","required":false,"choices":["enable","disable"]},"unknown_multicast":{"type":"str","required":false,"choices":['
+    '"enable","disable"]}}}'
+)
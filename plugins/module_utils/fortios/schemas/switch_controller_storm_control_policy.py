@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]},"storm_control_mode":{"type":"string","options":[{"value":"global","revisi'
+    'ons":[2040,2040]},{"value":"override","revisions":[2040,2040]},{"value":"disabled","revisions":[2040,2040]}],"revisions":[2040,2040]},"broadcast":{"ty'
+    'pe":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"rate":{"type'
+    '":"integer","revisions":[2040,2040]},"unknown_unicast":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revi'
+    'sions":[2040,2040]}],"revisions":[2040,2040]},"unknown_multicast":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"dis'
+    'able","revisions":[2040,2040]}],"revisions":[2040,2040]},"description":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"storm_control_mode":{"type":"str","required":false,"choices":["glob'
+    'al","override","disabled"]},"broadcast":{"type":"str","required":false,"choices":["enable","disable"]},"rate":{"type":"int","required":false},"unknown'
+    '_unicast":{"type":"str","required":false,"choices":["enable","disable"]},"unknown_multicast":{"type":"str","required":false,"choices":["enable","disab'
+    'le"]},"description":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"vlan_range":{"type":"list","children":{"vlan_name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"id'
+    '":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"vlan_range":{"type":"list","required":false,"options":{"vlan_name":{"type":"str","required":false}}},"id":'
+    '{"type":"str","required":false}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[23,23]},{"value":"disable","revisions":[23,23]}],"revis'
+    'ions":[2047,23]},"max_age":{"type":"integer","revisions":[2047,2047]},"pending_timer":{"type":"integer","revisions":[2047,2047]},"name":{"type":"strin'
+    'g","revisions":[2047,2047]},"hello_time":{"type":"integer","revisions":[2047,2047]},"max_hops":{"type":"integer","revisions":[2047,2047]},"forward_tim'
+    'e":{"type":"integer","revisions":[2047,2047]},"revision":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false},"max_age":{"type":"int","required":false},"pending_timer":{"type":'
+    '"int","required":false},"name":{"type":"str","required":false},"hello_time":{"type":"int","required":false},"max_hops":{"type":"int","required":false}'
+    ',"forward_time":{"type":"int","required":false},"revision":{"type":"int","required":false}}}'
+)
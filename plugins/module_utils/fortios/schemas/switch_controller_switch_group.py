@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"fortilink":{"type":"string","revisions":[1920,1664]},"name":{"type":"string","revisions":[2047,2047]},"members":{"type":"l'
+    'ist","children":{"switch_id":{"type":"string","revisions":[1920,1920]},"name":{"type":"string","revisions":[2047,127]}},"revisions":[2047,2047]},"desc'
+    'ription":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"fortilink":{"type":"str","required":false},"name":{"type":"str","required":false},"members":{"type":"list"'
+    ',"required":false,"options":{"switch_id":{"type":"str","required":false},"name":{"type":"str","required":false}}},"description":{"type":"str","require'
+    'd":false}}}'
+)
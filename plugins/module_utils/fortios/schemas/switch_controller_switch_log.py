@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"emergency","revisions":[2047,2047]},{"value":"alert","revisions":[2047,204'
+    '7]},{"value":"critical","revisions":[2047,2047]},{"value":"error","revisions":[2047,2047]},{"value":"warning","revisions":[2047,2047]},{"value":"notif'
+    'ication","revisions":[2047,2047]},{"value":"information","revisions":[2047,2047]},{"value":"debug","revisions":[2047,2047]}],"revisions":[2047,2047]}}'
+    ',"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"severity":{"type":"str","required"'
+    ':false,"choices":["emergency","alert","critical","error","warning","notification","information","debug"]}}}'
+)
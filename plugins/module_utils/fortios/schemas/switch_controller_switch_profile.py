@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"login_passwd":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"login_passwd_ove'
+    'rride":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"'
+    'revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"login_passwd":{"type":"str","required":false},"name":{"type":"str","required":false},"login_passwd_overrid'
+    'e":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
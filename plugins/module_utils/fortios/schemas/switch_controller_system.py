@@ -0,0 +1,20 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"tunnel_mode":{"type":"string","options":[{"value":"compatible","revisions":[1024,1024]},{"value":"strict","revisions":[102'
+    '4,1024]}],"revisions":[1024,1024]},"iot_holdoff":{"type":"integer","revisions":[1920,1920]},"iot_scan_interval":{"type":"integer","revisions":[1920,19'
+    '20]},"parallel_process_override":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"iot_mac_idle":{"type":"integer","revisions":[1920,1920]},"nac_periodic_interval":{"type":"integer","revisions":[1024,1024]},"'
+    'data_sync_interval":{"type":"integer","revisions":[2040,2040]},"dynamic_periodic_interval":{"type":"integer","revisions":[1024,1024]},"iot_weight_thre'
+    'shold":{"type":"integer","revisions":[1920,1920]},"parallel_process":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"tunnel_mode":{"type":"str","required":false,"choices":["compatible","strict"]},"iot_holdoff":{"type":"int"'
+    ',"required":false},"iot_scan_interval":{"type":"int","required":false},"parallel_process_override":{"type":"str","required":false,"choices":["disable"'
+    ',"enable"]},"iot_mac_idle":{"type":"int","required":false},"nac_periodic_interval":{"type":"int","required":false},"data_sync_interval":{"type":"int",'
+    '"required":false},"dynamic_periodic_interval":{"type":"int","required":false},"iot_weight_threshold":{"type":"int","required":false},"parallel_process'
+    '":{"type":"int","required":false}}}'
+)
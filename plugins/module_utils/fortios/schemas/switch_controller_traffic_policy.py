@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"cos_queue":{"type":"integer","revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]},"policer_status":{"'
+    'type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"maximum_bu'
+    'rst":{"type":"integer","revisions":[2040,2040]},"guaranteed_burst":{"type":"integer","revisions":[2040,2040]},"guaranteed_bandwidth":{"type":"integer"'
+    ',"revisions":[2040,2040]},"type":{"type":"string","options":[{"value":"ingress","revisions":[2040,2040]},{"value":"egress","revisions":[2040,2040]}],"'
+    'revisions":[2040,2040]},"id":{"type":"integer","revisions":[2032,16]},"description":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]'
+    '}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"cos_queue":{"type":"int","required":false},"name":{"type":"str","required":false},"policer_status":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]},"maximum_burst":{"type":"int","required":false},"guaranteed_burst":{"type":"int","required":fa'
+    'lse},"guaranteed_bandwidth":{"type":"int","required":false},"type":{"type":"str","required":false,"choices":["ingress","egress"]},"id":{"type":"int","'
+    'required":false},"description":{"type":"str","required":false}}}'
+)
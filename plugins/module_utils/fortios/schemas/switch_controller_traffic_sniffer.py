@@ -0,0 +1,25 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"target_ip":{"type":"list","children":{"ip":{"type":"string","revisions":[2040,2040]},"dst_entry_id":{"type":"integer","rev'
+    'isions":[2032,16]},"description":{"type":"string","revisions":[2040,2040]},"src_entry_id":{"type":"integer","revisions":[2032,16]}},"revisions":[2040,'
+    '2040]},"target_port":{"type":"list","children":{"in_ports":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2'
+    '040,2040]},"out_ports":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"switch_id":{"type":"stri'
+    'ng","revisions":[2040,2040]},"description":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"mode":{"type":"string","options":[{"va'
+    'lue":"erspan-auto","revisions":[2040,2040]},{"value":"rspan","revisions":[2040,2040]},{"value":"none","revisions":[2040,2040]}],"revisions":[2040,2040'
+    ']},"erspan_ip":{"type":"string","revisions":[2040,2040]},"target_mac":{"type":"list","children":{"mac":{"type":"string","revisions":[2040,2040]},"dst_'
+    'entry_id":{"type":"integer","revisions":[2032,16]},"description":{"type":"string","revisions":[2040,2040]},"src_entry_id":{"type":"integer","revisions'
+    '":[2032,16]}},"revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"target_ip":{"type":"list","required":false,"options":{"ip":{"type":"str","required":false},"dst_entry_id":'
+    '{"type":"int","required":false},"description":{"type":"str","required":false},"src_entry_id":{"type":"int","required":false}}},"target_port":{"type":"'
+    'list","required":false,"options":{"in_ports":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"out_ports":{"type":"'
+    'list","required":false,"options":{"name":{"type":"str","required":false}}},"switch_id":{"type":"str","required":false},"description":{"type":"str","re'
+    'quired":false}}},"mode":{"type":"str","required":false,"choices":["erspan-auto","rspan","none"]},"erspan_ip":{"type":"str","required":false},"target_m'
+    'ac":{"type":"list","required":false,"options":{"mac":{"type":"str","required":false},"dst_entry_id":{"type":"int","required":false},"description":{"ty'
+    'pe":"str","required":false},"src_entry_id":{"type":"int","required":false}}}}}'
+)
@@ -0,0 +1,25 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[23,23]},"color":{"type":"integer","revisions":[23,23]},"selected_usergroups":{"type":"'
+    'list","children":{"name":{"type":"string","revisions":[23,23]}},"revisions":[23,23]},"comments":{"type":"string","revisions":[23,23]},"portal_message_'
+    'override_group":{"type":"string","revisions":[23,23]},"vlanid":{"type":"integer","revisions":[23,23]},"usergroup":{"type":"string","revisions":[23,23]'
+    '},"security":{"type":"string","options":[{"value":"open","revisions":[23,23]},{"value":"captive-portal","revisions":[23,23]},{"value":"8021x","revisio'
+    'ns":[23,23]}],"revisions":[23,23]},"auth":{"type":"string","options":[{"value":"radius","revisions":[23,23]},{"value":"usergroup","revisions":[23,23]}'
+    '],"revisions":[23,23]},"portal_message_overrides":{"type":"dict","children":{"auth_login_failed_page":{"type":"string","revisions":[23,23]},"auth_disc'
+    'laimer_page":{"type":"string","revisions":[23,23]},"auth_login_page":{"type":"string","revisions":[23,23]},"auth_reject_page":{"type":"string","revisi'
+    'ons":[23,23]}},"revisions":[23,23]},"vdom":{"type":"string","revisions":[23,23]},"radius_server":{"type":"string","revisions":[23,23]}},"revisions":[2'
+    '3,23]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"color":{"type":"int","required":false},"selected_usergroups":{"type'
+    '":"list","required":false,"options":{"name":{"type":"str","required":false}}},"comments":{"type":"str","required":false},"portal_message_override_grou'
+    'p":{"type":"str","required":false},"vlanid":{"type":"int","required":false},"usergroup":{"type":"str","required":false},"security":{"type":"str","requ'
+    'ired":false,"choices":["open","captive-portal","8021x"]},"auth":{"type":"str","required":false,"choices":["radius","usergroup"]},"portal_message_overr'
+    'ides":{"type":"dict","required":false,"options":{"auth_login_failed_page":{"type":"str","required":false},"auth_disclaimer_page":{"type":"str","requir'
+    'ed":false},"auth_login_page":{"type":"str","required":false},"auth_reject_page":{"type":"str","required":false}}},"vdom":{"type":"str","required":fals'
+    'e},"radius_server":{"type":"str","required":false}}}'
+)
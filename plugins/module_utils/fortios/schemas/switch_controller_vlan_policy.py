@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"fortilink":{"type":"string","revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1920]},"vlan":{"type":"stri'
+    'ng","revisions":[1920,1920]},"discard_mode":{"type":"string","options":[{"value":"none","revisions":[1920,1920]},{"value":"all-untagged","revisions":['
+    '1920,1920]},{"value":"all-tagged","revisions":[1920,1920]}],"revisions":[1920,1920]},"untagged_vlans":{"type":"list","children":{"vlan_name":{"type":"'
+    'string","revisions":[1920,1920]}},"revisions":[1920,1920]},"allowed_vlans":{"type":"list","children":{"vlan_name":{"type":"string","revisions":[1920,1'
+    '920]}},"revisions":[1920,1920]},"allowed_vlans_all":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisio'
+    'ns":[1920,1920]}],"revisions":[1920,1920]},"description":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"fortilink":{"type":"str","required":false},"name":{"type":"str","required":false},"vlan":{"type":"str","re'
+    'quired":false},"discard_mode":{"type":"str","required":false,"choices":["none","all-untagged","all-tagged"]},"untagged_vlans":{"type":"list","required'
+    '":false,"options":{"vlan_name":{"type":"str","required":false}}},"allowed_vlans":{"type":"list","required":false,"options":{"vlan_name":{"type":"str",'
+    '"required":false}}},"allowed_vlans_all":{"type":"str","required":false,"choices":["enable","disable"]},"description":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"vendor":{"type":"string","revisions":[2047,2047]},"product_id":{"type":"string","revisions":[2047,2047]},"modeswitch_strin'
+    'g":{"type":"string","revisions":[2040,1768]},"class_id":{"type":"string","revisions":[2047,2047]},"vendor_id":{"type":"string","revisions":[2047,2047]'
+    '},"id":{"type":"integer","revisions":[2047,2047]},"model":{"type":"string","revisions":[2047,2047]},"init_string":{"type":"string","revisions":[2047,2'
+    '047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"vendor":{"type":"str","required":false},"product_id":{"type":"str","required":false},"modeswitch_string":{'
+    '"type":"str","required":false},"class_id":{"type":"str","required":false},"vendor_id":{"type":"str","required":false},"id":{"type":"int","required":fa'
+    'lse},"model":{"type":"str","required":false},"init_string":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,97 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ftviewgrp":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{'
+    '"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"admintimeout":{"type":"integer","revisions":[2047,2047]},"admintimeout_overri'
+    'de":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"logg'
+    'rp":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2'
+    '047,2047]},{"value":"custom","revisions":[2047,2047]}],"revisions":[2047,2047]},"netgrp_permission":{"type":"dict","children":{"cfg":{"type":"string",'
+    '"options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"packet_capture":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value'
+    '":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"route_cfg":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"v'
+    'alue":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"sysgrp_permi'
+    'ssion":{"type":"dict","children":{"admin":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]'
+    '},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"cfg":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},'
+    '{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"upd":{"type":"string","options":[{"'
+    'value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"mnt":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"loggrp_permission":{"type":"dict","children":{"data_access":{"type":"string","opt'
+    'ions":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"config":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-writ'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"report_access":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"r'
+    'ead","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"threat_weight":{"type":"string","options":[{"v'
+    'alue":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '}},"revisions":[2047,2047]},"utmgrp":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"v'
+    'alue":"read-write","revisions":[2047,2047]},{"value":"custom","revisions":[2047,2047]}],"revisions":[2047,2047]},"fwgrp":{"type":"string","options":[{'
+    '"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]},{"value":"custom","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},"scope":{"type":"string","options":[{"value":"vdom'
+    '","revisions":[2047,2047]},{"value":"global","revisions":[2047,2047]}],"revisions":[2047,2047]},"secfabgrp":{"type":"string","options":[{"value":"none'
+    '","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"vpngrp":'
+    '{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"sysgrp":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]'
+    '},{"value":"read-write","revisions":[2047,2047]},{"value":"custom","revisions":[2047,2047]}],"revisions":[2047,2047]},"fwgrp_permission":{"type":"dict'
+    '","children":{"policy":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-wr'
+    'ite","revisions":[2047,2047]}],"revisions":[2047,2047]},"schedule":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read'
+    '","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"service":{"type":"string","options":[{"value":"no'
+    'ne","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"addres'
+    's":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"system_diagnostics":{"type":"string","options":[{"value":"enable","revisions":[1920,192'
+    '0]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"name":{"type":"string","revisions":[2047,2047]},"utmgrp_permission":{"type"'
+    ':"dict","children":{"emailfilter":{"type":"string","options":[{"value":"none","revisions":[2040,2040]},{"value":"read","revisions":[2040,2040]},{"valu'
+    'e":"read-write","revisions":[2040,2040]}],"revisions":[2040,2040]},"waf":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value"'
+    ':"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"dnsfilter":{"type":"string","options":[{"va'
+    'lue":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"file_filter":{"type":"string","options":[{"value":"none","revisions":[1920,1920]},{"value":"read","revisions":[1920,1920]},{"value":"read-write","re'
+    'visions":[1920,1920]}],"revisions":[1920,1920]},"antivirus":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revi'
+    'sions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"icap":{"type":"string","options":[{"value":"none","revis'
+    'ions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"ips":{"type":"st'
+    'ring","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"spamfilter":{"type":"string","options":[{"value":"none","revisions":[7,7]},{"value":"read","revisions":[7,7]},{"value":"read-wr'
+    'ite","revisions":[7,7]}],"revisions":[2047,7]},"endpoint_control":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read"'
+    ',"revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"webfilter":{"type":"string","options":[{"value":"n'
+    'one","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"appli'
+    'cation_control":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]},"mmsgtp":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisi'
+    'ons":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,1023]},"voip":{"type":"string","options":[{"value":"none","revisio'
+    'ns":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"data_loss_preventi'
+    'on":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"wifi":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"r'
+    'ead","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"netgrp":{"type":"string","options":[{"value":"'
+    'none","revisions":[2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]},{"value":"custom","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"wanoptgrp":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"read","revisions":[20'
+    '47,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]},"authgrp":{"type":"string","options":[{"value":"none","revisions":['
+    '2047,2047]},{"value":"read","revisions":[2047,2047]},{"value":"read-write","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]'
+    '}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ftviewgrp":{"type":"str","required":false,"choices":["none","read","read-write"]},"admintimeout":{"type":"'
+    'int","required":false},"admintimeout_override":{"type":"str","required":false,"choices":["enable","disable"]},"loggrp":{"type":"str","required":false,'
+    '"choices":["none","read","read-write","custom"]},"netgrp_permission":{"type":"dict","required":false,"options":{"cfg":{"type":"str","required":false,"'
+    'choices":["none","read","read-write"]},"packet_capture":{"type":"str","required":false,"choices":["none","read","read-write"]},"route_cfg":{"type":"st'
+    'r","required":false,"choices":["none","read","read-write"]}}},"sysgrp_permission":{"type":"dict","required":false,"options":{"admin":{"type":"str","re'
+    'quired":false,"choices":["none","read","read-write"]},"cfg":{"type":"str","required":false,"choices":["none","read","read-write"]},"upd":{"type":"str"'
+    ',"required":false,"choices":["none","read","read-write"]},"mnt":{"type":"str","required":false,"choices":["none","read","read-write"]}}},"loggrp_permi'
+    'ssion":{"type":"dict","required":false,"options":{"data_access":{"type":"str","required":false,"choices":["none","read","read-write"]},"config":{"type'
+    '":"str","required":false,"choices":["none","read","read-write"]},"report_access":{"type":"str","required":false,"choices":["none","read","read-write"]'
+    '},"threat_weight":{"type":"str","required":false,"choices":["none","read","read-write"]}}},"utmgrp":{"type":"str","required":false,"choices":["none","'
+    'read","read-write","custom"]},"fwgrp":{"type":"str","required":false,"choices":["none","read","read-write","custom"]},"comments":{"type":"str","requir'
+    'ed":false},"scope":{"type":"str","required":false,"choices":["vdom","global"]},"secfabgrp":{"type":"str","required":false,"choices":["none","read","re'
+    'ad-write"]},"vpngrp":{"type":"str","required":false,"choices":["none","read","read-write"]},"sysgrp":{"type":"str","required":false,"choices":["none",'
+    '"read","read-write","custom"]},"fwgrp_permission":{"type":"dict","required":false,"options":{"policy":{"type":"str","required":false,"choices":["none"'
+    ',"read","read-write"]},"schedule":{"type":"str","required":false,"choices":["none","read","read-write"]},"service":{"type":"str","required":false,"cho'
+    'ices":["none","read","read-write"]},"address":{"type":"str","required":false,"choices":["none","read","read-write"]}}},"system_diagnostics":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"utmgrp_permission":{"type":"dict","required":false,"optio'
+    'ns":{"emailfilter":{"type":"str","required":false,"choices":["none","read","read-write"]},"waf":{"type":"str","required":false,"choices":["none","read'
+    '","read-write"]},"dnsfilter":{"type":"str","required":false,"choices":["none","read","read-write"]},"file_filter":{"type":"str","required":false,"choi'
+    'ces":["none","read","read-write"]},"antivirus":{"type":"str","required":false,"choices":["none","read","read-write"]},"icap":{"type":"str","required":'
+    'false,"choices":["none","read","read-write"]},"ips":{"type":"str","required":false,"choices":["none","read","read-write"]},"spamfilter":{"type":"str",'
+    '"required":false},"endpoint_control":{"type":"str","required":false,"choices":["none","read","read-write"]},"webfilter":{"type":"str","required":false'
+    ',"choices":["none","read","read-write"]},"application_control":{"type":"str","required":false,"choices":["none","read","read-write"]},"mmsgtp":{"type"'
+    ':"str","required":false,"choices":["none","read","read-write"]},"voip":{"type":"str","required":false,"choices":["none","read","read-write"]},"data_lo'
+    'ss_prevention":{"type":"str","required":false,"choices":["none","read","read-write"]}}},"wifi":{"type":"str","required":false,"choices":["none","read"'
+    ',"read-write"]},"netgrp":{"type":"str","required":false,"choices":["none","read","read-write","custom"]},"wanoptgrp":{"type":"str","required":false,"c'
+    'hoices":["none","read","read-write"]},"authgrp":{"type":"str","required":false,"choices":["none","read","read-write"]}}}'
+)
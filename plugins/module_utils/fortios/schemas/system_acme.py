@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"interface":{"type":"list","children":{"interface_name":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]}'
+    ',"accounts":{"type":"list","children":{"status":{"type":"string","revisions":[1024,1024]},"url":{"type":"string","revisions":[1024,1024]},"privatekey"'
+    ':{"type":"string","revisions":[1024,1024]},"email":{"type":"string","revisions":[1024,1024]},"ca_url":{"type":"string","revisions":[1024,1024]},"id":{'
+    '"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"interface":{"type":"list","required":false,"options":{"interface_name":{"type":"str","required":false}}},"'
+    'accounts":{"type":"list","required":false,"options":{"status":{"type":"str","required":false},"url":{"type":"str","required":false},"privatekey":{"typ'
+    'e":"str","required":false},"email":{"type":"str","required":false},"ca_url":{"type":"str","required":false},"id":{"type":"str","required":false}}}}}'
+)
@@ -0,0 +1,99 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"gui_vdom_menu_favorites":{"type":"list","children":{"id":{"type":"string","revisions":[23,23]}},"revisions":[2047,23]},"re'
+    'mote_group":{"type":"string","revisions":[2047,2047]},"accprofile":{"type":"string","revisions":[2047,2047]},"allow_remove_admin_session":{"type":"str'
+    'ing","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"two_factor_notificat'
+    'ion":{"type":"string","options":[{"value":"email","revisions":[2024,2024]},{"value":"sms","revisions":[2024,2024]}],"revisions":[2040,2024]},"peer_aut'
+    'h":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"guest'
+    '_lang":{"type":"string","revisions":[2047,2047]},"guest_auth":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_new_feature_acknowledge":{"type":"list","children":{"id":{"type":"string","revisions":[16,16'
+    ']}},"revisions":[2032,16]},"ip6_trusthost2":{"type":"string","revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},"gui_dashbo'
+    'ard":{"type":"list","children":{"widget":{"type":"list","children":{"x_pos":{"type":"integer","revisions":[23,23]},"title":{"type":"string","revisions'
+    '":[23,23]},"fortiview_type":{"type":"string","revisions":[23,23]},"industry":{"type":"string","options":[{"value":"default","revisions":[23,23]},{"val'
+    'ue":"custom","revisions":[23,23]}],"revisions":[23,23]},"region":{"type":"string","options":[{"value":"default","revisions":[23,23]},{"value":"custom"'
+    ',"revisions":[23,23]}],"revisions":[23,23]},"fortiview_sort_by":{"type":"string","revisions":[23,23]},"fortiview_device":{"type":"string","revisions":'
+    '[16,16]},"fortiview_filters":{"type":"list","children":{"value":{"type":"string","revisions":[23,23]},"id":{"type":"integer","revisions":[23,23]},"key'
+    '":{"type":"string","revisions":[23,23]}},"revisions":[23,23]},"height":{"type":"integer","revisions":[23,23]},"fabric_device":{"type":"string","revisi'
+    'ons":[23,23]},"interface":{"type":"string","revisions":[23,23]},"fortiview_visualization":{"type":"string","revisions":[23,23]},"fabric_device_widget_'
+    'visualization_type":{"type":"string","revisions":[16,16]},"y_pos":{"type":"integer","revisions":[23,23]},"id":{"type":"integer","revisions":[23,23]},"'
+    'fabric_device_widget_name":{"type":"string","revisions":[16,16]},"fortiview_timeframe":{"type":"string","revisions":[23,23]},"type":{"type":"string","'
+    'options":[{"value":"sysinfo","revisions":[23,23]},{"value":"licinfo","revisions":[23,23]},{"value":"forticloud","revisions":[23,23]},{"value":"cpu-usa'
+    'ge","revisions":[23,23]},{"value":"memory-usage","revisions":[23,23]},{"value":"disk-usage","revisions":[23,23]},{"value":"log-rate","revisions":[23,2'
+    '3]},{"value":"sessions","revisions":[23,23]},{"value":"session-rate","revisions":[23,23]},{"value":"tr-history","revisions":[23,23]},{"value":"analyti'
+    'cs","revisions":[23,23]},{"value":"usb-modem","revisions":[23,23]},{"value":"admins","revisions":[23,23]},{"value":"security-fabric","revisions":[23,2'
+    '3]},{"value":"security-fabric-ranking","revisions":[23,23]},{"value":"sensor-info","revisions":[23,23]},{"value":"ha-status","revisions":[23,23]},{"va'
+    'lue":"vulnerability-summary","revisions":[23,23]},{"value":"host-scan-summary","revisions":[23,23]},{"value":"fortiview","revisions":[23,23]},{"value"'
+    ':"botnet-activity","revisions":[23,23]},{"value":"fortimail","revisions":[23,7]},{"value":"fabric-device","revisions":[16,16]}],"revisions":[23,23]},"'
+    'width":{"type":"integer","revisions":[23,23]}},"revisions":[23,23]},"name":{"type":"string","revisions":[23,23]},"permanent":{"type":"string","options'
+    '":[{"value":"disable","revisions":[16,16]},{"value":"enable","revisions":[16,16]}],"revisions":[16,16]},"vdom":{"type":"string","revisions":[16,16]},"'
+    'scope":{"type":"string","options":[{"value":"global","revisions":[7,7]},{"value":"vdom","revisions":[7,7]}],"revisions":[23,7]},"layout_type":{"type":'
+    '"string","options":[{"value":"responsive","revisions":[23,23]},{"value":"fixed","revisions":[23,23]}],"revisions":[23,23]},"id":{"type":"integer","rev'
+    'isions":[23,23]},"columns":{"type":"integer","revisions":[23,23]}},"revisions":[2047,23]},"ip6_trusthost1":{"type":"string","revisions":[2047,2047]},"'
+    'peer_group":{"type":"string","revisions":[2047,2047]},"ip6_trusthost3":{"type":"string","revisions":[2047,2047]},"ip6_trusthost4":{"type":"string","re'
+    'visions":[2047,2047]},"ip6_trusthost5":{"type":"string","revisions":[2047,2047]},"ip6_trusthost6":{"type":"string","revisions":[2047,2047]},"ip6_trust'
+    'host7":{"type":"string","revisions":[2047,2047]},"ip6_trusthost8":{"type":"string","revisions":[2047,2047]},"ip6_trusthost9":{"type":"string","revisio'
+    'ns":[2047,2047]},"sms_custom_server":{"type":"string","revisions":[2047,2047]},"remote_auth":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssh_certificate":{"type":"string","revisions":[2047,2047]},"login'
+    '_time":{"type":"list","children":{"last_login":{"type":"string","revisions":[23,23]},"last_failed_login":{"type":"string","revisions":[23,23]},"usr_na'
+    'me":{"type":"string","revisions":[23,23]}},"revisions":[2047,23]},"sms_server":{"type":"string","options":[{"value":"fortiguard","revisions":[2047,204'
+    '7]},{"value":"custom","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip6_trusthost10":{"type":"string","revisions":[2047,2047]},"trusthost8":{"ty'
+    'pe":"string","revisions":[2047,2047]},"trusthost9":{"type":"string","revisions":[2047,2047]},"trusthost6":{"type":"string","revisions":[2047,2047]},"t'
+    'rusthost7":{"type":"string","revisions":[2047,2047]},"trusthost4":{"type":"string","revisions":[2047,2047]},"trusthost5":{"type":"string","revisions":'
+    '[2047,2047]},"trusthost2":{"type":"string","revisions":[2047,2047]},"trusthost3":{"type":"string","revisions":[2047,2047]},"schedule":{"type":"string"'
+    ',"revisions":[2047,2047]},"trusthost1":{"type":"string","revisions":[2047,2047]},"history0":{"type":"string","revisions":[2047,23]},"history1":{"type"'
+    ':"string","revisions":[2047,23]},"ssh_public_key3":{"type":"string","revisions":[2047,2047]},"ssh_public_key2":{"type":"string","revisions":[2047,2047'
+    ']},"email_to":{"type":"string","revisions":[2047,2047]},"guest_usergroups":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}'
+    '},"revisions":[2047,2047]},"radius_vdom_override":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"gui_global_menu_favorites":{"type":"list","children":{"id":{"type":"string","revisions":[23,23]}},"revisions'
+    '":[2047,23]},"password":{"type":"string","revisions":[2047,2047]},"hidden":{"type":"integer","revisions":[2047,7]},"vdom":{"type":"list","children":{"'
+    'name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"fortitoken":{"type":"string","revisions":[2047,2047]},"ssh_public_key1":{"t'
+    'ype":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"accprofile_override":{"type":"string","options":[{"value":"en'
+    'able","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"password_expire":{"type":"string","revisions":[2'
+    '047,2047]},"two_factor":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"fortitoken","revisions":[2047,2047]},{"value'
+    '":"email","revisions":[2047,2047]},{"value":"sms","revisions":[2047,2047]},{"value":"fortitoken-cloud","revisions":[2040,2040]}],"revisions":[2047,204'
+    '7]},"sms_phone":{"type":"string","revisions":[2047,2047]},"wildcard":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"'
+    'disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"force_password_change":{"type":"string","options":[{"value":"enable","revisions":[2047,20'
+    '47]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"two_factor_authentication":{"type":"string","options":[{"value":"fortitoke'
+    'n","revisions":[2024,2024]},{"value":"email","revisions":[2024,2024]},{"value":"sms","revisions":[2024,2024]}],"revisions":[2040,2024]},"trusthost10":'
+    '{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"gui_vdom_menu_favorites":{"type":"list","required":false,"options":{"id":{"type":"str","required":false}}}'
+    ',"remote_group":{"type":"str","required":false},"accprofile":{"type":"str","required":false},"allow_remove_admin_session":{"type":"str","required":fal'
+    'se,"choices":["enable","disable"]},"two_factor_notification":{"type":"str","required":false},"peer_auth":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"guest_lang":{"type":"str","required":false},"guest_auth":{"type":"str","required":false,"choices":["disable","enable"]},"gui_new_fe'
+    'ature_acknowledge":{"type":"list","required":false,"options":{"id":{"type":"str","required":false}}},"ip6_trusthost2":{"type":"str","required":false},'
+    '"comments":{"type":"str","required":false},"gui_dashboard":{"type":"list","required":false,"options":{"widget":{"type":"list","required":false,"option'
+    's":{"x_pos":{"type":"int","required":false},"title":{"type":"str","required":false},"fortiview_type":{"type":"str","required":false},"industry":{"type'
+    '":"str","required":false,"choices":["default","custom"]},"region":{"type":"str","required":false,"choices":["default","custom"]},"fortiview_sort_by":{'
+    '"type":"str","required":false},"fortiview_device":{"type":"str","required":false},"fortiview_filters":{"type":"list","required":false,"options":{"valu'
+    'e":{"type":"str","required":false},"id":{"type":"int","required":false},"key":{"type":"str","required":false}}},"height":{"type":"int","required":fals'
+    'e},"fabric_device":{"type":"str","required":false},"interface":{"type":"str","required":false},"fortiview_visualization":{"type":"str","required":fals'
+    'e},"fabric_device_widget_visualization_type":{"type":"str","required":false},"y_pos":{"type":"int","required":false},"id":{"type":"int","required":fal'
+    'se},"fabric_device_widget_name":{"type":"str","required":false},"fortiview_timeframe":{"type":"str","required":false},"type":{"type":"str","required":'
+    'false},"width":{"type":"int","required":false}}},"name":{"type":"str","required":false},"permanent":{"type":"str","required":false,"choices":["disable'
+    '","enable"]},"vdom":{"type":"str","required":false},"scope":{"type":"str","required":false},"layout_type":{"type":"str","required":false,"choices":["r'
+    'esponsive","fixed"]},"id":{"type":"int","required":false},"columns":{"type":"int","required":false}}},"ip6_trusthost1":{"type":"str","required":false}'
+    ',"peer_group":{"type":"str","required":false},"ip6_trusthost3":{"type":"str","required":false},"ip6_trusthost4":{"type":"str","required":false},"ip6_t'
+    'rusthost5":{"type":"str","required":false},"ip6_trusthost6":{"type":"str","required":false},"ip6_trusthost7":{"type":"str","required":false},"ip6_trus'
+    'thost8":{"type":"str","required":false},"ip6_trusthost9":{"type":"str","required":false},"sms_custom_server":{"type":"str","required":false},"remote_a'
+    'uth":{"type":"str","required":false,"choices":["enable","disable"]},"ssh_certificate":{"type":"str","required":false},"login_time":{"type":"list","req'
+    'uired":false,"options":{"last_login":{"type":"str","required":false},"last_failed_login":{"type":"str","required":false},"usr_name":{"type":"str","req'
+    'uired":false}}},"sms_server":{"type":"str","required":false,"choices":["fortiguard","custom"]},"ip6_trusthost10":{"type":"str","required":false},"trus'
+    'thost8":{"type":"str","required":false},"trusthost9":{"type":"str","required":false},"trusthost6":{"type":"str","required":false},"trusthost7":{"type"'
+    ':"str","required":false},"trusthost4":{"type":"str","required":false},"trusthost5":{"type":"str","required":false},"trusthost2":{"type":"str","require'
+    'd":false},"trusthost3":{"type":"str","required":false},"schedule":{"type":"str","required":false},"trusthost1":{"type":"str","required":false},"histor'
+    'y0":{"type":"str","required":false},"history1":{"type":"str","required":false},"ssh_public_key3":{"type":"str","required":false},"ssh_public_key2":{"t'
+    'ype":"str","required":false},"email_to":{"type":"str","required":false},"guest_usergroups":{"type":"list","required":false,"options":{"name":{"type":"'
+    'str","required":false}}},"radius_vdom_override":{"type":"str","required":false,"choices":["enable","disable"]},"gui_global_menu_favorites":{"type":"li'
+    'st","required":false,"options":{"id":{"type":"str","required":false}}},"password":{"type":"str","required":false},"hidden":{"type":"int","required":fa'
+    'lse},"vdom":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"fortitoken":{"type":"str","required":false},"ssh_publ'
+    'ic_key1":{"type":"str","required":false},"name":{"type":"str","required":false},"accprofile_override":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"password_expire":{"type":"str","required":false},"two_factor":{"type":"str","required":false},"sms_phone":{"type":"str","required":fal'
+    'se},"wildcard":{"type":"str","required":false,"choices":["enable","disable"]},"force_password_change":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"two_factor_authentication":{"type":"str","required":false},"trusthost10":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"interface":{"type":"string","revisions":[1024,1024]},"rxqid":{"type":"integer","revisions":[1024,1024]},"affinity_cpumask"'
+    ':{"type":"string","revisions":[1024,1024]},"id":{"type":"integer","revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"interface":{"type":"str","required":false},"rxqid":{"type":"int","required":false},"affinity_cpumask":{"ty'
+    'pe":"str","required":false},"id":{"type":"int","required":false}}}'
+)
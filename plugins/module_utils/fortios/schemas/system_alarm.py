@@ -0,0 +1,30 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"audible":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"groups":{"type":"list","children":{"fw_policy_id_threshold":{"type":"integer","revisions":[2047,2047]},"admin_auth_lockou'
+    't_threshold":{"type":"integer","revisions":[2047,2047]},"user_auth_lockout_threshold":{"type":"integer","revisions":[2047,2047]},"fw_policy_violations'
+    '":{"type":"list","children":{"src_port":{"type":"integer","revisions":[2047,2047]},"src_ip":{"type":"string","revisions":[2047,2047]},"dst_port":{"typ'
+    'e":"integer","revisions":[2047,2047]},"threshold":{"type":"integer","revisions":[2047,2047]},"dst_ip":{"type":"string","revisions":[2047,2047]},"id":{'
+    '"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"user_auth_failure_threshold":{"type":"integer","revisions":[2047,2047]},"period":'
+    '{"type":"integer","revisions":[2047,2047]},"admin_auth_failure_threshold":{"type":"integer","revisions":[2047,2047]},"log_full_warning_threshold":{"ty'
+    'pe":"integer","revisions":[2047,2047]},"decryption_failure_threshold":{"type":"integer","revisions":[2047,2047]},"replay_attempt_threshold":{"type":"i'
+    'nteger","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"self_test_failure_threshold":{"type":"integer","revisions":[2047,204'
+    '7]},"encryption_failure_threshold":{"type":"integer","revisions":[2047,2047]},"fw_policy_id":{"type":"integer","revisions":[2047,2047]}},"revisions":['
+    '2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"audible":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"groups":{"type":"list","required":false,"options":{"fw_policy_id_threshold":{"type":"int","required":false},"ad'
+    'min_auth_lockout_threshold":{"type":"int","required":false},"user_auth_lockout_threshold":{"type":"int","required":false},"fw_policy_violations":{"typ'
+    'e":"list","required":false,"options":{"src_port":{"type":"int","required":false},"src_ip":{"type":"str","required":false},"dst_port":{"type":"int","re'
+    'quired":false},"threshold":{"type":"int","required":false},"dst_ip":{"type":"str","required":false},"id":{"type":"int","required":false}}},"user_auth_'
+    'failure_threshold":{"type":"int","required":false},"period":{"type":"int","required":false},"admin_auth_failure_threshold":{"type":"int","required":fa'
+    'lse},"log_full_warning_threshold":{"type":"int","required":false},"decryption_failure_threshold":{"type":"int","required":false},"replay_attempt_thres'
+    'hold":{"type":"int","required":false},"id":{"type":"int","required":false},"self_test_failure_threshold":{"type":"int","required":false},"encryption_f'
+    'ailure_threshold":{"type":"int","required":false},"fw_policy_id":{"type":"int","required":false}}}}}'
+)
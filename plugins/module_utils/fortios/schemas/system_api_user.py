@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"peer_auth":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"schedule":{"type":"string","revisions":[2047,2047]},"comments":{"type"'
+    ':"string","revisions":[2047,2047]},"peer_group":{"type":"string","revisions":[2047,2047]},"accprofile":{"type":"string","revisions":[2047,2047]},"trus'
+    'thost":{"type":"list","children":{"ipv6_trusthost":{"type":"string","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"ipv4-trustho'
+    'st","revisions":[2047,2047]},{"value":"ipv6-trusthost","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,204'
+    '7]},"ipv4_trusthost":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"cors_allow_origin":{"type":"string","revisions":[2047,2047]}'
+    ',"api_key":{"type":"string","revisions":[2047,2047]},"vdom":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":['
+    '2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"peer_auth":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":'
+    'false},"schedule":{"type":"str","required":false},"comments":{"type":"str","required":false},"peer_group":{"type":"str","required":false},"accprofile"'
+    ':{"type":"str","required":false},"trusthost":{"type":"list","required":false,"options":{"ipv6_trusthost":{"type":"str","required":false},"type":{"type'
+    '":"str","required":false,"choices":["ipv4-trusthost","ipv6-trusthost"]},"id":{"type":"int","required":false},"ipv4_trusthost":{"type":"str","required"'
+    ':false}}},"cors_allow_origin":{"type":"str","required":false},"api_key":{"type":"str","required":false},"vdom":{"type":"list","required":false,"option'
+    's":{"name":{"type":"str","required":false}}}}}'
+)
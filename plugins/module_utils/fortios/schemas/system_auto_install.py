@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"auto_install_image":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"default_config_file":{"type":"string","revisions":[2047,2047]},"default_image_file":{"type":"string","revision'
+    's":[2047,2047]},"auto_install_config":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"auto_install_image":{"type":"str","required":false,"choices":["enable","disable"]},"default_config_file":{'
+    '"type":"str","required":false},"default_image_file":{"type":"str","required":false},"auto_install_config":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"repeat":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"output_size":{"type":'
+    '"integer","revisions":[2047,2047]},"script":{"type":"string","revisions":[2047,2047]},"interval":{"type":"integer","revisions":[2047,2047]},"start":{"'
+    'type":"string","options":[{"value":"manual","revisions":[2047,2047]},{"value":"auto","revisions":[2047,2047]}],"revisions":[2047,2047]},"timeout":{"ty'
+    'pe":"integer","revisions":[1920,1920]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"repeat":{"type":"int","required":false},"name":{"type":"str","required":false},"output_size":{"type":"int"'
+    ',"required":false},"script":{"type":"str","required":false},"interval":{"type":"int","required":false},"start":{"type":"str","required":false,"choices'
+    '":["manual","auto"]},"timeout":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,62 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"azure_domain":{"type":"string","revisions":[2040,1016]},"aws_api_key":{"type":"string","revisions":[2047,2047]},"replaceme'
+    'nt_message":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024'
+    ']},"protocol":{"type":"string","options":[{"value":"http","revisions":[2047,2047]},{"value":"https","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"azure_app":{"type":"string","revisions":[2040,1016]},"gcp_function_domain":{"type":"string","revisions":[2040,1016]},"uri":{"type":"string","revisio'
+    'ns":[2047,2047]},"gcp_project":{"type":"string","revisions":[2040,1016]},"accprofile":{"type":"string","revisions":[1024,1024]},"alicloud_service":{"t'
+    'ype":"string","revisions":[2040,1016]},"message":{"type":"string","revisions":[1920,1920]},"alicloud_function_authorization":{"type":"string","options'
+    '":[{"value":"anonymous","revisions":[2040,2040]},{"value":"function","revisions":[2040,2040]}],"revisions":[2040,2040]},"port":{"type":"integer","revi'
+    'sions":[2047,2047]},"azure_function":{"type":"string","revisions":[2040,1016]},"delay":{"type":"integer","revisions":[2047,2047]},"gcp_function_region'
+    '":{"type":"string","revisions":[2040,1016]},"aws_api_id":{"type":"string","revisions":[2047,1023]},"script":{"type":"string","revisions":[2040,2040]},'
+    '"tls_certificate":{"type":"string","revisions":[2040,2040]},"alicloud_access_key_secret":{"type":"string","revisions":[2040,2040]},"replacemsg_group":'
+    '{"type":"string","revisions":[1024,1024]},"azure_api_key":{"type":"string","revisions":[2040,2040]},"aws_api_path":{"type":"string","revisions":[2047,'
+    '1023]},"method":{"type":"string","options":[{"value":"post","revisions":[2047,2047]},{"value":"put","revisions":[2047,2047]},{"value":"get","revisions'
+    '":[2047,2047]},{"value":"patch","revisions":[2040,2040]},{"value":"delete","revisions":[2040,2040]}],"revisions":[2047,2047]},"alicloud_function_domai'
+    'n":{"type":"string","revisions":[2040,1016]},"description":{"type":"string","revisions":[1024,1024]},"http_body":{"type":"string","revisions":[2047,20'
+    '47]},"aws_region":{"type":"string","revisions":[2047,1023]},"minimum_interval":{"type":"integer","revisions":[2047,2047]},"alicloud_region":{"type":"s'
+    'tring","revisions":[2040,1016]},"email_to":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"gcp_'
+    'function":{"type":"string","revisions":[2040,1016]},"azure_function_authorization":{"type":"string","options":[{"value":"anonymous","revisions":[2040,'
+    '2040]},{"value":"function","revisions":[2040,2040]},{"value":"admin","revisions":[2040,2040]}],"revisions":[2040,2040]},"alicloud_access_key_id":{"typ'
+    'e":"string","revisions":[2040,2040]},"name":{"type":"string","revisions":[2047,2047]},"alicloud_version":{"type":"string","revisions":[2040,1016]},"sd'
+    'n_connector":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"aws_api_stage":{"type":"string","r'
+    'evisions":[2047,1023]},"required":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"email_body":{"type":"string","revisions":[2040,120]},"alicloud_account_id":{"type":"string","revisions":[2040,1016]},"securi'
+    'ty_tag":{"type":"string","revisions":[2040,2040]},"headers":{"type":"list","children":{"header":{"type":"string","revisions":[2047,2047]}},"revisions"'
+    ':[2047,2047]},"aws_domain":{"type":"string","revisions":[2047,1023]},"action_type":{"type":"string","options":[{"value":"email","revisions":[2047,2047'
+    ']},{"value":"ios-notification","revisions":[2047,1023]},{"value":"alert","revisions":[2047,2047]},{"value":"disable-ssid","revisions":[2047,2047]},{"v'
+    'alue":"quarantine","revisions":[2047,2047]},{"value":"quarantine-forticlient","revisions":[2047,2047]},{"value":"ban-ip","revisions":[2047,2047]},{"va'
+    'lue":"aws-lambda","revisions":[2047,2047]},{"value":"webhook","revisions":[2047,2047]},{"value":"quarantine-nsx","revisions":[2040,2040]},{"value":"az'
+    'ure-function","revisions":[2040,2040]},{"value":"google-cloud-function","revisions":[2040,2040]},{"value":"alicloud-function","revisions":[2040,2040]}'
+    ',{"value":"cli-script","revisions":[2040,2040]},{"value":"quarantine-fortinac","revisions":[1920,1664]},{"value":"slack-notification","revisions":[192'
+    '0,1920]},{"value":"fortiexplorer-notification","revisions":[1024,1024]},{"value":"microsoft-teams-notification","revisions":[1024,1024]}],"revisions":'
+    '[2047,2047]},"alicloud_function":{"type":"string","revisions":[2040,1016]},"email_subject":{"type":"string","revisions":[2047,2047]},"verify_host_cert'
+    '":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"messag'
+    'e_type":{"type":"string","options":[{"value":"text","revisions":[1024,1024]},{"value":"json","revisions":[1024,1024]}],"revisions":[1024,1024]},"email'
+    '_from":{"type":"string","revisions":[2040,2040]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"azure_domain":{"type":"str","required":false},"aws_api_key":{"type":"str","required":false},"replacement_m'
+    'essage":{"type":"str","required":false,"choices":["enable","disable"]},"protocol":{"type":"str","required":false,"choices":["http","https"]},"azure_ap'
+    'p":{"type":"str","required":false},"gcp_function_domain":{"type":"str","required":false},"uri":{"type":"str","required":false},"gcp_project":{"type":"'
+    'str","required":false},"accprofile":{"type":"str","required":false},"alicloud_service":{"type":"str","required":false},"message":{"type":"str","requir'
+    'ed":false},"alicloud_function_authorization":{"type":"str","required":false,"choices":["anonymous","function"]},"port":{"type":"int","required":false}'
+    ',"azure_function":{"type":"str","required":false},"delay":{"type":"int","required":false},"gcp_function_region":{"type":"str","required":false},"aws_a'
+    'pi_id":{"type":"str","required":false},"script":{"type":"str","required":false},"tls_certificate":{"type":"str","required":false},"alicloud_access_key'
+    '_secret":{"type":"str","required":false},"replacemsg_group":{"type":"str","required":false},"azure_api_key":{"type":"str","required":false},"aws_api_p'
+    'ath":{"type":"str","required":false},"method":{"type":"str","required":false},"alicloud_function_domain":{"type":"str","required":false},"description"'
+    ':{"type":"str","required":false},"http_body":{"type":"str","required":false},"aws_region":{"type":"str","required":false},"minimum_interval":{"type":"'
+    'int","required":false},"alicloud_region":{"type":"str","required":false},"email_to":{"type":"list","required":false,"options":{"name":{"type":"str","r'
+    'equired":false}}},"gcp_function":{"type":"str","required":false},"azure_function_authorization":{"type":"str","required":false,"choices":["anonymous",'
+    '"function","admin"]},"alicloud_access_key_id":{"type":"str","required":false},"name":{"type":"str","required":false},"alicloud_version":{"type":"str",'
+    '"required":false},"sdn_connector":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"aws_api_stage":{"type":"str","r'
+    'equired":false},"required":{"type":"str","required":false,"choices":["enable","disable"]},"email_body":{"type":"str","required":false},"alicloud_accou'
+    'nt_id":{"type":"str","required":false},"security_tag":{"type":"str","required":false},"headers":{"type":"list","required":false,"options":{"header":{"'
+    'type":"str","required":false}}},"aws_domain":{"type":"str","required":false},"action_type":{"type":"str","required":false},"alicloud_function":{"type"'
+    ':"str","required":false},"email_subject":{"type":"str","required":false},"verify_host_cert":{"type":"str","required":false,"choices":["enable","disabl'
+    'e"]},"message_type":{"type":"str","required":false,"choices":["text","json"]},"email_from":{"type":"str","required":false}}}'
+)
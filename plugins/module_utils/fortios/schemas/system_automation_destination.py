@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ha_group_id":{"type":"integer","revisions":[2047,2047]},"destination":{"type":"list","children":{"name":{"type":"string","'
+    'revisions":[2047,2047]}},"revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"fortigate","revisions":[2047,2047]},{"value":"ha-cluste'
+    'r","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ha_group_id":{"type":"int","required":false},"destination":{"type":"list","required":false,"options":{"nam'
+    'e":{"type":"str","required":false}}},"type":{"type":"str","required":false,"choices":["fortigate","ha-cluster"]},"name":{"type":"str","required":false'
+    '}}}'
+)
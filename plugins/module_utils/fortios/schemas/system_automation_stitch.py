@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"destination":{"type":"list","children":{"name":{"type":"string","revision'
+    's":[2047,2047]}},"revisions":[2047,2047]},"trigger":{"type":"string","revisions":[2047,2047]},"action":{"type":"list","children":{"name":{"type":"stri'
+    'ng","revisions":[2047,2047]}},"revisions":[2047,2047]},"description":{"type":"string","revisions":[1024,1024]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":fal'
+    'se},"destination":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"trigger":{"type":"str","required":false},"actio'
+    'n":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"description":{"type":"str","required":false}}}'
+)
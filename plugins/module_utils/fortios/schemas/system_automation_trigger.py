@@ -0,0 +1,42 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"trigger_day":{"type":"integer","revisions":[2047,2047]},"trigger_weekday":{"type":"string","options":[{"value":"sunday","r'
+    'evisions":[2047,2047]},{"value":"monday","revisions":[2047,2047]},{"value":"tuesday","revisions":[2047,2047]},{"value":"wednesday","revisions":[2047,2'
+    '047]},{"value":"thursday","revisions":[2047,2047]},{"value":"friday","revisions":[2047,2047]},{"value":"saturday","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"trigger_frequency":{"type":"string","options":[{"value":"hourly","revisions":[2047,20'
+    '47]},{"value":"daily","revisions":[2047,2047]},{"value":"weekly","revisions":[2047,2047]},{"value":"monthly","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"trigger_hour":{"type":"integer","revisions":[2047,2047]},"trigger_minute":{"type":"integer","revisions":[2047,2047]},"description":{"type":'
+    '"string","revisions":[1024,1024]},"trigger_type":{"type":"string","options":[{"value":"event-based","revisions":[2047,2047]},{"value":"scheduled","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"faz_event_name":{"type":"string","revisions":[2040,2040]},"fabric_event_name":{"type":"string","revisi'
+    'ons":[1024,1024]},"logid":{"type":"integer","revisions":[2047,2047]},"ioc_level":{"type":"string","options":[{"value":"medium","revisions":[2047,2047]'
+    '},{"value":"high","revisions":[2047,2047]}],"revisions":[2047,2047]},"report_type":{"type":"string","options":[{"value":"PostureReport","revisions":[1'
+    '920,896]},{"value":"CoverageReport","revisions":[1920,896]},{"value":"OptimizationReport","revisions":[1920,896]},{"value":"posture","revisions":[1024'
+    ',1024]},{"value":"coverage","revisions":[1024,1024]},{"value":"optimization","revisions":[1024,1024]},{"value":"any","revisions":[1024,1024]}],"revisi'
+    'ons":[1920,1920]},"fields":{"type":"list","children":{"id":{"type":"integer","revisions":[2040,2040]},"value":{"type":"string","revisions":[2040,2040]'
+    '},"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"license_type":{"type":"string","options":[{"value":"forticare-support","'
+    'revisions":[2047,2047]},{"value":"fortiguard-webfilter","revisions":[2047,2047]},{"value":"fortiguard-antispam","revisions":[2047,2047]},{"value":"for'
+    'tiguard-antivirus","revisions":[2047,2047]},{"value":"fortiguard-ips","revisions":[2047,2047]},{"value":"fortiguard-management","revisions":[2047,2047'
+    ']},{"value":"forticloud","revisions":[2047,2047]},{"value":"any","revisions":[1920,1920]}],"revisions":[2047,2047]},"fabric_event_severity":{"type":"s'
+    'tring","revisions":[1024,1024]},"serial":{"type":"string","revisions":[1024,1024]},"faz_event_tags":{"type":"string","revisions":[2040,2040]},"faz_eve'
+    'nt_severity":{"type":"string","revisions":[2040,2040]},"event_type":{"type":"string","options":[{"value":"ioc","revisions":[2047,2047]},{"value":"even'
+    't-log","revisions":[2047,2047]},{"value":"reboot","revisions":[2047,2047]},{"value":"low-memory","revisions":[2047,2047]},{"value":"high-cpu","revisio'
+    'ns":[2047,2047]},{"value":"license-near-expiry","revisions":[2047,2047]},{"value":"ha-failover","revisions":[2047,2047]},{"value":"config-change","rev'
+    'isions":[2047,2047]},{"value":"security-rating-summary","revisions":[2047,2047]},{"value":"virus-ips-db-updated","revisions":[2047,2047]},{"value":"fa'
+    'z-event","revisions":[2040,2040]},{"value":"incoming-webhook","revisions":[1920,1920]},{"value":"fabric-event","revisions":[1024,1024]}],"revisions":['
+    '2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"trigger_day":{"type":"int","required":false},"trigger_weekday":{"type":"str","required":false,"choices":["'
+    'sunday","monday","tuesday","wednesday","thursday","friday","saturday"]},"name":{"type":"str","required":false},"trigger_frequency":{"type":"str","requ'
+    'ired":false,"choices":["hourly","daily","weekly","monthly"]},"trigger_hour":{"type":"int","required":false},"trigger_minute":{"type":"int","required":'
+    'false},"description":{"type":"str","required":false},"trigger_type":{"type":"str","required":false,"choices":["event-based","scheduled"]},"faz_event_n'
+    'ame":{"type":"str","required":false},"fabric_event_name":{"type":"str","required":false},"logid":{"type":"int","required":false},"ioc_level":{"type":"'
+    'str","required":false,"choices":["medium","high"]},"report_type":{"type":"str","required":false},"fields":{"type":"list","required":false,"options":{"'
+    'id":{"type":"int","required":false},"value":{"type":"str","required":false},"name":{"type":"str","required":false}}},"license_type":{"type":"str","req'
+    'uired":false},"fabric_event_severity":{"type":"str","required":false},"serial":{"type":"str","required":false},"faz_event_tags":{"type":"str","require'
+    'd":false},"faz_event_severity":{"type":"str","required":false},"event_type":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[1023,1023]},{"value":"disable","revisions":[1023,1023]}'
+    '],"revisions":[1023,1023]},"override":{"type":"string","options":[{"value":"enable","revisions":[1023,1023]},{"value":"disable","revisions":[1023,1023'
+    ']}],"revisions":[1023,1023]},"port":{"type":"integer","revisions":[1023,1023]},"address":{"type":"string","revisions":[1023,1023]}},"revisions":[1023,'
+    '1023]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"override":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]},"port":{"type":"int","required":false},"address":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"frequency":{"type":"string","options":[{"value":"every","revisions":[2047,2047]},{"value":"daily","revisions":[2047,2047]}'
+    ',{"value":"weekly","revisions":[2047,2047]},{"value":"automatic","revisions":[1024,1024]}],"revisions":[2047,2047]},"day":{"type":"string","options":['
+    '{"value":"Sunday","revisions":[2047,2047]},{"value":"Monday","revisions":[2047,2047]},{"value":"Tuesday","revisions":[2047,2047]},{"value":"Wednesday"'
+    ',"revisions":[2047,2047]},{"value":"Thursday","revisions":[2047,2047]},{"value":"Friday","revisions":[2047,2047]},{"value":"Saturday","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"time":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"frequency":{"type":"str","required'
+    '":false},"day":{"type":"str","required":false,"choices":["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"]},"time":{"type":"str"'
+    ',"required":false}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"username":{"type":"string","revisions":[2047,2047]},"password":{"type":"string","revisions":[2047,2047]},"port":{"type":"i'
+    'nteger","revisions":[2047,2047]},"address":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"username":{"type":"str","required"'
+    ':false},"password":{"type":"str","required":false},"port":{"type":"int","required":false},"address":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,43 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"allow_monitor":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"schedule_script_restore":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"schedule_config_restore":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"'
+    'value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ca_cert":{"type":"string","revisions":[2040,2040]},"server_list":{"type":"list","'
+    'children":{"server_type":{"multiple_values":true,"type":"list","options":[{"value":"update","revisions":[2047,2047]},{"value":"rating","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"server_address":{"type":"string","revisions":[2047,2047]},"fqdn":{"type":"string","revisions":[2047,2047]},"addr_'
+    'type":{"type":"string","options":[{"value":"ipv4","revisions":[2047,2047]},{"value":"ipv6","revisions":[2047,2047]},{"value":"fqdn","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"server_address6":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisio'
+    'ns":[2047,2047]},"include_default_servers":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"fortimanager","revisions":[2047,2047]},{"value":"fortiguard","revisions'
+    '":[2047,2047]},{"value":"none","revisions":[2047,2047]}],"revisions":[2047,2047]},"mode":{"type":"string","options":[{"value":"normal","revisions":[20'
+    '47,2047]},{"value":"backup","revisions":[2047,2047]}],"revisions":[2047,2047]},"local_cert":{"type":"string","revisions":[2047,2045]},"allow_push_firm'
+    'ware":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"in'
+    'terface_select_method":{"type":"string","options":[{"value":"auto","revisions":[2024,2024]},{"value":"sdwan","revisions":[2024,2024]},{"value":"specif'
+    'y","revisions":[2024,2024]}],"revisions":[2040,2024]},"fmg_source_ip":{"type":"string","revisions":[2047,2047]},"allow_push_configuration":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"fmg":{"type":"strin'
+    'g","revisions":[2047,2047]},"interface":{"type":"string","revisions":[2040,2024]},"serial_number":{"type":"string","revisions":[2047,2047]},"fmg_sourc'
+    'e_ip6":{"type":"string","revisions":[2047,2047]},"enc_algorithm":{"type":"string","options":[{"value":"default","revisions":[2047,2047]},{"value":"hig'
+    'h","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]},"allow_remote_firmware_upgrade":{"type":"string","option'
+    's":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"vdom":{"type":"string","revision'
+    's":[2047,2047]},"fmg_update_port":{"type":"string","options":[{"value":"8890","revisions":[2040,2040]},{"value":"443","revisions":[2040,2040]}],"revis'
+    'ions":[2040,2040]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"allow_monitor":{"type":"str","required":false,"choices":["enable","disable"]},"schedule_script_restore":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"schedule_config_restore":{"type":"str","required":false,"choices":["enable","disable"]},'
+    '"ca_cert":{"type":"str","required":false},"server_list":{"type":"list","required":false,"options":{"server_type":{"type":"list","required":false,"choi'
+    'ces":["update","rating"]},"server_address":{"type":"str","required":false},"fqdn":{"type":"str","required":false},"addr_type":{"type":"str","required"'
+    ':false,"choices":["ipv4","ipv6","fqdn"]},"server_address6":{"type":"str","required":false},"id":{"type":"int","required":false}}},"include_default_ser'
+    'vers":{"type":"str","required":false,"choices":["enable","disable"]},"type":{"type":"str","required":false,"choices":["fortimanager","fortiguard","non'
+    'e"]},"mode":{"type":"str","required":false,"choices":["normal","backup"]},"local_cert":{"type":"str","required":false},"allow_push_firmware":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"interface_select_method":{"type":"str","required":false},"fmg_source_ip":{"type":"str","require'
+    'd":false},"allow_push_configuration":{"type":"str","required":false,"choices":["enable","disable"]},"fmg":{"type":"str","required":false},"interface":'
+    '{"type":"str","required":false},"serial_number":{"type":"str","required":false},"fmg_source_ip6":{"type":"str","required":false},"enc_algorithm":{"typ'
+    'e":"str","required":false,"choices":["default","high","low"]},"allow_remote_firmware_upgrade":{"type":"str","required":false,"choices":["enable","disa'
+    'ble"]},"vdom":{"type":"str","required":false},"fmg_update_port":{"type":"str","required":false,"choices":["8890","443"]}}}'
+)
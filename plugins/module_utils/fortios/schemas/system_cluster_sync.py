@@ -0,0 +1,32 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"peerip":{"type":"string","revisions":[2047,2047]},"peervd":{"type":"string","revisions":[2047,2047]},"syncvd":{"type":"lis'
+    't","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"hb_lost_threshold":{"type":"integer","revisions":[2047,2047'
+    ']},"ike_seqjump_speed":{"type":"integer","revisions":[1024,1024]},"slave_add_ike_routes":{"type":"string","options":[{"value":"enable","revisions":[20'
+    '47,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sync_id":{"type":"integer","revisions":[2047,2047]},"ike_monitor_inte'
+    'rval":{"type":"integer","revisions":[1024,1024]},"ike_heartbeat_interval":{"type":"integer","revisions":[1024,1024]},"ike_monitor":{"type":"string","o'
+    'ptions":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"session_sync_filter":{"type'
+    '":"dict","children":{"srcaddr6":{"type":"string","revisions":[2047,2047]},"dstaddr6":{"type":"string","revisions":[2047,2047]},"custom_service":{"type'
+    '":"list","children":{"dst_port_range":{"type":"string","revisions":[2047,2047]},"src_port_range":{"type":"string","revisions":[2047,2047]},"id":{"type'
+    '":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"srcaddr":{"type":"string","revisions":[2047,2047]},"dstintf":{"type":"string","revisio'
+    'ns":[2047,2047]},"srcintf":{"type":"string","revisions":[2047,2047]},"dstaddr":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"do'
+    'wn_intfs_before_sess_sync":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"ipsec_tunnel_sync":{'
+    '"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"hb_interv'
+    'al":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"peerip":{"type":"str","required":false},"peervd":{"type":"str","required":false},"syncvd":{"type":"list","'
+    'required":false,"options":{"name":{"type":"str","required":false}}},"hb_lost_threshold":{"type":"int","required":false},"ike_seqjump_speed":{"type":"i'
+    'nt","required":false},"slave_add_ike_routes":{"type":"str","required":false,"choices":["enable","disable"]},"sync_id":{"type":"int","required":false},'
+    '"ike_monitor_interval":{"type":"int","required":false},"ike_heartbeat_interval":{"type":"int","required":false},"ike_monitor":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]},"session_sync_filter":{"type":"dict","required":false,"options":{"srcaddr6":{"type":"str","required":false},"ds'
+    'taddr6":{"type":"str","required":false},"custom_service":{"type":"list","required":false,"options":{"dst_port_range":{"type":"str","required":false},"'
+    'src_port_range":{"type":"str","required":false},"id":{"type":"int","required":false}}},"srcaddr":{"type":"str","required":false},"dstintf":{"type":"st'
+    'r","required":false},"srcintf":{"type":"str","required":false},"dstaddr":{"type":"str","required":false}}},"down_intfs_before_sess_sync":{"type":"list'
+    '","required":false,"options":{"name":{"type":"str","required":false}}},"ipsec_tunnel_sync":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"hb_interval":{"type":"int","required":false}}}'
+)
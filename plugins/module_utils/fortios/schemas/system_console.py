@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"fortiexplorer":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,1023]},"output":{"type":"string","options":[{"value":"standard","revisions":[2047,2047]},{"value":"more","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"baudrate":{"type":"string","options":[{"value":"9600","revisions":[2047,2047]},{"value":"19200","revisions":[2047,20'
+    '47]},{"value":"38400","revisions":[2047,2047]},{"value":"57600","revisions":[2047,2047]},{"value":"115200","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"mode":{"type":"string","options":[{"value":"batch","revisions":[2047,2047]},{"value":"line","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"login":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    '},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"fortiexplorer":{"type":"str","required":false,"choices":["enable","disable"]},"output":{"type":"str","requ'
+    'ired":false,"choices":["standard","more"]},"baudrate":{"type":"str","required":false,"choices":["9600","19200","38400","57600","115200"]},"mode":{"typ'
+    'e":"str","required":false,"choices":["batch","line"]},"login":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,48 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"saml_configuration_sync":{"type":"string","options":[{"value":"default","revisions":[1664,1664]},{"value":"local","revisio'
+    'ns":[1664,1664]}],"revisions":[1920,1664]},"authorization_request_type":{"type":"string","options":[{"value":"serial","revisions":[1664,1664]},{"value'
+    '":"certificate","revisions":[1664,1664]}],"revisions":[1920,1664]},"upstream_port":{"type":"integer","revisions":[2047,2047]},"certificate":{"type":"s'
+    'tring","revisions":[1920,1664]},"fabric_workers":{"type":"integer","revisions":[1536,1536]},"log_unification":{"type":"string","options":[{"value":"di'
+    'sable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"fixed_key":{"type":"string","revisions":[2047,23'
+    ']},"fabric_object_unification":{"type":"string","options":[{"value":"default","revisions":[1920,1920]},{"value":"local","revisions":[1920,1920]}],"rev'
+    'isions":[1920,1920]},"management_port":{"type":"integer","revisions":[2047,1023]},"group_name":{"type":"string","revisions":[2047,2047]},"trusted_list'
+    '":{"type":"list","children":{"authorization_type":{"type":"string","options":[{"value":"serial","revisions":[1664,1664]},{"value":"certificate","revis'
+    'ions":[1664,1664]}],"revisions":[1920,1664]},"name":{"type":"string","revisions":[1920,1664]},"certificate":{"type":"string","revisions":[1920,1664]},'
+    '"ha_members":{"type":"string","revisions":[2047,2047]},"downstream_authorization":{"type":"string","options":[{"value":"enable","revisions":[2047,2047'
+    ']},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"accept","revisions":[2047,2047'
+    ']},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"serial":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"fa'
+    'bric_device":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"access_token":{"type":"string","revisions":[2040,2040]},"dev'
+    'ice_ip":{"type":"string","revisions":[2047,2047]},"device_type":{"type":"string","options":[{"value":"fortimail","revisions":[7,7]}],"revisions":[2047'
+    ',7]},"login":{"type":"string","revisions":[2047,7]},"password":{"type":"string","revisions":[2047,7]},"https_port":{"type":"integer","revisions":[2040'
+    ',2040]}},"revisions":[2047,2047]},"management_ip":{"type":"string","revisions":[2047,1023]},"accept_auth_by_cert":{"type":"string","options":[{"value"'
+    ':"disable","revisions":[1664,1664]},{"value":"enable","revisions":[1664,1664]}],"revisions":[1920,1664]},"downstream_accprofile":{"type":"string","rev'
+    'isions":[1024,1024]},"configuration_sync":{"type":"string","options":[{"value":"default","revisions":[2047,2047]},{"value":"local","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"upstream_ip":{"type":"string","revisions":[2047,2047]},"group_password":{"type":"string","revisions":[2047,2047]},"fa'
+    'bric_connector":{"type":"list","children":{"serial":{"type":"string","revisions":[1024,1024]},"accprofile":{"type":"string","revisions":[1024,1024]},"'
+    'configuration_write_access":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revis'
+    'ions":[1024,1024]}},"revisions":[1024,1024]},"downstream_access":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disa'
+    'ble","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"saml_configuration_sync":{"type":"'
+    'str","required":false},"authorization_request_type":{"type":"str","required":false},"upstream_port":{"type":"int","required":false},"certificate":{"ty'
+    'pe":"str","required":false},"fabric_workers":{"type":"int","required":false},"log_unification":{"type":"str","required":false,"choices":["disable","en'
+    'able"]},"fixed_key":{"type":"str","required":false},"fabric_object_unification":{"type":"str","required":false,"choices":["default","local"]},"managem'
+    'ent_port":{"type":"int","required":false},"group_name":{"type":"str","required":false},"trusted_list":{"type":"list","required":false,"options":{"auth'
+    'orization_type":{"type":"str","required":false},"name":{"type":"str","required":false},"certificate":{"type":"str","required":false},"ha_members":{"ty'
+    'pe":"str","required":false},"downstream_authorization":{"type":"str","required":false,"choices":["enable","disable"]},"action":{"type":"str","required'
+    '":false,"choices":["accept","deny"]},"serial":{"type":"str","required":false}}},"fabric_device":{"type":"list","required":false,"options":{"name":{"ty'
+    'pe":"str","required":false},"access_token":{"type":"str","required":false},"device_ip":{"type":"str","required":false},"device_type":{"type":"str","re'
+    'quired":false},"login":{"type":"str","required":false},"password":{"type":"str","required":false},"https_port":{"type":"int","required":false}}},"mana'
+    'gement_ip":{"type":"str","required":false},"accept_auth_by_cert":{"type":"str","required":false},"downstream_accprofile":{"type":"str","required":fals'
+    'e},"configuration_sync":{"type":"str","required":false,"choices":["default","local"]},"upstream_ip":{"type":"str","required":false},"group_password":{'
+    '"type":"str","required":false},"fabric_connector":{"type":"list","required":false,"options":{"serial":{"type":"str","required":false},"accprofile":{"t'
+    'ype":"str","required":false},"configuration_write_access":{"type":"str","required":false,"choices":["enable","disable"]}}},"downstream_access":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,35 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ssl_certificate":{"type":"string","revisions":[2047,2047]},"server_type":{"type":"string","options":[{"value":"ipv4","revi'
+    'sions":[1024,1024]},{"value":"ipv6","revisions":[1024,1024]}],"revisions":[1024,1024]},"ddns_ttl":{"type":"integer","revisions":[2047,2047]},"ddns_sn"'
+    ':{"type":"string","revisions":[2047,2047]},"ddns_password":{"type":"string","revisions":[2047,2047]},"ddnsid":{"type":"integer","revisions":[2047,2047'
+    ']},"clear_text":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"ddns_auth":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"tsig","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"use_public_ip":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"ddns_username":{"type":"string","revisions":[2047,2047]},"bound_ip":{"type":"string","revisions":[2047,2047]},"ddns_keyname":{"type":"'
+    'string","revisions":[2047,2047]},"ddns_server":{"type":"string","options":[{"value":"dyndns.org","revisions":[2047,2047]},{"value":"dyns.net","revisio'
+    'ns":[2047,2047]},{"value":"tzo.com","revisions":[2047,2047]},{"value":"vavic.com","revisions":[2047,2047]},{"value":"dipdns.net","revisions":[2047,204'
+    '7]},{"value":"now.net.cn","revisions":[2047,2047]},{"value":"dhs.org","revisions":[2047,2047]},{"value":"easydns.com","revisions":[2047,2047]},{"value'
+    '":"genericDDNS","revisions":[2047,2047]},{"value":"FortiGuardDDNS","revisions":[2047,2047]},{"value":"noip.com","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"ddns_key":{"type":"string","revisions":[2047,2047]},"ddns_server_ip":{"type":"string","revisions":[2047,1023]},"ddns_server_addr":{"type'
+    '":"list","children":{"addr":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"update_interval":{"type":"integer","revisions":[2047,'
+    '2047]},"ddns_domain":{"type":"string","revisions":[2047,2047]},"monitor_interface":{"type":"list","children":{"interface_name":{"type":"string","revis'
+    'ions":[2047,2047]}},"revisions":[2047,2047]},"addr_type":{"type":"string","options":[{"value":"ipv4","revisions":[1024,1024]},{"value":"ipv6","revisio'
+    'ns":[1024,1024]}],"revisions":[1024,1024]},"ddns_zone":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ssl_certificate":{"type":"str","required":false},"server_type":{"type":"str","required":false,"choices":["'
+    'ipv4","ipv6"]},"ddns_ttl":{"type":"int","required":false},"ddns_sn":{"type":"str","required":false},"ddns_password":{"type":"str","required":false},"d'
+    'dnsid":{"type":"int","required":false},"clear_text":{"type":"str","required":false,"choices":["disable","enable"]},"ddns_auth":{"type":"str","required'
+    '":false,"choices":["disable","tsig"]},"use_public_ip":{"type":"str","required":false,"choices":["disable","enable"]},"ddns_username":{"type":"str","re'
+    'quired":false},"bound_ip":{"type":"str","required":false},"ddns_keyname":{"type":"str","required":false},"ddns_server":{"type":"str","required":false,'
+    '"choices":["dyndns.org","dyns.net","tzo.com","vavic.com","dipdns.net","now.net.cn","dhs.org","easydns.com","genericDDNS","FortiGuardDDNS","noip.com"]}'
+    ',"ddns_key":{"type":"str","required":false},"ddns_server_ip":{"type":"str","required":false},"ddns_server_addr":{"type":"list","required":false,"optio'
+    'ns":{"addr":{"type":"str","required":false}}},"update_interval":{"type":"int","required":false},"ddns_domain":{"type":"str","required":false},"monitor'
+    '_interface":{"type":"list","required":false,"options":{"interface_name":{"type":"str","required":false}}},"addr_type":{"type":"str","required":false,"'
+    'choices":["ipv4","ipv6"]},"ddns_zone":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"dhcp_end_ip":{"type":"string","revisions":[2047,2047]},"default_gateway":{"type":"string","revisions":[2047,2047]},"dhcp_n'
+    'etmask":{"type":"string","revisions":[2047,2047]},"dhcp_start_ip":{"type":"string","revisions":[2047,2047]},"interface":{"type":"string","revisions":['
+    '2047,2047]},"dhcp_server":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"dhcp_end_ip":{"type":"str","requir'
+    'ed":false},"default_gateway":{"type":"str","required":false},"dhcp_netmask":{"type":"str","required":false},"dhcp_start_ip":{"type":"str","required":f'
+    'alse},"interface":{"type":"str","required":false},"dhcp_server":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,34 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"subnet":{"type":"string","revisions":[2047,2047]},"domain":{"type":"string","revisions":[2047,2047]},"dns_server3":{"type"'
+    ':"string","revisions":[2047,2047]},"lease_time":{"type":"integer","revisions":[2047,2047]},"rapid_commit":{"type":"string","options":[{"value":"disabl'
+    'e","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dns_server1":{"type":"string","revisions":[2047,2047'
+    ']},"dns_search_list":{"type":"string","options":[{"value":"delegated","revisions":[2047,2047]},{"value":"specify","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"prefix_mode":{"type":"string","options":[{"value":"dhcp6","revisions":[1024,1024]},{"value":"ra","revisions":[1024,1024]}],"revisions"'
+    ':[1024,1024]},"dns_service":{"type":"string","options":[{"value":"delegated","revisions":[2047,2047]},{"value":"default","revisions":[2047,2047]},{"va'
+    'lue":"specify","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip_mode":{"type":"string","options":[{"value":"range","revisions":[2047,2047]},{"va'
+    'lue":"delegated","revisions":[2047,2047]}],"revisions":[2047,2047]},"dns_server2":{"type":"string","revisions":[2047,2047]},"option3":{"type":"string"'
+    ',"revisions":[2047,2047]},"ip_range":{"type":"list","children":{"start_ip":{"type":"string","revisions":[2047,2047]},"end_ip":{"type":"string","revisi'
+    'ons":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]},"dns'
+    '_server4":{"type":"string","revisions":[2040,2040]},"upstream_interface":{"type":"string","revisions":[2047,2047]},"option2":{"type":"string","revisio'
+    'ns":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"prefix_range":{"type":"list","children":{"start_prefix":{"type":"string","revisions"'
+    ':[2047,2047]},"end_prefix":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"prefix_length":{"type":"integer"'
+    ',"revisions":[2047,2047]}},"revisions":[2047,2047]},"option1":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"subnet":{"type":"str","required":f'
+    'alse},"domain":{"type":"str","required":false},"dns_server3":{"type":"str","required":false},"lease_time":{"type":"int","required":false},"rapid_commi'
+    't":{"type":"str","required":false,"choices":["disable","enable"]},"dns_server1":{"type":"str","required":false},"dns_search_list":{"type":"str","requi'
+    'red":false,"choices":["delegated","specify"]},"prefix_mode":{"type":"str","required":false,"choices":["dhcp6","ra"]},"dns_service":{"type":"str","requ'
+    'ired":false,"choices":["delegated","default","specify"]},"ip_mode":{"type":"str","required":false,"choices":["range","delegated"]},"dns_server2":{"typ'
+    'e":"str","required":false},"option3":{"type":"str","required":false},"ip_range":{"type":"list","required":false,"options":{"start_ip":{"type":"str","r'
+    'equired":false},"end_ip":{"type":"str","required":false},"id":{"type":"int","required":false}}},"interface":{"type":"str","required":false},"dns_serve'
+    'r4":{"type":"str","required":false},"upstream_interface":{"type":"str","required":false},"option2":{"type":"str","required":false},"id":{"type":"int",'
+    '"required":false},"prefix_range":{"type":"list","required":false,"options":{"start_prefix":{"type":"str","required":false},"end_prefix":{"type":"str",'
+    '"required":false},"id":{"type":"int","required":false},"prefix_length":{"type":"int","required":false}}},"option1":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,107 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"exclude_range":{"type":"list","children":{"start_ip":{"type":"string","revisions":[2047,2047]},"end_ip":{"type":"string","'
+    'revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"domain":{"type":"string","revisions":[2047,2047]},"'
+    'lease_time":{"type":"integer","revisions":[2047,2047]},"ipsec_lease_hold":{"type":"integer","revisions":[2047,2047]},"ntp_server3":{"type":"string","r'
+    'evisions":[2047,2047]},"ntp_server2":{"type":"string","revisions":[2047,2047]},"ntp_server1":{"type":"string","revisions":[2047,2047]},"wifi_ac1":{"ty'
+    'pe":"string","revisions":[2047,2047]},"ddns_server_ip":{"type":"string","revisions":[2047,2047]},"ddns_update_override":{"type":"string","options":[{"'
+    'value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ddns_auth":{"type":"string","options":'
+    '[{"value":"disable","revisions":[2047,2047]},{"value":"tsig","revisions":[2047,2047]}],"revisions":[2047,2047]},"timezone_option":{"type":"string","op'
+    'tions":[{"value":"disable","revisions":[2047,2047]},{"value":"default","revisions":[2047,2047]},{"value":"specify","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"next_server":{"type":"string","revisions":[2047,2047]},"ip_range":{"type":"list","children":{"start_ip":{"type":"string","revisions":'
+    '[2047,2047]},"end_ip":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"timezone":{'
+    '"type":"string","options":[{"value":"01","revisions":[2047,2047]},{"value":"02","revisions":[2047,2047]},{"value":"03","revisions":[2047,2047]},{"valu'
+    'e":"04","revisions":[2047,2047]},{"value":"05","revisions":[2047,2047]},{"value":"81","revisions":[2047,2047]},{"value":"06","revisions":[2047,2047]},'
+    '{"value":"07","revisions":[2047,2047]},{"value":"08","revisions":[2047,2047]},{"value":"09","revisions":[2047,2047]},{"value":"10","revisions":[2047,2'
+    '047]},{"value":"11","revisions":[2047,2047]},{"value":"12","revisions":[2047,2047]},{"value":"13","revisions":[2047,2047]},{"value":"74","revisions":['
+    '2047,2047]},{"value":"14","revisions":[2047,2047]},{"value":"77","revisions":[2047,2047]},{"value":"15","revisions":[2047,2047]},{"value":"87","revisi'
+    'ons":[2047,2047]},{"value":"16","revisions":[2047,2047]},{"value":"17","revisions":[2047,2047]},{"value":"18","revisions":[2047,2047]},{"value":"19","'
+    'revisions":[2047,2047]},{"value":"20","revisions":[2047,2047]},{"value":"75","revisions":[2047,2047]},{"value":"21","revisions":[2047,2047]},{"value":'
+    '"22","revisions":[2047,2047]},{"value":"23","revisions":[2047,2047]},{"value":"24","revisions":[2047,2047]},{"value":"80","revisions":[2047,2047]},{"v'
+    'alue":"79","revisions":[2047,2047]},{"value":"25","revisions":[2047,2047]},{"value":"26","revisions":[2047,2047]},{"value":"27","revisions":[2047,2047'
+    ']},{"value":"28","revisions":[2047,2047]},{"value":"78","revisions":[2047,2047]},{"value":"29","revisions":[2047,2047]},{"value":"30","revisions":[204'
+    '7,2047]},{"value":"31","revisions":[2047,2047]},{"value":"32","revisions":[2047,2047]},{"value":"33","revisions":[2047,2047]},{"value":"34","revisions'
+    '":[2047,2047]},{"value":"35","revisions":[2047,2047]},{"value":"36","revisions":[2047,2047]},{"value":"37","revisions":[2047,2047]},{"value":"38","rev'
+    'isions":[2047,2047]},{"value":"83","revisions":[2047,2047]},{"value":"84","revisions":[2047,2047]},{"value":"40","revisions":[2047,2047]},{"value":"85'
+    '","revisions":[2047,2047]},{"value":"41","revisions":[2047,2047]},{"value":"42","revisions":[2047,2047]},{"value":"43","revisions":[2047,2047]},{"valu'
+    'e":"39","revisions":[2047,2047]},{"value":"44","revisions":[2047,2047]},{"value":"46","revisions":[2047,2047]},{"value":"47","revisions":[2047,2047]},'
+    '{"value":"51","revisions":[2047,2047]},{"value":"48","revisions":[2047,2047]},{"value":"45","revisions":[2047,2047]},{"value":"49","revisions":[2047,2'
+    '047]},{"value":"50","revisions":[2047,2047]},{"value":"52","revisions":[2047,2047]},{"value":"53","revisions":[2047,2047]},{"value":"54","revisions":['
+    '2047,2047]},{"value":"55","revisions":[2047,2047]},{"value":"56","revisions":[2047,2047]},{"value":"57","revisions":[2047,2047]},{"value":"58","revisi'
+    'ons":[2047,2047]},{"value":"59","revisions":[2047,2047]},{"value":"60","revisions":[2047,2047]},{"value":"62","revisions":[2047,2047]},{"value":"63","'
+    'revisions":[2047,2047]},{"value":"61","revisions":[2047,2047]},{"value":"64","revisions":[2047,2047]},{"value":"65","revisions":[2047,2047]},{"value":'
+    '"66","revisions":[2047,2047]},{"value":"67","revisions":[2047,2047]},{"value":"68","revisions":[2047,2047]},{"value":"69","revisions":[2047,2047]},{"v'
+    'alue":"70","revisions":[2047,2047]},{"value":"71","revisions":[2047,2047]},{"value":"72","revisions":[2047,2047]},{"value":"00","revisions":[2047,2047'
+    ']},{"value":"82","revisions":[2047,2047]},{"value":"73","revisions":[2047,2047]},{"value":"86","revisions":[2047,2047]},{"value":"76","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"ddns_update":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"auto_configuration":{"type":"string","options":[{"value":"dis'
+    'able","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"conflicted_ip_timeout":{"type":"integer","revisio'
+    'ns":[2047,2047]},"dns_service":{"type":"string","options":[{"value":"local","revisions":[2047,2047]},{"value":"default","revisions":[2047,2047]},{"val'
+    'ue":"specify","revisions":[2047,2047]}],"revisions":[2047,2047]},"default_gateway":{"type":"string","revisions":[2047,2047]},"ip_mode":{"type":"string'
+    '","options":[{"value":"range","revisions":[2047,2047]},{"value":"usrgrp","revisions":[2047,2047]}],"revisions":[2047,2047]},"filename":{"type":"string'
+    '","revisions":[2047,2047]},"wifi_ac2":{"type":"string","revisions":[2047,2047]},"dhcp_settings_from_fortiipam":{"type":"string","options":[{"value":"d'
+    'isable","revisions":[1920,1920]},{"value":"enable","revisions":[1920,1920]}],"revisions":[1920,1920]},"wifi_ac3":{"type":"string","revisions":[2047,20'
+    '47]},"vci_match":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"dns_server1":{"type":"string","revisions":[2047,2047]},"ntp_service":{"type":"string","options":[{"value":"local","revisions":[2047,2047]},{"'
+    'value":"default","revisions":[2047,2047]},{"value":"specify","revisions":[2047,2047]}],"revisions":[2047,2047]},"status":{"type":"string","options":[{'
+    '"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"wifi_ac_service":{"type":"string","op'
+    'tions":[{"value":"specify","revisions":[2040,2040]},{"value":"local","revisions":[2040,2040]}],"revisions":[2040,2040]},"dns_server2":{"type":"string"'
+    ',"revisions":[2047,2047]},"dns_server3":{"type":"string","revisions":[2047,2047]},"dns_server4":{"type":"string","revisions":[2040,2040]},"server_type'
+    '":{"type":"string","options":[{"value":"regular","revisions":[2047,2047]},{"value":"ipsec","revisions":[2047,2047]}],"revisions":[2047,2047]},"ddns_tt'
+    'l":{"type":"integer","revisions":[2047,2047]},"wins_server2":{"type":"string","revisions":[2047,2047]},"tftp_server":{"type":"list","children":{"tftp_'
+    'server":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"auto_managed_status":{"type":"string","options":[{"value":"disable","revi'
+    'sions":[1920,1920]},{"value":"enable","revisions":[1920,1920]}],"revisions":[1920,1920]},"netmask":{"type":"string","revisions":[2047,2047]},"reserved'
+    '_address":{"type":"list","children":{"description":{"type":"string","revisions":[2047,2047]},"circuit_id":{"type":"string","revisions":[2040,2040]},"r'
+    'emote_id":{"type":"string","revisions":[2040,2040]},"circuit_id_type":{"type":"string","options":[{"value":"hex","revisions":[2040,2040]},{"value":"st'
+    'ring","revisions":[2040,2040]}],"revisions":[2040,2040]},"mac":{"type":"string","revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]'
+    '},"action":{"type":"string","options":[{"value":"assign","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]},{"value":"reserved","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"mac","revisions":[2040,2040]},{"value":"option82","revisions'
+    '":[2040,2040]}],"revisions":[2040,2040]},"id":{"type":"integer","revisions":[2047,2047]},"remote_id_type":{"type":"string","options":[{"value":"hex","'
+    'revisions":[2040,2040]},{"value":"string","revisions":[2040,2040]}],"revisions":[2040,2040]}},"revisions":[2047,2047]},"ddns_key":{"type":"string","re'
+    'visions":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]},"mac_acl_default_action":{"type":"string","options":[{"value":"assign","re'
+    'visions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"wins_server1":{"type":"string","revisions":[2047,2047]},"dd'
+    'ns_zone":{"type":"string","revisions":[2047,2047]},"vci_string":{"type":"list","children":{"vci_string":{"type":"string","revisions":[2047,2047]}},"re'
+    'visions":[2047,2047]},"forticlient_on_net_status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"ddns_keyname":{"type":"string","revisions":[2047,2047]},"options":{"type":"list","children":{"ip":{"type":"s'
+    'tring","revisions":[2047,2047]},"code":{"type":"integer","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"hex","revisions":[2047,'
+    '2047]},{"value":"string","revisions":[2047,2047]},{"value":"ip","revisions":[2047,2047]},{"value":"fqdn","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"id":{"type":"integer","revisions":[2047,2047]},"value":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2'
+    '047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"exclude_range":{"type":"list","required":false,"options":{"start_ip":{"type":"str","required":false},"end_'
+    'ip":{"type":"str","required":false},"id":{"type":"int","required":false}}},"domain":{"type":"str","required":false},"lease_time":{"type":"int","requir'
+    'ed":false},"ipsec_lease_hold":{"type":"int","required":false},"ntp_server3":{"type":"str","required":false},"ntp_server2":{"type":"str","required":fal'
+    'se},"ntp_server1":{"type":"str","required":false},"wifi_ac1":{"type":"str","required":false},"ddns_server_ip":{"type":"str","required":false},"ddns_up'
+    'date_override":{"type":"str","required":false,"choices":["disable","enable"]},"ddns_auth":{"type":"str","required":false,"choices":["disable","tsig"]}'
+    ',"timezone_option":{"type":"str","required":false,"choices":["disable","default","specify"]},"next_server":{"type":"str","required":false},"ip_range":'
+    '{"type":"list","required":false,"options":{"start_ip":{"type":"str","required":false},"end_ip":{"type":"str","required":false},"id":{"type":"int","req'
+    'uired":false}}},"timezone":{"type":"str","required":false,"choices":["01","02","03","04","05","81","06","07","08","09","10","11","12","13","74","14","'
+    '77","15","87","16","17","18","19","20","75","21","22","23","24","80","79","25","26","27","28","78","29","30","31","32","33","34","35","36","37","38","'
+    '83","84","40","85","41","42","43","39","44","46","47","51","48","45","49","50","52","53","54","55","56","57","58","59","60","62","63","61","64","65","'
+    '66","67","68","69","70","71","72","00","82","73","86","76"]},"ddns_update":{"type":"str","required":false,"choices":["disable","enable"]},"id":{"type"'
+    ':"int","required":false},"auto_configuration":{"type":"str","required":false,"choices":["disable","enable"]},"conflicted_ip_timeout":{"type":"int","re'
+    'quired":false},"dns_service":{"type":"str","required":false,"choices":["local","default","specify"]},"default_gateway":{"type":"str","required":false}'
+    ',"ip_mode":{"type":"str","required":false,"choices":["range","usrgrp"]},"filename":{"type":"str","required":false},"wifi_ac2":{"type":"str","required"'
+    ':false},"dhcp_settings_from_fortiipam":{"type":"str","required":false,"choices":["disable","enable"]},"wifi_ac3":{"type":"str","required":false},"vci_'
+    'match":{"type":"str","required":false,"choices":["disable","enable"]},"dns_server1":{"type":"str","required":false},"ntp_service":{"type":"str","requi'
+    'red":false,"choices":["local","default","specify"]},"status":{"type":"str","required":false,"choices":["disable","enable"]},"wifi_ac_service":{"type":'
+    '"str","required":false,"choices":["specify","local"]},"dns_server2":{"type":"str","required":false},"dns_server3":{"type":"str","required":false},"dns'
+    '_server4":{"type":"str","required":false},"server_type":{"type":"str","required":false,"choices":["regular","ipsec"]},"ddns_ttl":{"type":"int","requir'
+    'ed":false},"wins_server2":{"type":"str","required":false},"tftp_server":{"type":"list","required":false,"options":{"tftp_server":{"type":"str","requir'
+    'ed":false}}},"auto_managed_status":{"type":"str","required":false,"choices":["disable","enable"]},"netmask":{"type":"str","required":false},"reserved_'
+    'address":{"type":"list","required":false,"options":{"description":{"type":"str","required":false},"circuit_id":{"type":"str","required":false},"remote'
+    '_id":{"type":"str","required":false},"circuit_id_type":{"type":"str","required":false,"choices":["hex","string"]},"mac":{"type":"str","required":false'
+    '},"ip":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["assign","block","reserved"]},"type":{"type":"str","required'
+    '":false,"choices":["mac","option82"]},"id":{"type":"int","required":false},"remote_id_type":{"type":"str","required":false,"choices":["hex","string"]}'
+    '}},"ddns_key":{"type":"str","required":false},"interface":{"type":"str","required":false},"mac_acl_default_action":{"type":"str","required":false,"cho'
+    'ices":["assign","block"]},"wins_server1":{"type":"str","required":false},"ddns_zone":{"type":"str","required":false},"vci_string":{"type":"list","requ'
+    'ired":false,"options":{"vci_string":{"type":"str","required":false}}},"forticlient_on_net_status":{"type":"str","required":false,"choices":["disable",'
+    '"enable"]},"ddns_keyname":{"type":"str","required":false},"options":{"type":"list","required":false,"options":{"ip":{"type":"str","required":false},"c'
+    'ode":{"type":"int","required":false},"type":{"type":"str","required":false,"choices":["hex","string","ip","fqdn"]},"id":{"type":"int","required":false'
+    '},"value":{"type":"str","required":false}}}}}'
+)
@@ -0,0 +1,28 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"server_hostname":{"type":"list","children":{"hostname":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+    ',"dns_cache_limit":{"type":"integer","revisions":[2047,2047]},"domain":{"type":"list","children":{"domain":{"type":"string","revisions":[2047,2047]}},'
+    '"revisions":[2047,2047]},"retry":{"type":"integer","revisions":[2047,2047]},"protocol":{"multiple_values":true,"type":"list","options":[{"value":"clea'
+    'rtext","revisions":[1024,1024]},{"value":"dot","revisions":[1024,1024]},{"value":"doh","revisions":[1024,1024]}],"revisions":[1024,1024]},"cache_notfo'
+    'und_responses":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"ssl_certificate":{"type":"string","revisions":[2040,2040]},"source_ip":{"type":"string","revisions":[2047,2047]},"primary":{"type":"string","re'
+    'visions":[2047,2047]},"dns_over_tls":{"type":"string","options":[{"value":"disable","revisions":[1016,1016]},{"value":"enable","revisions":[1016,1016]'
+    '},{"value":"enforce","revisions":[1016,1016]}],"revisions":[2040,1016]},"interface_select_method":{"type":"string","options":[{"value":"auto","revisio'
+    'ns":[2024,2024]},{"value":"sdwan","revisions":[2024,2024]},{"value":"specify","revisions":[2024,2024]}],"revisions":[2040,2024]},"timeout":{"type":"in'
+    'teger","revisions":[2047,2047]},"interface":{"type":"string","revisions":[2040,2024]},"ip6_primary":{"type":"string","revisions":[2047,2047]},"ip6_sec'
+    'ondary":{"type":"string","revisions":[2047,2047]},"dns_cache_ttl":{"type":"integer","revisions":[2047,2047]},"secondary":{"type":"string","revisions":'
+    '[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"server_hostname":{"type":"list","required":false,"options":{"hostname":{"type":"str","required":false}}},"'
+    'dns_cache_limit":{"type":"int","required":false},"domain":{"type":"list","required":false,"options":{"domain":{"type":"str","required":false}}},"retry'
+    '":{"type":"int","required":false},"protocol":{"type":"list","required":false,"choices":["cleartext","dot","doh"]},"cache_notfound_responses":{"type":"'
+    'str","required":false,"choices":["disable","enable"]},"ssl_certificate":{"type":"str","required":false},"source_ip":{"type":"str","required":false},"p'
+    'rimary":{"type":"str","required":false},"dns_over_tls":{"type":"str","required":false},"interface_select_method":{"type":"str","required":false},"time'
+    'out":{"type":"int","required":false},"interface":{"type":"str","required":false},"ip6_primary":{"type":"str","required":false},"ip6_secondary":{"type"'
+    ':"str","required":false},"dns_cache_ttl":{"type":"int","required":false},"secondary":{"type":"str","required":false}}}'
+)
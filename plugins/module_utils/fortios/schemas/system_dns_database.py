@@ -0,0 +1,33 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"ip_master":{"type":"string","revisions":[2047,1023]},"domain":{"type":"string","revisions":[2047,2047]},"name":{"type":"st'
+    'ring","revisions":[2047,2047]},"authoritative":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"rr_max":{"type":"integer","revisions":[1920,1920]},"source_ip":{"type":"string","revisions":[2047,2047]},"conta'
+    'ct":{"type":"string","revisions":[2047,2047]},"primary_name":{"type":"string","revisions":[2047,2047]},"dns_entry":{"type":"list","children":{"status"'
+    ':{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip":{"t'
+    'ype":"string","revisions":[2047,2047]},"hostname":{"type":"string","revisions":[2047,2047]},"ipv6":{"type":"string","revisions":[2047,2047]},"canonica'
+    'l_name":{"type":"string","revisions":[2047,2047]},"preference":{"type":"integer","revisions":[2047,2047]},"ttl":{"type":"integer","revisions":[2047,20'
+    '47]},"type":{"type":"string","options":[{"value":"A","revisions":[2047,2047]},{"value":"NS","revisions":[2047,2047]},{"value":"CNAME","revisions":[204'
+    '7,2047]},{"value":"MX","revisions":[2047,2047]},{"value":"AAAA","revisions":[2047,2047]},{"value":"PTR","revisions":[2047,2047]},{"value":"PTR_V6","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"ttl":{"type":"integer","rev'
+    'isions":[2047,2047]},"forwarder":{"type":"string","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"master","revisions":[2047,1023'
+    ']},{"value":"slave","revisions":[2047,1023]},{"value":"primary","revisions":[1024,1024]},{"value":"secondary","revisions":[1024,1024]}],"revisions":[2'
+    '047,2047]},"allow_transfer":{"type":"string","revisions":[2047,2047]},"ip_primary":{"type":"string","revisions":[1024,1024]},"view":{"type":"string","'
+    'options":[{"value":"shadow","revisions":[2047,2047]},{"value":"public","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"ip_master":{"type":"str","required'
+    '":false},"domain":{"type":"str","required":false},"name":{"type":"str","required":false},"authoritative":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"rr_max":{"type":"int","required":false},"source_ip":{"type":"str","required":false},"contact":{"type":"str","required":false},"prim'
+    'ary_name":{"type":"str","required":false},"dns_entry":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"ip":{"type":"str","required":false},"hostname":{"type":"str","required":false},"ipv6":{"type":"str","required":false},"canonical_n'
+    'ame":{"type":"str","required":false},"preference":{"type":"int","required":false},"ttl":{"type":"int","required":false},"type":{"type":"str","required'
+    '":false,"choices":["A","NS","CNAME","MX","AAAA","PTR","PTR_V6"]},"id":{"type":"int","required":false}}},"ttl":{"type":"int","required":false},"forward'
+    'er":{"type":"str","required":false},"type":{"type":"str","required":false},"allow_transfer":{"type":"str","required":false},"ip_primary":{"type":"str"'
+    ',"required":false},"view":{"type":"str","required":false,"choices":["shadow","public"]}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"doh":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"'
+    'revisions":[1024,1024]},"dnsfilter_profile":{"type":"string","revisions":[2047,2047]},"mode":{"type":"string","options":[{"value":"recursive","revisio'
+    'ns":[2047,2047]},{"value":"non-recursive","revisions":[2047,2047]},{"value":"forward-only","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{'
+    '"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"doh":{"type":"str","required":false,"choices":["enable","disable"]},"dnsfilter_profile":{"type":"str","req'
+    'uired":false},"mode":{"type":"str","required":false,"choices":["recursive","non-recursive","forward-only"]},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"priority":{"type":"string","options":[{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{'
+    '"value":"high","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"ds":{"type":"integer","revisions":['
+    '2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"priority":{"type":"str","required":false,"choices":["low","medium","high"]},"id":{"type":"int","required":'
+    'false},"ds":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"username":{"type":"string","revisions":[2047,2047]},"authenticate":{"type":"string","options":[{"value":"enable","revision'
+    's":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2047,2047]},"server":{'
+    '"type":"string","revisions":[2047,2047]},"reply_to":{"type":"string","revisions":[2047,2047]},"source_ip6":{"type":"string","revisions":[2047,2047]},"'
+    'ssl_min_proto_version":{"type":"string","options":[{"value":"default","revisions":[2047,2047]},{"value":"SSLv3","revisions":[2047,2047]},{"value":"TLS'
+    'v1","revisions":[2047,2047]},{"value":"TLSv1-1","revisions":[2047,2047]},{"value":"TLSv1-2","revisions":[2047,2047]}],"revisions":[2047,2047]},"valida'
+    'te_server":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"interface":{"type":"string","revisions":[1024,1024]},"security":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"star'
+    'ttls","revisions":[2047,2047]},{"value":"smtps","revisions":[2047,2047]}],"revisions":[2047,2047]},"password":{"type":"string","revisions":[2047,2047]'
+    '},"type":{"type":"string","options":[{"value":"custom","revisions":[2047,2047]}],"revisions":[2047,2047]},"port":{"type":"integer","revisions":[2047,2'
+    '047]},"interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[1024,1024]},{"value":"sdwan","revisions":[1024,1024]},{"value'
+    '":"specify","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"username":{"type":"str","required":false},"authenticate":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"source_ip":{"type":"str","required":false},"server":{"type":"str","required":false},"reply_to":{"type":"str","required":false},"source_'
+    'ip6":{"type":"str","required":false},"ssl_min_proto_version":{"type":"str","required":false,"choices":["default","SSLv3","TLSv1","TLSv1-1","TLSv1-2"]}'
+    ',"validate_server":{"type":"str","required":false,"choices":["enable","disable"]},"interface":{"type":"str","required":false},"security":{"type":"str"'
+    ',"required":false,"choices":["none","starttls","smtps"]},"password":{"type":"str","required":false},"type":{"type":"str","required":false,"choices":["'
+    'custom"]},"port":{"type":"int","required":false},"interface_select_method":{"type":"str","required":false,"choices":["auto","sdwan","specify"]}}}'
+)
@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"category":{"type":"integer","revisions":[2047,2047]},"resource":{"type":"string","revisions":[2047,2047]},"name":{"type":"'
+    'string","revisions":[2047,2047]},"refresh_rate":{"type":"integer","revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2040,2040]},"comm'
+    'ents":{"type":"string","revisions":[2047,2047]},"username":{"type":"string","revisions":[2040,2040]},"interface_select_method":{"type":"string","optio'
+    'ns":[{"value":"auto","revisions":[1664,1664]},{"value":"sdwan","revisions":[1664,1664]},{"value":"specify","revisions":[1664,1664]}],"revisions":[1920'
+    ',1664]},"user_agent":{"type":"string","revisions":[1920,1664]},"interface":{"type":"string","revisions":[1920,1664]},"password":{"type":"string","revi'
+    'sions":[2040,2040]},"type":{"type":"string","options":[{"value":"category","revisions":[2047,2047]},{"value":"address","revisions":[2047,2047]},{"valu'
+    'e":"domain","revisions":[2047,2047]},{"value":"malware","revisions":[2040,2040]}],"revisions":[2047,2047]},"uuid":{"type":"string","revisions":[1024,1'
+    '024]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"category":{"type":"int","required"'
+    ':false},"resource":{"type":"str","required":false},"name":{"type":"str","required":false},"refresh_rate":{"type":"int","required":false},"source_ip":{'
+    '"type":"str","required":false},"comments":{"type":"str","required":false},"username":{"type":"str","required":false},"interface_select_method":{"type"'
+    ':"str","required":false},"user_agent":{"type":"str","required":false},"interface":{"type":"str","required":false},"password":{"type":"str","required":'
+    'false},"type":{"type":"str","required":false},"uuid":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disabled","revisions":[1024,1024]},{"value":"initialized","revisions":[1024,'
+    '1024]},{"value":"downloading","revisions":[1024,1024]},{"value":"download-failed","revisions":[1024,1024]},{"value":"device-disconnected","revisions":'
+    '[1024,1024]},{"value":"ready","revisions":[1024,1024]},{"value":"staging","revisions":[1024,1024]},{"value":"cancelled","revisions":[1024,1024]},{"val'
+    'ue":"confirmed","revisions":[1024,1024]},{"value":"done","revisions":[1024,1024]},{"value":"failed","revisions":[1024,1024]}],"revisions":[1024,1024]}'
+    ',"node_list":{"type":"list","children":{"coordinating_fortigate":{"type":"string","revisions":[1024,1024]},"upgrade_path":{"type":"string","revisions"'
+    ':[1024,1024]},"setup_time":{"type":"string","revisions":[1024,1024]},"device_type":{"type":"string","options":[{"value":"fortigate","revisions":[1024,'
+    '1024]},{"value":"fortiswitch","revisions":[1024,1024]},{"value":"fortiap","revisions":[1024,1024]}],"revisions":[1024,1024]},"time":{"type":"string","'
+    'revisions":[1024,1024]},"timing":{"type":"string","options":[{"value":"immediate","revisions":[1024,1024]},{"value":"scheduled","revisions":[1024,1024'
+    ']}],"revisions":[1024,1024]},"serial":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"upgrade_id":{"type":"integer","revisions":['
+    '1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disabled","initialized","downloading","download-failed"'
+    ',"device-disconnected","ready","staging","cancelled","confirmed","done","failed"]},"node_list":{"type":"list","required":false,"options":{"coordinatin'
+    'g_fortigate":{"type":"str","required":false},"upgrade_path":{"type":"str","required":false},"setup_time":{"type":"str","required":false},"device_type"'
+    ':{"type":"str","required":false,"choices":["fortigate","fortiswitch","fortiap"]},"time":{"type":"str","required":false},"timing":{"type":"str","requir'
+    'ed":false,"choices":["immediate","scheduled"]},"serial":{"type":"str","required":false}}},"upgrade_id":{"type":"int","required":false}}}'
+)
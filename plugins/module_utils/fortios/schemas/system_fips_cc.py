@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"entropy_token":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]},{"value":"dynamic","revisions":[2047,2047]}],"revisions":[2047,2047]},"key_generation_self_test":{"type":"string","options":[{"value":"enable"'
+    ',"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"self_test_period":{"type":"integer","revisions":[2047'
+    ',2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"entropy_token":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable","dynamic"]},"key_generation_self_test":{"type":"str","required":false,"choices":["enable","disable"]},"self_'
+    'test_period":{"type":"int","required":false}}}'
+)
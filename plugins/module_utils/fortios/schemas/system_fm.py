@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"scheduled_config_restore":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"auto_backup":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","'
+    'revisions":[2047,2047]}],"revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"id":{"type":"string","revisions":[2047,2047]},"vdom"'
+    ':{"type":"string","revisions":[2047,2047]},"ipsec":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"scheduled_config_restore":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"auto_backup":{"type":"str","required":false,"choices":["enable","disable"]},"ip":{"type":"str"'
+    ',"required":false},"id":{"type":"str","required":false},"vdom":{"type":"str","required":false},"ipsec":{"type":"str","required":false,"choices":["enab'
+    'le","disable"]}}}'
+)
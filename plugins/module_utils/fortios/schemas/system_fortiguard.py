@@ -0,0 +1,67 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"outbreak_prevention_cache_mpercent":{"type":"integer","revisions":[2047,2047]},"protocol":{"type":"string","options":[{"va'
+    'lue":"udp","revisions":[2045,2045]},{"value":"http","revisions":[2045,2045]},{"value":"https","revisions":[2045,2045]}],"revisions":[2047,2045]},"webf'
+    'ilter_license":{"type":"integer","revisions":[2047,2047]},"sdns_server_ip":{"type":"string","revisions":[2047,2047]},"antispam_timeout":{"type":"integ'
+    'er","revisions":[2047,2047]},"update_server_location":{"type":"string","options":[{"value":"usa","revisions":[2047,2047]},{"value":"any","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"antispam_cache_mpercent":{"type":"integer","revisions":[2047,2047]},"ddns_server_ip":{"type":"string","revision'
+    's":[2047,2047]},"antispam_cache":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"auto_join_forticloud":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":['
+    '1024,1024]}],"revisions":[1024,1024]},"source_ip6":{"type":"string","revisions":[2047,2047]},"update_uwdb":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"webfilter_force_off":{"type":"string","options":[{"'
+    'value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"port":{"type":"string","options":[{"va'
+    'lue":"8888","revisions":[2047,2047]},{"value":"53","revisions":[2047,2047]},{"value":"80","revisions":[2047,2047]},{"value":"443","revisions":[2040,20'
+    '40]}],"revisions":[2047,2047]},"ddns_server_port":{"type":"integer","revisions":[2047,2047]},"sandbox_region":{"type":"string","revisions":[2040,2040]'
+    '},"webfilter_expiration":{"type":"integer","revisions":[2047,2047]},"service_account_id":{"type":"string","revisions":[2047,23]},"fortiguard_anycast":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"antispam'
+    '_expiration":{"type":"integer","revisions":[2047,2047]},"outbreak_prevention_license":{"type":"integer","revisions":[2047,2047]},"persistent_connectio'
+    'n":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"sdns_'
+    'options":{"multiple_values":true,"type":"list","options":[{"value":"include-question-section","revisions":[1920,1920]}],"revisions":[1920,1920]},"upda'
+    'te_ffdb":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},'
+    '"webfilter_cache":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[204'
+    '7,2047]},"webfilter_cache_ttl":{"type":"integer","revisions":[2047,2047]},"antispam_license":{"type":"integer","revisions":[2047,2047]},"videofilter_l'
+    'icense":{"type":"integer","revisions":[1024,1024]},"webfilter_timeout":{"type":"integer","revisions":[2047,2047]},"anycast_sdns_server_ip":{"type":"st'
+    'ring","revisions":[1920,1920]},"antispam_cache_ttl":{"type":"integer","revisions":[2047,2047]},"proxy_password":{"type":"string","revisions":[2040,204'
+    '0]},"antispam_force_off":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"interface":{"type":"string","revisions":[2040,2024]},"proxy_server_port":{"type":"integer","revisions":[2040,2040]},"update_build_pro'
+    'xy":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"prox'
+    'y_server_ip":{"type":"string","revisions":[2040,2040]},"outbreak_prevention_cache":{"type":"string","options":[{"value":"enable","revisions":[2047,204'
+    '7]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sdns_server_port":{"type":"integer","revisions":[2047,2047]},"outbreak_prev'
+    'ention_timeout":{"type":"integer","revisions":[2047,2047]},"outbreak_prevention_expiration":{"type":"integer","revisions":[2047,2047]},"videofilter_ex'
+    'piration":{"type":"integer","revisions":[1024,1024]},"source_ip":{"type":"string","revisions":[2047,2047]},"outbreak_prevention_cache_ttl":{"type":"in'
+    'teger","revisions":[2047,2047]},"update_extdb":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":['
+    '1024,1024]}],"revisions":[1024,1024]},"interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[2024,2024]},{"value":"sdwan",'
+    '"revisions":[2024,2024]},{"value":"specify","revisions":[2024,2024]}],"revisions":[2040,2024]},"proxy_username":{"type":"string","revisions":[2040,204'
+    '0]},"fortiguard_anycast_source":{"type":"string","options":[{"value":"fortinet","revisions":[2040,2040]},{"value":"aws","revisions":[2040,2040]},{"val'
+    'ue":"debug","revisions":[2040,2040]}],"revisions":[2040,2040]},"anycast_sdns_server_port":{"type":"integer","revisions":[1920,1920]},"outbreak_prevent'
+    'ion_force_off":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"load_balance_servers":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"outbreak_prevention_cache_mpercent":{"type":"int","required":false},"protocol":{"type":"str","required":fa'
+    'lse},"webfilter_license":{"type":"int","required":false},"sdns_server_ip":{"type":"str","required":false},"antispam_timeout":{"type":"int","required":'
+    'false},"update_server_location":{"type":"str","required":false,"choices":["usa","any"]},"antispam_cache_mpercent":{"type":"int","required":false},"ddn'
+    's_server_ip":{"type":"str","required":false},"antispam_cache":{"type":"str","required":false,"choices":["enable","disable"]},"auto_join_forticloud":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"source_ip6":{"type":"str","required":false},"update_uwdb":{"type":"str","required":false'
+    ',"choices":["enable","disable"]},"webfilter_force_off":{"type":"str","required":false,"choices":["enable","disable"]},"port":{"type":"str","required":'
+    'false},"ddns_server_port":{"type":"int","required":false},"sandbox_region":{"type":"str","required":false},"webfilter_expiration":{"type":"int","requi'
+    'red":false},"service_account_id":{"type":"str","required":false},"fortiguard_anycast":{"type":"str","required":false,"choices":["enable","disable"]},"'
+    'antispam_expiration":{"type":"int","required":false},"outbreak_prevention_license":{"type":"int","required":false},"persistent_connection":{"type":"st'
+    'r","required":false,"choices":["enable","disable"]},"sdns_options":{"type":"list","required":false,"choices":["include-question-section"]},"update_ffd'
+    'b":{"type":"str","required":false,"choices":["enable","disable"]},"webfilter_cache":{"type":"str","required":false,"choices":["enable","disable"]},"we'
+    'bfilter_cache_ttl":{"type":"int","required":false},"antispam_license":{"type":"int","required":false},"videofilter_license":{"type":"int","required":f'
+    'alse},"webfilter_timeout":{"type":"int","required":false},"anycast_sdns_server_ip":{"type":"str","required":false},"antispam_cache_ttl":{"type":"int",'
+    '"required":false},"proxy_password":{"type":"str","required":false},"antispam_force_off":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"interface":{"type":"str","required":false},"proxy_server_port":{"type":"int","required":false},"update_build_proxy":{"type":"str","required":false,"'
+    'choices":["enable","disable"]},"proxy_server_ip":{"type":"str","required":false},"outbreak_prevention_cache":{"type":"str","required":false,"choices":'
+    '["enable","disable"]},"sdns_server_port":{"type":"int","required":false},"outbreak_prevention_timeout":{"type":"int","required":false},"outbreak_preve'
+    'ntion_expiration":{"type":"int","required":false},"videofilter_expiration":{"type":"int","required":false},"source_ip":{"type":"str","required":false}'
+    ',"outbreak_prevention_cache_ttl":{"type":"int","required":false},"update_extdb":{"type":"str","required":false,"choices":["enable","disable"]},"interf'
+    'ace_select_method":{"type":"str","required":false},"proxy_username":{"type":"str","required":false},"fortiguard_anycast_source":{"type":"str","require'
+    'd":false,"choices":["fortinet","aws","debug"]},"anycast_sdns_server_port":{"type":"int","required":false},"outbreak_prevention_force_off":{"type":"str'
+    '","required":false,"choices":["enable","disable"]},"load_balance_servers":{"type":"int","required":false}}}'
+)
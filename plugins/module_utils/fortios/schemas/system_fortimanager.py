@@ -0,0 +1,20 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"central_management":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"central_mgmt_auto_backup":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"dis'
+    'able","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"central_mgmt_schedule_script_restore":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipsec":{"type":'
+    '"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"vdom":{"type":"s'
+    'tring","revisions":[2047,2047]},"central_mgmt_schedule_config_restore":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value"'
+    ':"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"central_management":{"type":"str","required":false,"choices":["enable","disable"]},"central_mgmt_auto_back'
+    'up":{"type":"str","required":false,"choices":["enable","disable"]},"ip":{"type":"str","required":false},"central_mgmt_schedule_script_restore":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]},"ipsec":{"type":"str","required":false,"choices":["enable","disable"]},"vdom":{"type":"str","r'
+    'equired":false},"central_mgmt_schedule_config_restore":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
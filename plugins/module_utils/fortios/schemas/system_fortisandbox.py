@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"forticloud":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,10'
+    '24]}],"revisions":[1024,1024]},"source_ip":{"type":"string","revisions":[2047,2047]},"server":{"type":"string","revisions":[2047,2047]},"interface_sel'
+    'ect_method":{"type":"string","options":[{"value":"auto","revisions":[1664,1664]},{"value":"sdwan","revisions":[1664,1664]},{"value":"specify","revisio'
+    'ns":[1664,1664]}],"revisions":[1920,1664]},"ssl_min_proto_version":{"type":"string","options":[{"value":"default","revisions":[2047,2047]},{"value":"S'
+    'SLv3","revisions":[2047,2047]},{"value":"TLSv1","revisions":[2047,2047]},{"value":"TLSv1-1","revisions":[2047,2047]},{"value":"TLSv1-2","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"interface":{"type":"string","revisions":[1920,1664]},"enc_algorithm":{"type":"string","options":[{"value":"defau'
+    'lt","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]},"email":{"type'
+    '":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"forticloud":{"type":"str","require'
+    'd":false,"choices":["enable","disable"]},"source_ip":{"type":"str","required":false},"server":{"type":"str","required":false},"interface_select_method'
+    '":{"type":"str","required":false},"ssl_min_proto_version":{"type":"str","required":false,"choices":["default","SSLv3","TLSv1","TLSv1-1","TLSv1-2"]},"i'
+    'nterface":{"type":"str","required":false},"enc_algorithm":{"type":"str","required":false,"choices":["default","high","low"]},"email":{"type":"str","re'
+    'quired":false}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"server_cert":{"type":"string","revisions":[1920,1920]},"server_port":{"type":"integer","revisions":[2047,2047]},"server_ip'
+    '":{"type":"string","revisions":[2047,2047]},"server":{"type":"string","revisions":[1024,1024]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"server_cert":{"type":"str","requir'
+    'ed":false},"server_port":{"type":"int","required":false},"server_ip":{"type":"str","required":false},"server":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]},"vni":{"type":"integer","revisions":[2040,2040]},"interface":{"type":"stri'
+    'ng","revisions":[2040,2040]},"ip_version":{"type":"string","options":[{"value":"ipv4-unicast","revisions":[2040,2040]},{"value":"ipv6-unicast","revisi'
+    'ons":[2040,2040]}],"revisions":[2040,2040]},"dstport":{"type":"integer","revisions":[2040,2040]},"type":{"type":"string","options":[{"value":"ethernet'
+    '","revisions":[1536,1536]},{"value":"ppp","revisions":[1536,1536]}],"revisions":[1536,1536]},"remote_ip6":{"type":"string","revisions":[2040,2040]},"r'
+    'emote_ip":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"vni":{"type":"int","required":false},"interface":{"type":"str","req'
+    'uired":false},"ip_version":{"type":"str","required":false,"choices":["ipv4-unicast","ipv6-unicast"]},"dstport":{"type":"int","required":false},"type":'
+    '{"type":"str","required":false,"choices":["ethernet","ppp"]},"remote_ip6":{"type":"str","required":false},"remote_ip":{"type":"str","required":false}}'
+    '}'
+)
@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ip6_range":{"type":"list","children":{"start_ip":{"type":"string","revisions":[1920,1920]},"end_ip":{"type":"string","revi'
+    'sions":[1920,1920]},"id":{"type":"integer","revisions":[1920,1920]}},"revisions":[1920,1920]},"description":{"type":"string","revisions":[2047,2047]},'
+    '"country_id":{"type":"string","revisions":[2047,2047]},"ip_range":{"type":"list","children":{"start_ip":{"type":"string","revisions":[2047,2047]},"end'
+    '_ip":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"name":{"type":"string","revi'
+    'sions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ip6_range":{"type":"list","required":false,"options":{"start_ip":{"type":"str","required":false},"end_ip":'
+    '{"type":"str","required":false},"id":{"type":"int","required":false}}},"description":{"type":"str","required":false},"country_id":{"type":"str","requi'
+    'red":false},"ip_range":{"type":"list","required":false,"options":{"start_ip":{"type":"str","required":false},"end_ip":{"type":"str","required":false},'
+    '"id":{"type":"int","required":false}}},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,12 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"port":{"type":"integer","revisions":[2047,2047]},"context":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2'
+    '047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"port":{"type":"int","required":false},"context":{"type":"int","required":false}}}'
+)
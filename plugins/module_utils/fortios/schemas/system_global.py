@@ -0,0 +1,325 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"two_factor_ftk_expiry":{"type":"integer","revisions":[2047,2047]},"ssd_trim_weekday":{"type":"string","options":[{"value":'
+    '"sunday","revisions":[2047,2047]},{"value":"monday","revisions":[2047,2047]},{"value":"tuesday","revisions":[2047,2047]},{"value":"wednesday","revisio'
+    'ns":[2047,2047]},{"value":"thursday","revisions":[2047,2047]},{"value":"friday","revisions":[2047,2047]},{"value":"saturday","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"gui_date_format":{"type":"string","options":[{"value":"yyyy/MM/dd","revisions":[2047,2047]},{"value":"dd/MM/yyyy","revision'
+    's":[2047,2047]},{"value":"MM/dd/yyyy","revisions":[2047,2047]},{"value":"yyyy-MM-dd","revisions":[2047,2047]},{"value":"dd-MM-yyyy","revisions":[2047,'
+    '2047]},{"value":"MM-dd-yyyy","revisions":[2047,2047]}],"revisions":[2047,2047]},"av_affinity":{"type":"string","revisions":[2047,2047]},"wad_csvc_db_c'
+    'ount":{"type":"integer","revisions":[2047,2047]},"admin_scp":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"endpoint_control_portal_port":{"type":"integer","revisions":[2047,7]},"virtual_server_count":{"ty'
+    'pe":"integer","revisions":[2047,23]},"proxy_re_authentication_mode":{"type":"string","options":[{"value":"session","revisions":[2047,2047]},{"value":"'
+    'traffic","revisions":[2047,2047]},{"value":"absolute","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssd_trim_freq":{"type":"string","options":[{'
+    '"value":"never","revisions":[2047,2047]},{"value":"hourly","revisions":[2047,2047]},{"value":"daily","revisions":[2047,2047]},{"value":"weekly","revis'
+    'ions":[2047,2047]},{"value":"monthly","revisions":[2047,2047]}],"revisions":[2047,2047]},"per_user_bal":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"tcp_halfclose_timer":{"type":"integer","revisions":[20'
+    '47,2047]},"wireless_controller_port":{"type":"integer","revisions":[2047,2047]},"timezone":{"type":"string","options":[{"value":"01","revisions":[2047'
+    ',2047]},{"value":"02","revisions":[2047,2047]},{"value":"03","revisions":[2047,2047]},{"value":"04","revisions":[2047,2047]},{"value":"05","revisions"'
+    ':[2047,2047]},{"value":"81","revisions":[2047,2047]},{"value":"06","revisions":[2047,2047]},{"value":"07","revisions":[2047,2047]},{"value":"08","revi'
+    'sions":[2047,2047]},{"value":"09","revisions":[2047,2047]},{"value":"10","revisions":[2047,2047]},{"value":"11","revisions":[2047,2047]},{"value":"12"'
+    ',"revisions":[2047,2047]},{"value":"13","revisions":[2047,2047]},{"value":"74","revisions":[2047,2047]},{"value":"14","revisions":[2047,2047]},{"value'
+    '":"77","revisions":[2047,2047]},{"value":"15","revisions":[2047,2047]},{"value":"87","revisions":[2047,2047]},{"value":"16","revisions":[2047,2047]},{'
+    '"value":"17","revisions":[2047,2047]},{"value":"18","revisions":[2047,2047]},{"value":"19","revisions":[2047,2047]},{"value":"20","revisions":[2047,20'
+    '47]},{"value":"75","revisions":[2047,2047]},{"value":"21","revisions":[2047,2047]},{"value":"22","revisions":[2047,2047]},{"value":"23","revisions":[2'
+    '047,2047]},{"value":"24","revisions":[2047,2047]},{"value":"80","revisions":[2047,2047]},{"value":"79","revisions":[2047,2047]},{"value":"25","revisio'
+    'ns":[2047,2047]},{"value":"26","revisions":[2047,2047]},{"value":"27","revisions":[2047,2047]},{"value":"28","revisions":[2047,2047]},{"value":"78","r'
+    'evisions":[2047,2047]},{"value":"29","revisions":[2047,2047]},{"value":"30","revisions":[2047,2047]},{"value":"31","revisions":[2047,2047]},{"value":"'
+    '32","revisions":[2047,2047]},{"value":"33","revisions":[2047,2047]},{"value":"34","revisions":[2047,2047]},{"value":"35","revisions":[2047,2047]},{"va'
+    'lue":"36","revisions":[2047,2047]},{"value":"37","revisions":[2047,2047]},{"value":"38","revisions":[2047,2047]},{"value":"83","revisions":[2047,2047]'
+    '},{"value":"84","revisions":[2047,2047]},{"value":"40","revisions":[2047,2047]},{"value":"85","revisions":[2047,2047]},{"value":"41","revisions":[2047'
+    ',2047]},{"value":"42","revisions":[2047,2047]},{"value":"43","revisions":[2047,2047]},{"value":"39","revisions":[2047,2047]},{"value":"44","revisions"'
+    ':[2047,2047]},{"value":"46","revisions":[2047,2047]},{"value":"47","revisions":[2047,2047]},{"value":"51","revisions":[2047,2047]},{"value":"48","revi'
+    'sions":[2047,2047]},{"value":"45","revisions":[2047,2047]},{"value":"49","revisions":[2047,2047]},{"value":"50","revisions":[2047,2047]},{"value":"52"'
+    ',"revisions":[2047,2047]},{"value":"53","revisions":[2047,2047]},{"value":"54","revisions":[2047,2047]},{"value":"55","revisions":[2047,2047]},{"value'
+    '":"56","revisions":[2047,2047]},{"value":"57","revisions":[2047,2047]},{"value":"58","revisions":[2047,2047]},{"value":"59","revisions":[2047,2047]},{'
+    '"value":"60","revisions":[2047,2047]},{"value":"62","revisions":[2047,2047]},{"value":"63","revisions":[2047,2047]},{"value":"61","revisions":[2047,20'
+    '47]},{"value":"64","revisions":[2047,2047]},{"value":"65","revisions":[2047,2047]},{"value":"66","revisions":[2047,2047]},{"value":"67","revisions":[2'
+    '047,2047]},{"value":"68","revisions":[2047,2047]},{"value":"69","revisions":[2047,2047]},{"value":"70","revisions":[2047,2047]},{"value":"71","revisio'
+    'ns":[2047,2047]},{"value":"72","revisions":[2047,2047]},{"value":"00","revisions":[2047,2047]},{"value":"82","revisions":[2047,2047]},{"value":"73","r'
+    'evisions":[2047,2047]},{"value":"86","revisions":[2047,2047]},{"value":"76","revisions":[2047,2047]}],"revisions":[2047,2047]},"revision_image_auto_ba'
+    'ckup":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"cs'
+    'r_ca_attribute":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"udp_idle_timer":{"type":"integer","revisions":[2047,2047]},"revision_backup_on_logout":{"type":"string","options":[{"value":"enable","revision'
+    's":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"clt_cert_req":{"type":"string","options":[{"value":"enable","re'
+    'visions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"block_session_timer":{"type":"integer","revisions":[2047,'
+    '2047]},"ldapconntimeout":{"type":"integer","revisions":[2047,2047]},"admin_ssh_port":{"type":"integer","revisions":[2047,2047]},"tcp_timewait_timer":{'
+    '"type":"integer","revisions":[2047,2047]},"ip_src_port_range":{"type":"string","revisions":[2047,2047]},"two_factor_sms_expiry":{"type":"integer","rev'
+    'isions":[2047,2047]},"ssl_min_proto_version":{"type":"string","options":[{"value":"SSLv3","revisions":[2047,2047]},{"value":"TLSv1","revisions":[2047,'
+    '2047]},{"value":"TLSv1-1","revisions":[2047,2047]},{"value":"TLSv1-2","revisions":[2047,2047]},{"value":"TLSv1-3","revisions":[2040,2040]}],"revisions'
+    '":[2047,2047]},"igmp_state_limit":{"type":"integer","revisions":[2047,2047]},"restart_time":{"type":"string","revisions":[2047,2047]},"url_filter_affi'
+    'nity":{"type":"string","revisions":[2040,2040]},"gui_local_out":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disab'
+    'le","revisions":[1024,1024]}],"revisions":[1024,1024]},"admin_https_ssl_versions":{"multiple_values":true,"type":"list","options":[{"value":"tlsv1-0",'
+    '"revisions":[2047,7]},{"value":"tlsv1-1","revisions":[2047,2047]},{"value":"tlsv1-2","revisions":[2047,2047]},{"value":"tlsv1-3","revisions":[2040,204'
+    '0]}],"revisions":[2047,2047]},"vdom_mode":{"type":"string","options":[{"value":"no-vdom","revisions":[2040,2040]},{"value":"split-vdom","revisions":[2'
+    '040,2040]},{"value":"multi-vdom","revisions":[2040,2040]}],"revisions":[2040,1016]},"strong_crypto":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"admin_hsts_max_age":{"type":"integer","revisions":[2047,20'
+    '47]},"admin_sport":{"type":"integer","revisions":[2047,2047]},"user_device_store_max_devices":{"type":"integer","revisions":[1536,1536]},"cfg_revert_t'
+    'imeout":{"type":"integer","revisions":[2047,2047]},"gui_display_hostname":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"val'
+    'ue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ndp_max_entry":{"type":"integer","revisions":[2047,2047]},"refresh":{"type":"integer'
+    '","revisions":[2047,2047]},"gui_device_longitude":{"type":"string","revisions":[2047,2047]},"scanunit_count":{"type":"integer","revisions":[2047,2047]'
+    '},"sslvpn_cipher_hardware_acceleration":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,20'
+    '47]}],"revisions":[2047,1023]},"gui_lines_per_page":{"type":"integer","revisions":[2047,383]},"remoteauthtimeout":{"type":"integer","revisions":[2047,'
+    '2047]},"arp_max_entry":{"type":"integer","revisions":[2047,2047]},"check_reset_range":{"type":"string","options":[{"value":"strict","revisions":[2047,'
+    '2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"br_fdb_max_entry":{"type":"integer","revisions":[2047,2047]},"gui_allow_'
+    'default_hostname":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[204'
+    '0,2040]},"private_data_encryption":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"ssd_trim_min":{"type":"integer","revisions":[2047,2047]},"endpoint_control_fds_access":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"admin_restrict_local":{"type":"string","options":[{"value":'
+    '"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"per_user_bwl":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[1023,1023]},{"value":"disable","revisions":[1023,1023]}],"revisions":[2047,1023]},"ipv6_allow_traffic_redirect":{"type":"s'
+    'tring","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"miglog_affinity":{'
+    '"type":"string","revisions":[2047,2047]},"security_rating_result_submission":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"'
+    'value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"login_timestamp":{"type":"string","options":[{"value":"enable","revisions":[2047,'
+    '2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sys_perf_log_interval":{"type":"integer","revisions":[2047,2047]},"ssd_t'
+    'rim_date":{"type":"integer","revisions":[2047,2047]},"dst":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","'
+    'revisions":[2047,2047]}],"revisions":[2047,2047]},"virtual_server_hardware_acceleration":{"type":"string","options":[{"value":"disable","revisions":[2'
+    '3,23]},{"value":"enable","revisions":[23,23]}],"revisions":[2047,23]},"honor_df":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]'
+    '},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_ssl_connection":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"tcp_halfopen_timer":{"type":"integer","revisions":[2047,2047]},"a'
+    'dmin_ssh_password":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"tcp_option":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"reset_sessionless_tcp":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"radius_port":{"type":"integer","revisions":[2047,2047]},"compliance_check":{"type":"string","options":[{"value":"enable"'
+    ',"revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"fec_port":{"type":"integer","revisions":[2040,2040]},"sslvpn_max_wor'
+    'ker_count":{"type":"integer","revisions":[2047,2047]},"policy_auth_concurrent":{"type":"integer","revisions":[2047,2047]},"snat_route_change":{"type":'
+    '"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssh_cbc_cipher":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipsec_ha'
+    '_seqjump_rate":{"type":"integer","revisions":[1024,1024]},"wad_csvc_cs_count":{"type":"integer","revisions":[2047,2047]},"user_device_store_max_users"'
+    ':{"type":"integer","revisions":[1536,1536]},"miglogd_children":{"type":"integer","revisions":[2047,2047]},"admin_port":{"type":"integer","revisions":['
+    '2047,2047]},"vdom_admin":{"type":"string","options":[{"value":"enable","revisions":[23,7]},{"value":"disable","revisions":[23,7]}],"revisions":[2047,2'
+    '3]},"log_uuid_policy":{"type":"string","options":[{"value":"enable","revisions":[376,376]},{"value":"disable","revisions":[376,376]}],"revisions":[204'
+    '0,376]},"wad_source_affinity":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"management_vdom":{"type":"string","revisions":[2047,2047]},"cpu_use_threshold":{"type":"integer","revisions":[2047,2047]},"admin'
+    '_lockout_duration":{"type":"integer","revisions":[2047,2047]},"gui_rest_api_cache":{"type":"string","options":[{"value":"enable","revisions":[1024,102'
+    '4]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"multicast_forward":{"type":"string","options":[{"value":"enable","revisions'
+    '":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"admin_console_timeout":{"type":"integer","revisions":[2047,2047]},"log_uuid_add'
+    'ress":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"wa'
+    'd_affinity":{"type":"string","revisions":[2047,2047]},"long_vdom_name":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value"'
+    ':"disable","revisions":[2047,2047]}],"revisions":[2047,1023]},"daily_restart":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{'
+    '"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"fortiipam_integration":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"fortiextender_data_port":{"type":"integer","revisions":[2047,2047'
+    ']},"language":{"type":"string","options":[{"value":"english","revisions":[2047,2047]},{"value":"french","revisions":[2047,2047]},{"value":"spanish","r'
+    'evisions":[2047,2047]},{"value":"portuguese","revisions":[2047,2047]},{"value":"japanese","revisions":[2047,2047]},{"value":"trach","revisions":[2047,'
+    '2047]},{"value":"simch","revisions":[2047,2047]},{"value":"korean","revisions":[2047,2047]}],"revisions":[2047,2047]},"fortiextender_vlan_mode":{"type'
+    '":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"wifi_certifica'
+    'te":{"type":"string","revisions":[2047,2047]},"log_uuid":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value":"policy-only","rev'
+    'isions":[7,7]},{"value":"extended","revisions":[7,7]}],"revisions":[2047,7]},"user_server_cert":{"type":"string","revisions":[2047,2047]},"gui_fortiga'
+    'te_cloud_sandbox":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[102'
+    '4,1024]},"irq_time_accounting":{"type":"string","options":[{"value":"auto","revisions":[1920,1920]},{"value":"force","revisions":[1920,1920]}],"revisi'
+    'ons":[1920,1920]},"av_failopen_session":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"special_file_23_support":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"anti_replay":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"loose"'
+    ',"revisions":[2047,2047]},{"value":"strict","revisions":[2047,2047]}],"revisions":[2047,2047]},"edit_vdom_prompt":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,896]},"tftp":{"type":"string","options":[{"value":"e'
+    'nable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"admin_telnet_port":{"type":"integer","revisions'
+    '":[2047,2047]},"fortiservice_port":{"type":"integer","revisions":[2047,2047]},"admin_https_redirect":{"type":"string","options":[{"value":"enable","re'
+    'visions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_accept_dad":{"type":"integer","revisions":[2047,2047'
+    ']},"ips_affinity":{"type":"string","revisions":[2047,2047]},"sslvpn_plugin_version_check":{"type":"string","options":[{"value":"enable","revisions":[2'
+    '047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_allow_anycast_probe":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"url_filter_count":{"type":"integer","revisions":[2'
+    '040,2040]},"gui_custom_language":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"proxy_worker_count":{"type":"integer","revisions":[2047,2047]},"device_idle_timeout":{"type":"integer","revisions":[2047,2047'
+    ']},"wifi_ca_certificate":{"type":"string","revisions":[2047,2047]},"max_dlpstat_memory":{"type":"integer","revisions":[2047,127]},"ssh_mac_weak":{"typ'
+    'e":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"lldp_receptio'
+    'n":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"auth_'
+    'session_limit":{"type":"string","options":[{"value":"block-new","revisions":[2047,2047]},{"value":"logout-inactive","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"admin_ssh_v1":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"fgd_alert_subscription":{"multiple_values":true,"type":"list","options":[{"value":"advisory","revisions":[2047,2047]},{"value"'
+    ':"latest-threat","revisions":[2047,2047]},{"value":"latest-virus","revisions":[2047,2047]},{"value":"latest-attack","revisions":[2047,2047]},{"value":'
+    '"new-antivirus-db","revisions":[2047,2047]},{"value":"new-attack-db","revisions":[2047,2047]}],"revisions":[2047,2047]},"dh_params":{"type":"string","'
+    'options":[{"value":"1024","revisions":[2047,2047]},{"value":"1536","revisions":[2047,2047]},{"value":"2048","revisions":[2047,2047]},{"value":"3072","'
+    'revisions":[2047,2047]},{"value":"4096","revisions":[2047,2047]},{"value":"6144","revisions":[2047,2047]},{"value":"8192","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"traffic_priority_level":{"type":"string","options":[{"value":"low","revisions":[2047,2047]},{"value":"medium","revisions":[204'
+    '7,2047]},{"value":"high","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_date_time_source":{"type":"string","options":[{"value":"system","revi'
+    'sions":[2040,2040]},{"value":"browser","revisions":[2040,2040]}],"revisions":[2040,2040]},"allow_traffic_redirect":{"type":"string","options":[{"value'
+    '":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"fds_statistics_period":{"type":"integer","r'
+    'evisions":[2047,2047]},"strict_dirty_session_check":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"mc_ttl_notchange":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","rev'
+    'isions":[7,7]}],"revisions":[2047,7]},"gui_theme":{"type":"string","options":[{"value":"green","revisions":[2047,1023]},{"value":"red","revisions":[20'
+    '47,7]},{"value":"blue","revisions":[2047,1023]},{"value":"melongene","revisions":[2047,2047]},{"value":"mariner","revisions":[2047,2047]},{"value":"ne'
+    'utrino","revisions":[2040,2040]},{"value":"jade","revisions":[1024,1024]},{"value":"graphite","revisions":[1024,1024]},{"value":"retro","revisions":[1'
+    '024,1024]},{"value":"dark-matter","revisions":[1024,1024]},{"value":"onyx","revisions":[1024,1024]},{"value":"eclipse","revisions":[1024,1024]}],"revi'
+    'sions":[2047,2047]},"ssh_hmac_md5":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"ipsec_hmac_offload":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":['
+    '2047,2047]}],"revisions":[2047,1023]},"admintimeout":{"type":"integer","revisions":[2047,2047]},"two_factor_ftm_expiry":{"type":"integer","revisions":'
+    '[2047,2047]},"compliance_check_time":{"type":"string","revisions":[2047,7]},"proxy_auth_timeout":{"type":"integer","revisions":[2047,2047]},"sslvpn_kx'
+    'p_hardware_acceleration":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revision'
+    's":[2047,1023]},"ssd_trim_hour":{"type":"integer","revisions":[2047,2047]},"check_protocol_header":{"type":"string","options":[{"value":"loose","revis'
+    'ions":[2047,2047]},{"value":"strict","revisions":[2047,2047]}],"revisions":[2047,2047]},"wireless_controller":{"type":"string","options":[{"value":"en'
+    'able","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"fds_statistics":{"type":"string","options":[{"va'
+    'lue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"cli_audit_log":{"type":"string","options'
+    '":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_forticare_registration_setup_'
+    'warning":{"type":"string","options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},'
+    '"max_route_cache_size":{"type":"integer","revisions":[2047,2047]},"fortiextender":{"type":"string","options":[{"value":"enable","revisions":[2047,2047'
+    ']},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"wad_worker_count":{"type":"integer","revisions":[2047,2047]},"admin_login_ma'
+    'x":{"type":"integer","revisions":[2047,2047]},"gui_certificates":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disa'
+    'ble","revisions":[2047,2047]}],"revisions":[2047,2047]},"autorun_log_fsck":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"va'
+    'lue":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"security_rating_run_on_schedule":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"vip_arp_range":{"type":"string","options":[{"value":"unlim'
+    'ited","revisions":[2047,2047]},{"value":"restricted","revisions":[2047,2047]}],"revisions":[2047,2047]},"admin_maintainer":{"type":"string","options":'
+    '[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"proxy_auth_lifetime_timeout":{"type'
+    '":"integer","revisions":[2047,2047]},"fortitoken_cloud":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","rev'
+    'isions":[2040,2040]}],"revisions":[2040,2040]},"gui_wireless_opensecurity":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"va'
+    'lue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"memory_use_threshold_green":{"type":"integer","revisions":[2047,2047]},"proxy_auth_'
+    'lifetime":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"two_factor_email_expiry":{"type":"integer","revisions":[2047,2047]},"cert_chain_max":{"type":"integer","revisions":[2047,2047]},"management_port":{"'
+    'type":"integer","revisions":[1024,1024]},"gui_replacement_message_groups":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"val'
+    'ue":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"auth_keepalive":{"type":"string","options":[{"value":"enable","revisions":[2047,2047'
+    ']},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sslvpn_ems_sn_check":{"type":"string","options":[{"value":"enable","revision'
+    's":[1664,1664]},{"value":"disable","revisions":[1664,1664]}],"revisions":[1920,1664]},"send_pmtu_icmp":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"device_identification_active_scan_delay":{"type":"integ'
+    'er","revisions":[2047,127]},"dnsproxy_worker_count":{"type":"integer","revisions":[2047,2047]},"auth_cert":{"type":"string","revisions":[2047,2047]},"'
+    'auto_auth_extension_device":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"cfg_save":{"type":"string","options":[{"value":"automatic","revisions":[2047,2047]},{"value":"manual","revisions":[2047,2047]},{"v'
+    'alue":"revert","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipsec_soft_dec_async":{"type":"string","options":[{"value":"enable","revisions":[20'
+    '47,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"admin_forticloud_sso_login":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"ssh_kex_sha1":{"type":"string","options":[{"value'
+    '":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"admin_telnet":{"type":"string","options":[{'
+    '"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"gui_fortisandbox_cloud":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[1016,1016]},{"value":"disable","revisions":[1016,1016]}],"revisions":[2040,1016]},"memory_use_threshold_'
+    'extreme":{"type":"integer","revisions":[2047,2047]},"wad_memory_change_granularity":{"type":"integer","revisions":[2040,2040]},"auth_https_port":{"typ'
+    'e":"integer","revisions":[2047,2047]},"auth_http_port":{"type":"integer","revisions":[2047,2047]},"ssl_static_key_ciphers":{"type":"string","options":'
+    '[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"two_factor_fac_expiry":{"type":"int'
+    'eger","revisions":[2047,2047]},"post_login_banner":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"cloud_communication":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disab'
+    'le","revisions":[2040,2040]}],"revisions":[2040,2040]},"alias":{"type":"string","revisions":[2047,2047]},"proxy_resource_mode":{"type":"string","optio'
+    'ns":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"hostname":{"type":"string","rev'
+    'isions":[2047,2047]},"pre_login_banner":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"default_service_source_port":{"type":"string","revisions":[2040,2040]},"av_failopen":{"type":"string","options":[{"val'
+    'ue":"pass","revisions":[2047,2047]},{"value":"off","revisions":[2047,2047]},{"value":"one-shot","revisions":[2047,2047]}],"revisions":[2047,2047]},"ll'
+    'dp_transmission":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"reboot_upon_config_restore":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"switch_controller_reserved_network":{"type":"string","revisions":[2047,2047]},"admin_lockout_threshold":{"type":"integer"'
+    ',"revisions":[2047,2047]},"ipsec_asic_offload":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":['
+    '2047,2047]}],"revisions":[2047,1023]},"asymroute":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7'
+    ']}],"revisions":[2047,7]},"wimax_4g_usb":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"gui_device_latitude":{"type":"string","revisions":[2047,2047]},"gui_firmware_upgrade_warning":{"type":"string","optio'
+    'ns":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"failtime":{"type":"integer","re'
+    'visions":[2047,2047]},"batch_cmdb":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"admin_concurrent":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"proxy_cipher_hardware_acceleration":{"type":"string","options":[{"value":"disable","revisions":[127,127]},{"value'
+    '":"enable","revisions":[127,127]}],"revisions":[2047,127]},"faz_disk_buffer_size":{"type":"integer","revisions":[1920,1920]},"gui_ipv6":{"type":"strin'
+    'g","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"tp_mc_skip_policy":{"t'
+    'ype":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"traffic_priority":{"type":'
+    '"string","options":[{"value":"tos","revisions":[2047,2047]},{"value":"dscp","revisions":[2047,2047]}],"revisions":[2047,2047]},"proxy_kxp_hardware_acc'
+    'eleration":{"type":"string","options":[{"value":"disable","revisions":[127,127]},{"value":"enable","revisions":[127,127]}],"revisions":[2047,127]},"mu'
+    'lti_factor_authentication":{"type":"string","options":[{"value":"optional","revisions":[2047,2047]},{"value":"mandatory","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"interval":{"type":"integer","revisions":[2047,2047]},"switch_controller":{"type":"string","options":[{"value":"disable","revisi'
+    'ons":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"split_port":{"type":"string","revisions":[2047,1023]},"admin_s'
+    'sh_grace_time":{"type":"integer","revisions":[2047,2047]},"management_ip":{"type":"string","revisions":[1024,1024]},"admin_server_cert":{"type":"strin'
+    'g","revisions":[2047,2047]},"proxy_hardware_acceleration":{"type":"string","options":[{"value":"disable","revisions":[1920,1920]},{"value":"enable","r'
+    'evisions":[1920,1920]}],"revisions":[1920,896]},"memory_use_threshold_red":{"type":"integer","revisions":[2047,2047]},"tcp_rst_timer":{"type":"integer'
+    '","revisions":[1024,1024]},"admin_https_pki_required":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"two_factor_ftk_expiry":{"type":"int","required":false},"ssd_trim_weekday":{"type":"str","required":false,"'
+    'choices":["sunday","monday","tuesday","wednesday","thursday","friday","saturday"]},"gui_date_format":{"type":"str","required":false,"choices":["yyyy/M'
+    'M/dd","dd/MM/yyyy","MM/dd/yyyy","yyyy-MM-dd","dd-MM-yyyy","MM-dd-yyyy"]},"av_affinity":{"type":"str","required":false},"wad_csvc_db_count":{"type":"in'
+    't","required":false},"admin_scp":{"type":"str","required":false,"choices":["enable","disable"]},"endpoint_control_portal_port":{"type":"int","required'
+    '":false},"virtual_server_count":{"type":"int","required":false},"proxy_re_authentication_mode":{"type":"str","required":false,"choices":["session","tr'
+    'affic","absolute"]},"ssd_trim_freq":{"type":"str","required":false,"choices":["never","hourly","daily","weekly","monthly"]},"per_user_bal":{"type":"st'
+    'r","required":false,"choices":["enable","disable"]},"tcp_halfclose_timer":{"type":"int","required":false},"wireless_controller_port":{"type":"int","re'
+    'quired":false},"timezone":{"type":"str","required":false,"choices":["01","02","03","04","05","81","06","07","08","09","10","11","12","13","74","14","7'
+    '7","15","87","16","17","18","19","20","75","21","22","23","24","80","79","25","26","27","28","78","29","30","31","32","33","34","35","36","37","38","8'
+    '3","84","40","85","41","42","43","39","44","46","47","51","48","45","49","50","52","53","54","55","56","57","58","59","60","62","63","61","64","65","6'
+    '6","67","68","69","70","71","72","00","82","73","86","76"]},"revision_image_auto_backup":{"type":"str","required":false,"choices":["enable","disable"]'
+    '},"csr_ca_attribute":{"type":"str","required":false,"choices":["enable","disable"]},"udp_idle_timer":{"type":"int","required":false},"revision_backup_'
+    'on_logout":{"type":"str","required":false,"choices":["enable","disable"]},"clt_cert_req":{"type":"str","required":false,"choices":["enable","disable"]'
+    '},"block_session_timer":{"type":"int","required":false},"ldapconntimeout":{"type":"int","required":false},"admin_ssh_port":{"type":"int","required":fa'
+    'lse},"tcp_timewait_timer":{"type":"int","required":false},"ip_src_port_range":{"type":"str","required":false},"two_factor_sms_expiry":{"type":"int","r'
+    'equired":false},"ssl_min_proto_version":{"type":"str","required":false},"igmp_state_limit":{"type":"int","required":false},"restart_time":{"type":"str'
+    '","required":false},"url_filter_affinity":{"type":"str","required":false},"gui_local_out":{"type":"str","required":false,"choices":["enable","disable"'
+    ']},"admin_https_ssl_versions":{"type":"list","required":false},"vdom_mode":{"type":"str","required":false,"choices":["no-vdom","split-vdom","multi-vdo'
+    'm"]},"strong_crypto":{"type":"str","required":false,"choices":["enable","disable"]},"admin_hsts_max_age":{"type":"int","required":false},"admin_sport"'
+    ':{"type":"int","required":false},"user_device_store_max_devices":{"type":"int","required":false},"cfg_revert_timeout":{"type":"int","required":false},'
+    '"gui_display_hostname":{"type":"str","required":false,"choices":["enable","disable"]},"ndp_max_entry":{"type":"int","required":false},"refresh":{"type'
+    '":"int","required":false},"gui_device_longitude":{"type":"str","required":false},"scanunit_count":{"type":"int","required":false},"sslvpn_cipher_hardw'
+    'are_acceleration":{"type":"str","required":false,"choices":["enable","disable"]},"gui_lines_per_page":{"type":"int","required":false},"remoteauthtimeo'
+    'ut":{"type":"int","required":false},"arp_max_entry":{"type":"int","required":false},"check_reset_range":{"type":"str","required":false,"choices":["str'
+    'ict","disable"]},"br_fdb_max_entry":{"type":"int","required":false},"gui_allow_default_hostname":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]},"private_data_encryption":{"type":"str","required":false,"choices":["disable","enable"]},"ssd_trim_min":{"type":"int","required":false},"end'
+    'point_control_fds_access":{"type":"str","required":false},"admin_restrict_local":{"type":"str","required":false,"choices":["enable","disable"]},"per_u'
+    'ser_bwl":{"type":"str","required":false},"ipv6_allow_traffic_redirect":{"type":"str","required":false,"choices":["enable","disable"]},"miglog_affinity'
+    '":{"type":"str","required":false},"security_rating_result_submission":{"type":"str","required":false,"choices":["enable","disable"]},"login_timestamp"'
+    ':{"type":"str","required":false,"choices":["enable","disable"]},"sys_perf_log_interval":{"type":"int","required":false},"ssd_trim_date":{"type":"int",'
+    '"required":false},"dst":{"type":"str","required":false,"choices":["enable","disable"]},"virtual_server_hardware_acceleration":{"type":"str","required"'
+    ':false},"honor_df":{"type":"str","required":false,"choices":["enable","disable"]},"log_ssl_connection":{"type":"str","required":false,"choices":["enab'
+    'le","disable"]},"tcp_halfopen_timer":{"type":"int","required":false},"admin_ssh_password":{"type":"str","required":false,"choices":["enable","disable"'
+    ']},"tcp_option":{"type":"str","required":false,"choices":["enable","disable"]},"reset_sessionless_tcp":{"type":"str","required":false,"choices":["enab'
+    'le","disable"]},"radius_port":{"type":"int","required":false},"compliance_check":{"type":"str","required":false},"fec_port":{"type":"int","required":f'
+    'alse},"sslvpn_max_worker_count":{"type":"int","required":false},"policy_auth_concurrent":{"type":"int","required":false},"snat_route_change":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"ssh_cbc_cipher":{"type":"str","required":false,"choices":["enable","disable"]},"ipsec_ha_seqjum'
+    'p_rate":{"type":"int","required":false},"wad_csvc_cs_count":{"type":"int","required":false},"user_device_store_max_users":{"type":"int","required":fal'
+    'se},"miglogd_children":{"type":"int","required":false},"admin_port":{"type":"int","required":false},"vdom_admin":{"type":"str","required":false},"log_'
+    'uuid_policy":{"type":"str","required":false},"wad_source_affinity":{"type":"str","required":false,"choices":["disable","enable"]},"management_vdom":{"'
+    'type":"str","required":false},"cpu_use_threshold":{"type":"int","required":false},"admin_lockout_duration":{"type":"int","required":false},"gui_rest_a'
+    'pi_cache":{"type":"str","required":false,"choices":["enable","disable"]},"multicast_forward":{"type":"str","required":false},"admin_console_timeout":{'
+    '"type":"int","required":false},"log_uuid_address":{"type":"str","required":false,"choices":["enable","disable"]},"wad_affinity":{"type":"str","require'
+    'd":false},"long_vdom_name":{"type":"str","required":false,"choices":["enable","disable"]},"daily_restart":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"fortiipam_integration":{"type":"str","required":false,"choices":["enable","disable"]},"fortiextender_data_port":{"type":"int","req'
+    'uired":false},"language":{"type":"str","required":false,"choices":["english","french","spanish","portuguese","japanese","trach","simch","korean"]},"fo'
+    'rtiextender_vlan_mode":{"type":"str","required":false,"choices":["enable","disable"]},"wifi_certificate":{"type":"str","required":false},"log_uuid":{"'
+    'type":"str","required":false},"user_server_cert":{"type":"str","required":false},"gui_fortigate_cloud_sandbox":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"irq_time_accounting":{"type":"str","required":false,"choices":["auto","force"]},"av_failopen_session":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"special_file_23_support":{"type":"str","required":false,"choices":["disable","enable"]},"anti_replay":{"type"'
+    ':"str","required":false,"choices":["disable","loose","strict"]},"edit_vdom_prompt":{"type":"str","required":false,"choices":["enable","disable"]},"tft'
+    'p":{"type":"str","required":false,"choices":["enable","disable"]},"admin_telnet_port":{"type":"int","required":false},"fortiservice_port":{"type":"int'
+    '","required":false},"admin_https_redirect":{"type":"str","required":false,"choices":["enable","disable"]},"ipv6_accept_dad":{"type":"int","required":f'
+    'alse},"ips_affinity":{"type":"str","required":false},"sslvpn_plugin_version_check":{"type":"str","required":false,"choices":["enable","disable"]},"ipv'
+    '6_allow_anycast_probe":{"type":"str","required":false,"choices":["enable","disable"]},"url_filter_count":{"type":"int","required":false},"gui_custom_l'
+    'anguage":{"type":"str","required":false,"choices":["enable","disable"]},"proxy_worker_count":{"type":"int","required":false},"device_idle_timeout":{"t'
+    'ype":"int","required":false},"wifi_ca_certificate":{"type":"str","required":false},"max_dlpstat_memory":{"type":"int","required":false},"ssh_mac_weak"'
+    ':{"type":"str","required":false,"choices":["enable","disable"]},"lldp_reception":{"type":"str","required":false,"choices":["enable","disable"]},"auth_'
+    'session_limit":{"type":"str","required":false,"choices":["block-new","logout-inactive"]},"admin_ssh_v1":{"type":"str","required":false,"choices":["ena'
+    'ble","disable"]},"fgd_alert_subscription":{"type":"list","required":false,"choices":["advisory","latest-threat","latest-virus","latest-attack","new-an'
+    'tivirus-db","new-attack-db"]},"dh_params":{"type":"str","required":false,"choices":["1024","1536","2048","3072","4096","6144","8192"]},"traffic_priori'
+    'ty_level":{"type":"str","required":false,"choices":["low","medium","high"]},"gui_date_time_source":{"type":"str","required":false,"choices":["system",'
+    '"browser"]},"allow_traffic_redirect":{"type":"str","required":false,"choices":["enable","disable"]},"fds_statistics_period":{"type":"int","required":f'
+    'alse},"strict_dirty_session_check":{"type":"str","required":false,"choices":["enable","disable"]},"mc_ttl_notchange":{"type":"str","required":false},"'
+    'gui_theme":{"type":"str","required":false},"ssh_hmac_md5":{"type":"str","required":false,"choices":["enable","disable"]},"ipsec_hmac_offload":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"admintimeout":{"type":"int","required":false},"two_factor_ftm_expiry":{"type":"int","required"'
+    ':false},"compliance_check_time":{"type":"str","required":false},"proxy_auth_timeout":{"type":"int","required":false},"sslvpn_kxp_hardware_acceleration'
+    '":{"type":"str","required":false,"choices":["enable","disable"]},"ssd_trim_hour":{"type":"int","required":false},"check_protocol_header":{"type":"str"'
+    ',"required":false,"choices":["loose","strict"]},"wireless_controller":{"type":"str","required":false,"choices":["enable","disable"]},"fds_statistics":'
+    '{"type":"str","required":false,"choices":["enable","disable"]},"cli_audit_log":{"type":"str","required":false,"choices":["enable","disable"]},"gui_for'
+    'ticare_registration_setup_warning":{"type":"str","required":false,"choices":["enable","disable"]},"max_route_cache_size":{"type":"int","required":fals'
+    'e},"fortiextender":{"type":"str","required":false,"choices":["enable","disable"]},"wad_worker_count":{"type":"int","required":false},"admin_login_max"'
+    ':{"type":"int","required":false},"gui_certificates":{"type":"str","required":false,"choices":["enable","disable"]},"autorun_log_fsck":{"type":"str","r'
+    'equired":false,"choices":["enable","disable"]},"security_rating_run_on_schedule":{"type":"str","required":false,"choices":["enable","disable"]},"vip_a'
+    'rp_range":{"type":"str","required":false,"choices":["unlimited","restricted"]},"admin_maintainer":{"type":"str","required":false,"choices":["enable","'
+    'disable"]},"proxy_auth_lifetime_timeout":{"type":"int","required":false},"fortitoken_cloud":{"type":"str","required":false,"choices":["enable","disabl'
+    'e"]},"gui_wireless_opensecurity":{"type":"str","required":false,"choices":["enable","disable"]},"memory_use_threshold_green":{"type":"int","required":'
+    'false},"proxy_auth_lifetime":{"type":"str","required":false,"choices":["enable","disable"]},"two_factor_email_expiry":{"type":"int","required":false},'
+    '"cert_chain_max":{"type":"int","required":false},"management_port":{"type":"int","required":false},"gui_replacement_message_groups":{"type":"str","req'
+    'uired":false,"choices":["enable","disable"]},"auth_keepalive":{"type":"str","required":false,"choices":["enable","disable"]},"sslvpn_ems_sn_check":{"t'
+    'ype":"str","required":false},"send_pmtu_icmp":{"type":"str","required":false,"choices":["enable","disable"]},"device_identification_active_scan_delay"'
+    ':{"type":"int","required":false},"dnsproxy_worker_count":{"type":"int","required":false},"auth_cert":{"type":"str","required":false},"auto_auth_extens'
+    'ion_device":{"type":"str","required":false,"choices":["enable","disable"]},"cfg_save":{"type":"str","required":false,"choices":["automatic","manual","'
+    'revert"]},"ipsec_soft_dec_async":{"type":"str","required":false,"choices":["enable","disable"]},"admin_forticloud_sso_login":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"ssh_kex_sha1":{"type":"str","required":false,"choices":["enable","disable"]},"admin_telnet":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"gui_fortisandbox_cloud":{"type":"str","required":false},"memory_use_threshold_extreme":{"type":"int","req'
+    'uired":false},"wad_memory_change_granularity":{"type":"int","required":false},"auth_https_port":{"type":"int","required":false},"auth_http_port":{"typ'
+    'e":"int","required":false},"ssl_static_key_ciphers":{"type":"str","required":false,"choices":["enable","disable"]},"two_factor_fac_expiry":{"type":"in'
+    't","required":false},"post_login_banner":{"type":"str","required":false,"choices":["disable","enable"]},"cloud_communication":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]},"alias":{"type":"str","required":false},"proxy_resource_mode":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"hostname":{"type":"str","required":false},"pre_login_banner":{"type":"str","required":false,"choices":["enable","disable"]},"default_se'
+    'rvice_source_port":{"type":"str","required":false},"av_failopen":{"type":"str","required":false,"choices":["pass","off","one-shot"]},"lldp_transmissio'
+    'n":{"type":"str","required":false,"choices":["enable","disable"]},"reboot_upon_config_restore":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"switch_controller_reserved_network":{"type":"str","required":false},"admin_lockout_threshold":{"type":"int","required":false},"ipsec_asic_off'
+    'load":{"type":"str","required":false,"choices":["enable","disable"]},"asymroute":{"type":"str","required":false},"wimax_4g_usb":{"type":"str","require'
+    'd":false,"choices":["enable","disable"]},"gui_device_latitude":{"type":"str","required":false},"gui_firmware_upgrade_warning":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]},"failtime":{"type":"int","required":false},"batch_cmdb":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"admin_concurrent":{"type":"str","required":false,"choices":["enable","disable"]},"proxy_cipher_hardware_acceleration":{"type":"str","required'
+    '":false},"faz_disk_buffer_size":{"type":"int","required":false},"gui_ipv6":{"type":"str","required":false,"choices":["enable","disable"]},"tp_mc_skip_'
+    'policy":{"type":"str","required":false},"traffic_priority":{"type":"str","required":false,"choices":["tos","dscp"]},"proxy_kxp_hardware_acceleration":'
+    '{"type":"str","required":false},"multi_factor_authentication":{"type":"str","required":false,"choices":["optional","mandatory"]},"interval":{"type":"i'
+    'nt","required":false},"switch_controller":{"type":"str","required":false,"choices":["disable","enable"]},"split_port":{"type":"str","required":false},'
+    '"admin_ssh_grace_time":{"type":"int","required":false},"management_ip":{"type":"str","required":false},"admin_server_cert":{"type":"str","required":fa'
+    'lse},"proxy_hardware_acceleration":{"type":"str","required":false,"choices":["disable","enable"]},"memory_use_threshold_red":{"type":"int","required":'
+    'false},"tcp_rst_timer":{"type":"int","required":false},"admin_https_pki_required":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
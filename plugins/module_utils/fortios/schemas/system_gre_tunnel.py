@@ -0,0 +1,28 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"use_sdwan":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,102'
+    '4]}],"revisions":[1024,1024]},"keepalive_interval":{"type":"integer","revisions":[2047,2047]},"sequence_number_reception":{"type":"string","options":['
+    '{"value":"disable","revisions":[1152,1152]},{"value":"enable","revisions":[1152,1152]}],"revisions":[1920,1152]},"key_inbound":{"type":"integer","revi'
+    'sions":[1920,1152]},"name":{"type":"string","revisions":[2047,2047]},"key_outbound":{"type":"integer","revisions":[1920,1152]},"keepalive_failtimes":{'
+    '"type":"integer","revisions":[2047,2047]},"local_gw6":{"type":"string","revisions":[2047,2047]},"local_gw":{"type":"string","revisions":[2047,2047]},"'
+    'interface":{"type":"string","revisions":[2047,2047]},"diffservcode":{"type":"string","revisions":[2040,2040]},"checksum_reception":{"type":"string","o'
+    'ptions":[{"value":"disable","revisions":[1152,1152]},{"value":"enable","revisions":[1152,1152]}],"revisions":[1920,1152]},"ip_version":{"type":"string'
+    '","options":[{"value":"4","revisions":[2047,2047]},{"value":"6","revisions":[2047,2047]}],"revisions":[2047,2047]},"sequence_number_transmission":{"ty'
+    'pe":"string","options":[{"value":"disable","revisions":[1152,1152]},{"value":"enable","revisions":[1152,1152]}],"revisions":[1920,1152]},"remote_gw":{'
+    '"type":"string","revisions":[2047,2047]},"checksum_transmission":{"type":"string","options":[{"value":"disable","revisions":[1152,1152]},{"value":"ena'
+    'ble","revisions":[1152,1152]}],"revisions":[1920,1152]},"dscp_copying":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value'
+    '":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"remote_gw6":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"use_sdwan":{"type":"str","required":false,"choices":["disable","enable"]},"keepalive_interval":{"type":"in'
+    't","required":false},"sequence_number_reception":{"type":"str","required":false},"key_inbound":{"type":"int","required":false},"name":{"type":"str","r'
+    'equired":false},"key_outbound":{"type":"int","required":false},"keepalive_failtimes":{"type":"int","required":false},"local_gw6":{"type":"str","requir'
+    'ed":false},"local_gw":{"type":"str","required":false},"interface":{"type":"str","required":false},"diffservcode":{"type":"str","required":false},"chec'
+    'ksum_reception":{"type":"str","required":false},"ip_version":{"type":"str","required":false,"choices":["4","6"]},"sequence_number_transmission":{"type'
+    '":"str","required":false},"remote_gw":{"type":"str","required":false},"checksum_transmission":{"type":"str","required":false},"dscp_copying":{"type":"'
+    'str","required":false,"choices":["disable","enable"]},"remote_gw6":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,113 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"l2ep_eth_type":{"type":"string","revisions":[2047,2047]},"link_failed_signal":{"type":"string","options":[{"value":"enable'
+    '","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pingserver_monitor_interface":{"type":"string","revi'
+    'sions":[2047,2047]},"weight":{"type":"string","revisions":[2047,2047]},"hc_eth_type":{"type":"string","revisions":[2047,2047]},"unicast_status":{"type'
+    '":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"group_name":{"'
+    'type":"string","revisions":[2047,2047]},"session_pickup_connectionless":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value'
+    '":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"route_wait":{"type":"integer","revisions":[2047,2047]},"standalone_mgmt_vdom":{"type":'
+    '"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pop3_proxy_thres'
+    'hold":{"type":"string","revisions":[2047,2047]},"pingserver_secondary_force_reset":{"type":"string","options":[{"value":"enable","revisions":[1536,153'
+    '6]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"http_proxy_threshold":{"type":"string","revisions":[2047,2047]},"ssd_failov'
+    'er":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"ha_d'
+    'irect":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"g'
+    'ratuitous_arps":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"session_sync_dev":{"type":"string","revisions":[2047,2047]},"unicast_gateway":{"type":"string","revisions":[1024,1024]},"unicast_peers":{"type'
+    '":"list","children":{"id":{"type":"integer","revisions":[1024,1024]},"peer_ip":{"type":"string","revisions":[1024,1024]}},"revisions":[1024,1024]},"hb'
+    'dev":{"type":"string","revisions":[2047,2047]},"group_id":{"type":"integer","revisions":[2047,2047]},"ha_uptime_diff_margin":{"type":"integer","revisi'
+    'ons":[2047,2047]},"smtp_proxy_threshold":{"type":"string","revisions":[2047,2047]},"inter_cluster_session_sync":{"type":"string","options":[{"value":"'
+    'enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"encryption":{"type":"string","options":[{"value":"e'
+    'nable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"session_pickup_delay":{"type":"string","options'
+    '":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"standalone_config_sync":{"type":"'
+    'string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"hb_interval_in_mi'
+    'lliseconds":{"type":"string","options":[{"value":"100ms","revisions":[1024,1024]},{"value":"10ms","revisions":[1024,1024]}],"revisions":[1024,1024]},"'
+    'memory_failover_monitor_period":{"type":"integer","revisions":[1024,1024]},"priority":{"type":"integer","revisions":[2047,2047]},"memory_failover_flip'
+    '_timeout":{"type":"integer","revisions":[1024,1024]},"authentication":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":'
+    '"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"cpu_threshold":{"type":"string","revisions":[2047,2047]},"session_pickup":{"type":"strin'
+    'g","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"memory_based_failover"'
+    ':{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"overrid'
+    'e":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"unica'
+    'st_hb_peerip":{"type":"string","revisions":[1024,1024]},"pingserver_failover_threshold":{"type":"integer","revisions":[2047,2047]},"vcluster2":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"arps":{"type":"'
+    'integer","revisions":[2047,2047]},"mode":{"type":"string","options":[{"value":"standalone","revisions":[2047,2047]},{"value":"a-a","revisions":[2047,2'
+    '047]},{"value":"a-p","revisions":[2047,2047]}],"revisions":[2047,2047]},"session_pickup_nat":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"session_pickup_expectation":{"type":"string","options":[{"value":'
+    '"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"hb_interval":{"type":"integer","revisions":[2'
+    '047,2047]},"vcluster_id":{"type":"integer","revisions":[2047,2047]},"uninterruptible_upgrade":{"type":"string","options":[{"value":"enable","revisions'
+    '":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"unicast_hb_netmask":{"type":"string","revisions":[1024,1024]},"r'
+    'oute_hold":{"type":"integer","revisions":[2047,2047]},"hello_holddown":{"type":"integer","revisions":[2047,2047]},"sync_packet_balance":{"type":"strin'
+    'g","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"imap_proxy_threshold":'
+    '{"type":"string","revisions":[2047,2047]},"ha_eth_type":{"type":"string","revisions":[2047,2047]},"sync_config":{"type":"string","options":[{"value":"'
+    'enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"key":{"type":"string","revisions":[2047,2047]}'
+    ',"logical_sn":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,20'
+    '40]},"unicast_hb":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[102'
+    '4,1024]},"password":{"type":"string","revisions":[2047,2047]},"vdom":{"type":"string","revisions":[2047,2047]},"route_ttl":{"type":"integer","revision'
+    's":[2047,2047]},"ha_mgmt_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"memory_failover_sample_rate":{"type":"integer","revisions":[1024,1024]},"nntp_proxy_threshold":{"type":"string","revisions":['
+    '2047,2047]},"multicast_ttl":{"type":"integer","revisions":[2047,2047]},"arps_interval":{"type":"integer","revisions":[2047,2047]},"ha_mgmt_interfaces"'
+    ':{"type":"list","children":{"interface":{"type":"string","revisions":[2047,2047]},"gateway6":{"type":"string","revisions":[2047,2047]},"dst":{"type":"'
+    'string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"gateway":{"type":"string","revisions":[2047,2047]}},"revisions":[204'
+    '7,2047]},"pingserver_flip_timeout":{"type":"integer","revisions":[2047,2047]},"hb_lost_threshold":{"type":"integer","revisions":[2047,2047]},"secondar'
+    'y_vcluster":{"type":"dict","children":{"monitor":{"type":"string","revisions":[2047,2047]},"vcluster_id":{"type":"integer","revisions":[2047,2047]},"p'
+    'riority":{"type":"integer","revisions":[2047,2047]},"pingserver_slave_force_reset":{"type":"string","options":[{"value":"enable","revisions":[511,511]'
+    '},{"value":"disable","revisions":[511,511]}],"revisions":[2047,511]},"pingserver_secondary_force_reset":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"override":{"type":"string","options":[{"value":"enable'
+    '","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pingserver_failover_threshold":{"type":"integer","re'
+    'visions":[2047,2047]},"vdom":{"type":"string","revisions":[2047,2047]},"pingserver_monitor_interface":{"type":"string","revisions":[2047,2047]},"overr'
+    'ide_wait_time":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"schedule":{"type":"string","options":[{"value":"none","revisions"'
+    ':[2047,2047]},{"value":"hub","revisions":[2047,2047]},{"value":"leastconnection","revisions":[2047,2047]},{"value":"round-robin","revisions":[2047,204'
+    '7]},{"value":"weight-round-robin","revisions":[2047,2047]},{"value":"random","revisions":[2047,2047]},{"value":"ip","revisions":[2047,2047]},{"value":'
+    '"ipport","revisions":[2047,2047]}],"revisions":[2047,2047]},"ftp_proxy_threshold":{"type":"string","revisions":[2047,2047]},"load_balance_all":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"monitor":{"type'
+    '":"string","revisions":[2047,2047]},"override_wait_time":{"type":"integer","revisions":[2047,2047]},"failover_hold_time":{"type":"integer","revisions"'
+    ':[1024,1024]},"memory_threshold":{"type":"string","revisions":[2047,2047]},"memory_failover_threshold":{"type":"integer","revisions":[1024,1024]},"mem'
+    'ory_compatible_mode":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"pingserver_slave_force_reset":{"type":"string","options":[{"value":"enable","revisions":[511,511]},{"value":"disable","revisions":[511,51'
+    '1]}],"revisions":[2047,511]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"l2ep_eth_type":{"type":"str","required":false},"link_failed_signal":{"type":"str","required":false,"choice'
+    's":["enable","disable"]},"pingserver_monitor_interface":{"type":"str","required":false},"weight":{"type":"str","required":false},"hc_eth_type":{"type"'
+    ':"str","required":false},"unicast_status":{"type":"str","required":false,"choices":["enable","disable"]},"group_name":{"type":"str","required":false},'
+    '"session_pickup_connectionless":{"type":"str","required":false,"choices":["enable","disable"]},"route_wait":{"type":"int","required":false},"standalon'
+    'e_mgmt_vdom":{"type":"str","required":false,"choices":["enable","disable"]},"pop3_proxy_threshold":{"type":"str","required":false},"pingserver_seconda'
+    'ry_force_reset":{"type":"str","required":false,"choices":["enable","disable"]},"http_proxy_threshold":{"type":"str","required":false},"ssd_failover":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"ha_direct":{"type":"str","required":false,"choices":["enable","disable"]},"gratuitous_a'
+    'rps":{"type":"str","required":false,"choices":["enable","disable"]},"session_sync_dev":{"type":"str","required":false},"unicast_gateway":{"type":"str"'
+    ',"required":false},"unicast_peers":{"type":"list","required":false,"options":{"id":{"type":"int","required":false},"peer_ip":{"type":"str","required":'
+    'false}}},"hbdev":{"type":"str","required":false},"group_id":{"type":"int","required":false},"ha_uptime_diff_margin":{"type":"int","required":false},"s'
+    'mtp_proxy_threshold":{"type":"str","required":false},"inter_cluster_session_sync":{"type":"str","required":false},"encryption":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"session_pickup_delay":{"type":"str","required":false,"choices":["enable","disable"]},"standalone_config_sync"'
+    ':{"type":"str","required":false,"choices":["enable","disable"]},"hb_interval_in_milliseconds":{"type":"str","required":false,"choices":["100ms","10ms"'
+    ']},"memory_failover_monitor_period":{"type":"int","required":false},"priority":{"type":"int","required":false},"memory_failover_flip_timeout":{"type":'
+    '"int","required":false},"authentication":{"type":"str","required":false,"choices":["enable","disable"]},"cpu_threshold":{"type":"str","required":false'
+    '},"session_pickup":{"type":"str","required":false,"choices":["enable","disable"]},"memory_based_failover":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"override":{"type":"str","required":false,"choices":["enable","disable"]},"unicast_hb_peerip":{"type":"str","required":false},"ping'
+    'server_failover_threshold":{"type":"int","required":false},"vcluster2":{"type":"str","required":false,"choices":["enable","disable"]},"arps":{"type":"'
+    'int","required":false},"mode":{"type":"str","required":false,"choices":["standalone","a-a","a-p"]},"session_pickup_nat":{"type":"str","required":false'
+    ',"choices":["enable","disable"]},"session_pickup_expectation":{"type":"str","required":false,"choices":["enable","disable"]},"hb_interval":{"type":"in'
+    't","required":false},"vcluster_id":{"type":"int","required":false},"uninterruptible_upgrade":{"type":"str","required":false,"choices":["enable","disab'
+    'le"]},"unicast_hb_netmask":{"type":"str","required":false},"route_hold":{"type":"int","required":false},"hello_holddown":{"type":"int","required":fals'
+    'e},"sync_packet_balance":{"type":"str","required":false,"choices":["enable","disable"]},"imap_proxy_threshold":{"type":"str","required":false},"ha_eth'
+    '_type":{"type":"str","required":false},"sync_config":{"type":"str","required":false,"choices":["enable","disable"]},"key":{"type":"str","required":fal'
+    'se},"logical_sn":{"type":"str","required":false,"choices":["enable","disable"]},"unicast_hb":{"type":"str","required":false,"choices":["enable","disab'
+    'le"]},"password":{"type":"str","required":false},"vdom":{"type":"str","required":false},"route_ttl":{"type":"int","required":false},"ha_mgmt_status":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"memory_failover_sample_rate":{"type":"int","required":false},"nntp_proxy_threshold":{"t'
+    'ype":"str","required":false},"multicast_ttl":{"type":"int","required":false},"arps_interval":{"type":"int","required":false},"ha_mgmt_interfaces":{"ty'
+    'pe":"list","required":false,"options":{"interface":{"type":"str","required":false},"gateway6":{"type":"str","required":false},"dst":{"type":"str","req'
+    'uired":false},"id":{"type":"int","required":false},"gateway":{"type":"str","required":false}}},"pingserver_flip_timeout":{"type":"int","required":fals'
+    'e},"hb_lost_threshold":{"type":"int","required":false},"secondary_vcluster":{"type":"dict","required":false,"options":{"monitor":{"type":"str","requir'
+    'ed":false},"vcluster_id":{"type":"int","required":false},"priority":{"type":"int","required":false},"pingserver_slave_force_reset":{"type":"str","requ'
+    'ired":false},"pingserver_secondary_force_reset":{"type":"str","required":false,"choices":["enable","disable"]},"override":{"type":"str","required":fal'
+    'se,"choices":["enable","disable"]},"pingserver_failover_threshold":{"type":"int","required":false},"vdom":{"type":"str","required":false},"pingserver_'
+    'monitor_interface":{"type":"str","required":false},"override_wait_time":{"type":"int","required":false}}},"schedule":{"type":"str","required":false,"c'
+    'hoices":["none","hub","leastconnection","round-robin","weight-round-robin","random","ip","ipport"]},"ftp_proxy_threshold":{"type":"str","required":fal'
+    'se},"load_balance_all":{"type":"str","required":false,"choices":["enable","disable"]},"monitor":{"type":"str","required":false},"override_wait_time":{'
+    '"type":"int","required":false},"failover_hold_time":{"type":"int","required":false},"memory_threshold":{"type":"str","required":false},"memory_failove'
+    'r_threshold":{"type":"int","required":false},"memory_compatible_mode":{"type":"str","required":false,"choices":["enable","disable"]},"pingserver_slave'
+    '_force_reset":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"vlan_hb_interval":{"type":"integer","revisions":[2047,2047]},"monitor_vlan":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"vlan_hb_lost_threshold":{"type":"integer","revisions":'
+    '[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"vlan_hb_interval":{"type":"int","required":false},"monitor_vlan":{"type":"str","required":false,"choices":'
+    '["enable","disable"]},"vlan_hb_lost_threshold":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,103 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"dh_worker_count":{"type":"integer","revisions":[1024,1024]},"dh_keypair_cache":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"dh_group_27":{"type":"dict","children":{"keypair_co'
+    'unt":{"type":"integer","revisions":[1024,1024]},"keypair_cache":{"type":"string","options":[{"value":"global","revisions":[1024,1024]},{"value":"custo'
+    'm","revisions":[1024,1024]}],"revisions":[1024,1024]},"mode":{"type":"string","options":[{"value":"software","revisions":[1024,1024]},{"value":"hardwa'
+    're","revisions":[1024,1024]},{"value":"global","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"dh_group_20":{"type":"dic'
+    't","children":{"keypair_count":{"type":"integer","revisions":[1024,1024]},"keypair_cache":{"type":"string","options":[{"value":"global","revisions":[1'
+    '024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[1024,1024]},"mode":{"type":"string","options":[{"value":"software","revisions":[10'
+    '24,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":"global","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},'
+    '"dh_group_21":{"type":"dict","children":{"keypair_count":{"type":"integer","revisions":[1024,1024]},"keypair_cache":{"type":"string","options":[{"valu'
+    'e":"global","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[1024,1024]},"mode":{"type":"string","options":[{"value":'
+    '"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":"global","revisions":[1024,1024]}],"revisions":[1024,1024]}}'
+    ',"revisions":[1024,1024]},"dh_group_28":{"type":"dict","children":{"keypair_count":{"type":"integer","revisions":[1024,1024]},"keypair_cache":{"type":'
+    '"string","options":[{"value":"global","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[1024,1024]},"mode":{"type":"st'
+    'ring","options":[{"value":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":"global","revisions":[1024,1024]}]'
+    ',"revisions":[1024,1024]}},"revisions":[1024,1024]},"dh_group_29":{"type":"dict","children":{"keypair_count":{"type":"integer","revisions":[1024,1024]'
+    '},"keypair_cache":{"type":"string","options":[{"value":"global","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[1024'
+    ',1024]},"mode":{"type":"string","options":[{"value":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":"global"'
+    ',"revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"dh_keypair_throttle":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"dh_keypair_count":{"type":"integer","revisions":[1024,1024'
+    ']},"dh_mode":{"type":"string","options":[{"value":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]}],"revisions":[1024,'
+    '1024]},"dh_multiprocess":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revision'
+    's":[1024,1024]},"dh_group_5":{"type":"dict","children":{"keypair_count":{"type":"integer","revisions":[1024,1024]},"keypair_cache":{"type":"string","o'
+    'ptions":[{"value":"global","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[1024,1024]},"mode":{"type":"string","opti'
+    'ons":[{"value":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":"global","revisions":[1024,1024]}],"revisions'
+    '":[1024,1024]}},"revisions":[1024,1024]},"dh_group_2":{"type":"dict","children":{"keypair_count":{"type":"integer","revisions":[1024,1024]},"keypair_c'
+    'ache":{"type":"string","options":[{"value":"global","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[1024,1024]},"mod'
+    'e":{"type":"string","options":[{"value":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":"global","revisions"'
+    ':[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"dh_group_1":{"type":"dict","children":{"keypair_count":{"type":"integer","revisions'
+    '":[1024,1024]},"keypair_cache":{"type":"string","options":[{"value":"global","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"rev'
+    'isions":[1024,1024]},"mode":{"type":"string","options":[{"value":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"va'
+    'lue":"global","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"embryonic_limit":{"type":"integer","revisions":[1024,1024]'
+    '},"dh_group_31":{"type":"dict","children":{"keypair_count":{"type":"integer","revisions":[1024,1024]},"keypair_cache":{"type":"string","options":[{"va'
+    'lue":"global","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[1024,1024]},"mode":{"type":"string","options":[{"value'
+    '":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":"global","revisions":[1024,1024]}],"revisions":[1024,1024]'
+    '}},"revisions":[1024,1024]},"dh_group_30":{"type":"dict","children":{"keypair_count":{"type":"integer","revisions":[1024,1024]},"keypair_cache":{"type'
+    '":"string","options":[{"value":"global","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[1024,1024]},"mode":{"type":"'
+    'string","options":[{"value":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":"global","revisions":[1024,1024]'
+    '}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"dh_group_32":{"type":"dict","children":{"keypair_count":{"type":"integer","revisions":[1024,102'
+    '4]},"keypair_cache":{"type":"string","options":[{"value":"global","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[10'
+    '24,1024]},"mode":{"type":"string","options":[{"value":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":"globa'
+    'l","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"dh_group_19":{"type":"dict","children":{"keypair_count":{"type":"inte'
+    'ger","revisions":[1024,1024]},"keypair_cache":{"type":"string","options":[{"value":"global","revisions":[1024,1024]},{"value":"custom","revisions":[10'
+    '24,1024]}],"revisions":[1024,1024]},"mode":{"type":"string","options":[{"value":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1'
+    '024,1024]},{"value":"global","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"dh_group_18":{"type":"dict","children":{"ke'
+    'ypair_count":{"type":"integer","revisions":[1024,1024]},"keypair_cache":{"type":"string","options":[{"value":"global","revisions":[1024,1024]},{"value'
+    '":"custom","revisions":[1024,1024]}],"revisions":[1024,1024]},"mode":{"type":"string","options":[{"value":"software","revisions":[1024,1024]},{"value"'
+    ':"hardware","revisions":[1024,1024]},{"value":"global","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"dh_group_17":{"ty'
+    'pe":"dict","children":{"keypair_count":{"type":"integer","revisions":[1024,1024]},"keypair_cache":{"type":"string","options":[{"value":"global","revis'
+    'ions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[1024,1024]},"mode":{"type":"string","options":[{"value":"software","revisi'
+    'ons":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":"global","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024'
+    ',1024]},"dh_group_16":{"type":"dict","children":{"keypair_count":{"type":"integer","revisions":[1024,1024]},"keypair_cache":{"type":"string","options"'
+    ':[{"value":"global","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[1024,1024]},"mode":{"type":"string","options":[{'
+    '"value":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":"global","revisions":[1024,1024]}],"revisions":[1024'
+    ',1024]}},"revisions":[1024,1024]},"dh_group_15":{"type":"dict","children":{"keypair_count":{"type":"integer","revisions":[1024,1024]},"keypair_cache":'
+    '{"type":"string","options":[{"value":"global","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revisions":[1024,1024]},"mode":{"t'
+    'ype":"string","options":[{"value":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":"global","revisions":[1024'
+    ',1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"dh_group_14":{"type":"dict","children":{"keypair_count":{"type":"integer","revisions":[10'
+    '24,1024]},"keypair_cache":{"type":"string","options":[{"value":"global","revisions":[1024,1024]},{"value":"custom","revisions":[1024,1024]}],"revision'
+    's":[1024,1024]},"mode":{"type":"string","options":[{"value":"software","revisions":[1024,1024]},{"value":"hardware","revisions":[1024,1024]},{"value":'
+    '"global","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"dh_worker_count":{"type":"int","required":false},"dh_keypair_cache":{"type":"str","required":false,"choice'
+    's":["enable","disable"]},"dh_group_27":{"type":"dict","required":false,"options":{"keypair_count":{"type":"int","required":false},"keypair_cache":{"ty'
+    'pe":"str","required":false,"choices":["global","custom"]},"mode":{"type":"str","required":false,"choices":["software","hardware","global"]}}},"dh_grou'
+    'p_20":{"type":"dict","required":false,"options":{"keypair_count":{"type":"int","required":false},"keypair_cache":{"type":"str","required":false,"choic'
+    'es":["global","custom"]},"mode":{"type":"str","required":false,"choices":["software","hardware","global"]}}},"dh_group_21":{"type":"dict","required":f'
+    'alse,"options":{"keypair_count":{"type":"int","required":false},"keypair_cache":{"type":"str","required":false,"choices":["global","custom"]},"mode":{'
+    '"type":"str","required":false,"choices":["software","hardware","global"]}}},"dh_group_28":{"type":"dict","required":false,"options":{"keypair_count":{'
+    '"type":"int","required":false},"keypair_cache":{"type":"str","required":false,"choices":["global","custom"]},"mode":{"type":"str","required":false,"ch'
+    'oices":["software","hardware","global"]}}},"dh_group_29":{"type":"dict","required":false,"options":{"keypair_count":{"type":"int","required":false},"k'
+    'eypair_cache":{"type":"str","required":false,"choices":["global","custom"]},"mode":{"type":"str","required":false,"choices":["software","hardware","gl'
+    'obal"]}}},"dh_keypair_throttle":{"type":"str","required":false,"choices":["enable","disable"]},"dh_keypair_count":{"type":"int","required":false},"dh_'
+    'mode":{"type":"str","required":false,"choices":["software","hardware"]},"dh_multiprocess":{"type":"str","required":false,"choices":["enable","disable"'
+    ']},"dh_group_5":{"type":"dict","required":false,"options":{"keypair_count":{"type":"int","required":false},"keypair_cache":{"type":"str","required":fa'
+    'lse,"choices":["global","custom"]},"mode":{"type":"str","required":false,"choices":["software","hardware","global"]}}},"dh_group_2":{"type":"dict","re'
+    'quired":false,"options":{"keypair_count":{"type":"int","required":false},"keypair_cache":{"type":"str","required":false,"choices":["global","custom"]}'
+    ',"mode":{"type":"str","required":false,"choices":["software","hardware","global"]}}},"dh_group_1":{"type":"dict","required":false,"options":{"keypair_'
+    'count":{"type":"int","required":false},"keypair_cache":{"type":"str","required":false,"choices":["global","custom"]},"mode":{"type":"str","required":f'
+    'alse,"choices":["software","hardware","global"]}}},"embryonic_limit":{"type":"int","required":false},"dh_group_31":{"type":"dict","required":false,"op'
+    'tions":{"keypair_count":{"type":"int","required":false},"keypair_cache":{"type":"str","required":false,"choices":["global","custom"]},"mode":{"type":"'
+    'str","required":false,"choices":["software","hardware","global"]}}},"dh_group_30":{"type":"dict","required":false,"options":{"keypair_count":{"type":"'
+    'int","required":false},"keypair_cache":{"type":"str","required":false,"choices":["global","custom"]},"mode":{"type":"str","required":false,"choices":['
+    '"software","hardware","global"]}}},"dh_group_32":{"type":"dict","required":false,"options":{"keypair_count":{"type":"int","required":false},"keypair_c'
+    'ache":{"type":"str","required":false,"choices":["global","custom"]},"mode":{"type":"str","required":false,"choices":["software","hardware","global"]}}'
+    '},"dh_group_19":{"type":"dict","required":false,"options":{"keypair_count":{"type":"int","required":false},"keypair_cache":{"type":"str","required":fa'
+    'lse,"choices":["global","custom"]},"mode":{"type":"str","required":false,"choices":["software","hardware","global"]}}},"dh_group_18":{"type":"dict","r'
+    'equired":false,"options":{"keypair_count":{"type":"int","required":false},"keypair_cache":{"type":"str","required":false,"choices":["global","custom"]'
+    '},"mode":{"type":"str","required":false,"choices":["software","hardware","global"]}}},"dh_group_17":{"type":"dict","required":false,"options":{"keypai'
+    'r_count":{"type":"int","required":false},"keypair_cache":{"type":"str","required":false,"choices":["global","custom"]},"mode":{"type":"str","required"'
+    ':false,"choices":["software","hardware","global"]}}},"dh_group_16":{"type":"dict","required":false,"options":{"keypair_count":{"type":"int","required"'
+    ':false},"keypair_cache":{"type":"str","required":false,"choices":["global","custom"]},"mode":{"type":"str","required":false,"choices":["software","har'
+    'dware","global"]}}},"dh_group_15":{"type":"dict","required":false,"options":{"keypair_count":{"type":"int","required":false},"keypair_cache":{"type":"'
+    'str","required":false,"choices":["global","custom"]},"mode":{"type":"str","required":false,"choices":["software","hardware","global"]}}},"dh_group_14"'
+    ':{"type":"dict","required":false,"options":{"keypair_count":{"type":"int","required":false},"keypair_cache":{"type":"str","required":false,"choices":['
+    '"global","custom"]},"mode":{"type":"str","required":false,"choices":["software","hardware","global"]}}}}}'
+)
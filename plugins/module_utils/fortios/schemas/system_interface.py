@@ -0,0 +1,391 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"egress_queues":{"type":"dict","children":{"cos7":{"type":"string","revisions":[128,128]},"cos6":{"type":"string","revision'
+    's":[128,128]},"cos5":{"type":"string","revisions":[128,128]},"cos4":{"type":"string","revisions":[128,128]},"cos3":{"type":"string","revisions":[128,1'
+    '28]},"cos2":{"type":"string","revisions":[128,128]},"cos1":{"type":"string","revisions":[128,128]},"cos0":{"type":"string","revisions":[128,128]}},"re'
+    'visions":[1920,128]},"macaddr":{"type":"string","revisions":[2047,2047]},"secondary_IP":{"type":"string","options":[{"value":"enable","revisions":[204'
+    '7,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"service_name":{"type":"string","revisions":[2047,2047]},"lacp_mode":{"'
+    'type":"string","options":[{"value":"static","revisions":[2047,2047]},{"value":"passive","revisions":[2047,2047]},{"value":"active","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"gwdetect":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"ping_serv_status":{"type":"integer","revisions":[2047,2047]},"src_check":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"min_links":{"type":"integer","revisions":[2047,204'
+    '7]},"speed":{"type":"string","options":[{"value":"auto","revisions":[2047,2047]},{"value":"10full","revisions":[2047,2047]},{"value":"10half","revisio'
+    'ns":[2047,2047]},{"value":"100full","revisions":[2047,2047]},{"value":"100half","revisions":[2047,2047]},{"value":"1000full","revisions":[2047,2047]},'
+    '{"value":"1000half","revisions":[2047,2047]},{"value":"1000auto","revisions":[2047,2047]},{"value":"10000full","revisions":[2047,1023]},{"value":"1000'
+    '0auto","revisions":[2047,1023]},{"value":"40000full","revisions":[2047,1023]},{"value":"100Gfull","revisions":[2047,895]}],"revisions":[2047,2047]},"v'
+    'lanforward":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"device_identification":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisi'
+    'ons":[2047,2047]},"member":{"type":"list","children":{"interface_name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"stp_ha_sec'
+    'ondary":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]},{"value":"priority-adjust",'
+    '"revisions":[1024,1024]}],"revisions":[1024,0]},"switch_controller_arp_inspection":{"type":"string","options":[{"value":"enable","revisions":[2047,204'
+    '7]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"bfd":{"type":"string","options":[{"value":"global","revisions":[2047,2047]}'
+    ',{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"proxy_captive_portal":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"managed_device":{"typ'
+    'e":"list","children":{"name":{"type":"string","revisions":[7,7]}},"revisions":[2047,7]},"auth_type":{"type":"string","options":[{"value":"auto","revis'
+    'ions":[2047,2047]},{"value":"pap","revisions":[2047,2047]},{"value":"chap","revisions":[2047,2047]},{"value":"mschapv1","revisions":[2047,2047]},{"val'
+    'ue":"mschapv2","revisions":[2047,2047]}],"revisions":[2047,2047]},"detectserver":{"type":"string","revisions":[2047,2047]},"color":{"type":"integer","'
+    'revisions":[2047,2047]},"internal":{"type":"integer","revisions":[2047,2047]},"dedicated_to":{"type":"string","options":[{"value":"none","revisions":['
+    '2047,2047]},{"value":"management","revisions":[2047,2047]}],"revisions":[2047,2047]},"pptp_password":{"type":"string","revisions":[2047,2047]},"manage'
+    'ment_ip":{"type":"string","revisions":[2047,2047]},"snmp_index":{"type":"integer","revisions":[2047,2047]},"switch_controller_igmp_snooping":{"type":"'
+    'string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dhcp_relay_type":'
+    '{"type":"string","options":[{"value":"regular","revisions":[2047,2047]},{"value":"ipsec","revisions":[2047,2047]}],"revisions":[2047,2047]},"mediatype'
+    '":{"type":"string","options":[{"value":"cfp2-sr10","revisions":[1919,1919]},{"value":"cfp2-lr4","revisions":[1919,1919]}],"revisions":[2047,895]},"swi'
+    'tch_controller_source_ip":{"type":"string","options":[{"value":"outbound","revisions":[1536,1536]},{"value":"fixed","revisions":[1536,1536]}],"revisio'
+    'ns":[1536,1536]},"broadcast_forticlient_discovery":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions"'
+    ':[127,127]}],"revisions":[2047,127]},"min_links_down":{"type":"string","options":[{"value":"operational","revisions":[2047,2047]},{"value":"administra'
+    'tive","revisions":[2047,2047]}],"revisions":[2047,2047]},"pptp_server_ip":{"type":"string","revisions":[2047,2047]},"dhcp_relay_service":{"type":"stri'
+    'ng","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"password":{"type":"st'
+    'ring","revisions":[2047,2047]},"tagging":{"type":"list","children":{"category":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revi'
+    'sions":[2047,2047]},"tags":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,20'
+    '47]},"explicit_ftp_proxy":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"device_netscan":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value":"enable","revisions":[7,7]}],"revisions":'
+    '[2047,7]},"name":{"type":"string","revisions":[2047,2047]},"fail_action_on_extender":{"type":"string","options":[{"value":"soft-restart","revisions":['
+    '2047,2047]},{"value":"hard-restart","revisions":[2047,2047]},{"value":"reboot","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipmac":{"type":"str'
+    'ing","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"vrrp_virtual_mac":{"'
+    'type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"lldp_netwo'
+    'rk_policy":{"type":"string","revisions":[2040,2040]},"detectprotocol":{"multiple_values":true,"type":"list","options":[{"value":"ping","revisions":[20'
+    '47,2047]},{"value":"tcp-echo","revisions":[2047,2047]},{"value":"udp-echo","revisions":[2047,2047]}],"revisions":[2047,2047]},"measured_upstream_bandw'
+    'idth":{"type":"integer","revisions":[1920,1920]},"swc_vlan":{"type":"integer","revisions":[1920,1920]},"dhcp_relay_agent_option":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"mode":{"type":"string","optio'
+    'ns":[{"value":"static","revisions":[2047,2047]},{"value":"dhcp","revisions":[2047,2047]},{"value":"pppoe","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"dhcp_relay_interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[1768,1768]},{"value":"sdwan","revisions":[1768,17'
+    '68]},{"value":"specify","revisions":[1768,1768]}],"revisions":[2040,1768]},"explicit_web_proxy":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ingress_cos":{"type":"string","options":[{"value":"disable","r'
+    'evisions":[128,128]},{"value":"cos0","revisions":[128,128]},{"value":"cos1","revisions":[128,128]},{"value":"cos2","revisions":[128,128]},{"value":"co'
+    's3","revisions":[128,128]},{"value":"cos4","revisions":[128,128]},{"value":"cos5","revisions":[128,128]},{"value":"cos6","revisions":[128,128]},{"valu'
+    'e":"cos7","revisions":[128,128]}],"revisions":[1920,128]},"ap_discover":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value'
+    '":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"stpforward":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"v'
+    'alue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"inbandwidth":{"type":"integer","revisions":[2047,2047]},"bandwidth_measure_time":{'
+    '"type":"integer","revisions":[1920,1920]},"switch_controller_feature":{"type":"string","options":[{"value":"none","revisions":[1920,1920]},{"value":"d'
+    'efault-vlan","revisions":[1920,1920]},{"value":"quarantine","revisions":[1920,1920]},{"value":"rspan","revisions":[1920,1920]},{"value":"voice","revis'
+    'ions":[1920,1920]},{"value":"video","revisions":[1920,1920]},{"value":"nac","revisions":[1920,1920]}],"revisions":[1920,1920]},"cli_conn_status":{"typ'
+    'e":"integer","revisions":[2047,2047]},"weight":{"type":"integer","revisions":[2047,2047]},"vlan_protocol":{"type":"string","options":[{"value":"8021q"'
+    ',"revisions":[1920,1920]},{"value":"8021ad","revisions":[1920,1920]}],"revisions":[1920,1920]},"stpforward_mode":{"type":"string","options":[{"value":'
+    '"rpl-all-ext-id","revisions":[2047,2047]},{"value":"rpl-bridge-ext-id","revisions":[2047,2047]},{"value":"rpl-nothing","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"ring_tx":{"type":"integer","revisions":[1024,1024]},"switch_controller_dhcp_snooping_option82":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"preserve_session_route":{"type":"string","'
+    'options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"drop_fragment":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"security_groups":{"'
+    'type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"device_user_identification":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sample_direction":{"type":"st'
+    'ring","options":[{"value":"tx","revisions":[2047,2047]},{"value":"rx","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"switch_controller_igmp_snooping_proxy":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisio'
+    'ns":[2040,2040]}],"revisions":[2040,2040]},"egress_shaping_profile":{"type":"string","revisions":[2047,2047]},"fail_detect":{"type":"string","options"'
+    ':[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"link_up_delay":{"type":"integer","'
+    'revisions":[2047,2047]},"vlanid":{"type":"integer","revisions":[2047,2047]},"switch_controller_nac":{"type":"string","revisions":[1920,1920]},"switch"'
+    ':{"type":"string","revisions":[2047,2047]},"vrrp":{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,'
+    '2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"priority":{"type":"integer","revisions":[2047,2047]},"start_time":{"type'
+    '":"integer","revisions":[2047,2047]},"vrid":{"type":"integer","revisions":[2047,2047]},"vrdst_priority":{"type":"integer","revisions":[2047,2047]},"vr'
+    'grp":{"type":"integer","revisions":[2047,2047]},"adv_interval":{"type":"integer","revisions":[2047,2047]},"preempt":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"version":{"type":"string","options":[{"val'
+    'ue":"2","revisions":[2047,2047]},{"value":"3","revisions":[2047,2047]}],"revisions":[2047,2047]},"ignore_default_route":{"type":"string","options":[{"'
+    'value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"proxy_arp":{"type":"list","children":{'
+    '"ip":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"vrdst":{"type":"string","rev'
+    'isions":[2047,2047]},"accept_mode":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"vrip":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"lcp_echo_interval":{"type":"integer","revisions"'
+    ':[2047,2047]},"dhcp_relay_ip":{"type":"string","revisions":[2047,2047]},"drop_overlapped_fragment":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"vindex":{"type":"integer","revisions":[2047,2047]},"fortihe'
+    'artbeat":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"devindex":{"ty'
+    'pe":"integer","revisions":[2047,2047]},"l2forward":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"vrf":{"type":"integer","revisions":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]},"pppo'
+    'e_unnumbered_negotiate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"device_identification_active_scan":{"type":"string","options":[{"value":"enable","revisions":[23,23]},{"value":"disable","revisions":['
+    '23,23]}],"revisions":[2047,23]},"vdom":{"type":"string","revisions":[2047,2047]},"security_external_web":{"type":"string","revisions":[2047,2047]},"pp'
+    'tp_client":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"scan_botnet_connections":{"type":"string","options":[{"value":"disable","revisions":[7,7]},{"value":"block","revisions":[7,7]},{"value":"monitor","'
+    'revisions":[7,7]}],"revisions":[2047,7]},"gi_gk":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions"'
+    ':[2047,2047]}],"revisions":[2047,1023]},"substitute_dst_mac":{"type":"string","revisions":[2047,2047]},"ac_name":{"type":"string","revisions":[2047,20'
+    '47]},"security_mode":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"captive-portal","revisions":[2047,2047]},{"value":'
+    '"802.1X","revisions":[2047,2047]}],"revisions":[2047,2047]},"switch_controller_dynamic":{"type":"string","revisions":[1024,1024]},"ingress_shaping_pro'
+    'file":{"type":"string","revisions":[2040,2040]},"device_access_list":{"type":"string","revisions":[2047,23]},"security_exempt_list":{"type":"string","'
+    'revisions":[2047,2047]},"padt_retry_timeout":{"type":"integer","revisions":[2047,2047]},"replacemsg_override_group":{"type":"string","revisions":[2047'
+    ',2047]},"switch_controller_mgmt_vlan":{"type":"integer","revisions":[1920,1920]},"fortilink_stacking":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[1023,1023]},{"value":"disable","revisions":[1023,1023]}],"revisions":[2047,1023]},"mtu_override":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ring_rx":{"type":"integer","revisions":[1024,1024]'
+    '},"monitor_bandwidth":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":'
+    '[1920,1920]},"egress_cos":{"type":"string","options":[{"value":"disable","revisions":[128,128]},{"value":"cos0","revisions":[128,128]},{"value":"cos1"'
+    ',"revisions":[128,128]},{"value":"cos2","revisions":[128,128]},{"value":"cos3","revisions":[128,128]},{"value":"cos4","revisions":[128,128]},{"value":'
+    '"cos5","revisions":[128,128]},{"value":"cos6","revisions":[128,128]},{"value":"cos7","revisions":[128,128]}],"revisions":[1920,128]},"fortilink":{"typ'
+    'e":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"switch_contro'
+    'ller_igmp_snooping_fast_leave":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"re'
+    'visions":[2040,2040]},"ha_priority":{"type":"integer","revisions":[2047,2047]},"outbandwidth":{"type":"integer","revisions":[2047,2047]},"estimated_do'
+    'wnstream_bandwidth":{"type":"integer","revisions":[2047,2047]},"security_mac_auth_bypass":{"type":"string","options":[{"value":"enable","revisions":[2'
+    '047,2047]},{"value":"disable","revisions":[2047,2047]},{"value":"mac-auth-only","revisions":[2040,2040]}],"revisions":[2047,2047]},"forward_domain":{"'
+    'type":"integer","revisions":[2047,2047]},"ip_managed_by_fortiipam":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"di'
+    'sable","revisions":[1920,1920]}],"revisions":[1920,1920]},"bfd_required_min_rx":{"type":"integer","revisions":[2047,2047]},"wccp":{"type":"string","op'
+    'tions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dhcp_relay_request_all_serve'
+    'r":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"detec'
+    'ted_peer_mtu":{"type":"integer","revisions":[2047,2047]},"ipunnumbered":{"type":"string","revisions":[2047,2047]},"bfd_desired_min_tx":{"type":"intege'
+    'r","revisions":[2047,2047]},"priority":{"type":"integer","revisions":[2047,2047]},"security_external_logout":{"type":"string","revisions":[2047,2047]}'
+    ',"subst":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"switch_controller_dhcp_snooping":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"icmp_send_redirect":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"ipv6":{"type":"dict","children":{"dhcp6_information_request":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dhcp6_relay_type":{"type":"string","options":[{"value":"reg'
+    'ular","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip6_dns_server_override":{"type":"string","options":[{"value":"enable","revisions":[2047,204'
+    '7]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip6_other_flag":{"type":"string","options":[{"value":"enable","revisions":['
+    '2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"nd_cert":{"type":"string","revisions":[2047,2047]},"vrrp6":{"type":'
+    '"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"priority":{"type":"integer","revisions":[2047,2047]},"vrip6":{"type":"string","revisions":[2047,2047]},"start_time":{"type":"integ'
+    'er","revisions":[2047,2047]},"vrid":{"type":"integer","revisions":[2047,2047]},"vrgrp":{"type":"integer","revisions":[2047,2047]},"adv_interval":{"typ'
+    'e":"integer","revisions":[2047,2047]},"preempt":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"vrdst6":{"type":"string","revisions":[2047,2047]},"accept_mode":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"nd_timestamp_delta":{"type":'
+    '"integer","revisions":[2047,2047]},"ip6_extra_addr":{"type":"list","children":{"prefix":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2'
+    '047]},"unique_autoconf_addr":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revi'
+    'sions":[1920,1920]},"ip6_address":{"type":"string","revisions":[2047,2047]},"dhcp6_prefix_delegation":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"nd_mode":{"type":"string","options":[{"value":"basic","r'
+    'evisions":[2047,2047]},{"value":"SEND-compatible","revisions":[2047,2047]}],"revisions":[2047,2047]},"vrip6_link_local":{"type":"string","revisions":['
+    '2047,2047]},"nd_security_level":{"type":"integer","revisions":[2047,2047]},"ip6_min_interval":{"type":"integer","revisions":[2047,2047]},"dhcp6_relay_'
+    'ip":{"type":"string","revisions":[2047,2047]},"vrrp_virtual_mac6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"dis'
+    'able","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip6_retrans_time":{"type":"integer","revisions":[2047,2047]},"nd_timestamp_fuzz":{"type":"in'
+    'teger","revisions":[2047,2047]},"ip6_manage_flag":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"ip6_prefix_mode":{"type":"string","options":[{"value":"dhcp6","revisions":[1024,1024]},{"value":"ra","revisi'
+    'ons":[1024,1024]}],"revisions":[1024,1024]},"ip6_max_interval":{"type":"integer","revisions":[2047,2047]},"dhcp6_prefix_hint_plt":{"type":"integer","r'
+    'evisions":[2047,2047]},"interface_identifier":{"type":"string","revisions":[1920,1920]},"ip6_link_mtu":{"type":"integer","revisions":[2047,2047]},"ip6'
+    '_mode":{"type":"string","options":[{"value":"static","revisions":[2047,2047]},{"value":"dhcp","revisions":[2047,2047]},{"value":"pppoe","revisions":[2'
+    '047,2047]},{"value":"delegated","revisions":[2047,2047]}],"revisions":[2047,2047]},"dhcp6_prefix_hint":{"type":"string","revisions":[2047,2047]},"ip6_'
+    'hop_limit":{"type":"integer","revisions":[2047,2047]},"ip6_upstream_interface":{"type":"string","revisions":[2047,2047]},"ip6_subnet":{"type":"string"'
+    ',"revisions":[2047,2047]},"dhcp6_client_options":{"multiple_values":true,"type":"list","options":[{"value":"rapid","revisions":[2047,2047]},{"value":"'
+    'iapd","revisions":[2047,2047]},{"value":"iana","revisions":[2047,2047]}],"revisions":[2047,2047]},"ra_send_mtu":{"type":"string","options":[{"value":"'
+    'enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"cli_conn6_status":{"type":"integer","revisions'
+    '":[1024,1024]},"ip6_send_adv":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"dhcp6_prefix_hint_vlt":{"type":"integer","revisions":[2047,2047]},"nd_cga_modifier":{"type":"string","revisions":[2047,2047]},"d'
+    'hcp6_relay_service":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"ip6_delegated_prefix_list":{"type":"list","children":{"subnet":{"type":"string","revisions":[2047,2047]},"onlink_flag":{"type":"string","o'
+    'ptions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rdnss":{"type":"string","re'
+    'visions":[2047,2047]},"upstream_interface":{"type":"string","revisions":[2047,2047]},"prefix_id":{"type":"integer","revisions":[2047,2047]},"rdnss_ser'
+    'vice":{"type":"string","options":[{"value":"delegated","revisions":[2047,2047]},{"value":"default","revisions":[2047,2047]},{"value":"specify","revisi'
+    'ons":[2047,2047]}],"revisions":[2047,2047]},"autonomous_flag":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"icmp6_send_redirect":{"type":"string","options":[{"value":"enable","re'
+    'visions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"ip6_default_life":{"type":"integer","revisions":[2047,204'
+    '7]},"autoconf":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"ip6_allowaccess":{"multiple_values":true,"type":"list","options":[{"value":"ping","revisions":[2047,2047]},{"value":"https","revisions":[2047,2'
+    '047]},{"value":"ssh","revisions":[2047,2047]},{"value":"snmp","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"telnet","rev'
+    'isions":[2047,2047]},{"value":"fgfm","revisions":[2047,2047]},{"value":"capwap","revisions":[2047,7]},{"value":"fabric","revisions":[2040,2040]}],"rev'
+    'isions":[2047,2047]},"ip6_prefix_list":{"type":"list","children":{"onlink_flag":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]}'
+    ',{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rdnss":{"type":"string","revisions":[2047,2047]},"valid_life_time":{"type":"in'
+    'teger","revisions":[2047,2047]},"dnssl":{"type":"list","children":{"domain":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"prefi'
+    'x":{"type":"string","revisions":[2047,2047]},"preferred_life_time":{"type":"integer","revisions":[2047,2047]},"autonomous_flag":{"type":"string","opti'
+    'ons":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"ip6_'
+    'reachable_time":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"disconnect_threshold":{"type":"integer","revisions":[2047,2047]}'
+    ',"type":{"type":"string","options":[{"value":"physical","revisions":[2047,2047]},{"value":"vlan","revisions":[2047,2047]},{"value":"aggregate","revisi'
+    'ons":[2047,2047]},{"value":"redundant","revisions":[2047,2047]},{"value":"tunnel","revisions":[2047,2047]},{"value":"vdom-link","revisions":[2047,2047'
+    ']},{"value":"loopback","revisions":[2047,2047]},{"value":"switch","revisions":[2047,2047]},{"value":"hard-switch","revisions":[2047,895]},{"value":"va'
+    'p-switch","revisions":[2047,2047]},{"value":"wl-mesh","revisions":[2047,2047]},{"value":"fext-wan","revisions":[2047,2047]},{"value":"vxlan","revision'
+    's":[2047,2047]},{"value":"hdlc","revisions":[2047,2047]},{"value":"switch-vlan","revisions":[2047,2047]},{"value":"emac-vlan","revisions":[2047,2047]}'
+    ',{"value":"geneve","revisions":[2040,2040]},{"value":"ssl","revisions":[1024,1024]}],"revisions":[2047,2047]},"username":{"type":"string","revisions":'
+    '[2047,2047]},"captive_portal":{"type":"integer","revisions":[2047,23]},"switch_controller_iot_scanning":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"pptp_auth_type":{"type":"string","options":[{"value":"'
+    'auto","revisions":[2047,2047]},{"value":"pap","revisions":[2047,2047]},{"value":"chap","revisions":[2047,2047]},{"value":"mschapv1","revisions":[2047,'
+    '2047]},{"value":"mschapv2","revisions":[2047,2047]}],"revisions":[2047,2047]},"endpoint_compliance":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"external":{"type":"string","options":[{"value":"enable","revisions":[2047'
+    ',2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"switch_controller_traffic_policy":{"type":"string","revisions":[2040,20'
+    '40]},"stp_ha_slave":{"type":"string","options":[{"value":"disable","revisions":[895,895]},{"value":"enable","revisions":[895,895]},{"value":"priority-'
+    'adjust","revisions":[895,895]}],"revisions":[2047,895]},"fail_detect_option":{"multiple_values":true,"type":"list","options":[{"value":"detectserver",'
+    '"revisions":[2047,2047]},{"value":"link-down","revisions":[2047,2047]}],"revisions":[2047,2047]},"distance":{"type":"integer","revisions":[2047,2047]}'
+    ',"security_redirect_url":{"type":"string","revisions":[2047,2047]},"switch_controller_learning_limit":{"type":"integer","revisions":[2047,2047]},"netf'
+    'low_sampler":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"tx","revisions":[2047,2047]},{"value":"rx","revisions":'
+    '[2047,2047]},{"value":"both","revisions":[2047,2047]}],"revisions":[2047,2047]},"mtu":{"type":"integer","revisions":[2047,2047]},"fail_alert_method":{'
+    '"type":"string","options":[{"value":"link-failed-signal","revisions":[2047,2047]},{"value":"link-down","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"stp":{"type":"string","options":[{"value":"disable","revisions":[1919,1919]},{"value":"enable","revisions":[1919,1919]}],"revisions":[2047,895]},'
+    '"wins_ip":{"type":"string","revisions":[2047,2047]},"lldp_reception":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"'
+    'disable","revisions":[2040,2040]},{"value":"vdom","revisions":[2040,2040]}],"revisions":[2040,2040]},"lcp_max_echo_fails":{"type":"integer","revisions'
+    '":[2047,2047]},"ident_accept":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"tcp_mss":{"type":"integer","revisions":[2047,2047]},"disc_retry_timeout":{"type":"integer","revisions":[2047,2047]},"spillover_t'
+    'hreshold":{"type":"integer","revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"auto_auth_extension_device":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"measured_downstream_bandwidth'
+    '":{"type":"integer","revisions":[1920,1920]},"fortilink_neighbor_detect":{"type":"string","options":[{"value":"lldp","revisions":[2040,2040]},{"value"'
+    ':"fortilink","revisions":[2040,2040]}],"revisions":[2040,2040]},"trust_ip6_2":{"type":"string","revisions":[2047,2047]},"trust_ip6_3":{"type":"string"'
+    ',"revisions":[2047,2047]},"trust_ip6_1":{"type":"string","revisions":[2047,2047]},"pptp_timeout":{"type":"integer","revisions":[2047,2047]},"lacp_ha_s'
+    'lave":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dh'
+    'cp_renew_time":{"type":"integer","revisions":[2047,2047]},"dhcp_client_identifier":{"type":"string","revisions":[2047,2047]},"fortilink_split_interfac'
+    'e":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"redun'
+    'dant_interface":{"type":"string","revisions":[2047,2047]},"switch_controller_rspan_mode":{"type":"string","options":[{"value":"disable","revisions":[2'
+    '040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"alias":{"type":"string","revisions":[2047,2047]},"client_options":{"t'
+    'ype":"list","children":{"ip":{"type":"string","revisions":[1920,1920]},"code":{"type":"integer","revisions":[1920,1920]},"type":{"type":"string","opti'
+    'ons":[{"value":"hex","revisions":[1920,1920]},{"value":"string","revisions":[1920,1920]},{"value":"ip","revisions":[1920,1920]},{"value":"fqdn","revis'
+    'ions":[1920,1920]}],"revisions":[1920,1920]},"id":{"type":"integer","revisions":[1920,1920]},"value":{"type":"string","revisions":[1920,1920]}},"revis'
+    'ions":[1920,1920]},"switch_controller_access_vlan":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"priority_override":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"ndiscforward":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"trust_ip_2":{"type":"string","revisions":[2047,2047]},"role":{"type":"string","options":[{'
+    '"value":"lan","revisions":[2047,2047]},{"value":"wan","revisions":[2047,2047]},{"value":"dmz","revisions":[2047,2047]},{"value":"undefined","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"allowaccess":{"multiple_values":true,"type":"list","options":[{"value":"ping","revisions":[2047,2047]},{"val'
+    'ue":"https","revisions":[2047,2047]},{"value":"ssh","revisions":[2047,2047]},{"value":"snmp","revisions":[2047,2047]},{"value":"http","revisions":[204'
+    '7,2047]},{"value":"telnet","revisions":[2047,2047]},{"value":"fgfm","revisions":[2047,2047]},{"value":"radius-acct","revisions":[2047,2047]},{"value":'
+    '"probe-response","revisions":[2047,2047]},{"value":"capwap","revisions":[2047,7]},{"value":"ftm","revisions":[2047,2047]},{"value":"fabric","revisions'
+    '":[2040,2040]}],"revisions":[2047,2047]},"polling_interval":{"type":"integer","revisions":[2047,2047]},"lldp_transmission":{"type":"string","options":'
+    '[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]},{"value":"vdom","revisions":[2047,2047]}],"revisions":[2047,20'
+    '47]},"ingress_spillover_threshold":{"type":"integer","revisions":[2047,2047]},"remote_ip":{"type":"string","revisions":[2047,2047]},"defaultgw":{"type'
+    '":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"description":{'
+    '"type":"string","revisions":[2047,2047]},"icmp_accept_redirect":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"dns_server_override":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"'
+    'value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ips_sniffer_mode":{"type":"string","options":[{"value":"enable","revisions":[2047'
+    ',2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"idle_timeout":{"type":"integer","revisions":[2047,2047]},"fail_alert_in'
+    'terfaces":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"switch_controller_dhcp_snooping_verif'
+    'y_mac":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"a'
+    'ggregate":{"type":"string","revisions":[2047,2047]},"estimated_upstream_bandwidth":{"type":"integer","revisions":[2047,2047]},"status":{"type":"string'
+    '","options":[{"value":"up","revisions":[2047,2047]},{"value":"down","revisions":[2047,2047]}],"revisions":[2047,2047]},"swc_first_create":{"type":"int'
+    'eger","revisions":[1536,1536]},"algorithm":{"type":"string","options":[{"value":"L2","revisions":[2047,2047]},{"value":"L3","revisions":[2047,2047]},{'
+    '"value":"L4","revisions":[2047,2047]}],"revisions":[2047,2047]},"sflow_sampler":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]}'
+    ',{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"bfd_detect_mult":{"type":"integer","revisions":[2047,2047]},"managed_subnetwor'
+    'k_size":{"type":"string","options":[{"value":"256","revisions":[1920,1920]},{"value":"512","revisions":[1920,1920]},{"value":"1024","revisions":[1920,'
+    '1920]},{"value":"2048","revisions":[1920,1920]},{"value":"4096","revisions":[1920,1920]},{"value":"8192","revisions":[1920,1920]},{"value":"16384","re'
+    'visions":[1920,1920]},{"value":"32768","revisions":[1920,1920]},{"value":"65536","revisions":[1920,1920]}],"revisions":[1920,1920]},"broadcast_forward'
+    '":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"trust_'
+    'ip_1":{"type":"string","revisions":[2047,2047]},"netbios_forward":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"en'
+    'able","revisions":[2047,2047]}],"revisions":[2047,2047]},"trust_ip_3":{"type":"string","revisions":[2047,2047]},"pptp_user":{"type":"string","revision'
+    's":[2047,2047]},"sample_rate":{"type":"integer","revisions":[2047,2047]},"fortilink_backup_link":{"type":"integer","revisions":[2047,2047]},"arpforwar'
+    'd":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"secon'
+    'daryip":{"type":"list","children":{"gwdetect":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"detectprotocol":{"multiple_values":true,"type":"list","options":[{"value":"ping","revisions":[2047,2047]},{"valu'
+    'e":"tcp-echo","revisions":[2047,2047]},{"value":"udp-echo","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,'
+    '2047]},"detectserver":{"type":"string","revisions":[2047,2047]},"ping_serv_status":{"type":"integer","revisions":[2047,2047]},"allowaccess":{"multiple'
+    '_values":true,"type":"list","options":[{"value":"ping","revisions":[2047,2047]},{"value":"https","revisions":[2047,2047]},{"value":"ssh","revisions":['
+    '2047,2047]},{"value":"snmp","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"telnet","revisions":[2047,2047]},{"value":"fgf'
+    'm","revisions":[2047,2047]},{"value":"radius-acct","revisions":[2047,2047]},{"value":"probe-response","revisions":[2047,2047]},{"value":"capwap","revi'
+    'sions":[2047,7]},{"value":"ftm","revisions":[2047,2047]},{"value":"fabric","revisions":[2040,2040]}],"revisions":[2047,2047]},"ha_priority":{"type":"i'
+    'nteger","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"lacp_speed":{"type":"string","options":[{"'
+    'value":"slow","revisions":[2047,2047]},{"value":"fast","revisions":[2047,2047]}],"revisions":[2047,2047]},"dhcp_relay_interface":{"type":"string","rev'
+    'isions":[2040,1768]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"egress_queues":{"type":"dict","required":false,"options":{"cos7":{"type":"str","required":false},"cos6":{"'
+    'type":"str","required":false},"cos5":{"type":"str","required":false},"cos4":{"type":"str","required":false},"cos3":{"type":"str","required":false},"co'
+    's2":{"type":"str","required":false},"cos1":{"type":"str","required":false},"cos0":{"type":"str","required":false}}},"macaddr":{"type":"str","required"'
+    ':false},"secondary_IP":{"type":"str","required":false,"choices":["enable","disable"]},"service_name":{"type":"str","required":false},"lacp_mode":{"typ'
+    'e":"str","required":false,"choices":["static","passive","active"]},"gwdetect":{"type":"str","required":false,"choices":["enable","disable"]},"ping_ser'
+    'v_status":{"type":"int","required":false},"src_check":{"type":"str","required":false,"choices":["enable","disable"]},"min_links":{"type":"int","requir'
+    'ed":false},"speed":{"type":"str","required":false,"choices":["auto","10full","10half","100full","100half","1000full","1000half","1000auto","10000full"'
+    ',"10000auto","40000full","100Gfull"]},"vlanforward":{"type":"str","required":false,"choices":["enable","disable"]},"device_identification":{"type":"st'
+    'r","required":false,"choices":["enable","disable"]},"member":{"type":"list","required":false,"options":{"interface_name":{"type":"str","required":fals'
+    'e}}},"stp_ha_secondary":{"type":"str","required":false,"choices":["disable","enable","priority-adjust"]},"switch_controller_arp_inspection":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"bfd":{"type":"str","required":false,"choices":["global","enable","disable"]},"proxy_captive_port'
+    'al":{"type":"str","required":false,"choices":["enable","disable"]},"managed_device":{"type":"list","required":false,"options":{"name":{"type":"str","r'
+    'equired":false}}},"auth_type":{"type":"str","required":false,"choices":["auto","pap","chap","mschapv1","mschapv2"]},"detectserver":{"type":"str","requ'
+    'ired":false},"color":{"type":"int","required":false},"internal":{"type":"int","required":false},"dedicated_to":{"type":"str","required":false,"choices'
+    '":["none","management"]},"pptp_password":{"type":"str","required":false},"management_ip":{"type":"str","required":false},"snmp_index":{"type":"int","r'
+    'equired":false},"switch_controller_igmp_snooping":{"type":"str","required":false,"choices":["enable","disable"]},"dhcp_relay_type":{"type":"str","requ'
+    'ired":false,"choices":["regular","ipsec"]},"mediatype":{"type":"str","required":false},"switch_controller_source_ip":{"type":"str","required":false,"c'
+    'hoices":["outbound","fixed"]},"broadcast_forticlient_discovery":{"type":"str","required":false},"min_links_down":{"type":"str","required":false,"choic'
+    'es":["operational","administrative"]},"pptp_server_ip":{"type":"str","required":false},"dhcp_relay_service":{"type":"str","required":false,"choices":['
+    '"disable","enable"]},"password":{"type":"str","required":false},"tagging":{"type":"list","required":false,"options":{"category":{"type":"str","require'
+    'd":false},"name":{"type":"str","required":false},"tags":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}}},"explici'
+    't_ftp_proxy":{"type":"str","required":false,"choices":["enable","disable"]},"device_netscan":{"type":"str","required":false},"name":{"type":"str","req'
+    'uired":false},"fail_action_on_extender":{"type":"str","required":false,"choices":["soft-restart","hard-restart","reboot"]},"ipmac":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"vrrp_virtual_mac":{"type":"str","required":false,"choices":["enable","disable"]},"lldp_network_policy":{"'
+    'type":"str","required":false},"detectprotocol":{"type":"list","required":false,"choices":["ping","tcp-echo","udp-echo"]},"measured_upstream_bandwidth"'
+    ':{"type":"int","required":false},"swc_vlan":{"type":"int","required":false},"dhcp_relay_agent_option":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"mode":{"type":"str","required":false,"choices":["static","dhcp","pppoe"]},"dhcp_relay_interface_select_method":{"type":"str","required'
+    '":false},"explicit_web_proxy":{"type":"str","required":false,"choices":["enable","disable"]},"ingress_cos":{"type":"str","required":false},"ap_discove'
+    'r":{"type":"str","required":false,"choices":["enable","disable"]},"stpforward":{"type":"str","required":false,"choices":["enable","disable"]},"inbandw'
+    'idth":{"type":"int","required":false},"bandwidth_measure_time":{"type":"int","required":false},"switch_controller_feature":{"type":"str","required":fa'
+    'lse,"choices":["none","default-vlan","quarantine","rspan","voice","video","nac"]},"cli_conn_status":{"type":"int","required":false},"weight":{"type":"'
+    'int","required":false},"vlan_protocol":{"type":"str","required":false,"choices":["8021q","8021ad"]},"stpforward_mode":{"type":"str","required":false,"'
+    'choices":["rpl-all-ext-id","rpl-bridge-ext-id","rpl-nothing"]},"ring_tx":{"type":"int","required":false},"switch_controller_dhcp_snooping_option82":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"preserve_session_route":{"type":"str","required":false,"choices":["enable","disable"]},"'
+    'drop_fragment":{"type":"str","required":false,"choices":["enable","disable"]},"security_groups":{"type":"list","required":false,"options":{"name":{"ty'
+    'pe":"str","required":false}}},"device_user_identification":{"type":"str","required":false,"choices":["enable","disable"]},"sample_direction":{"type":"'
+    'str","required":false,"choices":["tx","rx","both"]},"switch_controller_igmp_snooping_proxy":{"type":"str","required":false,"choices":["enable","disabl'
+    'e"]},"egress_shaping_profile":{"type":"str","required":false},"fail_detect":{"type":"str","required":false,"choices":["enable","disable"]},"link_up_de'
+    'lay":{"type":"int","required":false},"vlanid":{"type":"int","required":false},"switch_controller_nac":{"type":"str","required":false},"switch":{"type"'
+    ':"str","required":false},"vrrp":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"pr'
+    'iority":{"type":"int","required":false},"start_time":{"type":"int","required":false},"vrid":{"type":"int","required":false},"vrdst_priority":{"type":"'
+    'int","required":false},"vrgrp":{"type":"int","required":false},"adv_interval":{"type":"int","required":false},"preempt":{"type":"str","required":false'
+    ',"choices":["enable","disable"]},"version":{"type":"str","required":false,"choices":["2","3"]},"ignore_default_route":{"type":"str","required":false,"'
+    'choices":["enable","disable"]},"proxy_arp":{"type":"list","required":false,"options":{"ip":{"type":"str","required":false},"id":{"type":"int","require'
+    'd":false}}},"vrdst":{"type":"str","required":false},"accept_mode":{"type":"str","required":false,"choices":["enable","disable"]},"vrip":{"type":"str",'
+    '"required":false}}},"lcp_echo_interval":{"type":"int","required":false},"dhcp_relay_ip":{"type":"str","required":false},"drop_overlapped_fragment":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"vindex":{"type":"int","required":false},"fortiheartbeat":{"type":"str","required":false},'
+    '"devindex":{"type":"int","required":false},"l2forward":{"type":"str","required":false,"choices":["enable","disable"]},"vrf":{"type":"int","required":f'
+    'alse},"interface":{"type":"str","required":false},"pppoe_unnumbered_negotiate":{"type":"str","required":false,"choices":["enable","disable"]},"device_'
+    'identification_active_scan":{"type":"str","required":false},"vdom":{"type":"str","required":false},"security_external_web":{"type":"str","required":fa'
+    'lse},"pptp_client":{"type":"str","required":false,"choices":["enable","disable"]},"scan_botnet_connections":{"type":"str","required":false},"gi_gk":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"substitute_dst_mac":{"type":"str","required":false},"ac_name":{"type":"str","required":f'
+    'alse},"security_mode":{"type":"str","required":false,"choices":["none","captive-portal","802.1X"]},"switch_controller_dynamic":{"type":"str","required'
+    '":false},"ingress_shaping_profile":{"type":"str","required":false},"device_access_list":{"type":"str","required":false},"security_exempt_list":{"type"'
+    ':"str","required":false},"padt_retry_timeout":{"type":"int","required":false},"replacemsg_override_group":{"type":"str","required":false},"switch_cont'
+    'roller_mgmt_vlan":{"type":"int","required":false},"fortilink_stacking":{"type":"str","required":false},"mtu_override":{"type":"str","required":false,"'
+    'choices":["enable","disable"]},"ring_rx":{"type":"int","required":false},"monitor_bandwidth":{"type":"str","required":false,"choices":["enable","disab'
+    'le"]},"egress_cos":{"type":"str","required":false},"fortilink":{"type":"str","required":false,"choices":["enable","disable"]},"switch_controller_igmp_'
+    'snooping_fast_leave":{"type":"str","required":false,"choices":["enable","disable"]},"ha_priority":{"type":"int","required":false},"outbandwidth":{"typ'
+    'e":"int","required":false},"estimated_downstream_bandwidth":{"type":"int","required":false},"security_mac_auth_bypass":{"type":"str","required":false}'
+    ',"forward_domain":{"type":"int","required":false},"ip_managed_by_fortiipam":{"type":"str","required":false,"choices":["enable","disable"]},"bfd_requir'
+    'ed_min_rx":{"type":"int","required":false},"wccp":{"type":"str","required":false,"choices":["enable","disable"]},"dhcp_relay_request_all_server":{"typ'
+    'e":"str","required":false,"choices":["disable","enable"]},"detected_peer_mtu":{"type":"int","required":false},"ipunnumbered":{"type":"str","required":'
+    'false},"bfd_desired_min_tx":{"type":"int","required":false},"priority":{"type":"int","required":false},"security_external_logout":{"type":"str","requi'
+    'red":false},"subst":{"type":"str","required":false,"choices":["enable","disable"]},"switch_controller_dhcp_snooping":{"type":"str","required":false,"c'
+    'hoices":["enable","disable"]},"icmp_send_redirect":{"type":"str","required":false,"choices":["enable","disable"]},"ipv6":{"type":"dict","required":fal'
+    'se,"options":{"dhcp6_information_request":{"type":"str","required":false,"choices":["enable","disable"]},"dhcp6_relay_type":{"type":"str","required":f'
+    'alse,"choices":["regular"]},"ip6_dns_server_override":{"type":"str","required":false,"choices":["enable","disable"]},"ip6_other_flag":{"type":"str","r'
+    'equired":false,"choices":["enable","disable"]},"nd_cert":{"type":"str","required":false},"vrrp6":{"type":"list","required":false,"options":{"status":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"priority":{"type":"int","required":false},"vrip6":{"type":"str","required":false},"star'
+    't_time":{"type":"int","required":false},"vrid":{"type":"int","required":false},"vrgrp":{"type":"int","required":false},"adv_interval":{"type":"int","r'
+    'equired":false},"preempt":{"type":"str","required":false,"choices":["enable","disable"]},"vrdst6":{"type":"str","required":false},"accept_mode":{"type'
+    '":"str","required":false,"choices":["enable","disable"]}}},"nd_timestamp_delta":{"type":"int","required":false},"ip6_extra_addr":{"type":"list","requi'
+    'red":false,"options":{"prefix":{"type":"str","required":false}}},"unique_autoconf_addr":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"ip6_address":{"type":"str","required":false},"dhcp6_prefix_delegation":{"type":"str","required":false,"choices":["enable","disable"]},"nd_mode":{"ty'
+    'pe":"str","required":false,"choices":["basic","SEND-compatible"]},"vrip6_link_local":{"type":"str","required":false},"nd_security_level":{"type":"int"'
+    ',"required":false},"ip6_min_interval":{"type":"int","required":false},"dhcp6_relay_ip":{"type":"str","required":false},"vrrp_virtual_mac6":{"type":"st'
+    'r","required":false,"choices":["enable","disable"]},"ip6_retrans_time":{"type":"int","required":false},"nd_timestamp_fuzz":{"type":"int","required":fa'
+    'lse},"ip6_manage_flag":{"type":"str","required":false,"choices":["enable","disable"]},"ip6_prefix_mode":{"type":"str","required":false,"choices":["dhc'
+    'p6","ra"]},"ip6_max_interval":{"type":"int","required":false},"dhcp6_prefix_hint_plt":{"type":"int","required":false},"interface_identifier":{"type":"'
+    'str","required":false},"ip6_link_mtu":{"type":"int","required":false},"ip6_mode":{"type":"str","required":false,"choices":["static","dhcp","pppoe","de'
+    'legated"]},"dhcp6_prefix_hint":{"type":"str","required":false},"ip6_hop_limit":{"type":"int","required":false},"ip6_upstream_interface":{"type":"str",'
+    '"required":false},"ip6_subnet":{"type":"str","required":false},"dhcp6_client_options":{"type":"list","required":false,"choices":["rapid","iapd","iana"'
+    ']},"ra_send_mtu":{"type":"str","required":false,"choices":["enable","disable"]},"cli_conn6_status":{"type":"int","required":false},"ip6_send_adv":{"ty'
+    'pe":"str","required":false,"choices":["enable","disable"]},"dhcp6_prefix_hint_vlt":{"type":"int","required":false},"nd_cga_modifier":{"type":"str","re'
+    'quired":false},"dhcp6_relay_service":{"type":"str","required":false,"choices":["disable","enable"]},"ip6_delegated_prefix_list":{"type":"list","requir'
+    'ed":false,"options":{"subnet":{"type":"str","required":false},"onlink_flag":{"type":"str","required":false,"choices":["enable","disable"]},"rdnss":{"t'
+    'ype":"str","required":false},"upstream_interface":{"type":"str","required":false},"prefix_id":{"type":"int","required":false},"rdnss_service":{"type":'
+    '"str","required":false,"choices":["delegated","default","specify"]},"autonomous_flag":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+    ',"icmp6_send_redirect":{"type":"str","required":false,"choices":["enable","disable"]},"ip6_default_life":{"type":"int","required":false},"autoconf":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"ip6_allowaccess":{"type":"list","required":false},"ip6_prefix_list":{"type":"list","requ'
+    'ired":false,"options":{"onlink_flag":{"type":"str","required":false,"choices":["enable","disable"]},"rdnss":{"type":"str","required":false},"valid_lif'
+    'e_time":{"type":"int","required":false},"dnssl":{"type":"list","required":false,"options":{"domain":{"type":"str","required":false}}},"prefix":{"type"'
+    ':"str","required":false},"preferred_life_time":{"type":"int","required":false},"autonomous_flag":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]}}},"ip6_reachable_time":{"type":"int","required":false}}},"disconnect_threshold":{"type":"int","required":false},"type":{"type":"str","requir'
+    'ed":false},"username":{"type":"str","required":false},"captive_portal":{"type":"int","required":false},"switch_controller_iot_scanning":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]},"pptp_auth_type":{"type":"str","required":false,"choices":["auto","pap","chap","mschapv1","mschapv2"]'
+    '},"endpoint_compliance":{"type":"str","required":false},"external":{"type":"str","required":false,"choices":["enable","disable"]},"switch_controller_t'
+    'raffic_policy":{"type":"str","required":false},"stp_ha_slave":{"type":"str","required":false},"fail_detect_option":{"type":"list","required":false,"ch'
+    'oices":["detectserver","link-down"]},"distance":{"type":"int","required":false},"security_redirect_url":{"type":"str","required":false},"switch_contro'
+    'ller_learning_limit":{"type":"int","required":false},"netflow_sampler":{"type":"str","required":false,"choices":["disable","tx","rx","both"]},"mtu":{"'
+    'type":"int","required":false},"fail_alert_method":{"type":"str","required":false,"choices":["link-failed-signal","link-down"]},"stp":{"type":"str","re'
+    'quired":false},"wins_ip":{"type":"str","required":false},"lldp_reception":{"type":"str","required":false,"choices":["enable","disable","vdom"]},"lcp_m'
+    'ax_echo_fails":{"type":"int","required":false},"ident_accept":{"type":"str","required":false,"choices":["enable","disable"]},"tcp_mss":{"type":"int","'
+    'required":false},"disc_retry_timeout":{"type":"int","required":false},"spillover_threshold":{"type":"int","required":false},"ip":{"type":"str","requir'
+    'ed":false},"auto_auth_extension_device":{"type":"str","required":false,"choices":["enable","disable"]},"measured_downstream_bandwidth":{"type":"int","'
+    'required":false},"fortilink_neighbor_detect":{"type":"str","required":false,"choices":["lldp","fortilink"]},"trust_ip6_2":{"type":"str","required":fal'
+    'se},"trust_ip6_3":{"type":"str","required":false},"trust_ip6_1":{"type":"str","required":false},"pptp_timeout":{"type":"int","required":false},"lacp_h'
+    'a_slave":{"type":"str","required":false,"choices":["enable","disable"]},"dhcp_renew_time":{"type":"int","required":false},"dhcp_client_identifier":{"t'
+    'ype":"str","required":false},"fortilink_split_interface":{"type":"str","required":false,"choices":["enable","disable"]},"redundant_interface":{"type":'
+    '"str","required":false},"switch_controller_rspan_mode":{"type":"str","required":false,"choices":["disable","enable"]},"alias":{"type":"str","required"'
+    ':false},"client_options":{"type":"list","required":false,"options":{"ip":{"type":"str","required":false},"code":{"type":"int","required":false},"type"'
+    ':{"type":"str","required":false,"choices":["hex","string","ip","fqdn"]},"id":{"type":"int","required":false},"value":{"type":"str","required":false}}}'
+    ',"switch_controller_access_vlan":{"type":"str","required":false,"choices":["enable","disable"]},"priority_override":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"ndiscforward":{"type":"str","required":false,"choices":["enable","disable"]},"trust_ip_2":{"type":"str","required":false'
+    '},"role":{"type":"str","required":false,"choices":["lan","wan","dmz","undefined"]},"allowaccess":{"type":"list","required":false},"polling_interval":{'
+    '"type":"int","required":false},"lldp_transmission":{"type":"str","required":false,"choices":["enable","disable","vdom"]},"ingress_spillover_threshold"'
+    ':{"type":"int","required":false},"remote_ip":{"type":"str","required":false},"defaultgw":{"type":"str","required":false,"choices":["enable","disable"]'
+    '},"description":{"type":"str","required":false},"icmp_accept_redirect":{"type":"str","required":false,"choices":["enable","disable"]},"dns_server_over'
+    'ride":{"type":"str","required":false,"choices":["enable","disable"]},"ips_sniffer_mode":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"idle_timeout":{"type":"int","required":false},"fail_alert_interfaces":{"type":"list","required":false,"options":{"name":{"type":"str","required":fal'
+    'se}}},"switch_controller_dhcp_snooping_verify_mac":{"type":"str","required":false,"choices":["enable","disable"]},"aggregate":{"type":"str","required"'
+    ':false},"estimated_upstream_bandwidth":{"type":"int","required":false},"status":{"type":"str","required":false,"choices":["up","down"]},"swc_first_cre'
+    'ate":{"type":"int","required":false},"algorithm":{"type":"str","required":false,"choices":["L2","L3","L4"]},"sflow_sampler":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"bfd_detect_mult":{"type":"int","required":false},"managed_subnetwork_size":{"type":"str","required":false,"choic'
+    'es":["256","512","1024","2048","4096","8192","16384","32768","65536"]},"broadcast_forward":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"trust_ip_1":{"type":"str","required":false},"netbios_forward":{"type":"str","required":false,"choices":["disable","enable"]},"trust_ip_3":{"type"'
+    ':"str","required":false},"pptp_user":{"type":"str","required":false},"sample_rate":{"type":"int","required":false},"fortilink_backup_link":{"type":"in'
+    't","required":false},"arpforward":{"type":"str","required":false,"choices":["enable","disable"]},"secondaryip":{"type":"list","required":false,"option'
+    's":{"gwdetect":{"type":"str","required":false,"choices":["enable","disable"]},"detectprotocol":{"type":"list","required":false,"choices":["ping","tcp-'
+    'echo","udp-echo"]},"ip":{"type":"str","required":false},"detectserver":{"type":"str","required":false},"ping_serv_status":{"type":"int","required":fal'
+    'se},"allowaccess":{"type":"list","required":false},"ha_priority":{"type":"int","required":false},"id":{"type":"int","required":false}}},"lacp_speed":{'
+    '"type":"str","required":false,"choices":["slow","fast"]},"dhcp_relay_interface":{"type":"str","required":false}}}'
+)
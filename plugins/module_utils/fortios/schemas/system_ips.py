@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"override_signature_hold_by_id":{"type":"string","options":[{"value":"enable","revisions":[1664,1664]},{"value":"disable","'
+    'revisions":[1664,1664]}],"revisions":[1664,1664]},"signature_hold_time":{"type":"string","revisions":[1664,1664]}},"revisions":[1664,1664]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"override_signature_hold_by_id":{"type":"str","required":false,"choices":["enable","disable"]},"signature_h'
+    'old_time":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"member":{"type":"list","children":{"tunnel_name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"name'
+    '":{"type":"string","revisions":[2040,2040]},"algorithm":{"type":"string","options":[{"value":"L3","revisions":[2040,2040]},{"value":"L4","revisions":['
+    '2040,2040]},{"value":"round-robin","revisions":[2040,2040]},{"value":"redundant","revisions":[2040,2040]},{"value":"weighted-round-robin","revisions":'
+    '[1920,1920]}],"revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"member":{"type":"list","required":false,"options":{"tunnel_name":{"type":"str","required":false}}},"name":'
+    '{"type":"str","required":false},"algorithm":{"type":"str","required":false}}}'
+)
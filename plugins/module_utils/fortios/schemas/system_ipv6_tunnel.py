@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"use_sdwan":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,102'
+    '4]}],"revisions":[1024,1024]},"name":{"type":"string","revisions":[2047,2047]},"destination":{"type":"string","revisions":[2047,2047]},"auto_asic_offl'
+    'oad":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,1023]},"sou'
+    'rce":{"type":"string","revisions":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"use_sdwan":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","required":'
+    'false},"destination":{"type":"str","required":false},"auto_asic_offload":{"type":"str","required":false,"choices":["enable","disable"]},"source":{"typ'
+    'e":"str","required":false},"interface":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"guaranteed_bandwidth":{"type":"integer","revisions":[128,128]},"maximum_bandwidth":{"type":"integer","revisions":[128,128]'
+    '},"bandwidth_unit":{"type":"string","options":[{"value":"kbps","revisions":[128,128]},{"value":"pps","revisions":[128,128]}],"revisions":[128,128]},"n'
+    'ame":{"type":"string","revisions":[128,128]},"burst_control":{"type":"string","options":[{"value":"disable","revisions":[128,128]},{"value":"enable","'
+    'revisions":[128,128]}],"revisions":[128,128]}},"revisions":[128,128]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"guaranteed_bandwidth":{"type":"int","required":false},"maximum_bandwidth":{"type":"int","required":false},'
+    '"bandwidth_unit":{"type":"str","required":false,"choices":["kbps","pps"]},"name":{"type":"str","required":false},"burst_control":{"type":"str","requir'
+    'ed":false,"choices":["disable","enable"]}}}'
+)
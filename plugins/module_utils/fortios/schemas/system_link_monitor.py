@@ -0,0 +1,39 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"service_detection":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":['
+    '1024,1024]}],"revisions":[1024,1024]},"gateway_ip6":{"type":"string","revisions":[2047,2047]},"update_cascade_interface":{"type":"string","options":[{'
+    '"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"diffservcode":{"type":"string","revis'
+    'ions":[1024,1024]},"gateway_ip":{"type":"string","revisions":[2047,2047]},"ha_priority":{"type":"integer","revisions":[2047,2047]},"protocol":{"multip'
+    'le_values":true,"type":"list","options":[{"value":"ping","revisions":[2047,2047]},{"value":"tcp-echo","revisions":[2047,2047]},{"value":"udp-echo","re'
+    'visions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"twamp","revisions":[2047,2047]},{"value":"ping6","revisions":[2047,383]}],"re'
+    'visions":[2047,2047]},"port":{"type":"integer","revisions":[2047,2047]},"packet_size":{"type":"integer","revisions":[2047,2047]},"addr_mode":{"type":"'
+    'string","options":[{"value":"ipv4","revisions":[2047,2047]},{"value":"ipv6","revisions":[2047,2047]}],"revisions":[2047,2047]},"update_static_route":{'
+    '"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"probe_tim'
+    'eout":{"type":"integer","revisions":[2040,2024]},"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]},"http_get":{"type":"string","revisions":[2047,2047]},"failtime":{"type":"integer","revisions":[2047,2'
+    '047]},"http_agent":{"type":"string","revisions":[2047,2047]},"source_ip6":{"type":"string","revisions":[2047,2047]},"srcintf":{"type":"string","revisi'
+    'ons":[2047,2047]},"probe_count":{"type":"integer","revisions":[1920,1920]},"password":{"type":"string","revisions":[2047,2047]},"recoverytime":{"type"'
+    ':"integer","revisions":[2047,2047]},"http_match":{"type":"string","revisions":[2047,2047]},"security_mode":{"type":"string","options":[{"value":"none"'
+    ',"revisions":[2047,2047]},{"value":"authentication","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]'
+    '},"class_id":{"type":"integer","revisions":[1024,1024]},"route":{"type":"list","children":{"subnet":{"type":"string","revisions":[1024,1024]}},"revisi'
+    'ons":[1024,1024]},"interval":{"type":"integer","revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2047,2047]},"server":{"type":"list",'
+    '"children":{"address":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"service_detection":{"type":"str","required":false,"choices":["enable","disable"]},"gateway_ip6":{"type":"s'
+    'tr","required":false},"update_cascade_interface":{"type":"str","required":false,"choices":["enable","disable"]},"diffservcode":{"type":"str","required'
+    '":false},"gateway_ip":{"type":"str","required":false},"ha_priority":{"type":"int","required":false},"protocol":{"type":"list","required":false,"choice'
+    's":["ping","tcp-echo","udp-echo","http","twamp","ping6"]},"port":{"type":"int","required":false},"packet_size":{"type":"int","required":false},"addr_m'
+    'ode":{"type":"str","required":false,"choices":["ipv4","ipv6"]},"update_static_route":{"type":"str","required":false,"choices":["enable","disable"]},"p'
+    'robe_timeout":{"type":"int","required":false},"status":{"type":"str","required":false,"choices":["enable","disable"]},"http_get":{"type":"str","requir'
+    'ed":false},"failtime":{"type":"int","required":false},"http_agent":{"type":"str","required":false},"source_ip6":{"type":"str","required":false},"srcin'
+    'tf":{"type":"str","required":false},"probe_count":{"type":"int","required":false},"password":{"type":"str","required":false},"recoverytime":{"type":"i'
+    'nt","required":false},"http_match":{"type":"str","required":false},"security_mode":{"type":"str","required":false,"choices":["none","authentication"]}'
+    ',"name":{"type":"str","required":false},"class_id":{"type":"int","required":false},"route":{"type":"list","required":false,"options":{"subnet":{"type"'
+    ':"str","required":false}}},"interval":{"type":"int","required":false},"source_ip":{"type":"str","required":false},"server":{"type":"list","required":f'
+    'alse,"options":{"address":{"type":"str","required":false}}}}}'
+)
@@ -0,0 +1,59 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]},"video_signaling":{"ty'
+    'pe":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"r'
+    'evisions":[2040,2040]},"priority":{"type":"integer","revisions":[2040,2040]},"tag":{"type":"string","options":[{"value":"none","revisions":[2040,2040]'
+    '},{"value":"dot1q","revisions":[2040,2040]},{"value":"dot1p","revisions":[2040,2040]}],"revisions":[2040,2040]},"dscp":{"type":"integer","revisions":['
+    '2040,2040]},"vlan":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"streaming_video":{"type":"dict","children":{"status":{"type":'
+    '"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"priority":{"type'
+    '":"integer","revisions":[2040,2040]},"tag":{"type":"string","options":[{"value":"none","revisions":[2040,2040]},{"value":"dot1q","revisions":[2040,204'
+    '0]},{"value":"dot1p","revisions":[2040,2040]}],"revisions":[2040,2040]},"dscp":{"type":"integer","revisions":[2040,2040]},"vlan":{"type":"integer","re'
+    'visions":[2040,2040]}},"revisions":[2040,2040]},"softphone":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisi'
+    'ons":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"priority":{"type":"integer","revisions":[2040,2040]},"tag":{"t'
+    'ype":"string","options":[{"value":"none","revisions":[2040,2040]},{"value":"dot1q","revisions":[2040,2040]},{"value":"dot1p","revisions":[2040,2040]}]'
+    ',"revisions":[2040,2040]},"dscp":{"type":"integer","revisions":[2040,2040]},"vlan":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]'
+    '},"voice_signaling":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","rev'
+    'isions":[2040,2040]}],"revisions":[2040,2040]},"priority":{"type":"integer","revisions":[2040,2040]},"tag":{"type":"string","options":[{"value":"none"'
+    ',"revisions":[2040,2040]},{"value":"dot1q","revisions":[2040,2040]},{"value":"dot1p","revisions":[2040,2040]}],"revisions":[2040,2040]},"dscp":{"type"'
+    ':"integer","revisions":[2040,2040]},"vlan":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"guest_voice_signaling":{"type":"dict"'
+    ',"children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":'
+    '[2040,2040]},"priority":{"type":"integer","revisions":[2040,2040]},"tag":{"type":"string","options":[{"value":"none","revisions":[2040,2040]},{"value"'
+    ':"dot1q","revisions":[2040,2040]},{"value":"dot1p","revisions":[2040,2040]}],"revisions":[2040,2040]},"dscp":{"type":"integer","revisions":[2040,2040]'
+    '},"vlan":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"voice":{"type":"dict","children":{"status":{"type":"string","options":['
+    '{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"priority":{"type":"integer","revisio'
+    'ns":[2040,2040]},"tag":{"type":"string","options":[{"value":"none","revisions":[2040,2040]},{"value":"dot1q","revisions":[2040,2040]},{"value":"dot1p"'
+    ',"revisions":[2040,2040]}],"revisions":[2040,2040]},"dscp":{"type":"integer","revisions":[2040,2040]},"vlan":{"type":"integer","revisions":[2040,2040]'
+    '}},"revisions":[2040,2040]},"video_conferencing":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2040,'
+    '2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"priority":{"type":"integer","revisions":[2040,2040]},"tag":{"type":"strin'
+    'g","options":[{"value":"none","revisions":[2040,2040]},{"value":"dot1q","revisions":[2040,2040]},{"value":"dot1p","revisions":[2040,2040]}],"revisions'
+    '":[2040,2040]},"dscp":{"type":"integer","revisions":[2040,2040]},"vlan":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"guest":{'
+    '"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}]'
+    ',"revisions":[2040,2040]},"priority":{"type":"integer","revisions":[2040,2040]},"tag":{"type":"string","options":[{"value":"none","revisions":[2040,20'
+    '40]},{"value":"dot1q","revisions":[2040,2040]},{"value":"dot1p","revisions":[2040,2040]}],"revisions":[2040,2040]},"dscp":{"type":"integer","revisions'
+    '":[2040,2040]},"vlan":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"name":{"type":"str","required":false},"video_signaling":{"type":'
+    '"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"priority":{"type":"int","required":false},'
+    '"tag":{"type":"str","required":false,"choices":["none","dot1q","dot1p"]},"dscp":{"type":"int","required":false},"vlan":{"type":"int","required":false}'
+    '}},"streaming_video":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"priority":{"t'
+    'ype":"int","required":false},"tag":{"type":"str","required":false,"choices":["none","dot1q","dot1p"]},"dscp":{"type":"int","required":false},"vlan":{"'
+    'type":"int","required":false}}},"softphone":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","e'
+    'nable"]},"priority":{"type":"int","required":false},"tag":{"type":"str","required":false,"choices":["none","dot1q","dot1p"]},"dscp":{"type":"int","req'
+    'uired":false},"vlan":{"type":"int","required":false}}},"voice_signaling":{"type":"dict","required":false,"options":{"status":{"type":"str","required":'
+    'false,"choices":["disable","enable"]},"priority":{"type":"int","required":false},"tag":{"type":"str","required":false,"choices":["none","dot1q","dot1p'
+    '"]},"dscp":{"type":"int","required":false},"vlan":{"type":"int","required":false}}},"guest_voice_signaling":{"type":"dict","required":false,"options":'
+    '{"status":{"type":"str","required":false,"choices":["disable","enable"]},"priority":{"type":"int","required":false},"tag":{"type":"str","required":fal'
+    'se,"choices":["none","dot1q","dot1p"]},"dscp":{"type":"int","required":false},"vlan":{"type":"int","required":false}}},"voice":{"type":"dict","require'
+    'd":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"priority":{"type":"int","required":false},"tag":{"type":"'
+    'str","required":false,"choices":["none","dot1q","dot1p"]},"dscp":{"type":"int","required":false},"vlan":{"type":"int","required":false}}},"video_confe'
+    'rencing":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"priority":{"type":"int","'
+    'required":false},"tag":{"type":"str","required":false,"choices":["none","dot1q","dot1p"]},"dscp":{"type":"int","required":false},"vlan":{"type":"int",'
+    '"required":false}}},"guest":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"priori'
+    'ty":{"type":"int","required":false},"tag":{"type":"str","required":false,"choices":["none","dot1q","dot1p"]},"dscp":{"type":"int","required":false},"v'
+    'lan":{"type":"int","required":false}}}}}'
+)
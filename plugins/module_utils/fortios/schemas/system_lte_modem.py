@@ -0,0 +1,20 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"username":{"type":"string","revisions":[2047,2047]},"authtype":{"type":"string","options":[{"value":"none","revisions":[20'
+    '47,2047]},{"value":"pap","revisions":[2047,2047]},{"value":"chap","revisions":[2047,2047]}],"revisions":[2047,2047]},"holddown_timer":{"type":"integer'
+    '","revisions":[2047,2047]},"passwd":{"type":"string","revisions":[2047,2047]},"extra_init":{"type":"string","revisions":[2047,2047]},"modem_port":{"ty'
+    'pe":"integer","revisions":[2047,2047]},"apn":{"type":"string","revisions":[2047,2047]},"mode":{"type":"string","options":[{"value":"standalone","revis'
+    'ions":[2047,2047]},{"value":"redundant","revisions":[2047,2047]}],"revisions":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]}},"rev'
+    'isions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"username":{"type":"str","required"'
+    ':false},"authtype":{"type":"str","required":false,"choices":["none","pap","chap"]},"holddown_timer":{"type":"int","required":false},"passwd":{"type":"'
+    'str","required":false},"extra_init":{"type":"str","required":false},"modem_port":{"type":"int","required":false},"apn":{"type":"str","required":false}'
+    ',"mode":{"type":"str","required":false,"choices":["standalone","redundant"]},"interface":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,22 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"allow_config_restore":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"authorized_manager_only":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"di'
+    'sable","revisions":[2047,2047]}],"revisions":[2047,2047]},"allow_push_firmware":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]}'
+    ',{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"allow_collect_statistics":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"allow_push_configuration":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"serial_number":{"type":"string","revisions'
+    '":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"allow_config_restore":{"type":"str'
+    '","required":false,"choices":["enable","disable"]},"authorized_manager_only":{"type":"str","required":false,"choices":["enable","disable"]},"allow_pus'
+    'h_firmware":{"type":"str","required":false,"choices":["enable","disable"]},"allow_collect_statistics":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"allow_push_configuration":{"type":"str","required":false,"choices":["enable","disable"]},"serial_number":{"type":"str","required":fals'
+    'e}}}'
+)
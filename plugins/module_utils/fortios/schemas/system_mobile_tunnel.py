@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"tunnel_mode":{"type":"string","options":[{"value":"gre","revisions":[2047,2047]}],"revisions":[2047,2047]},"home_address":'
+    '{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"reg_interval":{"type":"integer","revisions":[2047,2047]},"'
+    'renew_interval":{"type":"integer","revisions":[2047,2047]},"reg_retry":{"type":"integer","revisions":[2047,2047]},"roaming_interface":{"type":"string"'
+    ',"revisions":[2047,2047]},"lifetime":{"type":"integer","revisions":[2047,2047]},"n_mhae_key_type":{"type":"string","options":[{"value":"ascii","revisi'
+    'ons":[2047,2047]},{"value":"base64","revisions":[2047,2047]}],"revisions":[2047,2047]},"home_agent":{"type":"string","revisions":[2047,2047]},"hash_al'
+    'gorithm":{"type":"string","options":[{"value":"hmac-md5","revisions":[2047,2047]}],"revisions":[2047,2047]},"n_mhae_spi":{"type":"integer","revisions"'
+    ':[2047,2047]},"n_mhae_key":{"type":"string","revisions":[2047,2047]},"network":{"type":"list","children":{"interface":{"type":"string","revisions":[20'
+    '47,2047]},"prefix":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2'
+    '047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"tunnel_mode":{"type":"str","requir'
+    'ed":false,"choices":["gre"]},"home_address":{"type":"str","required":false},"name":{"type":"str","required":false},"reg_interval":{"type":"int","requi'
+    'red":false},"renew_interval":{"type":"int","required":false},"reg_retry":{"type":"int","required":false},"roaming_interface":{"type":"str","required":'
+    'false},"lifetime":{"type":"int","required":false},"n_mhae_key_type":{"type":"str","required":false,"choices":["ascii","base64"]},"home_agent":{"type":'
+    '"str","required":false},"hash_algorithm":{"type":"str","required":false,"choices":["hmac-md5"]},"n_mhae_spi":{"type":"int","required":false},"n_mhae_k'
+    'ey":{"type":"str","required":false},"network":{"type":"list","required":false,"options":{"interface":{"type":"str","required":false},"prefix":{"type":'
+    '"str","required":false},"id":{"type":"int","required":false}}}}}'
+)
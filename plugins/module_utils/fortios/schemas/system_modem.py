@@ -0,0 +1,65 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"ppp_echo_request3":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"dial_cmd1":{"type":"string","revisions":[2047,2047]},"dial_cmd2":{"type":"string","revisions":[2047,2047]},"dia'
+    'l_cmd3":{"type":"string","revisions":[2047,2047]},"holddown_timer":{"type":"integer","revisions":[2047,2047]},"username1":{"type":"string","revisions"'
+    ':[2047,2047]},"dial_on_demand":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"redial":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"1","revisions":[2047,2047]},{"value":"2"'
+    ',"revisions":[2047,2047]},{"value":"3","revisions":[2047,2047]},{"value":"4","revisions":[2047,2047]},{"value":"5","revisions":[2047,2047]},{"value":"'
+    '6","revisions":[2047,2047]},{"value":"7","revisions":[2047,2047]},{"value":"8","revisions":[2047,2047]},{"value":"9","revisions":[2047,2047]},{"value"'
+    ':"10","revisions":[2047,2047]}],"revisions":[2047,2047]},"extra_init3":{"type":"string","revisions":[2047,2047]},"pin_init":{"type":"string","revision'
+    's":[2047,2047]},"priority":{"type":"integer","revisions":[2047,2047]},"auto_dial":{"type":"string","options":[{"value":"enable","revisions":[2047,2047'
+    ']},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"altmode":{"type":"string","options":[{"value":"enable","revisions":[2047,204'
+    '7]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dont_send_CR3":{"type":"string","options":[{"value":"enable","revisions":[2'
+    '047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dont_send_CR2":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dont_send_CR1":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"mode":{"type":"string","options":[{"value":"standalone'
+    '","revisions":[2047,2047]},{"value":"redundant","revisions":[2047,2047]}],"revisions":[2047,2047]},"peer_modem2":{"type":"string","options":[{"value":'
+    '"generic","revisions":[2047,2047]},{"value":"actiontec","revisions":[2047,2047]},{"value":"ascend_TNT","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"peer_modem3":{"type":"string","options":[{"value":"generic","revisions":[2047,2047]},{"value":"actiontec","revisions":[2047,2047]},{"value":"asce'
+    'nd_TNT","revisions":[2047,2047]}],"revisions":[2047,2047]},"peer_modem1":{"type":"string","options":[{"value":"generic","revisions":[2047,2047]},{"val'
+    'ue":"actiontec","revisions":[2047,2047]},{"value":"ascend_TNT","revisions":[2047,2047]}],"revisions":[2047,2047]},"phone2":{"type":"string","revisions'
+    '":[2047,2047]},"phone3":{"type":"string","revisions":[2047,2047]},"phone1":{"type":"string","revisions":[2047,2047]},"extra_init2":{"type":"string","r'
+    'evisions":[2047,2047]},"username3":{"type":"string","revisions":[2047,2047]},"extra_init1":{"type":"string","revisions":[2047,2047]},"lockdown_lac":{"'
+    'type":"string","revisions":[2047,2047]},"ppp_echo_request1":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]},"traffic_check":{"type":"string","options":[{'
+    '"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"passwd1":{"type":"string","revisions"'
+    ':[2047,2047]},"passwd3":{"type":"string","revisions":[2047,2047]},"wireless_port":{"type":"integer","revisions":[2047,2047]},"reset":{"type":"integer"'
+    ',"revisions":[2047,2047]},"distance":{"type":"integer","revisions":[2047,2047]},"network_init":{"type":"string","revisions":[2047,2047]},"username2":{'
+    '"type":"string","revisions":[2047,2047]},"authtype3":{"multiple_values":true,"type":"list","options":[{"value":"pap","revisions":[2047,2047]},{"value"'
+    ':"chap","revisions":[2047,2047]},{"value":"mschap","revisions":[2047,2047]},{"value":"mschapv2","revisions":[2047,2047]}],"revisions":[2047,2047]},"au'
+    'thtype2":{"multiple_values":true,"type":"list","options":[{"value":"pap","revisions":[2047,2047]},{"value":"chap","revisions":[2047,2047]},{"value":"m'
+    'schap","revisions":[2047,2047]},{"value":"mschapv2","revisions":[2047,2047]}],"revisions":[2047,2047]},"authtype1":{"multiple_values":true,"type":"lis'
+    't","options":[{"value":"pap","revisions":[2047,2047]},{"value":"chap","revisions":[2047,2047]},{"value":"mschap","revisions":[2047,2047]},{"value":"ms'
+    'chapv2","revisions":[2047,2047]}],"revisions":[2047,2047]},"connect_timeout":{"type":"integer","revisions":[2047,2047]},"ppp_echo_request2":{"type":"s'
+    'tring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"idle_timer":{"type'
+    '":"integer","revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"dial","revisions":[2047,2047]},{"value":"stop","revisions":[2047,2'
+    '047]},{"value":"none","revisions":[2047,2047]}],"revisions":[2047,2047]},"passwd2":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"ppp_echo_request3":{"type":"str","'
+    'required":false,"choices":["enable","disable"]},"dial_cmd1":{"type":"str","required":false},"dial_cmd2":{"type":"str","required":false},"dial_cmd3":{"'
+    'type":"str","required":false},"holddown_timer":{"type":"int","required":false},"username1":{"type":"str","required":false},"dial_on_demand":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"redial":{"type":"str","required":false,"choices":["none","1","2","3","4","5","6","7","8","9","10'
+    '"]},"extra_init3":{"type":"str","required":false},"pin_init":{"type":"str","required":false},"priority":{"type":"int","required":false},"auto_dial":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"altmode":{"type":"str","required":false,"choices":["enable","disable"]},"dont_send_CR3":'
+    '{"type":"str","required":false,"choices":["enable","disable"]},"dont_send_CR2":{"type":"str","required":false,"choices":["enable","disable"]},"dont_se'
+    'nd_CR1":{"type":"str","required":false,"choices":["enable","disable"]},"mode":{"type":"str","required":false,"choices":["standalone","redundant"]},"pe'
+    'er_modem2":{"type":"str","required":false,"choices":["generic","actiontec","ascend_TNT"]},"peer_modem3":{"type":"str","required":false,"choices":["gen'
+    'eric","actiontec","ascend_TNT"]},"peer_modem1":{"type":"str","required":false,"choices":["generic","actiontec","ascend_TNT"]},"phone2":{"type":"str","'
+    'required":false},"phone3":{"type":"str","required":false},"phone1":{"type":"str","required":false},"extra_init2":{"type":"str","required":false},"user'
+    'name3":{"type":"str","required":false},"extra_init1":{"type":"str","required":false},"lockdown_lac":{"type":"str","required":false},"ppp_echo_request1'
+    '":{"type":"str","required":false,"choices":["enable","disable"]},"interface":{"type":"str","required":false},"traffic_check":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"passwd1":{"type":"str","required":false},"passwd3":{"type":"str","required":false},"wireless_port":{"type":"int'
+    '","required":false},"reset":{"type":"int","required":false},"distance":{"type":"int","required":false},"network_init":{"type":"str","required":false},'
+    '"username2":{"type":"str","required":false},"authtype3":{"type":"list","required":false,"choices":["pap","chap","mschap","mschapv2"]},"authtype2":{"ty'
+    'pe":"list","required":false,"choices":["pap","chap","mschap","mschapv2"]},"authtype1":{"type":"list","required":false,"choices":["pap","chap","mschap"'
+    ',"mschapv2"]},"connect_timeout":{"type":"int","required":false},"ppp_echo_request2":{"type":"str","required":false,"choices":["enable","disable"]},"id'
+    'le_timer":{"type":"int","required":false},"action":{"type":"str","required":false,"choices":["dial","stop","none"]},"passwd2":{"type":"str","required"'
+    ':false}}}'
+)
@@ -0,0 +1,22 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"nat64_prefix":{"type":"string","revisions":[2047,2047]},"secondary_prefix_status":{"type":"string","options":[{"value":"en'
+    'able","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"secondary_prefix":{"type":"list","children":{"na'
+    't64_prefix":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"always_synthesize_aa'
+    'aa_record":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"nat46_force_ipv4_packet_forwarding":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"generate_ipv6_fragment_header":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"nat64_prefix":{"type":"str","requi'
+    'red":false},"secondary_prefix_status":{"type":"str","required":false,"choices":["enable","disable"]},"secondary_prefix":{"type":"list","required":fals'
+    'e,"options":{"nat64_prefix":{"type":"str","required":false},"name":{"type":"str","required":false}}},"always_synthesize_aaaa_record":{"type":"str","re'
+    'quired":false,"choices":["enable","disable"]},"nat46_force_ipv4_packet_forwarding":{"type":"str","required":false,"choices":["enable","disable"]},"gen'
+    'erate_ipv6_fragment_header":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"template_tx_counter":{"type":"integer","revisions":[2047,2047]},"inactive_flow_timeout":{"type":"integer","revisions":[204'
+    '7,2047]},"collector_ip":{"type":"string","revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2047,2047]},"template_tx_timeout":{"type":'
+    '"integer","revisions":[2047,2047]},"collector_port":{"type":"integer","revisions":[2047,2047]},"active_flow_timeout":{"type":"integer","revisions":[20'
+    '47,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"template_tx_counter":{"type":"int","required":false},"inactive_flow_timeout":{"type":"int","required":fals'
+    'e},"collector_ip":{"type":"str","required":false},"source_ip":{"type":"str","required":false},"template_tx_timeout":{"type":"int","required":false},"c'
+    'ollector_port":{"type":"int","required":false},"active_flow_timeout":{"type":"int","required":false}}}'
+)
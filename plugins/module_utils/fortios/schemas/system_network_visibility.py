@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"hostname_ttl":{"type":"integer","revisions":[2047,2047]},"source_location":{"type":"string","options":[{"value":"disable",'
+    '"revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"destination_hostname_visibility":{"type":"string","opti'
+    'ons":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"hostname_limit":{"type":"integ'
+    'er","revisions":[2047,2047]},"destination_visibility":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"destination_location":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"'
+    'enable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"hostname_ttl":{"type":"int","required":false},"source_location":{"type":"str","required":false,"choices":['
+    '"disable","enable"]},"destination_hostname_visibility":{"type":"str","required":false,"choices":["disable","enable"]},"hostname_limit":{"type":"int","'
+    'required":false},"destination_visibility":{"type":"str","required":false,"choices":["disable","enable"]},"destination_location":{"type":"str","require'
+    'd":false,"choices":["disable","enable"]}}}'
+)
@@ -0,0 +1,104 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"ipsec_ob_hash_function":{"type":"string","options":[{"value":"global-hash'
+    '","revisions":[1919,1919]},{"value":"round-robin-global","revisions":[1919,1919]}],"revisions":[2047,1919]},"hpe":{"type":"dict","children":{"udp_max"'
+    ':{"type":"integer","revisions":[2047,2047]},"tcpfin_rst_max":{"type":"integer","revisions":[1024,1024]},"sctp_max":{"type":"integer","revisions":[2047'
+    ',2047]},"ip_frag_max":{"type":"integer","revisions":[2047,2047]},"esp_max":{"type":"integer","revisions":[2047,2047]},"enable_shaper":{"type":"string"'
+    ',"options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"tcpsyn_ack_max":{"type":'
+    '"integer","revisions":[1024,1024]},"tcpsyn_max":{"type":"integer","revisions":[2047,2047]},"pri_type_max":{"type":"integer","revisions":[2047,2045]},"'
+    'icmp_max":{"type":"integer","revisions":[2047,2047]},"tcp_max":{"type":"integer","revisions":[2047,2047]},"l2_others_max":{"type":"integer","revisions'
+    '":[2047,2047]},"ip_others_max":{"type":"integer","revisions":[2047,2047]},"arp_max":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047'
+    ']},"garbage_session_collector":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"session_timeout_interval":{"type":"integer","revisions":[2047,2047]},"fp_anomaly":{"type":"dict","children":{"ipv4_unknopt":{"t'
+    'ype":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"icmp_csum_err":{"type":"string","options":[{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"tcp_fin_only":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revis'
+    'ions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"tcp_syn_fin":{"type":"string","options":[{"value":"allo'
+    'w","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv4_'
+    'optrr":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"ipv4_optlsrr":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revis'
+    'ions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv4_proto_err":{"type":"string","options":[{"value":"a'
+    'llow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip'
+    'v6_proto_err":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","'
+    'revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv4_opttimestamp":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"'
+    'drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_opthomeaddr":{"type":"string","options'
+    '":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"ipv4_land":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-t'
+    'o-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv4_csum_err":{"type":"string","options":[{"value":"drop","revisions":[2047,2047]},{"valu'
+    'e":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_optnsap":{"type":"string","options":[{"value":"allow","revisions":[2047,204'
+    '7]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"tcp_csum_err":{"type":"string'
+    '","options":[{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"udp_land":{"type":"s'
+    'tring","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"icmp_land":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{'
+    '"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"tcp_syn_data":{"type":"string","options":[{"value":"allow","revisions":[204'
+    '7,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_optinvld":{"type":"'
+    'string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"ipv6_daddr_err":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,20'
+    '47]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv4_optsecurity":{"type":"string","options":[{"value":"allow","revis'
+    'ions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_unknopt":'
+    '{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"ipv6_land":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[204'
+    '7,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_optendpid":{"type":"string","options":[{"value":"allow","rev'
+    'isions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_optrale'
+    'rt":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"tcp_land":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":['
+    '2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"udp_csum_err":{"type":"string","options":[{"value":"drop","rev'
+    'isions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"tcp_winnuke":{"type":"string","options":[{"value":"al'
+    'low","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv'
+    '6_saddr_err":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]},"tcp_fin_noack":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop"'
+    ',"revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"tcp_no_flag":{"type":"string","options":[{"value'
+    '":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"ipv6_optjumbo":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv4_optstream":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"'
+    'drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]},"icmp_frag":{"type":"string","options":[{"va'
+    'lue":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"ipv4_optssrr":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"drop","revisions":[2047,2047]},{"value":"trap-to-ho'
+    'st","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_opttunnel":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value"'
+    ':"drop","revisions":[2047,2047]},{"value":"trap-to-host","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"session_timeout'
+    '_fixed":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"'
+    'session_timeout_random_range":{"type":"integer","revisions":[2047,2047]},"per_session_accounting":{"type":"string","options":[{"value":"disable","revi'
+    'sions":[2047,2047]},{"value":"traffic-log-only","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipsec_o'
+    'utbound_hash":{"type":"string","options":[{"value":"disable","revisions":[1919,1919]},{"value":"enable","revisions":[1919,1919]}],"revisions":[2047,19'
+    '19]},"low_latency_mode":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"session_collector_interval":{"type":"integer","revisions":[2047,2047]},"fastpath":{"type":"string","options":[{"value":"disable","revi'
+    'sions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"ipsec_ob_hash_function":{"type":"str","required":false},"hpe":{"typ'
+    'e":"dict","required":false,"options":{"udp_max":{"type":"int","required":false},"tcpfin_rst_max":{"type":"int","required":false},"sctp_max":{"type":"i'
+    'nt","required":false},"ip_frag_max":{"type":"int","required":false},"esp_max":{"type":"int","required":false},"enable_shaper":{"type":"str","required"'
+    ':false,"choices":["disable","enable"]},"tcpsyn_ack_max":{"type":"int","required":false},"tcpsyn_max":{"type":"int","required":false},"pri_type_max":{"'
+    'type":"int","required":false},"icmp_max":{"type":"int","required":false},"tcp_max":{"type":"int","required":false},"l2_others_max":{"type":"int","requ'
+    'ired":false},"ip_others_max":{"type":"int","required":false},"arp_max":{"type":"int","required":false}}},"garbage_session_collector":{"type":"str","re'
+    'quired":false,"choices":["disable","enable"]},"session_timeout_interval":{"type":"int","required":false},"fp_anomaly":{"type":"dict","required":false,'
+    '"options":{"ipv4_unknopt":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"icmp_csum_err":{"type":"str","required":false,"ch'
+    'oices":["drop","trap-to-host"]},"tcp_fin_only":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"tcp_syn_fin":{"type":"str","'
+    'required":false,"choices":["allow","drop","trap-to-host"]},"ipv4_optrr":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"ipv'
+    '4_optlsrr":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"ipv4_proto_err":{"type":"str","required":false,"choices":["allow'
+    '","drop","trap-to-host"]},"ipv6_proto_err":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"ipv4_opttimestamp":{"type":"str"'
+    ',"required":false,"choices":["allow","drop","trap-to-host"]},"ipv6_opthomeaddr":{"type":"str","required":false,"choices":["allow","drop","trap-to-host'
+    '"]},"ipv4_land":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"ipv4_csum_err":{"type":"str","required":false,"choices":["d'
+    'rop","trap-to-host"]},"ipv6_optnsap":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"tcp_csum_err":{"type":"str","required"'
+    ':false,"choices":["drop","trap-to-host"]},"udp_land":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"icmp_land":{"type":"st'
+    'r","required":false,"choices":["allow","drop","trap-to-host"]},"tcp_syn_data":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]'
+    '},"ipv6_optinvld":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"ipv6_daddr_err":{"type":"str","required":false,"choices":'
+    '["allow","drop","trap-to-host"]},"ipv4_optsecurity":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"ipv6_unknopt":{"type":"'
+    'str","required":false,"choices":["allow","drop","trap-to-host"]},"ipv6_land":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]}'
+    ',"ipv6_optendpid":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"ipv6_optralert":{"type":"str","required":false,"choices":'
+    '["allow","drop","trap-to-host"]},"tcp_land":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"udp_csum_err":{"type":"str","re'
+    'quired":false,"choices":["drop","trap-to-host"]},"tcp_winnuke":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"ipv6_saddr_e'
+    'rr":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"tcp_fin_noack":{"type":"str","required":false,"choices":["allow","drop"'
+    ',"trap-to-host"]},"tcp_no_flag":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"ipv6_optjumbo":{"type":"str","required":fal'
+    'se,"choices":["allow","drop","trap-to-host"]},"ipv4_optstream":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"icmp_frag":{'
+    '"type":"str","required":false,"choices":["allow","drop","trap-to-host"]},"ipv4_optssrr":{"type":"str","required":false,"choices":["allow","drop","trap'
+    '-to-host"]},"ipv6_opttunnel":{"type":"str","required":false,"choices":["allow","drop","trap-to-host"]}}},"session_timeout_fixed":{"type":"str","requir'
+    'ed":false,"choices":["disable","enable"]},"session_timeout_random_range":{"type":"int","required":false},"per_session_accounting":{"type":"str","requi'
+    'red":false,"choices":["disable","traffic-log-only","enable"]},"ipsec_outbound_hash":{"type":"str","required":false},"low_latency_mode":{"type":"str","'
+    'required":false,"choices":["disable","enable"]},"session_collector_interval":{"type":"int","required":false},"fastpath":{"type":"str","required":false'
+    ',"choices":["disable","enable"]}}}'
+)
@@ -0,0 +1,59 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"session_denied_offload":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisio'
+    'ns":[1024,1024]}],"revisions":[1024,1024]},"rdp_offload":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"ipsec_over_vlink":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"di'
+    'sable","revisions":[2047,2047]}],"revisions":[2047,2047]},"intf_shaping_offload":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]'
+    '},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"uesp_offload":{"type":"string","options":[{"value":"enable","revisions":[1024'
+    ',1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"ipsec_dec_subengine_mask":{"type":"string","revisions":[2047,2047]},"gt'
+    'p_enhanced_cpu_range":{"type":"string","options":[{"value":"0","revisions":[2047,2047]},{"value":"1","revisions":[2047,2047]},{"value":"2","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"dedicated_management_cpu":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"di'
+    'sable","revisions":[2047,2047]}],"revisions":[2047,2047]},"lag_out_port_select":{"type":"string","options":[{"value":"disable","revisions":[1912,1912]'
+    '},{"value":"enable","revisions":[1912,1912]}],"revisions":[2040,1912]},"ipsec_mtu_override":{"type":"string","options":[{"value":"disable","revisions"'
+    ':[1608,1608]},{"value":"enable","revisions":[1608,1608]}],"revisions":[2040,1608]},"isf_np_queues":{"type":"dict","children":{"cos7":{"type":"string",'
+    '"revisions":[128,128]},"cos6":{"type":"string","revisions":[128,128]},"cos5":{"type":"string","revisions":[128,128]},"cos4":{"type":"string","revision'
+    's":[128,128]},"cos3":{"type":"string","revisions":[128,128]},"cos2":{"type":"string","revisions":[128,128]},"cos1":{"type":"string","revisions":[128,1'
+    '28]},"cos0":{"type":"string","revisions":[128,128]}},"revisions":[1920,128]},"strip_clear_text_padding":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sse_backpressure":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"mcast_session_accounting":{"type":"string","'
+    'options":[{"value":"tpe-based","revisions":[1645,1645]},{"value":"session-based","revisions":[1645,1645]},{"value":"disable","revisions":[1645,1645]}]'
+    ',"revisions":[2047,1645]},"ipsec_inbound_cache":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":'
+    '[2040,2040]}],"revisions":[2040,2040]},"fastpath":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"capwap_offload":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]},"priority_protocol":{"type":"dict","children":{"bgp":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[2045,2045]},{"value":"disable","revisions":[2045,2045]}],"revisions":[2045,2045]},"slbc":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[2045,2045]},{"value":"disable","revisions":[2045,2045]}],"revisions":[2045,2045]},"bfd":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2045,2045]},{"value":"disable","revisions":[2045,2045]}],"revisions":[2045,2045]}},"revisions":[2047,2045]},"sw_np_bandwidth":{"type":"string","'
+    'options":[{"value":"0G","revisions":[2040,2040]},{"value":"2G","revisions":[2040,2040]},{"value":"4G","revisions":[2040,2040]},{"value":"5G","revision'
+    's":[2040,2040]},{"value":"6G","revisions":[2040,2040]}],"revisions":[2040,2040]},"strip_esp_padding":{"type":"string","options":[{"value":"enable","re'
+    'visions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"port_npu_map":{"type":"list","children":{"interface":{"ty'
+    'pe":"string","revisions":[1919,1919]},"npu_group_index":{"type":"integer","revisions":[1919,1919]}},"revisions":[2047,1919]},"port_cpu_map":{"type":"l'
+    'ist","children":{"interface":{"type":"string","revisions":[128,128]},"cpu_core":{"type":"string","revisions":[128,128]}},"revisions":[1920,128]},"gtp_'
+    'enhanced_mode":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"ipsec_enc_subengine_mask":{"type":"string","revisions":[2047,2047]},"qos_mode":{"type":"string","options":[{"value":"disable","revisions":[128,'
+    '128]},{"value":"priority","revisions":[128,128]},{"value":"round-robin","revisions":[128,128]}],"revisions":[1920,128]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"session_denied_offload":{"type":"str","required":false,"choices":["disable","enable"]},"rdp_offload":{"typ'
+    'e":"str","required":false,"choices":["enable","disable"]},"ipsec_over_vlink":{"type":"str","required":false,"choices":["enable","disable"]},"intf_shap'
+    'ing_offload":{"type":"str","required":false,"choices":["enable","disable"]},"uesp_offload":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"ipsec_dec_subengine_mask":{"type":"str","required":false},"gtp_enhanced_cpu_range":{"type":"str","required":false,"choices":["0","1","2"]},"dedic'
+    'ated_management_cpu":{"type":"str","required":false,"choices":["enable","disable"]},"lag_out_port_select":{"type":"str","required":false},"ipsec_mtu_o'
+    'verride":{"type":"str","required":false},"isf_np_queues":{"type":"dict","required":false,"options":{"cos7":{"type":"str","required":false},"cos6":{"ty'
+    'pe":"str","required":false},"cos5":{"type":"str","required":false},"cos4":{"type":"str","required":false},"cos3":{"type":"str","required":false},"cos2'
+    '":{"type":"str","required":false},"cos1":{"type":"str","required":false},"cos0":{"type":"str","required":false}}},"strip_clear_text_padding":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"sse_backpressure":{"type":"str","required":false,"choices":["enable","disable"]},"mcast_session'
+    '_accounting":{"type":"str","required":false},"ipsec_inbound_cache":{"type":"str","required":false,"choices":["enable","disable"]},"fastpath":{"type":"'
+    'str","required":false,"choices":["disable","enable"]},"capwap_offload":{"type":"str","required":false,"choices":["enable","disable"]},"priority_protoc'
+    'ol":{"type":"dict","required":false,"options":{"bgp":{"type":"str","required":false,"choices":["enable","disable"]},"slbc":{"type":"str","required":fa'
+    'lse,"choices":["enable","disable"]},"bfd":{"type":"str","required":false,"choices":["enable","disable"]}}},"sw_np_bandwidth":{"type":"str","required":'
+    'false,"choices":["0G","2G","4G","5G","6G"]},"strip_esp_padding":{"type":"str","required":false,"choices":["enable","disable"]},"port_npu_map":{"type":'
+    '"list","required":false,"options":{"interface":{"type":"str","required":false},"npu_group_index":{"type":"int","required":false}}},"port_cpu_map":{"ty'
+    'pe":"list","required":false,"options":{"interface":{"type":"str","required":false},"cpu_core":{"type":"str","required":false}}},"gtp_enhanced_mode":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"ipsec_enc_subengine_mask":{"type":"str","required":false},"qos_mode":{"type":"str","requ'
+    'ired":false}}}'
+)
@@ -0,0 +1,32 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"ntpserver":{"type":"list","children":{"ntpv3":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"val'
+    'ue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"server":{"type":"string","revisions":[2047,2047]},"authentication":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"interface_select_method":'
+    '{"type":"string","options":[{"value":"auto","revisions":[1768,1768]},{"value":"sdwan","revisions":[1768,1768]},{"value":"specify","revisions":[1768,17'
+    '68]}],"revisions":[2040,1768]},"key":{"type":"string","revisions":[2047,2047]},"interface":{"type":"string","revisions":[2040,1768]},"key_id":{"type":'
+    '"integer","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"source_ip":{"type":"string","revisions":'
+    '[2047,2047]},"server_mode":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisi'
+    'ons":[2047,2047]},"key_type":{"type":"string","options":[{"value":"MD5","revisions":[2040,2040]},{"value":"SHA1","revisions":[2040,2040]}],"revisions"'
+    ':[2040,2040]},"interface":{"type":"list","children":{"interface_name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"authenticat'
+    'ion":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"sou'
+    'rce_ip6":{"type":"string","revisions":[2047,2047]},"key":{"type":"string","revisions":[2040,2040]},"ntpsync":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"key_id":{"type":"integer","revisions":[2040,2040]'
+    '},"syncinterval":{"type":"integer","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"fortiguard","revisions":[2047,2047]},{"value"'
+    ':"custom","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"ntpserver":{"type":"list","required":false,"options":{"ntpv3":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"server":{"type":"str","required":false},"authentication":{"type":"str","required":false,"choices":["enable","disable"]},"interface'
+    '_select_method":{"type":"str","required":false},"key":{"type":"str","required":false},"interface":{"type":"str","required":false},"key_id":{"type":"in'
+    't","required":false},"id":{"type":"int","required":false}}},"source_ip":{"type":"str","required":false},"server_mode":{"type":"str","required":false,"'
+    'choices":["enable","disable"]},"key_type":{"type":"str","required":false,"choices":["MD5","SHA1"]},"interface":{"type":"list","required":false,"option'
+    's":{"interface_name":{"type":"str","required":false}}},"authentication":{"type":"str","required":false,"choices":["enable","disable"]},"source_ip6":{"'
+    'type":"str","required":false},"key":{"type":"str","required":false},"ntpsync":{"type":"str","required":false,"choices":["enable","disable"]},"key_id":'
+    '{"type":"int","required":false},"syncinterval":{"type":"int","required":false},"type":{"type":"str","required":false,"choices":["fortiguard","custom"]'
+    '}}}'
+)
@@ -0,0 +1,20 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"category":{"type":"string","revisions":[2047,2047]},"multiple":{"type":"string","options":[{"value":"enable","revisions":['
+    '2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"tags":{"type":"list","children":{"name":{"type":"string","revisions'
+    '":[2047,2047]}},"revisions":[2047,2047]},"color":{"type":"integer","revisions":[2047,2047]},"interface":{"type":"string","options":[{"value":"disable"'
+    ',"revisions":[2047,2047]},{"value":"mandatory","revisions":[2047,2047]},{"value":"optional","revisions":[2047,2047]}],"revisions":[2047,2047]},"addres'
+    's":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"mandatory","revisions":[2047,2047]},{"value":"optional","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"device":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"mandatory","revis'
+    'ions":[2047,2047]},{"value":"optional","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"category":{"type":"str","required":false},"multiple":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]},"tags":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"color":{"type":"int","required":false},"interfac'
+    'e":{"type":"str","required":false,"choices":["disable","mandatory","optional"]},"address":{"type":"str","required":false,"choices":["disable","mandato'
+    'ry","optional"]},"device":{"type":"str","required":false,"choices":["disable","mandatory","optional"]}}}'
+)
@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"min_change_characters":{"type":"integer","revisions":[1024,1024]},"min_upper_case_letter":{"type":"integer","revisions":[2'
+    '047,2047]},"expire_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisi'
+    'ons":[2047,2047]},"min_lower_case_letter":{"type":"integer","revisions":[2047,2047]},"min_non_alphanumeric":{"type":"integer","revisions":[2047,2047]}'
+    ',"expire_day":{"type":"integer","revisions":[2047,2047]},"minimum_length":{"type":"integer","revisions":[2047,2047]},"min_number":{"type":"integer","r'
+    'evisions":[2047,2047]},"apply_to":{"multiple_values":true,"type":"list","options":[{"value":"guest-admin-password","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"change_4_characters":{"type":"string","options":[{"value":"enable","revisions":[1023,1023]},{"value":"disable","revisions":[1023,1023'
+    ']}],"revisions":[2047,1023]},"reuse_password":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"min_change_characters":{"type":"in'
+    't","required":false},"min_upper_case_letter":{"type":"int","required":false},"expire_status":{"type":"str","required":false,"choices":["enable","disab'
+    'le"]},"min_lower_case_letter":{"type":"int","required":false},"min_non_alphanumeric":{"type":"int","required":false},"expire_day":{"type":"int","requi'
+    'red":false},"minimum_length":{"type":"int","required":false},"min_number":{"type":"int","required":false},"apply_to":{"type":"list","required":false,"'
+    'choices":["guest-admin-password"]},"change_4_characters":{"type":"str","required":false},"reuse_password":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]}}}'
+)
@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"age_enable":{"type":"string","options":[{"value":"enable","revisions":[1919,1919]},{"value":"disable","revisions":[1919,19'
+    '19]}],"revisions":[1919,1919]},"name":{"type":"string","revisions":[1919,1919]},"age_val":{"type":"integer","revisions":[1919,1919]},"port":{"type":"l'
+    'ist","children":{"status":{"type":"string","options":[{"value":"up","revisions":[23,23]},{"value":"down","revisions":[23,23]}],"revisions":[23,23]},"s'
+    'peed":{"type":"string","options":[{"value":"auto","revisions":[23,23]},{"value":"10full","revisions":[23,23]},{"value":"10half","revisions":[23,23]},{'
+    '"value":"100full","revisions":[23,23]},{"value":"100half","revisions":[23,23]},{"value":"1000full","revisions":[23,23]},{"value":"1000half","revisions'
+    '":[23,23]},{"value":"1000auto","revisions":[23,23]},{"value":"10000full","revisions":[23,23]},{"value":"10000auto","revisions":[23,23]},{"value":"4000'
+    '0full","revisions":[23,23]},{"value":"100Gfull","revisions":[23,23]}],"revisions":[23,23]},"name":{"type":"string","revisions":[23,23]}},"revisions":['
+    '1919,23]}},"revisions":[1919,1919]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"age_enable":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required"'
+    ':false},"age_val":{"type":"int","required":false},"port":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":'
+    '["up","down"]},"speed":{"type":"str","required":false,"choices":["auto","10full","10half","100full","100half","1000full","1000half","1000auto","10000f'
+    'ull","10000auto","40000full","100Gfull"]},"name":{"type":"str","required":false}}}}}'
+)
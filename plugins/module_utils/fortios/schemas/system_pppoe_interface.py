@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"username":{"type":"string","revisions":[2047,2047]},"auth_type":{"type":"string","options":[{"value":"auto","revisions":[2'
+    '047,2047]},{"value":"pap","revisions":[2047,2047]},{"value":"chap","revisions":[2047,2047]},{"value":"mschapv1","revisions":[2047,2047]},{"value":"msc'
+    'hapv2","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"disc_retry_timeout":{"type":"integer","rev'
+    'isions":[2047,2047]},"service_name":{"type":"string","revisions":[2047,2047]},"ipunnumbered":{"type":"string","revisions":[2047,2047]},"ac_name":{"typ'
+    'e":"string","revisions":[2047,2047]},"device":{"type":"string","revisions":[2047,2047]},"idle_timeout":{"type":"integer","revisions":[2047,2047]},"lcp'
+    '_echo_interval":{"type":"integer","revisions":[2047,2047]},"ipv6":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"dis'
+    'able","revisions":[2047,2047]}],"revisions":[2047,2047]},"padt_retry_timeout":{"type":"integer","revisions":[2047,2047]},"pppoe_unnumbered_negotiate":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dial_on_'
+    'demand":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"'
+    'password":{"type":"string","revisions":[2047,2047]},"lcp_max_echo_fails":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"username":{"type":"str","required":false},"auth_type":{"type":"str","required":false,"choices":["auto","pa'
+    'p","chap","mschapv1","mschapv2"]},"name":{"type":"str","required":false},"disc_retry_timeout":{"type":"int","required":false},"service_name":{"type":"'
+    'str","required":false},"ipunnumbered":{"type":"str","required":false},"ac_name":{"type":"str","required":false},"device":{"type":"str","required":fals'
+    'e},"idle_timeout":{"type":"int","required":false},"lcp_echo_interval":{"type":"int","required":false},"ipv6":{"type":"str","required":false,"choices":'
+    '["enable","disable"]},"padt_retry_timeout":{"type":"int","required":false},"pppoe_unnumbered_negotiate":{"type":"str","required":false,"choices":["ena'
+    'ble","disable"]},"dial_on_demand":{"type":"str","required":false,"choices":["enable","disable"]},"password":{"type":"str","required":false},"lcp_max_e'
+    'cho_fails":{"type":"int","required":false}}}'
+)
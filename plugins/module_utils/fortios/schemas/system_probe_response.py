@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"security_mode":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"authentication","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"http_probe_value":{"type":"string","revisions":[2047,2047]},"ttl_mode":{"type":"string","options":[{"value":"r'
+    'einit","revisions":[2047,2047]},{"value":"decrease","revisions":[2047,2047]},{"value":"retain","revisions":[2047,2047]}],"revisions":[2047,2047]},"mod'
+    'e":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"http-probe","revisions":[2047,2047]},{"value":"twamp","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"timeout":{"type":"integer","revisions":[2047,2047]},"password":{"type":"string","revisions":[2047,2047]},"port":'
+    '{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"security_mode":{"type":"str","required":false,"choices":["none","authentication"]},"http_probe_value":{"ty'
+    'pe":"str","required":false},"ttl_mode":{"type":"str","required":false,"choices":["reinit","decrease","retain"]},"mode":{"type":"str","required":false,'
+    '"choices":["none","http-probe","twamp"]},"timeout":{"type":"int","required":false},"password":{"type":"str","required":false},"port":{"type":"int","re'
+    'quired":false}}}'
+)
@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"interface":{"type":"string","revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"end_ip":{"type":"stri'
+    'ng","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"interface":{"type":"str","required":false},"ip":{"type":"str","required":false},"end_ip":{"type":"str","re'
+    'quired":false},"id":{"type":"int","required":false}}}'
+)
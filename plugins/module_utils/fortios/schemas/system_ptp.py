@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}'
+    '],"revisions":[2040,2040]},"interface":{"type":"string","revisions":[2040,2040]},"request_interval":{"type":"integer","revisions":[2040,2040]},"mode":'
+    '{"type":"string","options":[{"value":"multicast","revisions":[2040,2040]},{"value":"hybrid","revisions":[2040,2040]}],"revisions":[2040,2040]},"delay_'
+    'mechanism":{"type":"string","options":[{"value":"E2E","revisions":[2040,2040]},{"value":"P2P","revisions":[2040,2040]}],"revisions":[2040,2040]}},"rev'
+    'isions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"interface":{"type":"str","required'
+    '":false},"request_interval":{"type":"int","required":false},"mode":{"type":"str","required":false,"choices":["multicast","hybrid"]},"delay_mechanism":'
+    '{"type":"str","required":false,"choices":["E2E","P2P"]}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"buffer":{"type":"string","revisions":[1024,1024]},"header":{"type":"string","options":[{"value":"none","revisions":[1024,1'
+    '024]},{"value":"http","revisions":[1024,1024]},{"value":"8bit","revisions":[1024,1024]}],"revisions":[1024,1024]},"msg_type":{"type":"string","revisio'
+    'ns":[1024,1024]},"format":{"type":"string","options":[{"value":"none","revisions":[1024,1024]},{"value":"text","revisions":[1024,1024]},{"value":"html'
+    '","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","'
+    '8bit"]},"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","text","html"]}}}'
+)
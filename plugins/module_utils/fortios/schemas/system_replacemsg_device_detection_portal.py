@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"buffer":{"type":"string","revisions":[383,383]},"header":{"type":"string","options":[{"value":"none","revisions":[383,383]'
+    '},{"value":"http","revisions":[383,383]},{"value":"8bit","revisions":[383,383]}],"revisions":[383,383]},"msg_type":{"type":"string","revisions":[383,3'
+    '83]},"format":{"type":"string","options":[{"value":"none","revisions":[383,383]},{"value":"text","revisions":[383,383]},{"value":"html","revisions":[3'
+    '83,383]},{"value":"wml","revisions":[383,127]}],"revisions":[383,383]}},"revisions":[383,383]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","'
+    '8bit"]},"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"buffer":{"type":"string","revisions":[7,7]},"header":{"type":"string","options":[{"value":"none","revisions":[7,7]},{"valu'
+    'e":"http","revisions":[7,7]},{"value":"8bit","revisions":[7,7]}],"revisions":[7,7]},"msg_type":{"type":"string","revisions":[7,7]},"format":{"type":"s'
+    'tring","options":[{"value":"none","revisions":[7,7]},{"value":"text","revisions":[7,7]},{"value":"html","revisions":[7,7]},{"value":"wml","revisions":'
+    '[7,7]}],"revisions":[7,7]}},"revisions":[7,7]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","'
+    '8bit"]},"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"buffer":{"type":"string","revisions":[2047,2047]},"header":{"type":"string","options":[{"value":"none","revisions":[2047,2'
+    '047]},{"value":"http","revisions":[2047,2047]},{"value":"8bit","revisions":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"string","revisio'
+    'ns":[2047,2047]},"format":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"html'
+    '","revisions":[2047,2047]},{"value":"wml","revisions":[2047,127]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","'
+    '8bit"]},"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}}'
+)
@@ -0,0 +1,226 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"traffic_quota":{"type":"list","children":{"buffer":{"type":"string","r'
+    'evisions":[2047,2047]},"header":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value"'
+    ':"8bit","revisions":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"string","revisions":[2047,2047]},"format":{"type":"string","options":[{'
+    '"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"html","revisions":[2047,2047]},{"value":"wml","revisions":['
+    '2047,127]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"mm4":{"type":"list","children":{"domain":{"type":"string","revisions":[127,127]},"from'
+    '":{"type":"string","revisions":[127,127]},"msg_type":{"type":"string","revisions":[127,127]},"format":{"type":"string","options":[{"value":"none","rev'
+    'isions":[127,127]},{"value":"text","revisions":[127,127]},{"value":"html","revisions":[127,127]},{"value":"wml","revisions":[127,127]}],"revisions":[1'
+    '27,127]},"smil_part":{"type":"string","revisions":[127,127]},"image":{"type":"string","revisions":[127,127]},"charset":{"type":"string","options":[{"v'
+    'alue":"utf-8","revisions":[127,127]},{"value":"us-ascii","revisions":[127,127]}],"revisions":[127,127]},"rsp_status":{"type":"string","options":[{"val'
+    'ue":"ok","revisions":[127,127]},{"value":"err-unspecified","revisions":[127,127]},{"value":"err-srv-denied","revisions":[127,127]},{"value":"err-msg-f'
+    'mt-corrupt","revisions":[127,127]},{"value":"err-snd-addr-unresolv","revisions":[127,127]},{"value":"err-net-prob","revisions":[127,127]},{"value":"er'
+    'r-content-not-accept","revisions":[127,127]},{"value":"err-unsupp-msg","revisions":[127,127]}],"revisions":[127,127]},"priority":{"type":"string","opt'
+    'ions":[{"value":"not-included","revisions":[127,127]},{"value":"low","revisions":[127,127]},{"value":"normal","revisions":[127,127]},{"value":"high","'
+    'revisions":[127,127]}],"revisions":[127,127]},"header":{"type":"string","options":[{"value":"none","revisions":[127,127]},{"value":"http","revisions":'
+    '[127,127]},{"value":"8bit","revisions":[127,127]}],"revisions":[127,127]},"add_smil":{"type":"string","options":[{"value":"enable","revisions":[127,12'
+    '7]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"message":{"type":"string","revisions":[127,127]},"subject":{"type":"string","re'
+    'visions":[127,127]},"class":{"type":"string","options":[{"value":"not-included","revisions":[127,127]},{"value":"personal","revisions":[127,127]},{"va'
+    'lue":"informational","revisions":[127,127]},{"value":"advertisement","revisions":[127,127]},{"value":"auto","revisions":[127,127]}],"revisions":[127,1'
+    '27]},"from_sender":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,12'
+    '7]}},"revisions":[2047,127]},"mm7":{"type":"list","children":{"rsp_status":{"type":"string","options":[{"value":"success","revisions":[127,127]},{"val'
+    'ue":"partial-success","revisions":[127,127]},{"value":"client-err","revisions":[127,127]},{"value":"oper-restrict","revisions":[127,127]},{"value":"ad'
+    'dr-err","revisions":[127,127]},{"value":"addr-not-found","revisions":[127,127]},{"value":"content-refused","revisions":[127,127]},{"value":"msg-id-not'
+    '-found","revisions":[127,127]},{"value":"link-id-not-found","revisions":[127,127]},{"value":"msg-fmt-corrupt","revisions":[127,127]},{"value":"app-id-'
+    'not-found","revisions":[127,127]},{"value":"repl-app-id-not-found","revisions":[127,127]},{"value":"srv-err","revisions":[127,127]},{"value":"not-poss'
+    'ible","revisions":[127,127]},{"value":"msg-rejected","revisions":[127,127]},{"value":"multiple-addr-not-supp","revisions":[127,127]},{"value":"app-add'
+    'r-not-supp","revisions":[127,127]},{"value":"gen-service-err","revisions":[127,127]},{"value":"improper-ident","revisions":[127,127]},{"value":"unsupp'
+    '-ver","revisions":[127,127]},{"value":"unsupp-oper","revisions":[127,127]},{"value":"validation-err","revisions":[127,127]},{"value":"service-err","re'
+    'visions":[127,127]},{"value":"service-unavail","revisions":[127,127]},{"value":"service-denied","revisions":[127,127]},{"value":"app-denied","revision'
+    's":[127,127]}],"revisions":[127,127]},"from":{"type":"string","revisions":[127,127]},"msg_type":{"type":"string","revisions":[127,127]},"format":{"typ'
+    'e":"string","options":[{"value":"none","revisions":[127,127]},{"value":"text","revisions":[127,127]},{"value":"html","revisions":[127,127]},{"value":"'
+    'wml","revisions":[127,127]}],"revisions":[127,127]},"smil_part":{"type":"string","revisions":[127,127]},"image":{"type":"string","revisions":[127,127]'
+    '},"charset":{"type":"string","options":[{"value":"utf-8","revisions":[127,127]},{"value":"us-ascii","revisions":[127,127]}],"revisions":[127,127]},"cl'
+    'ass":{"type":"string","options":[{"value":"not-included","revisions":[127,127]},{"value":"personal","revisions":[127,127]},{"value":"informational","r'
+    'evisions":[127,127]},{"value":"advertisement","revisions":[127,127]},{"value":"auto","revisions":[127,127]}],"revisions":[127,127]},"priority":{"type"'
+    ':"string","options":[{"value":"not-included","revisions":[127,127]},{"value":"low","revisions":[127,127]},{"value":"normal","revisions":[127,127]},{"v'
+    'alue":"high","revisions":[127,127]}],"revisions":[127,127]},"header":{"type":"string","options":[{"value":"none","revisions":[127,127]},{"value":"http'
+    '","revisions":[127,127]},{"value":"8bit","revisions":[127,127]}],"revisions":[127,127]},"allow_content_adaptation":{"type":"string","options":[{"value'
+    '":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"add_smil":{"type":"string","options":[{"value":"e'
+    'nable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"message":{"type":"string","revisions":[127,127]},"sub'
+    'ject":{"type":"string","revisions":[127,127]},"addr_type":{"type":"string","options":[{"value":"rfc2822-addr","revisions":[127,127]},{"value":"number"'
+    ',"revisions":[127,127]},{"value":"short-code","revisions":[127,127]}],"revisions":[127,127]},"from_sender":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]}},"revisions":[2047,127]},"mm1":{"type":"list","children":{'
+    '"rsp_status":{"type":"string","options":[{"value":"ok","revisions":[127,127]},{"value":"err-unspecified","revisions":[127,127]},{"value":"err-srv-deni'
+    'ed","revisions":[127,127]},{"value":"err-msg-fmt-corrupt","revisions":[127,127]},{"value":"err-snd-addr-unresolv","revisions":[127,127]},{"value":"err'
+    '-msg-not-found","revisions":[127,127]},{"value":"err-net-prob","revisions":[127,127]},{"value":"err-content-not-accept","revisions":[127,127]},{"value'
+    '":"err-unsupp-msg","revisions":[127,127]}],"revisions":[127,127]},"from":{"type":"string","revisions":[127,127]},"msg_type":{"type":"string","revision'
+    's":[127,127]},"format":{"type":"string","options":[{"value":"none","revisions":[127,127]},{"value":"text","revisions":[127,127]},{"value":"html","revi'
+    'sions":[127,127]},{"value":"wml","revisions":[127,127]}],"revisions":[127,127]},"smil_part":{"type":"string","revisions":[127,127]},"rsp_text":{"type"'
+    ':"string","revisions":[127,127]},"image":{"type":"string","revisions":[127,127]},"charset":{"type":"string","options":[{"value":"utf-8","revisions":[1'
+    '27,127]},{"value":"us-ascii","revisions":[127,127]}],"revisions":[127,127]},"sender_visibility":{"type":"string","options":[{"value":"not-specified","'
+    'revisions":[127,127]},{"value":"show","revisions":[127,127]},{"value":"hide","revisions":[127,127]}],"revisions":[127,127]},"priority":{"type":"string'
+    '","options":[{"value":"not-included","revisions":[127,127]},{"value":"low","revisions":[127,127]},{"value":"normal","revisions":[127,127]},{"value":"h'
+    'igh","revisions":[127,127]}],"revisions":[127,127]},"header":{"type":"string","options":[{"value":"none","revisions":[127,127]},{"value":"http","revis'
+    'ions":[127,127]},{"value":"8bit","revisions":[127,127]}],"revisions":[127,127]},"add_smil":{"type":"string","options":[{"value":"enable","revisions":['
+    '127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"message":{"type":"string","revisions":[127,127]},"subject":{"type":"strin'
+    'g","revisions":[127,127]},"class":{"type":"string","options":[{"value":"not-included","revisions":[127,127]},{"value":"personal","revisions":[127,127]'
+    '},{"value":"advertisement","revisions":[127,127]},{"value":"information","revisions":[127,127]},{"value":"automatic","revisions":[127,127]}],"revision'
+    's":[127,127]},"from_sender":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions'
+    '":[127,127]}},"revisions":[2047,127]},"mm3":{"type":"list","children":{"from":{"type":"string","revisions":[127,127]},"msg_type":{"type":"string","rev'
+    'isions":[127,127]},"format":{"type":"string","options":[{"value":"none","revisions":[127,127]},{"value":"text","revisions":[127,127]},{"value":"html",'
+    '"revisions":[127,127]},{"value":"wml","revisions":[127,127]}],"revisions":[127,127]},"image":{"type":"string","revisions":[127,127]},"charset":{"type"'
+    ':"string","options":[{"value":"utf-8","revisions":[127,127]},{"value":"us-ascii","revisions":[127,127]}],"revisions":[127,127]},"priority":{"type":"st'
+    'ring","options":[{"value":"not-included","revisions":[127,127]},{"value":"low","revisions":[127,127]},{"value":"normal","revisions":[127,127]},{"value'
+    '":"high","revisions":[127,127]}],"revisions":[127,127]},"header":{"type":"string","options":[{"value":"none","revisions":[127,127]},{"value":"http","r'
+    'evisions":[127,127]},{"value":"8bit","revisions":[127,127]}],"revisions":[127,127]},"add_html":{"type":"string","options":[{"value":"enable","revision'
+    's":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"html_part":{"type":"string","revisions":[127,127]},"message":{"type":'
+    '"string","revisions":[127,127]},"subject":{"type":"string","revisions":[127,127]},"from_sender":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]}},"revisions":[2047,127]},"fortiguard_wf":{"type":"list","children":{"'
+    'buffer":{"type":"string","revisions":[2047,2047]},"header":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"http","revis'
+    'ions":[2047,2047]},{"value":"8bit","revisions":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"string","revisions":[2047,2047]},"format":{"'
+    'type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"html","revisions":[2047,2047]},{'
+    '"value":"wml","revisions":[2047,127]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"auth":{"type":"list","children":{"buffer":{"type":"string",'
+    '"revisions":[2047,2047]},"header":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"valu'
+    'e":"8bit","revisions":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"string","revisions":[2047,2047]},"format":{"type":"string","options":'
+    '[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"html","revisions":[2047,2047]},{"value":"wml","revisions"'
+    ':[2047,127]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"ftp":{"type":"list","children":{"buffer":{"type":"string","revisions":[2047,2047]},"'
+    'header":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"8bit","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"string","revisions":[2047,2047]},"format":{"type":"string","options":[{"value":"none","revision'
+    's":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"html","revisions":[2047,2047]},{"value":"wml","revisions":[2047,127]}],"revisions":'
+    '[2047,2047]}},"revisions":[2047,2047]},"spam":{"type":"list","children":{"buffer":{"type":"string","revisions":[2047,2047]},"header":{"type":"string",'
+    '"options":[{"value":"none","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"8bit","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"msg_type":{"type":"string","revisions":[2047,2047]},"format":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":'
+    '"text","revisions":[2047,2047]},{"value":"html","revisions":[2047,2047]},{"value":"wml","revisions":[2047,127]}],"revisions":[2047,2047]}},"revisions"'
+    ':[2047,2047]},"sslvpn":{"type":"list","children":{"buffer":{"type":"string","revisions":[2047,2047]},"header":{"type":"string","options":[{"value":"no'
+    'ne","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"8bit","revisions":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"'
+    'type":"string","revisions":[2047,2047]},"format":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[204'
+    '7,2047]},{"value":"html","revisions":[2047,2047]},{"value":"wml","revisions":[2047,127]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"mail":{"'
+    'type":"list","children":{"buffer":{"type":"string","revisions":[2047,2047]},"header":{"type":"string","options":[{"value":"none","revisions":[2047,204'
+    '7]},{"value":"http","revisions":[2047,2047]},{"value":"8bit","revisions":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"string","revisions'
+    '":[2047,2047]},"format":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"html",'
+    '"revisions":[2047,2047]},{"value":"wml","revisions":[2047,127]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"nntp":{"type":"list","children":{'
+    '"buffer":{"type":"string","revisions":[383,383]},"header":{"type":"string","options":[{"value":"none","revisions":[383,383]},{"value":"http","revision'
+    's":[383,383]},{"value":"8bit","revisions":[383,383]}],"revisions":[383,383]},"msg_type":{"type":"string","revisions":[383,383]},"format":{"type":"stri'
+    'ng","options":[{"value":"none","revisions":[383,383]},{"value":"text","revisions":[383,383]},{"value":"html","revisions":[383,383]},{"value":"wml","re'
+    'visions":[383,127]}],"revisions":[383,383]}},"revisions":[2047,383]},"group_type":{"type":"string","options":[{"value":"default","revisions":[2047,204'
+    '7]},{"value":"utm","revisions":[2047,2047]},{"value":"auth","revisions":[2047,2047]},{"value":"ec","revisions":[2047,7]}],"revisions":[2047,2047]},"ht'
+    'tp":{"type":"list","children":{"buffer":{"type":"string","revisions":[2047,2047]},"header":{"type":"string","options":[{"value":"none","revisions":[20'
+    '47,2047]},{"value":"http","revisions":[2047,2047]},{"value":"8bit","revisions":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"string","rev'
+    'isions":[2047,2047]},"format":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"'
+    'html","revisions":[2047,2047]},{"value":"wml","revisions":[2047,127]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"nac_quar":{"type":"list","c'
+    'hildren":{"buffer":{"type":"string","revisions":[2047,2047]},"header":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"h'
+    'ttp","revisions":[2047,2047]},{"value":"8bit","revisions":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"string","revisions":[2047,2047]},'
+    '"format":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"html","revisions":[20'
+    '47,2047]},{"value":"wml","revisions":[2047,127]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"mms":{"type":"list","children":{"msg_type":{"typ'
+    'e":"string","revisions":[127,127]},"format":{"type":"string","options":[{"value":"none","revisions":[127,127]},{"value":"text","revisions":[127,127]},'
+    '{"value":"html","revisions":[127,127]},{"value":"wml","revisions":[127,127]}],"revisions":[127,127]},"buffer":{"type":"string","revisions":[127,127]},'
+    '"image":{"type":"string","revisions":[127,127]},"charset":{"type":"string","options":[{"value":"utf-8","revisions":[127,127]},{"value":"us-ascii","rev'
+    'isions":[127,127]}],"revisions":[127,127]},"header":{"type":"string","options":[{"value":"none","revisions":[127,127]},{"value":"http","revisions":[12'
+    '7,127]},{"value":"8bit","revisions":[127,127]}],"revisions":[127,127]}},"revisions":[2047,127]},"icap":{"type":"list","children":{"buffer":{"type":"st'
+    'ring","revisions":[2047,2047]},"header":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},'
+    '{"value":"8bit","revisions":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"string","revisions":[2047,2047]},"format":{"type":"string","opt'
+    'ions":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"html","revisions":[2047,2047]},{"value":"wml","revi'
+    'sions":[2047,127]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"ec":{"type":"list","children":{"buffer":{"type":"string","revisions":[7,7]},"h'
+    'eader":{"type":"string","options":[{"value":"none","revisions":[7,7]},{"value":"http","revisions":[7,7]},{"value":"8bit","revisions":[7,7]}],"revision'
+    's":[7,7]},"msg_type":{"type":"string","revisions":[7,7]},"format":{"type":"string","options":[{"value":"none","revisions":[7,7]},{"value":"text","revi'
+    'sions":[7,7]},{"value":"html","revisions":[7,7]},{"value":"wml","revisions":[7,7]}],"revisions":[7,7]}},"revisions":[2047,7]},"automation":{"type":"li'
+    'st","children":{"buffer":{"type":"string","revisions":[1024,1024]},"header":{"type":"string","options":[{"value":"none","revisions":[1024,1024]},{"val'
+    'ue":"http","revisions":[1024,1024]},{"value":"8bit","revisions":[1024,1024]}],"revisions":[1024,1024]},"msg_type":{"type":"string","revisions":[1024,1'
+    '024]},"format":{"type":"string","options":[{"value":"none","revisions":[1024,1024]},{"value":"text","revisions":[1024,1024]},{"value":"html","revision'
+    's":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1024,1024]},"name":{"type":"string","revisions":[2047,2047]},"alertmail":{"type":"list","child'
+    'ren":{"buffer":{"type":"string","revisions":[2047,2047]},"header":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"http"'
+    ',"revisions":[2047,2047]},{"value":"8bit","revisions":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"string","revisions":[2047,2047]},"for'
+    'mat":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"html","revisions":[2047,2'
+    '047]},{"value":"wml","revisions":[2047,127]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"admin":{"type":"list","children":{"buffer":{"type":"'
+    'string","revisions":[2047,2047]},"header":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]'
+    '},{"value":"8bit","revisions":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"string","revisions":[2047,2047]},"format":{"type":"string","o'
+    'ptions":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"html","revisions":[2047,2047]},{"value":"wml","re'
+    'visions":[2047,127]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"utm":{"type":"list","children":{"buffer":{"type":"string","revisions":[2047,'
+    '2047]},"header":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"8bit","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"string","revisions":[2047,2047]},"format":{"type":"string","options":[{"value":"none","'
+    'revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]},{"value":"html","revisions":[2047,2047]},{"value":"wml","revisions":[2047,127]}],"rev'
+    'isions":[2047,2047]}},"revisions":[2047,2047]},"custom_message":{"type":"list","children":{"buffer":{"type":"string","revisions":[2047,2047]},"header"'
+    ':{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"8bit","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"msg_type":{"type":"string","revisions":[2047,2047]},"format":{"type":"string","options":[{"value":"none","revisions":[204'
+    '7,2047]},{"value":"text","revisions":[2047,2047]},{"value":"html","revisions":[2047,2047]},{"value":"wml","revisions":[2047,127]}],"revisions":[2047,2'
+    '047]}},"revisions":[2047,2047]},"device_detection_portal":{"type":"list","children":{"buffer":{"type":"string","revisions":[383,383]},"header":{"type"'
+    ':"string","options":[{"value":"none","revisions":[383,383]},{"value":"http","revisions":[383,383]},{"value":"8bit","revisions":[383,383]}],"revisions"'
+    ':[383,383]},"msg_type":{"type":"string","revisions":[383,383]},"format":{"type":"string","options":[{"value":"none","revisions":[383,383]},{"value":"t'
+    'ext","revisions":[383,383]},{"value":"html","revisions":[383,383]},{"value":"wml","revisions":[383,127]}],"revisions":[383,383]}},"revisions":[2047,38'
+    '3]},"webproxy":{"type":"list","children":{"buffer":{"type":"string","revisions":[2047,2047]},"header":{"type":"string","options":[{"value":"none","rev'
+    'isions":[2047,2047]},{"value":"http","revisions":[2047,2047]},{"value":"8bit","revisions":[2047,2047]}],"revisions":[2047,2047]},"msg_type":{"type":"s'
+    'tring","revisions":[2047,2047]},"format":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"text","revisions":[2047,2047]}'
+    ',{"value":"html","revisions":[2047,2047]},{"value":"wml","revisions":[2047,127]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[204'
+    '7,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"traffic_quota":{"type":"list","required":false,"options":{"buffe'
+    'r":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str","required":false'
+    '},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"mm4":{"type":"list","required":false,"options":{"domain":{"type":'
+    '"str","required":false},"from":{"type":"str","required":false},"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"cho'
+    'ices":["none","text","html","wml"]},"smil_part":{"type":"str","required":false},"image":{"type":"str","required":false},"charset":{"type":"str","requi'
+    'red":false,"choices":["utf-8","us-ascii"]},"rsp_status":{"type":"str","required":false,"choices":["ok","err-unspecified","err-srv-denied","err-msg-fmt'
+    '-corrupt","err-snd-addr-unresolv","err-net-prob","err-content-not-accept","err-unsupp-msg"]},"priority":{"type":"str","required":false,"choices":["not'
+    '-included","low","normal","high"]},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"add_smil":{"type":"str","required":false'
+    ',"choices":["enable","disable"]},"message":{"type":"str","required":false},"subject":{"type":"str","required":false},"class":{"type":"str","required":'
+    'false,"choices":["not-included","personal","informational","advertisement","auto"]},"from_sender":{"type":"str","required":false,"choices":["enable","'
+    'disable"]}}},"mm7":{"type":"list","required":false,"options":{"rsp_status":{"type":"str","required":false,"choices":["success","partial-success","clie'
+    'nt-err","oper-restrict","addr-err","addr-not-found","content-refused","msg-id-not-found","link-id-not-found","msg-fmt-corrupt","app-id-not-found","rep'
+    'l-app-id-not-found","srv-err","not-possible","msg-rejected","multiple-addr-not-supp","app-addr-not-supp","gen-service-err","improper-ident","unsupp-ve'
+    'r","unsupp-oper","validation-err","service-err","service-unavail","service-denied","app-denied"]},"from":{"type":"str","required":false},"msg_type":{"'
+    'type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]},"smil_part":{"type":"str","required":fal'
+    'se},"image":{"type":"str","required":false},"charset":{"type":"str","required":false,"choices":["utf-8","us-ascii"]},"class":{"type":"str","required":'
+    'false,"choices":["not-included","personal","informational","advertisement","auto"]},"priority":{"type":"str","required":false,"choices":["not-included'
+    '","low","normal","high"]},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"allow_content_adaptation":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"add_smil":{"type":"str","required":false,"choices":["enable","disable"]},"message":{"type":"str","required":f'
+    'alse},"subject":{"type":"str","required":false},"addr_type":{"type":"str","required":false,"choices":["rfc2822-addr","number","short-code"]},"from_sen'
+    'der":{"type":"str","required":false,"choices":["enable","disable"]}}},"mm1":{"type":"list","required":false,"options":{"rsp_status":{"type":"str","req'
+    'uired":false,"choices":["ok","err-unspecified","err-srv-denied","err-msg-fmt-corrupt","err-snd-addr-unresolv","err-msg-not-found","err-net-prob","err-'
+    'content-not-accept","err-unsupp-msg"]},"from":{"type":"str","required":false},"msg_type":{"type":"str","required":false},"format":{"type":"str","requi'
+    'red":false,"choices":["none","text","html","wml"]},"smil_part":{"type":"str","required":false},"rsp_text":{"type":"str","required":false},"image":{"ty'
+    'pe":"str","required":false},"charset":{"type":"str","required":false,"choices":["utf-8","us-ascii"]},"sender_visibility":{"type":"str","required":fals'
+    'e,"choices":["not-specified","show","hide"]},"priority":{"type":"str","required":false,"choices":["not-included","low","normal","high"]},"header":{"ty'
+    'pe":"str","required":false,"choices":["none","http","8bit"]},"add_smil":{"type":"str","required":false,"choices":["enable","disable"]},"message":{"typ'
+    'e":"str","required":false},"subject":{"type":"str","required":false},"class":{"type":"str","required":false,"choices":["not-included","personal","adve'
+    'rtisement","information","automatic"]},"from_sender":{"type":"str","required":false,"choices":["enable","disable"]}}},"mm3":{"type":"list","required":'
+    'false,"options":{"from":{"type":"str","required":false},"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":['
+    '"none","text","html","wml"]},"image":{"type":"str","required":false},"charset":{"type":"str","required":false,"choices":["utf-8","us-ascii"]},"priorit'
+    'y":{"type":"str","required":false,"choices":["not-included","low","normal","high"]},"header":{"type":"str","required":false,"choices":["none","http","'
+    '8bit"]},"add_html":{"type":"str","required":false,"choices":["enable","disable"]},"html_part":{"type":"str","required":false},"message":{"type":"str",'
+    '"required":false},"subject":{"type":"str","required":false},"from_sender":{"type":"str","required":false,"choices":["enable","disable"]}}},"fortiguard'
+    '_wf":{"type":"list","required":false,"options":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","ht'
+    'tp","8bit"]},"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"auth":{"typ'
+    'e":"list","required":false,"options":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"'
+    ']},"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"ftp":{"type":"list","'
+    'required":false,"options":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_typ'
+    'e":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"spam":{"type":"list","required":'
+    'false,"options":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type"'
+    ':"str","required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"sslvpn":{"type":"list","required":false,"o'
+    'ptions":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str","'
+    'required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"mail":{"type":"list","required":false,"options":{"'
+    'buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str","required":'
+    'false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"nntp":{"type":"list","required":false,"options":{"buffer":{"'
+    'type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str","required":false},"fo'
+    'rmat":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"group_type":{"type":"str","required":false,"choices":["default","utm",'
+    '"auth","ec"]},"http":{"type":"list","required":false,"options":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choi'
+    'ces":["none","http","8bit"]},"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]'
+    '}}},"nac_quar":{"type":"list","required":false,"options":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":['
+    '"none","http","8bit"]},"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"m'
+    'ms":{"type":"list","required":false,"options":{"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","t'
+    'ext","html","wml"]},"buffer":{"type":"str","required":false},"image":{"type":"str","required":false},"charset":{"type":"str","required":false,"choices'
+    '":["utf-8","us-ascii"]},"header":{"type":"str","required":false,"choices":["none","http","8bit"]}}},"icap":{"type":"list","required":false,"options":{'
+    '"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str","required"'
+    ':false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"ec":{"type":"list","required":false,"options":{"buffer":{"t'
+    'ype":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str","required":false},"for'
+    'mat":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"automation":{"type":"list","required":false,"options":{"buffer":{"type"'
+    ':"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str","required":false},"format"'
+    ':{"type":"str","required":false,"choices":["none","text","html"]}}},"name":{"type":"str","required":false},"alertmail":{"type":"list","required":false'
+    ',"options":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str'
+    '","required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"admin":{"type":"list","required":false,"options'
+    '":{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str","requir'
+    'ed":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"utm":{"type":"list","required":false,"options":{"buffer"'
+    ':{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str","required":false},'
+    '"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"custom_message":{"type":"list","required":false,"options":{"buffer"'
+    ':{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str","required":false},'
+    '"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"device_detection_portal":{"type":"list","required":false,"options":'
+    '{"buffer":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str","required'
+    '":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}},"webproxy":{"type":"list","required":false,"options":{"buff'
+    'er":{"type":"str","required":false},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"msg_type":{"type":"str","required":fals'
+    'e},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]}}}}}'
+)
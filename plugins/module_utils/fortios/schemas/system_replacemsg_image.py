@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"image_type":{"type":"string","options":[{"value":"gif","revisions":[2047,2047]},{"value":"jpg","revisions":[2047,2047]},{"'
+    'value":"tiff","revisions":[2047,2047]},{"value":"png","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,204'
+    '7]},"image_base64":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"image_type":{"type":"str","required":false,"choices":["gif","jpg","tiff","png"]},"name":{"type":"str","req'
+    'uired":false},"image_base64":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,35 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"rsp_status":{"type":"string","options":[{"value":"ok","revisions":[127,127]},{"value":"err-unspecified","revisions":[127,1'
+    '27]},{"value":"err-srv-denied","revisions":[127,127]},{"value":"err-msg-fmt-corrupt","revisions":[127,127]},{"value":"err-snd-addr-unresolv","revision'
+    's":[127,127]},{"value":"err-msg-not-found","revisions":[127,127]},{"value":"err-net-prob","revisions":[127,127]},{"value":"err-content-not-accept","re'
+    'visions":[127,127]},{"value":"err-unsupp-msg","revisions":[127,127]}],"revisions":[127,127]},"from":{"type":"string","revisions":[127,127]},"msg_type"'
+    ':{"type":"string","revisions":[127,127]},"format":{"type":"string","options":[{"value":"none","revisions":[127,127]},{"value":"text","revisions":[127,'
+    '127]},{"value":"html","revisions":[127,127]},{"value":"wml","revisions":[127,127]}],"revisions":[127,127]},"smil_part":{"type":"string","revisions":[1'
+    '27,127]},"rsp_text":{"type":"string","revisions":[127,127]},"image":{"type":"string","revisions":[127,127]},"charset":{"type":"string","options":[{"va'
+    'lue":"utf-8","revisions":[127,127]},{"value":"us-ascii","revisions":[127,127]}],"revisions":[127,127]},"sender_visibility":{"type":"string","options":'
+    '[{"value":"not-specified","revisions":[127,127]},{"value":"show","revisions":[127,127]},{"value":"hide","revisions":[127,127]}],"revisions":[127,127]}'
+    ',"priority":{"type":"string","options":[{"value":"not-included","revisions":[127,127]},{"value":"low","revisions":[127,127]},{"value":"normal","revisi'
+    'ons":[127,127]},{"value":"high","revisions":[127,127]}],"revisions":[127,127]},"header":{"type":"string","options":[{"value":"none","revisions":[127,1'
+    '27]},{"value":"http","revisions":[127,127]},{"value":"8bit","revisions":[127,127]}],"revisions":[127,127]},"add_smil":{"type":"string","options":[{"va'
+    'lue":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"message":{"type":"string","revisions":[127,127'
+    ']},"subject":{"type":"string","revisions":[127,127]},"class":{"type":"string","options":[{"value":"not-included","revisions":[127,127]},{"value":"pers'
+    'onal","revisions":[127,127]},{"value":"advertisement","revisions":[127,127]},{"value":"information","revisions":[127,127]},{"value":"automatic","revis'
+    'ions":[127,127]}],"revisions":[127,127]},"from_sender":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisi'
+    'ons":[127,127]}],"revisions":[127,127]}},"revisions":[127,127]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"rsp_status":{"type":"str","required":false,"choices":["ok","err-unspecified","err-srv-denied","err-msg-fmt'
+    '-corrupt","err-snd-addr-unresolv","err-msg-not-found","err-net-prob","err-content-not-accept","err-unsupp-msg"]},"from":{"type":"str","required":false'
+    '},"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]},"smil_part":{"type":"str"'
+    ',"required":false},"rsp_text":{"type":"str","required":false},"image":{"type":"str","required":false},"charset":{"type":"str","required":false,"choice'
+    's":["utf-8","us-ascii"]},"sender_visibility":{"type":"str","required":false,"choices":["not-specified","show","hide"]},"priority":{"type":"str","requi'
+    'red":false,"choices":["not-included","low","normal","high"]},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"add_smil":{"ty'
+    'pe":"str","required":false,"choices":["enable","disable"]},"message":{"type":"str","required":false},"subject":{"type":"str","required":false},"class"'
+    ':{"type":"str","required":false,"choices":["not-included","personal","advertisement","information","automatic"]},"from_sender":{"type":"str","required'
+    '":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,25 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"from":{"type":"string","revisions":[127,127]},"msg_type":{"type":"string","revisions":[127,127]},"format":{"type":"string"'
+    ',"options":[{"value":"none","revisions":[127,127]},{"value":"text","revisions":[127,127]},{"value":"html","revisions":[127,127]},{"value":"wml","revis'
+    'ions":[127,127]}],"revisions":[127,127]},"image":{"type":"string","revisions":[127,127]},"charset":{"type":"string","options":[{"value":"utf-8","revis'
+    'ions":[127,127]},{"value":"us-ascii","revisions":[127,127]}],"revisions":[127,127]},"priority":{"type":"string","options":[{"value":"not-included","re'
+    'visions":[127,127]},{"value":"low","revisions":[127,127]},{"value":"normal","revisions":[127,127]},{"value":"high","revisions":[127,127]}],"revisions"'
+    ':[127,127]},"header":{"type":"string","options":[{"value":"none","revisions":[127,127]},{"value":"http","revisions":[127,127]},{"value":"8bit","revisi'
+    'ons":[127,127]}],"revisions":[127,127]},"add_html":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions"'
+    ':[127,127]}],"revisions":[127,127]},"html_part":{"type":"string","revisions":[127,127]},"message":{"type":"string","revisions":[127,127]},"subject":{"'
+    'type":"string","revisions":[127,127]},"from_sender":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions'
+    '":[127,127]}],"revisions":[127,127]}},"revisions":[127,127]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"from":{"type":"str","required":false},"msg_type":{"type":"str","required":false},"format":{"type":"str","r'
+    'equired":false,"choices":["none","text","html","wml"]},"image":{"type":"str","required":false},"charset":{"type":"str","required":false,"choices":["ut'
+    'f-8","us-ascii"]},"priority":{"type":"str","required":false,"choices":["not-included","low","normal","high"]},"header":{"type":"str","required":false,'
+    '"choices":["none","http","8bit"]},"add_html":{"type":"str","required":false,"choices":["enable","disable"]},"html_part":{"type":"str","required":false'
+    '},"message":{"type":"str","required":false},"subject":{"type":"str","required":false},"from_sender":{"type":"str","required":false,"choices":["enable"'
+    ',"disable"]}}}'
+)
@@ -0,0 +1,32 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"domain":{"type":"string","revisions":[127,127]},"from":{"type":"string","revisions":[127,127]},"msg_type":{"type":"string"'
+    ',"revisions":[127,127]},"format":{"type":"string","options":[{"value":"none","revisions":[127,127]},{"value":"text","revisions":[127,127]},{"value":"h'
+    'tml","revisions":[127,127]},{"value":"wml","revisions":[127,127]}],"revisions":[127,127]},"smil_part":{"type":"string","revisions":[127,127]},"image":'
+    '{"type":"string","revisions":[127,127]},"charset":{"type":"string","options":[{"value":"utf-8","revisions":[127,127]},{"value":"us-ascii","revisions":'
+    '[127,127]}],"revisions":[127,127]},"rsp_status":{"type":"string","options":[{"value":"ok","revisions":[127,127]},{"value":"err-unspecified","revisions'
+    '":[127,127]},{"value":"err-srv-denied","revisions":[127,127]},{"value":"err-msg-fmt-corrupt","revisions":[127,127]},{"value":"err-snd-addr-unresolv","'
+    'revisions":[127,127]},{"value":"err-net-prob","revisions":[127,127]},{"value":"err-content-not-accept","revisions":[127,127]},{"value":"err-unsupp-msg'
+    '","revisions":[127,127]}],"revisions":[127,127]},"priority":{"type":"string","options":[{"value":"not-included","revisions":[127,127]},{"value":"low",'
+    '"revisions":[127,127]},{"value":"normal","revisions":[127,127]},{"value":"high","revisions":[127,127]}],"revisions":[127,127]},"header":{"type":"strin'
+    'g","options":[{"value":"none","revisions":[127,127]},{"value":"http","revisions":[127,127]},{"value":"8bit","revisions":[127,127]}],"revisions":[127,1'
+    '27]},"add_smil":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]}'
+    ',"message":{"type":"string","revisions":[127,127]},"subject":{"type":"string","revisions":[127,127]},"class":{"type":"string","options":[{"value":"not'
+    '-included","revisions":[127,127]},{"value":"personal","revisions":[127,127]},{"value":"informational","revisions":[127,127]},{"value":"advertisement",'
+    '"revisions":[127,127]},{"value":"auto","revisions":[127,127]}],"revisions":[127,127]},"from_sender":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]}},"revisions":[127,127]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"domain":{"type":"str","required":false},"from":{"type":"str","required":false},"msg_type":{"type":"str","r'
+    'equired":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]},"smil_part":{"type":"str","required":false},"image":{"'
+    'type":"str","required":false},"charset":{"type":"str","required":false,"choices":["utf-8","us-ascii"]},"rsp_status":{"type":"str","required":false,"ch'
+    'oices":["ok","err-unspecified","err-srv-denied","err-msg-fmt-corrupt","err-snd-addr-unresolv","err-net-prob","err-content-not-accept","err-unsupp-msg"'
+    ']},"priority":{"type":"str","required":false,"choices":["not-included","low","normal","high"]},"header":{"type":"str","required":false,"choices":["non'
+    'e","http","8bit"]},"add_smil":{"type":"str","required":false,"choices":["enable","disable"]},"message":{"type":"str","required":false},"subject":{"typ'
+    'e":"str","required":false},"class":{"type":"str","required":false,"choices":["not-included","personal","informational","advertisement","auto"]},"from_'
+    'sender":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,43 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"rsp_status":{"type":"string","options":[{"value":"success","revisions":[127,127]},{"value":"partial-success","revisions":['
+    '127,127]},{"value":"client-err","revisions":[127,127]},{"value":"oper-restrict","revisions":[127,127]},{"value":"addr-err","revisions":[127,127]},{"va'
+    'lue":"addr-not-found","revisions":[127,127]},{"value":"content-refused","revisions":[127,127]},{"value":"msg-id-not-found","revisions":[127,127]},{"va'
+    'lue":"link-id-not-found","revisions":[127,127]},{"value":"msg-fmt-corrupt","revisions":[127,127]},{"value":"app-id-not-found","revisions":[127,127]},{'
+    '"value":"repl-app-id-not-found","revisions":[127,127]},{"value":"srv-err","revisions":[127,127]},{"value":"not-possible","revisions":[127,127]},{"valu'
+    'e":"msg-rejected","revisions":[127,127]},{"value":"multiple-addr-not-supp","revisions":[127,127]},{"value":"app-addr-not-supp","revisions":[127,127]},'
+    '{"value":"gen-service-err","revisions":[127,127]},{"value":"improper-ident","revisions":[127,127]},{"value":"unsupp-ver","revisions":[127,127]},{"valu'
+    'e":"unsupp-oper","revisions":[127,127]},{"value":"validation-err","revisions":[127,127]},{"value":"service-err","revisions":[127,127]},{"value":"servi'
+    'ce-unavail","revisions":[127,127]},{"value":"service-denied","revisions":[127,127]},{"value":"app-denied","revisions":[127,127]}],"revisions":[127,127'
+    ']},"from":{"type":"string","revisions":[127,127]},"msg_type":{"type":"string","revisions":[127,127]},"format":{"type":"string","options":[{"value":"no'
+    'ne","revisions":[127,127]},{"value":"text","revisions":[127,127]},{"value":"html","revisions":[127,127]},{"value":"wml","revisions":[127,127]}],"revis'
+    'ions":[127,127]},"smil_part":{"type":"string","revisions":[127,127]},"image":{"type":"string","revisions":[127,127]},"charset":{"type":"string","optio'
+    'ns":[{"value":"utf-8","revisions":[127,127]},{"value":"us-ascii","revisions":[127,127]}],"revisions":[127,127]},"class":{"type":"string","options":[{"'
+    'value":"not-included","revisions":[127,127]},{"value":"personal","revisions":[127,127]},{"value":"informational","revisions":[127,127]},{"value":"adve'
+    'rtisement","revisions":[127,127]},{"value":"auto","revisions":[127,127]}],"revisions":[127,127]},"priority":{"type":"string","options":[{"value":"not-'
+    'included","revisions":[127,127]},{"value":"low","revisions":[127,127]},{"value":"normal","revisions":[127,127]},{"value":"high","revisions":[127,127]}'
+    '],"revisions":[127,127]},"header":{"type":"string","options":[{"value":"none","revisions":[127,127]},{"value":"http","revisions":[127,127]},{"value":"'
+    '8bit","revisions":[127,127]}],"revisions":[127,127]},"allow_content_adaptation":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{'
+    '"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"add_smil":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"val'
+    'ue":"disable","revisions":[127,127]}],"revisions":[127,127]},"message":{"type":"string","revisions":[127,127]},"subject":{"type":"string","revisions":'
+    '[127,127]},"addr_type":{"type":"string","options":[{"value":"rfc2822-addr","revisions":[127,127]},{"value":"number","revisions":[127,127]},{"value":"s'
+    'hort-code","revisions":[127,127]}],"revisions":[127,127]},"from_sender":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":'
+    '"disable","revisions":[127,127]}],"revisions":[127,127]}},"revisions":[127,127]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"rsp_status":{"type":"str","required":false,"choices":["success","partial-success","client-err","oper-restr'
+    'ict","addr-err","addr-not-found","content-refused","msg-id-not-found","link-id-not-found","msg-fmt-corrupt","app-id-not-found","repl-app-id-not-found"'
+    ',"srv-err","not-possible","msg-rejected","multiple-addr-not-supp","app-addr-not-supp","gen-service-err","improper-ident","unsupp-ver","unsupp-oper","v'
+    'alidation-err","service-err","service-unavail","service-denied","app-denied"]},"from":{"type":"str","required":false},"msg_type":{"type":"str","requir'
+    'ed":false},"format":{"type":"str","required":false,"choices":["none","text","html","wml"]},"smil_part":{"type":"str","required":false},"image":{"type"'
+    ':"str","required":false},"charset":{"type":"str","required":false,"choices":["utf-8","us-ascii"]},"class":{"type":"str","required":false,"choices":["n'
+    'ot-included","personal","informational","advertisement","auto"]},"priority":{"type":"str","required":false,"choices":["not-included","low","normal","h'
+    'igh"]},"header":{"type":"str","required":false,"choices":["none","http","8bit"]},"allow_content_adaptation":{"type":"str","required":false,"choices":['
+    '"enable","disable"]},"add_smil":{"type":"str","required":false,"choices":["enable","disable"]},"message":{"type":"str","required":false},"subject":{"t'
+    'ype":"str","required":false},"addr_type":{"type":"str","required":false,"choices":["rfc2822-addr","number","short-code"]},"from_sender":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]}}}'
+)
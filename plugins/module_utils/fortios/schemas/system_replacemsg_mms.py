@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"msg_type":{"type":"string","revisions":[127,127]},"format":{"type":"string","options":[{"value":"none","revisions":[127,12'
+    '7]},{"value":"text","revisions":[127,127]},{"value":"html","revisions":[127,127]},{"value":"wml","revisions":[127,127]}],"revisions":[127,127]},"buffe'
+    'r":{"type":"string","revisions":[127,127]},"image":{"type":"string","revisions":[127,127]},"charset":{"type":"string","options":[{"value":"utf-8","rev'
+    'isions":[127,127]},{"value":"us-ascii","revisions":[127,127]}],"revisions":[127,127]},"header":{"type":"string","options":[{"value":"none","revisions"'
+    ':[127,127]},{"value":"http","revisions":[127,127]},{"value":"8bit","revisions":[127,127]}],"revisions":[127,127]}},"revisions":[127,127]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"msg_type":{"type":"str","required":false},"format":{"type":"str","required":false,"choices":["none","text"'
+    ',"html","wml"]},"buffer":{"type":"str","required":false},"image":{"type":"str","required":false},"charset":{"type":"str","required":false,"choices":["'
+    'utf-8","us-ascii"]},"header":{"type":"str","required":false,"choices":["none","http","8bit"]}}}'
+)
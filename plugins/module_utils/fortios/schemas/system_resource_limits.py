@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"service_group":{"type":"integer","revisions":[2047,2047]},"firewall_address":{"type":"integer","revisions":[2047,2047]},"f'
+    'irewall_policy":{"type":"integer","revisions":[2047,2047]},"ipsec_phase1":{"type":"integer","revisions":[2047,2047]},"session":{"type":"integer","revi'
+    'sions":[2047,2047]},"ipsec_phase1_interface":{"type":"integer","revisions":[2047,2047]},"custom_service":{"type":"integer","revisions":[2047,2047]},"i'
+    'psec_phase2":{"type":"integer","revisions":[2047,2047]},"ipsec_phase2_interface":{"type":"integer","revisions":[2047,2047]},"dialup_tunnel":{"type":"i'
+    'nteger","revisions":[2047,2047]},"user":{"type":"integer","revisions":[2047,2047]},"user_group":{"type":"integer","revisions":[2047,2047]},"sslvpn":{"'
+    'type":"integer","revisions":[2047,2047]},"onetime_schedule":{"type":"integer","revisions":[2047,2047]},"firewall_addrgrp":{"type":"integer","revisions'
+    '":[2047,2047]},"proxy":{"type":"integer","revisions":[2047,2047]},"recurring_schedule":{"type":"integer","revisions":[2047,2047]},"log_disk_quota":{"t'
+    'ype":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"service_group":{"type":"int","required":false},"firewall_address":{"type":"int","required":false},"firewal'
+    'l_policy":{"type":"int","required":false},"ipsec_phase1":{"type":"int","required":false},"session":{"type":"int","required":false},"ipsec_phase1_inter'
+    'face":{"type":"int","required":false},"custom_service":{"type":"int","required":false},"ipsec_phase2":{"type":"int","required":false},"ipsec_phase2_in'
+    'terface":{"type":"int","required":false},"dialup_tunnel":{"type":"int","required":false},"user":{"type":"int","required":false},"user_group":{"type":"'
+    'int","required":false},"sslvpn":{"type":"int","required":false},"onetime_schedule":{"type":"int","required":false},"firewall_addrgrp":{"type":"int","r'
+    'equired":false},"proxy":{"type":"int","required":false},"recurring_schedule":{"type":"int","required":false},"log_disk_quota":{"type":"int","required"'
+    ':false}}}'
+)
@@ -0,0 +1,43 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}'
+    '],"revisions":[2040,2040]},"entity_id":{"type":"string","revisions":[2040,2040]},"service_providers":{"type":"list","children":{"sp_entity_id":{"type"'
+    ':"string","revisions":[2040,2040]},"assertion_attributes":{"type":"list","children":{"type":{"type":"string","options":[{"value":"username","revisions'
+    '":[2040,2040]},{"value":"email","revisions":[2040,2040]},{"value":"profile-name","revisions":[1920,1920]}],"revisions":[2040,2040]},"name":{"type":"st'
+    'ring","revisions":[2040,2040]}},"revisions":[2040,2040]},"idp_artifact_resolution_url":{"type":"string","revisions":[2032,16]},"idp_single_logout_url"'
+    ':{"type":"string","revisions":[2040,2040]},"sp_artifact_resolution_url":{"type":"string","revisions":[2032,16]},"sp_cert":{"type":"string","revisions"'
+    ':[2040,2040]},"idp_entity_id":{"type":"string","revisions":[2040,2040]},"sp_binding_protocol":{"type":"string","options":[{"value":"post","revisions":'
+    '[1040,1040]},{"value":"redirect","revisions":[1024,1024]}],"revisions":[2032,1040]},"prefix":{"type":"string","revisions":[2040,2040]},"sp_single_logo'
+    'ut_url":{"type":"string","revisions":[2040,2040]},"sp_single_sign_on_url":{"type":"string","revisions":[2040,2040]},"idp_single_sign_on_url":{"type":"'
+    'string","revisions":[2040,2040]},"sp_portal_url":{"type":"string","revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]}},"revision'
+    's":[2040,2040]},"idp_cert":{"type":"string","revisions":[2040,2040]},"idp_artifact_resolution_url":{"type":"string","revisions":[2032,16]},"idp_single'
+    '_logout_url":{"type":"string","revisions":[2040,2040]},"tolerance":{"type":"integer","revisions":[2040,2040]},"server_address":{"type":"string","revis'
+    'ions":[2040,2040]},"life":{"type":"integer","revisions":[2040,2040]},"artifact_resolution_url":{"type":"string","revisions":[2032,16]},"idp_entity_id"'
+    ':{"type":"string","revisions":[2040,2040]},"single_sign_on_url":{"type":"string","revisions":[2040,2040]},"cert":{"type":"string","revisions":[2040,20'
+    '40]},"role":{"type":"string","options":[{"value":"identity-provider","revisions":[2040,2040]},{"value":"service-provider","revisions":[2040,2040]}],"r'
+    'evisions":[2040,2040]},"portal_url":{"type":"string","revisions":[2040,2040]},"default_profile":{"type":"string","revisions":[2040,2040]},"default_log'
+    'in_page":{"type":"string","options":[{"value":"normal","revisions":[2040,2040]},{"value":"sso","revisions":[2040,2040]}],"revisions":[2040,2040]},"idp'
+    '_single_sign_on_url":{"type":"string","revisions":[2040,2040]},"single_logout_url":{"type":"string","revisions":[2040,2040]},"binding_protocol":{"type'
+    '":"string","options":[{"value":"post","revisions":[1040,1040]},{"value":"redirect","revisions":[1024,1024]}],"revisions":[2032,1040]}},"revisions":[20'
+    '40,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"entity_id":{"type":"str","required'
+    '":false},"service_providers":{"type":"list","required":false,"options":{"sp_entity_id":{"type":"str","required":false},"assertion_attributes":{"type":'
+    '"list","required":false,"options":{"type":{"type":"str","required":false},"name":{"type":"str","required":false}}},"idp_artifact_resolution_url":{"typ'
+    'e":"str","required":false},"idp_single_logout_url":{"type":"str","required":false},"sp_artifact_resolution_url":{"type":"str","required":false},"sp_ce'
+    'rt":{"type":"str","required":false},"idp_entity_id":{"type":"str","required":false},"sp_binding_protocol":{"type":"str","required":false},"prefix":{"t'
+    'ype":"str","required":false},"sp_single_logout_url":{"type":"str","required":false},"sp_single_sign_on_url":{"type":"str","required":false},"idp_singl'
+    'e_sign_on_url":{"type":"str","required":false},"sp_portal_url":{"type":"str","required":false},"name":{"type":"str","required":false}}},"idp_cert":{"t'
+    'ype":"str","required":false},"idp_artifact_resolution_url":{"type":"str","required":false},"idp_single_logout_url":{"type":"str","required":false},"to'
+    'lerance":{"type":"int","required":false},"server_address":{"type":"str","required":false},"life":{"type":"int","required":false},"artifact_resolution_'
+    'url":{"type":"str","required":false},"idp_entity_id":{"type":"str","required":false},"single_sign_on_url":{"type":"str","required":false},"cert":{"typ'
+    'e":"str","required":false},"role":{"type":"str","required":false,"choices":["identity-provider","service-provider"]},"portal_url":{"type":"str","requi'
+    'red":false},"default_profile":{"type":"str","required":false},"default_login_page":{"type":"str","required":false,"choices":["normal","sso"]},"idp_sin'
+    'gle_sign_on_url":{"type":"str","required":false},"single_logout_url":{"type":"str","required":false},"binding_protocol":{"type":"str","required":false'
+    '}}}'
+)
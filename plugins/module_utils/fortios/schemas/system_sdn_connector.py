@@ -0,0 +1,68 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"vcenter_username":{"type":"string","revisions":[1920,1920]},"username":{"type":"string","revisions":[2047,2047]},"domain":'
+    '{"type":"string","revisions":[2040,2040]},"oci_region":{"type":"string","options":[{"value":"phoenix","revisions":[7,7]},{"value":"ashburn","revisions'
+    '":[7,7]},{"value":"frankfurt","revisions":[7,7]},{"value":"london","revisions":[7,7]}],"revisions":[2047,2047]},"secret_token":{"type":"string","revis'
+    'ions":[2040,2040]},"vpc_id":{"type":"string","revisions":[2047,2047]},"oci_region_type":{"type":"string","options":[{"value":"commercial","revisions":'
+    '[2040,2040]},{"value":"government","revisions":[2040,2040]}],"revisions":[2040,2040]},"group_name":{"type":"string","revisions":[2040,2040]},"gcp_proj'
+    'ect":{"type":"string","revisions":[2047,2047]},"route_table":{"type":"list","children":{"route":{"type":"list","children":{"next_hop":{"type":"string"'
+    ',"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"subscription_id":{"type":"string","revisions":[2'
+    '040,2024]},"resource_group":{"type":"string","revisions":[2040,2040]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"oci_'
+    'fingerprint":{"type":"string","revisions":[2047,2047]},"user_id":{"type":"string","revisions":[2047,2047]},"resource_group":{"type":"string","revision'
+    's":[2047,2047]},"compartment_id":{"type":"string","revisions":[2047,2047]},"server_port":{"type":"integer","revisions":[2047,2047]},"update_interval":'
+    '{"type":"integer","revisions":[2047,2047]},"api_key":{"type":"string","revisions":[1920,1920]},"type":{"type":"string","options":[{"value":"aci","revi'
+    'sions":[2047,2047]},{"value":"aws","revisions":[2047,2047]},{"value":"azure","revisions":[2047,2047]},{"value":"gcp","revisions":[2047,2047]},{"value"'
+    ':"nsx","revisions":[2047,2047]},{"value":"nuage","revisions":[2047,2047]},{"value":"oci","revisions":[2047,2047]},{"value":"openstack","revisions":[20'
+    '47,2047]},{"value":"alicloud","revisions":[2040,2040]},{"value":"kubernetes","revisions":[2040,2040]},{"value":"vmware","revisions":[2040,2040]},{"val'
+    'ue":"sepm","revisions":[2040,2040]},{"value":"aci-direct","revisions":[1920,1920]},{"value":"ibm","revisions":[1920,1920]},{"value":"nutanix","revisio'
+    'ns":[1024,1024]}],"revisions":[2047,2047]},"secret_key":{"type":"string","revisions":[2047,2047]},"status":{"type":"string","options":[{"value":"disab'
+    'le","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"private_key":{"type":"string","revisions":[2047,204'
+    '7]},"compute_generation":{"type":"integer","revisions":[1920,1920]},"login_endpoint":{"type":"string","revisions":[2047,2047]},"nic":{"type":"list","c'
+    'hildren":{"ip":{"type":"list","children":{"public_ip":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"reso'
+    'urce_group":{"type":"string","revisions":[2040,2040]}},"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,20'
+    '47]},"ibm_region":{"type":"string","options":[{"value":"us-south","revisions":[1664,1664]},{"value":"us-east","revisions":[1664,1664]},{"value":"germa'
+    'ny","revisions":[1664,1664]},{"value":"great-britain","revisions":[1664,1664]},{"value":"japan","revisions":[1664,1664]},{"value":"australia","revisio'
+    'ns":[1664,1664]}],"revisions":[1920,1664]},"ibm_region_gen1":{"type":"string","options":[{"value":"us-south","revisions":[256,256]},{"value":"us-east"'
+    ',"revisions":[256,256]},{"value":"germany","revisions":[256,256]},{"value":"great-britain","revisions":[256,256]},{"value":"japan","revisions":[256,25'
+    '6]},{"value":"australia","revisions":[256,256]}],"revisions":[1792,256]},"client_id":{"type":"string","revisions":[2047,2047]},"ibm_region_gen2":{"typ'
+    'e":"string","options":[{"value":"us-south","revisions":[256,256]},{"value":"us-east","revisions":[256,256]},{"value":"great-britain","revisions":[256,'
+    '256]}],"revisions":[1792,256]},"key_passwd":{"type":"string","revisions":[2047,23]},"password":{"type":"string","revisions":[2047,2047]},"subscription'
+    '_id":{"type":"string","revisions":[2047,2047]},"access_key":{"type":"string","revisions":[2047,2047]},"vcenter_password":{"type":"string","revisions":'
+    '[1920,1920]},"name":{"type":"string","revisions":[2047,2047]},"server_list":{"type":"list","children":{"ip":{"type":"string","revisions":[1536,1536]}}'
+    ',"revisions":[1536,1536]},"external_ip":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"tenant_'
+    'id":{"type":"string","revisions":[2047,2047]},"route":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2'
+    '047]},"server":{"type":"string","revisions":[2047,2047]},"azure_region":{"type":"string","options":[{"value":"global","revisions":[2047,2047]},{"value'
+    '":"china","revisions":[2047,2047]},{"value":"germany","revisions":[2047,2047]},{"value":"usgov","revisions":[2047,2047]},{"value":"local","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"use_metadata_iam":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]},"service_account":{"type":"string","revisions":[2047,2047]},"client_secret":{"type":"string","revisio'
+    'ns":[2047,2047]},"resource_url":{"type":"string","revisions":[2047,2047]},"ha_status":{"type":"string","options":[{"value":"disable","revisions":[2040'
+    ',2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"oci_cert":{"type":"string","revisions":[2047,2047]},"region":{"type":"st'
+    'ring","revisions":[2047,2047]},"vcenter_server":{"type":"string","revisions":[1920,1920]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"vcenter_username":{"type":"str","required":false},"username":{"type":"str","required":false},"domain":{"ty'
+    'pe":"str","required":false},"oci_region":{"type":"str","required":false},"secret_token":{"type":"str","required":false},"vpc_id":{"type":"str","requir'
+    'ed":false},"oci_region_type":{"type":"str","required":false,"choices":["commercial","government"]},"group_name":{"type":"str","required":false},"gcp_p'
+    'roject":{"type":"str","required":false},"route_table":{"type":"list","required":false,"options":{"route":{"type":"list","required":false,"options":{"n'
+    'ext_hop":{"type":"str","required":false},"name":{"type":"str","required":false}}},"subscription_id":{"type":"str","required":false},"resource_group":{'
+    '"type":"str","required":false},"name":{"type":"str","required":false}}},"oci_fingerprint":{"type":"str","required":false},"user_id":{"type":"str","req'
+    'uired":false},"resource_group":{"type":"str","required":false},"compartment_id":{"type":"str","required":false},"server_port":{"type":"int","required"'
+    ':false},"update_interval":{"type":"int","required":false},"api_key":{"type":"str","required":false},"type":{"type":"str","required":false},"secret_key'
+    '":{"type":"str","required":false},"status":{"type":"str","required":false,"choices":["disable","enable"]},"private_key":{"type":"str","required":false'
+    '},"compute_generation":{"type":"int","required":false},"login_endpoint":{"type":"str","required":false},"nic":{"type":"list","required":false,"options'
+    '":{"ip":{"type":"list","required":false,"options":{"public_ip":{"type":"str","required":false},"name":{"type":"str","required":false},"resource_group"'
+    ':{"type":"str","required":false}}},"name":{"type":"str","required":false}}},"ibm_region":{"type":"str","required":false},"ibm_region_gen1":{"type":"st'
+    'r","required":false},"client_id":{"type":"str","required":false},"ibm_region_gen2":{"type":"str","required":false},"key_passwd":{"type":"str","require'
+    'd":false},"password":{"type":"str","required":false},"subscription_id":{"type":"str","required":false},"access_key":{"type":"str","required":false},"v'
+    'center_password":{"type":"str","required":false},"name":{"type":"str","required":false},"server_list":{"type":"list","required":false,"options":{"ip":'
+    '{"type":"str","required":false}}},"external_ip":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"tenant_id":{"type'
+    '":"str","required":false},"route":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"server":{"type":"str","required'
+    '":false},"azure_region":{"type":"str","required":false,"choices":["global","china","germany","usgov","local"]},"use_metadata_iam":{"type":"str","requi'
+    'red":false,"choices":["disable","enable"]},"service_account":{"type":"str","required":false},"client_secret":{"type":"str","required":false},"resource'
+    '_url":{"type":"str","required":false},"ha_status":{"type":"str","required":false,"choices":["disable","enable"]},"oci_cert":{"type":"str","required":f'
+    'alse},"region":{"type":"str","required":false},"vcenter_server":{"type":"str","required":false}}}'
+)
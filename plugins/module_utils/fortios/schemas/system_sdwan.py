@@ -0,0 +1,175 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[1920,1920]},{"value":"enable","revisions":[1920,1920]}'
+    '],"revisions":[1920,1920]},"load_balance_mode":{"type":"string","options":[{"value":"source-ip-based","revisions":[1920,1920]},{"value":"weight-based"'
+    ',"revisions":[1920,1920]},{"value":"usage-based","revisions":[1920,1920]},{"value":"source-dest-ip-based","revisions":[1920,1920]},{"value":"measured-'
+    'volume-based","revisions":[1920,1920]}],"revisions":[1920,1920]},"fail_alert_interfaces":{"type":"list","children":{"name":{"type":"string","revisions'
+    '":[1920,1920]}},"revisions":[1920,1920]},"service":{"type":"list","children":{"jitter_weight":{"type":"integer","revisions":[1920,1920]},"dscp_forward'
+    '_tag":{"type":"string","revisions":[1920,1920]},"protocol":{"type":"integer","revisions":[1920,1920]},"link_cost_threshold":{"type":"integer","revisio'
+    'ns":[1920,1920]},"dscp_reverse_tag":{"type":"string","revisions":[1920,1920]},"dst6":{"type":"list","children":{"name":{"type":"string","revisions":[1'
+    '920,1920]}},"revisions":[1920,1920]},"end_port":{"type":"integer","revisions":[1920,1920]},"internet_service_app_ctrl":{"type":"list","children":{"id"'
+    ':{"type":"integer","revisions":[1920,1920]}},"revisions":[1920,1920]},"priority_members":{"type":"list","children":{"seq_num":{"type":"integer","revis'
+    'ions":[1920,1920]}},"revisions":[1920,1920]},"minimum_sla_meet_members":{"type":"integer","revisions":[1920,1664]},"src6":{"type":"list","children":{"'
+    'name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"bandwidth_weight":{"type":"integer","revisions":[1920,1920]},"internet_serv'
+    'ice_custom":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"input_device":{"type":"list","child'
+    'ren":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"link_cost_factor":{"type":"string","options":[{"value":"latency","re'
+    'visions":[1920,1920]},{"value":"jitter","revisions":[1920,1920]},{"value":"packet-loss","revisions":[1920,1920]},{"value":"inbandwidth","revisions":[1'
+    '920,1920]},{"value":"outbandwidth","revisions":[1920,1920]},{"value":"bibandwidth","revisions":[1920,1920]},{"value":"custom-profile-1","revisions":[1'
+    '920,1920]}],"revisions":[1920,1920]},"route_tag":{"type":"integer","revisions":[1920,1920]},"id":{"type":"integer","revisions":[1920,1920]},"packet_lo'
+    'ss_weight":{"type":"integer","revisions":[1920,1920]},"addr_mode":{"type":"string","options":[{"value":"ipv4","revisions":[1920,1920]},{"value":"ipv6"'
+    ',"revisions":[1920,1920]}],"revisions":[1920,1920]},"tos":{"type":"string","revisions":[1920,1920]},"dst":{"type":"list","children":{"name":{"type":"s'
+    'tring","revisions":[1920,1920]}},"revisions":[1920,1920]},"input_device_negate":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]}'
+    ',{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"gateway":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]'
+    '},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"role":{"type":"string","options":[{"value":"standalone","revisions":[1920,192'
+    '0]},{"value":"primary","revisions":[1920,1920]},{"value":"secondary","revisions":[1920,1920]}],"revisions":[1920,1920]},"internet_service_custom_group'
+    '":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"dscp_forward":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"quality_link":{"type":"integer","revisi'
+    'ons":[1920,1920]},"mode":{"type":"string","options":[{"value":"auto","revisions":[1920,1920]},{"value":"manual","revisions":[1920,1920]},{"value":"pri'
+    'ority","revisions":[1920,1920]},{"value":"sla","revisions":[1920,1920]},{"value":"load-balance","revisions":[1920,1920]}],"revisions":[1920,1920]},"st'
+    'atus":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"he'
+    'alth_check":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"start_port":{"type":"integer","revi'
+    'sions":[1920,1920]},"users":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"src":{"type":"list"'
+    ',"children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"dst_negate":{"type":"string","options":[{"value":"enable","re'
+    'visions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"dscp_reverse":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"latency_weight":{"type":"integer","revisions":[1920'
+    ',1920]},"tos_mask":{"type":"string","revisions":[1920,1920]},"groups":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"re'
+    'visions":[1920,1920]},"standalone_action":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,'
+    '1920]}],"revisions":[1920,1920]},"sla_compare_method":{"type":"string","options":[{"value":"order","revisions":[1920,1920]},{"value":"number","revisio'
+    'ns":[1920,1920]}],"revisions":[1920,1920]},"internet_service_app_ctrl_group":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920'
+    ']}},"revisions":[1920,1920]},"hold_down_time":{"type":"integer","revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1920]},"hash_mode":'
+    '{"type":"string","options":[{"value":"round-robin","revisions":[1664,1664]},{"value":"source-ip-based","revisions":[1664,1664]},{"value":"source-dest-'
+    'ip-based","revisions":[1664,1664]},{"value":"inbandwidth","revisions":[1664,1664]},{"value":"outbandwidth","revisions":[1664,1664]},{"value":"bibandwi'
+    'dth","revisions":[1664,1664]}],"revisions":[1920,1664]},"default":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"dis'
+    'able","revisions":[1920,1920]}],"revisions":[1920,1920]},"src_negate":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":'
+    '"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"internet_service_name":{"type":"list","children":{"name":{"type":"string","revisions":[1'
+    '920,1920]}},"revisions":[1920,1920]},"internet_service_group":{"type":"list","children":{"name":{"type":"string","revisions":[1920,1920]}},"revisions"'
+    ':[1920,1920]},"tie_break":{"type":"string","options":[{"value":"zone","revisions":[1536,1536]},{"value":"cfg-order","revisions":[1536,1536]},{"value":'
+    '"fib-best-match","revisions":[1536,1536]}],"revisions":[1536,1536]},"use_shortcut_sla":{"type":"string","options":[{"value":"enable","revisions":[1536'
+    ',1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"sla":{"type":"list","children":{"health_check":{"type":"string","revisi'
+    'ons":[1920,1920]},"id":{"type":"integer","revisions":[1920,1920]}},"revisions":[1920,1920]},"internet_service":{"type":"string","options":[{"value":"e'
+    'nable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]}},"revisions":[1920,1920]},"zone":{"type":"list",'
+    '"children":{"service_sla_tie_break":{"type":"string","options":[{"value":"cfg-order","revisions":[1536,1536]},{"value":"fib-best-match","revisions":[1'
+    '536,1536]}],"revisions":[1536,1536]},"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"fail_detect":{"type":"string","option'
+    's":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"neighbor_hold_down_time":{"type"'
+    ':"integer","revisions":[1920,1920]},"neighbor_hold_down":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","re'
+    'visions":[1920,1920]}],"revisions":[1920,1920]},"neighbor":{"type":"list","children":{"member":{"type":"integer","revisions":[1920,1920]},"ip":{"type"'
+    ':"string","revisions":[1920,1920]},"health_check":{"type":"string","revisions":[1920,1920]},"role":{"type":"string","options":[{"value":"standalone","'
+    'revisions":[1920,1920]},{"value":"primary","revisions":[1920,1920]},{"value":"secondary","revisions":[1920,1920]}],"revisions":[1920,1920]},"sla_id":{'
+    '"type":"integer","revisions":[1920,1920]}},"revisions":[1920,1920]},"health_check":{"type":"list","children":{"protocol":{"type":"string","options":[{'
+    '"value":"ping","revisions":[1920,1920]},{"value":"tcp-echo","revisions":[1920,1920]},{"value":"udp-echo","revisions":[1920,1920]},{"value":"http","rev'
+    'isions":[1920,1920]},{"value":"twamp","revisions":[1920,1920]},{"value":"dns","revisions":[1920,1920]},{"value":"tcp-connect","revisions":[1920,1664]}'
+    ',{"value":"ftp","revisions":[1920,1664]},{"value":"ping6","revisions":[1792,256]}],"revisions":[1920,1920]},"system_dns":{"type":"string","options":[{'
+    '"value":"disable","revisions":[1920,1920]},{"value":"enable","revisions":[1920,1920]}],"revisions":[1920,1920]},"update_cascade_interface":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"diffservcode":{"typ'
+    'e":"string","revisions":[1920,1920]},"threshold_alert_jitter":{"type":"integer","revisions":[1920,1920]},"ha_priority":{"type":"integer","revisions":['
+    '1920,1920]},"port":{"type":"integer","revisions":[1920,1920]},"threshold_warning_packetloss":{"type":"integer","revisions":[1920,1920]},"sla":{"type":'
+    '"list","children":{"packetloss_threshold":{"type":"integer","revisions":[1920,1920]},"jitter_threshold":{"type":"integer","revisions":[1920,1920]},"id'
+    '":{"type":"integer","revisions":[1920,1920]},"link_cost_factor":{"multiple_values":true,"type":"list","options":[{"value":"latency","revisions":[1920,'
+    '1920]},{"value":"jitter","revisions":[1920,1920]},{"value":"packet-loss","revisions":[1920,1920]}],"revisions":[1920,1920]},"latency_threshold":{"type'
+    '":"integer","revisions":[1920,1920]}},"revisions":[1920,1920]},"packet_size":{"type":"integer","revisions":[1920,1920]},"addr_mode":{"type":"string","'
+    'options":[{"value":"ipv4","revisions":[1920,1920]},{"value":"ipv6","revisions":[1920,1920]}],"revisions":[1920,1920]},"update_static_route":{"type":"s'
+    'tring","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"threshold_alert_la'
+    'tency":{"type":"integer","revisions":[1920,1920]},"probe_timeout":{"type":"integer","revisions":[1920,1920]},"ftp_file":{"type":"string","revisions":['
+    '1920,1664]},"quality_measured_method":{"type":"string","options":[{"value":"half-open","revisions":[1664,1664]},{"value":"half-close","revisions":[166'
+    '4,1664]}],"revisions":[1920,1664]},"http_get":{"type":"string","revisions":[1920,1920]},"failtime":{"type":"integer","revisions":[1920,1920]},"http_ag'
+    'ent":{"type":"string","revisions":[1920,1920]},"ftp_mode":{"type":"string","options":[{"value":"passive","revisions":[1664,1664]},{"value":"port","rev'
+    'isions":[1664,1664]}],"revisions":[1920,1664]},"user":{"type":"string","revisions":[1920,1664]},"members":{"type":"list","children":{"seq_num":{"type"'
+    ':"integer","revisions":[1920,1920]}},"revisions":[1920,1920]},"probe_count":{"type":"integer","revisions":[1920,1920]},"password":{"type":"string","re'
+    'visions":[1920,1920]},"sla_fail_log_period":{"type":"integer","revisions":[1920,1920]},"recoverytime":{"type":"integer","revisions":[1920,1920]},"prob'
+    'e_packets":{"type":"string","options":[{"value":"disable","revisions":[1920,1920]},{"value":"enable","revisions":[1920,1920]}],"revisions":[1920,1920]'
+    '},"http_match":{"type":"string","revisions":[1920,1920]},"security_mode":{"type":"string","options":[{"value":"none","revisions":[1920,1920]},{"value"'
+    ':"authentication","revisions":[1920,1920]}],"revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1920]},"detect_mode":{"type":"string","'
+    'options":[{"value":"active","revisions":[1024,1024]},{"value":"passive","revisions":[1024,1024]},{"value":"prefer-passive","revisions":[1024,1024]}],"'
+    'revisions":[1024,1024]},"interval":{"type":"integer","revisions":[1920,1920]},"server":{"type":"string","revisions":[1920,1920]},"sla_pass_log_period"'
+    ':{"type":"integer","revisions":[1920,1920]},"threshold_alert_packetloss":{"type":"integer","revisions":[1920,1920]},"dns_request_domain":{"type":"stri'
+    'ng","revisions":[1920,1920]},"threshold_warning_jitter":{"type":"integer","revisions":[1920,1920]},"threshold_warning_latency":{"type":"integer","revi'
+    'sions":[1920,1920]},"dns_match_ip":{"type":"string","revisions":[1920,1664]}},"revisions":[1920,1920]},"duplication_max_num":{"type":"integer","revisi'
+    'ons":[1920,1664]},"members":{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[1920,1920]},{"value":"enab'
+    'le","revisions":[1920,1920]}],"revisions":[1920,1920]},"comment":{"type":"string","revisions":[1920,1920]},"weight":{"type":"integer","revisions":[192'
+    '0,1920]},"zone":{"type":"string","revisions":[1920,1920]},"spillover_threshold":{"type":"integer","revisions":[1920,1920]},"seq_num":{"type":"integer"'
+    ',"revisions":[1920,1920]},"priority":{"type":"integer","revisions":[1920,1920]},"source":{"type":"string","revisions":[1920,1920]},"cost":{"type":"int'
+    'eger","revisions":[1920,1920]},"source6":{"type":"string","revisions":[1920,1920]},"gateway6":{"type":"string","revisions":[1920,1920]},"priority6":{"'
+    'type":"integer","revisions":[1024,1024]},"interface":{"type":"string","revisions":[1920,1920]},"volume_ratio":{"type":"integer","revisions":[1920,1920'
+    ']},"gateway":{"type":"string","revisions":[1920,1920]},"ingress_spillover_threshold":{"type":"integer","revisions":[1920,1920]}},"revisions":[1920,192'
+    '0]},"duplication":{"type":"list","children":{"packet_de_duplication":{"type":"string","options":[{"value":"enable","revisions":[1664,1664]},{"value":"'
+    'disable","revisions":[1664,1664]}],"revisions":[1664,1664]},"srcaddr6":{"type":"list","children":{"name":{"type":"string","revisions":[1664,1664]}},"r'
+    'evisions":[1664,1664]},"service":{"type":"list","children":{"name":{"type":"string","revisions":[1664,1664]}},"revisions":[1664,1664]},"dstaddr6":{"ty'
+    'pe":"list","children":{"name":{"type":"string","revisions":[1664,1664]}},"revisions":[1664,1664]},"srcaddr":{"type":"list","children":{"name":{"type":'
+    '"string","revisions":[1664,1664]}},"revisions":[1664,1664]},"packet_duplication":{"type":"string","options":[{"value":"disable","revisions":[1664,1664'
+    ']},{"value":"force","revisions":[1664,1664]},{"value":"on-demand","revisions":[1664,1664]}],"revisions":[1664,1664]},"dstintf":{"type":"list","childre'
+    'n":{"name":{"type":"string","revisions":[1664,1664]}},"revisions":[1664,1664]},"srcintf":{"type":"list","children":{"name":{"type":"string","revisions'
+    '":[1664,1664]}},"revisions":[1664,1664]},"service_id":{"type":"list","children":{"id":{"type":"integer","revisions":[1536,1536]}},"revisions":[1536,15'
+    '36]},"dstaddr":{"type":"list","children":{"name":{"type":"string","revisions":[1664,1664]}},"revisions":[1664,1664]},"id":{"type":"integer","revisions'
+    '":[1664,1664]}},"revisions":[1920,1664]},"neighbor_hold_boot_time":{"type":"integer","revisions":[1920,1920]}},"revisions":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"load_balance_mode":{"type":"str","'
+    'required":false,"choices":["source-ip-based","weight-based","usage-based","source-dest-ip-based","measured-volume-based"]},"fail_alert_interfaces":{"t'
+    'ype":"list","required":false,"options":{"name":{"type":"str","required":false}}},"service":{"type":"list","required":false,"options":{"jitter_weight":'
+    '{"type":"int","required":false},"dscp_forward_tag":{"type":"str","required":false},"protocol":{"type":"int","required":false},"link_cost_threshold":{"'
+    'type":"int","required":false},"dscp_reverse_tag":{"type":"str","required":false},"dst6":{"type":"list","required":false,"options":{"name":{"type":"str'
+    '","required":false}}},"end_port":{"type":"int","required":false},"internet_service_app_ctrl":{"type":"list","required":false,"options":{"id":{"type":"'
+    'int","required":false}}},"priority_members":{"type":"list","required":false,"options":{"seq_num":{"type":"int","required":false}}},"minimum_sla_meet_m'
+    'embers":{"type":"int","required":false},"src6":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"bandwidth_weight":'
+    '{"type":"int","required":false},"internet_service_custom":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"input_d'
+    'evice":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"link_cost_factor":{"type":"str","required":false,"choices"'
+    ':["latency","jitter","packet-loss","inbandwidth","outbandwidth","bibandwidth","custom-profile-1"]},"route_tag":{"type":"int","required":false},"id":{"'
+    'type":"int","required":false},"packet_loss_weight":{"type":"int","required":false},"addr_mode":{"type":"str","required":false,"choices":["ipv4","ipv6"'
+    ']},"tos":{"type":"str","required":false},"dst":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"input_device_negat'
+    'e":{"type":"str","required":false,"choices":["enable","disable"]},"gateway":{"type":"str","required":false,"choices":["enable","disable"]},"role":{"ty'
+    'pe":"str","required":false,"choices":["standalone","primary","secondary"]},"internet_service_custom_group":{"type":"list","required":false,"options":{'
+    '"name":{"type":"str","required":false}}},"dscp_forward":{"type":"str","required":false,"choices":["enable","disable"]},"quality_link":{"type":"int","r'
+    'equired":false},"mode":{"type":"str","required":false,"choices":["auto","manual","priority","sla","load-balance"]},"status":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"health_check":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"start_port":{'
+    '"type":"int","required":false},"users":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"src":{"type":"list","requi'
+    'red":false,"options":{"name":{"type":"str","required":false}}},"dst_negate":{"type":"str","required":false,"choices":["enable","disable"]},"dscp_rever'
+    'se":{"type":"str","required":false,"choices":["enable","disable"]},"latency_weight":{"type":"int","required":false},"tos_mask":{"type":"str","required'
+    '":false},"groups":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"standalone_action":{"type":"str","required":fal'
+    'se,"choices":["enable","disable"]},"sla_compare_method":{"type":"str","required":false,"choices":["order","number"]},"internet_service_app_ctrl_group"'
+    ':{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"hold_down_time":{"type":"int","required":false},"name":{"type":"'
+    'str","required":false},"hash_mode":{"type":"str","required":false},"default":{"type":"str","required":false,"choices":["enable","disable"]},"src_negat'
+    'e":{"type":"str","required":false,"choices":["enable","disable"]},"internet_service_name":{"type":"list","required":false,"options":{"name":{"type":"s'
+    'tr","required":false}}},"internet_service_group":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"tie_break":{"typ'
+    'e":"str","required":false,"choices":["zone","cfg-order","fib-best-match"]},"use_shortcut_sla":{"type":"str","required":false,"choices":["enable","disa'
+    'ble"]},"sla":{"type":"list","required":false,"options":{"health_check":{"type":"str","required":false},"id":{"type":"int","required":false}}},"interne'
+    't_service":{"type":"str","required":false,"choices":["enable","disable"]}}},"zone":{"type":"list","required":false,"options":{"service_sla_tie_break":'
+    '{"type":"str","required":false,"choices":["cfg-order","fib-best-match"]},"name":{"type":"str","required":false}}},"fail_detect":{"type":"str","require'
+    'd":false,"choices":["enable","disable"]},"neighbor_hold_down_time":{"type":"int","required":false},"neighbor_hold_down":{"type":"str","required":false'
+    ',"choices":["enable","disable"]},"neighbor":{"type":"list","required":false,"options":{"member":{"type":"int","required":false},"ip":{"type":"str","re'
+    'quired":false},"health_check":{"type":"str","required":false},"role":{"type":"str","required":false,"choices":["standalone","primary","secondary"]},"s'
+    'la_id":{"type":"int","required":false}}},"health_check":{"type":"list","required":false,"options":{"protocol":{"type":"str","required":false},"system_'
+    'dns":{"type":"str","required":false,"choices":["disable","enable"]},"update_cascade_interface":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"diffservcode":{"type":"str","required":false},"threshold_alert_jitter":{"type":"int","required":false},"ha_priority":{"type":"int","required"'
+    ':false},"port":{"type":"int","required":false},"threshold_warning_packetloss":{"type":"int","required":false},"sla":{"type":"list","required":false,"o'
+    'ptions":{"packetloss_threshold":{"type":"int","required":false},"jitter_threshold":{"type":"int","required":false},"id":{"type":"int","required":false'
+    '},"link_cost_factor":{"type":"list","required":false,"choices":["latency","jitter","packet-loss"]},"latency_threshold":{"type":"int","required":false}'
+    '}},"packet_size":{"type":"int","required":false},"addr_mode":{"type":"str","required":false,"choices":["ipv4","ipv6"]},"update_static_route":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"threshold_alert_latency":{"type":"int","required":false},"probe_timeout":{"type":"int","require'
+    'd":false},"ftp_file":{"type":"str","required":false},"quality_measured_method":{"type":"str","required":false},"http_get":{"type":"str","required":fal'
+    'se},"failtime":{"type":"int","required":false},"http_agent":{"type":"str","required":false},"ftp_mode":{"type":"str","required":false},"user":{"type":'
+    '"str","required":false},"members":{"type":"list","required":false,"options":{"seq_num":{"type":"int","required":false}}},"probe_count":{"type":"int","'
+    'required":false},"password":{"type":"str","required":false},"sla_fail_log_period":{"type":"int","required":false},"recoverytime":{"type":"int","requir'
+    'ed":false},"probe_packets":{"type":"str","required":false,"choices":["disable","enable"]},"http_match":{"type":"str","required":false},"security_mode"'
+    ':{"type":"str","required":false,"choices":["none","authentication"]},"name":{"type":"str","required":false},"detect_mode":{"type":"str","required":fal'
+    'se,"choices":["active","passive","prefer-passive"]},"interval":{"type":"int","required":false},"server":{"type":"str","required":false},"sla_pass_log_'
+    'period":{"type":"int","required":false},"threshold_alert_packetloss":{"type":"int","required":false},"dns_request_domain":{"type":"str","required":fal'
+    'se},"threshold_warning_jitter":{"type":"int","required":false},"threshold_warning_latency":{"type":"int","required":false},"dns_match_ip":{"type":"str'
+    '","required":false}}},"duplication_max_num":{"type":"int","required":false},"members":{"type":"list","required":false,"options":{"status":{"type":"str'
+    '","required":false,"choices":["disable","enable"]},"comment":{"type":"str","required":false},"weight":{"type":"int","required":false},"zone":{"type":"'
+    'str","required":false},"spillover_threshold":{"type":"int","required":false},"seq_num":{"type":"int","required":false},"priority":{"type":"int","requi'
+    'red":false},"source":{"type":"str","required":false},"cost":{"type":"int","required":false},"source6":{"type":"str","required":false},"gateway6":{"typ'
+    'e":"str","required":false},"priority6":{"type":"int","required":false},"interface":{"type":"str","required":false},"volume_ratio":{"type":"int","requi'
+    'red":false},"gateway":{"type":"str","required":false},"ingress_spillover_threshold":{"type":"int","required":false}}},"duplication":{"type":"list","re'
+    'quired":false,"options":{"packet_de_duplication":{"type":"str","required":false,"choices":["enable","disable"]},"srcaddr6":{"type":"list","required":f'
+    'alse,"options":{"name":{"type":"str","required":false}}},"service":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}'
+    ',"dstaddr6":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"srcaddr":{"type":"list","required":false,"options":{"'
+    'name":{"type":"str","required":false}}},"packet_duplication":{"type":"str","required":false,"choices":["disable","force","on-demand"]},"dstintf":{"typ'
+    'e":"list","required":false,"options":{"name":{"type":"str","required":false}}},"srcintf":{"type":"list","required":false,"options":{"name":{"type":"st'
+    'r","required":false}}},"service_id":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"dstaddr":{"type":"list","requir'
+    'ed":false,"options":{"name":{"type":"str","required":false}}},"id":{"type":"int","required":false}}},"neighbor_hold_boot_time":{"type":"int","required'
+    '":false}}}'
+)
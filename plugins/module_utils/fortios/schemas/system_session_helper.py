@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]},"protocol":{"type":"integer","revisions":[2047,2047]},"port":{"type":"integ'
+    'er","revisions":[2047,2047]},"name":{"type":"string","options":[{"value":"ftp","revisions":[2047,2047]},{"value":"tftp","revisions":[2047,2047]},{"val'
+    'ue":"ras","revisions":[2047,2047]},{"value":"h323","revisions":[2047,2047]},{"value":"tns","revisions":[2047,2047]},{"value":"mms","revisions":[2047,2'
+    '047]},{"value":"sip","revisions":[2047,2047]},{"value":"pptp","revisions":[2047,2047]},{"value":"rtsp","revisions":[2047,2047]},{"value":"dns-udp","re'
+    'visions":[2047,2047]},{"value":"dns-tcp","revisions":[2047,2047]},{"value":"pmap","revisions":[2047,2047]},{"value":"rsh","revisions":[2047,2047]},{"v'
+    'alue":"dcerpc","revisions":[2047,2047]},{"value":"mgcp","revisions":[2047,2047]},{"value":"gtp-c","revisions":[2047,1023]},{"value":"gtp-u","revisions'
+    '":[2047,1023]},{"value":"gtp-b","revisions":[2047,1023]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"id":{"type":"int","required":false},"protocol":{"type":"int","required":false},"port":{"type":"int","requi'
+    'red":false},"name":{"type":"str","required":false,"choices":["ftp","tftp","ras","h323","tns","mms","sip","pptp","rtsp","dns-udp","dns-tcp","pmap","rsh'
+    '","dcerpc","mgcp","gtp-c","gtp-u","gtp-b"]}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"default":{"type":"string","revisions":[2047,2047]},"port":{"type":"list","children":{"protocol":{"type":"integer","revisio'
+    'ns":[2047,2047]},"end_port":{"type":"integer","revisions":[2047,2047]},"start_port":{"type":"integer","revisions":[2047,2047]},"id":{"type":"integer",'
+    '"revisions":[2047,2047]},"timeout":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"default":{"type":"str","required":false},"port":{"type":"list","required":false,"options":{"protocol":{"ty'
+    'pe":"int","required":false},"end_port":{"type":"int","required":false},"start_port":{"type":"int","required":false},"id":{"type":"int","required":fals'
+    'e},"timeout":{"type":"str","required":false}}}}}'
+)
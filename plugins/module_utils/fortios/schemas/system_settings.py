@@ -0,0 +1,201 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"deny_tcp_with_icmp":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"email_portal_check_dns":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_advanced_policy":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"'
+    'value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sip_ssl_port":{"type":"integer","revisions":[2047,2047]},"prp_trailer_action":{"t'
+    'ype":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dhcp_proxy_'
+    'interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[1768,1768]},{"value":"sdwan","revisions":[1768,1768]},{"value":"spec'
+    'ify","revisions":[1768,1768]}],"revisions":[2040,1768]},"gui_threat_weight":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"v'
+    'alue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dhcp_server_ip":{"type":"string","revisions":[2047,2047]},"sccp_port":{"type":"int'
+    'eger","revisions":[2047,2047]},"gui_switch_controller":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"gui_voip_profile":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disa'
+    'ble","revisions":[2047,2047]}],"revisions":[2047,2047]},"consolidated_firewall_mode":{"type":"string","options":[{"value":"enable","revisions":[120,12'
+    '0]},{"value":"disable","revisions":[120,120]}],"revisions":[2040,120]},"gui_local_in_policy":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"bfd":{"type":"string","options":[{"value":"enable","revisions":[2'
+    '047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_dlp":{"type":"string","options":[{"value":"enable","revisions":['
+    '7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"manageip6":{"type":"string","revisions":[2047,2047]},"opmode":{"type":"string","op'
+    'tions":[{"value":"nat","revisions":[2047,2047]},{"value":"transparent","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_videofilter":{"type":"s'
+    'tring","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"ecmp_max_paths":{"'
+    'type":"integer","revisions":[2047,2047]},"wccp_cache_engine":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"bfd_required_min_rx":{"type":"integer","revisions":[2047,2047]},"mac_ttl":{"type":"integer","revi'
+    'sions":[2047,2047]},"gtp_monitor_mode":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,204'
+    '0]}],"revisions":[2040,1016]},"sip_helper":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"re'
+    'visions":[2047,7]},"gui_wireless_controller":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"sip_nat_trace":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"vpn_stats_log":{"multiple_values":true,"type":"list","options":[{"value":"ipsec","revisions":[2047,2047]},'
+    '{"value":"pptp","revisions":[2047,2047]},{"value":"l2tp","revisions":[2047,2047]},{"value":"ssl","revisions":[2047,2047]}],"revisions":[2047,2047]},"g'
+    'ui_antivirus":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,20'
+    '47]},"ike_port":{"type":"integer","revisions":[1024,1024]},"gui_waf_profile":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"'
+    'value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"multicast_forward":{"type":"string","options":[{"value":"enable","revisions":[204'
+    '7,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_wan_load_balancing":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"tcp_session_without_syn":{"type":"string","options":[{'
+    '"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"asymroute_icmp":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sip_expectation":{"type":"str'
+    'ing","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"gui_email_collection'
+    '":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_se'
+    'curity_profile_group":{"type":"string","options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":'
+    '[1536,1536]},"gui_policy_based_ipsec":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"ike_dn_format":{"type":"string","options":[{"value":"with-space","revisions":[2047,2047]},{"value":"no-space","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"gui_implicit_policy":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disabl'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_ssh_profile":{"type":"string","revisions":[2047,7]},"application_bandwidth_tracking":{"type'
+    '":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"comments":{"ty'
+    'pe":"string","revisions":[2047,2047]},"gateway":{"type":"string","revisions":[2047,2047]},"central_nat":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_wanopt_cache":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_dhcp_advanced":{"type":"string","options'
+    '":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"compliance_check":{"type":"string'
+    '","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"multicast_skip_policy":{"type":"string'
+    '","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ngfw_mode":{"type":"str'
+    'ing","options":[{"value":"profile-based","revisions":[2047,2047]},{"value":"policy-based","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_appl'
+    'ication_control":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"asymroute6_icmp":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"bfd_dont_enforce_src_port":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"allow_linkdown_path":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]},"gtp_asym_fgsp":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"ena'
+    'ble","revisions":[2040,2040]}],"revisions":[2040,1016]},"gui_allow_unnamed_policy":{"type":"string","options":[{"value":"enable","revisions":[2047,204'
+    '7]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_default_policy_columns":{"type":"list","children":{"name":{"type":"stri'
+    'ng","revisions":[2047,2047]}},"revisions":[2047,2047]},"gui_dynamic_profile_display":{"type":"string","options":[{"value":"enable","revisions":[511,51'
+    '1]},{"value":"disable","revisions":[511,511]}],"revisions":[2047,511]},"implicit_allow_dns":{"type":"string","options":[{"value":"enable","revisions":'
+    '[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"strict_src_check":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_object_colors":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"manageip":{"type":"string","revisions":[2047,2047]'
+    '},"gui_endpoint_control_advanced":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"utf8_spam_tagging":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"gui_traffic_shaping":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]},"link_down_access":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_dynamic_routing":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]'
+    '},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auxiliary_session":{"type":"string","options":[{"value":"enable","revisions":'
+    '[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"dhcp_proxy_interface":{"type":"string","revisions":[2040,1768]},"s'
+    'nat_hairpin_traffic":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"gui_ips":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"gui_ztna":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions'
+    '":[1024,1024]},"gui_ap_profile":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"gui_domain_ip_reputation":{"type":"string","options":[{"value":"enable","revisions":[383,383]},{"value":"disable","revisions":'
+    '[383,383]}],"revisions":[2047,383]},"default_voip_alg_mode":{"type":"string","options":[{"value":"proxy-based","revisions":[2047,2047]},{"value":"kern'
+    'el-helper-based","revisions":[2047,2047]}],"revisions":[2047,2047]},"dhcp6_server_ip":{"type":"string","revisions":[2047,2047]},"gui_dos_policy":{"typ'
+    'e":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_dns_datab'
+    'ase":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"bfd'
+    '_desired_min_tx":{"type":"integer","revisions":[2047,2047]},"gui_local_reports":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]}'
+    ',{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sctp_session_without_init":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"gui_fortiextender_controller":{"type":"string","options":[{'
+    '"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_spamfilter":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"discovered_device_timeout":{"'
+    'type":"integer","revisions":[2047,2047]},"gui_multiple_utm_profiles":{"type":"string","options":[{"value":"enable","revisions":[383,383]},{"value":"di'
+    'sable","revisions":[383,383]}],"revisions":[2047,383]},"fw_session_hairpin":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"v'
+    'alue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_load_balance":{"type":"string","options":[{"value":"enable","revisions":[2047,'
+    '2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_policy_learning":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"gui_policy_disclaimer":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"dhcp_proxy":{"type":"string","options":[{"value":"enable","'
+    'revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_sslvpn_realms":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sip_tcp_port":{"type":"integer","revisions":'
+    '[2047,2047]},"gui_explicit_proxy":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"gui_multiple_interface_policy":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"sip_udp_port":{"type":"integer","revisions":[2047,2047]},"gui_webfilter_advanced":{"type":"string","o'
+    'ptions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_replacement_message_gro'
+    'ups":{"type":"string","options":[{"value":"enable","revisions":[1023,1023]},{"value":"disable","revisions":[1023,1023]}],"revisions":[2047,1023]},"ike'
+    '_quick_crash_detect":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"lldp_reception":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]},{"valu'
+    'e":"global","revisions":[2040,2040]}],"revisions":[2040,2040]},"gui_sslvpn_personal_bookmarks":{"type":"string","options":[{"value":"enable","revision'
+    's":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"multicast_ttl_no'
+    'tchange":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"gui_icap":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"ike_session_resume":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"location_id":{"type":"string","revisions":[1024,1024]},"gui_multicast_policy":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"vpn_stats_period":{"type":"integer","revisions":[2047,2047]},"gui'
+    '_webfilter":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"gui_per_policy_disclaimer":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisi'
+    'ons":[2040,120]},"http_external_dest":{"type":"string","options":[{"value":"fortiweb","revisions":[2047,2047]},{"value":"forticache","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"lldp_transmission":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]},{"value":"global","revisions":[2047,2047]}],"revisions":[2047,2047]},"asymroute6":{"type":"string","options":[{"value":"enable","re'
+    'visions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"status":{"type":"string","options":[{"value":"enable","re'
+    'visions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"asymroute":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_endpoint_control":{"type":"string","options":[{"va'
+    'lue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_fortiap_split_tunneling":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_vpn":{"type":"s'
+    'tring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"firewall_session_d'
+    'irty":{"type":"string","options":[{"value":"check-all","revisions":[2047,2047]},{"value":"check-new","revisions":[2047,2047]},{"value":"check-policy-o'
+    'ption","revisions":[2047,2047]}],"revisions":[2047,2047]},"device":{"type":"string","revisions":[2047,2047]},"allow_subnet_overlap":{"type":"string","'
+    'options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"gui_dnsfilter":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ses_denied_traffic"'
+    ':{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"block_l'
+    'and_attack":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"bfd_detect_mult":{"type":"integer","revisions":[2047,2047]},"v4_ecmp_mode":{"type":"string","options":[{"value":"source-ip-based","revisions":[204'
+    '7,2047]},{"value":"weight-based","revisions":[2047,2047]},{"value":"usage-based","revisions":[2047,2047]},{"value":"source-dest-ip-based","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"gateway6":{"type":"string","revisions":[2047,2047]},"gui_nat46_64":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip6":{"type":"string","revisions":[2047,2047]},"gui'
+    '_file_filter":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,19'
+    '20]},"inspection_mode":{"type":"string","options":[{"value":"proxy","revisions":[7,7]},{"value":"flow","revisions":[7,7]}],"revisions":[2047,7]}},"rev'
+    'isions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"deny_tcp_with_icmp":{"type":"str","required":false,"choices":["enable","disable"]},"email_portal_check_dns'
+    '":{"type":"str","required":false,"choices":["disable","enable"]},"gui_advanced_policy":{"type":"str","required":false,"choices":["enable","disable"]},'
+    '"sip_ssl_port":{"type":"int","required":false},"prp_trailer_action":{"type":"str","required":false,"choices":["enable","disable"]},"dhcp_proxy_interfa'
+    'ce_select_method":{"type":"str","required":false},"gui_threat_weight":{"type":"str","required":false,"choices":["enable","disable"]},"dhcp_server_ip":'
+    '{"type":"str","required":false},"sccp_port":{"type":"int","required":false},"gui_switch_controller":{"type":"str","required":false,"choices":["enable"'
+    ',"disable"]},"gui_voip_profile":{"type":"str","required":false,"choices":["enable","disable"]},"consolidated_firewall_mode":{"type":"str","required":f'
+    'alse},"gui_local_in_policy":{"type":"str","required":false,"choices":["enable","disable"]},"bfd":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]},"gui_dlp":{"type":"str","required":false},"manageip6":{"type":"str","required":false},"opmode":{"type":"str","required":false,"choices":["na'
+    't","transparent"]},"gui_videofilter":{"type":"str","required":false,"choices":["enable","disable"]},"ecmp_max_paths":{"type":"int","required":false},"'
+    'wccp_cache_engine":{"type":"str","required":false,"choices":["enable","disable"]},"bfd_required_min_rx":{"type":"int","required":false},"mac_ttl":{"ty'
+    'pe":"int","required":false},"gtp_monitor_mode":{"type":"str","required":false,"choices":["enable","disable"]},"sip_helper":{"type":"str","required":fa'
+    'lse},"gui_wireless_controller":{"type":"str","required":false,"choices":["enable","disable"]},"sip_nat_trace":{"type":"str","required":false,"choices"'
+    ':["enable","disable"]},"vpn_stats_log":{"type":"list","required":false,"choices":["ipsec","pptp","l2tp","ssl"]},"gui_antivirus":{"type":"str","require'
+    'd":false,"choices":["enable","disable"]},"ike_port":{"type":"int","required":false},"gui_waf_profile":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"multicast_forward":{"type":"str","required":false,"choices":["enable","disable"]},"gui_wan_load_balancing":{"type":"str","required":fa'
+    'lse,"choices":["enable","disable"]},"tcp_session_without_syn":{"type":"str","required":false,"choices":["enable","disable"]},"asymroute_icmp":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"sip_expectation":{"type":"str","required":false,"choices":["enable","disable"]},"gui_email_col'
+    'lection":{"type":"str","required":false,"choices":["enable","disable"]},"gui_security_profile_group":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"gui_policy_based_ipsec":{"type":"str","required":false,"choices":["enable","disable"]},"ike_dn_format":{"type":"str","required":false,"'
+    'choices":["with-space","no-space"]},"gui_implicit_policy":{"type":"str","required":false,"choices":["enable","disable"]},"ssl_ssh_profile":{"type":"st'
+    'r","required":false},"application_bandwidth_tracking":{"type":"str","required":false,"choices":["disable","enable"]},"comments":{"type":"str","require'
+    'd":false},"gateway":{"type":"str","required":false},"central_nat":{"type":"str","required":false,"choices":["enable","disable"]},"gui_wanopt_cache":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"gui_dhcp_advanced":{"type":"str","required":false,"choices":["enable","disable"]},"compl'
+    'iance_check":{"type":"str","required":false},"multicast_skip_policy":{"type":"str","required":false,"choices":["enable","disable"]},"ngfw_mode":{"type'
+    '":"str","required":false,"choices":["profile-based","policy-based"]},"gui_application_control":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"asymroute6_icmp":{"type":"str","required":false,"choices":["enable","disable"]},"bfd_dont_enforce_src_port":{"type":"str","required":false,"c'
+    'hoices":["enable","disable"]},"allow_linkdown_path":{"type":"str","required":false,"choices":["enable","disable"]},"gtp_asym_fgsp":{"type":"str","requ'
+    'ired":false,"choices":["disable","enable"]},"gui_allow_unnamed_policy":{"type":"str","required":false,"choices":["enable","disable"]},"gui_default_pol'
+    'icy_columns":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"gui_dynamic_profile_display":{"type":"str","required'
+    '":false},"implicit_allow_dns":{"type":"str","required":false},"strict_src_check":{"type":"str","required":false,"choices":["enable","disable"]},"gui_o'
+    'bject_colors":{"type":"str","required":false,"choices":["enable","disable"]},"manageip":{"type":"str","required":false},"gui_endpoint_control_advanced'
+    '":{"type":"str","required":false,"choices":["enable","disable"]},"utf8_spam_tagging":{"type":"str","required":false,"choices":["enable","disable"]},"g'
+    'ui_traffic_shaping":{"type":"str","required":false,"choices":["enable","disable"]},"link_down_access":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"gui_dynamic_routing":{"type":"str","required":false,"choices":["enable","disable"]},"auxiliary_session":{"type":"str","required":false'
+    ',"choices":["enable","disable"]},"dhcp_proxy_interface":{"type":"str","required":false},"snat_hairpin_traffic":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"gui_ips":{"type":"str","required":false,"choices":["enable","disable"]},"gui_ztna":{"type":"str","required":false,"choices":['
+    '"enable","disable"]},"gui_ap_profile":{"type":"str","required":false,"choices":["enable","disable"]},"gui_domain_ip_reputation":{"type":"str","require'
+    'd":false},"default_voip_alg_mode":{"type":"str","required":false,"choices":["proxy-based","kernel-helper-based"]},"dhcp6_server_ip":{"type":"str","req'
+    'uired":false},"gui_dos_policy":{"type":"str","required":false,"choices":["enable","disable"]},"gui_dns_database":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"bfd_desired_min_tx":{"type":"int","required":false},"gui_local_reports":{"type":"str","required":false,"choices":["enable",'
+    '"disable"]},"sctp_session_without_init":{"type":"str","required":false,"choices":["enable","disable"]},"gui_fortiextender_controller":{"type":"str","r'
+    'equired":false,"choices":["enable","disable"]},"gui_spamfilter":{"type":"str","required":false,"choices":["enable","disable"]},"discovered_device_time'
+    'out":{"type":"int","required":false},"gui_multiple_utm_profiles":{"type":"str","required":false},"fw_session_hairpin":{"type":"str","required":false,"'
+    'choices":["enable","disable"]},"gui_load_balance":{"type":"str","required":false,"choices":["enable","disable"]},"gui_policy_learning":{"type":"str","'
+    'required":false},"gui_policy_disclaimer":{"type":"str","required":false,"choices":["enable","disable"]},"dhcp_proxy":{"type":"str","required":false,"c'
+    'hoices":["enable","disable"]},"gui_sslvpn_realms":{"type":"str","required":false,"choices":["enable","disable"]},"sip_tcp_port":{"type":"int","require'
+    'd":false},"gui_explicit_proxy":{"type":"str","required":false,"choices":["enable","disable"]},"gui_multiple_interface_policy":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]},"sip_udp_port":{"type":"int","required":false},"gui_webfilter_advanced":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"gui_replacement_message_groups":{"type":"str","required":false},"ike_quick_crash_detect":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"lldp_reception":{"type":"str","required":false,"choices":["enable","disable","global"]},"gui_sslvpn_personal_bookmarks":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"ip":{"type":"str","required":false},"multicast_ttl_notchange":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"gui_icap":{"type":"str","required":false,"choices":["enable","disable"]},"ike_session_resume":{"type":"str","req'
+    'uired":false,"choices":["enable","disable"]},"location_id":{"type":"str","required":false},"gui_multicast_policy":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"vpn_stats_period":{"type":"int","required":false},"gui_webfilter":{"type":"str","required":false,"choices":["enable","disa'
+    'ble"]},"gui_per_policy_disclaimer":{"type":"str","required":false},"http_external_dest":{"type":"str","required":false,"choices":["fortiweb","forticac'
+    'he"]},"lldp_transmission":{"type":"str","required":false,"choices":["enable","disable","global"]},"asymroute6":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"status":{"type":"str","required":false,"choices":["enable","disable"]},"asymroute":{"type":"str","required":false,"choices":['
+    '"enable","disable"]},"gui_endpoint_control":{"type":"str","required":false,"choices":["enable","disable"]},"gui_fortiap_split_tunneling":{"type":"str"'
+    ',"required":false,"choices":["enable","disable"]},"gui_vpn":{"type":"str","required":false,"choices":["enable","disable"]},"firewall_session_dirty":{"'
+    'type":"str","required":false,"choices":["check-all","check-new","check-policy-option"]},"device":{"type":"str","required":false},"allow_subnet_overlap'
+    '":{"type":"str","required":false,"choices":["enable","disable"]},"gui_dnsfilter":{"type":"str","required":false,"choices":["enable","disable"]},"ses_d'
+    'enied_traffic":{"type":"str","required":false,"choices":["enable","disable"]},"block_land_attack":{"type":"str","required":false,"choices":["disable",'
+    '"enable"]},"bfd_detect_mult":{"type":"int","required":false},"v4_ecmp_mode":{"type":"str","required":false,"choices":["source-ip-based","weight-based"'
+    ',"usage-based","source-dest-ip-based"]},"gateway6":{"type":"str","required":false},"gui_nat46_64":{"type":"str","required":false,"choices":["enable","'
+    'disable"]},"ip6":{"type":"str","required":false},"gui_file_filter":{"type":"str","required":false,"choices":["enable","disable"]},"inspection_mode":{"'
+    'type":"str","required":false}}}'
+)
@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"collector_port":{"type":"integer","revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2047,2047]},"collecto'
+    'r_ip":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"collector_port":{"type":"int","required":false},"source_ip":{"type":"str","required":false},"collector_ip"'
+    ':{"type":"str","required":false}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"ntpsync":{"type":"string","options":[{"value":"enable","revisions":[16,16]},{"value":"disable","revisions":[16,16]}],"revi'
+    'sions":[16,16]},"syncinterval":{"type":"integer","revisions":[16,16]},"ntpserver":{"type":"list","children":{"id":{"type":"integer","revisions":[16,16'
+    ']},"server":{"type":"string","revisions":[16,16]}},"revisions":[16,16]},"channel":{"type":"integer","revisions":[16,16]}},"revisions":[16,16]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"ntpsync":{"type":"str","required":false,"choices":["enable","disable"]},"syncinterval":{"type":"int","requ'
+    'ired":false},"ntpserver":{"type":"list","required":false,"options":{"id":{"type":"int","required":false},"server":{"type":"str","required":false}}},"c'
+    'hannel":{"type":"int","required":false}}}'
+)
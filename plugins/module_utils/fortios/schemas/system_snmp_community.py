@@ -0,0 +1,50 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"hosts6":{"type":"list","children":{"ipv6":{"type":"string","revisions":[2047,2047]},"host_type":{"type":"string","options"'
+    ':[{"value":"any","revisions":[2047,2047]},{"value":"query","revisions":[2047,2047]},{"value":"trap","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"ha_direct":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"source_ipv6":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"name":{"type":"'
+    'string","revisions":[2047,2047]},"query_v1_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"trap_v2c_rport":{"type":"integer","revisions":[2047,2047]},'
+    '"query_v1_port":{"type":"integer","revisions":[2047,2047]},"hosts":{"type":"list","children":{"ip":{"type":"string","revisions":[2047,2047]},"source_i'
+    'p":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"ha_direct":{"type":"string","options":[{"value":"enable"'
+    ',"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"host_type":{"type":"string","options":[{"value":"any"'
+    ',"revisions":[2047,2047]},{"value":"query","revisions":[2047,2047]},{"value":"trap","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2'
+    '047,2047]},"trap_v1_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"trap_v1_lport":{"type":"integer","revisions":[2047,2047]},"trap_v2c_status":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"trap_v1_rport":{"type":"integer","revisions":[2047,2047]},"eve'
+    'nts":{"multiple_values":true,"type":"list","options":[{"value":"cpu-high","revisions":[2047,2047]},{"value":"mem-low","revisions":[2047,2047]},{"value'
+    '":"log-full","revisions":[2047,2047]},{"value":"intf-ip","revisions":[2047,2047]},{"value":"vpn-tun-up","revisions":[2047,2047]},{"value":"vpn-tun-dow'
+    'n","revisions":[2047,2047]},{"value":"ha-switch","revisions":[2047,2047]},{"value":"ha-hb-failure","revisions":[2047,2047]},{"value":"ips-signature","'
+    'revisions":[2047,2047]},{"value":"ips-anomaly","revisions":[2047,2047]},{"value":"av-virus","revisions":[2047,2047]},{"value":"av-oversize","revisions'
+    '":[2047,2047]},{"value":"av-pattern","revisions":[2047,2047]},{"value":"av-fragmented","revisions":[2047,2047]},{"value":"fm-if-change","revisions":[2'
+    '047,2047]},{"value":"fm-conf-change","revisions":[2047,2047]},{"value":"bgp-established","revisions":[2047,2047]},{"value":"bgp-backward-transition","'
+    'revisions":[2047,2047]},{"value":"ha-member-up","revisions":[2047,2047]},{"value":"ha-member-down","revisions":[2047,2047]},{"value":"ent-conf-change"'
+    ',"revisions":[2047,2047]},{"value":"av-conserve","revisions":[2047,2047]},{"value":"av-bypass","revisions":[2047,2047]},{"value":"av-oversize-passed",'
+    '"revisions":[2047,2047]},{"value":"av-oversize-blocked","revisions":[2047,2047]},{"value":"ips-pkg-update","revisions":[2047,2047]},{"value":"ips-fail'
+    '-open","revisions":[2047,2047]},{"value":"temperature-high","revisions":[2047,1023]},{"value":"voltage-alert","revisions":[2047,1023]},{"value":"power'
+    '-supply-failure","revisions":[2047,1023]},{"value":"faz-disconnect","revisions":[2047,2047]},{"value":"fan-failure","revisions":[2047,1023]},{"value":'
+    '"wc-ap-up","revisions":[2047,2047]},{"value":"wc-ap-down","revisions":[2047,2047]},{"value":"fswctl-session-up","revisions":[2047,2047]},{"value":"fsw'
+    'ctl-session-down","revisions":[2047,2047]},{"value":"load-balance-real-server-down","revisions":[2047,2047]},{"value":"device-new","revisions":[2047,2'
+    '047]},{"value":"per-cpu-high","revisions":[2047,2047]},{"value":"dhcp","revisions":[1920,1920]},{"value":"ospf-nbr-state-change","revisions":[1024,102'
+    '4]},{"value":"ospf-virtnbr-state-change","revisions":[1024,1024]}],"revisions":[2047,2047]},"query_v2c_status":{"type":"string","options":[{"value":"e'
+    'nable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"trap_v2c_lport":{"type":"integer","revisions":['
+    '2047,2047]},"query_v2c_port":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"hosts6":{"type":"list","required":'
+    'false,"options":{"ipv6":{"type":"str","required":false},"host_type":{"type":"str","required":false,"choices":["any","query","trap"]},"ha_direct":{"typ'
+    'e":"str","required":false,"choices":["enable","disable"]},"source_ipv6":{"type":"str","required":false},"id":{"type":"int","required":false}}},"name":'
+    '{"type":"str","required":false},"query_v1_status":{"type":"str","required":false,"choices":["enable","disable"]},"id":{"type":"int","required":false},'
+    '"trap_v2c_rport":{"type":"int","required":false},"query_v1_port":{"type":"int","required":false},"hosts":{"type":"list","required":false,"options":{"i'
+    'p":{"type":"str","required":false},"source_ip":{"type":"str","required":false},"id":{"type":"int","required":false},"ha_direct":{"type":"str","require'
+    'd":false,"choices":["enable","disable"]},"host_type":{"type":"str","required":false,"choices":["any","query","trap"]}}},"trap_v1_status":{"type":"str"'
+    ',"required":false,"choices":["enable","disable"]},"trap_v1_lport":{"type":"int","required":false},"trap_v2c_status":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"trap_v1_rport":{"type":"int","required":false},"events":{"type":"list","required":false},"query_v2c_status":{"type":"str'
+    '","required":false,"choices":["enable","disable"]},"trap_v2c_lport":{"type":"int","required":false},"query_v2c_port":{"type":"int","required":false}}}'
+)
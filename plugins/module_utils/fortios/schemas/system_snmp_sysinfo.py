@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"trap_log_full_threshold":{"type":"integer","revisions":[2047,2047]},"trap_low_memory_threshold":{"type":"integer","revisio'
+    'ns":[2047,2047]},"contact_info":{"type":"string","revisions":[2047,2047]},"engine_id":{"type":"string","revisions":[2047,2047]},"location":{"type":"st'
+    'ring","revisions":[2047,2047]},"trap_high_cpu_threshold":{"type":"integer","revisions":[2047,2047]},"description":{"type":"string","revisions":[2047,2'
+    '047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"trap_log_full_threshold":{"type":"'
+    'int","required":false},"trap_low_memory_threshold":{"type":"int","required":false},"contact_info":{"type":"str","required":false},"engine_id":{"type":'
+    '"str","required":false},"location":{"type":"str","required":false},"trap_high_cpu_threshold":{"type":"int","required":false},"description":{"type":"st'
+    'r","required":false}}}'
+)
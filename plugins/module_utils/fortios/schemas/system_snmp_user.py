@@ -0,0 +1,45 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"trap_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"auth_pwd":{"type":"string","revisions":[2047,2047]},"priv_pwd":{"typ'
+    'e":"string","revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2047,2047]},"priv_proto":{"type":"string","options":[{"value":"aes","re'
+    'visions":[2047,2047]},{"value":"des","revisions":[2047,2047]},{"value":"aes256","revisions":[2047,2047]},{"value":"aes256cisco","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"security_level":{"type":"string","options":[{"value":"no-auth-no-priv","revisions":[2047,2047]},{"value":"auth-no-priv",'
+    '"revisions":[2047,2047]},{"value":"auth-priv","revisions":[2047,2047]}],"revisions":[2047,2047]},"query_port":{"type":"integer","revisions":[2047,2047'
+    ']},"notify_hosts":{"type":"list","revisions":[2047,2047]},"trap_rport":{"type":"integer","revisions":[2047,2047]},"source_ipv6":{"type":"string","revi'
+    'sions":[2047,2047]},"queries":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"notify_hosts6":{"type":"list","revisions":[2047,2047]},"trap_lport":{"type":"integer","revisions":[2047,2047]},"events":{"multip'
+    'le_values":true,"type":"list","options":[{"value":"cpu-high","revisions":[2047,2047]},{"value":"mem-low","revisions":[2047,2047]},{"value":"log-full",'
+    '"revisions":[2047,2047]},{"value":"intf-ip","revisions":[2047,2047]},{"value":"vpn-tun-up","revisions":[2047,2047]},{"value":"vpn-tun-down","revisions'
+    '":[2047,2047]},{"value":"ha-switch","revisions":[2047,2047]},{"value":"ha-hb-failure","revisions":[2047,2047]},{"value":"ips-signature","revisions":[2'
+    '047,2047]},{"value":"ips-anomaly","revisions":[2047,2047]},{"value":"av-virus","revisions":[2047,2047]},{"value":"av-oversize","revisions":[2047,2047]'
+    '},{"value":"av-pattern","revisions":[2047,2047]},{"value":"av-fragmented","revisions":[2047,2047]},{"value":"fm-if-change","revisions":[2047,2047]},{"'
+    'value":"fm-conf-change","revisions":[2047,2047]},{"value":"bgp-established","revisions":[2047,2047]},{"value":"bgp-backward-transition","revisions":[2'
+    '047,2047]},{"value":"ha-member-up","revisions":[2047,2047]},{"value":"ha-member-down","revisions":[2047,2047]},{"value":"ent-conf-change","revisions":'
+    '[2047,2047]},{"value":"av-conserve","revisions":[2047,2047]},{"value":"av-bypass","revisions":[2047,2047]},{"value":"av-oversize-passed","revisions":['
+    '2047,2047]},{"value":"av-oversize-blocked","revisions":[2047,2047]},{"value":"ips-pkg-update","revisions":[2047,2047]},{"value":"ips-fail-open","revis'
+    'ions":[2047,2047]},{"value":"temperature-high","revisions":[2047,1023]},{"value":"voltage-alert","revisions":[2047,1023]},{"value":"power-supply-failu'
+    're","revisions":[2047,1023]},{"value":"faz-disconnect","revisions":[2047,2047]},{"value":"fan-failure","revisions":[2047,1023]},{"value":"wc-ap-up","r'
+    'evisions":[2047,2047]},{"value":"wc-ap-down","revisions":[2047,2047]},{"value":"fswctl-session-up","revisions":[2047,2047]},{"value":"fswctl-session-d'
+    'own","revisions":[2047,2047]},{"value":"load-balance-real-server-down","revisions":[2047,2047]},{"value":"device-new","revisions":[2047,2047]},{"value'
+    '":"per-cpu-high","revisions":[2047,2047]},{"value":"dhcp","revisions":[1920,1920]},{"value":"ospf-nbr-state-change","revisions":[1024,1024]},{"value":'
+    '"ospf-virtnbr-state-change","revisions":[1024,1024]}],"revisions":[2047,2047]},"ha_direct":{"type":"string","options":[{"value":"enable","revisions":['
+    '2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_proto":{"type":"string","options":[{"value":"md5","revisions":'
+    '[2047,2047]},{"value":"sha","revisions":[2047,2047]},{"value":"sha224","revisions":[2040,2040]},{"value":"sha256","revisions":[2040,2040]},{"value":"s'
+    'ha384","revisions":[2040,2040]},{"value":"sha512","revisions":[2040,2040]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"trap_status":{"type":"str","requir'
+    'ed":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"auth_pwd":{"type":"str","required":false},"priv_pwd":{"type":"str","'
+    'required":false},"source_ip":{"type":"str","required":false},"priv_proto":{"type":"str","required":false,"choices":["aes","des","aes256","aes256cisco"'
+    ']},"security_level":{"type":"str","required":false,"choices":["no-auth-no-priv","auth-no-priv","auth-priv"]},"query_port":{"type":"int","required":fal'
+    'se},"notify_hosts":{"type":"list","required":false},"trap_rport":{"type":"int","required":false},"source_ipv6":{"type":"str","required":false},"querie'
+    's":{"type":"str","required":false,"choices":["enable","disable"]},"notify_hosts6":{"type":"list","required":false},"trap_lport":{"type":"int","require'
+    'd":false},"events":{"type":"list","required":false},"ha_direct":{"type":"str","required":false,"choices":["enable","disable"]},"auth_proto":{"type":"s'
+    'tr","required":false}}}'
+)
@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}'
+    '],"revisions":[1024,1024]},"diffserv":{"type":"string","revisions":[1024,1024]},"server_name":{"type":"string","revisions":[1024,1024]},"update_inband'
+    'width_minimum":{"type":"integer","revisions":[1024,1024]},"schedules":{"type":"list","children":{"name":{"type":"string","revisions":[1024,1024]}},"re'
+    'visions":[1024,1024]},"update_inbandwidth_maximum":{"type":"integer","revisions":[1024,1024]},"update_outbandwidth_maximum":{"type":"integer","revisio'
+    'ns":[1024,1024]},"update_inbandwidth":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024'
+    ']}],"revisions":[1024,1024]},"update_outbandwidth":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revision'
+    's":[1024,1024]}],"revisions":[1024,1024]},"interface":{"type":"string","revisions":[1024,1024]},"update_outbandwidth_minimum":{"type":"integer","revis'
+    'ions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"diffserv":{"type":"str","required"'
+    ':false},"server_name":{"type":"str","required":false},"update_inbandwidth_minimum":{"type":"int","required":false},"schedules":{"type":"list","require'
+    'd":false,"options":{"name":{"type":"str","required":false}}},"update_inbandwidth_maximum":{"type":"int","required":false},"update_outbandwidth_maximum'
+    '":{"type":"int","required":false},"update_inbandwidth":{"type":"str","required":false,"choices":["disable","enable"]},"update_outbandwidth":{"type":"s'
+    'tr","required":false,"choices":["disable","enable"]},"interface":{"type":"str","required":false},"update_outbandwidth_minimum":{"type":"int","required'
+    '":false}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"timestamp":{"type":"integer","revisions":[2040,2040]},"host":{"type":"list","children":{"id":{"type":"integer","revisions"'
+    ':[2040,2040]},"ip":{"type":"string","revisions":[2040,2040]},"password":{"type":"string","revisions":[2040,2040]},"port":{"type":"integer","revisions"'
+    ':[2040,2040]},"user":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]}},"revisions"'
+    ':[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"timestamp":{"type":"int","required":false},"host":{"type":"list","required":false,"options":{"id":{"type":'
+    '"int","required":false},"ip":{"type":"str","required":false},"password":{"type":"str","required":false},"port":{"type":"int","required":false},"user":'
+    '{"type":"str","required":false}}},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,51 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"gui_vdom_menu_favorites":{"type":"list","children":{"id":{"type":"string","revisions":[16,16]}},"revisions":[2032,16]},"na'
+    'me":{"type":"string","revisions":[2040,2040]},"gui_new_feature_acknowledge":{"type":"list","children":{"id":{"type":"string","revisions":[16,16]}},"re'
+    'visions":[2032,16]},"gui_ignore_release_overview_version":{"type":"string","revisions":[1792,256]},"accprofile":{"type":"string","revisions":[2040,204'
+    '0]},"gui_global_menu_favorites":{"type":"list","children":{"id":{"type":"string","revisions":[16,16]}},"revisions":[2032,16]},"gui_dashboard":{"type":'
+    '"list","children":{"widget":{"type":"list","children":{"x_pos":{"type":"integer","revisions":[16,16]},"title":{"type":"string","revisions":[16,16]},"f'
+    'ortiview_type":{"type":"string","revisions":[16,16]},"industry":{"type":"string","options":[{"value":"default","revisions":[16,16]},{"value":"custom",'
+    '"revisions":[16,16]}],"revisions":[16,16]},"region":{"type":"string","options":[{"value":"default","revisions":[16,16]},{"value":"custom","revisions":'
+    '[16,16]}],"revisions":[16,16]},"fortiview_sort_by":{"type":"string","revisions":[16,16]},"fortiview_device":{"type":"string","revisions":[16,16]},"for'
+    'tiview_filters":{"type":"list","children":{"value":{"type":"string","revisions":[16,16]},"id":{"type":"integer","revisions":[16,16]},"key":{"type":"st'
+    'ring","revisions":[16,16]}},"revisions":[16,16]},"height":{"type":"integer","revisions":[16,16]},"fabric_device":{"type":"string","revisions":[16,16]}'
+    ',"interface":{"type":"string","revisions":[16,16]},"fortiview_visualization":{"type":"string","revisions":[16,16]},"fabric_device_widget_visualization'
+    '_type":{"type":"string","revisions":[16,16]},"y_pos":{"type":"integer","revisions":[16,16]},"id":{"type":"integer","revisions":[16,16]},"fabric_device'
+    '_widget_name":{"type":"string","revisions":[16,16]},"fortiview_timeframe":{"type":"string","revisions":[16,16]},"type":{"type":"string","options":[{"v'
+    'alue":"sysinfo","revisions":[16,16]},{"value":"licinfo","revisions":[16,16]},{"value":"forticloud","revisions":[16,16]},{"value":"cpu-usage","revision'
+    's":[16,16]},{"value":"memory-usage","revisions":[16,16]},{"value":"disk-usage","revisions":[16,16]},{"value":"log-rate","revisions":[16,16]},{"value":'
+    '"sessions","revisions":[16,16]},{"value":"session-rate","revisions":[16,16]},{"value":"tr-history","revisions":[16,16]},{"value":"analytics","revision'
+    's":[16,16]},{"value":"usb-modem","revisions":[16,16]},{"value":"admins","revisions":[16,16]},{"value":"security-fabric","revisions":[16,16]},{"value":'
+    '"security-fabric-ranking","revisions":[16,16]},{"value":"sensor-info","revisions":[16,16]},{"value":"ha-status","revisions":[16,16]},{"value":"vulnera'
+    'bility-summary","revisions":[16,16]},{"value":"host-scan-summary","revisions":[16,16]},{"value":"fortiview","revisions":[16,16]},{"value":"botnet-acti'
+    'vity","revisions":[16,16]},{"value":"fabric-device","revisions":[16,16]}],"revisions":[16,16]},"width":{"type":"integer","revisions":[16,16]}},"revisi'
+    'ons":[16,16]},"name":{"type":"string","revisions":[16,16]},"permanent":{"type":"string","options":[{"value":"disable","revisions":[16,16]},{"value":"e'
+    'nable","revisions":[16,16]}],"revisions":[16,16]},"vdom":{"type":"string","revisions":[16,16]},"layout_type":{"type":"string","options":[{"value":"res'
+    'ponsive","revisions":[16,16]},{"value":"fixed","revisions":[16,16]}],"revisions":[16,16]},"id":{"type":"integer","revisions":[16,16]},"columns":{"type'
+    '":"integer","revisions":[16,16]}},"revisions":[2032,16]},"vdom":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revision'
+    's":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"gui_vdom_menu_favorites":{"type":"list","required":false,"options":{"id":{"type":"str","required":false}}}'
+    ',"name":{"type":"str","required":false},"gui_new_feature_acknowledge":{"type":"list","required":false,"options":{"id":{"type":"str","required":false}}'
+    '},"gui_ignore_release_overview_version":{"type":"str","required":false},"accprofile":{"type":"str","required":false},"gui_global_menu_favorites":{"typ'
+    'e":"list","required":false,"options":{"id":{"type":"str","required":false}}},"gui_dashboard":{"type":"list","required":false,"options":{"widget":{"typ'
+    'e":"list","required":false,"options":{"x_pos":{"type":"int","required":false},"title":{"type":"str","required":false},"fortiview_type":{"type":"str","'
+    'required":false},"industry":{"type":"str","required":false,"choices":["default","custom"]},"region":{"type":"str","required":false,"choices":["default'
+    '","custom"]},"fortiview_sort_by":{"type":"str","required":false},"fortiview_device":{"type":"str","required":false},"fortiview_filters":{"type":"list"'
+    ',"required":false,"options":{"value":{"type":"str","required":false},"id":{"type":"int","required":false},"key":{"type":"str","required":false}}},"hei'
+    'ght":{"type":"int","required":false},"fabric_device":{"type":"str","required":false},"interface":{"type":"str","required":false},"fortiview_visualizat'
+    'ion":{"type":"str","required":false},"fabric_device_widget_visualization_type":{"type":"str","required":false},"y_pos":{"type":"int","required":false}'
+    ',"id":{"type":"int","required":false},"fabric_device_widget_name":{"type":"str","required":false},"fortiview_timeframe":{"type":"str","required":false'
+    '},"type":{"type":"str","required":false,"choices":["sysinfo","licinfo","forticloud","cpu-usage","memory-usage","disk-usage","log-rate","sessions","ses'
+    'sion-rate","tr-history","analytics","usb-modem","admins","security-fabric","security-fabric-ranking","sensor-info","ha-status","vulnerability-summary"'
+    ',"host-scan-summary","fortiview","botnet-activity","fabric-device"]},"width":{"type":"int","required":false}}},"name":{"type":"str","required":false},'
+    '"permanent":{"type":"str","required":false,"choices":["disable","enable"]},"vdom":{"type":"str","required":false},"layout_type":{"type":"str","require'
+    'd":false,"choices":["responsive","fixed"]},"id":{"type":"int","required":false},"columns":{"type":"int","required":false}}},"vdom":{"type":"list","req'
+    'uired":false,"options":{"name":{"type":"str","required":false}}}}}'
+)
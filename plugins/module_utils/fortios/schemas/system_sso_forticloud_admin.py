@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[1024,1024]},"vdom":{"type":"list","children":{"name":{"type":"string","revisions":[102'
+    '4,1024]}},"revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"vdom":{"type":"list","required":false,"options":{"name":{"type":"st'
+    'r","required":false}}}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"standalone_group_id":{"type":"integer","revisions":[1920,1920]},"encryption":{"type":"string","options":[{"value":"enable"'
+    ',"revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"psksecret":{"type":"string","revisions":[1920,1920]},'
+    '"group_member_id":{"type":"integer","revisions":[1920,1920]},"session_sync_dev":{"type":"string","revisions":[1920,1920]},"layer2_connection":{"type":'
+    '"string","options":[{"value":"available","revisions":[1920,1920]},{"value":"unavailable","revisions":[1920,1920]}],"revisions":[1920,1920]}},"revision'
+    's":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"standalone_group_id":{"type":"int","required":false},"encryption":{"type":"str","required":false,"choices"'
+    ':["enable","disable"]},"psksecret":{"type":"str","required":false},"group_member_id":{"type":"int","required":false},"session_sync_dev":{"type":"str",'
+    '"required":false},"layer2_connection":{"type":"str","required":false,"choices":["available","unavailable"]}}}'
+)
@@ -0,0 +1,20 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"partition":{"type":"string","revisions":[2047,2047]},"media_status":{"typ'
+    'e":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]},{"value":"fail","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"usage":{"type":"string","options":[{"value":"log","revisions":[2047,2047]},{"value":"wanopt","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"device":{"type":"string","revisions":[2047,2047]},"wanopt_mode":{"type":"string","options":[{"value":"mix","revisions":[2047,20'
+    '47]},{"value":"wanopt","revisions":[2047,2047]},{"value":"webcache","revisions":[2047,2047]}],"revisions":[2047,2047]},"order":{"type":"integer","revi'
+    'sions":[2047,2047]},"size":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":fal'
+    'se},"partition":{"type":"str","required":false},"media_status":{"type":"str","required":false,"choices":["enable","disable","fail"]},"usage":{"type":"'
+    'str","required":false,"choices":["log","wanopt"]},"device":{"type":"str","required":false},"wanopt_mode":{"type":"str","required":false,"choices":["mi'
+    'x","wanopt","webcache"]},"order":{"type":"int","required":false},"size":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","revisions":[1919,7]},"max_age":{"type":"integer","revisions":[1919,1919]},"region_name":{"type":'
+    '"string","revisions":[1919,7]},"hello_time":{"type":"integer","revisions":[1919,1919]},"config_revision":{"type":"integer","revisions":[1919,7]},"swit'
+    'ch_priority":{"type":"string","options":[{"value":"0","revisions":[1919,1919]},{"value":"4096","revisions":[1919,1919]},{"value":"8192","revisions":[1'
+    '919,1919]},{"value":"12288","revisions":[1919,1919]},{"value":"16384","revisions":[1919,1919]},{"value":"20480","revisions":[1919,1919]},{"value":"245'
+    '76","revisions":[1919,1919]},{"value":"28672","revisions":[1919,1919]},{"value":"32768","revisions":[1919,1919]},{"value":"36864","revisions":[1919,19'
+    '19]},{"value":"40960","revisions":[1919,1919]},{"value":"45056","revisions":[1919,1919]},{"value":"49152","revisions":[1919,1919]},{"value":"53248","r'
+    'evisions":[1919,1919]},{"value":"57344","revisions":[1919,1919]}],"revisions":[1919,1919]},"max_hops":{"type":"integer","revisions":[1919,1919]},"forw'
+    'ard_delay":{"type":"integer","revisions":[1919,1919]}},"revisions":[1919,1919]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false},"max_age":{"type":"int","required":false},"region_name":{"type":"s'
+    'tr","required":false},"hello_time":{"type":"int","required":false},"config_revision":{"type":"int","required":false},"switch_priority":{"type":"str","'
+    'required":false,"choices":["0","4096","8192","12288","16384","20480","24576","28672","32768","36864","40960","45056","49152","53248","57344"]},"max_ho'
+    'ps":{"type":"int","required":false},"forward_delay":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,22 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"span":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"mac_ttl":{"type":"integer","revisions":[1920,1664]},"member":{"type":"list"'
+    ',"children":{"interface_name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"intra_switch_policy":{"type":"string","options":[{"'
+    'value":"implicit","revisions":[2047,2047]},{"value":"explicit","revisions":[2047,2047]}],"revisions":[2047,2047]},"span_direction":{"type":"string","o'
+    'ptions":[{"value":"rx","revisions":[2047,2047]},{"value":"tx","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"span_source_port":{"type":"list","children":{"interface_name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"type":{"type":'
+    '"string","options":[{"value":"switch","revisions":[2047,2047]},{"value":"hub","revisions":[2047,2047]}],"revisions":[2047,2047]},"vdom":{"type":"strin'
+    'g","revisions":[2047,2047]},"span_dest_port":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"span":{"type":"str","required":false,"choices":["disable","enable"]},"name":{"type":"str","required":false'
+    '},"mac_ttl":{"type":"int","required":false},"member":{"type":"list","required":false,"options":{"interface_name":{"type":"str","required":false}}},"in'
+    'tra_switch_policy":{"type":"str","required":false,"choices":["implicit","explicit"]},"span_direction":{"type":"str","required":false,"choices":["rx","'
+    'tx","both"]},"span_source_port":{"type":"list","required":false,"options":{"interface_name":{"type":"str","required":false}}},"type":{"type":"str","re'
+    'quired":false,"choices":["switch","hub"]},"vdom":{"type":"str","required":false},"span_dest_port":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"flag":{"type":"integer","revisions":[2040,2040]},"temporary":{"type":"integer","revisions":[2047,7]},"name":{"type":"strin'
+    'g","revisions":[2047,2047]},"short_name":{"type":"string","revisions":[2047,2047]},"vcluster_id":{"type":"integer","revisions":[2047,2047]}},"revision'
+    's":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"flag":{"type":"int","required":false},"temporary":{"type":"int","required":false},"name":{"type":"str","re'
+    'quired":false},"short_name":{"type":"str","required":false},"vcluster_id":{"type":"int","required":false}}}'
+)
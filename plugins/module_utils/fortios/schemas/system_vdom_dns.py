@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"server_hostname":{"type":"list","children":{"hostname":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+    ',"ssl_certificate":{"type":"string","revisions":[2040,2040]},"protocol":{"multiple_values":true,"type":"list","options":[{"value":"cleartext","revisio'
+    'ns":[1024,1024]},{"value":"dot","revisions":[1024,1024]},{"value":"doh","revisions":[1024,1024]}],"revisions":[1024,1024]},"source_ip":{"type":"string'
+    '","revisions":[2047,2047]},"primary":{"type":"string","revisions":[2047,2047]},"dns_over_tls":{"type":"string","options":[{"value":"disable","revision'
+    's":[1016,1016]},{"value":"enable","revisions":[1016,1016]},{"value":"enforce","revisions":[1016,1016]}],"revisions":[2040,1016]},"interface_select_met'
+    'hod":{"type":"string","options":[{"value":"auto","revisions":[2024,2024]},{"value":"sdwan","revisions":[2024,2024]},{"value":"specify","revisions":[20'
+    '24,2024]}],"revisions":[2040,2024]},"interface":{"type":"string","revisions":[2040,2024]},"vdom_dns":{"type":"string","options":[{"value":"enable","re'
+    'visions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip6_primary":{"type":"string","revisions":[2047,2047]},"i'
+    'p6_secondary":{"type":"string","revisions":[2047,2047]},"secondary":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"server_hostname":{"type":"list","required":false,"options":{"hostname":{"type":"str","required":false}}},"'
+    'ssl_certificate":{"type":"str","required":false},"protocol":{"type":"list","required":false,"choices":["cleartext","dot","doh"]},"source_ip":{"type":"'
+    'str","required":false},"primary":{"type":"str","required":false},"dns_over_tls":{"type":"str","required":false},"interface_select_method":{"type":"str'
+    '","required":false},"interface":{"type":"str","required":false},"vdom_dns":{"type":"str","required":false,"choices":["enable","disable"]},"ip6_primary'
+    '":{"type":"str","required":false},"ip6_secondary":{"type":"str","required":false},"secondary":{"type":"str","required":false}}}'
+)
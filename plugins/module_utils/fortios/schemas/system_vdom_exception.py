@@ -0,0 +1,30 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"vdom":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"scope":{"type'
+    '":"string","options":[{"value":"all","revisions":[2047,2047]},{"value":"inclusive","revisions":[2047,2047]},{"value":"exclusive","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"oid":{"type":"integer","revisions":[2047,23]},"id":{"type":"integer","revisions":[2047,2047]},"object":{"type":"string"'
+    ',"options":[{"value":"log.fortianalyzer.setting","revisions":[2047,2047]},{"value":"log.fortianalyzer.override-setting","revisions":[2047,2047]},{"val'
+    'ue":"log.fortianalyzer2.setting","revisions":[2047,2045]},{"value":"log.fortianalyzer2.override-setting","revisions":[2047,2045]},{"value":"log.fortia'
+    'nalyzer3.setting","revisions":[2047,2045]},{"value":"log.fortianalyzer3.override-setting","revisions":[2047,2045]},{"value":"system.central-management'
+    '","revisions":[2047,2045]},{"value":"system.csf","revisions":[2047,2045]},{"value":"user.radius","revisions":[2047,2045]},{"value":"log.fortianalyzer-'
+    'cloud.setting","revisions":[2040,2040]},{"value":"log.fortianalyzer-cloud.override-setting","revisions":[2040,2040]},{"value":"log.syslogd.setting","r'
+    'evisions":[1920,1920]},{"value":"log.syslogd.override-setting","revisions":[1920,1920]},{"value":"log.syslogd2.setting","revisions":[1920,1920]},{"val'
+    'ue":"log.syslogd2.override-setting","revisions":[1920,1920]},{"value":"log.syslogd3.setting","revisions":[1920,1920]},{"value":"log.syslogd3.override-'
+    'setting","revisions":[1920,1920]},{"value":"log.syslogd4.setting","revisions":[1920,1920]},{"value":"log.syslogd4.override-setting","revisions":[1920,'
+    '1920]},{"value":"system.interface","revisions":[1024,1024]},{"value":"vpn.ipsec.phase1-interface","revisions":[1024,1024]},{"value":"vpn.ipsec.phase2-'
+    'interface","revisions":[1024,1024]},{"value":"router.bgp","revisions":[1024,1024]},{"value":"router.route-map","revisions":[1024,1024]},{"value":"rout'
+    'er.prefix-list","revisions":[1024,1024]},{"value":"firewall.ippool","revisions":[1024,1024]},{"value":"firewall.ippool6","revisions":[1024,1024]},{"va'
+    'lue":"router.static","revisions":[1024,1024]},{"value":"router.static6","revisions":[1024,1024]},{"value":"firewall.vip","revisions":[1024,1024]},{"va'
+    'lue":"firewall.vip6","revisions":[1024,1024]},{"value":"firewall.vip46","revisions":[1024,1024]},{"value":"firewall.vip64","revisions":[1024,1024]},{"'
+    'value":"system.sdwan","revisions":[1024,1024]},{"value":"system.saml","revisions":[1024,1024]},{"value":"router.policy","revisions":[1024,1024]},{"val'
+    'ue":"router.policy6","revisions":[1024,1024]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"vdom":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"scope":{"type":'
+    '"str","required":false,"choices":["all","inclusive","exclusive"]},"oid":{"type":"int","required":false},"id":{"type":"int","required":false},"object":'
+    '{"type":"str","required":false}}}'
+)
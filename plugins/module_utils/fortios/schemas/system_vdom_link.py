@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"type":{"type":"string","options":[{"value":"ppp","revisions":[2047,2047]},{"value":"ethernet","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"vcluster":{"type":"string","options":[{"value":"vcluster1","revisions":[2047,2047]},{"value":"vcluster2","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"type":{"type":"str","required":false,"choices":["ppp","ethernet"]},"vcluster":{"type":"str","required":fal'
+    'se,"choices":["vcluster1","vcluster2"]},"name":{"type":"str","required":false}}}'
+)
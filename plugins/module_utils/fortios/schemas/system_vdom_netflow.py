@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"vdom_netflow":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"collector_port":{"type":"integer","revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2047,2047]},"co'
+    'llector_ip":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"vdom_netflow":{"type":"str","required":false,"choices":["enable","disable"]},"collector_port":{"type":"int'
+    '","required":false},"source_ip":{"type":"str","required":false},"collector_ip":{"type":"str","required":false}}}'
+)
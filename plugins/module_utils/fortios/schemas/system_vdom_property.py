@@ -0,0 +1,25 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"service_group":{"type":"string","revisions":[2047,2047]},"firewall_address":{"type":"string","revisions":[2047,2047]},"fir'
+    'ewall_policy":{"type":"string","revisions":[2047,2047]},"snmp_index":{"type":"integer","revisions":[2047,2047]},"ipsec_phase1":{"type":"string","revis'
+    'ions":[2047,2047]},"description":{"type":"string","revisions":[2047,2047]},"session":{"type":"string","revisions":[2047,2047]},"ipsec_phase1_interface'
+    '":{"type":"string","revisions":[2047,2047]},"custom_service":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]'
+    '},"ipsec_phase2":{"type":"string","revisions":[2047,2047]},"ipsec_phase2_interface":{"type":"string","revisions":[2047,2047]},"dialup_tunnel":{"type":'
+    '"string","revisions":[2047,2047]},"log_disk_quota":{"type":"string","revisions":[2047,2047]},"user_group":{"type":"string","revisions":[2047,2047]},"s'
+    'slvpn":{"type":"string","revisions":[2047,2047]},"onetime_schedule":{"type":"string","revisions":[2047,2047]},"firewall_addrgrp":{"type":"string","rev'
+    'isions":[2047,2047]},"proxy":{"type":"string","revisions":[2047,2047]},"recurring_schedule":{"type":"string","revisions":[2047,2047]},"user":{"type":"'
+    'string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"service_group":{"type":"str","required":false},"firewall_address":{"type":"str","required":false},"firewal'
+    'l_policy":{"type":"str","required":false},"snmp_index":{"type":"int","required":false},"ipsec_phase1":{"type":"str","required":false},"description":{"'
+    'type":"str","required":false},"session":{"type":"str","required":false},"ipsec_phase1_interface":{"type":"str","required":false},"custom_service":{"ty'
+    'pe":"str","required":false},"name":{"type":"str","required":false},"ipsec_phase2":{"type":"str","required":false},"ipsec_phase2_interface":{"type":"st'
+    'r","required":false},"dialup_tunnel":{"type":"str","required":false},"log_disk_quota":{"type":"str","required":false},"user_group":{"type":"str","requ'
+    'ired":false},"sslvpn":{"type":"str","required":false},"onetime_schedule":{"type":"str","required":false},"firewall_addrgrp":{"type":"str","required":f'
+    'alse},"proxy":{"type":"str","required":false},"recurring_schedule":{"type":"str","required":false},"user":{"type":"str","required":false}}}'
+)
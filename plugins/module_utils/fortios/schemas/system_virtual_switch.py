@@ -0,0 +1,27 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"span":{"type":"string","options":[{"value":"disable","revisions":[1919,1919]},{"value":"enable","revisions":[1919,1919]}],'
+    '"revisions":[1919,1919]},"span_dest_port":{"type":"string","revisions":[1919,1919]},"physical_switch":{"type":"string","revisions":[1919,1919]},"span_'
+    'direction":{"type":"string","options":[{"value":"rx","revisions":[1919,1919]},{"value":"tx","revisions":[1919,1919]},{"value":"both","revisions":[1919'
+    ',1919]}],"revisions":[1919,1919]},"span_source_port":{"type":"string","revisions":[1919,1919]},"port":{"type":"list","children":{"status":{"type":"str'
+    'ing","options":[{"value":"up","revisions":[1919,1919]},{"value":"down","revisions":[1919,1919]}],"revisions":[1919,1919]},"alias":{"type":"string","re'
+    'visions":[1919,1919]},"speed":{"type":"string","options":[{"value":"auto","revisions":[1919,1919]},{"value":"10full","revisions":[1919,1919]},{"value"'
+    ':"10half","revisions":[1919,1919]},{"value":"100full","revisions":[1919,1919]},{"value":"100half","revisions":[1919,1919]},{"value":"1000full","revisi'
+    'ons":[1919,1919]},{"value":"1000half","revisions":[1919,1919]},{"value":"1000auto","revisions":[1919,1919]},{"value":"10000full","revisions":[1919,191'
+    '9]},{"value":"10000auto","revisions":[1919,1919]},{"value":"40000full","revisions":[1919,1919]},{"value":"100Gfull","revisions":[1919,1919]}],"revisio'
+    'ns":[1919,1919]},"name":{"type":"string","revisions":[1919,1919]},"mediatype":{"type":"string","options":[{"value":"cfp2-sr10","revisions":[1919,1919]'
+    '},{"value":"cfp2-lr4","revisions":[1919,1919]}],"revisions":[1919,1919]}},"revisions":[1919,1919]},"name":{"type":"string","revisions":[1919,1919]}},"'
+    'revisions":[1919,1919]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"span":{"type":"str","required":false,"choices":["disable","enable"]},"span_dest_port":{"type":"str","requi'
+    'red":false},"physical_switch":{"type":"str","required":false},"span_direction":{"type":"str","required":false,"choices":["rx","tx","both"]},"span_sour'
+    'ce_port":{"type":"str","required":false},"port":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["up","do'
+    'wn"]},"alias":{"type":"str","required":false},"speed":{"type":"str","required":false,"choices":["auto","10full","10half","100full","100half","1000full'
+    '","1000half","1000auto","10000full","10000auto","40000full","100Gfull"]},"name":{"type":"str","required":false},"mediatype":{"type":"str","required":f'
+    'alse,"choices":["cfp2-sr10","cfp2-lr4"]}}},"name":{"type":"str","required":false}}}'
+)
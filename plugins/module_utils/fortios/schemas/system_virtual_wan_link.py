@@ -0,0 +1,137 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[127,127]},{"value":"enable","revisions":[127,127]}],"r'
+    'evisions":[127,127]},"load_balance_mode":{"type":"string","options":[{"value":"source-ip-based","revisions":[127,127]},{"value":"weight-based","revisi'
+    'ons":[127,127]},{"value":"usage-based","revisions":[127,127]},{"value":"source-dest-ip-based","revisions":[127,127]},{"value":"measured-volume-based",'
+    '"revisions":[127,127]}],"revisions":[127,127]},"fail_alert_interfaces":{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}},"rev'
+    'isions":[127,127]},"neighbor":{"type":"list","children":{"member":{"type":"integer","revisions":[120,120]},"ip":{"type":"string","revisions":[120,120]'
+    '},"health_check":{"type":"string","revisions":[120,120]},"role":{"type":"string","options":[{"value":"standalone","revisions":[120,120]},{"value":"pri'
+    'mary","revisions":[120,120]},{"value":"secondary","revisions":[120,120]}],"revisions":[120,120]},"sla_id":{"type":"integer","revisions":[120,120]}},"r'
+    'evisions":[120,120]},"service":{"type":"list","children":{"jitter_weight":{"type":"integer","revisions":[127,127]},"internet_service_ctrl":{"type":"li'
+    'st","children":{"id":{"type":"integer","revisions":[7,7]}},"revisions":[127,7]},"protocol":{"type":"integer","revisions":[127,127]},"dscp_forward_tag"'
+    ':{"type":"string","revisions":[127,127]},"dscp_reverse_tag":{"type":"string","revisions":[127,127]},"dst6":{"type":"list","children":{"name":{"type":"'
+    'string","revisions":[127,127]}},"revisions":[127,127]},"end_port":{"type":"integer","revisions":[127,127]},"internet_service_app_ctrl":{"type":"list",'
+    '"children":{"id":{"type":"integer","revisions":[120,120]}},"revisions":[120,120]},"hold_down_time":{"type":"integer","revisions":[127,127]},"link_cost'
+    '_threshold":{"type":"integer","revisions":[127,127]},"src6":{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}},"revisions":[12'
+    '7,127]},"bandwidth_weight":{"type":"integer","revisions":[127,127]},"internet_service_custom":{"type":"list","children":{"name":{"type":"string","revi'
+    'sions":[127,127]}},"revisions":[127,127]},"input_device":{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}},"revisions":[127,1'
+    '27]},"link_cost_factor":{"type":"string","options":[{"value":"latency","revisions":[127,127]},{"value":"jitter","revisions":[127,127]},{"value":"packe'
+    't-loss","revisions":[127,127]},{"value":"inbandwidth","revisions":[127,127]},{"value":"outbandwidth","revisions":[127,127]},{"value":"bibandwidth","re'
+    'visions":[127,127]},{"value":"custom-profile-1","revisions":[127,127]}],"revisions":[127,127]},"packet_loss_weight":{"type":"integer","revisions":[127'
+    ',127]},"id":{"type":"integer","revisions":[127,127]},"route_tag":{"type":"integer","revisions":[127,127]},"addr_mode":{"type":"string","options":[{"va'
+    'lue":"ipv4","revisions":[127,127]},{"value":"ipv6","revisions":[127,127]}],"revisions":[127,127]},"tos":{"type":"string","revisions":[127,127]},"dst":'
+    '{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}},"revisions":[127,127]},"input_device_negate":{"type":"string","options":[{"'
+    'value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"gateway":{"type":"string","options":[{"value'
+    '":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"member":{"type":"integer","revisions":[127,23]},"'
+    'dscp_forward":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"'
+    'internet_service_custom_group":{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}},"revisions":[127,127]},"role":{"type":"strin'
+    'g","options":[{"value":"standalone","revisions":[120,120]},{"value":"primary","revisions":[120,120]},{"value":"secondary","revisions":[120,120]}],"rev'
+    'isions":[120,120]},"quality_link":{"type":"integer","revisions":[127,127]},"mode":{"type":"string","options":[{"value":"auto","revisions":[127,127]},{'
+    '"value":"manual","revisions":[127,127]},{"value":"priority","revisions":[127,127]},{"value":"sla","revisions":[127,127]},{"value":"load-balance","revi'
+    'sions":[120,120]}],"revisions":[127,127]},"status":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions"'
+    ':[127,127]}],"revisions":[127,127]},"health_check":{"type":"string","revisions":[127,127]},"start_port":{"type":"integer","revisions":[127,127]},"user'
+    's":{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}},"revisions":[127,127]},"src":{"type":"list","children":{"name":{"type":"'
+    'string","revisions":[127,127]}},"revisions":[127,127]},"dst_negate":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"dis'
+    'able","revisions":[127,127]}],"revisions":[127,127]},"sla_compare_method":{"type":"string","options":[{"value":"order","revisions":[120,120]},{"value"'
+    ':"number","revisions":[120,120]}],"revisions":[120,120]},"dscp_reverse":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":'
+    '"disable","revisions":[127,127]}],"revisions":[127,127]},"latency_weight":{"type":"integer","revisions":[127,127]},"tos_mask":{"type":"string","revisi'
+    'ons":[127,127]},"groups":{"type":"list","children":{"name":{"type":"string","revisions":[127,127]}},"revisions":[127,127]},"standalone_action":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"internet_service_ctrl'
+    '_group":{"type":"list","children":{"name":{"type":"string","revisions":[7,7]}},"revisions":[127,7]},"internet_service_app_ctrl_group":{"type":"list","'
+    'children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"priority_members":{"type":"list","children":{"seq_num":{"type":"int'
+    'eger","revisions":[127,127]}},"revisions":[127,127]},"name":{"type":"string","revisions":[127,127]},"default":{"type":"string","options":[{"value":"en'
+    'able","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"internet_service_id":{"type":"list","children":{"id":{'
+    '"type":"integer","revisions":[127,127]}},"revisions":[127,127]},"src_negate":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"va'
+    'lue":"disable","revisions":[127,127]}],"revisions":[127,127]},"internet_service_group":{"type":"list","children":{"name":{"type":"string","revisions":'
+    '[127,127]}},"revisions":[127,127]},"sla":{"type":"list","children":{"health_check":{"type":"string","revisions":[127,127]},"id":{"type":"integer","rev'
+    'isions":[127,127]}},"revisions":[127,127]},"internet_service":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable",'
+    '"revisions":[127,127]}],"revisions":[127,127]}},"revisions":[127,127]},"fail_detect":{"type":"string","options":[{"value":"enable","revisions":[127,12'
+    '7]},{"value":"disable","revisions":[127,127]}],"revisions":[127,127]},"neighbor_hold_down_time":{"type":"integer","revisions":[120,120]},"neighbor_hol'
+    'd_down":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[120,120]},"health'
+    '_check":{"type":"list","children":{"protocol":{"type":"string","options":[{"value":"ping","revisions":[127,127]},{"value":"tcp-echo","revisions":[127,'
+    '127]},{"value":"udp-echo","revisions":[127,127]},{"value":"http","revisions":[127,127]},{"value":"twamp","revisions":[127,127]},{"value":"ping6","revi'
+    'sions":[127,127]}],"revisions":[127,127]},"update_cascade_interface":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"di'
+    'sable","revisions":[127,127]}],"revisions":[127,127]},"diffservcode":{"type":"string","revisions":[120,104]},"ha_priority":{"type":"integer","revision'
+    's":[120,120]},"port":{"type":"integer","revisions":[127,127]},"threshold_warning_packetloss":{"type":"integer","revisions":[127,127]},"packet_size":{"'
+    'type":"integer","revisions":[127,127]},"addr_mode":{"type":"string","options":[{"value":"ipv4","revisions":[127,127]},{"value":"ipv6","revisions":[127'
+    ',127]}],"revisions":[127,127]},"threshold_alert_jitter":{"type":"integer","revisions":[127,127]},"threshold_alert_latency":{"type":"integer","revision'
+    's":[127,127]},"probe_timeout":{"type":"integer","revisions":[120,104]},"http_get":{"type":"string","revisions":[127,127]},"failtime":{"type":"integer"'
+    ',"revisions":[127,127]},"http_agent":{"type":"string","revisions":[127,127]},"members":{"type":"list","children":{"seq_num":{"type":"integer","revisio'
+    'ns":[127,127]}},"revisions":[127,127]},"update_static_route":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","'
+    'revisions":[127,127]}],"revisions":[127,127]},"password":{"type":"string","revisions":[127,127]},"sla_fail_log_period":{"type":"integer","revisions":['
+    '120,120]},"recoverytime":{"type":"integer","revisions":[127,127]},"probe_packets":{"type":"string","options":[{"value":"disable","revisions":[120,120]'
+    '},{"value":"enable","revisions":[120,120]}],"revisions":[120,120]},"http_match":{"type":"string","revisions":[127,127]},"security_mode":{"type":"strin'
+    'g","options":[{"value":"none","revisions":[127,127]},{"value":"authentication","revisions":[127,127]}],"revisions":[127,127]},"name":{"type":"string",'
+    '"revisions":[127,127]},"threshold_warning_latency":{"type":"integer","revisions":[127,127]},"interval":{"type":"integer","revisions":[127,127]},"serve'
+    'r":{"type":"string","revisions":[127,127]},"sla_pass_log_period":{"type":"integer","revisions":[120,120]},"threshold_alert_packetloss":{"type":"intege'
+    'r","revisions":[127,127]},"threshold_warning_jitter":{"type":"integer","revisions":[127,127]},"sla":{"type":"list","children":{"packetloss_threshold":'
+    '{"type":"integer","revisions":[127,127]},"jitter_threshold":{"type":"integer","revisions":[127,127]},"id":{"type":"integer","revisions":[127,127]},"li'
+    'nk_cost_factor":{"multiple_values":true,"type":"list","options":[{"value":"latency","revisions":[127,127]},{"value":"jitter","revisions":[127,127]},{"'
+    'value":"packet-loss","revisions":[127,127]}],"revisions":[127,127]},"latency_threshold":{"type":"integer","revisions":[127,127]}},"revisions":[127,127'
+    ']}},"revisions":[127,127]},"members":{"type":"list","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[127,127]},{"value'
+    '":"enable","revisions":[127,127]}],"revisions":[127,127]},"comment":{"type":"string","revisions":[127,127]},"weight":{"type":"integer","revisions":[12'
+    '7,127]},"seq_num":{"type":"integer","revisions":[127,127]},"spillover_threshold":{"type":"integer","revisions":[127,127]},"priority":{"type":"integer"'
+    ',"revisions":[127,127]},"source":{"type":"string","revisions":[127,127]},"cost":{"type":"integer","revisions":[120,120]},"source6":{"type":"string","r'
+    'evisions":[127,127]},"gateway6":{"type":"string","revisions":[127,127]},"interface":{"type":"string","revisions":[127,127]},"volume_ratio":{"type":"in'
+    'teger","revisions":[127,127]},"gateway":{"type":"string","revisions":[127,127]},"ingress_spillover_threshold":{"type":"integer","revisions":[127,127]}'
+    '},"revisions":[127,127]},"zone":{"type":"list","children":{"name":{"type":"string","revisions":[104,104]}},"revisions":[120,104]},"neighbor_hold_boot_'
+    'time":{"type":"integer","revisions":[120,120]}},"revisions":[127,127]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"load_balance_mode":{"type":"str","'
+    'required":false,"choices":["source-ip-based","weight-based","usage-based","source-dest-ip-based","measured-volume-based"]},"fail_alert_interfaces":{"t'
+    'ype":"list","required":false,"options":{"name":{"type":"str","required":false}}},"neighbor":{"type":"list","required":false,"options":{"member":{"type'
+    '":"int","required":false},"ip":{"type":"str","required":false},"health_check":{"type":"str","required":false},"role":{"type":"str","required":false,"c'
+    'hoices":["standalone","primary","secondary"]},"sla_id":{"type":"int","required":false}}},"service":{"type":"list","required":false,"options":{"jitter_'
+    'weight":{"type":"int","required":false},"internet_service_ctrl":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"pro'
+    'tocol":{"type":"int","required":false},"dscp_forward_tag":{"type":"str","required":false},"dscp_reverse_tag":{"type":"str","required":false},"dst6":{"'
+    'type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"end_port":{"type":"int","required":false},"internet_service_app_ctr'
+    'l":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"hold_down_time":{"type":"int","required":false},"link_cost_thres'
+    'hold":{"type":"int","required":false},"src6":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"bandwidth_weight":{"'
+    'type":"int","required":false},"internet_service_custom":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"input_dev'
+    'ice":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"link_cost_factor":{"type":"str","required":false,"choices":['
+    '"latency","jitter","packet-loss","inbandwidth","outbandwidth","bibandwidth","custom-profile-1"]},"packet_loss_weight":{"type":"int","required":false},'
+    '"id":{"type":"int","required":false},"route_tag":{"type":"int","required":false},"addr_mode":{"type":"str","required":false,"choices":["ipv4","ipv6"]}'
+    ',"tos":{"type":"str","required":false},"dst":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"input_device_negate"'
+    ':{"type":"str","required":false,"choices":["enable","disable"]},"gateway":{"type":"str","required":false,"choices":["enable","disable"]},"member":{"ty'
+    'pe":"int","required":false},"dscp_forward":{"type":"str","required":false,"choices":["enable","disable"]},"internet_service_custom_group":{"type":"lis'
+    't","required":false,"options":{"name":{"type":"str","required":false}}},"role":{"type":"str","required":false,"choices":["standalone","primary","secon'
+    'dary"]},"quality_link":{"type":"int","required":false},"mode":{"type":"str","required":false},"status":{"type":"str","required":false,"choices":["enab'
+    'le","disable"]},"health_check":{"type":"str","required":false},"start_port":{"type":"int","required":false},"users":{"type":"list","required":false,"o'
+    'ptions":{"name":{"type":"str","required":false}}},"src":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"dst_negat'
+    'e":{"type":"str","required":false,"choices":["enable","disable"]},"sla_compare_method":{"type":"str","required":false,"choices":["order","number"]},"d'
+    'scp_reverse":{"type":"str","required":false,"choices":["enable","disable"]},"latency_weight":{"type":"int","required":false},"tos_mask":{"type":"str",'
+    '"required":false},"groups":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"standalone_action":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"internet_service_ctrl_group":{"type":"list","required":false,"options":{"name":{"type":"str","required":f'
+    'alse}}},"internet_service_app_ctrl_group":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"priority_members":{"typ'
+    'e":"list","required":false,"options":{"seq_num":{"type":"int","required":false}}},"name":{"type":"str","required":false},"default":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"internet_service_id":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"s'
+    'rc_negate":{"type":"str","required":false,"choices":["enable","disable"]},"internet_service_group":{"type":"list","required":false,"options":{"name":{'
+    '"type":"str","required":false}}},"sla":{"type":"list","required":false,"options":{"health_check":{"type":"str","required":false},"id":{"type":"int","r'
+    'equired":false}}},"internet_service":{"type":"str","required":false,"choices":["enable","disable"]}}},"fail_detect":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"neighbor_hold_down_time":{"type":"int","required":false},"neighbor_hold_down":{"type":"str","required":false,"choices":['
+    '"enable","disable"]},"health_check":{"type":"list","required":false,"options":{"protocol":{"type":"str","required":false,"choices":["ping","tcp-echo",'
+    '"udp-echo","http","twamp","ping6"]},"update_cascade_interface":{"type":"str","required":false,"choices":["enable","disable"]},"diffservcode":{"type":"'
+    'str","required":false},"ha_priority":{"type":"int","required":false},"port":{"type":"int","required":false},"threshold_warning_packetloss":{"type":"in'
+    't","required":false},"packet_size":{"type":"int","required":false},"addr_mode":{"type":"str","required":false,"choices":["ipv4","ipv6"]},"threshold_al'
+    'ert_jitter":{"type":"int","required":false},"threshold_alert_latency":{"type":"int","required":false},"probe_timeout":{"type":"int","required":false},'
+    '"http_get":{"type":"str","required":false},"failtime":{"type":"int","required":false},"http_agent":{"type":"str","required":false},"members":{"type":"'
+    'list","required":false,"options":{"seq_num":{"type":"int","required":false}}},"update_static_route":{"type":"str","required":false,"choices":["enable"'
+    ',"disable"]},"password":{"type":"str","required":false},"sla_fail_log_period":{"type":"int","required":false},"recoverytime":{"type":"int","required":'
+    'false},"probe_packets":{"type":"str","required":false,"choices":["disable","enable"]},"http_match":{"type":"str","required":false},"security_mode":{"t'
+    'ype":"str","required":false,"choices":["none","authentication"]},"name":{"type":"str","required":false},"threshold_warning_latency":{"type":"int","req'
+    'uired":false},"interval":{"type":"int","required":false},"server":{"type":"str","required":false},"sla_pass_log_period":{"type":"int","required":false'
+    '},"threshold_alert_packetloss":{"type":"int","required":false},"threshold_warning_jitter":{"type":"int","required":false},"sla":{"type":"list","requir'
+    'ed":false,"options":{"packetloss_threshold":{"type":"int","required":false},"jitter_threshold":{"type":"int","required":false},"id":{"type":"int","req'
+    'uired":false},"link_cost_factor":{"type":"list","required":false,"choices":["latency","jitter","packet-loss"]},"latency_threshold":{"type":"int","requ'
+    'ired":false}}}}},"members":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"comment'
+    '":{"type":"str","required":false},"weight":{"type":"int","required":false},"seq_num":{"type":"int","required":false},"spillover_threshold":{"type":"in'
+    't","required":false},"priority":{"type":"int","required":false},"source":{"type":"str","required":false},"cost":{"type":"int","required":false},"sourc'
+    'e6":{"type":"str","required":false},"gateway6":{"type":"str","required":false},"interface":{"type":"str","required":false},"volume_ratio":{"type":"int'
+    '","required":false},"gateway":{"type":"str","required":false},"ingress_spillover_threshold":{"type":"int","required":false}}},"zone":{"type":"list","r'
+    'equired":false,"options":{"name":{"type":"str","required":false}}},"neighbor_hold_boot_time":{"type":"int","required":false}}}'
+)
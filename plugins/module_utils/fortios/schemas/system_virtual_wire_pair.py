@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"member":{"type":"list","children":{"interface_name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"v'
+    'lan_filter":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"wildcard_vlan":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"member":{"type":"list","required":false,"options":{"interface_name":{"type":"str","required":false}}},"vla'
+    'n_filter":{"type":"str","required":false},"name":{"type":"str","required":false},"wildcard_vlan":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]}}}'
+)
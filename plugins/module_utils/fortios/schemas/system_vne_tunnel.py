@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}'
+    '],"revisions":[1920,1920]},"bmr_hostname":{"type":"string","revisions":[1920,1920]},"ssl_certificate":{"type":"string","revisions":[1920,1920]},"auto_'
+    'asic_offload":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,89'
+    '6]},"ipv4_address":{"type":"string","revisions":[1920,1920]},"mode":{"type":"string","options":[{"value":"map-e","revisions":[1920,1920]},{"value":"fi'
+    'xed-ip","revisions":[1920,1920]}],"revisions":[1920,1920]},"br":{"type":"string","revisions":[1920,1920]},"interface":{"type":"string","revisions":[19'
+    '20,1920]},"update_url":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"bmr_hostname":{"type":"str","requi'
+    'red":false},"ssl_certificate":{"type":"str","required":false},"auto_asic_offload":{"type":"str","required":false,"choices":["enable","disable"]},"ipv4'
+    '_address":{"type":"str","required":false},"mode":{"type":"str","required":false,"choices":["map-e","fixed-ip"]},"br":{"type":"str","required":false},"'
+    'interface":{"type":"str","required":false},"update_url":{"type":"str","required":false}}}'
+)
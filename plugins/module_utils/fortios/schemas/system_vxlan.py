@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"multicast_ttl":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"vni":{"type":"'
+    'integer","revisions":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]},"ip_version":{"type":"string","options":[{"value":"ipv4-unicas'
+    't","revisions":[2047,2047]},{"value":"ipv6-unicast","revisions":[2047,2047]},{"value":"ipv4-multicast","revisions":[2047,2047]},{"value":"ipv6-multica'
+    'st","revisions":[2047,2047]}],"revisions":[2047,2047]},"dstport":{"type":"integer","revisions":[2047,2047]},"remote_ip6":{"type":"list","children":{"i'
+    'p6":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"remote_ip":{"type":"list","children":{"ip":{"type":"string","revisions":[2047'
+    ',2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"multicast_ttl":{"type":"int","required":false},"name":{"type":"str","required":false},"vni":{"type":"int",'
+    '"required":false},"interface":{"type":"str","required":false},"ip_version":{"type":"str","required":false,"choices":["ipv4-unicast","ipv6-unicast","ip'
+    'v4-multicast","ipv6-multicast"]},"dstport":{"type":"int","required":false},"remote_ip6":{"type":"list","required":false,"options":{"ip6":{"type":"str"'
+    ',"required":false}}},"remote_ip":{"type":"list","required":false,"options":{"ip":{"type":"str","required":false}}}}}'
+)
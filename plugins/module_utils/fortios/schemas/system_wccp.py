@@ -0,0 +1,37 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"protocol":{"type":"integer","revisions":[2047,2047]},"cache_id":{"type":"string","revisions":[2047,2047]},"assignment_weig'
+    'ht":{"type":"integer","revisions":[2047,2047]},"assignment_srcaddr_mask":{"type":"string","revisions":[2047,2047]},"priority":{"type":"integer","revis'
+    'ions":[2047,2047]},"authentication":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"return_method":{"type":"string","options":[{"value":"GRE","revisions":[2047,2047]},{"value":"L2","revisions":[2047,2047]},'
+    '{"value":"any","revisions":[2047,2047]}],"revisions":[2047,2047]},"assignment_dstaddr_mask":{"type":"string","revisions":[2047,2047]},"service_type":{'
+    '"type":"string","options":[{"value":"auto","revisions":[2047,2047]},{"value":"standard","revisions":[2047,2047]},{"value":"dynamic","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"router_list":{"type":"string","revisions":[2047,2047]},"router_id":{"type":"string","revisions":[2047,2047]},"group_'
+    'address":{"type":"string","revisions":[2047,2047]},"server_type":{"type":"string","options":[{"value":"forward","revisions":[2047,2047]},{"value":"pro'
+    'xy","revisions":[2047,2047]}],"revisions":[2047,2047]},"assignment_bucket_format":{"type":"string","options":[{"value":"wccp-v2","revisions":[2047,204'
+    '7]},{"value":"cisco-implementation","revisions":[2047,2047]}],"revisions":[2047,2047]},"assignment_method":{"type":"string","options":[{"value":"HASH"'
+    ',"revisions":[2047,2047]},{"value":"MASK","revisions":[2047,2047]},{"value":"any","revisions":[2047,2047]}],"revisions":[2047,2047]},"password":{"type'
+    '":"string","revisions":[2047,2047]},"primary_hash":{"multiple_values":true,"type":"list","options":[{"value":"src-ip","revisions":[2047,2047]},{"value'
+    '":"dst-ip","revisions":[2047,2047]},{"value":"src-port","revisions":[2047,2047]},{"value":"dst-port","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"forward_method":{"type":"string","options":[{"value":"GRE","revisions":[2047,2047]},{"value":"L2","revisions":[2047,2047]},{"value":"any","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"ports_defined":{"type":"string","options":[{"value":"source","revisions":[2047,2047]},{"value":"destination'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"cache_engine_method":{"type":"string","options":[{"value":"GRE","revisions":[2047,2047]},{"value'
+    '":"L2","revisions":[2047,2047]}],"revisions":[2047,2047]},"server_list":{"type":"string","revisions":[2047,2047]},"service_id":{"type":"string","revis'
+    'ions":[2047,2047]},"ports":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"protocol":{"type":"int","required":false},"cache_id":{"type":"str","required":false},"assignment_weight":{'
+    '"type":"int","required":false},"assignment_srcaddr_mask":{"type":"str","required":false},"priority":{"type":"int","required":false},"authentication":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"return_method":{"type":"str","required":false,"choices":["GRE","L2","any"]},"assignment'
+    '_dstaddr_mask":{"type":"str","required":false},"service_type":{"type":"str","required":false,"choices":["auto","standard","dynamic"]},"router_list":{"'
+    'type":"str","required":false},"router_id":{"type":"str","required":false},"group_address":{"type":"str","required":false},"server_type":{"type":"str",'
+    '"required":false,"choices":["forward","proxy"]},"assignment_bucket_format":{"type":"str","required":false,"choices":["wccp-v2","cisco-implementation"]'
+    '},"assignment_method":{"type":"str","required":false,"choices":["HASH","MASK","any"]},"password":{"type":"str","required":false},"primary_hash":{"type'
+    '":"list","required":false,"choices":["src-ip","dst-ip","src-port","dst-port"]},"forward_method":{"type":"str","required":false,"choices":["GRE","L2","'
+    'any"]},"ports_defined":{"type":"str","required":false,"choices":["source","destination"]},"cache_engine_method":{"type":"str","required":false,"choice'
+    's":["GRE","L2"]},"server_list":{"type":"str","required":false},"service_id":{"type":"str","required":false},"ports":{"type":"str","required":false}}}'
+)
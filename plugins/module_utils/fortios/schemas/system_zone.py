@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"interface":{"type":"list","children":{"interface_name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+    ',"intrazone":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"name":{"type":"string","revisions":[2047,2047]},"tagging":{"type":"list","children":{"category":{"type":"string","revisions":[2047,2047]},"name":{"ty'
+    'pe":"string","revisions":[2047,2047]},"tags":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"r'
+    'evisions":[2047,2047]},"description":{"type":"string","revisions":[2040,2040]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"interface":{"type":"list","required":false,"options":{"interface_name":{"type":"str","required":false}}},"'
+    'intrazone":{"type":"str","required":false,"choices":["allow","deny"]},"name":{"type":"str","required":false},"tagging":{"type":"list","required":false'
+    ',"options":{"category":{"type":"str","required":false},"name":{"type":"str","required":false},"tags":{"type":"list","required":false,"options":{"name"'
+    ':{"type":"str","required":false}}}}},"description":{"type":"str","required":false}}}'
+)
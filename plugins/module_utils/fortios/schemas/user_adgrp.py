@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"connector_source":{"type":"string","revisions":[1920,1920]},"id":{"type":"integer","revisions":[2040,2040]},"server_name":'
+    '{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"connector_source":{"type":"str","required":false},"id":{"type":"int","required":false},"server_name":{"typ'
+    'e":"str","required":false},"name":{"type":"str","required":false}}}'
+)
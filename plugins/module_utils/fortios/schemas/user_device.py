@@ -0,0 +1,27 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[23,23]},"category":{"type":"string","options":[{"value":"none","revisions":[7,7]},{'
+    '"value":"amazon-device","revisions":[7,7]},{"value":"android-device","revisions":[7,7]},{"value":"blackberry-device","revisions":[7,7]},{"value":"fort'
+    'inet-device","revisions":[7,7]},{"value":"ios-device","revisions":[7,7]},{"value":"windows-device","revisions":[7,7]}],"revisions":[23,23]},"master_de'
+    'vice":{"type":"string","revisions":[23,23]},"alias":{"type":"string","revisions":[23,23]},"mac":{"type":"string","revisions":[23,23]},"user":{"type":"'
+    'string","revisions":[23,23]},"type":{"type":"string","options":[{"value":"unknown","revisions":[7,7]},{"value":"android-phone","revisions":[7,7]},{"va'
+    'lue":"android-tablet","revisions":[7,7]},{"value":"blackberry-phone","revisions":[7,7]},{"value":"blackberry-playbook","revisions":[7,7]},{"value":"fo'
+    'rticam","revisions":[7,7]},{"value":"fortifone","revisions":[7,7]},{"value":"fortinet-device","revisions":[7,7]},{"value":"gaming-console","revisions"'
+    ':[7,7]},{"value":"ip-phone","revisions":[7,7]},{"value":"ipad","revisions":[7,7]},{"value":"iphone","revisions":[7,7]},{"value":"linux-pc","revisions"'
+    ':[7,7]},{"value":"mac","revisions":[7,7]},{"value":"media-streaming","revisions":[7,7]},{"value":"printer","revisions":[7,7]},{"value":"router-nat-dev'
+    'ice","revisions":[7,7]},{"value":"windows-pc","revisions":[7,7]},{"value":"windows-phone","revisions":[7,7]},{"value":"windows-tablet","revisions":[7,'
+    '7]},{"value":"other-network-device","revisions":[7,7]}],"revisions":[23,23]},"tagging":{"type":"list","children":{"category":{"type":"string","revisio'
+    'ns":[23,23]},"name":{"type":"string","revisions":[23,23]},"tags":{"type":"list","children":{"name":{"type":"string","revisions":[23,23]}},"revisions":'
+    '[23,23]}},"revisions":[23,23]},"avatar":{"type":"string","revisions":[23,23]}},"revisions":[23,23]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"category":{"type":"str","required":false},"master_device":{"type'
+    '":"str","required":false},"alias":{"type":"str","required":false},"mac":{"type":"str","required":false},"user":{"type":"str","required":false},"type":'
+    '{"type":"str","required":false},"tagging":{"type":"list","required":false,"options":{"category":{"type":"str","required":false},"name":{"type":"str","'
+    'required":false},"tags":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}}},"avatar":{"type":"str","required":false}'
+    '}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"default_action":{"type":"string","options":[{"value":"accept","revisions":[7,7]},{"value":"deny","revisions":[7,7]}],"revi'
+    'sions":[7,7]},"name":{"type":"string","revisions":[7,7]},"device_list":{"type":"list","children":{"device":{"type":"string","revisions":[7,7]},"action'
+    '":{"type":"string","options":[{"value":"accept","revisions":[7,7]},{"value":"deny","revisions":[7,7]}],"revisions":[7,7]},"id":{"type":"integer","revi'
+    'sions":[7,7]}},"revisions":[7,7]}},"revisions":[7,7]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"default_action":{"type":"str","required":false,"choices":["accept","deny"]},"name":{"type":"str","required'
+    '":false},"device_list":{"type":"list","required":false,"options":{"device":{"type":"str","required":false},"action":{"type":"str","required":false,"ch'
+    'oices":["accept","deny"]},"id":{"type":"int","required":false}}}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"member":{"type":"list","children":{"name":{"type":"string","revisions":[23,23]}},"revisions":[23,23]},"comment":{"type":"s'
+    'tring","revisions":[23,23]},"name":{"type":"string","revisions":[23,23]},"tagging":{"type":"list","children":{"category":{"type":"string","revisions":'
+    '[23,23]},"name":{"type":"string","revisions":[23,23]},"tags":{"type":"list","children":{"name":{"type":"string","revisions":[23,23]}},"revisions":[23,'
+    '23]}},"revisions":[23,23]}},"revisions":[23,23]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"member":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"comment":{"ty'
+    'pe":"str","required":false},"name":{"type":"str","required":false},"tagging":{"type":"list","required":false,"options":{"category":{"type":"str","requ'
+    'ired":false},"name":{"type":"str","required":false},"tags":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}}}}}'
+)
@@ -0,0 +1,32 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"extra_server":{"type":"list","children":{"source_port":{"type":"integer","revisions":[1024,1024]},"source_ip_address":{"ty'
+    'pe":"string","revisions":[1024,1024]},"ip_address":{"type":"string","revisions":[2040,2040]},"port":{"type":"integer","revisions":[2040,2040]},"id":{"'
+    'type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"ldap_server":{"type":"string","revisions":[2047,2047]},"source_ip_address":{"type"'
+    ':"string","revisions":[1024,1024]},"port":{"type":"integer","revisions":[2047,2047]},"replication_port":{"type":"integer","revisions":[1024,1024]},"ad'
+    'lds_dn":{"type":"string","revisions":[1024,1024]},"hostname":{"type":"string","revisions":[1024,1024]},"domain_name":{"type":"string","revisions":[204'
+    '7,2047]},"adlds_port":{"type":"integer","revisions":[1024,1024]},"adlds_ip_address":{"type":"string","revisions":[1024,1024]},"adlds_ip6":{"type":"str'
+    'ing","revisions":[1024,1024]},"username":{"type":"string","revisions":[1024,1024]},"source_ip6":{"type":"string","revisions":[1024,1024]},"ip6":{"type'
+    '":"string","revisions":[1024,1024]},"interface":{"type":"string","revisions":[1024,1024]},"password":{"type":"string","revisions":[1024,1024]},"ip_add'
+    'ress":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"dns_srv_lookup":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"ad_mode":{"type":"string","options":[{"value'
+    '":"none","revisions":[1024,1024]},{"value":"ds","revisions":[1024,1024]},{"value":"lds","revisions":[1024,1024]}],"revisions":[1024,1024]},"interface_'
+    'select_method":{"type":"string","options":[{"value":"auto","revisions":[1024,1024]},{"value":"sdwan","revisions":[1024,1024]},{"value":"specify","revi'
+    'sions":[1024,1024]}],"revisions":[1024,1024]},"source_port":{"type":"integer","revisions":[1024,1024]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"extra_server":{"type":"list","required":false,"options":{"source_port":{"type":"int","required":false},"so'
+    'urce_ip_address":{"type":"str","required":false},"ip_address":{"type":"str","required":false},"port":{"type":"int","required":false},"id":{"type":"int'
+    '","required":false}}},"ldap_server":{"type":"str","required":false},"source_ip_address":{"type":"str","required":false},"port":{"type":"int","required'
+    '":false},"replication_port":{"type":"int","required":false},"adlds_dn":{"type":"str","required":false},"hostname":{"type":"str","required":false},"dom'
+    'ain_name":{"type":"str","required":false},"adlds_port":{"type":"int","required":false},"adlds_ip_address":{"type":"str","required":false},"adlds_ip6":'
+    '{"type":"str","required":false},"username":{"type":"str","required":false},"source_ip6":{"type":"str","required":false},"ip6":{"type":"str","required"'
+    ':false},"interface":{"type":"str","required":false},"password":{"type":"str","required":false},"ip_address":{"type":"str","required":false},"name":{"t'
+    'ype":"str","required":false},"dns_srv_lookup":{"type":"str","required":false,"choices":["enable","disable"]},"ad_mode":{"type":"str","required":false,'
+    '"choices":["none","ds","lds"]},"interface_select_method":{"type":"str","required":false,"choices":["auto","sdwan","specify"]},"source_port":{"type":"i'
+    'nt","required":false}}}'
+)
@@ -0,0 +1,28 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"username":{"type":"string","revisions":[2040,2040]},"auth_type":{"type":"string","options":[{"value":"spnego","revisions":'
+    '[2040,2040]},{"value":"ntlm","revisions":[2040,2040]},{"value":"kerberos","revisions":[2040,2040]}],"revisions":[2040,2040]},"name":{"type":"string","'
+    'revisions":[2040,2040]},"server_name":{"type":"string","revisions":[2040,2040]},"ip":{"type":"string","revisions":[2040,2040]},"auth_level":{"type":"s'
+    'tring","options":[{"value":"connect","revisions":[2040,2040]},{"value":"call","revisions":[2040,2040]},{"value":"packet","revisions":[2040,2040]},{"va'
+    'lue":"integrity","revisions":[2040,2040]},{"value":"privacy","revisions":[2040,2040]}],"revisions":[2040,2040]},"domain_name":{"type":"string","revisi'
+    'ons":[2040,2040]},"http_auth_type":{"type":"string","options":[{"value":"basic","revisions":[2040,2040]},{"value":"ntlm","revisions":[2040,2040]}],"re'
+    'visions":[2040,2040]},"ssl_min_proto_version":{"type":"string","options":[{"value":"default","revisions":[2040,2040]},{"value":"SSLv3","revisions":[20'
+    '40,2040]},{"value":"TLSv1","revisions":[2040,2040]},{"value":"TLSv1-1","revisions":[2040,2040]},{"value":"TLSv1-2","revisions":[2040,2040]}],"revision'
+    's":[2040,2040]},"connect_protocol":{"type":"string","options":[{"value":"rpc-over-tcp","revisions":[2040,2040]},{"value":"rpc-over-http","revisions":['
+    '2040,2040]},{"value":"rpc-over-https","revisions":[2040,2040]}],"revisions":[2040,2040]},"password":{"type":"string","revisions":[2040,2040]},"kdc_ip"'
+    ':{"type":"list","children":{"ipv4":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"auto_discover_kdc":{"type":"string","options":'
+    '[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"username":{"type":"str","required":false},"auth_type":{"type":"str","required":false,"choices":["spnego","'
+    'ntlm","kerberos"]},"name":{"type":"str","required":false},"server_name":{"type":"str","required":false},"ip":{"type":"str","required":false},"auth_lev'
+    'el":{"type":"str","required":false,"choices":["connect","call","packet","integrity","privacy"]},"domain_name":{"type":"str","required":false},"http_au'
+    'th_type":{"type":"str","required":false,"choices":["basic","ntlm"]},"ssl_min_proto_version":{"type":"str","required":false,"choices":["default","SSLv3'
+    '","TLSv1","TLSv1-1","TLSv1-2"]},"connect_protocol":{"type":"str","required":false,"choices":["rpc-over-tcp","rpc-over-http","rpc-over-https"]},"passwo'
+    'rd":{"type":"str","required":false},"kdc_ip":{"type":"list","required":false,"options":{"ipv4":{"type":"str","required":false}}},"auto_discover_kdc":{'
+    '"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"active","revisions":[2047,2047]},{"value":"lock","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"license":{"type":"string","revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},"activation_expire":{'
+    '"type":"integer","revisions":[2047,2047]},"reg_id":{"type":"string","revisions":[2047,2047]},"seed":{"type":"string","revisions":[2047,23]},"serial_nu'
+    'mber":{"type":"string","revisions":[2047,2047]},"activation_code":{"type":"string","revisions":[2047,2047]},"os_ver":{"type":"string","revisions":[204'
+    '7,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["active","lock"]},"license":{"type":"str","required":fal'
+    'se},"comments":{"type":"str","required":false},"activation_expire":{"type":"int","required":false},"reg_id":{"type":"str","required":false},"seed":{"t'
+    'ype":"str","required":false},"serial_number":{"type":"str","required":false},"activation_code":{"type":"str","required":false},"os_ver":{"type":"str",'
+    '"required":false}}}'
+)
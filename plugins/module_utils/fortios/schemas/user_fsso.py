@@ -0,0 +1,34 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"password2":{"type":"string","revisions":[2047,2047]},"password3":{"type":"string","revisions":[2047,2047]},"password4":{"t'
+    'ype":"string","revisions":[2047,2047]},"password5":{"type":"string","revisions":[2047,2047]},"user_info_server":{"type":"string","revisions":[2040,204'
+    '0]},"ldap_server":{"type":"string","revisions":[2047,2047]},"port":{"type":"integer","revisions":[2047,2047]},"ssl_trusted_cert":{"type":"string","rev'
+    'isions":[2040,2040]},"port4":{"type":"integer","revisions":[2047,2047]},"port5":{"type":"integer","revisions":[2047,2047]},"type":{"type":"string","op'
+    'tions":[{"value":"default","revisions":[2040,2040]},{"value":"fortiems","revisions":[2040,120]},{"value":"fortinac","revisions":[2040,2040]},{"value":'
+    '"fortiems-cloud","revisions":[2040,120]}],"revisions":[2040,2040]},"port3":{"type":"integer","revisions":[2047,2047]},"ldap_poll":{"type":"string","op'
+    'tions":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"server4":{"type":"string","r'
+    'evisions":[2047,2047]},"server5":{"type":"string","revisions":[2047,2047]},"group_poll_interval":{"type":"integer","revisions":[2040,2040]},"server3":'
+    '{"type":"string","revisions":[2047,2047]},"ssl":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":'
+    '[2040,2040]}],"revisions":[2040,2040]},"source_ip6":{"type":"string","revisions":[2047,2047]},"server2":{"type":"string","revisions":[2047,2047]},"int'
+    'erface":{"type":"string","revisions":[2040,1768]},"password":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]'
+    '},"port2":{"type":"integer","revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2047,2047]},"server":{"type":"string","revisions":[2047'
+    ',2047]},"interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[1768,1768]},{"value":"sdwan","revisions":[1768,1768]},{"val'
+    'ue":"specify","revisions":[1768,1768]}],"revisions":[2040,1768]},"ldap_poll_filter":{"type":"string","revisions":[2040,2040]},"ldap_poll_interval":{"t'
+    'ype":"integer","revisions":[2040,2040]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"password2":{"type":"str","required":false},"password3":{"type":"str","required":false},"password4":{"type"'
+    ':"str","required":false},"password5":{"type":"str","required":false},"user_info_server":{"type":"str","required":false},"ldap_server":{"type":"str","r'
+    'equired":false},"port":{"type":"int","required":false},"ssl_trusted_cert":{"type":"str","required":false},"port4":{"type":"int","required":false},"por'
+    't5":{"type":"int","required":false},"type":{"type":"str","required":false,"choices":["default","fortiems","fortinac","fortiems-cloud"]},"port3":{"type'
+    '":"int","required":false},"ldap_poll":{"type":"str","required":false,"choices":["enable","disable"]},"server4":{"type":"str","required":false},"server'
+    '5":{"type":"str","required":false},"group_poll_interval":{"type":"int","required":false},"server3":{"type":"str","required":false},"ssl":{"type":"str"'
+    ',"required":false,"choices":["enable","disable"]},"source_ip6":{"type":"str","required":false},"server2":{"type":"str","required":false},"interface":{'
+    '"type":"str","required":false},"password":{"type":"str","required":false},"name":{"type":"str","required":false},"port2":{"type":"int","required":fals'
+    'e},"source_ip":{"type":"str","required":false},"server":{"type":"str","required":false},"interface_select_method":{"type":"str","required":false},"lda'
+    'p_poll_filter":{"type":"str","required":false},"ldap_poll_interval":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"smbv1":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}]'
+    ',"revisions":[2040,2040]},"password":{"type":"string","revisions":[2047,2047]},"polling_frequency":{"type":"integer","revisions":[2047,2047]},"ldap_se'
+    'rver":{"type":"string","revisions":[2047,2047]},"port":{"type":"integer","revisions":[2047,2047]},"default_domain":{"type":"string","revisions":[2047,'
+    '2047]},"user":{"type":"string","revisions":[2047,2047]},"adgrp":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revision'
+    's":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"logon_history":{"type":"integer","revisions":[2047,2047]},"server":{"type":"string","'
+    'revisions":[2047,2047]},"smb_ntlmv1_auth":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,'
+    '2040]}],"revisions":[2040,2040]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"smbv1":{"type":"str","required":fa'
+    'lse,"choices":["enable","disable"]},"password":{"type":"str","required":false},"polling_frequency":{"type":"int","required":false},"ldap_server":{"typ'
+    'e":"str","required":false},"port":{"type":"int","required":false},"default_domain":{"type":"str","required":false},"user":{"type":"str","required":fal'
+    'se},"adgrp":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"id":{"type":"int","required":false},"logon_history":{'
+    '"type":"int","required":false},"server":{"type":"str","required":false},"smb_ntlmv1_auth":{"type":"str","required":false,"choices":["enable","disable"'
+    ']}}}'
+)
@@ -0,0 +1,49 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"expire_type":{"type":"string","options":[{"value":"immediately","revisions":[2047,2047]},{"value":"first-successful-login"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"sponsor":{"type":"string","options":[{"value":"optional","revisions":[2047,2047]},{"value":"manda'
+    'tory","revisions":[2047,2047]},{"value":"disabled","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},'
+    '"user_id":{"type":"string","options":[{"value":"email","revisions":[2047,2047]},{"value":"auto-generate","revisions":[2047,2047]},{"value":"specify","'
+    'revisions":[2047,2047]}],"revisions":[2047,2047]},"guest":{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"mobile_phone'
+    '":{"type":"string","revisions":[2047,2047]},"user_id":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"comp'
+    'any":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2040,2040]},"sponsor":{"type":"string","revisions":[2047,2047]},"pa'
+    'ssword":{"type":"string","revisions":[2047,2047]},"email":{"type":"string","revisions":[2047,2047]},"expiration":{"type":"string","revisions":[2047,20'
+    '47]}},"revisions":[2047,2047]},"authtimeout":{"type":"integer","revisions":[2047,2047]},"member":{"type":"list","children":{"name":{"type":"string","r'
+    'evisions":[2047,2047]}},"revisions":[2047,2047]},"http_digest_realm":{"type":"string","revisions":[2047,2047]},"sso_attribute_value":{"type":"string",'
+    '"revisions":[2047,2047]},"sms_custom_server":{"type":"string","revisions":[2047,2047]},"user_name":{"type":"string","options":[{"value":"disable","rev'
+    'isions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"email":{"type":"string","options":[{"value":"disable","revi'
+    'sions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"match":{"type":"list","children":{"id":{"type":"integer","re'
+    'visions":[2047,2047]},"server_name":{"type":"string","revisions":[2047,2047]},"group_name":{"type":"string","revisions":[2047,2047]}},"revisions":[204'
+    '7,2047]},"sms_server":{"type":"string","options":[{"value":"fortiguard","revisions":[2047,2047]},{"value":"custom","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"mobile_phone":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"company":{"type":"string","options":[{"value":"optional","revisions":[2047,2047]},{"value":"mandatory","revisions":[2047,2047]}'
+    ',{"value":"disabled","revisions":[2047,2047]}],"revisions":[2047,2047]},"expire":{"type":"integer","revisions":[2047,2047]},"auth_concurrent_override"'
+    ':{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_acc'
+    'ounts":{"type":"integer","revisions":[2047,2047]},"password":{"type":"string","options":[{"value":"auto-generate","revisions":[2047,2047]},{"value":"s'
+    'pecify","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_concurrent_value":{"type":"integer","revi'
+    'sions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"multiple_guest_add":{"type":"string","options":[{"value":"disable","revisions":['
+    '2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"group_type":{"type":"string","options":[{"value":"firewall","revisio'
+    'ns":[2047,2047]},{"value":"fsso-service","revisions":[2047,2047]},{"value":"rsso","revisions":[2047,2047]},{"value":"guest","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"expire_type":{"type":"str","required":false,"choices":["immediately","first-successful-login"]},"sponsor":'
+    '{"type":"str","required":false,"choices":["optional","mandatory","disabled"]},"id":{"type":"int","required":false},"user_id":{"type":"str","required":'
+    'false,"choices":["email","auto-generate","specify"]},"guest":{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"mob'
+    'ile_phone":{"type":"str","required":false},"user_id":{"type":"str","required":false},"name":{"type":"str","required":false},"company":{"type":"str","r'
+    'equired":false},"id":{"type":"int","required":false},"sponsor":{"type":"str","required":false},"password":{"type":"str","required":false},"email":{"ty'
+    'pe":"str","required":false},"expiration":{"type":"str","required":false}}},"authtimeout":{"type":"int","required":false},"member":{"type":"list","requ'
+    'ired":false,"options":{"name":{"type":"str","required":false}}},"http_digest_realm":{"type":"str","required":false},"sso_attribute_value":{"type":"str'
+    '","required":false},"sms_custom_server":{"type":"str","required":false},"user_name":{"type":"str","required":false,"choices":["disable","enable"]},"em'
+    'ail":{"type":"str","required":false,"choices":["disable","enable"]},"match":{"type":"list","required":false,"options":{"id":{"type":"int","required":f'
+    'alse},"server_name":{"type":"str","required":false},"group_name":{"type":"str","required":false}}},"sms_server":{"type":"str","required":false,"choice'
+    's":["fortiguard","custom"]},"mobile_phone":{"type":"str","required":false,"choices":["disable","enable"]},"company":{"type":"str","required":false,"ch'
+    'oices":["optional","mandatory","disabled"]},"expire":{"type":"int","required":false},"auth_concurrent_override":{"type":"str","required":false,"choice'
+    's":["enable","disable"]},"max_accounts":{"type":"int","required":false},"password":{"type":"str","required":false,"choices":["auto-generate","specify"'
+    ',"disable"]},"auth_concurrent_value":{"type":"int","required":false},"name":{"type":"str","required":false},"multiple_guest_add":{"type":"str","requir'
+    'ed":false,"choices":["disable","enable"]},"group_type":{"type":"str","required":false,"choices":["firewall","fsso-service","rsso","guest"]}}}'
+)
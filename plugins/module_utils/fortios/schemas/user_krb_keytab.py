@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"keytab":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"pac_data":{"type":"str'
+    'ing","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"ldap_server":{"type"'
+    ':"string","revisions":[2047,2047]},"password":{"type":"string","revisions":[2032,16]},"principal":{"type":"string","revisions":[2047,2047]}},"revision'
+    's":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"keytab":{"type":"str","required":false},"name":{"type":"str","required":false},"pac_data":{"type":"str","r'
+    'equired":false,"choices":["enable","disable"]},"ldap_server":{"type":"str","required":false},"password":{"type":"str","required":false},"principal":{"'
+    'type":"str","required":false}}}'
+)
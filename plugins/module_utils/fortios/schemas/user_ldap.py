@@ -0,0 +1,51 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"username":{"type":"string","revisions":[2047,2047]},"secure":{"type":"string","options":[{"value":"disable","revisions":[2'
+    '047,2047]},{"value":"starttls","revisions":[2047,2047]},{"value":"ldaps","revisions":[2047,2047]}],"revisions":[2047,2047]},"group_filter":{"type":"st'
+    'ring","revisions":[2047,2047]},"account_key_filter":{"type":"string","revisions":[2047,2047]},"user_info_exchange_server":{"type":"string","revisions"'
+    ':[2040,2040]},"two_factor_notification":{"type":"string","options":[{"value":"email","revisions":[2024,2024]},{"value":"sms","revisions":[2024,2024]}]'
+    ',"revisions":[2040,2024]},"secondary_server":{"type":"string","revisions":[2047,2047]},"password_attr":{"type":"string","revisions":[1024,1024]},"grou'
+    'p_search_base":{"type":"string","revisions":[2047,2047]},"port":{"type":"integer","revisions":[2047,2047]},"password_renewal":{"type":"string","option'
+    's":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"member_attr":{"type":"string","r'
+    'evisions":[2047,2047]},"type":{"type":"string","options":[{"value":"simple","revisions":[2047,2047]},{"value":"anonymous","revisions":[2047,2047]},{"v'
+    'alue":"regular","revisions":[2047,2047]}],"revisions":[2047,2047]},"dn":{"type":"string","revisions":[2047,2047]},"group_object_filter":{"type":"strin'
+    'g","revisions":[2047,2047]},"ca_cert":{"type":"string","revisions":[2047,2047]},"account_key_processing":{"type":"string","options":[{"value":"same","'
+    'revisions":[2047,2047]},{"value":"strip","revisions":[2047,2047]}],"revisions":[2047,2047]},"server_identity_check":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"cnid":{"type":"string","revisions":[2047,2'
+    '047]},"interface":{"type":"string","revisions":[2040,2024]},"password":{"type":"string","revisions":[2047,2047]},"two_factor_authentication":{"type":"'
+    'string","options":[{"value":"fortitoken","revisions":[2024,2024]},{"value":"email","revisions":[2024,2024]},{"value":"sms","revisions":[2024,2024]}],"'
+    'revisions":[2040,2024]},"name":{"type":"string","revisions":[2047,2047]},"antiphish":{"type":"string","options":[{"value":"enable","revisions":[1024,1'
+    '024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"obtain_user_info":{"type":"string","options":[{"value":"enable","revision'
+    's":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"password_expiry_warning":{"type":"string","options":[{"value":"'
+    'enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"two_factor":{"type":"string","options":[{"valu'
+    'e":"disable","revisions":[2040,2040]},{"value":"fortitoken-cloud","revisions":[2040,2040]}],"revisions":[2040,2040]},"source_ip":{"type":"string","rev'
+    'isions":[2047,2047]},"server":{"type":"string","revisions":[2047,2047]},"search_type":{"multiple_values":true,"type":"list","options":[{"value":"recur'
+    'sive","revisions":[2040,2040]}],"revisions":[2040,2040]},"interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[2024,2024]'
+    '},{"value":"sdwan","revisions":[2024,2024]},{"value":"specify","revisions":[2024,2024]}],"revisions":[2040,2024]},"source_port":{"type":"integer","rev'
+    'isions":[1024,1024]},"ssl_min_proto_version":{"type":"string","options":[{"value":"default","revisions":[2047,2047]},{"value":"SSLv3","revisions":[204'
+    '7,2047]},{"value":"TLSv1","revisions":[2047,2047]},{"value":"TLSv1-1","revisions":[2047,2047]},{"value":"TLSv1-2","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"tertiary_server":{"type":"string","revisions":[2047,2047]},"group_member_check":{"type":"string","options":[{"value":"user-attr","revi'
+    'sions":[2047,2047]},{"value":"group-object","revisions":[2047,2047]},{"value":"posix-group-object","revisions":[2047,2047]}],"revisions":[2047,2047]}}'
+    ',"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"username":{"type":"str","required":false},"secure":{"type":"str","required":false,"choices":["disable","st'
+    'arttls","ldaps"]},"group_filter":{"type":"str","required":false},"account_key_filter":{"type":"str","required":false},"user_info_exchange_server":{"ty'
+    'pe":"str","required":false},"two_factor_notification":{"type":"str","required":false},"secondary_server":{"type":"str","required":false},"password_att'
+    'r":{"type":"str","required":false},"group_search_base":{"type":"str","required":false},"port":{"type":"int","required":false},"password_renewal":{"typ'
+    'e":"str","required":false,"choices":["enable","disable"]},"member_attr":{"type":"str","required":false},"type":{"type":"str","required":false,"choices'
+    '":["simple","anonymous","regular"]},"dn":{"type":"str","required":false},"group_object_filter":{"type":"str","required":false},"ca_cert":{"type":"str"'
+    ',"required":false},"account_key_processing":{"type":"str","required":false,"choices":["same","strip"]},"server_identity_check":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"cnid":{"type":"str","required":false},"interface":{"type":"str","required":false},"password":{"type":"str","r'
+    'equired":false},"two_factor_authentication":{"type":"str","required":false},"name":{"type":"str","required":false},"antiphish":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"obtain_user_info":{"type":"str","required":false,"choices":["enable","disable"]},"password_expiry_warning":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"two_factor":{"type":"str","required":false,"choices":["disable","fortitoken-cloud"]},"so'
+    'urce_ip":{"type":"str","required":false},"server":{"type":"str","required":false},"search_type":{"type":"list","required":false,"choices":["recursive"'
+    ']},"interface_select_method":{"type":"str","required":false},"source_port":{"type":"int","required":false},"ssl_min_proto_version":{"type":"str","requ'
+    'ired":false,"choices":["default","SSLv3","TLSv1","TLSv1-1","TLSv1-2"]},"tertiary_server":{"type":"str","required":false},"group_member_check":{"type":'
+    '"str","required":false,"choices":["user-attr","group-object","posix-group-object"]}}}'
+)
@@ -0,0 +1,36 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ldap_server":{"type":"string","revisions":[2047,2047]},"passwd_time":{"type":"string","revisions":[2047,2047]},"ppk_secret'
+    '":{"type":"string","revisions":[2047,2047]},"radius_server":{"type":"string","revisions":[2047,2047]},"two_factor_notification":{"type":"string","opti'
+    'ons":[{"value":"email","revisions":[2024,2024]},{"value":"sms","revisions":[2024,2024]}],"revisions":[2040,2024]},"username_case_sensitivity":{"type":'
+    '"string","options":[{"value":"disable","revisions":[2029,2029]},{"value":"enable","revisions":[2029,2029]}],"revisions":[2047,2029]},"passwd_policy":{'
+    '"type":"string","revisions":[2047,2047]},"authtimeout":{"type":"integer","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"aut'
+    'h_concurrent_override":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"sms_custom_server":{"type":"string","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"password","revisions":[2047,2'
+    '047]},{"value":"radius","revisions":[2047,2047]},{"value":"tacacs+","revisions":[2047,2047]},{"value":"ldap","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"sms_server":{"type":"string","options":[{"value":"fortiguard","revisions":[2047,2047]},{"value":"custom","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"passwd":{"type":"string","revisions":[2047,2047]},"tacacs+_server":{"type":"string","revisions":[2047,2047]},"email_to":{"type":"str'
+    'ing","revisions":[2047,2047]},"auth_concurrent_value":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"wor'
+    'kstation":{"type":"string","revisions":[2047,2047]},"fortitoken":{"type":"string","revisions":[2047,2047]},"ppk_identity":{"type":"string","revisions"'
+    ':[2047,2047]},"two_factor_authentication":{"type":"string","options":[{"value":"fortitoken","revisions":[2024,2024]},{"value":"email","revisions":[202'
+    '4,2024]},{"value":"sms","revisions":[2024,2024]}],"revisions":[2040,2024]},"sms_phone":{"type":"string","revisions":[2047,2047]},"two_factor":{"type":'
+    '"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"fortitoken","revisions":[2047,2047]},{"value":"email","revisions":[2047,2047'
+    ']},{"value":"sms","revisions":[2047,2047]},{"value":"fortitoken-cloud","revisions":[2040,2040]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ldap_server":{"type":"str","required":false},"passwd_time":{"type":"str","required":false},"ppk_secret":{"'
+    'type":"str","required":false},"radius_server":{"type":"str","required":false},"two_factor_notification":{"type":"str","required":false},"username_case'
+    '_sensitivity":{"type":"str","required":false},"passwd_policy":{"type":"str","required":false},"authtimeout":{"type":"int","required":false},"id":{"typ'
+    'e":"int","required":false},"auth_concurrent_override":{"type":"str","required":false,"choices":["enable","disable"]},"sms_custom_server":{"type":"str"'
+    ',"required":false},"type":{"type":"str","required":false,"choices":["password","radius","tacacs+","ldap"]},"status":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"sms_server":{"type":"str","required":false,"choices":["fortiguard","custom"]},"passwd":{"type":"str","required":false},"'
+    'tacacs+_server":{"type":"str","required":false},"email_to":{"type":"str","required":false},"auth_concurrent_value":{"type":"int","required":false},"na'
+    'me":{"type":"str","required":false},"workstation":{"type":"str","required":false},"fortitoken":{"type":"str","required":false},"ppk_identity":{"type":'
+    '"str","required":false},"two_factor_authentication":{"type":"str","required":false},"sms_phone":{"type":"str","required":false},"two_factor":{"type":"'
+    'str","required":false}}}'
+)
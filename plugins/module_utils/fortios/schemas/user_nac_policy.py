@@ -0,0 +1,29 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ssid_policy":{"type":"string","revisions":[1024,1024]},"family":{"type":"string","revisions":[1920,1920]},"user_group":{"t'
+    'ype":"string","revisions":[1920,1920]},"switch_fortilink":{"type":"string","revisions":[1920,1920]},"switch_scope":{"type":"list","children":{"switch_'
+    'id":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"hw_vendor":{"type":"string","revisions":[1920,1920]},"category":{"type":"stri'
+    'ng","options":[{"value":"device","revisions":[1920,1920]},{"value":"firewall-user","revisions":[1920,1920]},{"value":"ems-tag","revisions":[1920,1664]'
+    '}],"revisions":[1920,1920]},"switch_mac_policy":{"type":"string","revisions":[1920,1920]},"type":{"type":"string","revisions":[1920,1920]},"status":{"'
+    'type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"descriptio'
+    'n":{"type":"string","revisions":[1920,1920]},"src":{"type":"string","revisions":[1920,1920]},"mac":{"type":"string","revisions":[1920,1920]},"user":{"'
+    'type":"string","revisions":[1920,1920]},"ems_tag":{"type":"string","revisions":[1920,1664]},"sw_version":{"type":"string","revisions":[1920,1920]},"hw'
+    '_version":{"type":"string","revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1920]},"switch_auto_auth":{"type":"string","options":[{"'
+    'value":"global","revisions":[896,896]},{"value":"disable","revisions":[896,896]},{"value":"enable","revisions":[896,896]}],"revisions":[1920,896]},"ho'
+    'st":{"type":"string","revisions":[1920,1920]},"switch_port_policy":{"type":"string","revisions":[1920,896]},"os":{"type":"string","revisions":[1920,19'
+    '20]}},"revisions":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ssid_policy":{"type":"str","required":false},"family":{"type":"str","required":false},"user_group":{"type"'
+    ':"str","required":false},"switch_fortilink":{"type":"str","required":false},"switch_scope":{"type":"list","required":false,"options":{"switch_id":{"ty'
+    'pe":"str","required":false}}},"hw_vendor":{"type":"str","required":false},"category":{"type":"str","required":false,"choices":["device","firewall-user'
+    '","ems-tag"]},"switch_mac_policy":{"type":"str","required":false},"type":{"type":"str","required":false},"status":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"description":{"type":"str","required":false},"src":{"type":"str","required":false},"mac":{"type":"str","required":false},"'
+    'user":{"type":"str","required":false},"ems_tag":{"type":"str","required":false},"sw_version":{"type":"str","required":false},"hw_version":{"type":"str'
+    '","required":false},"name":{"type":"str","required":false},"switch_auto_auth":{"type":"str","required":false},"host":{"type":"str","required":false},"'
+    'switch_port_policy":{"type":"str","required":false},"os":{"type":"str","required":false}}}'
+)
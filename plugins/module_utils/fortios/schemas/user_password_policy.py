@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"expired_password_renewal":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revis'
+    'ions":[2040,2040]}],"revisions":[2040,2040]},"expire_days":{"type":"integer","revisions":[2047,2047]},"warn_days":{"type":"integer","revisions":[2047,'
+    '2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"expired_password_renewal":{"type":"str","required":false,"choices":["enable","disable"]},"expire_days":{"t'
+    'ype":"int","required":false},"warn_days":{"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
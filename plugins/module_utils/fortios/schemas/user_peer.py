@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ocsp_override_server":{"type":"string","revisions":[2047,2047]},"cn":{"type":"string","revisions":[2047,2047]},"name":{"ty'
+    'pe":"string","revisions":[2047,2047]},"passwd":{"type":"string","revisions":[2047,2047]},"two_factor":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ldap_server":{"type":"string","revisions":[2047,2047]},"'
+    'cn_type":{"type":"string","options":[{"value":"string","revisions":[2047,2047]},{"value":"email","revisions":[2047,2047]},{"value":"FQDN","revisions":'
+    '[2047,2047]},{"value":"ipv4","revisions":[2047,2047]},{"value":"ipv6","revisions":[2047,2047]}],"revisions":[2047,2047]},"ldap_username":{"type":"stri'
+    'ng","revisions":[2047,2047]},"ldap_password":{"type":"string","revisions":[2047,2047]},"mandatory_ca_verify":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ldap_mode":{"type":"string","options":[{"value":"'
+    'password","revisions":[2047,2047]},{"value":"principal-name","revisions":[2047,2047]}],"revisions":[2047,2047]},"ca":{"type":"string","revisions":[204'
+    '7,2047]},"subject":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ocsp_override_server":{"type":"str","required":false},"cn":{"type":"str","required":false},"name":{"type":'
+    '"str","required":false},"passwd":{"type":"str","required":false},"two_factor":{"type":"str","required":false,"choices":["enable","disable"]},"ldap_ser'
+    'ver":{"type":"str","required":false},"cn_type":{"type":"str","required":false,"choices":["string","email","FQDN","ipv4","ipv6"]},"ldap_username":{"typ'
+    'e":"str","required":false},"ldap_password":{"type":"str","required":false},"mandatory_ca_verify":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]},"ldap_mode":{"type":"str","required":false,"choices":["password","principal-name"]},"ca":{"type":"str","required":false},"subject":{"type":"'
+    'str","required":false}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"secure":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"starttls","revisions":[2047,2047]},'
+    '{"value":"pop3s","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_min_proto_version":{"type":"string","options":[{"value":"default","revisions"'
+    ':[2047,2047]},{"value":"SSLv3","revisions":[2047,2047]},{"value":"TLSv1","revisions":[2047,2047]},{"value":"TLSv1-1","revisions":[2047,2047]},{"value"'
+    ':"TLSv1-2","revisions":[2047,2047]}],"revisions":[2047,2047]},"port":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2'
+    '047,2047]},"server":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"secure":{"type":"str","required":false,"choices":["none","starttls","pop3s"]},"ssl_min_proto_version":{"ty'
+    'pe":"str","required":false,"choices":["default","SSLv3","TLSv1","TLSv1-1","TLSv1-2"]},"port":{"type":"int","required":false},"name":{"type":"str","req'
+    'uired":false},"server":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"firewall_groups":{"type":"string","revisions":[1920,1920]},"quarantine":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"traffic_policy":{"type":"string","revisions":[2040,2040]},'
+    '"targets":{"type":"list","children":{"entry":{"type":"string","revisions":[2047,2047]},"macs":{"type":"list","children":{"mac":{"type":"string","revis'
+    'ions":[2047,2047]},"drop":{"type":"string","options":[{"value":"disable","revisions":[1920,1920]},{"value":"enable","revisions":[1920,1920]}],"revisio'
+    'ns":[1920,1920]},"entry_id":{"type":"integer","revisions":[2047,23]},"description":{"type":"string","revisions":[2047,2047]},"parent":{"type":"string"'
+    ',"revisions":[2047,2047]}},"revisions":[2047,2047]},"description":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[20'
+    '47,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"firewall_groups":{"type":"str","required":false},"quarantine":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"traffic_policy":{"type":"str","required":false},"targets":{"type":"list","required":false,"options":{"entry":{"type":"str","requir'
+    'ed":false},"macs":{"type":"list","required":false,"options":{"mac":{"type":"str","required":false},"drop":{"type":"str","required":false,"choices":["d'
+    'isable","enable"]},"entry_id":{"type":"int","required":false},"description":{"type":"str","required":false},"parent":{"type":"str","required":false}}}'
+    ',"description":{"type":"str","required":false}}}}}'
+)
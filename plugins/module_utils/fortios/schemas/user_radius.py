@@ -0,0 +1,105 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"password_encoding":{"type":"string","options":[{"value":"auto","revisions":[2047,2047]},{"value":"ISO-8859-1","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"auth_type":{"type":"string","options":[{"value":"auto","revisions":[2047,2047]},{"value":"ms_chap_v2","revisio'
+    'ns":[2047,2047]},{"value":"ms_chap","revisions":[2047,2047]},{"value":"chap","revisions":[2047,2047]},{"value":"pap","revisions":[2047,2047]}],"revisi'
+    'ons":[2047,2047]},"use_management_vdom":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"h3c_compatibility":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"rsso_log_period":{"type":"integer","revisions":[2047,2047]},"acct_all_servers":{"type":"string","options":['
+    '{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"acct_interim_interval":{"type":"inte'
+    'ger","revisions":[2047,2047]},"accounting_server":{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,'
+    '2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"source_ip":{"type":"stri'
+    'ng","revisions":[2047,2047]},"server":{"type":"string","revisions":[2047,2047]},"secret":{"type":"string","revisions":[2047,2047]},"interface_select_m'
+    'ethod":{"type":"string","options":[{"value":"auto","revisions":[2024,2024]},{"value":"sdwan","revisions":[2024,2024]},{"value":"specify","revisions":['
+    '2024,2024]}],"revisions":[2040,2024]},"interface":{"type":"string","revisions":[2040,2024]},"port":{"type":"integer","revisions":[2047,2047]}},"revisi'
+    'ons":[2047,2047]},"rsso_endpoint_block_attribute":{"type":"string","options":[{"value":"User-Name","revisions":[2047,2047]},{"value":"NAS-IP-Address",'
+    '"revisions":[2047,2047]},{"value":"Framed-IP-Address","revisions":[2047,2047]},{"value":"Framed-IP-Netmask","revisions":[2047,2047]},{"value":"Filter-'
+    'Id","revisions":[2047,2047]},{"value":"Login-IP-Host","revisions":[2047,2047]},{"value":"Reply-Message","revisions":[2047,2047]},{"value":"Callback-Nu'
+    'mber","revisions":[2047,2047]},{"value":"Callback-Id","revisions":[2047,2047]},{"value":"Framed-Route","revisions":[2047,2047]},{"value":"Framed-IPX-N'
+    'etwork","revisions":[2047,2047]},{"value":"Class","revisions":[2047,2047]},{"value":"Called-Station-Id","revisions":[2047,2047]},{"value":"Calling-Sta'
+    'tion-Id","revisions":[2047,2047]},{"value":"NAS-Identifier","revisions":[2047,2047]},{"value":"Proxy-State","revisions":[2047,2047]},{"value":"Login-L'
+    'AT-Service","revisions":[2047,2047]},{"value":"Login-LAT-Node","revisions":[2047,2047]},{"value":"Login-LAT-Group","revisions":[2047,2047]},{"value":"'
+    'Framed-AppleTalk-Zone","revisions":[2047,2047]},{"value":"Acct-Session-Id","revisions":[2047,2047]},{"value":"Acct-Multi-Session-Id","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"switch_controller_service_type":{"multiple_values":true,"type":"list","options":[{"value":"login","revisions":[1664'
+    ',1664]},{"value":"framed","revisions":[1664,1664]},{"value":"callback-login","revisions":[1664,1664]},{"value":"callback-framed","revisions":[1664,166'
+    '4]},{"value":"outbound","revisions":[1664,1664]},{"value":"administrative","revisions":[1664,1664]},{"value":"nas-prompt","revisions":[1664,1664]},{"v'
+    'alue":"authenticate-only","revisions":[1664,1664]},{"value":"callback-nas-prompt","revisions":[1664,1664]},{"value":"call-check","revisions":[1664,166'
+    '4]},{"value":"callback-administrative","revisions":[1664,1664]}],"revisions":[1920,1664]},"sso_attribute_value_override":{"type":"string","options":[{'
+    '"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"nas_ip":{"type":"string","revisions":'
+    '[2047,2047]},"secondary_server":{"type":"string","revisions":[2047,2047]},"rsso_secret":{"type":"string","revisions":[2047,2047]},"all_usergroup":{"ty'
+    'pe":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"switch_contr'
+    'oller_acct_fast_framedip_detect":{"type":"integer","revisions":[1920,1920]},"secret":{"type":"string","revisions":[2047,2047]},"password_renewal":{"ty'
+    'pe":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rsso_context'
+    '_timeout":{"type":"integer","revisions":[2047,2047]},"tertiary_secret":{"type":"string","revisions":[2047,2047]},"rsso_flush_ip_session":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rsso_validate_request'
+    '_secret":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"rsso_ep_one_ip_only":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"rsso_radius_server_port":{"type":"integer","revisions":[2047,2047]},"sso_attribute_key":{"type":"string","revisions":[2047,2047]},"rsso_'
+    'endpoint_attribute":{"type":"string","options":[{"value":"User-Name","revisions":[2047,2047]},{"value":"NAS-IP-Address","revisions":[2047,2047]},{"val'
+    'ue":"Framed-IP-Address","revisions":[2047,2047]},{"value":"Framed-IP-Netmask","revisions":[2047,2047]},{"value":"Filter-Id","revisions":[2047,2047]},{'
+    '"value":"Login-IP-Host","revisions":[2047,2047]},{"value":"Reply-Message","revisions":[2047,2047]},{"value":"Callback-Number","revisions":[2047,2047]}'
+    ',{"value":"Callback-Id","revisions":[2047,2047]},{"value":"Framed-Route","revisions":[2047,2047]},{"value":"Framed-IPX-Network","revisions":[2047,2047'
+    ']},{"value":"Class","revisions":[2047,2047]},{"value":"Called-Station-Id","revisions":[2047,2047]},{"value":"Calling-Station-Id","revisions":[2047,204'
+    '7]},{"value":"NAS-Identifier","revisions":[2047,2047]},{"value":"Proxy-State","revisions":[2047,2047]},{"value":"Login-LAT-Service","revisions":[2047,'
+    '2047]},{"value":"Login-LAT-Node","revisions":[2047,2047]},{"value":"Login-LAT-Group","revisions":[2047,2047]},{"value":"Framed-AppleTalk-Zone","revisi'
+    'ons":[2047,2047]},{"value":"Acct-Session-Id","revisions":[2047,2047]},{"value":"Acct-Multi-Session-Id","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"interface":{"type":"string","revisions":[2040,2024]},"class":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisi'
+    'ons":[2047,2047]},"radius_coa":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"sso_attribute":{"type":"string","options":[{"value":"User-Name","revisions":[2'
+    '047,2047]},{"value":"NAS-IP-Address","revisions":[2047,2047]},{"value":"Framed-IP-Address","revisions":[2047,2047]},{"value":"Framed-IP-Netmask","revi'
+    'sions":[2047,2047]},{"value":"Filter-Id","revisions":[2047,2047]},{"value":"Login-IP-Host","revisions":[2047,2047]},{"value":"Reply-Message","revision'
+    's":[2047,2047]},{"value":"Callback-Number","revisions":[2047,2047]},{"value":"Callback-Id","revisions":[2047,2047]},{"value":"Framed-Route","revisions'
+    '":[2047,2047]},{"value":"Framed-IPX-Network","revisions":[2047,2047]},{"value":"Class","revisions":[2047,2047]},{"value":"Called-Station-Id","revision'
+    's":[2047,2047]},{"value":"Calling-Station-Id","revisions":[2047,2047]},{"value":"NAS-Identifier","revisions":[2047,2047]},{"value":"Proxy-State","revi'
+    'sions":[2047,2047]},{"value":"Login-LAT-Service","revisions":[2047,2047]},{"value":"Login-LAT-Node","revisions":[2047,2047]},{"value":"Login-LAT-Group'
+    '","revisions":[2047,2047]},{"value":"Framed-AppleTalk-Zone","revisions":[2047,2047]},{"value":"Acct-Session-Id","revisions":[2047,2047]},{"value":"Acc'
+    't-Multi-Session-Id","revisions":[2047,2047]}],"revisions":[2047,2047]},"rsso_log_flags":{"multiple_values":true,"type":"list","options":[{"value":"pro'
+    'tocol-error","revisions":[2047,2047]},{"value":"profile-missing","revisions":[2047,2047]},{"value":"accounting-stop-missed","revisions":[2047,2047]},{'
+    '"value":"accounting-event","revisions":[2047,2047]},{"value":"endpoint-block","revisions":[2047,2047]},{"value":"radiusd-other","revisions":[2047,2047'
+    ']},{"value":"none","revisions":[2047,2047]}],"revisions":[2047,2047]},"secondary_secret":{"type":"string","revisions":[2047,2047]},"group_override_att'
+    'r_type":{"type":"string","options":[{"value":"filter-Id","revisions":[1920,1920]},{"value":"class","revisions":[1920,1920]}],"revisions":[1920,1920]},'
+    '"source_ip":{"type":"string","revisions":[2047,2047]},"username_case_sensitive":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]}'
+    ',{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rsso_radius_response":{"type":"string","options":[{"value":"enable","revisions'
+    '":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"server":{"type":"string","revisions":[2047,2047]},"interface_sel'
+    'ect_method":{"type":"string","options":[{"value":"auto","revisions":[2024,2024]},{"value":"sdwan","revisions":[2024,2024]},{"value":"specify","revisio'
+    'ns":[2024,2024]}],"revisions":[2040,2024]},"timeout":{"type":"integer","revisions":[2047,2047]},"radius_port":{"type":"integer","revisions":[2047,2047'
+    ']},"tertiary_server":{"type":"string","revisions":[2047,2047]},"rsso":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":'
+    '"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"password_encoding":{"type":"str","required":false,"choices":["auto","ISO-8859-1"]},"auth_type":{"type":"st'
+    'r","required":false,"choices":["auto","ms_chap_v2","ms_chap","chap","pap"]},"use_management_vdom":{"type":"str","required":false,"choices":["enable","'
+    'disable"]},"h3c_compatibility":{"type":"str","required":false,"choices":["enable","disable"]},"rsso_log_period":{"type":"int","required":false},"acct_'
+    'all_servers":{"type":"str","required":false,"choices":["enable","disable"]},"acct_interim_interval":{"type":"int","required":false},"accounting_server'
+    '":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"id":{"type":"int","required":fal'
+    'se},"source_ip":{"type":"str","required":false},"server":{"type":"str","required":false},"secret":{"type":"str","required":false},"interface_select_me'
+    'thod":{"type":"str","required":false},"interface":{"type":"str","required":false},"port":{"type":"int","required":false}}},"rsso_endpoint_block_attrib'
+    'ute":{"type":"str","required":false,"choices":["User-Name","NAS-IP-Address","Framed-IP-Address","Framed-IP-Netmask","Filter-Id","Login-IP-Host","Reply'
+    '-Message","Callback-Number","Callback-Id","Framed-Route","Framed-IPX-Network","Class","Called-Station-Id","Calling-Station-Id","NAS-Identifier","Proxy'
+    '-State","Login-LAT-Service","Login-LAT-Node","Login-LAT-Group","Framed-AppleTalk-Zone","Acct-Session-Id","Acct-Multi-Session-Id"]},"switch_controller_'
+    'service_type":{"type":"list","required":false},"sso_attribute_value_override":{"type":"str","required":false,"choices":["enable","disable"]},"nas_ip":'
+    '{"type":"str","required":false},"secondary_server":{"type":"str","required":false},"rsso_secret":{"type":"str","required":false},"all_usergroup":{"typ'
+    'e":"str","required":false,"choices":["disable","enable"]},"switch_controller_acct_fast_framedip_detect":{"type":"int","required":false},"secret":{"typ'
+    'e":"str","required":false},"password_renewal":{"type":"str","required":false,"choices":["enable","disable"]},"rsso_context_timeout":{"type":"int","req'
+    'uired":false},"tertiary_secret":{"type":"str","required":false},"rsso_flush_ip_session":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"rsso_validate_request_secret":{"type":"str","required":false,"choices":["enable","disable"]},"rsso_ep_one_ip_only":{"type":"str","required":false,"c'
+    'hoices":["enable","disable"]},"rsso_radius_server_port":{"type":"int","required":false},"sso_attribute_key":{"type":"str","required":false},"rsso_endp'
+    'oint_attribute":{"type":"str","required":false,"choices":["User-Name","NAS-IP-Address","Framed-IP-Address","Framed-IP-Netmask","Filter-Id","Login-IP-H'
+    'ost","Reply-Message","Callback-Number","Callback-Id","Framed-Route","Framed-IPX-Network","Class","Called-Station-Id","Calling-Station-Id","NAS-Identif'
+    'ier","Proxy-State","Login-LAT-Service","Login-LAT-Node","Login-LAT-Group","Framed-AppleTalk-Zone","Acct-Session-Id","Acct-Multi-Session-Id"]},"interfa'
+    'ce":{"type":"str","required":false},"class":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"radius_coa":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"sso_attribute":{"type":"str","required":false,"choices":'
+    '["User-Name","NAS-IP-Address","Framed-IP-Address","Framed-IP-Netmask","Filter-Id","Login-IP-Host","Reply-Message","Callback-Number","Callback-Id","Fra'
+    'med-Route","Framed-IPX-Network","Class","Called-Station-Id","Calling-Station-Id","NAS-Identifier","Proxy-State","Login-LAT-Service","Login-LAT-Node","'
+    'Login-LAT-Group","Framed-AppleTalk-Zone","Acct-Session-Id","Acct-Multi-Session-Id"]},"rsso_log_flags":{"type":"list","required":false,"choices":["prot'
+    'ocol-error","profile-missing","accounting-stop-missed","accounting-event","endpoint-block","radiusd-other","none"]},"secondary_secret":{"type":"str","'
+    'required":false},"group_override_attr_type":{"type":"str","required":false,"choices":["filter-Id","class"]},"source_ip":{"type":"str","required":false'
+    '},"username_case_sensitive":{"type":"str","required":false,"choices":["enable","disable"]},"rsso_radius_response":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"server":{"type":"str","required":false},"interface_select_method":{"type":"str","required":false},"timeout":{"type":"int",'
+    '"required":false},"radius_port":{"type":"int","required":false},"tertiary_server":{"type":"str","required":false},"rsso":{"type":"str","required":fals'
+    'e,"choices":["enable","disable"]}}}'
+)
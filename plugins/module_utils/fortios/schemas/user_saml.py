@@ -0,0 +1,42 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"user_claim_type":{"type":"string","options":[{"value":"email","revisions":[1024,1024]},{"value":"given-name","revisions":['
+    '1024,1024]},{"value":"name","revisions":[1024,1024]},{"value":"upn","revisions":[1024,1024]},{"value":"common-name","revisions":[1024,1024]},{"value":'
+    '"email-adfs-1x","revisions":[1024,1024]},{"value":"group","revisions":[1024,1024]},{"value":"upn-adfs-1x","revisions":[1024,1024]},{"value":"role","re'
+    'visions":[1024,1024]},{"value":"sur-name","revisions":[1024,1024]},{"value":"ppid","revisions":[1024,1024]},{"value":"name-identifier","revisions":[10'
+    '24,1024]},{"value":"authentication-method","revisions":[1024,1024]},{"value":"deny-only-group-sid","revisions":[1024,1024]},{"value":"deny-only-primar'
+    'y-sid","revisions":[1024,1024]},{"value":"deny-only-primary-group-sid","revisions":[1024,1024]},{"value":"group-sid","revisions":[1024,1024]},{"value"'
+    ':"primary-group-sid","revisions":[1024,1024]},{"value":"primary-sid","revisions":[1024,1024]},{"value":"windows-account-name","revisions":[1024,1024]}'
+    '],"revisions":[1024,1024]},"entity_id":{"type":"string","revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]},"idp_single_logout_u'
+    'rl":{"type":"string","revisions":[2040,2040]},"user_name":{"type":"string","revisions":[2040,2040]},"single_logout_url":{"type":"string","revisions":['
+    '2040,2040]},"digest_method":{"type":"string","options":[{"value":"sha1","revisions":[1024,1024]},{"value":"sha256","revisions":[1024,1024]}],"revision'
+    's":[1024,1024]},"cert":{"type":"string","revisions":[2040,2040]},"idp_entity_id":{"type":"string","revisions":[2040,2040]},"group_name":{"type":"strin'
+    'g","revisions":[2040,2040]},"single_sign_on_url":{"type":"string","revisions":[2040,2040]},"limit_relaystate":{"type":"string","options":[{"value":"en'
+    'able","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"adfs_claim":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"idp_cert":{"type":"string","revisions":[2040'
+    ',2040]},"idp_single_sign_on_url":{"type":"string","revisions":[2040,2040]},"group_claim_type":{"type":"string","options":[{"value":"email","revisions"'
+    ':[1024,1024]},{"value":"given-name","revisions":[1024,1024]},{"value":"name","revisions":[1024,1024]},{"value":"upn","revisions":[1024,1024]},{"value"'
+    ':"common-name","revisions":[1024,1024]},{"value":"email-adfs-1x","revisions":[1024,1024]},{"value":"group","revisions":[1024,1024]},{"value":"upn-adfs'
+    '-1x","revisions":[1024,1024]},{"value":"role","revisions":[1024,1024]},{"value":"sur-name","revisions":[1024,1024]},{"value":"ppid","revisions":[1024,'
+    '1024]},{"value":"name-identifier","revisions":[1024,1024]},{"value":"authentication-method","revisions":[1024,1024]},{"value":"deny-only-group-sid","r'
+    'evisions":[1024,1024]},{"value":"deny-only-primary-sid","revisions":[1024,1024]},{"value":"deny-only-primary-group-sid","revisions":[1024,1024]},{"val'
+    'ue":"group-sid","revisions":[1024,1024]},{"value":"primary-group-sid","revisions":[1024,1024]},{"value":"primary-sid","revisions":[1024,1024]},{"value'
+    '":"windows-account-name","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"user_claim_type":{"type":"str","required":false,"choices":["email","given-name","name","upn","common-name"'
+    ',"email-adfs-1x","group","upn-adfs-1x","role","sur-name","ppid","name-identifier","authentication-method","deny-only-group-sid","deny-only-primary-sid'
+    '","deny-only-primary-group-sid","group-sid","primary-group-sid","primary-sid","windows-account-name"]},"entity_id":{"type":"str","required":false},"na'
+    'me":{"type":"str","required":false},"idp_single_logout_url":{"type":"str","required":false},"user_name":{"type":"str","required":false},"single_logout'
+    '_url":{"type":"str","required":false},"digest_method":{"type":"str","required":false,"choices":["sha1","sha256"]},"cert":{"type":"str","required":fals'
+    'e},"idp_entity_id":{"type":"str","required":false},"group_name":{"type":"str","required":false},"single_sign_on_url":{"type":"str","required":false},"'
+    'limit_relaystate":{"type":"str","required":false,"choices":["enable","disable"]},"adfs_claim":{"type":"str","required":false,"choices":["enable","disa'
+    'ble"]},"idp_cert":{"type":"str","required":false},"idp_single_sign_on_url":{"type":"str","required":false},"group_claim_type":{"type":"str","required"'
+    ':false,"choices":["email","given-name","name","upn","common-name","email-adfs-1x","group","upn-adfs-1x","role","sur-name","ppid","name-identifier","au'
+    'thentication-method","deny-only-group-sid","deny-only-primary-sid","deny-only-primary-group-sid","group-sid","primary-group-sid","primary-sid","window'
+    's-account-name"]}}}'
+)
@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"rule":{"type":"list","children":{"srcaddr":{"type":"list","children":{"na'
+    'me":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"service":{"type":"list","children":{"name":{"type":"string","revisions":[2047'
+    ',2047]}},"revisions":[2047,2047]},"dstaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"id"'
+    ':{"type":"integer","revisions":[2047,2047]},"devices":{"type":"list","children":{"name":{"type":"string","revisions":[23,23]}},"revisions":[2047,23]}}'
+    ',"revisions":[2047,2047]},"description":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"rule":{"type":"list","required":false,"options":{"srcaddr":{"type":'
+    '"list","required":false,"options":{"name":{"type":"str","required":false}}},"service":{"type":"list","required":false,"options":{"name":{"type":"str",'
+    '"required":false}}},"dstaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"id":{"type":"int","required":false}'
+    ',"devices":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}}},"description":{"type":"str","required":false}}}'
+)
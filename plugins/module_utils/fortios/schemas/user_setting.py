@@ -0,0 +1,40 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"auth_type":{"multiple_values":true,"type":"list","options":[{"value":"http","revisions":[2047,2047]},{"value":"https","rev'
+    'isions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"value":"telnet","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_ssl_allow_rene'
+    'gotiation":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"auth_lockout_duration":{"type":"integer","revisions":[2047,2047]},"auth_lockout_threshold":{"type":"integer","revisions":[2047,2047]},"auth_timeout'
+    '":{"type":"integer","revisions":[2047,2047]},"auth_http_basic":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disabl'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_cert":{"type":"string","revisions":[2047,2047]},"auth_blackout_time":{"type":"integer","re'
+    'visions":[2047,2047]},"auth_src_mac":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"auth_on_demand":{"type":"string","options":[{"value":"always","revisions":[2040,2040]},{"value":"implicitly","revisions":'
+    '[2040,2040]}],"revisions":[2040,2040]},"auth_secure_http":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","r'
+    'evisions":[2047,2047]}],"revisions":[2047,2047]},"auth_ssl_min_proto_version":{"type":"string","options":[{"value":"default","revisions":[2040,2040]},'
+    '{"value":"SSLv3","revisions":[2040,2040]},{"value":"TLSv1","revisions":[2040,2040]},{"value":"TLSv1-1","revisions":[2040,2040]},{"value":"TLSv1-2","re'
+    'visions":[2040,2040]}],"revisions":[2040,2040]},"auth_ports":{"type":"list","children":{"type":{"type":"string","options":[{"value":"http","revisions"'
+    ':[2047,2047]},{"value":"https","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"value":"telnet","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"port":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"auth_ca_ce'
+    'rt":{"type":"string","revisions":[2047,2047]},"auth_timeout_type":{"type":"string","options":[{"value":"idle-timeout","revisions":[2047,2047]},{"value'
+    '":"hard-timeout","revisions":[2047,2047]},{"value":"new-session","revisions":[2047,2047]}],"revisions":[2047,2047]},"radius_ses_timeout_act":{"type":"'
+    'string","options":[{"value":"hard-timeout","revisions":[2047,2047]},{"value":"ignore-timeout","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth'
+    '_portal_timeout":{"type":"integer","revisions":[2047,2047]},"per_policy_disclaimer":{"type":"string","options":[{"value":"enable","revisions":[2040,20'
+    '40]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"auth_invalid_max":{"type":"integer","revisions":[2047,2047]}},"revisions":'
+    '[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"auth_type":{"type":"list","required":false,"choices":["http","https","ftp","telnet"]},"auth_ssl_allow_rene'
+    'gotiation":{"type":"str","required":false,"choices":["enable","disable"]},"auth_lockout_duration":{"type":"int","required":false},"auth_lockout_thresh'
+    'old":{"type":"int","required":false},"auth_timeout":{"type":"int","required":false},"auth_http_basic":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"auth_cert":{"type":"str","required":false},"auth_blackout_time":{"type":"int","required":false},"auth_src_mac":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"auth_on_demand":{"type":"str","required":false,"choices":["always","implicitly"]},"auth_secure_http":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"auth_ssl_min_proto_version":{"type":"str","required":false,"choices":["default","SSLv3","TLSv1'
+    '","TLSv1-1","TLSv1-2"]},"auth_ports":{"type":"list","required":false,"options":{"type":{"type":"str","required":false,"choices":["http","https","ftp",'
+    '"telnet"]},"id":{"type":"int","required":false},"port":{"type":"int","required":false}}},"auth_ca_cert":{"type":"str","required":false},"auth_timeout_'
+    'type":{"type":"str","required":false,"choices":["idle-timeout","hard-timeout","new-session"]},"radius_ses_timeout_act":{"type":"str","required":false,'
+    '"choices":["hard-timeout","ignore-timeout"]},"auth_portal_timeout":{"type":"int","required":false},"per_policy_disclaimer":{"type":"str","required":fa'
+    'lse,"choices":["enable","disable"]},"auth_invalid_max":{"type":"int","required":false}}}'
+)
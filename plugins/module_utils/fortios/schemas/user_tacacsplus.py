@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"secondary_server":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"tertiary_key'
+    '":{"type":"string","revisions":[2047,2047]},"secondary_key":{"type":"string","revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2047,2'
+    '047]},"server":{"type":"string","revisions":[2047,2047]},"interface_select_method":{"type":"string","options":[{"value":"auto","revisions":[2024,2024]'
+    '},{"value":"sdwan","revisions":[2024,2024]},{"value":"specify","revisions":[2024,2024]}],"revisions":[2040,2024]},"key":{"type":"string","revisions":['
+    '2047,2047]},"interface":{"type":"string","revisions":[2040,2024]},"authen_type":{"type":"string","options":[{"value":"mschap","revisions":[2047,2047]}'
+    ',{"value":"chap","revisions":[2047,2047]},{"value":"pap","revisions":[2047,2047]},{"value":"ascii","revisions":[2047,2047]},{"value":"auto","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"tertiary_server":{"type":"string","revisions":[2047,2047]},"port":{"type":"integer","revisions":[2047,2047]}'
+    ',"authorization":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"secondary_server":{"type":"str","required":false},"name":{"type":"str","required":false},"tertiary_key":{"'
+    'type":"str","required":false},"secondary_key":{"type":"str","required":false},"source_ip":{"type":"str","required":false},"server":{"type":"str","requ'
+    'ired":false},"interface_select_method":{"type":"str","required":false},"key":{"type":"str","required":false},"interface":{"type":"str","required":fals'
+    'e},"authen_type":{"type":"str","required":false,"choices":["mschap","chap","pap","ascii","auto"]},"tertiary_server":{"type":"str","required":false},"p'
+    'ort":{"type":"int","required":false},"authorization":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
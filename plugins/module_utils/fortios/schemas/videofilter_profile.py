@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[1024,1024]},"dailymotion":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"name":{"type":"string","revisions":[1024,1024]},"youtube_restrict'
+    '":{"type":"string","options":[{"value":"none","revisions":[1024,1024]},{"value":"strict","revisions":[1024,1024]},{"value":"moderate","revisions":[102'
+    '4,1024]}],"revisions":[1024,1024]},"vimeo":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024'
+    ',1024]}],"revisions":[1024,1024]},"youtube":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[102'
+    '4,1024]}],"revisions":[1024,1024]},"vimeo_restrict":{"type":"string","revisions":[1024,1024]},"youtube_channel_filter":{"type":"integer","revisions":['
+    '1024,1024]},"fortiguard_category":{"type":"dict","children":{"filters":{"type":"list","children":{"action":{"type":"string","options":[{"value":"bypas'
+    's","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]},{"value":"block","revisions":[1024,1024]}],"revisions":[1024,1024]},"category_'
+    'id":{"type":"integer","revisions":[1024,1024]},"log":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisi'
+    'ons":[1024,1024]}],"revisions":[1024,1024]},"id":{"type":"integer","revisions":[1024,1024]}},"revisions":[1024,1024]}},"revisions":[1024,1024]}},"revi'
+    'sions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"dailymotion":{"type":"str","required":false,"choices":["enable",'
+    '"disable"]},"name":{"type":"str","required":false},"youtube_restrict":{"type":"str","required":false,"choices":["none","strict","moderate"]},"vimeo":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"youtube":{"type":"str","required":false,"choices":["enable","disable"]},"vimeo_restrict'
+    '":{"type":"str","required":false},"youtube_channel_filter":{"type":"int","required":false},"fortiguard_category":{"type":"dict","required":false,"opti'
+    'ons":{"filters":{"type":"list","required":false,"options":{"action":{"type":"str","required":false,"choices":["bypass","monitor","block"]},"category_i'
+    'd":{"type":"int","required":false},"log":{"type":"str","required":false,"choices":["enable","disable"]},"id":{"type":"int","required":false}}}}}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[1024,1024]},"entries":{"type":"list","children":{"comment":{"type":"string","revisi'
+    'ons":[1024,1024]},"action":{"type":"string","options":[{"value":"bypass","revisions":[1024,1024]},{"value":"monitor","revisions":[1024,1024]},{"value"'
+    ':"block","revisions":[1024,1024]}],"revisions":[1024,1024]},"id":{"type":"integer","revisions":[1024,1024]},"channel_id":{"type":"string","revisions":'
+    '[1024,1024]}},"revisions":[1024,1024]},"id":{"type":"integer","revisions":[1024,1024]},"name":{"type":"string","revisions":[1024,1024]}},"revisions":['
+    '1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"comment":{"'
+    'type":"str","required":false},"action":{"type":"str","required":false,"choices":["bypass","monitor","block"]},"id":{"type":"int","required":false},"ch'
+    'annel_id":{"type":"str","required":false}}},"id":{"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
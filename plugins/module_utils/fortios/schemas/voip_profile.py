@@ -0,0 +1,203 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"feature_set":{"type":"string","options":[{"value":"flow","revisions":['
+    '1024,1024]},{"value":"proxy","revisions":[1024,1024]}],"revisions":[1024,1024]},"sip":{"type":"dict","children":{"ssl_mode":{"type":"string","options"'
+    ':[{"value":"off","revisions":[2047,2047]},{"value":"full","revisions":[2047,2047]}],"revisions":[2047,2047]},"prack_rate_track":{"type":"string","opti'
+    'ons":[{"value":"none","revisions":[1024,1024]},{"value":"src-ip","revisions":[1024,1024]},{"value":"dest-ip","revisions":[1024,1024]}],"revisions":[10'
+    '24,1024]},"provisional_invite_expiry_time":{"type":"integer","revisions":[2047,2047]},"ack_rate_track":{"type":"string","options":[{"value":"none","re'
+    'visions":[1024,1024]},{"value":"src-ip","revisions":[1024,1024]},{"value":"dest-ip","revisions":[1024,1024]}],"revisions":[1024,1024]},"unknown_header'
+    '":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"block_options":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"rtp":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"malformed_header_no_proxy_require":{"type":"string","options":[{"value":"discard","revisions":[1024,1024]},{"v'
+    'alue":"pass","revisions":[1024,1024]},{"value":"respond","revisions":[1024,1024]}],"revisions":[1024,1024]},"ssl_server_certificate":{"type":"string",'
+    '"revisions":[2047,2047]},"register_contact_trace":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"nat_port_range":{"type":"string","revisions":[2040,2040]},"open_via_pinhole":{"type":"string","options":[{"v'
+    'alue":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_header_record_route":{"type":'
+    '"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"register_rate":{"type":"integer","revisions":[2047,2047]},"ssl_client_certificate":{"type":"string","revisions":[2047,2047]}'
+    ',"block_refer":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"malformed_header_rack":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value'
+    '":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"block_unknown":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]}'
+    ',{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"open_contact_pinhole":{"type":"string","options":[{"value":"disable","revisions'
+    '":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_header_via":{"type":"string","options":[{"value":"disca'
+    'rd","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed'
+    '_header_max_forwards":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respo'
+    'nd","revisions":[2047,2047]}],"revisions":[2047,2047]},"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"block_ack":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"e'
+    'nable","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_violations":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"v'
+    'alue":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_body_length":{"type":"integer","revisions":[2047,2047]},"malformed_header_route'
+    '":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"ssl_algorithm":{"type":"string","options":[{"value":"high","revisions":[2047,2047]},{"value":"medium","revisions":'
+    '[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]},"invite_rate_track":{"type":"string","options":[{"value":"none","revisi'
+    'ons":[1024,1024]},{"value":"src-ip","revisions":[1024,1024]},{"value":"dest-ip","revisions":[1024,1024]}],"revisions":[1024,1024]},"max_line_length":{'
+    '"type":"integer","revisions":[2047,2047]},"subscribe_rate_track":{"type":"string","options":[{"value":"none","revisions":[1024,1024]},{"value":"src-ip'
+    '","revisions":[1024,1024]},{"value":"dest-ip","revisions":[1024,1024]}],"revisions":[1024,1024]},"update_rate":{"type":"integer","revisions":[2047,204'
+    '7]},"block_message":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"max_dialogs":{"type":"integer","revisions":[2047,2047]},"malformed_header_content_length":{"type":"string","options":[{"value":"discard","'
+    'revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_head'
+    'er_expires":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"cancel_rate_track":{"type":"string","options":[{"value":"none","revisions":[1024,1024]},{"value":"src-ip'
+    '","revisions":[1024,1024]},{"value":"dest-ip","revisions":[1024,1024]}],"revisions":[1024,1024]},"ssl_client_renegotiation":{"type":"string","options"'
+    ':[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]},{"value":"secure","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"no_sdp_fixup":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"ssl_min_version":{"type":"string","options":[{"value":"ssl-3.0","revisions":[2047,2047]},{"value":"tls-1.0","revisions":[2047,2047]},{"valu'
+    'e":"tls-1.1","revisions":[2047,2047]},{"value":"tls-1.2","revisions":[2047,2047]},{"value":"tls-1.3","revisions":[2040,2040]}],"revisions":[2047,2047]'
+    '},"malformed_header_allow":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"'
+    'respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"invite_rate":{"type":"integer","revisions":[2047,2047]},"malformed_request_line":{"type":'
+    '"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"bye_rate":{"type":"integer","revisions":[2047,2047]},"ssl_pfs":{"type":"string","options":[{"value":"require","revisions":[2'
+    '047,2047]},{"value":"deny","revisions":[2047,2047]},{"value":"allow","revisions":[2047,2047]}],"revisions":[2047,2047]},"hnt_restrict_source_ip":{"typ'
+    'e":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"hosted_nat_tr'
+    'aversal":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"publish_rate":{"type":"integer","revisions":[2047,2047]},"block_subscribe":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"'
+    'value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_header_content_type":{"type":"string","options":[{"value":"discard","rev'
+    'isions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_call_summary"'
+    ':{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"malform'
+    'ed_header_contact":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_header_call_id":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]}'
+    ',{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"options_rate_track":{"type":"string",'
+    '"options":[{"value":"none","revisions":[1024,1024]},{"value":"src-ip","revisions":[1024,1024]},{"value":"dest-ip","revisions":[1024,1024]}],"revisions'
+    '":[1024,1024]},"options_rate":{"type":"integer","revisions":[2047,2047]},"preserve_override":{"type":"string","options":[{"value":"disable","revisions'
+    '":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_auth_client":{"type":"string","revisions":[2047,2047]},"malfo'
+    'rmed_header_sdp_r":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_header_sdp_s":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{'
+    '"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_header_sdp_t":{"type":"string'
+    '","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisi'
+    'ons":[2047,2047]},"malformed_header_sdp_v":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2'
+    '047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_header_sdp_z":{"type":"string","options":[{"value":"discard","r'
+    'evisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"ack_rate":{"typ'
+    'e":"integer","revisions":[2047,2047]},"malformed_header_sdp_a":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass"'
+    ',"revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_header_sdp_b":{"type":"string","options":[{'
+    '"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"malformed_header_sdp_c":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value"'
+    ':"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_header_sdp_i":{"type":"string","options":[{"value":"discard","revisions":[204'
+    '7,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_header_sdp_k":{"typ'
+    'e":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"malformed_header_sdp_m":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revision'
+    's":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_header_sdp_o":{"type":"string","options":[{"value":"d'
+    'iscard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"stric'
+    't_register":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"open_record_route_pinhole":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"block_long_lines":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"block_bye":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"block_invite":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"refer_rate":{"type":"integer","revisions":[2047,2047]},"block_notify":{"type":"string","options":[{"value":"'
+    'disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"subscribe_rate":{"type":"integer","revisions":'
+    '[2047,2047]},"block_publish":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"malformed_header_to":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,20'
+    '47]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_send_empty_frags":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"contact_fixup":{"type":"string","options":[{"value":"disable'
+    '","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"notify_rate":{"type":"integer","revisions":[2047,2047'
+    ']},"ssl_auth_server":{"type":"string","revisions":[2047,2047]},"malformed_header_cseq":{"type":"string","options":[{"value":"discard","revisions":[204'
+    '7,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"notify_rate_track":{"type":"s'
+    'tring","options":[{"value":"none","revisions":[1024,1024]},{"value":"src-ip","revisions":[1024,1024]},{"value":"dest-ip","revisions":[1024,1024]}],"re'
+    'visions":[1024,1024]},"block_geo_red_options":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"open_register_pinhole":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"info_rate":{"type":"integer","revisions":[2047,2047]},"message_rate":{"type":"integer","revisions'
+    '":[2047,2047]},"block_prack":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"ssl_max_version":{"type":"string","options":[{"value":"ssl-3.0","revisions":[2047,2047]},{"value":"tls-1.0","revisions":[2047,204'
+    '7]},{"value":"tls-1.1","revisions":[2047,2047]},{"value":"tls-1.2","revisions":[2047,2047]},{"value":"tls-1.3","revisions":[2040,2040]}],"revisions":['
+    '2047,2047]},"rfc2543_branch":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"block_register":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"block_cancel":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"publish_rate_track":{"type":"string","options":[{"value":"none","revisions":[1024,1024]},{"value":"src-ip","revisio'
+    'ns":[1024,1024]},{"value":"dest-ip","revisions":[1024,1024]}],"revisions":[1024,1024]},"call_keepalive":{"type":"integer","revisions":[2047,2047]},"ip'
+    's_rtp":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"r'
+    'efer_rate_track":{"type":"string","options":[{"value":"none","revisions":[1024,1024]},{"value":"src-ip","revisions":[1024,1024]},{"value":"dest-ip","r'
+    'evisions":[1024,1024]}],"revisions":[1024,1024]},"prack_rate":{"type":"integer","revisions":[2047,2047]},"max_idle_dialogs":{"type":"integer","revisio'
+    'ns":[2047,2047]},"malformed_header_rseq":{"type":"string","options":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,204'
+    '7]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]},"bye_rate_track":{"type":"string","options":[{"value":"none","revisions":[10'
+    '24,1024]},{"value":"src-ip","revisions":[1024,1024]},{"value":"dest-ip","revisions":[1024,1024]}],"revisions":[1024,1024]},"nat_trace":{"type":"string'
+    '","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"cancel_rate":{"type":"i'
+    'nteger","revisions":[2047,2047]},"block_update":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"register_rate_track":{"type":"string","options":[{"value":"none","revisions":[1024,1024]},{"value":"src-ip","r'
+    'evisions":[1024,1024]},{"value":"dest-ip","revisions":[1024,1024]}],"revisions":[1024,1024]},"info_rate_track":{"type":"string","options":[{"value":"n'
+    'one","revisions":[1024,1024]},{"value":"src-ip","revisions":[1024,1024]},{"value":"dest-ip","revisions":[1024,1024]}],"revisions":[1024,1024]},"messag'
+    'e_rate_track":{"type":"string","options":[{"value":"none","revisions":[1024,1024]},{"value":"src-ip","revisions":[1024,1024]},{"value":"dest-ip","revi'
+    'sions":[1024,1024]}],"revisions":[1024,1024]},"update_rate_track":{"type":"string","options":[{"value":"none","revisions":[1024,1024]},{"value":"src-i'
+    'p","revisions":[1024,1024]},{"value":"dest-ip","revisions":[1024,1024]}],"revisions":[1024,1024]},"block_info":{"type":"string","options":[{"value":"d'
+    'isable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"malformed_header_from":{"type":"string","option'
+    's":[{"value":"discard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[204'
+    '7,2047]},"malformed_header_no_require":{"type":"string","options":[{"value":"discard","revisions":[1024,1024]},{"value":"pass","revisions":[1024,1024]'
+    '},{"value":"respond","revisions":[1024,1024]}],"revisions":[1024,1024]},"malformed_header_p_asserted_identity":{"type":"string","options":[{"value":"d'
+    'iscard","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"respond","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revi'
+    'sions":[2047,2047]},"sccp":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enabl'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"verify_header":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value"'
+    ':"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_call_summary":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]'
+    '},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"block_mcast":{"type":"string","options":[{"value":"disable","revisions":[2047,'
+    '2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_calls":{"type":"integer","revisions":[2047,2047]},"log_violations":{"'
+    'type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions'
+    '":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"feature_set":{"type":"str","required":false,"choices":["flow","p'
+    'roxy"]},"sip":{"type":"dict","required":false,"options":{"ssl_mode":{"type":"str","required":false,"choices":["off","full"]},"prack_rate_track":{"type'
+    '":"str","required":false,"choices":["none","src-ip","dest-ip"]},"provisional_invite_expiry_time":{"type":"int","required":false},"ack_rate_track":{"ty'
+    'pe":"str","required":false,"choices":["none","src-ip","dest-ip"]},"unknown_header":{"type":"str","required":false,"choices":["discard","pass","respond'
+    '"]},"block_options":{"type":"str","required":false,"choices":["disable","enable"]},"rtp":{"type":"str","required":false,"choices":["disable","enable"]'
+    '},"malformed_header_no_proxy_require":{"type":"str","required":false,"choices":["discard","pass","respond"]},"ssl_server_certificate":{"type":"str","r'
+    'equired":false},"register_contact_trace":{"type":"str","required":false,"choices":["disable","enable"]},"nat_port_range":{"type":"str","required":fals'
+    'e},"open_via_pinhole":{"type":"str","required":false,"choices":["disable","enable"]},"malformed_header_record_route":{"type":"str","required":false,"c'
+    'hoices":["discard","pass","respond"]},"register_rate":{"type":"int","required":false},"ssl_client_certificate":{"type":"str","required":false},"block_'
+    'refer":{"type":"str","required":false,"choices":["disable","enable"]},"malformed_header_rack":{"type":"str","required":false,"choices":["discard","pas'
+    's","respond"]},"block_unknown":{"type":"str","required":false,"choices":["disable","enable"]},"open_contact_pinhole":{"type":"str","required":false,"c'
+    'hoices":["disable","enable"]},"malformed_header_via":{"type":"str","required":false,"choices":["discard","pass","respond"]},"malformed_header_max_forw'
+    'ards":{"type":"str","required":false,"choices":["discard","pass","respond"]},"status":{"type":"str","required":false,"choices":["disable","enable"]},"'
+    'block_ack":{"type":"str","required":false,"choices":["disable","enable"]},"log_violations":{"type":"str","required":false,"choices":["disable","enable'
+    '"]},"max_body_length":{"type":"int","required":false},"malformed_header_route":{"type":"str","required":false,"choices":["discard","pass","respond"]},'
+    '"ssl_algorithm":{"type":"str","required":false,"choices":["high","medium","low"]},"invite_rate_track":{"type":"str","required":false,"choices":["none"'
+    ',"src-ip","dest-ip"]},"max_line_length":{"type":"int","required":false},"subscribe_rate_track":{"type":"str","required":false,"choices":["none","src-i'
+    'p","dest-ip"]},"update_rate":{"type":"int","required":false},"block_message":{"type":"str","required":false,"choices":["disable","enable"]},"max_dialo'
+    'gs":{"type":"int","required":false},"malformed_header_content_length":{"type":"str","required":false,"choices":["discard","pass","respond"]},"malforme'
+    'd_header_expires":{"type":"str","required":false,"choices":["discard","pass","respond"]},"cancel_rate_track":{"type":"str","required":false,"choices":'
+    '["none","src-ip","dest-ip"]},"ssl_client_renegotiation":{"type":"str","required":false,"choices":["allow","deny","secure"]},"no_sdp_fixup":{"type":"st'
+    'r","required":false,"choices":["disable","enable"]},"ssl_min_version":{"type":"str","required":false},"malformed_header_allow":{"type":"str","required'
+    '":false,"choices":["discard","pass","respond"]},"invite_rate":{"type":"int","required":false},"malformed_request_line":{"type":"str","required":false,'
+    '"choices":["discard","pass","respond"]},"bye_rate":{"type":"int","required":false},"ssl_pfs":{"type":"str","required":false,"choices":["require","deny'
+    '","allow"]},"hnt_restrict_source_ip":{"type":"str","required":false,"choices":["disable","enable"]},"hosted_nat_traversal":{"type":"str","required":fa'
+    'lse,"choices":["disable","enable"]},"publish_rate":{"type":"int","required":false},"block_subscribe":{"type":"str","required":false,"choices":["disabl'
+    'e","enable"]},"malformed_header_content_type":{"type":"str","required":false,"choices":["discard","pass","respond"]},"log_call_summary":{"type":"str",'
+    '"required":false,"choices":["disable","enable"]},"malformed_header_contact":{"type":"str","required":false,"choices":["discard","pass","respond"]},"ma'
+    'lformed_header_call_id":{"type":"str","required":false,"choices":["discard","pass","respond"]},"options_rate_track":{"type":"str","required":false,"ch'
+    'oices":["none","src-ip","dest-ip"]},"options_rate":{"type":"int","required":false},"preserve_override":{"type":"str","required":false,"choices":["disa'
+    'ble","enable"]},"ssl_auth_client":{"type":"str","required":false},"malformed_header_sdp_r":{"type":"str","required":false,"choices":["discard","pass",'
+    '"respond"]},"malformed_header_sdp_s":{"type":"str","required":false,"choices":["discard","pass","respond"]},"malformed_header_sdp_t":{"type":"str","re'
+    'quired":false,"choices":["discard","pass","respond"]},"malformed_header_sdp_v":{"type":"str","required":false,"choices":["discard","pass","respond"]},'
+    '"malformed_header_sdp_z":{"type":"str","required":false,"choices":["discard","pass","respond"]},"ack_rate":{"type":"int","required":false},"malformed_'
+    'header_sdp_a":{"type":"str","required":false,"choices":["discard","pass","respond"]},"malformed_header_sdp_b":{"type":"str","required":false,"choices"'
+    ':["discard","pass","respond"]},"malformed_header_sdp_c":{"type":"str","required":false,"choices":["discard","pass","respond"]},"malformed_header_sdp_i'
+    '":{"type":"str","required":false,"choices":["discard","pass","respond"]},"malformed_header_sdp_k":{"type":"str","required":false,"choices":["discard",'
+    '"pass","respond"]},"malformed_header_sdp_m":{"type":"str","required":false,"choices":["discard","pass","respond"]},"malformed_header_sdp_o":{"type":"s'
+    'tr","required":false,"choices":["discard","pass","respond"]},"strict_register":{"type":"str","required":false,"choices":["disable","enable"]},"open_re'
+    'cord_route_pinhole":{"type":"str","required":false,"choices":["disable","enable"]},"block_long_lines":{"type":"str","required":false,"choices":["disab'
+    'le","enable"]},"block_bye":{"type":"str","required":false,"choices":["disable","enable"]},"block_invite":{"type":"str","required":false,"choices":["di'
+    'sable","enable"]},"refer_rate":{"type":"int","required":false},"block_notify":{"type":"str","required":false,"choices":["disable","enable"]},"subscrib'
+    'e_rate":{"type":"int","required":false},"block_publish":{"type":"str","required":false,"choices":["disable","enable"]},"malformed_header_to":{"type":"'
+    'str","required":false,"choices":["discard","pass","respond"]},"ssl_send_empty_frags":{"type":"str","required":false,"choices":["enable","disable"]},"c'
+    'ontact_fixup":{"type":"str","required":false,"choices":["disable","enable"]},"notify_rate":{"type":"int","required":false},"ssl_auth_server":{"type":"'
+    'str","required":false},"malformed_header_cseq":{"type":"str","required":false,"choices":["discard","pass","respond"]},"notify_rate_track":{"type":"str'
+    '","required":false,"choices":["none","src-ip","dest-ip"]},"block_geo_red_options":{"type":"str","required":false,"choices":["disable","enable"]},"open'
+    '_register_pinhole":{"type":"str","required":false,"choices":["disable","enable"]},"info_rate":{"type":"int","required":false},"message_rate":{"type":"'
+    'int","required":false},"block_prack":{"type":"str","required":false,"choices":["disable","enable"]},"ssl_max_version":{"type":"str","required":false},'
+    '"rfc2543_branch":{"type":"str","required":false,"choices":["disable","enable"]},"block_register":{"type":"str","required":false,"choices":["disable","'
+    'enable"]},"block_cancel":{"type":"str","required":false,"choices":["disable","enable"]},"publish_rate_track":{"type":"str","required":false,"choices":'
+    '["none","src-ip","dest-ip"]},"call_keepalive":{"type":"int","required":false},"ips_rtp":{"type":"str","required":false,"choices":["disable","enable"]}'
+    ',"refer_rate_track":{"type":"str","required":false,"choices":["none","src-ip","dest-ip"]},"prack_rate":{"type":"int","required":false},"max_idle_dialo'
+    'gs":{"type":"int","required":false},"malformed_header_rseq":{"type":"str","required":false,"choices":["discard","pass","respond"]},"bye_rate_track":{"'
+    'type":"str","required":false,"choices":["none","src-ip","dest-ip"]},"nat_trace":{"type":"str","required":false,"choices":["disable","enable"]},"cancel'
+    '_rate":{"type":"int","required":false},"block_update":{"type":"str","required":false,"choices":["disable","enable"]},"register_rate_track":{"type":"st'
+    'r","required":false,"choices":["none","src-ip","dest-ip"]},"info_rate_track":{"type":"str","required":false,"choices":["none","src-ip","dest-ip"]},"me'
+    'ssage_rate_track":{"type":"str","required":false,"choices":["none","src-ip","dest-ip"]},"update_rate_track":{"type":"str","required":false,"choices":['
+    '"none","src-ip","dest-ip"]},"block_info":{"type":"str","required":false,"choices":["disable","enable"]},"malformed_header_from":{"type":"str","require'
+    'd":false,"choices":["discard","pass","respond"]},"malformed_header_no_require":{"type":"str","required":false,"choices":["discard","pass","respond"]},'
+    '"malformed_header_p_asserted_identity":{"type":"str","required":false,"choices":["discard","pass","respond"]}}},"sccp":{"type":"dict","required":false'
+    ',"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"verify_header":{"type":"str","required":false,"choices":["disable'
+    '","enable"]},"log_call_summary":{"type":"str","required":false,"choices":["disable","enable"]},"block_mcast":{"type":"str","required":false,"choices":'
+    '["disable","enable"]},"max_calls":{"type":"int","required":false},"log_violations":{"type":"str","required":false,"choices":["disable","enable"]}}},"n'
+    'ame":{"type":"str","required":false}}}'
+)
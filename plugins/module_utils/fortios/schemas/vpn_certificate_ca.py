@@ -0,0 +1,22 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ssl_inspection_trusted":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisio'
+    'ns":[2040,2040]}],"revisions":[2040,2040]},"auto_update_days_warning":{"type":"integer","revisions":[2047,2047]},"auto_update_days":{"type":"integer",'
+    '"revisions":[2047,2047]},"last_updated":{"type":"integer","revisions":[2047,23]},"name":{"type":"string","revisions":[2047,2047]},"scep_url":{"type":"'
+    'string","revisions":[2047,2047]},"ca":{"type":"string","revisions":[2047,2047]},"source_ip":{"type":"string","revisions":[2047,2047]},"source":{"type"'
+    ':"string","options":[{"value":"factory","revisions":[2047,2047]},{"value":"user","revisions":[2047,2047]},{"value":"bundle","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"range":{"type":"string","options":[{"value":"global","revisions":[2047,2047]},{"value":"vdom","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"trusted":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[20'
+    '47,7]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ssl_inspection_trusted":{"type":"str","required":false,"choices":["enable","disable"]},"auto_update_days_w'
+    'arning":{"type":"int","required":false},"auto_update_days":{"type":"int","required":false},"last_updated":{"type":"int","required":false},"name":{"typ'
+    'e":"str","required":false},"scep_url":{"type":"str","required":false},"ca":{"type":"str","required":false},"source_ip":{"type":"str","required":false}'
+    ',"source":{"type":"str","required":false,"choices":["factory","user","bundle"]},"range":{"type":"str","required":false,"choices":["global","vdom"]},"t'
+    'rusted":{"type":"str","required":false}}}'
+)
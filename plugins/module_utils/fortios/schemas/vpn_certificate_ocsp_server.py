@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"url":{"type":"string","revisions":[2047,2047]},"source_ip":{"type":"strin'
+    'g","revisions":[2047,2047]},"secondary_url":{"type":"string","revisions":[2047,2047]},"secondary_cert":{"type":"string","revisions":[2047,2047]},"cert'
+    '":{"type":"string","revisions":[2047,2047]},"unavail_action":{"type":"string","options":[{"value":"revoke","revisions":[2047,2047]},{"value":"ignore",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"url":{"type":"str","required":false},"source_ip":{"type":"str","req'
+    'uired":false},"secondary_url":{"type":"str","required":false},"secondary_cert":{"type":"str","required":false},"cert":{"type":"str","required":false},'
+    '"unavail_action":{"type":"str","required":false,"choices":["revoke","ignore"]}}}'
+)
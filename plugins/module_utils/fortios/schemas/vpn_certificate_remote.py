@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"source":{"type":"string","options":[{"value":"factory","revisions":[2047,2047]},{"value":"user","revisions":[2047,2047]},{'
+    '"value":"bundle","revisions":[2047,2047]}],"revisions":[2047,2047]},"range":{"type":"string","options":[{"value":"global","revisions":[2047,2047]},{"v'
+    'alue":"vdom","revisions":[2047,2047]}],"revisions":[2047,2047]},"remote":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions"'
+    ':[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"source":{"type":"str","required":false,"choices":["factory","user","bundle"]},"range":{"type":"str","requi'
+    'red":false,"choices":["global","vdom"]},"remote":{"type":"str","required":false},"name":{"type":"str","required":false}}}'
+)
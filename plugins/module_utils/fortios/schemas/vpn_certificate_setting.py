@@ -0,0 +1,43 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"ssl_ocsp_source_ip":{"type":"string","revisions":[2040,2024]},"cn_match":{"type":"string","options":[{"value":"substring",'
+    '"revisions":[2047,2047]},{"value":"value","revisions":[2047,2047]}],"revisions":[2047,2047]},"strict_ocsp_check":{"type":"string","options":[{"value":'
+    '"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"certname_ed448":{"type":"string","revisions":'
+    '[2040,2040]},"cmp_save_extra_certs":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"certname_dsa2048":{"type":"string","revisions":[2047,2047]},"certname_dsa1024":{"type":"string","revisions":[2047,2047]},"'
+    'ssl_ocsp_status":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"check_'
+    'ca_cert":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"ocsp_default_server":{"type":"string","revisions":[2047,2047]},"certname_ed25519":{"type":"string","revisions":[2040,2040]},"certname_ecdsa256":{"typ'
+    'e":"string","revisions":[2047,2047]},"subject_match":{"type":"string","options":[{"value":"substring","revisions":[2047,2047]},{"value":"value","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"certname_ecdsa521":{"type":"string","revisions":[2040,2040]},"strict_crl_check":{"type":"string","option'
+    's":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ocsp_status":{"type":"string","o'
+    'ptions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"certname_rsa4096":{"type":"'
+    'string","revisions":[2040,2040]},"check_ca_chain":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"cmp_key_usage_checking":{"type":"string","options":[{"value":"enable","revisions":[2029,2029]},{"value":"dis'
+    'able","revisions":[2029,2029]}],"revisions":[2047,2029]},"ocsp_option":{"type":"string","options":[{"value":"certificate","revisions":[2040,2040]},{"v'
+    'alue":"server","revisions":[2040,2040]}],"revisions":[2040,2040]},"ssl_min_proto_version":{"type":"string","options":[{"value":"default","revisions":['
+    '2047,2047]},{"value":"SSLv3","revisions":[2047,2047]},{"value":"TLSv1","revisions":[2047,2047]},{"value":"TLSv1-1","revisions":[2047,2047]},{"value":"'
+    'TLSv1-2","revisions":[2047,2047]}],"revisions":[2047,2047]},"interface":{"type":"string","revisions":[2040,1768]},"certname_rsa1024":{"type":"string",'
+    '"revisions":[2047,2047]},"ssl_ocsp_option":{"type":"string","options":[{"value":"certificate","revisions":[7,7]},{"value":"server","revisions":[7,7]}]'
+    ',"revisions":[2047,7]},"certname_ecdsa384":{"type":"string","revisions":[2047,2047]},"certname_rsa2048":{"type":"string","revisions":[2047,2047]},"int'
+    'erface_select_method":{"type":"string","options":[{"value":"auto","revisions":[1768,1768]},{"value":"sdwan","revisions":[1768,1768]},{"value":"specify'
+    '","revisions":[1768,1768]}],"revisions":[2040,1768]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"ssl_ocsp_source_ip":{"type":"str","required":false},"cn_match":{"type":"str","required":false,"choices":["'
+    'substring","value"]},"strict_ocsp_check":{"type":"str","required":false,"choices":["enable","disable"]},"certname_ed448":{"type":"str","required":fals'
+    'e},"cmp_save_extra_certs":{"type":"str","required":false,"choices":["enable","disable"]},"certname_dsa2048":{"type":"str","required":false},"certname_'
+    'dsa1024":{"type":"str","required":false},"ssl_ocsp_status":{"type":"str","required":false},"check_ca_cert":{"type":"str","required":false,"choices":["'
+    'enable","disable"]},"ocsp_default_server":{"type":"str","required":false},"certname_ed25519":{"type":"str","required":false},"certname_ecdsa256":{"typ'
+    'e":"str","required":false},"subject_match":{"type":"str","required":false,"choices":["substring","value"]},"certname_ecdsa521":{"type":"str","required'
+    '":false},"strict_crl_check":{"type":"str","required":false,"choices":["enable","disable"]},"ocsp_status":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"certname_rsa4096":{"type":"str","required":false},"check_ca_chain":{"type":"str","required":false,"choices":["enable","disable"]},"'
+    'cmp_key_usage_checking":{"type":"str","required":false},"ocsp_option":{"type":"str","required":false,"choices":["certificate","server"]},"ssl_min_prot'
+    'o_version":{"type":"str","required":false,"choices":["default","SSLv3","TLSv1","TLSv1-1","TLSv1-2"]},"interface":{"type":"str","required":false},"cert'
+    'name_rsa1024":{"type":"str","required":false},"ssl_ocsp_option":{"type":"str","required":false},"certname_ecdsa384":{"type":"str","required":false},"c'
+    'ertname_rsa2048":{"type":"str","required":false},"interface_select_method":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"member":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"name":{"typ'
+    'e":"string","revisions":[2047,2047]},"src_check":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"member":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"name":{"type"'
+    ':"str","required":false},"src_check":{"type":"str","required":false,"choices":["disable","enable"]}}}'
+)
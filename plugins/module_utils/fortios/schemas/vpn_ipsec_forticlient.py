@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"realm":{"type":"string","revisions":[2047,2047]},"phase2name":{"type":"string","revisions":[2047,2047]},"usergroupname":{"'
+    'type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"realm":{"type":"str","required":fa'
+    'lse},"phase2name":{"type":"str","required":false},"usergroupname":{"type":"str","required":false}}}'
+)
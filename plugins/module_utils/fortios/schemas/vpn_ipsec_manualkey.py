@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"encryption":{"type":"string","options":[{"value":"null","revisions":[2047'
+    ',2047]},{"value":"des","revisions":[2047,2047]},{"value":"3des","revisions":[2047,2047]},{"value":"aes128","revisions":[2047,2047]},{"value":"aes192",'
+    '"revisions":[2047,2047]},{"value":"aes256","revisions":[2047,2047]},{"value":"aria128","revisions":[2047,2047]},{"value":"aria192","revisions":[2047,2'
+    '047]},{"value":"aria256","revisions":[2047,2047]},{"value":"seed","revisions":[2047,2047]}],"revisions":[2047,2047]},"remotespi":{"type":"string","rev'
+    'isions":[2047,2047]},"local_gw":{"type":"string","revisions":[2047,2047]},"authkey":{"type":"string","revisions":[2047,2047]},"authentication":{"type"'
+    ':"string","options":[{"value":"null","revisions":[2047,2047]},{"value":"md5","revisions":[2047,2047]},{"value":"sha1","revisions":[2047,2047]},{"value'
+    '":"sha256","revisions":[2047,2047]},{"value":"sha384","revisions":[2047,2047]},{"value":"sha512","revisions":[2047,2047]}],"revisions":[2047,2047]},"e'
+    'nckey":{"type":"string","revisions":[2047,2047]},"localspi":{"type":"string","revisions":[2047,2047]},"interface":{"type":"string","revisions":[2047,2'
+    '047]},"remote_gw":{"type":"string","revisions":[2047,2047]},"npu_offload":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"val'
+    'ue":"disable","revisions":[2047,2047]}],"revisions":[2047,1023]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"encryption":{"type":"str","required":false,"choices":["null","des",'
+    '"3des","aes128","aes192","aes256","aria128","aria192","aria256","seed"]},"remotespi":{"type":"str","required":false},"local_gw":{"type":"str","require'
+    'd":false},"authkey":{"type":"str","required":false},"authentication":{"type":"str","required":false,"choices":["null","md5","sha1","sha256","sha384","'
+    'sha512"]},"enckey":{"type":"str","required":false},"localspi":{"type":"str","required":false},"interface":{"type":"str","required":false},"remote_gw":'
+    '{"type":"str","required":false},"npu_offload":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
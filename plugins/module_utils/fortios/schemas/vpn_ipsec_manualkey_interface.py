@@ -0,0 +1,29 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"enc_key":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"auth_key":{"type":"st'
+    'ring","revisions":[2047,2047]},"enc_alg":{"type":"string","options":[{"value":"null","revisions":[2047,2047]},{"value":"des","revisions":[2047,2047]},'
+    '{"value":"3des","revisions":[2047,2047]},{"value":"aes128","revisions":[2047,2047]},{"value":"aes192","revisions":[2047,2047]},{"value":"aes256","revi'
+    'sions":[2047,2047]},{"value":"aria128","revisions":[2047,2047]},{"value":"aria192","revisions":[2047,2047]},{"value":"aria256","revisions":[2047,2047]'
+    '},{"value":"seed","revisions":[2047,2047]}],"revisions":[2047,2047]},"remote_spi":{"type":"string","revisions":[2047,2047]},"local_gw6":{"type":"strin'
+    'g","revisions":[2047,2047]},"local_gw":{"type":"string","revisions":[2047,2047]},"auth_alg":{"type":"string","options":[{"value":"null","revisions":[2'
+    '047,2047]},{"value":"md5","revisions":[2047,2047]},{"value":"sha1","revisions":[2047,2047]},{"value":"sha256","revisions":[2047,2047]},{"value":"sha38'
+    '4","revisions":[2047,2047]},{"value":"sha512","revisions":[2047,2047]}],"revisions":[2047,2047]},"local_spi":{"type":"string","revisions":[2047,2047]}'
+    ',"ip_version":{"type":"string","options":[{"value":"4","revisions":[2047,2047]},{"value":"6","revisions":[2047,2047]}],"revisions":[2047,2047]},"remot'
+    'e_gw":{"type":"string","revisions":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]},"addr_type":{"type":"string","options":[{"value"'
+    ':"4","revisions":[2047,2047]},{"value":"6","revisions":[2047,2047]}],"revisions":[2047,2047]},"npu_offload":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,1023]},"remote_gw6":{"type":"string","revisions":[2047,204'
+    '7]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"enc_key":{"type":"str","required":false},"name":{"type":"str","required":false},"auth_key":{"type":"str","'
+    'required":false},"enc_alg":{"type":"str","required":false,"choices":["null","des","3des","aes128","aes192","aes256","aria128","aria192","aria256","see'
+    'd"]},"remote_spi":{"type":"str","required":false},"local_gw6":{"type":"str","required":false},"local_gw":{"type":"str","required":false},"auth_alg":{"'
+    'type":"str","required":false,"choices":["null","md5","sha1","sha256","sha384","sha512"]},"local_spi":{"type":"str","required":false},"ip_version":{"ty'
+    'pe":"str","required":false,"choices":["4","6"]},"remote_gw":{"type":"str","required":false},"interface":{"type":"str","required":false},"addr_type":{"'
+    'type":"str","required":false,"choices":["4","6"]},"npu_offload":{"type":"str","required":false,"choices":["enable","disable"]},"remote_gw6":{"type":"s'
+    'tr","required":false}}}'
+)
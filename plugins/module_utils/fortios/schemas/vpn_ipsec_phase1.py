@@ -0,0 +1,181 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"signature_hash_alg":{"multiple_values":true,"type":"list","options":[{"value":"sha1","revisions":[2047,2047]},{"value":"sh'
+    'a2-256","revisions":[2047,2047]},{"value":"sha2-384","revisions":[2047,2047]},{"value":"sha2-512","revisions":[2047,2047]}],"revisions":[2047,2047]},"'
+    'dhgrp":{"multiple_values":true,"type":"list","options":[{"value":"1","revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]},{"value":"5","revi'
+    'sions":[2047,2047]},{"value":"14","revisions":[2047,2047]},{"value":"15","revisions":[2047,2047]},{"value":"16","revisions":[2047,2047]},{"value":"17"'
+    ',"revisions":[2047,2047]},{"value":"18","revisions":[2047,2047]},{"value":"19","revisions":[2047,2047]},{"value":"20","revisions":[2047,2047]},{"value'
+    '":"21","revisions":[2047,2047]},{"value":"27","revisions":[2047,2047]},{"value":"28","revisions":[2047,2047]},{"value":"29","revisions":[2047,2047]},{'
+    '"value":"30","revisions":[2047,2047]},{"value":"31","revisions":[2047,2047]},{"value":"32","revisions":[2040,2040]}],"revisions":[2047,2047]},"fragmen'
+    'tation_mtu":{"type":"integer","revisions":[2047,2047]},"ipv4_split_exclude":{"type":"string","revisions":[2047,2047]},"comments":{"type":"string","rev'
+    'isions":[2047,2047]},"eap":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisi'
+    'ons":[2047,2047]},"remote_gw":{"type":"string","revisions":[2047,2047]},"ipv6_name":{"type":"string","revisions":[2047,2047]},"childless_ike":{"type":'
+    '"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv4_wins_server'
+    '2":{"type":"string","revisions":[2047,2047]},"unity_support":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"ha_sync_esp_seqno":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value'
+    '":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv4_wins_server1":{"type":"string","revisions":[2047,2047]},"ipv6_start_ip":{"type":"'
+    'string","revisions":[2047,2047]},"assign_ip":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"ipv4_end_ip":{"type":"string","revisions":[2047,2047]},"banner":{"type":"string","revisions":[2047,2047]},"name":'
+    '{"type":"string","revisions":[2047,2047]},"localid":{"type":"string","revisions":[2047,2047]},"authpasswd":{"type":"string","revisions":[2047,2047]},"'
+    'network_id":{"type":"integer","revisions":[2040,2040]},"client_auto_negotiate":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]}'
+    ',{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"interface":{"type":"string","revisions":[2047,2047]},"ipv6_end_ip":{"type":"str'
+    'ing","revisions":[2047,2047]},"dpd":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"on-idle","revisions":[2047,2047]'
+    '},{"value":"on-demand","revisions":[2047,2047]}],"revisions":[2047,2047]},"mode":{"type":"string","options":[{"value":"aggressive","revisions":[2047,2'
+    '047]},{"value":"main","revisions":[2047,2047]}],"revisions":[2047,2047]},"dns_mode":{"type":"string","options":[{"value":"manual","revisions":[2047,20'
+    '47]},{"value":"auto","revisions":[2047,2047]}],"revisions":[2047,2047]},"forticlient_enforcement":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"idle_timeoutinterval":{"type":"integer","revisions":[2047,20'
+    '47]},"domain":{"type":"string","revisions":[2047,2047]},"ipv6_split_include":{"type":"string","revisions":[2047,2047]},"ipv6_dns_server1":{"type":"str'
+    'ing","revisions":[2047,2047]},"ipv6_dns_server3":{"type":"string","revisions":[2047,2047]},"ipv4_split_include":{"type":"string","revisions":[2047,204'
+    '7]},"group_authentication_secret":{"type":"string","revisions":[2047,2047]},"dhcp6_ra_linkaddr":{"type":"string","revisions":[2040,2024]},"eap_exclude'
+    '_peergrp":{"type":"string","revisions":[2040,2040]},"mesh_selector_type":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"val'
+    'ue":"subnet","revisions":[2047,2047]},{"value":"host","revisions":[2047,2047]}],"revisions":[2047,2047]},"auto_negotiate":{"type":"string","options":['
+    '{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"split_include_service":{"type":"stri'
+    'ng","revisions":[2047,2047]},"esn":{"type":"string","options":[{"value":"require","revisions":[2047,2047]},{"value":"allow","revisions":[2047,2047]},{'
+    '"value":"disable","revisions":[2047,2047]}],"revisions":[2047,1023]},"keepalive":{"type":"integer","revisions":[2047,2047]},"localid_type":{"type":"st'
+    'ring","options":[{"value":"auto","revisions":[2047,2047]},{"value":"fqdn","revisions":[2047,2047]},{"value":"user-fqdn","revisions":[2047,2047]},{"val'
+    'ue":"keyid","revisions":[2047,2047]},{"value":"address","revisions":[2047,2047]},{"value":"asn1dn","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"cert_id_validation":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"authmethod_remote":{"type":"string","options":[{"value":"psk","revisions":[2047,2047]},{"value":"signature","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"peer":{"type":"string","revisions":[2047,2047]},"fec_redundant":{"type":"integer","revisions":[2040,2040]},"npu_offload":{"type'
+    '":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,1023]},"backup_gateway'
+    '":{"type":"list","children":{"address":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"suite_b":{"type":"string","options":[{"val'
+    'ue":"disable","revisions":[2047,2047]},{"value":"suite-b-gcm-128","revisions":[2047,2047]},{"value":"suite-b-gcm-256","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"digital_signature_auth":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"assign_ip_from":{"type":"string","options":[{"value":"range","revisions":[2047,2047]},{"value":"usrgrp","revisions'
+    '":[2047,2047]},{"value":"dhcp","revisions":[2047,2047]},{"value":"name","revisions":[2047,2047]}],"revisions":[2047,2047]},"rsa_signature_format":{"ty'
+    'pe":"string","options":[{"value":"pkcs1","revisions":[2047,2047]},{"value":"pss","revisions":[2047,2047]}],"revisions":[2047,2047]},"ppk":{"type":"str'
+    'ing","options":[{"value":"disable","revisions":[2047,2047]},{"value":"allow","revisions":[2047,2047]},{"value":"require","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"xauthtype":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"client","revisions":[2047,2047]},{'
+    '"value":"pap","revisions":[2047,2047]},{"value":"chap","revisions":[2047,2047]},{"value":"auto","revisions":[2047,2047]}],"revisions":[2047,2047]},"in'
+    'clude_local_lan":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"dhcp_ra_giaddr":{"type":"string","revisions":[2040,2024]},"ppk_secret":{"type":"string","revisions":[2047,2047]},"ipv4_netmask":{"type":"stri'
+    'ng","revisions":[2047,2047]},"ike_version":{"type":"string","options":[{"value":"1","revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"keylife":{"type":"integer","revisions":[2047,2047]},"loopback_asymroute":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"certificate":{"type":"list","children":{"name":{"type":"strin'
+    'g","revisions":[2047,2047]}},"revisions":[2047,2047]},"priority":{"type":"integer","revisions":[2047,2047]},"psksecret_remote":{"type":"string","revis'
+    'ions":[2047,2047]},"dpd_retrycount":{"type":"integer","revisions":[2047,2047]},"ipv6_prefix":{"type":"integer","revisions":[2047,2047]},"proposal":{"m'
+    'ultiple_values":true,"type":"list","options":[{"value":"des-md5","revisions":[2047,2047]},{"value":"des-sha1","revisions":[2047,2047]},{"value":"des-s'
+    'ha256","revisions":[2047,2047]},{"value":"des-sha384","revisions":[2047,2047]},{"value":"des-sha512","revisions":[2047,2047]},{"value":"3des-md5","rev'
+    'isions":[2047,2047]},{"value":"3des-sha1","revisions":[2047,2047]},{"value":"3des-sha256","revisions":[2047,2047]},{"value":"3des-sha384","revisions":'
+    '[2047,2047]},{"value":"3des-sha512","revisions":[2047,2047]},{"value":"aes128-md5","revisions":[2047,2047]},{"value":"aes128-sha1","revisions":[2047,2'
+    '047]},{"value":"aes128-sha256","revisions":[2047,2047]},{"value":"aes128-sha384","revisions":[2047,2047]},{"value":"aes128-sha512","revisions":[2047,2'
+    '047]},{"value":"aes128gcm-prfsha1","revisions":[2047,2047]},{"value":"aes128gcm-prfsha256","revisions":[2047,2047]},{"value":"aes128gcm-prfsha384","re'
+    'visions":[2047,2047]},{"value":"aes128gcm-prfsha512","revisions":[2047,2047]},{"value":"aes192-md5","revisions":[2047,2047]},{"value":"aes192-sha1","r'
+    'evisions":[2047,2047]},{"value":"aes192-sha256","revisions":[2047,2047]},{"value":"aes192-sha384","revisions":[2047,2047]},{"value":"aes192-sha512","r'
+    'evisions":[2047,2047]},{"value":"aes256-md5","revisions":[2047,2047]},{"value":"aes256-sha1","revisions":[2047,2047]},{"value":"aes256-sha256","revisi'
+    'ons":[2047,2047]},{"value":"aes256-sha384","revisions":[2047,2047]},{"value":"aes256-sha512","revisions":[2047,2047]},{"value":"aes256gcm-prfsha1","re'
+    'visions":[2047,2047]},{"value":"aes256gcm-prfsha256","revisions":[2047,2047]},{"value":"aes256gcm-prfsha384","revisions":[2047,2047]},{"value":"aes256'
+    'gcm-prfsha512","revisions":[2047,2047]},{"value":"chacha20poly1305-prfsha1","revisions":[2047,2047]},{"value":"chacha20poly1305-prfsha256","revisions"'
+    ':[2047,2047]},{"value":"chacha20poly1305-prfsha384","revisions":[2047,2047]},{"value":"chacha20poly1305-prfsha512","revisions":[2047,2047]},{"value":"'
+    'aria128-md5","revisions":[2047,2047]},{"value":"aria128-sha1","revisions":[2047,2047]},{"value":"aria128-sha256","revisions":[2047,2047]},{"value":"ar'
+    'ia128-sha384","revisions":[2047,2047]},{"value":"aria128-sha512","revisions":[2047,2047]},{"value":"aria192-md5","revisions":[2047,2047]},{"value":"ar'
+    'ia192-sha1","revisions":[2047,2047]},{"value":"aria192-sha256","revisions":[2047,2047]},{"value":"aria192-sha384","revisions":[2047,2047]},{"value":"a'
+    'ria192-sha512","revisions":[2047,2047]},{"value":"aria256-md5","revisions":[2047,2047]},{"value":"aria256-sha1","revisions":[2047,2047]},{"value":"ari'
+    'a256-sha256","revisions":[2047,2047]},{"value":"aria256-sha384","revisions":[2047,2047]},{"value":"aria256-sha512","revisions":[2047,2047]},{"value":"'
+    'seed-md5","revisions":[2047,2047]},{"value":"seed-sha1","revisions":[2047,2047]},{"value":"seed-sha256","revisions":[2047,2047]},{"value":"seed-sha384'
+    '","revisions":[2047,2047]},{"value":"seed-sha512","revisions":[2047,2047]}],"revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"stat'
+    'ic","revisions":[2047,2047]},{"value":"dynamic","revisions":[2047,2047]},{"value":"ddns","revisions":[2047,2047]}],"revisions":[2047,2047]},"authusrgr'
+    'p":{"type":"string","revisions":[2047,2047]},"reauth":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"ipv4_dns_server3":{"type":"string","revisions":[2047,2047]},"ipv4_exclude_range":{"type":"list","childre'
+    'n":{"start_ip":{"type":"string","revisions":[2047,2047]},"end_ip":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2'
+    '047]}},"revisions":[2047,2047]},"ipv6_split_exclude":{"type":"string","revisions":[2047,2047]},"local_gw":{"type":"string","revisions":[2047,2047]},"i'
+    'pv4_dns_server2":{"type":"string","revisions":[2047,2047]},"nattraversal":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"val'
+    'ue":"disable","revisions":[2047,2047]},{"value":"forced","revisions":[2047,2047]}],"revisions":[2047,2047]},"peerid":{"type":"string","revisions":[204'
+    '7,2047]},"enforce_unique_id":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"keep-new","revisions":[2047,2047]},{"va'
+    'lue":"keep-old","revisions":[2047,2047]}],"revisions":[2047,2047]},"rekey":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"va'
+    'lue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"distance":{"type":"integer","revisions":[2047,2047]},"fragmentation":{"type":"strin'
+    'g","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"authusr":{"type":"stri'
+    'ng","revisions":[2047,2047]},"fec_base":{"type":"integer","revisions":[2040,2040]},"acct_verify":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"authmethod":{"type":"string","options":[{"value":"psk","revis'
+    'ions":[2047,2047]},{"value":"signature","revisions":[2047,2047]}],"revisions":[2047,2047]},"psksecret":{"type":"string","revisions":[2047,2047]},"add_'
+    'route":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"f'
+    'ec_codec":{"type":"integer","revisions":[1024,1024]},"fec_ingress":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"di'
+    'sable","revisions":[2040,2040]}],"revisions":[2040,2040]},"ipv4_dns_server1":{"type":"string","revisions":[2047,2047]},"save_password":{"type":"string'
+    '","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"peertype":{"type":"stri'
+    'ng","options":[{"value":"any","revisions":[2047,2047]},{"value":"one","revisions":[2047,2047]},{"value":"dialup","revisions":[2047,2047]},{"value":"pe'
+    'er","revisions":[2047,2047]},{"value":"peergrp","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_dns_server2":{"type":"string","revisions":[20'
+    '47,2047]},"wizard_type":{"type":"string","options":[{"value":"custom","revisions":[2047,2047]},{"value":"dialup-forticlient","revisions":[2047,2047]},'
+    '{"value":"dialup-ios","revisions":[2047,2047]},{"value":"dialup-android","revisions":[2047,2047]},{"value":"dialup-windows","revisions":[2047,2047]},{'
+    '"value":"dialup-cisco","revisions":[2047,2047]},{"value":"static-fortigate","revisions":[2047,2047]},{"value":"dialup-fortigate","revisions":[2047,204'
+    '7]},{"value":"static-cisco","revisions":[2047,2047]},{"value":"dialup-cisco-fw","revisions":[2047,2047]},{"value":"simplified-static-fortigate","revis'
+    'ions":[2040,2040]},{"value":"hub-fortigate-auto-discovery","revisions":[2040,2040]},{"value":"spoke-fortigate-auto-discovery","revisions":[2040,2040]}'
+    '],"revisions":[2047,2047]},"network_overlay":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[20'
+    '40,2040]}],"revisions":[2040,2040]},"ipv6_exclude_range":{"type":"list","children":{"start_ip":{"type":"string","revisions":[2047,2047]},"end_ip":{"ty'
+    'pe":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"mode_cfg":{"type":"string","options":'
+    '[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"send_cert_chain":{"type":"string","'
+    'options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"fec_egress":{"type":"strin'
+    'g","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"fec_send_timeout":{"ty'
+    'pe":"integer","revisions":[2040,2040]},"add_gw_route":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"usrgrp":{"type":"string","revisions":[2047,2047]},"ppk_identity":{"type":"string","revisions":[2047,2047'
+    ']},"idle_timeout":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[204'
+    '7,2047]},"eap_identity":{"type":"string","options":[{"value":"use-id-payload","revisions":[2047,2047]},{"value":"send-request","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"ipv4_name":{"type":"string","revisions":[2047,2047]},"client_keep_alive":{"type":"string","options":[{"value":"disable","'
+    'revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dpd_retryinterval":{"type":"string","revisions":[2047,20'
+    '47]},"remotegw_ddns":{"type":"string","revisions":[2047,2047]},"fec_receive_timeout":{"type":"integer","revisions":[2040,2040]},"peergrp":{"type":"str'
+    'ing","revisions":[2047,2047]},"ipv4_start_ip":{"type":"string","revisions":[2047,2047]},"group_authentication":{"type":"string","options":[{"value":"e'
+    'nable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"negotiate_timeout":{"type":"integer","revisions'
+    '":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"signature_hash_alg":{"type":"list","required":false,"choices":["sha1","sha2-256","sha2-384","sha2-512"]},"'
+    'dhgrp":{"type":"list","required":false},"fragmentation_mtu":{"type":"int","required":false},"ipv4_split_exclude":{"type":"str","required":false},"comm'
+    'ents":{"type":"str","required":false},"eap":{"type":"str","required":false,"choices":["enable","disable"]},"remote_gw":{"type":"str","required":false}'
+    ',"ipv6_name":{"type":"str","required":false},"childless_ike":{"type":"str","required":false,"choices":["enable","disable"]},"ipv4_wins_server2":{"type'
+    '":"str","required":false},"unity_support":{"type":"str","required":false,"choices":["disable","enable"]},"ha_sync_esp_seqno":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"ipv4_wins_server1":{"type":"str","required":false},"ipv6_start_ip":{"type":"str","required":false},"assign_ip":'
+    '{"type":"str","required":false,"choices":["disable","enable"]},"ipv4_end_ip":{"type":"str","required":false},"banner":{"type":"str","required":false},'
+    '"name":{"type":"str","required":false},"localid":{"type":"str","required":false},"authpasswd":{"type":"str","required":false},"network_id":{"type":"in'
+    't","required":false},"client_auto_negotiate":{"type":"str","required":false,"choices":["disable","enable"]},"interface":{"type":"str","required":false'
+    '},"ipv6_end_ip":{"type":"str","required":false},"dpd":{"type":"str","required":false,"choices":["disable","on-idle","on-demand"]},"mode":{"type":"str"'
+    ',"required":false,"choices":["aggressive","main"]},"dns_mode":{"type":"str","required":false,"choices":["manual","auto"]},"forticlient_enforcement":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"idle_timeoutinterval":{"type":"int","required":false},"domain":{"type":"str","required":'
+    'false},"ipv6_split_include":{"type":"str","required":false},"ipv6_dns_server1":{"type":"str","required":false},"ipv6_dns_server3":{"type":"str","requi'
+    'red":false},"ipv4_split_include":{"type":"str","required":false},"group_authentication_secret":{"type":"str","required":false},"dhcp6_ra_linkaddr":{"t'
+    'ype":"str","required":false},"eap_exclude_peergrp":{"type":"str","required":false},"mesh_selector_type":{"type":"str","required":false,"choices":["dis'
+    'able","subnet","host"]},"auto_negotiate":{"type":"str","required":false,"choices":["enable","disable"]},"split_include_service":{"type":"str","require'
+    'd":false},"esn":{"type":"str","required":false,"choices":["require","allow","disable"]},"keepalive":{"type":"int","required":false},"localid_type":{"t'
+    'ype":"str","required":false,"choices":["auto","fqdn","user-fqdn","keyid","address","asn1dn"]},"cert_id_validation":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]},"authmethod_remote":{"type":"str","required":false,"choices":["psk","signature"]},"peer":{"type":"str","required":false},"'
+    'fec_redundant":{"type":"int","required":false},"npu_offload":{"type":"str","required":false,"choices":["enable","disable"]},"backup_gateway":{"type":"'
+    'list","required":false,"options":{"address":{"type":"str","required":false}}},"suite_b":{"type":"str","required":false,"choices":["disable","suite-b-g'
+    'cm-128","suite-b-gcm-256"]},"digital_signature_auth":{"type":"str","required":false,"choices":["enable","disable"]},"assign_ip_from":{"type":"str","re'
+    'quired":false,"choices":["range","usrgrp","dhcp","name"]},"rsa_signature_format":{"type":"str","required":false,"choices":["pkcs1","pss"]},"ppk":{"typ'
+    'e":"str","required":false,"choices":["disable","allow","require"]},"xauthtype":{"type":"str","required":false,"choices":["disable","client","pap","cha'
+    'p","auto"]},"include_local_lan":{"type":"str","required":false,"choices":["disable","enable"]},"dhcp_ra_giaddr":{"type":"str","required":false},"ppk_s'
+    'ecret":{"type":"str","required":false},"ipv4_netmask":{"type":"str","required":false},"ike_version":{"type":"str","required":false,"choices":["1","2"]'
+    '},"keylife":{"type":"int","required":false},"loopback_asymroute":{"type":"str","required":false,"choices":["enable","disable"]},"certificate":{"type":'
+    '"list","required":false,"options":{"name":{"type":"str","required":false}}},"priority":{"type":"int","required":false},"psksecret_remote":{"type":"str'
+    '","required":false},"dpd_retrycount":{"type":"int","required":false},"ipv6_prefix":{"type":"int","required":false},"proposal":{"type":"list","required'
+    '":false,"choices":["des-md5","des-sha1","des-sha256","des-sha384","des-sha512","3des-md5","3des-sha1","3des-sha256","3des-sha384","3des-sha512","aes12'
+    '8-md5","aes128-sha1","aes128-sha256","aes128-sha384","aes128-sha512","aes128gcm-prfsha1","aes128gcm-prfsha256","aes128gcm-prfsha384","aes128gcm-prfsha'
+    '512","aes192-md5","aes192-sha1","aes192-sha256","aes192-sha384","aes192-sha512","aes256-md5","aes256-sha1","aes256-sha256","aes256-sha384","aes256-sha'
+    '512","aes256gcm-prfsha1","aes256gcm-prfsha256","aes256gcm-prfsha384","aes256gcm-prfsha512","chacha20poly1305-prfsha1","chacha20poly1305-prfsha256","ch'
+    'acha20poly1305-prfsha384","chacha20poly1305-prfsha512","aria128-md5","aria128-sha1","aria128-sha256","aria128-sha384","aria128-sha512","aria192-md5","'
+    'aria192-sha1","aria192-sha256","aria192-sha384","aria192-sha512","aria256-md5","aria256-sha1","aria256-sha256","aria256-sha384","aria256-sha512","seed'
+    '-md5","seed-sha1","seed-sha256","seed-sha384","seed-sha512"]},"type":{"type":"str","required":false,"choices":["static","dynamic","ddns"]},"authusrgrp'
+    '":{"type":"str","required":false},"reauth":{"type":"str","required":false,"choices":["disable","enable"]},"ipv4_dns_server3":{"type":"str","required":'
+    'false},"ipv4_exclude_range":{"type":"list","required":false,"options":{"start_ip":{"type":"str","required":false},"end_ip":{"type":"str","required":fa'
+    'lse},"id":{"type":"int","required":false}}},"ipv6_split_exclude":{"type":"str","required":false},"local_gw":{"type":"str","required":false},"ipv4_dns_'
+    'server2":{"type":"str","required":false},"nattraversal":{"type":"str","required":false,"choices":["enable","disable","forced"]},"peerid":{"type":"str"'
+    ',"required":false},"enforce_unique_id":{"type":"str","required":false,"choices":["disable","keep-new","keep-old"]},"rekey":{"type":"str","required":fa'
+    'lse,"choices":["enable","disable"]},"distance":{"type":"int","required":false},"fragmentation":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"authusr":{"type":"str","required":false},"fec_base":{"type":"int","required":false},"acct_verify":{"type":"str","required":false,"choices":["'
+    'enable","disable"]},"authmethod":{"type":"str","required":false,"choices":["psk","signature"]},"psksecret":{"type":"str","required":false},"add_route"'
+    ':{"type":"str","required":false,"choices":["disable","enable"]},"fec_codec":{"type":"int","required":false},"fec_ingress":{"type":"str","required":fal'
+    'se,"choices":["enable","disable"]},"ipv4_dns_server1":{"type":"str","required":false},"save_password":{"type":"str","required":false,"choices":["disab'
+    'le","enable"]},"peertype":{"type":"str","required":false,"choices":["any","one","dialup","peer","peergrp"]},"ipv6_dns_server2":{"type":"str","required'
+    '":false},"wizard_type":{"type":"str","required":false},"network_overlay":{"type":"str","required":false,"choices":["disable","enable"]},"ipv6_exclude_'
+    'range":{"type":"list","required":false,"options":{"start_ip":{"type":"str","required":false},"end_ip":{"type":"str","required":false},"id":{"type":"in'
+    't","required":false}}},"mode_cfg":{"type":"str","required":false,"choices":["disable","enable"]},"send_cert_chain":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]},"fec_egress":{"type":"str","required":false,"choices":["enable","disable"]},"fec_send_timeout":{"type":"int","required":fa'
+    'lse},"add_gw_route":{"type":"str","required":false,"choices":["enable","disable"]},"usrgrp":{"type":"str","required":false},"ppk_identity":{"type":"st'
+    'r","required":false},"idle_timeout":{"type":"str","required":false,"choices":["enable","disable"]},"eap_identity":{"type":"str","required":false,"choi'
+    'ces":["use-id-payload","send-request"]},"ipv4_name":{"type":"str","required":false},"client_keep_alive":{"type":"str","required":false,"choices":["dis'
+    'able","enable"]},"dpd_retryinterval":{"type":"str","required":false},"remotegw_ddns":{"type":"str","required":false},"fec_receive_timeout":{"type":"in'
+    't","required":false},"peergrp":{"type":"str","required":false},"ipv4_start_ip":{"type":"str","required":false},"group_authentication":{"type":"str","r'
+    'equired":false,"choices":["enable","disable"]},"negotiate_timeout":{"type":"int","required":false}}}'
+)
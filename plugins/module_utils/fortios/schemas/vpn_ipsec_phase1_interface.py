@@ -0,0 +1,221 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"encap_local_gw6":{"type":"string","revisions":[2047,2047]},"auto_discovery_psk":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"signature_hash_alg":{"multiple_values":true,"type"'
+    ':"list","options":[{"value":"sha1","revisions":[2047,2047]},{"value":"sha2-256","revisions":[2047,2047]},{"value":"sha2-384","revisions":[2047,2047]},'
+    '{"value":"sha2-512","revisions":[2047,2047]}],"revisions":[2047,2047]},"dhgrp":{"multiple_values":true,"type":"list","options":[{"value":"1","revision'
+    's":[2047,2047]},{"value":"2","revisions":[2047,2047]},{"value":"5","revisions":[2047,2047]},{"value":"14","revisions":[2047,2047]},{"value":"15","revi'
+    'sions":[2047,2047]},{"value":"16","revisions":[2047,2047]},{"value":"17","revisions":[2047,2047]},{"value":"18","revisions":[2047,2047]},{"value":"19"'
+    ',"revisions":[2047,2047]},{"value":"20","revisions":[2047,2047]},{"value":"21","revisions":[2047,2047]},{"value":"27","revisions":[2047,2047]},{"value'
+    '":"28","revisions":[2047,2047]},{"value":"29","revisions":[2047,2047]},{"value":"30","revisions":[2047,2047]},{"value":"31","revisions":[2047,2047]},{'
+    '"value":"32","revisions":[2040,2040]}],"revisions":[2047,2047]},"fragmentation_mtu":{"type":"integer","revisions":[2047,2047]},"ipv4_split_exclude":{"'
+    'type":"string","revisions":[2047,2047]},"encap_local_gw4":{"type":"string","revisions":[2047,2047]},"mesh_selector_type":{"type":"string","options":[{'
+    '"value":"disable","revisions":[2047,2047]},{"value":"subnet","revisions":[2047,2047]},{"value":"host","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"eap":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"remote_gw":{"type":"string","revisions":[2047,2047]},"ipv4_end_ip":{"type":"string","revisions":[2047,2047]},"monitor":{"type":"string","revisions":['
+    '2047,2047]},"childless_ike":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"ipv4_wins_server2":{"type":"string","revisions":[2047,2047]},"unity_support":{"type":"string","options":[{"value":"disable","revis'
+    'ions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ha_sync_esp_seqno":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv4_wins_server1":{"type":"string","revisions":[2'
+    '047,2047]},"ipv6_start_ip":{"type":"string","revisions":[2047,2047]},"assign_ip":{"type":"string","options":[{"value":"disable","revisions":[2047,2047'
+    ']},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auto_discovery_receiver":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_name":{"type":"string","revisions":[2047,2047]},"banner'
+    '":{"type":"string","revisions":[2047,2047]},"localid":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"auth'
+    'passwd":{"type":"string","revisions":[2047,2047]},"network_id":{"type":"integer","revisions":[2040,2040]},"client_auto_negotiate":{"type":"string","op'
+    'tions":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"interface":{"type":"string",'
+    '"revisions":[2047,2047]},"ipv6_end_ip":{"type":"string","revisions":[2047,2047]},"dpd":{"type":"string","options":[{"value":"disable","revisions":[204'
+    '7,2047]},{"value":"on-idle","revisions":[2047,2047]},{"value":"on-demand","revisions":[2047,2047]}],"revisions":[2047,2047]},"mode":{"type":"string","'
+    'options":[{"value":"aggressive","revisions":[2047,2047]},{"value":"main","revisions":[2047,2047]}],"revisions":[2047,2047]},"monitor_hold_down_time":{'
+    '"type":"string","revisions":[2047,2047]},"dns_mode":{"type":"string","options":[{"value":"manual","revisions":[2047,2047]},{"value":"auto","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"forticlient_enforcement":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"dis'
+    'able","revisions":[2047,2047]}],"revisions":[2047,2047]},"idle_timeoutinterval":{"type":"integer","revisions":[2047,2047]},"domain":{"type":"string","'
+    'revisions":[2047,2047]},"auto_discovery_forwarder":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"ipv6_split_include":{"type":"string","revisions":[2047,2047]},"auto_discovery_shortcuts":{"type":"string","'
+    'options":[{"value":"independent","revisions":[1536,1536]},{"value":"dependent","revisions":[1536,1536]}],"revisions":[1536,1536]},"ipv6_dns_server1":{'
+    '"type":"string","revisions":[2047,2047]},"ipv6_dns_server3":{"type":"string","revisions":[2047,2047]},"ipv4_split_include":{"type":"string","revisions'
+    '":[2047,2047]},"group_authentication_secret":{"type":"string","revisions":[2047,2047]},"dhcp6_ra_linkaddr":{"type":"string","revisions":[2040,2024]},"'
+    'encap_remote_gw6":{"type":"string","revisions":[2047,2047]},"encap_remote_gw4":{"type":"string","revisions":[2047,2047]},"encapsulation_address":{"typ'
+    'e":"string","options":[{"value":"ike","revisions":[2047,2047]},{"value":"ipv4","revisions":[2047,2047]},{"value":"ipv6","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"eap_exclude_peergrp":{"type":"string","revisions":[2040,2040]},"comments":{"type":"string","revisions":[2047,2047]},"auto_negoti'
+    'ate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"spl'
+    'it_include_service":{"type":"string","revisions":[2047,2047]},"esn":{"type":"string","options":[{"value":"require","revisions":[2047,2047]},{"value":"'
+    'allow","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,1023]},"keepalive":{"type":"integer","revisions":[2047,'
+    '2047]},"localid_type":{"type":"string","options":[{"value":"auto","revisions":[2047,2047]},{"value":"fqdn","revisions":[2047,2047]},{"value":"user-fqd'
+    'n","revisions":[2047,2047]},{"value":"keyid","revisions":[2047,2047]},{"value":"address","revisions":[2047,2047]},{"value":"asn1dn","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"cert_id_validation":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"remote_gw6":{"type":"string","revisions":[2047,2047]},"authmethod_remote":{"type":"string","options":[{"'
+    'value":"psk","revisions":[2047,2047]},{"value":"signature","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip_fragmentation":{"type":"string","opt'
+    'ions":[{"value":"pre-encapsulation","revisions":[2040,2040]},{"value":"post-encapsulation","revisions":[2040,2040]}],"revisions":[2040,2040]},"ipv6_dn'
+    's_server2":{"type":"string","revisions":[2047,2047]},"vni":{"type":"integer","revisions":[2047,2047]},"monitor_hold_down_weekday":{"type":"string","op'
+    'tions":[{"value":"everyday","revisions":[2047,2047]},{"value":"sunday","revisions":[2047,2047]},{"value":"monday","revisions":[2047,2047]},{"value":"t'
+    'uesday","revisions":[2047,2047]},{"value":"wednesday","revisions":[2047,2047]},{"value":"thursday","revisions":[2047,2047]},{"value":"friday","revisio'
+    'ns":[2047,2047]},{"value":"saturday","revisions":[2047,2047]}],"revisions":[2047,2047]},"peer":{"type":"string","revisions":[2047,2047]},"fec_redundan'
+    't":{"type":"integer","revisions":[2040,2040]},"encapsulation":{"type":"string","options":[{"value":"none","revisions":[2047,2047]},{"value":"gre","rev'
+    'isions":[2047,2047]},{"value":"vxlan","revisions":[2047,2047]}],"revisions":[2047,2047]},"backup_gateway":{"type":"list","children":{"address":{"type"'
+    ':"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"suite_b":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value'
+    '":"suite-b-gcm-128","revisions":[2047,2047]},{"value":"suite-b-gcm-256","revisions":[2047,2047]}],"revisions":[2047,2047]},"monitor_hold_down_type":{"'
+    'type":"string","options":[{"value":"immediate","revisions":[2047,2047]},{"value":"delay","revisions":[2047,2047]},{"value":"time","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"passive_mode":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"assign_ip_from":{"type":"string","options":[{"value":"range","revisions":[2047,2047]},{"value":"usrgrp","revisio'
+    'ns":[2047,2047]},{"value":"dhcp","revisions":[2047,2047]},{"value":"name","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip_version":{"type":"str'
+    'ing","options":[{"value":"4","revisions":[2047,2047]},{"value":"6","revisions":[2047,2047]}],"revisions":[2047,2047]},"rsa_signature_format":{"type":"'
+    'string","options":[{"value":"pkcs1","revisions":[2047,2047]},{"value":"pss","revisions":[2047,2047]}],"revisions":[2047,2047]},"ppk":{"type":"string",'
+    '"options":[{"value":"disable","revisions":[2047,2047]},{"value":"allow","revisions":[2047,2047]},{"value":"require","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"xauthtype":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"client","revisions":[2047,2047]},{"valu'
+    'e":"pap","revisions":[2047,2047]},{"value":"chap","revisions":[2047,2047]},{"value":"auto","revisions":[2047,2047]}],"revisions":[2047,2047]},"include'
+    '_local_lan":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"default_gw":{"type":"string","revisions":[2047,2047]},"dhcp_ra_giaddr":{"type":"string","revisions":[2040,2024]},"ppk_secret":{"type":"string","re'
+    'visions":[2047,2047]},"ipv4_netmask":{"type":"string","revisions":[2047,2047]},"ike_version":{"type":"string","options":[{"value":"1","revisions":[204'
+    '7,2047]},{"value":"2","revisions":[2047,2047]}],"revisions":[2047,2047]},"keylife":{"type":"integer","revisions":[2047,2047]},"loopback_asymroute":{"t'
+    'ype":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"certificate'
+    '":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"priority":{"type":"integer","revisions":[2047'
+    ',2047]},"aggregate_member":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisi'
+    'ons":[2040,2040]},"psksecret_remote":{"type":"string","revisions":[2047,2047]},"npu_offload":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,1023]},"dpd_retrycount":{"type":"integer","revisions":[2047,2047]},"ipv6_'
+    'prefix":{"type":"integer","revisions":[2047,2047]},"proposal":{"multiple_values":true,"type":"list","options":[{"value":"des-md5","revisions":[2047,20'
+    '47]},{"value":"des-sha1","revisions":[2047,2047]},{"value":"des-sha256","revisions":[2047,2047]},{"value":"des-sha384","revisions":[2047,2047]},{"valu'
+    'e":"des-sha512","revisions":[2047,2047]},{"value":"3des-md5","revisions":[2047,2047]},{"value":"3des-sha1","revisions":[2047,2047]},{"value":"3des-sha'
+    '256","revisions":[2047,2047]},{"value":"3des-sha384","revisions":[2047,2047]},{"value":"3des-sha512","revisions":[2047,2047]},{"value":"aes128-md5","r'
+    'evisions":[2047,2047]},{"value":"aes128-sha1","revisions":[2047,2047]},{"value":"aes128-sha256","revisions":[2047,2047]},{"value":"aes128-sha384","rev'
+    'isions":[2047,2047]},{"value":"aes128-sha512","revisions":[2047,2047]},{"value":"aes128gcm-prfsha1","revisions":[2047,2047]},{"value":"aes128gcm-prfsh'
+    'a256","revisions":[2047,2047]},{"value":"aes128gcm-prfsha384","revisions":[2047,2047]},{"value":"aes128gcm-prfsha512","revisions":[2047,2047]},{"value'
+    '":"aes192-md5","revisions":[2047,2047]},{"value":"aes192-sha1","revisions":[2047,2047]},{"value":"aes192-sha256","revisions":[2047,2047]},{"value":"ae'
+    's192-sha384","revisions":[2047,2047]},{"value":"aes192-sha512","revisions":[2047,2047]},{"value":"aes256-md5","revisions":[2047,2047]},{"value":"aes25'
+    '6-sha1","revisions":[2047,2047]},{"value":"aes256-sha256","revisions":[2047,2047]},{"value":"aes256-sha384","revisions":[2047,2047]},{"value":"aes256-'
+    'sha512","revisions":[2047,2047]},{"value":"aes256gcm-prfsha1","revisions":[2047,2047]},{"value":"aes256gcm-prfsha256","revisions":[2047,2047]},{"value'
+    '":"aes256gcm-prfsha384","revisions":[2047,2047]},{"value":"aes256gcm-prfsha512","revisions":[2047,2047]},{"value":"chacha20poly1305-prfsha1","revision'
+    's":[2047,2047]},{"value":"chacha20poly1305-prfsha256","revisions":[2047,2047]},{"value":"chacha20poly1305-prfsha384","revisions":[2047,2047]},{"value"'
+    ':"chacha20poly1305-prfsha512","revisions":[2047,2047]},{"value":"aria128-md5","revisions":[2047,2047]},{"value":"aria128-sha1","revisions":[2047,2047]'
+    '},{"value":"aria128-sha256","revisions":[2047,2047]},{"value":"aria128-sha384","revisions":[2047,2047]},{"value":"aria128-sha512","revisions":[2047,20'
+    '47]},{"value":"aria192-md5","revisions":[2047,2047]},{"value":"aria192-sha1","revisions":[2047,2047]},{"value":"aria192-sha256","revisions":[2047,2047'
+    ']},{"value":"aria192-sha384","revisions":[2047,2047]},{"value":"aria192-sha512","revisions":[2047,2047]},{"value":"aria256-md5","revisions":[2047,2047'
+    ']},{"value":"aria256-sha1","revisions":[2047,2047]},{"value":"aria256-sha256","revisions":[2047,2047]},{"value":"aria256-sha384","revisions":[2047,204'
+    '7]},{"value":"aria256-sha512","revisions":[2047,2047]},{"value":"seed-md5","revisions":[2047,2047]},{"value":"seed-sha1","revisions":[2047,2047]},{"va'
+    'lue":"seed-sha256","revisions":[2047,2047]},{"value":"seed-sha384","revisions":[2047,2047]},{"value":"seed-sha512","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"type":{"type":"string","options":[{"value":"static","revisions":[2047,2047]},{"value":"dynamic","revisions":[2047,2047]},{"value":"dd'
+    'ns","revisions":[2047,2047]}],"revisions":[2047,2047]},"authusrgrp":{"type":"string","revisions":[2047,2047]},"reauth":{"type":"string","options":[{"v'
+    'alue":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"fec_codec":{"type":"integer","revisions'
+    '":[1024,1024]},"ipv4_exclude_range":{"type":"list","children":{"start_ip":{"type":"string","revisions":[2047,2047]},"end_ip":{"type":"string","revisio'
+    'ns":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"ipv6_split_exclude":{"type":"string","revisions":[2047,204'
+    '7]},"local_gw":{"type":"string","revisions":[2047,2047]},"ipv4_dns_server2":{"type":"string","revisions":[2047,2047]},"nattraversal":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]},{"value":"forced","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"peerid":{"type":"string","revisions":[2047,2047]},"enforce_unique_id":{"type":"string","options":[{"value":"disable","revisions":[20'
+    '47,2047]},{"value":"keep-new","revisions":[2047,2047]},{"value":"keep-old","revisions":[2047,2047]}],"revisions":[2047,2047]},"rekey":{"type":"string"'
+    ',"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"distance":{"type":"integ'
+    'er","revisions":[2047,2047]},"fragmentation":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"authusr":{"type":"string","revisions":[2047,2047]},"fec_base":{"type":"integer","revisions":[2040,2040]},"acct_ve'
+    'rify":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"au'
+    'thmethod":{"type":"string","options":[{"value":"psk","revisions":[2047,2047]},{"value":"signature","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"local_gw6":{"type":"string","revisions":[2047,2047]},"monitor_hold_down_delay":{"type":"integer","revisions":[2047,2047]},"psksecret":{"type":"string'
+    '","revisions":[2047,2047]},"digital_signature_auth":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"add_route":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"aggregate_weight":{"type":"integer","revisions":[1920,1920]},"fec_ingress":{"type":"string","options":['
+    '{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"ipv4_dns_server1":{"type":"string","'
+    'revisions":[2047,2047]},"save_password":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"peertype":{"type":"string","options":[{"value":"any","revisions":[2047,2047]},{"value":"one","revisions":[2047,2047]},'
+    '{"value":"dialup","revisions":[2047,2047]},{"value":"peer","revisions":[2047,2047]},{"value":"peergrp","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"auto_discovery_sender":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revis'
+    'ions":[2047,2047]},"net_device":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"wizard_type":{"type":"string","options":[{"value":"custom","revisions":[2047,2047]},{"value":"dialup-forticlient","revisions":'
+    '[2047,2047]},{"value":"dialup-ios","revisions":[2047,2047]},{"value":"dialup-android","revisions":[2047,2047]},{"value":"dialup-windows","revisions":['
+    '2047,2047]},{"value":"dialup-cisco","revisions":[2047,2047]},{"value":"static-fortigate","revisions":[2047,2047]},{"value":"dialup-fortigate","revisio'
+    'ns":[2047,2047]},{"value":"static-cisco","revisions":[2047,2047]},{"value":"dialup-cisco-fw","revisions":[2047,2047]},{"value":"simplified-static-fort'
+    'igate","revisions":[2040,2040]},{"value":"hub-fortigate-auto-discovery","revisions":[2040,2040]},{"value":"spoke-fortigate-auto-discovery","revisions"'
+    ':[2040,2040]}],"revisions":[2047,2047]},"network_overlay":{"type":"string","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","r'
+    'evisions":[2040,2040]}],"revisions":[2040,2040]},"ipv6_exclude_range":{"type":"list","children":{"start_ip":{"type":"string","revisions":[2047,2047]},'
+    '"end_ip":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"mode_cfg":{"type":"strin'
+    'g","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"send_cert_chain":{"typ'
+    'e":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"default_gw_pr'
+    'iority":{"type":"integer","revisions":[2047,2047]},"fec_egress":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disab'
+    'le","revisions":[2040,2040]}],"revisions":[2040,2040]},"fec_send_timeout":{"type":"integer","revisions":[2040,2040]},"add_gw_route":{"type":"string","'
+    'options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"usrgrp":{"type":"string","'
+    'revisions":[2047,2047]},"ppk_identity":{"type":"string","revisions":[2047,2047]},"exchange_ip_addr6":{"type":"string","revisions":[2047,2047]},"exchan'
+    'ge_ip_addr4":{"type":"string","revisions":[2047,2047]},"tunnel_search":{"type":"string","options":[{"value":"selectors","revisions":[1023,1023]},{"val'
+    'ue":"nexthop","revisions":[1023,1023]}],"revisions":[2047,1023]},"idle_timeout":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]}'
+    ',{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"eap_identity":{"type":"string","options":[{"value":"use-id-payload","revisions'
+    '":[2047,2047]},{"value":"send-request","revisions":[2047,2047]}],"revisions":[2047,2047]},"exchange_interface_ip":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv4_dns_server3":{"type":"string","revision'
+    's":[2047,2047]},"ipv4_name":{"type":"string","revisions":[2047,2047]},"client_keep_alive":{"type":"string","options":[{"value":"disable","revisions":['
+    '2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dpd_retryinterval":{"type":"string","revisions":[2047,2047]},"remote'
+    'gw_ddns":{"type":"string","revisions":[2047,2047]},"fec_receive_timeout":{"type":"integer","revisions":[2040,2040]},"peergrp":{"type":"string","revisi'
+    'ons":[2047,2047]},"ipv4_start_ip":{"type":"string","revisions":[2047,2047]},"group_authentication":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"negotiate_timeout":{"type":"integer","revisions":[2047,2047'
+    ']}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"encap_local_gw6":{"type":"str","required":false},"auto_discovery_psk":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"signature_hash_alg":{"type":"list","required":false,"choices":["sha1","sha2-256","sha2-384","sha2-512"]},"dhgrp":{"type":"'
+    'list","required":false},"fragmentation_mtu":{"type":"int","required":false},"ipv4_split_exclude":{"type":"str","required":false},"encap_local_gw4":{"t'
+    'ype":"str","required":false},"mesh_selector_type":{"type":"str","required":false,"choices":["disable","subnet","host"]},"eap":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]},"remote_gw":{"type":"str","required":false},"ipv4_end_ip":{"type":"str","required":false},"monitor":{"type":"st'
+    'r","required":false},"childless_ike":{"type":"str","required":false,"choices":["enable","disable"]},"ipv4_wins_server2":{"type":"str","required":false'
+    '},"unity_support":{"type":"str","required":false,"choices":["disable","enable"]},"ha_sync_esp_seqno":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"ipv4_wins_server1":{"type":"str","required":false},"ipv6_start_ip":{"type":"str","required":false},"assign_ip":{"type":"str","required"'
+    ':false,"choices":["disable","enable"]},"auto_discovery_receiver":{"type":"str","required":false,"choices":["enable","disable"]},"ipv6_name":{"type":"s'
+    'tr","required":false},"banner":{"type":"str","required":false},"localid":{"type":"str","required":false},"name":{"type":"str","required":false},"authp'
+    'asswd":{"type":"str","required":false},"network_id":{"type":"int","required":false},"client_auto_negotiate":{"type":"str","required":false,"choices":['
+    '"disable","enable"]},"interface":{"type":"str","required":false},"ipv6_end_ip":{"type":"str","required":false},"dpd":{"type":"str","required":false,"c'
+    'hoices":["disable","on-idle","on-demand"]},"mode":{"type":"str","required":false,"choices":["aggressive","main"]},"monitor_hold_down_time":{"type":"st'
+    'r","required":false},"dns_mode":{"type":"str","required":false,"choices":["manual","auto"]},"forticlient_enforcement":{"type":"str","required":false,"'
+    'choices":["enable","disable"]},"idle_timeoutinterval":{"type":"int","required":false},"domain":{"type":"str","required":false},"auto_discovery_forward'
+    'er":{"type":"str","required":false,"choices":["enable","disable"]},"ipv6_split_include":{"type":"str","required":false},"auto_discovery_shortcuts":{"t'
+    'ype":"str","required":false,"choices":["independent","dependent"]},"ipv6_dns_server1":{"type":"str","required":false},"ipv6_dns_server3":{"type":"str"'
+    ',"required":false},"ipv4_split_include":{"type":"str","required":false},"group_authentication_secret":{"type":"str","required":false},"dhcp6_ra_linkad'
+    'dr":{"type":"str","required":false},"encap_remote_gw6":{"type":"str","required":false},"encap_remote_gw4":{"type":"str","required":false},"encapsulati'
+    'on_address":{"type":"str","required":false,"choices":["ike","ipv4","ipv6"]},"eap_exclude_peergrp":{"type":"str","required":false},"comments":{"type":"'
+    'str","required":false},"auto_negotiate":{"type":"str","required":false,"choices":["enable","disable"]},"split_include_service":{"type":"str","required'
+    '":false},"esn":{"type":"str","required":false,"choices":["require","allow","disable"]},"keepalive":{"type":"int","required":false},"localid_type":{"ty'
+    'pe":"str","required":false,"choices":["auto","fqdn","user-fqdn","keyid","address","asn1dn"]},"cert_id_validation":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"remote_gw6":{"type":"str","required":false},"authmethod_remote":{"type":"str","required":false,"choices":["psk","signature'
+    '"]},"ip_fragmentation":{"type":"str","required":false,"choices":["pre-encapsulation","post-encapsulation"]},"ipv6_dns_server2":{"type":"str","required'
+    '":false},"vni":{"type":"int","required":false},"monitor_hold_down_weekday":{"type":"str","required":false,"choices":["everyday","sunday","monday","tue'
+    'sday","wednesday","thursday","friday","saturday"]},"peer":{"type":"str","required":false},"fec_redundant":{"type":"int","required":false},"encapsulati'
+    'on":{"type":"str","required":false,"choices":["none","gre","vxlan"]},"backup_gateway":{"type":"list","required":false,"options":{"address":{"type":"st'
+    'r","required":false}}},"suite_b":{"type":"str","required":false,"choices":["disable","suite-b-gcm-128","suite-b-gcm-256"]},"monitor_hold_down_type":{"'
+    'type":"str","required":false,"choices":["immediate","delay","time"]},"passive_mode":{"type":"str","required":false,"choices":["enable","disable"]},"as'
+    'sign_ip_from":{"type":"str","required":false,"choices":["range","usrgrp","dhcp","name"]},"ip_version":{"type":"str","required":false,"choices":["4","6'
+    '"]},"rsa_signature_format":{"type":"str","required":false,"choices":["pkcs1","pss"]},"ppk":{"type":"str","required":false,"choices":["disable","allow"'
+    ',"require"]},"xauthtype":{"type":"str","required":false,"choices":["disable","client","pap","chap","auto"]},"include_local_lan":{"type":"str","require'
+    'd":false,"choices":["disable","enable"]},"default_gw":{"type":"str","required":false},"dhcp_ra_giaddr":{"type":"str","required":false},"ppk_secret":{"'
+    'type":"str","required":false},"ipv4_netmask":{"type":"str","required":false},"ike_version":{"type":"str","required":false,"choices":["1","2"]},"keylif'
+    'e":{"type":"int","required":false},"loopback_asymroute":{"type":"str","required":false,"choices":["enable","disable"]},"certificate":{"type":"list","r'
+    'equired":false,"options":{"name":{"type":"str","required":false}}},"priority":{"type":"int","required":false},"aggregate_member":{"type":"str","requir'
+    'ed":false,"choices":["enable","disable"]},"psksecret_remote":{"type":"str","required":false},"npu_offload":{"type":"str","required":false,"choices":["'
+    'enable","disable"]},"dpd_retrycount":{"type":"int","required":false},"ipv6_prefix":{"type":"int","required":false},"proposal":{"type":"list","required'
+    '":false,"choices":["des-md5","des-sha1","des-sha256","des-sha384","des-sha512","3des-md5","3des-sha1","3des-sha256","3des-sha384","3des-sha512","aes12'
+    '8-md5","aes128-sha1","aes128-sha256","aes128-sha384","aes128-sha512","aes128gcm-prfsha1","aes128gcm-prfsha256","aes128gcm-prfsha384","aes128gcm-prfsha'
+    '512","aes192-md5","aes192-sha1","aes192-sha256","aes192-sha384","aes192-sha512","aes256-md5","aes256-sha1","aes256-sha256","aes256-sha384","aes256-sha'
+    '512","aes256gcm-prfsha1","aes256gcm-prfsha256","aes256gcm-prfsha384","aes256gcm-prfsha512","chacha20poly1305-prfsha1","chacha20poly1305-prfsha256","ch'
+    'acha20poly1305-prfsha384","chacha20poly1305-prfsha512","aria128-md5","aria128-sha1","aria128-sha256","aria128-sha384","aria128-sha512","aria192-md5","'
+    'aria192-sha1","aria192-sha256","aria192-sha384","aria192-sha512","aria256-md5","aria256-sha1","aria256-sha256","aria256-sha384","aria256-sha512","seed'
+    '-md5","seed-sha1","seed-sha256","seed-sha384","seed-sha512"]},"type":{"type":"str","required":false,"choices":["static","dynamic","ddns"]},"authusrgrp'
+    '":{"type":"str","required":false},"reauth":{"type":"str","required":false,"choices":["disable","enable"]},"fec_codec":{"type":"int","required":false},'
+    '"ipv4_exclude_range":{"type":"list","required":false,"options":{"start_ip":{"type":"str","required":false},"end_ip":{"type":"str","required":false},"i'
+    'd":{"type":"int","required":false}}},"ipv6_split_exclude":{"type":"str","required":false},"local_gw":{"type":"str","required":false},"ipv4_dns_server2'
+    '":{"type":"str","required":false},"nattraversal":{"type":"str","required":false,"choices":["enable","disable","forced"]},"peerid":{"type":"str","requi'
+    'red":false},"enforce_unique_id":{"type":"str","required":false,"choices":["disable","keep-new","keep-old"]},"rekey":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"distance":{"type":"int","required":false},"fragmentation":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"authusr":{"type":"str","required":false},"fec_base":{"type":"int","required":false},"acct_verify":{"type":"str","required":false,"choices":["enable"'
+    ',"disable"]},"authmethod":{"type":"str","required":false,"choices":["psk","signature"]},"local_gw6":{"type":"str","required":false},"monitor_hold_down'
+    '_delay":{"type":"int","required":false},"psksecret":{"type":"str","required":false},"digital_signature_auth":{"type":"str","required":false,"choices":'
+    '["enable","disable"]},"add_route":{"type":"str","required":false,"choices":["disable","enable"]},"aggregate_weight":{"type":"int","required":false},"f'
+    'ec_ingress":{"type":"str","required":false,"choices":["enable","disable"]},"ipv4_dns_server1":{"type":"str","required":false},"save_password":{"type":'
+    '"str","required":false,"choices":["disable","enable"]},"peertype":{"type":"str","required":false,"choices":["any","one","dialup","peer","peergrp"]},"a'
+    'uto_discovery_sender":{"type":"str","required":false,"choices":["enable","disable"]},"net_device":{"type":"str","required":false,"choices":["enable","'
+    'disable"]},"wizard_type":{"type":"str","required":false},"network_overlay":{"type":"str","required":false,"choices":["disable","enable"]},"ipv6_exclud'
+    'e_range":{"type":"list","required":false,"options":{"start_ip":{"type":"str","required":false},"end_ip":{"type":"str","required":false},"id":{"type":"'
+    'int","required":false}}},"mode_cfg":{"type":"str","required":false,"choices":["disable","enable"]},"send_cert_chain":{"type":"str","required":false,"c'
+    'hoices":["enable","disable"]},"default_gw_priority":{"type":"int","required":false},"fec_egress":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]},"fec_send_timeout":{"type":"int","required":false},"add_gw_route":{"type":"str","required":false,"choices":["enable","disable"]},"usrgrp":{"'
+    'type":"str","required":false},"ppk_identity":{"type":"str","required":false},"exchange_ip_addr6":{"type":"str","required":false},"exchange_ip_addr4":{'
+    '"type":"str","required":false},"tunnel_search":{"type":"str","required":false},"idle_timeout":{"type":"str","required":false,"choices":["enable","disa'
+    'ble"]},"eap_identity":{"type":"str","required":false,"choices":["use-id-payload","send-request"]},"exchange_interface_ip":{"type":"str","required":fal'
+    'se,"choices":["enable","disable"]},"ipv4_dns_server3":{"type":"str","required":false},"ipv4_name":{"type":"str","required":false},"client_keep_alive":'
+    '{"type":"str","required":false,"choices":["disable","enable"]},"dpd_retryinterval":{"type":"str","required":false},"remotegw_ddns":{"type":"str","requ'
+    'ired":false},"fec_receive_timeout":{"type":"int","required":false},"peergrp":{"type":"str","required":false},"ipv4_start_ip":{"type":"str","required":'
+    'false},"group_authentication":{"type":"str","required":false,"choices":["enable","disable"]},"negotiate_timeout":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,93 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"protocol":{"type":"integer","revisions":[2047,2047]},"diffserv":{"type":"string","options":[{"value":"enable","revisions":'
+    '[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"add_route":{"type":"string","options":[{"value":"phase1","revision'
+    's":[2047,2047]},{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"diffservcode":{"type'
+    '":"string","revisions":[1536,1536]},"dst_name":{"type":"string","revisions":[2047,2047]},"keylifekbs":{"type":"integer","revisions":[2047,2047]},"repl'
+    'ay":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"comm'
+    'ents":{"type":"string","revisions":[2047,2047]},"keepalive":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv4_df":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable"'
+    ',"revisions":[2040,2040]}],"revisions":[2040,2040]},"auto_discovery_sender":{"type":"string","options":[{"value":"phase1","revisions":[2047,2047]},{"v'
+    'alue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"src_port":{"type":"integer","revisions"'
+    ':[2047,2047]},"dst_subnet":{"type":"string","revisions":[2047,2047]},"dhgrp":{"multiple_values":true,"type":"list","options":[{"value":"1","revisions"'
+    ':[2047,2047]},{"value":"2","revisions":[2047,2047]},{"value":"5","revisions":[2047,2047]},{"value":"14","revisions":[2047,2047]},{"value":"15","revisi'
+    'ons":[2047,2047]},{"value":"16","revisions":[2047,2047]},{"value":"17","revisions":[2047,2047]},{"value":"18","revisions":[2047,2047]},{"value":"19","'
+    'revisions":[2047,2047]},{"value":"20","revisions":[2047,2047]},{"value":"21","revisions":[2047,2047]},{"value":"27","revisions":[2047,2047]},{"value":'
+    '"28","revisions":[2047,2047]},{"value":"29","revisions":[2047,2047]},{"value":"30","revisions":[2047,2047]},{"value":"31","revisions":[2047,2047]},{"v'
+    'alue":"32","revisions":[2040,2040]}],"revisions":[2047,2047]},"src_end_ip":{"type":"string","revisions":[2047,2047]},"keylifeseconds":{"type":"integer'
+    '","revisions":[2047,2047]},"single_source":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"auto_negotiate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"l2tp":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"dst_name6":{"type":"string","revisions":[2047,2047]},"phase1name":{"type":"string","revisions":[2047,2047]},"'
+    'proposal":{"multiple_values":true,"type":"list","options":[{"value":"null-md5","revisions":[2047,2047]},{"value":"null-sha1","revisions":[2047,2047]},'
+    '{"value":"null-sha256","revisions":[2047,2047]},{"value":"null-sha384","revisions":[2047,2047]},{"value":"null-sha512","revisions":[2047,2047]},{"valu'
+    'e":"des-null","revisions":[2047,2047]},{"value":"des-md5","revisions":[2047,2047]},{"value":"des-sha1","revisions":[2047,2047]},{"value":"des-sha256",'
+    '"revisions":[2047,2047]},{"value":"des-sha384","revisions":[2047,2047]},{"value":"des-sha512","revisions":[2047,2047]},{"value":"3des-null","revisions'
+    '":[2047,2047]},{"value":"3des-md5","revisions":[2047,2047]},{"value":"3des-sha1","revisions":[2047,2047]},{"value":"3des-sha256","revisions":[2047,204'
+    '7]},{"value":"3des-sha384","revisions":[2047,2047]},{"value":"3des-sha512","revisions":[2047,2047]},{"value":"aes128-null","revisions":[2047,2047]},{"'
+    'value":"aes128-md5","revisions":[2047,2047]},{"value":"aes128-sha1","revisions":[2047,2047]},{"value":"aes128-sha256","revisions":[2047,2047]},{"value'
+    '":"aes128-sha384","revisions":[2047,2047]},{"value":"aes128-sha512","revisions":[2047,2047]},{"value":"aes128gcm","revisions":[2047,2047]},{"value":"a'
+    'es192-null","revisions":[2047,2047]},{"value":"aes192-md5","revisions":[2047,2047]},{"value":"aes192-sha1","revisions":[2047,2047]},{"value":"aes192-s'
+    'ha256","revisions":[2047,2047]},{"value":"aes192-sha384","revisions":[2047,2047]},{"value":"aes192-sha512","revisions":[2047,2047]},{"value":"aes256-n'
+    'ull","revisions":[2047,2047]},{"value":"aes256-md5","revisions":[2047,2047]},{"value":"aes256-sha1","revisions":[2047,2047]},{"value":"aes256-sha256",'
+    '"revisions":[2047,2047]},{"value":"aes256-sha384","revisions":[2047,2047]},{"value":"aes256-sha512","revisions":[2047,2047]},{"value":"aes256gcm","rev'
+    'isions":[2047,2047]},{"value":"chacha20poly1305","revisions":[2047,2047]},{"value":"aria128-null","revisions":[2047,2047]},{"value":"aria128-md5","rev'
+    'isions":[2047,2047]},{"value":"aria128-sha1","revisions":[2047,2047]},{"value":"aria128-sha256","revisions":[2047,2047]},{"value":"aria128-sha384","re'
+    'visions":[2047,2047]},{"value":"aria128-sha512","revisions":[2047,2047]},{"value":"aria192-null","revisions":[2047,2047]},{"value":"aria192-md5","revi'
+    'sions":[2047,2047]},{"value":"aria192-sha1","revisions":[2047,2047]},{"value":"aria192-sha256","revisions":[2047,2047]},{"value":"aria192-sha384","rev'
+    'isions":[2047,2047]},{"value":"aria192-sha512","revisions":[2047,2047]},{"value":"aria256-null","revisions":[2047,2047]},{"value":"aria256-md5","revis'
+    'ions":[2047,2047]},{"value":"aria256-sha1","revisions":[2047,2047]},{"value":"aria256-sha256","revisions":[2047,2047]},{"value":"aria256-sha384","revi'
+    'sions":[2047,2047]},{"value":"aria256-sha512","revisions":[2047,2047]},{"value":"seed-null","revisions":[2047,2047]},{"value":"seed-md5","revisions":['
+    '2047,2047]},{"value":"seed-sha1","revisions":[2047,2047]},{"value":"seed-sha256","revisions":[2047,2047]},{"value":"seed-sha384","revisions":[2047,204'
+    '7]},{"value":"seed-sha512","revisions":[2047,2047]}],"revisions":[2047,2047]},"src_addr_type":{"type":"string","options":[{"value":"subnet","revisions'
+    '":[2047,2047]},{"value":"range","revisions":[2047,2047]},{"value":"ip","revisions":[2047,2047]},{"value":"name","revisions":[2047,2047]},{"value":"sub'
+    'net6","revisions":[2047,2047]},{"value":"range6","revisions":[2047,2047]},{"value":"ip6","revisions":[2047,2047]},{"value":"name6","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"dst_port":{"type":"integer","revisions":[2047,2047]},"dhcp_ipsec":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"dst_subnet6":{"type":"string","revisions":[2047,2047]},"src'
+    '_name6":{"type":"string","revisions":[2047,2047]},"src_name":{"type":"string","revisions":[2047,2047]},"src_end_ip6":{"type":"string","revisions":[204'
+    '7,2047]},"pfs":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"dst_end_ip":{"type":"string","revisions":[2047,2047]},"src_start_ip6":{"type":"string","revisions":[2047,2047]},"encapsulation":{"type":"string'
+    '","options":[{"value":"tunnel-mode","revisions":[2047,2047]},{"value":"transport-mode","revisions":[2047,2047]}],"revisions":[2047,2047]},"initiator_t'
+    's_narrow":{"type":"string","options":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]}'
+    ',"src_subnet6":{"type":"string","revisions":[2047,2047]},"dst_start_ip":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":'
+    '[2047,2047]},"keylife_type":{"type":"string","options":[{"value":"seconds","revisions":[2047,2047]},{"value":"kbs","revisions":[2047,2047]},{"value":"'
+    'both","revisions":[2047,2047]}],"revisions":[2047,2047]},"auto_discovery_forwarder":{"type":"string","options":[{"value":"phase1","revisions":[2047,20'
+    '47]},{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"src_start_ip":{"type":"string",'
+    '"revisions":[2047,2047]},"dst_addr_type":{"type":"string","options":[{"value":"subnet","revisions":[2047,2047]},{"value":"range","revisions":[2047,204'
+    '7]},{"value":"ip","revisions":[2047,2047]},{"value":"name","revisions":[2047,2047]},{"value":"subnet6","revisions":[2047,2047]},{"value":"range6","rev'
+    'isions":[2047,2047]},{"value":"ip6","revisions":[2047,2047]},{"value":"name6","revisions":[2047,2047]}],"revisions":[2047,2047]},"dst_end_ip6":{"type"'
+    ':"string","revisions":[2047,2047]},"src_subnet":{"type":"string","revisions":[2047,2047]},"route_overlap":{"type":"string","options":[{"value":"use-ol'
+    'd","revisions":[2047,2047]},{"value":"use-new","revisions":[2047,2047]},{"value":"allow","revisions":[2047,2047]}],"revisions":[2047,2047]},"dst_start'
+    '_ip6":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"protocol":{"type":"int","required":false},"diffserv":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]},"add_route":{"type":"str","required":false,"choices":["phase1","enable","disable"]},"diffservcode":{"type":"str","required":false},"dst_name'
+    '":{"type":"str","required":false},"keylifekbs":{"type":"int","required":false},"replay":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"comments":{"type":"str","required":false},"keepalive":{"type":"str","required":false,"choices":["enable","disable"]},"ipv4_df":{"type":"str","requir'
+    'ed":false,"choices":["enable","disable"]},"auto_discovery_sender":{"type":"str","required":false,"choices":["phase1","enable","disable"]},"src_port":{'
+    '"type":"int","required":false},"dst_subnet":{"type":"str","required":false},"dhgrp":{"type":"list","required":false},"src_end_ip":{"type":"str","requi'
+    'red":false},"keylifeseconds":{"type":"int","required":false},"single_source":{"type":"str","required":false,"choices":["enable","disable"]},"auto_nego'
+    'tiate":{"type":"str","required":false,"choices":["enable","disable"]},"l2tp":{"type":"str","required":false,"choices":["enable","disable"]},"dst_name6'
+    '":{"type":"str","required":false},"phase1name":{"type":"str","required":false},"proposal":{"type":"list","required":false,"choices":["null-md5","null-'
+    'sha1","null-sha256","null-sha384","null-sha512","des-null","des-md5","des-sha1","des-sha256","des-sha384","des-sha512","3des-null","3des-md5","3des-sh'
+    'a1","3des-sha256","3des-sha384","3des-sha512","aes128-null","aes128-md5","aes128-sha1","aes128-sha256","aes128-sha384","aes128-sha512","aes128gcm","ae'
+    's192-null","aes192-md5","aes192-sha1","aes192-sha256","aes192-sha384","aes192-sha512","aes256-null","aes256-md5","aes256-sha1","aes256-sha256","aes256'
+    '-sha384","aes256-sha512","aes256gcm","chacha20poly1305","aria128-null","aria128-md5","aria128-sha1","aria128-sha256","aria128-sha384","aria128-sha512"'
+    ',"aria192-null","aria192-md5","aria192-sha1","aria192-sha256","aria192-sha384","aria192-sha512","aria256-null","aria256-md5","aria256-sha1","aria256-s'
+    'ha256","aria256-sha384","aria256-sha512","seed-null","seed-md5","seed-sha1","seed-sha256","seed-sha384","seed-sha512"]},"src_addr_type":{"type":"str",'
+    '"required":false,"choices":["subnet","range","ip","name","subnet6","range6","ip6","name6"]},"dst_port":{"type":"int","required":false},"dhcp_ipsec":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"dst_subnet6":{"type":"str","required":false},"src_name6":{"type":"str","required":false}'
+    ',"src_name":{"type":"str","required":false},"src_end_ip6":{"type":"str","required":false},"pfs":{"type":"str","required":false,"choices":["enable","di'
+    'sable"]},"dst_end_ip":{"type":"str","required":false},"src_start_ip6":{"type":"str","required":false},"encapsulation":{"type":"str","required":false,"'
+    'choices":["tunnel-mode","transport-mode"]},"initiator_ts_narrow":{"type":"str","required":false,"choices":["enable","disable"]},"src_subnet6":{"type":'
+    '"str","required":false},"dst_start_ip":{"type":"str","required":false},"name":{"type":"str","required":false},"keylife_type":{"type":"str","required":'
+    'false,"choices":["seconds","kbs","both"]},"auto_discovery_forwarder":{"type":"str","required":false,"choices":["phase1","enable","disable"]},"src_star'
+    't_ip":{"type":"str","required":false},"dst_addr_type":{"type":"str","required":false,"choices":["subnet","range","ip","name","subnet6","range6","ip6",'
+    '"name6"]},"dst_end_ip6":{"type":"str","required":false},"src_subnet":{"type":"str","required":false},"route_overlap":{"type":"str","required":false,"c'
+    'hoices":["use-old","use-new","allow"]},"dst_start_ip6":{"type":"str","required":false}}}'
+)
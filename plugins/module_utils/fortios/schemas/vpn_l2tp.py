@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"eip":{"type":"string","revisions":[2047,2047]},"sip":{"type":"string","revisions":[2047,2047]},"usrgrp":{"type":"string","'
+    'revisions":[2047,2047]},"compress":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}]'
+    ',"revisions":[2040,2024]},"lcp_echo_interval":{"type":"integer","revisions":[1920,1664]},"enforce_ipsec":{"type":"string","options":[{"value":"enable"'
+    ',"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"lcp_max_echo_fails":{"type":"integer","revisions":[19'
+    '20,1664]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"eip":{"type":"str","required":fals'
+    'e},"sip":{"type":"str","required":false},"usrgrp":{"type":"str","required":false},"compress":{"type":"str","required":false},"lcp_echo_interval":{"typ'
+    'e":"int","required":false},"enforce_ipsec":{"type":"str","required":false,"choices":["enable","disable"]},"lcp_max_echo_fails":{"type":"int","required'
+    '":false}}}'
+)
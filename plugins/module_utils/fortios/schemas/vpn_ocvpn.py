@@ -0,0 +1,49 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"subnets":{"type":"list","children":{"interface":{"type":"string","revisions":[7,7]},"subnet":{"type":"string","revisions":'
+    '[7,7]},"type":{"type":"string","options":[{"value":"subnet","revisions":[7,7]},{"value":"interface","revisions":[7,7]}],"revisions":[7,7]},"id":{"type'
+    '":"integer","revisions":[7,7]}},"revisions":[2047,7]},"auto_discovery":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value"'
+    ':"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"wan_interface":{"type":"list","children":{"name":{"type":"string","revisions":[1920,192'
+    '0]}},"revisions":[1920,1920]},"sdwan_zone":{"type":"string","revisions":[1024,1024]},"sdwan":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"forticlient_access":{"type":"dict","children":{"status":{"type":"'
+    'string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"auth_groups":{"ty'
+    'pe":"list","children":{"overlays":{"type":"list","children":{"overlay_name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"auth_'
+    'group":{"type":"string","revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"psksecret":{"type":"strin'
+    'g","revisions":[1920,1920]}},"revisions":[1920,1920]},"ha_alias":{"type":"string","revisions":[2047,23]},"ip_allocation_block":{"type":"string","revis'
+    'ions":[1920,1920]},"poll_interval":{"type":"integer","revisions":[2047,2047]},"multipath":{"type":"string","options":[{"value":"enable","revisions":[1'
+    '920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"role":{"type":"string","options":[{"value":"spoke","revisions":[2040'
+    ',2040]},{"value":"primary-hub","revisions":[2040,2040]},{"value":"secondary-hub","revisions":[2040,2040]}],"revisions":[2040,2040]},"nat":{"type":"str'
+    'ing","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"eap":{"type":"string'
+    '","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"eap_users":{"type":"str'
+    'ing","revisions":[2040,2040]},"overlays":{"type":"list","children":{"subnets":{"type":"list","children":{"interface":{"type":"string","revisions":[204'
+    '0,2040]},"subnet":{"type":"string","revisions":[2040,2040]},"type":{"type":"string","options":[{"value":"subnet","revisions":[2040,2040]},{"value":"in'
+    'terface","revisions":[2040,2040]}],"revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"name":{"type":"'
+    'string","revisions":[2040,120]},"overlay_name":{"type":"string","revisions":[1920,1920]},"inter_overlay":{"type":"string","options":[{"value":"allow",'
+    '"revisions":[1920,1920]},{"value":"deny","revisions":[1920,1920]}],"revisions":[1920,1920]},"assign_ip":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"ipv4_start_ip":{"type":"string","revisions":[2040,2040'
+    ']},"ipv4_end_ip":{"type":"string","revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040,120]}},"revisions":[2040,2040]}},"revisions":[2047'
+    ',2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"subnets":{"type":"list","required"'
+    ':false,"options":{"interface":{"type":"str","required":false},"subnet":{"type":"str","required":false},"type":{"type":"str","required":false,"choices"'
+    ':["subnet","interface"]},"id":{"type":"int","required":false}}},"auto_discovery":{"type":"str","required":false,"choices":["enable","disable"]},"wan_i'
+    'nterface":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"sdwan_zone":{"type":"str","required":false},"sdwan":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"forticlient_access":{"type":"dict","required":false,"options":{"status":{"type":"str","re'
+    'quired":false,"choices":["enable","disable"]},"auth_groups":{"type":"list","required":false,"options":{"overlays":{"type":"list","required":false,"opt'
+    'ions":{"overlay_name":{"type":"str","required":false}}},"auth_group":{"type":"str","required":false},"name":{"type":"str","required":false}}},"psksecr'
+    'et":{"type":"str","required":false}}},"ha_alias":{"type":"str","required":false},"ip_allocation_block":{"type":"str","required":false},"poll_interval"'
+    ':{"type":"int","required":false},"multipath":{"type":"str","required":false,"choices":["enable","disable"]},"role":{"type":"str","required":false,"cho'
+    'ices":["spoke","primary-hub","secondary-hub"]},"nat":{"type":"str","required":false,"choices":["enable","disable"]},"eap":{"type":"str","required":fal'
+    'se,"choices":["enable","disable"]},"eap_users":{"type":"str","required":false},"overlays":{"type":"list","required":false,"options":{"subnets":{"type"'
+    ':"list","required":false,"options":{"interface":{"type":"str","required":false},"subnet":{"type":"str","required":false},"type":{"type":"str","require'
+    'd":false,"choices":["subnet","interface"]},"id":{"type":"int","required":false}}},"name":{"type":"str","required":false},"overlay_name":{"type":"str",'
+    '"required":false},"inter_overlay":{"type":"str","required":false,"choices":["allow","deny"]},"assign_ip":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"ipv4_start_ip":{"type":"str","required":false},"ipv4_end_ip":{"type":"str","required":false},"id":{"type":"int","required":false}}}'
+    '}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"eip":{"type":"string","revisions":[2047,2047]},"usrgrp":{"type":"string","revisions":[2047,2047]},"sip":{"type":"string","'
+    'revisions":[2047,2047]},"local_ip":{"type":"string","revisions":[2047,2047]},"ip_mode":{"type":"string","options":[{"value":"range","revisions":[2047,'
+    '2047]},{"value":"usrgrp","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"eip":{"type":"str","required":fals'
+    'e},"usrgrp":{"type":"str","required":false},"sip":{"type":"str","required":false},"local_ip":{"type":"str","required":false},"ip_mode":{"type":"str","'
+    'required":false,"choices":["range","usrgrp"]}}}'
+)
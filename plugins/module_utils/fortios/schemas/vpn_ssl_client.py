@@ -0,0 +1,20 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[1024,1024]},"psk":{"type":"string","revisions":[1024,1024]},"name":{"type":"string"'
+    ',"revisions":[1024,1024]},"certificate":{"type":"string","revisions":[1024,1024]},"distance":{"type":"integer","revisions":[1024,1024]},"source_ip":{"'
+    'type":"string","revisions":[1024,1024]},"server":{"type":"string","revisions":[1024,1024]},"priority":{"type":"integer","revisions":[1024,1024]},"peer'
+    '":{"type":"string","revisions":[1024,1024]},"status":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisi'
+    'ons":[1024,1024]}],"revisions":[1024,1024]},"user":{"type":"string","revisions":[1024,1024]},"interface":{"type":"string","revisions":[1024,1024]},"po'
+    'rt":{"type":"integer","revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"psk":{"type":"str","required":false},"name":{"type":"str","requi'
+    'red":false},"certificate":{"type":"str","required":false},"distance":{"type":"int","required":false},"source_ip":{"type":"str","required":false},"serv'
+    'er":{"type":"str","required":false},"priority":{"type":"int","required":false},"peer":{"type":"str","required":false},"status":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"user":{"type":"str","required":false},"interface":{"type":"str","required":false},"port":{"type":"int","requi'
+    'red":false}}}'
+)
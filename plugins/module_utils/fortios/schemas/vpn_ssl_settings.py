@@ -0,0 +1,126 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"force_two_factor_auth":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"banned_cipher":{"multiple_values":true,"type":"list","options":[{"value":"RSA","revisions":[2047,2047]},{"v'
+    'alue":"DH","revisions":[2047,7]},{"value":"DHE","revisions":[2047,2047]},{"value":"ECDH","revisions":[2047,7]},{"value":"ECDHE","revisions":[2047,2047'
+    ']},{"value":"DSS","revisions":[2047,2047]},{"value":"ECDSA","revisions":[2047,2047]},{"value":"AES","revisions":[2047,2047]},{"value":"AESGCM","revisi'
+    'ons":[2047,2047]},{"value":"CAMELLIA","revisions":[2047,2047]},{"value":"3DES","revisions":[2047,2047]},{"value":"SHA1","revisions":[2047,2047]},{"val'
+    'ue":"SHA256","revisions":[2047,2047]},{"value":"SHA384","revisions":[2047,2047]},{"value":"STATIC","revisions":[2047,2047]},{"value":"CHACHA20","revis'
+    'ions":[1024,1024]},{"value":"ARIA","revisions":[1024,1024]},{"value":"AESCCM","revisions":[1024,1024]}],"revisions":[2047,2047]},"dns_suffix":{"type":'
+    '"string","revisions":[2047,2047]},"dns_server2":{"type":"string","revisions":[2047,2047]},"authentication_rule":{"type":"list","children":{"realm":{"t'
+    'ype":"string","revisions":[2047,2047]},"users":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"'
+    'source_address6_negate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"auth":{"type":"string","options":[{"value":"any","revisions":[2047,2047]},{"value":"local","revisions":[2047,2047]},{"value":"radius",'
+    '"revisions":[2047,2047]},{"value":"tacacs+","revisions":[2047,2047]},{"value":"ldap","revisions":[2047,2047]}],"revisions":[2047,2047]},"source_addres'
+    's6":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"user_peer":{"type":"string","revisions":[20'
+    '40,2040]},"cipher":{"type":"string","options":[{"value":"any","revisions":[2047,2047]},{"value":"high","revisions":[2047,2047]},{"value":"medium","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"portal":{"type":"string","revisions":[2047,2047]},"groups":{"type":"list","children":{"name":{"type":"'
+    'string","revisions":[2047,2047]}},"revisions":[2047,2047]},"source_interface":{"type":"list","children":{"name":{"type":"string","revisions":[2047,204'
+    '7]}},"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"source_address":{"type":"list","children":{"name":{"type":"string","rev'
+    'isions":[2047,2047]}},"revisions":[2047,2047]},"client_cert":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"source_address_negate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"v'
+    'alue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"dual_stack_mode":{"type":"string","options":[{"value":"e'
+    'nable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"user_peer":{"type":"string","revisions":[2040,2'
+    '040]},"default_portal":{"type":"string","revisions":[2047,2047]},"login_timeout":{"type":"integer","revisions":[2047,2047]},"login_block_time":{"type"'
+    ':"integer","revisions":[2047,2047]},"ipv6_dns_server1":{"type":"string","revisions":[2047,2047]},"dtls_tunnel":{"type":"string","options":[{"value":"e'
+    'nable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auto_tunnel_static_route":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"header_x_forwarded_for":{"typ'
+    'e":"string","options":[{"value":"pass","revisions":[2047,2047]},{"value":"add","revisions":[2047,2047]},{"value":"remove","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"tunnel_connect_without_reauth":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revi'
+    'sions":[2040,2040]}],"revisions":[2040,2040]},"servercert":{"type":"string","revisions":[2047,2047]},"ssl_insert_empty_fragment":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl_min_proto_ver":{"type":"s'
+    'tring","options":[{"value":"tls1-0","revisions":[2040,2040]},{"value":"tls1-1","revisions":[2040,2040]},{"value":"tls1-2","revisions":[2040,2040]},{"v'
+    'alue":"tls1-3","revisions":[2040,2040]}],"revisions":[2040,2040]},"deflate_min_data_size":{"type":"integer","revisions":[2047,2047]},"ipv6_wins_server'
+    '1":{"type":"string","revisions":[2047,2047]},"ipv6_wins_server2":{"type":"string","revisions":[2047,2047]},"x_content_type_options":{"type":"string","'
+    'options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"port":{"type":"integer","r'
+    'evisions":[2047,2047]},"deflate_compression_level":{"type":"integer","revisions":[2047,2047]},"encode_2f_sequence":{"type":"string","options":[{"value'
+    '":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2040,2024]},"unsafe_legacy_renegotiation":{"type":"strin'
+    'g","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"hsts_include_subdomain'
+    's":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"dtls_'
+    'min_proto_ver":{"type":"string","options":[{"value":"dtls1-0","revisions":[2040,2040]},{"value":"dtls1-2","revisions":[2040,2040]}],"revisions":[2040,'
+    '2040]},"algorithm":{"type":"string","options":[{"value":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"default",'
+    '"revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]},"port_precedence":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"source_address":{"type":"list","children":{"name"'
+    ':{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"ssl_client_renegotiation":{"type":"string","options":[{"value":"disable","revisi'
+    'ons":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ciphersuite":{"multiple_values":true,"type":"list","options":['
+    '{"value":"TLS-AES-128-GCM-SHA256","revisions":[1024,1024]},{"value":"TLS-AES-256-GCM-SHA384","revisions":[1024,1024]},{"value":"TLS-CHACHA20-POLY1305-'
+    'SHA256","revisions":[1024,1024]},{"value":"TLS-AES-128-CCM-SHA256","revisions":[1024,1024]},{"value":"TLS-AES-128-CCM-8-SHA256","revisions":[1024,1024'
+    ']}],"revisions":[1024,1024]},"dns_server1":{"type":"string","revisions":[2047,2047]},"http_only_cookie":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"route_source_interface":{"type":"string","options":[{"'
+    'value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"reqclientcert":{"type":"string","options":['
+    '{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"tunnel_user_session_timeout":{"type"'
+    ':"integer","revisions":[2040,2040]},"source_interface":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,'
+    '2047]},"https_redirect":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]},"auth_session_check_source_ip":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2'
+    '040,2040]}],"revisions":[2040,2040]},"tunnel_ipv6_pools":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[204'
+    '7,2047]},"check_referer":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"idle_timeout":{"type":"integer","revisions":[2047,2047]},"ipv6_dns_server2":{"type":"string","revisions":[2047,2047]},"source_address'
+    '6":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"http_request_header_timeout":{"type":"intege'
+    'r","revisions":[2047,2047]},"url_obscuration":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"wins_server2":{"type":"string","revisions":[2047,2047]},"login_attempt_limit":{"type":"integer","revisions":[204'
+    '7,2047]},"tlsv1_3":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[2040,1'
+    '20]},"http_request_body_timeout":{"type":"integer","revisions":[2047,2047]},"tunnel_addr_assigned_method":{"type":"string","options":[{"value":"first-'
+    'available","revisions":[1024,1024]},{"value":"round-robin","revisions":[1024,1024]}],"revisions":[1024,1024]},"dtls_max_proto_ver":{"type":"string","o'
+    'ptions":[{"value":"dtls1-0","revisions":[2040,2040]},{"value":"dtls1-2","revisions":[2040,2040]}],"revisions":[2040,2040]},"tlsv1_2":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"auth_timeout":{"type":"integer'
+    '","revisions":[2047,2047]},"tlsv1_0":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"'
+    'revisions":[2047,127]},"tlsv1_1":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revi'
+    'sions":[2047,127]},"wins_server1":{"type":"string","revisions":[2047,2047]},"ssl_max_proto_ver":{"type":"string","options":[{"value":"tls1-0","revisio'
+    'ns":[2040,2040]},{"value":"tls1-1","revisions":[2040,2040]},{"value":"tls1-2","revisions":[2040,2040]},{"value":"tls1-3","revisions":[2040,2040]}],"re'
+    'visions":[2040,2040]},"source_address6_negate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"http_compression":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"dtls_hello_timeout":{"type":"integer","revisions":[2047,2047]},"client_sigalgs":{"type":"string","opt'
+    'ions":[{"value":"no-rsa-pss","revisions":[1536,1536]},{"value":"all","revisions":[1536,1536]}],"revisions":[1536,1536]},"tunnel_ip_pools":{"type":"lis'
+    't","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"transform_backward_slashes":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"encrypt_and_store_password":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"source_address_nega'
+    'te":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"rev'
+    'isions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"force_two_factor_auth":{"type":"str","required":false,"choices":["enable","disable"]},"banned_cipher":{"ty'
+    'pe":"list","required":false},"dns_suffix":{"type":"str","required":false},"dns_server2":{"type":"str","required":false},"authentication_rule":{"type":'
+    '"list","required":false,"options":{"realm":{"type":"str","required":false},"users":{"type":"list","required":false,"options":{"name":{"type":"str","re'
+    'quired":false}}},"source_address6_negate":{"type":"str","required":false,"choices":["enable","disable"]},"auth":{"type":"str","required":false,"choice'
+    's":["any","local","radius","tacacs+","ldap"]},"source_address6":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"u'
+    'ser_peer":{"type":"str","required":false},"cipher":{"type":"str","required":false,"choices":["any","high","medium"]},"portal":{"type":"str","required"'
+    ':false},"groups":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"source_interface":{"type":"list","required":fals'
+    'e,"options":{"name":{"type":"str","required":false}}},"id":{"type":"int","required":false},"source_address":{"type":"list","required":false,"options":'
+    '{"name":{"type":"str","required":false}}},"client_cert":{"type":"str","required":false,"choices":["enable","disable"]},"source_address_negate":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]}}},"dual_stack_mode":{"type":"str","required":false,"choices":["enable","disable"]},"user_peer"'
+    ':{"type":"str","required":false},"default_portal":{"type":"str","required":false},"login_timeout":{"type":"int","required":false},"login_block_time":{'
+    '"type":"int","required":false},"ipv6_dns_server1":{"type":"str","required":false},"dtls_tunnel":{"type":"str","required":false,"choices":["enable","di'
+    'sable"]},"auto_tunnel_static_route":{"type":"str","required":false,"choices":["enable","disable"]},"header_x_forwarded_for":{"type":"str","required":f'
+    'alse,"choices":["pass","add","remove"]},"tunnel_connect_without_reauth":{"type":"str","required":false,"choices":["enable","disable"]},"servercert":{"'
+    'type":"str","required":false},"ssl_insert_empty_fragment":{"type":"str","required":false,"choices":["enable","disable"]},"ssl_min_proto_ver":{"type":"'
+    'str","required":false,"choices":["tls1-0","tls1-1","tls1-2","tls1-3"]},"deflate_min_data_size":{"type":"int","required":false},"ipv6_wins_server1":{"t'
+    'ype":"str","required":false},"ipv6_wins_server2":{"type":"str","required":false},"x_content_type_options":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"port":{"type":"int","required":false},"deflate_compression_level":{"type":"int","required":false},"encode_2f_sequence":{"type":"st'
+    'r","required":false},"unsafe_legacy_renegotiation":{"type":"str","required":false,"choices":["enable","disable"]},"hsts_include_subdomains":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"dtls_min_proto_ver":{"type":"str","required":false,"choices":["dtls1-0","dtls1-2"]},"algorithm":'
+    '{"type":"str","required":false,"choices":["high","medium","default","low"]},"port_precedence":{"type":"str","required":false,"choices":["enable","disa'
+    'ble"]},"source_address":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"ssl_client_renegotiation":{"type":"str","'
+    'required":false,"choices":["disable","enable"]},"ciphersuite":{"type":"list","required":false,"choices":["TLS-AES-128-GCM-SHA256","TLS-AES-256-GCM-SHA'
+    '384","TLS-CHACHA20-POLY1305-SHA256","TLS-AES-128-CCM-SHA256","TLS-AES-128-CCM-8-SHA256"]},"dns_server1":{"type":"str","required":false},"http_only_coo'
+    'kie":{"type":"str","required":false,"choices":["enable","disable"]},"route_source_interface":{"type":"str","required":false},"reqclientcert":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"tunnel_user_session_timeout":{"type":"int","required":false},"source_interface":{"type":"list",'
+    '"required":false,"options":{"name":{"type":"str","required":false}}},"https_redirect":{"type":"str","required":false,"choices":["enable","disable"]},"'
+    'auth_session_check_source_ip":{"type":"str","required":false,"choices":["enable","disable"]},"tunnel_ipv6_pools":{"type":"list","required":false,"opti'
+    'ons":{"name":{"type":"str","required":false}}},"check_referer":{"type":"str","required":false,"choices":["enable","disable"]},"idle_timeout":{"type":"'
+    'int","required":false},"ipv6_dns_server2":{"type":"str","required":false},"source_address6":{"type":"list","required":false,"options":{"name":{"type":'
+    '"str","required":false}}},"http_request_header_timeout":{"type":"int","required":false},"url_obscuration":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"wins_server2":{"type":"str","required":false},"login_attempt_limit":{"type":"int","required":false},"tlsv1_3":{"type":"str","requi'
+    'red":false},"http_request_body_timeout":{"type":"int","required":false},"tunnel_addr_assigned_method":{"type":"str","required":false,"choices":["first'
+    '-available","round-robin"]},"dtls_max_proto_ver":{"type":"str","required":false,"choices":["dtls1-0","dtls1-2"]},"tlsv1_2":{"type":"str","required":fa'
+    'lse},"auth_timeout":{"type":"int","required":false},"tlsv1_0":{"type":"str","required":false},"tlsv1_1":{"type":"str","required":false},"wins_server1"'
+    ':{"type":"str","required":false},"ssl_max_proto_ver":{"type":"str","required":false,"choices":["tls1-0","tls1-1","tls1-2","tls1-3"]},"source_address6_'
+    'negate":{"type":"str","required":false,"choices":["enable","disable"]},"http_compression":{"type":"str","required":false,"choices":["enable","disable"'
+    ']},"dtls_hello_timeout":{"type":"int","required":false},"client_sigalgs":{"type":"str","required":false,"choices":["no-rsa-pss","all"]},"tunnel_ip_poo'
+    'ls":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"transform_backward_slashes":{"type":"str","required":false,"c'
+    'hoices":["enable","disable"]},"encrypt_and_store_password":{"type":"str","required":false,"choices":["enable","disable"]},"source_address_negate":{"ty'
+    'pe":"str","required":false,"choices":["enable","disable"]}}}'
+)
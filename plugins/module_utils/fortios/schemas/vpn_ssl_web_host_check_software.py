@@ -0,0 +1,22 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"version":{"type":"string","revisions":[2047,2047]},"os_type":{"type":"str'
+    'ing","options":[{"value":"windows","revisions":[2047,2047]},{"value":"macos","revisions":[2047,2047]}],"revisions":[2047,2047]},"guid":{"type":"string'
+    '","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"av","revisions":[2047,2047]},{"value":"fw","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"check_item_list":{"type":"list","children":{"md5s":{"type":"list","children":{"id":{"type":"string","revisions":[2047,2047]}},"revisi'
+    'ons":[2047,2047]},"target":{"type":"string","revisions":[2047,2047]},"version":{"type":"string","revisions":[2047,2047]},"action":{"type":"string","op'
+    'tions":[{"value":"require","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"type":{"type":"string","option'
+    's":[{"value":"file","revisions":[2047,2047]},{"value":"registry","revisions":[2047,2047]},{"value":"process","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"version":{"type":"str","required":false},"os_type":{"type":"str","r'
+    'equired":false,"choices":["windows","macos"]},"guid":{"type":"str","required":false},"type":{"type":"str","required":false,"choices":["av","fw"]},"che'
+    'ck_item_list":{"type":"list","required":false,"options":{"md5s":{"type":"list","required":false,"options":{"id":{"type":"str","required":false}}},"tar'
+    'get":{"type":"str","required":false},"version":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["require","deny"]},"'
+    'type":{"type":"str","required":false,"choices":["file","registry","process"]},"id":{"type":"int","required":false}}}}}'
+)
@@ -0,0 +1,152 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"use_sdwan":{"type":"string","options":[{"value":"enable","revisions":[1600,1600]},{"value":"disable","revisions":[1600,160'
+    '0]}],"revisions":[1984,1600]},"smb_max_version":{"type":"string","options":[{"value":"smbv1","revisions":[2040,2040]},{"value":"smbv2","revisions":[20'
+    '40,2040]},{"value":"smbv3","revisions":[2040,2040]}],"revisions":[2040,2040]},"auto_connect":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"transform_backward_slashes":{"type":"string","options":[{"value":'
+    '"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[2040,120]},"dns_suffix":{"type":"string","revisions":[2047,204'
+    '7]},"mac_addr_check_rule":{"type":"list","children":{"mac_addr_list":{"type":"list","children":{"addr":{"type":"string","revisions":[2047,2047]}},"rev'
+    'isions":[2047,2047]},"mac_addr_mask":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,20'
+    '47]},"ip_mode":{"type":"string","options":[{"value":"range","revisions":[2047,2047]},{"value":"user-group","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"forticlient_download":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"dns_server2":{"type":"string","revisions":[2047,2047]},"ipv6_split_tunneling_routing_negate":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"bookmark_group":{"type":"list","children":'
+    '{"bookmarks":{"type":"list","children":{"show_status_window":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"domain":{"type":"string","revisions":[1920,1664]},"additional_params":{"type":"string","revisions'
+    '":[2047,2047]},"sso_password":{"type":"string","revisions":[2047,2047]},"logon_user":{"type":"string","revisions":[2047,2047]},"sso_credential_sent_on'
+    'ce":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sso_'
+    'credential":{"type":"string","options":[{"value":"sslvpn-login","revisions":[2047,2047]},{"value":"alternative","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"port":{"type":"integer","revisions":[2047,2047]},"listening_port":{"type":"integer","revisions":[2047,2047]},"preconnection_blob":{"type'
+    '":"string","revisions":[2047,2047]},"apptype":{"type":"string","options":[{"value":"citrix","revisions":[2047,7]},{"value":"ftp","revisions":[2047,204'
+    '7]},{"value":"portforward","revisions":[2047,7]},{"value":"rdp","revisions":[2047,2047]},{"value":"smb","revisions":[2047,2047]},{"value":"ssh","revis'
+    'ions":[2047,2047]},{"value":"telnet","revisions":[2047,2047]},{"value":"vnc","revisions":[2047,2047]},{"value":"web","revisions":[2047,2047]},{"value"'
+    ':"sftp","revisions":[2040,2040]}],"revisions":[2047,2047]},"remote_port":{"type":"integer","revisions":[2047,2047]},"preconnection_id":{"type":"intege'
+    'r","revisions":[2047,2047]},"folder":{"type":"string","revisions":[2047,2047]},"load_balancing_info":{"type":"string","revisions":[2047,2047]},"descri'
+    'ption":{"type":"string","revisions":[2047,2047]},"sso_username":{"type":"string","revisions":[2047,2047]},"host":{"type":"string","revisions":[2047,20'
+    '47]},"name":{"type":"string","revisions":[2047,2047]},"url":{"type":"string","revisions":[2047,2047]},"sso":{"type":"string","options":[{"value":"disa'
+    'ble","revisions":[2047,2047]},{"value":"static","revisions":[2047,2047]},{"value":"auto","revisions":[2047,2047]}],"revisions":[2047,2047]},"logon_pas'
+    'sword":{"type":"string","revisions":[2047,2047]},"form_data":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"value":{"typ'
+    'e":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"security":{"type":"string","options":[{"value":"rdp","revisions":[2047,2047]},{"value"'
+    ':"nla","revisions":[2047,2047]},{"value":"tls","revisions":[2047,2047]},{"value":"any","revisions":[2047,2047]}],"revisions":[2047,2047]},"server_layo'
+    'ut":{"type":"string","options":[{"value":"de-de-qwertz","revisions":[2047,2047]},{"value":"en-gb-qwerty","revisions":[2047,2047]},{"value":"en-us-qwer'
+    'ty","revisions":[2047,2047]},{"value":"es-es-qwerty","revisions":[2047,2047]},{"value":"fr-fr-azerty","revisions":[2047,2047]},{"value":"fr-ch-qwertz"'
+    ',"revisions":[2047,2047]},{"value":"it-it-qwerty","revisions":[2047,2047]},{"value":"ja-jp-qwerty","revisions":[2047,2047]},{"value":"pt-br-qwerty","r'
+    'evisions":[2047,2047]},{"value":"sv-se-qwerty","revisions":[2047,2047]},{"value":"tr-tr-qwerty","revisions":[2047,2047]},{"value":"failsafe","revision'
+    's":[2047,2047]},{"value":"fr-ca-qwerty","revisions":[2040,2040]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"name":{"type":"string","revision'
+    's":[2047,2047]}},"revisions":[2047,2047]},"ipv6_service_restriction":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"'
+    'disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"exclusive_routing":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]}'
+    ',{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"allow_user_access":{"multiple_values":true,"type":"list","options":[{"value":"'
+    'web","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"value":"smb","revisions":[2047,2047]},{"value":"telnet","revisions":[2047,2047'
+    ']},{"value":"ssh","revisions":[2047,2047]},{"value":"vnc","revisions":[2047,2047]},{"value":"rdp","revisions":[2047,2047]},{"value":"ping","revisions"'
+    ':[2047,2047]},{"value":"citrix","revisions":[2047,2047]},{"value":"portforward","revisions":[2047,2047]},{"value":"sftp","revisions":[2040,2040]}],"re'
+    'visions":[2047,2047]},"ipv6_dns_server1":{"type":"string","revisions":[2047,2047]},"user_bookmark":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_dns_server2":{"type":"string","revisions":[2047,2047]}'
+    ',"smb_ntlmv1_auth":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"smb_min_version":{"type":"string","options":[{"value":"smbv1","revisions":[2040,2040]},{"value":"smbv2","revisions":[2040,2040]},{"value":"'
+    'smbv3","revisions":[2040,2040]}],"revisions":[2040,2040]},"ipv6_tunnel_mode":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"'
+    'value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_exclusive_routing":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"windows_forticlient_download_url":{"type":"string","revisions":[2'
+    '047,2047]},"service_restriction":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"ipv6_wins_server1":{"type":"string","revisions":[2047,2047]},"ipv6_wins_server2":{"type":"string","revisions":[2047,2047]},"s'
+    'plit_tunneling":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"heading":{"type":"string","revisions":[2047,2047]},"tunnel_mode":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"valu'
+    'e":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"theme":{"type":"string","options":[{"value":"blue","revisions":[2047,1023]},{"value":'
+    '"green","revisions":[2047,1023]},{"value":"red","revisions":[2047,7]},{"value":"melongene","revisions":[2047,2047]},{"value":"mariner","revisions":[20'
+    '47,2047]},{"value":"neutrino","revisions":[2040,2040]},{"value":"jade","revisions":[1024,1024]},{"value":"graphite","revisions":[1024,1024]},{"value":'
+    '"dark-matter","revisions":[1024,1024]},{"value":"onyx","revisions":[1024,1024]},{"value":"eclipse","revisions":[1024,1024]}],"revisions":[2047,2047]},'
+    '"redir_url":{"type":"string","revisions":[2047,2047]},"keep_alive":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"di'
+    'sable","revisions":[2047,2047]}],"revisions":[2047,2047]},"wins_server1":{"type":"string","revisions":[2047,2047]},"hide_sso_credential":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"skip_check_for_unsupp'
+    'orted_os":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"mac_addr_action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"skip_check_for_unsupported_browser":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"re'
+    'visions":[2047,7]},"display_history":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"dns_server1":{"type":"string","revisions":[2047,2047]},"macos_forticlient_download_url":{"type":"string","revisions":[204'
+    '7,2047]},"os_check":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"display_connection_tools":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"split_dns":{"type":"list","children":{"dns_server1":{"type":"string","revisions":[2047,2047]},"dns_server2":{"type":"str'
+    'ing","revisions":[2047,2047]},"domains":{"type":"string","revisions":[2047,2047]},"ipv6_dns_server1":{"type":"string","revisions":[2047,2047]},"ipv6_d'
+    'ns_server2":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"skip_check_for_browse'
+    'r":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"custo'
+    'm_lang":{"type":"string","revisions":[2047,2047]},"rewrite_ip_uri_ui":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":'
+    '"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"smbv1":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"'
+    'disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_split_tunneling":{"type":"string","options":[{"value":"enable","revisions":[2047,204'
+    '7]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"customize_forticlient_download_url":{"type":"string","options":[{"value":"e'
+    'nable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"host_check":{"type":"string","options":[{"value'
+    '":"none","revisions":[2047,2047]},{"value":"av","revisions":[2047,2047]},{"value":"fw","revisions":[2047,2047]},{"value":"av-fw","revisions":[2047,204'
+    '7]},{"value":"custom","revisions":[2047,2047]}],"revisions":[2047,2047]},"wins_server2":{"type":"string","revisions":[2047,2047]},"host_check_interval'
+    '":{"type":"integer","revisions":[2047,2047]},"ipv6_split_tunneling_routing_address":{"type":"list","children":{"name":{"type":"string","revisions":[20'
+    '47,2047]}},"revisions":[2047,2047]},"forticlient_download_method":{"type":"string","options":[{"value":"direct","revisions":[2047,2047]},{"value":"ssl'
+    '-vpn","revisions":[2047,2047]}],"revisions":[2047,2047]},"web_mode":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"limit_user_logins":{"type":"string","opti'
+    'ons":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"display_bookmark":{"type":"str'
+    'ing","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_pools":{"type":'
+    '"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"split_tunneling_routing_address":{"type":"list","childr'
+    'en":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"user_group_bookmark":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"os_check_list":{"type":"list","children":{"action":{"typ'
+    'e":"string","options":[{"value":"deny","revisions":[2047,2047]},{"value":"allow","revisions":[2047,2047]},{"value":"check-up-to-date","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"tolerance":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"latest_pat'
+    'ch_level":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"ip_pools":{"type":"list","children":{"name":{"type":"string","revisions'
+    '":[2047,2047]}},"revisions":[2047,2047]},"prefer_ipv6_dns":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","'
+    'revisions":[1024,1024]}],"revisions":[1024,1024]},"display_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"di'
+    'sable","revisions":[2047,2047]}],"revisions":[2047,2047]},"save_password":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"val'
+    'ue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"split_tunneling_routing_negate":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"host_check_policy":{"type":"list","children":{"name":{"type"'
+    ':"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"mac_addr_check":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{'
+    '"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"use_sdwan":{"type":"str","required":false},"smb_max_version":{"type":"str","required":false,"choices":["sm'
+    'bv1","smbv2","smbv3"]},"auto_connect":{"type":"str","required":false,"choices":["enable","disable"]},"transform_backward_slashes":{"type":"str","requi'
+    'red":false},"dns_suffix":{"type":"str","required":false},"mac_addr_check_rule":{"type":"list","required":false,"options":{"mac_addr_list":{"type":"lis'
+    't","required":false,"options":{"addr":{"type":"str","required":false}}},"mac_addr_mask":{"type":"int","required":false},"name":{"type":"str","required'
+    '":false}}},"ip_mode":{"type":"str","required":false,"choices":["range","user-group"]},"forticlient_download":{"type":"str","required":false,"choices":'
+    '["enable","disable"]},"dns_server2":{"type":"str","required":false},"ipv6_split_tunneling_routing_negate":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"bookmark_group":{"type":"list","required":false,"options":{"bookmarks":{"type":"list","required":false,"options":{"show_status_win'
+    'dow":{"type":"str","required":false,"choices":["enable","disable"]},"domain":{"type":"str","required":false},"additional_params":{"type":"str","requir'
+    'ed":false},"sso_password":{"type":"str","required":false},"logon_user":{"type":"str","required":false},"sso_credential_sent_once":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]},"sso_credential":{"type":"str","required":false,"choices":["sslvpn-login","alternative"]},"port":{"type":"i'
+    'nt","required":false},"listening_port":{"type":"int","required":false},"preconnection_blob":{"type":"str","required":false},"apptype":{"type":"str","r'
+    'equired":false},"remote_port":{"type":"int","required":false},"preconnection_id":{"type":"int","required":false},"folder":{"type":"str","required":fal'
+    'se},"load_balancing_info":{"type":"str","required":false},"description":{"type":"str","required":false},"sso_username":{"type":"str","required":false}'
+    ',"host":{"type":"str","required":false},"name":{"type":"str","required":false},"url":{"type":"str","required":false},"sso":{"type":"str","required":fa'
+    'lse,"choices":["disable","static","auto"]},"logon_password":{"type":"str","required":false},"form_data":{"type":"list","required":false,"options":{"na'
+    'me":{"type":"str","required":false},"value":{"type":"str","required":false}}},"security":{"type":"str","required":false,"choices":["rdp","nla","tls","'
+    'any"]},"server_layout":{"type":"str","required":false}}},"name":{"type":"str","required":false}}},"ipv6_service_restriction":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"exclusive_routing":{"type":"str","required":false,"choices":["enable","disable"]},"allow_user_access":{"type":"'
+    'list","required":false},"ipv6_dns_server1":{"type":"str","required":false},"user_bookmark":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"ipv6_dns_server2":{"type":"str","required":false},"smb_ntlmv1_auth":{"type":"str","required":false,"choices":["enable","disable"]},"smb_min_versi'
+    'on":{"type":"str","required":false,"choices":["smbv1","smbv2","smbv3"]},"ipv6_tunnel_mode":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"ipv6_exclusive_routing":{"type":"str","required":false,"choices":["enable","disable"]},"windows_forticlient_download_url":{"type":"str","required'
+    '":false},"service_restriction":{"type":"str","required":false,"choices":["enable","disable"]},"ipv6_wins_server1":{"type":"str","required":false},"ipv'
+    '6_wins_server2":{"type":"str","required":false},"split_tunneling":{"type":"str","required":false,"choices":["enable","disable"]},"heading":{"type":"st'
+    'r","required":false},"tunnel_mode":{"type":"str","required":false,"choices":["enable","disable"]},"theme":{"type":"str","required":false},"redir_url":'
+    '{"type":"str","required":false},"keep_alive":{"type":"str","required":false,"choices":["enable","disable"]},"wins_server1":{"type":"str","required":fa'
+    'lse},"hide_sso_credential":{"type":"str","required":false,"choices":["enable","disable"]},"skip_check_for_unsupported_os":{"type":"str","required":fal'
+    'se,"choices":["enable","disable"]},"mac_addr_action":{"type":"str","required":false,"choices":["allow","deny"]},"skip_check_for_unsupported_browser":{'
+    '"type":"str","required":false},"display_history":{"type":"str","required":false,"choices":["enable","disable"]},"dns_server1":{"type":"str","required"'
+    ':false},"macos_forticlient_download_url":{"type":"str","required":false},"os_check":{"type":"str","required":false,"choices":["enable","disable"]},"di'
+    'splay_connection_tools":{"type":"str","required":false,"choices":["enable","disable"]},"split_dns":{"type":"list","required":false,"options":{"dns_ser'
+    'ver1":{"type":"str","required":false},"dns_server2":{"type":"str","required":false},"domains":{"type":"str","required":false},"ipv6_dns_server1":{"typ'
+    'e":"str","required":false},"ipv6_dns_server2":{"type":"str","required":false},"id":{"type":"int","required":false}}},"skip_check_for_browser":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"custom_lang":{"type":"str","required":false},"rewrite_ip_uri_ui":{"type":"str","required":fals'
+    'e,"choices":["enable","disable"]},"smbv1":{"type":"str","required":false,"choices":["enable","disable"]},"ipv6_split_tunneling":{"type":"str","require'
+    'd":false,"choices":["enable","disable"]},"customize_forticlient_download_url":{"type":"str","required":false,"choices":["enable","disable"]},"host_che'
+    'ck":{"type":"str","required":false,"choices":["none","av","fw","av-fw","custom"]},"wins_server2":{"type":"str","required":false},"host_check_interval"'
+    ':{"type":"int","required":false},"ipv6_split_tunneling_routing_address":{"type":"list","required":false,"options":{"name":{"type":"str","required":fal'
+    'se}}},"forticlient_download_method":{"type":"str","required":false,"choices":["direct","ssl-vpn"]},"web_mode":{"type":"str","required":false,"choices"'
+    ':["enable","disable"]},"name":{"type":"str","required":false},"limit_user_logins":{"type":"str","required":false,"choices":["enable","disable"]},"disp'
+    'lay_bookmark":{"type":"str","required":false,"choices":["enable","disable"]},"ipv6_pools":{"type":"list","required":false,"options":{"name":{"type":"s'
+    'tr","required":false}}},"split_tunneling_routing_address":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"user_gr'
+    'oup_bookmark":{"type":"str","required":false,"choices":["enable","disable"]},"os_check_list":{"type":"list","required":false,"options":{"action":{"typ'
+    'e":"str","required":false,"choices":["deny","allow","check-up-to-date"]},"tolerance":{"type":"int","required":false},"name":{"type":"str","required":f'
+    'alse},"latest_patch_level":{"type":"str","required":false}}},"ip_pools":{"type":"list","required":false,"options":{"name":{"type":"str","required":fal'
+    'se}}},"prefer_ipv6_dns":{"type":"str","required":false,"choices":["enable","disable"]},"display_status":{"type":"str","required":false,"choices":["ena'
+    'ble","disable"]},"save_password":{"type":"str","required":false,"choices":["enable","disable"]},"split_tunneling_routing_negate":{"type":"str","requir'
+    'ed":false,"choices":["enable","disable"]},"host_check_policy":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"mac'
+    '_addr_check":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
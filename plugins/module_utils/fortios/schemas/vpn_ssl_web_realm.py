@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"nas_ip":{"type":"string","revisions":[1920,1920]},"login_page":{"type":"string","revisions":[2047,2047]},"max_concurrent_u'
+    'ser":{"type":"integer","revisions":[2047,2047]},"virtual_host_only":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"d'
+    'isable","revisions":[1920,1920]}],"revisions":[1920,1920]},"radius_server":{"type":"string","revisions":[1920,1920]},"virtual_host":{"type":"string","'
+    'revisions":[2047,2047]},"radius_port":{"type":"integer","revisions":[1920,1664]},"url_path":{"type":"string","revisions":[2047,2047]}},"revisions":[20'
+    '47,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"nas_ip":{"type":"str","required":false},"login_page":{"type":"str","required":false},"max_concurrent_user"'
+    ':{"type":"int","required":false},"virtual_host_only":{"type":"str","required":false,"choices":["enable","disable"]},"radius_server":{"type":"str","req'
+    'uired":false},"virtual_host":{"type":"str","required":false},"radius_port":{"type":"int","required":false},"url_path":{"type":"str","required":false}}'
+    '}'
+)
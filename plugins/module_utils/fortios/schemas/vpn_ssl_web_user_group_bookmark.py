@@ -0,0 +1,43 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"bookmarks":{"type":"list","children":{"show_status_window":{"type":"string","options":[{"value":"enable","revisions":[2047'
+    ',2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"domain":{"type":"string","revisions":[1920,1664]},"additional_params":{'
+    '"type":"string","revisions":[2047,2047]},"sso_password":{"type":"string","revisions":[2047,2047]},"logon_user":{"type":"string","revisions":[2047,2047'
+    ']},"sso_credential_sent_once":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"sso_credential":{"type":"string","options":[{"value":"sslvpn-login","revisions":[2047,2047]},{"value":"alternative","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"port":{"type":"integer","revisions":[2047,2047]},"listening_port":{"type":"integer","revisions":[2047,2047]},"'
+    'preconnection_blob":{"type":"string","revisions":[2047,2047]},"apptype":{"type":"string","options":[{"value":"citrix","revisions":[2047,7]},{"value":"'
+    'ftp","revisions":[2047,2047]},{"value":"portforward","revisions":[2047,7]},{"value":"rdp","revisions":[2047,2047]},{"value":"smb","revisions":[2047,20'
+    '47]},{"value":"ssh","revisions":[2047,2047]},{"value":"telnet","revisions":[2047,2047]},{"value":"vnc","revisions":[2047,2047]},{"value":"web","revisi'
+    'ons":[2047,2047]},{"value":"sftp","revisions":[2040,2040]}],"revisions":[2047,2047]},"remote_port":{"type":"integer","revisions":[2047,2047]},"preconn'
+    'ection_id":{"type":"integer","revisions":[2047,2047]},"folder":{"type":"string","revisions":[2047,2047]},"load_balancing_info":{"type":"string","revis'
+    'ions":[2047,2047]},"description":{"type":"string","revisions":[2047,2047]},"sso_username":{"type":"string","revisions":[2047,2047]},"host":{"type":"st'
+    'ring","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"url":{"type":"string","revisions":[2047,2047]},"sso":{"type":"string"'
+    ',"options":[{"value":"disable","revisions":[2047,2047]},{"value":"static","revisions":[2047,2047]},{"value":"auto","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"logon_password":{"type":"string","revisions":[2047,2047]},"form_data":{"type":"list","children":{"name":{"type":"string","revisions":'
+    '[2047,2047]},"value":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"security":{"type":"string","options":[{"value":"rdp","revisi'
+    'ons":[2047,2047]},{"value":"nla","revisions":[2047,2047]},{"value":"tls","revisions":[2047,2047]},{"value":"any","revisions":[2047,2047]}],"revisions"'
+    ':[2047,2047]},"server_layout":{"type":"string","options":[{"value":"de-de-qwertz","revisions":[2047,2047]},{"value":"en-gb-qwerty","revisions":[2047,2'
+    '047]},{"value":"en-us-qwerty","revisions":[2047,2047]},{"value":"es-es-qwerty","revisions":[2047,2047]},{"value":"fr-fr-azerty","revisions":[2047,2047'
+    ']},{"value":"fr-ch-qwertz","revisions":[2047,2047]},{"value":"it-it-qwerty","revisions":[2047,2047]},{"value":"ja-jp-qwerty","revisions":[2047,2047]},'
+    '{"value":"pt-br-qwerty","revisions":[2047,2047]},{"value":"sv-se-qwerty","revisions":[2047,2047]},{"value":"tr-tr-qwerty","revisions":[2047,2047]},{"v'
+    'alue":"failsafe","revisions":[2047,2047]},{"value":"fr-ca-qwerty","revisions":[2040,2040]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"name":'
+    '{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"bookmarks":{"type":"list","required":false,"options":{"show_status_window":{"type":"str","required":false,'
+    '"choices":["enable","disable"]},"domain":{"type":"str","required":false},"additional_params":{"type":"str","required":false},"sso_password":{"type":"s'
+    'tr","required":false},"logon_user":{"type":"str","required":false},"sso_credential_sent_once":{"type":"str","required":false,"choices":["enable","disa'
+    'ble"]},"sso_credential":{"type":"str","required":false,"choices":["sslvpn-login","alternative"]},"port":{"type":"int","required":false},"listening_por'
+    't":{"type":"int","required":false},"preconnection_blob":{"type":"str","required":false},"apptype":{"type":"str","required":false},"remote_port":{"type'
+    '":"int","required":false},"preconnection_id":{"type":"int","required":false},"folder":{"type":"str","required":false},"load_balancing_info":{"type":"s'
+    'tr","required":false},"description":{"type":"str","required":false},"sso_username":{"type":"str","required":false},"host":{"type":"str","required":fal'
+    'se},"name":{"type":"str","required":false},"url":{"type":"str","required":false},"sso":{"type":"str","required":false,"choices":["disable","static","a'
+    'uto"]},"logon_password":{"type":"str","required":false},"form_data":{"type":"list","required":false,"options":{"name":{"type":"str","required":false},'
+    '"value":{"type":"str","required":false}}},"security":{"type":"str","required":false,"choices":["rdp","nla","tls","any"]},"server_layout":{"type":"str"'
+    ',"required":false}}},"name":{"type":"str","required":false}}}'
+)
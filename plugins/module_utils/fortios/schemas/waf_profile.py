@@ -0,0 +1,206 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"constraint":{"type":"'
+    'dict","children":{"content_length":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value"'
+    ':"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":'
+    '"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"length":{"type":"integer","revisions":[2047,2047]},"log":{"type":"string","options":[{"val'
+    'ue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"v'
+    'alue":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]}},"r'
+    'evisions":[2047,2047]},"exception":{"type":"list","children":{"regex":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":'
+    '"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"content_length":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{'
+    '"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"header_length":{"type":"string","options":[{"value":"enable","revisions":[2047,2'
+    '047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_cookie":{"type":"string","options":[{"value":"enable","revisions":[20'
+    '47,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"param_length":{"type":"string","options":[{"value":"enable","revision'
+    's":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_url_param":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pattern":{"type":"string","revisions":[2047,2047]},"host'
+    'name":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"me'
+    'thod":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ur'
+    'l_param_length":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"malformed":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"max_range_segment":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"version":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"address":{"type":"string","revisions":[2047,2047]},"max_header_line":{"type":"string","options":[{"value":"enable","revisions":'
+    '[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"line_length":{"typ'
+    'e":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":['
+    '2047,2047]},"header_length":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disab'
+    'le","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"block"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"length":{"type":"integer","revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"en'
+    'able","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"'
+    'high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revision'
+    's":[2047,2047]},"max_cookie":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disa'
+    'ble","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"block'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_cookie":{"type":"integer","revisions":[2047,2047]},"severity":{"type":"string","options":[{"'
+    'value":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]},"l'
+    'og":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"rev'
+    'isions":[2047,2047]},"param_length":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value'
+    '":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value"'
+    ':"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"length":{"type":"integer","revisions":[2047,2047]},"log":{"type":"string","options":[{"va'
+    'lue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"'
+    'value":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]}},"'
+    'revisions":[2047,2047]},"max_url_param":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"v'
+    'alue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"va'
+    'lue":"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":'
+    '"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"high","revisions":[2047,2047]},{"value":'
+    '"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_url_param":{"type":"integer","revisions":[204'
+    '7,2047]}},"revisions":[2047,2047]},"hostname":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047'
+    ']},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]'
+    '},{"value":"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"v'
+    'alue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"high","revisions":[2047,2047]},{"v'
+    'alue":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"url_param_length"'
+    ':{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"length":{"type":"integer","revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"enable","revisions":[2047,204'
+    '7]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"high","revisions":[2047,204'
+    '7]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"malformed"'
+    ':{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"severity":{"type":"string","options":[{"value":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"val'
+    'ue":"low","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"max_range_segment":{"type":"dict","children":{"status":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type"'
+    ':"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_range_segment"'
+    ':{"type":"integer","revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"high","revisions":[2047,2047]},{"value":"medium","revisions"'
+    ':[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"version":{"type":"dict","children":{"status'
+    '":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"action'
+    '":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"log":{"ty'
+    'pe":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"'
+    'type":"string","options":[{"value":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]}},"revisions":[2047,2047]},"max_header_line":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable'
+    '","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"allow"'
+    ',"revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_header_line":{"type":"integer","revisions":[2047,20'
+    '47]},"log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"severity":{"type":"string","options":[{"value":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions'
+    '":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"method":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"'
+    'enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"'
+    'allow","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"enable'
+    '","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"high'
+    '","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":['
+    '2047,2047]},"line_length":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"block","'
+    'revisions":[2047,2047]}],"revisions":[2047,2047]},"length":{"type":"integer","revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"hi'
+    'gh","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions"'
+    ':[2047,2047]}},"revisions":[2047,2047]},"extended_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"url_access":{"type":"list","children":{"severity":{"type":"string","options":[{"value":"high","revision'
+    's":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]},"access_pattern":{"type":'
+    '"list","children":{"srcaddr":{"type":"string","revisions":[2047,2047]},"pattern":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","rev'
+    'isions":[2047,2047]},"negate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"regex":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]}},"revisions":[2047,2047]},"address":{"type":"string","revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"bypas'
+    's","revisions":[2047,2047]},{"value":"permit","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type'
+    '":"integer","revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"external":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value'
+    '":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"signature":{"type":"dict","children":{"main_class":{"type":"list","children":{"status":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":'
+    '{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]},{"value":"erase","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},'
+    '{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"disabled_'
+    'sub_class":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"custom_signature":{"type":"list","chi'
+    'ldren":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"direction":{"type":"string","options":[{"value":"request","revisions":[2047,2047]},{"value":"response","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"pattern":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"case_sensitivity":{"type":"string","op'
+    'tions":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"target":{"multiple_values":t'
+    'rue,"type":"list","options":[{"value":"arg","revisions":[2047,2047]},{"value":"arg-name","revisions":[2047,2047]},{"value":"req-body","revisions":[204'
+    '7,2047]},{"value":"req-cookie","revisions":[2047,2047]},{"value":"req-cookie-name","revisions":[2047,2047]},{"value":"req-filename","revisions":[2047,'
+    '2047]},{"value":"req-header","revisions":[2047,2047]},{"value":"req-header-name","revisions":[2047,2047]},{"value":"req-raw-uri","revisions":[2047,204'
+    '7]},{"value":"req-uri","revisions":[2047,2047]},{"value":"resp-body","revisions":[2047,2047]},{"value":"resp-hdr","revisions":[2047,2047]},{"value":"r'
+    'esp-status","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value"'
+    ':"block","revisions":[2047,2047]},{"value":"erase","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":'
+    '"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisio'
+    'ns":[2047,2047]},"disabled_signature":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"credit_car'
+    'd_detection_threshold":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"method":{"type":"dict","children":{"status":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"method_policy":{"type'
+    '":"list","children":{"regex":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"pattern":{"type":"string","revisions":[2047,2047]},"allowed_methods":{"multiple_values":true,"type":"list","options":[{"value":"g'
+    'et","revisions":[2047,2047]},{"value":"post","revisions":[2047,2047]},{"value":"put","revisions":[2047,2047]},{"value":"head","revisions":[2047,2047]}'
+    ',{"value":"connect","revisions":[2047,2047]},{"value":"trace","revisions":[2047,2047]},{"value":"options","revisions":[2047,2047]},{"value":"delete","'
+    'revisions":[2047,2047]},{"value":"others","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"address"'
+    ':{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"default_allowed_methods":{"multiple_values":true,"type":"list","options":[{"valu'
+    'e":"get","revisions":[2047,2047]},{"value":"post","revisions":[2047,2047]},{"value":"put","revisions":[2047,2047]},{"value":"head","revisions":[2047,2'
+    '047]},{"value":"connect","revisions":[2047,2047]},{"value":"trace","revisions":[2047,2047]},{"value":"options","revisions":[2047,2047]},{"value":"dele'
+    'te","revisions":[2047,2047]},{"value":"others","revisions":[2047,2047]}],"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"hig'
+    'h","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]},"log":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[20'
+    '47,2047]},"address_list":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"blocked_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"dis'
+    'able","revisions":[2047,2047]}],"revisions":[2047,2047]},"trusted_address":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}'
+    '},"revisions":[2047,2047]},"severity":{"type":"string","options":[{"value":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},'
+    '{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]},"blocked_address":{"type":"list","children":{"name":{"type":"string","revisions":[20'
+    '47,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"name":{"type":"str","required":false},"constraint":{"type":"dict'
+    '","required":false,"options":{"content_length":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable",'
+    '"disable"]},"action":{"type":"str","required":false,"choices":["allow","block"]},"length":{"type":"int","required":false},"log":{"type":"str","require'
+    'd":false,"choices":["enable","disable"]},"severity":{"type":"str","required":false,"choices":["high","medium","low"]}}},"exception":{"type":"list","re'
+    'quired":false,"options":{"regex":{"type":"str","required":false,"choices":["enable","disable"]},"content_length":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"header_length":{"type":"str","required":false,"choices":["enable","disable"]},"max_cookie":{"type":"str","required":false,"'
+    'choices":["enable","disable"]},"param_length":{"type":"str","required":false,"choices":["enable","disable"]},"max_url_param":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"pattern":{"type":"str","required":false},"hostname":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"method":{"type":"str","required":false,"choices":["enable","disable"]},"url_param_length":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"malformed":{"type":"str","required":false,"choices":["enable","disable"]},"max_range_segment":{"type":"str","required":false,"choices":["enab'
+    'le","disable"]},"version":{"type":"str","required":false,"choices":["enable","disable"]},"address":{"type":"str","required":false},"max_header_line":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"id":{"type":"int","required":false},"line_length":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]}}},"header_length":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","di'
+    'sable"]},"action":{"type":"str","required":false,"choices":["allow","block"]},"length":{"type":"int","required":false},"log":{"type":"str","required":'
+    'false,"choices":["enable","disable"]},"severity":{"type":"str","required":false,"choices":["high","medium","low"]}}},"max_cookie":{"type":"dict","requ'
+    'ired":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"action":{"type":"str","required":false,"choices":["all'
+    'ow","block"]},"max_cookie":{"type":"int","required":false},"severity":{"type":"str","required":false,"choices":["high","medium","low"]},"log":{"type":'
+    '"str","required":false,"choices":["enable","disable"]}}},"param_length":{"type":"dict","required":false,"options":{"status":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"action":{"type":"str","required":false,"choices":["allow","block"]},"length":{"type":"int","required":false},"lo'
+    'g":{"type":"str","required":false,"choices":["enable","disable"]},"severity":{"type":"str","required":false,"choices":["high","medium","low"]}}},"max_'
+    'url_param":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"action":{"type":"str","'
+    'required":false,"choices":["allow","block"]},"log":{"type":"str","required":false,"choices":["enable","disable"]},"severity":{"type":"str","required":'
+    'false,"choices":["high","medium","low"]},"max_url_param":{"type":"int","required":false}}},"hostname":{"type":"dict","required":false,"options":{"stat'
+    'us":{"type":"str","required":false,"choices":["enable","disable"]},"action":{"type":"str","required":false,"choices":["allow","block"]},"log":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"severity":{"type":"str","required":false,"choices":["high","medium","low"]}}},"url_param_lengt'
+    'h":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"action":{"type":"str","required'
+    '":false,"choices":["allow","block"]},"length":{"type":"int","required":false},"log":{"type":"str","required":false,"choices":["enable","disable"]},"se'
+    'verity":{"type":"str","required":false,"choices":["high","medium","low"]}}},"malformed":{"type":"dict","required":false,"options":{"status":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"action":{"type":"str","required":false,"choices":["allow","block"]},"log":{"type":"str","require'
+    'd":false,"choices":["enable","disable"]},"severity":{"type":"str","required":false,"choices":["high","medium","low"]}}},"max_range_segment":{"type":"d'
+    'ict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"action":{"type":"str","required":false,"choi'
+    'ces":["allow","block"]},"max_range_segment":{"type":"int","required":false},"log":{"type":"str","required":false,"choices":["enable","disable"]},"seve'
+    'rity":{"type":"str","required":false,"choices":["high","medium","low"]}}},"version":{"type":"dict","required":false,"options":{"status":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]},"action":{"type":"str","required":false,"choices":["allow","block"]},"log":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"severity":{"type":"str","required":false,"choices":["high","medium","low"]}}},"max_header_line":{"type":"dict","'
+    'required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"action":{"type":"str","required":false,"choices":['
+    '"allow","block"]},"max_header_line":{"type":"int","required":false},"log":{"type":"str","required":false,"choices":["enable","disable"]},"severity":{"'
+    'type":"str","required":false,"choices":["high","medium","low"]}}},"method":{"type":"dict","required":false,"options":{"status":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"action":{"type":"str","required":false,"choices":["allow","block"]},"log":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]},"severity":{"type":"str","required":false,"choices":["high","medium","low"]}}},"line_length":{"type":"dict","required":fal'
+    'se,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"action":{"type":"str","required":false,"choices":["allow","bloc'
+    'k"]},"length":{"type":"int","required":false},"log":{"type":"str","required":false,"choices":["enable","disable"]},"severity":{"type":"str","required"'
+    ':false,"choices":["high","medium","low"]}}}}},"extended_log":{"type":"str","required":false,"choices":["enable","disable"]},"url_access":{"type":"list'
+    '","required":false,"options":{"severity":{"type":"str","required":false,"choices":["high","medium","low"]},"access_pattern":{"type":"list","required":'
+    'false,"options":{"srcaddr":{"type":"str","required":false},"pattern":{"type":"str","required":false},"id":{"type":"int","required":false},"negate":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"regex":{"type":"str","required":false,"choices":["enable","disable"]}}},"address":{"type"'
+    ':"str","required":false},"action":{"type":"str","required":false,"choices":["bypass","permit","block"]},"id":{"type":"int","required":false},"log":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]}}},"external":{"type":"str","required":false,"choices":["disable","enable"]},"signature":{"'
+    'type":"dict","required":false,"options":{"main_class":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"action":{"type":"str","required":false,"choices":["allow","block","erase"]},"log":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"severity":{"type":"str","required":false,"choices":["high","medium","low"]},"id":{"type":"int","required":false}}},"disabled_sub_class'
+    '":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"custom_signature":{"type":"list","required":false,"options":{"sta'
+    'tus":{"type":"str","required":false,"choices":["enable","disable"]},"direction":{"type":"str","required":false,"choices":["request","response"]},"log"'
+    ':{"type":"str","required":false,"choices":["enable","disable"]},"pattern":{"type":"str","required":false},"name":{"type":"str","required":false},"case'
+    '_sensitivity":{"type":"str","required":false,"choices":["disable","enable"]},"target":{"type":"list","required":false,"choices":["arg","arg-name","req'
+    '-body","req-cookie","req-cookie-name","req-filename","req-header","req-header-name","req-raw-uri","req-uri","resp-body","resp-hdr","resp-status"]},"ac'
+    'tion":{"type":"str","required":false,"choices":["allow","block","erase"]},"severity":{"type":"str","required":false,"choices":["high","medium","low"]}'
+    '}},"disabled_signature":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"credit_card_detection_threshold":{"type":"i'
+    'nt","required":false}}},"method":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"m'
+    'ethod_policy":{"type":"list","required":false,"options":{"regex":{"type":"str","required":false,"choices":["enable","disable"]},"pattern":{"type":"str'
+    '","required":false},"allowed_methods":{"type":"list","required":false,"choices":["get","post","put","head","connect","trace","options","delete","other'
+    's"]},"id":{"type":"int","required":false},"address":{"type":"str","required":false}}},"default_allowed_methods":{"type":"list","required":false,"choic'
+    'es":["get","post","put","head","connect","trace","options","delete","others"]},"severity":{"type":"str","required":false,"choices":["high","medium","l'
+    'ow"]},"log":{"type":"str","required":false,"choices":["enable","disable"]}}},"address_list":{"type":"dict","required":false,"options":{"status":{"type'
+    '":"str","required":false,"choices":["enable","disable"]},"blocked_log":{"type":"str","required":false,"choices":["enable","disable"]},"trusted_address'
+    '":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"severity":{"type":"str","required":false,"choices":["high","med'
+    'ium","low"]},"blocked_address":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}}}}}'
+)
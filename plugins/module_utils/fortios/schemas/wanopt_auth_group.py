@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"psk":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"cert":{"type":"string","r'
+    'evisions":[2047,2047]},"peer":{"type":"string","revisions":[2047,2047]},"peer_accept":{"type":"string","options":[{"value":"any","revisions":[2047,204'
+    '7]},{"value":"defined","revisions":[2047,2047]},{"value":"one","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_method":{"type":"string","opti'
+    'ons":[{"value":"cert","revisions":[2047,2047]},{"value":"psk","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"psk":{"type":"str","required":false},"name":{"type":"str","required":false},"cert":{"type":"str","required'
+    '":false},"peer":{"type":"str","required":false},"peer_accept":{"type":"str","required":false,"choices":["any","defined","one"]},"auth_method":{"type":'
+    '"str","required":false,"choices":["cert","psk"]}}}'
+)
@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"acceptable_connections":{"type":"string","options":[{"value":"any","revisions":[2047,2047]},{"value":"peers","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"collaboration":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"src_peer":{"type":"list","children":{"priority":{"type":"integer","revisions":[2047,2047]},"auth_type":{'
+    '"type":"integer","revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"encode_type":{"type":"integer","revisions":[2047,2047]},"dev'
+    'ice_id":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"dst_peer":{"type":"list","children":{"priority":{"type":"integer","revisi'
+    'ons":[2047,2047]},"auth_type":{"type":"integer","revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"encode_type":{"type":"integer'
+    '","revisions":[2047,2047]},"device_id":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"prefer_scenario":{"type":"string","options'
+    '":[{"value":"balance","revisions":[2047,2047]},{"value":"prefer-speed","revisions":[2047,2047]},{"value":"prefer-cache","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"device_id":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"acceptable_connections":{"type":"str","required":false,"choices":["any","peers"]},"collaboration":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"src_peer":{"type":"list","required":false,"options":{"priority":{"type":"int","required":false'
+    '},"auth_type":{"type":"int","required":false},"ip":{"type":"str","required":false},"encode_type":{"type":"int","required":false},"device_id":{"type":"'
+    'str","required":false}}},"dst_peer":{"type":"list","required":false,"options":{"priority":{"type":"int","required":false},"auth_type":{"type":"int","r'
+    'equired":false},"ip":{"type":"str","required":false},"encode_type":{"type":"int","required":false},"device_id":{"type":"str","required":false}}},"pref'
+    'er_scenario":{"type":"str","required":false,"choices":["balance","prefer-speed","prefer-cache"]},"device_id":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,53 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"status":{"type":"string","options":[{"value":"enable","revisions":[204'
+    '7,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"response_cache_contro'
+    'l":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rules'
+    '":{"type":"list","children":{"skip_rule_mode":{"type":"string","options":[{"value":"all","revisions":[2047,2047]},{"value":"any","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"content_id":{"type":"dict","children":{"start_direction":{"type":"string","options":[{"value":"forward","revisions":[20'
+    '47,2047]},{"value":"backward","revisions":[2047,2047]}],"revisions":[2047,2047]},"start_skip":{"type":"integer","revisions":[2047,2047]},"end_directio'
+    'n":{"type":"string","options":[{"value":"forward","revisions":[2047,2047]},{"value":"backward","revisions":[2047,2047]}],"revisions":[2047,2047]},"end'
+    '_str":{"type":"string","revisions":[2047,2047]},"range_str":{"type":"string","revisions":[2047,2047]},"start_str":{"type":"string","revisions":[2047,2'
+    '047]},"target":{"type":"string","options":[{"value":"path","revisions":[2047,2047]},{"value":"parameter","revisions":[2047,2047]},{"value":"referrer",'
+    '"revisions":[2047,2047]},{"value":"youtube-map","revisions":[2047,2047]},{"value":"youtube-id","revisions":[2047,2047]},{"value":"youku-id","revisions'
+    '":[2047,2047]},{"value":"hls-manifest","revisions":[2047,2047]},{"value":"dash-manifest","revisions":[2047,2047]},{"value":"hls-fragment","revisions":'
+    '[2047,2047]},{"value":"dash-fragment","revisions":[2047,2047]}],"revisions":[2047,2047]},"end_skip":{"type":"integer","revisions":[2047,2047]}},"revis'
+    'ions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"match_mode":{"type":"string","options":[{"value":"all","revisions":[2047,2047]},{'
+    '"value":"any","revisions":[2047,2047]}],"revisions":[2047,2047]},"skip_entries":{"type":"list","children":{"pattern":{"type":"list","children":{"strin'
+    'g":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"target":{"type":"string","opti'
+    'ons":[{"value":"path","revisions":[2047,2047]},{"value":"parameter","revisions":[2047,2047]},{"value":"referrer","revisions":[2047,2047]},{"value":"yo'
+    'utube-map","revisions":[2047,2047]},{"value":"youtube-id","revisions":[2047,2047]},{"value":"youku-id","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]}},"revisions":[2047,2047]},"match_entries":{"type":"list","children":{"pattern":{"type":"list","children":{"string":{"type":"string","revisions":[2'
+    '047,2047]}},"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"target":{"type":"string","options":[{"value":"path","revisions":'
+    '[2047,2047]},{"value":"parameter","revisions":[2047,2047]},{"value":"referrer","revisions":[2047,2047]},{"value":"youtube-map","revisions":[2047,2047]'
+    '},{"value":"youtube-id","revisions":[2047,2047]},{"value":"youku-id","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}},"re'
+    'visions":[2047,2047]},"text_response_vcache":{"type":"string","options":[{"value":"enable","revisions":[23,23]},{"value":"disable","revisions":[23,23]'
+    '}],"revisions":[2047,23]},"host_domain_name_suffix":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,204'
+    '7]},"category":{"type":"string","options":[{"value":"vcache","revisions":[2047,2047]},{"value":"youtube","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"response_expires":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"updateserver":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"request_cache_control":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"status":{"type":"str","required":false,"choices":["enable","disa'
+    'ble"]},"name":{"type":"str","required":false},"response_cache_control":{"type":"str","required":false,"choices":["enable","disable"]},"rules":{"type":'
+    '"list","required":false,"options":{"skip_rule_mode":{"type":"str","required":false,"choices":["all","any"]},"content_id":{"type":"dict","required":fal'
+    'se,"options":{"start_direction":{"type":"str","required":false,"choices":["forward","backward"]},"start_skip":{"type":"int","required":false},"end_dir'
+    'ection":{"type":"str","required":false,"choices":["forward","backward"]},"end_str":{"type":"str","required":false},"range_str":{"type":"str","required'
+    '":false},"start_str":{"type":"str","required":false},"target":{"type":"str","required":false,"choices":["path","parameter","referrer","youtube-map","y'
+    'outube-id","youku-id","hls-manifest","dash-manifest","hls-fragment","dash-fragment"]},"end_skip":{"type":"int","required":false}}},"name":{"type":"str'
+    '","required":false},"match_mode":{"type":"str","required":false,"choices":["all","any"]},"skip_entries":{"type":"list","required":false,"options":{"pa'
+    'ttern":{"type":"list","required":false,"options":{"string":{"type":"str","required":false}}},"id":{"type":"int","required":false},"target":{"type":"st'
+    'r","required":false,"choices":["path","parameter","referrer","youtube-map","youtube-id","youku-id"]}}},"match_entries":{"type":"list","required":false'
+    ',"options":{"pattern":{"type":"list","required":false,"options":{"string":{"type":"str","required":false}}},"id":{"type":"int","required":false},"targ'
+    'et":{"type":"str","required":false,"choices":["path","parameter","referrer","youtube-map","youtube-id","youku-id"]}}}}},"text_response_vcache":{"type"'
+    ':"str","required":false},"host_domain_name_suffix":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"category":{"ty'
+    'pe":"str","required":false,"choices":["vcache","youtube"]},"response_expires":{"type":"str","required":false,"choices":["enable","disable"]},"updatese'
+    'rver":{"type":"str","required":false,"choices":["enable","disable"]},"request_cache_control":{"type":"str","required":false,"choices":["enable","disab'
+    'le"]}}}'
+)
@@ -0,0 +1,12 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ip":{"type":"string","revisions":[2047,2047]},"peer_host_id":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,'
+    '2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ip":{"type":"str","required":false},"peer_host_id":{"type":"str","required":false}}}'
+)
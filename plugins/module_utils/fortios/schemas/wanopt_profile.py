@@ -0,0 +1,81 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ftp":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"'
+    'disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"protocol_opt":{"type":"string","options":[{"value":"protocol","revisions":[1920,1920]},{"'
+    'value":"tcp","revisions":[1920,1920]}],"revisions":[1920,1920]},"prefer_chunking":{"type":"string","options":[{"value":"dynamic","revisions":[2047,204'
+    '7]},{"value":"fix","revisions":[2047,2047]}],"revisions":[2047,2047]},"byte_caching":{"type":"string","options":[{"value":"enable","revisions":[2047,2'
+    '047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssl":{"type":"string","options":[{"value":"enable","revisions":[1920,1920'
+    ']},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"tunnel_sharing":{"type":"string","options":[{"value":"private","revisions":['
+    '2047,2047]},{"value":"shared","revisions":[2047,2047]},{"value":"express-shared","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_traffic":{"ty'
+    'pe":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"secure_tunne'
+    'l":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"port"'
+    ':{"type":"integer","revisions":[2047,127]}},"revisions":[2047,2047]},"auth_group":{"type":"string","revisions":[2047,2047]},"cifs":{"type":"dict","chi'
+    'ldren":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"protocol_opt":{"type":"string","options":[{"value":"protocol","revisions":[1920,1920]},{"value":"tcp","revisions":[1920,1920]}],"revisions":['
+    '1920,1920]},"prefer_chunking":{"type":"string","options":[{"value":"dynamic","revisions":[2047,2047]},{"value":"fix","revisions":[2047,2047]}],"revisi'
+    'ons":[2047,2047]},"byte_caching":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"tunnel_sharing":{"type":"string","options":[{"value":"private","revisions":[2047,2047]},{"value":"shared","revisions":[2047,2'
+    '047]},{"value":"express-shared","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_traffic":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"secure_tunnel":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"port":{"type":"integer","revisions":[2047,127]}},"revi'
+    'sions":[2047,2047]},"mapi":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disabl'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"byte_caching":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"'
+    'disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"tunnel_sharing":{"type":"string","options":[{"value":"private","revisions":[2047,2047]},{'
+    '"value":"shared","revisions":[2047,2047]},{"value":"express-shared","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_traffic":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"secure_tunnel":{"type":"s'
+    'tring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"port":{"type":"int'
+    'eger","revisions":[2047,127]}},"revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},"tcp":{"type":"dict","children":{"status"'
+    ':{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"byte_ca'
+    'ching_opt":{"type":"string","options":[{"value":"mem-only","revisions":[2047,2047]},{"value":"mem-disk","revisions":[2047,2047]}],"revisions":[2047,20'
+    '47]},"byte_caching":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"ssl":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"ssl_port":{"type":"integer","revisions":[2047,2047]},"tunnel_sharing":{"type":"string","options":[{"value":"private","revisions":[2047,2047]}'
+    ',{"value":"shared","revisions":[2047,2047]},{"value":"express-shared","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_traffic":{"type":"string'
+    '","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"secure_tunnel":{"type":'
+    '"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"port":{"type":"s'
+    'tring","revisions":[2047,2047]}},"revisions":[2047,2047]},"http":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","re'
+    'visions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"unknown_http_version":{"type":"string","options":[{"value'
+    '":"reject","revisions":[127,127]},{"value":"tunnel","revisions":[127,127]},{"value":"best-effort","revisions":[127,127]}],"revisions":[2047,127]},"pro'
+    'tocol_opt":{"type":"string","options":[{"value":"protocol","revisions":[1920,1920]},{"value":"tcp","revisions":[1920,1920]}],"revisions":[1920,1920]},'
+    '"prefer_chunking":{"type":"string","options":[{"value":"dynamic","revisions":[2047,2047]},{"value":"fix","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"tunnel_non_http":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2'
+    '047,127]},"byte_caching":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"ssl":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"ssl_port":{"type":"integer","revisions":[2047,127]},"tunnel_sharing":{"type":"string","options":[{"value":"private","revisions":[2047,20'
+    '47]},{"value":"shared","revisions":[2047,2047]},{"value":"express-shared","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_traffic":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"secure_tunnel":{"ty'
+    'pe":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"port":{"type'
+    '":"integer","revisions":[2047,127]}},"revisions":[2047,2047]},"transparent":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"v'
+    'alue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ftp":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"protocol_opt":{"type":"str","required":false,"choices":["protocol","tcp"]},"prefer_chunking":{"type":"str","required":false,"choices":['
+    '"dynamic","fix"]},"byte_caching":{"type":"str","required":false,"choices":["enable","disable"]},"ssl":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"tunnel_sharing":{"type":"str","required":false,"choices":["private","shared","express-shared"]},"log_traffic":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]},"secure_tunnel":{"type":"str","required":false,"choices":["enable","disable"]},"port":{"type":"int","required":'
+    'false}}},"auth_group":{"type":"str","required":false},"cifs":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"protocol_opt":{"type":"str","required":false,"choices":["protocol","tcp"]},"prefer_chunking":{"type":"str","required":false'
+    ',"choices":["dynamic","fix"]},"byte_caching":{"type":"str","required":false,"choices":["enable","disable"]},"tunnel_sharing":{"type":"str","required":'
+    'false,"choices":["private","shared","express-shared"]},"log_traffic":{"type":"str","required":false,"choices":["enable","disable"]},"secure_tunnel":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"port":{"type":"int","required":false}}},"mapi":{"type":"dict","required":false,"options"'
+    ':{"status":{"type":"str","required":false,"choices":["enable","disable"]},"byte_caching":{"type":"str","required":false,"choices":["enable","disable"]'
+    '},"tunnel_sharing":{"type":"str","required":false,"choices":["private","shared","express-shared"]},"log_traffic":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"secure_tunnel":{"type":"str","required":false,"choices":["enable","disable"]},"port":{"type":"int","required":false}}},"com'
+    'ments":{"type":"str","required":false},"tcp":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","d'
+    'isable"]},"byte_caching_opt":{"type":"str","required":false,"choices":["mem-only","mem-disk"]},"byte_caching":{"type":"str","required":false,"choices"'
+    ':["enable","disable"]},"ssl":{"type":"str","required":false,"choices":["enable","disable"]},"ssl_port":{"type":"int","required":false},"tunnel_sharing'
+    '":{"type":"str","required":false,"choices":["private","shared","express-shared"]},"log_traffic":{"type":"str","required":false,"choices":["enable","di'
+    'sable"]},"secure_tunnel":{"type":"str","required":false,"choices":["enable","disable"]},"port":{"type":"str","required":false}}},"http":{"type":"dict"'
+    ',"required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"unknown_http_version":{"type":"str","required":f'
+    'alse},"protocol_opt":{"type":"str","required":false,"choices":["protocol","tcp"]},"prefer_chunking":{"type":"str","required":false,"choices":["dynamic'
+    '","fix"]},"tunnel_non_http":{"type":"str","required":false},"byte_caching":{"type":"str","required":false,"choices":["enable","disable"]},"ssl":{"type'
+    '":"str","required":false,"choices":["enable","disable"]},"ssl_port":{"type":"int","required":false},"tunnel_sharing":{"type":"str","required":false,"c'
+    'hoices":["private","shared","express-shared"]},"log_traffic":{"type":"str","required":false,"choices":["enable","disable"]},"secure_tunnel":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"port":{"type":"int","required":false}}},"transparent":{"type":"str","required":false,"choices":['
+    '"enable","disable"]},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"remote_cache_id":{"type":"string","revisions":[2047,2047]},"local_cache_id":{"type":"string","revisions":[2047,2047]},"rem'
+    'ote_cache_ip":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["disable","enable"]},"remote_cache_id":{"type":"str","re'
+    'quired":false},"local_cache_id":{"type":"str","required":false},"remote_cache_ip":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"host_id":{"type":"string","revisions":[2047,2047]},"auto_detect_algorithm":{"type":"string","options":[{"value":"simple","'
+    'revisions":[2047,2047]},{"value":"diff-req-resp","revisions":[2047,2047]}],"revisions":[2047,2047]},"tunnel_ssl_algorithm":{"type":"string","options":'
+    '[{"value":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    '},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"host_id":{"type":"str","required":false},"auto_detect_algorithm":{"type":"str","required":false,"choices":'
+    '["simple","diff-req-resp"]},"tunnel_ssl_algorithm":{"type":"str","required":false,"choices":["high","medium","low"]}}}'
+)
@@ -0,0 +1,32 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"fresh_factor":{"type":"integer","revisions":[2047,2047]},"default_ttl":{"type":"integer","revisions":[2047,2047]},"cache_b'
+    'y_default":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"reval_pnc":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,20'
+    '47]},"max_ttl":{"type":"integer","revisions":[2047,2047]},"cache_cookie":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"valu'
+    'e":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"neg_resp_time":{"type":"integer","revisions":[2047,2047]},"ignore_conditional":{"type'
+    '":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"cache_expired"'
+    ':{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"min_ttl'
+    '":{"type":"integer","revisions":[2047,2047]},"external":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"always_revalidate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"di'
+    'sable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ignore_pnc":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value"'
+    ':"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ignore_ie_reload":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]'
+    '},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_object_size":{"type":"integer","revisions":[2047,2047]},"ignore_ims":{"ty'
+    'pe":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"host_validat'
+    'e":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revi'
+    'sions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"fresh_factor":{"type":"int","required":false},"default_ttl":{"type":"int","required":false},"cache_by_defa'
+    'ult":{"type":"str","required":false,"choices":["enable","disable"]},"reval_pnc":{"type":"str","required":false,"choices":["enable","disable"]},"max_tt'
+    'l":{"type":"int","required":false},"cache_cookie":{"type":"str","required":false,"choices":["enable","disable"]},"neg_resp_time":{"type":"int","requir'
+    'ed":false},"ignore_conditional":{"type":"str","required":false,"choices":["enable","disable"]},"cache_expired":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"min_ttl":{"type":"int","required":false},"external":{"type":"str","required":false,"choices":["enable","disable"]},"always_re'
+    'validate":{"type":"str","required":false,"choices":["enable","disable"]},"ignore_pnc":{"type":"str","required":false,"choices":["enable","disable"]},"'
+    'ignore_ie_reload":{"type":"str","required":false,"choices":["enable","disable"]},"max_object_size":{"type":"int","required":false},"ignore_ims":{"type'
+    '":"str","required":false,"choices":["enable","disable"]},"host_validate":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
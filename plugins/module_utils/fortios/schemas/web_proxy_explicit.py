@@ -0,0 +1,50 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"pac_file_server_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"outgoing_ip":{"type":"string","revisions":[2047,2047]},"socks":{"type":"string","options":[{"value":"enabl'
+    'e","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"outgoing_ip6":{"type":"string","revisions":[2047,20'
+    '47]},"incoming_ip":{"type":"string","revisions":[2047,2047]},"pac_policy":{"type":"list","children":{"status":{"type":"string","options":[{"value":"en'
+    'able","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"srcaddr":{"type":"list","children":{"name":{"typ'
+    'e":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"dstaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},'
+    '"revisions":[2047,2047]},"pac_file_data":{"type":"string","revisions":[2047,2047]},"comments":{"type":"string","revisions":[2047,2047]},"pac_file_name'
+    '":{"type":"string","revisions":[2047,2047]},"policyid":{"type":"integer","revisions":[2047,2047]},"srcaddr6":{"type":"list","children":{"name":{"type"'
+    ':"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]},"ftp_incoming_port":{"type":"string","revisions":[2047,2047]},"'
+    'unknown_http_version":{"type":"string","options":[{"value":"reject","revisions":[2047,2047]},{"value":"best-effort","revisions":[2047,2047]},{"value":'
+    '"tunnel","revisions":[1920,1920]}],"revisions":[2047,2047]},"sec_default_action":{"type":"string","options":[{"value":"accept","revisions":[2047,2047]'
+    '},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"realm":{"type":"string","revisions":[2047,2047]},"ssl_algorithm":{"type":"string'
+    '","options":[{"value":"high","revisions":[2047,2047]},{"value":"medium","revisions":[2047,2047]},{"value":"low","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"trace_auth_no_rsp":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"pac_file_name":{"type":"string","revisions":[2047,2047]},"status":{"type":"string","options":[{"value":"enable","revisions":['
+    '2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"strict_guest":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"https_replacement_message":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"https_incoming_port":{"type":"string","rev'
+    'isions":[2047,2047]},"ipv6_status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"socks_incoming_port":{"type":"string","revisions":[2047,2047]},"message_upon_server_error":{"type":"string","options":[{"va'
+    'lue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pref_dns_result":{"type":"string","optio'
+    'ns":[{"value":"ipv4","revisions":[2047,2047]},{"value":"ipv6","revisions":[2047,2047]}],"revisions":[2047,2047]},"pac_file_data":{"type":"string","rev'
+    'isions":[2047,2047]},"incoming_ip6":{"type":"string","revisions":[2047,2047]},"ftp_over_http":{"type":"string","options":[{"value":"enable","revisions'
+    '":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"http_incoming_port":{"type":"string","revisions":[2047,2047]},"p'
+    'ac_file_url":{"type":"string","revisions":[2047,2047]},"pac_file_server_port":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"pac_file_server_status":{"type":"str","required":false,"choices":["enable","disable"]},"outgoing_ip":{"typ'
+    'e":"str","required":false},"socks":{"type":"str","required":false,"choices":["enable","disable"]},"outgoing_ip6":{"type":"str","required":false},"inco'
+    'ming_ip":{"type":"str","required":false},"pac_policy":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"srcaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"dstaddr":{"type":"list","required":f'
+    'alse,"options":{"name":{"type":"str","required":false}}},"pac_file_data":{"type":"str","required":false},"comments":{"type":"str","required":false},"p'
+    'ac_file_name":{"type":"str","required":false},"policyid":{"type":"int","required":false},"srcaddr6":{"type":"list","required":false,"options":{"name":'
+    '{"type":"str","required":false}}}}},"ftp_incoming_port":{"type":"str","required":false},"unknown_http_version":{"type":"str","required":false},"sec_de'
+    'fault_action":{"type":"str","required":false,"choices":["accept","deny"]},"realm":{"type":"str","required":false},"ssl_algorithm":{"type":"str","requi'
+    'red":false,"choices":["high","medium","low"]},"trace_auth_no_rsp":{"type":"str","required":false,"choices":["enable","disable"]},"pac_file_name":{"typ'
+    'e":"str","required":false},"status":{"type":"str","required":false,"choices":["enable","disable"]},"strict_guest":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"https_replacement_message":{"type":"str","required":false,"choices":["enable","disable"]},"https_incoming_port":{"type":"s'
+    'tr","required":false},"ipv6_status":{"type":"str","required":false,"choices":["enable","disable"]},"socks_incoming_port":{"type":"str","required":fals'
+    'e},"message_upon_server_error":{"type":"str","required":false,"choices":["enable","disable"]},"pref_dns_result":{"type":"str","required":false,"choice'
+    's":["ipv4","ipv6"]},"pac_file_data":{"type":"str","required":false},"incoming_ip6":{"type":"str","required":false},"ftp_over_http":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"http_incoming_port":{"type":"str","required":false},"pac_file_url":{"type":"str","required":false},"pac_f'
+    'ile_server_port":{"type":"str","required":false}}}'
+)
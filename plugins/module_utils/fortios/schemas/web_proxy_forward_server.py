@@ -0,0 +1,20 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"username":{"type":"string","revisions":[1920,1920]},"name":{"type":"st'
+    'ring","revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"fqdn":{"type":"string","revisions":[2047,2047]},"port":{"type":"integer'
+    '","revisions":[2047,2047]},"healthcheck":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"password":{"type":"string","revisions":[1920,1920]},"addr_type":{"type":"string","options":[{"value":"ip","revisions"'
+    ':[2047,2047]},{"value":"fqdn","revisions":[2047,2047]}],"revisions":[2047,2047]},"server_down_option":{"type":"string","options":[{"value":"block","re'
+    'visions":[2047,2047]},{"value":"pass","revisions":[2047,2047]}],"revisions":[2047,2047]},"monitor":{"type":"string","revisions":[2047,2047]}},"revisio'
+    'ns":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"username":{"type":"str","required":false},"name":{"type":"str","'
+    'required":false},"ip":{"type":"str","required":false},"fqdn":{"type":"str","required":false},"port":{"type":"int","required":false},"healthcheck":{"ty'
+    'pe":"str","required":false,"choices":["disable","enable"]},"password":{"type":"str","required":false},"addr_type":{"type":"str","required":false,"choi'
+    'ces":["ip","fqdn"]},"server_down_option":{"type":"str","required":false,"choices":["block","pass"]},"monitor":{"type":"str","required":false}}}'
+)
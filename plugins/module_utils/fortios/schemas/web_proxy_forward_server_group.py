@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ldb_method":{"type":"string","options":[{"value":"weighted","revisions":[2047,2047]},{"value":"least-session","revisions":'
+    '[2047,2047]},{"value":"active-passive","revisions":[2040,2040]}],"revisions":[2047,2047]},"affinity":{"type":"string","options":[{"value":"enable","re'
+    'visions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"group_do'
+    'wn_option":{"type":"string","options":[{"value":"block","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]}],"revisions":[2047,2047]},"s'
+    'erver_list":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"weight":{"type":"integer","revisions":[2047,2047]}},"revision'
+    's":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ldb_method":{"type":"str","required":false},"affinity":{"type":"str","required":false,"choices":["enable",'
+    '"disable"]},"name":{"type":"str","required":false},"group_down_option":{"type":"str","required":false,"choices":["block","pass"]},"server_list":{"type'
+    '":"list","required":false,"options":{"name":{"type":"str","required":false},"weight":{"type":"int","required":false}}}}}'
+)
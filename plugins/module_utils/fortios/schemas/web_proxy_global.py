@@ -0,0 +1,34 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"src_affinity_exempt_addr6":{"type":"string","revisions":[1024,1024]},"ssl_ca_cert":{"type":"string","revisions":[2040,2040'
+    ']},"ssl_cert":{"type":"string","revisions":[2040,2040]},"learn_client_ip_from_header":{"multiple_values":true,"type":"list","options":[{"value":"true-'
+    'client-ip","revisions":[2047,2047]},{"value":"x-real-ip","revisions":[2047,2047]},{"value":"x-forwarded-for","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"max_message_length":{"type":"integer","revisions":[2047,2047]},"webproxy_profile":{"type":"string","revisions":[2047,2047]},"src_affinity_e'
+    'xempt_addr":{"type":"string","revisions":[1024,1024]},"forward_server_affinity_timeout":{"type":"integer","revisions":[2047,2047]},"strict_web_check":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"tunnel_n'
+    'on_http":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"lear'
+    'n_client_ip":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,204'
+    '7]},"learn_client_ip_srcaddr6":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"forward_proxy_au'
+    'th":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"prox'
+    'y_fqdn":{"type":"string","revisions":[2047,2047]},"max_request_length":{"type":"integer","revisions":[2047,2047]},"fast_policy_match":{"type":"string"'
+    ',"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"learn_client_ip_srcaddr"'
+    ':{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"unknown_http_version":{"type":"string","option'
+    's":[{"value":"reject","revisions":[127,127]},{"value":"tunnel","revisions":[127,127]},{"value":"best-effort","revisions":[127,127]}],"revisions":[2047'
+    ',127]},"max_waf_body_cache_length":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"src_affinity_exempt_addr6":{"type":"str","required":false},"ssl_ca_cert":{"type":"str","required":false},"'
+    'ssl_cert":{"type":"str","required":false},"learn_client_ip_from_header":{"type":"list","required":false,"choices":["true-client-ip","x-real-ip","x-for'
+    'warded-for"]},"max_message_length":{"type":"int","required":false},"webproxy_profile":{"type":"str","required":false},"src_affinity_exempt_addr":{"typ'
+    'e":"str","required":false},"forward_server_affinity_timeout":{"type":"int","required":false},"strict_web_check":{"type":"str","required":false,"choice'
+    's":["enable","disable"]},"tunnel_non_http":{"type":"str","required":false},"learn_client_ip":{"type":"str","required":false,"choices":["enable","disab'
+    'le"]},"learn_client_ip_srcaddr6":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"forward_proxy_auth":{"type":"str'
+    '","required":false,"choices":["enable","disable"]},"proxy_fqdn":{"type":"str","required":false},"max_request_length":{"type":"int","required":false},"'
+    'fast_policy_match":{"type":"str","required":false,"choices":["enable","disable"]},"learn_client_ip_srcaddr":{"type":"list","required":false,"options":'
+    '{"name":{"type":"str","required":false}}},"unknown_http_version":{"type":"str","required":false},"max_waf_body_cache_length":{"type":"int","required":'
+    'false}}}'
+)
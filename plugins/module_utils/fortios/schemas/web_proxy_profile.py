@@ -0,0 +1,41 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"header_x_authenticated_groups":{"type":"string","options":[{"value":"pass","revisions":[2047,2047]},{"value":"add","revisi'
+    'ons":[2047,2047]},{"value":"remove","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"header_x_forw'
+    'arded_for":{"type":"string","options":[{"value":"pass","revisions":[2047,2047]},{"value":"add","revisions":[2047,2047]},{"value":"remove","revisions":'
+    '[2047,2047]}],"revisions":[2047,2047]},"header_x_authenticated_user":{"type":"string","options":[{"value":"pass","revisions":[2047,2047]},{"value":"ad'
+    'd","revisions":[2047,2047]},{"value":"remove","revisions":[2047,2047]}],"revisions":[2047,2047]},"log_header_change":{"type":"string","options":[{"val'
+    'ue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"header_client_ip":{"type":"string","optio'
+    'ns":[{"value":"pass","revisions":[2047,2047]},{"value":"add","revisions":[2047,2047]},{"value":"remove","revisions":[2047,2047]}],"revisions":[2047,20'
+    '47]},"strip_encoding":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"headers":{"type":"list","children":{"protocol":{"multiple_values":true,"type":"list","options":[{"value":"https","revisions":[2040,2040]'
+    '},{"value":"http","revisions":[2040,2040]}],"revisions":[2040,2040]},"name":{"type":"string","revisions":[2047,2047]},"base64_encoding":{"type":"strin'
+    'g","options":[{"value":"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"dstaddr6":{"type":"lis'
+    't","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"content":{"type":"string","revisions":[2047,2047]},"add_opt'
+    'ion":{"type":"string","options":[{"value":"append","revisions":[2040,2040]},{"value":"new-on-not-found","revisions":[2040,2040]},{"value":"new","revis'
+    'ions":[2040,2040]}],"revisions":[2040,2040]},"action":{"type":"string","options":[{"value":"add-to-request","revisions":[2047,2047]},{"value":"add-to-'
+    'response","revisions":[2047,2047]},{"value":"remove-from-request","revisions":[2047,2047]},{"value":"remove-from-response","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"dstaddr":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"id":{"type":"'
+    'integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"header_via_response":{"type":"string","options":[{"value":"pass","revisions":[2047,2047]}'
+    ',{"value":"add","revisions":[2047,2047]},{"value":"remove","revisions":[2047,2047]}],"revisions":[2047,2047]},"header_via_request":{"type":"string","o'
+    'ptions":[{"value":"pass","revisions":[2047,2047]},{"value":"add","revisions":[2047,2047]},{"value":"remove","revisions":[2047,2047]}],"revisions":[204'
+    '7,2047]},"header_front_end_https":{"type":"string","options":[{"value":"pass","revisions":[2047,2047]},{"value":"add","revisions":[2047,2047]},{"value'
+    '":"remove","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"header_x_authenticated_groups":{"type":"str","required":false,"choices":["pass","add","remove"]},"name":{"'
+    'type":"str","required":false},"header_x_forwarded_for":{"type":"str","required":false,"choices":["pass","add","remove"]},"header_x_authenticated_user"'
+    ':{"type":"str","required":false,"choices":["pass","add","remove"]},"log_header_change":{"type":"str","required":false,"choices":["enable","disable"]},'
+    '"header_client_ip":{"type":"str","required":false,"choices":["pass","add","remove"]},"strip_encoding":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"headers":{"type":"list","required":false,"options":{"protocol":{"type":"list","required":false,"choices":["https","http"]},"name":{"ty'
+    'pe":"str","required":false},"base64_encoding":{"type":"str","required":false,"choices":["disable","enable"]},"dstaddr6":{"type":"list","required":fals'
+    'e,"options":{"name":{"type":"str","required":false}}},"content":{"type":"str","required":false},"add_option":{"type":"str","required":false,"choices":'
+    '["append","new-on-not-found","new"]},"action":{"type":"str","required":false,"choices":["add-to-request","add-to-response","remove-from-request","remo'
+    've-from-response"]},"dstaddr":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"id":{"type":"int","required":false}'
+    '}},"header_via_response":{"type":"str","required":false,"choices":["pass","add","remove"]},"header_via_request":{"type":"str","required":false,"choice'
+    's":["pass","add","remove"]},"header_front_end_https":{"type":"str","required":false,"choices":["pass","add","remove"]}}}'
+)
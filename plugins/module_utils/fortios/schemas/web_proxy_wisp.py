@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"outgoing_ip":{"type":"string","revisions":[2047,2047]},"server_ip":{"t'
+    'ype":"string","revisions":[2047,2047]},"server_port":{"type":"integer","revisions":[2047,2047]},"timeout":{"type":"integer","revisions":[2047,2047]},"'
+    'max_connections":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"outgoing_ip":{"type":"str","required":false},"server_ip":{"type"'
+    ':"str","required":false},"server_port":{"type":"int","required":false},"timeout":{"type":"int","required":false},"max_connections":{"type":"int","requ'
+    'ired":false},"name":{"type":"str","required":false}}}'
+)
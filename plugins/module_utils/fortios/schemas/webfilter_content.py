@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"entries":{"type":"list","children":{"status":{"type":"string","options'
+    '":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"lang":{"type":"string","options":'
+    '[{"value":"western","revisions":[2047,2047]},{"value":"simch","revisions":[2047,2047]},{"value":"trach","revisions":[2047,2047]},{"value":"japanese","'
+    'revisions":[2047,2047]},{"value":"korean","revisions":[2047,2047]},{"value":"french","revisions":[2047,2047]},{"value":"thai","revisions":[2047,2047]}'
+    ',{"value":"spanish","revisions":[2047,2047]},{"value":"cyrillic","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions'
+    '":[2047,2047]},"pattern_type":{"type":"string","options":[{"value":"wildcard","revisions":[2047,2047]},{"value":"regexp","revisions":[2047,2047]}],"re'
+    'visions":[2047,2047]},"score":{"type":"integer","revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"block","revisions":[2047,2047]'
+    '},{"value":"exempt","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"name'
+    '":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"status":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"lang":{"type":"str","required":false,"choices":["western","simch","trach","japanese","kor'
+    'ean","french","thai","spanish","cyrillic"]},"name":{"type":"str","required":false},"pattern_type":{"type":"str","required":false,"choices":["wildcard"'
+    ',"regexp"]},"score":{"type":"int","required":false},"action":{"type":"str","required":false,"choices":["block","exempt"]}}},"id":{"type":"int","requir'
+    'ed":false},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,16 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"entries":{"type":"list","children":{"action":{"type":"string","options'
+    '":[{"value":"block","revisions":[2047,2047]},{"value":"allow","revisions":[2047,2047]},{"value":"exempt","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"pattern":{"type":"string","revisions":[2047,2047]},"category":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"id":{"type":'
+    '"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"entries":{"type":"list","required":false,"options":{"action":{"t'
+    'ype":"str","required":false,"choices":["block","allow","exempt"]},"pattern":{"type":"str","required":false},"category":{"type":"str","required":false}'
+    '}},"id":{"type":"int","required":false},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,24 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"cache_mode":{"type":"string","options":[{"value":"ttl","revisions":[2047,2047]},{"value":"db-ver","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"request_packet_size_limit":{"type":"integer","revisions":[2047,2047]},"ovrd_auth_port_https_flow":{"type":"integer","revis'
+    'ions":[2040,2040]},"ovrd_auth_https":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"warn_auth_https":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"close_ports":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"ovrd_auth_port_warning":{"type":"integer","revisions":[2047,2047]},"ovrd_auth_port_http":{"type":"integer",'
+    '"revisions":[2047,2047]},"ovrd_auth_port":{"type":"integer","revisions":[2047,23]},"cache_mem_percent":{"type":"integer","revisions":[2047,2047]},"ovr'
+    'd_auth_port_https":{"type":"integer","revisions":[2047,2047]},"cache_prefix_match":{"type":"string","options":[{"value":"enable","revisions":[2047,204'
+    '7]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"cache_mode":{"type":"str","required":false,"choices":["ttl","db-ver"]},"request_packet_size_limit":{"type"'
+    ':"int","required":false},"ovrd_auth_port_https_flow":{"type":"int","required":false},"ovrd_auth_https":{"type":"str","required":false,"choices":["enab'
+    'le","disable"]},"warn_auth_https":{"type":"str","required":false,"choices":["enable","disable"]},"close_ports":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"ovrd_auth_port_warning":{"type":"int","required":false},"ovrd_auth_port_http":{"type":"int","required":false},"ovrd_auth_port'
+    '":{"type":"int","required":false},"cache_mem_percent":{"type":"int","required":false},"ovrd_auth_port_https":{"type":"int","required":false},"cache_pr'
+    'efix_match":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"url":{"type":"string","revisions":[2047,2047]},"status":{"type":"string","options":[{"value":"enable","revisions":[2047,20'
+    '47]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"comment":{"type":"string","revisions":[1536,1536]},"rating":{"type":"strin'
+    'g","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"url":{"type":"str","required":false},"status":{"type":"str","required":false,"choices":["enable","disable"'
+    ']},"comment":{"type":"str","required":false},"rating":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,12 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"dns_retry_interval":{"type":"integer","revisions":[2047,2047]},"extended_ttl":{"type":"integer","revisions":[2047,2047]}},'
+    '"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"dns_retry_interval":{"type":"int","required":false},"extended_ttl":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"device":{"type":"string","revisions":[2047,2047]},"distance":{"type":"integer","revisions":[2047,2047]},"geo_filter":{"typ'
+    'e":"string","revisions":[2047,2047]},"gateway6":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"device":{"type":"str","required":false},"distance":{"type":"int","required":false},"geo_filter":{"type":"s'
+    'tr","required":false},"gateway6":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"initiator":{"type":"string","revisions":[2047,2047]},"ip":{"type":"string","revisions":[2047,2047]},"expires":{"type":"str'
+    'ing","revisions":[2047,2047]},"ip6":{"type":"string","revisions":[2047,2047]},"user":{"type":"string","revisions":[2047,2047]},"user_group":{"type":"s'
+    'tring","revisions":[2047,2047]},"scope":{"type":"string","options":[{"value":"user","revisions":[2047,2047]},{"value":"user-group","revisions":[2047,2'
+    '047]},{"value":"ip","revisions":[2047,2047]},{"value":"ip6","revisions":[2047,2047]}],"revisions":[2047,2047]},"old_profile":{"type":"string","revisio'
+    'ns":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"new_profile":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"initiator":{"type":"str","required'
+    '":false},"ip":{"type":"str","required":false},"expires":{"type":"str","required":false},"ip6":{"type":"str","required":false},"user":{"type":"str","re'
+    'quired":false},"user_group":{"type":"str","required":false},"scope":{"type":"str","required":false,"choices":["user","user-group","ip","ip6"]},"old_pr'
+    'ofile":{"type":"str","required":false},"id":{"type":"int","required":false},"new_profile":{"type":"str","required":false}}}'
+)
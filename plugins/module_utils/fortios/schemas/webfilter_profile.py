@@ -0,0 +1,183 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"feature_set":{"type":"string","options":[{"value":"flow","revisions":['
+    '1920,1920]},{"value":"proxy","revisions":[1920,1920]}],"revisions":[1920,1920]},"web_filter_referer_log":{"type":"string","options":[{"value":"enable"'
+    ',"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"web_filter_activex_log":{"type":"string","options":[{'
+    '"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"web_filter_jscript_log":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"replacemsg_group":{"t'
+    'ype":"string","revisions":[2047,2047]},"web_url_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisi'
+    'ons":[2047,2047]}],"revisions":[2047,2047]},"wisp_algorithm":{"type":"string","options":[{"value":"primary-secondary","revisions":[2047,2047]},{"value'
+    '":"round-robin","revisions":[2047,2047]},{"value":"auto-learning","revisions":[2047,2047]}],"revisions":[2047,2047]},"url_extraction":{"type":"dict","'
+    'children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2'
+    '047,2047]},"redirect_no_content":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"'
+    'revisions":[2047,2047]},"redirect_url":{"type":"string","revisions":[2047,2047]},"server_fqdn":{"type":"string","revisions":[2047,2047]},"redirect_hea'
+    'der":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,1023]},"web_filter_unknown_log":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ovrd_perm":{"multiple_values":true,"type":"list","options":['
+    '{"value":"bannedword-override","revisions":[2047,2047]},{"value":"urlfilter-override","revisions":[2047,2047]},{"value":"fortiguard-wf-override","revi'
+    'sions":[2047,2047]},{"value":"contenttype-check-override","revisions":[2047,2047]}],"revisions":[2047,2047]},"web_filter_applet_log":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"web_filter_cookie_removal'
+    '_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"we'
+    'b":{"type":"dict","children":{"bword_threshold":{"type":"integer","revisions":[2047,2047]},"blocklist":{"type":"string","options":[{"value":"enable","'
+    'revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"youtube_restrict":{"type":"string","options":[{"value":'
+    '"none","revisions":[1023,1023]},{"value":"strict","revisions":[1023,1023]},{"value":"moderate","revisions":[1023,1023]}],"revisions":[2047,1023]},"url'
+    'filter_table":{"type":"integer","revisions":[2047,2047]},"bword_table":{"type":"integer","revisions":[2047,2047]},"safe_search":{"multiple_values":tru'
+    'e,"type":"list","options":[{"value":"url","revisions":[2047,2047]},{"value":"header","revisions":[2047,2047]}],"revisions":[2047,2047]},"whitelist":{"'
+    'multiple_values":true,"type":"list","options":[{"value":"exempt-av","revisions":[1023,1023]},{"value":"exempt-webcontent","revisions":[1023,1023]},{"v'
+    'alue":"exempt-activex-java-cookie","revisions":[1023,1023]},{"value":"exempt-dlp","revisions":[1023,1023]},{"value":"exempt-rangeblock","revisions":[1'
+    '023,1023]},{"value":"extended-log-others","revisions":[1023,1023]}],"revisions":[2047,1023]},"content_header_list":{"type":"integer","revisions":[2047'
+    ',2047]},"allowlist":{"multiple_values":true,"type":"list","options":[{"value":"exempt-av","revisions":[1024,1024]},{"value":"exempt-webcontent","revis'
+    'ions":[1024,1024]},{"value":"exempt-activex-java-cookie","revisions":[1024,1024]},{"value":"exempt-dlp","revisions":[1024,1024]},{"value":"exempt-rang'
+    'eblock","revisions":[1024,1024]},{"value":"extended-log-others","revisions":[1024,1024]}],"revisions":[1024,1024]},"blacklist":{"type":"string","optio'
+    'ns":[{"value":"enable","revisions":[1023,1023]},{"value":"disable","revisions":[1023,1023]}],"revisions":[2047,1023]},"keyword_match":{"type":"list","'
+    'children":{"pattern":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"log_search":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"web_filter_js_log":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"web_filter_command_'
+    'block_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"extended_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"youtube_channel_status":{"type":"string","options":[{"value":"disable","revisions":[1023,1023]},{"value":"blacklist","revisions":[1023,1023]}'
+    ',{"value":"whitelist","revisions":[1023,1023]}],"revisions":[2047,1023]},"override":{"type":"dict","children":{"profile":{"type":"list","children":{"n'
+    'ame":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"ovrd_cookie":{"type":"string","options":[{"value":"allow","revisions":[2047,'
+    '2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"profile_type":{"type":"string","options":[{"value":"list","revisions":[2047'
+    ',2047]},{"value":"radius","revisions":[2047,2047]}],"revisions":[2047,2047]},"ovrd_dur":{"type":"string","revisions":[2047,2047]},"ovrd_dur_mode":{"ty'
+    'pe":"string","options":[{"value":"constant","revisions":[2047,2047]},{"value":"ask","revisions":[2047,2047]}],"revisions":[2047,2047]},"ovrd_user_grou'
+    'p":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"ovrd_scope":{"type":"string","options":[{"va'
+    'lue":"user","revisions":[2047,2047]},{"value":"user-group","revisions":[2047,2047]},{"value":"ip","revisions":[2047,2047]},{"value":"browser","revisio'
+    'ns":[2047,2047]},{"value":"ask","revisions":[2047,2047]}],"revisions":[2047,2047]},"profile_attribute":{"type":"string","options":[{"value":"User-Name'
+    '","revisions":[2047,2047]},{"value":"NAS-IP-Address","revisions":[2047,2047]},{"value":"Framed-IP-Address","revisions":[2047,2047]},{"value":"Framed-I'
+    'P-Netmask","revisions":[2047,2047]},{"value":"Filter-Id","revisions":[2047,2047]},{"value":"Login-IP-Host","revisions":[2047,2047]},{"value":"Reply-Me'
+    'ssage","revisions":[2047,2047]},{"value":"Callback-Number","revisions":[2047,2047]},{"value":"Callback-Id","revisions":[2047,2047]},{"value":"Framed-R'
+    'oute","revisions":[2047,2047]},{"value":"Framed-IPX-Network","revisions":[2047,2047]},{"value":"Class","revisions":[2047,2047]},{"value":"Called-Stati'
+    'on-Id","revisions":[2047,2047]},{"value":"Calling-Station-Id","revisions":[2047,2047]},{"value":"NAS-Identifier","revisions":[2047,2047]},{"value":"Pr'
+    'oxy-State","revisions":[2047,2047]},{"value":"Login-LAT-Service","revisions":[2047,2047]},{"value":"Login-LAT-Node","revisions":[2047,2047]},{"value":'
+    '"Login-LAT-Group","revisions":[2047,2047]},{"value":"Framed-AppleTalk-Zone","revisions":[2047,2047]},{"value":"Acct-Session-Id","revisions":[2047,2047'
+    ']},{"value":"Acct-Multi-Session-Id","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"web_filter_cookie_log":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"wisp_servers":{"type"'
+    ':"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"web_ftgd_quota_usage":{"type":"string","options":[{"va'
+    'lue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"web_content_log":{"type":"string","optio'
+    'ns":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"post_action":{"type":"string","'
+    'options":[{"value":"normal","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revisions":[2047,2047]},"web_ftgd_err_log":{"type":"s'
+    'tring","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"web_antiphishing_l'
+    'og":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"ftgd'
+    '_wf":{"type":"dict","children":{"rate_javascript_urls":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revi'
+    'sions":[2047,2047]}],"revisions":[2047,2047]},"filters":{"type":"list","children":{"category":{"type":"integer","revisions":[2047,2047]},"warning_dura'
+    'tion_type":{"type":"string","options":[{"value":"session","revisions":[2047,2047]},{"value":"timeout","revisions":[2047,2047]}],"revisions":[2047,2047'
+    ']},"log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"override_replacemsg":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"warning_prompt":{"type":"string","opt'
+    'ions":[{"value":"per-domain","revisions":[2047,2047]},{"value":"per-category","revisions":[2047,2047]}],"revisions":[2047,2047]},"action":{"type":"str'
+    'ing","options":[{"value":"block","revisions":[2047,2047]},{"value":"authenticate","revisions":[2047,2047]},{"value":"monitor","revisions":[2047,2047]}'
+    ',{"value":"warning","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_usr_grp":{"type":"list","children":{"name":{"type":"string","revisions":['
+    '2047,2047]}},"revisions":[2047,2047]},"warn_duration":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"max_quota_timeout":{"type":'
+    '"integer","revisions":[2047,2047]},"ovrd":{"type":"string","revisions":[2047,2047]},"quota":{"type":"list","children":{"category":{"type":"string","re'
+    'visions":[2047,2047]},"override_replacemsg":{"type":"string","revisions":[2047,2047]},"value":{"type":"integer","revisions":[2047,2047]},"duration":{"'
+    'type":"string","revisions":[2047,2047]},"type":{"type":"string","options":[{"value":"time","revisions":[2047,2047]},{"value":"traffic","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"unit":{"type":"string","options":[{"value":"B","revisions":[2047,'
+    '2047]},{"value":"KB","revisions":[2047,2047]},{"value":"MB","revisions":[2047,2047]},{"value":"GB","revisions":[2047,2047]}],"revisions":[2047,2047]}}'
+    ',"revisions":[2047,2047]},"rate_image_urls":{"type":"string","options":[{"value":"disable","revisions":[511,511]},{"value":"enable","revisions":[511,5'
+    '11]}],"revisions":[2047,511]},"exempt_quota":{"type":"string","revisions":[2047,2047]},"rate_css_urls":{"type":"string","options":[{"value":"disable",'
+    '"revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"options":{"multiple_values":true,"type":"list","options'
+    '":[{"value":"error-allow","revisions":[2047,2047]},{"value":"rate-server-ip","revisions":[2047,2047]},{"value":"connect-request-bypass","revisions":[2'
+    '047,2047]},{"value":"ftgd-disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rate_crl_urls":{"type":"string","options":[{"value":"disable","'
+    'revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"web_extended_all_action_log":{'
+    '"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"web_filte'
+    'r_vbs_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"antiphish":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions'
+    '":[1920,1920]}],"revisions":[1920,1920]},"check_uri":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisi'
+    'ons":[1920,1920]}],"revisions":[1920,1920]},"authentication":{"type":"string","options":[{"value":"domain-controller","revisions":[1024,1024]},{"value'
+    '":"ldap","revisions":[1024,1024]}],"revisions":[1024,1024]},"max_body_len":{"type":"integer","revisions":[1920,1920]},"custom_patterns":{"type":"list"'
+    ',"children":{"category":{"type":"string","options":[{"value":"username","revisions":[1920,1920]},{"value":"password","revisions":[1920,1920]}],"revisi'
+    'ons":[1920,1920]},"pattern":{"type":"string","revisions":[1920,1920]},"type":{"type":"string","options":[{"value":"regex","revisions":[1024,1024]},{"v'
+    'alue":"literal","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[1920,1920]},"check_basic_auth":{"type":"string","options":[{"value":"'
+    'enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"ldap":{"type":"string","revisions":[1024,1024]'
+    '},"default_action":{"type":"string","options":[{"value":"exempt","revisions":[1920,1920]},{"value":"log","revisions":[1920,1920]},{"value":"block","re'
+    'visions":[1920,1920]}],"revisions":[1920,1920]},"check_username_only":{"type":"string","options":[{"value":"enable","revisions":[1536,1536]},{"value":'
+    '"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"inspection_entries":{"type":"list","children":{"action":{"type":"string","options":[{"va'
+    'lue":"exempt","revisions":[1920,1920]},{"value":"log","revisions":[1920,1920]},{"value":"block","revisions":[1920,1920]}],"revisions":[1920,1920]},"fo'
+    'rtiguard_category":{"type":"string","revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"domain_contro'
+    'ller":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"web_invalid_domain_log":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"file_filte'
+    'r":{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}]'
+    ',"revisions":[120,120]},"scan_archive_contents":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[1'
+    '20,120]}],"revisions":[120,120]},"log":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}]'
+    ',"revisions":[120,120]},"entries":{"type":"list","children":{"comment":{"type":"string","revisions":[120,120]},"direction":{"type":"string","options":'
+    '[{"value":"incoming","revisions":[120,120]},{"value":"outgoing","revisions":[120,120]},{"value":"any","revisions":[120,120]}],"revisions":[120,120]},"'
+    'protocol":{"multiple_values":true,"type":"list","options":[{"value":"http","revisions":[120,120]},{"value":"ftp","revisions":[120,120]}],"revisions":['
+    '120,120]},"file_type":{"type":"list","children":{"name":{"type":"string","revisions":[120,120]}},"revisions":[120,120]},"password_protected":{"type":"'
+    'string","options":[{"value":"yes","revisions":[120,120]},{"value":"any","revisions":[120,120]}],"revisions":[120,120]},"filter":{"type":"string","revi'
+    'sions":[120,120]},"action":{"type":"string","options":[{"value":"log","revisions":[120,120]},{"value":"block","revisions":[120,120]}],"revisions":[120'
+    ',120]}},"revisions":[120,120]}},"revisions":[2040,120]},"wisp":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disabl'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"youtube_channel_filter":{"type":"list","children":{"comment":{"type":"string","revisions":[1023'
+    ',1023]},"channel_id":{"type":"string","revisions":[1023,1023]},"id":{"type":"integer","revisions":[1023,1023]}},"revisions":[2047,1023]},"https_replac'
+    'emsg":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"lo'
+    'g_all_url":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"options":{"multiple_values":true,"type":"list","options":[{"value":"activexfilter","revisions":[2047,2047]},{"value":"cookiefilter","revisions":[20'
+    '47,2047]},{"value":"javafilter","revisions":[2047,2047]},{"value":"block-invalid-url","revisions":[2047,2047]},{"value":"jscript","revisions":[2047,20'
+    '47]},{"value":"js","revisions":[2047,2047]},{"value":"vbs","revisions":[2047,2047]},{"value":"unknown","revisions":[2047,2047]},{"value":"intrinsic","'
+    'revisions":[2047,2047]},{"value":"wf-referer","revisions":[2047,2047]},{"value":"wf-cookie","revisions":[2047,2047]},{"value":"per-user-bwl","revision'
+    's":[2047,1023]},{"value":"per-user-bal","revisions":[1024,1024]}],"revisions":[2047,2047]},"inspection_mode":{"type":"string","options":[{"value":"pro'
+    'xy","revisions":[7,7]},{"value":"flow-based","revisions":[7,7]}],"revisions":[2047,7]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"feature_set":{"type":"str","required":false,"choices":["flow","p'
+    'roxy"]},"web_filter_referer_log":{"type":"str","required":false,"choices":["enable","disable"]},"web_filter_activex_log":{"type":"str","required":fals'
+    'e,"choices":["enable","disable"]},"web_filter_jscript_log":{"type":"str","required":false,"choices":["enable","disable"]},"replacemsg_group":{"type":"'
+    'str","required":false},"web_url_log":{"type":"str","required":false,"choices":["enable","disable"]},"wisp_algorithm":{"type":"str","required":false,"c'
+    'hoices":["primary-secondary","round-robin","auto-learning"]},"url_extraction":{"type":"dict","required":false,"options":{"status":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]},"redirect_no_content":{"type":"str","required":false,"choices":["enable","disable"]},"redirect_url":{"type"'
+    ':"str","required":false},"server_fqdn":{"type":"str","required":false},"redirect_header":{"type":"str","required":false}}},"web_filter_unknown_log":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"ovrd_perm":{"type":"list","required":false,"choices":["bannedword-override","urlfilter-o'
+    'verride","fortiguard-wf-override","contenttype-check-override"]},"web_filter_applet_log":{"type":"str","required":false,"choices":["enable","disable"]'
+    '},"web_filter_cookie_removal_log":{"type":"str","required":false,"choices":["enable","disable"]},"web":{"type":"dict","required":false,"options":{"bwo'
+    'rd_threshold":{"type":"int","required":false},"blocklist":{"type":"str","required":false,"choices":["enable","disable"]},"youtube_restrict":{"type":"s'
+    'tr","required":false},"urlfilter_table":{"type":"int","required":false},"bword_table":{"type":"int","required":false},"safe_search":{"type":"list","re'
+    'quired":false,"choices":["url","header"]},"whitelist":{"type":"list","required":false},"content_header_list":{"type":"int","required":false},"allowlis'
+    't":{"type":"list","required":false,"choices":["exempt-av","exempt-webcontent","exempt-activex-java-cookie","exempt-dlp","exempt-rangeblock","extended-'
+    'log-others"]},"blacklist":{"type":"str","required":false},"keyword_match":{"type":"list","required":false,"options":{"pattern":{"type":"str","required'
+    '":false}}},"log_search":{"type":"str","required":false,"choices":["enable","disable"]}}},"web_filter_js_log":{"type":"str","required":false,"choices":'
+    '["enable","disable"]},"web_filter_command_block_log":{"type":"str","required":false,"choices":["enable","disable"]},"extended_log":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"youtube_channel_status":{"type":"str","required":false},"override":{"type":"dict","required":false,"optio'
+    'ns":{"profile":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"ovrd_cookie":{"type":"str","required":false,"choic'
+    'es":["allow","deny"]},"profile_type":{"type":"str","required":false,"choices":["list","radius"]},"ovrd_dur":{"type":"str","required":false},"ovrd_dur_'
+    'mode":{"type":"str","required":false,"choices":["constant","ask"]},"ovrd_user_group":{"type":"list","required":false,"options":{"name":{"type":"str","'
+    'required":false}}},"ovrd_scope":{"type":"str","required":false,"choices":["user","user-group","ip","browser","ask"]},"profile_attribute":{"type":"str"'
+    ',"required":false,"choices":["User-Name","NAS-IP-Address","Framed-IP-Address","Framed-IP-Netmask","Filter-Id","Login-IP-Host","Reply-Message","Callbac'
+    'k-Number","Callback-Id","Framed-Route","Framed-IPX-Network","Class","Called-Station-Id","Calling-Station-Id","NAS-Identifier","Proxy-State","Login-LAT'
+    '-Service","Login-LAT-Node","Login-LAT-Group","Framed-AppleTalk-Zone","Acct-Session-Id","Acct-Multi-Session-Id"]}}},"web_filter_cookie_log":{"type":"st'
+    'r","required":false,"choices":["enable","disable"]},"wisp_servers":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}}'
+    ',"web_ftgd_quota_usage":{"type":"str","required":false,"choices":["enable","disable"]},"web_content_log":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"post_action":{"type":"str","required":false,"choices":["normal","block"]},"web_ftgd_err_log":{"type":"str","required":false,"choice'
+    's":["enable","disable"]},"web_antiphishing_log":{"type":"str","required":false,"choices":["enable","disable"]},"ftgd_wf":{"type":"dict","required":fal'
+    'se,"options":{"rate_javascript_urls":{"type":"str","required":false,"choices":["disable","enable"]},"filters":{"type":"list","required":false,"options'
+    '":{"category":{"type":"int","required":false},"warning_duration_type":{"type":"str","required":false,"choices":["session","timeout"]},"log":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"override_replacemsg":{"type":"str","required":false},"id":{"type":"int","required":false},"warni'
+    'ng_prompt":{"type":"str","required":false,"choices":["per-domain","per-category"]},"action":{"type":"str","required":false,"choices":["block","authent'
+    'icate","monitor","warning"]},"auth_usr_grp":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"warn_duration":{"type'
+    '":"str","required":false}}},"max_quota_timeout":{"type":"int","required":false},"ovrd":{"type":"str","required":false},"quota":{"type":"list","require'
+    'd":false,"options":{"category":{"type":"str","required":false},"override_replacemsg":{"type":"str","required":false},"value":{"type":"int","required":'
+    'false},"duration":{"type":"str","required":false},"type":{"type":"str","required":false,"choices":["time","traffic"]},"id":{"type":"int","required":fa'
+    'lse},"unit":{"type":"str","required":false,"choices":["B","KB","MB","GB"]}}},"rate_image_urls":{"type":"str","required":false},"exempt_quota":{"type":'
+    '"str","required":false},"rate_css_urls":{"type":"str","required":false,"choices":["disable","enable"]},"options":{"type":"list","required":false,"choi'
+    'ces":["error-allow","rate-server-ip","connect-request-bypass","ftgd-disable"]},"rate_crl_urls":{"type":"str","required":false,"choices":["disable","en'
+    'able"]}}},"web_extended_all_action_log":{"type":"str","required":false,"choices":["enable","disable"]},"web_filter_vbs_log":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"antiphish":{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"check_uri":{"type":"str","required":false,"choices":["enable","disable"]},"authentication":{"type":"str","required":false,"choices":["d'
+    'omain-controller","ldap"]},"max_body_len":{"type":"int","required":false},"custom_patterns":{"type":"list","required":false,"options":{"category":{"ty'
+    'pe":"str","required":false,"choices":["username","password"]},"pattern":{"type":"str","required":false},"type":{"type":"str","required":false,"choices'
+    '":["regex","literal"]}}},"check_basic_auth":{"type":"str","required":false,"choices":["enable","disable"]},"ldap":{"type":"str","required":false},"def'
+    'ault_action":{"type":"str","required":false,"choices":["exempt","log","block"]},"check_username_only":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"inspection_entries":{"type":"list","required":false,"options":{"action":{"type":"str","required":false,"choices":["exempt","log","bloc'
+    'k"]},"fortiguard_category":{"type":"str","required":false},"name":{"type":"str","required":false}}},"domain_controller":{"type":"str","required":false'
+    '}}},"web_invalid_domain_log":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"file_filter":{"typ'
+    'e":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"scan_archive_contents":{"type":"str","r'
+    'equired":false,"choices":["enable","disable"]},"log":{"type":"str","required":false,"choices":["enable","disable"]},"entries":{"type":"list","required'
+    '":false,"options":{"comment":{"type":"str","required":false},"direction":{"type":"str","required":false,"choices":["incoming","outgoing","any"]},"prot'
+    'ocol":{"type":"list","required":false,"choices":["http","ftp"]},"file_type":{"type":"list","required":false,"options":{"name":{"type":"str","required"'
+    ':false}}},"password_protected":{"type":"str","required":false,"choices":["yes","any"]},"filter":{"type":"str","required":false},"action":{"type":"str"'
+    ',"required":false,"choices":["log","block"]}}}}},"wisp":{"type":"str","required":false,"choices":["enable","disable"]},"youtube_channel_filter":{"type'
+    '":"list","required":false,"options":{"comment":{"type":"str","required":false},"channel_id":{"type":"str","required":false},"id":{"type":"int","requir'
+    'ed":false}}},"https_replacemsg":{"type":"str","required":false,"choices":["enable","disable"]},"log_all_url":{"type":"str","required":false,"choices":'
+    '["enable","disable"]},"options":{"type":"list","required":false},"inspection_mode":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"safesearch_str":{"type":"string","revisions":[2047,2047]},"charset":{"type":"string","options":[{"value":"utf-8","revision'
+    's":[2047,2047]},{"value":"gb2312","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"url":{"type":"s'
+    'tring","revisions":[2047,2047]},"hostname":{"type":"string","revisions":[2047,2047]},"safesearch":{"type":"string","options":[{"value":"disable","revi'
+    'sions":[2047,2047]},{"value":"url","revisions":[2047,2047]},{"value":"header","revisions":[2047,2047]}],"revisions":[2047,2047]},"query":{"type":"stri'
+    'ng","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"safesearch_str":{"type":"str","required":false},"charset":{"type":"str","required":false,"choices":["utf-8'
+    '","gb2312"]},"name":{"type":"str","required":false},"url":{"type":"str","required":false},"hostname":{"type":"str","required":false},"safesearch":{"ty'
+    'pe":"str","required":false,"choices":["disable","url","header"]},"query":{"type":"str","required":false}}}'
+)
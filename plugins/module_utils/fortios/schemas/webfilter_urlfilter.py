@@ -0,0 +1,31 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"ip_addr_block":{"type":"string","options":[{"value":"enable","revision'
+    's":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"one_arm_ips_ur'
+    'lfilter":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"entries":{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"web_proxy_profile":{"type":"string","revisions":[2047,2047]},"url":{"type":"string","revisions":[2047,2047]},"an'
+    'tiphish_action":{"type":"string","options":[{"value":"block","revisions":[1920,1920]},{"value":"log","revisions":[1920,1920]}],"revisions":[1920,1920]'
+    '},"exempt":{"multiple_values":true,"type":"list","options":[{"value":"av","revisions":[2047,2047]},{"value":"web-content","revisions":[2047,2047]},{"v'
+    'alue":"activex-java-cookie","revisions":[2047,2047]},{"value":"dlp","revisions":[2047,2047]},{"value":"fortiguard","revisions":[2047,2047]},{"value":"'
+    'range-block","revisions":[2047,2047]},{"value":"pass","revisions":[2047,2047]},{"value":"all","revisions":[2047,2047]},{"value":"antiphish","revisions'
+    '":[1920,1920]}],"revisions":[2047,2047]},"action":{"type":"string","options":[{"value":"exempt","revisions":[2047,2047]},{"value":"block","revisions":'
+    '[2047,2047]},{"value":"allow","revisions":[2047,2047]},{"value":"monitor","revisions":[2047,2047]}],"revisions":[2047,2047]},"dns_address_family":{"ty'
+    'pe":"string","options":[{"value":"ipv4","revisions":[2047,2047]},{"value":"ipv6","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"type":{"type":"string","options":[{"value":"simple","revisions":[2047,2047]},{"value":"regex","revisions":[2047,2047]},{"value'
+    '":"wildcard","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"referrer_host":{"type":"string","revi'
+    'sions":[2047,2047]}},"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"ip_addr_block":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"name":{"type":"str","required":false},"one_arm_ips_urlfilter":{"type":"str","required":false,"choices":["enable","disable"]},"entries":'
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"web_proxy_profile":{"type":"str","'
+    'required":false},"url":{"type":"str","required":false},"antiphish_action":{"type":"str","required":false,"choices":["block","log"]},"exempt":{"type":"'
+    'list","required":false},"action":{"type":"str","required":false,"choices":["exempt","block","allow","monitor"]},"dns_address_family":{"type":"str","re'
+    'quired":false,"choices":["ipv4","ipv6","both"]},"type":{"type":"str","required":false,"choices":["simple","regex","wildcard"]},"id":{"type":"int","req'
+    'uired":false},"referrer_host":{"type":"str","required":false}}},"id":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,25 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[1920,1920]},"layer3_ipv6_rules":{"type":"list","children":{"comment":{"type":"strin'
+    'g","revisions":[1920,1920]},"dstaddr":{"type":"string","revisions":[1920,1920]},"protocol":{"type":"integer","revisions":[1920,1920]},"srcport":{"type'
+    '":"integer","revisions":[1920,1920]},"srcaddr":{"type":"string","revisions":[1920,1920]},"action":{"type":"string","options":[{"value":"allow","revisi'
+    'ons":[1920,1920]},{"value":"deny","revisions":[1920,1920]}],"revisions":[1920,1920]},"dstport":{"type":"integer","revisions":[1920,1920]},"rule_id":{"'
+    'type":"integer","revisions":[1920,1920]}},"revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1920]},"layer3_ipv4_rules":{"type":"list"'
+    ',"children":{"comment":{"type":"string","revisions":[1920,1920]},"dstaddr":{"type":"string","revisions":[1920,1920]},"protocol":{"type":"integer","rev'
+    'isions":[1920,1920]},"srcport":{"type":"integer","revisions":[1920,1920]},"srcaddr":{"type":"string","revisions":[1920,1920]},"action":{"type":"string'
+    '","options":[{"value":"allow","revisions":[1920,1920]},{"value":"deny","revisions":[1920,1920]}],"revisions":[1920,1920]},"dstport":{"type":"integer",'
+    '"revisions":[1920,1920]},"rule_id":{"type":"integer","revisions":[1920,1920]}},"revisions":[1920,1920]}},"revisions":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"layer3_ipv6_rules":{"type":"list","required":false,"options":{"c'
+    'omment":{"type":"str","required":false},"dstaddr":{"type":"str","required":false},"protocol":{"type":"int","required":false},"srcport":{"type":"int","'
+    'required":false},"srcaddr":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["allow","deny"]},"dstport":{"type":"int"'
+    ',"required":false},"rule_id":{"type":"int","required":false}}},"name":{"type":"str","required":false},"layer3_ipv4_rules":{"type":"list","required":fa'
+    'lse,"options":{"comment":{"type":"str","required":false},"dstaddr":{"type":"str","required":false},"protocol":{"type":"int","required":false},"srcport'
+    '":{"type":"int","required":false},"srcaddr":{"type":"str","required":false},"action":{"type":"str","required":false,"choices":["allow","deny"]},"dstpo'
+    'rt":{"type":"int","required":false},"rule_id":{"type":"int","required":false}}}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"id":{"type":"string","revisions":[2040,2040]},"default_policy":{"type":"string","options":[{"value":"allow","revisions":[2'
+    '040,2040]},{"value":"deny","revisions":[2040,2040]}],"revisions":[2040,2040]},"addresses":{"type":"list","children":{"id":{"type":"string","revisions"'
+    ':[2040,2040]}},"revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"id":{"type":"str","required":false},"default_policy":{"type":"str","required":false,"choices":["allow","de'
+    'ny"]},"addresses":{"type":"list","required":false,"options":{"id":{"type":"str","required":false}}}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"rogue","revisions":[2047,2047]},{"value":"accepted","revisions":[2047,2047]}'
+    ',{"value":"suppressed","revisions":[2047,2047]}],"revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"bssid":{"type":"string","re'
+    'visions":[2047,2047]},"ssid":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["rogue","accepted","suppressed"]},"id":{"type":"int","re'
+    'quired":false},"bssid":{"type":"str","required":false},"ssid":{"type":"str","required":false}}}'
+)
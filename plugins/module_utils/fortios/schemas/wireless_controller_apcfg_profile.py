@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[1920,1920]},"ac_type":{"type":"string","options":[{"value":"default","revisions":[1'
+    '920,1920]},{"value":"specify","revisions":[1920,1920]},{"value":"apcfg","revisions":[1920,1920]}],"revisions":[1920,1920]},"name":{"type":"string","re'
+    'visions":[1920,1920]},"command_list":{"type":"list","children":{"passwd_value":{"type":"string","revisions":[1920,1920]},"type":{"type":"string","opti'
+    'ons":[{"value":"non-password","revisions":[1920,1920]},{"value":"password","revisions":[1920,1920]}],"revisions":[1920,1920]},"id":{"type":"integer","'
+    'revisions":[1920,1920]},"value":{"type":"string","revisions":[1920,1920]},"name":{"type":"string","revisions":[1920,1920]}},"revisions":[1920,1920]},"'
+    'ac_timer":{"type":"integer","revisions":[1920,1920]},"ac_ip":{"type":"string","revisions":[1920,1920]},"ac_port":{"type":"integer","revisions":[1920,1'
+    '920]}},"revisions":[1920,1920]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"ac_type":{"type":"str","required":false,"choices":["default","sp'
+    'ecify","apcfg"]},"name":{"type":"str","required":false},"command_list":{"type":"list","required":false,"options":{"passwd_value":{"type":"str","requir'
+    'ed":false},"type":{"type":"str","required":false,"choices":["non-password","password"]},"id":{"type":"int","required":false},"value":{"type":"str","re'
+    'quired":false},"name":{"type":"str","required":false}}},"ac_timer":{"type":"int","required":false},"ac_ip":{"type":"str","required":false},"ac_port":{'
+    '"type":"int","required":false}}}'
+)
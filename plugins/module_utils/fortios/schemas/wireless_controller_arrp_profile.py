@@ -0,0 +1,27 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[1664,1664]},"weight_dfs_channel":{"type":"integer","revisions":[1664,1664]},"name":'
+    '{"type":"string","revisions":[1664,1664]},"threshold_spectral_rssi":{"type":"string","revisions":[1664,1664]},"threshold_tx_retries":{"type":"integer"'
+    ',"revisions":[1664,1664]},"weight_spectral_rssi":{"type":"integer","revisions":[1664,1664]},"weight_rogue_ap":{"type":"integer","revisions":[1664,1664'
+    ']},"selection_period":{"type":"integer","revisions":[1664,1664]},"include_weather_channel":{"type":"string","options":[{"value":"yes","revisions":[166'
+    '4,128]},{"value":"no","revisions":[1664,128]},{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[166'
+    '4,1664]},"threshold_noise_floor":{"type":"string","revisions":[1664,1664]},"threshold_ap":{"type":"integer","revisions":[1664,1664]},"weight_channel_l'
+    'oad":{"type":"integer","revisions":[1664,1664]},"weight_noise_floor":{"type":"integer","revisions":[1664,1664]},"weight_managed_ap":{"type":"integer",'
+    '"revisions":[1664,1664]},"monitor_period":{"type":"integer","revisions":[1664,1664]},"threshold_channel_load":{"type":"integer","revisions":[1664,1664'
+    ']},"threshold_rx_errors":{"type":"integer","revisions":[1664,1664]},"weight_weather_channel":{"type":"integer","revisions":[1664,1664]},"include_dfs_c'
+    'hannel":{"type":"string","options":[{"value":"yes","revisions":[1664,128]},{"value":"no","revisions":[1664,128]},{"value":"enable","revisions":[1536,1'
+    '536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1664,1664]}},"revisions":[1664,1664]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"weight_dfs_channel":{"type":"int","required":false},"name":{"typ'
+    'e":"str","required":false},"threshold_spectral_rssi":{"type":"str","required":false},"threshold_tx_retries":{"type":"int","required":false},"weight_sp'
+    'ectral_rssi":{"type":"int","required":false},"weight_rogue_ap":{"type":"int","required":false},"selection_period":{"type":"int","required":false},"inc'
+    'lude_weather_channel":{"type":"str","required":false},"threshold_noise_floor":{"type":"str","required":false},"threshold_ap":{"type":"int","required":'
+    'false},"weight_channel_load":{"type":"int","required":false},"weight_noise_floor":{"type":"int","required":false},"weight_managed_ap":{"type":"int","r'
+    'equired":false},"monitor_period":{"type":"int","required":false},"threshold_channel_load":{"type":"int","required":false},"threshold_rx_errors":{"type'
+    '":"int","required":false},"weight_weather_channel":{"type":"int","required":false},"include_dfs_channel":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"ble_scanning":{"type":"string","options":[{"value":"enable","revisions'
+    '":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"eddystone_names'
+    'pace":{"type":"string","revisions":[2047,2047]},"major_id":{"type":"integer","revisions":[2047,2047]},"ibeacon_uuid":{"type":"string","revisions":[204'
+    '7,2047]},"eddystone_url_encode_hex":{"type":"string","revisions":[2047,23]},"txpower":{"type":"string","options":[{"value":"0","revisions":[2047,2047]'
+    '},{"value":"1","revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]},{"value":"3","revisions":[2047,2047]},{"value":"4","revisions":[2047,204'
+    '7]},{"value":"5","revisions":[2047,2047]},{"value":"6","revisions":[2047,2047]},{"value":"7","revisions":[2047,2047]},{"value":"8","revisions":[2047,2'
+    '047]},{"value":"9","revisions":[2047,2047]},{"value":"10","revisions":[2047,2047]},{"value":"11","revisions":[2047,2047]},{"value":"12","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"beacon_interval":{"type":"integer","revisions":[2047,2047]},"advertising":{"multiple_values":true,"type":"list",'
+    '"options":[{"value":"ibeacon","revisions":[2047,2047]},{"value":"eddystone-uid","revisions":[2047,2047]},{"value":"eddystone-url","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"eddystone_url":{"type":"string","revisions":[2047,2047]},"eddystone_instance":{"type":"string","revisions":[2047,2047]'
+    '},"minor_id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"ble_scanning":{"type":"str","required":false,"choices":["enable"'
+    ',"disable"]},"name":{"type":"str","required":false},"eddystone_namespace":{"type":"str","required":false},"major_id":{"type":"int","required":false},"'
+    'ibeacon_uuid":{"type":"str","required":false},"eddystone_url_encode_hex":{"type":"str","required":false},"txpower":{"type":"str","required":false,"cho'
+    'ices":["0","1","2","3","4","5","6","7","8","9","10","11","12"]},"beacon_interval":{"type":"int","required":false},"advertising":{"type":"list","requir'
+    'ed":false,"choices":["ibeacon","eddystone-uid","eddystone-url"]},"eddystone_url":{"type":"str","required":false},"eddystone_instance":{"type":"str","r'
+    'equired":false},"minor_id":{"type":"int","required":false}}}'
+)
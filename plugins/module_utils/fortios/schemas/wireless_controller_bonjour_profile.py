@@ -0,0 +1,20 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"policy_list":{"type":'
+    '"list","children":{"services":{"multiple_values":true,"type":"list","options":[{"value":"all","revisions":[2047,2047]},{"value":"airplay","revisions":'
+    '[2047,2047]},{"value":"afp","revisions":[2047,2047]},{"value":"bit-torrent","revisions":[2047,2047]},{"value":"ftp","revisions":[2047,2047]},{"value":'
+    '"ichat","revisions":[2047,2047]},{"value":"itunes","revisions":[2047,2047]},{"value":"printers","revisions":[2047,2047]},{"value":"samba","revisions":'
+    '[2047,2047]},{"value":"scanners","revisions":[2047,2047]},{"value":"ssh","revisions":[2047,2047]},{"value":"chromecast","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"to_vlan":{"type":"string","revisions":[2047,2047]},"description":{"type":"string","revisions":[2047,2047]},"from_vlan":{"type":"'
+    'string","revisions":[2047,2047]},"policy_id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"name":{"type":"str","required":false},"policy_list":{"type":"lis'
+    't","required":false,"options":{"services":{"type":"list","required":false,"choices":["all","airplay","afp","bit-torrent","ftp","ichat","itunes","print'
+    'ers","samba","scanners","ssh","chromecast"]},"to_vlan":{"type":"str","required":false},"description":{"type":"str","required":false},"from_vlan":{"typ'
+    'e":"str","required":false},"policy_id":{"type":"int","required":false}}}}}'
+)
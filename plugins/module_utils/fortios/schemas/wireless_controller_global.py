@@ -0,0 +1,30 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"ipsec_base_ip":{"type":"string","revisions":[2047,2047]},"max_retransmit":{"type":"integer","revisions":[2047,2047]},"name'
+    '":{"type":"string","revisions":[2047,2047]},"data_ethernet_II":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disabl'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"discovery_mc_addr":{"type":"string","revisions":[2047,2047]},"wtp_share":{"type":"string","opti'
+    'ons":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"rogue_scan_mac_adjacency":{"ty'
+    'pe":"integer","revisions":[2047,2047]},"ap_log_server_port":{"type":"integer","revisions":[2047,2047]},"location":{"type":"string","revisions":[2047,2'
+    '047]},"control_message_offload":{"multiple_values":true,"type":"list","options":[{"value":"ebp-frame","revisions":[2047,2047]},{"value":"aeroscout-tag'
+    '","revisions":[2047,2047]},{"value":"ap-list","revisions":[2047,2047]},{"value":"sta-list","revisions":[2047,2047]},{"value":"sta-cap-list","revisions'
+    '":[2047,2047]},{"value":"stats","revisions":[2047,2047]},{"value":"aeroscout-mu","revisions":[2047,2047]},{"value":"sta-health","revisions":[2040,2040'
+    ']},{"value":"spectral-analysis","revisions":[1920,1920]}],"revisions":[2047,2047]},"mesh_eth_type":{"type":"integer","revisions":[2047,2047]},"image_d'
+    'ownload":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"ap_log_server_ip":{"type":"string","revisions":[2047,2047]},"ap_log_server":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"'
+    'value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"max_clients":{"type":"integer","revisions":[2047,2047]},"fiapp_eth_type":{"type":'
+    '"integer","revisions":[2047,2047]},"link_aggregation":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"ipsec_base_ip":{"type":"str","required":false},"max_retransmit":{"type":"int","required":false},"name":{"t'
+    'ype":"str","required":false},"data_ethernet_II":{"type":"str","required":false,"choices":["enable","disable"]},"discovery_mc_addr":{"type":"str","requ'
+    'ired":false},"wtp_share":{"type":"str","required":false,"choices":["enable","disable"]},"rogue_scan_mac_adjacency":{"type":"int","required":false},"ap'
+    '_log_server_port":{"type":"int","required":false},"location":{"type":"str","required":false},"control_message_offload":{"type":"list","required":false'
+    '},"mesh_eth_type":{"type":"int","required":false},"image_download":{"type":"str","required":false,"choices":["enable","disable"]},"ap_log_server_ip":{'
+    '"type":"str","required":false},"ap_log_server":{"type":"str","required":false,"choices":["enable","disable"]},"max_clients":{"type":"int","required":f'
+    'alse},"fiapp_eth_type":{"type":"int","required":false},"link_aggregation":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"mcc_mnc_list":{"type":"list","children":{"mnc":{"type":"string","revisions":[2047,2047]},"mcc":{"type":"string","revisions'
+    '":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions"'
+    ':[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"mcc_mnc_list":{"type":"list","required":false,"options":{"mnc":{"type":"str","required":false},"mcc":{"typ'
+    'e":"str","required":false},"id":{"type":"int","required":false}}},"name":{"type":"str","required":false}}}'
+)
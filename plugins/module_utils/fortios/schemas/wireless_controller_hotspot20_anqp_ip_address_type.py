@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"ipv4_address_type":{"type":"string","options":[{"value":"not-available","revisions":[2047,2047]},{"value":"public","revisi'
+    'ons":[2047,2047]},{"value":"port-restricted","revisions":[2047,2047]},{"value":"single-NATed-private","revisions":[2047,2047]},{"value":"double-NATed-'
+    'private","revisions":[2047,2047]},{"value":"port-restricted-and-single-NATed","revisions":[2047,2047]},{"value":"port-restricted-and-double-NATed","re'
+    'visions":[2047,2047]},{"value":"not-known","revisions":[2047,2047]}],"revisions":[2047,2047]},"ipv6_address_type":{"type":"string","options":[{"value"'
+    ':"not-available","revisions":[2047,2047]},{"value":"available","revisions":[2047,2047]},{"value":"not-known","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"ipv4_address_type":{"type":"str","required":false,"choices":["not-available","public","port-restricted","s'
+    'ingle-NATed-private","double-NATed-private","port-restricted-and-single-NATed","port-restricted-and-double-NATed","not-known"]},"ipv6_address_type":{"'
+    'type":"str","required":false,"choices":["not-available","available","not-known"]},"name":{"type":"str","required":false}}}'
+)
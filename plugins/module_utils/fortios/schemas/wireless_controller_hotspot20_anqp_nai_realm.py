@@ -0,0 +1,38 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"nai_list":{"type":"list","children":{"nai_realm":{"type":"string","revisions":[2047,2047]},"eap_method":{"type":"list","ch'
+    'ildren":{"index":{"type":"integer","revisions":[2047,2047]},"auth_param":{"type":"list","children":{"index":{"type":"integer","revisions":[2047,2047]}'
+    ',"id":{"type":"string","options":[{"value":"non-eap-inner-auth","revisions":[2047,2047]},{"value":"inner-auth-eap","revisions":[2047,2047]},{"value":"'
+    'credential","revisions":[2047,2047]},{"value":"tunneled-credential","revisions":[2047,2047]}],"revisions":[2047,2047]},"val":{"type":"string","options'
+    '":[{"value":"eap-identity","revisions":[2047,2047]},{"value":"eap-md5","revisions":[2047,2047]},{"value":"eap-tls","revisions":[2047,2047]},{"value":"'
+    'eap-ttls","revisions":[2047,2047]},{"value":"eap-peap","revisions":[2047,2047]},{"value":"eap-sim","revisions":[2047,2047]},{"value":"eap-aka","revisi'
+    'ons":[2047,2047]},{"value":"eap-aka-prime","revisions":[2047,2047]},{"value":"non-eap-pap","revisions":[2047,2047]},{"value":"non-eap-chap","revisions'
+    '":[2047,2047]},{"value":"non-eap-mschap","revisions":[2047,2047]},{"value":"non-eap-mschapv2","revisions":[2047,2047]},{"value":"cred-sim","revisions"'
+    ':[2047,2047]},{"value":"cred-usim","revisions":[2047,2047]},{"value":"cred-nfc","revisions":[2047,2047]},{"value":"cred-hardware-token","revisions":[2'
+    '047,2047]},{"value":"cred-softoken","revisions":[2047,2047]},{"value":"cred-certificate","revisions":[2047,2047]},{"value":"cred-user-pwd","revisions"'
+    ':[2047,2047]},{"value":"cred-none","revisions":[2047,2047]},{"value":"cred-vendor-specific","revisions":[2047,2047]},{"value":"tun-cred-sim","revision'
+    's":[2047,2047]},{"value":"tun-cred-usim","revisions":[2047,2047]},{"value":"tun-cred-nfc","revisions":[2047,2047]},{"value":"tun-cred-hardware-token",'
+    '"revisions":[2047,2047]},{"value":"tun-cred-softoken","revisions":[2047,2047]},{"value":"tun-cred-certificate","revisions":[2047,2047]},{"value":"tun-'
+    'cred-user-pwd","revisions":[2047,2047]},{"value":"tun-cred-anonymous","revisions":[2047,2047]},{"value":"tun-cred-vendor-specific","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"method":{"type":"string","options":[{"value":"eap-identity","revisions":[2047,2047]},{"valu'
+    'e":"eap-md5","revisions":[2047,2047]},{"value":"eap-tls","revisions":[2047,2047]},{"value":"eap-ttls","revisions":[2047,2047]},{"value":"eap-peap","re'
+    'visions":[2047,2047]},{"value":"eap-sim","revisions":[2047,2047]},{"value":"eap-aka","revisions":[2047,2047]},{"value":"eap-aka-prime","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"encoding":{"type":"string","options":['
+    '{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]},"name":{"ty'
+    'pe":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"nai_list":{"type":"list","required":false,"options":{"nai_realm":{"type":"str","required":false},"eap_meth'
+    'od":{"type":"list","required":false,"options":{"index":{"type":"int","required":false},"auth_param":{"type":"list","required":false,"options":{"index"'
+    ':{"type":"int","required":false},"id":{"type":"str","required":false,"choices":["non-eap-inner-auth","inner-auth-eap","credential","tunneled-credentia'
+    'l"]},"val":{"type":"str","required":false,"choices":["eap-identity","eap-md5","eap-tls","eap-ttls","eap-peap","eap-sim","eap-aka","eap-aka-prime","non'
+    '-eap-pap","non-eap-chap","non-eap-mschap","non-eap-mschapv2","cred-sim","cred-usim","cred-nfc","cred-hardware-token","cred-softoken","cred-certificate'
+    '","cred-user-pwd","cred-none","cred-vendor-specific","tun-cred-sim","tun-cred-usim","tun-cred-nfc","tun-cred-hardware-token","tun-cred-softoken","tun-'
+    'cred-certificate","tun-cred-user-pwd","tun-cred-anonymous","tun-cred-vendor-specific"]}}},"method":{"type":"str","required":false,"choices":["eap-iden'
+    'tity","eap-md5","eap-tls","eap-ttls","eap-peap","eap-sim","eap-aka","eap-aka-prime"]}}},"name":{"type":"str","required":false},"encoding":{"type":"str'
+    '","required":false,"choices":["disable","enable"]}}},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"url":{"type":"string","revisions":[2047,2047]},"auth_type":{"type":"string","options":[{"value":"acceptance-of-terms","rev'
+    'isions":[2047,2047]},{"value":"online-enrollment","revisions":[2047,2047]},{"value":"http-redirection","revisions":[2047,2047]},{"value":"dns-redirect'
+    'ion","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"url":{"type":"str","required":false},"auth_type":{"type":"str","required":false,"choices":["acceptance-of-'
+    'terms","online-enrollment","http-redirection","dns-redirection"]},"name":{"type":"str","required":false}}}'
+)
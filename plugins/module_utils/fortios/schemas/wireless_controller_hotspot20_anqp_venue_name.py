@@ -0,0 +1,14 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"value_list":{"type":"list","children":{"lang":{"type":"string","revisions":[2047,2047]},"index":{"type":"integer","revisio'
+    'ns":[2047,2047]},"value":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]}},"revisi'
+    'ons":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"value_list":{"type":"list","required":false,"options":{"lang":{"type":"str","required":false},"index":{"ty'
+    'pe":"int","required":false},"value":{"type":"str","required":false}}},"name":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,31 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"icmp_port":{"type":"string","options":[{"value":"closed","revisions":[2047,2047]},{"value":"open","revisions":[2047,2047]}'
+    ',{"value":"unknown","revisions":[2047,2047]}],"revisions":[2047,2047]},"http_port":{"type":"string","options":[{"value":"closed","revisions":[2047,204'
+    '7]},{"value":"open","revisions":[2047,2047]},{"value":"unknown","revisions":[2047,2047]}],"revisions":[2047,2047]},"ftp_port":{"type":"string","option'
+    's":[{"value":"closed","revisions":[2047,2047]},{"value":"open","revisions":[2047,2047]},{"value":"unknown","revisions":[2047,2047]}],"revisions":[2047'
+    ',2047]},"name":{"type":"string","revisions":[2047,2047]},"voip_udp_port":{"type":"string","options":[{"value":"closed","revisions":[2047,2047]},{"valu'
+    'e":"open","revisions":[2047,2047]},{"value":"unknown","revisions":[2047,2047]}],"revisions":[2047,2047]},"ssh_port":{"type":"string","options":[{"valu'
+    'e":"closed","revisions":[2047,2047]},{"value":"open","revisions":[2047,2047]},{"value":"unknown","revisions":[2047,2047]}],"revisions":[2047,2047]},"i'
+    'kev2_port":{"type":"string","options":[{"value":"closed","revisions":[2047,2047]},{"value":"open","revisions":[2047,2047]},{"value":"unknown","revisio'
+    'ns":[2047,2047]}],"revisions":[2047,2047]},"voip_tcp_port":{"type":"string","options":[{"value":"closed","revisions":[2047,2047]},{"value":"open","rev'
+    'isions":[2047,2047]},{"value":"unknown","revisions":[2047,2047]}],"revisions":[2047,2047]},"ikev2_xx_port":{"type":"string","options":[{"value":"close'
+    'd","revisions":[2047,2047]},{"value":"open","revisions":[2047,2047]},{"value":"unknown","revisions":[2047,2047]}],"revisions":[2047,2047]},"esp_port":'
+    '{"type":"string","options":[{"value":"closed","revisions":[2047,2047]},{"value":"open","revisions":[2047,2047]},{"value":"unknown","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"tls_port":{"type":"string","options":[{"value":"closed","revisions":[2047,2047]},{"value":"open","revisions":[2047,20'
+    '47]},{"value":"unknown","revisions":[2047,2047]}],"revisions":[2047,2047]},"pptp_vpn_port":{"type":"string","options":[{"value":"closed","revisions":['
+    '2047,2047]},{"value":"open","revisions":[2047,2047]},{"value":"unknown","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"icmp_port":{"type":"str","required":false,"choices":["closed","open","unknown"]},"http_port":{"type":"str"'
+    ',"required":false,"choices":["closed","open","unknown"]},"ftp_port":{"type":"str","required":false,"choices":["closed","open","unknown"]},"name":{"typ'
+    'e":"str","required":false},"voip_udp_port":{"type":"str","required":false,"choices":["closed","open","unknown"]},"ssh_port":{"type":"str","required":f'
+    'alse,"choices":["closed","open","unknown"]},"ikev2_port":{"type":"str","required":false,"choices":["closed","open","unknown"]},"voip_tcp_port":{"type"'
+    ':"str","required":false,"choices":["closed","open","unknown"]},"ikev2_xx_port":{"type":"str","required":false,"choices":["closed","open","unknown"]},"'
+    'esp_port":{"type":"str","required":false,"choices":["closed","open","unknown"]},"tls_port":{"type":"str","required":false,"choices":["closed","open","'
+    'unknown"]},"pptp_vpn_port":{"type":"str","required":false,"choices":["closed","open","unknown"]}}}'
+)
@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]},"server_uri":{"type":"string","revisions":[2047,2047]},"friendly_name":{"t'
+    'ype":"list","children":{"lang":{"type":"string","revisions":[2047,2047]},"index":{"type":"integer","revisions":[2047,2047]},"friendly_name":{"type":"s'
+    'tring","revisions":[2047,2047]}},"revisions":[2047,2047]},"osu_method":{"multiple_values":true,"type":"list","options":[{"value":"oma-dm","revisions":'
+    '[2047,2047]},{"value":"soap-xml-spp","revisions":[2047,2047]},{"value":"reserved","revisions":[2047,2047]}],"revisions":[2047,2047]},"osu_nai":{"type"'
+    ':"string","revisions":[2047,2047]},"service_description":{"type":"list","children":{"lang":{"type":"string","revisions":[2047,2047]},"service_id":{"ty'
+    'pe":"integer","revisions":[2047,2047]},"service_description":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"icon":{"type":"strin'
+    'g","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"name":{"type":"str","required":false},"server_uri":{"type":"str","required":false},"friendly_name":{"type"'
+    ':"list","required":false,"options":{"lang":{"type":"str","required":false},"index":{"type":"int","required":false},"friendly_name":{"type":"str","requ'
+    'ired":false}}},"osu_method":{"type":"list","required":false,"choices":["oma-dm","soap-xml-spp","reserved"]},"osu_nai":{"type":"str","required":false},'
+    '"service_description":{"type":"list","required":false,"options":{"lang":{"type":"str","required":false},"service_id":{"type":"int","required":false},"'
+    'service_description":{"type":"str","required":false}}},"icon":{"type":"str","required":false}}}'
+)
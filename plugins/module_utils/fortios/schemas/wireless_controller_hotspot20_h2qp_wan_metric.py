@@ -0,0 +1,20 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"uplink_speed":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"link_status":{"'
+    'type":"string","options":[{"value":"up","revisions":[2047,2047]},{"value":"down","revisions":[2047,2047]},{"value":"in-test","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"link_at_capacity":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"uplink_load":{"type":"integer","revisions":[2047,2047]},"downlink_speed":{"type":"integer","revisions":[2047,2047'
+    ']},"symmetric_wan_link":{"type":"string","options":[{"value":"symmetric","revisions":[2047,2047]},{"value":"asymmetric","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"load_measurement_duration":{"type":"integer","revisions":[2047,2047]},"downlink_load":{"type":"integer","revisions":[2047,2047]}'
+    '},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"uplink_speed":{"type":"int","required":false},"name":{"type":"str","required":false},"link_status":{"type"'
+    ':"str","required":false,"choices":["up","down","in-test"]},"link_at_capacity":{"type":"str","required":false,"choices":["enable","disable"]},"uplink_l'
+    'oad":{"type":"int","required":false},"downlink_speed":{"type":"int","required":false},"symmetric_wan_link":{"type":"str","required":false,"choices":["'
+    'symmetric","asymmetric"]},"load_measurement_duration":{"type":"int","required":false},"downlink_load":{"type":"int","required":false}}}'
+)
@@ -0,0 +1,75 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"access_network_internet":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisi'
+    'ons":[2047,2047]}],"revisions":[2047,2047]},"access_network_type":{"type":"string","options":[{"value":"private-network","revisions":[2047,2047]},{"va'
+    'lue":"private-network-with-guest-access","revisions":[2047,2047]},{"value":"chargeable-public-network","revisions":[2047,2047]},{"value":"free-public-'
+    'network","revisions":[2047,2047]},{"value":"personal-device-network","revisions":[2047,2047]},{"value":"emergency-services-only-network","revisions":['
+    '2047,2047]},{"value":"test-or-experimental","revisions":[2047,2047]},{"value":"wildcard","revisions":[2047,2047]}],"revisions":[2047,2047]},"bss_trans'
+    'ition":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"r'
+    'oaming_consortium":{"type":"string","revisions":[2047,2047]},"3gpp_plmn":{"type":"string","revisions":[2047,2047]},"access_network_asra":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"nai_realm":{"type":"s'
+    'tring","revisions":[2047,2047]},"proxy_arp":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"osu_provider":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]'
+    '},"gas_fragmentation_limit":{"type":"integer","revisions":[2047,2047]},"qos_map":{"type":"string","revisions":[2047,2047]},"anqp_domain_id":{"type":"i'
+    'nteger","revisions":[2047,2047]},"l2tif":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2'
+    '047]}],"revisions":[2047,2047]},"osu_ssid":{"type":"string","revisions":[2047,2047]},"oper_friendly_name":{"type":"string","revisions":[2047,2047]},"v'
+    'enue_name":{"type":"string","revisions":[2047,2047]},"domain_name":{"type":"string","revisions":[2047,2047]},"wan_metrics":{"type":"string","revisions'
+    '":[2047,2047]},"venue_group":{"type":"string","options":[{"value":"unspecified","revisions":[2047,2047]},{"value":"assembly","revisions":[2047,2047]},'
+    '{"value":"business","revisions":[2047,2047]},{"value":"educational","revisions":[2047,2047]},{"value":"factory","revisions":[2047,2047]},{"value":"ins'
+    'titutional","revisions":[2047,2047]},{"value":"mercantile","revisions":[2047,2047]},{"value":"residential","revisions":[2047,2047]},{"value":"storage"'
+    ',"revisions":[2047,2047]},{"value":"utility","revisions":[2047,2047]},{"value":"vehicular","revisions":[2047,2047]},{"value":"outdoor","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"hessid":{"type":"string","revisions":[2047,2047]},"pame_bi":{"type":"string","options":[{"value":"disable","revis'
+    'ions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"access_network_uesa":{"type":"string","options":[{"value":"en'
+    'able","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"venue_type":{"type":"string","options":[{"value"'
+    ':"unspecified","revisions":[2047,2047]},{"value":"arena","revisions":[2047,2047]},{"value":"stadium","revisions":[2047,2047]},{"value":"passenger-term'
+    'inal","revisions":[2047,2047]},{"value":"amphitheater","revisions":[2047,2047]},{"value":"amusement-park","revisions":[2047,2047]},{"value":"place-of-'
+    'worship","revisions":[2047,2047]},{"value":"convention-center","revisions":[2047,2047]},{"value":"library","revisions":[2047,2047]},{"value":"museum",'
+    '"revisions":[2047,2047]},{"value":"restaurant","revisions":[2047,2047]},{"value":"theater","revisions":[2047,2047]},{"value":"bar","revisions":[2047,2'
+    '047]},{"value":"coffee-shop","revisions":[2047,2047]},{"value":"zoo-or-aquarium","revisions":[2047,2047]},{"value":"emergency-center","revisions":[204'
+    '7,2047]},{"value":"doctor-office","revisions":[2047,2047]},{"value":"bank","revisions":[2047,2047]},{"value":"fire-station","revisions":[2047,2047]},{'
+    '"value":"police-station","revisions":[2047,2047]},{"value":"post-office","revisions":[2047,2047]},{"value":"professional-office","revisions":[2047,204'
+    '7]},{"value":"research-facility","revisions":[2047,2047]},{"value":"attorney-office","revisions":[2047,2047]},{"value":"primary-school","revisions":[2'
+    '047,2047]},{"value":"secondary-school","revisions":[2047,2047]},{"value":"university-or-college","revisions":[2047,2047]},{"value":"factory","revision'
+    's":[2047,2047]},{"value":"hospital","revisions":[2047,2047]},{"value":"long-term-care-facility","revisions":[2047,2047]},{"value":"rehab-center","revi'
+    'sions":[2047,2047]},{"value":"group-home","revisions":[2047,2047]},{"value":"prison-or-jail","revisions":[2047,2047]},{"value":"retail-store","revisio'
+    'ns":[2047,2047]},{"value":"grocery-market","revisions":[2047,2047]},{"value":"auto-service-station","revisions":[2047,2047]},{"value":"shopping-mall",'
+    '"revisions":[2047,2047]},{"value":"gas-station","revisions":[2047,2047]},{"value":"private","revisions":[2047,2047]},{"value":"hotel-or-motel","revisi'
+    'ons":[2047,2047]},{"value":"dormitory","revisions":[2047,2047]},{"value":"boarding-house","revisions":[2047,2047]},{"value":"automobile","revisions":['
+    '2047,2047]},{"value":"airplane","revisions":[2047,2047]},{"value":"bus","revisions":[2047,2047]},{"value":"ferry","revisions":[2047,2047]},{"value":"s'
+    'hip-or-boat","revisions":[2047,2047]},{"value":"train","revisions":[2047,2047]},{"value":"motor-bike","revisions":[2047,2047]},{"value":"muni-mesh-net'
+    'work","revisions":[2047,2047]},{"value":"city-park","revisions":[2047,2047]},{"value":"rest-area","revisions":[2047,2047]},{"value":"traffic-control",'
+    '"revisions":[2047,2047]},{"value":"bus-stop","revisions":[2047,2047]},{"value":"kiosk","revisions":[2047,2047]}],"revisions":[2047,2047]},"gas_comebac'
+    'k_delay":{"type":"integer","revisions":[2047,2047]},"ip_addr_type":{"type":"string","revisions":[2047,2047]},"conn_cap":{"type":"string","revisions":['
+    '2047,2047]},"dgaf":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"deauth_request_timeout":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"wnm_sleep_mode":{"type'
+    '":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"access_network'
+    '_esr":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ne'
+    'twork_auth":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"access_network_internet":{"type":"str","required":false,"choices":["enable","disable"]},"access_network_ty'
+    'pe":{"type":"str","required":false,"choices":["private-network","private-network-with-guest-access","chargeable-public-network","free-public-network",'
+    '"personal-device-network","emergency-services-only-network","test-or-experimental","wildcard"]},"bss_transition":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"roaming_consortium":{"type":"str","required":false},"3gpp_plmn":{"type":"str","required":false},"access_network_asra":{"typ'
+    'e":"str","required":false,"choices":["enable","disable"]},"nai_realm":{"type":"str","required":false},"proxy_arp":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"osu_provider":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"gas_fragmentation_limit'
+    '":{"type":"int","required":false},"qos_map":{"type":"str","required":false},"anqp_domain_id":{"type":"int","required":false},"l2tif":{"type":"str","re'
+    'quired":false,"choices":["enable","disable"]},"osu_ssid":{"type":"str","required":false},"oper_friendly_name":{"type":"str","required":false},"venue_n'
+    'ame":{"type":"str","required":false},"domain_name":{"type":"str","required":false},"wan_metrics":{"type":"str","required":false},"venue_group":{"type"'
+    ':"str","required":false,"choices":["unspecified","assembly","business","educational","factory","institutional","mercantile","residential","storage","u'
+    'tility","vehicular","outdoor"]},"hessid":{"type":"str","required":false},"pame_bi":{"type":"str","required":false,"choices":["disable","enable"]},"acc'
+    'ess_network_uesa":{"type":"str","required":false,"choices":["enable","disable"]},"venue_type":{"type":"str","required":false,"choices":["unspecified",'
+    '"arena","stadium","passenger-terminal","amphitheater","amusement-park","place-of-worship","convention-center","library","museum","restaurant","theater'
+    '","bar","coffee-shop","zoo-or-aquarium","emergency-center","doctor-office","bank","fire-station","police-station","post-office","professional-office",'
+    '"research-facility","attorney-office","primary-school","secondary-school","university-or-college","factory","hospital","long-term-care-facility","reha'
+    'b-center","group-home","prison-or-jail","retail-store","grocery-market","auto-service-station","shopping-mall","gas-station","private","hotel-or-motel'
+    '","dormitory","boarding-house","automobile","airplane","bus","ferry","ship-or-boat","train","motor-bike","muni-mesh-network","city-park","rest-area","'
+    'traffic-control","bus-stop","kiosk"]},"gas_comeback_delay":{"type":"int","required":false},"ip_addr_type":{"type":"str","required":false},"conn_cap":{'
+    '"type":"str","required":false},"dgaf":{"type":"str","required":false,"choices":["enable","disable"]},"deauth_request_timeout":{"type":"int","required"'
+    ':false},"name":{"type":"str","required":false},"wnm_sleep_mode":{"type":"str","required":false,"choices":["enable","disable"]},"access_network_esr":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"network_auth":{"type":"str","required":false}}}'
+)
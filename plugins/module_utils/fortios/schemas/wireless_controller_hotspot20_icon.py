@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"icon_list":{"type":"list","children":{"lang":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions"'
+    ':[2047,2047]},"height":{"type":"integer","revisions":[2047,2047]},"width":{"type":"integer","revisions":[2047,2047]},"file":{"type":"string","revision'
+    's":[2047,2047]},"type":{"type":"string","options":[{"value":"bmp","revisions":[2047,2047]},{"value":"gif","revisions":[2047,2047]},{"value":"jpeg","re'
+    'visions":[2047,2047]},{"value":"png","revisions":[2047,2047]},{"value":"tiff","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,20'
+    '47]},"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"icon_list":{"type":"list","required":false,"options":{"lang":{"type":"str","required":false},"name":{"type'
+    '":"str","required":false},"height":{"type":"int","required":false},"width":{"type":"int","required":false},"file":{"type":"str","required":false},"typ'
+    'e":{"type":"str","required":false,"choices":["bmp","gif","jpeg","png","tiff"]}}},"name":{"type":"str","required":false}}}'
+)
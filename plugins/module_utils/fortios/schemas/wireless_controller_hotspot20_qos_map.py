@@ -0,0 +1,17 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"dscp_range":{"type":"list","children":{"high":{"type":"integer","revisions":[2047,2047]},"index":{"type":"integer","revisi'
+    'ons":[2047,2047]},"up":{"type":"integer","revisions":[2047,2047]},"low":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"name":{"'
+    'type":"string","revisions":[2047,2047]},"dscp_except":{"type":"list","children":{"index":{"type":"integer","revisions":[2047,2047]},"up":{"type":"inte'
+    'ger","revisions":[2047,2047]},"dscp":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"dscp_range":{"type":"list","required":false,"options":{"high":{"type":"int","required":false},"index":{"ty'
+    'pe":"int","required":false},"up":{"type":"int","required":false},"low":{"type":"int","required":false}}},"name":{"type":"str","required":false},"dscp_'
+    'except":{"type":"list","required":false,"options":{"index":{"type":"int","required":false},"up":{"type":"int","required":false},"dscp":{"type":"int","'
+    'required":false}}}}}'
+)
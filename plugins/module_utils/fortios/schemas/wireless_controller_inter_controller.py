@@ -0,0 +1,21 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"fast_failover_max":{"type":"integer","revisions":[2047,2047]},"inter_controller_peer":{"type":"list","children":{"peer_pri'
+    'ority":{"type":"string","options":[{"value":"primary","revisions":[2047,2047]},{"value":"secondary","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"peer_port":{"type":"integer","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"peer_ip":{"type":"string","revisions":[2047,2'
+    '047]}},"revisions":[2047,2047]},"fast_failover_wait":{"type":"integer","revisions":[2047,2047]},"inter_controller_key":{"type":"string","revisions":[2'
+    '047,2047]},"inter_controller_pri":{"type":"string","options":[{"value":"primary","revisions":[2047,2047]},{"value":"secondary","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"inter_controller_mode":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"l2-roaming","rev'
+    'isions":[2047,2047]},{"value":"1+1","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"fast_failover_max":{"type":"int","required":false},"inter_controller_peer":{"type":"list","required":false'
+    ',"options":{"peer_priority":{"type":"str","required":false,"choices":["primary","secondary"]},"peer_port":{"type":"int","required":false},"id":{"type"'
+    ':"int","required":false},"peer_ip":{"type":"str","required":false}}},"fast_failover_wait":{"type":"int","required":false},"inter_controller_key":{"typ'
+    'e":"str","required":false},"inter_controller_pri":{"type":"str","required":false,"choices":["primary","secondary"]},"inter_controller_mode":{"type":"s'
+    'tr","required":false,"choices":["disable","l2-roaming","1+1"]}}}'
+)
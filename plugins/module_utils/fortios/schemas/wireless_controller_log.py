@@ -0,0 +1,54 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}'
+    '],"revisions":[2040,2040]},"sta_event_log":{"type":"string","options":[{"value":"emergency","revisions":[2040,2040]},{"value":"alert","revisions":[204'
+    '0,2040]},{"value":"critical","revisions":[2040,2040]},{"value":"error","revisions":[2040,2040]},{"value":"warning","revisions":[2040,2040]},{"value":"'
+    'notification","revisions":[2040,2040]},{"value":"information","revisions":[2040,2040]},{"value":"debug","revisions":[2040,2040]}],"revisions":[2040,20'
+    '40]},"radio_event_log":{"type":"string","options":[{"value":"emergency","revisions":[2040,2040]},{"value":"alert","revisions":[2040,2040]},{"value":"c'
+    'ritical","revisions":[2040,2040]},{"value":"error","revisions":[2040,2040]},{"value":"warning","revisions":[2040,2040]},{"value":"notification","revis'
+    'ions":[2040,2040]},{"value":"information","revisions":[2040,2040]},{"value":"debug","revisions":[2040,2040]}],"revisions":[2040,2040]},"clb_log":{"typ'
+    'e":"string","options":[{"value":"emergency","revisions":[2040,2040]},{"value":"alert","revisions":[2040,2040]},{"value":"critical","revisions":[2040,2'
+    '040]},{"value":"error","revisions":[2040,2040]},{"value":"warning","revisions":[2040,2040]},{"value":"notification","revisions":[2040,2040]},{"value":'
+    '"information","revisions":[2040,2040]},{"value":"debug","revisions":[2040,2040]}],"revisions":[2040,2040]},"addrgrp_log":{"type":"string","options":[{'
+    '"value":"emergency","revisions":[2040,2040]},{"value":"alert","revisions":[2040,2040]},{"value":"critical","revisions":[2040,2040]},{"value":"error","'
+    'revisions":[2040,2040]},{"value":"warning","revisions":[2040,2040]},{"value":"notification","revisions":[2040,2040]},{"value":"information","revisions'
+    '":[2040,2040]},{"value":"debug","revisions":[2040,2040]}],"revisions":[2040,2040]},"dhcp_starv_log":{"type":"string","options":[{"value":"emergency","'
+    'revisions":[2040,2040]},{"value":"alert","revisions":[2040,2040]},{"value":"critical","revisions":[2040,2040]},{"value":"error","revisions":[2040,2040'
+    ']},{"value":"warning","revisions":[2040,2040]},{"value":"notification","revisions":[2040,2040]},{"value":"information","revisions":[2040,2040]},{"valu'
+    'e":"debug","revisions":[2040,2040]}],"revisions":[2040,2040]},"wtp_event_log":{"type":"string","options":[{"value":"emergency","revisions":[2040,2040]'
+    '},{"value":"alert","revisions":[2040,2040]},{"value":"critical","revisions":[2040,2040]},{"value":"error","revisions":[2040,2040]},{"value":"warning",'
+    '"revisions":[2040,2040]},{"value":"notification","revisions":[2040,2040]},{"value":"information","revisions":[2040,2040]},{"value":"debug","revisions"'
+    ':[2040,2040]}],"revisions":[2040,2040]},"sta_locate_log":{"type":"string","options":[{"value":"emergency","revisions":[2040,2040]},{"value":"alert","r'
+    'evisions":[2040,2040]},{"value":"critical","revisions":[2040,2040]},{"value":"error","revisions":[2040,2040]},{"value":"warning","revisions":[2040,204'
+    '0]},{"value":"notification","revisions":[2040,2040]},{"value":"information","revisions":[2040,2040]},{"value":"debug","revisions":[2040,2040]}],"revis'
+    'ions":[2040,2040]},"wids_log":{"type":"string","options":[{"value":"emergency","revisions":[2040,2040]},{"value":"alert","revisions":[2040,2040]},{"va'
+    'lue":"critical","revisions":[2040,2040]},{"value":"error","revisions":[2040,2040]},{"value":"warning","revisions":[2040,2040]},{"value":"notification"'
+    ',"revisions":[2040,2040]},{"value":"information","revisions":[2040,2040]},{"value":"debug","revisions":[2040,2040]}],"revisions":[2040,2040]},"rogue_e'
+    'vent_log":{"type":"string","options":[{"value":"emergency","revisions":[2040,2040]},{"value":"alert","revisions":[2040,2040]},{"value":"critical","rev'
+    'isions":[2040,2040]},{"value":"error","revisions":[2040,2040]},{"value":"warning","revisions":[2040,2040]},{"value":"notification","revisions":[2040,2'
+    '040]},{"value":"information","revisions":[2040,2040]},{"value":"debug","revisions":[2040,2040]}],"revisions":[2040,2040]},"ble_log":{"type":"string","'
+    'options":[{"value":"emergency","revisions":[2040,2040]},{"value":"alert","revisions":[2040,2040]},{"value":"critical","revisions":[2040,2040]},{"value'
+    '":"error","revisions":[2040,2040]},{"value":"warning","revisions":[2040,2040]},{"value":"notification","revisions":[2040,2040]},{"value":"information"'
+    ',"revisions":[2040,2040]},{"value":"debug","revisions":[2040,2040]}],"revisions":[2040,2040]},"led_sched_log":{"type":"string","options":[{"value":"em'
+    'ergency","revisions":[2040,2040]},{"value":"alert","revisions":[2040,2040]},{"value":"critical","revisions":[2040,2040]},{"value":"error","revisions":'
+    '[2040,2040]},{"value":"warning","revisions":[2040,2040]},{"value":"notification","revisions":[2040,2040]},{"value":"information","revisions":[2040,204'
+    '0]},{"value":"debug","revisions":[2040,2040]}],"revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"sta_event_log":{"type":"str","requ'
+    'ired":false,"choices":["emergency","alert","critical","error","warning","notification","information","debug"]},"radio_event_log":{"type":"str","requir'
+    'ed":false,"choices":["emergency","alert","critical","error","warning","notification","information","debug"]},"clb_log":{"type":"str","required":false,'
+    '"choices":["emergency","alert","critical","error","warning","notification","information","debug"]},"addrgrp_log":{"type":"str","required":false,"choic'
+    'es":["emergency","alert","critical","error","warning","notification","information","debug"]},"dhcp_starv_log":{"type":"str","required":false,"choices"'
+    ':["emergency","alert","critical","error","warning","notification","information","debug"]},"wtp_event_log":{"type":"str","required":false,"choices":["e'
+    'mergency","alert","critical","error","warning","notification","information","debug"]},"sta_locate_log":{"type":"str","required":false,"choices":["emer'
+    'gency","alert","critical","error","warning","notification","information","debug"]},"wids_log":{"type":"str","required":false,"choices":["emergency","a'
+    'lert","critical","error","warning","notification","information","debug"]},"rogue_event_log":{"type":"str","required":false,"choices":["emergency","ale'
+    'rt","critical","error","warning","notification","information","debug"]},"ble_log":{"type":"str","required":false,"choices":["emergency","alert","criti'
+    'cal","error","warning","notification","information","debug"]},"led_sched_log":{"type":"str","required":false,"choices":["emergency","alert","critical"'
+    ',"error","warning","notification","information","debug"]}}}'
+)
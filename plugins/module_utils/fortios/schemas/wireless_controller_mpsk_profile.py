@@ -0,0 +1,23 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"mpsk_concurrent_clients":{"type":"integer","revisions":[1664,1664]},"name":{"type":"string","revisions":[1664,1664]},"mpsk'
+    '_group":{"type":"list","children":{"mpsk_key":{"type":"list","children":{"comment":{"type":"string","revisions":[1664,1664]},"concurrent_client_limit_'
+    'type":{"type":"string","options":[{"value":"default","revisions":[1664,1664]},{"value":"unlimited","revisions":[1664,1664]},{"value":"specified","revi'
+    'sions":[1664,1664]}],"revisions":[1664,1664]},"name":{"type":"string","revisions":[1664,1664]},"mpsk_schedules":{"type":"list","children":{"name":{"ty'
+    'pe":"string","revisions":[1664,1664]}},"revisions":[1664,1664]},"mac":{"type":"string","revisions":[1664,1664]},"passphrase":{"type":"string","revisio'
+    'ns":[1664,1664]},"concurrent_clients":{"type":"integer","revisions":[1664,1664]}},"revisions":[1664,1664]},"vlan_type":{"type":"string","options":[{"v'
+    'alue":"no-vlan","revisions":[1664,1664]},{"value":"fixed-vlan","revisions":[1664,1664]}],"revisions":[1664,1664]},"name":{"type":"string","revisions":'
+    '[1664,1664]},"vlan_id":{"type":"integer","revisions":[1664,1664]}},"revisions":[1664,1664]}},"revisions":[1664,1664]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"mpsk_concurrent_clients":{"type":"int","required":false},"name":{"type":"str","required":false},"mpsk_grou'
+    'p":{"type":"list","required":false,"options":{"mpsk_key":{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"concurr'
+    'ent_client_limit_type":{"type":"str","required":false,"choices":["default","unlimited","specified"]},"name":{"type":"str","required":false},"mpsk_sche'
+    'dules":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"mac":{"type":"str","required":false},"passphrase":{"type":'
+    '"str","required":false},"concurrent_clients":{"type":"int","required":false}}},"vlan_type":{"type":"str","required":false,"choices":["no-vlan","fixed-'
+    'vlan"]},"name":{"type":"str","required":false},"vlan_id":{"type":"int","required":false}}}}}'
+)
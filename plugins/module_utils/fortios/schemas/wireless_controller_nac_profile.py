@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[1024,1024]},"onboarding_vlan":{"type":"string","revisions":[1024,1024]},"name":{"ty'
+    'pe":"string","revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"onboarding_vlan":{"type":"str","required":false},"name":{"type":'
+    '"str","required":false}}}'
+)
@@ -0,0 +1,36 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"burst":{"type":"string","options":[{"value":"enable","revisions":[2047'
+    ',2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"wmm_bk_dscp":{"type":"integer","revisions":[2040,2040]},"bandwidth_admi'
+    'ssion_control":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"wmm_dscp_marking":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revision'
+    's":[2040,2040]},"bandwidth_capacity":{"type":"integer","revisions":[2047,2047]},"downlink_sta":{"type":"integer","revisions":[2047,2047]},"call_capaci'
+    'ty":{"type":"integer","revisions":[2047,2047]},"dscp_wmm_vi":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":['
+    '2047,2047]},"dscp_wmm_vo":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"wmm_vi_dscp":{"type":"'
+    'integer","revisions":[2040,2040]},"wmm":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"dscp_wmm_be":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"upl'
+    'ink":{"type":"integer","revisions":[2047,2047]},"dscp_wmm_mapping":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"di'
+    'sable","revisions":[2047,2047]}],"revisions":[2047,2047]},"uplink_sta":{"type":"integer","revisions":[2047,2047]},"dscp_wmm_bk":{"type":"list","childr'
+    'en":{"id":{"type":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"wmm_vo_dscp":{"type":"integer","revisions":[2040,2040]},"downlink":{"t'
+    'ype":"integer","revisions":[2047,2047]},"call_admission_control":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disa'
+    'ble","revisions":[2047,2047]}],"revisions":[2047,2047]},"wmm_be_dscp":{"type":"integer","revisions":[2040,2040]},"name":{"type":"string","revisions":['
+    '2047,2047]},"wmm_uapsd":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions'
+    '":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"burst":{"type":"str","required":false,"choices":["enable","disab'
+    'le"]},"wmm_bk_dscp":{"type":"int","required":false},"bandwidth_admission_control":{"type":"str","required":false,"choices":["enable","disable"]},"wmm_'
+    'dscp_marking":{"type":"str","required":false,"choices":["enable","disable"]},"bandwidth_capacity":{"type":"int","required":false},"downlink_sta":{"typ'
+    'e":"int","required":false},"call_capacity":{"type":"int","required":false},"dscp_wmm_vi":{"type":"list","required":false,"options":{"id":{"type":"int"'
+    ',"required":false}}},"dscp_wmm_vo":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"wmm_vi_dscp":{"type":"int","requ'
+    'ired":false},"wmm":{"type":"str","required":false,"choices":["enable","disable"]},"dscp_wmm_be":{"type":"list","required":false,"options":{"id":{"type'
+    '":"int","required":false}}},"uplink":{"type":"int","required":false},"dscp_wmm_mapping":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"uplink_sta":{"type":"int","required":false},"dscp_wmm_bk":{"type":"list","required":false,"options":{"id":{"type":"int","required":false}}},"wmm_vo_'
+    'dscp":{"type":"int","required":false},"downlink":{"type":"int","required":false},"call_admission_control":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"wmm_be_dscp":{"type":"int","required":false},"name":{"type":"str","required":false},"wmm_uapsd":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]}}}'
+)
@@ -0,0 +1,15 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"opacity":{"type":"integer","revisions":[2040,2040]},"image_type":{"type":"string","options":[{"value":"png","revisions":[1'
+    '6,16]},{"value":"jpeg","revisions":[16,16]},{"value":"gif","revisions":[16,16]}],"revisions":[2032,16]},"grayscale":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2'
+    '040]},"comments":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"opacity":{"type":"int","required":false},"image_type":{"type":"str","required":false},"grayscale":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"comments":{"type":"str","required":false}}}'
+)
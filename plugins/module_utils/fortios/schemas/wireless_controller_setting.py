@@ -0,0 +1,79 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"phishing_ssid_detect":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions'
+    '":[2040,2040]}],"revisions":[2040,2040]},"darrp_optimize":{"type":"integer","revisions":[2040,2040]},"offending_ssid":{"type":"list","children":{"acti'
+    'on":{"multiple_values":true,"type":"list","options":[{"value":"log","revisions":[2040,2040]},{"value":"suppress","revisions":[2040,2040]}],"revisions"'
+    ':[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]},"ssid_pattern":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"devi'
+    'ce_idle":{"type":"integer","revisions":[1920,1664]},"account_id":{"type":"string","revisions":[2047,2047]},"darrp_optimize_schedules":{"type":"list","'
+    'children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"country":{"type":"string","options":[{"value":"NA","revisions":'
+    '[2047,2047]},{"value":"AL","revisions":[2047,2047]},{"value":"DZ","revisions":[2047,2047]},{"value":"AO","revisions":[2047,2047]},{"value":"AR","revis'
+    'ions":[2047,2047]},{"value":"AM","revisions":[2047,2047]},{"value":"AU","revisions":[2047,2047]},{"value":"AT","revisions":[2047,2047]},{"value":"AZ",'
+    '"revisions":[2047,2047]},{"value":"BH","revisions":[2047,2047]},{"value":"BD","revisions":[2047,2047]},{"value":"BB","revisions":[2047,2047]},{"value"'
+    ':"BY","revisions":[2047,2047]},{"value":"BE","revisions":[2047,2047]},{"value":"BZ","revisions":[2047,2047]},{"value":"BO","revisions":[2047,2047]},{"'
+    'value":"BA","revisions":[2047,2047]},{"value":"BR","revisions":[2047,2047]},{"value":"BN","revisions":[2047,2047]},{"value":"BG","revisions":[2047,204'
+    '7]},{"value":"KH","revisions":[2047,2047]},{"value":"CL","revisions":[2047,2047]},{"value":"CN","revisions":[2047,2047]},{"value":"CO","revisions":[20'
+    '47,2047]},{"value":"CR","revisions":[2047,2047]},{"value":"HR","revisions":[2047,2047]},{"value":"CY","revisions":[2047,2047]},{"value":"CZ","revision'
+    's":[2047,2047]},{"value":"DK","revisions":[2047,2047]},{"value":"DO","revisions":[2047,2047]},{"value":"EC","revisions":[2047,2047]},{"value":"EG","re'
+    'visions":[2047,2047]},{"value":"SV","revisions":[2047,2047]},{"value":"EE","revisions":[2047,2047]},{"value":"FI","revisions":[2047,2047]},{"value":"F'
+    'R","revisions":[2047,2047]},{"value":"GE","revisions":[2047,2047]},{"value":"DE","revisions":[2047,2047]},{"value":"GR","revisions":[2047,2047]},{"val'
+    'ue":"GL","revisions":[2047,2047]},{"value":"GD","revisions":[2047,2047]},{"value":"GU","revisions":[2047,2047]},{"value":"GT","revisions":[2047,2047]}'
+    ',{"value":"HT","revisions":[2047,2047]},{"value":"HN","revisions":[2047,2047]},{"value":"HK","revisions":[2047,2047]},{"value":"HU","revisions":[2047,'
+    '2047]},{"value":"IS","revisions":[2047,2047]},{"value":"IN","revisions":[2047,2047]},{"value":"ID","revisions":[2047,2047]},{"value":"IR","revisions":'
+    '[2047,1023]},{"value":"IE","revisions":[2047,2047]},{"value":"IL","revisions":[2047,2047]},{"value":"IT","revisions":[2047,2047]},{"value":"JM","revis'
+    'ions":[2047,2047]},{"value":"JO","revisions":[2047,2047]},{"value":"KZ","revisions":[2047,2047]},{"value":"KE","revisions":[2047,2047]},{"value":"KP",'
+    '"revisions":[2047,1023]},{"value":"KR","revisions":[2047,2047]},{"value":"KW","revisions":[2047,2047]},{"value":"LV","revisions":[2047,2047]},{"value"'
+    ':"LB","revisions":[2047,2047]},{"value":"LI","revisions":[2047,2047]},{"value":"LT","revisions":[2047,2047]},{"value":"LU","revisions":[2047,2047]},{"'
+    'value":"MO","revisions":[2047,2047]},{"value":"MK","revisions":[2047,2047]},{"value":"MY","revisions":[2047,2047]},{"value":"MT","revisions":[2047,204'
+    '7]},{"value":"MX","revisions":[2047,2047]},{"value":"MC","revisions":[2047,2047]},{"value":"MA","revisions":[2047,2047]},{"value":"MZ","revisions":[20'
+    '47,2047]},{"value":"MM","revisions":[2047,2047]},{"value":"NP","revisions":[2047,2047]},{"value":"NL","revisions":[2047,2047]},{"value":"AN","revision'
+    's":[2047,2047]},{"value":"AW","revisions":[2047,2047]},{"value":"NZ","revisions":[2047,2047]},{"value":"NO","revisions":[2047,2047]},{"value":"OM","re'
+    'visions":[2047,2047]},{"value":"PK","revisions":[2047,2047]},{"value":"PA","revisions":[2047,2047]},{"value":"PG","revisions":[2047,2047]},{"value":"P'
+    'Y","revisions":[2047,2047]},{"value":"PE","revisions":[2047,2047]},{"value":"PH","revisions":[2047,2047]},{"value":"PL","revisions":[2047,2047]},{"val'
+    'ue":"PT","revisions":[2047,2047]},{"value":"PR","revisions":[2047,2047]},{"value":"QA","revisions":[2047,2047]},{"value":"RO","revisions":[2047,2047]}'
+    ',{"value":"RU","revisions":[2047,2047]},{"value":"RW","revisions":[2047,2047]},{"value":"SA","revisions":[2047,2047]},{"value":"RS","revisions":[2047,'
+    '2047]},{"value":"ME","revisions":[2047,2047]},{"value":"SG","revisions":[2047,2047]},{"value":"SK","revisions":[2047,2047]},{"value":"SI","revisions":'
+    '[2047,2047]},{"value":"ZA","revisions":[2047,2047]},{"value":"ES","revisions":[2047,2047]},{"value":"LK","revisions":[2047,2047]},{"value":"SE","revis'
+    'ions":[2047,2047]},{"value":"SD","revisions":[2047,1023]},{"value":"CH","revisions":[2047,2047]},{"value":"SY","revisions":[2047,1023]},{"value":"TW",'
+    '"revisions":[2047,2047]},{"value":"TZ","revisions":[2047,2047]},{"value":"TH","revisions":[2047,2047]},{"value":"TT","revisions":[2047,2047]},{"value"'
+    ':"TN","revisions":[2047,2047]},{"value":"TR","revisions":[2047,2047]},{"value":"AE","revisions":[2047,2047]},{"value":"UA","revisions":[2047,2047]},{"'
+    'value":"GB","revisions":[2047,2047]},{"value":"US","revisions":[2047,2047]},{"value":"PS","revisions":[2047,2047]},{"value":"UY","revisions":[2047,204'
+    '7]},{"value":"UZ","revisions":[2047,2047]},{"value":"VE","revisions":[2047,2047]},{"value":"VN","revisions":[2047,2047]},{"value":"YE","revisions":[20'
+    '47,2047]},{"value":"ZB","revisions":[2047,1023]},{"value":"ZW","revisions":[2047,2047]},{"value":"JP","revisions":[2047,2047]},{"value":"CA","revision'
+    's":[2047,2047]},{"value":"CF","revisions":[2040,2040]},{"value":"BS","revisions":[1920,1920]},{"value":"BF","revisions":[1920,1664]},{"value":"KY","re'
+    'visions":[1920,1664]},{"value":"CX","revisions":[1920,1664]},{"value":"GH","revisions":[1920,1664]},{"value":"GY","revisions":[1920,1664]},{"value":"C'
+    'I","revisions":[1920,1664]},{"value":"MW","revisions":[1920,1664]},{"value":"MV","revisions":[1920,1664]},{"value":"FM","revisions":[1920,1664]},{"val'
+    'ue":"KN","revisions":[1920,1664]},{"value":"LC","revisions":[1920,1664]},{"value":"VC","revisions":[1920,1664]},{"value":"SN","revisions":[1920,1664]}'
+    ',{"value":"TM","revisions":[1920,1664]},{"value":"TC","revisions":[1920,1664]},{"value":"UG","revisions":[1920,1664]},{"value":"VU","revisions":[1920,'
+    '1664]},{"value":"AF","revisions":[1024,1024]},{"value":"AS","revisions":[1024,1024]},{"value":"BJ","revisions":[1024,1024]},{"value":"BM","revisions":'
+    '[1024,1024]},{"value":"BT","revisions":[1024,1024]},{"value":"BW","revisions":[1024,1024]},{"value":"CM","revisions":[1024,1024]},{"value":"TD","revis'
+    'ions":[1024,1024]},{"value":"CG","revisions":[1024,1024]},{"value":"CD","revisions":[1024,1024]},{"value":"DM","revisions":[1024,1024]},{"value":"ET",'
+    '"revisions":[1024,1024]},{"value":"GF","revisions":[1024,1024]},{"value":"PF","revisions":[1024,1024]},{"value":"FO","revisions":[1024,1024]},{"value"'
+    ':"FJ","revisions":[1024,1024]},{"value":"GI","revisions":[1024,1024]},{"value":"GP","revisions":[1024,1024]},{"value":"IQ","revisions":[1024,1024]},{"'
+    'value":"IM","revisions":[1024,1024]},{"value":"LA","revisions":[1024,1024]},{"value":"LS","revisions":[1024,1024]},{"value":"LY","revisions":[1024,102'
+    '4]},{"value":"MG","revisions":[1024,1024]},{"value":"ML","revisions":[1024,1024]},{"value":"MH","revisions":[1024,1024]},{"value":"MQ","revisions":[10'
+    '24,1024]},{"value":"MR","revisions":[1024,1024]},{"value":"MU","revisions":[1024,1024]},{"value":"YT","revisions":[1024,1024]},{"value":"MD","revision'
+    's":[1024,1024]},{"value":"NI","revisions":[1024,1024]},{"value":"NE","revisions":[1024,1024]},{"value":"MP","revisions":[1024,1024]},{"value":"PW","re'
+    'visions":[1024,1024]},{"value":"RE","revisions":[1024,1024]},{"value":"BL","revisions":[1024,1024]},{"value":"MF","revisions":[1024,1024]},{"value":"P'
+    'M","revisions":[1024,1024]},{"value":"SL","revisions":[1024,1024]},{"value":"SR","revisions":[1024,1024]},{"value":"TG","revisions":[1024,1024]},{"val'
+    'ue":"VI","revisions":[1024,1024]},{"value":"WF","revisions":[1024,1024]},{"value":"ZM","revisions":[1024,1024]}],"revisions":[2047,2047]},"fapc_compat'
+    'ibility":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"device_weight":{"type":"integer","revisions":[1920,1664]},"duplicate_ssid":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"v'
+    'alue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"wfa_compatibility":{"type":"string","options":[{"value":"enable","revisions":[2040'
+    ',2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"fake_ssid_action":{"multiple_values":true,"type":"list","options":[{"va'
+    'lue":"log","revisions":[2040,2040]},{"value":"suppress","revisions":[2040,2040]}],"revisions":[2040,2040]},"device_holdoff":{"type":"integer","revisio'
+    'ns":[1920,1664]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"phishing_ssid_detect":{"type":"str","required":false,"choices":["enable","disable"]},"darrp_optimize":{"ty'
+    'pe":"int","required":false},"offending_ssid":{"type":"list","required":false,"options":{"action":{"type":"list","required":false,"choices":["log","sup'
+    'press"]},"id":{"type":"int","required":false},"ssid_pattern":{"type":"str","required":false}}},"device_idle":{"type":"int","required":false},"account_'
+    'id":{"type":"str","required":false},"darrp_optimize_schedules":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"co'
+    'untry":{"type":"str","required":false},"fapc_compatibility":{"type":"str","required":false,"choices":["enable","disable"]},"device_weight":{"type":"in'
+    't","required":false},"duplicate_ssid":{"type":"str","required":false,"choices":["enable","disable"]},"wfa_compatibility":{"type":"str","required":fals'
+    'e,"choices":["enable","disable"]},"fake_ssid_action":{"type":"list","required":false,"choices":["log","suppress"]},"device_holdoff":{"type":"int","req'
+    'uired":false}}}'
+)
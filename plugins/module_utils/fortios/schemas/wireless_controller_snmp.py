@@ -0,0 +1,39 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"contact_info":{"type":"string","revisions":[2040,2040]},"engine_id":{"type":"string","revisions":[2040,2040]},"community":'
+    '{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}'
+    '],"revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]},"query_v1_status":{"type":"string","options":[{"value":"enable","revisions'
+    '":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"hosts":{"type":"list","children":{"ip":{"type":"string","revisio'
+    'ns":[2040,2040]},"id":{"type":"integer","revisions":[2040,2040]}},"revisions":[2040,2040]},"trap_v2c_status":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"query_v2c_status":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"id":{"type":"integer","revisions":[2040'
+    ',2040]},"trap_v1_status":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revision'
+    's":[2040,2040]}},"revisions":[2040,2040]},"user":{"type":"list","children":{"status":{"type":"string","options":[{"value":"enable","revisions":[2040,2'
+    '040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"trap_status":{"type":"string","options":[{"value":"enable","revisions":[2'
+    '040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"name":{"type":"string","revisions":[2040,2040]},"auth_pwd":{"type":"'
+    'string","revisions":[2040,2040]},"priv_pwd":{"type":"string","revisions":[2040,2040]},"priv_proto":{"type":"string","options":[{"value":"aes","revisio'
+    'ns":[2040,2040]},{"value":"des","revisions":[2040,2040]},{"value":"aes256","revisions":[2040,2040]},{"value":"aes256cisco","revisions":[2040,2040]}],"'
+    'revisions":[2040,2040]},"queries":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],'
+    '"revisions":[2040,2040]},"notify_hosts":{"type":"string","revisions":[2040,2040]},"security_level":{"type":"string","options":[{"value":"no-auth-no-pr'
+    'iv","revisions":[2040,2040]},{"value":"auth-no-priv","revisions":[2040,2040]},{"value":"auth-priv","revisions":[2040,2040]}],"revisions":[2040,2040]},'
+    '"auth_proto":{"type":"string","options":[{"value":"md5","revisions":[2040,2040]},{"value":"sha","revisions":[2040,2040]}],"revisions":[2040,2040]}},"r'
+    'evisions":[2040,2040]},"trap_high_cpu_threshold":{"type":"integer","revisions":[2040,2040]},"trap_high_mem_threshold":{"type":"integer","revisions":[2'
+    '040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"contact_info":{"type":"str","required":false},"engine_id":{"type":"str","required":false},"community":{"ty'
+    'pe":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},'
+    '"query_v1_status":{"type":"str","required":false,"choices":["enable","disable"]},"hosts":{"type":"list","required":false,"options":{"ip":{"type":"str"'
+    ',"required":false},"id":{"type":"int","required":false}}},"trap_v2c_status":{"type":"str","required":false,"choices":["enable","disable"]},"query_v2c_'
+    'status":{"type":"str","required":false,"choices":["enable","disable"]},"id":{"type":"int","required":false},"trap_v1_status":{"type":"str","required":'
+    'false,"choices":["enable","disable"]}}},"user":{"type":"list","required":false,"options":{"status":{"type":"str","required":false,"choices":["enable",'
+    '"disable"]},"trap_status":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"auth_pwd":{"type":"st'
+    'r","required":false},"priv_pwd":{"type":"str","required":false},"priv_proto":{"type":"str","required":false,"choices":["aes","des","aes256","aes256cis'
+    'co"]},"queries":{"type":"str","required":false,"choices":["enable","disable"]},"notify_hosts":{"type":"str","required":false},"security_level":{"type"'
+    ':"str","required":false,"choices":["no-auth-no-priv","auth-no-priv","auth-priv"]},"auth_proto":{"type":"str","required":false,"choices":["md5","sha"]}'
+    '}},"trap_high_cpu_threshold":{"type":"int","required":false},"trap_high_mem_threshold":{"type":"int","required":false}}}'
+)
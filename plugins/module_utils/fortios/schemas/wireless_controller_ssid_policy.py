@@ -0,0 +1,13 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"vlan":{"type":"string","revisions":[1024,1024]},"name":{"type":"string","revisions":[1024,1024]},"description":{"type":"st'
+    'ring","revisions":[1024,1024]}},"revisions":[1024,1024]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"vlan":{"type":"str","required":false},"name":{"type":"str","required":false},"description":{"type":"str","'
+    'required":false}}}'
+)
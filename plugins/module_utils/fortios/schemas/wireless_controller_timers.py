@@ -0,0 +1,26 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"dict","children":{"discovery_interval":{"type":"integer","revisions":[2047,2047]},"darrp_optimize":{"type":"integer","revisions":[2047,7]},"s'
+    'ta_capability_interval":{"type":"integer","revisions":[2047,2047]},"fake_ap_log":{"type":"integer","revisions":[2047,2047]},"sta_stats_interval":{"typ'
+    'e":"integer","revisions":[2047,2047]},"darrp_time":{"type":"list","children":{"time":{"type":"string","revisions":[7,7]}},"revisions":[2047,7]},"clien'
+    't_idle_timeout":{"type":"integer","revisions":[2047,2047]},"darrp_day":{"type":"string","options":[{"value":"sunday","revisions":[7,7]},{"value":"mond'
+    'ay","revisions":[7,7]},{"value":"tuesday","revisions":[7,7]},{"value":"wednesday","revisions":[7,7]},{"value":"thursday","revisions":[7,7]},{"value":"'
+    'friday","revisions":[7,7]},{"value":"saturday","revisions":[7,7]}],"revisions":[2047,7]},"ble_scan_report_intv":{"type":"integer","revisions":[2047,20'
+    '47]},"ipsec_intf_cleanup":{"type":"integer","revisions":[2047,2047]},"radio_stats_interval":{"type":"integer","revisions":[2047,2047]},"echo_interval"'
+    ':{"type":"integer","revisions":[2047,2047]},"sta_locate_timer":{"type":"integer","revisions":[2047,2047]},"vap_stats_interval":{"type":"integer","revi'
+    'sions":[2047,2047]},"drma_interval":{"type":"integer","revisions":[1536,1536]},"rogue_ap_log":{"type":"integer","revisions":[2047,2047]}},"revisions":'
+    '[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"dict","required":false,"options":{"discovery_interval":{"type":"int","required":false},"darrp_optimize":{"type":"int","required":false},"sta_'
+    'capability_interval":{"type":"int","required":false},"fake_ap_log":{"type":"int","required":false},"sta_stats_interval":{"type":"int","required":false'
+    '},"darrp_time":{"type":"list","required":false,"options":{"time":{"type":"str","required":false}}},"client_idle_timeout":{"type":"int","required":fals'
+    'e},"darrp_day":{"type":"str","required":false},"ble_scan_report_intv":{"type":"int","required":false},"ipsec_intf_cleanup":{"type":"int","required":fa'
+    'lse},"radio_stats_interval":{"type":"int","required":false},"echo_interval":{"type":"int","required":false},"sta_locate_timer":{"type":"int","required'
+    '":false},"vap_stats_interval":{"type":"int","required":false},"drma_interval":{"type":"int","required":false},"rogue_ap_log":{"type":"int","required":'
+    'false}}}'
+)
@@ -0,0 +1,19 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"antivirus_profile":{"type":"string","revisions":[2047,2047]},"webfilte'
+    'r_profile":{"type":"string","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"scan_botnet_connections":{"type":"string","opti'
+    'ons":[{"value":"disable","revisions":[2047,2047]},{"value":"monitor","revisions":[2047,2047]},{"value":"block","revisions":[2047,2047]}],"revisions":['
+    '2047,2047]},"utm_log":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"application_list":{"type":"string","revisions":[2047,2047]},"ips_sensor":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,20'
+    '47]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"antivirus_profile":{"type":"str","required":false},"webfilter_pr'
+    'ofile":{"type":"str","required":false},"name":{"type":"str","required":false},"scan_botnet_connections":{"type":"str","required":false,"choices":["dis'
+    'able","monitor","block"]},"utm_log":{"type":"str","required":false,"choices":["enable","disable"]},"application_list":{"type":"str","required":false},'
+    '"ips_sensor":{"type":"str","required":false}}}'
+)
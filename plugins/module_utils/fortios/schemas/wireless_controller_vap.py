@@ -0,0 +1,264 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"dhcp_option43_insertion":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisi'
+    'ons":[1920,1920]}],"revisions":[1920,1920]},"captive_portal_radius_secret":{"type":"string","revisions":[2047,127]},"captive_portal_macauth_radius_sec'
+    'ret":{"type":"string","revisions":[2047,127]},"mesh_backhaul":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"rates_11ac_ss34":{"multiple_values":true,"type":"list","options":[{"value":"mcs0/3","revisions":'
+    '[2047,2047]},{"value":"mcs1/3","revisions":[2047,2047]},{"value":"mcs2/3","revisions":[2047,2047]},{"value":"mcs3/3","revisions":[2047,2047]},{"value"'
+    ':"mcs4/3","revisions":[2047,2047]},{"value":"mcs5/3","revisions":[2047,2047]},{"value":"mcs6/3","revisions":[2047,2047]},{"value":"mcs7/3","revisions"'
+    ':[2047,2047]},{"value":"mcs8/3","revisions":[2047,2047]},{"value":"mcs9/3","revisions":[2047,2047]},{"value":"mcs10/3","revisions":[2047,2047]},{"valu'
+    'e":"mcs11/3","revisions":[2047,2047]},{"value":"mcs0/4","revisions":[2047,2047]},{"value":"mcs1/4","revisions":[2047,2047]},{"value":"mcs2/4","revisio'
+    'ns":[2047,2047]},{"value":"mcs3/4","revisions":[2047,2047]},{"value":"mcs4/4","revisions":[2047,2047]},{"value":"mcs5/4","revisions":[2047,2047]},{"va'
+    'lue":"mcs6/4","revisions":[2047,2047]},{"value":"mcs7/4","revisions":[2047,2047]},{"value":"mcs8/4","revisions":[2047,2047]},{"value":"mcs9/4","revisi'
+    'ons":[2047,2047]},{"value":"mcs10/4","revisions":[2047,2047]},{"value":"mcs11/4","revisions":[2047,2047]}],"revisions":[2047,2047]},"radio_5g_threshol'
+    'd":{"type":"string","revisions":[2047,2047]},"radius_mac_auth_usergroups":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}}'
+    ',"revisions":[2047,2047]},"port_macauth_timeout":{"type":"integer","revisions":[1536,1536]},"nac_profile":{"type":"string","revisions":[1024,1024]},"o'
+    'we_transition_ssid":{"type":"string","revisions":[2040,2040]},"keyindex":{"type":"integer","revisions":[2047,2047]},"local_bridging":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"mu_mimo":{"type":"string"'
+    ',"options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"mac_password_delimiter":'
+    '{"type":"string","options":[{"value":"hyphen","revisions":[1024,1024]},{"value":"single-hyphen","revisions":[1024,1024]},{"value":"colon","revisions":'
+    '[1024,1024]},{"value":"none","revisions":[1024,1024]}],"revisions":[1024,1024]},"auth":{"type":"string","options":[{"value":"psk","revisions":[2047,20'
+    '47]},{"value":"radius","revisions":[2047,2047]},{"value":"usergroup","revisions":[2047,2047]}],"revisions":[2047,2047]},"voice_enterprise":{"type":"st'
+    'ring","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"okc":{"type":"strin'
+    'g","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ldpc":{"type":"string"'
+    ',"options":[{"value":"disable","revisions":[2047,2047]},{"value":"rx","revisions":[2047,2047]},{"value":"tx","revisions":[2047,2047]},{"value":"rxtx",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"dhcp_lease_time":{"type":"integer","revisions":[2047,2047]},"secondary_wag_profile":{"type":"strin'
+    'g","revisions":[2040,2040]},"mac_auth_bypass":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"local_standalone_nat":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"atf_weight":{"type":"integer","revisions":[2040,2040]},"name":{"type":"string","revisions":[2047,2'
+    '047]},"eapol_key_retries":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"quarantine":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"mac_filter_policy_other":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"radio_sensitivity":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"mpsk_profile":{"type":"string","revisions":[1920,1664]},"sticky_client_remove":{"type":"string","options'
+    '":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"radio_2g_threshold":{"type":"stri'
+    'ng","revisions":[2047,2047]},"portal_message_override_group":{"type":"string","revisions":[2047,2047]},"tunnel_fallback_interval":{"type":"integer","r'
+    'evisions":[2040,2040]},"access_control_list":{"type":"string","revisions":[1920,1920]},"security":{"type":"string","options":[{"value":"open","revisio'
+    'ns":[2047,2047]},{"value":"captive-portal","revisions":[2047,2047]},{"value":"wep64","revisions":[2047,2047]},{"value":"wep128","revisions":[2047,2047'
+    ']},{"value":"wpa-personal","revisions":[2047,2047]},{"value":"wpa-personal+captive-portal","revisions":[2047,2047]},{"value":"wpa-enterprise","revisio'
+    'ns":[2047,2047]},{"value":"wpa-only-personal","revisions":[2047,2047]},{"value":"wpa-only-personal+captive-portal","revisions":[2047,2047]},{"value":"'
+    'wpa-only-enterprise","revisions":[2047,2047]},{"value":"wpa2-only-personal","revisions":[2047,2047]},{"value":"wpa2-only-personal+captive-portal","rev'
+    'isions":[2047,2047]},{"value":"wpa2-only-enterprise","revisions":[2047,2047]},{"value":"osen","revisions":[2047,2047]},{"value":"wpa3-enterprise","rev'
+    'isions":[2040,2040]},{"value":"wpa3-sae","revisions":[2040,2040]},{"value":"wpa3-sae-transition","revisions":[2040,2040]},{"value":"owe","revisions":['
+    '2040,2040]},{"value":"wpa3-only-enterprise","revisions":[1024,1024]},{"value":"wpa3-enterprise-transition","revisions":[1024,1024]}],"revisions":[2047'
+    ',2047]},"hotspot20_profile":{"type":"string","revisions":[2047,2047]},"radius_server":{"type":"string","revisions":[2047,2047]},"address_group":{"type'
+    '":"string","revisions":[2040,2040]},"rates_11a":{"multiple_values":true,"type":"list","options":[{"value":"1","revisions":[2047,2047]},{"value":"1-bas'
+    'ic","revisions":[2047,2047]},{"value":"2","revisions":[2047,2047]},{"value":"2-basic","revisions":[2047,2047]},{"value":"5.5","revisions":[2047,2047]}'
+    ',{"value":"5.5-basic","revisions":[2047,2047]},{"value":"11","revisions":[2047,2047]},{"value":"11-basic","revisions":[2047,2047]},{"value":"6","revis'
+    'ions":[2047,2047]},{"value":"6-basic","revisions":[2047,2047]},{"value":"9","revisions":[2047,2047]},{"value":"9-basic","revisions":[2047,2047]},{"val'
+    'ue":"12","revisions":[2047,2047]},{"value":"12-basic","revisions":[2047,2047]},{"value":"18","revisions":[2047,2047]},{"value":"18-basic","revisions":'
+    '[2047,2047]},{"value":"24","revisions":[2047,2047]},{"value":"24-basic","revisions":[2047,2047]},{"value":"36","revisions":[2047,2047]},{"value":"36-b'
+    'asic","revisions":[2047,2047]},{"value":"48","revisions":[2047,2047]},{"value":"48-basic","revisions":[2047,2047]},{"value":"54","revisions":[2047,204'
+    '7]},{"value":"54-basic","revisions":[2047,2047]}],"revisions":[2047,2047]},"ptk_rekey":{"type":"string","options":[{"value":"enable","revisions":[2047'
+    ',2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ptk_rekey_intv":{"type":"integer","revisions":[2047,2047]},"usergroup":'
+    '{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"mac_username_delimiter":{"type":"string","optio'
+    'ns":[{"value":"hyphen","revisions":[1024,1024]},{"value":"single-hyphen","revisions":[1024,1024]},{"value":"colon","revisions":[1024,1024]},{"value":"'
+    'none","revisions":[1024,1024]}],"revisions":[1024,1024]},"vlan_pool":{"type":"list","children":{"id":{"type":"integer","revisions":[2047,2047]},"wtp_g'
+    'roup":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"ipv6_rules":{"multiple_values":true,"type":"list","options":[{"value":"drop'
+    '-icmp6ra","revisions":[1920,1920]},{"value":"drop-icmp6rs","revisions":[1920,1920]},{"value":"drop-llmnr6","revisions":[1920,1920]},{"value":"drop-icm'
+    'p6mld2","revisions":[1920,1920]},{"value":"drop-dhcp6s","revisions":[1920,1920]},{"value":"drop-dhcp6c","revisions":[1920,1920]},{"value":"ndp-proxy",'
+    '"revisions":[1920,1920]},{"value":"drop-ns-dad","revisions":[1920,1920]},{"value":"drop-ns-nondad","revisions":[1920,1920]}],"revisions":[1920,1920]},'
+    '"acct_interim_interval":{"type":"integer","revisions":[2047,127]},"tunnel_echo_interval":{"type":"integer","revisions":[2040,2040]},"passphrase":{"typ'
+    'e":"string","revisions":[2047,2047]},"ssid":{"type":"string","revisions":[2047,2047]},"vlan_pooling":{"type":"string","options":[{"value":"wtp-group",'
+    '"revisions":[2047,2047]},{"value":"round-robin","revisions":[2047,2047]},{"value":"hash","revisions":[2047,2047]},{"value":"disable","revisions":[2047'
+    ',2047]}],"revisions":[2047,2047]},"schedule":{"type":"string","revisions":[2047,2047]},"tkip_counter_measure":{"type":"string","options":[{"value":"en'
+    'able","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"vlanid":{"type":"integer","revisions":[2047,2047'
+    ']},"neighbor_report_dual_band":{"type":"string","options":[{"value":"disable","revisions":[1024,1024]},{"value":"enable","revisions":[1024,1024]}],"re'
+    'visions":[1024,1024]},"max_clients_ap":{"type":"integer","revisions":[2047,2047]},"local_lan":{"type":"string","options":[{"value":"allow","revisions"'
+    ':[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]},"gas_fragmentation_limit":{"type":"integer","revisions":[1024,1024]},'
+    '"mac_filter_list":{"type":"list","children":{"mac":{"type":"string","revisions":[2047,2047]},"id":{"type":"integer","revisions":[2047,2047]},"mac_filt'
+    'er_policy":{"type":"string","options":[{"value":"allow","revisions":[2047,2047]},{"value":"deny","revisions":[2047,2047]}],"revisions":[2047,2047]}},"'
+    'revisions":[2047,2047]},"external_web_format":{"type":"string","options":[{"value":"auto-detect","revisions":[2040,2040]},{"value":"no-query-string","'
+    'revisions":[2040,2040]},{"value":"partial-query-string","revisions":[2040,2040]}],"revisions":[2040,2040]},"gtk_rekey":{"type":"string","options":[{"v'
+    'alue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"security_obsolete_option":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[23,23]},{"value":"disable","revisions":[23,23]}],"revisions":[2047,23]},"key":{"type":"string","revision'
+    's":[2047,2047]},"mac_called_station_delimiter":{"type":"string","options":[{"value":"hyphen","revisions":[1024,1024]},{"value":"single-hyphen","revisi'
+    'ons":[1024,1024]},{"value":"colon","revisions":[1024,1024]},{"value":"none","revisions":[1024,1024]}],"revisions":[1024,1024]},"dhcp_address_enforceme'
+    'nt":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"port'
+    '_macauth_reauth_timeout":{"type":"integer","revisions":[1536,1536]},"vdom":{"type":"string","revisions":[2047,7]},"bstm_rssi_disassoc_timer":{"type":"'
+    'integer","revisions":[1024,1024]},"gtk_rekey_intv":{"type":"integer","revisions":[2047,2047]},"mpsk":{"type":"string","options":[{"value":"enable","re'
+    'visions":[383,383]},{"value":"disable","revisions":[383,383]}],"revisions":[2047,383]},"security_exempt_list":{"type":"string","revisions":[2047,2047]'
+    '},"mac_filter":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"sticky_client_threshold_2g":{"type":"string","revisions":[1920,1920]},"mac_case":{"type":"string","options":[{"value":"uppercase","revisions":['
+    '1024,1024]},{"value":"lowercase","revisions":[1024,1024]}],"revisions":[1024,1024]},"mbo":{"type":"string","options":[{"value":"disable","revisions":['
+    '1024,1024]},{"value":"enable","revisions":[1024,1024]}],"revisions":[1024,1024]},"target_wake_time":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"bstm_load_balancing_disassoc_timer":{"type":"integer","rev'
+    'isions":[1024,1024]},"probe_resp_suppression":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"captive_portal_auth_timeout":{"type":"integer","revisions":[1920,1920]},"mbo_cell_data_conn_pref":{"type":"strin'
+    'g","options":[{"value":"excluded","revisions":[1024,1024]},{"value":"prefer-not","revisions":[1024,1024]},{"value":"prefer-use","revisions":[1024,1024'
+    ']}],"revisions":[1024,1024]},"mpsk_concurrent_clients":{"type":"integer","revisions":[2047,383]},"external_fast_roaming":{"type":"string","options":[{'
+    '"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"bstm_disassociation_imminent":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"external_logout'
+    '":{"type":"string","revisions":[2047,2047]},"vlan_auto":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"sticky_client_threshold_5g":{"type":"string","revisions":[1920,1920]},"owe_groups":{"multiple_values":'
+    'true,"type":"list","options":[{"value":"19","revisions":[2040,2040]},{"value":"20","revisions":[2040,2040]},{"value":"21","revisions":[2040,2040]}],"r'
+    'evisions":[2040,2040]},"ip":{"type":"string","revisions":[2047,2047]},"dhcp_option82_remote_id_insertion":{"type":"string","options":[{"value":"style-'
+    '1","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"pmf_assoc_comeback_timeout":{"type":"integer","revi'
+    'sions":[2047,2047]},"local_standalone":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"portal_type":{"type":"string","options":[{"value":"auth","revisions":[2047,2047]},{"value":"auth+disclaimer","revisions'
+    '":[2047,2047]},{"value":"disclaimer","revisions":[2047,2047]},{"value":"email-collect","revisions":[2047,2047]},{"value":"cmcc","revisions":[2047,2047'
+    ']},{"value":"cmcc-macauth","revisions":[2047,2047]},{"value":"auth-mac","revisions":[2047,2047]},{"value":"external-auth","revisions":[2040,2040]},{"v'
+    'alue":"external-macauth","revisions":[1024,1024]}],"revisions":[2047,2047]},"port_macauth":{"type":"string","options":[{"value":"disable","revisions":'
+    '[1536,1536]},{"value":"radius","revisions":[1536,1536]},{"value":"address-group","revisions":[1536,1536]}],"revisions":[1536,1536]},"high_efficiency":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"local_au'
+    'thentication":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,20'
+    '47]},"external_web":{"type":"string","revisions":[2047,2047]},"qos_profile":{"type":"string","revisions":[2047,2047]},"utm_profile":{"type":"string","'
+    'revisions":[2047,2047]},"rates_11n_ss12":{"multiple_values":true,"type":"list","options":[{"value":"mcs0/1","revisions":[2047,2047]},{"value":"mcs1/1"'
+    ',"revisions":[2047,2047]},{"value":"mcs2/1","revisions":[2047,2047]},{"value":"mcs3/1","revisions":[2047,2047]},{"value":"mcs4/1","revisions":[2047,20'
+    '47]},{"value":"mcs5/1","revisions":[2047,2047]},{"value":"mcs6/1","revisions":[2047,2047]},{"value":"mcs7/1","revisions":[2047,2047]},{"value":"mcs8/2'
+    '","revisions":[2047,2047]},{"value":"mcs9/2","revisions":[2047,2047]},{"value":"mcs10/2","revisions":[2047,2047]},{"value":"mcs11/2","revisions":[2047'
+    ',2047]},{"value":"mcs12/2","revisions":[2047,2047]},{"value":"mcs13/2","revisions":[2047,2047]},{"value":"mcs14/2","revisions":[2047,2047]},{"value":"'
+    'mcs15/2","revisions":[2047,2047]}],"revisions":[2047,2047]},"primary_wag_profile":{"type":"string","revisions":[2040,2040]},"security_redirect_url":{"'
+    'type":"string","revisions":[2047,2047]},"pmf_sa_query_retry_timeout":{"type":"integer","revisions":[2047,2047]},"me_disable_thresh":{"type":"integer",'
+    '"revisions":[2047,2047]},"fast_bss_transition":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":['
+    '2047,2047]}],"revisions":[2047,2047]},"broadcast_suppression":{"multiple_values":true,"type":"list","options":[{"value":"dhcp-up","revisions":[2047,20'
+    '47]},{"value":"dhcp-down","revisions":[2047,2047]},{"value":"dhcp-starvation","revisions":[2047,2047]},{"value":"arp-known","revisions":[2047,2047]},{'
+    '"value":"arp-unknown","revisions":[2047,2047]},{"value":"arp-reply","revisions":[2047,2047]},{"value":"arp-poison","revisions":[2047,2047]},{"value":"'
+    'arp-proxy","revisions":[2047,2047]},{"value":"netbios-ns","revisions":[2047,2047]},{"value":"netbios-ds","revisions":[2047,2047]},{"value":"ipv6","rev'
+    'isions":[2047,2047]},{"value":"all-other-mc","revisions":[2047,2047]},{"value":"all-other-bc","revisions":[2047,2047]},{"value":"dhcp-ucast","revision'
+    's":[2040,2040]}],"revisions":[2047,2047]},"pmf":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":'
+    '[2047,2047]},{"value":"optional","revisions":[2047,2047]}],"revisions":[2047,2047]},"sae_groups":{"multiple_values":true,"type":"list","options":[{"va'
+    'lue":"19","revisions":[2040,2040]},{"value":"20","revisions":[2040,2040]},{"value":"21","revisions":[2040,2040]},{"value":"1","revisions":[2032,16]},{'
+    '"value":"2","revisions":[2032,16]},{"value":"5","revisions":[2032,16]},{"value":"14","revisions":[2032,16]},{"value":"15","revisions":[2032,16]},{"val'
+    'ue":"16","revisions":[2032,16]},{"value":"17","revisions":[2032,16]},{"value":"18","revisions":[2032,16]},{"value":"27","revisions":[2032,16]},{"value'
+    '":"28","revisions":[2032,16]},{"value":"29","revisions":[2032,16]},{"value":"30","revisions":[2032,16]},{"value":"31","revisions":[2032,16]}],"revisio'
+    'ns":[2040,2040]},"broadcast_ssid":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"multicast_enhance":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[20'
+    '47,2047]}],"revisions":[2047,2047]},"rates_11n_ss34":{"multiple_values":true,"type":"list","options":[{"value":"mcs16/3","revisions":[2047,2047]},{"va'
+    'lue":"mcs17/3","revisions":[2047,2047]},{"value":"mcs18/3","revisions":[2047,2047]},{"value":"mcs19/3","revisions":[2047,2047]},{"value":"mcs20/3","re'
+    'visions":[2047,2047]},{"value":"mcs21/3","revisions":[2047,2047]},{"value":"mcs22/3","revisions":[2047,2047]},{"value":"mcs23/3","revisions":[2047,204'
+    '7]},{"value":"mcs24/4","revisions":[2047,2047]},{"value":"mcs25/4","revisions":[2047,2047]},{"value":"mcs26/4","revisions":[2047,2047]},{"value":"mcs2'
+    '7/4","revisions":[2047,2047]},{"value":"mcs28/4","revisions":[2047,2047]},{"value":"mcs29/4","revisions":[2047,2047]},{"value":"mcs30/4","revisions":['
+    '2047,2047]},{"value":"mcs31/4","revisions":[2047,2047]}],"revisions":[2047,2047]},"bss_color_partial":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[1664,1664]},{"value":"disable","revisions":[1664,1664]}],"revisions":[1920,1664]},"multicast_rate":{"type":"string","options":[{"value":"0"'
+    ',"revisions":[2047,2047]},{"value":"6000","revisions":[2047,2047]},{"value":"12000","revisions":[2047,2047]},{"value":"24000","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"ft_over_ds":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,20'
+    '47]}],"revisions":[2047,2047]},"radius_mac_auth":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"additional_akms":{"multiple_values":true,"type":"list","options":[{"value":"akm6","revisions":[1024,1024]}],"'
+    'revisions":[1024,1024]},"fast_roaming":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]},"sae_password":{"type":"string","revisions":[2040,2040]},"rates_11ac_ss12":{"multiple_values":true,"type":"list","option'
+    's":[{"value":"mcs0/1","revisions":[2047,2047]},{"value":"mcs1/1","revisions":[2047,2047]},{"value":"mcs2/1","revisions":[2047,2047]},{"value":"mcs3/1"'
+    ',"revisions":[2047,2047]},{"value":"mcs4/1","revisions":[2047,2047]},{"value":"mcs5/1","revisions":[2047,2047]},{"value":"mcs6/1","revisions":[2047,20'
+    '47]},{"value":"mcs7/1","revisions":[2047,2047]},{"value":"mcs8/1","revisions":[2047,2047]},{"value":"mcs9/1","revisions":[2047,2047]},{"value":"mcs10/'
+    '1","revisions":[2047,2047]},{"value":"mcs11/1","revisions":[2047,2047]},{"value":"mcs0/2","revisions":[2047,2047]},{"value":"mcs1/2","revisions":[2047'
+    ',2047]},{"value":"mcs2/2","revisions":[2047,2047]},{"value":"mcs3/2","revisions":[2047,2047]},{"value":"mcs4/2","revisions":[2047,2047]},{"value":"mcs'
+    '5/2","revisions":[2047,2047]},{"value":"mcs6/2","revisions":[2047,2047]},{"value":"mcs7/2","revisions":[2047,2047]},{"value":"mcs8/2","revisions":[204'
+    '7,2047]},{"value":"mcs9/2","revisions":[2047,2047]},{"value":"mcs10/2","revisions":[2047,2047]},{"value":"mcs11/2","revisions":[2047,2047]}],"revision'
+    's":[2047,2047]},"captive_portal_radius_server":{"type":"string","revisions":[2047,127]},"nac":{"type":"string","options":[{"value":"enable","revisions'
+    '":[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"encrypt":{"type":"string","options":[{"value":"TKIP","revisions"'
+    ':[2047,2047]},{"value":"AES","revisions":[2047,2047]},{"value":"TKIP-AES","revisions":[2047,2047]}],"revisions":[2047,2047]},"eap_reauth_intv":{"type"'
+    ':"integer","revisions":[2047,2047]},"split_tunneling":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"ft_r0_key_lifetime":{"type":"integer","revisions":[2047,2047]},"igmp_snooping":{"type":"string","options'
+    '":[{"value":"enable","revisions":[1536,1536]},{"value":"disable","revisions":[1536,1536]}],"revisions":[1536,1536]},"gas_comeback_delay":{"type":"inte'
+    'ger","revisions":[1024,1024]},"captive_portal_ac_name":{"type":"string","revisions":[2047,2047]},"owe_transition":{"type":"string","options":[{"value"'
+    ':"disable","revisions":[2040,2040]},{"value":"enable","revisions":[2040,2040]}],"revisions":[2040,2040]},"captive_portal_session_timeout_interval":{"t'
+    'ype":"integer","revisions":[2047,127]},"dynamic_vlan":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revis'
+    'ions":[2047,2047]}],"revisions":[2047,2047]},"ft_mobility_domain":{"type":"integer","revisions":[2047,2047]},"selected_usergroups":{"type":"list","chi'
+    'ldren":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"captive_portal_macauth_radius_server":{"type":"string","revisions"'
+    ':[2047,127]},"dhcp_option82_circuit_id_insertion":{"type":"string","options":[{"value":"style-1","revisions":[2047,2047]},{"value":"style-2","revision'
+    's":[2047,2047]},{"value":"disable","revisions":[2047,2047]},{"value":"style-3","revisions":[1920,1920]}],"revisions":[2047,2047]},"max_clients":{"type'
+    '":"integer","revisions":[2047,2047]},"mpsk_key":{"type":"list","children":{"comment":{"type":"string","revisions":[383,383]},"concurrent_clients":{"ty'
+    'pe":"string","revisions":[383,383]},"mpsk_schedules":{"type":"list","children":{"name":{"type":"string","revisions":[376,376]}},"revisions":[376,376]}'
+    ',"passphrase":{"type":"string","revisions":[383,383]},"key_name":{"type":"string","revisions":[383,383]}},"revisions":[2047,383]},"portal_message_over'
+    'rides":{"type":"dict","children":{"auth_login_failed_page":{"type":"string","revisions":[2047,2047]},"auth_disclaimer_page":{"type":"string","revision'
+    's":[2047,2047]},"auth_login_page":{"type":"string","revisions":[2047,2047]},"auth_reject_page":{"type":"string","revisions":[2047,2047]}},"revisions":'
+    '[2047,2047]},"eap_reauth":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisio'
+    'ns":[2047,2047]},"probe_resp_threshold":{"type":"string","revisions":[2047,2047]},"alias":{"type":"string","revisions":[2047,23]},"dhcp_option82_inser'
+    'tion":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ra'
+    'tes_11bg":{"multiple_values":true,"type":"list","options":[{"value":"1","revisions":[2047,2047]},{"value":"1-basic","revisions":[2047,2047]},{"value":'
+    '"2","revisions":[2047,2047]},{"value":"2-basic","revisions":[2047,2047]},{"value":"5.5","revisions":[2047,2047]},{"value":"5.5-basic","revisions":[204'
+    '7,2047]},{"value":"11","revisions":[2047,2047]},{"value":"11-basic","revisions":[2047,2047]},{"value":"6","revisions":[2047,2047]},{"value":"6-basic",'
+    '"revisions":[2047,2047]},{"value":"9","revisions":[2047,2047]},{"value":"9-basic","revisions":[2047,2047]},{"value":"12","revisions":[2047,2047]},{"va'
+    'lue":"12-basic","revisions":[2047,2047]},{"value":"18","revisions":[2047,2047]},{"value":"18-basic","revisions":[2047,2047]},{"value":"24","revisions"'
+    ':[2047,2047]},{"value":"24-basic","revisions":[2047,2047]},{"value":"36","revisions":[2047,2047]},{"value":"36-basic","revisions":[2047,2047]},{"value'
+    '":"48","revisions":[2047,2047]},{"value":"48-basic","revisions":[2047,2047]},{"value":"54","revisions":[2047,2047]},{"value":"54-basic","revisions":[2'
+    '047,2047]}],"revisions":[2047,2047]},"intra_vap_privacy":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","re'
+    'visions":[2047,2047]}],"revisions":[2047,2047]},"radius_mac_auth_server":{"type":"string","revisions":[2047,2047]},"mac_calling_station_delimiter":{"t'
+    'ype":"string","options":[{"value":"hyphen","revisions":[1024,1024]},{"value":"single-hyphen","revisions":[1024,1024]},{"value":"colon","revisions":[10'
+    '24,1024]},{"value":"none","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"dhcp_option43_insertion":{"type":"str","required":false,"choices":["enable","disable"]},"captive_portal_ra'
+    'dius_secret":{"type":"str","required":false},"captive_portal_macauth_radius_secret":{"type":"str","required":false},"mesh_backhaul":{"type":"str","req'
+    'uired":false,"choices":["enable","disable"]},"rates_11ac_ss34":{"type":"list","required":false,"choices":["mcs0/3","mcs1/3","mcs2/3","mcs3/3","mcs4/3"'
+    ',"mcs5/3","mcs6/3","mcs7/3","mcs8/3","mcs9/3","mcs10/3","mcs11/3","mcs0/4","mcs1/4","mcs2/4","mcs3/4","mcs4/4","mcs5/4","mcs6/4","mcs7/4","mcs8/4","mc'
+    's9/4","mcs10/4","mcs11/4"]},"radio_5g_threshold":{"type":"str","required":false},"radius_mac_auth_usergroups":{"type":"list","required":false,"options'
+    '":{"name":{"type":"str","required":false}}},"port_macauth_timeout":{"type":"int","required":false},"nac_profile":{"type":"str","required":false},"owe_'
+    'transition_ssid":{"type":"str","required":false},"keyindex":{"type":"int","required":false},"local_bridging":{"type":"str","required":false,"choices":'
+    '["enable","disable"]},"mu_mimo":{"type":"str","required":false,"choices":["enable","disable"]},"mac_password_delimiter":{"type":"str","required":false'
+    ',"choices":["hyphen","single-hyphen","colon","none"]},"auth":{"type":"str","required":false,"choices":["psk","radius","usergroup"]},"voice_enterprise"'
+    ':{"type":"str","required":false,"choices":["disable","enable"]},"okc":{"type":"str","required":false,"choices":["disable","enable"]},"ldpc":{"type":"s'
+    'tr","required":false,"choices":["disable","rx","tx","rxtx"]},"dhcp_lease_time":{"type":"int","required":false},"secondary_wag_profile":{"type":"str","'
+    'required":false},"mac_auth_bypass":{"type":"str","required":false,"choices":["enable","disable"]},"local_standalone_nat":{"type":"str","required":fals'
+    'e,"choices":["enable","disable"]},"atf_weight":{"type":"int","required":false},"name":{"type":"str","required":false},"eapol_key_retries":{"type":"str'
+    '","required":false,"choices":["disable","enable"]},"quarantine":{"type":"str","required":false,"choices":["enable","disable"]},"mac_filter_policy_othe'
+    'r":{"type":"str","required":false,"choices":["allow","deny"]},"radio_sensitivity":{"type":"str","required":false,"choices":["enable","disable"]},"mpsk'
+    '_profile":{"type":"str","required":false},"sticky_client_remove":{"type":"str","required":false,"choices":["enable","disable"]},"radio_2g_threshold":{'
+    '"type":"str","required":false},"portal_message_override_group":{"type":"str","required":false},"tunnel_fallback_interval":{"type":"int","required":fal'
+    'se},"access_control_list":{"type":"str","required":false},"security":{"type":"str","required":false},"hotspot20_profile":{"type":"str","required":fals'
+    'e},"radius_server":{"type":"str","required":false},"address_group":{"type":"str","required":false},"rates_11a":{"type":"list","required":false,"choice'
+    's":["1","1-basic","2","2-basic","5.5","5.5-basic","11","11-basic","6","6-basic","9","9-basic","12","12-basic","18","18-basic","24","24-basic","36","36'
+    '-basic","48","48-basic","54","54-basic"]},"ptk_rekey":{"type":"str","required":false,"choices":["enable","disable"]},"ptk_rekey_intv":{"type":"int","r'
+    'equired":false},"usergroup":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"mac_username_delimiter":{"type":"str"'
+    ',"required":false,"choices":["hyphen","single-hyphen","colon","none"]},"vlan_pool":{"type":"list","required":false,"options":{"id":{"type":"int","requ'
+    'ired":false},"wtp_group":{"type":"str","required":false}}},"ipv6_rules":{"type":"list","required":false,"choices":["drop-icmp6ra","drop-icmp6rs","drop'
+    '-llmnr6","drop-icmp6mld2","drop-dhcp6s","drop-dhcp6c","ndp-proxy","drop-ns-dad","drop-ns-nondad"]},"acct_interim_interval":{"type":"int","required":fa'
+    'lse},"tunnel_echo_interval":{"type":"int","required":false},"passphrase":{"type":"str","required":false},"ssid":{"type":"str","required":false},"vlan_'
+    'pooling":{"type":"str","required":false,"choices":["wtp-group","round-robin","hash","disable"]},"schedule":{"type":"str","required":false},"tkip_count'
+    'er_measure":{"type":"str","required":false,"choices":["enable","disable"]},"vlanid":{"type":"int","required":false},"neighbor_report_dual_band":{"type'
+    '":"str","required":false,"choices":["disable","enable"]},"max_clients_ap":{"type":"int","required":false},"local_lan":{"type":"str","required":false,"'
+    'choices":["allow","deny"]},"gas_fragmentation_limit":{"type":"int","required":false},"mac_filter_list":{"type":"list","required":false,"options":{"mac'
+    '":{"type":"str","required":false},"id":{"type":"int","required":false},"mac_filter_policy":{"type":"str","required":false,"choices":["allow","deny"]}}'
+    '},"external_web_format":{"type":"str","required":false,"choices":["auto-detect","no-query-string","partial-query-string"]},"gtk_rekey":{"type":"str","'
+    'required":false,"choices":["enable","disable"]},"security_obsolete_option":{"type":"str","required":false},"key":{"type":"str","required":false},"mac_'
+    'called_station_delimiter":{"type":"str","required":false,"choices":["hyphen","single-hyphen","colon","none"]},"dhcp_address_enforcement":{"type":"str"'
+    ',"required":false,"choices":["enable","disable"]},"port_macauth_reauth_timeout":{"type":"int","required":false},"vdom":{"type":"str","required":false}'
+    ',"bstm_rssi_disassoc_timer":{"type":"int","required":false},"gtk_rekey_intv":{"type":"int","required":false},"mpsk":{"type":"str","required":false},"s'
+    'ecurity_exempt_list":{"type":"str","required":false},"mac_filter":{"type":"str","required":false,"choices":["enable","disable"]},"sticky_client_thresh'
+    'old_2g":{"type":"str","required":false},"mac_case":{"type":"str","required":false,"choices":["uppercase","lowercase"]},"mbo":{"type":"str","required":'
+    'false,"choices":["disable","enable"]},"target_wake_time":{"type":"str","required":false,"choices":["enable","disable"]},"bstm_load_balancing_disassoc_'
+    'timer":{"type":"int","required":false},"probe_resp_suppression":{"type":"str","required":false,"choices":["enable","disable"]},"captive_portal_auth_ti'
+    'meout":{"type":"int","required":false},"mbo_cell_data_conn_pref":{"type":"str","required":false,"choices":["excluded","prefer-not","prefer-use"]},"mps'
+    'k_concurrent_clients":{"type":"int","required":false},"external_fast_roaming":{"type":"str","required":false,"choices":["enable","disable"]},"bstm_dis'
+    'association_imminent":{"type":"str","required":false,"choices":["enable","disable"]},"external_logout":{"type":"str","required":false},"vlan_auto":{"t'
+    'ype":"str","required":false,"choices":["enable","disable"]},"sticky_client_threshold_5g":{"type":"str","required":false},"owe_groups":{"type":"list","'
+    'required":false,"choices":["19","20","21"]},"ip":{"type":"str","required":false},"dhcp_option82_remote_id_insertion":{"type":"str","required":false,"c'
+    'hoices":["style-1","disable"]},"pmf_assoc_comeback_timeout":{"type":"int","required":false},"local_standalone":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"portal_type":{"type":"str","required":false},"port_macauth":{"type":"str","required":false,"choices":["disable","radius","add'
+    'ress-group"]},"high_efficiency":{"type":"str","required":false,"choices":["enable","disable"]},"local_authentication":{"type":"str","required":false,"'
+    'choices":["enable","disable"]},"external_web":{"type":"str","required":false},"qos_profile":{"type":"str","required":false},"utm_profile":{"type":"str'
+    '","required":false},"rates_11n_ss12":{"type":"list","required":false,"choices":["mcs0/1","mcs1/1","mcs2/1","mcs3/1","mcs4/1","mcs5/1","mcs6/1","mcs7/1'
+    '","mcs8/2","mcs9/2","mcs10/2","mcs11/2","mcs12/2","mcs13/2","mcs14/2","mcs15/2"]},"primary_wag_profile":{"type":"str","required":false},"security_redi'
+    'rect_url":{"type":"str","required":false},"pmf_sa_query_retry_timeout":{"type":"int","required":false},"me_disable_thresh":{"type":"int","required":fa'
+    'lse},"fast_bss_transition":{"type":"str","required":false,"choices":["disable","enable"]},"broadcast_suppression":{"type":"list","required":false},"pm'
+    'f":{"type":"str","required":false,"choices":["disable","enable","optional"]},"sae_groups":{"type":"list","required":false},"broadcast_ssid":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"multicast_enhance":{"type":"str","required":false,"choices":["enable","disable"]},"rates_11n_ss3'
+    '4":{"type":"list","required":false,"choices":["mcs16/3","mcs17/3","mcs18/3","mcs19/3","mcs20/3","mcs21/3","mcs22/3","mcs23/3","mcs24/4","mcs25/4","mcs'
+    '26/4","mcs27/4","mcs28/4","mcs29/4","mcs30/4","mcs31/4"]},"bss_color_partial":{"type":"str","required":false},"multicast_rate":{"type":"str","required'
+    '":false,"choices":["0","6000","12000","24000"]},"ft_over_ds":{"type":"str","required":false,"choices":["disable","enable"]},"radius_mac_auth":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"additional_akms":{"type":"list","required":false,"choices":["akm6"]},"fast_roaming":{"type":"s'
+    'tr","required":false,"choices":["enable","disable"]},"sae_password":{"type":"str","required":false},"rates_11ac_ss12":{"type":"list","required":false,'
+    '"choices":["mcs0/1","mcs1/1","mcs2/1","mcs3/1","mcs4/1","mcs5/1","mcs6/1","mcs7/1","mcs8/1","mcs9/1","mcs10/1","mcs11/1","mcs0/2","mcs1/2","mcs2/2","m'
+    'cs3/2","mcs4/2","mcs5/2","mcs6/2","mcs7/2","mcs8/2","mcs9/2","mcs10/2","mcs11/2"]},"captive_portal_radius_server":{"type":"str","required":false},"nac'
+    '":{"type":"str","required":false,"choices":["enable","disable"]},"encrypt":{"type":"str","required":false,"choices":["TKIP","AES","TKIP-AES"]},"eap_re'
+    'auth_intv":{"type":"int","required":false},"split_tunneling":{"type":"str","required":false,"choices":["enable","disable"]},"ft_r0_key_lifetime":{"typ'
+    'e":"int","required":false},"igmp_snooping":{"type":"str","required":false,"choices":["enable","disable"]},"gas_comeback_delay":{"type":"int","required'
+    '":false},"captive_portal_ac_name":{"type":"str","required":false},"owe_transition":{"type":"str","required":false,"choices":["disable","enable"]},"cap'
+    'tive_portal_session_timeout_interval":{"type":"int","required":false},"dynamic_vlan":{"type":"str","required":false,"choices":["enable","disable"]},"f'
+    't_mobility_domain":{"type":"int","required":false},"selected_usergroups":{"type":"list","required":false,"options":{"name":{"type":"str","required":fa'
+    'lse}}},"captive_portal_macauth_radius_server":{"type":"str","required":false},"dhcp_option82_circuit_id_insertion":{"type":"str","required":false},"ma'
+    'x_clients":{"type":"int","required":false},"mpsk_key":{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"concurrent'
+    '_clients":{"type":"str","required":false},"mpsk_schedules":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"passph'
+    'rase":{"type":"str","required":false},"key_name":{"type":"str","required":false}}},"portal_message_overrides":{"type":"dict","required":false,"options'
+    '":{"auth_login_failed_page":{"type":"str","required":false},"auth_disclaimer_page":{"type":"str","required":false},"auth_login_page":{"type":"str","re'
+    'quired":false},"auth_reject_page":{"type":"str","required":false}}},"eap_reauth":{"type":"str","required":false,"choices":["enable","disable"]},"probe'
+    '_resp_threshold":{"type":"str","required":false},"alias":{"type":"str","required":false},"dhcp_option82_insertion":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]},"rates_11bg":{"type":"list","required":false,"choices":["1","1-basic","2","2-basic","5.5","5.5-basic","11","11-basic","6",'
+    '"6-basic","9","9-basic","12","12-basic","18","18-basic","24","24-basic","36","36-basic","48","48-basic","54","54-basic"]},"intra_vap_privacy":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"radius_mac_auth_server":{"type":"str","required":false},"mac_calling_station_delimiter":{"type'
+    '":"str","required":false,"choices":["hyphen","single-hyphen","colon","none"]}}}'
+)
@@ -0,0 +1,18 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2040,2040]},"ping_interval":{"type":"integer","revisions":[2040,2040]},"tunnel_type'
+    '":{"type":"string","options":[{"value":"l2tpv3","revisions":[2040,2040]},{"value":"gre","revisions":[2040,2040]}],"revisions":[2040,2040]},"ping_numbe'
+    'r":{"type":"integer","revisions":[2040,2040]},"wag_ip":{"type":"string","revisions":[2040,2040]},"dhcp_ip_addr":{"type":"string","revisions":[2040,204'
+    '0]},"wag_port":{"type":"integer","revisions":[2040,2040]},"return_packet_timeout":{"type":"integer","revisions":[2040,2040]},"name":{"type":"string","'
+    'revisions":[2040,2040]}},"revisions":[2040,2040]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"ping_interval":{"type":"int","required":false},"tunnel_type":{"t'
+    'ype":"str","required":false,"choices":["l2tpv3","gre"]},"ping_number":{"type":"int","required":false},"wag_ip":{"type":"str","required":false},"dhcp_i'
+    'p_addr":{"type":"str","required":false},"wag_port":{"type":"int","required":false},"return_packet_timeout":{"type":"int","required":false},"name":{"ty'
+    'pe":"str","required":false}}}'
+)
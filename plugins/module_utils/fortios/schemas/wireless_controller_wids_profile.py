@@ -0,0 +1,70 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"eapol_pre_succ_flood":{"type":"string","options":[{"value":"enable","r'
+    'evisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"eapol_succ_flood":{"type":"string","options":[{"value":"'
+    'enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"eapol_succ_thresh":{"type":"integer","revision'
+    's":[2047,2047]},"ap_bgscan_disable_end":{"type":"string","revisions":[2047,7]},"eapol_start_intv":{"type":"integer","revisions":[2047,2047]},"eapol_lo'
+    'goff_thresh":{"type":"integer","revisions":[2047,2047]},"eapol_logoff_intv":{"type":"integer","revisions":[2047,2047]},"ap_bgscan_intv":{"type":"integ'
+    'er","revisions":[2047,2047]},"assoc_flood_thresh":{"type":"integer","revisions":[2047,2047]},"null_ssid_probe_resp":{"type":"string","options":[{"valu'
+    'e":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"assoc_frame_flood":{"type":"string","optio'
+    'ns":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ap_bgscan_disable_day":{"type":'
+    '"string","options":[{"value":"sunday","revisions":[7,7]},{"value":"monday","revisions":[7,7]},{"value":"tuesday","revisions":[7,7]},{"value":"wednesda'
+    'y","revisions":[7,7]},{"value":"thursday","revisions":[7,7]},{"value":"friday","revisions":[7,7]},{"value":"saturday","revisions":[7,7]}],"revisions":'
+    '[2047,7]},"eapol_fail_thresh":{"type":"integer","revisions":[2047,2047]},"ap_bgscan_disable_schedules":{"type":"list","children":{"name":{"type":"stri'
+    'ng","revisions":[2040,2040]}},"revisions":[2040,2040]},"ap_scan":{"type":"string","options":[{"value":"disable","revisions":[2047,2047]},{"value":"ena'
+    'ble","revisions":[2047,2047]}],"revisions":[2047,2047]},"deauth_broadcast":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"va'
+    'lue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"wireless_bridge":{"type":"string","options":[{"value":"enable","revisions":[2047,20'
+    '47]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ap_scan_threshold":{"type":"string","revisions":[2040,2040]},"assoc_flood_'
+    'time":{"type":"integer","revisions":[2047,2047]},"long_duration_thresh":{"type":"integer","revisions":[2047,2047]},"eapol_pre_fail_flood":{"type":"str'
+    'ing","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"eapol_logoff_flood":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ap_bgsca'
+    'n_duration":{"type":"integer","revisions":[2047,2047]},"eapol_pre_succ_thresh":{"type":"integer","revisions":[2047,2047]},"ap_bgscan_idle":{"type":"in'
+    'teger","revisions":[2047,2047]},"ap_bgscan_report_intv":{"type":"integer","revisions":[2047,2047]},"auth_frame_flood":{"type":"string","options":[{"va'
+    'lue":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ap_fgscan_report_intv":{"type":"integer"'
+    ',"revisions":[2047,2047]},"ap_bgscan_period":{"type":"integer","revisions":[2047,2047]},"eapol_pre_succ_intv":{"type":"integer","revisions":[2047,2047'
+    ']},"eapol_succ_intv":{"type":"integer","revisions":[2047,2047]},"eapol_pre_fail_thresh":{"type":"integer","revisions":[2047,2047]},"eapol_fail_flood":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auth_flo'
+    'od_time":{"type":"integer","revisions":[2047,2047]},"ap_scan_passive":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":'
+    '"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"weak_wep_iv":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"va'
+    'lue":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ap_auto_suppress":{"type":"string","options":[{"value":"enable","revisions":[2047,2'
+    '047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"invalid_mac_oui":{"type":"string","options":[{"value":"enable","revisions'
+    '":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"asleap_attack":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"eapol_st'
+    'art_flood":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"deauth_unknown_src_thresh":{"type":"integer","revisions":[2047,2047]},"long_duration_attack":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"spoofed_deauth":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"eapol_start_thresh":{"type":"integer","revisions":[204'
+    '7,2047]},"eapol_pre_fail_intv":{"type":"integer","revisions":[2047,2047]},"auth_flood_thresh":{"type":"integer","revisions":[2047,2047]},"ap_bgscan_di'
+    'sable_start":{"type":"string","revisions":[2047,7]},"eapol_fail_intv":{"type":"integer","revisions":[2047,2047]},"sensor_mode":{"type":"string","optio'
+    'ns":[{"value":"disable","revisions":[2047,2047]},{"value":"foreign","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"eapol_pre_succ_flood":{"type":"str","required":false,"choices":['
+    '"enable","disable"]},"eapol_succ_flood":{"type":"str","required":false,"choices":["enable","disable"]},"eapol_succ_thresh":{"type":"int","required":fa'
+    'lse},"ap_bgscan_disable_end":{"type":"str","required":false},"eapol_start_intv":{"type":"int","required":false},"eapol_logoff_thresh":{"type":"int","r'
+    'equired":false},"eapol_logoff_intv":{"type":"int","required":false},"ap_bgscan_intv":{"type":"int","required":false},"assoc_flood_thresh":{"type":"int'
+    '","required":false},"null_ssid_probe_resp":{"type":"str","required":false,"choices":["enable","disable"]},"assoc_frame_flood":{"type":"str","required"'
+    ':false,"choices":["enable","disable"]},"ap_bgscan_disable_day":{"type":"str","required":false},"eapol_fail_thresh":{"type":"int","required":false},"ap'
+    '_bgscan_disable_schedules":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"ap_scan":{"type":"str","required":fals'
+    'e,"choices":["disable","enable"]},"deauth_broadcast":{"type":"str","required":false,"choices":["enable","disable"]},"wireless_bridge":{"type":"str","r'
+    'equired":false,"choices":["enable","disable"]},"ap_scan_threshold":{"type":"str","required":false},"assoc_flood_time":{"type":"int","required":false},'
+    '"long_duration_thresh":{"type":"int","required":false},"eapol_pre_fail_flood":{"type":"str","required":false,"choices":["enable","disable"]},"eapol_lo'
+    'goff_flood":{"type":"str","required":false,"choices":["enable","disable"]},"ap_bgscan_duration":{"type":"int","required":false},"eapol_pre_succ_thresh'
+    '":{"type":"int","required":false},"ap_bgscan_idle":{"type":"int","required":false},"ap_bgscan_report_intv":{"type":"int","required":false},"auth_frame'
+    '_flood":{"type":"str","required":false,"choices":["enable","disable"]},"ap_fgscan_report_intv":{"type":"int","required":false},"ap_bgscan_period":{"ty'
+    'pe":"int","required":false},"eapol_pre_succ_intv":{"type":"int","required":false},"eapol_succ_intv":{"type":"int","required":false},"eapol_pre_fail_th'
+    'resh":{"type":"int","required":false},"eapol_fail_flood":{"type":"str","required":false,"choices":["enable","disable"]},"auth_flood_time":{"type":"int'
+    '","required":false},"ap_scan_passive":{"type":"str","required":false,"choices":["enable","disable"]},"weak_wep_iv":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]},"ap_auto_suppress":{"type":"str","required":false,"choices":["enable","disable"]},"invalid_mac_oui":{"type":"str","require'
+    'd":false,"choices":["enable","disable"]},"name":{"type":"str","required":false},"asleap_attack":{"type":"str","required":false,"choices":["enable","di'
+    'sable"]},"eapol_start_flood":{"type":"str","required":false,"choices":["enable","disable"]},"deauth_unknown_src_thresh":{"type":"int","required":false'
+    '},"long_duration_attack":{"type":"str","required":false,"choices":["enable","disable"]},"spoofed_deauth":{"type":"str","required":false,"choices":["en'
+    'able","disable"]},"eapol_start_thresh":{"type":"int","required":false},"eapol_pre_fail_intv":{"type":"int","required":false},"auth_flood_thresh":{"typ'
+    'e":"int","required":false},"ap_bgscan_disable_start":{"type":"str","required":false},"eapol_fail_intv":{"type":"int","required":false},"sensor_mode":{'
+    '"type":"str","required":false,"choices":["disable","foreign","both"]}}}'
+)
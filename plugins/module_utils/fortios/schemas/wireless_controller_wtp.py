@@ -0,0 +1,218 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"bonjour_profile":{"type":"string","revisions":[2047,2047]},"split_tunneling_acl":{"type":"list","children":{"id":{"type":"'
+    'integer","revisions":[2047,2047]},"dest_ip":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"tun_mtu_downlink":{"type":"integer","'
+    'revisions":[2047,2047]},"coordinate_latitude":{"type":"string","revisions":[2047,2047]},"tun_mtu_uplink":{"type":"integer","revisions":[2047,2047]},"c'
+    'oordinate_enable":{"type":"string","options":[{"value":"enable","revisions":[7,7]},{"value":"disable","revisions":[7,7]}],"revisions":[2047,7]},"overr'
+    'ide_lan":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},'
+    '"mesh_bridge_enable":{"type":"string","options":[{"value":"default","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]},{"value":"disa'
+    'ble","revisions":[2047,2047]}],"revisions":[2047,2047]},"index":{"type":"integer","revisions":[2047,2047]},"uuid":{"type":"string","revisions":[1920,1'
+    '664]},"override_login_passwd_change":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]'
+    '}],"revisions":[2047,2047]},"wtp_mode":{"type":"string","options":[{"value":"normal","revisions":[127,127]},{"value":"remote","revisions":[127,127]}],'
+    '"revisions":[2047,127]},"split_tunneling_acl_path":{"type":"string","options":[{"value":"tunnel","revisions":[2047,2047]},{"value":"local","revisions"'
+    ':[2047,2047]}],"revisions":[2047,2047]},"ip_fragment_preventing":{"multiple_values":true,"type":"list","options":[{"value":"tcp-mss-adjust","revisions'
+    '":[2047,2047]},{"value":"icmp-unreachable","revisions":[2047,2047]}],"revisions":[2047,2047]},"coordinate_y":{"type":"string","revisions":[2047,7]},"c'
+    'oordinate_x":{"type":"string","revisions":[2047,7]},"radio_3":{"type":"dict","children":{"auto_power_target":{"type":"string","revisions":[1536,1536]}'
+    ',"power_value":{"type":"integer","revisions":[1024,1024]},"radio_id":{"type":"integer","revisions":[2032,16]},"band":{"type":"string","options":[{"val'
+    'ue":"802.11a","revisions":[2040,2040]},{"value":"802.11b","revisions":[2040,2040]},{"value":"802.11g","revisions":[2040,2040]},{"value":"802.11n","rev'
+    'isions":[2040,2040]},{"value":"802.11n-5G","revisions":[2040,2040]},{"value":"802.11n,g-only","revisions":[2040,2040]},{"value":"802.11g-only","revisi'
+    'ons":[2040,2040]},{"value":"802.11n-only","revisions":[2040,2040]},{"value":"802.11n-5G-only","revisions":[2040,2040]},{"value":"802.11ac","revisions"'
+    ':[2040,2040]},{"value":"802.11ac,n-only","revisions":[2040,2040]},{"value":"802.11ac-only","revisions":[2040,2040]},{"value":"802.11ax-5G","revisions"'
+    ':[2040,2040]},{"value":"802.11ax,ac-only","revisions":[2040,2040]},{"value":"802.11ax,ac,n-only","revisions":[2040,2040]},{"value":"802.11ax-5G-only",'
+    '"revisions":[2040,2040]},{"value":"802.11ax","revisions":[2040,2040]},{"value":"802.11ax,n-only","revisions":[2040,2040]},{"value":"802.11ax,n,g-only"'
+    ',"revisions":[2040,2040]},{"value":"802.11ax-only","revisions":[2040,2040]},{"value":"802.11ac-2G","revisions":[1920,1664]}],"revisions":[2040,2040]},'
+    '"override_analysis":{"type":"string","options":[{"value":"enable","revisions":[376,376]},{"value":"disable","revisions":[376,376]}],"revisions":[2040,'
+    '376]},"power_mode":{"type":"string","options":[{"value":"dBm","revisions":[1024,1024]},{"value":"percentage","revisions":[1024,1024]}],"revisions":[10'
+    '24,1024]},"spectrum_analysis":{"type":"string","options":[{"value":"enable","revisions":[376,376]},{"value":"disable","revisions":[376,376]},{"value":'
+    '"scan-only","revisions":[256,256]}],"revisions":[2040,376]},"auto_power_low":{"type":"integer","revisions":[2040,2040]},"auto_power_level":{"type":"st'
+    'ring","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"drma_manual_mode":{'
+    '"type":"string","options":[{"value":"ap","revisions":[1536,1536]},{"value":"monitor","revisions":[1536,1536]},{"value":"ncf","revisions":[1536,1536]},'
+    '{"value":"ncf-peek","revisions":[1536,1536]}],"revisions":[1536,1536]},"override_channel":{"type":"string","options":[{"value":"enable","revisions":[2'
+    '040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"override_txpower":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"channel":{"type":"list","children":{"chan":{"type":"string'
+    '","revisions":[2040,2040]}},"revisions":[2040,2040]},"override_band":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"'
+    'disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"auto_power_high":{"type":"integer","revisions":[2040,2040]},"vap_all":{"type":"string","o'
+    'ptions":[{"value":"enable","revisions":[2040,120]},{"value":"disable","revisions":[2040,120]},{"value":"tunnel","revisions":[1920,1920]},{"value":"bri'
+    'dge","revisions":[1920,1920]},{"value":"manual","revisions":[1920,1920]}],"revisions":[2040,2040]},"power_level":{"type":"integer","revisions":[2040,2'
+    '040]},"vaps":{"type":"list","children":{"name":{"type":"string","revisions":[2040,2040]}},"revisions":[2040,2040]},"override_vaps":{"type":"string","o'
+    'ptions":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]}},"revisions":[2040,2040]},"r'
+    'adio_2":{"type":"dict","children":{"auto_power_target":{"type":"string","revisions":[1536,1536]},"power_value":{"type":"integer","revisions":[1024,102'
+    '4]},"spectrum_analysis":{"type":"string","options":[{"value":"enable","revisions":[383,383]},{"value":"disable","revisions":[383,383]},{"value":"scan-'
+    'only","revisions":[256,256]}],"revisions":[2047,383]},"override_analysis":{"type":"string","options":[{"value":"enable","revisions":[383,383]},{"value'
+    '":"disable","revisions":[383,383]}],"revisions":[2047,383]},"drma_manual_mode":{"type":"string","options":[{"value":"ap","revisions":[1536,1536]},{"va'
+    'lue":"monitor","revisions":[1536,1536]},{"value":"ncf","revisions":[1536,1536]},{"value":"ncf-peek","revisions":[1536,1536]}],"revisions":[1536,1536]}'
+    ',"radio_id":{"type":"integer","revisions":[2047,23]},"override_vaps":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"'
+    'disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"power_mode":{"type":"string","options":[{"value":"dBm","revisions":[1024,1024]},{"value":'
+    '"percentage","revisions":[1024,1024]}],"revisions":[1024,1024]},"override_txpower":{"type":"string","options":[{"value":"enable","revisions":[2047,204'
+    '7]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"band":{"type":"string","options":[{"value":"802.11a","revisions":[2047,2047'
+    ']},{"value":"802.11b","revisions":[2047,2047]},{"value":"802.11g","revisions":[2047,2047]},{"value":"802.11n","revisions":[2047,2047]},{"value":"802.1'
+    '1n-5G","revisions":[2047,2047]},{"value":"802.11n,g-only","revisions":[2047,2047]},{"value":"802.11g-only","revisions":[2047,2047]},{"value":"802.11n-'
+    'only","revisions":[2047,2047]},{"value":"802.11n-5G-only","revisions":[2047,2047]},{"value":"802.11ac","revisions":[2047,2047]},{"value":"802.11ac,n-o'
+    'nly","revisions":[2047,2047]},{"value":"802.11ac-only","revisions":[2047,2047]},{"value":"802.11ax-5G","revisions":[2040,2040]},{"value":"802.11ax,ac-'
+    'only","revisions":[2040,2040]},{"value":"802.11ax,ac,n-only","revisions":[2040,2040]},{"value":"802.11ax-5G-only","revisions":[2040,2040]},{"value":"8'
+    '02.11ax","revisions":[2040,2040]},{"value":"802.11ax,n-only","revisions":[2040,2040]},{"value":"802.11ax,n,g-only","revisions":[2040,2040]},{"value":"'
+    '802.11ax-only","revisions":[2040,2040]},{"value":"802.11ac-2G","revisions":[1920,1664]}],"revisions":[2047,2047]},"auto_power_level":{"type":"string",'
+    '"options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"override_channel":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auto_power_low"'
+    ':{"type":"integer","revisions":[2047,2047]},"override_band":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable",'
+    '"revisions":[2047,2047]}],"revisions":[2047,2047]},"auto_power_high":{"type":"integer","revisions":[2047,2047]},"vap_all":{"type":"string","options":['
+    '{"value":"enable","revisions":[2047,127]},{"value":"disable","revisions":[2047,127]},{"value":"tunnel","revisions":[1920,1920]},{"value":"bridge","rev'
+    'isions":[1920,1920]},{"value":"manual","revisions":[1920,1920]}],"revisions":[2047,2047]},"power_level":{"type":"integer","revisions":[2047,2047]},"va'
+    'ps":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"channel":{"type":"list","children":{"chan":'
+    '{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"revisions":[2047,2047]},"radio_1":{"type":"dict","children":{"auto_power_target"'
+    ':{"type":"string","revisions":[1536,1536]},"power_value":{"type":"integer","revisions":[1024,1024]},"spectrum_analysis":{"type":"string","options":[{"'
+    'value":"enable","revisions":[383,383]},{"value":"disable","revisions":[383,383]},{"value":"scan-only","revisions":[256,256]}],"revisions":[2047,383]},'
+    '"override_analysis":{"type":"string","options":[{"value":"enable","revisions":[383,383]},{"value":"disable","revisions":[383,383]}],"revisions":[2047,'
+    '383]},"drma_manual_mode":{"type":"string","options":[{"value":"ap","revisions":[1536,1536]},{"value":"monitor","revisions":[1536,1536]},{"value":"ncf"'
+    ',"revisions":[1536,1536]},{"value":"ncf-peek","revisions":[1536,1536]}],"revisions":[1536,1536]},"radio_id":{"type":"integer","revisions":[2047,23]},"'
+    'override_vaps":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2'
+    '047]},"power_mode":{"type":"string","options":[{"value":"dBm","revisions":[1024,1024]},{"value":"percentage","revisions":[1024,1024]}],"revisions":[10'
+    '24,1024]},"override_txpower":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revi'
+    'sions":[2047,2047]},"band":{"type":"string","options":[{"value":"802.11a","revisions":[2047,2047]},{"value":"802.11b","revisions":[2047,2047]},{"value'
+    '":"802.11g","revisions":[2047,2047]},{"value":"802.11n","revisions":[2047,2047]},{"value":"802.11n-5G","revisions":[2047,2047]},{"value":"802.11n,g-on'
+    'ly","revisions":[2047,2047]},{"value":"802.11g-only","revisions":[2047,2047]},{"value":"802.11n-only","revisions":[2047,2047]},{"value":"802.11n-5G-on'
+    'ly","revisions":[2047,2047]},{"value":"802.11ac","revisions":[2047,2047]},{"value":"802.11ac,n-only","revisions":[2047,2047]},{"value":"802.11ac-only"'
+    ',"revisions":[2047,2047]},{"value":"802.11ax-5G","revisions":[2040,2040]},{"value":"802.11ax,ac-only","revisions":[2040,2040]},{"value":"802.11ax,ac,n'
+    '-only","revisions":[2040,2040]},{"value":"802.11ax-5G-only","revisions":[2040,2040]},{"value":"802.11ax","revisions":[2040,2040]},{"value":"802.11ax,n'
+    '-only","revisions":[2040,2040]},{"value":"802.11ax,n,g-only","revisions":[2040,2040]},{"value":"802.11ax-only","revisions":[2040,2040]},{"value":"802.'
+    '11ac-2G","revisions":[1920,1664]}],"revisions":[2047,2047]},"auto_power_level":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},'
+    '{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"override_channel":{"type":"string","options":[{"value":"enable","revisions":[20'
+    '47,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auto_power_low":{"type":"integer","revisions":[2047,2047]},"override_'
+    'band":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"au'
+    'to_power_high":{"type":"integer","revisions":[2047,2047]},"vap_all":{"type":"string","options":[{"value":"enable","revisions":[2047,127]},{"value":"di'
+    'sable","revisions":[2047,127]},{"value":"tunnel","revisions":[1920,1920]},{"value":"bridge","revisions":[1920,1920]},{"value":"manual","revisions":[19'
+    '20,1920]}],"revisions":[2047,2047]},"power_level":{"type":"integer","revisions":[2047,2047]},"vaps":{"type":"list","children":{"name":{"type":"string"'
+    ',"revisions":[2047,2047]}},"revisions":[2047,2047]},"channel":{"type":"list","children":{"chan":{"type":"string","revisions":[2047,2047]}},"revisions"'
+    ':[2047,2047]}},"revisions":[2047,2047]},"location":{"type":"string","revisions":[2047,2047]},"allowaccess":{"multiple_values":true,"type":"list","opti'
+    'ons":[{"value":"telnet","revisions":[2047,7]},{"value":"http","revisions":[2047,7]},{"value":"https","revisions":[2047,2047]},{"value":"ssh","revision'
+    's":[2047,2047]},{"value":"snmp","revisions":[2040,2040]}],"revisions":[2047,2047]},"radio_4":{"type":"dict","children":{"auto_power_target":{"type":"s'
+    'tring","revisions":[1536,1536]},"power_value":{"type":"integer","revisions":[1024,1024]},"band":{"type":"string","options":[{"value":"802.11a","revisi'
+    'ons":[2024,2024]},{"value":"802.11b","revisions":[2024,2024]},{"value":"802.11g","revisions":[2024,2024]},{"value":"802.11n","revisions":[2024,2024]},'
+    '{"value":"802.11n-5G","revisions":[2024,2024]},{"value":"802.11n,g-only","revisions":[2024,2024]},{"value":"802.11g-only","revisions":[2024,2024]},{"v'
+    'alue":"802.11n-only","revisions":[2024,2024]},{"value":"802.11n-5G-only","revisions":[2024,2024]},{"value":"802.11ac","revisions":[2024,2024]},{"value'
+    '":"802.11ac,n-only","revisions":[2024,2024]},{"value":"802.11ac-only","revisions":[2024,2024]},{"value":"802.11ax-5G","revisions":[2024,2024]},{"value'
+    '":"802.11ax,ac-only","revisions":[2024,2024]},{"value":"802.11ax,ac,n-only","revisions":[2024,2024]},{"value":"802.11ax-5G-only","revisions":[2024,202'
+    '4]},{"value":"802.11ax","revisions":[2024,2024]},{"value":"802.11ax,n-only","revisions":[2024,2024]},{"value":"802.11ax,n,g-only","revisions":[2024,20'
+    '24]},{"value":"802.11ax-only","revisions":[2024,2024]},{"value":"802.11ac-2G","revisions":[1920,1664]}],"revisions":[2024,2024]},"override_analysis":{'
+    '"type":"string","options":[{"value":"enable","revisions":[360,360]},{"value":"disable","revisions":[360,360]}],"revisions":[2024,360]},"drma_manual_mo'
+    'de":{"type":"string","options":[{"value":"ap","revisions":[1536,1536]},{"value":"monitor","revisions":[1536,1536]},{"value":"ncf","revisions":[1536,15'
+    '36]},{"value":"ncf-peek","revisions":[1536,1536]}],"revisions":[1536,1536]},"spectrum_analysis":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[360,360]},{"value":"disable","revisions":[360,360]},{"value":"scan-only","revisions":[256,256]}],"revisions":[2024,360]},"override_vaps":{"type":'
+    '"string","options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"power_mode":{"ty'
+    'pe":"string","options":[{"value":"dBm","revisions":[1024,1024]},{"value":"percentage","revisions":[1024,1024]}],"revisions":[1024,1024]},"auto_power_l'
+    'ow":{"type":"integer","revisions":[2024,2024]},"auto_power_level":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]},{"value":"dis'
+    'able","revisions":[2024,2024]}],"revisions":[2024,2024]},"override_channel":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]},{"v'
+    'alue":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"override_txpower":{"type":"string","options":[{"value":"enable","revisions":[2024,'
+    '2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"override_band":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"auto_power_high":{"type":"integer","revisions":[2024,2024]},"vap_'
+    'all":{"type":"string","options":[{"value":"enable","revisions":[2024,104]},{"value":"disable","revisions":[2024,104]},{"value":"tunnel","revisions":[1'
+    '920,1920]},{"value":"bridge","revisions":[1920,1920]},{"value":"manual","revisions":[1920,1920]}],"revisions":[2024,2024]},"power_level":{"type":"inte'
+    'ger","revisions":[2024,2024]},"vaps":{"type":"list","children":{"name":{"type":"string","revisions":[2024,2024]}},"revisions":[2024,2024]},"channel":{'
+    '"type":"list","children":{"chan":{"type":"string","revisions":[2024,2024]}},"revisions":[2024,2024]}},"revisions":[2040,2024]},"override_allowaccess":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"lan":{"t'
+    'ype":"dict","children":{"port7_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-to-wan","revisions":[2047,2'
+    '047]},{"value":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]},"port3_ssid":{"ty'
+    'pe":"string","revisions":[2047,2047]},"port_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-to-wan","revis'
+    'ions":[2047,2047]},{"value":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]},"por'
+    't_esl_ssid":{"type":"string","revisions":[1920,1664]},"port4_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"n'
+    'at-to-wan","revisions":[2047,2047]},{"value":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":'
+    '[2047,2047]},"port4_ssid":{"type":"string","revisions":[2047,2047]},"port3_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047'
+    ']},{"value":"nat-to-wan","revisions":[2047,2047]},{"value":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"port6_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-to-wan","revisions":[204'
+    '7,2047]},{"value":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]},"port5_mode":{'
+    '"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-to-wan","revisions":[2047,2047]},{"value":"bridge-to-wan","revisi'
+    'ons":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]},"port6_ssid":{"type":"string","revisions":[2047,2047]},'
+    '"port_ssid":{"type":"string","revisions":[2047,2047]},"port1_ssid":{"type":"string","revisions":[2047,2047]},"port2_ssid":{"type":"string","revisions"'
+    ':[2047,2047]},"port8_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-to-wan","revisions":[2047,2047]},{"va'
+    'lue":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]},"port5_ssid":{"type":"strin'
+    'g","revisions":[2047,2047]},"port_esl_mode":{"type":"string","options":[{"value":"offline","revisions":[1664,1664]},{"value":"nat-to-wan","revisions":'
+    '[1664,1664]},{"value":"bridge-to-wan","revisions":[1664,1664]},{"value":"bridge-to-ssid","revisions":[1664,1664]}],"revisions":[1920,1664]},"port7_ssi'
+    'd":{"type":"string","revisions":[2047,2047]},"port8_ssid":{"type":"string","revisions":[2047,2047]},"port1_mode":{"type":"string","options":[{"value":'
+    '"offline","revisions":[2047,2047]},{"value":"nat-to-wan","revisions":[2047,2047]},{"value":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-t'
+    'o-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]},"port2_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"valu'
+    'e":"nat-to-wan","revisions":[2047,2047]},{"value":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisi'
+    'ons":[2047,2047]}},"revisions":[2047,2047]},"apcfg_profile":{"type":"string","revisions":[1920,1920]},"override_ip_fragment":{"type":"string","options'
+    '":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"override_led_state":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"region_y":{"type":"st'
+    'ring","revisions":[2040,2040]},"region_x":{"type":"string","revisions":[2040,2040]},"wtp_id":{"type":"string","revisions":[2047,2047]},"image_download'
+    '":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"name":'
+    '{"type":"string","revisions":[2047,2047]},"override_split_tunnel":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"dis'
+    'able","revisions":[2047,2047]}],"revisions":[2047,2047]},"admin":{"type":"string","options":[{"value":"discovered","revisions":[2047,2047]},{"value":"'
+    'disable","revisions":[2047,2047]},{"value":"enable","revisions":[2047,2047]}],"revisions":[2047,2047]},"region":{"type":"string","revisions":[2040,204'
+    '0]},"split_tunneling_acl_local_ap_subnet":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,'
+    '2047]}],"revisions":[2047,2047]},"wtp_profile":{"type":"string","revisions":[2047,2047]},"login_passwd":{"type":"string","revisions":[2047,2047]},"fir'
+    'mware_provision":{"type":"string","revisions":[1920,1920]},"wan_port_mode":{"type":"string","options":[{"value":"wan-lan","revisions":[2047,2047]},{"v'
+    'alue":"wan-only","revisions":[2047,2047]}],"revisions":[2047,2047]},"led_state":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]}'
+    ',{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"override_wan_port_mode":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"login_passwd_change":{"type":"string","options":[{"value":"yes'
+    '","revisions":[2047,2047]},{"value":"default","revisions":[2047,2047]},{"value":"no","revisions":[2047,2047]}],"revisions":[2047,2047]},"coordinate_lo'
+    'ngitude":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"bonjour_profile":{"type":"str","required":false},"split_tunneling_acl":{"type":"list","required":false,"op'
+    'tions":{"id":{"type":"int","required":false},"dest_ip":{"type":"str","required":false}}},"tun_mtu_downlink":{"type":"int","required":false},"coordinat'
+    'e_latitude":{"type":"str","required":false},"tun_mtu_uplink":{"type":"int","required":false},"coordinate_enable":{"type":"str","required":false},"over'
+    'ride_lan":{"type":"str","required":false,"choices":["enable","disable"]},"mesh_bridge_enable":{"type":"str","required":false,"choices":["default","ena'
+    'ble","disable"]},"index":{"type":"int","required":false},"uuid":{"type":"str","required":false},"override_login_passwd_change":{"type":"str","required'
+    '":false,"choices":["enable","disable"]},"wtp_mode":{"type":"str","required":false},"split_tunneling_acl_path":{"type":"str","required":false,"choices"'
+    ':["tunnel","local"]},"ip_fragment_preventing":{"type":"list","required":false,"choices":["tcp-mss-adjust","icmp-unreachable"]},"coordinate_y":{"type":'
+    '"str","required":false},"coordinate_x":{"type":"str","required":false},"radio_3":{"type":"dict","required":false,"options":{"auto_power_target":{"type'
+    '":"str","required":false},"power_value":{"type":"int","required":false},"radio_id":{"type":"int","required":false},"band":{"type":"str","required":fal'
+    'se},"override_analysis":{"type":"str","required":false},"power_mode":{"type":"str","required":false,"choices":["dBm","percentage"]},"spectrum_analysis'
+    '":{"type":"str","required":false},"auto_power_low":{"type":"int","required":false},"auto_power_level":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"drma_manual_mode":{"type":"str","required":false,"choices":["ap","monitor","ncf","ncf-peek"]},"override_channel":{"type":"str","requir'
+    'ed":false,"choices":["enable","disable"]},"override_txpower":{"type":"str","required":false,"choices":["enable","disable"]},"channel":{"type":"list","'
+    'required":false,"options":{"chan":{"type":"str","required":false}}},"override_band":{"type":"str","required":false,"choices":["enable","disable"]},"au'
+    'to_power_high":{"type":"int","required":false},"vap_all":{"type":"str","required":false},"power_level":{"type":"int","required":false},"vaps":{"type":'
+    '"list","required":false,"options":{"name":{"type":"str","required":false}}},"override_vaps":{"type":"str","required":false,"choices":["enable","disabl'
+    'e"]}}},"radio_2":{"type":"dict","required":false,"options":{"auto_power_target":{"type":"str","required":false},"power_value":{"type":"int","required"'
+    ':false},"spectrum_analysis":{"type":"str","required":false},"override_analysis":{"type":"str","required":false},"drma_manual_mode":{"type":"str","requ'
+    'ired":false,"choices":["ap","monitor","ncf","ncf-peek"]},"radio_id":{"type":"int","required":false},"override_vaps":{"type":"str","required":false,"ch'
+    'oices":["enable","disable"]},"power_mode":{"type":"str","required":false,"choices":["dBm","percentage"]},"override_txpower":{"type":"str","required":f'
+    'alse,"choices":["enable","disable"]},"band":{"type":"str","required":false},"auto_power_level":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"override_channel":{"type":"str","required":false,"choices":["enable","disable"]},"auto_power_low":{"type":"int","required":false},"override_b'
+    'and":{"type":"str","required":false,"choices":["enable","disable"]},"auto_power_high":{"type":"int","required":false},"vap_all":{"type":"str","require'
+    'd":false},"power_level":{"type":"int","required":false},"vaps":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"ch'
+    'annel":{"type":"list","required":false,"options":{"chan":{"type":"str","required":false}}}}},"radio_1":{"type":"dict","required":false,"options":{"aut'
+    'o_power_target":{"type":"str","required":false},"power_value":{"type":"int","required":false},"spectrum_analysis":{"type":"str","required":false},"ove'
+    'rride_analysis":{"type":"str","required":false},"drma_manual_mode":{"type":"str","required":false,"choices":["ap","monitor","ncf","ncf-peek"]},"radio_'
+    'id":{"type":"int","required":false},"override_vaps":{"type":"str","required":false,"choices":["enable","disable"]},"power_mode":{"type":"str","require'
+    'd":false,"choices":["dBm","percentage"]},"override_txpower":{"type":"str","required":false,"choices":["enable","disable"]},"band":{"type":"str","requi'
+    'red":false},"auto_power_level":{"type":"str","required":false,"choices":["enable","disable"]},"override_channel":{"type":"str","required":false,"choic'
+    'es":["enable","disable"]},"auto_power_low":{"type":"int","required":false},"override_band":{"type":"str","required":false,"choices":["enable","disable'
+    '"]},"auto_power_high":{"type":"int","required":false},"vap_all":{"type":"str","required":false},"power_level":{"type":"int","required":false},"vaps":{'
+    '"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"channel":{"type":"list","required":false,"options":{"chan":{"type"'
+    ':"str","required":false}}}}},"location":{"type":"str","required":false},"allowaccess":{"type":"list","required":false},"radio_4":{"type":"dict","requi'
+    'red":false,"options":{"auto_power_target":{"type":"str","required":false},"power_value":{"type":"int","required":false},"band":{"type":"str","required'
+    '":false},"override_analysis":{"type":"str","required":false},"drma_manual_mode":{"type":"str","required":false,"choices":["ap","monitor","ncf","ncf-pe'
+    'ek"]},"spectrum_analysis":{"type":"str","required":false},"override_vaps":{"type":"str","required":false,"choices":["enable","disable"]},"power_mode":'
+    '{"type":"str","required":false,"choices":["dBm","percentage"]},"auto_power_low":{"type":"int","required":false},"auto_power_level":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"override_channel":{"type":"str","required":false,"choices":["enable","disable"]},"override_txpower":{"typ'
+    'e":"str","required":false,"choices":["enable","disable"]},"override_band":{"type":"str","required":false,"choices":["enable","disable"]},"auto_power_h'
+    'igh":{"type":"int","required":false},"vap_all":{"type":"str","required":false},"power_level":{"type":"int","required":false},"vaps":{"type":"list","re'
+    'quired":false,"options":{"name":{"type":"str","required":false}}},"channel":{"type":"list","required":false,"options":{"chan":{"type":"str","required"'
+    ':false}}}}},"override_allowaccess":{"type":"str","required":false,"choices":["enable","disable"]},"lan":{"type":"dict","required":false,"options":{"po'
+    'rt7_mode":{"type":"str","required":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port3_ssid":{"type":"str","required":fa'
+    'lse},"port_mode":{"type":"str","required":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port_esl_ssid":{"type":"str","re'
+    'quired":false},"port4_mode":{"type":"str","required":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port4_ssid":{"type":"'
+    'str","required":false},"port3_mode":{"type":"str","required":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port6_mode":{'
+    '"type":"str","required":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port5_mode":{"type":"str","required":false,"choice'
+    's":["offline","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port6_ssid":{"type":"str","required":false},"port_ssid":{"type":"str","required":false}'
+    ',"port1_ssid":{"type":"str","required":false},"port2_ssid":{"type":"str","required":false},"port8_mode":{"type":"str","required":false,"choices":["off'
+    'line","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port5_ssid":{"type":"str","required":false},"port_esl_mode":{"type":"str","required":false},"po'
+    'rt7_ssid":{"type":"str","required":false},"port8_ssid":{"type":"str","required":false},"port1_mode":{"type":"str","required":false,"choices":["offline'
+    '","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port2_mode":{"type":"str","required":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridg'
+    'e-to-ssid"]}}},"apcfg_profile":{"type":"str","required":false},"override_ip_fragment":{"type":"str","required":false,"choices":["enable","disable"]},"'
+    'override_led_state":{"type":"str","required":false,"choices":["enable","disable"]},"region_y":{"type":"str","required":false},"region_x":{"type":"str"'
+    ',"required":false},"wtp_id":{"type":"str","required":false},"image_download":{"type":"str","required":false,"choices":["enable","disable"]},"name":{"t'
+    'ype":"str","required":false},"override_split_tunnel":{"type":"str","required":false,"choices":["enable","disable"]},"admin":{"type":"str","required":f'
+    'alse,"choices":["discovered","disable","enable"]},"region":{"type":"str","required":false},"split_tunneling_acl_local_ap_subnet":{"type":"str","requir'
+    'ed":false,"choices":["enable","disable"]},"wtp_profile":{"type":"str","required":false},"login_passwd":{"type":"str","required":false},"firmware_provi'
+    'sion":{"type":"str","required":false},"wan_port_mode":{"type":"str","required":false,"choices":["wan-lan","wan-only"]},"led_state":{"type":"str","requ'
+    'ired":false,"choices":["enable","disable"]},"override_wan_port_mode":{"type":"str","required":false,"choices":["enable","disable"]},"login_passwd_chan'
+    'ge":{"type":"str","required":false,"choices":["yes","default","no"]},"coordinate_longitude":{"type":"str","required":false}}}'
+)
@@ -0,0 +1,32 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"platform_type":{"type":"string","options":[{"value":"AP-11N","revisions":[2047,2047]},{"value":"220B","revisions":[2047,20'
+    '47]},{"value":"210B","revisions":[2047,2047]},{"value":"222B","revisions":[2047,2047]},{"value":"112B","revisions":[2047,2047]},{"value":"320B","revis'
+    'ions":[2047,2047]},{"value":"11C","revisions":[2047,2047]},{"value":"14C","revisions":[2047,2047]},{"value":"223B","revisions":[2047,2047]},{"value":"'
+    '28C","revisions":[2047,2047]},{"value":"320C","revisions":[2047,2047]},{"value":"221C","revisions":[2047,2047]},{"value":"25D","revisions":[2047,2047]'
+    '},{"value":"222C","revisions":[2047,2047]},{"value":"224D","revisions":[2047,2047]},{"value":"214B","revisions":[2047,2047]},{"value":"21D","revisions'
+    '":[2047,2047]},{"value":"24D","revisions":[2047,2047]},{"value":"112D","revisions":[2047,2047]},{"value":"223C","revisions":[2047,2047]},{"value":"321'
+    'C","revisions":[2047,2047]},{"value":"C220C","revisions":[2047,2047]},{"value":"C225C","revisions":[2047,2047]},{"value":"C23JD","revisions":[2047,204'
+    '7]},{"value":"C24JE","revisions":[2047,2047]},{"value":"S321C","revisions":[2047,2047]},{"value":"S322C","revisions":[2047,2047]},{"value":"S323C","re'
+    'visions":[2047,2047]},{"value":"S311C","revisions":[2047,2047]},{"value":"S313C","revisions":[2047,2047]},{"value":"S321CR","revisions":[2047,2047]},{'
+    '"value":"S322CR","revisions":[2047,2047]},{"value":"S323CR","revisions":[2047,2047]},{"value":"S421E","revisions":[2047,2047]},{"value":"S422E","revis'
+    'ions":[2047,2047]},{"value":"S423E","revisions":[2047,2047]},{"value":"421E","revisions":[2047,2047]},{"value":"423E","revisions":[2047,2047]},{"value'
+    '":"221E","revisions":[2047,2047]},{"value":"222E","revisions":[2047,2047]},{"value":"223E","revisions":[2047,2047]},{"value":"224E","revisions":[2047,'
+    '2047]},{"value":"S221E","revisions":[2047,2047]},{"value":"S223E","revisions":[2047,2047]},{"value":"U421E","revisions":[2047,2047]},{"value":"U422EV"'
+    ',"revisions":[2047,2047]},{"value":"U423E","revisions":[2047,2047]},{"value":"U221EV","revisions":[2047,2047]},{"value":"U223EV","revisions":[2047,204'
+    '7]},{"value":"U24JEV","revisions":[2047,2047]},{"value":"U321EV","revisions":[2047,2047]},{"value":"U323EV","revisions":[2047,2047]},{"value":"231E","'
+    'revisions":[2040,2024]},{"value":"321E","revisions":[2040,2040]},{"value":"431F","revisions":[2040,2024]},{"value":"432F","revisions":[2040,1768]},{"v'
+    'alue":"433F","revisions":[2040,2024]},{"value":"231F","revisions":[2040,1768]},{"value":"234F","revisions":[2040,1768]},{"value":"23JF","revisions":[2'
+    '040,1768]},{"value":"U431F","revisions":[2040,2040]},{"value":"U433F","revisions":[2040,2040]},{"value":"831F","revisions":[1536,1536]},{"value":"U231'
+    'F","revisions":[1536,1536]},{"value":"U234F","revisions":[1536,1536]},{"value":"U432F","revisions":[1536,1536]}],"revisions":[2047,2047]},"name":{"typ'
+    'e":"string","revisions":[2047,2047]},"wtps":{"type":"list","children":{"wtp_id":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]}},"'
+    'revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"platform_type":{"type":"str","required":false},"name":{"type":"str","required":false},"wtps":{"type":"list'
+    '","required":false,"options":{"wtp_id":{"type":"str","required":false}}}}}'
+)
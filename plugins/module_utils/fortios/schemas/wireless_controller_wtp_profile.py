@@ -0,0 +1,529 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+VERSIONED_SCHEMA = (
+    '{"type":"list","children":{"comment":{"type":"string","revisions":[2047,2047]},"split_tunneling_acl":{"type":"list","children":{"id":{"type":"integer"'
+    ',"revisions":[2047,2047]},"dest_ip":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"lbs":{"type":"dict","children":{"fortipresenc'
+    'e_port":{"type":"integer","revisions":[2047,2047]},"erc_server_port":{"type":"integer","revisions":[2047,2047]},"aeroscout":{"type":"string","options"'
+    ':[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"fortipresence_frequency":{"type":"'
+    'integer","revisions":[2047,2047]},"fortipresence_ble":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revis'
+    'ions":[2040,2040]}],"revisions":[2040,2040]},"fortipresence_project":{"type":"string","revisions":[2047,2047]},"aeroscout_ap_mac":{"type":"string","op'
+    'tions":[{"value":"bssid","revisions":[2047,2047]},{"value":"board-mac","revisions":[2047,2047]}],"revisions":[2047,2047]},"aeroscout_mmu_report":{"typ'
+    'e":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"fortipresence'
+    '":{"type":"string","options":[{"value":"foreign","revisions":[2047,2047]},{"value":"both","revisions":[2047,2047]},{"value":"disable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"ekahau_tag":{"type":"string","revisions":[2047,2047]},"fortipresence_unassoc":{"type":"string","options":[{"value"'
+    ':"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"erc_server_ip":{"type":"string","revisions":'
+    '[2047,2047]},"aeroscout_mu_factor":{"type":"integer","revisions":[2047,2047]},"fortipresence_server":{"type":"string","revisions":[2047,2047]},"statio'
+    'n_locate":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    ',"aeroscout_mu":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,'
+    '2047]},"aeroscout_mu_timeout":{"type":"integer","revisions":[2047,2047]},"aeroscout_server_ip":{"type":"string","revisions":[2047,2047]},"fortipresenc'
+    'e_secret":{"type":"string","revisions":[2047,2047]},"aeroscout_server_port":{"type":"integer","revisions":[2047,2047]},"fortipresence_rogue":{"type":"'
+    'string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ekahau_blink_mode'
+    '":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]}},"revis'
+    'ions":[2047,2047]},"control_message_offload":{"multiple_values":true,"type":"list","options":[{"value":"ebp-frame","revisions":[2047,2047]},{"value":"'
+    'aeroscout-tag","revisions":[2047,2047]},{"value":"ap-list","revisions":[2047,2047]},{"value":"sta-list","revisions":[2047,2047]},{"value":"sta-cap-lis'
+    't","revisions":[2047,2047]},{"value":"stats","revisions":[2047,2047]},{"value":"aeroscout-mu","revisions":[2047,2047]},{"value":"sta-health","revision'
+    's":[2040,2040]},{"value":"spectral-analysis","revisions":[1920,1920]}],"revisions":[2047,2047]},"tun_mtu_downlink":{"type":"integer","revisions":[2047'
+    ',2047]},"tun_mtu_uplink":{"type":"integer","revisions":[2047,2047]},"ble_profile":{"type":"string","revisions":[2047,2047]},"lldp":{"type":"string","o'
+    'ptions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"login_passwd_change":{"type'
+    '":"string","options":[{"value":"yes","revisions":[2047,2047]},{"value":"default","revisions":[2047,2047]},{"value":"no","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"platform":{"type":"dict","children":{"type":{"type":"string","options":[{"value":"AP-11N","revisions":[2047,2047]},{"value":"220'
+    'B","revisions":[2047,2047]},{"value":"210B","revisions":[2047,2047]},{"value":"222B","revisions":[2047,2047]},{"value":"112B","revisions":[2047,2047]}'
+    ',{"value":"320B","revisions":[2047,2047]},{"value":"11C","revisions":[2047,2047]},{"value":"14C","revisions":[2047,2047]},{"value":"223B","revisions":'
+    '[2047,2047]},{"value":"28C","revisions":[2047,2047]},{"value":"320C","revisions":[2047,2047]},{"value":"221C","revisions":[2047,2047]},{"value":"25D",'
+    '"revisions":[2047,2047]},{"value":"222C","revisions":[2047,2047]},{"value":"224D","revisions":[2047,2047]},{"value":"214B","revisions":[2047,2047]},{"'
+    'value":"21D","revisions":[2047,2047]},{"value":"24D","revisions":[2047,2047]},{"value":"112D","revisions":[2047,2047]},{"value":"223C","revisions":[20'
+    '47,2047]},{"value":"321C","revisions":[2047,2047]},{"value":"C220C","revisions":[2047,2047]},{"value":"C225C","revisions":[2047,2047]},{"value":"C23JD'
+    '","revisions":[2047,2047]},{"value":"C24JE","revisions":[2047,2047]},{"value":"S321C","revisions":[2047,2047]},{"value":"S322C","revisions":[2047,2047'
+    ']},{"value":"S323C","revisions":[2047,2047]},{"value":"S311C","revisions":[2047,2047]},{"value":"S313C","revisions":[2047,2047]},{"value":"S321CR","re'
+    'visions":[2047,2047]},{"value":"S322CR","revisions":[2047,2047]},{"value":"S323CR","revisions":[2047,2047]},{"value":"S421E","revisions":[2047,2047]},'
+    '{"value":"S422E","revisions":[2047,2047]},{"value":"S423E","revisions":[2047,2047]},{"value":"421E","revisions":[2047,2047]},{"value":"423E","revision'
+    's":[2047,2047]},{"value":"221E","revisions":[2047,2047]},{"value":"222E","revisions":[2047,2047]},{"value":"223E","revisions":[2047,2047]},{"value":"2'
+    '24E","revisions":[2047,2047]},{"value":"S221E","revisions":[2047,2047]},{"value":"S223E","revisions":[2047,2047]},{"value":"U421E","revisions":[2047,2'
+    '047]},{"value":"U422EV","revisions":[2047,2047]},{"value":"U423E","revisions":[2047,2047]},{"value":"U221EV","revisions":[2047,2047]},{"value":"U223EV'
+    '","revisions":[2047,2047]},{"value":"U24JEV","revisions":[2047,2047]},{"value":"U321EV","revisions":[2047,2047]},{"value":"U323EV","revisions":[2047,2'
+    '047]},{"value":"231E","revisions":[2040,2024]},{"value":"321E","revisions":[2040,2040]},{"value":"431F","revisions":[2040,2024]},{"value":"432F","revi'
+    'sions":[2040,1768]},{"value":"433F","revisions":[2040,2024]},{"value":"231F","revisions":[2040,1768]},{"value":"234F","revisions":[2040,1768]},{"value'
+    '":"23JF","revisions":[2040,1768]},{"value":"U431F","revisions":[2040,2040]},{"value":"U433F","revisions":[2040,2040]},{"value":"831F","revisions":[153'
+    '6,1536]},{"value":"U231F","revisions":[1536,1536]},{"value":"U234F","revisions":[1536,1536]},{"value":"U432F","revisions":[1536,1536]}],"revisions":[2'
+    '047,2047]},"mode":{"type":"string","options":[{"value":"single-5G","revisions":[2040,2040]},{"value":"dual-5G","revisions":[2040,2040]}],"revisions":['
+    '2040,2040]},"ddscan":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":['
+    '2040,2024]}},"revisions":[2047,2047]},"frequency_handoff":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","r'
+    'evisions":[1920,1920]}],"revisions":[1920,1920]},"deny_mac_list":{"type":"list","children":{"mac":{"type":"string","revisions":[2047,2047]},"id":{"typ'
+    'e":"integer","revisions":[2047,2047]}},"revisions":[2047,2047]},"split_tunneling_acl_path":{"type":"string","options":[{"value":"tunnel","revisions":['
+    '2047,2047]},{"value":"local","revisions":[2047,2047]}],"revisions":[2047,2047]},"ip_fragment_preventing":{"multiple_values":true,"type":"list","option'
+    's":[{"value":"tcp-mss-adjust","revisions":[2047,2047]},{"value":"icmp-unreachable","revisions":[2047,2047]}],"revisions":[2047,2047]},"radio_3":{"type'
+    '":"dict","children":{"transmit_optimize":{"multiple_values":true,"type":"list","options":[{"value":"disable","revisions":[2040,2040]},{"value":"power-'
+    'save","revisions":[2040,2040]},{"value":"aggr-limit","revisions":[2040,2040]},{"value":"retry-limit","revisions":[2040,2040]},{"value":"send-bar","rev'
+    'isions":[2040,2040]}],"revisions":[2040,2040]},"ap_sniffer_bufsize":{"type":"integer","revisions":[2040,2040]},"ap_handoff":{"type":"string","options"'
+    ':[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions":[2040,120]},"frag_threshold":{"type":"integer","revi'
+    'sions":[2040,2040]},"bandwidth_admission_control":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions'
+    '":[2040,2040]}],"revisions":[2040,2040]},"coexistence":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revi'
+    'sions":[2040,2040]}],"revisions":[2040,2040]},"auto_power_low":{"type":"integer","revisions":[2040,2040]},"ap_sniffer_ctl":{"type":"string","options":'
+    '[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"bandwidth_capacity":{"type":"intege'
+    'r","revisions":[2040,2040]},"bss_color":{"type":"integer","revisions":[1920,1664]},"band_5g_type":{"type":"string","options":[{"value":"5g-full","revi'
+    'sions":[2024,2024]},{"value":"5g-high","revisions":[2024,2024]},{"value":"5g-low","revisions":[2024,2024]}],"revisions":[2040,2024]},"channel_bonding"'
+    ':{"type":"string","options":[{"value":"160MHz","revisions":[2040,2040]},{"value":"80MHz","revisions":[2040,2040]},{"value":"40MHz","revisions":[2040,2'
+    '040]},{"value":"20MHz","revisions":[2040,2040]}],"revisions":[2040,2040]},"dtim":{"type":"integer","revisions":[2040,2040]},"auto_power_high":{"type":'
+    '"integer","revisions":[2040,2040]},"iperf_server_port":{"type":"integer","revisions":[1024,1024]},"vaps":{"type":"list","children":{"name":{"type":"st'
+    'ring","revisions":[2040,2040]}},"revisions":[2040,2040]},"short_guard_interval":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]}'
+    ',{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"powersave_optimize":{"multiple_values":true,"type":"list","options":[{"value":'
+    '"tim","revisions":[2040,2040]},{"value":"ac-vo","revisions":[2040,2040]},{"value":"no-obss-scan","revisions":[2040,2040]},{"value":"no-11b-rate","revi'
+    'sions":[2040,2040]},{"value":"client-rate-follow","revisions":[2040,2040]}],"revisions":[2040,2040]},"auto_power_level":{"type":"string","options":[{"'
+    'value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"ap_sniffer_chan":{"type":"integer","re'
+    'visions":[2040,2040]},"ap_sniffer_addr":{"type":"string","revisions":[2040,2040]},"radio_id":{"type":"integer","revisions":[2032,16]},"ap_sniffer_data'
+    '":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"wids_p'
+    'rofile":{"type":"string","revisions":[2040,2040]},"vap_all":{"type":"string","options":[{"value":"enable","revisions":[2040,120]},{"value":"disable","'
+    'revisions":[2040,120]},{"value":"tunnel","revisions":[1920,1920]},{"value":"bridge","revisions":[1920,1920]},{"value":"manual","revisions":[1920,1920]'
+    '}],"revisions":[2040,2040]},"rts_threshold":{"type":"integer","revisions":[2040,2040]},"iperf_protocol":{"type":"string","options":[{"value":"udp","re'
+    'visions":[1024,1024]},{"value":"tcp","revisions":[1024,1024]}],"revisions":[1024,1024]},"channel":{"type":"list","children":{"chan":{"type":"string","'
+    'revisions":[2040,2040]}},"revisions":[2040,2040]},"protection_mode":{"type":"string","options":[{"value":"rtscts","revisions":[2040,2040]},{"value":"c'
+    'tsonly","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"drma":{"type":"string","options":[{"value":"di'
+    'sable","revisions":[1536,1536]},{"value":"enable","revisions":[1536,1536]}],"revisions":[1536,1536]},"sam_security_type":{"type":"string","options":[{'
+    '"value":"open","revisions":[1024,1024]},{"value":"wpa-personal","revisions":[1024,1024]},{"value":"wpa-enterprise","revisions":[1024,1024]}],"revision'
+    's":[1024,1024]},"power_value":{"type":"integer","revisions":[1024,1024]},"ap_sniffer_mgmt_probe":{"type":"string","options":[{"value":"enable","revisi'
+    'ons":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"zero_wait_dfs":{"type":"string","options":[{"value":"enable",'
+    '"revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2040,2024]},"spectrum_analysis":{"type":"string","options":[{"value'
+    '":"enable","revisions":[376,376]},{"value":"disable","revisions":[376,376]},{"value":"scan-only","revisions":[256,256]}],"revisions":[2040,376]},"chan'
+    'nel_utilization":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040'
+    ',2040]},"frequency_handoff":{"type":"string","options":[{"value":"enable","revisions":[120,120]},{"value":"disable","revisions":[120,120]}],"revisions'
+    '":[2040,120]},"sam_password":{"type":"string","revisions":[1024,1024]},"drma_sensitivity":{"type":"string","options":[{"value":"low","revisions":[1536'
+    ',1536]},{"value":"medium","revisions":[1536,1536]},{"value":"high","revisions":[1536,1536]}],"revisions":[1536,1536]},"band":{"type":"string","options'
+    '":[{"value":"802.11a","revisions":[2040,2040]},{"value":"802.11b","revisions":[2040,2040]},{"value":"802.11g","revisions":[2040,2040]},{"value":"802.1'
+    '1n","revisions":[2040,2040]},{"value":"802.11n-5G","revisions":[2040,2040]},{"value":"802.11ac","revisions":[2040,2040]},{"value":"802.11ax-5G","revis'
+    'ions":[2040,2040]},{"value":"802.11ax","revisions":[2040,2040]},{"value":"802.11n,g-only","revisions":[2040,2040]},{"value":"802.11g-only","revisions"'
+    ':[2040,2040]},{"value":"802.11n-only","revisions":[2040,2040]},{"value":"802.11n-5G-only","revisions":[2040,2040]},{"value":"802.11ac,n-only","revisio'
+    'ns":[2040,2040]},{"value":"802.11ac-only","revisions":[2040,2040]},{"value":"802.11ax,ac-only","revisions":[2040,2040]},{"value":"802.11ax,ac,n-only",'
+    '"revisions":[2040,2040]},{"value":"802.11ax-5G-only","revisions":[2040,2040]},{"value":"802.11ax,n-only","revisions":[2040,2040]},{"value":"802.11ax,n'
+    ',g-only","revisions":[2040,2040]},{"value":"802.11ax-only","revisions":[2040,2040]},{"value":"802.11ac-2G","revisions":[1920,1920]}],"revisions":[2040'
+    ',2040]},"ap_sniffer_mgmt_beacon":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"'
+    'revisions":[2040,2040]},"beacon_interval":{"type":"integer","revisions":[2040,2040]},"ap_sniffer_mgmt_other":{"type":"string","options":[{"value":"ena'
+    'ble","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"sam_ssid":{"type":"string","revisions":[1024,1024'
+    ']},"max_distance":{"type":"integer","revisions":[2040,2040]},"sam_test":{"type":"string","options":[{"value":"ping","revisions":[1024,1024]},{"value":'
+    '"iperf","revisions":[1024,1024]}],"revisions":[1024,1024]},"call_admission_control":{"type":"string","options":[{"value":"enable","revisions":[2040,20'
+    '40]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"power_level":{"type":"integer","revisions":[2040,2040]},"max_clients":{"ty'
+    'pe":"integer","revisions":[2040,2040]},"airtime_fairness":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","r'
+    'evisions":[2040,2040]}],"revisions":[2040,2040]},"darrp":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","re'
+    'visions":[2040,2040]}],"revisions":[2040,2040]},"sam_report_intv":{"type":"integer","revisions":[1024,1024]},"call_capacity":{"type":"integer","revisi'
+    'ons":[2040,2040]},"sam_bssid":{"type":"string","revisions":[1024,1024]},"sam_captive_portal":{"type":"string","options":[{"value":"enable","revisions"'
+    ':[1024,1024]},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"amsdu":{"type":"string","options":[{"value":"enable","revisions":'
+    '[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040]},"auto_power_target":{"type":"string","revisions":[1536,1536]},"sam_'
+    'server":{"type":"string","revisions":[1024,1024]},"sam_username":{"type":"string","revisions":[1024,1024]},"mode":{"type":"string","options":[{"value"'
+    ':"disabled","revisions":[2040,2040]},{"value":"ap","revisions":[2040,2040]},{"value":"monitor","revisions":[2040,2040]},{"value":"sniffer","revisions"'
+    ':[2040,2040]},{"value":"sam","revisions":[1024,1024]}],"revisions":[2040,2040]},"power_mode":{"type":"string","options":[{"value":"dBm","revisions":[1'
+    '024,1024]},{"value":"percentage","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[2040,2040]},"radio_2":{"type":"dict","children":{"tr'
+    'ansmit_optimize":{"multiple_values":true,"type":"list","options":[{"value":"disable","revisions":[2047,2047]},{"value":"power-save","revisions":[2047,'
+    '2047]},{"value":"aggr-limit","revisions":[2047,2047]},{"value":"retry-limit","revisions":[2047,2047]},{"value":"send-bar","revisions":[2047,2047]}],"r'
+    'evisions":[2047,2047]},"ap_sniffer_bufsize":{"type":"integer","revisions":[2047,2047]},"ap_handoff":{"type":"string","options":[{"value":"enable","rev'
+    'isions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"sam_bssid":{"type":"string","revisions":[1024,1024]},"frag_thre'
+    'shold":{"type":"integer","revisions":[2047,2047]},"bandwidth_admission_control":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]}'
+    ',{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"coexistence":{"type":"string","options":[{"value":"enable","revisions":[2047,2'
+    '047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auto_power_low":{"type":"integer","revisions":[2047,2047]},"ap_sniffer_ct'
+    'l":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"bandw'
+    'idth_capacity":{"type":"integer","revisions":[2047,2047]},"bss_color":{"type":"integer","revisions":[1920,1664]},"band_5g_type":{"type":"string","opti'
+    'ons":[{"value":"5g-full","revisions":[2024,2024]},{"value":"5g-high","revisions":[2024,2024]},{"value":"5g-low","revisions":[2024,2024]}],"revisions":'
+    '[2040,2024]},"channel_bonding":{"type":"string","options":[{"value":"80MHz","revisions":[2047,2047]},{"value":"40MHz","revisions":[2047,2047]},{"value'
+    '":"20MHz","revisions":[2047,2047]},{"value":"160MHz","revisions":[2040,2040]}],"revisions":[2047,2047]},"dtim":{"type":"integer","revisions":[2047,204'
+    '7]},"auto_power_high":{"type":"integer","revisions":[2047,2047]},"iperf_server_port":{"type":"integer","revisions":[1024,1024]},"vaps":{"type":"list",'
+    '"children":{"name":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"short_guard_interval":{"type":"string","options":[{"value":"en'
+    'able","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"powersave_optimize":{"multiple_values":true,"typ'
+    'e":"list","options":[{"value":"tim","revisions":[2047,2047]},{"value":"ac-vo","revisions":[2047,2047]},{"value":"no-obss-scan","revisions":[2047,2047]'
+    '},{"value":"no-11b-rate","revisions":[2047,2047]},{"value":"client-rate-follow","revisions":[2047,2047]}],"revisions":[2047,2047]},"auto_power_level":'
+    '{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ap_sniff'
+    'er_chan":{"type":"integer","revisions":[2047,2047]},"ap_sniffer_addr":{"type":"string","revisions":[2047,2047]},"spectrum_analysis":{"type":"string","'
+    'options":[{"value":"enable","revisions":[383,383]},{"value":"disable","revisions":[383,383]},{"value":"scan-only","revisions":[256,256]}],"revisions":'
+    '[2047,383]},"ap_sniffer_data":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"wids_profile":{"type":"string","revisions":[2047,2047]},"vap_all":{"type":"string","options":[{"value":"enable","revisions":[204'
+    '7,127]},{"value":"disable","revisions":[2047,127]},{"value":"tunnel","revisions":[1920,1920]},{"value":"bridge","revisions":[1920,1920]},{"value":"man'
+    'ual","revisions":[1920,1920]}],"revisions":[2047,2047]},"rts_threshold":{"type":"integer","revisions":[2047,2047]},"iperf_protocol":{"type":"string","'
+    'options":[{"value":"udp","revisions":[1024,1024]},{"value":"tcp","revisions":[1024,1024]}],"revisions":[1024,1024]},"channel":{"type":"list","children'
+    '":{"chan":{"type":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"protection_mode":{"type":"string","options":[{"value":"rtscts","revisio'
+    'ns":[2047,2047]},{"value":"ctsonly","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"drma":{"type":"str'
+    'ing","options":[{"value":"disable","revisions":[1536,1536]},{"value":"enable","revisions":[1536,1536]}],"revisions":[1536,1536]},"sam_security_type":{'
+    '"type":"string","options":[{"value":"open","revisions":[1024,1024]},{"value":"wpa-personal","revisions":[1024,1024]},{"value":"wpa-enterprise","revisi'
+    'ons":[1024,1024]}],"revisions":[1024,1024]},"power_value":{"type":"integer","revisions":[1024,1024]},"ap_sniffer_mgmt_probe":{"type":"string","options'
+    '":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"zero_wait_dfs":{"type":"string","'
+    'options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2040,2024]},"channel_utilization":{"typ'
+    'e":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"frequency_han'
+    'doff":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"sam_pas'
+    'sword":{"type":"string","revisions":[1024,1024]},"drma_sensitivity":{"type":"string","options":[{"value":"low","revisions":[1536,1536]},{"value":"medi'
+    'um","revisions":[1536,1536]},{"value":"high","revisions":[1536,1536]}],"revisions":[1536,1536]},"band":{"type":"string","options":[{"value":"802.11a",'
+    '"revisions":[2047,2047]},{"value":"802.11b","revisions":[2047,2047]},{"value":"802.11g","revisions":[2047,2047]},{"value":"802.11n","revisions":[2047,'
+    '2047]},{"value":"802.11n-5G","revisions":[2047,2047]},{"value":"802.11ac","revisions":[2047,2047]},{"value":"802.11n,g-only","revisions":[2047,2047]},'
+    '{"value":"802.11g-only","revisions":[2047,2047]},{"value":"802.11n-only","revisions":[2047,2047]},{"value":"802.11n-5G-only","revisions":[2047,2047]},'
+    '{"value":"802.11ac,n-only","revisions":[2047,2047]},{"value":"802.11ac-only","revisions":[2047,2047]},{"value":"802.11ax-5G","revisions":[2040,2040]},'
+    '{"value":"802.11ax","revisions":[2040,2040]},{"value":"802.11ax,ac-only","revisions":[2040,2040]},{"value":"802.11ax,ac,n-only","revisions":[2040,2040'
+    ']},{"value":"802.11ax-5G-only","revisions":[2040,2040]},{"value":"802.11ax,n-only","revisions":[2040,2040]},{"value":"802.11ax,n,g-only","revisions":['
+    '2040,2040]},{"value":"802.11ax-only","revisions":[2040,2040]},{"value":"802.11ac-2G","revisions":[1920,1920]}],"revisions":[2047,2047]},"ap_sniffer_mg'
+    'mt_beacon":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"beacon_interval":{"type":"integer","revisions":[2047,2047]},"ap_sniffer_mgmt_other":{"type":"string","options":[{"value":"enable","revisions":[2047'
+    ',2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"sam_ssid":{"type":"string","revisions":[1024,1024]},"max_distance":{"ty'
+    'pe":"integer","revisions":[2047,2047]},"sam_test":{"type":"string","options":[{"value":"ping","revisions":[1024,1024]},{"value":"iperf","revisions":[1'
+    '024,1024]}],"revisions":[1024,1024]},"call_admission_control":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable'
+    '","revisions":[2047,2047]}],"revisions":[2047,2047]},"power_level":{"type":"integer","revisions":[2047,2047]},"max_clients":{"type":"integer","revisio'
+    'ns":[2047,2047]},"airtime_fairness":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}'
+    '],"revisions":[2040,2040]},"darrp":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}]'
+    ',"revisions":[2047,2047]},"sam_report_intv":{"type":"integer","revisions":[1024,1024]},"call_capacity":{"type":"integer","revisions":[2047,2047]},"rad'
+    'io_id":{"type":"integer","revisions":[2047,23]},"sam_captive_portal":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"'
+    'disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"amsdu":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"d'
+    'isable","revisions":[2047,2047]}],"revisions":[2047,2047]},"auto_power_target":{"type":"string","revisions":[1536,1536]},"sam_server":{"type":"string"'
+    ',"revisions":[1024,1024]},"sam_username":{"type":"string","revisions":[1024,1024]},"mode":{"type":"string","options":[{"value":"disabled","revisions":'
+    '[2047,2047]},{"value":"ap","revisions":[2047,2047]},{"value":"monitor","revisions":[2047,2047]},{"value":"sniffer","revisions":[2047,2047]},{"value":"'
+    'sam","revisions":[1024,1024]}],"revisions":[2047,2047]},"power_mode":{"type":"string","options":[{"value":"dBm","revisions":[1024,1024]},{"value":"per'
+    'centage","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[2047,2047]},"radio_1":{"type":"dict","children":{"transmit_optimize":{"multi'
+    'ple_values":true,"type":"list","options":[{"value":"disable","revisions":[2047,2047]},{"value":"power-save","revisions":[2047,2047]},{"value":"aggr-li'
+    'mit","revisions":[2047,2047]},{"value":"retry-limit","revisions":[2047,2047]},{"value":"send-bar","revisions":[2047,2047]}],"revisions":[2047,2047]},"'
+    'ap_sniffer_bufsize":{"type":"integer","revisions":[2047,2047]},"ap_handoff":{"type":"string","options":[{"value":"enable","revisions":[127,127]},{"val'
+    'ue":"disable","revisions":[127,127]}],"revisions":[2047,127]},"sam_bssid":{"type":"string","revisions":[1024,1024]},"frag_threshold":{"type":"integer"'
+    ',"revisions":[2047,2047]},"bandwidth_admission_control":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","rev'
+    'isions":[2047,2047]}],"revisions":[2047,2047]},"coexistence":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable"'
+    ',"revisions":[2047,2047]}],"revisions":[2047,2047]},"auto_power_low":{"type":"integer","revisions":[2047,2047]},"ap_sniffer_ctl":{"type":"string","opt'
+    'ions":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"bandwidth_capacity":{"type":"'
+    'integer","revisions":[2047,2047]},"bss_color":{"type":"integer","revisions":[1920,1664]},"band_5g_type":{"type":"string","options":[{"value":"5g-full"'
+    ',"revisions":[2024,2024]},{"value":"5g-high","revisions":[2024,2024]},{"value":"5g-low","revisions":[2024,2024]}],"revisions":[2040,2024]},"channel_bo'
+    'nding":{"type":"string","options":[{"value":"80MHz","revisions":[2047,2047]},{"value":"40MHz","revisions":[2047,2047]},{"value":"20MHz","revisions":[2'
+    '047,2047]},{"value":"160MHz","revisions":[2040,2040]}],"revisions":[2047,2047]},"dtim":{"type":"integer","revisions":[2047,2047]},"auto_power_high":{"'
+    'type":"integer","revisions":[2047,2047]},"iperf_server_port":{"type":"integer","revisions":[1024,1024]},"vaps":{"type":"list","children":{"name":{"typ'
+    'e":"string","revisions":[2047,2047]}},"revisions":[2047,2047]},"short_guard_interval":{"type":"string","options":[{"value":"enable","revisions":[2047,'
+    '2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"powersave_optimize":{"multiple_values":true,"type":"list","options":[{"v'
+    'alue":"tim","revisions":[2047,2047]},{"value":"ac-vo","revisions":[2047,2047]},{"value":"no-obss-scan","revisions":[2047,2047]},{"value":"no-11b-rate"'
+    ',"revisions":[2047,2047]},{"value":"client-rate-follow","revisions":[2047,2047]}],"revisions":[2047,2047]},"auto_power_level":{"type":"string","option'
+    's":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"ap_sniffer_chan":{"type":"intege'
+    'r","revisions":[2047,2047]},"ap_sniffer_addr":{"type":"string","revisions":[2047,2047]},"spectrum_analysis":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[383,383]},{"value":"disable","revisions":[383,383]},{"value":"scan-only","revisions":[256,256]}],"revisions":[2047,383]},"ap_sniffer_'
+    'data":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"wi'
+    'ds_profile":{"type":"string","revisions":[2047,2047]},"vap_all":{"type":"string","options":[{"value":"enable","revisions":[2047,127]},{"value":"disabl'
+    'e","revisions":[2047,127]},{"value":"tunnel","revisions":[1920,1920]},{"value":"bridge","revisions":[1920,1920]},{"value":"manual","revisions":[1920,1'
+    '920]}],"revisions":[2047,2047]},"rts_threshold":{"type":"integer","revisions":[2047,2047]},"iperf_protocol":{"type":"string","options":[{"value":"udp"'
+    ',"revisions":[1024,1024]},{"value":"tcp","revisions":[1024,1024]}],"revisions":[1024,1024]},"channel":{"type":"list","children":{"chan":{"type":"strin'
+    'g","revisions":[2047,2047]}},"revisions":[2047,2047]},"protection_mode":{"type":"string","options":[{"value":"rtscts","revisions":[2047,2047]},{"value'
+    '":"ctsonly","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"drma":{"type":"string","options":[{"value"'
+    ':"disable","revisions":[1536,1536]},{"value":"enable","revisions":[1536,1536]}],"revisions":[1536,1536]},"sam_security_type":{"type":"string","options'
+    '":[{"value":"open","revisions":[1024,1024]},{"value":"wpa-personal","revisions":[1024,1024]},{"value":"wpa-enterprise","revisions":[1024,1024]}],"revi'
+    'sions":[1024,1024]},"power_value":{"type":"integer","revisions":[1024,1024]},"ap_sniffer_mgmt_probe":{"type":"string","options":[{"value":"enable","re'
+    'visions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"zero_wait_dfs":{"type":"string","options":[{"value":"enab'
+    'le","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2040,2024]},"channel_utilization":{"type":"string","options":[{'
+    '"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"frequency_handoff":{"type":"string","'
+    'options":[{"value":"enable","revisions":[127,127]},{"value":"disable","revisions":[127,127]}],"revisions":[2047,127]},"sam_password":{"type":"string",'
+    '"revisions":[1024,1024]},"drma_sensitivity":{"type":"string","options":[{"value":"low","revisions":[1536,1536]},{"value":"medium","revisions":[1536,15'
+    '36]},{"value":"high","revisions":[1536,1536]}],"revisions":[1536,1536]},"band":{"type":"string","options":[{"value":"802.11a","revisions":[2047,2047]}'
+    ',{"value":"802.11b","revisions":[2047,2047]},{"value":"802.11g","revisions":[2047,2047]},{"value":"802.11n","revisions":[2047,2047]},{"value":"802.11n'
+    '-5G","revisions":[2047,2047]},{"value":"802.11ac","revisions":[2047,2047]},{"value":"802.11n,g-only","revisions":[2047,2047]},{"value":"802.11g-only",'
+    '"revisions":[2047,2047]},{"value":"802.11n-only","revisions":[2047,2047]},{"value":"802.11n-5G-only","revisions":[2047,2047]},{"value":"802.11ac,n-onl'
+    'y","revisions":[2047,2047]},{"value":"802.11ac-only","revisions":[2047,2047]},{"value":"802.11ax-5G","revisions":[2040,2040]},{"value":"802.11ax","rev'
+    'isions":[2040,2040]},{"value":"802.11ax,ac-only","revisions":[2040,2040]},{"value":"802.11ax,ac,n-only","revisions":[2040,2040]},{"value":"802.11ax-5G'
+    '-only","revisions":[2040,2040]},{"value":"802.11ax,n-only","revisions":[2040,2040]},{"value":"802.11ax,n,g-only","revisions":[2040,2040]},{"value":"80'
+    '2.11ax-only","revisions":[2040,2040]},{"value":"802.11ac-2G","revisions":[1920,1920]}],"revisions":[2047,2047]},"ap_sniffer_mgmt_beacon":{"type":"stri'
+    'ng","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"beacon_interval":{"ty'
+    'pe":"integer","revisions":[2047,2047]},"ap_sniffer_mgmt_other":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disabl'
+    'e","revisions":[2047,2047]}],"revisions":[2047,2047]},"sam_ssid":{"type":"string","revisions":[1024,1024]},"max_distance":{"type":"integer","revisions'
+    '":[2047,2047]},"sam_test":{"type":"string","options":[{"value":"ping","revisions":[1024,1024]},{"value":"iperf","revisions":[1024,1024]}],"revisions":'
+    '[1024,1024]},"call_admission_control":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047'
+    ']}],"revisions":[2047,2047]},"power_level":{"type":"integer","revisions":[2047,2047]},"max_clients":{"type":"integer","revisions":[2047,2047]},"airtim'
+    'e_fairness":{"type":"string","options":[{"value":"enable","revisions":[2040,2040]},{"value":"disable","revisions":[2040,2040]}],"revisions":[2040,2040'
+    ']},"darrp":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]'
+    '},"sam_report_intv":{"type":"integer","revisions":[1024,1024]},"call_capacity":{"type":"integer","revisions":[2047,2047]},"radio_id":{"type":"integer"'
+    ',"revisions":[2047,23]},"sam_captive_portal":{"type":"string","options":[{"value":"enable","revisions":[1024,1024]},{"value":"disable","revisions":[10'
+    '24,1024]}],"revisions":[1024,1024]},"amsdu":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[204'
+    '7,2047]}],"revisions":[2047,2047]},"auto_power_target":{"type":"string","revisions":[1536,1536]},"sam_server":{"type":"string","revisions":[1024,1024]'
+    '},"sam_username":{"type":"string","revisions":[1024,1024]},"mode":{"type":"string","options":[{"value":"disabled","revisions":[2047,2047]},{"value":"a'
+    'p","revisions":[2047,2047]},{"value":"monitor","revisions":[2047,2047]},{"value":"sniffer","revisions":[2047,2047]},{"value":"sam","revisions":[1024,1'
+    '024]}],"revisions":[2047,2047]},"power_mode":{"type":"string","options":[{"value":"dBm","revisions":[1024,1024]},{"value":"percentage","revisions":[10'
+    '24,1024]}],"revisions":[1024,1024]}},"revisions":[2047,2047]},"allowaccess":{"multiple_values":true,"type":"list","options":[{"value":"telnet","revisi'
+    'ons":[2047,7]},{"value":"http","revisions":[2047,7]},{"value":"https","revisions":[2047,2047]},{"value":"ssh","revisions":[2047,2047]},{"value":"snmp"'
+    ',"revisions":[2040,2040]}],"revisions":[2047,2047]},"dtls_in_kernel":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"'
+    'disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"handoff_sta_thresh":{"type":"integer","revisions":[2047,2047]},"lan":{"type":"dict","chil'
+    'dren":{"port7_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-to-wan","revisions":[2047,2047]},{"value":"b'
+    'ridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]},"port3_ssid":{"type":"string","rev'
+    'isions":[2047,2047]},"port_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-to-wan","revisions":[2047,2047]'
+    '},{"value":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]},"port_esl_ssid":{"typ'
+    'e":"string","revisions":[1920,1664]},"port4_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-to-wan","revis'
+    'ions":[2047,2047]},{"value":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]},"por'
+    't4_ssid":{"type":"string","revisions":[2047,2047]},"port3_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-'
+    'to-wan","revisions":[2047,2047]},{"value":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[20'
+    '47,2047]},"port6_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-to-wan","revisions":[2047,2047]},{"value"'
+    ':"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]},"port5_mode":{"type":"string","'
+    'options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-to-wan","revisions":[2047,2047]},{"value":"bridge-to-wan","revisions":[2047,2047]}'
+    ',{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]},"port6_ssid":{"type":"string","revisions":[2047,2047]},"port_ssid":{"typ'
+    'e":"string","revisions":[2047,2047]},"port1_ssid":{"type":"string","revisions":[2047,2047]},"port2_ssid":{"type":"string","revisions":[2047,2047]},"po'
+    'rt8_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-to-wan","revisions":[2047,2047]},{"value":"bridge-to-w'
+    'an","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]},"port5_ssid":{"type":"string","revisions":[2'
+    '047,2047]},"port_esl_mode":{"type":"string","options":[{"value":"offline","revisions":[1664,1664]},{"value":"nat-to-wan","revisions":[1664,1664]},{"va'
+    'lue":"bridge-to-wan","revisions":[1664,1664]},{"value":"bridge-to-ssid","revisions":[1664,1664]}],"revisions":[1920,1664]},"port7_ssid":{"type":"strin'
+    'g","revisions":[2047,2047]},"port8_ssid":{"type":"string","revisions":[2047,2047]},"port1_mode":{"type":"string","options":[{"value":"offline","revisi'
+    'ons":[2047,2047]},{"value":"nat-to-wan","revisions":[2047,2047]},{"value":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revision'
+    's":[2047,2047]}],"revisions":[2047,2047]},"port2_mode":{"type":"string","options":[{"value":"offline","revisions":[2047,2047]},{"value":"nat-to-wan","'
+    'revisions":[2047,2047]},{"value":"bridge-to-wan","revisions":[2047,2047]},{"value":"bridge-to-ssid","revisions":[2047,2047]}],"revisions":[2047,2047]}'
+    '},"revisions":[2047,2047]},"dtls_policy":{"multiple_values":true,"type":"list","options":[{"value":"clear-text","revisions":[2047,2047]},{"value":"dtl'
+    's-enabled","revisions":[2047,2047]},{"value":"ipsec-vpn","revisions":[2047,2047]}],"revisions":[2047,2047]},"apcfg_profile":{"type":"string","revision'
+    's":[1920,1920]},"ext_info_enable":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],'
+    '"revisions":[2047,2047]},"radio_4":{"type":"dict","children":{"transmit_optimize":{"multiple_values":true,"type":"list","options":[{"value":"disable",'
+    '"revisions":[2024,2024]},{"value":"power-save","revisions":[2024,2024]},{"value":"aggr-limit","revisions":[2024,2024]},{"value":"retry-limit","revisio'
+    'ns":[2024,2024]},{"value":"send-bar","revisions":[2024,2024]}],"revisions":[2024,2024]},"ap_sniffer_bufsize":{"type":"integer","revisions":[2024,2024]'
+    '},"ap_handoff":{"type":"string","options":[{"value":"enable","revisions":[104,104]},{"value":"disable","revisions":[104,104]}],"revisions":[2024,104]}'
+    ',"frag_threshold":{"type":"integer","revisions":[2024,2024]},"bandwidth_admission_control":{"type":"string","options":[{"value":"enable","revisions":['
+    '2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"coexistence":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"auto_power_low":{"type":"integer","revisions":[2024,2024]},"ap'
+    '_sniffer_ctl":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,20'
+    '24]},"bandwidth_capacity":{"type":"integer","revisions":[2024,2024]},"bss_color":{"type":"integer","revisions":[1920,1664]},"band_5g_type":{"type":"st'
+    'ring","options":[{"value":"5g-full","revisions":[2024,2024]},{"value":"5g-high","revisions":[2024,2024]},{"value":"5g-low","revisions":[2024,2024]}],"'
+    'revisions":[2024,2024]},"channel_bonding":{"type":"string","options":[{"value":"160MHz","revisions":[2024,2024]},{"value":"80MHz","revisions":[2024,20'
+    '24]},{"value":"40MHz","revisions":[2024,2024]},{"value":"20MHz","revisions":[2024,2024]}],"revisions":[2024,2024]},"dtim":{"type":"integer","revisions'
+    '":[2024,2024]},"auto_power_high":{"type":"integer","revisions":[2024,2024]},"iperf_server_port":{"type":"integer","revisions":[1024,1024]},"vaps":{"ty'
+    'pe":"list","children":{"name":{"type":"string","revisions":[2024,2024]}},"revisions":[2024,2024]},"short_guard_interval":{"type":"string","options":[{'
+    '"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"powersave_optimize":{"multiple_values'
+    '":true,"type":"list","options":[{"value":"tim","revisions":[2024,2024]},{"value":"ac-vo","revisions":[2024,2024]},{"value":"no-obss-scan","revisions":'
+    '[2024,2024]},{"value":"no-11b-rate","revisions":[2024,2024]},{"value":"client-rate-follow","revisions":[2024,2024]}],"revisions":[2024,2024]},"auto_po'
+    'wer_level":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]'
+    '},"ap_sniffer_chan":{"type":"integer","revisions":[2024,2024]},"ap_sniffer_addr":{"type":"string","revisions":[2024,2024]},"spectrum_analysis":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[360,360]},{"value":"disable","revisions":[360,360]},{"value":"scan-only","revisions":[256,256]}],"'
+    'revisions":[2024,360]},"ap_sniffer_data":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2'
+    '024]}],"revisions":[2024,2024]},"wids_profile":{"type":"string","revisions":[2024,2024]},"vap_all":{"type":"string","options":[{"value":"enable","revi'
+    'sions":[2024,104]},{"value":"disable","revisions":[2024,104]},{"value":"tunnel","revisions":[1920,1920]},{"value":"bridge","revisions":[1920,1920]},{"'
+    'value":"manual","revisions":[1920,1920]}],"revisions":[2024,2024]},"rts_threshold":{"type":"integer","revisions":[2024,2024]},"iperf_protocol":{"type"'
+    ':"string","options":[{"value":"udp","revisions":[1024,1024]},{"value":"tcp","revisions":[1024,1024]}],"revisions":[1024,1024]},"channel":{"type":"list'
+    '","children":{"chan":{"type":"string","revisions":[2024,2024]}},"revisions":[2024,2024]},"protection_mode":{"type":"string","options":[{"value":"rtsct'
+    's","revisions":[2024,2024]},{"value":"ctsonly","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"drma":{'
+    '"type":"string","options":[{"value":"disable","revisions":[1536,1536]},{"value":"enable","revisions":[1536,1536]}],"revisions":[1536,1536]},"sam_secur'
+    'ity_type":{"type":"string","options":[{"value":"open","revisions":[1024,1024]},{"value":"wpa-personal","revisions":[1024,1024]},{"value":"wpa-enterpri'
+    'se","revisions":[1024,1024]}],"revisions":[1024,1024]},"power_value":{"type":"integer","revisions":[1024,1024]},"ap_sniffer_mgmt_probe":{"type":"strin'
+    'g","options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"zero_wait_dfs":{"type"'
+    ':"string","options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"channel_utiliza'
+    'tion":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"fr'
+    'equency_handoff":{"type":"string","options":[{"value":"enable","revisions":[104,104]},{"value":"disable","revisions":[104,104]}],"revisions":[2024,104'
+    ']},"sam_password":{"type":"string","revisions":[1024,1024]},"drma_sensitivity":{"type":"string","options":[{"value":"low","revisions":[1536,1536]},{"v'
+    'alue":"medium","revisions":[1536,1536]},{"value":"high","revisions":[1536,1536]}],"revisions":[1536,1536]},"band":{"type":"string","options":[{"value"'
+    ':"802.11a","revisions":[2024,2024]},{"value":"802.11b","revisions":[2024,2024]},{"value":"802.11g","revisions":[2024,2024]},{"value":"802.11n","revisi'
+    'ons":[2024,2024]},{"value":"802.11n-5G","revisions":[2024,2024]},{"value":"802.11ac","revisions":[2024,2024]},{"value":"802.11ax-5G","revisions":[2024'
+    ',2024]},{"value":"802.11ax","revisions":[2024,2024]},{"value":"802.11n,g-only","revisions":[2024,2024]},{"value":"802.11g-only","revisions":[2024,2024'
+    ']},{"value":"802.11n-only","revisions":[2024,2024]},{"value":"802.11n-5G-only","revisions":[2024,2024]},{"value":"802.11ac,n-only","revisions":[2024,2'
+    '024]},{"value":"802.11ac-only","revisions":[2024,2024]},{"value":"802.11ax,ac-only","revisions":[2024,2024]},{"value":"802.11ax,ac,n-only","revisions"'
+    ':[2024,2024]},{"value":"802.11ax-5G-only","revisions":[2024,2024]},{"value":"802.11ax,n-only","revisions":[2024,2024]},{"value":"802.11ax,n,g-only","r'
+    'evisions":[2024,2024]},{"value":"802.11ax-only","revisions":[2024,2024]},{"value":"802.11ac-2G","revisions":[1920,1920]}],"revisions":[2024,2024]},"ap'
+    '_sniffer_mgmt_beacon":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":'
+    '[2024,2024]},"beacon_interval":{"type":"integer","revisions":[2024,2024]},"ap_sniffer_mgmt_other":{"type":"string","options":[{"value":"enable","revis'
+    'ions":[2024,2024]},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"sam_ssid":{"type":"string","revisions":[1024,1024]},"max_dis'
+    'tance":{"type":"integer","revisions":[2024,2024]},"sam_test":{"type":"string","options":[{"value":"ping","revisions":[1024,1024]},{"value":"iperf","re'
+    'visions":[1024,1024]}],"revisions":[1024,1024]},"call_admission_control":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]},{"valu'
+    'e":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"power_level":{"type":"integer","revisions":[2024,2024]},"max_clients":{"type":"intege'
+    'r","revisions":[2024,2024]},"airtime_fairness":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":['
+    '2024,2024]}],"revisions":[2024,2024]},"darrp":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]},{"value":"disable","revisions":[2'
+    '024,2024]}],"revisions":[2024,2024]},"sam_report_intv":{"type":"integer","revisions":[1024,1024]},"call_capacity":{"type":"integer","revisions":[2024,'
+    '2024]},"sam_bssid":{"type":"string","revisions":[1024,1024]},"sam_captive_portal":{"type":"string","options":[{"value":"enable","revisions":[1024,1024'
+    ']},{"value":"disable","revisions":[1024,1024]}],"revisions":[1024,1024]},"amsdu":{"type":"string","options":[{"value":"enable","revisions":[2024,2024]'
+    '},{"value":"disable","revisions":[2024,2024]}],"revisions":[2024,2024]},"auto_power_target":{"type":"string","revisions":[1536,1536]},"sam_server":{"t'
+    'ype":"string","revisions":[1024,1024]},"sam_username":{"type":"string","revisions":[1024,1024]},"mode":{"type":"string","options":[{"value":"disabled"'
+    ',"revisions":[2024,2024]},{"value":"ap","revisions":[2024,2024]},{"value":"monitor","revisions":[2024,2024]},{"value":"sniffer","revisions":[2024,2024'
+    ']},{"value":"sam","revisions":[1024,1024]}],"revisions":[2024,2024]},"power_mode":{"type":"string","options":[{"value":"dBm","revisions":[1024,1024]},'
+    '{"value":"percentage","revisions":[1024,1024]}],"revisions":[1024,1024]}},"revisions":[2040,2024]},"poe_mode":{"type":"string","options":[{"value":"au'
+    'to","revisions":[2047,2047]},{"value":"8023af","revisions":[2047,2047]},{"value":"8023at","revisions":[2047,2047]},{"value":"power-adapter","revisions'
+    '":[2047,2047]},{"value":"full","revisions":[1536,1536]},{"value":"high","revisions":[1536,1536]},{"value":"low","revisions":[1536,1536]}],"revisions":'
+    '[2047,2047]},"ap_country":{"type":"string","options":[{"value":"NA","revisions":[2047,2047]},{"value":"AL","revisions":[2047,2047]},{"value":"DZ","rev'
+    'isions":[2047,2047]},{"value":"AO","revisions":[2047,2047]},{"value":"AR","revisions":[2047,2047]},{"value":"AM","revisions":[2047,2047]},{"value":"AU'
+    '","revisions":[2047,2047]},{"value":"AT","revisions":[2047,2047]},{"value":"AZ","revisions":[2047,2047]},{"value":"BH","revisions":[2047,2047]},{"valu'
+    'e":"BD","revisions":[2047,2047]},{"value":"BB","revisions":[2047,2047]},{"value":"BY","revisions":[2047,2047]},{"value":"BE","revisions":[2047,2047]},'
+    '{"value":"BZ","revisions":[2047,2047]},{"value":"BO","revisions":[2047,2047]},{"value":"BA","revisions":[2047,2047]},{"value":"BR","revisions":[2047,2'
+    '047]},{"value":"BN","revisions":[2047,2047]},{"value":"BG","revisions":[2047,2047]},{"value":"KH","revisions":[2047,2047]},{"value":"CL","revisions":['
+    '2047,2047]},{"value":"CN","revisions":[2047,2047]},{"value":"CO","revisions":[2047,2047]},{"value":"CR","revisions":[2047,2047]},{"value":"HR","revisi'
+    'ons":[2047,2047]},{"value":"CY","revisions":[2047,2047]},{"value":"CZ","revisions":[2047,2047]},{"value":"DK","revisions":[2047,2047]},{"value":"DO","'
+    'revisions":[2047,2047]},{"value":"EC","revisions":[2047,2047]},{"value":"EG","revisions":[2047,2047]},{"value":"SV","revisions":[2047,2047]},{"value":'
+    '"EE","revisions":[2047,2047]},{"value":"FI","revisions":[2047,2047]},{"value":"FR","revisions":[2047,2047]},{"value":"GE","revisions":[2047,2047]},{"v'
+    'alue":"DE","revisions":[2047,2047]},{"value":"GR","revisions":[2047,2047]},{"value":"GL","revisions":[2047,2047]},{"value":"GD","revisions":[2047,2047'
+    ']},{"value":"GU","revisions":[2047,2047]},{"value":"GT","revisions":[2047,2047]},{"value":"HT","revisions":[2047,2047]},{"value":"HN","revisions":[204'
+    '7,2047]},{"value":"HK","revisions":[2047,2047]},{"value":"HU","revisions":[2047,2047]},{"value":"IS","revisions":[2047,2047]},{"value":"IN","revisions'
+    '":[2047,2047]},{"value":"ID","revisions":[2047,2047]},{"value":"IR","revisions":[2047,1023]},{"value":"IE","revisions":[2047,2047]},{"value":"IL","rev'
+    'isions":[2047,2047]},{"value":"IT","revisions":[2047,2047]},{"value":"JM","revisions":[2047,2047]},{"value":"JO","revisions":[2047,2047]},{"value":"KZ'
+    '","revisions":[2047,2047]},{"value":"KE","revisions":[2047,2047]},{"value":"KP","revisions":[2047,1023]},{"value":"KR","revisions":[2047,2047]},{"valu'
+    'e":"KW","revisions":[2047,2047]},{"value":"LV","revisions":[2047,2047]},{"value":"LB","revisions":[2047,2047]},{"value":"LI","revisions":[2047,2047]},'
+    '{"value":"LT","revisions":[2047,2047]},{"value":"LU","revisions":[2047,2047]},{"value":"MO","revisions":[2047,2047]},{"value":"MK","revisions":[2047,2'
+    '047]},{"value":"MY","revisions":[2047,2047]},{"value":"MT","revisions":[2047,2047]},{"value":"MX","revisions":[2047,2047]},{"value":"MC","revisions":['
+    '2047,2047]},{"value":"MA","revisions":[2047,2047]},{"value":"MZ","revisions":[2047,2047]},{"value":"MM","revisions":[2047,2047]},{"value":"NP","revisi'
+    'ons":[2047,2047]},{"value":"NL","revisions":[2047,2047]},{"value":"AN","revisions":[2047,2047]},{"value":"AW","revisions":[2047,2047]},{"value":"NZ","'
+    'revisions":[2047,2047]},{"value":"NO","revisions":[2047,2047]},{"value":"OM","revisions":[2047,2047]},{"value":"PK","revisions":[2047,2047]},{"value":'
+    '"PA","revisions":[2047,2047]},{"value":"PG","revisions":[2047,2047]},{"value":"PY","revisions":[2047,2047]},{"value":"PE","revisions":[2047,2047]},{"v'
+    'alue":"PH","revisions":[2047,2047]},{"value":"PL","revisions":[2047,2047]},{"value":"PT","revisions":[2047,2047]},{"value":"PR","revisions":[2047,2047'
+    ']},{"value":"QA","revisions":[2047,2047]},{"value":"RO","revisions":[2047,2047]},{"value":"RU","revisions":[2047,2047]},{"value":"RW","revisions":[204'
+    '7,2047]},{"value":"SA","revisions":[2047,2047]},{"value":"RS","revisions":[2047,2047]},{"value":"ME","revisions":[2047,2047]},{"value":"SG","revisions'
+    '":[2047,2047]},{"value":"SK","revisions":[2047,2047]},{"value":"SI","revisions":[2047,2047]},{"value":"ZA","revisions":[2047,2047]},{"value":"ES","rev'
+    'isions":[2047,2047]},{"value":"LK","revisions":[2047,2047]},{"value":"SE","revisions":[2047,2047]},{"value":"SD","revisions":[2047,1023]},{"value":"CH'
+    '","revisions":[2047,2047]},{"value":"SY","revisions":[2047,1023]},{"value":"TW","revisions":[2047,2047]},{"value":"TZ","revisions":[2047,2047]},{"valu'
+    'e":"TH","revisions":[2047,2047]},{"value":"TT","revisions":[2047,2047]},{"value":"TN","revisions":[2047,2047]},{"value":"TR","revisions":[2047,2047]},'
+    '{"value":"AE","revisions":[2047,2047]},{"value":"UA","revisions":[2047,2047]},{"value":"GB","revisions":[2047,2047]},{"value":"US","revisions":[2047,2'
+    '047]},{"value":"PS","revisions":[2047,2047]},{"value":"UY","revisions":[2047,2047]},{"value":"UZ","revisions":[2047,2047]},{"value":"VE","revisions":['
+    '2047,2047]},{"value":"VN","revisions":[2047,2047]},{"value":"YE","revisions":[2047,2047]},{"value":"ZB","revisions":[2047,1023]},{"value":"ZW","revisi'
+    'ons":[2047,2047]},{"value":"JP","revisions":[2047,2047]},{"value":"CA","revisions":[2047,2047]},{"value":"CF","revisions":[2040,2040]},{"value":"BS","'
+    'revisions":[1920,1920]},{"value":"BF","revisions":[1920,1664]},{"value":"KY","revisions":[1920,1664]},{"value":"CX","revisions":[1920,1664]},{"value":'
+    '"GH","revisions":[1920,1664]},{"value":"GY","revisions":[1920,1664]},{"value":"CI","revisions":[1920,1664]},{"value":"MW","revisions":[1920,1664]},{"v'
+    'alue":"MV","revisions":[1920,1664]},{"value":"FM","revisions":[1920,1664]},{"value":"KN","revisions":[1920,1664]},{"value":"LC","revisions":[1920,1664'
+    ']},{"value":"VC","revisions":[1920,1664]},{"value":"SN","revisions":[1920,1664]},{"value":"TM","revisions":[1920,1664]},{"value":"TC","revisions":[192'
+    '0,1664]},{"value":"UG","revisions":[1920,1664]},{"value":"VU","revisions":[1920,1664]},{"value":"AF","revisions":[1024,1024]},{"value":"AS","revisions'
+    '":[1024,1024]},{"value":"BJ","revisions":[1024,1024]},{"value":"BM","revisions":[1024,1024]},{"value":"BT","revisions":[1024,1024]},{"value":"BW","rev'
+    'isions":[1024,1024]},{"value":"CM","revisions":[1024,1024]},{"value":"TD","revisions":[1024,1024]},{"value":"CG","revisions":[1024,1024]},{"value":"CD'
+    '","revisions":[1024,1024]},{"value":"DM","revisions":[1024,1024]},{"value":"ET","revisions":[1024,1024]},{"value":"GF","revisions":[1024,1024]},{"valu'
+    'e":"PF","revisions":[1024,1024]},{"value":"FO","revisions":[1024,1024]},{"value":"FJ","revisions":[1024,1024]},{"value":"GI","revisions":[1024,1024]},'
+    '{"value":"GP","revisions":[1024,1024]},{"value":"IQ","revisions":[1024,1024]},{"value":"IM","revisions":[1024,1024]},{"value":"LA","revisions":[1024,1'
+    '024]},{"value":"LS","revisions":[1024,1024]},{"value":"LY","revisions":[1024,1024]},{"value":"MG","revisions":[1024,1024]},{"value":"ML","revisions":['
+    '1024,1024]},{"value":"MH","revisions":[1024,1024]},{"value":"MQ","revisions":[1024,1024]},{"value":"MR","revisions":[1024,1024]},{"value":"MU","revisi'
+    'ons":[1024,1024]},{"value":"YT","revisions":[1024,1024]},{"value":"MD","revisions":[1024,1024]},{"value":"NI","revisions":[1024,1024]},{"value":"NE","'
+    'revisions":[1024,1024]},{"value":"MP","revisions":[1024,1024]},{"value":"PW","revisions":[1024,1024]},{"value":"RE","revisions":[1024,1024]},{"value":'
+    '"BL","revisions":[1024,1024]},{"value":"MF","revisions":[1024,1024]},{"value":"PM","revisions":[1024,1024]},{"value":"SL","revisions":[1024,1024]},{"v'
+    'alue":"SR","revisions":[1024,1024]},{"value":"TG","revisions":[1024,1024]},{"value":"VI","revisions":[1024,1024]},{"value":"WF","revisions":[1024,1024'
+    ']},{"value":"ZM","revisions":[1024,1024]}],"revisions":[2047,2047]},"energy_efficient_ethernet":{"type":"string","options":[{"value":"enable","revisio'
+    'ns":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"revisions":[2047,2047]},"handoff_rssi":{"type":"integer","revisions":[2047,2047]},"ap_h'
+    'andoff":{"type":"string","options":[{"value":"enable","revisions":[1920,1920]},{"value":"disable","revisions":[1920,1920]}],"revisions":[1920,1920]},"'
+    'max_clients":{"type":"integer","revisions":[2047,2047]},"name":{"type":"string","revisions":[2047,2047]},"login_passwd":{"type":"string","revisions":['
+    '2047,2047]},"handoff_roaming":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,2047]}],"rev'
+    'isions":[2047,2047]},"split_tunneling_acl_local_ap_subnet":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","'
+    'revisions":[2047,2047]}],"revisions":[2047,2047]},"led_schedules":{"type":"list","children":{"name":{"type":"string","revisions":[2047,2047]}},"revisi'
+    'ons":[2047,2047]},"wan_port_mode":{"type":"string","options":[{"value":"wan-lan","revisions":[2047,2047]},{"value":"wan-only","revisions":[2047,2047]}'
+    '],"revisions":[2047,2047]},"led_state":{"type":"string","options":[{"value":"enable","revisions":[2047,2047]},{"value":"disable","revisions":[2047,204'
+    '7]}],"revisions":[2047,2047]}},"revisions":[2047,2047]}'
+)
+
+# generated from VERSIONED_SCHEMA by schema_to_module_spec
+MODULE_SPEC = (
+    '{"type":"list","required":false,"options":{"comment":{"type":"str","required":false},"split_tunneling_acl":{"type":"list","required":false,"options":{'
+    '"id":{"type":"int","required":false},"dest_ip":{"type":"str","required":false}}},"lbs":{"type":"dict","required":false,"options":{"fortipresence_port"'
+    ':{"type":"int","required":false},"erc_server_port":{"type":"int","required":false},"aeroscout":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"fortipresence_frequency":{"type":"int","required":false},"fortipresence_ble":{"type":"str","required":false,"choices":["enable","disable"]},"'
+    'fortipresence_project":{"type":"str","required":false},"aeroscout_ap_mac":{"type":"str","required":false,"choices":["bssid","board-mac"]},"aeroscout_m'
+    'mu_report":{"type":"str","required":false,"choices":["enable","disable"]},"fortipresence":{"type":"str","required":false,"choices":["foreign","both","'
+    'disable"]},"ekahau_tag":{"type":"str","required":false},"fortipresence_unassoc":{"type":"str","required":false,"choices":["enable","disable"]},"erc_se'
+    'rver_ip":{"type":"str","required":false},"aeroscout_mu_factor":{"type":"int","required":false},"fortipresence_server":{"type":"str","required":false},'
+    '"station_locate":{"type":"str","required":false,"choices":["enable","disable"]},"aeroscout_mu":{"type":"str","required":false,"choices":["enable","dis'
+    'able"]},"aeroscout_mu_timeout":{"type":"int","required":false},"aeroscout_server_ip":{"type":"str","required":false},"fortipresence_secret":{"type":"s'
+    'tr","required":false},"aeroscout_server_port":{"type":"int","required":false},"fortipresence_rogue":{"type":"str","required":false,"choices":["enable"'
+    ',"disable"]},"ekahau_blink_mode":{"type":"str","required":false,"choices":["enable","disable"]}}},"control_message_offload":{"type":"list","required":'
+    'false},"tun_mtu_downlink":{"type":"int","required":false},"tun_mtu_uplink":{"type":"int","required":false},"ble_profile":{"type":"str","required":fals'
+    'e},"lldp":{"type":"str","required":false,"choices":["enable","disable"]},"login_passwd_change":{"type":"str","required":false,"choices":["yes","defaul'
+    't","no"]},"platform":{"type":"dict","required":false,"options":{"type":{"type":"str","required":false},"mode":{"type":"str","required":false,"choices"'
+    ':["single-5G","dual-5G"]},"ddscan":{"type":"str","required":false}}},"frequency_handoff":{"type":"str","required":false,"choices":["enable","disable"]'
+    '},"deny_mac_list":{"type":"list","required":false,"options":{"mac":{"type":"str","required":false},"id":{"type":"int","required":false}}},"split_tunne'
+    'ling_acl_path":{"type":"str","required":false,"choices":["tunnel","local"]},"ip_fragment_preventing":{"type":"list","required":false,"choices":["tcp-m'
+    'ss-adjust","icmp-unreachable"]},"radio_3":{"type":"dict","required":false,"options":{"transmit_optimize":{"type":"list","required":false,"choices":["d'
+    'isable","power-save","aggr-limit","retry-limit","send-bar"]},"ap_sniffer_bufsize":{"type":"int","required":false},"ap_handoff":{"type":"str","required'
+    '":false},"frag_threshold":{"type":"int","required":false},"bandwidth_admission_control":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"coexistence":{"type":"str","required":false,"choices":["enable","disable"]},"auto_power_low":{"type":"int","required":false},"ap_sniffer_ctl":{"type'
+    '":"str","required":false,"choices":["enable","disable"]},"bandwidth_capacity":{"type":"int","required":false},"bss_color":{"type":"int","required":fal'
+    'se},"band_5g_type":{"type":"str","required":false},"channel_bonding":{"type":"str","required":false,"choices":["160MHz","80MHz","40MHz","20MHz"]},"dti'
+    'm":{"type":"int","required":false},"auto_power_high":{"type":"int","required":false},"iperf_server_port":{"type":"int","required":false},"vaps":{"type'
+    '":"list","required":false,"options":{"name":{"type":"str","required":false}}},"short_guard_interval":{"type":"str","required":false,"choices":["enable'
+    '","disable"]},"powersave_optimize":{"type":"list","required":false,"choices":["tim","ac-vo","no-obss-scan","no-11b-rate","client-rate-follow"]},"auto_'
+    'power_level":{"type":"str","required":false,"choices":["enable","disable"]},"ap_sniffer_chan":{"type":"int","required":false},"ap_sniffer_addr":{"type'
+    '":"str","required":false},"radio_id":{"type":"int","required":false},"ap_sniffer_data":{"type":"str","required":false,"choices":["enable","disable"]},'
+    '"wids_profile":{"type":"str","required":false},"vap_all":{"type":"str","required":false},"rts_threshold":{"type":"int","required":false},"iperf_protoc'
+    'ol":{"type":"str","required":false,"choices":["udp","tcp"]},"channel":{"type":"list","required":false,"options":{"chan":{"type":"str","required":false'
+    '}}},"protection_mode":{"type":"str","required":false,"choices":["rtscts","ctsonly","disable"]},"drma":{"type":"str","required":false,"choices":["disab'
+    'le","enable"]},"sam_security_type":{"type":"str","required":false,"choices":["open","wpa-personal","wpa-enterprise"]},"power_value":{"type":"int","req'
+    'uired":false},"ap_sniffer_mgmt_probe":{"type":"str","required":false,"choices":["enable","disable"]},"zero_wait_dfs":{"type":"str","required":false},"'
+    'spectrum_analysis":{"type":"str","required":false},"channel_utilization":{"type":"str","required":false,"choices":["enable","disable"]},"frequency_han'
+    'doff":{"type":"str","required":false},"sam_password":{"type":"str","required":false},"drma_sensitivity":{"type":"str","required":false,"choices":["low'
+    '","medium","high"]},"band":{"type":"str","required":false},"ap_sniffer_mgmt_beacon":{"type":"str","required":false,"choices":["enable","disable"]},"be'
+    'acon_interval":{"type":"int","required":false},"ap_sniffer_mgmt_other":{"type":"str","required":false,"choices":["enable","disable"]},"sam_ssid":{"typ'
+    'e":"str","required":false},"max_distance":{"type":"int","required":false},"sam_test":{"type":"str","required":false,"choices":["ping","iperf"]},"call_'
+    'admission_control":{"type":"str","required":false,"choices":["enable","disable"]},"power_level":{"type":"int","required":false},"max_clients":{"type":'
+    '"int","required":false},"airtime_fairness":{"type":"str","required":false,"choices":["enable","disable"]},"darrp":{"type":"str","required":false,"choi'
+    'ces":["enable","disable"]},"sam_report_intv":{"type":"int","required":false},"call_capacity":{"type":"int","required":false},"sam_bssid":{"type":"str"'
+    ',"required":false},"sam_captive_portal":{"type":"str","required":false,"choices":["enable","disable"]},"amsdu":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"auto_power_target":{"type":"str","required":false},"sam_server":{"type":"str","required":false},"sam_username":{"type":"str",'
+    '"required":false},"mode":{"type":"str","required":false},"power_mode":{"type":"str","required":false,"choices":["dBm","percentage"]}}},"radio_2":{"typ'
+    'e":"dict","required":false,"options":{"transmit_optimize":{"type":"list","required":false,"choices":["disable","power-save","aggr-limit","retry-limit"'
+    ',"send-bar"]},"ap_sniffer_bufsize":{"type":"int","required":false},"ap_handoff":{"type":"str","required":false},"sam_bssid":{"type":"str","required":f'
+    'alse},"frag_threshold":{"type":"int","required":false},"bandwidth_admission_control":{"type":"str","required":false,"choices":["enable","disable"]},"c'
+    'oexistence":{"type":"str","required":false,"choices":["enable","disable"]},"auto_power_low":{"type":"int","required":false},"ap_sniffer_ctl":{"type":"'
+    'str","required":false,"choices":["enable","disable"]},"bandwidth_capacity":{"type":"int","required":false},"bss_color":{"type":"int","required":false}'
+    ',"band_5g_type":{"type":"str","required":false},"channel_bonding":{"type":"str","required":false},"dtim":{"type":"int","required":false},"auto_power_h'
+    'igh":{"type":"int","required":false},"iperf_server_port":{"type":"int","required":false},"vaps":{"type":"list","required":false,"options":{"name":{"ty'
+    'pe":"str","required":false}}},"short_guard_interval":{"type":"str","required":false,"choices":["enable","disable"]},"powersave_optimize":{"type":"list'
+    '","required":false,"choices":["tim","ac-vo","no-obss-scan","no-11b-rate","client-rate-follow"]},"auto_power_level":{"type":"str","required":false,"cho'
+    'ices":["enable","disable"]},"ap_sniffer_chan":{"type":"int","required":false},"ap_sniffer_addr":{"type":"str","required":false},"spectrum_analysis":{"'
+    'type":"str","required":false},"ap_sniffer_data":{"type":"str","required":false,"choices":["enable","disable"]},"wids_profile":{"type":"str","required"'
+    ':false},"vap_all":{"type":"str","required":false},"rts_threshold":{"type":"int","required":false},"iperf_protocol":{"type":"str","required":false,"cho'
+    'ices":["udp","tcp"]},"channel":{"type":"list","required":false,"options":{"chan":{"type":"str","required":false}}},"protection_mode":{"type":"str","re'
+    'quired":false,"choices":["rtscts","ctsonly","disable"]},"drma":{"type":"str","required":false,"choices":["disable","enable"]},"sam_security_type":{"ty'
+    'pe":"str","required":false,"choices":["open","wpa-personal","wpa-enterprise"]},"power_value":{"type":"int","required":false},"ap_sniffer_mgmt_probe":{'
+    '"type":"str","required":false,"choices":["enable","disable"]},"zero_wait_dfs":{"type":"str","required":false},"channel_utilization":{"type":"str","req'
+    'uired":false,"choices":["enable","disable"]},"frequency_handoff":{"type":"str","required":false},"sam_password":{"type":"str","required":false},"drma_'
+    'sensitivity":{"type":"str","required":false,"choices":["low","medium","high"]},"band":{"type":"str","required":false},"ap_sniffer_mgmt_beacon":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]},"beacon_interval":{"type":"int","required":false},"ap_sniffer_mgmt_other":{"type":"str","requi'
+    'red":false,"choices":["enable","disable"]},"sam_ssid":{"type":"str","required":false},"max_distance":{"type":"int","required":false},"sam_test":{"type'
+    '":"str","required":false,"choices":["ping","iperf"]},"call_admission_control":{"type":"str","required":false,"choices":["enable","disable"]},"power_le'
+    'vel":{"type":"int","required":false},"max_clients":{"type":"int","required":false},"airtime_fairness":{"type":"str","required":false,"choices":["enabl'
+    'e","disable"]},"darrp":{"type":"str","required":false,"choices":["enable","disable"]},"sam_report_intv":{"type":"int","required":false},"call_capacity'
+    '":{"type":"int","required":false},"radio_id":{"type":"int","required":false},"sam_captive_portal":{"type":"str","required":false,"choices":["enable","'
+    'disable"]},"amsdu":{"type":"str","required":false,"choices":["enable","disable"]},"auto_power_target":{"type":"str","required":false},"sam_server":{"t'
+    'ype":"str","required":false},"sam_username":{"type":"str","required":false},"mode":{"type":"str","required":false},"power_mode":{"type":"str","require'
+    'd":false,"choices":["dBm","percentage"]}}},"radio_1":{"type":"dict","required":false,"options":{"transmit_optimize":{"type":"list","required":false,"c'
+    'hoices":["disable","power-save","aggr-limit","retry-limit","send-bar"]},"ap_sniffer_bufsize":{"type":"int","required":false},"ap_handoff":{"type":"str'
+    '","required":false},"sam_bssid":{"type":"str","required":false},"frag_threshold":{"type":"int","required":false},"bandwidth_admission_control":{"type"'
+    ':"str","required":false,"choices":["enable","disable"]},"coexistence":{"type":"str","required":false,"choices":["enable","disable"]},"auto_power_low":'
+    '{"type":"int","required":false},"ap_sniffer_ctl":{"type":"str","required":false,"choices":["enable","disable"]},"bandwidth_capacity":{"type":"int","re'
+    'quired":false},"bss_color":{"type":"int","required":false},"band_5g_type":{"type":"str","required":false},"channel_bonding":{"type":"str","required":f'
+    'alse},"dtim":{"type":"int","required":false},"auto_power_high":{"type":"int","required":false},"iperf_server_port":{"type":"int","required":false},"va'
+    'ps":{"type":"list","required":false,"options":{"name":{"type":"str","required":false}}},"short_guard_interval":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"powersave_optimize":{"type":"list","required":false,"choices":["tim","ac-vo","no-obss-scan","no-11b-rate","client-rate-follow'
+    '"]},"auto_power_level":{"type":"str","required":false,"choices":["enable","disable"]},"ap_sniffer_chan":{"type":"int","required":false},"ap_sniffer_ad'
+    'dr":{"type":"str","required":false},"spectrum_analysis":{"type":"str","required":false},"ap_sniffer_data":{"type":"str","required":false,"choices":["e'
+    'nable","disable"]},"wids_profile":{"type":"str","required":false},"vap_all":{"type":"str","required":false},"rts_threshold":{"type":"int","required":f'
+    'alse},"iperf_protocol":{"type":"str","required":false,"choices":["udp","tcp"]},"channel":{"type":"list","required":false,"options":{"chan":{"type":"st'
+    'r","required":false}}},"protection_mode":{"type":"str","required":false,"choices":["rtscts","ctsonly","disable"]},"drma":{"type":"str","required":fals'
+    'e,"choices":["disable","enable"]},"sam_security_type":{"type":"str","required":false,"choices":["open","wpa-personal","wpa-enterprise"]},"power_value"'
+    ':{"type":"int","required":false},"ap_sniffer_mgmt_probe":{"type":"str","required":false,"choices":["enable","disable"]},"zero_wait_dfs":{"type":"str",'
+    '"required":false},"channel_utilization":{"type":"str","required":false,"choices":["enable","disable"]},"frequency_handoff":{"type":"str","required":fa'
+    'lse},"sam_password":{"type":"str","required":false},"drma_sensitivity":{"type":"str","required":false,"choices":["low","medium","high"]},"band":{"type'
+    '":"str","required":false},"ap_sniffer_mgmt_beacon":{"type":"str","required":false,"choices":["enable","disable"]},"beacon_interval":{"type":"int","req'
+    'uired":false},"ap_sniffer_mgmt_other":{"type":"str","required":false,"choices":["enable","disable"]},"sam_ssid":{"type":"str","required":false},"max_d'
+    'istance":{"type":"int","required":false},"sam_test":{"type":"str","required":false,"choices":["ping","iperf"]},"call_admission_control":{"type":"str",'
+    '"required":false,"choices":["enable","disable"]},"power_level":{"type":"int","required":false},"max_clients":{"type":"int","required":false},"airtime_'
+    'fairness":{"type":"str","required":false,"choices":["enable","disable"]},"darrp":{"type":"str","required":false,"choices":["enable","disable"]},"sam_r'
+    'eport_intv":{"type":"int","required":false},"call_capacity":{"type":"int","required":false},"radio_id":{"type":"int","required":false},"sam_captive_po'
+    'rtal":{"type":"str","required":false,"choices":["enable","disable"]},"amsdu":{"type":"str","required":false,"choices":["enable","disable"]},"auto_powe'
+    'r_target":{"type":"str","required":false},"sam_server":{"type":"str","required":false},"sam_username":{"type":"str","required":false},"mode":{"type":"'
+    'str","required":false},"power_mode":{"type":"str","required":false,"choices":["dBm","percentage"]}}},"allowaccess":{"type":"list","required":false},"d'
+    'tls_in_kernel":{"type":"str","required":false,"choices":["enable","disable"]},"handoff_sta_thresh":{"type":"int","required":false},"lan":{"type":"dict'
+    '","required":false,"options":{"port7_mode":{"type":"str","required":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port3_'
+    'ssid":{"type":"str","required":false},"port_mode":{"type":"str","required":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},'
+    '"port_esl_ssid":{"type":"str","required":false},"port4_mode":{"type":"str","required":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridge-'
+    'to-ssid"]},"port4_ssid":{"type":"str","required":false},"port3_mode":{"type":"str","required":false,"choices":["offline","nat-to-wan","bridge-to-wan",'
+    '"bridge-to-ssid"]},"port6_mode":{"type":"str","required":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port5_mode":{"typ'
+    'e":"str","required":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port6_ssid":{"type":"str","required":false},"port_ssid'
+    '":{"type":"str","required":false},"port1_ssid":{"type":"str","required":false},"port2_ssid":{"type":"str","required":false},"port8_mode":{"type":"str"'
+    ',"required":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port5_ssid":{"type":"str","required":false},"port_esl_mode":{"'
+    'type":"str","required":false},"port7_ssid":{"type":"str","required":false},"port8_ssid":{"type":"str","required":false},"port1_mode":{"type":"str","re'
+    'quired":false,"choices":["offline","nat-to-wan","bridge-to-wan","bridge-to-ssid"]},"port2_mode":{"type":"str","required":false,"choices":["offline","n'
+    'at-to-wan","bridge-to-wan","bridge-to-ssid"]}}},"dtls_policy":{"type":"list","required":false,"choices":["clear-text","dtls-enabled","ipsec-vpn"]},"ap'
+    'cfg_profile":{"type":"str","required":false},"ext_info_enable":{"type":"str","required":false,"choices":["enable","disable"]},"radio_4":{"type":"dict"'
+    ',"required":false,"options":{"transmit_optimize":{"type":"list","required":false,"choices":["disable","power-save","aggr-limit","retry-limit","send-ba'
+    'r"]},"ap_sniffer_bufsize":{"type":"int","required":false},"ap_handoff":{"type":"str","required":false},"frag_threshold":{"type":"int","required":false'
+    '},"bandwidth_admission_control":{"type":"str","required":false,"choices":["enable","disable"]},"coexistence":{"type":"str","required":false,"choices":'
+    '["enable","disable"]},"auto_power_low":{"type":"int","required":false},"ap_sniffer_ctl":{"type":"str","required":false,"choices":["enable","disable"]}'
+    ',"bandwidth_capacity":{"type":"int","required":false},"bss_color":{"type":"int","required":false},"band_5g_type":{"type":"str","required":false,"choic'
+    'es":["5g-full","5g-high","5g-low"]},"channel_bonding":{"type":"str","required":false,"choices":["160MHz","80MHz","40MHz","20MHz"]},"dtim":{"type":"int'
+    '","required":false},"auto_power_high":{"type":"int","required":false},"iperf_server_port":{"type":"int","required":false},"vaps":{"type":"list","requi'
+    'red":false,"options":{"name":{"type":"str","required":false}}},"short_guard_interval":{"type":"str","required":false,"choices":["enable","disable"]},"'
+    'powersave_optimize":{"type":"list","required":false,"choices":["tim","ac-vo","no-obss-scan","no-11b-rate","client-rate-follow"]},"auto_power_level":{"'
+    'type":"str","required":false,"choices":["enable","disable"]},"ap_sniffer_chan":{"type":"int","required":false},"ap_sniffer_addr":{"type":"str","requir'
+    'ed":false},"spectrum_analysis":{"type":"str","required":false},"ap_sniffer_data":{"type":"str","required":false,"choices":["enable","disable"]},"wids_'
+    'profile":{"type":"str","required":false},"vap_all":{"type":"str","required":false},"rts_threshold":{"type":"int","required":false},"iperf_protocol":{"'
+    'type":"str","required":false,"choices":["udp","tcp"]},"channel":{"type":"list","required":false,"options":{"chan":{"type":"str","required":false}}},"p'
+    'rotection_mode":{"type":"str","required":false,"choices":["rtscts","ctsonly","disable"]},"drma":{"type":"str","required":false,"choices":["disable","e'
+    'nable"]},"sam_security_type":{"type":"str","required":false,"choices":["open","wpa-personal","wpa-enterprise"]},"power_value":{"type":"int","required"'
+    ':false},"ap_sniffer_mgmt_probe":{"type":"str","required":false,"choices":["enable","disable"]},"zero_wait_dfs":{"type":"str","required":false,"choices'
+    '":["enable","disable"]},"channel_utilization":{"type":"str","required":false,"choices":["enable","disable"]},"frequency_handoff":{"type":"str","requir'
+    'ed":false},"sam_password":{"type":"str","required":false},"drma_sensitivity":{"type":"str","required":false,"choices":["low","medium","high"]},"band":'
+    '{"type":"str","required":false},"ap_sniffer_mgmt_beacon":{"type":"str","required":false,"choices":["enable","disable"]},"beacon_interval":{"type":"int'
+    '","required":false},"ap_sniffer_mgmt_other":{"type":"str","required":false,"choices":["enable","disable"]},"sam_ssid":{"type":"str","required":false},'
+    '"max_distance":{"type":"int","required":false},"sam_test":{"type":"str","required":false,"choices":["ping","iperf"]},"call_admission_control":{"type":'
+    '"str","required":false,"choices":["enable","disable"]},"power_level":{"type":"int","required":false},"max_clients":{"type":"int","required":false},"ai'
+    'rtime_fairness":{"type":"str","required":false,"choices":["enable","disable"]},"darrp":{"type":"str","required":false,"choices":["enable","disable"]},'
+    '"sam_report_intv":{"type":"int","required":false},"call_capacity":{"type":"int","required":false},"sam_bssid":{"type":"str","required":false},"sam_cap'
+    'tive_portal":{"type":"str","required":false,"choices":["enable","disable"]},"amsdu":{"type":"str","required":false,"choices":["enable","disable"]},"au'
+    'to_power_target":{"type":"str","required":false},"sam_server":{"type":"str","required":false},"sam_username":{"type":"str","required":false},"mode":{"'
+    'type":"str","required":false},"power_mode":{"type":"str","required":false,"choices":["dBm","percentage"]}}},"poe_mode":{"type":"str","required":false}'
+    ',"ap_country":{"type":"str","required":false},"energy_efficient_ethernet":{"type":"str","required":false,"choices":["enable","disable"]},"handoff_rssi'
+    '":{"type":"int","required":false},"ap_handoff":{"type":"str","required":false,"choices":["enable","disable"]},"max_clients":{"type":"int","required":f'
+    'alse},"name":{"type":"str","required":false},"login_passwd":{"type":"str","required":false},"handoff_roaming":{"type":"str","required":false,"choices"'
+    ':["enable","disable"]},"split_tunneling_acl_local_ap_subnet":{"type":"str","required":false,"choices":["enable","disable"]},"led_schedules":{"type":"l'
+    'ist","required":false,"options":{"name":{"type":"str","required":false}}},"wan_port_mode":{"type":"str","required":false,"choices":["wan-lan","wan-onl'
+    'y"]},"led_state":{"type":"str","required":false,"choices":["enable","disable"]}}}'
+)
@@ -56,11 +56,28 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Fetch the current object before writing it and skip the write when nothing differs.
+        type: bool
+        required: false
+        default: false
+    partial_update:
+        description:
+            - Fetch the current object before writing it and only send the attributes which differ.
+              Implies skip_unchanged.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
               virtual instance of the FortiGate that can be configured and
               used as a different unit.
+            - Several virtual domains can be given as a comma separated list, or "*"
+              for all of them. The task is then applied to every one of them concurrently
+              and their results are returned under vdoms. In check mode, only the first
+              virtual domain holding the object is compared.
         type: str
         default: root
 
@@ -130,6 +147,10 @@ path:
   returned: always
   type: str
   sample: "webfilter"
+perf:
+  description: Method, endpoint, status, payload sizes and timings of the requests issued by the task
+  returned: when the perf_stats option of the httpapi connection is enabled
+  type: dict
 revision:
   description: Internal revision number
   returned: always
@@ -161,8 +182,11 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.connection import Connection
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import FortiOSHandler
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_legacy_fortiosapi
-from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import schema_to_module_spec
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_schema_versioning
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import load_schema
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import load_module_spec
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas.antivirus_heuristic import VERSIONED_SCHEMA
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas.antivirus_heuristic import MODULE_SPEC
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortimanager.common import FAIL_SOCKET_MSG
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import is_same_comparison
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import serialize
@@ -221,93 +245,14 @@ def fortios_antivirus(data, fos):
         resp
 
 
-versioned_schema = {
-    "type": "dict",
-    "children": {
-        "mode": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "pass",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                {
-                    "value": "block",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v6.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        }
-    },
-    "revisions": {
-        "v6.0.0": True,
-        "v6.0.5": True,
-        "v6.4.4": True,
-        "v6.4.0": True,
-        "v6.4.1": True,
-        "v6.2.0": True,
-        "v6.2.3": True,
-        "v6.2.5": True,
-        "v6.2.7": True,
-        "v6.0.11": True
-    }
-}
-
-
 def main():
-    module_spec = schema_to_module_spec(versioned_schema)
+    module_spec = load_module_spec(MODULE_SPEC)
     mkeyname = None
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": bool},
+        "skip_unchanged": {"required": False, "type": bool, "default": False},
+        "partial_update": {"required": False, "type": bool, "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "antivirus_heuristic": {
             "required": False, "type": "dict", "default": None,
@@ -335,7 +280,7 @@ def main():
         else:
             connection.set_option('enable_log', False)
         fos = FortiOSHandler(connection, module, mkeyname)
-        versions_check_result = check_schema_versioning(fos, versioned_schema, "antivirus_heuristic")
+        versions_check_result = check_schema_versioning(fos, load_schema(VERSIONED_SCHEMA), "antivirus_heuristic")
 
         is_error, has_changed, result = fortios_antivirus(module.params, fos)
 
@@ -347,14 +292,14 @@ def main():
 
     if not is_error:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result)
+            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.exit_json(changed=has_changed, meta=result)
+            module.exit_json(changed=has_changed, meta=result, **fos.perf_report())
     else:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result)
+            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.fail_json(msg="Error in repo", meta=result)
+            module.fail_json(msg="Error in repo", meta=result, **fos.perf_report())
 
 
 if __name__ == '__main__':
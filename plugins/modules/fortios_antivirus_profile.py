@@ -56,11 +56,28 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Fetch the current object before writing it and skip the write when nothing differs.
+        type: bool
+        required: false
+        default: false
+    partial_update:
+        description:
+            - Fetch the current object before writing it and only send the attributes which differ.
+              Implies skip_unchanged.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
               virtual instance of the FortiGate that can be configured and
               used as a different unit.
+            - Several virtual domains can be given as a comma separated list, or "*"
+              for all of them. The task is then applied to every one of them concurrently
+              and their results are returned under vdoms. In check mode, only the first
+              virtual domain holding the object is compared.
         type: str
         default: root
 
@@ -1446,6 +1463,10 @@ path:
   returned: always
   type: str
   sample: "webfilter"
+perf:
+  description: Method, endpoint, status, payload sizes and timings of the requests issued by the task
+  returned: when the perf_stats option of the httpapi connection is enabled
+  type: dict
 revision:
   description: Internal revision number
   returned: always
@@ -1477,8 +1498,11 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.connection import Connection
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import FortiOSHandler
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_legacy_fortiosapi
-from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import schema_to_module_spec
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_schema_versioning
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import load_schema
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import load_module_spec
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas.antivirus_profile import VERSIONED_SCHEMA
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas.antivirus_profile import MODULE_SPEC
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortimanager.common import FAIL_SOCKET_MSG
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import is_same_comparison
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import serialize
@@ -1588,7875 +1612,14 @@ def fortios_antivirus(data, fos):
         resp
 
 
-versioned_schema = {
-    "type": "list",
-    "children": {
-        "comment": {
-            "type": "string",
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "feature_set": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "flow",
-                    "revisions": {
-                        "v6.4.4": True,
-                        "v7.0.0": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True
-                    }
-                },
-                {
-                    "value": "proxy",
-                    "revisions": {
-                        "v6.4.4": True,
-                        "v7.0.0": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v6.4.4": True,
-                "v7.0.0": True,
-                "v6.4.0": True,
-                "v6.4.1": True
-            }
-        },
-        "smtp": {
-            "type": "dict",
-            "children": {
-                "executables": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "default",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "virus",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "av_scan": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "external_blocklist": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "quarantine": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "content_disarm": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "emulator": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_block": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_log": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "outbreak_prevention": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disabled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "files",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "full-archive",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "options": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "scan",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "avmonitor",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "quarantine",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": False,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "analytics_db": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                {
-                    "value": "enable",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "analytics_ignore_filetype": {
-            "type": "integer",
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "av_virus_log": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "enable",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "external_blocklist_archive_scan": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                {
-                    "value": "enable",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "replacemsg_group": {
-            "type": "string",
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "outbreak_prevention_archive_scan": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                {
-                    "value": "enable",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "analytics_bl_filetype": {
-            "type": "integer",
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": False,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "analytics_accept_filetype": {
-            "type": "integer",
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "ftp": {
-            "type": "dict",
-            "children": {
-                "av_scan": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "external_blocklist": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "quarantine": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "emulator": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_block": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_log": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "outbreak_prevention": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disabled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "files",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "full-archive",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "options": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "scan",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "avmonitor",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "quarantine",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": False,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "analytics_max_upload": {
-            "type": "integer",
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "mapi": {
-            "type": "dict",
-            "children": {
-                "executables": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "default",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "virus",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "av_scan": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "external_blocklist": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "quarantine": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "emulator": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_block": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_log": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "outbreak_prevention": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disabled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "files",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "full-archive",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "options": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "scan",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "avmonitor",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "quarantine",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": False,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "extended_log": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "enable",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "content_disarm": {
-            "type": "dict",
-            "children": {
-                "office_action": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                },
-                "pdf_act_launch": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "office_dde": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                },
-                "office_hylink": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "pdf_embedfile": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "office_macro": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "cover_page": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "office_linked": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "pdf_javacode": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "pdf_hyperlink": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "detect_only": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "pdf_act_gotor": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "pdf_act_form": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "original_file_destination": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "fortisandbox",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "quarantine",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "discard",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "office_embed": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "pdf_act_sound": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "pdf_act_java": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "pdf_act_movie": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "error_action": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v7.0.0": True,
-                                "v6.4.0": True
-                            }
-                        },
-                        {
-                            "value": "log-only",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v7.0.0": True,
-                                "v6.4.0": True
-                            }
-                        },
-                        {
-                            "value": "ignore",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v7.0.0": True,
-                                "v6.4.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.4.4": True,
-                        "v7.0.0": True,
-                        "v6.4.0": True,
-                        "v6.4.1": False
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "nntp": {
-            "type": "dict",
-            "children": {
-                "av_scan": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "external_blocklist": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "quarantine": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "emulator": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_block": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_log": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "outbreak_prevention": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disabled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "files",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "full-archive",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "options": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "scan",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "avmonitor",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "quarantine",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": False,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "smb": {
-            "type": "dict",
-            "children": {
-                "archive_block": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "archive_log": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "outbreak_prevention": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disabled",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "files",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "full-archive",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "options": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "scan",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "avmonitor",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "quarantine",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "emulator": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": False,
-                "v6.0.5": True,
-                "v6.4.4": False,
-                "v6.4.0": False,
-                "v6.4.1": False,
-                "v6.2.0": False,
-                "v6.2.3": False,
-                "v6.2.5": False,
-                "v6.2.7": False,
-                "v6.0.11": True
-            }
-        },
-        "analytics_wl_filetype": {
-            "type": "integer",
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": False,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "http": {
-            "type": "dict",
-            "children": {
-                "av_scan": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "external_blocklist": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "quarantine": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "content_disarm": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "emulator": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_block": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_log": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "outbreak_prevention": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disabled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "files",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "full-archive",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "options": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "scan",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "avmonitor",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "quarantine",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": False,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "cifs": {
-            "type": "dict",
-            "children": {
-                "av_scan": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "external_blocklist": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "quarantine": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "emulator": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                },
-                "archive_block": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                },
-                "archive_log": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                },
-                "outbreak_prevention": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disabled",
-                            "revisions": {
-                                "v7.0.0": False,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "files",
-                            "revisions": {
-                                "v7.0.0": False,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "full-archive",
-                            "revisions": {
-                                "v7.0.0": False,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                },
-                "options": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "scan",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "avmonitor",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "quarantine",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": False,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True
-            }
-        },
-        "nac_quar": {
-            "type": "dict",
-            "children": {
-                "infected": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "none",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "quar-src-ip",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "log": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "expiry": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "ems_threat_feed": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                {
-                    "value": "enable",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "ssh": {
-            "type": "dict",
-            "children": {
-                "av_scan": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "external_blocklist": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "quarantine": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "emulator": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                },
-                "archive_block": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                },
-                "archive_log": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v7.0.0": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                },
-                "outbreak_prevention": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disabled",
-                            "revisions": {
-                                "v7.0.0": False,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "files",
-                            "revisions": {
-                                "v7.0.0": False,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "full-archive",
-                            "revisions": {
-                                "v7.0.0": False,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                },
-                "options": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "scan",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "avmonitor",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "quarantine",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": False,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True
-            }
-        },
-        "av_block_log": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "enable",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "imap": {
-            "type": "dict",
-            "children": {
-                "executables": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "default",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "virus",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "av_scan": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "external_blocklist": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "quarantine": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "content_disarm": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "emulator": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_block": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_log": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "outbreak_prevention": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disabled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "files",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "full-archive",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "options": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "scan",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "avmonitor",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "quarantine",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": False,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "name": {
-            "type": "string",
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "pop3": {
-            "type": "dict",
-            "children": {
-                "executables": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "default",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "virus",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "av_scan": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "external_blocklist": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "quarantine": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "content_disarm": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "emulator": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_block": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "archive_log": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "encrypted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "corrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "partiallycorrupted",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "multipart",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "nested",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "mailbomb",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "fileslimit",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "timeout",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "unhandled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "outbreak_prevention": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disabled",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "files",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "full-archive",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v7.0.0": False,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "monitor",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                "options": {
-                    "multiple_values": True,
-                    "type": "list",
-                    "options": [
-                        {
-                            "value": "scan",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "avmonitor",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        },
-                        {
-                            "value": "quarantine",
-                            "revisions": {
-                                "v6.0.0": True,
-                                "v6.0.5": True,
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True,
-                                "v6.0.11": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": False,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "external_blocklist": {
-            "type": "list",
-            "children": {
-                "name": {
-                    "type": "string",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "ftgd_analytics": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                {
-                    "value": "suspicious",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                {
-                    "value": "everything",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "scan_mode": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "quick",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": False,
-                        "v6.0.5": True,
-                        "v6.4.4": False,
-                        "v6.4.0": False,
-                        "v6.4.1": False,
-                        "v6.2.0": False,
-                        "v6.2.3": False,
-                        "v6.2.5": False,
-                        "v6.2.7": False,
-                        "v6.0.11": True
-                    }
-                },
-                {
-                    "value": "full",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": False,
-                        "v6.0.5": True,
-                        "v6.4.4": False,
-                        "v6.4.0": False,
-                        "v6.4.1": False,
-                        "v6.2.0": False,
-                        "v6.2.3": False,
-                        "v6.2.5": False,
-                        "v6.2.7": False,
-                        "v6.0.11": True
-                    }
-                },
-                {
-                    "value": "default",
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                },
-                {
-                    "value": "legacy",
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "mobile_malware_db": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                },
-                {
-                    "value": "enable",
-                    "revisions": {
-                        "v6.0.0": True,
-                        "v7.0.0": True,
-                        "v6.0.5": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True,
-                        "v6.0.11": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": True,
-                "v6.0.5": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True,
-                "v6.0.11": True
-            }
-        },
-        "external_blocklist_enable_all": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                {
-                    "value": "enable",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "outbreak_prevention": {
-            "type": "dict",
-            "children": {
-                "external_blocklist": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                },
-                "ftgd_service": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.4.4": True,
-                                "v6.4.0": True,
-                                "v6.4.1": True,
-                                "v6.2.0": True,
-                                "v6.2.3": True,
-                                "v6.2.5": True,
-                                "v6.2.7": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": False,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True
-            }
-        },
-        "inspection_mode": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "proxy",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                {
-                    "value": "flow-based",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v6.0.0": True,
-                "v7.0.0": False,
-                "v6.0.5": True,
-                "v6.4.4": False,
-                "v6.4.0": False,
-                "v6.4.1": False,
-                "v6.2.0": False,
-                "v6.2.3": False,
-                "v6.2.5": False,
-                "v6.2.7": False,
-                "v6.0.11": True
-            }
-        }
-    },
-    "revisions": {
-        "v6.0.0": True,
-        "v7.0.0": True,
-        "v6.0.5": True,
-        "v6.4.4": True,
-        "v6.4.0": True,
-        "v6.4.1": True,
-        "v6.2.0": True,
-        "v6.2.3": True,
-        "v6.2.5": True,
-        "v6.2.7": True,
-        "v6.0.11": True
-    }
-}
-
-
 def main():
-    module_spec = schema_to_module_spec(versioned_schema)
+    module_spec = load_module_spec(MODULE_SPEC)
     mkeyname = 'name'
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": bool},
+        "skip_unchanged": {"required": False, "type": bool, "default": False},
+        "partial_update": {"required": False, "type": bool, "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "state": {"required": True, "type": "str",
                   "choices": ["present", "absent"]},
@@ -9486,7 +1649,7 @@ def main():
         else:
             connection.set_option('enable_log', False)
         fos = FortiOSHandler(connection, module, mkeyname)
-        versions_check_result = check_schema_versioning(fos, versioned_schema, "antivirus_profile")
+        versions_check_result = check_schema_versioning(fos, load_schema(VERSIONED_SCHEMA), "antivirus_profile")
 
         is_error, has_changed, result = fortios_antivirus(module.params, fos)
 
@@ -9498,14 +1661,14 @@ def main():
 
     if not is_error:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result)
+            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.exit_json(changed=has_changed, meta=result)
+            module.exit_json(changed=has_changed, meta=result, **fos.perf_report())
     else:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result)
+            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.fail_json(msg="Error in repo", meta=result)
+            module.fail_json(msg="Error in repo", meta=result, **fos.perf_report())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,381 @@
+#!/usr/bin/python
+from __future__ import (absolute_import, division, print_function)
+# Copyright 2021 Fortinet, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'status': ['preview'],
+                    'supported_by': 'community',
+                    'metadata_version': '1.1'}
+
+DOCUMENTATION = '''
+---
+module: fortios_apply
+short_description: Apply objects of several configuration tables in dependency order in Fortinet's FortiOS and FortiGate.
+description:
+    - This module takes objects of any CMDB tables and orders them by the references between them, e.g. addresses
+      before the address groups holding them and address groups before the policies using them. Objects which
+      do not depend on each other are applied concurrently over the httpapi connection, layer after layer.
+      Objects to delete are deleted last, the objects of a table before those of the tables it refers to.
+      Tested with FOS v6.4.0
+version_added: "2.10"
+author:
+    - Link Zheng (@chillancezen)
+    - Jie Xue (@JieX19)
+    - Hongbin Lu (@fgtdev-hblu)
+    - Frank Shen (@frankshen01)
+notes:
+    - References are read from the datasources of the table schemas reported by the device.
+    - Attributes are named as in the FortiOS API, underscores are turned into hyphens like in the other modules.
+    - The objects to create or update are validated against the table schemas, as by fortios_bulk.
+    - Nothing is applied when an object is invalid or when objects depend on each other in a cycle.
+    - The layers following a layer with a failed object are not applied.
+    - In check mode, nothing is sent to the device but the reads of the objects, the plan is returned with the outcome
+      every object would have.
+requirements:
+    - ansible>=2.9.0
+options:
+    access_token:
+        description:
+            - Token-based authentication.
+              Generated from GUI of Fortigate.
+        type: str
+        required: false
+    enable_log:
+        description:
+            - Enable/Disable logging for task.
+        type: bool
+        required: false
+        default: false
+    skip_unchanged:
+        description:
+            - Fetch the current object before writing it and skip the write when nothing differs.
+        type: bool
+        required: false
+        default: false
+    partial_update:
+        description:
+            - Fetch the current object before writing it and only send the attributes which differ.
+              Implies skip_unchanged.
+        type: bool
+        required: false
+        default: false
+    vdom:
+        description:
+            - Virtual domain, among those defined previously. A vdom is a
+              virtual instance of the FortiGate that can be configured and
+              used as a different unit.
+        type: str
+        default: root
+    objects:
+        description:
+            - Objects to apply.
+        type: list
+        elements: dict
+        required: true
+        suboptions:
+            path:
+                description:
+                    - Path of the table of the object, e.g. firewall for firewall addresses.
+                type: str
+                required: true
+            name:
+                description:
+                    - Name of the table of the object, e.g. address for firewall addresses.
+                type: str
+                required: true
+            state:
+                description:
+                    - Indicates whether to create or remove the object.
+                type: str
+                default: present
+                choices:
+                    - present
+                    - absent
+            config:
+                description:
+                    - Attributes of the object, at least the mkey of the table.
+                type: dict
+                required: true
+    batch_size:
+        description:
+            - Number of objects of a layer whose requests are sent together.
+        type: int
+        default: 100
+    transaction:
+        description:
+            - Apply the objects in a FortiOS transaction, which is aborted when one of them fails (6.4.0+).
+        type: bool
+        default: false
+'''
+
+EXAMPLES = '''
+- hosts: fortigates
+  collections:
+    - fortinet.fortios
+  connection: httpapi
+  vars:
+   vdom: "root"
+   ansible_httpapi_use_ssl: yes
+   ansible_httpapi_validate_certs: no
+   ansible_httpapi_port: 443
+  tasks:
+  - name: Allow the web servers out, whatever the order of the objects.
+    fortios_apply:
+      vdom: "{{ vdom }}"
+      objects:
+        - path: "firewall"
+          name: "policy"
+          config:
+            policyid: 10
+            name: "web_out"
+            srcintf:
+              - name: "port2"
+            dstintf:
+              - name: "port1"
+            srcaddr:
+              - name: "web_servers"
+            dstaddr:
+              - name: "all"
+            service:
+              - name: "ALL"
+            schedule: "always"
+            action: "accept"
+        - path: "firewall"
+          name: "addrgrp"
+          config:
+            name: "web_servers"
+            member:
+              - name: "web_1"
+        - path: "firewall"
+          name: "address"
+          config:
+            name: "web_1"
+            subnet: "10.0.1.10 255.255.255.255"
+        - path: "firewall"
+          name: "address"
+          state: "absent"
+          config:
+            name: "web_old"
+'''
+
+RETURN = '''
+perf:
+  description: Method, endpoint, status, payload sizes and timings of the requests issued by the task
+  returned: when the perf_stats option of the httpapi connection is enabled
+  type: dict
+plan:
+  description: Layers of objects applied one after the other, objects are named path/name/mkey
+  returned: always
+  type: list
+  sample: [["firewall/address/web_1"], ["firewall/addrgrp/web_servers"], ["firewall/policy/10"], ["firewall/address/web_old"]]
+results:
+  description: Outcome of every object, in the order of the objects
+  returned: always
+  type: list
+  sample: [{"object": "firewall/policy/10", "layer": 2, "status": "success", "http_method": "POST", "http_status": 200, "changed": true}]
+summary:
+  description: Number of objects created, updated, unchanged, deleted, absent, failed, skipped and invalid
+  returned: always
+  type: dict
+  sample: {"total": 4, "created": 3, "updated": 0, "unchanged": 0, "deleted": 1, "absent": 0, "failed": 0, "skipped": 0, "invalid": 0}
+status:
+  description: Indication of the operation's result
+  returned: always
+  type: str
+  sample: "success"
+vdom:
+  description: Virtual domain used
+  returned: always
+  type: str
+  sample: "root"
+'''
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.connection import Connection
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import FortiOSHandler
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_legacy_fortiosapi
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.bulk import item_result
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.bulk import validate_attributes
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import is_same_comparison
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import serialize
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.planner import plan
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortimanager.common import FAIL_SOCKET_MSG
+
+
+def underscore_to_hyphen(data):
+    if isinstance(data, list):
+        for i, elem in enumerate(data):
+            data[i] = underscore_to_hyphen(elem)
+    elif isinstance(data, dict):
+        new_data = {}
+        for k, v in data.items():
+            new_data[k.replace('_', '-')] = underscore_to_hyphen(v)
+        data = new_data
+
+    return data
+
+
+def summarize(results):
+    summary = {'total': len(results)}
+    for outcome in ('created', 'updated', 'unchanged', 'deleted', 'absent', 'failed', 'skipped', 'invalid'):
+        summary[outcome] = len([result for result in results if result['outcome'] == outcome])
+    return summary
+
+
+def fortios_apply(data, fos, check_mode=False):
+    vdom = data['vdom']
+    items = [{'path': item['path'], 'name': item['name'], 'state': item['state'],
+              'data': underscore_to_hyphen(item['config'])} for item in data['objects']]
+
+    tables = sorted(set((item['path'], item['name']) for item in items))
+    schemas = fos.schemas(tables, vdom=vdom)
+    mkeynames = {}
+    for table in tables:
+        if schemas[table]:
+            mkeynames[table] = schemas[table].get('mkey')
+            fos.set_mkeyname(table[0], table[1], mkeynames[table])
+
+    results = [None] * len(items)
+    valid = []
+    for index, item in enumerate(items):
+        table = (item['path'], item['name'])
+        mkey = item['data'].get(mkeynames.get(table)) if mkeynames.get(table) else None
+        results[index] = {'object': '/'.join([item['path'], item['name']] + ([str(mkey)] if mkey is not None else []))}
+        errors = validate_attributes(schemas[table], item['data']) if schemas[table] and item['state'] == 'present' else []
+        if not schemas[table]:
+            results[index].update({'status': 'error', 'outcome': 'invalid', 'succeeded': False, 'changed': False,
+                                   'errors': ['Unable to read the schema of %s %s' % table]})
+        elif mkeynames[table] and mkey in (None, '') or not mkeynames[table] and item['state'] == 'absent':
+            results[index].update({'status': 'error', 'outcome': 'invalid', 'succeeded': False, 'changed': False,
+                                   'errors': ['%s is missing' % (mkeynames[table]) if mkeynames[table] else 'the object cannot be deleted']})
+        elif errors:
+            results[index].update({'status': 'error', 'outcome': 'invalid', 'succeeded': False, 'changed': False,
+                                   'errors': errors})
+        else:
+            valid.append(index)
+
+    layers, cycle = plan([items[index] for index in valid], schemas, mkeynames)
+    layers = [[valid[index] for index in layer] for layer in layers]
+    for index in cycle:
+        results[valid[index]].update({'status': 'error', 'outcome': 'invalid', 'succeeded': False, 'changed': False,
+                                      'errors': ['the object depends on itself through other objects']})
+    for layer_index, layer in enumerate(layers):
+        for index in layer:
+            results[index].update({'layer': layer_index, 'outcome': 'skipped', 'succeeded': False, 'changed': False})
+    applied_plan = [[results[index]['object'] for index in layer] for layer in layers]
+
+    if cycle or len(valid) != len(items):
+        return True, False, {'status': 'error', 'vdom': vdom, 'plan': applied_plan, 'summary': summarize(results), 'results': results}
+    if check_mode:
+        # the objects are read to tell the ones the plan would change, assuming the layers before succeed
+        planned = [index for layer in layers for index in layer]
+        for index, resp in zip(planned, fos.get_objects([items[index] for index in planned], vdom=vdom, batch_size=data['batch_size'])):
+            current = resp.get('results') if resp.get('http_status') == 200 else None
+            if isinstance(current, list):
+                current = current[0] if current else None
+            if items[index]['state'] == 'absent':
+                outcome = 'absent' if current is None else 'deleted'
+            elif current is None:
+                outcome = 'created'
+            else:
+                outcome = 'unchanged' if is_same_comparison(serialize(current), serialize(items[index]['data'])) else 'updated'
+            results[index].update({'outcome': outcome, 'succeeded': True, 'changed': outcome in ('created', 'updated', 'deleted')})
+        has_changed = any(results[index]['changed'] for index in planned)
+        return False, has_changed, {'status': 'success', 'vdom': vdom, 'plan': applied_plan, 'summary': summarize(results), 'results': results}
+
+    is_error = False
+    transaction = bool(data['transaction'] and layers)
+    if transaction:
+        resp = fos.transaction_start(vdom=vdom)
+        if resp['status'] != 'success':
+            return True, False, {'status': 'error', 'message': 'Unable to start the transaction', 'response': resp}
+
+    try:
+        for layer in layers:
+            for index, resp in zip(layer, fos.apply_objects([items[index] for index in layer], vdom=vdom, batch_size=data['batch_size'])):
+                results[index].update(item_result(resp, items[index]['state']))
+            # objects still referred to by objects deleted later in the layer are retried while deletes make progress
+            pending = [index for index in layer if results[index]['outcome'] == 'failed' and items[index]['state'] == 'absent']
+            while pending:
+                responses = fos.apply_objects([items[index] for index in pending], vdom=vdom, batch_size=data['batch_size'])
+                for index, resp in zip(pending, responses):
+                    results[index].update(item_result(resp, items[index]['state']))
+                failed = [index for index in pending if results[index]['outcome'] == 'failed']
+                if len(failed) == len(pending):
+                    break
+                pending = failed
+            if not all(results[index]['succeeded'] for index in layer):
+                is_error = True
+                break
+        if transaction:
+            resp = fos.transaction_abort(vdom=vdom) if is_error else fos.transaction_commit(vdom=vdom)
+            if resp['status'] != 'success':
+                is_error = True
+    finally:
+        if transaction:
+            # a failure above must not leave later tasks of the connection staging into a dead transaction
+            fos.transaction_release(vdom=vdom)
+
+    has_changed = any(result['changed'] for result in results) and not (data['transaction'] and is_error)
+
+    return is_error, has_changed, {'status': 'error' if is_error else 'success', 'vdom': vdom,
+                                   'plan': applied_plan, 'summary': summarize(results), 'results': results}
+
+
+def main():
+    fields = {
+        "access_token": {"required": False, "type": "str", "no_log": True},
+        "enable_log": {"required": False, "type": bool},
+        "skip_unchanged": {"required": False, "type": bool, "default": False},
+        "partial_update": {"required": False, "type": bool, "default": False},
+        "vdom": {"required": False, "type": "str", "default": "root"},
+        "objects": {"required": True, "type": "list", "elements": "dict",
+                    "options": {
+                        "path": {"required": True, "type": "str"},
+                        "name": {"required": True, "type": "str"},
+                        "state": {"required": False, "type": "str", "default": "present",
+                                  "choices": ["present", "absent"]},
+                        "config": {"required": True, "type": "dict"},
+                    }},
+        "batch_size": {"required": False, "type": "int", "default": 100},
+        "transaction": {"required": False, "type": "bool", "default": False},
+    }
+
+    check_legacy_fortiosapi()
+    module = AnsibleModule(argument_spec=fields,
+                           supports_check_mode=True)
+
+    if module._socket_path:
+        connection = Connection(module._socket_path)
+        if 'access_token' in module.params:
+            connection.set_option('access_token', module.params['access_token'])
+        if 'enable_log' in module.params:
+            connection.set_option('enable_log', module.params['enable_log'])
+        else:
+            connection.set_option('enable_log', False)
+        fos = FortiOSHandler(connection, module)
+        is_error, has_changed, result = fortios_apply(module.params, fos, module.check_mode)
+    else:
+        module.fail_json(**FAIL_SOCKET_MSG)
+
+    if not is_error:
+        module.exit_json(changed=has_changed, meta=result, **fos.perf_report())
+    else:
+        module.fail_json(msg="Error in repo", meta=result, **fos.perf_report())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/python
+from __future__ import (absolute_import, division, print_function)
+# Copyright 2021 Fortinet, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'status': ['preview'],
+                    'supported_by': 'community',
+                    'metadata_version': '1.1'}
+
+DOCUMENTATION = '''
+---
+module: fortios_bulk
+short_description: Apply a list of objects of one configuration table in Fortinet's FortiOS and FortiGate.
+description:
+    - This module creates, updates or deletes many objects of a single CMDB table in one task.
+      The objects are validated against the schema of the table reported by the device, then
+      applied in batches whose requests are sent concurrently over the httpapi connection.
+      Tested with FOS v6.4.0
+version_added: "2.10"
+author:
+    - Link Zheng (@chillancezen)
+    - Jie Xue (@JieX19)
+    - Hongbin Lu (@fgtdev-hblu)
+    - Frank Shen (@frankshen01)
+notes:
+    - Attributes are named as in the FortiOS API, underscores are turned into hyphens like in the other modules.
+    - Objects failing the validation are reported and nothing is sent, unless continue_on_invalid is set.
+    - The number of requests in flight is bounded by the concurrent_requests option of the httpapi plugin.
+requirements:
+    - ansible>=2.9.0
+options:
+    access_token:
+        description:
+            - Token-based authentication.
+              Generated from GUI of Fortigate.
+        type: str
+        required: false
+    enable_log:
+        description:
+            - Enable/Disable logging for task.
+        type: bool
+        required: false
+        default: false
+    skip_unchanged:
+        description:
+            - Fetch the current object before writing it and skip the write when nothing differs.
+        type: bool
+        required: false
+        default: false
+    partial_update:
+        description:
+            - Fetch the current object before writing it and only send the attributes which differ.
+              Implies skip_unchanged.
+        type: bool
+        required: false
+        default: false
+    vdom:
+        description:
+            - Virtual domain, among those defined previously. A vdom is a
+              virtual instance of the FortiGate that can be configured and
+              used as a different unit.
+        type: str
+        default: root
+    path:
+        description:
+            - Path of the table, e.g. firewall for firewall addresses.
+        type: str
+        required: true
+    name:
+        description:
+            - Name of the table, e.g. address for firewall addresses.
+        type: str
+        required: true
+    state:
+        description:
+            - Indicates whether to create or remove the objects.
+            - With overridden, the table ends up holding exactly the objects, the others are deleted.
+              The table is read once, objects which differ from the device are updated and the objects
+              still referred to by deleted ones are deleted in a following round.
+        type: str
+        required: true
+        choices:
+            - present
+            - absent
+            - overridden
+    objects:
+        description:
+            - Objects of the table, each one holding at least the mkey of the table.
+        type: list
+        elements: dict
+        required: true
+    batch_size:
+        description:
+            - Number of objects whose requests are sent together.
+        type: int
+        default: 100
+    transaction:
+        description:
+            - Apply the objects in a FortiOS transaction, which is aborted when one of them fails (6.4.0+).
+        type: bool
+        default: false
+    continue_on_invalid:
+        description:
+            - Apply the valid objects even when some objects fail the validation, the task still fails.
+            - Ignored by the overridden state, which never applies anything when one of the objects is invalid.
+        type: bool
+        default: false
+'''
+
+EXAMPLES = '''
+- hosts: fortigates
+  collections:
+    - fortinet.fortios
+  connection: httpapi
+  vars:
+   vdom: "root"
+   ansible_httpapi_use_ssl: yes
+   ansible_httpapi_validate_certs: no
+   ansible_httpapi_port: 443
+  tasks:
+  - name: Keep exactly these IPv4 address groups.
+    fortios_bulk:
+      vdom: "{{ vdom }}"
+      path: "firewall"
+      name: "addrgrp"
+      state: "overridden"
+      objects:
+        - name: "hosts"
+          member:
+            - name: "host_10.0.0.1"
+            - name: "host_10.0.0.2"
+
+  - name: Configure IPv4 addresses.
+    fortios_bulk:
+      vdom: "{{ vdom }}"
+      path: "firewall"
+      name: "address"
+      state: "present"
+      skip_unchanged: true
+      transaction: true
+      objects:
+        - name: "host_10.0.0.1"
+          subnet: "10.0.0.1 255.255.255.255"
+        - name: "host_10.0.0.2"
+          subnet: "10.0.0.2 255.255.255.255"
+          comment: "backup"
+'''
+
+RETURN = '''
+perf:
+  description: Method, endpoint, status, payload sizes and timings of the requests issued by the task
+  returned: when the perf_stats option of the httpapi connection is enabled
+  type: dict
+results:
+  description: Outcome of every object, in the order of the objects, followed by the objects deleted by overridden
+  returned: always
+  type: list
+  sample: [{"mkey": "host_10.0.0.1", "status": "success", "http_method": "POST", "http_status": 200, "changed": true}]
+summary:
+  description: Number of objects created, updated, unchanged, deleted, absent, failed, invalid and skipped
+  returned: always
+  type: dict
+  sample: {"total": 2, "created": 1, "updated": 0, "unchanged": 1, "deleted": 0, "absent": 0, "failed": 0, "invalid": 0, "skipped": 0}
+status:
+  description: Indication of the operation's result
+  returned: always
+  type: str
+  sample: "success"
+vdom:
+  description: Virtual domain used
+  returned: always
+  type: str
+  sample: "root"
+'''
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.connection import Connection
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import FortiOSHandler
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_legacy_fortiosapi
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.bulk import item_result
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.bulk import validate_attributes
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortimanager.common import FAIL_SOCKET_MSG
+
+
+def underscore_to_hyphen(data):
+    if isinstance(data, list):
+        for i, elem in enumerate(data):
+            data[i] = underscore_to_hyphen(elem)
+    elif isinstance(data, dict):
+        new_data = {}
+        for k, v in data.items():
+            new_data[k.replace('_', '-')] = underscore_to_hyphen(v)
+        data = new_data
+
+    return data
+
+
+def summarize(results):
+    summary = {'total': len(results)}
+    for outcome in ('created', 'updated', 'unchanged', 'deleted', 'absent', 'failed', 'invalid', 'skipped'):
+        summary[outcome] = len([result for result in results if result['outcome'] == outcome])
+    return summary
+
+
+def fortios_bulk(data, fos, schema):
+    vdom = data['vdom']
+    state = data['state']
+
+    if not isinstance(schema, dict) or 'children' not in schema:
+        return True, False, {'status': 'error', 'message': 'Unable to read the schema of %s %s' % (data['path'], data['name']), 'response': schema}
+    mkeyname = fos.get_mkeyname(data['path'], data['name'], vdom)
+    if not mkeyname:
+        return True, False, {'status': 'error', 'message': '%s %s is not a table' % (data['path'], data['name'])}
+
+    objects = [underscore_to_hyphen(item) for item in data['objects']]
+    results = [None] * len(objects)
+    valid = []
+    for index, item in enumerate(objects):
+        errors = [] if item.get(mkeyname) not in (None, '') else ['%s is missing' % (mkeyname)]
+        if state != 'absent':
+            errors.extend(validate_attributes(schema, item))
+        if errors:
+            results[index] = {'mkey': item.get(mkeyname), 'status': 'error', 'outcome': 'invalid', 'succeeded': False,
+                              'changed': False, 'errors': errors}
+        else:
+            valid.append(index)
+
+    # overriding with part of the objects would delete the device copies of the others
+    if len(valid) != len(objects) and (not data['continue_on_invalid'] or state == 'overridden'):
+        # nothing is written when one of the objects is invalid
+        for index in valid:
+            results[index] = {'mkey': objects[index][mkeyname], 'status': 'error', 'outcome': 'skipped', 'succeeded': False,
+                              'changed': False}
+        return True, False, {'status': 'error', 'vdom': vdom, 'message': 'invalid objects, nothing applied',
+                             'summary': summarize(results), 'results': results}
+
+    # overriding with an empty list of objects empties the table
+    transaction = bool(data['transaction'] and (valid or state == 'overridden'))
+    if transaction:
+        resp = fos.transaction_start(vdom=vdom)
+        if resp['status'] != 'success':
+            return True, False, {'status': 'error', 'message': 'Unable to start the transaction', 'response': resp}
+
+    try:
+        deleted = []
+        if state == 'overridden':
+            responses, deleted = fos.override_table(data['path'], data['name'], [objects[index] for index in valid],
+                                                    vdom=vdom, batch_size=data['batch_size'],
+                                                    keep=[item.get(mkeyname) for item in objects if item.get(mkeyname) not in (None, '')])
+        elif state == 'present':
+            responses = fos.set_objects(data['path'], data['name'], [objects[index] for index in valid],
+                                        vdom=vdom, batch_size=data['batch_size'])
+        else:
+            responses = fos.delete_objects(data['path'], data['name'], [objects[index][mkeyname] for index in valid],
+                                           vdom=vdom, batch_size=data['batch_size'])
+        for index, resp in zip(valid, responses):
+            results[index] = item_result(resp, state, mkey=objects[index][mkeyname])
+        results.extend(item_result(resp, 'absent', mkey=mkey) for mkey, resp in deleted)
+
+        is_error = not all(result['succeeded'] for result in results)
+        if transaction:
+            resp = fos.transaction_abort(vdom=vdom) if is_error else fos.transaction_commit(vdom=vdom)
+            if resp['status'] != 'success':
+                is_error = True
+    finally:
+        if transaction:
+            # a failure above must not leave later tasks of the connection staging into a dead transaction
+            fos.transaction_release(vdom=vdom)
+
+    has_changed = any(result['changed'] for result in results) and not (data['transaction'] and is_error)
+
+    return is_error, has_changed, {'status': 'error' if is_error else 'success', 'vdom': vdom,
+                                   'summary': summarize(results), 'results': results}
+
+
+def main():
+    fields = {
+        "access_token": {"required": False, "type": "str", "no_log": True},
+        "enable_log": {"required": False, "type": bool},
+        "skip_unchanged": {"required": False, "type": bool, "default": False},
+        "partial_update": {"required": False, "type": bool, "default": False},
+        "vdom": {"required": False, "type": "str", "default": "root"},
+        "path": {"required": True, "type": "str"},
+        "name": {"required": True, "type": "str"},
+        "state": {"required": True, "type": "str",
+                  "choices": ["present", "absent", "overridden"]},
+        "objects": {"required": True, "type": "list", "elements": "dict"},
+        "batch_size": {"required": False, "type": "int", "default": 100},
+        "transaction": {"required": False, "type": "bool", "default": False},
+        "continue_on_invalid": {"required": False, "type": "bool", "default": False},
+    }
+
+    check_legacy_fortiosapi()
+    module = AnsibleModule(argument_spec=fields,
+                           supports_check_mode=False)
+
+    if module._socket_path:
+        connection = Connection(module._socket_path)
+        if 'access_token' in module.params:
+            connection.set_option('access_token', module.params['access_token'])
+        if 'enable_log' in module.params:
+            connection.set_option('enable_log', module.params['enable_log'])
+        else:
+            connection.set_option('enable_log', False)
+        # the table is validated against the schema of the device, which also names its mkey
+        schema = FortiOSHandler(connection, module).schema(module.params['path'], module.params['name'], vdom=module.params['vdom'])
+        mkeyname = schema.get('mkey') if isinstance(schema, dict) else None
+        fos = FortiOSHandler(connection, module, mkeyname)
+        is_error, has_changed, result = fortios_bulk(module.params, fos, schema)
+    else:
+        module.fail_json(**FAIL_SOCKET_MSG)
+
+    if not is_error:
+        module.exit_json(changed=has_changed, meta=result, **fos.perf_report())
+    else:
+        module.fail_json(msg="Error in repo", meta=result, **fos.perf_report())
+
+
+if __name__ == '__main__':
+    main()
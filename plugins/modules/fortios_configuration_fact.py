@@ -82,6 +82,13 @@ options:
             - A list of fields to display for returned results.
         type: list
         required: false
+    page_size:
+        description:
+            - Read a whole table in requests of page_size objects instead of a single request,
+              which keeps large tables from timing out on the device side.
+            - The results of every page are returned together.
+        type: int
+        required: false
     selector:
         description:
             - selector of the retrieved fortigate facts
@@ -847,6 +854,10 @@ path:
   returned: always
   type: str
   sample: "system"
+perf:
+  description: Method, endpoint, status, payload sizes and timings of the requests issued by the task
+  returned: when the perf_stats option of the httpapi connection is enabled
+  type: dict
 revision:
   description: Internal revision number
   returned: always
@@ -3586,29 +3597,21 @@ def fortios_configuration_fact(params, fos):
     mkey_value = selector_params.get(mkey_name) if selector_params else None
 
     [path, name] = selector.split('_')
-    # XXX: The plugin level do not accept duplicated url keys, so we make only keep one key here.
     url_params = dict()
-    if params['filters'] and len(params['filters']):
-        filter_body = params['filters'][0]
-        for filter_item in params['filters'][1:]:
-            filter_body = "%s&filter=%s" % (filter_body, filter_item)
-        url_params['filter'] = filter_body
-
-    if params['sorters'] and len(params['sorters']):
-        sorter_body = params['sorters'][0]
-        for sorter_item in params['sorters'][1:]:
-            sorter_body = "%s&sort=%s" % (sorter_body, sorter_item)
-        url_params['sort'] = sorter_body
-
-    if params['formatters'] and len(params['formatters']):
-        formatter_body = params['formatters'][0]
-        for formatter_item in params['formatters'][1:]:
-            formatter_body = '%s|%s' % (formatter_body, formatter_item)
-        url_params['format'] = formatter_body
+    if params.get('filters'):
+        url_params['filter'] = params['filters']
+    if params.get('sorters'):
+        url_params['sort'] = params['sorters']
+    if params.get('formatters'):
+        url_params['format'] = params['formatters']
 
     fact = None
     if mkey_value:
         fact = fos.get(path, name, vdom=params['vdom'], mkey=mkey_value, parameters=url_params)
+    elif params.get('page_size'):
+        results = list(fos.iter_table(path, name, vdom=params['vdom'], page_size=params['page_size'], parameters=url_params))
+        fact = {'status': 'success', 'http_method': 'GET', 'http_status': 200,
+                'path': path, 'name': name, 'vdom': params['vdom'], 'results': results}
     else:
         fact = fos.get(path, name, vdom=params['vdom'], parameters=url_params)
 
@@ -3623,6 +3626,7 @@ def main():
         "filters": {"required": False, "type": 'list'},
         "sorters": {"required": False, "type": 'list'},
         "formatters": {"required": False, "type": 'list'},
+        "page_size": {"required": False, "type": "int"},
         "params": {"required": False, "type": "dict"},
         "selector": {
             "required": False,
@@ -4335,6 +4339,7 @@ def main():
                     'vdom': params.get('vdom'),
                     'selector': selector_obj.get('selector'),
                     'params': selector_obj.get('params'),
+                    'page_size': params.get('page_size'),
                 }
                 is_error_local, has_changed_local, result_local = fortios_configuration_fact(per_selector, fos)
 
@@ -4349,14 +4354,14 @@ def main():
 
     if not is_error:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result)
+            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.exit_json(changed=has_changed, meta=result)
+            module.exit_json(changed=has_changed, meta=result, **fos.perf_report())
     else:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result)
+            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.fail_json(msg="Error in repo", meta=result)
+            module.fail_json(msg="Error in repo", meta=result, **fos.perf_report())
 
 
 if __name__ == '__main__':
@@ -56,11 +56,28 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Fetch the current object before writing it and skip the write when nothing differs.
+        type: bool
+        required: false
+        default: false
+    partial_update:
+        description:
+            - Fetch the current object before writing it and only send the attributes which differ.
+              Implies skip_unchanged.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
               virtual instance of the FortiGate that can be configured and
               used as a different unit.
+            - Several virtual domains can be given as a comma separated list, or "*"
+              for all of them. The task is then applied to every one of them concurrently
+              and their results are returned under vdoms. In check mode, only the first
+              virtual domain holding the object is compared.
         type: str
         default: root
 
@@ -216,6 +233,10 @@ path:
   returned: always
   type: str
   sample: "webfilter"
+perf:
+  description: Method, endpoint, status, payload sizes and timings of the requests issued by the task
+  returned: when the perf_stats option of the httpapi connection is enabled
+  type: dict
 revision:
   description: Internal revision number
   returned: always
@@ -247,8 +268,11 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.connection import Connection
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import FortiOSHandler
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_legacy_fortiosapi
-from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import schema_to_module_spec
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_schema_versioning
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import load_schema
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import load_module_spec
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas.emailfilter_block_allow_list import VERSIONED_SCHEMA
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas.emailfilter_block_allow_list import MODULE_SPEC
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortimanager.common import FAIL_SOCKET_MSG
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import is_same_comparison
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import serialize
@@ -320,178 +344,14 @@ def fortios_emailfilter(data, fos):
         resp
 
 
-versioned_schema = {
-    "type": "list",
-    "children": {
-        "comment": {
-            "type": "string",
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "entries": {
-            "type": "list",
-            "children": {
-                "status": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "pattern_type": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "wildcard",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "regexp",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "ip4_subnet": {
-                    "type": "string",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "email_pattern": {
-                    "type": "string",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "id": {
-                    "type": "integer",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "ip6_subnet": {
-                    "type": "string",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "action": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "reject",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "spam",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "clear",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "type": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "ip",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "email",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "addr_type": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "ipv4",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "ipv6",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "id": {
-            "type": "integer",
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "name": {
-            "type": "string",
-            "revisions": {
-                "v7.0.0": True
-            }
-        }
-    },
-    "revisions": {
-        "v7.0.0": True
-    }
-}
-
-
 def main():
-    module_spec = schema_to_module_spec(versioned_schema)
+    module_spec = load_module_spec(MODULE_SPEC)
     mkeyname = 'id'
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": bool},
+        "skip_unchanged": {"required": False, "type": bool, "default": False},
+        "partial_update": {"required": False, "type": bool, "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "state": {"required": True, "type": "str",
                   "choices": ["present", "absent"]},
@@ -521,7 +381,7 @@ def main():
         else:
             connection.set_option('enable_log', False)
         fos = FortiOSHandler(connection, module, mkeyname)
-        versions_check_result = check_schema_versioning(fos, versioned_schema, "emailfilter_block_allow_list")
+        versions_check_result = check_schema_versioning(fos, load_schema(VERSIONED_SCHEMA), "emailfilter_block_allow_list")
 
         is_error, has_changed, result = fortios_emailfilter(module.params, fos)
 
@@ -533,14 +393,14 @@ def main():
 
     if not is_error:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result)
+            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.exit_json(changed=has_changed, meta=result)
+            module.exit_json(changed=has_changed, meta=result, **fos.perf_report())
     else:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result)
+            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.fail_json(msg="Error in repo", meta=result)
+            module.fail_json(msg="Error in repo", meta=result, **fos.perf_report())
 
 
 if __name__ == '__main__':
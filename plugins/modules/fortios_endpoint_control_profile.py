@@ -56,11 +56,28 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Fetch the current object before writing it and skip the write when nothing differs.
+        type: bool
+        required: false
+        default: false
+    partial_update:
+        description:
+            - Fetch the current object before writing it and only send the attributes which differ.
+              Implies skip_unchanged.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
               virtual instance of the FortiGate that can be configured and
               used as a different unit.
+            - Several virtual domains can be given as a comma separated list, or "*"
+              for all of them. The task is then applied to every one of them concurrently
+              and their results are returned under vdoms. In check mode, only the first
+              virtual domain holding the object is compared.
         type: str
         default: root
 
@@ -805,6 +822,10 @@ path:
   returned: always
   type: str
   sample: "webfilter"
+perf:
+  description: Method, endpoint, status, payload sizes and timings of the requests issued by the task
+  returned: when the perf_stats option of the httpapi connection is enabled
+  type: dict
 revision:
   description: Internal revision number
   returned: always
@@ -836,11 +857,13 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.connection import Connection
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import FortiOSHandler
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_legacy_fortiosapi
-from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import schema_to_module_spec
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import fortios_check_mode
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_schema_versioning
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import load_schema
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import load_module_spec
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas.endpoint_control_profile import VERSIONED_SCHEMA
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas.endpoint_control_profile import MODULE_SPEC
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortimanager.common import FAIL_SOCKET_MSG
-from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import is_same_comparison
-from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import serialize
 
 
 def filter_endpoint_control_profile_data(json):
@@ -881,36 +904,7 @@ def endpoint_control_profile(data, fos, check_mode=False):
 
     # check_mode starts from here
     if check_mode:
-        mkey = fos.get_mkey('system', 'interface', filtered_data, vdom=vdom)
-        current_data = fos.get('system', 'interface', vdom=vdom, mkey=mkey)
-        is_existed = current_data and current_data.get('http_status') == 200 \
-            and isinstance(current_data.get('results'), list) \
-            and len(current_data['results']) > 0
-
-        # 2. if it exists and the state is 'present' then compare current settings with desired
-        if state == 'present' or state is True:
-            if mkey is None:
-                return False, True, filtered_data
-
-            # if mkey exists then compare each other
-            # record exits and they're matched or not
-            if is_existed:
-                is_same = is_same_comparison(
-                    serialize(current_data['results'][0]), serialize(filtered_data))
-                return False, not is_same, filtered_data
-
-            # record does not exist
-            return False, True, filtered_data
-
-        if state == 'absent':
-            if mkey is None:
-                return False, False, filtered_data
-
-            if is_existed:
-                return False, True, filtered_data
-            return False, False, filtered_data
-
-        return True, False, {'reason: ': 'Must provide state parameter'}
+        return fortios_check_mode(data, fos, 'endpoint-control', 'profile', filtered_data)
 
     if state == "present" or state is True:
         return fos.set('endpoint-control',
@@ -946,1712 +940,14 @@ def fortios_endpoint_control(data, fos, check_mode):
         resp
 
 
-versioned_schema = {
-    "type": "list",
-    "children": {
-        "forticlient_ios_settings": {
-            "type": "dict",
-            "children": {
-                "forticlient_wf": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "client_vpn_settings": {
-                    "type": "list",
-                    "children": {
-                        "vpn_configuration_content": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "vpn_configuration_name": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "sslvpn_access_port": {
-                            "type": "integer",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "sslvpn_require_certificate": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "enable",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "disable",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "preshared_key": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "remote_gw": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "type": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "ipsec",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "ssl",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "auth_method": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "psk",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "certificate",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "name": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    },
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "configuration_name": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "client_vpn_provisioning": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "distribute_configuration_profile": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "disable_wf_when_protected": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_wf_profile": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "configuration_content": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.11": True,
-                "v6.0.0": True,
-                "v6.0.5": True
-            }
-        },
-        "forticlient_android_settings": {
-            "type": "dict",
-            "children": {
-                "forticlient_wf": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_vpn_provisioning": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_advanced_vpn_buffer": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "disable_wf_when_protected": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_advanced_vpn": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_vpn_settings": {
-                    "type": "list",
-                    "children": {
-                        "name": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "sslvpn_access_port": {
-                            "type": "integer",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "sslvpn_require_certificate": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "enable",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "disable",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "preshared_key": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "remote_gw": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "type": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "ipsec",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "ssl",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "auth_method": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "psk",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "certificate",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    },
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_wf_profile": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.11": True,
-                "v6.0.0": True,
-                "v6.0.5": True
-            }
-        },
-        "on_net_addr": {
-            "type": "list",
-            "children": {
-                "name": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.11": True,
-                "v6.0.0": True,
-                "v6.0.5": True
-            }
-        },
-        "description": {
-            "type": "string",
-            "revisions": {
-                "v6.0.11": True,
-                "v6.0.0": True,
-                "v6.0.5": True
-            }
-        },
-        "user_groups": {
-            "type": "list",
-            "children": {
-                "name": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.11": True,
-                "v6.0.0": True,
-                "v6.0.5": True
-            }
-        },
-        "profile_name": {
-            "type": "string",
-            "revisions": {
-                "v6.0.11": True,
-                "v6.0.0": True,
-                "v6.0.5": True
-            }
-        },
-        "forticlient_winmac_settings": {
-            "type": "dict",
-            "children": {
-                "forticlient_wf": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_vuln_scan_compliance_action": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "warning",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_vuln_scan": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_application_firewall": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_own_file": {
-                    "type": "list",
-                    "children": {
-                        "id": {
-                            "type": "integer",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "file": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    },
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_security_posture_compliance_action": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "warning",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "sandbox_address": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_log_upload": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_log_upload_level": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "traffic",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "vulnerability",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "event",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_vuln_scan_exempt": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_vuln_scan_enforce": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "critical",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "high",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "medium",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "low",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "info",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "av_realtime_protection": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_minimum_software_version": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_mac_ver": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_application_firewall_list": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "sandbox_analysis": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_vuln_scan_enforce_grace": {
-                    "type": "integer",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_security_posture": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_registration_compliance_action": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "warning",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_system_compliance_action": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "warning",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_system_compliance": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_running_app": {
-                    "type": "list",
-                    "children": {
-                        "process_name3": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "app_name": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "app_sha256_signature3": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "app_sha256_signature2": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "process_name2": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "process_name": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "process_name4": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "app_sha256_signature": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "app_sha256_signature4": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "application_check_rule": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "present",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "absent",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "id": {
-                            "type": "integer",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    },
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_operating_system": {
-                    "type": "list",
-                    "children": {
-                        "os_type": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "custom",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "mac-os",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-7",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-80",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-81",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-10",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-2000",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-home-svr",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-svr-10",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-svr-2003",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-svr-2003-r2",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-svr-2008",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-svr-2008-r2",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-svr-2012",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-svr-2012-r2",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-sto-svr-2003",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-vista",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "win-xp",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "ubuntu-linux",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "centos-linux",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "redhat-linux",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                },
-                                {
-                                    "value": "fedora-linux",
-                                    "revisions": {
-                                        "v6.0.11": True,
-                                        "v6.0.0": True,
-                                        "v6.0.5": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "os_name": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "id": {
-                            "type": "integer",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    },
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_log_upload_server": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "av_signature_up_to_date": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_registry_entry": {
-                    "type": "list",
-                    "children": {
-                        "registry_entry": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        "id": {
-                            "type": "integer",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    },
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_wf_profile": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_ems_entries": {
-                    "type": "list",
-                    "children": {
-                        "name": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    },
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_ems_compliance": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_linux_ver": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "os_av_software_installed": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_av": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_win_ver": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                },
-                "forticlient_ems_compliance_action": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "block",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        },
-                        {
-                            "value": "warning",
-                            "revisions": {
-                                "v6.0.11": True,
-                                "v6.0.0": True,
-                                "v6.0.5": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.11": True,
-                "v6.0.0": True,
-                "v6.0.5": True
-            }
-        },
-        "device_groups": {
-            "type": "list",
-            "children": {
-                "name": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.11": True,
-                "v6.0.0": True,
-                "v6.0.5": True
-            }
-        },
-        "src_addr": {
-            "type": "list",
-            "children": {
-                "name": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.11": True,
-                "v6.0.0": True,
-                "v6.0.5": True
-            }
-        },
-        "replacemsg_override_group": {
-            "type": "string",
-            "revisions": {
-                "v6.0.11": True,
-                "v6.0.0": True,
-                "v6.0.5": True
-            }
-        },
-        "users": {
-            "type": "list",
-            "children": {
-                "name": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.0.11": True,
-                        "v6.0.0": True,
-                        "v6.0.5": True
-                    }
-                }
-            },
-            "revisions": {
-                "v6.0.11": True,
-                "v6.0.0": True,
-                "v6.0.5": True
-            }
-        }
-    },
-    "revisions": {
-        "v6.0.11": True,
-        "v6.0.0": True,
-        "v6.0.5": True
-    }
-}
-
-
 def main():
-    module_spec = schema_to_module_spec(versioned_schema)
+    module_spec = load_module_spec(MODULE_SPEC)
     mkeyname = 'profile-name'
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": bool},
+        "skip_unchanged": {"required": False, "type": bool, "default": False},
+        "partial_update": {"required": False, "type": bool, "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "state": {"required": True, "type": "str",
                   "choices": ["present", "absent"]},
@@ -2681,7 +977,7 @@ def main():
         else:
             connection.set_option('enable_log', False)
         fos = FortiOSHandler(connection, module, mkeyname)
-        versions_check_result = check_schema_versioning(fos, versioned_schema, "endpoint_control_profile")
+        versions_check_result = check_schema_versioning(fos, load_schema(VERSIONED_SCHEMA), "endpoint_control_profile")
 
         is_error, has_changed, result = fortios_endpoint_control(module.params, fos, module.check_mode)
 
@@ -2693,14 +989,14 @@ def main():
 
     if not is_error:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result)
+            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.exit_json(changed=has_changed, meta=result)
+            module.exit_json(changed=has_changed, meta=result, **fos.perf_report())
     else:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result)
+            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.fail_json(msg="Error in repo", meta=result)
+            module.fail_json(msg="Error in repo", meta=result, **fos.perf_report())
 
 
 if __name__ == '__main__':
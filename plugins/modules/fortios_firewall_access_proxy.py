@@ -56,11 +56,28 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Fetch the current object before writing it and skip the write when nothing differs.
+        type: bool
+        required: false
+        default: false
+    partial_update:
+        description:
+            - Fetch the current object before writing it and only send the attributes which differ.
+              Implies skip_unchanged.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
               virtual instance of the FortiGate that can be configured and
               used as a different unit.
+            - Several virtual domains can be given as a comma separated list, or "*"
+              for all of them. The task is then applied to every one of them concurrently
+              and their results are returned under vdoms. In check mode, only the first
+              virtual domain holding the object is compared.
         type: str
         default: root
 
@@ -635,6 +652,10 @@ path:
   returned: always
   type: str
   sample: "webfilter"
+perf:
+  description: Method, endpoint, status, payload sizes and timings of the requests issued by the task
+  returned: when the perf_stats option of the httpapi connection is enabled
+  type: dict
 revision:
   description: Internal revision number
   returned: always
@@ -666,8 +687,11 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.connection import Connection
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import FortiOSHandler
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_legacy_fortiosapi
-from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import schema_to_module_spec
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_schema_versioning
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import load_schema
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import load_module_spec
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas.firewall_access_proxy import VERSIONED_SCHEMA
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas.firewall_access_proxy import MODULE_SPEC
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortimanager.common import FAIL_SOCKET_MSG
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import is_same_comparison
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import serialize
@@ -763,1371 +787,14 @@ def fortios_firewall(data, fos):
         resp
 
 
-versioned_schema = {
-    "type": "list",
-    "children": {
-        "api_gateway": {
-            "type": "list",
-            "children": {
-                "ssl_algorithm": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "high",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "medium",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "low",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "custom",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "ssl_min_version": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "tls-1.0",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "tls-1.1",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "tls-1.2",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "tls-1.3",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "ssl_cipher_suites": {
-                    "type": "list",
-                    "children": {
-                        "priority": {
-                            "type": "integer",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "cipher": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "TLS-AES-128-GCM-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-AES-256-GCM-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-CHACHA20-POLY1305-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-RSA-WITH-CHACHA20-POLY1305-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-ECDSA-WITH-CHACHA20-POLY1305-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-CHACHA20-POLY1305-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-AES-128-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-AES-256-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-AES-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-AES-128-GCM-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-AES-256-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-AES-256-GCM-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-AES-128-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-AES-256-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-AES-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-AES-128-GCM-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-AES-256-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-AES-256-GCM-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-RSA-WITH-AES-128-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-RSA-WITH-AES-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-RSA-WITH-AES-128-GCM-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-RSA-WITH-AES-256-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-RSA-WITH-AES-256-CBC-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-RSA-WITH-AES-256-GCM-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-ECDSA-WITH-AES-128-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-ECDSA-WITH-AES-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-ECDSA-WITH-AES-128-GCM-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-ECDSA-WITH-AES-256-CBC-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-ECDSA-WITH-AES-256-GCM-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-AES-128-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-AES-256-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-AES-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-AES-128-GCM-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-AES-256-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-AES-256-GCM-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-CAMELLIA-128-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-CAMELLIA-256-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-CAMELLIA-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-CAMELLIA-256-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-3DES-EDE-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-CAMELLIA-128-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-CAMELLIA-128-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-CAMELLIA-256-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-CAMELLIA-256-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-CAMELLIA-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-CAMELLIA-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-CAMELLIA-256-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-CAMELLIA-256-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-SEED-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-SEED-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-ARIA-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-ARIA-256-CBC-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-ARIA-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-ARIA-256-CBC-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-SEED-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-ARIA-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-ARIA-256-CBC-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-RSA-WITH-ARIA-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-RSA-WITH-ARIA-256-CBC-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-ECDSA-WITH-ARIA-128-CBC-SHA256",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-ECDSA-WITH-ARIA-256-CBC-SHA384",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-RSA-WITH-RC4-128-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-ECDHE-RSA-WITH-3DES-EDE-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-3DES-EDE-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-3DES-EDE-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-RC4-128-MD5",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-RC4-128-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-RSA-WITH-DES-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-DHE-DSS-WITH-DES-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "TLS-RSA-WITH-DES-CBC-SHA",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "versions": {
-                            "multiple_values": True,
-                            "type": "list",
-                            "options": [
-                                {
-                                    "value": "tls-1.0",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "tls-1.1",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "tls-1.2",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "tls-1.3",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    },
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "service": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "http",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "https",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "tcp-forwarding",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "samlsp",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "realservers": {
-                    "type": "list",
-                    "children": {
-                        "status": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "active",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "standby",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "disable",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "health_check": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "disable",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "enable",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "weight": {
-                            "type": "integer",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "ip": {
-                            "type": "string",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "id": {
-                            "type": "integer",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "http_host": {
-                            "type": "string",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "health_check_proto": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "ping",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "http",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "tcp-connect",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "address": {
-                            "type": "string",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "port": {
-                            "type": "integer",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "mappedport": {
-                            "type": "string",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    },
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "http_cookie_domain_from_host": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "https_cookie_secure": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "http_cookie_generation": {
-                    "type": "integer",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "http_cookie_domain": {
-                    "type": "string",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "url_map_type": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "sub-string",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "wildcard",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "regex",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "http_cookie_share": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "same-ip",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "ssl_dh_bits": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "768",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "1024",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "1536",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "2048",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "3072",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "4096",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "ldb_method": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "static",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "round-robin",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "weighted",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "least-session",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "least-rtt",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "first-alive",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "http-host",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "persistence": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "none",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "http-cookie",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "virtual_host": {
-                    "type": "string",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "ssl_max_version": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "tls-1.0",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "tls-1.1",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "tls-1.2",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "tls-1.3",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "url_map": {
-                    "type": "string",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "saml_server": {
-                    "type": "string",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "id": {
-                    "type": "integer",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "http_cookie_age": {
-                    "type": "integer",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "http_cookie_path": {
-                    "type": "string",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "name": {
-            "type": "string",
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "realservers": {
-            "type": "list",
-            "children": {
-                "status": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "active",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "standby",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "ip": {
-                    "type": "string",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "id": {
-                    "type": "integer",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "weight": {
-                    "type": "integer",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "port": {
-                    "type": "integer",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "empty_cert_action": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "accept",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                {
-                    "value": "block",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "server_pubkey_auth": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                {
-                    "value": "enable",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "vip": {
-            "type": "string",
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "ldb_method": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "static",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                {
-                    "value": "round-robin",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                {
-                    "value": "weighted",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                {
-                    "value": "least-session",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                {
-                    "value": "least-rtt",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                {
-                    "value": "first-alive",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "server_pubkey_auth_settings": {
-            "type": "dict",
-            "children": {
-                "permit_x11_forwarding": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "auth_ca": {
-                    "type": "string",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "permit_port_forwarding": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "permit_pty": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "permit_user_rc": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "permit_agent_forwarding": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "source_address": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                "cert_extension": {
-                    "type": "list",
-                    "children": {
-                        "data": {
-                            "type": "string",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "critical": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "no",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "yes",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "type": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "fixed",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                },
-                                {
-                                    "value": "user",
-                                    "revisions": {
-                                        "v7.0.0": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        },
-                        "name": {
-                            "type": "string",
-                            "revisions": {
-                                "v7.0.0": True
-                            }
-                        }
-                    },
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": True
-            }
-        },
-        "client_cert": {
-            "type": "string",
-            "options": [
-                {
-                    "value": "disable",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                },
-                {
-                    "value": "enable",
-                    "revisions": {
-                        "v7.0.0": True
-                    }
-                }
-            ],
-            "revisions": {
-                "v7.0.0": True
-            }
-        }
-    },
-    "revisions": {
-        "v7.0.0": True
-    }
-}
-
-
 def main():
-    module_spec = schema_to_module_spec(versioned_schema)
+    module_spec = load_module_spec(MODULE_SPEC)
     mkeyname = 'name'
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": bool},
+        "skip_unchanged": {"required": False, "type": bool, "default": False},
+        "partial_update": {"required": False, "type": bool, "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "state": {"required": True, "type": "str",
                   "choices": ["present", "absent"]},
@@ -2157,7 +824,7 @@ def main():
         else:
             connection.set_option('enable_log', False)
         fos = FortiOSHandler(connection, module, mkeyname)
-        versions_check_result = check_schema_versioning(fos, versioned_schema, "firewall_access_proxy")
+        versions_check_result = check_schema_versioning(fos, load_schema(VERSIONED_SCHEMA), "firewall_access_proxy")
 
         is_error, has_changed, result = fortios_firewall(module.params, fos)
 
@@ -2169,14 +836,14 @@ def main():
 
     if not is_error:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result)
+            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.exit_json(changed=has_changed, meta=result)
+            module.exit_json(changed=has_changed, meta=result, **fos.perf_report())
     else:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result)
+            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.fail_json(msg="Error in repo", meta=result)
+            module.fail_json(msg="Error in repo", meta=result, **fos.perf_report())
 
 
 if __name__ == '__main__':
@@ -256,6 +256,10 @@ path:
   returned: always
   type: str
   sample: "webfilter"
+perf:
+  description: Method, endpoint, status, payload sizes and timings of the requests issued by the task
+  returned: when the perf_stats option of the httpapi connection is enabled
+  type: dict
 revision:
   description: Internal revision number
   returned: always
@@ -381,9 +385,10 @@ def main():
         module.fail_json(**FAIL_SOCKET_MSG)
 
     if not is_error:
-        module.exit_json(changed=has_changed, meta=result)
+        module.exit_json(changed=has_changed, meta=result, **fos.perf_report())
     else:
-        module.fail_json(msg="Unable to precess the request, please provide correct parameters and make sure the path exists.", meta=result)
+        module.fail_json(msg="Unable to precess the request, please provide correct parameters and make sure the path exists.",
+                         meta=result, **fos.perf_report())
 
 
 if __name__ == '__main__':
@@ -281,6 +281,10 @@ rows:
   returned: always
   type: int
   sample: 400
+perf:
+  description: Method, endpoint, status, payload sizes and timings of the requests issued by the task
+  returned: when the perf_stats option of the httpapi connection is enabled
+  type: dict
 serial:
   description: Serial number of the unit
   returned: always
@@ -4785,21 +4789,12 @@ def fortios_log_fact(fos):
     selector = params['selector']
 
     url_params = dict()
-    if params['filters'] and len(params['filters']):
-        filter_body = params['filters'][0]
-        for filter_item in params['filters'][1:]:
-            filter_body = "%s&filter=%s" % (filter_body, filter_item)
-        url_params['filter'] = filter_body
-    if params['sorters'] and len(params['sorters']):
-        sorter_body = params['sorters'][0]
-        for sorter_item in params['sorters'][1:]:
-            sorter_body = "%s&sort=%s" % (sorter_body, sorter_item)
-        url_params['sort'] = sorter_body
-    if params['formatters'] and len(params['formatters']):
-        formatter_body = params['formatters'][0]
-        for formatter_item in params['formatters'][1:]:
-            formatter_body = '%s|%s' % (formatter_body, formatter_item)
-        url_params['format'] = formatter_body
+    if params['filters']:
+        url_params['filter'] = params['filters']
+    if params['sorters']:
+        url_params['sort'] = params['sorters']
+    if params['formatters']:
+        url_params['format'] = params['formatters']
     if params['params']:
         for selector_param_key, selector_param in params['params'].items():
             url_params[selector_param_key] = selector_param
@@ -5005,14 +5000,14 @@ def main():
 
     if not is_error:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result)
+            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.exit_json(changed=has_changed, meta=result)
+            module.exit_json(changed=has_changed, meta=result, **fos.perf_report())
     else:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result)
+            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.fail_json(msg="Error in repo", meta=result)
+            module.fail_json(msg="Error in repo", meta=result, **fos.perf_report())
 
 
 if __name__ == '__main__':
@@ -56,11 +56,28 @@ options:
         type: bool
         required: false
         default: false
+    skip_unchanged:
+        description:
+            - Fetch the current object before writing it and skip the write when nothing differs.
+        type: bool
+        required: false
+        default: false
+    partial_update:
+        description:
+            - Fetch the current object before writing it and only send the attributes which differ.
+              Implies skip_unchanged.
+        type: bool
+        required: false
+        default: false
     vdom:
         description:
             - Virtual domain, among those defined previously. A vdom is a
               virtual instance of the FortiGate that can be configured and
               used as a different unit.
+            - Several virtual domains can be given as a comma separated list, or "*"
+              for all of them. The task is then applied to every one of them concurrently
+              and their results are returned under vdoms. In check mode, only the first
+              virtual domain holding the object is compared.
         type: str
         default: root
 
@@ -393,6 +410,10 @@ path:
   returned: always
   type: str
   sample: "webfilter"
+perf:
+  description: Method, endpoint, status, payload sizes and timings of the requests issued by the task
+  returned: when the perf_stats option of the httpapi connection is enabled
+  type: dict
 revision:
   description: Internal revision number
   returned: always
@@ -424,11 +445,13 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.connection import Connection
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import FortiOSHandler
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_legacy_fortiosapi
-from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import schema_to_module_spec
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import fortios_check_mode
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_schema_versioning
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import load_schema
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas import load_module_spec
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas.system_sso_admin import VERSIONED_SCHEMA
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.schemas.system_sso_admin import MODULE_SPEC
 from ansible_collections.fortinet.fortios.plugins.module_utils.fortimanager.common import FAIL_SOCKET_MSG
-from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import is_same_comparison
-from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.comparison import serialize
 
 
 def filter_system_sso_admin_data(json):
@@ -468,36 +491,7 @@ def system_sso_admin(data, fos, check_mode=False):
 
     # check_mode starts from here
     if check_mode:
-        mkey = fos.get_mkey('system', 'interface', filtered_data, vdom=vdom)
-        current_data = fos.get('system', 'interface', vdom=vdom, mkey=mkey)
-        is_existed = current_data and current_data.get('http_status') == 200 \
-            and isinstance(current_data.get('results'), list) \
-            and len(current_data['results']) > 0
-
-        # 2. if it exists and the state is 'present' then compare current settings with desired
-        if state == 'present' or state is True:
-            if mkey is None:
-                return False, True, filtered_data
-
-            # if mkey exists then compare each other
-            # record exits and they're matched or not
-            if is_existed:
-                is_same = is_same_comparison(
-                    serialize(current_data['results'][0]), serialize(filtered_data))
-                return False, not is_same, filtered_data
-
-            # record does not exist
-            return False, True, filtered_data
-
-        if state == 'absent':
-            if mkey is None:
-                return False, False, filtered_data
-
-            if is_existed:
-                return False, True, filtered_data
-            return False, False, filtered_data
-
-        return True, False, {'reason: ': 'Must provide state parameter'}
+        return fortios_check_mode(data, fos, 'system', 'sso-admin', filtered_data)
 
     if state == "present" or state is True:
         return fos.set('system',
@@ -533,533 +527,14 @@ def fortios_system(data, fos, check_mode):
         resp
 
 
-versioned_schema = {
-    "type": "list",
-    "children": {
-        "gui_vdom_menu_favorites": {
-            "type": "list",
-            "children": {
-                "id": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.2.3": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": False,
-                "v6.4.4": False,
-                "v6.4.0": False,
-                "v6.4.1": False,
-                "v6.2.3": True,
-                "v6.2.5": False,
-                "v6.2.7": False
-            }
-        },
-        "name": {
-            "type": "string",
-            "revisions": {
-                "v7.0.0": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True
-            }
-        },
-        "gui_new_feature_acknowledge": {
-            "type": "list",
-            "children": {
-                "id": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.2.3": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": False,
-                "v6.4.4": False,
-                "v6.4.0": False,
-                "v6.4.1": False,
-                "v6.2.3": True,
-                "v6.2.5": False,
-                "v6.2.7": False
-            }
-        },
-        "gui_ignore_release_overview_version": {
-            "type": "string",
-            "revisions": {
-                "v6.4.4": False,
-                "v7.0.0": False,
-                "v6.4.1": True
-            }
-        },
-        "accprofile": {
-            "type": "string",
-            "revisions": {
-                "v7.0.0": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True
-            }
-        },
-        "gui_global_menu_favorites": {
-            "type": "list",
-            "children": {
-                "id": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.2.3": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": False,
-                "v6.4.4": False,
-                "v6.4.0": False,
-                "v6.4.1": False,
-                "v6.2.3": True,
-                "v6.2.5": False,
-                "v6.2.7": False
-            }
-        },
-        "gui_dashboard": {
-            "type": "list",
-            "children": {
-                "widget": {
-                    "type": "list",
-                    "children": {
-                        "x_pos": {
-                            "type": "integer",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "title": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "fortiview_type": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "industry": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "default",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "custom",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "region": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "default",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "custom",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "fortiview_sort_by": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "fortiview_device": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "fortiview_filters": {
-                            "type": "list",
-                            "children": {
-                                "value": {
-                                    "type": "string",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                "id": {
-                                    "type": "integer",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                "key": {
-                                    "type": "string",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                }
-                            },
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "height": {
-                            "type": "integer",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "fabric_device": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "interface": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "fortiview_visualization": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "fabric_device_widget_visualization_type": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "y_pos": {
-                            "type": "integer",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "id": {
-                            "type": "integer",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "fabric_device_widget_name": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "fortiview_timeframe": {
-                            "type": "string",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "type": {
-                            "type": "string",
-                            "options": [
-                                {
-                                    "value": "sysinfo",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "licinfo",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "forticloud",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "cpu-usage",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "memory-usage",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "disk-usage",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "log-rate",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "sessions",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "session-rate",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "tr-history",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "analytics",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "usb-modem",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "admins",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "security-fabric",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "security-fabric-ranking",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "sensor-info",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "ha-status",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "vulnerability-summary",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "host-scan-summary",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "fortiview",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "botnet-activity",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                },
-                                {
-                                    "value": "fabric-device",
-                                    "revisions": {
-                                        "v6.2.3": True
-                                    }
-                                }
-                            ],
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        "width": {
-                            "type": "integer",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        }
-                    },
-                    "revisions": {
-                        "v6.2.3": True
-                    }
-                },
-                "name": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.2.3": True
-                    }
-                },
-                "permanent": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "disable",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        {
-                            "value": "enable",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.2.3": True
-                    }
-                },
-                "vdom": {
-                    "type": "string",
-                    "revisions": {
-                        "v6.2.3": True
-                    }
-                },
-                "layout_type": {
-                    "type": "string",
-                    "options": [
-                        {
-                            "value": "responsive",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        },
-                        {
-                            "value": "fixed",
-                            "revisions": {
-                                "v6.2.3": True
-                            }
-                        }
-                    ],
-                    "revisions": {
-                        "v6.2.3": True
-                    }
-                },
-                "id": {
-                    "type": "integer",
-                    "revisions": {
-                        "v6.2.3": True
-                    }
-                },
-                "columns": {
-                    "type": "integer",
-                    "revisions": {
-                        "v6.2.3": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": False,
-                "v6.4.4": False,
-                "v6.4.0": False,
-                "v6.4.1": False,
-                "v6.2.3": True,
-                "v6.2.5": False,
-                "v6.2.7": False
-            }
-        },
-        "vdom": {
-            "type": "list",
-            "children": {
-                "name": {
-                    "type": "string",
-                    "revisions": {
-                        "v7.0.0": True,
-                        "v6.4.4": True,
-                        "v6.4.0": True,
-                        "v6.4.1": True,
-                        "v6.2.0": True,
-                        "v6.2.3": True,
-                        "v6.2.5": True,
-                        "v6.2.7": True
-                    }
-                }
-            },
-            "revisions": {
-                "v7.0.0": True,
-                "v6.4.4": True,
-                "v6.4.0": True,
-                "v6.4.1": True,
-                "v6.2.0": True,
-                "v6.2.3": True,
-                "v6.2.5": True,
-                "v6.2.7": True
-            }
-        }
-    },
-    "revisions": {
-        "v7.0.0": True,
-        "v6.4.4": True,
-        "v6.4.0": True,
-        "v6.4.1": True,
-        "v6.2.0": True,
-        "v6.2.3": True,
-        "v6.2.5": True,
-        "v6.2.7": True
-    }
-}
-
-
 def main():
-    module_spec = schema_to_module_spec(versioned_schema)
+    module_spec = load_module_spec(MODULE_SPEC)
     mkeyname = 'name'
     fields = {
         "access_token": {"required": False, "type": "str", "no_log": True},
         "enable_log": {"required": False, "type": bool},
+        "skip_unchanged": {"required": False, "type": bool, "default": False},
+        "partial_update": {"required": False, "type": bool, "default": False},
         "vdom": {"required": False, "type": "str", "default": "root"},
         "state": {"required": True, "type": "str",
                   "choices": ["present", "absent"]},
@@ -1089,7 +564,7 @@ def main():
         else:
             connection.set_option('enable_log', False)
         fos = FortiOSHandler(connection, module, mkeyname)
-        versions_check_result = check_schema_versioning(fos, versioned_schema, "system_sso_admin")
+        versions_check_result = check_schema_versioning(fos, load_schema(VERSIONED_SCHEMA), "system_sso_admin")
 
         is_error, has_changed, result = fortios_system(module.params, fos, module.check_mode)
 
@@ -1101,14 +576,14 @@ def main():
 
     if not is_error:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result)
+            module.exit_json(changed=has_changed, version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.exit_json(changed=has_changed, meta=result)
+            module.exit_json(changed=has_changed, meta=result, **fos.perf_report())
     else:
         if versions_check_result and versions_check_result['matched'] is False:
-            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result)
+            module.fail_json(msg="Error in repo", version_check_warning=versions_check_result, meta=result, **fos.perf_report())
         else:
-            module.fail_json(msg="Error in repo", meta=result)
+            module.fail_json(msg="Error in repo", meta=result, **fos.perf_report())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,231 @@
+#!/usr/bin/python
+from __future__ import (absolute_import, division, print_function)
+# Copyright 2021 Fortinet, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {'status': ['preview'],
+                    'supported_by': 'community',
+                    'metadata_version': '1.1'}
+
+DOCUMENTATION = '''
+---
+module: fortios_transaction
+short_description: Start, commit or abort a configuration transaction in Fortinet's FortiOS and FortiGate.
+description:
+    - This module opens a FortiOS configuration transaction on the httpapi connection. Every configuration
+      change issued by the following tasks against the same device is staged in the transaction and is
+      applied as a single commit, or discarded when the transaction is aborted.
+      Tested with FOS v6.4.0
+version_added: "2.10"
+author:
+    - Link Zheng (@chillancezen)
+    - Jie Xue (@JieX19)
+    - Hongbin Lu (@fgtdev-hblu)
+    - Frank Shen (@frankshen01)
+notes:
+    - Transactions are supported by FortiOS 6.4.0 and later.
+    - The transaction belongs to the persistent connection, start and end it in the same play.
+    - Use the rescue section of a block to abort the transaction when one of the tasks fails.
+requirements:
+    - ansible>=2.9.0
+options:
+    access_token:
+        description:
+            - Token-based authentication.
+              Generated from GUI of Fortigate.
+        type: str
+        required: false
+    enable_log:
+        description:
+            - Enable/Disable logging for task.
+        type: bool
+        required: false
+        default: false
+    vdom:
+        description:
+            - Virtual domain, among those defined previously. A vdom is a
+              virtual instance of the FortiGate that can be configured and
+              used as a different unit.
+        type: str
+        default: root
+    action:
+        description:
+            - Start a transaction, commit the staged changes or discard them.
+        type: str
+        required: true
+        choices:
+            - start
+            - commit
+            - abort
+    timeout:
+        description:
+            - Number of seconds after which the device aborts an idle transaction.
+        type: int
+        default: 60
+'''
+
+EXAMPLES = '''
+- hosts: fortigates
+  collections:
+    - fortinet.fortios
+  connection: httpapi
+  vars:
+   vdom: "root"
+   ansible_httpapi_use_ssl: yes
+   ansible_httpapi_validate_certs: no
+   ansible_httpapi_port: 443
+  tasks:
+  - block:
+    - name: Start a transaction
+      fortios_transaction:
+        vdom: "{{ vdom }}"
+        action: "start"
+        timeout: 120
+
+    - name: Configure IPv4 addresses.
+      fortios_firewall_address:
+        vdom: "{{ vdom }}"
+        state: "present"
+        firewall_address:
+          name: "host_10.0.0.1"
+          subnet: "10.0.0.1 255.255.255.255"
+
+    - name: Configure IPv4 address groups.
+      fortios_firewall_addrgrp:
+        vdom: "{{ vdom }}"
+        state: "present"
+        firewall_addrgrp:
+          name: "hosts"
+          member:
+           -
+            name: "host_10.0.0.1"
+
+    - name: Apply both changes in one commit
+      fortios_transaction:
+        vdom: "{{ vdom }}"
+        action: "commit"
+
+    rescue:
+    - name: Discard the staged changes
+      fortios_transaction:
+        vdom: "{{ vdom }}"
+        action: "abort"
+'''
+
+RETURN = '''
+build:
+  description: Build number of the fortigate image
+  returned: always
+  type: str
+  sample: '1547'
+http_method:
+  description: Last method used to provision the content into FortiGate
+  returned: always
+  type: str
+  sample: 'POST'
+http_status:
+  description: Last result given by FortiGate on last operation applied
+  returned: always
+  type: str
+  sample: "200"
+perf:
+  description: Method, endpoint, status, payload sizes and timings of the requests issued by the task
+  returned: when the perf_stats option of the httpapi connection is enabled
+  type: dict
+serial:
+  description: Serial number of the unit
+  returned: always
+  type: str
+  sample: "FGVMEVYYQT3AB5352"
+status:
+  description: Indication of the operation's result
+  returned: always
+  type: str
+  sample: "success"
+transaction_id:
+  description: Identifier of the transaction started, committed or aborted
+  returned: success
+  type: int
+  sample: 3
+vdom:
+  description: Virtual domain used
+  returned: always
+  type: str
+  sample: "root"
+version:
+  description: Version of the FortiGate
+  returned: always
+  type: str
+  sample: "v6.4.4"
+
+'''
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.connection import Connection
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import FortiOSHandler
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import check_legacy_fortiosapi
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortimanager.common import FAIL_SOCKET_MSG
+
+
+def fortios_transaction(data, fos):
+    vdom = data['vdom']
+    action = data['action']
+
+    if action == 'start':
+        resp = fos.transaction_start(vdom=vdom, timeout=data['timeout'])
+    elif action == 'commit':
+        resp = fos.transaction_commit(vdom=vdom)
+    else:
+        resp = fos.transaction_abort(vdom=vdom)
+
+    return resp['status'] != 'success', resp['status'] == 'success' and action != 'start', resp
+
+
+def main():
+    fields = {
+        "access_token": {"required": False, "type": "str", "no_log": True},
+        "enable_log": {"required": False, "type": bool},
+        "vdom": {"required": False, "type": "str", "default": "root"},
+        "action": {"required": True, "type": "str",
+                   "choices": ["start", "commit", "abort"]},
+        "timeout": {"required": False, "type": "int", "default": 60},
+    }
+
+    check_legacy_fortiosapi()
+    module = AnsibleModule(argument_spec=fields,
+                           supports_check_mode=False)
+
+    if module._socket_path:
+        connection = Connection(module._socket_path)
+        if 'access_token' in module.params:
+            connection.set_option('access_token', module.params['access_token'])
+        if 'enable_log' in module.params:
+            connection.set_option('enable_log', module.params['enable_log'])
+        else:
+            connection.set_option('enable_log', False)
+        fos = FortiOSHandler(connection, module)
+        is_error, has_changed, result = fortios_transaction(module.params, fos)
+    else:
+        module.fail_json(**FAIL_SOCKET_MSG)
+
+    if not is_error:
+        module.exit_json(changed=has_changed, meta=result, **fos.perf_report())
+    else:
+        module.fail_json(msg="Error in repo", meta=result, **fos.perf_report())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import io
+import os
+import threading
+
+from ansible_collections.fortinet.fortios.plugins.httpapi.fortios import HttpApi
+from ansible_collections.fortinet.fortios.plugins.httpapi.fortios import MKEY_INDEX_PAGE_SIZE
+
+
+class FakeConnection(object):
+
+    def __init__(self, **options):
+        self._options = dict(host='192.0.2.1', port=443, **options)
+        self._auth = None
+
+    def get_option(self, option):
+        return self._options.get(option)
+
+
+def httpapi(options=None, connection=None):
+    api = HttpApi(connection)
+    api.get_option = lambda option: (options or {}).get(option)
+    api.log = lambda *args, **kwargs: None
+    return api
+
+
+def test_mkey_index_ends_on_endpoints_ignoring_paging():
+    for count in (MKEY_INDEX_PAGE_SIZE + 10, MKEY_INDEX_PAGE_SIZE, 3):
+        api = httpapi({'mkey_index': True})
+        requests = []
+
+        def send_request(**request):
+            requests.append(request)
+            return 200, {'http_status': 200, 'status': 'success', 'results': [{'name': str(index)} for index in range(count)]}
+
+        api.send_request = send_request
+        assert api.mkey_exists('/api/v2/cmdb/firewall/address?vdom=root', 'name', str(count - 1))
+        assert not api.mkey_exists('/api/v2/cmdb/firewall/address?vdom=root', 'name', str(count))
+        assert len(requests) <= 2
+
+
+def test_session_cache_keeps_the_credentials_out_of_the_cache(tmp_path):
+    options = {'session_cache': True, 'session_cache_path': str(tmp_path)}
+    api = httpapi(options, FakeConnection())
+    assert not api._load_session_cache('admin', 'secret')
+    api._conn._auth = {'Cookie': 'APSCOOKIE=1'}
+    api._system_version = 'v7.0.0'
+    api._save_session_cache()
+
+    entries = os.listdir(str(tmp_path))
+    assert len(entries) == 1
+    with open(os.path.join(str(tmp_path), entries[0])) as entry:
+        assert 'secret' not in entries[0] and 'secret' not in entry.read()
+    assert os.stat(os.path.join(str(tmp_path), entries[0])).st_mode & 0o077 == 0
+
+    restored = httpapi(options, FakeConnection())
+    assert restored._load_session_cache('admin', 'secret')
+    assert restored._conn._auth == {'Cookie': 'APSCOOKIE=1'} and restored._system_version == 'v7.0.0'
+
+    # the entry of the same user is not reused with other credentials
+    other = httpapi(options, FakeConnection())
+    assert not other._load_session_cache('admin', 'other') and other._conn._auth is None
+
+
+class FakeResponse(object):
+
+    def __init__(self, status):
+        self.status = status
+
+    def info(self):
+        return {}
+
+
+def test_rejected_session_logs_in_once_for_concurrent_requests():
+    connection = FakeConnection(remote_user='admin', password='secret', check_system_status=False)
+    connection._auth = 'restored'
+    rejected = threading.Barrier(4, timeout=10)
+    logins = []
+
+    def send(url, data, method='GET', headers=None):
+        if url.startswith('/logincheck'):
+            logins.append(url)
+            connection._auth = 'new'
+            return FakeResponse(200), io.BytesIO(b'1')
+        if connection._auth == 'restored':
+            # every request is rejected on the restored session before any of them logs in again
+            rejected.wait()
+            return FakeResponse(401), io.BytesIO(b'{}')
+        return FakeResponse(200), io.BytesIO(b'{"status": "success"}')
+
+    connection.send = send
+    api = httpapi({'concurrent_requests': 4}, connection)
+    api._session_restored = True
+
+    responses = api.send_requests([{'url': '/api/v2/cmdb/firewall/address/host_%d' % (index), 'json_decode': True} for index in range(4)])
+    assert [status for status, data in responses] == [200] * 4
+    assert len(logins) == 1
+
+
+def test_encode_query_tells_booleans_from_integers():
+    api = httpapi()
+    assert api._encode_query({'with_meta': 1}) == 'with_meta=1'
+    assert api._encode_query({'with_meta': True}) == 'with_meta=True'
+    assert api._encode_query({'skip': 0}) == 'skip=0'
+    assert api._encode_query({'skip': False}) == 'skip=False'
+    assert api._encode_query({'filter': [1, 'name==a']}) == 'filter=1&filter=name%3D%3Da'
+    assert api._encode_query({'filter': [True, 'name==a']}) == 'filter=True&filter=name%3D%3Da'
@@ -0,0 +1,97 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.module_utils.six.moves.urllib.parse import unquote, urlsplit
+
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import FortiOSHandler
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import fortios_check_mode
+
+
+class FakeConnection(object):
+    """
+    Device serving the objects of a CMDB table per virtual domain, tables maps a vdom to the list of its objects.
+    """
+
+    def __init__(self, tables, mkeyname='name'):
+        self.tables = tables
+        self.mkeyname = mkeyname
+        self.requests = []
+
+    def send_request(self, url, params=None, method='GET', json_decode=True, **kwargs):
+        self.requests.append((url, params))
+        parts = urlsplit(url)
+        vdom = parts.query.split('vdom=')[-1]
+        path = parts.path.split('/')[4:]
+        objects = self.tables.get(vdom, [])
+        if len(path) == 3:
+            objects = [item for item in objects if str(item[self.mkeyname]) == unquote(path[2])]
+            if not objects:
+                return 404, {'http_status': 404, 'status': 'error', 'vdom': vdom}
+        return 200, {'http_status': 200, 'status': 'success', 'vdom': vdom, 'results': objects}
+
+    def send_requests(self, requests):
+        return [self.send_request(**request) for request in requests]
+
+
+class FakeModule(object):
+    params = {}
+
+    def fail_json(self, **kwargs):
+        raise AssertionError(kwargs)
+
+
+def check_mode(tables, data, state='present', vdom='root'):
+    fos = FortiOSHandler(FakeConnection(tables), FakeModule(), 'name')
+    is_error, has_changed, result = fortios_check_mode({'state': state, 'vdom': vdom}, fos, 'firewall', 'address', data)
+    assert not is_error
+    return has_changed
+
+
+def test_check_mode_reads_the_table_of_the_module():
+    fos = FortiOSHandler(FakeConnection({'root': [{'name': 'host_1', 'color': 1}]}), FakeModule(), 'name')
+    fortios_check_mode({'state': 'present', 'vdom': 'root'}, fos, 'firewall', 'address', {'name': 'host_1', 'color': 1})
+    assert fos._conn.requests == [('/api/v2/cmdb/firewall/address/host_1?vdom=root', None)]
+
+
+def test_check_mode_single_vdom():
+    tables = {'root': [{'name': 'host_1', 'color': 1}]}
+    assert not check_mode(tables, {'name': 'host_1', 'color': 1})
+    assert check_mode(tables, {'name': 'host_1', 'color': 2})
+    assert check_mode(tables, {'name': 'host_2', 'color': 1})
+    assert check_mode(tables, {'name': 'host_1'}, state='absent')
+    assert not check_mode(tables, {'name': 'host_2'}, state='absent')
+
+
+def test_check_mode_compares_every_vdom():
+    tables = {'root': [{'name': 'host_1', 'color': 1}], 'vd1': [{'name': 'host_1', 'color': 2}], 'vd2': []}
+    same = {'root': tables['root'], 'vd1': tables['root']}
+    assert not check_mode(same, {'name': 'host_1', 'color': 1}, vdom=['root', 'vd1'])
+    # the first vdom holds the same object, the second one a different one
+    assert check_mode(tables, {'name': 'host_1', 'color': 1}, vdom=['root', 'vd1'])
+    # the object is missing from the second vdom
+    assert check_mode(tables, {'name': 'host_1', 'color': 1}, vdom='root,vd2')
+    assert check_mode(tables, {'name': 'host_1'}, state='absent', vdom=['vd2', 'root'])
+    assert not check_mode(tables, {'name': 'host_2'}, state='absent', vdom=['root', 'vd1', 'vd2'])
+
+
+def handler(count):
+    # FakeConnection ignores start and count, as some endpoints do
+    return FortiOSHandler(FakeConnection({'root': [{'name': str(index)} for index in range(count)]}), FakeModule(), 'name')
+
+
+def test_iter_table_ends_on_endpoints_ignoring_paging():
+    for count, page_size in ((2500, 1000), (1000, 1000), (10, 1000)):
+        fos = handler(count)
+        assert [item['name'] for item in fos.iter_table('firewall', 'address', vdom='root', page_size=page_size)] == \
+            [str(index) for index in range(count)]
+        assert len(fos._conn.requests) <= 2
+
+
+def test_move_and_reorder_end_on_endpoints_ignoring_paging():
+    for count in (1500, 1000):
+        fos = handler(count)
+        resp = fos.move('firewall', 'policy', '5', after='3', vdom='root', check_mode=True)
+        assert resp['status'] == 'success' and resp['revision_changed']
+        resp = fos.reorder('firewall', 'policy', ['1', '0'], vdom='root', check_mode=True)
+        assert resp['status'] == 'success'
+        assert len(fos._conn.requests) <= 4
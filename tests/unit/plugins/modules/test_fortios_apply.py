@@ -0,0 +1,53 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.fortinet.fortios.plugins.modules.fortios_apply import fortios_apply
+
+SCHEMA = {
+    'mkey': 'name',
+    'children': {
+        'name': {'type': 'string', 'size': 79},
+        'color': {'type': 'integer', 'min-value': 0, 'max-value': 32},
+    }
+}
+
+
+class FakeFortiOS(object):
+    """
+    Device side of fortios_apply holding the objects of firewall/address, the calls writing to it fail the test.
+    """
+
+    def __init__(self, objects):
+        self.objects = objects
+
+    def schemas(self, tables, vdom=None):
+        return dict((table, SCHEMA) for table in tables)
+
+    def set_mkeyname(self, path, name, mkeyname):
+        pass
+
+    def get_objects(self, items, vdom=None, batch_size=100):
+        responses = []
+        for item in items:
+            current = [data for data in self.objects if data['name'] == item['data']['name']]
+            responses.append({'status': 'success', 'http_status': 200, 'results': current} if current else
+                             {'status': 'error', 'http_status': 404})
+        return responses
+
+
+def apply_data(*objects):
+    return {'vdom': 'root', 'batch_size': 100, 'transaction': False,
+            'objects': [{'path': 'firewall', 'name': 'address', 'state': state, 'config': config} for state, config in objects]}
+
+
+def test_check_mode_reports_the_changes_read_from_the_device():
+    fos = FakeFortiOS([{'name': 'host_1', 'color': 1}, {'name': 'host_2', 'color': 1}])
+
+    assert fortios_apply(apply_data(('present', {'name': 'host_1', 'color': 1}), ('absent', {'name': 'host_3'})),
+                         fos, check_mode=True)[:2] == (False, False)
+
+    is_error, has_changed, result = fortios_apply(apply_data(
+        ('present', {'name': 'host_1', 'color': 1}), ('present', {'name': 'host_2', 'color': 2}),
+        ('present', {'name': 'host_3'}), ('absent', {'name': 'host_1'})), fos, check_mode=True)
+    assert not is_error and has_changed
+    assert [item['outcome'] for item in result['results']] == ['unchanged', 'updated', 'created', 'deleted']
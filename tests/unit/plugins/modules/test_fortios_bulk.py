@@ -0,0 +1,74 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.fortinet.fortios.plugins.modules.fortios_bulk import fortios_bulk
+
+SCHEMA = {
+    'children': {
+        'name': {'type': 'string', 'size': 79},
+        'subnet': {'type': 'ipv4-classnet-any'},
+        'color': {'type': 'integer', 'min-value': 0, 'max-value': 32},
+    }
+}
+
+
+class FakeFortiOS(object):
+    """
+    Device side of fortios_bulk recording the calls writing to the table.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def get_mkeyname(self, path, name, vdom):
+        return 'name'
+
+    def override_table(self, path, name, objects, vdom=None, batch_size=100, keep=None):
+        self.calls.append(('override_table', [data['name'] for data in objects], keep))
+        return [{'status': 'success', 'http_method': 'PUT', 'http_status': 200} for data in objects], []
+
+    def set_objects(self, path, name, objects, vdom=None, batch_size=100):
+        self.calls.append(('set_objects', [data['name'] for data in objects]))
+        return [{'status': 'success', 'http_method': 'POST', 'http_status': 200} for data in objects]
+
+    def transaction_release(self, vdom=None):
+        pass
+
+
+def bulk_data(state, continue_on_invalid=False):
+    return {
+        'path': 'firewall', 'name': 'address', 'vdom': 'root', 'state': state,
+        'objects': [{'name': 'host_1', 'subnet': '10.0.0.1 255.255.255.255'},
+                    {'name': 'host_2', 'color': 99}],
+        'batch_size': 100, 'transaction': False, 'continue_on_invalid': continue_on_invalid,
+    }
+
+
+@pytest.mark.parametrize('continue_on_invalid', [False, True])
+def test_overridden_with_an_invalid_object_writes_nothing(continue_on_invalid):
+    fos = FakeFortiOS()
+    is_error, has_changed, result = fortios_bulk(bulk_data('overridden', continue_on_invalid), fos, SCHEMA)
+
+    assert is_error and not has_changed
+    assert fos.calls == []
+    assert [item['outcome'] for item in result['results']] == ['skipped', 'invalid']
+    assert result['summary']['invalid'] == 1 and result['summary']['skipped'] == 1
+
+
+def test_present_with_an_invalid_object_writes_nothing():
+    fos = FakeFortiOS()
+    is_error, has_changed, result = fortios_bulk(bulk_data('present'), fos, SCHEMA)
+
+    assert is_error and not has_changed
+    assert fos.calls == []
+
+
+def test_present_continue_on_invalid_applies_the_valid_objects():
+    fos = FakeFortiOS()
+    is_error, has_changed, result = fortios_bulk(bulk_data('present', continue_on_invalid=True), fos, SCHEMA)
+
+    assert is_error and has_changed
+    assert fos.calls == [('set_objects', ['host_1'])]
+    assert [item['outcome'] for item in result['results']] == ['created', 'invalid']
@@ -0,0 +1,22 @@
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.fortinet.fortios.plugins.module_utils.fortios.fortios import FortiOSHandler
+from ansible_collections.fortinet.fortios.plugins.modules.fortios_firewall_address import firewall_address
+from ansible_collections.fortinet.fortios.tests.unit.plugins.module_utils.fortios.test_fortios import FakeConnection
+from ansible_collections.fortinet.fortios.tests.unit.plugins.module_utils.fortios.test_fortios import FakeModule
+
+
+def task(vdom, color):
+    return {'vdom': vdom, 'state': 'present', 'firewall_address': {'name': 'host_1', 'color': color, 'comment': None}}
+
+
+def test_check_mode_reports_a_change_in_any_vdom():
+    conn = FakeConnection({'root': [{'name': 'host_1', 'color': 1}], 'vd1': [{'name': 'host_1', 'color': 2}]})
+    fos = FortiOSHandler(conn, FakeModule(), 'name')
+
+    assert firewall_address(task('root', 1), fos, check_mode=True)[:2] == (False, False)
+    assert firewall_address(task(['root', 'vd1'], 1), fos, check_mode=True)[:2] == (False, True)
+    assert firewall_address(task(['vd1', 'root'], 2), fos, check_mode=True)[:2] == (False, True)
+    assert [url for url, params in conn.requests] == ['/api/v2/cmdb/firewall/address/host_1?vdom=root'] + \
+        ['/api/v2/cmdb/firewall/address/host_1?vdom=%s' % (vdom) for vdom in ('root', 'vd1', 'vd1', 'root')]